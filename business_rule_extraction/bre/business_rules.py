@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
+from core.lineage import iter_rpg_statements
+
 from .rule_patterns import RulePattern, AS400RulePatterns
 
 class RuleType(Enum):
@@ -86,10 +88,11 @@ class RuleSet:
 class BusinessRuleExtractor:
     """Extracts business rules from AS400 AST."""
     
-    def __init__(self):
+    def __init__(self, catalog=None):
         self.rule_counter = 0
         self.patterns = self._initialize_patterns()
         self.comprehensive_patterns = AS400RulePatterns()
+        self.catalog = catalog  # optional core.catalog.SchemaCatalog for resolving table names
     
     def _initialize_patterns(self) -> Dict[str, Dict]:
         """Initialize basic rule extraction patterns."""
@@ -183,21 +186,14 @@ class BusinessRuleExtractor:
         if not ast:
             return rule_set
         
-        # Extract rules from main body
-        if hasattr(ast, 'main_body'):
-            for stmt in ast.main_body:
-                rule = self._extract_rpg_rule(stmt, source_file)
-                if rule:
-                    rule_set.add_rule(rule)
-        
-        # Extract rules from procedures
-        if hasattr(ast, 'procedures'):
-            for proc in ast.procedures:
-                if hasattr(proc, 'body'):
-                    for stmt in proc.body:
-                        rule = self._extract_rpg_rule(stmt, source_file)
-                        if rule:
-                            rule_set.add_rule(rule)
+        # Extract rules from main body and procedures, including statements nested in blocks
+        statements = list(getattr(ast, 'main_body', None) or [])
+        for proc in getattr(ast, 'procedures', None) or []:
+            statements.extend(getattr(proc, 'body', None) or [])
+        for stmt in iter_rpg_statements(statements):
+            rule = self._extract_rpg_rule(stmt, source_file)
+            if rule:
+                rule_set.add_rule(rule)
         
         return rule_set
     
@@ -516,12 +512,16 @@ class BusinessRuleExtractor:
         return variables
     
     def _extract_db2_tables(self, stmt) -> List[str]:
-        """Extract table names from DB2 statement."""
+        """Extract table names from DB2 statement, qualified through the schema catalog when known."""
+        from core.catalog import statement_tables
+
         tables = []
-        if hasattr(stmt, 'table'):
-            tables.append(str(stmt.table))
-        if hasattr(stmt, 'from_clause'):
-            tables.append(str(stmt.from_clause))
+        for ref in statement_tables(stmt):
+            entry = self.catalog.resolve(ref) if self.catalog else None
+            if entry:
+                tables.append(entry.qualified_name)
+            else:
+                tables.append(f"{ref.schema}.{ref.name}" if ref.schema else ref.name)
         return tables
     
     def _generate_rpg_description(self, stmt_type: str, condition: str, action: str) -> str:
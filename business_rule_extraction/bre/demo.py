@@ -20,9 +20,6 @@ def demo_bre_extraction():
     print("🔍 Business Rule Extraction Demo")
     print("=" * 50)
     
-    # Initialize analyzer
-    analyzer = BREAnalyzer()
-    
     # Analyze all AS400 file types including enhanced examples
     examples_dir = Path("examples")
     
@@ -30,6 +27,9 @@ def demo_bre_extraction():
         print("❌ Examples directory not found")
         return
     
+    # Initialize analyzer; tables resolve through the catalog of the example DDL
+    analyzer = BREAnalyzer(catalog=_example_catalog(examples_dir))
+    
     # Find all AS400 files
     file_patterns = ["*.clle", "*.rpgle", "*.rpg", "*.sql", "*.dspf"]
     all_files = []
@@ -104,6 +104,18 @@ def demo_bre_extraction():
     
     print("\n✅ Demo completed!")
 
+def _example_catalog(examples_dir: Path):
+    """Schema catalog of the example DDL, so rules name tables as the DDL defines them."""
+    from core.catalog import SchemaCatalog
+    from db2.runner import run_db2_file
+
+    catalog = SchemaCatalog()
+    for path in examples_dir.glob("*.sql"):
+        result = run_db2_file(str(path))
+        if result.ast is not None:
+            catalog.add_db2(result.ast, str(path))
+    return catalog
+
 def demo_cross_reference_analysis():
     """Demonstrate cross-reference analysis."""
     
@@ -18,8 +18,8 @@ from dspf.runner import run_dspf_file
 class BREAnalyzer:
     """Main Business Rule Extraction analyzer."""
     
-    def __init__(self):
-        self.extractor = BusinessRuleExtractor()
+    def __init__(self, catalog=None):
+        self.extractor = BusinessRuleExtractor(catalog)
         self.all_rules = {}
     
     def analyze_file(self, file_path: str) -> RuleSet:
@@ -45,6 +45,23 @@ class BREAnalyzer:
         else:
             raise ValueError(f"Unsupported file type: {file_path.suffix}")
     
+    def analyze_pipeline_result(self, result) -> Dict[str, RuleSet]:
+        """
+        Extract business rules from the ASTs of a main.run_pipeline result,
+        resolving tables through its schema catalog (run with catalog_path).
+        """
+        if result.catalog is not None:
+            self.extractor.catalog = result.catalog
+        rule_sets = {}
+        for results, extract in ((result.cl_results, self.extractor.extract_from_cl),
+                                 (result.rpg_results, self.extractor.extract_from_rpg),
+                                 (result.db2_results, self.extractor.extract_from_db2),
+                                 (result.dspf_results, self.extractor.extract_from_dspf)):
+            for r in results:
+                if r.ast is not None:
+                    rule_sets[r.path] = extract(r.ast, r.path)
+        return rule_sets
+    
     def analyze_directory(self, dir_path: str, pattern: str = "*") -> Dict[str, RuleSet]:
         """Analyze all files in a directory."""
         dir_path = Path(dir_path)
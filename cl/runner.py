@@ -2,6 +2,7 @@
 CL/CLLE runner: parse file and return ClResult with AST and diagnostics.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -9,6 +10,9 @@ from core.diagnostics import Diagnostic
 from core.io import load_file
 from cl.ast_nodes import ClProgram, ClCommand
 from cl.ast_builder import parse_cl
+from cl.scanner import scan_cl
+
+_CALL_TARGET_RE = re.compile(r"(?:PGM|PRC)\(\s*([^)\s]+)\s*\)", re.I)
 
 @dataclass
 class ClMetrics:
@@ -16,6 +20,7 @@ class ClMetrics:
     variable_count: int = 0
     cyclomatic_complexity: int = 1
     maintainability_rating: str = "A"
+    call_targets: List[str] = field(default_factory=list)
 
 @dataclass
 class ClResult:
@@ -90,14 +95,47 @@ def run_cl_file(path: str) -> ClResult:
                 files_used.add("Declared File") # Simplified extraction
             if cmd.name == 'DCL':
                 internal_vars.append("Variable") # Simplified extraction
+            if cmd.name in ('CALL', 'CALLPRC'):
+                for param in cmd.parameters:
+                    m = _CALL_TARGET_RE.match(param.value.text)
+                    if m:
+                        metrics.call_targets.append(m.group(1).strip("'").upper())
+
+    report_text = _summary_report(path, len(source.splitlines()), metrics, unique_ops, files_used, len(diagnostics))
+
+    return ClResult(path, ast, diagnostics, metrics, report_text, "\n".join(ast_lines))
+
+
+def run_cl_metrics(path: str) -> ClResult:
+    """
+    Fill ClMetrics for a CL/CLLE file from a lexical scan only (no parse, no AST).
+    """
+    try:
+        source = load_file(path)
+    except Exception as e:
+        return ClResult(path, None, [Diagnostic(path, 0, 0, "error", str(e))])
 
-    # Generate Text Report
+    scan = scan_cl(source)
+    metrics = ClMetrics(
+        command_count=scan.command_count,
+        variable_count=scan.variable_count,
+        cyclomatic_complexity=1 + scan.decision_count,
+        call_targets=scan.call_targets,
+    )
+    unique_ops = set(scan.operations)
+    files_used = set(scan.files_used)
+    report_text = _summary_report(path, scan.total_lines, metrics, unique_ops, files_used, 0)
+    return ClResult(path, None, [], metrics, report_text)
+
+
+def _summary_report(path: str, total_lines: int, metrics: ClMetrics, unique_ops: set,
+                    files_used: set, issue_count: int) -> str:
     lines = []
     lines.append("Summarization/Analysis Report")
     lines.append(f"Program: {path}")
     lines.append("Type: CL/CLLE")
     lines.append("I. Overview")
-    lines.append(f"Total Lines: {len(source.splitlines())}")
+    lines.append(f"Total Lines: {total_lines}")
     lines.append(f"Logical LOC: {metrics.command_count}")
     lines.append(f"Procedural Complexity: {'Low' if metrics.cyclomatic_complexity < 5 else 'Medium'} ({metrics.cyclomatic_complexity})")
     lines.append(f"Database Access: {len(files_used)} Files")
@@ -105,11 +143,9 @@ def run_cl_file(path: str) -> ClResult:
     lines.append("II. Metrics & Violations")
     lines.append(f"Maintainability Index: {metrics.maintainability_rating}")
     lines.append(f"Cyclomatic Complexity: {metrics.cyclomatic_complexity}")
-    lines.append(f"Issues: {len(diagnostics)}")
+    lines.append(f"Issues: {issue_count}")
     lines.append("III. Data Flow & Dependencies")
     lines.append(f"Files Used: {', '.join(files_used) if files_used else 'None'}")
     lines.append(f"Internal Variables: {metrics.variable_count} defined")
-    
-    report_text = "\n".join(lines)
-
-    return ClResult(path, ast, diagnostics, metrics, report_text, "\n".join(ast_lines))
+    lines.append(f"Calls: {', '.join(metrics.call_targets) if metrics.call_targets else 'None'}")
+    return "\n".join(lines)
@@ -0,0 +1,97 @@
+"""
+Metrics-only scanner for CL/CLLE.
+
+Single pass over the source with precompiled patterns; no parser, no AST.
+Feeds ClMetrics when the pipeline runs in metrics-only mode.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Optional LABEL: prefix, then the command name (a bare "LABEL:" line is not a command).
+_COMMAND_RE = re.compile(r"\s*(?:[A-Z_$#@][\w$#@]*:\s*)?([A-Z$#@][\w$#@]*)\b(?!\s*:)", re.I)
+_PGM_PARAM_RE = re.compile(r"\bPGM\(\s*([^)\s]+)\s*\)", re.I)
+_PRC_PARAM_RE = re.compile(r"\bPRC\(\s*([^)\s]+)\s*\)", re.I)
+_FILE_PARAM_RE = re.compile(r"\bFILE\(\s*([^)\s]+)\s*\)", re.I)
+_COMMENT_RE = re.compile(r"/\*.*?\*/")
+
+DECISION_COMMANDS = frozenset(("IF", "DOFOR", "DOWHILE", "MONMSG"))
+
+
+@dataclass
+class ClScan:
+    """Counts gathered by scan_cl."""
+
+    total_lines: int = 0
+    command_count: int = 0
+    variable_count: int = 0
+    decision_count: int = 0
+    operations: Counter = field(default_factory=Counter)
+    call_targets: list[str] = field(default_factory=list)
+    files_used: list[str] = field(default_factory=list)
+
+
+def scan_cl(source: str) -> ClScan:
+    """
+    Count commands, declarations, decisions, call targets and files in CL source.
+
+    Continuation lines (trailing '+' or '-') are joined before matching, so a
+    command spanning several lines is counted once.
+    """
+    scan = ClScan()
+    pending = ""
+    in_comment = False
+
+    for raw in source.splitlines():
+        scan.total_lines += 1
+        line = raw
+        if in_comment:
+            end = line.find("*/")
+            if end < 0:
+                continue
+            line = line[end + 2:]
+            in_comment = False
+        if "/*" in line:
+            line = _COMMENT_RE.sub(" ", line)
+            start = line.find("/*")
+            if start >= 0:
+                line = line[:start]
+                in_comment = True
+        text = line.rstrip()
+        if not text:
+            continue
+        if text[-1] in "+-":
+            pending += text[:-1] + " "
+            continue
+        _scan_command(pending + text, scan)
+        pending = ""
+
+    if pending.strip():
+        _scan_command(pending, scan)
+    return scan
+
+
+def _scan_command(text: str, scan: ClScan) -> None:
+    m = _COMMAND_RE.match(text)
+    if not m:
+        return
+    name = m.group(1).upper()
+    scan.command_count += 1
+    scan.operations[name] += 1
+    if name == "DCL":
+        scan.variable_count += 1
+    elif name in DECISION_COMMANDS:
+        scan.decision_count += 1
+    elif name in ("CALL", "SBMJOB", "TFRCTL"):
+        target = _PGM_PARAM_RE.search(text, m.end())
+        if target:
+            scan.call_targets.append(target.group(1).upper())
+    elif name == "CALLPRC":
+        target = _PRC_PARAM_RE.search(text, m.end())
+        if target:
+            scan.call_targets.append(target.group(1).strip("'").upper())
+    elif name == "DCLF":
+        f = _FILE_PARAM_RE.search(text, m.end())
+        if f:
+            scan.files_used.append(f.group(1).upper())
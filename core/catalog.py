@@ -0,0 +1,293 @@
+"""
+Project-wide schema catalog.
+
+Collects tables and views from parsed Db2Ddl statements, plus table references
+from DSPF REF/REFFLD keywords and embedded SQL. Lookups by schema.table, by
+column and by referencing program are dict hits. The catalog is saved as JSON.
+Each entry records the source file that contributed it, so an incremental
+run only replaces the entries of files that changed.
+"""
+
+import json
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from db2.ast_nodes import Db2Ddl, Db2Insert, Db2Script, Db2Select, TableRef
+
+CATALOG_VERSION = 2
+
+# REF(FILE), REF(LIB/FILE), REFFLD(FIELD LIB/FILE): optional library, then the file.
+_REF_FILE_RE = re.compile(r"(?:([\w$#@]+)/)?([\w$#@*]+)\s*\)?\s*$")
+
+
+@dataclass
+class CatalogColumn:
+    """Column of a catalog table."""
+
+    name: str
+    data_type: str | None = None
+    length: int | None = None
+    scale: int | None = None
+    nullable: bool = True
+
+
+@dataclass
+class CatalogTable:
+    """Table or view known to the catalog."""
+
+    name: str
+    schema: str | None = None
+    kind: str = "TABLE"  # "TABLE" | "VIEW"
+    source: str | None = None  # file that defined it
+    line: int = 0
+    columns: dict[str, CatalogColumn] = field(default_factory=dict)  # keyed by upper-case name
+    primary_key: list[str] = field(default_factory=list)
+    indexes: list[str] = field(default_factory=list)
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.schema}.{self.name}" if self.schema else self.name
+
+
+def table_key(name: str, schema: str | None = None) -> str:
+    """Catalog key for a table: upper-case SCHEMA.NAME, or NAME when unqualified."""
+    return f"{schema}.{name}".upper() if schema else name.upper()
+
+
+class SchemaCatalog:
+    """
+    Hash-indexed catalog of tables, columns and program references.
+
+    Program references are keyed by bare table name: on IBM i an unqualified
+    name is resolved through the library list at run time, so a program's
+    reference cannot be pinned to one schema statically.
+    """
+
+    def __init__(self):
+        self._tables: dict[str, CatalogTable] = {}  # SCHEMA.NAME (or NAME) -> table
+        self._by_name: dict[str, list[str]] = {}  # NAME -> keys, in definition order
+        self._by_column: dict[str, list[str]] = {}  # COLUMN -> keys
+        self._referenced_by: dict[str, set[str]] = {}  # NAME -> programs
+        self._references: dict[str, set[str]] = {}  # PROGRAM -> table names
+        self._reference_counts: Counter = Counter()  # (PROGRAM, NAME) -> contributing sources
+        self._sources: dict[str, dict] = {}  # path -> {"stamp": [...], "tables": [...], "refs": [...], "columns": [...]}
+        self._source_refs: dict[str, set[tuple[str, str]]] = {}  # path -> its refs, for the duplicate check
+
+    # -- lookups -----------------------------------------------------------
+
+    def table(self, name: str, schema: str | None = None) -> CatalogTable | None:
+        """Table by name; an unqualified name resolves to the first definition seen."""
+        if schema:
+            return self._tables.get(table_key(name, schema))
+        keys = self._by_name.get(name.upper())
+        return self._tables[keys[0]] if keys else None
+
+    def resolve(self, ref: TableRef) -> CatalogTable | None:
+        """Table for a Db2 AST table reference."""
+        return self.table(ref.name, ref.schema)
+
+    def column(self, table: str, column: str, schema: str | None = None) -> CatalogColumn | None:
+        entry = self.table(table, schema)
+        return entry.columns.get(column.upper()) if entry else None
+
+    def tables_with_column(self, column: str) -> list[CatalogTable]:
+        return [self._tables[k] for k in self._by_column.get(column.upper(), ())]
+
+    def programs_referencing(self, table: str) -> set[str]:
+        return self._referenced_by.get(table.upper(), set())
+
+    def tables_referenced_by(self, program: str) -> set[str]:
+        return self._references.get(program.upper(), set())
+
+    def tables(self) -> list[CatalogTable]:
+        return list(self._tables.values())
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, name: str) -> bool:
+        return name.upper() in self._tables or name.upper() in self._by_name
+
+    # -- building ----------------------------------------------------------
+
+    def add_table(self, table: CatalogTable) -> None:
+        """Add or replace a table definition."""
+        key = table_key(table.name, table.schema)
+        if key in self._tables:
+            self._unindex_table(key)
+        self._tables[key] = table
+        self._by_name.setdefault(table.name.upper(), []).append(key)
+        for column in table.columns:
+            self._by_column.setdefault(column, []).append(key)
+        if table.source:
+            self._source(table.source)["tables"].append(key)
+
+    def add_reference(self, program: str, table: str, source: str | None = None) -> None:
+        """Record that program reads or writes table (bare or LIB/FILE / SCHEMA.TABLE name)."""
+        name = re.split(r"[./]", table)[-1].upper()
+        program = program.upper()
+        seen = self._source_refs.setdefault(str(source or ""), set())
+        if (program, name) in seen:
+            return
+        seen.add((program, name))
+        self._source(source or "")["refs"].append([program, name])
+        self._reference_counts[program, name] += 1
+        self._references.setdefault(program, set()).add(name)
+        self._referenced_by.setdefault(name, set()).add(program)
+
+    def add_db2(self, script: Db2Script, source: str) -> None:
+        """
+        Add tables and views from a DB2 script; CREATE INDEX and ALTER TABLE
+        amend them. Columns an ALTER TABLE adds belong to its source file, so
+        they go when that file is removed.
+        """
+        for stmt in script.statements:
+            if not isinstance(stmt, Db2Ddl):
+                continue
+            if stmt.kind in ("CREATE TABLE", "CREATE VIEW"):
+                table = CatalogTable(
+                    name=stmt.name,
+                    schema=stmt.schema,
+                    kind=stmt.kind.split()[1],
+                    source=source,
+                    line=stmt.loc.line,
+                    primary_key=list(stmt.primary_key),
+                )
+                for c in stmt.columns:
+                    table.columns[c.name.upper()] = CatalogColumn(c.name, c.data_type, c.length, c.scale, c.nullable)
+                self.add_table(table)
+            elif stmt.kind == "CREATE INDEX" and stmt.on_table is not None:
+                table = self.resolve(stmt.on_table)
+                if table is not None:
+                    table.indexes.append(stmt.name)
+            elif stmt.kind == "ALTER TABLE":
+                table = self.table(stmt.name, stmt.schema)
+                if table is not None:
+                    key = table_key(table.name, table.schema)
+                    for c in stmt.columns:
+                        column = c.name.upper()
+                        if column not in table.columns:
+                            self._by_column.setdefault(column, []).append(key)
+                            self._source(source)["columns"].append([key, column])
+                        table.columns[column] = CatalogColumn(c.name, c.data_type, c.length, c.scale, c.nullable)
+                    if not table.primary_key:
+                        table.primary_key = list(stmt.primary_key)
+
+    def add_statement_references(self, program: str, statements: list, source: str | None = None) -> None:
+        """Record the tables read or written by DB2 statements (e.g. a program's embedded SQL)."""
+        for stmt in statements:
+            for ref in statement_tables(stmt):
+                self.add_reference(program, ref.name, source)
+
+    def add_dspf(self, display_file, source: str) -> None:
+        """Record the files a display file refers to through REF / REFFLD."""
+        program = display_file.name or Path(source).stem
+        refs = [display_file.file_level_keywords.get("REF")]
+        for record in display_file.record_formats:
+            for f in record.fields:
+                refs += [f.ref, f.keywords.get("REF"), f.keywords.get("REFFLD")]
+        for value in refs:
+            if not value:
+                continue
+            m = _REF_FILE_RE.search(value.strip())
+            if m and m.group(2) != "*SRC":
+                self.add_reference(program, m.group(2), source)
+
+    def remove_source(self, source: str) -> None:
+        """Drop everything the given file contributed."""
+        entry = self._sources.pop(str(source), None)
+        self._source_refs.pop(str(source), None)
+        if entry is None:
+            return
+        for key, column in entry["columns"]:
+            table = self._tables.get(key)
+            if table is not None and table.columns.pop(column, None) is not None:
+                keys = self._by_column.get(column, [])
+                if key in keys:
+                    keys.remove(key)
+        for key in entry["tables"]:
+            if key in self._tables and self._tables[key].source == str(source):
+                self._unindex_table(key)
+                del self._tables[key]
+        for program, name in entry["refs"]:
+            self._reference_counts[program, name] -= 1
+            if self._reference_counts[program, name] <= 0:
+                del self._reference_counts[program, name]
+                self._references[program].discard(name)
+                self._referenced_by[name].discard(program)
+
+    def is_current(self, source: str) -> bool:
+        """True when source was catalogued and has not changed on disk since."""
+        entry = self._sources.get(str(source))
+        return entry is not None and entry["stamp"] == _stamp(source)
+
+    def mark_current(self, source: str) -> None:
+        """Record the file's size/mtime so is_current can skip it next run."""
+        self._source(source)["stamp"] = _stamp(source)
+
+    def _source(self, source: str) -> dict:
+        return self._sources.setdefault(str(source), {"stamp": None, "tables": [], "refs": [], "columns": []})
+
+    def _unindex_table(self, key: str) -> None:
+        table = self._tables[key]
+        keys = self._by_name.get(table.name.upper(), [])
+        if key in keys:
+            keys.remove(key)
+        for column in table.columns:
+            keys = self._by_column.get(column, [])
+            if key in keys:
+                keys.remove(key)
+
+    # -- persistence -------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        data = {
+            "version": CATALOG_VERSION,
+            "tables": [asdict(t) for t in self._tables.values()],
+            "sources": self._sources,  # also carries every program reference
+        }
+        Path(path).write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SchemaCatalog":
+        """Load a saved catalog; a missing or out-of-date file gives an empty one."""
+        catalog = cls()
+        path = Path(path)
+        if not path.exists():
+            return catalog
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != CATALOG_VERSION:
+            return catalog
+
+        for t in data.get("tables", []):
+            columns = {k: CatalogColumn(**c) for k, c in t.pop("columns", {}).items()}
+            catalog.add_table(CatalogTable(**t, columns=columns))
+        for source, entry in data.get("sources", {}).items():
+            for program, name in entry["refs"]:
+                catalog.add_reference(program, name, source)
+            catalog._source(source)["columns"] = entry["columns"]  # already in the saved tables
+            catalog._source(source)["stamp"] = entry["stamp"]
+        return catalog
+
+
+def statement_tables(stmt) -> list[TableRef]:
+    """Tables a DB2 statement reads or writes (FROM/JOIN, INSERT/UPDATE/DELETE target)."""
+    tables = []
+    table = getattr(stmt, "table", None)
+    if table is not None:
+        tables.append(table)
+    if isinstance(stmt, Db2Insert) and stmt.select is not None:
+        stmt = stmt.select
+    if isinstance(stmt, Db2Select):
+        tables.extend(t for t in stmt.from_tables if t.name != "<subquery>")
+    return tables
+
+
+def _stamp(source: str | Path) -> list[int] | None:
+    try:
+        st = Path(source).stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
@@ -0,0 +1,233 @@
+"""
+Numbered indicator (*IN01 - *IN99) usage across RPG programs and display files.
+
+Each program and each display file record format gets an IndicatorUsage:
+two int bitsets, bit n standing for indicator n. A program sets indicators
+through resulting-indicator columns (C 71-76, I 21-22 and 69-74), assignments
+to *INnn / *IN(nn) and result fields; it tests them through conditioning
+columns (C 9-11, O 21-29) and expressions. A record format tests its option
+indicators (DDS columns 7-16) and sets its response indicators (CA03(03),
+CHANGE(31), ...) when the program reads it.
+
+IndicatorIndex joins the two: a program uses the display files it declares
+as WORKSTN. Sources are scanned once when added; queries are bit tests.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.lineage import iter_rpg_statements
+
+_IN_RE = re.compile(r"\*IN\s*(?:(\d\d)\b|\(\s*(\d\d?)\s*\))", re.I)
+_DIGITS_RE = re.compile(r"\d\d")
+# C-spec opcodes whose columns 36-80 hold one free-form expression (no result field or indicators)
+_EXTENDED_FACTOR2_OPCODES = frozenset((
+    "EVAL", "EVALR", "EVAL-CORR", "IF", "ELSEIF", "DOW", "DOU", "WHEN", "FOR", "CALLP", "RETURN",
+    "ON-ERROR", "SORTA",
+))
+# DDS keywords whose parameter starts with a response indicator
+_RESPONSE_KEYWORD_RE = re.compile(
+    r"C[AF]\d\d|CHANGE|BLANKS|CLEAR|HELP|HOME|PRINT|ROLLUP|ROLLDOWN|PAGEUP|PAGEDOWN|VLDCMDKEY|DUP"
+)
+
+
+@dataclass
+class IndicatorUsage:
+    """Indicators set and tested by one program or record format (bit n = indicator n)."""
+
+    name: str
+    sets: int = 0
+    tests: int = 0
+
+    def set_indicators(self) -> list[int]:
+        return indicator_numbers(self.sets)
+
+    def tested_indicators(self) -> list[int]:
+        return indicator_numbers(self.tests)
+
+
+def indicator_numbers(bits: int) -> list[int]:
+    """Indicator numbers of a bitset, ascending."""
+    found = []
+    while bits:
+        low = bits & -bits
+        found.append(low.bit_length() - 1)
+        bits ^= low
+    return found
+
+
+def indicator_bits(text: str) -> int:
+    """Bitset of the two-digit indicators written in text ("N31", "3132", " 40")."""
+    bits = 0
+    for digits in _DIGITS_RE.findall(text):
+        n = int(digits)
+        if n:
+            bits |= 1 << n
+    return bits
+
+
+def expression_bits(text: str | None) -> int:
+    """Bitset of the *INnn and *IN(nn) references in an RPG expression."""
+    bits = 0
+    for m in _IN_RE.finditer(text or ""):
+        n = int(m.group(1) or m.group(2))
+        if n:
+            bits |= 1 << n
+    return bits
+
+
+def _slot_bits(text: str) -> int:
+    """indicator_bits of adjacent two-column slots, one slot at a time (H1 then 23, not 12)."""
+    bits = 0
+    for i in range(0, len(text), 2):
+        bits |= indicator_bits(text[i:i + 2])
+    return bits
+
+
+def rpg_indicator_usage(ast, name: str) -> IndicatorUsage:
+    """Indicators set and tested by an RpgProgram: its fixed spec lines, then every statement."""
+    usage = IndicatorUsage(name.upper())
+    for spec in ast.specs:
+        f = spec.fields
+        if spec.spec == "C":
+            usage.tests |= indicator_bits(f["conditioning"])
+            op = f["opcode"].split("(")[0].upper()
+            if op and op not in _EXTENDED_FACTOR2_OPCODES:
+                usage.sets |= (indicator_bits(f["hi"]) | indicator_bits(f["lo"]) | indicator_bits(f["eq"])
+                               | expression_bits(f["result"]))
+                usage.tests |= expression_bits(f["factor1"]) | expression_bits(f["factor2"])
+        elif spec.spec == "I":
+            usage.sets |= indicator_bits(f["record_indicator"]) | _slot_bits(f["field_indicators"])
+        elif spec.spec == "O":
+            usage.tests |= indicator_bits(f["indicators"])
+    for stmt in _statements(ast):
+        target = getattr(stmt, "target", None)
+        if target is not None:
+            usage.sets |= expression_bits(target.value)
+        for expr in _read_expressions(stmt):
+            usage.tests |= _expr_bits(expr)
+    return usage
+
+
+def dspf_indicator_usage(display_file) -> dict[str, IndicatorUsage]:
+    """
+    IndicatorUsage of each record format of a DisplayFile, by upper-case
+    format name. File-level response keywords (CA03(03) before the first
+    record format) apply to every record format.
+    """
+    formats: dict[str, IndicatorUsage] = {}
+    file_sets = _response_bits(display_file.file_level_keywords)
+    for record in display_file.record_formats:
+        usage = formats.setdefault(record.name.upper(), IndicatorUsage(record.name.upper()))
+        usage.tests |= indicator_bits(" ".join(record.indicators))
+        usage.sets |= file_sets | _response_bits(record.keywords)
+        for fld in record.fields:
+            usage.tests |= indicator_bits(" ".join(fld.indicators + fld.keyword_indicators))
+            usage.sets |= _response_bits(fld.keywords)
+    return formats
+
+
+class IndicatorIndex:
+    """
+    Indicator usage of programs and display files, and which display files
+    each program uses. Names are upper case: programs and display files by
+    member name (file stem), record formats by format name.
+    """
+
+    def __init__(self):
+        self.programs: dict[str, IndicatorUsage] = {}
+        self.display_files: dict[str, dict[str, IndicatorUsage]] = {}  # file -> format -> usage
+        self._workstn: dict[str, set[str]] = {}  # program -> WORKSTN files it declares
+
+    def add_rpg_program(self, ast, program: str) -> None:
+        program = program.upper()
+        self.programs[program] = rpg_indicator_usage(ast, program)
+        self._workstn[program] = {f.name.upper() for f in ast.files if (f.device or "").upper() == "WORKSTN"}
+
+    def add_display_file(self, ast, name: str) -> None:
+        self.display_files[name.upper()] = dspf_indicator_usage(ast)
+
+    # -- queries -----------------------------------------------------------
+
+    def display_files_of(self, program: str) -> list[str]:
+        """Display files the program declares that are in the index."""
+        return sorted(self._workstn.get(program.upper(), set()) & self.display_files.keys())
+
+    def programs_setting(self, indicator: int) -> list[str]:
+        bit = 1 << indicator
+        return [p for p, usage in self.programs.items() if usage.sets & bit]
+
+    def programs_testing(self, indicator: int) -> list[str]:
+        bit = 1 << indicator
+        return [p for p, usage in self.programs.items() if usage.tests & bit]
+
+    def screens_reacting_to(self, indicator: int, program: str) -> list[tuple[str, str]]:
+        """
+        (display file, record format) pairs whose option indicators include
+        indicator, over the display files of program; empty unless program
+        sets indicator.
+        """
+        usage = self.programs.get(program.upper())
+        bit = 1 << indicator
+        if usage is None or not usage.sets & bit:
+            return []
+        return list(self._formats(self.display_files_of(program), bit, "tests"))
+
+    def screens_setting(self, indicator: int, program: str | None = None) -> list[tuple[str, str]]:
+        """(display file, record format) pairs that return indicator as a response indicator (to program)."""
+        files = self.display_files_of(program) if program is not None else list(self.display_files)
+        return list(self._formats(files, 1 << indicator, "sets"))
+
+    def _formats(self, files: Iterable[str], bit: int, attr: str) -> Iterator[tuple[str, str]]:
+        for file in files:
+            for fmt, usage in self.display_files[file].items():
+                if getattr(usage, attr) & bit:
+                    yield file, fmt
+
+
+def build_indicator_index(rpg_results: Iterable = (), dspf_results: Iterable = ()) -> IndicatorIndex:
+    """Indicator index for a pipeline run (RpgResult / DspfResult objects with an ast)."""
+    index = IndicatorIndex()
+    for r in dspf_results:
+        if r.ast is not None:
+            index.add_display_file(r.ast, r.ast.name or Path(r.path).stem)
+    for r in rpg_results:
+        if r.ast is not None:
+            index.add_rpg_program(r.ast, Path(r.path).stem)
+    return index
+
+
+def _statements(ast) -> Iterator:
+    yield from iter_rpg_statements(ast.main_body)
+    for proc in ast.procedures:
+        yield from iter_rpg_statements(proc.body)
+
+
+def _read_expressions(stmt) -> Iterator:
+    """Expressions a statement reads (not nested bodies: iter_rpg_statements visits those)."""
+    for attr in ("expr", "condition", "value"):
+        expr = getattr(stmt, attr, None)
+        if expr is not None:
+            yield expr
+    for attr in ("else_if_parts", "cases"):
+        for condition, _ in getattr(stmt, attr, None) or []:
+            if condition is not None:
+                yield condition
+    yield from getattr(stmt, "params", None) or []
+
+
+def _expr_bits(expr) -> int:
+    bits = expression_bits(expr.value)
+    for child in expr.children:
+        bits |= _expr_bits(child)
+    return bits
+
+
+def _response_bits(keywords: dict[str, str]) -> int:
+    bits = 0
+    for keyword, value in keywords.items():
+        if _RESPONSE_KEYWORD_RE.fullmatch(keyword):
+            bits |= indicator_bits(value[:2])
+    return bits
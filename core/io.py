@@ -5,6 +5,8 @@ Supports reading CL, RPG, DB2, and DSPF source files with encoding handling
 (common IBM i encodings: EBCDIC, UTF-8, Latin-1).
 """
 
+import codecs
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -45,6 +47,41 @@ def load_file(path: str | Path, encodings: tuple[str, ...] | None = None) -> str
     raise UnicodeDecodeError("unknown", b"", 0, 1, "no encoding succeeded")
 
 
+def iter_lines(
+    path: str | Path,
+    encodings: tuple[str, ...] | None = None,
+    sniff_bytes: int = 1 << 20,
+) -> Iterator[str]:
+    """
+    Stream a source file line by line (line endings kept) in bounded memory.
+
+    The encoding is chosen like load_file, but only the first sniff_bytes are
+    trial-decoded; undecodable bytes later in the file are replaced.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(str(path))
+
+    encodings = encodings or DEFAULT_ENCODINGS
+    with open(path, "rb") as f:
+        head = f.read(sniff_bytes)
+    chosen = encodings[-1]
+    for enc in encodings:
+        try:
+            # final=False tolerates a multi-byte sequence cut at the sniff boundary
+            codecs.getincrementaldecoder(enc)().decode(head, final=len(head) < sniff_bytes)
+            chosen = enc
+            break
+        except UnicodeDecodeError:
+            continue
+
+    with open(path, encoding=chosen, errors="replace", newline="") as f:
+        yield from f
+
+
 def discover_files(
     root: str | Path,
     include_patterns: list[str] | None = None,
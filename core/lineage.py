@@ -0,0 +1,295 @@
+"""
+Column-level data lineage across DB2 and RPG.
+
+Nodes are table columns ("SCHEMA.TABLE.COLUMN") and program variables
+("PROGRAM:NAME"). Node names are interned to dense integer ids. Edges say
+"data flows from src to dst". They come from INSERT ... SELECT, INSERT
+VALUES (:hostvar), UPDATE SET, SELECT INTO :hostvar and RPG assignments.
+Once built, the graph is frozen into CSR adjacency arrays (offsets +
+targets, both directions). Upstream/downstream queries are then
+array-indexed breadth-first walks.
+"""
+
+import re
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from db2.ast_nodes import ColumnRef, Db2Insert, Db2Select, Db2Update, TableRef
+
+# Edge kinds (stored as one byte per edge).
+EDGE_KINDS = ("insert", "update", "select_into", "assign")
+_KIND_IDS = {k: i for i, k in enumerate(EDGE_KINDS)}
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_HOST_VAR_RE = re.compile(r":\s*([A-Za-z_$#@][\w$#@]*(?:\.[A-Za-z_$#@][\w$#@]*)?)")
+# [qualifier.]name not followed by '(' (function call) and not part of a host variable
+_SQL_NAME_RE = re.compile(r"(?<![:\w$#@.])(?:([A-Za-z_$#@][\w$#@]*)\.)?([A-Za-z_$#@][\w$#@]*)\b(?!\s*\()")
+_RPG_NAME_RE = re.compile(r"(?<![\w$#@%*'])([A-Za-z_$#@][\w$#@]*(?:\.[A-Za-z_$#@][\w$#@]*)?)\b(?!\s*\()")
+_SQL_WORDS = frozenset((
+    "AS", "AND", "OR", "NOT", "NULL", "IS", "IN", "LIKE", "BETWEEN", "CASE", "WHEN", "THEN", "ELSE",
+    "END", "DISTINCT", "ALL", "CURRENT_DATE", "CURRENT_TIME", "CURRENT_TIMESTAMP", "CURRENT",
+    "DATE", "TIME", "TIMESTAMP", "EXISTS", "SELECT", "FROM", "WHERE",
+))
+
+
+class LineageGraph:
+    """
+    Directed data-flow graph over interned column and variable names.
+
+    Build with add_flow() (or the add_* helpers), then query; the CSR arrays
+    are (re)built on the first query after a change.
+    """
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._src = array("i")
+        self._dst = array("i")
+        self._kind = array("b")
+        self._seen: set[int] = set()  # src << 32 | dst, to drop duplicate edges
+        self._frozen = False
+        self._fwd_offsets = self._fwd_targets = self._rev_offsets = self._rev_targets = array("i")
+
+    # -- nodes -------------------------------------------------------------
+
+    def node(self, name: str) -> int:
+        """Id of a node name, interning it if new."""
+        node_id = self._ids.get(name)
+        if node_id is None:
+            node_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return node_id
+
+    def name(self, node_id: int) -> str:
+        return self._names[node_id]
+
+    def find(self, name: str) -> int | None:
+        return self._ids.get(name.upper())
+
+    @staticmethod
+    def column_name(table: str, column: str, schema: str | None = None) -> str:
+        return f"{schema}.{table}.{column}".upper() if schema else f"{table}.{column}".upper()
+
+    @staticmethod
+    def variable_name(program: str, variable: str) -> str:
+        return f"{program}:{variable}".upper()
+
+    @property
+    def node_count(self) -> int:
+        return len(self._names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._src)
+
+    # -- edges -------------------------------------------------------------
+
+    def add_flow(self, src: str, dst: str, kind: str) -> None:
+        """Record that data flows from node src to node dst."""
+        s, d = self.node(src), self.node(dst)
+        if s == d or (s << 32 | d) in self._seen:
+            return
+        self._seen.add(s << 32 | d)
+        self._src.append(s)
+        self._dst.append(d)
+        self._kind.append(_KIND_IDS[kind])
+        self._frozen = False
+
+    def add_db2_statement(self, stmt, program: str | None = None, catalog=None) -> None:
+        """
+        Add the flows of one Db2 statement. Host variables belong to program;
+        catalog (core.catalog.SchemaCatalog) resolves unqualified columns and
+        the implicit column list of INSERT without one.
+        """
+        if isinstance(stmt, Db2Insert):
+            targets = [c.name if isinstance(c, ColumnRef) else c for c in stmt.columns]
+            if not targets and catalog is not None:
+                table = catalog.resolve(stmt.table)
+                targets = [c.name for c in table.columns.values()] if table else []
+            target_nodes = [self.column_name(stmt.table.name, t, stmt.table.schema) for t in targets]
+            if stmt.select is not None:
+                sources = stmt.select.columns
+                for target, item in zip(target_nodes, sources):
+                    for src in self._select_item_sources(item, stmt.select.from_tables, program, catalog):
+                        self.add_flow(src, target, "insert")
+            elif stmt.values:
+                for target, value in zip(target_nodes, stmt.values):
+                    for src in self._expression_sources(value, [], program, catalog):
+                        self.add_flow(src, target, "insert")
+        elif isinstance(stmt, Db2Update):
+            for column, value in stmt.set_clauses:
+                name = column.name if isinstance(column, ColumnRef) else column
+                target = self.column_name(stmt.table.name, name, stmt.table.schema)
+                for src in self._expression_sources(value, [stmt.table], program, catalog):
+                    self.add_flow(src, target, "update")
+        elif isinstance(stmt, Db2Select) and stmt.into and program:
+            for item, host in zip(stmt.columns, stmt.into):
+                target = self.variable_name(program, host.lstrip(":").strip())
+                for src in self._select_item_sources(item, stmt.from_tables, program, catalog):
+                    self.add_flow(src, target, "select_into")
+
+    def add_rpg_program(self, ast, program: str, catalog=None) -> None:
+        """Add the flows of an RpgProgram: assignments and embedded SQL."""
+        for stmt in iter_rpg_statements(ast.main_body):
+            self._add_rpg_statement(stmt, program)
+        for proc in ast.procedures:
+            for stmt in iter_rpg_statements(proc.body):
+                self._add_rpg_statement(stmt, program)
+        for sql in ast.sql_statements:
+            for stmt in sql.statements:
+                self.add_db2_statement(stmt, program, catalog)
+
+    def _add_rpg_statement(self, stmt, program: str) -> None:
+        target = getattr(stmt, "target", None)
+        expr = getattr(stmt, "expr", None)
+        if target is None or expr is None or not target.value:
+            return
+        name = target.value.split("(")[0].strip()
+        dst = self.variable_name(program, name)
+        names = _rpg_expression_names(expr)
+        if getattr(stmt, "operator", None):  # x += y
+            names.append(name)  # the old value is read too (a self-flow, which add_flow does not record)
+        for name in names:
+            self.add_flow(self.variable_name(program, name), dst, "assign")
+
+    # -- resolution helpers -----------------------------------------------
+
+    def _select_item_sources(self, item, tables: list[TableRef], program, catalog) -> list[str]:
+        if isinstance(item, ColumnRef):
+            return [self._column_node(item.table_alias, item.name, tables, catalog)]
+        text = re.sub(r"\s+AS\s+[\w$#@\"]+\s*$", "", item, flags=re.I)  # drop a trailing alias
+        return self._expression_sources(text, tables, program, catalog)
+
+    def _expression_sources(self, text: str, tables: list[TableRef], program, catalog) -> list[str]:
+        sources = []
+        if program:
+            sources += [self.variable_name(program, m) for m in _HOST_VAR_RE.findall(text)]
+        code = _HOST_VAR_RE.sub(" ", _STRING_RE.sub(" ", text))
+        for qualifier, name in _SQL_NAME_RE.findall(code):
+            if name.upper() in _SQL_WORDS or name[0].isdigit():
+                continue
+            if tables or catalog is not None:
+                sources.append(self._column_node(qualifier or None, name, tables, catalog))
+        return sources
+
+    def _column_node(self, qualifier: str | None, column: str, tables: list[TableRef], catalog) -> str:
+        table = _resolve_table(qualifier, column, tables, catalog)
+        if table is None:
+            return self.column_name(qualifier or "?", column)
+        return self.column_name(table.name, column, table.schema)
+
+    # -- queries -----------------------------------------------------------
+
+    def downstream(self, node: str | int) -> list[str]:
+        """Every node data at node can flow to (transitively)."""
+        self._freeze()
+        return self._walk(node, self._fwd_offsets, self._fwd_targets)
+
+    def upstream(self, node: str | int) -> list[str]:
+        """Every node that can flow into node (transitively)."""
+        self._freeze()
+        return self._walk(node, self._rev_offsets, self._rev_targets)
+
+    def edges(self) -> Iterator[tuple[str, str, str]]:
+        for s, d, k in zip(self._src, self._dst, self._kind):
+            yield self._names[s], self._names[d], EDGE_KINDS[k]
+
+    def _walk(self, node: str | int, offsets: array, targets: array) -> list[str]:
+        start = node if isinstance(node, int) else self.find(node)
+        if start is None:
+            return []
+        visited = bytearray(len(self._names))
+        visited[start] = 1
+        queue = deque((start,))
+        found = []
+        while queue:
+            n = queue.popleft()
+            for i in range(offsets[n], offsets[n + 1]):
+                t = targets[i]
+                if not visited[t]:
+                    visited[t] = 1
+                    found.append(t)
+                    queue.append(t)
+        return [self._names[t] for t in found]
+
+    def _freeze(self) -> None:
+        if self._frozen:
+            return
+        n = len(self._names)
+        self._fwd_offsets, self._fwd_targets = _csr(n, self._src, self._dst)
+        self._rev_offsets, self._rev_targets = _csr(n, self._dst, self._src)
+        self._frozen = True
+
+
+def build_lineage(db2_results: Iterable = (), rpg_results: Iterable = (), catalog=None) -> LineageGraph:
+    """Lineage graph for a pipeline run (Db2Result / RpgResult objects with an ast)."""
+    from pathlib import Path
+
+    graph = LineageGraph()
+    for r in db2_results:
+        if r.ast is not None:
+            for stmt in r.ast.statements:
+                graph.add_db2_statement(stmt, None, catalog)
+    for r in rpg_results:
+        if r.ast is not None:
+            graph.add_rpg_program(r.ast, Path(r.path).stem, catalog)
+    return graph
+
+
+def iter_rpg_statements(statements: list) -> Iterator:
+    """Statements in order, descending into IF/SELECT/DO/MONITOR bodies."""
+    for stmt in statements:
+        yield stmt
+        yield from iter_rpg_statements(getattr(stmt, "then_body", None) or [])
+        for attr in ("else_if_parts", "cases"):
+            for _, body in getattr(stmt, attr, None) or []:
+                yield from iter_rpg_statements(body)
+        for attr in ("else_body", "body"):
+            yield from iter_rpg_statements(getattr(stmt, attr, None) or [])
+        for _, body in getattr(stmt, "handlers", None) or []:
+            yield from iter_rpg_statements(body)
+
+
+def _rpg_expression_names(expr) -> list[str]:
+    """Variable names read by an RpgExpr (from its parse tree when present, else its text)."""
+    if expr.children:
+        names = []
+        for child in expr.children:
+            names += _rpg_expression_names(child)
+        return names
+    if expr.kind != "expr":  # a parse tree leaf: only identifiers are variables
+        return [expr.value] if expr.kind == "ident" and expr.value else []
+    return [n for n in _RPG_NAME_RE.findall(_STRING_RE.sub(" ", expr.value or "")) if not n[0].isdigit()]
+
+
+def _resolve_table(qualifier: str | None, column: str, tables: list[TableRef], catalog) -> TableRef | None:
+    if qualifier:
+        q = qualifier.upper()
+        for t in tables:
+            if (t.alias or "").upper() == q or t.name.upper() == q:
+                return t
+        return TableRef(loc=None, name=qualifier)  # type: ignore[arg-type]
+    if len(tables) == 1:
+        return tables[0]
+    if catalog is not None:
+        for t in tables:
+            entry = catalog.resolve(t)
+            if entry is not None and column.upper() in entry.columns:
+                return t
+    return None
+
+
+def _csr(n: int, src: array, dst: array) -> tuple[array, array]:
+    """Compressed sparse rows: targets of node i are targets[offsets[i]:offsets[i + 1]]."""
+    offsets = array("i", bytes(4 * (n + 1)))
+    for s in src:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    fill = array("i", offsets[:n])
+    targets = array("i", bytes(4 * len(src)))
+    for s, d in zip(src, dst):
+        targets[fill[s]] = d
+        fill[s] += 1
+    return offsets, targets
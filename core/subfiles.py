@@ -0,0 +1,175 @@
+"""
+Subfile relationships across display files and RPG programs.
+
+Parsing already links each subfile record (SFL) to its control record
+(SFLCTL) with SFLSIZ, SFLPAG and the option fields (DisplayFile.subfiles),
+and collects each program's record-level I/O (RpgProgram.file_operations).
+The index joins the two: a program uses a subfile when it declares the
+display file as WORKSTN and names the subfile or control record in an I/O
+opcode (READC, WRITE, CHAIN, UPDATE, EXFMT, ...). Names are upper case:
+display files and programs by member name (file stem), records by format
+name.
+
+Entries are kept per source file and saved as JSON with the file's size and
+mtime, so a later run only re-indexes the files that changed (as the schema
+catalog does); the join is computed on the first query after a change.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+SUBFILE_INDEX_VERSION = 1
+
+
+@dataclass
+class SubfileEntry:
+    """One subfile of a display file, with the programs using it (opcode -> programs)."""
+
+    file: str
+    record: str
+    control: str | None = None
+    size: int | None = None
+    page: int | None = None
+    option_fields: list[str] = field(default_factory=list)
+    operations: dict[str, list[str]] = field(default_factory=dict)  # resolved by SubfileIndex
+    control_operations: dict[str, list[str]] = field(default_factory=dict)
+
+    def programs(self, *opcodes: str) -> list[str]:
+        """Programs using the subfile record with any of opcodes (default READC and WRITE)."""
+        found: set[str] = set()
+        for opcode in opcodes or ("READC", "WRITE"):
+            found.update(self.operations.get(opcode, ()))
+        return sorted(found)
+
+
+class SubfileIndex:
+    """Subfiles of display files and the record-level I/O of programs, per source file."""
+
+    def __init__(self):
+        self._sources: dict[str, dict] = {}  # path -> {"stamp": [...], "subfiles": [...]} or {..., "program": ...}
+        self._entries: dict[tuple[str, str], SubfileEntry] | None = None  # (FILE, RECORD) -> entry, once resolved
+
+    # -- lookups -----------------------------------------------------------
+
+    def subfiles(self) -> list[SubfileEntry]:
+        return list(self._resolve().values())
+
+    def subfile(self, record: str, file: str | None = None) -> SubfileEntry | None:
+        """Subfile by record format name (in file, when given)."""
+        record = record.upper()
+        for (f, r), entry in self._resolve().items():
+            if r == record and (file is None or f == file.upper()):
+                return entry
+        return None
+
+    def subfiles_of(self, program: str) -> list[SubfileEntry]:
+        """Subfiles program reads, writes or updates (through the subfile or its control record)."""
+        program = program.upper()
+        return [e for e in self._resolve().values()
+                if any(program in p for p in (*e.operations.values(), *e.control_operations.values()))]
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    # -- building ----------------------------------------------------------
+
+    def add_display_file(self, display_file, source: str, name: str | None = None) -> None:
+        """Record the subfiles of a parsed DisplayFile."""
+        file = (name or display_file.name or Path(source).stem).upper()
+        self._source(source)["subfiles"] = [
+            asdict(SubfileEntry(
+                file=file,
+                record=s.record.name.upper(),
+                control=s.control.name.upper() if s.control is not None else None,
+                size=s.size,
+                page=s.page,
+                option_fields=[f.name.upper() for f in s.option_fields],
+            ))
+            for s in display_file.subfiles
+        ]
+        self._entries = None
+
+    def add_rpg_program(self, program_ast, source: str, name: str | None = None) -> None:
+        """Record the WORKSTN files and record-level I/O of a parsed RpgProgram."""
+        entry = self._source(source)
+        entry["program"] = (name or Path(source).stem).upper()
+        entry["workstn"] = sorted({f.name.upper() for f in program_ast.files if (f.device or "").upper() == "WORKSTN"})
+        entry["operations"] = [[op.opcode, op.name.upper()] for op in program_ast.file_operations]
+        self._entries = None
+
+    def remove_source(self, source: str) -> None:
+        """Drop everything the given file contributed."""
+        if self._sources.pop(str(source), None) is not None:
+            self._entries = None
+
+    def is_current(self, source: str) -> bool:
+        """True when source was indexed and has not changed on disk since."""
+        entry = self._sources.get(str(source))
+        return entry is not None and entry["stamp"] == _stamp(source)
+
+    def mark_current(self, source: str) -> None:
+        """Record the file's size/mtime so is_current can skip it next run."""
+        self._source(source)["stamp"] = _stamp(source)
+
+    def _source(self, source: str) -> dict:
+        return self._sources.setdefault(str(source), {"stamp": None})
+
+    def _resolve(self) -> dict[tuple[str, str], SubfileEntry]:
+        """Join programs to subfiles; kept until the next change."""
+        if self._entries is not None:
+            return self._entries
+        entries: dict[tuple[str, str], SubfileEntry] = {}
+        controls: dict[tuple[str, str], SubfileEntry] = {}
+        for source in self._sources.values():
+            for data in source.get("subfiles", ()):
+                entry = SubfileEntry(**{**data, "operations": {}, "control_operations": {}})
+                entries[entry.file, entry.record] = entry
+                if entry.control:
+                    controls[entry.file, entry.control] = entry
+        for source in self._sources.values():
+            program = source.get("program")
+            if program is None:
+                continue
+            for opcode, record in source["operations"]:
+                for file in source["workstn"]:
+                    entry = entries.get((file, record))
+                    if entry is not None:
+                        _add_program(entry.operations, opcode, program)
+                    entry = controls.get((file, record))
+                    if entry is not None:
+                        _add_program(entry.control_operations, opcode, program)
+        self._entries = entries
+        return entries
+
+    # -- persistence -------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        data = {"version": SUBFILE_INDEX_VERSION, "sources": self._sources}
+        Path(path).write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SubfileIndex":
+        """Load a saved index; a missing or out-of-date file gives an empty one."""
+        index = cls()
+        path = Path(path)
+        if not path.exists():
+            return index
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") == SUBFILE_INDEX_VERSION:
+            index._sources = data.get("sources", {})
+        return index
+
+
+def _add_program(operations: dict[str, list[str]], opcode: str, program: str) -> None:
+    programs = operations.setdefault(opcode, [])
+    if program not in programs:
+        programs.append(program)
+
+
+def _stamp(source: str | Path) -> list[int] | None:
+    try:
+        st = Path(source).stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
@@ -8,6 +8,7 @@ statement-splitting parser when grammars are not generated.
 import re
 from core.diagnostics import Diagnostic
 from core.antlr_listener import HAS_ANTLR, DiagnosticErrorListener
+from db2.splitter import iter_sql_statements
 from db2.ast_nodes import (
     Db2Script,
     Db2Select,
@@ -15,6 +16,8 @@ from db2.ast_nodes import (
     Db2Update,
     Db2Delete,
     Db2Ddl,
+    ColumnDef,
+    TableConstraint,
     TableRef,
     ColumnRef,
     Predicate,
@@ -23,31 +26,59 @@ from db2.ast_nodes import (
 
 FILENAME = "<memory>"
 
+_WORD_RE = re.compile(r"[\w.]+")
+
+# Below this size a script is parsed in-process; process start-up would dominate.
+PARALLEL_MIN_BYTES = 1 << 20
+
 try:
     from db2.gen.db2_parserVisitor import db2_parserVisitor
 except ImportError:
     db2_parserVisitor = None  # type: ignore
 
 
-def parse_db2(source: str, filename: str = FILENAME) -> tuple[Db2Script, list[Diagnostic]]:
+def parse_db2(
+    source: str, filename: str = FILENAME, workers: int | None = None
+) -> tuple[Db2Script, list[Diagnostic]]:
     """
     Parse DB2 SQL script into Db2Script AST.
 
     Uses ANTLR parser from db2.gen when available; otherwise statement-splitting fallback.
+    Scripts of PARALLEL_MIN_BYTES or more are cut at statement boundaries and
+    parsed in worker processes (see db2.parallel); workers=1 forces a single
+    in-process parse.
+    """
+    if workers != 1 and len(source) >= PARALLEL_MIN_BYTES:
+        from db2.parallel import parse_db2_parallel
+
+        return parse_db2_parallel(source, filename, workers)
+    return parse_db2_chunk(source, filename)
+
+
+def parse_db2_chunk(source: str, filename: str = FILENAME, first_line: int = 1) -> tuple[Db2Script, list[Diagnostic]]:
+    """
+    Parse one piece of a script in-process, numbering lines from first_line.
+
+    This is the unit of work of parse_db2: the whole script for small inputs,
+    one chunk of statements per worker for large ones. When the whole piece
+    does not parse, its errors are dropped: the statement fallback reports
+    each statement it cannot parse instead.
     """
     diagnostics: list[Diagnostic] = []
 
     try:
-        ast = _parse_with_antlr(source, filename, diagnostics)
+        ast = _parse_with_antlr(source, filename, [], first_line)
         if ast is not None:
             return ast, diagnostics
     except ImportError:
         pass
 
-    return _fallback_parse_db2(source, filename, diagnostics)
+    return _fallback_parse_db2(source, filename, diagnostics, first_line)
 
 
-def _parse_with_antlr(source: str, filename: str, diagnostics: list[Diagnostic]) -> Db2Script | None:
+def _parse_with_antlr(
+    source: str, filename: str, diagnostics: list[Diagnostic], first_line: int = 1
+) -> Db2Script | None:
     """Parse using generated db2_lexer/db2_parser. Returns None on parse error."""
     if not HAS_ANTLR:
         return None
@@ -60,6 +91,7 @@ def _parse_with_antlr(source: str, filename: str, diagnostics: list[Diagnostic])
 
     stream = InputStream(source)
     lexer = db2_lexer(stream)
+    lexer.line = first_line
     tokens = CommonTokenStream(lexer)
     parser = db2_parser(tokens)
 
@@ -83,60 +115,347 @@ def _parse_with_antlr(source: str, filename: str, diagnostics: list[Diagnostic])
 
 
 if db2_parserVisitor is not None:
+    from db2.gen.db2_parser import db2_parser
+
+    # comparisonOperator token type -> Predicate.kind
+    _COMPARISON_KINDS = {
+        db2_parser.EQUALS: "equals",
+        db2_parser.NE: "not_equals",
+        db2_parser.GT: "gt",
+        db2_parser.LT: "lt",
+        db2_parser.GE: "ge",
+        db2_parser.LE: "le",
+        db2_parser.LIKE: "like",
+        db2_parser.NOT_LIKE: "not_like",
+    }
 
     class Db2AstVisitor(db2_parserVisitor):
-        """Builds Db2Script AST from db2_parser parse tree."""
+        """
+        Builds Db2Script AST from db2_parser parse tree.
+
+        Tables, columns, predicates, joins and group-by are read from the rule
+        contexts; only leaf expressions are kept as text, sliced from the
+        original input so whitespace survives.
+        """
 
         def __init__(self, filename: str):
             self.filename = filename
             self._statements: list = []
 
+        def _loc(self, ctx) -> SourceLocation:
+            start = ctx.start
+            return SourceLocation(self.filename, start.line if start else 1, start.column if start else 0)
+
         def visitSqlScript(self, ctx):
             self._statements = []
             for stmt_ctx in ctx.sqlStatement():
                 result = self.visit(stmt_ctx)
                 if result is not None:
                     self._statements.append(result)
-            loc = SourceLocation(self.filename, ctx.start.line if ctx.start else 1, ctx.start.column if ctx.start else 0)
-            return Db2Script(loc=loc, statements=self._statements)
+            return Db2Script(loc=self._loc(ctx), statements=self._statements)
 
         def visitSqlStatement(self, ctx):
-            if ctx.selectStatement():
-                return self.visit(ctx.selectStatement())
-            if ctx.insertStatement():
-                return self.visit(ctx.insertStatement())
-            if ctx.updateStatement():
-                return self.visit(ctx.updateStatement())
-            if ctx.deleteStatement():
-                return self.visit(ctx.deleteStatement())
-            if ctx.createStatement():
-                return self.visit(ctx.createStatement())
-            return self.visitChildren(ctx)
+            for child in (
+                ctx.selectStatement(),
+                ctx.insertStatement(),
+                ctx.updateStatement(),
+                ctx.deleteStatement(),
+                ctx.createStatement(),
+                ctx.alterStatement(),
+                ctx.dropStatement(),
+            ):
+                if child is not None:
+                    return self.visit(child)
+            return None
 
         def visitSelectStatement(self, ctx):
-            text = ctx.getText()
-            loc = SourceLocation(self.filename, ctx.start.line if ctx.start else 1, ctx.start.column if ctx.start else 0)
-            return _parse_select_from_text(text, self.filename, ctx.start.line if ctx.start else 1)
+            select_list = ctx.selectList()
+            if select_list.ASTERISK() is not None:
+                columns: list = ["*"]
+            else:
+                columns = [self._select_item(item) for item in select_list.selectItem()]
+            group_by = []
+            if ctx.groupByClause() is not None:
+                group_by = [self._operand(e) for e in ctx.groupByClause().expression()]
+            order_by = []
+            if ctx.orderByClause() is not None:
+                order_by = [self._order_item(item) for item in ctx.orderByClause().orderByItem()]
+            return Db2Select(
+                loc=self._loc(ctx),
+                columns=columns,
+                from_tables=self._table_expression(ctx.tableExpression()),
+                where=self._where(ctx.whereClause()),
+                group_by=group_by,
+                order_by=order_by,
+                into=[self._host_variable(hv) for hv in ctx.hostVariable()],
+            )
 
         def visitInsertStatement(self, ctx):
-            text = ctx.getText()
-            return _parse_insert_from_text(text, self.filename, ctx.start.line if ctx.start else 1)
+            columns = []
+            if ctx.columnList() is not None:
+                columns = [self._column_name(c) for c in ctx.columnList().columnName()]
+            values = None
+            if ctx.valueList() is not None:
+                values = [_source_text(e) for e in ctx.valueList().expression()]
+            select = self.visit(ctx.selectStatement()) if ctx.selectStatement() is not None else None
+            return Db2Insert(
+                loc=self._loc(ctx),
+                table=self._table_name(ctx.tableName()),
+                columns=columns,
+                values=values,
+                select=select,
+            )
 
         def visitUpdateStatement(self, ctx):
-            text = ctx.getText()
-            return _parse_update_from_text(text, self.filename, ctx.start.line if ctx.start else 1)
+            set_clauses = [
+                (self._column_name(sc.columnName()), _source_text(sc.expression()))
+                for sc in ctx.setClause()
+            ]
+            return Db2Update(
+                loc=self._loc(ctx),
+                table=self._table_name(ctx.tableName()),
+                set_clauses=set_clauses,
+                where=self._where(ctx.whereClause()),
+            )
 
         def visitDeleteStatement(self, ctx):
-            text = ctx.getText()
-            return _parse_delete_from_text(text, self.filename, ctx.start.line if ctx.start else 1)
+            return Db2Delete(
+                loc=self._loc(ctx),
+                table=self._table_name(ctx.tableName()),
+                where=self._where(ctx.whereClause()),
+            )
 
         def visitCreateStatement(self, ctx):
-            text = ctx.getText()
-            if "TABLE" in text.upper()[:20]:
-                return _parse_create_table_from_text(text, self.filename, ctx.start.line if ctx.start else 1)
-            if "VIEW" in text.upper()[:20]:
-                return _parse_create_view_from_text(text, self.filename, ctx.start.line if ctx.start else 1)
-            return None
+            return self.visitChildren(ctx)
+
+        def visitCreateTableStatement(self, ctx):
+            ddl = self._ddl(ctx, "CREATE TABLE", ctx.tableName())
+            for element in ctx.tableElement():
+                if element.columnDefinition() is not None:
+                    self._column_definition(element.columnDefinition(), ddl)
+                else:
+                    ddl.constraints.append(self._table_constraint(element.tableConstraint()))
+            return ddl
+
+        def visitCreateViewStatement(self, ctx):
+            return self._ddl(ctx, "CREATE VIEW", ctx.tableName())
+
+        def visitCreateIndexStatement(self, ctx):
+            ddl = self._ddl(ctx, "CREATE INDEX", ctx.tableName(0))
+            ddl.unique = ctx.UNIQUE() is not None
+            ddl.on_table = self._table_name(ctx.tableName(1))
+            ddl.keys = [self._order_item(item) for item in ctx.orderByItem()]
+            return ddl
+
+        def visitCreateSequenceStatement(self, ctx):
+            return Db2Ddl(loc=self._loc(ctx), kind="CREATE SEQUENCE", name=ctx.IDENTIFIER().getText(),
+                          body=_source_text(ctx))
+
+        def visitAlterStatement(self, ctx):
+            ddl = self._ddl(ctx, "ALTER TABLE", ctx.tableName())
+            action = ctx.alterAction()
+            if action.columnDefinition() is not None:
+                self._column_definition(action.columnDefinition(), ddl)
+            elif action.tableConstraint() is not None:
+                ddl.constraints.append(self._table_constraint(action.tableConstraint()))
+            return ddl
+
+        def visitDropStatement(self, ctx):
+            kind = "DROP " + ctx.getChild(1).getText().upper()
+            return self._ddl(ctx, kind, ctx.objectName().tableName())
+
+        # -- helpers -----------------------------------------------------
+
+        def _ddl(self, ctx, kind: str, name_ctx) -> Db2Ddl:
+            ref = self._table_name(name_ctx)
+            return Db2Ddl(loc=self._loc(ctx), kind=kind, name=ref.name, schema=ref.schema,
+                          body=_source_text(ctx))
+
+        def _column_definition(self, ctx, ddl: Db2Ddl) -> None:
+            """Append the column to ddl.columns and its column-level constraints to ddl.constraints."""
+            name = ctx.columnName().getText()
+            data_type = ctx.dataType()
+            column = ColumnDef(loc=self._loc(ctx), name=name, data_type=" ".join(data_type.getChild(0).getText().upper().split()))
+            size = data_type.length() or data_type.precision()
+            if size is not None:
+                column.length = int(size.getText())
+            if data_type.scale() is not None:
+                column.scale = int(data_type.scale().getText())
+            ddl.columns.append(column)
+
+            for cc in ctx.columnConstraint():
+                constraint_name = cc.constraintName().getText() if cc.constraintName() is not None else None
+                if cc.NOT_NULL() is not None:
+                    column.nullable = False
+                elif cc.DEFAULT() is not None and cc.GENERATED() is None:
+                    column.default = _source_text(cc.defaultValue()) if cc.defaultValue() is not None else ""
+                elif cc.GENERATED() is not None:
+                    column.identity = "ALWAYS" if cc.ALWAYS() is not None else "BY DEFAULT"
+                    column.nullable = False
+                elif cc.PRIMARY() is not None:
+                    column.nullable = False
+                    ddl.constraints.append(TableConstraint(self._loc(cc), "PRIMARY KEY", constraint_name, [name]))
+                elif cc.UNIQUE() is not None:
+                    ddl.constraints.append(TableConstraint(self._loc(cc), "UNIQUE", constraint_name, [name]))
+                elif cc.CHECK() is not None:
+                    ddl.constraints.append(TableConstraint(self._loc(cc), "CHECK", constraint_name, [name],
+                                                           check=_source_text(cc.checkCondition())))
+                elif cc.REFERENCES() is not None:
+                    fk = TableConstraint(self._loc(cc), "FOREIGN KEY", constraint_name, [name],
+                                         references=self._table_name(cc.tableName()))
+                    if cc.columnList() is not None:
+                        fk.ref_columns = [c.getText() for c in cc.columnList().columnName()]
+                    self._referential_actions(cc.referentialAction(), fk)
+                    ddl.constraints.append(fk)
+
+        def _table_constraint(self, ctx) -> TableConstraint:
+            definition = ctx.constraintDefinition()
+            name = ctx.constraintName().getText() if ctx.constraintName() is not None else None
+            column_lists = [[c.getText() for c in cl.columnName()] for cl in definition.columnList()]
+            columns = column_lists[0] if column_lists else []
+            if definition.PRIMARY() is not None:
+                return TableConstraint(self._loc(ctx), "PRIMARY KEY", name, columns)
+            if definition.UNIQUE() is not None:
+                return TableConstraint(self._loc(ctx), "UNIQUE", name, columns)
+            if definition.CHECK() is not None:
+                return TableConstraint(self._loc(ctx), "CHECK", name,
+                                       check=_source_text(definition.checkCondition()))
+            fk = TableConstraint(self._loc(ctx), "FOREIGN KEY", name, columns,
+                                 references=self._table_name(definition.tableName()),
+                                 ref_columns=column_lists[1] if len(column_lists) > 1 else [])
+            self._referential_actions(definition.referentialAction(), fk)
+            return fk
+
+        def _referential_actions(self, actions, fk: TableConstraint) -> None:
+            for action in actions:
+                rule = " ".join(_source_text(action, action.getChild(2).symbol).split()).upper()
+                if action.DELETE() is not None:
+                    fk.on_delete = rule
+                else:
+                    fk.on_update = rule
+
+        def _table_name(self, ctx, alias: str | None = None) -> TableRef:
+            schema = ctx.schemaName().getText() if ctx.schemaName() is not None else None
+            return TableRef(loc=self._loc(ctx), name=ctx.IDENTIFIER().getText(), alias=alias, schema=schema)
+
+        def _host_variable(self, ctx) -> str:
+            """":VAR" or ":DS.FIELD", without any indicator variable."""
+            name = ctx.IDENTIFIER(1) if ctx.DOT() is not None else ctx.IDENTIFIER(0)
+            return _source_text(ctx, ctx.start, name.symbol)
+
+        def _column_name(self, ctx) -> ColumnRef:
+            return ColumnRef(loc=self._loc(ctx), name=ctx.getText())
+
+        def _column_ref(self, ctx) -> ColumnRef:
+            ref = ColumnRef(loc=self._loc(ctx), name=ctx.columnName().getText())
+            qualifier = ctx.tableQualifier()
+            if qualifier is not None:
+                ref.table_alias = qualifier.IDENTIFIER().getText()
+                if qualifier.schemaName() is not None:
+                    ref.schema = qualifier.schemaName().getText()
+            return ref
+
+        def _select_item(self, ctx) -> ColumnRef | str:
+            if ctx.ASTERISK() is not None:
+                return _source_text(ctx)
+            item = self._operand(ctx.expression())
+            if isinstance(item, ColumnRef):
+                if ctx.alias() is not None:
+                    item.alias = ctx.alias().getText()
+                return item
+            return _source_text(ctx)
+
+        def _order_item(self, ctx) -> tuple[ColumnRef | str, str]:
+            return self._operand(ctx.expression()), "DESC" if ctx.DESC() is not None else "ASC"
+
+        def _table_expression(self, ctx) -> list[TableRef]:
+            if ctx.tableReference() is not None:
+                return [self._table_reference(ctx.tableReference())]
+            tables = self._table_expression(ctx.tableExpression())
+            join = ctx.joinClause()
+            if join is not None:
+                tables.append(self._join(join))
+            return tables
+
+        def _table_reference(self, ctx, join_type: str | None = None,
+                             join_on: Predicate | None = None) -> TableRef:
+            alias = ctx.alias().getText() if ctx.alias() is not None else None
+            if ctx.tableName() is not None:
+                ref = self._table_name(ctx.tableName(), alias)
+            elif ctx.tableFunctionName() is not None:
+                ref = TableRef(loc=self._loc(ctx), name=ctx.tableFunctionName().getText(), alias=alias)
+            else:
+                ref = TableRef(loc=self._loc(ctx), name="<subquery>", alias=alias)
+            ref.join_type = join_type
+            ref.join_on = join_on
+            return ref
+
+        def _join(self, ctx) -> TableRef:
+            words = [ctx.getChild(i).getText().upper() for i in range(ctx.getChildCount())]
+            qualifier = words[: words.index("JOIN")]
+            join_type = " ".join(qualifier) if qualifier else "INNER"
+            join_on = None
+            if ctx.joinCondition() is not None:
+                join_on = self._predicate(ctx.joinCondition().expression())
+            elif ctx.columnList() is not None:
+                join_on = Predicate(loc=self._loc(ctx.columnList()), kind="using",
+                                    right=_source_text(ctx.columnList()))
+            return self._table_reference(ctx.tableReference(), join_type, join_on)
+
+        def _where(self, ctx) -> Predicate | None:
+            return self._predicate(ctx.expression()) if ctx is not None else None
+
+        def _operand(self, ctx) -> ColumnRef | str:
+            """Column reference when the expression is a bare column, otherwise its source text."""
+            if isinstance(ctx, db2_parser.PrimaryExprContext):
+                col = ctx.primaryExpression().columnReference()
+                if col is not None:
+                    return self._column_ref(col)
+            return _source_text(ctx)
+
+        def _predicate(self, ctx) -> Predicate:
+            loc = self._loc(ctx)
+            if isinstance(ctx, (db2_parser.AndExprContext, db2_parser.OrExprContext)):
+                kind = "and" if isinstance(ctx, db2_parser.AndExprContext) else "or"
+                children: list[Predicate] = []
+                for operand in ctx.expression():
+                    child = self._predicate(operand)
+                    if child.kind == kind:
+                        children.extend(child.children)
+                    else:
+                        children.append(child)
+                return Predicate(loc=loc, kind=kind, children=children)
+            if isinstance(ctx, db2_parser.NotExprContext):
+                return Predicate(loc=loc, kind="not", children=[self._predicate(ctx.expression())])
+            if isinstance(ctx, db2_parser.ParenExprContext) and len(ctx.expression()) == 1:
+                return self._predicate(ctx.expression(0))
+            if isinstance(ctx, db2_parser.ComparisonExprContext):
+                kind = _COMPARISON_KINDS.get(ctx.comparisonOperator().start.type, "compare")
+                return Predicate(loc=loc, kind=kind, left=self._operand(ctx.expression(0)),
+                                 right=self._operand(ctx.expression(1)))
+            if isinstance(ctx, db2_parser.InExprContext):
+                kind = "not_in" if ctx.NOT_IN() is not None else "in"
+                values = _source_text(ctx, ctx.LPAREN().symbol, ctx.RPAREN().symbol)
+                return Predicate(loc=loc, kind=kind, left=self._operand(ctx.expression(0)), right=values)
+            if isinstance(ctx, db2_parser.BetweenExprContext):
+                kind = "not_between" if ctx.NOT_BETWEEN() is not None else "between"
+                bounds = _source_text(ctx, ctx.expression(1).start, ctx.expression(2).stop)
+                return Predicate(loc=loc, kind=kind, left=self._operand(ctx.expression(0)), right=bounds)
+            if isinstance(ctx, db2_parser.IsNullExprContext):
+                kind = "is_not_null" if ctx.IS_NOT() is not None else "is_null"
+                return Predicate(loc=loc, kind=kind, left=self._operand(ctx.expression()))
+            if isinstance(ctx, db2_parser.ExistsExprContext):
+                kind = "not_exists" if ctx.NOT_EXISTS() is not None else "exists"
+                return Predicate(loc=loc, kind=kind, right=_source_text(ctx.subquery()))
+            return Predicate(loc=loc, kind="expr", right=_source_text(ctx))
+
+    def _source_text(ctx, start=None, stop=None) -> str:
+        """Original input text spanned by ctx (or by the start/stop tokens given)."""
+        start = start or ctx.start
+        stop = stop or ctx.stop
+        if start is None or stop is None or stop.stop < start.start:
+            return ""
+        return start.getInputStream().getText(start.start, stop.stop)
 
 else:
     Db2AstVisitor = None  # type: ignore
@@ -154,8 +473,9 @@ def _parse_select_from_text(text: str, filename: str, line: int) -> Db2Select:
             schema, tname = tname.split(".", 1)
         tables.append(TableRef(loc=loc, name=tname, alias=alias, schema=schema))
     cols: list = []
-    if " FROM " in text.upper():
-        cols_part = text[: text.upper().index(" FROM ")].strip()
+    from_kw = re.search(r"\sFROM\s", text, re.I)
+    if from_kw:
+        cols_part = text[: from_kw.start()].strip()
         if cols_part.upper().startswith("SELECT"):
             cols_part = cols_part[6:].strip()
         if cols_part == "*":
@@ -220,26 +540,47 @@ def _parse_create_view_from_text(text: str, filename: str, line: int) -> Db2Ddl:
 
 
 def _fallback_parse_db2(
-    source: str, filename: str, diagnostics: list[Diagnostic]
+    source: str, filename: str, diagnostics: list[Diagnostic], first_line: int = 1
 ) -> tuple[Db2Script, list[Diagnostic]]:
-    """Statement-splitting fallback parser for DB2 SQL."""
-    loc = SourceLocation(filename, 1, 0)
+    """
+    Statement-splitting fallback parser for DB2 SQL.
+
+    Each statement is retried on its own with the ANTLR parser, so one
+    unsupported statement (a trigger, a GRANT) does not cost the structured
+    AST of its neighbours; the text parser only handles what ANTLR rejects.
+    A statement neither accepts gets one warning, with ANTLR's first error.
+    """
+    loc = SourceLocation(filename, first_line, 0)
     statements: list = []
 
-    parts = re.split(r";\s*", source)
-    line_num = 1
-    for part in parts:
-        part = part.strip()
-        if not part or part.startswith("--"):
-            continue
-        stmt = _parse_statement(part.strip(), filename, line_num, diagnostics)
+    for part in iter_sql_statements(source.splitlines(keepends=True)):
+        line = part.line + first_line - 1
+        errors: list[Diagnostic] = []
+        stmt = _parse_statement_with_antlr(part.text, filename, line, part.column, errors)
+        if stmt is None:
+            stmt = _parse_statement(part.text, filename, line, diagnostics)
         if stmt:
             statements.append(stmt)
-        line_num += part.count("\n") + 1
+        else:
+            head = " ".join(_WORD_RE.findall(part.text)[:3])
+            reason = f": {errors[0].message}" if errors else ""
+            diagnostics.append(Diagnostic(filename, line, part.column, "warning",
+                                          f"statement {head} ... not parsed; skipped{reason}"))
 
     return Db2Script(loc=loc, statements=statements), diagnostics
 
 
+def _parse_statement_with_antlr(text: str, filename: str, line: int, column: int,
+                                errors: list[Diagnostic] | None = None):
+    """ANTLR-parse a single statement in place; None if it does not parse (its errors go to errors)."""
+    if Db2AstVisitor is None:
+        return None
+    script = _parse_with_antlr(" " * column + text, filename, errors if errors is not None else [], line)
+    if script is None or len(script.statements) != 1:
+        return None
+    return script.statements[0]
+
+
 def _parse_statement(
     text: str, filename: str, line: int, diagnostics: list[Diagnostic]
 ):
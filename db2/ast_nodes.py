@@ -26,6 +26,8 @@ class TableRef:
     name: str
     alias: str | None = None
     schema: str | None = None
+    join_type: str | None = None  # None for the first FROM table; "INNER", "LEFT OUTER", ...
+    join_on: "Predicate | None" = None
 
 
 @dataclass
@@ -36,6 +38,7 @@ class ColumnRef:
     name: str
     table_alias: str | None = None
     schema: str | None = None
+    alias: str | None = None  # AS name in a select list
 
 
 @dataclass
@@ -59,6 +62,7 @@ class Db2Select:
     where: Predicate | None = None
     group_by: list[ColumnRef | str] = field(default_factory=list)
     order_by: list[tuple[ColumnRef | str, str]] = field(default_factory=list)  # col, ASC/DESC
+    into: list[str] = field(default_factory=list)  # SELECT ... INTO host variables (":VAR")
 
 
 @dataclass
@@ -91,6 +95,35 @@ class Db2Delete:
     where: Predicate | None = None
 
 
+@dataclass
+class ColumnDef:
+    """Column definition (CREATE TABLE, ALTER TABLE ADD COLUMN)."""
+
+    loc: SourceLocation
+    name: str
+    data_type: str  # "INTEGER" | "DECIMAL" | "VARCHAR" | ...
+    length: int | None = None  # length, or precision for DECIMAL/TIMESTAMP
+    scale: int | None = None
+    nullable: bool = True
+    default: str | None = None  # expression text; "" for a bare WITH DEFAULT
+    identity: str | None = None  # "ALWAYS" | "BY DEFAULT" for GENERATED ... AS IDENTITY
+
+
+@dataclass
+class TableConstraint:
+    """PRIMARY KEY, UNIQUE, FOREIGN KEY or CHECK constraint (column- or table-level)."""
+
+    loc: SourceLocation
+    kind: str  # "PRIMARY KEY" | "UNIQUE" | "FOREIGN KEY" | "CHECK"
+    name: str | None = None
+    columns: list[str] = field(default_factory=list)
+    references: TableRef | None = None  # FOREIGN KEY parent table
+    ref_columns: list[str] = field(default_factory=list)
+    on_delete: str | None = None  # "CASCADE" | "RESTRICT" | "SET NULL" | "NO ACTION" | "SET DEFAULT"
+    on_update: str | None = None
+    check: str | None = None  # CHECK condition text
+
+
 @dataclass
 class Db2Ddl:
     """DDL statement (CREATE TABLE, CREATE VIEW, etc.)."""
@@ -100,6 +133,19 @@ class Db2Ddl:
     name: str
     schema: str | None = None
     body: str | None = None  # raw DDL text for complex cases
+    columns: list[ColumnDef] = field(default_factory=list)
+    constraints: list[TableConstraint] = field(default_factory=list)
+    on_table: TableRef | None = None  # CREATE INDEX: indexed table
+    keys: list[tuple[ColumnRef | str, str]] = field(default_factory=list)  # CREATE INDEX: key, ASC/DESC
+    unique: bool = False  # CREATE UNIQUE INDEX
+
+    @property
+    def primary_key(self) -> list[str]:
+        """Primary key column names, whether declared on a column or the table."""
+        for c in self.constraints:
+            if c.kind == "PRIMARY KEY":
+                return c.columns
+        return []
 
 
 Db2Statement = Db2Select | Db2Insert | Db2Update | Db2Delete | Db2Ddl
@@ -1,4 +1,4 @@
-# Generated from C:/Users/natar/AI/AS400Parser/grammars/db2_lexer.g4 by ANTLR 4.13.2
+# Generated from db2_lexer.g4 by ANTLR 4.13.2
 from antlr4 import *
 from io import StringIO
 import sys
@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,216,2038,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,
+        4,0,232,2182,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,
         5,2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,
         2,13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,
         7,19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,
@@ -46,147 +46,161 @@ def serializedATN():
         2,197,7,197,2,198,7,198,2,199,7,199,2,200,7,200,2,201,7,201,2,202,
         7,202,2,203,7,203,2,204,7,204,2,205,7,205,2,206,7,206,2,207,7,207,
         2,208,7,208,2,209,7,209,2,210,7,210,2,211,7,211,2,212,7,212,2,213,
-        7,213,2,214,7,214,2,215,7,215,1,0,1,0,5,0,436,8,0,10,0,12,0,439,
-        9,0,1,1,4,1,442,8,1,11,1,12,1,443,1,1,1,1,4,1,448,8,1,11,1,12,1,
-        449,3,1,452,8,1,1,2,1,2,5,2,456,8,2,10,2,12,2,459,9,2,1,2,1,2,1,
-        3,1,3,5,3,465,8,3,10,3,12,3,468,9,3,1,3,1,3,1,4,1,4,1,4,1,4,5,4,
-        476,8,4,10,4,12,4,479,9,4,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,8,1,
-        8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,15,
-        1,15,1,16,1,16,1,17,1,17,1,18,1,18,1,19,1,19,1,20,1,20,1,21,1,21,
-        1,22,1,22,1,23,1,23,1,24,1,24,1,25,1,25,1,26,1,26,1,27,1,27,1,28,
-        1,28,1,29,1,29,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,31,3,31,541,
-        8,31,1,32,1,32,1,33,1,33,1,34,1,34,1,34,1,35,1,35,1,35,1,36,1,36,
-        1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
-        1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,40,1,40,
-        1,40,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
-        1,41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,42,1,43,1,43,1,43,1,43,
-        1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,
-        1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,
-        1,46,1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,49,1,49,1,49,1,49,1,50,
-        1,50,1,50,1,50,1,50,1,50,1,50,3,50,652,8,50,1,51,4,51,655,8,51,11,
-        51,12,51,656,1,51,1,51,1,52,1,52,1,52,1,52,5,52,665,8,52,10,52,12,
-        52,668,9,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,1,53,1,53,5,53,679,
-        8,53,10,53,12,53,682,9,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,
-        1,54,1,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,56,1,57,
-        1,57,1,57,1,57,1,57,1,57,1,58,1,58,1,58,1,59,1,59,1,59,1,59,1,59,
-        1,59,1,59,1,60,1,60,1,60,1,60,1,60,1,60,1,61,1,61,1,61,1,61,1,62,
-        1,62,1,62,1,62,1,62,1,63,1,63,1,63,1,63,1,63,1,63,1,64,1,64,1,64,
-        1,64,1,64,1,64,1,64,1,65,1,65,1,65,1,65,1,65,1,65,1,66,1,66,1,66,
-        1,66,1,66,1,66,1,67,1,67,1,67,1,67,1,67,1,68,1,68,1,68,1,68,1,68,
-        1,69,1,69,1,69,1,69,1,69,1,70,1,70,1,70,1,70,1,70,1,70,1,70,1,71,
-        1,71,1,71,1,71,1,71,1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,72,1,72,
-        1,73,1,73,1,73,1,73,1,73,1,73,1,74,1,74,1,74,1,74,1,74,1,74,1,74,
-        1,75,1,75,1,75,1,75,1,76,1,76,1,76,1,76,1,76,1,77,1,77,1,77,1,77,
-        1,77,1,77,1,77,1,78,1,78,1,78,1,78,1,78,1,78,1,79,1,79,1,79,1,79,
-        1,79,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,81,1,81,1,81,
-        1,81,1,81,1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,82,1,83,1,83,1,83,
-        1,83,1,83,1,83,1,83,1,84,1,84,1,84,1,84,1,84,1,84,1,85,1,85,1,85,
-        1,85,1,85,1,86,1,86,1,86,1,86,1,86,1,86,1,87,1,87,1,87,1,87,1,87,
-        1,87,1,87,1,87,1,87,1,88,1,88,1,88,1,88,1,88,1,88,1,88,1,89,1,89,
-        1,89,1,89,1,89,1,89,1,89,1,89,1,89,1,90,1,90,1,90,1,90,1,90,1,90,
-        1,90,1,90,1,90,1,90,1,90,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,91,
-        1,91,1,91,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,3,92,
-        938,8,92,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,94,1,94,
-        1,94,1,94,1,94,1,94,1,94,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,
-        1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,3,95,973,8,95,1,96,
-        1,96,1,96,1,96,1,96,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,
-        1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,1,97,
-        3,97,1002,8,97,1,98,1,98,1,98,1,98,1,98,1,98,1,99,1,99,1,99,1,99,
-        1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,3,99,1023,8,99,1,100,
-        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,
-        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,
-        1,100,3,100,1049,8,100,1,101,1,101,1,101,1,101,1,101,1,101,1,101,
-        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,
-        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,3,101,1077,8,101,
+        7,213,2,214,7,214,2,215,7,215,2,216,7,216,2,217,7,217,2,218,7,218,
+        2,219,7,219,2,220,7,220,2,221,7,221,2,222,7,222,2,223,7,223,2,224,
+        7,224,2,225,7,225,2,226,7,226,2,227,7,227,2,228,7,228,2,229,7,229,
+        2,230,7,230,2,231,7,231,1,0,4,0,467,8,0,11,0,12,0,468,1,0,1,0,4,
+        0,473,8,0,11,0,12,0,474,3,0,477,8,0,1,1,1,1,1,1,1,1,5,1,483,8,1,
+        10,1,12,1,486,9,1,1,1,1,1,1,2,1,2,5,2,492,8,2,10,2,12,2,495,9,2,
+        1,2,1,2,1,3,1,3,1,3,1,3,5,3,503,8,3,10,3,12,3,506,9,3,1,3,1,3,1,
+        4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,11,
+        1,12,1,12,1,13,1,13,1,14,1,14,1,15,1,15,1,16,1,16,1,17,1,17,1,18,
+        1,18,1,19,1,19,1,20,1,20,1,21,1,21,1,22,1,22,1,23,1,23,1,24,1,24,
+        1,25,1,25,1,26,1,26,1,27,1,27,1,27,1,28,1,28,1,29,1,29,1,30,1,30,
+        1,31,1,31,1,31,1,31,1,31,1,31,3,31,571,8,31,1,32,1,32,1,33,1,33,
+        1,34,1,34,1,34,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,37,1,37,
+        1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,38,1,38,1,38,1,39,1,39,
+        1,39,1,39,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,
+        1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
+        1,41,1,42,1,42,1,42,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,44,
+        1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,
+        1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,46,1,47,1,47,1,47,1,48,
+        1,48,1,48,1,48,1,49,1,49,1,49,1,49,1,50,1,50,1,50,1,50,1,50,1,50,
+        1,50,3,50,682,8,50,1,51,4,51,685,8,51,11,51,12,51,686,1,51,1,51,
+        1,52,1,52,1,52,1,52,5,52,695,8,52,10,52,12,52,698,9,52,1,52,1,52,
+        1,52,1,52,1,52,1,53,1,53,1,53,1,53,5,53,709,8,53,10,53,12,53,712,
+        9,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,55,1,55,1,55,
+        1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,56,1,57,1,57,1,57,1,57,1,57,
+        1,57,1,58,1,58,1,58,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,60,1,60,
+        1,60,1,60,1,60,1,60,1,61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,1,62,
+        1,63,1,63,1,63,1,63,1,63,1,63,1,64,1,64,1,64,1,64,1,64,1,64,1,64,
+        1,65,1,65,1,65,1,65,1,65,1,65,1,66,1,66,1,66,1,66,1,66,1,66,1,67,
+        1,67,1,67,1,67,1,67,1,68,1,68,1,68,1,68,1,68,1,69,1,69,1,69,1,69,
+        1,69,1,70,1,70,1,70,1,70,1,70,1,70,1,70,1,71,1,71,1,71,1,71,1,71,
+        1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,73,1,73,1,73,1,73,
+        1,73,1,73,1,74,1,74,1,74,1,74,1,74,1,74,1,74,1,75,1,75,1,75,1,75,
+        1,76,1,76,1,76,1,76,1,76,1,77,1,77,1,77,1,78,1,78,1,78,1,79,1,79,
+        1,79,1,79,1,79,1,79,1,79,1,79,1,80,1,80,1,80,1,80,1,80,1,80,1,80,
+        1,81,1,81,1,81,1,81,1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,83,1,83,
+        1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,84,1,84,1,84,1,84,1,84,1,84,
+        1,84,1,85,1,85,1,85,1,85,1,85,1,85,1,86,1,86,1,86,1,86,1,86,1,86,
+        1,86,1,87,1,87,1,87,1,87,1,87,1,87,1,88,1,88,1,88,1,88,1,88,1,89,
+        1,89,1,89,1,89,1,89,1,89,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,
+        1,90,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,92,1,92,1,92,1,92,1,92,
+        1,92,1,92,1,92,1,92,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,
+        1,93,1,93,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,94,1,95,
+        1,95,1,95,1,95,1,95,1,95,1,95,1,96,1,96,1,96,1,96,1,97,1,97,1,97,
+        1,97,1,97,1,97,1,97,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,99,
+        1,99,1,99,1,99,1,99,1,99,1,99,1,100,1,100,1,100,1,100,1,100,1,100,
+        1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,102,
         1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,102,1,103,1,103,1,103,
-        1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,
-        1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,
-        3,103,1112,8,103,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,3,104,
-        1154,8,104,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,
-        1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,1,105,
-        1,105,1,105,1,105,3,105,1179,8,105,1,106,1,106,1,106,1,106,1,106,
-        1,107,1,107,1,107,1,107,1,107,1,108,1,108,1,108,1,108,1,108,1,108,
-        1,108,1,108,1,108,1,108,1,109,1,109,1,109,1,109,1,110,1,110,1,110,
-        1,110,1,110,1,110,1,110,1,110,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,112,1,112,1,112,1,112,1,113,1,113,1,113,1,113,1,113,
-        1,113,1,113,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,
-        1,114,1,115,1,115,1,115,1,115,1,115,1,116,1,116,1,116,1,116,1,116,
-        1,116,1,116,1,116,1,117,1,117,1,117,1,117,1,117,1,117,1,118,1,118,
-        1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,119,1,119,
-        1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,120,1,120,
-        1,120,1,120,1,120,1,120,1,120,1,120,1,121,1,121,1,121,1,121,1,121,
-        1,121,1,121,1,121,1,121,1,122,1,122,1,122,1,122,1,122,1,122,1,122,
+        1,103,1,103,1,103,1,103,1,103,1,103,1,104,1,104,1,104,1,104,1,104,
+        1,104,1,104,1,104,1,104,1,104,3,104,1049,8,104,1,105,1,105,1,105,
+        1,105,1,105,1,105,1,105,1,105,1,105,1,106,1,106,1,106,1,106,1,106,
+        1,106,1,106,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,
+        1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,3,107,1084,8,107,
+        1,108,1,108,1,108,1,108,1,108,1,109,1,109,1,109,1,109,1,109,1,109,
+        1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,109,
+        1,109,1,109,1,109,1,109,1,109,3,109,1113,8,109,1,110,1,110,1,110,
+        1,110,1,110,1,110,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
+        1,111,1,111,1,111,1,111,1,111,3,111,1134,8,111,1,112,1,112,1,112,
+        1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,
+        1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,3,112,
+        1160,8,112,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
+        1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
+        1,113,1,113,1,113,1,113,1,113,1,113,3,113,1188,8,113,1,114,1,114,
+        1,114,1,114,1,114,1,114,1,114,1,114,1,115,1,115,1,115,1,115,1,115,
+        1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,
+        1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,3,115,1223,
+        8,115,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,3,116,1265,8,116,
+        1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,
+        1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,1,117,
+        1,117,3,117,1290,8,117,1,118,1,118,1,118,1,118,1,118,1,119,1,119,
+        1,119,1,119,1,119,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,
+        1,120,1,120,1,121,1,121,1,121,1,121,1,122,1,122,1,122,1,122,1,122,
         1,122,1,122,1,122,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,
-        1,123,1,123,1,123,1,124,1,124,1,124,1,124,1,124,1,124,1,125,1,125,
-        1,125,1,125,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,
-        1,126,3,126,1341,8,126,1,127,1,127,1,127,1,127,1,128,1,128,1,128,
-        1,128,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,130,
-        1,130,1,130,1,130,1,130,1,130,1,130,1,131,1,131,1,131,1,131,1,131,
-        1,132,1,132,1,132,1,132,1,132,1,133,1,133,1,133,1,133,1,133,1,134,
-        1,134,1,134,1,134,1,134,1,135,1,135,1,135,1,135,1,136,1,136,1,136,
-        1,136,1,136,1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,138,
-        1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,
-        1,138,1,138,1,138,3,138,1419,8,138,1,139,1,139,1,139,1,139,1,139,
-        1,139,1,139,1,139,1,139,3,139,1430,8,139,1,140,1,140,1,140,1,140,
-        1,140,1,140,1,141,1,141,1,141,1,141,1,141,1,141,1,142,1,142,1,142,
-        1,142,1,142,1,143,1,143,1,143,1,143,1,143,1,143,1,144,1,144,1,144,
-        1,144,1,144,1,144,1,145,1,145,1,145,1,145,1,145,1,145,1,145,1,145,
-        1,146,1,146,1,146,1,146,1,146,1,146,1,146,1,146,1,146,1,146,1,147,
-        1,147,1,147,1,147,1,147,1,147,1,147,1,147,1,147,1,147,1,147,3,147,
-        1490,8,147,1,148,1,148,1,148,1,148,1,148,1,148,1,148,1,149,1,149,
-        1,149,1,149,1,149,1,150,1,150,1,150,1,150,1,150,1,150,1,151,1,151,
-        1,151,1,151,1,151,1,152,1,152,1,152,1,152,1,152,1,152,1,153,1,153,
-        1,153,1,153,1,153,1,154,1,154,1,154,1,154,1,154,1,154,1,155,1,155,
-        1,155,1,155,1,155,1,155,1,156,1,156,1,156,1,156,1,156,1,156,1,156,
-        1,156,1,157,1,157,1,157,1,157,1,157,1,157,1,158,1,158,1,158,1,159,
+        1,124,1,124,1,124,1,124,1,125,1,125,1,125,1,125,1,125,1,125,1,125,
+        1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,127,
+        1,127,1,127,1,127,1,127,1,128,1,128,1,128,1,128,1,128,1,128,1,128,
+        1,128,1,129,1,129,1,129,1,129,1,129,1,129,1,130,1,130,1,130,1,130,
+        1,130,1,130,1,130,1,130,1,130,1,130,1,130,1,131,1,131,1,131,1,131,
+        1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,132,1,132,1,132,1,132,
+        1,132,1,132,1,132,1,132,1,133,1,133,1,133,1,133,1,133,1,133,1,133,
+        1,133,1,133,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,
+        1,134,1,135,1,135,1,135,1,135,1,135,1,135,1,135,1,135,1,135,1,135,
+        1,135,1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,
+        1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,138,1,138,1,138,1,138,
+        1,138,1,138,1,138,1,138,1,138,1,139,1,139,1,139,1,139,1,139,1,139,
+        1,140,1,140,1,140,1,140,1,141,1,141,1,141,1,141,1,141,1,141,1,141,
+        1,141,1,141,1,141,3,141,1478,8,141,1,142,1,142,1,142,1,142,1,143,
+        1,143,1,143,1,143,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,
+        1,144,1,145,1,145,1,145,1,145,1,145,1,145,1,145,1,146,1,146,1,146,
+        1,146,1,146,1,147,1,147,1,147,1,147,1,147,1,148,1,148,1,148,1,148,
+        1,148,1,149,1,149,1,149,1,149,1,149,1,150,1,150,1,150,1,150,1,151,
+        1,151,1,151,1,151,1,151,1,152,1,152,1,152,1,152,1,152,1,152,1,152,
+        1,152,1,153,1,153,1,153,1,153,1,153,1,153,1,153,1,153,1,153,1,153,
+        1,153,1,153,1,153,1,153,1,153,3,153,1556,8,153,1,154,1,154,1,154,
+        1,154,1,154,1,154,1,154,1,154,1,154,3,154,1567,8,154,1,155,1,155,
+        1,155,1,155,1,155,1,155,1,156,1,156,1,156,1,156,1,156,1,156,1,157,
+        1,157,1,157,1,157,1,157,1,158,1,158,1,158,1,158,1,158,1,158,1,159,
         1,159,1,159,1,159,1,159,1,159,1,160,1,160,1,160,1,160,1,160,1,160,
-        1,160,1,160,1,160,1,160,1,161,1,161,1,161,1,161,1,161,1,161,1,161,
-        1,162,1,162,1,162,1,162,1,163,1,163,1,163,1,163,1,163,1,163,1,163,
-        1,163,1,163,1,164,1,164,1,164,1,164,1,165,1,165,1,165,1,165,1,165,
-        1,166,1,166,1,166,1,166,1,166,1,166,1,167,1,167,1,167,1,167,1,167,
-        1,167,1,167,1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,168,
-        1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,170,
-        1,170,1,170,1,170,1,170,1,170,1,170,1,170,1,171,1,171,1,171,1,171,
-        1,171,1,172,1,172,1,172,1,172,1,172,1,172,1,172,1,172,1,172,1,172,
-        1,172,1,172,1,173,1,173,1,173,1,173,1,173,1,173,1,173,1,173,1,174,
-        1,174,1,174,1,174,1,174,1,174,1,174,1,174,1,174,1,174,1,174,1,175,
-        1,175,1,175,1,175,1,175,1,175,1,176,1,176,1,176,1,176,1,176,1,176,
-        1,176,1,176,1,176,1,176,1,176,1,176,1,176,1,177,1,177,1,177,1,177,
-        1,177,1,177,1,177,1,177,1,177,1,177,1,177,1,177,1,177,1,178,1,178,
-        1,178,1,178,1,178,1,178,1,178,1,178,1,178,1,178,1,178,1,178,1,178,
-        1,178,1,178,1,178,1,178,1,178,1,179,1,179,1,179,1,179,1,179,1,179,
-        1,179,1,179,1,179,1,179,1,179,1,179,1,179,1,180,1,180,1,180,1,180,
-        1,180,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,
-        1,181,1,181,1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,182,
-        1,182,1,182,1,182,1,182,1,183,1,183,1,183,1,183,1,183,1,184,1,184,
-        1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,185,1,185,1,185,
-        1,185,1,185,1,185,1,185,1,185,1,186,1,186,1,186,1,186,1,186,1,186,
-        1,187,1,187,1,187,1,187,1,187,1,187,1,187,1,188,1,188,1,188,1,188,
-        1,188,1,188,1,188,1,188,1,188,1,188,1,189,1,189,1,189,1,189,1,189,
-        1,189,1,189,1,189,1,189,1,189,1,190,1,190,1,190,1,190,1,190,1,190,
-        1,190,1,190,1,190,1,190,1,191,1,191,1,191,1,191,1,191,1,191,1,191,
-        1,191,1,192,1,192,1,192,1,192,1,193,1,193,1,193,1,193,1,193,1,194,
-        1,194,1,194,1,194,1,194,1,194,1,194,1,195,1,195,1,195,1,195,1,195,
-        1,195,1,196,1,196,1,196,1,196,1,196,1,196,1,196,1,196,1,197,1,197,
-        1,197,1,197,1,197,1,198,1,198,1,198,1,198,1,198,1,198,1,198,1,198,
-        1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,200,1,200,1,200,1,200,
-        1,200,1,200,1,201,1,201,1,201,1,201,1,201,1,202,1,202,1,202,1,202,
-        1,202,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,
-        1,203,1,204,1,204,1,204,1,204,1,204,1,205,1,205,1,205,1,205,1,205,
+        1,160,1,160,1,161,1,161,1,161,1,161,1,161,1,161,1,161,1,161,1,161,
+        1,161,1,162,1,162,1,162,1,162,1,162,1,162,1,162,1,162,1,162,1,162,
+        1,162,3,162,1627,8,162,1,163,1,163,1,163,1,163,1,163,1,163,1,163,
+        1,164,1,164,1,164,1,164,1,164,1,165,1,165,1,165,1,165,1,165,1,165,
+        1,166,1,166,1,166,1,166,1,166,1,167,1,167,1,167,1,167,1,167,1,167,
+        1,168,1,168,1,168,1,168,1,168,1,169,1,169,1,169,1,169,1,169,1,169,
+        1,170,1,170,1,170,1,170,1,170,1,170,1,171,1,171,1,171,1,171,1,171,
+        1,171,1,171,1,171,1,172,1,172,1,172,1,172,1,172,1,172,1,173,1,173,
+        1,173,1,174,1,174,1,174,1,174,1,174,1,174,1,175,1,175,1,175,1,175,
+        1,175,1,175,1,175,1,175,1,175,1,175,1,176,1,176,1,176,1,176,1,176,
+        1,176,1,176,1,177,1,177,1,177,1,177,1,178,1,178,1,178,1,178,1,178,
+        1,178,1,178,1,178,1,178,1,179,1,179,1,179,1,179,1,180,1,180,1,180,
+        1,180,1,180,1,181,1,181,1,181,1,181,1,181,1,181,1,182,1,182,1,182,
+        1,182,1,182,1,182,1,182,1,183,1,183,1,183,1,183,1,183,1,183,1,183,
+        1,183,1,183,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,
+        1,184,1,185,1,185,1,185,1,185,1,185,1,185,1,185,1,185,1,186,1,186,
+        1,186,1,186,1,186,1,187,1,187,1,187,1,187,1,187,1,187,1,187,1,187,
+        1,187,1,187,1,187,1,187,1,188,1,188,1,188,1,188,1,188,1,188,1,188,
+        1,188,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,
+        1,189,1,190,1,190,1,190,1,190,1,190,1,190,1,191,1,191,1,191,1,191,
+        1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,192,1,192,
+        1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,
+        1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,
+        1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,194,1,194,1,194,1,194,
+        1,194,1,194,1,194,1,194,1,194,1,194,1,194,1,194,1,194,1,195,1,195,
+        1,195,1,195,1,195,1,196,1,196,1,196,1,196,1,196,1,196,1,196,1,196,
+        1,196,1,196,1,196,1,196,1,197,1,197,1,197,1,197,1,197,1,197,1,197,
+        1,197,1,197,1,197,1,197,1,197,1,197,1,198,1,198,1,198,1,198,1,198,
+        1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,200,
+        1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,201,1,201,1,201,1,201,
+        1,201,1,201,1,202,1,202,1,202,1,202,1,202,1,202,1,202,1,203,1,203,
+        1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,204,1,204,1,204,
+        1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,205,1,205,1,205,1,205,
         1,205,1,205,1,205,1,205,1,205,1,205,1,206,1,206,1,206,1,206,1,206,
-        1,206,1,207,1,207,1,207,1,207,1,208,1,208,1,208,1,208,1,208,1,209,
-        1,209,1,209,1,209,1,209,1,209,1,209,1,209,1,209,1,209,1,209,1,209,
-        1,210,1,210,1,210,1,210,1,210,1,210,1,210,1,210,1,210,1,210,1,210,
-        1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,212,
-        1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,
-        1,212,1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,213,
-        1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,214,
-        1,214,1,214,1,214,1,214,1,214,1,215,1,215,1,215,1,215,1,215,1,215,
-        1,215,1,215,1,215,1,215,1,215,1,215,1,215,1,215,1,215,1,215,1,666,
-        0,216,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,
+        1,206,1,206,1,206,1,207,1,207,1,207,1,207,1,208,1,208,1,208,1,208,
+        1,208,1,209,1,209,1,209,1,209,1,209,1,209,1,209,1,210,1,210,1,210,
+        1,210,1,210,1,210,1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,211,
+        1,212,1,212,1,212,1,212,1,212,1,213,1,213,1,213,1,213,1,213,1,213,
+        1,213,1,213,1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,215,1,215,
+        1,215,1,215,1,215,1,215,1,216,1,216,1,216,1,216,1,216,1,217,1,217,
+        1,217,1,217,1,217,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,
+        1,218,1,218,1,218,1,219,1,219,1,219,1,219,1,219,1,220,1,220,1,220,
+        1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,221,1,221,1,221,
+        1,221,1,221,1,221,1,222,1,222,1,222,1,222,1,223,1,223,1,223,1,223,
+        1,223,1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,224,1,224,
+        1,224,1,224,1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,
+        1,225,1,225,1,226,1,226,1,226,1,226,1,226,1,226,1,226,1,226,1,226,
+        1,226,1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,227,
+        1,227,1,227,1,227,1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,228,
+        1,228,1,228,1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,
+        1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,230,1,230,1,230,1,230,
+        1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,
+        1,230,1,231,1,231,5,231,2178,8,231,10,231,12,231,2181,9,231,1,696,
+        0,232,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,
         25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,
         47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,
         69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,
@@ -210,9 +224,18 @@ def serializedATN():
         381,191,383,192,385,193,387,194,389,195,391,196,393,197,395,198,
         397,199,399,200,401,201,403,202,405,203,407,204,409,205,411,206,
         413,207,415,208,417,209,419,210,421,211,423,212,425,213,427,214,
-        429,215,431,216,1,0,8,3,0,65,90,95,95,97,122,4,0,48,57,65,90,95,
-        95,97,122,1,0,48,57,3,0,10,10,13,13,39,39,3,0,10,10,13,13,34,34,
-        3,0,48,57,65,70,97,102,3,0,9,10,13,13,32,32,2,0,10,10,13,13,2064,
+        429,215,431,216,433,217,435,218,437,219,439,220,441,221,443,222,
+        445,223,447,224,449,225,451,226,453,227,455,228,457,229,459,230,
+        461,231,463,232,1,0,33,1,0,48,57,3,0,10,10,13,13,39,39,3,0,10,10,
+        13,13,34,34,2,0,88,88,120,120,3,0,48,57,65,70,97,102,2,0,76,76,108,
+        108,2,0,73,73,105,105,2,0,75,75,107,107,2,0,69,69,101,101,2,0,78,
+        78,110,110,2,0,79,79,111,111,2,0,84,84,116,116,2,0,66,66,98,98,2,
+        0,87,87,119,119,2,0,83,83,115,115,2,0,65,65,97,97,2,0,68,68,100,
+        100,2,0,82,82,114,114,2,0,80,80,112,112,3,0,9,10,13,13,32,32,2,0,
+        10,10,13,13,2,0,67,67,99,99,2,0,70,70,102,102,2,0,77,77,109,109,
+        2,0,72,72,104,104,2,0,71,71,103,103,2,0,85,85,117,117,2,0,89,89,
+        121,121,2,0,86,86,118,118,2,0,81,81,113,113,2,0,74,74,106,106,4,
+        0,35,36,64,90,95,95,97,122,5,0,35,36,48,57,64,90,95,95,97,122,2209,
         0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,
         1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,
         1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,
@@ -259,513 +282,545 @@ def serializedATN():
         405,1,0,0,0,0,407,1,0,0,0,0,409,1,0,0,0,0,411,1,0,0,0,0,413,1,0,
         0,0,0,415,1,0,0,0,0,417,1,0,0,0,0,419,1,0,0,0,0,421,1,0,0,0,0,423,
         1,0,0,0,0,425,1,0,0,0,0,427,1,0,0,0,0,429,1,0,0,0,0,431,1,0,0,0,
-        1,433,1,0,0,0,3,441,1,0,0,0,5,453,1,0,0,0,7,462,1,0,0,0,9,471,1,
-        0,0,0,11,482,1,0,0,0,13,484,1,0,0,0,15,486,1,0,0,0,17,488,1,0,0,
-        0,19,490,1,0,0,0,21,492,1,0,0,0,23,494,1,0,0,0,25,496,1,0,0,0,27,
-        498,1,0,0,0,29,500,1,0,0,0,31,502,1,0,0,0,33,504,1,0,0,0,35,506,
-        1,0,0,0,37,508,1,0,0,0,39,510,1,0,0,0,41,512,1,0,0,0,43,514,1,0,
-        0,0,45,516,1,0,0,0,47,518,1,0,0,0,49,520,1,0,0,0,51,522,1,0,0,0,
-        53,524,1,0,0,0,55,526,1,0,0,0,57,528,1,0,0,0,59,530,1,0,0,0,61,532,
-        1,0,0,0,63,540,1,0,0,0,65,542,1,0,0,0,67,544,1,0,0,0,69,546,1,0,
-        0,0,71,549,1,0,0,0,73,552,1,0,0,0,75,557,1,0,0,0,77,567,1,0,0,0,
-        79,570,1,0,0,0,81,578,1,0,0,0,83,586,1,0,0,0,85,599,1,0,0,0,87,602,
-        1,0,0,0,89,610,1,0,0,0,91,617,1,0,0,0,93,629,1,0,0,0,95,633,1,0,
-        0,0,97,636,1,0,0,0,99,640,1,0,0,0,101,651,1,0,0,0,103,654,1,0,0,
-        0,105,660,1,0,0,0,107,674,1,0,0,0,109,685,1,0,0,0,111,692,1,0,0,
-        0,113,697,1,0,0,0,115,703,1,0,0,0,117,709,1,0,0,0,119,712,1,0,0,
-        0,121,719,1,0,0,0,123,725,1,0,0,0,125,729,1,0,0,0,127,734,1,0,0,
-        0,129,740,1,0,0,0,131,747,1,0,0,0,133,753,1,0,0,0,135,759,1,0,0,
-        0,137,764,1,0,0,0,139,769,1,0,0,0,141,774,1,0,0,0,143,781,1,0,0,
-        0,145,788,1,0,0,0,147,795,1,0,0,0,149,801,1,0,0,0,151,808,1,0,0,
-        0,153,812,1,0,0,0,155,817,1,0,0,0,157,824,1,0,0,0,159,830,1,0,0,
-        0,161,835,1,0,0,0,163,844,1,0,0,0,165,851,1,0,0,0,167,857,1,0,0,
-        0,169,864,1,0,0,0,171,870,1,0,0,0,173,875,1,0,0,0,175,881,1,0,0,
-        0,177,890,1,0,0,0,179,897,1,0,0,0,181,906,1,0,0,0,183,917,1,0,0,
-        0,185,937,1,0,0,0,187,939,1,0,0,0,189,948,1,0,0,0,191,972,1,0,0,
-        0,193,974,1,0,0,0,195,1001,1,0,0,0,197,1003,1,0,0,0,199,1022,1,0,
-        0,0,201,1048,1,0,0,0,203,1076,1,0,0,0,205,1078,1,0,0,0,207,1111,
-        1,0,0,0,209,1153,1,0,0,0,211,1178,1,0,0,0,213,1180,1,0,0,0,215,1185,
-        1,0,0,0,217,1190,1,0,0,0,219,1200,1,0,0,0,221,1204,1,0,0,0,223,1212,
-        1,0,0,0,225,1220,1,0,0,0,227,1224,1,0,0,0,229,1231,1,0,0,0,231,1241,
-        1,0,0,0,233,1246,1,0,0,0,235,1254,1,0,0,0,237,1260,1,0,0,0,239,1271,
-        1,0,0,0,241,1282,1,0,0,0,243,1290,1,0,0,0,245,1299,1,0,0,0,247,1309,
-        1,0,0,0,249,1320,1,0,0,0,251,1326,1,0,0,0,253,1340,1,0,0,0,255,1342,
-        1,0,0,0,257,1346,1,0,0,0,259,1350,1,0,0,0,261,1359,1,0,0,0,263,1366,
-        1,0,0,0,265,1371,1,0,0,0,267,1376,1,0,0,0,269,1381,1,0,0,0,271,1386,
-        1,0,0,0,273,1390,1,0,0,0,275,1395,1,0,0,0,277,1418,1,0,0,0,279,1429,
-        1,0,0,0,281,1431,1,0,0,0,283,1437,1,0,0,0,285,1443,1,0,0,0,287,1448,
-        1,0,0,0,289,1454,1,0,0,0,291,1460,1,0,0,0,293,1468,1,0,0,0,295,1489,
-        1,0,0,0,297,1491,1,0,0,0,299,1498,1,0,0,0,301,1503,1,0,0,0,303,1509,
-        1,0,0,0,305,1514,1,0,0,0,307,1520,1,0,0,0,309,1525,1,0,0,0,311,1531,
-        1,0,0,0,313,1537,1,0,0,0,315,1545,1,0,0,0,317,1551,1,0,0,0,319,1554,
-        1,0,0,0,321,1560,1,0,0,0,323,1570,1,0,0,0,325,1577,1,0,0,0,327,1581,
-        1,0,0,0,329,1590,1,0,0,0,331,1594,1,0,0,0,333,1599,1,0,0,0,335,1605,
-        1,0,0,0,337,1612,1,0,0,0,339,1621,1,0,0,0,341,1631,1,0,0,0,343,1639,
-        1,0,0,0,345,1644,1,0,0,0,347,1656,1,0,0,0,349,1664,1,0,0,0,351,1675,
-        1,0,0,0,353,1681,1,0,0,0,355,1694,1,0,0,0,357,1707,1,0,0,0,359,1725,
-        1,0,0,0,361,1738,1,0,0,0,363,1743,1,0,0,0,365,1755,1,0,0,0,367,1768,
-        1,0,0,0,369,1773,1,0,0,0,371,1783,1,0,0,0,373,1791,1,0,0,0,375,1797,
-        1,0,0,0,377,1804,1,0,0,0,379,1814,1,0,0,0,381,1824,1,0,0,0,383,1834,
-        1,0,0,0,385,1842,1,0,0,0,387,1846,1,0,0,0,389,1851,1,0,0,0,391,1858,
-        1,0,0,0,393,1864,1,0,0,0,395,1872,1,0,0,0,397,1877,1,0,0,0,399,1885,
-        1,0,0,0,401,1892,1,0,0,0,403,1898,1,0,0,0,405,1903,1,0,0,0,407,1908,
-        1,0,0,0,409,1919,1,0,0,0,411,1924,1,0,0,0,413,1935,1,0,0,0,415,1941,
-        1,0,0,0,417,1945,1,0,0,0,419,1950,1,0,0,0,421,1962,1,0,0,0,423,1973,
-        1,0,0,0,425,1983,1,0,0,0,427,1996,1,0,0,0,429,2006,1,0,0,0,431,2022,
-        1,0,0,0,433,437,7,0,0,0,434,436,7,1,0,0,435,434,1,0,0,0,436,439,
-        1,0,0,0,437,435,1,0,0,0,437,438,1,0,0,0,438,2,1,0,0,0,439,437,1,
-        0,0,0,440,442,7,2,0,0,441,440,1,0,0,0,442,443,1,0,0,0,443,441,1,
-        0,0,0,443,444,1,0,0,0,444,451,1,0,0,0,445,447,5,46,0,0,446,448,7,
-        2,0,0,447,446,1,0,0,0,448,449,1,0,0,0,449,447,1,0,0,0,449,450,1,
-        0,0,0,450,452,1,0,0,0,451,445,1,0,0,0,451,452,1,0,0,0,452,4,1,0,
-        0,0,453,457,5,39,0,0,454,456,8,3,0,0,455,454,1,0,0,0,456,459,1,0,
-        0,0,457,455,1,0,0,0,457,458,1,0,0,0,458,460,1,0,0,0,459,457,1,0,
-        0,0,460,461,5,39,0,0,461,6,1,0,0,0,462,466,5,34,0,0,463,465,8,4,
-        0,0,464,463,1,0,0,0,465,468,1,0,0,0,466,464,1,0,0,0,466,467,1,0,
-        0,0,467,469,1,0,0,0,468,466,1,0,0,0,469,470,5,34,0,0,470,8,1,0,0,
-        0,471,472,5,88,0,0,472,473,5,39,0,0,473,477,1,0,0,0,474,476,7,5,
-        0,0,475,474,1,0,0,0,476,479,1,0,0,0,477,475,1,0,0,0,477,478,1,0,
-        0,0,478,480,1,0,0,0,479,477,1,0,0,0,480,481,5,39,0,0,481,10,1,0,
-        0,0,482,483,5,40,0,0,483,12,1,0,0,0,484,485,5,41,0,0,485,14,1,0,
-        0,0,486,487,5,91,0,0,487,16,1,0,0,0,488,489,5,93,0,0,489,18,1,0,
-        0,0,490,491,5,44,0,0,491,20,1,0,0,0,492,493,5,59,0,0,493,22,1,0,
-        0,0,494,495,5,58,0,0,495,24,1,0,0,0,496,497,5,61,0,0,497,26,1,0,
-        0,0,498,499,5,43,0,0,499,28,1,0,0,0,500,501,5,45,0,0,501,30,1,0,
-        0,0,502,503,5,42,0,0,503,32,1,0,0,0,504,505,5,47,0,0,505,34,1,0,
-        0,0,506,507,5,37,0,0,507,36,1,0,0,0,508,509,5,35,0,0,509,38,1,0,
-        0,0,510,511,5,64,0,0,511,40,1,0,0,0,512,513,5,36,0,0,513,42,1,0,
-        0,0,514,515,5,46,0,0,515,44,1,0,0,0,516,517,5,95,0,0,517,46,1,0,
-        0,0,518,519,5,63,0,0,519,48,1,0,0,0,520,521,5,33,0,0,521,50,1,0,
-        0,0,522,523,5,126,0,0,523,52,1,0,0,0,524,525,5,94,0,0,525,54,1,0,
-        0,0,526,527,5,38,0,0,527,56,1,0,0,0,528,529,5,124,0,0,529,58,1,0,
-        0,0,530,531,5,92,0,0,531,60,1,0,0,0,532,533,5,96,0,0,533,62,1,0,
-        0,0,534,535,5,60,0,0,535,541,5,62,0,0,536,537,5,33,0,0,537,541,5,
-        61,0,0,538,539,5,94,0,0,539,541,5,61,0,0,540,534,1,0,0,0,540,536,
-        1,0,0,0,540,538,1,0,0,0,541,64,1,0,0,0,542,543,5,62,0,0,543,66,1,
-        0,0,0,544,545,5,60,0,0,545,68,1,0,0,0,546,547,5,62,0,0,547,548,5,
-        61,0,0,548,70,1,0,0,0,549,550,5,60,0,0,550,551,5,61,0,0,551,72,1,
-        0,0,0,552,553,5,76,0,0,553,554,5,73,0,0,554,555,5,75,0,0,555,556,
-        5,69,0,0,556,74,1,0,0,0,557,558,5,78,0,0,558,559,5,79,0,0,559,560,
-        5,84,0,0,560,561,1,0,0,0,561,562,3,103,51,0,562,563,5,76,0,0,563,
-        564,5,73,0,0,564,565,5,75,0,0,565,566,5,69,0,0,566,76,1,0,0,0,567,
-        568,5,73,0,0,568,569,5,78,0,0,569,78,1,0,0,0,570,571,5,78,0,0,571,
-        572,5,79,0,0,572,573,5,84,0,0,573,574,1,0,0,0,574,575,3,103,51,0,
-        575,576,5,73,0,0,576,577,5,78,0,0,577,80,1,0,0,0,578,579,5,66,0,
-        0,579,580,5,69,0,0,580,581,5,84,0,0,581,582,5,87,0,0,582,583,5,69,
-        0,0,583,584,5,69,0,0,584,585,5,78,0,0,585,82,1,0,0,0,586,587,5,78,
-        0,0,587,588,5,79,0,0,588,589,5,84,0,0,589,590,1,0,0,0,590,591,3,
-        103,51,0,591,592,5,66,0,0,592,593,5,69,0,0,593,594,5,84,0,0,594,
-        595,5,87,0,0,595,596,5,69,0,0,596,597,5,69,0,0,597,598,5,78,0,0,
-        598,84,1,0,0,0,599,600,5,73,0,0,600,601,5,83,0,0,601,86,1,0,0,0,
-        602,603,5,73,0,0,603,604,5,83,0,0,604,605,1,0,0,0,605,606,3,103,
-        51,0,606,607,5,78,0,0,607,608,5,79,0,0,608,609,5,84,0,0,609,88,1,
-        0,0,0,610,611,5,69,0,0,611,612,5,88,0,0,612,613,5,73,0,0,613,614,
-        5,83,0,0,614,615,5,84,0,0,615,616,5,83,0,0,616,90,1,0,0,0,617,618,
-        5,78,0,0,618,619,5,79,0,0,619,620,5,84,0,0,620,621,1,0,0,0,621,622,
-        3,103,51,0,622,623,5,69,0,0,623,624,5,88,0,0,624,625,5,73,0,0,625,
-        626,5,83,0,0,626,627,5,84,0,0,627,628,5,83,0,0,628,92,1,0,0,0,629,
-        630,5,65,0,0,630,631,5,78,0,0,631,632,5,68,0,0,632,94,1,0,0,0,633,
-        634,5,79,0,0,634,635,5,82,0,0,635,96,1,0,0,0,636,637,5,78,0,0,637,
-        638,5,79,0,0,638,639,5,84,0,0,639,98,1,0,0,0,640,641,5,88,0,0,641,
-        642,5,79,0,0,642,643,5,82,0,0,643,100,1,0,0,0,644,645,5,42,0,0,645,
-        652,5,42,0,0,646,647,5,80,0,0,647,648,5,79,0,0,648,649,5,87,0,0,
-        649,650,5,69,0,0,650,652,5,82,0,0,651,644,1,0,0,0,651,646,1,0,0,
-        0,652,102,1,0,0,0,653,655,7,6,0,0,654,653,1,0,0,0,655,656,1,0,0,
-        0,656,654,1,0,0,0,656,657,1,0,0,0,657,658,1,0,0,0,658,659,6,51,0,
-        0,659,104,1,0,0,0,660,661,5,47,0,0,661,662,5,42,0,0,662,666,1,0,
-        0,0,663,665,9,0,0,0,664,663,1,0,0,0,665,668,1,0,0,0,666,667,1,0,
-        0,0,666,664,1,0,0,0,667,669,1,0,0,0,668,666,1,0,0,0,669,670,5,42,
-        0,0,670,671,5,47,0,0,671,672,1,0,0,0,672,673,6,52,0,0,673,106,1,
-        0,0,0,674,675,5,45,0,0,675,676,5,45,0,0,676,680,1,0,0,0,677,679,
-        8,7,0,0,678,677,1,0,0,0,679,682,1,0,0,0,680,678,1,0,0,0,680,681,
-        1,0,0,0,681,683,1,0,0,0,682,680,1,0,0,0,683,684,6,53,0,0,684,108,
-        1,0,0,0,685,686,5,83,0,0,686,687,5,69,0,0,687,688,5,76,0,0,688,689,
-        5,69,0,0,689,690,5,67,0,0,690,691,5,84,0,0,691,110,1,0,0,0,692,693,
-        5,70,0,0,693,694,5,82,0,0,694,695,5,79,0,0,695,696,5,77,0,0,696,
-        112,1,0,0,0,697,698,5,87,0,0,698,699,5,72,0,0,699,700,5,69,0,0,700,
-        701,5,82,0,0,701,702,5,69,0,0,702,114,1,0,0,0,703,704,5,71,0,0,704,
-        705,5,82,0,0,705,706,5,79,0,0,706,707,5,85,0,0,707,708,5,80,0,0,
-        708,116,1,0,0,0,709,710,5,66,0,0,710,711,5,89,0,0,711,118,1,0,0,
-        0,712,713,5,72,0,0,713,714,5,65,0,0,714,715,5,86,0,0,715,716,5,73,
-        0,0,716,717,5,78,0,0,717,718,5,71,0,0,718,120,1,0,0,0,719,720,5,
-        79,0,0,720,721,5,82,0,0,721,722,5,68,0,0,722,723,5,69,0,0,723,724,
-        5,82,0,0,724,122,1,0,0,0,725,726,5,65,0,0,726,727,5,83,0,0,727,728,
-        5,67,0,0,728,124,1,0,0,0,729,730,5,68,0,0,730,731,5,69,0,0,731,732,
-        5,83,0,0,732,733,5,67,0,0,733,126,1,0,0,0,734,735,5,76,0,0,735,736,
-        5,73,0,0,736,737,5,77,0,0,737,738,5,73,0,0,738,739,5,84,0,0,739,
-        128,1,0,0,0,740,741,5,79,0,0,741,742,5,70,0,0,742,743,5,70,0,0,743,
-        744,5,83,0,0,744,745,5,69,0,0,745,746,5,84,0,0,746,130,1,0,0,0,747,
-        748,5,70,0,0,748,749,5,69,0,0,749,750,5,84,0,0,750,751,5,67,0,0,
-        751,752,5,72,0,0,752,132,1,0,0,0,753,754,5,70,0,0,754,755,5,73,0,
-        0,755,756,5,82,0,0,756,757,5,83,0,0,757,758,5,84,0,0,758,134,1,0,
-        0,0,759,760,5,78,0,0,760,761,5,69,0,0,761,762,5,88,0,0,762,763,5,
-        84,0,0,763,136,1,0,0,0,764,765,5,82,0,0,765,766,5,79,0,0,766,767,
-        5,87,0,0,767,768,5,83,0,0,768,138,1,0,0,0,769,770,5,79,0,0,770,771,
-        5,78,0,0,771,772,5,76,0,0,772,773,5,89,0,0,773,140,1,0,0,0,774,775,
-        5,73,0,0,775,776,5,78,0,0,776,777,5,83,0,0,777,778,5,69,0,0,778,
-        779,5,82,0,0,779,780,5,84,0,0,780,142,1,0,0,0,781,782,5,85,0,0,782,
-        783,5,80,0,0,783,784,5,68,0,0,784,785,5,65,0,0,785,786,5,84,0,0,
-        786,787,5,69,0,0,787,144,1,0,0,0,788,789,5,68,0,0,789,790,5,69,0,
-        0,790,791,5,76,0,0,791,792,5,69,0,0,792,793,5,84,0,0,793,794,5,69,
-        0,0,794,146,1,0,0,0,795,796,5,77,0,0,796,797,5,69,0,0,797,798,5,
-        82,0,0,798,799,5,71,0,0,799,800,5,69,0,0,800,148,1,0,0,0,801,802,
-        5,86,0,0,802,803,5,65,0,0,803,804,5,76,0,0,804,805,5,85,0,0,805,
-        806,5,69,0,0,806,807,5,83,0,0,807,150,1,0,0,0,808,809,5,83,0,0,809,
-        810,5,69,0,0,810,811,5,84,0,0,811,152,1,0,0,0,812,813,5,73,0,0,813,
-        814,5,78,0,0,814,815,5,84,0,0,815,816,5,79,0,0,816,154,1,0,0,0,817,
-        818,5,67,0,0,818,819,5,82,0,0,819,820,5,69,0,0,820,821,5,65,0,0,
-        821,822,5,84,0,0,822,823,5,69,0,0,823,156,1,0,0,0,824,825,5,65,0,
-        0,825,826,5,76,0,0,826,827,5,84,0,0,827,828,5,69,0,0,828,829,5,82,
-        0,0,829,158,1,0,0,0,830,831,5,68,0,0,831,832,5,82,0,0,832,833,5,
-        79,0,0,833,834,5,80,0,0,834,160,1,0,0,0,835,836,5,84,0,0,836,837,
-        5,82,0,0,837,838,5,85,0,0,838,839,5,78,0,0,839,840,5,67,0,0,840,
-        841,5,65,0,0,841,842,5,84,0,0,842,843,5,69,0,0,843,162,1,0,0,0,844,
-        845,5,82,0,0,845,846,5,69,0,0,846,847,5,78,0,0,847,848,5,65,0,0,
-        848,849,5,77,0,0,849,850,5,69,0,0,850,164,1,0,0,0,851,852,5,71,0,
-        0,852,853,5,82,0,0,853,854,5,65,0,0,854,855,5,78,0,0,855,856,5,84,
-        0,0,856,166,1,0,0,0,857,858,5,82,0,0,858,859,5,69,0,0,859,860,5,
-        86,0,0,860,861,5,79,0,0,861,862,5,75,0,0,862,863,5,69,0,0,863,168,
-        1,0,0,0,864,865,5,84,0,0,865,866,5,65,0,0,866,867,5,66,0,0,867,868,
-        5,76,0,0,868,869,5,69,0,0,869,170,1,0,0,0,870,871,5,86,0,0,871,872,
-        5,73,0,0,872,873,5,69,0,0,873,874,5,87,0,0,874,172,1,0,0,0,875,876,
-        5,73,0,0,876,877,5,78,0,0,877,878,5,68,0,0,878,879,5,69,0,0,879,
-        880,5,88,0,0,880,174,1,0,0,0,881,882,5,83,0,0,882,883,5,69,0,0,883,
-        884,5,81,0,0,884,885,5,85,0,0,885,886,5,69,0,0,886,887,5,78,0,0,
-        887,888,5,67,0,0,888,889,5,69,0,0,889,176,1,0,0,0,890,891,5,83,0,
-        0,891,892,5,67,0,0,892,893,5,72,0,0,893,894,5,69,0,0,894,895,5,77,
-        0,0,895,896,5,65,0,0,896,178,1,0,0,0,897,898,5,68,0,0,898,899,5,
-        65,0,0,899,900,5,84,0,0,900,901,5,65,0,0,901,902,5,66,0,0,902,903,
-        5,65,0,0,903,904,5,83,0,0,904,905,5,69,0,0,905,180,1,0,0,0,906,907,
-        5,84,0,0,907,908,5,65,0,0,908,909,5,66,0,0,909,910,5,76,0,0,910,
-        911,5,69,0,0,911,912,5,83,0,0,912,913,5,80,0,0,913,914,5,65,0,0,
-        914,915,5,67,0,0,915,916,5,69,0,0,916,182,1,0,0,0,917,918,5,80,0,
-        0,918,919,5,65,0,0,919,920,5,82,0,0,920,921,5,84,0,0,921,922,5,73,
-        0,0,922,923,5,84,0,0,923,924,5,73,0,0,924,925,5,79,0,0,925,926,5,
-        78,0,0,926,184,1,0,0,0,927,928,5,73,0,0,928,929,5,78,0,0,929,930,
-        5,84,0,0,930,931,5,69,0,0,931,932,5,71,0,0,932,933,5,69,0,0,933,
-        938,5,82,0,0,934,935,5,73,0,0,935,936,5,78,0,0,936,938,5,84,0,0,
-        937,927,1,0,0,0,937,934,1,0,0,0,938,186,1,0,0,0,939,940,5,83,0,0,
-        940,941,5,77,0,0,941,942,5,65,0,0,942,943,5,76,0,0,943,944,5,76,
-        0,0,944,945,5,73,0,0,945,946,5,78,0,0,946,947,5,84,0,0,947,188,1,
-        0,0,0,948,949,5,66,0,0,949,950,5,73,0,0,950,951,5,71,0,0,951,952,
-        5,73,0,0,952,953,5,78,0,0,953,954,5,84,0,0,954,190,1,0,0,0,955,956,
-        5,68,0,0,956,957,5,69,0,0,957,958,5,67,0,0,958,959,5,73,0,0,959,
-        960,5,77,0,0,960,961,5,65,0,0,961,973,5,76,0,0,962,963,5,68,0,0,
-        963,964,5,69,0,0,964,973,5,67,0,0,965,966,5,78,0,0,966,967,5,85,
-        0,0,967,968,5,77,0,0,968,969,5,69,0,0,969,970,5,82,0,0,970,971,5,
-        73,0,0,971,973,5,67,0,0,972,955,1,0,0,0,972,962,1,0,0,0,972,965,
-        1,0,0,0,973,192,1,0,0,0,974,975,5,82,0,0,975,976,5,69,0,0,976,977,
-        5,65,0,0,977,978,5,76,0,0,978,194,1,0,0,0,979,980,5,68,0,0,980,981,
-        5,79,0,0,981,982,5,85,0,0,982,983,5,66,0,0,983,984,5,76,0,0,984,
-        1002,5,69,0,0,985,986,5,68,0,0,986,987,5,79,0,0,987,988,5,85,0,0,
-        988,989,5,66,0,0,989,990,5,76,0,0,990,991,5,69,0,0,991,992,5,95,
-        0,0,992,993,5,80,0,0,993,994,5,82,0,0,994,995,5,69,0,0,995,996,5,
-        67,0,0,996,997,5,73,0,0,997,998,5,83,0,0,998,999,5,73,0,0,999,1000,
-        5,79,0,0,1000,1002,5,78,0,0,1001,979,1,0,0,0,1001,985,1,0,0,0,1002,
-        196,1,0,0,0,1003,1004,5,70,0,0,1004,1005,5,76,0,0,1005,1006,5,79,
-        0,0,1006,1007,5,65,0,0,1007,1008,5,84,0,0,1008,198,1,0,0,0,1009,
-        1010,5,67,0,0,1010,1011,5,72,0,0,1011,1012,5,65,0,0,1012,1023,5,
-        82,0,0,1013,1014,5,67,0,0,1014,1015,5,72,0,0,1015,1016,5,65,0,0,
-        1016,1017,5,82,0,0,1017,1018,5,65,0,0,1018,1019,5,67,0,0,1019,1020,
-        5,84,0,0,1020,1021,5,69,0,0,1021,1023,5,82,0,0,1022,1009,1,0,0,0,
-        1022,1013,1,0,0,0,1023,200,1,0,0,0,1024,1025,5,86,0,0,1025,1026,
-        5,65,0,0,1026,1027,5,82,0,0,1027,1028,5,67,0,0,1028,1029,5,72,0,
-        0,1029,1030,5,65,0,0,1030,1049,5,82,0,0,1031,1032,5,67,0,0,1032,
-        1033,5,72,0,0,1033,1034,5,65,0,0,1034,1035,5,82,0,0,1035,1036,5,
-        65,0,0,1036,1037,5,67,0,0,1037,1038,5,84,0,0,1038,1039,5,69,0,0,
-        1039,1040,5,82,0,0,1040,1041,5,32,0,0,1041,1042,5,86,0,0,1042,1043,
-        5,65,0,0,1043,1044,5,82,0,0,1044,1045,5,89,0,0,1045,1046,5,73,0,
-        0,1046,1047,5,78,0,0,1047,1049,5,71,0,0,1048,1024,1,0,0,0,1048,1031,
-        1,0,0,0,1049,202,1,0,0,0,1050,1051,5,67,0,0,1051,1052,5,76,0,0,1052,
-        1053,5,79,0,0,1053,1077,5,66,0,0,1054,1055,5,67,0,0,1055,1056,5,
-        72,0,0,1056,1057,5,65,0,0,1057,1058,5,82,0,0,1058,1059,5,65,0,0,
-        1059,1060,5,67,0,0,1060,1061,5,84,0,0,1061,1062,5,69,0,0,1062,1063,
-        5,82,0,0,1063,1064,5,32,0,0,1064,1065,5,76,0,0,1065,1066,5,65,0,
-        0,1066,1067,5,82,0,0,1067,1068,5,71,0,0,1068,1069,5,69,0,0,1069,
-        1070,5,32,0,0,1070,1071,5,79,0,0,1071,1072,5,66,0,0,1072,1073,5,
-        74,0,0,1073,1074,5,69,0,0,1074,1075,5,67,0,0,1075,1077,5,84,0,0,
-        1076,1050,1,0,0,0,1076,1054,1,0,0,0,1077,204,1,0,0,0,1078,1079,5,
-        71,0,0,1079,1080,5,82,0,0,1080,1081,5,65,0,0,1081,1082,5,80,0,0,
-        1082,1083,5,72,0,0,1083,1084,5,73,0,0,1084,1085,5,67,0,0,1085,206,
-        1,0,0,0,1086,1087,5,86,0,0,1087,1088,5,65,0,0,1088,1089,5,82,0,0,
-        1089,1090,5,71,0,0,1090,1091,5,82,0,0,1091,1092,5,65,0,0,1092,1093,
-        5,80,0,0,1093,1094,5,72,0,0,1094,1095,5,73,0,0,1095,1112,5,67,0,
-        0,1096,1097,5,71,0,0,1097,1098,5,82,0,0,1098,1099,5,65,0,0,1099,
-        1100,5,80,0,0,1100,1101,5,72,0,0,1101,1102,5,73,0,0,1102,1103,5,
-        67,0,0,1103,1104,5,32,0,0,1104,1105,5,86,0,0,1105,1106,5,65,0,0,
-        1106,1107,5,82,0,0,1107,1108,5,89,0,0,1108,1109,5,73,0,0,1109,1110,
-        5,78,0,0,1110,1112,5,71,0,0,1111,1086,1,0,0,0,1111,1096,1,0,0,0,
-        1112,208,1,0,0,0,1113,1114,5,68,0,0,1114,1115,5,66,0,0,1115,1116,
-        5,67,0,0,1116,1117,5,76,0,0,1117,1118,5,79,0,0,1118,1154,5,66,0,
-        0,1119,1120,5,68,0,0,1120,1121,5,79,0,0,1121,1122,5,85,0,0,1122,
-        1123,5,66,0,0,1123,1124,5,76,0,0,1124,1125,5,69,0,0,1125,1126,5,
-        32,0,0,1126,1127,5,66,0,0,1127,1128,5,89,0,0,1128,1129,5,84,0,0,
-        1129,1130,5,69,0,0,1130,1131,5,32,0,0,1131,1132,5,67,0,0,1132,1133,
-        5,72,0,0,1133,1134,5,65,0,0,1134,1135,5,82,0,0,1135,1136,5,65,0,
-        0,1136,1137,5,67,0,0,1137,1138,5,84,0,0,1138,1139,5,69,0,0,1139,
-        1140,5,82,0,0,1140,1141,5,32,0,0,1141,1142,5,76,0,0,1142,1143,5,
-        65,0,0,1143,1144,5,82,0,0,1144,1145,5,71,0,0,1145,1146,5,69,0,0,
-        1146,1147,5,32,0,0,1147,1148,5,79,0,0,1148,1149,5,66,0,0,1149,1150,
-        5,74,0,0,1150,1151,5,69,0,0,1151,1152,5,67,0,0,1152,1154,5,84,0,
-        0,1153,1113,1,0,0,0,1153,1119,1,0,0,0,1154,210,1,0,0,0,1155,1156,
-        5,66,0,0,1156,1157,5,76,0,0,1157,1158,5,79,0,0,1158,1179,5,66,0,
-        0,1159,1160,5,66,0,0,1160,1161,5,73,0,0,1161,1162,5,78,0,0,1162,
-        1163,5,65,0,0,1163,1164,5,82,0,0,1164,1165,5,89,0,0,1165,1166,5,
-        32,0,0,1166,1167,5,76,0,0,1167,1168,5,65,0,0,1168,1169,5,82,0,0,
-        1169,1170,5,71,0,0,1170,1171,5,69,0,0,1171,1172,5,32,0,0,1172,1173,
-        5,79,0,0,1173,1174,5,66,0,0,1174,1175,5,74,0,0,1175,1176,5,69,0,
-        0,1176,1177,5,67,0,0,1177,1179,5,84,0,0,1178,1155,1,0,0,0,1178,1159,
-        1,0,0,0,1179,212,1,0,0,0,1180,1181,5,68,0,0,1181,1182,5,65,0,0,1182,
-        1183,5,84,0,0,1183,1184,5,69,0,0,1184,214,1,0,0,0,1185,1186,5,84,
-        0,0,1186,1187,5,73,0,0,1187,1188,5,77,0,0,1188,1189,5,69,0,0,1189,
-        216,1,0,0,0,1190,1191,5,84,0,0,1191,1192,5,73,0,0,1192,1193,5,77,
-        0,0,1193,1194,5,69,0,0,1194,1195,5,83,0,0,1195,1196,5,84,0,0,1196,
-        1197,5,65,0,0,1197,1198,5,77,0,0,1198,1199,5,80,0,0,1199,218,1,0,
-        0,0,1200,1201,5,88,0,0,1201,1202,5,77,0,0,1202,1203,5,76,0,0,1203,
-        220,1,0,0,0,1204,1205,5,80,0,0,1205,1206,5,82,0,0,1206,1207,5,73,
-        0,0,1207,1208,5,77,0,0,1208,1209,5,65,0,0,1209,1210,5,82,0,0,1210,
-        1211,5,89,0,0,1211,222,1,0,0,0,1212,1213,5,70,0,0,1213,1214,5,79,
-        0,0,1214,1215,5,82,0,0,1215,1216,5,69,0,0,1216,1217,5,73,0,0,1217,
-        1218,5,71,0,0,1218,1219,5,78,0,0,1219,224,1,0,0,0,1220,1221,5,75,
-        0,0,1221,1222,5,69,0,0,1222,1223,5,89,0,0,1223,226,1,0,0,0,1224,
-        1225,5,85,0,0,1225,1226,5,78,0,0,1226,1227,5,73,0,0,1227,1228,5,
-        81,0,0,1228,1229,5,85,0,0,1229,1230,5,69,0,0,1230,228,1,0,0,0,1231,
-        1232,5,78,0,0,1232,1233,5,79,0,0,1233,1234,5,84,0,0,1234,1235,1,
-        0,0,0,1235,1236,3,103,51,0,1236,1237,5,78,0,0,1237,1238,5,85,0,0,
-        1238,1239,5,76,0,0,1239,1240,5,76,0,0,1240,230,1,0,0,0,1241,1242,
-        5,78,0,0,1242,1243,5,85,0,0,1243,1244,5,76,0,0,1244,1245,5,76,0,
-        0,1245,232,1,0,0,0,1246,1247,5,68,0,0,1247,1248,5,69,0,0,1248,1249,
-        5,70,0,0,1249,1250,5,65,0,0,1250,1251,5,85,0,0,1251,1252,5,76,0,
-        0,1252,1253,5,84,0,0,1253,234,1,0,0,0,1254,1255,5,67,0,0,1255,1256,
-        5,72,0,0,1256,1257,5,69,0,0,1257,1258,5,67,0,0,1258,1259,5,75,0,
-        0,1259,236,1,0,0,0,1260,1261,5,67,0,0,1261,1262,5,79,0,0,1262,1263,
-        5,78,0,0,1263,1264,5,83,0,0,1264,1265,5,84,0,0,1265,1266,5,82,0,
-        0,1266,1267,5,65,0,0,1267,1268,5,73,0,0,1268,1269,5,78,0,0,1269,
-        1270,5,84,0,0,1270,238,1,0,0,0,1271,1272,5,82,0,0,1272,1273,5,69,
-        0,0,1273,1274,5,70,0,0,1274,1275,5,69,0,0,1275,1276,5,82,0,0,1276,
-        1277,5,69,0,0,1277,1278,5,78,0,0,1278,1279,5,67,0,0,1279,1280,5,
-        69,0,0,1280,1281,5,83,0,0,1281,240,1,0,0,0,1282,1283,5,67,0,0,1283,
-        1284,5,65,0,0,1284,1285,5,83,0,0,1285,1286,5,67,0,0,1286,1287,5,
-        65,0,0,1287,1288,5,68,0,0,1288,1289,5,69,0,0,1289,242,1,0,0,0,1290,
-        1291,5,82,0,0,1291,1292,5,69,0,0,1292,1293,5,83,0,0,1293,1294,5,
-        84,0,0,1294,1295,5,82,0,0,1295,1296,5,73,0,0,1296,1297,5,67,0,0,
-        1297,1298,5,84,0,0,1298,244,1,0,0,0,1299,1300,5,83,0,0,1300,1301,
-        5,69,0,0,1301,1302,5,84,0,0,1302,1303,1,0,0,0,1303,1304,3,103,51,
-        0,1304,1305,5,78,0,0,1305,1306,5,85,0,0,1306,1307,5,76,0,0,1307,
-        1308,5,76,0,0,1308,246,1,0,0,0,1309,1310,5,78,0,0,1310,1311,5,79,
-        0,0,1311,1312,1,0,0,0,1312,1313,3,103,51,0,1313,1314,5,65,0,0,1314,
-        1315,5,67,0,0,1315,1316,5,84,0,0,1316,1317,5,73,0,0,1317,1318,5,
-        79,0,0,1318,1319,5,78,0,0,1319,248,1,0,0,0,1320,1321,5,67,0,0,1321,
-        1322,5,79,0,0,1322,1323,5,85,0,0,1323,1324,5,78,0,0,1324,1325,5,
-        84,0,0,1325,250,1,0,0,0,1326,1327,5,83,0,0,1327,1328,5,85,0,0,1328,
-        1329,5,77,0,0,1329,252,1,0,0,0,1330,1331,5,65,0,0,1331,1332,5,86,
-        0,0,1332,1341,5,71,0,0,1333,1334,5,65,0,0,1334,1335,5,86,0,0,1335,
-        1336,5,69,0,0,1336,1337,5,82,0,0,1337,1338,5,65,0,0,1338,1339,5,
-        71,0,0,1339,1341,5,69,0,0,1340,1330,1,0,0,0,1340,1333,1,0,0,0,1341,
-        254,1,0,0,0,1342,1343,5,77,0,0,1343,1344,5,73,0,0,1344,1345,5,78,
-        0,0,1345,256,1,0,0,0,1346,1347,5,77,0,0,1347,1348,5,65,0,0,1348,
-        1349,5,88,0,0,1349,258,1,0,0,0,1350,1351,5,67,0,0,1351,1352,5,79,
-        0,0,1352,1353,5,65,0,0,1353,1354,5,76,0,0,1354,1355,5,69,0,0,1355,
-        1356,5,83,0,0,1356,1357,5,67,0,0,1357,1358,5,69,0,0,1358,260,1,0,
-        0,0,1359,1360,5,78,0,0,1360,1361,5,85,0,0,1361,1362,5,76,0,0,1362,
-        1363,5,76,0,0,1363,1364,5,73,0,0,1364,1365,5,70,0,0,1365,262,1,0,
-        0,0,1366,1367,5,67,0,0,1367,1368,5,65,0,0,1368,1369,5,83,0,0,1369,
-        1370,5,69,0,0,1370,264,1,0,0,0,1371,1372,5,87,0,0,1372,1373,5,72,
-        0,0,1373,1374,5,69,0,0,1374,1375,5,78,0,0,1375,266,1,0,0,0,1376,
-        1377,5,84,0,0,1377,1378,5,72,0,0,1378,1379,5,69,0,0,1379,1380,5,
-        78,0,0,1380,268,1,0,0,0,1381,1382,5,69,0,0,1382,1383,5,76,0,0,1383,
-        1384,5,83,0,0,1384,1385,5,69,0,0,1385,270,1,0,0,0,1386,1387,5,69,
-        0,0,1387,1388,5,78,0,0,1388,1389,5,68,0,0,1389,272,1,0,0,0,1390,
-        1391,5,67,0,0,1391,1392,5,65,0,0,1392,1393,5,83,0,0,1393,1394,5,
-        84,0,0,1394,274,1,0,0,0,1395,1396,5,67,0,0,1396,1397,5,79,0,0,1397,
-        1398,5,78,0,0,1398,1399,5,86,0,0,1399,1400,5,69,0,0,1400,1401,5,
-        82,0,0,1401,1402,5,84,0,0,1402,276,1,0,0,0,1403,1404,5,83,0,0,1404,
-        1405,5,85,0,0,1405,1406,5,66,0,0,1406,1407,5,83,0,0,1407,1408,5,
-        84,0,0,1408,1409,5,82,0,0,1409,1410,5,73,0,0,1410,1411,5,78,0,0,
-        1411,1419,5,71,0,0,1412,1413,5,83,0,0,1413,1414,5,85,0,0,1414,1415,
-        5,66,0,0,1415,1416,5,83,0,0,1416,1417,5,84,0,0,1417,1419,5,82,0,
-        0,1418,1403,1,0,0,0,1418,1412,1,0,0,0,1419,278,1,0,0,0,1420,1421,
-        5,76,0,0,1421,1422,5,69,0,0,1422,1423,5,78,0,0,1423,1424,5,71,0,
-        0,1424,1425,5,84,0,0,1425,1430,5,72,0,0,1426,1427,5,76,0,0,1427,
-        1428,5,69,0,0,1428,1430,5,78,0,0,1429,1420,1,0,0,0,1429,1426,1,0,
-        0,0,1430,280,1,0,0,0,1431,1432,5,85,0,0,1432,1433,5,80,0,0,1433,
-        1434,5,80,0,0,1434,1435,5,69,0,0,1435,1436,5,82,0,0,1436,282,1,0,
-        0,0,1437,1438,5,76,0,0,1438,1439,5,79,0,0,1439,1440,5,87,0,0,1440,
-        1441,5,69,0,0,1441,1442,5,82,0,0,1442,284,1,0,0,0,1443,1444,5,84,
-        0,0,1444,1445,5,82,0,0,1445,1446,5,73,0,0,1446,1447,5,77,0,0,1447,
-        286,1,0,0,0,1448,1449,5,76,0,0,1449,1450,5,84,0,0,1450,1451,5,82,
-        0,0,1451,1452,5,73,0,0,1452,1453,5,77,0,0,1453,288,1,0,0,0,1454,
-        1455,5,82,0,0,1455,1456,5,84,0,0,1456,1457,5,82,0,0,1457,1458,5,
-        73,0,0,1458,1459,5,77,0,0,1459,290,1,0,0,0,1460,1461,5,82,0,0,1461,
-        1462,5,69,0,0,1462,1463,5,80,0,0,1463,1464,5,76,0,0,1464,1465,5,
-        65,0,0,1465,1466,5,67,0,0,1466,1467,5,69,0,0,1467,292,1,0,0,0,1468,
-        1469,5,84,0,0,1469,1470,5,82,0,0,1470,1471,5,65,0,0,1471,1472,5,
-        78,0,0,1472,1473,5,83,0,0,1473,1474,5,76,0,0,1474,1475,5,65,0,0,
-        1475,1476,5,84,0,0,1476,1477,5,69,0,0,1477,294,1,0,0,0,1478,1479,
-        5,80,0,0,1479,1480,5,79,0,0,1480,1481,5,83,0,0,1481,1482,5,73,0,
-        0,1482,1483,5,84,0,0,1483,1484,5,73,0,0,1484,1485,5,79,0,0,1485,
-        1490,5,78,0,0,1486,1487,5,80,0,0,1487,1488,5,79,0,0,1488,1490,5,
-        83,0,0,1489,1478,1,0,0,0,1489,1486,1,0,0,0,1490,296,1,0,0,0,1491,
-        1492,5,76,0,0,1492,1493,5,79,0,0,1493,1494,5,67,0,0,1494,1495,5,
-        65,0,0,1495,1496,5,84,0,0,1496,1497,5,69,0,0,1497,298,1,0,0,0,1498,
-        1499,5,74,0,0,1499,1500,5,79,0,0,1500,1501,5,73,0,0,1501,1502,5,
-        78,0,0,1502,300,1,0,0,0,1503,1504,5,73,0,0,1504,1505,5,78,0,0,1505,
-        1506,5,78,0,0,1506,1507,5,69,0,0,1507,1508,5,82,0,0,1508,302,1,0,
-        0,0,1509,1510,5,76,0,0,1510,1511,5,69,0,0,1511,1512,5,70,0,0,1512,
-        1513,5,84,0,0,1513,304,1,0,0,0,1514,1515,5,82,0,0,1515,1516,5,73,
-        0,0,1516,1517,5,71,0,0,1517,1518,5,72,0,0,1518,1519,5,84,0,0,1519,
-        306,1,0,0,0,1520,1521,5,70,0,0,1521,1522,5,85,0,0,1522,1523,5,76,
-        0,0,1523,1524,5,76,0,0,1524,308,1,0,0,0,1525,1526,5,79,0,0,1526,
-        1527,5,85,0,0,1527,1528,5,84,0,0,1528,1529,5,69,0,0,1529,1530,5,
-        82,0,0,1530,310,1,0,0,0,1531,1532,5,67,0,0,1532,1533,5,82,0,0,1533,
-        1534,5,79,0,0,1534,1535,5,83,0,0,1535,1536,5,83,0,0,1536,312,1,0,
-        0,0,1537,1538,5,78,0,0,1538,1539,5,65,0,0,1539,1540,5,84,0,0,1540,
-        1541,5,85,0,0,1541,1542,5,82,0,0,1542,1543,5,65,0,0,1543,1544,5,
-        76,0,0,1544,314,1,0,0,0,1545,1546,5,85,0,0,1546,1547,5,83,0,0,1547,
-        1548,5,73,0,0,1548,1549,5,78,0,0,1549,1550,5,71,0,0,1550,316,1,0,
-        0,0,1551,1552,5,79,0,0,1552,1553,5,78,0,0,1553,318,1,0,0,0,1554,
-        1555,5,85,0,0,1555,1556,5,78,0,0,1556,1557,5,73,0,0,1557,1558,5,
-        79,0,0,1558,1559,5,78,0,0,1559,320,1,0,0,0,1560,1561,5,73,0,0,1561,
-        1562,5,78,0,0,1562,1563,5,84,0,0,1563,1564,5,69,0,0,1564,1565,5,
-        82,0,0,1565,1566,5,83,0,0,1566,1567,5,69,0,0,1567,1568,5,67,0,0,
-        1568,1569,5,84,0,0,1569,322,1,0,0,0,1570,1571,5,69,0,0,1571,1572,
-        5,88,0,0,1572,1573,5,67,0,0,1573,1574,5,69,0,0,1574,1575,5,80,0,
-        0,1575,1576,5,84,0,0,1576,324,1,0,0,0,1577,1578,5,65,0,0,1578,1579,
-        5,76,0,0,1579,1580,5,76,0,0,1580,326,1,0,0,0,1581,1582,5,68,0,0,
-        1582,1583,5,73,0,0,1583,1584,5,83,0,0,1584,1585,5,84,0,0,1585,1586,
-        5,73,0,0,1586,1587,5,78,0,0,1587,1588,5,67,0,0,1588,1589,5,84,0,
-        0,1589,328,1,0,0,0,1590,1591,5,65,0,0,1591,1592,5,78,0,0,1592,1593,
-        5,89,0,0,1593,330,1,0,0,0,1594,1595,5,83,0,0,1595,1596,5,79,0,0,
-        1596,1597,5,77,0,0,1597,1598,5,69,0,0,1598,332,1,0,0,0,1599,1600,
-        5,66,0,0,1600,1601,5,69,0,0,1601,1602,5,71,0,0,1602,1603,5,73,0,
-        0,1603,1604,5,78,0,0,1604,334,1,0,0,0,1605,1606,5,67,0,0,1606,1607,
-        5,79,0,0,1607,1608,5,77,0,0,1608,1609,5,77,0,0,1609,1610,5,73,0,
-        0,1610,1611,5,84,0,0,1611,336,1,0,0,0,1612,1613,5,82,0,0,1613,1614,
-        5,79,0,0,1614,1615,5,76,0,0,1615,1616,5,76,0,0,1616,1617,5,66,0,
-        0,1617,1618,5,65,0,0,1618,1619,5,67,0,0,1619,1620,5,75,0,0,1620,
-        338,1,0,0,0,1621,1622,5,83,0,0,1622,1623,5,65,0,0,1623,1624,5,86,
-        0,0,1624,1625,5,69,0,0,1625,1626,5,80,0,0,1626,1627,5,79,0,0,1627,
-        1628,5,73,0,0,1628,1629,5,78,0,0,1629,1630,5,84,0,0,1630,340,1,0,
-        0,0,1631,1632,5,82,0,0,1632,1633,5,69,0,0,1633,1634,5,76,0,0,1634,
-        1635,5,69,0,0,1635,1636,5,65,0,0,1636,1637,5,83,0,0,1637,1638,5,
-        69,0,0,1638,342,1,0,0,0,1639,1640,5,87,0,0,1640,1641,5,79,0,0,1641,
-        1642,5,82,0,0,1642,1643,5,75,0,0,1643,344,1,0,0,0,1644,1645,5,84,
-        0,0,1645,1646,5,82,0,0,1646,1647,5,65,0,0,1647,1648,5,78,0,0,1648,
-        1649,5,83,0,0,1649,1650,5,65,0,0,1650,1651,5,67,0,0,1651,1652,5,
-        84,0,0,1652,1653,5,73,0,0,1653,1654,5,79,0,0,1654,1655,5,78,0,0,
-        1655,346,1,0,0,0,1656,1657,5,67,0,0,1657,1658,5,79,0,0,1658,1659,
-        5,78,0,0,1659,1660,5,78,0,0,1660,1661,5,69,0,0,1661,1662,5,67,0,
-        0,1662,1663,5,84,0,0,1663,348,1,0,0,0,1664,1665,5,68,0,0,1665,1666,
-        5,73,0,0,1666,1667,5,83,0,0,1667,1668,5,67,0,0,1668,1669,5,79,0,
-        0,1669,1670,5,78,0,0,1670,1671,5,78,0,0,1671,1672,5,69,0,0,1672,
-        1673,5,67,0,0,1673,1674,5,84,0,0,1674,350,1,0,0,0,1675,1676,5,82,
-        0,0,1676,1677,5,69,0,0,1677,1678,5,83,0,0,1678,1679,5,69,0,0,1679,
-        1680,5,84,0,0,1680,352,1,0,0,0,1681,1682,5,67,0,0,1682,1683,5,85,
-        0,0,1683,1684,5,82,0,0,1684,1685,5,82,0,0,1685,1686,5,69,0,0,1686,
-        1687,5,78,0,0,1687,1688,5,84,0,0,1688,1689,5,95,0,0,1689,1690,5,
-        68,0,0,1690,1691,5,65,0,0,1691,1692,5,84,0,0,1692,1693,5,69,0,0,
-        1693,354,1,0,0,0,1694,1695,5,67,0,0,1695,1696,5,85,0,0,1696,1697,
-        5,82,0,0,1697,1698,5,82,0,0,1698,1699,5,69,0,0,1699,1700,5,78,0,
-        0,1700,1701,5,84,0,0,1701,1702,5,95,0,0,1702,1703,5,84,0,0,1703,
-        1704,5,73,0,0,1704,1705,5,77,0,0,1705,1706,5,69,0,0,1706,356,1,0,
-        0,0,1707,1708,5,67,0,0,1708,1709,5,85,0,0,1709,1710,5,82,0,0,1710,
-        1711,5,82,0,0,1711,1712,5,69,0,0,1712,1713,5,78,0,0,1713,1714,5,
-        84,0,0,1714,1715,5,95,0,0,1715,1716,5,84,0,0,1716,1717,5,73,0,0,
-        1717,1718,5,77,0,0,1718,1719,5,69,0,0,1719,1720,5,83,0,0,1720,1721,
-        5,84,0,0,1721,1722,5,65,0,0,1722,1723,5,77,0,0,1723,1724,5,80,0,
-        0,1724,358,1,0,0,0,1725,1726,5,67,0,0,1726,1727,5,85,0,0,1727,1728,
-        5,82,0,0,1728,1729,5,82,0,0,1729,1730,5,69,0,0,1730,1731,5,78,0,
-        0,1731,1732,5,84,0,0,1732,1733,5,95,0,0,1733,1734,5,85,0,0,1734,
-        1735,5,83,0,0,1735,1736,5,69,0,0,1736,1737,5,82,0,0,1737,360,1,0,
-        0,0,1738,1739,5,85,0,0,1739,1740,5,83,0,0,1740,1741,5,69,0,0,1741,
-        1742,5,82,0,0,1742,362,1,0,0,0,1743,1744,5,83,0,0,1744,1745,5,89,
-        0,0,1745,1746,5,83,0,0,1746,1747,5,84,0,0,1747,1748,5,69,0,0,1748,
-        1749,5,77,0,0,1749,1750,5,95,0,0,1750,1751,5,85,0,0,1751,1752,5,
-        83,0,0,1752,1753,5,69,0,0,1753,1754,5,82,0,0,1754,364,1,0,0,0,1755,
-        1756,5,83,0,0,1756,1757,5,69,0,0,1757,1758,5,83,0,0,1758,1759,5,
-        83,0,0,1759,1760,5,73,0,0,1760,1761,5,79,0,0,1761,1762,5,78,0,0,
-        1762,1763,5,95,0,0,1763,1764,5,85,0,0,1764,1765,5,83,0,0,1765,1766,
-        5,69,0,0,1766,1767,5,82,0,0,1767,366,1,0,0,0,1768,1769,5,87,0,0,
-        1769,1770,5,73,0,0,1770,1771,5,84,0,0,1771,1772,5,72,0,0,1772,368,
-        1,0,0,0,1773,1774,5,82,0,0,1774,1775,5,69,0,0,1775,1776,5,67,0,0,
-        1776,1777,5,85,0,0,1777,1778,5,82,0,0,1778,1779,5,83,0,0,1779,1780,
-        5,73,0,0,1780,1781,5,86,0,0,1781,1782,5,69,0,0,1782,370,1,0,0,0,
-        1783,1784,5,76,0,0,1784,1785,5,65,0,0,1785,1786,5,84,0,0,1786,1787,
-        5,69,0,0,1787,1788,5,82,0,0,1788,1789,5,65,0,0,1789,1790,5,76,0,
-        0,1790,372,1,0,0,0,1791,1792,5,82,0,0,1792,1793,5,65,0,0,1793,1794,
-        5,78,0,0,1794,1795,5,71,0,0,1795,1796,5,69,0,0,1796,374,1,0,0,0,
-        1797,1798,5,71,0,0,1798,1799,5,82,0,0,1799,1800,5,79,0,0,1800,1801,
-        5,85,0,0,1801,1802,5,80,0,0,1802,1803,5,83,0,0,1803,376,1,0,0,0,
-        1804,1805,5,85,0,0,1805,1806,5,78,0,0,1806,1807,5,66,0,0,1807,1808,
-        5,79,0,0,1808,1809,5,85,0,0,1809,1810,5,78,0,0,1810,1811,5,68,0,
-        0,1811,1812,5,69,0,0,1812,1813,5,68,0,0,1813,378,1,0,0,0,1814,1815,
-        5,80,0,0,1815,1816,5,82,0,0,1816,1817,5,69,0,0,1817,1818,5,67,0,
-        0,1818,1819,5,69,0,0,1819,1820,5,68,0,0,1820,1821,5,73,0,0,1821,
-        1822,5,78,0,0,1822,1823,5,71,0,0,1823,380,1,0,0,0,1824,1825,5,70,
-        0,0,1825,1826,5,79,0,0,1826,1827,5,76,0,0,1827,1828,5,76,0,0,1828,
-        1829,5,79,0,0,1829,1830,5,87,0,0,1830,1831,5,73,0,0,1831,1832,5,
-        78,0,0,1832,1833,5,71,0,0,1833,382,1,0,0,0,1834,1835,5,67,0,0,1835,
-        1836,5,85,0,0,1836,1837,5,82,0,0,1837,1838,5,82,0,0,1838,1839,5,
-        69,0,0,1839,1840,5,78,0,0,1840,1841,5,84,0,0,1841,384,1,0,0,0,1842,
-        1843,5,82,0,0,1843,1844,5,79,0,0,1844,1845,5,87,0,0,1845,386,1,0,
-        0,0,1846,1847,5,79,0,0,1847,1848,5,86,0,0,1848,1849,5,69,0,0,1849,
-        1850,5,82,0,0,1850,388,1,0,0,0,1851,1852,5,87,0,0,1852,1853,5,73,
-        0,0,1853,1854,5,78,0,0,1854,1855,5,68,0,0,1855,1856,5,79,0,0,1856,
-        1857,5,87,0,0,1857,390,1,0,0,0,1858,1859,5,70,0,0,1859,1860,5,82,
-        0,0,1860,1861,5,65,0,0,1861,1862,5,77,0,0,1862,1863,5,69,0,0,1863,
-        392,1,0,0,0,1864,1865,5,69,0,0,1865,1866,5,88,0,0,1866,1867,5,67,
-        0,0,1867,1868,5,76,0,0,1868,1869,5,85,0,0,1869,1870,5,68,0,0,1870,
-        1871,5,69,0,0,1871,394,1,0,0,0,1872,1873,5,84,0,0,1873,1874,5,73,
-        0,0,1874,1875,5,69,0,0,1875,1876,5,83,0,0,1876,396,1,0,0,0,1877,
-        1878,5,82,0,0,1878,1879,5,69,0,0,1879,1880,5,83,0,0,1880,1881,5,
-        80,0,0,1881,1882,5,69,0,0,1882,1883,5,67,0,0,1883,1884,5,84,0,0,
-        1884,398,1,0,0,0,1885,1886,5,73,0,0,1886,1887,5,71,0,0,1887,1888,
-        5,78,0,0,1888,1889,5,79,0,0,1889,1890,5,82,0,0,1890,1891,5,69,0,
-        0,1891,400,1,0,0,0,1892,1893,5,78,0,0,1893,1894,5,85,0,0,1894,1895,
-        5,76,0,0,1895,1896,5,76,0,0,1896,1897,5,83,0,0,1897,402,1,0,0,0,
-        1898,1899,5,76,0,0,1899,1900,5,65,0,0,1900,1901,5,83,0,0,1901,1902,
-        5,84,0,0,1902,404,1,0,0,0,1903,1904,5,75,0,0,1904,1905,5,69,0,0,
-        1905,1906,5,69,0,0,1906,1907,5,80,0,0,1907,406,1,0,0,0,1908,1909,
-        5,68,0,0,1909,1910,5,69,0,0,1910,1911,5,78,0,0,1911,1912,5,83,0,
-        0,1912,1913,5,69,0,0,1913,1914,5,95,0,0,1914,1915,5,82,0,0,1915,
-        1916,5,65,0,0,1916,1917,5,78,0,0,1917,1918,5,75,0,0,1918,408,1,0,
-        0,0,1919,1920,5,82,0,0,1920,1921,5,65,0,0,1921,1922,5,78,0,0,1922,
-        1923,5,75,0,0,1923,410,1,0,0,0,1924,1925,5,82,0,0,1925,1926,5,79,
-        0,0,1926,1927,5,87,0,0,1927,1928,5,95,0,0,1928,1929,5,78,0,0,1929,
-        1930,5,85,0,0,1930,1931,5,77,0,0,1931,1932,5,66,0,0,1932,1933,5,
-        69,0,0,1933,1934,5,82,0,0,1934,412,1,0,0,0,1935,1936,5,78,0,0,1936,
-        1937,5,84,0,0,1937,1938,5,73,0,0,1938,1939,5,76,0,0,1939,1940,5,
-        69,0,0,1940,414,1,0,0,0,1941,1942,5,76,0,0,1942,1943,5,65,0,0,1943,
-        1944,5,71,0,0,1944,416,1,0,0,0,1945,1946,5,76,0,0,1946,1947,5,69,
-        0,0,1947,1948,5,65,0,0,1948,1949,5,68,0,0,1949,418,1,0,0,0,1950,
-        1951,5,70,0,0,1951,1952,5,73,0,0,1952,1953,5,82,0,0,1953,1954,5,
-        83,0,0,1954,1955,5,84,0,0,1955,1956,5,95,0,0,1956,1957,5,86,0,0,
-        1957,1958,5,65,0,0,1958,1959,5,76,0,0,1959,1960,5,85,0,0,1960,1961,
-        5,69,0,0,1961,420,1,0,0,0,1962,1963,5,76,0,0,1963,1964,5,65,0,0,
-        1964,1965,5,83,0,0,1965,1966,5,84,0,0,1966,1967,5,95,0,0,1967,1968,
-        5,86,0,0,1968,1969,5,65,0,0,1969,1970,5,76,0,0,1970,1971,5,85,0,
-        0,1971,1972,5,69,0,0,1972,422,1,0,0,0,1973,1974,5,78,0,0,1974,1975,
-        5,84,0,0,1975,1976,5,72,0,0,1976,1977,5,95,0,0,1977,1978,5,86,0,
-        0,1978,1979,5,65,0,0,1979,1980,5,76,0,0,1980,1981,5,85,0,0,1981,
-        1982,5,69,0,0,1982,424,1,0,0,0,1983,1984,5,80,0,0,1984,1985,5,69,
-        0,0,1985,1986,5,82,0,0,1986,1987,5,67,0,0,1987,1988,5,69,0,0,1988,
-        1989,5,78,0,0,1989,1990,5,84,0,0,1990,1991,5,95,0,0,1991,1992,5,
-        82,0,0,1992,1993,5,65,0,0,1993,1994,5,78,0,0,1994,1995,5,75,0,0,
-        1995,426,1,0,0,0,1996,1997,5,67,0,0,1997,1998,5,85,0,0,1998,1999,
-        5,77,0,0,1999,2000,5,69,0,0,2000,2001,5,95,0,0,2001,2002,5,68,0,
-        0,2002,2003,5,73,0,0,2003,2004,5,83,0,0,2004,2005,5,84,0,0,2005,
-        428,1,0,0,0,2006,2007,5,80,0,0,2007,2008,5,69,0,0,2008,2009,5,82,
-        0,0,2009,2010,5,67,0,0,2010,2011,5,69,0,0,2011,2012,5,78,0,0,2012,
-        2013,5,84,0,0,2013,2014,5,73,0,0,2014,2015,5,76,0,0,2015,2016,5,
-        69,0,0,2016,2017,5,95,0,0,2017,2018,5,67,0,0,2018,2019,5,79,0,0,
-        2019,2020,5,78,0,0,2020,2021,5,84,0,0,2021,430,1,0,0,0,2022,2023,
-        5,80,0,0,2023,2024,5,69,0,0,2024,2025,5,82,0,0,2025,2026,5,67,0,
-        0,2026,2027,5,69,0,0,2027,2028,5,78,0,0,2028,2029,5,84,0,0,2029,
-        2030,5,73,0,0,2030,2031,5,76,0,0,2031,2032,5,69,0,0,2032,2033,5,
-        95,0,0,2033,2034,5,68,0,0,2034,2035,5,73,0,0,2035,2036,5,83,0,0,
-        2036,2037,5,67,0,0,2037,432,1,0,0,0,26,0,437,443,449,451,457,466,
-        477,540,651,656,666,680,937,972,1001,1022,1048,1076,1111,1153,1178,
-        1340,1418,1429,1489,1,6,0,0
+        0,433,1,0,0,0,0,435,1,0,0,0,0,437,1,0,0,0,0,439,1,0,0,0,0,441,1,
+        0,0,0,0,443,1,0,0,0,0,445,1,0,0,0,0,447,1,0,0,0,0,449,1,0,0,0,0,
+        451,1,0,0,0,0,453,1,0,0,0,0,455,1,0,0,0,0,457,1,0,0,0,0,459,1,0,
+        0,0,0,461,1,0,0,0,0,463,1,0,0,0,1,466,1,0,0,0,3,478,1,0,0,0,5,489,
+        1,0,0,0,7,498,1,0,0,0,9,509,1,0,0,0,11,511,1,0,0,0,13,513,1,0,0,
+        0,15,515,1,0,0,0,17,517,1,0,0,0,19,519,1,0,0,0,21,521,1,0,0,0,23,
+        523,1,0,0,0,25,525,1,0,0,0,27,527,1,0,0,0,29,529,1,0,0,0,31,531,
+        1,0,0,0,33,533,1,0,0,0,35,535,1,0,0,0,37,537,1,0,0,0,39,539,1,0,
+        0,0,41,541,1,0,0,0,43,543,1,0,0,0,45,545,1,0,0,0,47,547,1,0,0,0,
+        49,549,1,0,0,0,51,551,1,0,0,0,53,553,1,0,0,0,55,555,1,0,0,0,57,558,
+        1,0,0,0,59,560,1,0,0,0,61,562,1,0,0,0,63,570,1,0,0,0,65,572,1,0,
+        0,0,67,574,1,0,0,0,69,576,1,0,0,0,71,579,1,0,0,0,73,582,1,0,0,0,
+        75,587,1,0,0,0,77,597,1,0,0,0,79,600,1,0,0,0,81,608,1,0,0,0,83,616,
+        1,0,0,0,85,629,1,0,0,0,87,632,1,0,0,0,89,640,1,0,0,0,91,647,1,0,
+        0,0,93,659,1,0,0,0,95,663,1,0,0,0,97,666,1,0,0,0,99,670,1,0,0,0,
+        101,681,1,0,0,0,103,684,1,0,0,0,105,690,1,0,0,0,107,704,1,0,0,0,
+        109,715,1,0,0,0,111,722,1,0,0,0,113,727,1,0,0,0,115,733,1,0,0,0,
+        117,739,1,0,0,0,119,742,1,0,0,0,121,749,1,0,0,0,123,755,1,0,0,0,
+        125,759,1,0,0,0,127,764,1,0,0,0,129,770,1,0,0,0,131,777,1,0,0,0,
+        133,783,1,0,0,0,135,789,1,0,0,0,137,794,1,0,0,0,139,799,1,0,0,0,
+        141,804,1,0,0,0,143,811,1,0,0,0,145,818,1,0,0,0,147,825,1,0,0,0,
+        149,831,1,0,0,0,151,838,1,0,0,0,153,842,1,0,0,0,155,847,1,0,0,0,
+        157,850,1,0,0,0,159,853,1,0,0,0,161,861,1,0,0,0,163,868,1,0,0,0,
+        165,874,1,0,0,0,167,879,1,0,0,0,169,888,1,0,0,0,171,895,1,0,0,0,
+        173,901,1,0,0,0,175,908,1,0,0,0,177,914,1,0,0,0,179,919,1,0,0,0,
+        181,925,1,0,0,0,183,934,1,0,0,0,185,941,1,0,0,0,187,950,1,0,0,0,
+        189,961,1,0,0,0,191,971,1,0,0,0,193,978,1,0,0,0,195,982,1,0,0,0,
+        197,989,1,0,0,0,199,997,1,0,0,0,201,1004,1,0,0,0,203,1010,1,0,0,
+        0,205,1020,1,0,0,0,207,1029,1,0,0,0,209,1048,1,0,0,0,211,1050,1,
+        0,0,0,213,1059,1,0,0,0,215,1083,1,0,0,0,217,1085,1,0,0,0,219,1112,
+        1,0,0,0,221,1114,1,0,0,0,223,1133,1,0,0,0,225,1159,1,0,0,0,227,1187,
+        1,0,0,0,229,1189,1,0,0,0,231,1222,1,0,0,0,233,1264,1,0,0,0,235,1289,
+        1,0,0,0,237,1291,1,0,0,0,239,1296,1,0,0,0,241,1301,1,0,0,0,243,1311,
+        1,0,0,0,245,1315,1,0,0,0,247,1323,1,0,0,0,249,1331,1,0,0,0,251,1335,
+        1,0,0,0,253,1342,1,0,0,0,255,1352,1,0,0,0,257,1357,1,0,0,0,259,1365,
+        1,0,0,0,261,1371,1,0,0,0,263,1382,1,0,0,0,265,1393,1,0,0,0,267,1401,
+        1,0,0,0,269,1410,1,0,0,0,271,1420,1,0,0,0,273,1431,1,0,0,0,275,1441,
+        1,0,0,0,277,1448,1,0,0,0,279,1457,1,0,0,0,281,1463,1,0,0,0,283,1477,
+        1,0,0,0,285,1479,1,0,0,0,287,1483,1,0,0,0,289,1487,1,0,0,0,291,1496,
+        1,0,0,0,293,1503,1,0,0,0,295,1508,1,0,0,0,297,1513,1,0,0,0,299,1518,
+        1,0,0,0,301,1523,1,0,0,0,303,1527,1,0,0,0,305,1532,1,0,0,0,307,1555,
+        1,0,0,0,309,1566,1,0,0,0,311,1568,1,0,0,0,313,1574,1,0,0,0,315,1580,
+        1,0,0,0,317,1585,1,0,0,0,319,1591,1,0,0,0,321,1597,1,0,0,0,323,1605,
+        1,0,0,0,325,1626,1,0,0,0,327,1628,1,0,0,0,329,1635,1,0,0,0,331,1640,
+        1,0,0,0,333,1646,1,0,0,0,335,1651,1,0,0,0,337,1657,1,0,0,0,339,1662,
+        1,0,0,0,341,1668,1,0,0,0,343,1674,1,0,0,0,345,1682,1,0,0,0,347,1688,
+        1,0,0,0,349,1691,1,0,0,0,351,1697,1,0,0,0,353,1707,1,0,0,0,355,1714,
+        1,0,0,0,357,1718,1,0,0,0,359,1727,1,0,0,0,361,1731,1,0,0,0,363,1736,
+        1,0,0,0,365,1742,1,0,0,0,367,1749,1,0,0,0,369,1758,1,0,0,0,371,1768,
+        1,0,0,0,373,1776,1,0,0,0,375,1781,1,0,0,0,377,1793,1,0,0,0,379,1801,
+        1,0,0,0,381,1812,1,0,0,0,383,1818,1,0,0,0,385,1831,1,0,0,0,387,1844,
+        1,0,0,0,389,1862,1,0,0,0,391,1875,1,0,0,0,393,1880,1,0,0,0,395,1892,
+        1,0,0,0,397,1905,1,0,0,0,399,1910,1,0,0,0,401,1920,1,0,0,0,403,1928,
+        1,0,0,0,405,1934,1,0,0,0,407,1941,1,0,0,0,409,1951,1,0,0,0,411,1961,
+        1,0,0,0,413,1971,1,0,0,0,415,1979,1,0,0,0,417,1983,1,0,0,0,419,1988,
+        1,0,0,0,421,1995,1,0,0,0,423,2001,1,0,0,0,425,2009,1,0,0,0,427,2014,
+        1,0,0,0,429,2022,1,0,0,0,431,2029,1,0,0,0,433,2035,1,0,0,0,435,2040,
+        1,0,0,0,437,2045,1,0,0,0,439,2056,1,0,0,0,441,2061,1,0,0,0,443,2072,
+        1,0,0,0,445,2078,1,0,0,0,447,2082,1,0,0,0,449,2087,1,0,0,0,451,2099,
+        1,0,0,0,453,2110,1,0,0,0,455,2120,1,0,0,0,457,2133,1,0,0,0,459,2143,
+        1,0,0,0,461,2159,1,0,0,0,463,2175,1,0,0,0,465,467,7,0,0,0,466,465,
+        1,0,0,0,467,468,1,0,0,0,468,466,1,0,0,0,468,469,1,0,0,0,469,476,
+        1,0,0,0,470,472,5,46,0,0,471,473,7,0,0,0,472,471,1,0,0,0,473,474,
+        1,0,0,0,474,472,1,0,0,0,474,475,1,0,0,0,475,477,1,0,0,0,476,470,
+        1,0,0,0,476,477,1,0,0,0,477,2,1,0,0,0,478,484,5,39,0,0,479,480,5,
+        39,0,0,480,483,5,39,0,0,481,483,8,1,0,0,482,479,1,0,0,0,482,481,
+        1,0,0,0,483,486,1,0,0,0,484,482,1,0,0,0,484,485,1,0,0,0,485,487,
+        1,0,0,0,486,484,1,0,0,0,487,488,5,39,0,0,488,4,1,0,0,0,489,493,5,
+        34,0,0,490,492,8,2,0,0,491,490,1,0,0,0,492,495,1,0,0,0,493,491,1,
+        0,0,0,493,494,1,0,0,0,494,496,1,0,0,0,495,493,1,0,0,0,496,497,5,
+        34,0,0,497,6,1,0,0,0,498,499,7,3,0,0,499,500,5,39,0,0,500,504,1,
+        0,0,0,501,503,7,4,0,0,502,501,1,0,0,0,503,506,1,0,0,0,504,502,1,
+        0,0,0,504,505,1,0,0,0,505,507,1,0,0,0,506,504,1,0,0,0,507,508,5,
+        39,0,0,508,8,1,0,0,0,509,510,5,40,0,0,510,10,1,0,0,0,511,512,5,41,
+        0,0,512,12,1,0,0,0,513,514,5,91,0,0,514,14,1,0,0,0,515,516,5,93,
+        0,0,516,16,1,0,0,0,517,518,5,44,0,0,518,18,1,0,0,0,519,520,5,59,
+        0,0,520,20,1,0,0,0,521,522,5,58,0,0,522,22,1,0,0,0,523,524,5,61,
+        0,0,524,24,1,0,0,0,525,526,5,43,0,0,526,26,1,0,0,0,527,528,5,45,
+        0,0,528,28,1,0,0,0,529,530,5,42,0,0,530,30,1,0,0,0,531,532,5,47,
+        0,0,532,32,1,0,0,0,533,534,5,37,0,0,534,34,1,0,0,0,535,536,5,35,
+        0,0,536,36,1,0,0,0,537,538,5,64,0,0,538,38,1,0,0,0,539,540,5,36,
+        0,0,540,40,1,0,0,0,541,542,5,46,0,0,542,42,1,0,0,0,543,544,5,95,
+        0,0,544,44,1,0,0,0,545,546,5,63,0,0,546,46,1,0,0,0,547,548,5,33,
+        0,0,548,48,1,0,0,0,549,550,5,126,0,0,550,50,1,0,0,0,551,552,5,94,
+        0,0,552,52,1,0,0,0,553,554,5,38,0,0,554,54,1,0,0,0,555,556,5,124,
+        0,0,556,557,5,124,0,0,557,56,1,0,0,0,558,559,5,124,0,0,559,58,1,
+        0,0,0,560,561,5,92,0,0,561,60,1,0,0,0,562,563,5,96,0,0,563,62,1,
+        0,0,0,564,565,5,60,0,0,565,571,5,62,0,0,566,567,5,33,0,0,567,571,
+        5,61,0,0,568,569,5,94,0,0,569,571,5,61,0,0,570,564,1,0,0,0,570,566,
+        1,0,0,0,570,568,1,0,0,0,571,64,1,0,0,0,572,573,5,62,0,0,573,66,1,
+        0,0,0,574,575,5,60,0,0,575,68,1,0,0,0,576,577,5,62,0,0,577,578,5,
+        61,0,0,578,70,1,0,0,0,579,580,5,60,0,0,580,581,5,61,0,0,581,72,1,
+        0,0,0,582,583,7,5,0,0,583,584,7,6,0,0,584,585,7,7,0,0,585,586,7,
+        8,0,0,586,74,1,0,0,0,587,588,7,9,0,0,588,589,7,10,0,0,589,590,7,
+        11,0,0,590,591,1,0,0,0,591,592,3,103,51,0,592,593,7,5,0,0,593,594,
+        7,6,0,0,594,595,7,7,0,0,595,596,7,8,0,0,596,76,1,0,0,0,597,598,7,
+        6,0,0,598,599,7,9,0,0,599,78,1,0,0,0,600,601,7,9,0,0,601,602,7,10,
+        0,0,602,603,7,11,0,0,603,604,1,0,0,0,604,605,3,103,51,0,605,606,
+        7,6,0,0,606,607,7,9,0,0,607,80,1,0,0,0,608,609,7,12,0,0,609,610,
+        7,8,0,0,610,611,7,11,0,0,611,612,7,13,0,0,612,613,7,8,0,0,613,614,
+        7,8,0,0,614,615,7,9,0,0,615,82,1,0,0,0,616,617,7,9,0,0,617,618,7,
+        10,0,0,618,619,7,11,0,0,619,620,1,0,0,0,620,621,3,103,51,0,621,622,
+        7,12,0,0,622,623,7,8,0,0,623,624,7,11,0,0,624,625,7,13,0,0,625,626,
+        7,8,0,0,626,627,7,8,0,0,627,628,7,9,0,0,628,84,1,0,0,0,629,630,7,
+        6,0,0,630,631,7,14,0,0,631,86,1,0,0,0,632,633,7,6,0,0,633,634,7,
+        14,0,0,634,635,1,0,0,0,635,636,3,103,51,0,636,637,7,9,0,0,637,638,
+        7,10,0,0,638,639,7,11,0,0,639,88,1,0,0,0,640,641,7,8,0,0,641,642,
+        7,3,0,0,642,643,7,6,0,0,643,644,7,14,0,0,644,645,7,11,0,0,645,646,
+        7,14,0,0,646,90,1,0,0,0,647,648,7,9,0,0,648,649,7,10,0,0,649,650,
+        7,11,0,0,650,651,1,0,0,0,651,652,3,103,51,0,652,653,7,8,0,0,653,
+        654,7,3,0,0,654,655,7,6,0,0,655,656,7,14,0,0,656,657,7,11,0,0,657,
+        658,7,14,0,0,658,92,1,0,0,0,659,660,7,15,0,0,660,661,7,9,0,0,661,
+        662,7,16,0,0,662,94,1,0,0,0,663,664,7,10,0,0,664,665,7,17,0,0,665,
+        96,1,0,0,0,666,667,7,9,0,0,667,668,7,10,0,0,668,669,7,11,0,0,669,
+        98,1,0,0,0,670,671,7,3,0,0,671,672,7,10,0,0,672,673,7,17,0,0,673,
+        100,1,0,0,0,674,675,5,42,0,0,675,682,5,42,0,0,676,677,7,18,0,0,677,
+        678,7,10,0,0,678,679,7,13,0,0,679,680,7,8,0,0,680,682,7,17,0,0,681,
+        674,1,0,0,0,681,676,1,0,0,0,682,102,1,0,0,0,683,685,7,19,0,0,684,
+        683,1,0,0,0,685,686,1,0,0,0,686,684,1,0,0,0,686,687,1,0,0,0,687,
+        688,1,0,0,0,688,689,6,51,0,0,689,104,1,0,0,0,690,691,5,47,0,0,691,
+        692,5,42,0,0,692,696,1,0,0,0,693,695,9,0,0,0,694,693,1,0,0,0,695,
+        698,1,0,0,0,696,697,1,0,0,0,696,694,1,0,0,0,697,699,1,0,0,0,698,
+        696,1,0,0,0,699,700,5,42,0,0,700,701,5,47,0,0,701,702,1,0,0,0,702,
+        703,6,52,0,0,703,106,1,0,0,0,704,705,5,45,0,0,705,706,5,45,0,0,706,
+        710,1,0,0,0,707,709,8,20,0,0,708,707,1,0,0,0,709,712,1,0,0,0,710,
+        708,1,0,0,0,710,711,1,0,0,0,711,713,1,0,0,0,712,710,1,0,0,0,713,
+        714,6,53,0,0,714,108,1,0,0,0,715,716,7,14,0,0,716,717,7,8,0,0,717,
+        718,7,5,0,0,718,719,7,8,0,0,719,720,7,21,0,0,720,721,7,11,0,0,721,
+        110,1,0,0,0,722,723,7,22,0,0,723,724,7,17,0,0,724,725,7,10,0,0,725,
+        726,7,23,0,0,726,112,1,0,0,0,727,728,7,13,0,0,728,729,7,24,0,0,729,
+        730,7,8,0,0,730,731,7,17,0,0,731,732,7,8,0,0,732,114,1,0,0,0,733,
+        734,7,25,0,0,734,735,7,17,0,0,735,736,7,10,0,0,736,737,7,26,0,0,
+        737,738,7,18,0,0,738,116,1,0,0,0,739,740,7,12,0,0,740,741,7,27,0,
+        0,741,118,1,0,0,0,742,743,7,24,0,0,743,744,7,15,0,0,744,745,7,28,
+        0,0,745,746,7,6,0,0,746,747,7,9,0,0,747,748,7,25,0,0,748,120,1,0,
+        0,0,749,750,7,10,0,0,750,751,7,17,0,0,751,752,7,16,0,0,752,753,7,
+        8,0,0,753,754,7,17,0,0,754,122,1,0,0,0,755,756,7,15,0,0,756,757,
+        7,14,0,0,757,758,7,21,0,0,758,124,1,0,0,0,759,760,7,16,0,0,760,761,
+        7,8,0,0,761,762,7,14,0,0,762,763,7,21,0,0,763,126,1,0,0,0,764,765,
+        7,5,0,0,765,766,7,6,0,0,766,767,7,23,0,0,767,768,7,6,0,0,768,769,
+        7,11,0,0,769,128,1,0,0,0,770,771,7,10,0,0,771,772,7,22,0,0,772,773,
+        7,22,0,0,773,774,7,14,0,0,774,775,7,8,0,0,775,776,7,11,0,0,776,130,
+        1,0,0,0,777,778,7,22,0,0,778,779,7,8,0,0,779,780,7,11,0,0,780,781,
+        7,21,0,0,781,782,7,24,0,0,782,132,1,0,0,0,783,784,7,22,0,0,784,785,
+        7,6,0,0,785,786,7,17,0,0,786,787,7,14,0,0,787,788,7,11,0,0,788,134,
+        1,0,0,0,789,790,7,9,0,0,790,791,7,8,0,0,791,792,7,3,0,0,792,793,
+        7,11,0,0,793,136,1,0,0,0,794,795,7,17,0,0,795,796,7,10,0,0,796,797,
+        7,13,0,0,797,798,7,14,0,0,798,138,1,0,0,0,799,800,7,10,0,0,800,801,
+        7,9,0,0,801,802,7,5,0,0,802,803,7,27,0,0,803,140,1,0,0,0,804,805,
+        7,6,0,0,805,806,7,9,0,0,806,807,7,14,0,0,807,808,7,8,0,0,808,809,
+        7,17,0,0,809,810,7,11,0,0,810,142,1,0,0,0,811,812,7,26,0,0,812,813,
+        7,18,0,0,813,814,7,16,0,0,814,815,7,15,0,0,815,816,7,11,0,0,816,
+        817,7,8,0,0,817,144,1,0,0,0,818,819,7,16,0,0,819,820,7,8,0,0,820,
+        821,7,5,0,0,821,822,7,8,0,0,822,823,7,11,0,0,823,824,7,8,0,0,824,
+        146,1,0,0,0,825,826,7,23,0,0,826,827,7,8,0,0,827,828,7,17,0,0,828,
+        829,7,25,0,0,829,830,7,8,0,0,830,148,1,0,0,0,831,832,7,28,0,0,832,
+        833,7,15,0,0,833,834,7,5,0,0,834,835,7,26,0,0,835,836,7,8,0,0,836,
+        837,7,14,0,0,837,150,1,0,0,0,838,839,7,14,0,0,839,840,7,8,0,0,840,
+        841,7,11,0,0,841,152,1,0,0,0,842,843,7,6,0,0,843,844,7,9,0,0,844,
+        845,7,11,0,0,845,846,7,10,0,0,846,154,1,0,0,0,847,848,7,15,0,0,848,
+        849,7,14,0,0,849,156,1,0,0,0,850,851,7,11,0,0,851,852,7,10,0,0,852,
+        158,1,0,0,0,853,854,7,23,0,0,854,855,7,15,0,0,855,856,7,11,0,0,856,
+        857,7,21,0,0,857,858,7,24,0,0,858,859,7,8,0,0,859,860,7,16,0,0,860,
+        160,1,0,0,0,861,862,7,21,0,0,862,863,7,17,0,0,863,864,7,8,0,0,864,
+        865,7,15,0,0,865,866,7,11,0,0,866,867,7,8,0,0,867,162,1,0,0,0,868,
+        869,7,15,0,0,869,870,7,5,0,0,870,871,7,11,0,0,871,872,7,8,0,0,872,
+        873,7,17,0,0,873,164,1,0,0,0,874,875,7,16,0,0,875,876,7,17,0,0,876,
+        877,7,10,0,0,877,878,7,18,0,0,878,166,1,0,0,0,879,880,7,11,0,0,880,
+        881,7,17,0,0,881,882,7,26,0,0,882,883,7,9,0,0,883,884,7,21,0,0,884,
+        885,7,15,0,0,885,886,7,11,0,0,886,887,7,8,0,0,887,168,1,0,0,0,888,
+        889,7,17,0,0,889,890,7,8,0,0,890,891,7,9,0,0,891,892,7,15,0,0,892,
+        893,7,23,0,0,893,894,7,8,0,0,894,170,1,0,0,0,895,896,7,25,0,0,896,
+        897,7,17,0,0,897,898,7,15,0,0,898,899,7,9,0,0,899,900,7,11,0,0,900,
+        172,1,0,0,0,901,902,7,17,0,0,902,903,7,8,0,0,903,904,7,28,0,0,904,
+        905,7,10,0,0,905,906,7,7,0,0,906,907,7,8,0,0,907,174,1,0,0,0,908,
+        909,7,11,0,0,909,910,7,15,0,0,910,911,7,12,0,0,911,912,7,5,0,0,912,
+        913,7,8,0,0,913,176,1,0,0,0,914,915,7,28,0,0,915,916,7,6,0,0,916,
+        917,7,8,0,0,917,918,7,13,0,0,918,178,1,0,0,0,919,920,7,6,0,0,920,
+        921,7,9,0,0,921,922,7,16,0,0,922,923,7,8,0,0,923,924,7,3,0,0,924,
+        180,1,0,0,0,925,926,7,14,0,0,926,927,7,8,0,0,927,928,7,29,0,0,928,
+        929,7,26,0,0,929,930,7,8,0,0,930,931,7,9,0,0,931,932,7,21,0,0,932,
+        933,7,8,0,0,933,182,1,0,0,0,934,935,7,14,0,0,935,936,7,21,0,0,936,
+        937,7,24,0,0,937,938,7,8,0,0,938,939,7,23,0,0,939,940,7,15,0,0,940,
+        184,1,0,0,0,941,942,7,16,0,0,942,943,7,15,0,0,943,944,7,11,0,0,944,
+        945,7,15,0,0,945,946,7,12,0,0,946,947,7,15,0,0,947,948,7,14,0,0,
+        948,949,7,8,0,0,949,186,1,0,0,0,950,951,7,11,0,0,951,952,7,15,0,
+        0,952,953,7,12,0,0,953,954,7,5,0,0,954,955,7,8,0,0,955,956,7,14,
+        0,0,956,957,7,18,0,0,957,958,7,15,0,0,958,959,7,21,0,0,959,960,7,
+        8,0,0,960,188,1,0,0,0,961,962,7,18,0,0,962,963,7,15,0,0,963,964,
+        7,17,0,0,964,965,7,11,0,0,965,966,7,6,0,0,966,967,7,11,0,0,967,968,
+        7,6,0,0,968,969,7,10,0,0,969,970,7,9,0,0,970,190,1,0,0,0,971,972,
+        7,21,0,0,972,973,7,10,0,0,973,974,7,5,0,0,974,975,7,26,0,0,975,976,
+        7,23,0,0,976,977,7,9,0,0,977,192,1,0,0,0,978,979,7,15,0,0,979,980,
+        7,16,0,0,980,981,7,16,0,0,981,194,1,0,0,0,982,983,7,23,0,0,983,984,
+        7,10,0,0,984,985,7,16,0,0,985,986,7,6,0,0,986,987,7,22,0,0,987,988,
+        7,27,0,0,988,196,1,0,0,0,989,990,7,21,0,0,990,991,7,10,0,0,991,992,
+        7,23,0,0,992,993,7,23,0,0,993,994,7,8,0,0,994,995,7,9,0,0,995,996,
+        7,11,0,0,996,198,1,0,0,0,997,998,7,18,0,0,998,999,7,26,0,0,999,1000,
+        7,12,0,0,1000,1001,7,5,0,0,1001,1002,7,6,0,0,1002,1003,7,21,0,0,
+        1003,200,1,0,0,0,1004,1005,7,14,0,0,1005,1006,7,11,0,0,1006,1007,
+        7,15,0,0,1007,1008,7,17,0,0,1008,1009,7,11,0,0,1009,202,1,0,0,0,
+        1010,1011,7,6,0,0,1011,1012,7,9,0,0,1012,1013,7,21,0,0,1013,1014,
+        7,17,0,0,1014,1015,7,8,0,0,1015,1016,7,23,0,0,1016,1017,7,8,0,0,
+        1017,1018,7,9,0,0,1018,1019,7,11,0,0,1019,204,1,0,0,0,1020,1021,
+        7,23,0,0,1021,1022,7,6,0,0,1022,1023,7,9,0,0,1023,1024,7,28,0,0,
+        1024,1025,7,15,0,0,1025,1026,7,5,0,0,1026,1027,7,26,0,0,1027,1028,
+        7,8,0,0,1028,206,1,0,0,0,1029,1030,7,23,0,0,1030,1031,7,15,0,0,1031,
+        1032,7,3,0,0,1032,1033,7,28,0,0,1033,1034,7,15,0,0,1034,1035,7,5,
+        0,0,1035,1036,7,26,0,0,1036,1037,7,8,0,0,1037,208,1,0,0,0,1038,1039,
+        7,6,0,0,1039,1040,7,9,0,0,1040,1041,7,11,0,0,1041,1042,7,8,0,0,1042,
+        1043,7,25,0,0,1043,1044,7,8,0,0,1044,1049,7,17,0,0,1045,1046,7,6,
+        0,0,1046,1047,7,9,0,0,1047,1049,7,11,0,0,1048,1038,1,0,0,0,1048,
+        1045,1,0,0,0,1049,210,1,0,0,0,1050,1051,7,14,0,0,1051,1052,7,23,
+        0,0,1052,1053,7,15,0,0,1053,1054,7,5,0,0,1054,1055,7,5,0,0,1055,
+        1056,7,6,0,0,1056,1057,7,9,0,0,1057,1058,7,11,0,0,1058,212,1,0,0,
+        0,1059,1060,7,12,0,0,1060,1061,7,6,0,0,1061,1062,7,25,0,0,1062,1063,
+        7,6,0,0,1063,1064,7,9,0,0,1064,1065,7,11,0,0,1065,214,1,0,0,0,1066,
+        1067,7,16,0,0,1067,1068,7,8,0,0,1068,1069,7,21,0,0,1069,1070,7,6,
+        0,0,1070,1071,7,23,0,0,1071,1072,7,15,0,0,1072,1084,7,5,0,0,1073,
+        1074,7,16,0,0,1074,1075,7,8,0,0,1075,1084,7,21,0,0,1076,1077,7,9,
+        0,0,1077,1078,7,26,0,0,1078,1079,7,23,0,0,1079,1080,7,8,0,0,1080,
+        1081,7,17,0,0,1081,1082,7,6,0,0,1082,1084,7,21,0,0,1083,1066,1,0,
+        0,0,1083,1073,1,0,0,0,1083,1076,1,0,0,0,1084,216,1,0,0,0,1085,1086,
+        7,17,0,0,1086,1087,7,8,0,0,1087,1088,7,15,0,0,1088,1089,7,5,0,0,
+        1089,218,1,0,0,0,1090,1091,7,16,0,0,1091,1092,7,10,0,0,1092,1093,
+        7,26,0,0,1093,1094,7,12,0,0,1094,1095,7,5,0,0,1095,1113,7,8,0,0,
+        1096,1097,7,16,0,0,1097,1098,7,10,0,0,1098,1099,7,26,0,0,1099,1100,
+        7,12,0,0,1100,1101,7,5,0,0,1101,1102,7,8,0,0,1102,1103,5,95,0,0,
+        1103,1104,7,18,0,0,1104,1105,7,17,0,0,1105,1106,7,8,0,0,1106,1107,
+        7,21,0,0,1107,1108,7,6,0,0,1108,1109,7,14,0,0,1109,1110,7,6,0,0,
+        1110,1111,7,10,0,0,1111,1113,7,9,0,0,1112,1090,1,0,0,0,1112,1096,
+        1,0,0,0,1113,220,1,0,0,0,1114,1115,7,22,0,0,1115,1116,7,5,0,0,1116,
+        1117,7,10,0,0,1117,1118,7,15,0,0,1118,1119,7,11,0,0,1119,222,1,0,
+        0,0,1120,1121,7,21,0,0,1121,1122,7,24,0,0,1122,1123,7,15,0,0,1123,
+        1134,7,17,0,0,1124,1125,7,21,0,0,1125,1126,7,24,0,0,1126,1127,7,
+        15,0,0,1127,1128,7,17,0,0,1128,1129,7,15,0,0,1129,1130,7,21,0,0,
+        1130,1131,7,11,0,0,1131,1132,7,8,0,0,1132,1134,7,17,0,0,1133,1120,
+        1,0,0,0,1133,1124,1,0,0,0,1134,224,1,0,0,0,1135,1136,7,28,0,0,1136,
+        1137,7,15,0,0,1137,1138,7,17,0,0,1138,1139,7,21,0,0,1139,1140,7,
+        24,0,0,1140,1141,7,15,0,0,1141,1160,7,17,0,0,1142,1143,7,21,0,0,
+        1143,1144,7,24,0,0,1144,1145,7,15,0,0,1145,1146,7,17,0,0,1146,1147,
+        7,15,0,0,1147,1148,7,21,0,0,1148,1149,7,11,0,0,1149,1150,7,8,0,0,
+        1150,1151,7,17,0,0,1151,1152,5,32,0,0,1152,1153,7,28,0,0,1153,1154,
+        7,15,0,0,1154,1155,7,17,0,0,1155,1156,7,27,0,0,1156,1157,7,6,0,0,
+        1157,1158,7,9,0,0,1158,1160,7,25,0,0,1159,1135,1,0,0,0,1159,1142,
+        1,0,0,0,1160,226,1,0,0,0,1161,1162,7,21,0,0,1162,1163,7,5,0,0,1163,
+        1164,7,10,0,0,1164,1188,7,12,0,0,1165,1166,7,21,0,0,1166,1167,7,
+        24,0,0,1167,1168,7,15,0,0,1168,1169,7,17,0,0,1169,1170,7,15,0,0,
+        1170,1171,7,21,0,0,1171,1172,7,11,0,0,1172,1173,7,8,0,0,1173,1174,
+        7,17,0,0,1174,1175,5,32,0,0,1175,1176,7,5,0,0,1176,1177,7,15,0,0,
+        1177,1178,7,17,0,0,1178,1179,7,25,0,0,1179,1180,7,8,0,0,1180,1181,
+        5,32,0,0,1181,1182,7,10,0,0,1182,1183,7,12,0,0,1183,1184,7,30,0,
+        0,1184,1185,7,8,0,0,1185,1186,7,21,0,0,1186,1188,7,11,0,0,1187,1161,
+        1,0,0,0,1187,1165,1,0,0,0,1188,228,1,0,0,0,1189,1190,7,25,0,0,1190,
+        1191,7,17,0,0,1191,1192,7,15,0,0,1192,1193,7,18,0,0,1193,1194,7,
+        24,0,0,1194,1195,7,6,0,0,1195,1196,7,21,0,0,1196,230,1,0,0,0,1197,
+        1198,7,28,0,0,1198,1199,7,15,0,0,1199,1200,7,17,0,0,1200,1201,7,
+        25,0,0,1201,1202,7,17,0,0,1202,1203,7,15,0,0,1203,1204,7,18,0,0,
+        1204,1205,7,24,0,0,1205,1206,7,6,0,0,1206,1223,7,21,0,0,1207,1208,
+        7,25,0,0,1208,1209,7,17,0,0,1209,1210,7,15,0,0,1210,1211,7,18,0,
+        0,1211,1212,7,24,0,0,1212,1213,7,6,0,0,1213,1214,7,21,0,0,1214,1215,
+        5,32,0,0,1215,1216,7,28,0,0,1216,1217,7,15,0,0,1217,1218,7,17,0,
+        0,1218,1219,7,27,0,0,1219,1220,7,6,0,0,1220,1221,7,9,0,0,1221,1223,
+        7,25,0,0,1222,1197,1,0,0,0,1222,1207,1,0,0,0,1223,232,1,0,0,0,1224,
+        1225,7,16,0,0,1225,1226,7,12,0,0,1226,1227,7,21,0,0,1227,1228,7,
+        5,0,0,1228,1229,7,10,0,0,1229,1265,7,12,0,0,1230,1231,7,16,0,0,1231,
+        1232,7,10,0,0,1232,1233,7,26,0,0,1233,1234,7,12,0,0,1234,1235,7,
+        5,0,0,1235,1236,7,8,0,0,1236,1237,5,32,0,0,1237,1238,7,12,0,0,1238,
+        1239,7,27,0,0,1239,1240,7,11,0,0,1240,1241,7,8,0,0,1241,1242,5,32,
+        0,0,1242,1243,7,21,0,0,1243,1244,7,24,0,0,1244,1245,7,15,0,0,1245,
+        1246,7,17,0,0,1246,1247,7,15,0,0,1247,1248,7,21,0,0,1248,1249,7,
+        11,0,0,1249,1250,7,8,0,0,1250,1251,7,17,0,0,1251,1252,5,32,0,0,1252,
+        1253,7,5,0,0,1253,1254,7,15,0,0,1254,1255,7,17,0,0,1255,1256,7,25,
+        0,0,1256,1257,7,8,0,0,1257,1258,5,32,0,0,1258,1259,7,10,0,0,1259,
+        1260,7,12,0,0,1260,1261,7,30,0,0,1261,1262,7,8,0,0,1262,1263,7,21,
+        0,0,1263,1265,7,11,0,0,1264,1224,1,0,0,0,1264,1230,1,0,0,0,1265,
+        234,1,0,0,0,1266,1267,7,12,0,0,1267,1268,7,5,0,0,1268,1269,7,10,
+        0,0,1269,1290,7,12,0,0,1270,1271,7,12,0,0,1271,1272,7,6,0,0,1272,
+        1273,7,9,0,0,1273,1274,7,15,0,0,1274,1275,7,17,0,0,1275,1276,7,27,
+        0,0,1276,1277,5,32,0,0,1277,1278,7,5,0,0,1278,1279,7,15,0,0,1279,
+        1280,7,17,0,0,1280,1281,7,25,0,0,1281,1282,7,8,0,0,1282,1283,5,32,
+        0,0,1283,1284,7,10,0,0,1284,1285,7,12,0,0,1285,1286,7,30,0,0,1286,
+        1287,7,8,0,0,1287,1288,7,21,0,0,1288,1290,7,11,0,0,1289,1266,1,0,
+        0,0,1289,1270,1,0,0,0,1290,236,1,0,0,0,1291,1292,7,16,0,0,1292,1293,
+        7,15,0,0,1293,1294,7,11,0,0,1294,1295,7,8,0,0,1295,238,1,0,0,0,1296,
+        1297,7,11,0,0,1297,1298,7,6,0,0,1298,1299,7,23,0,0,1299,1300,7,8,
+        0,0,1300,240,1,0,0,0,1301,1302,7,11,0,0,1302,1303,7,6,0,0,1303,1304,
+        7,23,0,0,1304,1305,7,8,0,0,1305,1306,7,14,0,0,1306,1307,7,11,0,0,
+        1307,1308,7,15,0,0,1308,1309,7,23,0,0,1309,1310,7,18,0,0,1310,242,
+        1,0,0,0,1311,1312,7,3,0,0,1312,1313,7,23,0,0,1313,1314,7,5,0,0,1314,
+        244,1,0,0,0,1315,1316,7,18,0,0,1316,1317,7,17,0,0,1317,1318,7,6,
+        0,0,1318,1319,7,23,0,0,1319,1320,7,15,0,0,1320,1321,7,17,0,0,1321,
+        1322,7,27,0,0,1322,246,1,0,0,0,1323,1324,7,22,0,0,1324,1325,7,10,
+        0,0,1325,1326,7,17,0,0,1326,1327,7,8,0,0,1327,1328,7,6,0,0,1328,
+        1329,7,25,0,0,1329,1330,7,9,0,0,1330,248,1,0,0,0,1331,1332,7,7,0,
+        0,1332,1333,7,8,0,0,1333,1334,7,27,0,0,1334,250,1,0,0,0,1335,1336,
+        7,26,0,0,1336,1337,7,9,0,0,1337,1338,7,6,0,0,1338,1339,7,29,0,0,
+        1339,1340,7,26,0,0,1340,1341,7,8,0,0,1341,252,1,0,0,0,1342,1343,
+        7,9,0,0,1343,1344,7,10,0,0,1344,1345,7,11,0,0,1345,1346,1,0,0,0,
+        1346,1347,3,103,51,0,1347,1348,7,9,0,0,1348,1349,7,26,0,0,1349,1350,
+        7,5,0,0,1350,1351,7,5,0,0,1351,254,1,0,0,0,1352,1353,7,9,0,0,1353,
+        1354,7,26,0,0,1354,1355,7,5,0,0,1355,1356,7,5,0,0,1356,256,1,0,0,
+        0,1357,1358,7,16,0,0,1358,1359,7,8,0,0,1359,1360,7,22,0,0,1360,1361,
+        7,15,0,0,1361,1362,7,26,0,0,1362,1363,7,5,0,0,1363,1364,7,11,0,0,
+        1364,258,1,0,0,0,1365,1366,7,21,0,0,1366,1367,7,24,0,0,1367,1368,
+        7,8,0,0,1368,1369,7,21,0,0,1369,1370,7,7,0,0,1370,260,1,0,0,0,1371,
+        1372,7,21,0,0,1372,1373,7,10,0,0,1373,1374,7,9,0,0,1374,1375,7,14,
+        0,0,1375,1376,7,11,0,0,1376,1377,7,17,0,0,1377,1378,7,15,0,0,1378,
+        1379,7,6,0,0,1379,1380,7,9,0,0,1380,1381,7,11,0,0,1381,262,1,0,0,
+        0,1382,1383,7,17,0,0,1383,1384,7,8,0,0,1384,1385,7,22,0,0,1385,1386,
+        7,8,0,0,1386,1387,7,17,0,0,1387,1388,7,8,0,0,1388,1389,7,9,0,0,1389,
+        1390,7,21,0,0,1390,1391,7,8,0,0,1391,1392,7,14,0,0,1392,264,1,0,
+        0,0,1393,1394,7,21,0,0,1394,1395,7,15,0,0,1395,1396,7,14,0,0,1396,
+        1397,7,21,0,0,1397,1398,7,15,0,0,1398,1399,7,16,0,0,1399,1400,7,
+        8,0,0,1400,266,1,0,0,0,1401,1402,7,17,0,0,1402,1403,7,8,0,0,1403,
+        1404,7,14,0,0,1404,1405,7,11,0,0,1405,1406,7,17,0,0,1406,1407,7,
+        6,0,0,1407,1408,7,21,0,0,1408,1409,7,11,0,0,1409,268,1,0,0,0,1410,
+        1411,7,14,0,0,1411,1412,7,8,0,0,1412,1413,7,11,0,0,1413,1414,1,0,
+        0,0,1414,1415,3,103,51,0,1415,1416,7,9,0,0,1416,1417,7,26,0,0,1417,
+        1418,7,5,0,0,1418,1419,7,5,0,0,1419,270,1,0,0,0,1420,1421,7,9,0,
+        0,1421,1422,7,10,0,0,1422,1423,1,0,0,0,1423,1424,3,103,51,0,1424,
+        1425,7,15,0,0,1425,1426,7,21,0,0,1426,1427,7,11,0,0,1427,1428,7,
+        6,0,0,1428,1429,7,10,0,0,1429,1430,7,9,0,0,1430,272,1,0,0,0,1431,
+        1432,7,25,0,0,1432,1433,7,8,0,0,1433,1434,7,9,0,0,1434,1435,7,8,
+        0,0,1435,1436,7,17,0,0,1436,1437,7,15,0,0,1437,1438,7,11,0,0,1438,
+        1439,7,8,0,0,1439,1440,7,16,0,0,1440,274,1,0,0,0,1441,1442,7,15,
+        0,0,1442,1443,7,5,0,0,1443,1444,7,13,0,0,1444,1445,7,15,0,0,1445,
+        1446,7,27,0,0,1446,1447,7,14,0,0,1447,276,1,0,0,0,1448,1449,7,6,
+        0,0,1449,1450,7,16,0,0,1450,1451,7,8,0,0,1451,1452,7,9,0,0,1452,
+        1453,7,11,0,0,1453,1454,7,6,0,0,1454,1455,7,11,0,0,1455,1456,7,27,
+        0,0,1456,278,1,0,0,0,1457,1458,7,21,0,0,1458,1459,7,10,0,0,1459,
+        1460,7,26,0,0,1460,1461,7,9,0,0,1461,1462,7,11,0,0,1462,280,1,0,
+        0,0,1463,1464,7,14,0,0,1464,1465,7,26,0,0,1465,1466,7,23,0,0,1466,
+        282,1,0,0,0,1467,1468,7,15,0,0,1468,1469,7,28,0,0,1469,1478,7,25,
+        0,0,1470,1471,7,15,0,0,1471,1472,7,28,0,0,1472,1473,7,8,0,0,1473,
+        1474,7,17,0,0,1474,1475,7,15,0,0,1475,1476,7,25,0,0,1476,1478,7,
+        8,0,0,1477,1467,1,0,0,0,1477,1470,1,0,0,0,1478,284,1,0,0,0,1479,
+        1480,7,23,0,0,1480,1481,7,6,0,0,1481,1482,7,9,0,0,1482,286,1,0,0,
+        0,1483,1484,7,23,0,0,1484,1485,7,15,0,0,1485,1486,7,3,0,0,1486,288,
+        1,0,0,0,1487,1488,7,21,0,0,1488,1489,7,10,0,0,1489,1490,7,15,0,0,
+        1490,1491,7,5,0,0,1491,1492,7,8,0,0,1492,1493,7,14,0,0,1493,1494,
+        7,21,0,0,1494,1495,7,8,0,0,1495,290,1,0,0,0,1496,1497,7,9,0,0,1497,
+        1498,7,26,0,0,1498,1499,7,5,0,0,1499,1500,7,5,0,0,1500,1501,7,6,
+        0,0,1501,1502,7,22,0,0,1502,292,1,0,0,0,1503,1504,7,21,0,0,1504,
+        1505,7,15,0,0,1505,1506,7,14,0,0,1506,1507,7,8,0,0,1507,294,1,0,
+        0,0,1508,1509,7,13,0,0,1509,1510,7,24,0,0,1510,1511,7,8,0,0,1511,
+        1512,7,9,0,0,1512,296,1,0,0,0,1513,1514,7,11,0,0,1514,1515,7,24,
+        0,0,1515,1516,7,8,0,0,1516,1517,7,9,0,0,1517,298,1,0,0,0,1518,1519,
+        7,8,0,0,1519,1520,7,5,0,0,1520,1521,7,14,0,0,1521,1522,7,8,0,0,1522,
+        300,1,0,0,0,1523,1524,7,8,0,0,1524,1525,7,9,0,0,1525,1526,7,16,0,
+        0,1526,302,1,0,0,0,1527,1528,7,21,0,0,1528,1529,7,15,0,0,1529,1530,
+        7,14,0,0,1530,1531,7,11,0,0,1531,304,1,0,0,0,1532,1533,7,21,0,0,
+        1533,1534,7,10,0,0,1534,1535,7,9,0,0,1535,1536,7,28,0,0,1536,1537,
+        7,8,0,0,1537,1538,7,17,0,0,1538,1539,7,11,0,0,1539,306,1,0,0,0,1540,
+        1541,7,14,0,0,1541,1542,7,26,0,0,1542,1543,7,12,0,0,1543,1544,7,
+        14,0,0,1544,1545,7,11,0,0,1545,1546,7,17,0,0,1546,1547,7,6,0,0,1547,
+        1548,7,9,0,0,1548,1556,7,25,0,0,1549,1550,7,14,0,0,1550,1551,7,26,
+        0,0,1551,1552,7,12,0,0,1552,1553,7,14,0,0,1553,1554,7,11,0,0,1554,
+        1556,7,17,0,0,1555,1540,1,0,0,0,1555,1549,1,0,0,0,1556,308,1,0,0,
+        0,1557,1558,7,5,0,0,1558,1559,7,8,0,0,1559,1560,7,9,0,0,1560,1561,
+        7,25,0,0,1561,1562,7,11,0,0,1562,1567,7,24,0,0,1563,1564,7,5,0,0,
+        1564,1565,7,8,0,0,1565,1567,7,9,0,0,1566,1557,1,0,0,0,1566,1563,
+        1,0,0,0,1567,310,1,0,0,0,1568,1569,7,26,0,0,1569,1570,7,18,0,0,1570,
+        1571,7,18,0,0,1571,1572,7,8,0,0,1572,1573,7,17,0,0,1573,312,1,0,
+        0,0,1574,1575,7,5,0,0,1575,1576,7,10,0,0,1576,1577,7,13,0,0,1577,
+        1578,7,8,0,0,1578,1579,7,17,0,0,1579,314,1,0,0,0,1580,1581,7,11,
+        0,0,1581,1582,7,17,0,0,1582,1583,7,6,0,0,1583,1584,7,23,0,0,1584,
+        316,1,0,0,0,1585,1586,7,5,0,0,1586,1587,7,11,0,0,1587,1588,7,17,
+        0,0,1588,1589,7,6,0,0,1589,1590,7,23,0,0,1590,318,1,0,0,0,1591,1592,
+        7,17,0,0,1592,1593,7,11,0,0,1593,1594,7,17,0,0,1594,1595,7,6,0,0,
+        1595,1596,7,23,0,0,1596,320,1,0,0,0,1597,1598,7,17,0,0,1598,1599,
+        7,8,0,0,1599,1600,7,18,0,0,1600,1601,7,5,0,0,1601,1602,7,15,0,0,
+        1602,1603,7,21,0,0,1603,1604,7,8,0,0,1604,322,1,0,0,0,1605,1606,
+        7,11,0,0,1606,1607,7,17,0,0,1607,1608,7,15,0,0,1608,1609,7,9,0,0,
+        1609,1610,7,14,0,0,1610,1611,7,5,0,0,1611,1612,7,15,0,0,1612,1613,
+        7,11,0,0,1613,1614,7,8,0,0,1614,324,1,0,0,0,1615,1616,7,18,0,0,1616,
+        1617,7,10,0,0,1617,1618,7,14,0,0,1618,1619,7,6,0,0,1619,1620,7,11,
+        0,0,1620,1621,7,6,0,0,1621,1622,7,10,0,0,1622,1627,7,9,0,0,1623,
+        1624,7,18,0,0,1624,1625,7,10,0,0,1625,1627,7,14,0,0,1626,1615,1,
+        0,0,0,1626,1623,1,0,0,0,1627,326,1,0,0,0,1628,1629,7,5,0,0,1629,
+        1630,7,10,0,0,1630,1631,7,21,0,0,1631,1632,7,15,0,0,1632,1633,7,
+        11,0,0,1633,1634,7,8,0,0,1634,328,1,0,0,0,1635,1636,7,30,0,0,1636,
+        1637,7,10,0,0,1637,1638,7,6,0,0,1638,1639,7,9,0,0,1639,330,1,0,0,
+        0,1640,1641,7,6,0,0,1641,1642,7,9,0,0,1642,1643,7,9,0,0,1643,1644,
+        7,8,0,0,1644,1645,7,17,0,0,1645,332,1,0,0,0,1646,1647,7,5,0,0,1647,
+        1648,7,8,0,0,1648,1649,7,22,0,0,1649,1650,7,11,0,0,1650,334,1,0,
+        0,0,1651,1652,7,17,0,0,1652,1653,7,6,0,0,1653,1654,7,25,0,0,1654,
+        1655,7,24,0,0,1655,1656,7,11,0,0,1656,336,1,0,0,0,1657,1658,7,22,
+        0,0,1658,1659,7,26,0,0,1659,1660,7,5,0,0,1660,1661,7,5,0,0,1661,
+        338,1,0,0,0,1662,1663,7,10,0,0,1663,1664,7,26,0,0,1664,1665,7,11,
+        0,0,1665,1666,7,8,0,0,1666,1667,7,17,0,0,1667,340,1,0,0,0,1668,1669,
+        7,21,0,0,1669,1670,7,17,0,0,1670,1671,7,10,0,0,1671,1672,7,14,0,
+        0,1672,1673,7,14,0,0,1673,342,1,0,0,0,1674,1675,7,9,0,0,1675,1676,
+        7,15,0,0,1676,1677,7,11,0,0,1677,1678,7,26,0,0,1678,1679,7,17,0,
+        0,1679,1680,7,15,0,0,1680,1681,7,5,0,0,1681,344,1,0,0,0,1682,1683,
+        7,26,0,0,1683,1684,7,14,0,0,1684,1685,7,6,0,0,1685,1686,7,9,0,0,
+        1686,1687,7,25,0,0,1687,346,1,0,0,0,1688,1689,7,10,0,0,1689,1690,
+        7,9,0,0,1690,348,1,0,0,0,1691,1692,7,26,0,0,1692,1693,7,9,0,0,1693,
+        1694,7,6,0,0,1694,1695,7,10,0,0,1695,1696,7,9,0,0,1696,350,1,0,0,
+        0,1697,1698,7,6,0,0,1698,1699,7,9,0,0,1699,1700,7,11,0,0,1700,1701,
+        7,8,0,0,1701,1702,7,17,0,0,1702,1703,7,14,0,0,1703,1704,7,8,0,0,
+        1704,1705,7,21,0,0,1705,1706,7,11,0,0,1706,352,1,0,0,0,1707,1708,
+        7,8,0,0,1708,1709,7,3,0,0,1709,1710,7,21,0,0,1710,1711,7,8,0,0,1711,
+        1712,7,18,0,0,1712,1713,7,11,0,0,1713,354,1,0,0,0,1714,1715,7,15,
+        0,0,1715,1716,7,5,0,0,1716,1717,7,5,0,0,1717,356,1,0,0,0,1718,1719,
+        7,16,0,0,1719,1720,7,6,0,0,1720,1721,7,14,0,0,1721,1722,7,11,0,0,
+        1722,1723,7,6,0,0,1723,1724,7,9,0,0,1724,1725,7,21,0,0,1725,1726,
+        7,11,0,0,1726,358,1,0,0,0,1727,1728,7,15,0,0,1728,1729,7,9,0,0,1729,
+        1730,7,27,0,0,1730,360,1,0,0,0,1731,1732,7,14,0,0,1732,1733,7,10,
+        0,0,1733,1734,7,23,0,0,1734,1735,7,8,0,0,1735,362,1,0,0,0,1736,1737,
+        7,12,0,0,1737,1738,7,8,0,0,1738,1739,7,25,0,0,1739,1740,7,6,0,0,
+        1740,1741,7,9,0,0,1741,364,1,0,0,0,1742,1743,7,21,0,0,1743,1744,
+        7,10,0,0,1744,1745,7,23,0,0,1745,1746,7,23,0,0,1746,1747,7,6,0,0,
+        1747,1748,7,11,0,0,1748,366,1,0,0,0,1749,1750,7,17,0,0,1750,1751,
+        7,10,0,0,1751,1752,7,5,0,0,1752,1753,7,5,0,0,1753,1754,7,12,0,0,
+        1754,1755,7,15,0,0,1755,1756,7,21,0,0,1756,1757,7,7,0,0,1757,368,
+        1,0,0,0,1758,1759,7,14,0,0,1759,1760,7,15,0,0,1760,1761,7,28,0,0,
+        1761,1762,7,8,0,0,1762,1763,7,18,0,0,1763,1764,7,10,0,0,1764,1765,
+        7,6,0,0,1765,1766,7,9,0,0,1766,1767,7,11,0,0,1767,370,1,0,0,0,1768,
+        1769,7,17,0,0,1769,1770,7,8,0,0,1770,1771,7,5,0,0,1771,1772,7,8,
+        0,0,1772,1773,7,15,0,0,1773,1774,7,14,0,0,1774,1775,7,8,0,0,1775,
+        372,1,0,0,0,1776,1777,7,13,0,0,1777,1778,7,10,0,0,1778,1779,7,17,
+        0,0,1779,1780,7,7,0,0,1780,374,1,0,0,0,1781,1782,7,11,0,0,1782,1783,
+        7,17,0,0,1783,1784,7,15,0,0,1784,1785,7,9,0,0,1785,1786,7,14,0,0,
+        1786,1787,7,15,0,0,1787,1788,7,21,0,0,1788,1789,7,11,0,0,1789,1790,
+        7,6,0,0,1790,1791,7,10,0,0,1791,1792,7,9,0,0,1792,376,1,0,0,0,1793,
+        1794,7,21,0,0,1794,1795,7,10,0,0,1795,1796,7,9,0,0,1796,1797,7,9,
+        0,0,1797,1798,7,8,0,0,1798,1799,7,21,0,0,1799,1800,7,11,0,0,1800,
+        378,1,0,0,0,1801,1802,7,16,0,0,1802,1803,7,6,0,0,1803,1804,7,14,
+        0,0,1804,1805,7,21,0,0,1805,1806,7,10,0,0,1806,1807,7,9,0,0,1807,
+        1808,7,9,0,0,1808,1809,7,8,0,0,1809,1810,7,21,0,0,1810,1811,7,11,
+        0,0,1811,380,1,0,0,0,1812,1813,7,17,0,0,1813,1814,7,8,0,0,1814,1815,
+        7,14,0,0,1815,1816,7,8,0,0,1816,1817,7,11,0,0,1817,382,1,0,0,0,1818,
+        1819,7,21,0,0,1819,1820,7,26,0,0,1820,1821,7,17,0,0,1821,1822,7,
+        17,0,0,1822,1823,7,8,0,0,1823,1824,7,9,0,0,1824,1825,7,11,0,0,1825,
+        1826,5,95,0,0,1826,1827,7,16,0,0,1827,1828,7,15,0,0,1828,1829,7,
+        11,0,0,1829,1830,7,8,0,0,1830,384,1,0,0,0,1831,1832,7,21,0,0,1832,
+        1833,7,26,0,0,1833,1834,7,17,0,0,1834,1835,7,17,0,0,1835,1836,7,
+        8,0,0,1836,1837,7,9,0,0,1837,1838,7,11,0,0,1838,1839,5,95,0,0,1839,
+        1840,7,11,0,0,1840,1841,7,6,0,0,1841,1842,7,23,0,0,1842,1843,7,8,
+        0,0,1843,386,1,0,0,0,1844,1845,7,21,0,0,1845,1846,7,26,0,0,1846,
+        1847,7,17,0,0,1847,1848,7,17,0,0,1848,1849,7,8,0,0,1849,1850,7,9,
+        0,0,1850,1851,7,11,0,0,1851,1852,5,95,0,0,1852,1853,7,11,0,0,1853,
+        1854,7,6,0,0,1854,1855,7,23,0,0,1855,1856,7,8,0,0,1856,1857,7,14,
+        0,0,1857,1858,7,11,0,0,1858,1859,7,15,0,0,1859,1860,7,23,0,0,1860,
+        1861,7,18,0,0,1861,388,1,0,0,0,1862,1863,7,21,0,0,1863,1864,7,26,
+        0,0,1864,1865,7,17,0,0,1865,1866,7,17,0,0,1866,1867,7,8,0,0,1867,
+        1868,7,9,0,0,1868,1869,7,11,0,0,1869,1870,5,95,0,0,1870,1871,7,26,
+        0,0,1871,1872,7,14,0,0,1872,1873,7,8,0,0,1873,1874,7,17,0,0,1874,
+        390,1,0,0,0,1875,1876,7,26,0,0,1876,1877,7,14,0,0,1877,1878,7,8,
+        0,0,1878,1879,7,17,0,0,1879,392,1,0,0,0,1880,1881,7,14,0,0,1881,
+        1882,7,27,0,0,1882,1883,7,14,0,0,1883,1884,7,11,0,0,1884,1885,7,
+        8,0,0,1885,1886,7,23,0,0,1886,1887,5,95,0,0,1887,1888,7,26,0,0,1888,
+        1889,7,14,0,0,1889,1890,7,8,0,0,1890,1891,7,17,0,0,1891,394,1,0,
+        0,0,1892,1893,7,14,0,0,1893,1894,7,8,0,0,1894,1895,7,14,0,0,1895,
+        1896,7,14,0,0,1896,1897,7,6,0,0,1897,1898,7,10,0,0,1898,1899,7,9,
+        0,0,1899,1900,5,95,0,0,1900,1901,7,26,0,0,1901,1902,7,14,0,0,1902,
+        1903,7,8,0,0,1903,1904,7,17,0,0,1904,396,1,0,0,0,1905,1906,7,13,
+        0,0,1906,1907,7,6,0,0,1907,1908,7,11,0,0,1908,1909,7,24,0,0,1909,
+        398,1,0,0,0,1910,1911,7,17,0,0,1911,1912,7,8,0,0,1912,1913,7,21,
+        0,0,1913,1914,7,26,0,0,1914,1915,7,17,0,0,1915,1916,7,14,0,0,1916,
+        1917,7,6,0,0,1917,1918,7,28,0,0,1918,1919,7,8,0,0,1919,400,1,0,0,
+        0,1920,1921,7,5,0,0,1921,1922,7,15,0,0,1922,1923,7,11,0,0,1923,1924,
+        7,8,0,0,1924,1925,7,17,0,0,1925,1926,7,15,0,0,1926,1927,7,5,0,0,
+        1927,402,1,0,0,0,1928,1929,7,17,0,0,1929,1930,7,15,0,0,1930,1931,
+        7,9,0,0,1931,1932,7,25,0,0,1932,1933,7,8,0,0,1933,404,1,0,0,0,1934,
+        1935,7,25,0,0,1935,1936,7,17,0,0,1936,1937,7,10,0,0,1937,1938,7,
+        26,0,0,1938,1939,7,18,0,0,1939,1940,7,14,0,0,1940,406,1,0,0,0,1941,
+        1942,7,26,0,0,1942,1943,7,9,0,0,1943,1944,7,12,0,0,1944,1945,7,10,
+        0,0,1945,1946,7,26,0,0,1946,1947,7,9,0,0,1947,1948,7,16,0,0,1948,
+        1949,7,8,0,0,1949,1950,7,16,0,0,1950,408,1,0,0,0,1951,1952,7,18,
+        0,0,1952,1953,7,17,0,0,1953,1954,7,8,0,0,1954,1955,7,21,0,0,1955,
+        1956,7,8,0,0,1956,1957,7,16,0,0,1957,1958,7,6,0,0,1958,1959,7,9,
+        0,0,1959,1960,7,25,0,0,1960,410,1,0,0,0,1961,1962,7,22,0,0,1962,
+        1963,7,10,0,0,1963,1964,7,5,0,0,1964,1965,7,5,0,0,1965,1966,7,10,
+        0,0,1966,1967,7,13,0,0,1967,1968,7,6,0,0,1968,1969,7,9,0,0,1969,
+        1970,7,25,0,0,1970,412,1,0,0,0,1971,1972,7,21,0,0,1972,1973,7,26,
+        0,0,1973,1974,7,17,0,0,1974,1975,7,17,0,0,1975,1976,7,8,0,0,1976,
+        1977,7,9,0,0,1977,1978,7,11,0,0,1978,414,1,0,0,0,1979,1980,7,17,
+        0,0,1980,1981,7,10,0,0,1981,1982,7,13,0,0,1982,416,1,0,0,0,1983,
+        1984,7,10,0,0,1984,1985,7,28,0,0,1985,1986,7,8,0,0,1986,1987,7,17,
+        0,0,1987,418,1,0,0,0,1988,1989,7,13,0,0,1989,1990,7,6,0,0,1990,1991,
+        7,9,0,0,1991,1992,7,16,0,0,1992,1993,7,10,0,0,1993,1994,7,13,0,0,
+        1994,420,1,0,0,0,1995,1996,7,22,0,0,1996,1997,7,17,0,0,1997,1998,
+        7,15,0,0,1998,1999,7,23,0,0,1999,2000,7,8,0,0,2000,422,1,0,0,0,2001,
+        2002,7,8,0,0,2002,2003,7,3,0,0,2003,2004,7,21,0,0,2004,2005,7,5,
+        0,0,2005,2006,7,26,0,0,2006,2007,7,16,0,0,2007,2008,7,8,0,0,2008,
+        424,1,0,0,0,2009,2010,7,11,0,0,2010,2011,7,6,0,0,2011,2012,7,8,0,
+        0,2012,2013,7,14,0,0,2013,426,1,0,0,0,2014,2015,7,17,0,0,2015,2016,
+        7,8,0,0,2016,2017,7,14,0,0,2017,2018,7,18,0,0,2018,2019,7,8,0,0,
+        2019,2020,7,21,0,0,2020,2021,7,11,0,0,2021,428,1,0,0,0,2022,2023,
+        7,6,0,0,2023,2024,7,25,0,0,2024,2025,7,9,0,0,2025,2026,7,10,0,0,
+        2026,2027,7,17,0,0,2027,2028,7,8,0,0,2028,430,1,0,0,0,2029,2030,
+        7,9,0,0,2030,2031,7,26,0,0,2031,2032,7,5,0,0,2032,2033,7,5,0,0,2033,
+        2034,7,14,0,0,2034,432,1,0,0,0,2035,2036,7,5,0,0,2036,2037,7,15,
+        0,0,2037,2038,7,14,0,0,2038,2039,7,11,0,0,2039,434,1,0,0,0,2040,
+        2041,7,7,0,0,2041,2042,7,8,0,0,2042,2043,7,8,0,0,2043,2044,7,18,
+        0,0,2044,436,1,0,0,0,2045,2046,7,16,0,0,2046,2047,7,8,0,0,2047,2048,
+        7,9,0,0,2048,2049,7,14,0,0,2049,2050,7,8,0,0,2050,2051,5,95,0,0,
+        2051,2052,7,17,0,0,2052,2053,7,15,0,0,2053,2054,7,9,0,0,2054,2055,
+        7,7,0,0,2055,438,1,0,0,0,2056,2057,7,17,0,0,2057,2058,7,15,0,0,2058,
+        2059,7,9,0,0,2059,2060,7,7,0,0,2060,440,1,0,0,0,2061,2062,7,17,0,
+        0,2062,2063,7,10,0,0,2063,2064,7,13,0,0,2064,2065,5,95,0,0,2065,
+        2066,7,9,0,0,2066,2067,7,26,0,0,2067,2068,7,23,0,0,2068,2069,7,12,
+        0,0,2069,2070,7,8,0,0,2070,2071,7,17,0,0,2071,442,1,0,0,0,2072,2073,
+        7,9,0,0,2073,2074,7,11,0,0,2074,2075,7,6,0,0,2075,2076,7,5,0,0,2076,
+        2077,7,8,0,0,2077,444,1,0,0,0,2078,2079,7,5,0,0,2079,2080,7,15,0,
+        0,2080,2081,7,25,0,0,2081,446,1,0,0,0,2082,2083,7,5,0,0,2083,2084,
+        7,8,0,0,2084,2085,7,15,0,0,2085,2086,7,16,0,0,2086,448,1,0,0,0,2087,
+        2088,7,22,0,0,2088,2089,7,6,0,0,2089,2090,7,17,0,0,2090,2091,7,14,
+        0,0,2091,2092,7,11,0,0,2092,2093,5,95,0,0,2093,2094,7,28,0,0,2094,
+        2095,7,15,0,0,2095,2096,7,5,0,0,2096,2097,7,26,0,0,2097,2098,7,8,
+        0,0,2098,450,1,0,0,0,2099,2100,7,5,0,0,2100,2101,7,15,0,0,2101,2102,
+        7,14,0,0,2102,2103,7,11,0,0,2103,2104,5,95,0,0,2104,2105,7,28,0,
+        0,2105,2106,7,15,0,0,2106,2107,7,5,0,0,2107,2108,7,26,0,0,2108,2109,
+        7,8,0,0,2109,452,1,0,0,0,2110,2111,7,9,0,0,2111,2112,7,11,0,0,2112,
+        2113,7,24,0,0,2113,2114,5,95,0,0,2114,2115,7,28,0,0,2115,2116,7,
+        15,0,0,2116,2117,7,5,0,0,2117,2118,7,26,0,0,2118,2119,7,8,0,0,2119,
+        454,1,0,0,0,2120,2121,7,18,0,0,2121,2122,7,8,0,0,2122,2123,7,17,
+        0,0,2123,2124,7,21,0,0,2124,2125,7,8,0,0,2125,2126,7,9,0,0,2126,
+        2127,7,11,0,0,2127,2128,5,95,0,0,2128,2129,7,17,0,0,2129,2130,7,
+        15,0,0,2130,2131,7,9,0,0,2131,2132,7,7,0,0,2132,456,1,0,0,0,2133,
+        2134,7,21,0,0,2134,2135,7,26,0,0,2135,2136,7,23,0,0,2136,2137,7,
+        8,0,0,2137,2138,5,95,0,0,2138,2139,7,16,0,0,2139,2140,7,6,0,0,2140,
+        2141,7,14,0,0,2141,2142,7,11,0,0,2142,458,1,0,0,0,2143,2144,7,18,
+        0,0,2144,2145,7,8,0,0,2145,2146,7,17,0,0,2146,2147,7,21,0,0,2147,
+        2148,7,8,0,0,2148,2149,7,9,0,0,2149,2150,7,11,0,0,2150,2151,7,6,
+        0,0,2151,2152,7,5,0,0,2152,2153,7,8,0,0,2153,2154,5,95,0,0,2154,
+        2155,7,21,0,0,2155,2156,7,10,0,0,2156,2157,7,9,0,0,2157,2158,7,11,
+        0,0,2158,460,1,0,0,0,2159,2160,7,18,0,0,2160,2161,7,8,0,0,2161,2162,
+        7,17,0,0,2162,2163,7,21,0,0,2163,2164,7,8,0,0,2164,2165,7,9,0,0,
+        2165,2166,7,11,0,0,2166,2167,7,6,0,0,2167,2168,7,5,0,0,2168,2169,
+        7,8,0,0,2169,2170,5,95,0,0,2170,2171,7,16,0,0,2171,2172,7,6,0,0,
+        2172,2173,7,14,0,0,2173,2174,7,21,0,0,2174,462,1,0,0,0,2175,2179,
+        7,31,0,0,2176,2178,7,32,0,0,2177,2176,1,0,0,0,2178,2181,1,0,0,0,
+        2179,2177,1,0,0,0,2179,2180,1,0,0,0,2180,464,1,0,0,0,2181,2179,1,
+        0,0,0,27,0,468,474,476,482,484,493,504,570,681,686,696,710,1048,
+        1083,1112,1133,1159,1187,1222,1264,1289,1477,1555,1566,1626,2179,
+        1,6,0,0
     ]
 
 class db2_lexer(Lexer):
@@ -774,34 +829,34 @@ class db2_lexer(Lexer):
 
     decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
 
-    IDENTIFIER = 1
-    NUMBER = 2
-    STRING = 3
-    DOUBLE_QUOTED_STRING = 4
-    HEX_STRING = 5
-    LPAREN = 6
-    RPAREN = 7
-    LBRACKET = 8
-    RBRACKET = 9
-    COMMA = 10
-    SEMICOLON = 11
-    COLON = 12
-    EQUALS = 13
-    PLUS = 14
-    MINUS = 15
-    ASTERISK = 16
-    SLASH = 17
-    PERCENT = 18
-    HASH = 19
-    AT = 20
-    DOLLAR = 21
-    DOT = 22
-    UNDERSCORE = 23
-    QUESTION = 24
-    EXCLAMATION = 25
-    TILDE = 26
-    CARET = 27
-    AMPERSAND = 28
+    NUMBER = 1
+    STRING = 2
+    DOUBLE_QUOTED_STRING = 3
+    HEX_STRING = 4
+    LPAREN = 5
+    RPAREN = 6
+    LBRACKET = 7
+    RBRACKET = 8
+    COMMA = 9
+    SEMICOLON = 10
+    COLON = 11
+    EQUALS = 12
+    PLUS = 13
+    MINUS = 14
+    ASTERISK = 15
+    SLASH = 16
+    PERCENT = 17
+    HASH = 18
+    AT = 19
+    DOLLAR = 20
+    DOT = 21
+    UNDERSCORE = 22
+    QUESTION = 23
+    EXCLAMATION = 24
+    TILDE = 25
+    CARET = 26
+    AMPERSAND = 27
+    CONCAT = 28
     PIPE = 29
     BACKSLASH = 30
     GRAVE = 31
@@ -826,7 +881,7 @@ class db2_lexer(Lexer):
     XOR = 50
     POWER = 51
     WS = 52
-    COMMENT = 53
+    BLOCK_COMMENT = 53
     LINE_COMMENT = 54
     SELECT = 55
     FROM = 56
@@ -851,145 +906,161 @@ class db2_lexer(Lexer):
     VALUES = 75
     SET = 76
     INTO = 77
-    CREATE = 78
-    ALTER = 79
-    DROP = 80
-    TRUNCATE = 81
-    RENAME = 82
-    GRANT = 83
-    REVOKE = 84
-    TABLE = 85
-    VIEW = 86
-    INDEX = 87
-    SEQUENCE = 88
-    SCHEMA = 89
-    DATABASE = 90
-    TABLESPACE = 91
-    PARTITION = 92
-    INTEGER = 93
-    SMALLINT = 94
-    BIGINT = 95
-    DECIMAL = 96
-    REAL = 97
-    DOUBLE = 98
-    FLOAT = 99
-    CHAR = 100
-    VARCHAR = 101
-    CLOB = 102
-    GRAPHIC = 103
-    VARGRAPHIC = 104
-    DBCLOB = 105
-    BLOB = 106
-    DATE = 107
-    TIME = 108
-    TIMESTAMP = 109
-    XML = 110
-    PRIMARY = 111
-    FOREIGN = 112
-    KEY = 113
-    UNIQUE = 114
-    NOT_NULL = 115
-    NULL = 116
-    DEFAULT = 117
-    CHECK = 118
-    CONSTRAINT = 119
-    REFERENCES = 120
-    CASCADE = 121
-    RESTRICT = 122
-    SET_NULL = 123
-    NO_ACTION = 124
-    COUNT = 125
-    SUM = 126
-    AVG = 127
-    MIN = 128
-    MAX = 129
-    COALESCE = 130
-    NULLIF = 131
-    CASE = 132
-    WHEN = 133
-    THEN = 134
-    ELSE = 135
-    END = 136
-    CAST = 137
-    CONVERT = 138
-    SUBSTRING = 139
-    LENGTH = 140
-    UPPER = 141
-    LOWER = 142
-    TRIM = 143
-    LTRIM = 144
-    RTRIM = 145
-    REPLACE = 146
-    TRANSLATE = 147
-    POSITION = 148
-    LOCATE = 149
-    JOIN = 150
-    INNER = 151
-    LEFT = 152
-    RIGHT = 153
-    FULL = 154
-    OUTER = 155
-    CROSS = 156
-    NATURAL = 157
-    USING = 158
-    ON = 159
-    UNION = 160
-    INTERSECT = 161
-    EXCEPT = 162
-    ALL = 163
-    DISTINCT = 164
-    ANY = 165
-    SOME = 166
-    BEGIN = 167
-    COMMIT = 168
-    ROLLBACK = 169
-    SAVEPOINT = 170
-    RELEASE = 171
-    WORK = 172
-    TRANSACTION = 173
-    CONNECT = 174
-    DISCONNECT = 175
-    RESET = 176
-    CURRENT_DATE = 177
-    CURRENT_TIME = 178
-    CURRENT_TIMESTAMP = 179
-    CURRENT_USER = 180
-    USER = 181
-    SYSTEM_USER = 182
-    SESSION_USER = 183
-    WITH = 184
-    RECURSIVE = 185
-    LATERAL = 186
-    RANGE = 187
-    GROUPS = 188
-    UNBOUNDED = 189
-    PRECEDING = 190
-    FOLLOWING = 191
-    CURRENT = 192
-    ROW = 193
-    OVER = 194
-    WINDOW = 195
-    FRAME = 196
-    EXCLUDE = 197
-    TIES = 198
-    RESPECT = 199
-    IGNORE = 200
-    NULLS = 201
-    LAST = 202
-    KEEP = 203
-    DENSE_RANK = 204
-    RANK = 205
-    ROW_NUMBER = 206
-    NTILE = 207
-    LAG = 208
-    LEAD = 209
-    FIRST_VALUE = 210
-    LAST_VALUE = 211
-    NTH_VALUE = 212
-    PERCENT_RANK = 213
-    CUME_DIST = 214
-    PERCENTILE_CONT = 215
-    PERCENTILE_DISC = 216
+    AS = 78
+    TO = 79
+    MATCHED = 80
+    CREATE = 81
+    ALTER = 82
+    DROP = 83
+    TRUNCATE = 84
+    RENAME = 85
+    GRANT = 86
+    REVOKE = 87
+    TABLE = 88
+    VIEW = 89
+    INDEX = 90
+    SEQUENCE = 91
+    SCHEMA = 92
+    DATABASE = 93
+    TABLESPACE = 94
+    PARTITION = 95
+    COLUMN = 96
+    ADD = 97
+    MODIFY = 98
+    COMMENT = 99
+    PUBLIC = 100
+    START = 101
+    INCREMENT = 102
+    MINVALUE = 103
+    MAXVALUE = 104
+    INTEGER = 105
+    SMALLINT = 106
+    BIGINT = 107
+    DECIMAL = 108
+    REAL = 109
+    DOUBLE = 110
+    FLOAT = 111
+    CHAR = 112
+    VARCHAR = 113
+    CLOB = 114
+    GRAPHIC = 115
+    VARGRAPHIC = 116
+    DBCLOB = 117
+    BLOB = 118
+    DATE = 119
+    TIME = 120
+    TIMESTAMP = 121
+    XML = 122
+    PRIMARY = 123
+    FOREIGN = 124
+    KEY = 125
+    UNIQUE = 126
+    NOT_NULL = 127
+    NULL = 128
+    DEFAULT = 129
+    CHECK = 130
+    CONSTRAINT = 131
+    REFERENCES = 132
+    CASCADE = 133
+    RESTRICT = 134
+    SET_NULL = 135
+    NO_ACTION = 136
+    GENERATED = 137
+    ALWAYS = 138
+    IDENTITY = 139
+    COUNT = 140
+    SUM = 141
+    AVG = 142
+    MIN = 143
+    MAX = 144
+    COALESCE = 145
+    NULLIF = 146
+    CASE = 147
+    WHEN = 148
+    THEN = 149
+    ELSE = 150
+    END = 151
+    CAST = 152
+    CONVERT = 153
+    SUBSTRING = 154
+    LENGTH = 155
+    UPPER = 156
+    LOWER = 157
+    TRIM = 158
+    LTRIM = 159
+    RTRIM = 160
+    REPLACE = 161
+    TRANSLATE = 162
+    POSITION = 163
+    LOCATE = 164
+    JOIN = 165
+    INNER = 166
+    LEFT = 167
+    RIGHT = 168
+    FULL = 169
+    OUTER = 170
+    CROSS = 171
+    NATURAL = 172
+    USING = 173
+    ON = 174
+    UNION = 175
+    INTERSECT = 176
+    EXCEPT = 177
+    ALL = 178
+    DISTINCT = 179
+    ANY = 180
+    SOME = 181
+    BEGIN = 182
+    COMMIT = 183
+    ROLLBACK = 184
+    SAVEPOINT = 185
+    RELEASE = 186
+    WORK = 187
+    TRANSACTION = 188
+    CONNECT = 189
+    DISCONNECT = 190
+    RESET = 191
+    CURRENT_DATE = 192
+    CURRENT_TIME = 193
+    CURRENT_TIMESTAMP = 194
+    CURRENT_USER = 195
+    USER = 196
+    SYSTEM_USER = 197
+    SESSION_USER = 198
+    WITH = 199
+    RECURSIVE = 200
+    LATERAL = 201
+    RANGE = 202
+    GROUPS = 203
+    UNBOUNDED = 204
+    PRECEDING = 205
+    FOLLOWING = 206
+    CURRENT = 207
+    ROW = 208
+    OVER = 209
+    WINDOW = 210
+    FRAME = 211
+    EXCLUDE = 212
+    TIES = 213
+    RESPECT = 214
+    IGNORE = 215
+    NULLS = 216
+    LAST = 217
+    KEEP = 218
+    DENSE_RANK = 219
+    RANK = 220
+    ROW_NUMBER = 221
+    NTILE = 222
+    LAG = 223
+    LEAD = 224
+    FIRST_VALUE = 225
+    LAST_VALUE = 226
+    NTH_VALUE = 227
+    PERCENT_RANK = 228
+    CUME_DIST = 229
+    PERCENTILE_CONT = 230
+    PERCENTILE_DISC = 231
+    IDENTIFIER = 232
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -998,94 +1069,102 @@ class db2_lexer(Lexer):
     literalNames = [ "<INVALID>",
             "'('", "')'", "'['", "']'", "','", "';'", "':'", "'='", "'+'", 
             "'-'", "'*'", "'/'", "'%'", "'#'", "'@'", "'$'", "'.'", "'_'", 
-            "'?'", "'!'", "'~'", "'^'", "'&'", "'|'", "'\\'", "'`'", "'>'", 
-            "'<'", "'>='", "'<='", "'LIKE'", "'IN'", "'BETWEEN'", "'IS'", 
-            "'EXISTS'", "'AND'", "'OR'", "'NOT'", "'XOR'", "'SELECT'", "'FROM'", 
-            "'WHERE'", "'GROUP'", "'BY'", "'HAVING'", "'ORDER'", "'ASC'", 
-            "'DESC'", "'LIMIT'", "'OFFSET'", "'FETCH'", "'FIRST'", "'NEXT'", 
-            "'ROWS'", "'ONLY'", "'INSERT'", "'UPDATE'", "'DELETE'", "'MERGE'", 
-            "'VALUES'", "'SET'", "'INTO'", "'CREATE'", "'ALTER'", "'DROP'", 
-            "'TRUNCATE'", "'RENAME'", "'GRANT'", "'REVOKE'", "'TABLE'", 
-            "'VIEW'", "'INDEX'", "'SEQUENCE'", "'SCHEMA'", "'DATABASE'", 
-            "'TABLESPACE'", "'PARTITION'", "'SMALLINT'", "'BIGINT'", "'REAL'", 
+            "'?'", "'!'", "'~'", "'^'", "'&'", "'||'", "'|'", "'\\'", "'`'", 
+            "'>'", "'<'", "'>='", "'<='", "'LIKE'", "'IN'", "'BETWEEN'", 
+            "'IS'", "'EXISTS'", "'AND'", "'OR'", "'NOT'", "'XOR'", "'SELECT'", 
+            "'FROM'", "'WHERE'", "'GROUP'", "'BY'", "'HAVING'", "'ORDER'", 
+            "'ASC'", "'DESC'", "'LIMIT'", "'OFFSET'", "'FETCH'", "'FIRST'", 
+            "'NEXT'", "'ROWS'", "'ONLY'", "'INSERT'", "'UPDATE'", "'DELETE'", 
+            "'MERGE'", "'VALUES'", "'SET'", "'INTO'", "'AS'", "'TO'", "'MATCHED'", 
+            "'CREATE'", "'ALTER'", "'DROP'", "'TRUNCATE'", "'RENAME'", "'GRANT'", 
+            "'REVOKE'", "'TABLE'", "'VIEW'", "'INDEX'", "'SEQUENCE'", "'SCHEMA'", 
+            "'DATABASE'", "'TABLESPACE'", "'PARTITION'", "'COLUMN'", "'ADD'", 
+            "'MODIFY'", "'COMMENT'", "'PUBLIC'", "'START'", "'INCREMENT'", 
+            "'MINVALUE'", "'MAXVALUE'", "'SMALLINT'", "'BIGINT'", "'REAL'", 
             "'FLOAT'", "'GRAPHIC'", "'DATE'", "'TIME'", "'TIMESTAMP'", "'XML'", 
             "'PRIMARY'", "'FOREIGN'", "'KEY'", "'UNIQUE'", "'NULL'", "'DEFAULT'", 
             "'CHECK'", "'CONSTRAINT'", "'REFERENCES'", "'CASCADE'", "'RESTRICT'", 
-            "'COUNT'", "'SUM'", "'MIN'", "'MAX'", "'COALESCE'", "'NULLIF'", 
-            "'CASE'", "'WHEN'", "'THEN'", "'ELSE'", "'END'", "'CAST'", "'CONVERT'", 
-            "'UPPER'", "'LOWER'", "'TRIM'", "'LTRIM'", "'RTRIM'", "'REPLACE'", 
-            "'TRANSLATE'", "'LOCATE'", "'JOIN'", "'INNER'", "'LEFT'", "'RIGHT'", 
-            "'FULL'", "'OUTER'", "'CROSS'", "'NATURAL'", "'USING'", "'ON'", 
-            "'UNION'", "'INTERSECT'", "'EXCEPT'", "'ALL'", "'DISTINCT'", 
-            "'ANY'", "'SOME'", "'BEGIN'", "'COMMIT'", "'ROLLBACK'", "'SAVEPOINT'", 
-            "'RELEASE'", "'WORK'", "'TRANSACTION'", "'CONNECT'", "'DISCONNECT'", 
-            "'RESET'", "'CURRENT_DATE'", "'CURRENT_TIME'", "'CURRENT_TIMESTAMP'", 
-            "'CURRENT_USER'", "'USER'", "'SYSTEM_USER'", "'SESSION_USER'", 
-            "'WITH'", "'RECURSIVE'", "'LATERAL'", "'RANGE'", "'GROUPS'", 
-            "'UNBOUNDED'", "'PRECEDING'", "'FOLLOWING'", "'CURRENT'", "'ROW'", 
-            "'OVER'", "'WINDOW'", "'FRAME'", "'EXCLUDE'", "'TIES'", "'RESPECT'", 
-            "'IGNORE'", "'NULLS'", "'LAST'", "'KEEP'", "'DENSE_RANK'", "'RANK'", 
-            "'ROW_NUMBER'", "'NTILE'", "'LAG'", "'LEAD'", "'FIRST_VALUE'", 
-            "'LAST_VALUE'", "'NTH_VALUE'", "'PERCENT_RANK'", "'CUME_DIST'", 
-            "'PERCENTILE_CONT'", "'PERCENTILE_DISC'" ]
+            "'GENERATED'", "'ALWAYS'", "'IDENTITY'", "'COUNT'", "'SUM'", 
+            "'MIN'", "'MAX'", "'COALESCE'", "'NULLIF'", "'CASE'", "'WHEN'", 
+            "'THEN'", "'ELSE'", "'END'", "'CAST'", "'CONVERT'", "'UPPER'", 
+            "'LOWER'", "'TRIM'", "'LTRIM'", "'RTRIM'", "'REPLACE'", "'TRANSLATE'", 
+            "'LOCATE'", "'JOIN'", "'INNER'", "'LEFT'", "'RIGHT'", "'FULL'", 
+            "'OUTER'", "'CROSS'", "'NATURAL'", "'USING'", "'ON'", "'UNION'", 
+            "'INTERSECT'", "'EXCEPT'", "'ALL'", "'DISTINCT'", "'ANY'", "'SOME'", 
+            "'BEGIN'", "'COMMIT'", "'ROLLBACK'", "'SAVEPOINT'", "'RELEASE'", 
+            "'WORK'", "'TRANSACTION'", "'CONNECT'", "'DISCONNECT'", "'RESET'", 
+            "'CURRENT_DATE'", "'CURRENT_TIME'", "'CURRENT_TIMESTAMP'", "'CURRENT_USER'", 
+            "'USER'", "'SYSTEM_USER'", "'SESSION_USER'", "'WITH'", "'RECURSIVE'", 
+            "'LATERAL'", "'RANGE'", "'GROUPS'", "'UNBOUNDED'", "'PRECEDING'", 
+            "'FOLLOWING'", "'CURRENT'", "'ROW'", "'OVER'", "'WINDOW'", "'FRAME'", 
+            "'EXCLUDE'", "'TIES'", "'RESPECT'", "'IGNORE'", "'NULLS'", "'LAST'", 
+            "'KEEP'", "'DENSE_RANK'", "'RANK'", "'ROW_NUMBER'", "'NTILE'", 
+            "'LAG'", "'LEAD'", "'FIRST_VALUE'", "'LAST_VALUE'", "'NTH_VALUE'", 
+            "'PERCENT_RANK'", "'CUME_DIST'", "'PERCENTILE_CONT'", "'PERCENTILE_DISC'" ]
 
     symbolicNames = [ "<INVALID>",
-            "IDENTIFIER", "NUMBER", "STRING", "DOUBLE_QUOTED_STRING", "HEX_STRING", 
-            "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", "COMMA", "SEMICOLON", 
-            "COLON", "EQUALS", "PLUS", "MINUS", "ASTERISK", "SLASH", "PERCENT", 
-            "HASH", "AT", "DOLLAR", "DOT", "UNDERSCORE", "QUESTION", "EXCLAMATION", 
-            "TILDE", "CARET", "AMPERSAND", "PIPE", "BACKSLASH", "GRAVE", 
-            "NE", "GT", "LT", "GE", "LE", "LIKE", "NOT_LIKE", "IN", "NOT_IN", 
-            "BETWEEN", "NOT_BETWEEN", "IS", "IS_NOT", "EXISTS", "NOT_EXISTS", 
-            "AND", "OR", "NOT", "XOR", "POWER", "WS", "COMMENT", "LINE_COMMENT", 
-            "SELECT", "FROM", "WHERE", "GROUP", "BY", "HAVING", "ORDER", 
-            "ASC", "DESC", "LIMIT", "OFFSET", "FETCH", "FIRST", "NEXT", 
-            "ROWS", "ONLY", "INSERT", "UPDATE", "DELETE", "MERGE", "VALUES", 
-            "SET", "INTO", "CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME", 
-            "GRANT", "REVOKE", "TABLE", "VIEW", "INDEX", "SEQUENCE", "SCHEMA", 
-            "DATABASE", "TABLESPACE", "PARTITION", "INTEGER", "SMALLINT", 
-            "BIGINT", "DECIMAL", "REAL", "DOUBLE", "FLOAT", "CHAR", "VARCHAR", 
-            "CLOB", "GRAPHIC", "VARGRAPHIC", "DBCLOB", "BLOB", "DATE", "TIME", 
-            "TIMESTAMP", "XML", "PRIMARY", "FOREIGN", "KEY", "UNIQUE", "NOT_NULL", 
-            "NULL", "DEFAULT", "CHECK", "CONSTRAINT", "REFERENCES", "CASCADE", 
-            "RESTRICT", "SET_NULL", "NO_ACTION", "COUNT", "SUM", "AVG", 
-            "MIN", "MAX", "COALESCE", "NULLIF", "CASE", "WHEN", "THEN", 
-            "ELSE", "END", "CAST", "CONVERT", "SUBSTRING", "LENGTH", "UPPER", 
-            "LOWER", "TRIM", "LTRIM", "RTRIM", "REPLACE", "TRANSLATE", "POSITION", 
-            "LOCATE", "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "OUTER", 
-            "CROSS", "NATURAL", "USING", "ON", "UNION", "INTERSECT", "EXCEPT", 
-            "ALL", "DISTINCT", "ANY", "SOME", "BEGIN", "COMMIT", "ROLLBACK", 
-            "SAVEPOINT", "RELEASE", "WORK", "TRANSACTION", "CONNECT", "DISCONNECT", 
-            "RESET", "CURRENT_DATE", "CURRENT_TIME", "CURRENT_TIMESTAMP", 
-            "CURRENT_USER", "USER", "SYSTEM_USER", "SESSION_USER", "WITH", 
-            "RECURSIVE", "LATERAL", "RANGE", "GROUPS", "UNBOUNDED", "PRECEDING", 
-            "FOLLOWING", "CURRENT", "ROW", "OVER", "WINDOW", "FRAME", "EXCLUDE", 
-            "TIES", "RESPECT", "IGNORE", "NULLS", "LAST", "KEEP", "DENSE_RANK", 
-            "RANK", "ROW_NUMBER", "NTILE", "LAG", "LEAD", "FIRST_VALUE", 
-            "LAST_VALUE", "NTH_VALUE", "PERCENT_RANK", "CUME_DIST", "PERCENTILE_CONT", 
-            "PERCENTILE_DISC" ]
+            "NUMBER", "STRING", "DOUBLE_QUOTED_STRING", "HEX_STRING", "LPAREN", 
+            "RPAREN", "LBRACKET", "RBRACKET", "COMMA", "SEMICOLON", "COLON", 
+            "EQUALS", "PLUS", "MINUS", "ASTERISK", "SLASH", "PERCENT", "HASH", 
+            "AT", "DOLLAR", "DOT", "UNDERSCORE", "QUESTION", "EXCLAMATION", 
+            "TILDE", "CARET", "AMPERSAND", "CONCAT", "PIPE", "BACKSLASH", 
+            "GRAVE", "NE", "GT", "LT", "GE", "LE", "LIKE", "NOT_LIKE", "IN", 
+            "NOT_IN", "BETWEEN", "NOT_BETWEEN", "IS", "IS_NOT", "EXISTS", 
+            "NOT_EXISTS", "AND", "OR", "NOT", "XOR", "POWER", "WS", "BLOCK_COMMENT", 
+            "LINE_COMMENT", "SELECT", "FROM", "WHERE", "GROUP", "BY", "HAVING", 
+            "ORDER", "ASC", "DESC", "LIMIT", "OFFSET", "FETCH", "FIRST", 
+            "NEXT", "ROWS", "ONLY", "INSERT", "UPDATE", "DELETE", "MERGE", 
+            "VALUES", "SET", "INTO", "AS", "TO", "MATCHED", "CREATE", "ALTER", 
+            "DROP", "TRUNCATE", "RENAME", "GRANT", "REVOKE", "TABLE", "VIEW", 
+            "INDEX", "SEQUENCE", "SCHEMA", "DATABASE", "TABLESPACE", "PARTITION", 
+            "COLUMN", "ADD", "MODIFY", "COMMENT", "PUBLIC", "START", "INCREMENT", 
+            "MINVALUE", "MAXVALUE", "INTEGER", "SMALLINT", "BIGINT", "DECIMAL", 
+            "REAL", "DOUBLE", "FLOAT", "CHAR", "VARCHAR", "CLOB", "GRAPHIC", 
+            "VARGRAPHIC", "DBCLOB", "BLOB", "DATE", "TIME", "TIMESTAMP", 
+            "XML", "PRIMARY", "FOREIGN", "KEY", "UNIQUE", "NOT_NULL", "NULL", 
+            "DEFAULT", "CHECK", "CONSTRAINT", "REFERENCES", "CASCADE", "RESTRICT", 
+            "SET_NULL", "NO_ACTION", "GENERATED", "ALWAYS", "IDENTITY", 
+            "COUNT", "SUM", "AVG", "MIN", "MAX", "COALESCE", "NULLIF", "CASE", 
+            "WHEN", "THEN", "ELSE", "END", "CAST", "CONVERT", "SUBSTRING", 
+            "LENGTH", "UPPER", "LOWER", "TRIM", "LTRIM", "RTRIM", "REPLACE", 
+            "TRANSLATE", "POSITION", "LOCATE", "JOIN", "INNER", "LEFT", 
+            "RIGHT", "FULL", "OUTER", "CROSS", "NATURAL", "USING", "ON", 
+            "UNION", "INTERSECT", "EXCEPT", "ALL", "DISTINCT", "ANY", "SOME", 
+            "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "WORK", 
+            "TRANSACTION", "CONNECT", "DISCONNECT", "RESET", "CURRENT_DATE", 
+            "CURRENT_TIME", "CURRENT_TIMESTAMP", "CURRENT_USER", "USER", 
+            "SYSTEM_USER", "SESSION_USER", "WITH", "RECURSIVE", "LATERAL", 
+            "RANGE", "GROUPS", "UNBOUNDED", "PRECEDING", "FOLLOWING", "CURRENT", 
+            "ROW", "OVER", "WINDOW", "FRAME", "EXCLUDE", "TIES", "RESPECT", 
+            "IGNORE", "NULLS", "LAST", "KEEP", "DENSE_RANK", "RANK", "ROW_NUMBER", 
+            "NTILE", "LAG", "LEAD", "FIRST_VALUE", "LAST_VALUE", "NTH_VALUE", 
+            "PERCENT_RANK", "CUME_DIST", "PERCENTILE_CONT", "PERCENTILE_DISC", 
+            "IDENTIFIER" ]
 
-    ruleNames = [ "IDENTIFIER", "NUMBER", "STRING", "DOUBLE_QUOTED_STRING", 
-                  "HEX_STRING", "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", 
-                  "COMMA", "SEMICOLON", "COLON", "EQUALS", "PLUS", "MINUS", 
-                  "ASTERISK", "SLASH", "PERCENT", "HASH", "AT", "DOLLAR", 
-                  "DOT", "UNDERSCORE", "QUESTION", "EXCLAMATION", "TILDE", 
-                  "CARET", "AMPERSAND", "PIPE", "BACKSLASH", "GRAVE", "NE", 
-                  "GT", "LT", "GE", "LE", "LIKE", "NOT_LIKE", "IN", "NOT_IN", 
-                  "BETWEEN", "NOT_BETWEEN", "IS", "IS_NOT", "EXISTS", "NOT_EXISTS", 
-                  "AND", "OR", "NOT", "XOR", "POWER", "WS", "COMMENT", "LINE_COMMENT", 
-                  "SELECT", "FROM", "WHERE", "GROUP", "BY", "HAVING", "ORDER", 
-                  "ASC", "DESC", "LIMIT", "OFFSET", "FETCH", "FIRST", "NEXT", 
-                  "ROWS", "ONLY", "INSERT", "UPDATE", "DELETE", "MERGE", 
-                  "VALUES", "SET", "INTO", "CREATE", "ALTER", "DROP", "TRUNCATE", 
-                  "RENAME", "GRANT", "REVOKE", "TABLE", "VIEW", "INDEX", 
-                  "SEQUENCE", "SCHEMA", "DATABASE", "TABLESPACE", "PARTITION", 
-                  "INTEGER", "SMALLINT", "BIGINT", "DECIMAL", "REAL", "DOUBLE", 
-                  "FLOAT", "CHAR", "VARCHAR", "CLOB", "GRAPHIC", "VARGRAPHIC", 
-                  "DBCLOB", "BLOB", "DATE", "TIME", "TIMESTAMP", "XML", 
-                  "PRIMARY", "FOREIGN", "KEY", "UNIQUE", "NOT_NULL", "NULL", 
-                  "DEFAULT", "CHECK", "CONSTRAINT", "REFERENCES", "CASCADE", 
-                  "RESTRICT", "SET_NULL", "NO_ACTION", "COUNT", "SUM", "AVG", 
+    ruleNames = [ "NUMBER", "STRING", "DOUBLE_QUOTED_STRING", "HEX_STRING", 
+                  "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", "COMMA", "SEMICOLON", 
+                  "COLON", "EQUALS", "PLUS", "MINUS", "ASTERISK", "SLASH", 
+                  "PERCENT", "HASH", "AT", "DOLLAR", "DOT", "UNDERSCORE", 
+                  "QUESTION", "EXCLAMATION", "TILDE", "CARET", "AMPERSAND", 
+                  "CONCAT", "PIPE", "BACKSLASH", "GRAVE", "NE", "GT", "LT", 
+                  "GE", "LE", "LIKE", "NOT_LIKE", "IN", "NOT_IN", "BETWEEN", 
+                  "NOT_BETWEEN", "IS", "IS_NOT", "EXISTS", "NOT_EXISTS", 
+                  "AND", "OR", "NOT", "XOR", "POWER", "WS", "BLOCK_COMMENT", 
+                  "LINE_COMMENT", "SELECT", "FROM", "WHERE", "GROUP", "BY", 
+                  "HAVING", "ORDER", "ASC", "DESC", "LIMIT", "OFFSET", "FETCH", 
+                  "FIRST", "NEXT", "ROWS", "ONLY", "INSERT", "UPDATE", "DELETE", 
+                  "MERGE", "VALUES", "SET", "INTO", "AS", "TO", "MATCHED", 
+                  "CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME", "GRANT", 
+                  "REVOKE", "TABLE", "VIEW", "INDEX", "SEQUENCE", "SCHEMA", 
+                  "DATABASE", "TABLESPACE", "PARTITION", "COLUMN", "ADD", 
+                  "MODIFY", "COMMENT", "PUBLIC", "START", "INCREMENT", "MINVALUE", 
+                  "MAXVALUE", "INTEGER", "SMALLINT", "BIGINT", "DECIMAL", 
+                  "REAL", "DOUBLE", "FLOAT", "CHAR", "VARCHAR", "CLOB", 
+                  "GRAPHIC", "VARGRAPHIC", "DBCLOB", "BLOB", "DATE", "TIME", 
+                  "TIMESTAMP", "XML", "PRIMARY", "FOREIGN", "KEY", "UNIQUE", 
+                  "NOT_NULL", "NULL", "DEFAULT", "CHECK", "CONSTRAINT", 
+                  "REFERENCES", "CASCADE", "RESTRICT", "SET_NULL", "NO_ACTION", 
+                  "GENERATED", "ALWAYS", "IDENTITY", "COUNT", "SUM", "AVG", 
                   "MIN", "MAX", "COALESCE", "NULLIF", "CASE", "WHEN", "THEN", 
                   "ELSE", "END", "CAST", "CONVERT", "SUBSTRING", "LENGTH", 
                   "UPPER", "LOWER", "TRIM", "LTRIM", "RTRIM", "REPLACE", 
@@ -1101,7 +1180,8 @@ class db2_lexer(Lexer):
                   "FRAME", "EXCLUDE", "TIES", "RESPECT", "IGNORE", "NULLS", 
                   "LAST", "KEEP", "DENSE_RANK", "RANK", "ROW_NUMBER", "NTILE", 
                   "LAG", "LEAD", "FIRST_VALUE", "LAST_VALUE", "NTH_VALUE", 
-                  "PERCENT_RANK", "CUME_DIST", "PERCENTILE_CONT", "PERCENTILE_DISC" ]
+                  "PERCENT_RANK", "CUME_DIST", "PERCENTILE_CONT", "PERCENTILE_DISC", 
+                  "IDENTIFIER" ]
 
     grammarFileName = "db2_lexer.g4"
 
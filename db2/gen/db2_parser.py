@@ -1,4 +1,4 @@
-# Generated from C:/Users/natar/AI/AS400Parser/grammars/db2_parser.g4 by ANTLR 4.13.2
+# Generated from db2_parser.g4 by ANTLR 4.13.2
 # encoding: utf-8
 from antlr4 import *
 from io import StringIO
@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,1,228,991,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
+        4,1,232,1213,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
         7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,
         13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,
         20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,
@@ -25,354 +25,456 @@ def serializedATN():
         78,2,79,7,79,2,80,7,80,2,81,7,81,2,82,7,82,2,83,7,83,2,84,7,84,2,
         85,7,85,2,86,7,86,2,87,7,87,2,88,7,88,2,89,7,89,2,90,7,90,2,91,7,
         91,2,92,7,92,2,93,7,93,2,94,7,94,2,95,7,95,2,96,7,96,2,97,7,97,2,
-        98,7,98,1,0,5,0,200,8,0,10,0,12,0,203,9,0,1,0,1,0,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,223,8,1,1,
-        2,1,2,1,3,1,3,3,3,229,8,3,1,3,1,3,1,3,1,3,1,3,3,3,236,8,3,1,3,1,
-        3,1,3,3,3,241,8,3,1,3,1,3,3,3,245,8,3,1,3,1,3,1,3,3,3,250,8,3,1,
-        3,1,3,3,3,254,8,3,1,3,1,3,3,3,258,8,3,1,3,1,3,3,3,262,8,3,1,4,1,
-        4,1,4,5,4,267,8,4,10,4,12,4,270,9,4,1,4,3,4,273,8,4,1,5,1,5,3,5,
-        277,8,5,1,5,3,5,280,8,5,1,5,1,5,1,5,1,5,3,5,286,8,5,1,6,1,6,1,7,
-        1,7,1,7,1,7,1,7,1,7,3,7,296,8,7,1,7,1,7,5,7,300,8,7,10,7,12,7,303,
-        9,7,1,8,1,8,3,8,307,8,8,1,8,3,8,310,8,8,1,8,1,8,1,8,1,8,3,8,316,
-        8,8,1,8,3,8,319,8,8,1,8,1,8,1,8,3,8,324,8,8,1,8,1,8,3,8,328,8,8,
-        1,8,3,8,331,8,8,3,8,333,8,8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,
-        1,13,1,13,1,13,3,13,346,8,13,1,13,1,13,3,13,350,8,13,1,13,1,13,1,
-        13,1,13,1,13,1,13,1,13,1,13,1,13,3,13,361,8,13,1,14,1,14,1,15,1,
-        15,1,15,5,15,368,8,15,10,15,12,15,371,9,15,1,16,1,16,1,17,1,17,1,
-        17,5,17,378,8,17,10,17,12,17,381,9,17,1,18,1,18,1,19,1,19,1,19,5,
-        19,388,8,19,10,19,12,19,391,9,19,1,20,1,20,3,20,395,8,20,1,21,1,
-        21,1,22,1,22,1,23,1,23,1,23,1,23,3,23,405,8,23,1,23,3,23,408,8,23,
-        1,24,1,24,1,24,1,24,1,24,1,24,1,24,3,24,417,8,24,1,24,1,24,1,24,
-        3,24,422,8,24,1,25,1,25,1,25,1,25,5,25,428,8,25,10,25,12,25,431,
-        9,25,1,25,1,25,1,26,1,26,1,26,5,26,438,8,26,10,26,12,26,441,9,26,
-        1,27,1,27,1,27,1,27,1,27,1,27,5,27,449,8,27,10,27,12,27,452,9,27,
-        1,27,1,27,3,27,456,8,27,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,
-        1,29,3,29,467,8,29,1,30,1,30,1,30,1,30,3,30,473,8,30,1,30,3,30,476,
-        8,30,1,30,1,30,1,30,3,30,481,8,30,1,30,3,30,484,8,30,1,30,1,30,1,
-        30,1,30,1,30,1,30,3,30,492,8,30,1,30,1,30,1,30,1,30,1,30,3,30,499,
-        8,30,1,31,1,31,1,32,1,32,1,32,1,32,1,32,5,32,508,8,32,10,32,12,32,
-        511,9,32,1,33,1,33,1,33,1,33,1,33,3,33,518,8,33,1,33,1,33,1,33,1,
-        34,1,34,1,34,1,34,3,34,527,8,34,1,35,1,35,1,35,1,35,1,35,1,35,1,
-        35,5,35,536,8,35,10,35,12,35,539,9,35,1,35,1,35,1,36,1,36,1,36,5,
-        36,546,8,36,10,36,12,36,549,9,36,1,37,1,37,1,37,1,37,1,37,1,37,1,
-        37,1,37,3,37,559,8,37,1,37,1,37,3,37,563,8,37,1,37,1,37,1,37,1,37,
-        1,37,1,37,1,37,1,37,3,37,573,8,37,1,37,1,37,1,37,1,37,1,37,3,37,
-        580,8,37,1,37,1,37,1,37,3,37,585,8,37,1,38,1,38,1,39,1,39,1,40,1,
-        40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,
-        41,1,41,1,41,1,41,1,41,3,41,610,8,41,3,41,612,8,41,1,42,1,42,1,43,
-        1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,3,44,625,8,44,1,44,1,44,
-        1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,
-        1,46,1,46,1,46,3,46,645,8,46,1,46,1,46,1,46,3,46,650,8,46,1,46,1,
-        46,3,46,654,8,46,1,46,1,46,3,46,658,8,46,1,47,1,47,1,48,1,48,1,49,
-        1,49,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,52,
-        1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,3,52,
-        690,8,52,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,
-        1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,
-        3,54,716,8,54,1,54,1,54,1,54,1,54,1,54,3,54,723,8,54,1,55,1,55,1,
-        55,1,55,1,56,1,56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,58,1,
-        58,1,58,5,58,742,8,58,10,58,12,58,745,9,58,1,59,1,59,1,60,1,60,1,
-        61,1,61,1,61,5,61,754,8,61,10,61,12,61,757,9,61,1,62,1,62,1,63,1,
-        63,1,63,1,63,1,63,1,63,1,63,1,63,1,64,1,64,3,64,771,8,64,1,65,1,
-        65,3,65,775,8,65,1,65,1,65,1,65,3,65,780,8,65,1,66,1,66,3,66,784,
-        8,66,1,67,1,67,1,68,1,68,1,68,1,68,1,68,1,69,1,69,1,70,1,70,1,71,
-        1,71,1,71,1,71,1,71,1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,72,1,72,
-        1,72,1,72,3,72,813,8,72,1,72,1,72,1,72,1,72,5,72,819,8,72,10,72,
-        12,72,822,9,72,1,73,1,73,1,73,1,73,3,73,828,8,73,1,74,1,74,1,75,
-        1,75,1,75,3,75,835,8,75,1,75,1,75,1,76,1,76,1,77,1,77,1,78,1,78,
-        1,79,1,79,1,79,3,79,848,8,79,1,80,1,80,1,81,1,81,1,82,1,82,1,83,
-        1,83,1,83,3,83,859,8,83,1,83,1,83,3,83,863,8,83,1,83,1,83,1,83,3,
-        83,868,8,83,1,84,1,84,1,85,1,85,1,85,5,85,875,8,85,10,85,12,85,878,
-        9,85,1,86,1,86,1,86,3,86,883,8,86,1,86,1,86,1,86,1,86,1,87,1,87,
-        1,88,1,88,1,88,1,88,1,88,1,88,5,88,897,8,88,10,88,12,88,900,9,88,
-        3,88,902,8,88,1,88,1,88,1,88,1,88,1,88,5,88,909,8,88,10,88,12,88,
-        912,9,88,3,88,914,8,88,1,88,1,88,3,88,918,8,88,1,88,1,88,1,89,1,
-        89,1,89,1,89,1,89,1,89,3,89,928,8,89,1,90,1,90,1,90,1,90,1,90,1,
-        90,1,90,1,90,1,90,1,90,3,90,940,8,90,1,91,1,91,1,91,1,91,1,91,1,
-        91,1,91,1,91,1,91,1,91,3,91,952,8,91,1,92,1,92,3,92,956,8,92,1,92,
-        4,92,959,8,92,11,92,12,92,960,1,92,1,92,3,92,965,8,92,1,92,1,92,
-        1,93,1,93,1,93,1,93,1,93,1,94,1,94,1,95,1,95,1,96,1,96,1,97,1,97,
-        1,97,1,97,1,97,1,97,1,97,1,98,1,98,1,98,1,98,1,98,0,2,14,144,99,
-        0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,
-        46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,
-        90,92,94,96,98,100,102,104,106,108,110,112,114,116,118,120,122,124,
-        126,128,130,132,134,136,138,140,142,144,146,148,150,152,154,156,
-        158,160,162,164,166,168,170,172,174,176,178,180,182,184,186,188,
-        190,192,194,196,0,17,1,0,163,164,2,0,1,1,3,3,1,0,152,154,1,0,62,
-        63,1,0,85,88,3,0,55,55,71,73,163,163,2,0,85,86,88,88,2,0,1,1,227,
-        227,1,0,172,173,2,0,85,85,224,224,3,0,2,5,116,116,177,179,2,0,14,
-        18,51,51,2,0,32,46,228,228,1,0,47,50,3,0,1,1,125,131,139,149,1,0,
-        204,216,2,0,69,69,187,188,1036,0,201,1,0,0,0,2,222,1,0,0,0,4,224,
-        1,0,0,0,6,226,1,0,0,0,8,272,1,0,0,0,10,285,1,0,0,0,12,287,1,0,0,
-        0,14,295,1,0,0,0,16,332,1,0,0,0,18,334,1,0,0,0,20,336,1,0,0,0,22,
-        338,1,0,0,0,24,340,1,0,0,0,26,349,1,0,0,0,28,362,1,0,0,0,30,364,
-        1,0,0,0,32,372,1,0,0,0,34,374,1,0,0,0,36,382,1,0,0,0,38,384,1,0,
-        0,0,40,392,1,0,0,0,42,396,1,0,0,0,44,398,1,0,0,0,46,407,1,0,0,0,
-        48,409,1,0,0,0,50,423,1,0,0,0,52,434,1,0,0,0,54,442,1,0,0,0,56,457,
-        1,0,0,0,58,461,1,0,0,0,60,468,1,0,0,0,62,500,1,0,0,0,64,502,1,0,
-        0,0,66,512,1,0,0,0,68,526,1,0,0,0,70,528,1,0,0,0,72,542,1,0,0,0,
-        74,584,1,0,0,0,76,586,1,0,0,0,78,588,1,0,0,0,80,590,1,0,0,0,82,611,
-        1,0,0,0,84,613,1,0,0,0,86,615,1,0,0,0,88,617,1,0,0,0,90,629,1,0,
-        0,0,92,638,1,0,0,0,94,659,1,0,0,0,96,661,1,0,0,0,98,663,1,0,0,0,
-        100,665,1,0,0,0,102,667,1,0,0,0,104,689,1,0,0,0,106,691,1,0,0,0,
-        108,722,1,0,0,0,110,724,1,0,0,0,112,728,1,0,0,0,114,730,1,0,0,0,
-        116,738,1,0,0,0,118,746,1,0,0,0,120,748,1,0,0,0,122,750,1,0,0,0,
-        124,758,1,0,0,0,126,760,1,0,0,0,128,768,1,0,0,0,130,772,1,0,0,0,
-        132,781,1,0,0,0,134,785,1,0,0,0,136,787,1,0,0,0,138,792,1,0,0,0,
-        140,794,1,0,0,0,142,796,1,0,0,0,144,812,1,0,0,0,146,827,1,0,0,0,
-        148,829,1,0,0,0,150,834,1,0,0,0,152,838,1,0,0,0,154,840,1,0,0,0,
-        156,842,1,0,0,0,158,847,1,0,0,0,160,849,1,0,0,0,162,851,1,0,0,0,
-        164,853,1,0,0,0,166,867,1,0,0,0,168,869,1,0,0,0,170,871,1,0,0,0,
-        172,879,1,0,0,0,174,888,1,0,0,0,176,890,1,0,0,0,178,927,1,0,0,0,
-        180,939,1,0,0,0,182,951,1,0,0,0,184,953,1,0,0,0,186,968,1,0,0,0,
-        188,973,1,0,0,0,190,975,1,0,0,0,192,977,1,0,0,0,194,979,1,0,0,0,
-        196,986,1,0,0,0,198,200,3,2,1,0,199,198,1,0,0,0,200,203,1,0,0,0,
-        201,199,1,0,0,0,201,202,1,0,0,0,202,204,1,0,0,0,203,201,1,0,0,0,
-        204,205,5,0,0,1,205,1,1,0,0,0,206,223,3,6,3,0,207,223,3,48,24,0,
-        208,223,3,54,27,0,209,223,3,58,29,0,210,223,3,60,30,0,211,223,3,
-        68,34,0,212,223,3,102,51,0,213,223,3,110,55,0,214,223,3,114,57,0,
-        215,223,3,126,63,0,216,223,3,128,64,0,217,223,3,130,65,0,218,223,
-        3,132,66,0,219,223,3,136,68,0,220,223,3,142,71,0,221,223,3,4,2,0,
-        222,206,1,0,0,0,222,207,1,0,0,0,222,208,1,0,0,0,222,209,1,0,0,0,
-        222,210,1,0,0,0,222,211,1,0,0,0,222,212,1,0,0,0,222,213,1,0,0,0,
-        222,214,1,0,0,0,222,215,1,0,0,0,222,216,1,0,0,0,222,217,1,0,0,0,
-        222,218,1,0,0,0,222,219,1,0,0,0,222,220,1,0,0,0,222,221,1,0,0,0,
-        223,3,1,0,0,0,224,225,5,11,0,0,225,5,1,0,0,0,226,228,5,55,0,0,227,
-        229,7,0,0,0,228,227,1,0,0,0,228,229,1,0,0,0,229,230,1,0,0,0,230,
-        231,3,8,4,0,231,232,5,56,0,0,232,235,3,14,7,0,233,234,5,57,0,0,234,
-        236,3,32,16,0,235,233,1,0,0,0,235,236,1,0,0,0,236,240,1,0,0,0,237,
-        238,5,58,0,0,238,239,5,59,0,0,239,241,3,34,17,0,240,237,1,0,0,0,
-        240,241,1,0,0,0,241,244,1,0,0,0,242,243,5,60,0,0,243,245,3,36,18,
-        0,244,242,1,0,0,0,244,245,1,0,0,0,245,249,1,0,0,0,246,247,5,61,0,
-        0,247,248,5,59,0,0,248,250,3,38,19,0,249,246,1,0,0,0,249,250,1,0,
-        0,0,250,253,1,0,0,0,251,252,5,64,0,0,252,254,3,42,21,0,253,251,1,
-        0,0,0,253,254,1,0,0,0,254,257,1,0,0,0,255,256,5,65,0,0,256,258,3,
-        44,22,0,257,255,1,0,0,0,257,258,1,0,0,0,258,261,1,0,0,0,259,260,
-        5,66,0,0,260,262,3,46,23,0,261,259,1,0,0,0,261,262,1,0,0,0,262,7,
-        1,0,0,0,263,268,3,10,5,0,264,265,5,10,0,0,265,267,3,10,5,0,266,264,
-        1,0,0,0,267,270,1,0,0,0,268,266,1,0,0,0,268,269,1,0,0,0,269,273,
-        1,0,0,0,270,268,1,0,0,0,271,273,5,16,0,0,272,263,1,0,0,0,272,271,
-        1,0,0,0,273,9,1,0,0,0,274,279,3,144,72,0,275,277,5,217,0,0,276,275,
-        1,0,0,0,276,277,1,0,0,0,277,278,1,0,0,0,278,280,3,12,6,0,279,276,
-        1,0,0,0,279,280,1,0,0,0,280,286,1,0,0,0,281,282,3,152,76,0,282,283,
-        5,22,0,0,283,284,5,16,0,0,284,286,1,0,0,0,285,274,1,0,0,0,285,281,
-        1,0,0,0,286,11,1,0,0,0,287,288,7,1,0,0,288,13,1,0,0,0,289,290,6,
-        7,-1,0,290,296,3,16,8,0,291,292,5,6,0,0,292,293,3,14,7,0,293,294,
-        5,7,0,0,294,296,1,0,0,0,295,289,1,0,0,0,295,291,1,0,0,0,296,301,
-        1,0,0,0,297,298,10,2,0,0,298,300,3,26,13,0,299,297,1,0,0,0,300,303,
-        1,0,0,0,301,299,1,0,0,0,301,302,1,0,0,0,302,15,1,0,0,0,303,301,1,
-        0,0,0,304,309,3,152,76,0,305,307,5,217,0,0,306,305,1,0,0,0,306,307,
-        1,0,0,0,307,308,1,0,0,0,308,310,3,12,6,0,309,306,1,0,0,0,309,310,
-        1,0,0,0,310,333,1,0,0,0,311,312,5,6,0,0,312,313,3,6,3,0,313,318,
-        5,7,0,0,314,316,5,217,0,0,315,314,1,0,0,0,315,316,1,0,0,0,316,317,
-        1,0,0,0,317,319,3,12,6,0,318,315,1,0,0,0,318,319,1,0,0,0,319,333,
-        1,0,0,0,320,321,3,18,9,0,321,323,5,6,0,0,322,324,3,52,26,0,323,322,
-        1,0,0,0,323,324,1,0,0,0,324,325,1,0,0,0,325,330,5,7,0,0,326,328,
-        5,217,0,0,327,326,1,0,0,0,327,328,1,0,0,0,328,329,1,0,0,0,329,331,
-        3,12,6,0,330,327,1,0,0,0,330,331,1,0,0,0,331,333,1,0,0,0,332,304,
-        1,0,0,0,332,311,1,0,0,0,332,320,1,0,0,0,333,17,1,0,0,0,334,335,5,
-        1,0,0,335,19,1,0,0,0,336,337,5,1,0,0,337,21,1,0,0,0,338,339,5,1,
-        0,0,339,23,1,0,0,0,340,341,5,1,0,0,341,25,1,0,0,0,342,350,5,151,
-        0,0,343,345,7,2,0,0,344,346,5,155,0,0,345,344,1,0,0,0,345,346,1,
-        0,0,0,346,350,1,0,0,0,347,350,5,156,0,0,348,350,5,157,0,0,349,342,
-        1,0,0,0,349,343,1,0,0,0,349,347,1,0,0,0,349,348,1,0,0,0,349,350,
-        1,0,0,0,350,351,1,0,0,0,351,352,5,150,0,0,352,360,3,16,8,0,353,354,
-        5,159,0,0,354,361,3,28,14,0,355,356,5,158,0,0,356,357,5,6,0,0,357,
-        358,3,30,15,0,358,359,5,7,0,0,359,361,1,0,0,0,360,353,1,0,0,0,360,
-        355,1,0,0,0,360,361,1,0,0,0,361,27,1,0,0,0,362,363,3,144,72,0,363,
-        29,1,0,0,0,364,369,3,154,77,0,365,366,5,10,0,0,366,368,3,154,77,
-        0,367,365,1,0,0,0,368,371,1,0,0,0,369,367,1,0,0,0,369,370,1,0,0,
-        0,370,31,1,0,0,0,371,369,1,0,0,0,372,373,3,144,72,0,373,33,1,0,0,
-        0,374,379,3,144,72,0,375,376,5,10,0,0,376,378,3,144,72,0,377,375,
-        1,0,0,0,378,381,1,0,0,0,379,377,1,0,0,0,379,380,1,0,0,0,380,35,1,
-        0,0,0,381,379,1,0,0,0,382,383,3,144,72,0,383,37,1,0,0,0,384,389,
-        3,40,20,0,385,386,5,10,0,0,386,388,3,40,20,0,387,385,1,0,0,0,388,
-        391,1,0,0,0,389,387,1,0,0,0,389,390,1,0,0,0,390,39,1,0,0,0,391,389,
-        1,0,0,0,392,394,3,144,72,0,393,395,7,3,0,0,394,393,1,0,0,0,394,395,
-        1,0,0,0,395,41,1,0,0,0,396,397,5,2,0,0,397,43,1,0,0,0,398,399,5,
-        2,0,0,399,45,1,0,0,0,400,408,5,67,0,0,401,402,5,68,0,0,402,404,5,
-        2,0,0,403,405,5,69,0,0,404,403,1,0,0,0,404,405,1,0,0,0,405,406,1,
-        0,0,0,406,408,5,70,0,0,407,400,1,0,0,0,407,401,1,0,0,0,408,47,1,
-        0,0,0,409,410,5,71,0,0,410,411,5,77,0,0,411,416,3,152,76,0,412,413,
-        5,6,0,0,413,414,3,30,15,0,414,415,5,7,0,0,415,417,1,0,0,0,416,412,
-        1,0,0,0,416,417,1,0,0,0,417,421,1,0,0,0,418,419,5,75,0,0,419,422,
-        3,50,25,0,420,422,3,6,3,0,421,418,1,0,0,0,421,420,1,0,0,0,422,49,
-        1,0,0,0,423,424,5,6,0,0,424,429,3,144,72,0,425,426,5,10,0,0,426,
-        428,3,144,72,0,427,425,1,0,0,0,428,431,1,0,0,0,429,427,1,0,0,0,429,
-        430,1,0,0,0,430,432,1,0,0,0,431,429,1,0,0,0,432,433,5,7,0,0,433,
-        51,1,0,0,0,434,439,3,144,72,0,435,436,5,10,0,0,436,438,3,144,72,
-        0,437,435,1,0,0,0,438,441,1,0,0,0,439,437,1,0,0,0,439,440,1,0,0,
-        0,440,53,1,0,0,0,441,439,1,0,0,0,442,443,5,72,0,0,443,444,3,152,
-        76,0,444,445,5,76,0,0,445,450,3,56,28,0,446,447,5,10,0,0,447,449,
-        3,56,28,0,448,446,1,0,0,0,449,452,1,0,0,0,450,448,1,0,0,0,450,451,
-        1,0,0,0,451,455,1,0,0,0,452,450,1,0,0,0,453,454,5,57,0,0,454,456,
-        3,32,16,0,455,453,1,0,0,0,455,456,1,0,0,0,456,55,1,0,0,0,457,458,
-        3,154,77,0,458,459,5,13,0,0,459,460,3,144,72,0,460,57,1,0,0,0,461,
-        462,5,73,0,0,462,463,5,56,0,0,463,466,3,152,76,0,464,465,5,57,0,
-        0,465,467,3,32,16,0,466,464,1,0,0,0,466,467,1,0,0,0,467,59,1,0,0,
-        0,468,469,5,74,0,0,469,470,5,77,0,0,470,475,3,152,76,0,471,473,5,
-        217,0,0,472,471,1,0,0,0,472,473,1,0,0,0,473,474,1,0,0,0,474,476,
-        3,12,6,0,475,472,1,0,0,0,475,476,1,0,0,0,476,477,1,0,0,0,477,478,
-        5,158,0,0,478,483,3,16,8,0,479,481,5,217,0,0,480,479,1,0,0,0,480,
-        481,1,0,0,0,481,482,1,0,0,0,482,484,3,12,6,0,483,480,1,0,0,0,483,
-        484,1,0,0,0,484,485,1,0,0,0,485,486,5,159,0,0,486,491,3,62,31,0,
-        487,488,5,133,0,0,488,489,5,218,0,0,489,490,5,134,0,0,490,492,3,
-        64,32,0,491,487,1,0,0,0,491,492,1,0,0,0,492,498,1,0,0,0,493,494,
-        5,133,0,0,494,495,5,49,0,0,495,496,5,218,0,0,496,497,5,134,0,0,497,
-        499,3,66,33,0,498,493,1,0,0,0,498,499,1,0,0,0,499,61,1,0,0,0,500,
-        501,3,144,72,0,501,63,1,0,0,0,502,503,5,72,0,0,503,504,5,76,0,0,
-        504,509,3,56,28,0,505,506,5,10,0,0,506,508,3,56,28,0,507,505,1,0,
-        0,0,508,511,1,0,0,0,509,507,1,0,0,0,509,510,1,0,0,0,510,65,1,0,0,
-        0,511,509,1,0,0,0,512,517,5,71,0,0,513,514,5,6,0,0,514,515,3,30,
-        15,0,515,516,5,7,0,0,516,518,1,0,0,0,517,513,1,0,0,0,517,518,1,0,
-        0,0,518,519,1,0,0,0,519,520,5,75,0,0,520,521,3,50,25,0,521,67,1,
-        0,0,0,522,527,3,70,35,0,523,527,3,88,44,0,524,527,3,90,45,0,525,
-        527,3,92,46,0,526,522,1,0,0,0,526,523,1,0,0,0,526,524,1,0,0,0,526,
-        525,1,0,0,0,527,69,1,0,0,0,528,529,5,78,0,0,529,530,5,85,0,0,530,
-        531,3,152,76,0,531,532,5,6,0,0,532,537,3,72,36,0,533,534,5,10,0,
-        0,534,536,3,72,36,0,535,533,1,0,0,0,536,539,1,0,0,0,537,535,1,0,
-        0,0,537,538,1,0,0,0,538,540,1,0,0,0,539,537,1,0,0,0,540,541,5,7,
-        0,0,541,71,1,0,0,0,542,543,3,154,77,0,543,547,3,74,37,0,544,546,
-        3,82,41,0,545,544,1,0,0,0,546,549,1,0,0,0,547,545,1,0,0,0,547,548,
-        1,0,0,0,548,73,1,0,0,0,549,547,1,0,0,0,550,585,5,93,0,0,551,585,
-        5,94,0,0,552,585,5,95,0,0,553,562,5,96,0,0,554,555,5,6,0,0,555,558,
-        3,76,38,0,556,557,5,10,0,0,557,559,3,78,39,0,558,556,1,0,0,0,558,
-        559,1,0,0,0,559,560,1,0,0,0,560,561,5,7,0,0,561,563,1,0,0,0,562,
-        554,1,0,0,0,562,563,1,0,0,0,563,585,1,0,0,0,564,585,5,97,0,0,565,
-        585,5,98,0,0,566,585,5,99,0,0,567,572,5,100,0,0,568,569,5,6,0,0,
-        569,570,3,80,40,0,570,571,5,7,0,0,571,573,1,0,0,0,572,568,1,0,0,
-        0,572,573,1,0,0,0,573,585,1,0,0,0,574,579,5,101,0,0,575,576,5,6,
-        0,0,576,577,3,80,40,0,577,578,5,7,0,0,578,580,1,0,0,0,579,575,1,
-        0,0,0,579,580,1,0,0,0,580,585,1,0,0,0,581,585,5,107,0,0,582,585,
-        5,108,0,0,583,585,5,109,0,0,584,550,1,0,0,0,584,551,1,0,0,0,584,
-        552,1,0,0,0,584,553,1,0,0,0,584,564,1,0,0,0,584,565,1,0,0,0,584,
-        566,1,0,0,0,584,567,1,0,0,0,584,574,1,0,0,0,584,581,1,0,0,0,584,
-        582,1,0,0,0,584,583,1,0,0,0,585,75,1,0,0,0,586,587,5,2,0,0,587,77,
-        1,0,0,0,588,589,5,2,0,0,589,79,1,0,0,0,590,591,5,2,0,0,591,81,1,
-        0,0,0,592,612,5,115,0,0,593,594,5,117,0,0,594,612,3,84,42,0,595,
-        596,5,111,0,0,596,612,5,113,0,0,597,612,5,114,0,0,598,599,5,118,
-        0,0,599,600,5,6,0,0,600,601,3,86,43,0,601,602,5,7,0,0,602,612,1,
-        0,0,0,603,604,5,120,0,0,604,609,3,152,76,0,605,606,5,6,0,0,606,607,
-        3,154,77,0,607,608,5,7,0,0,608,610,1,0,0,0,609,605,1,0,0,0,609,610,
-        1,0,0,0,610,612,1,0,0,0,611,592,1,0,0,0,611,593,1,0,0,0,611,595,
-        1,0,0,0,611,597,1,0,0,0,611,598,1,0,0,0,611,603,1,0,0,0,612,83,1,
-        0,0,0,613,614,3,144,72,0,614,85,1,0,0,0,615,616,3,144,72,0,616,87,
-        1,0,0,0,617,618,5,78,0,0,618,619,5,86,0,0,619,624,5,1,0,0,620,621,
-        5,6,0,0,621,622,3,30,15,0,622,623,5,7,0,0,623,625,1,0,0,0,624,620,
-        1,0,0,0,624,625,1,0,0,0,625,626,1,0,0,0,626,627,5,217,0,0,627,628,
-        3,6,3,0,628,89,1,0,0,0,629,630,5,78,0,0,630,631,5,87,0,0,631,632,
-        5,1,0,0,632,633,5,159,0,0,633,634,3,152,76,0,634,635,5,6,0,0,635,
-        636,3,30,15,0,636,637,5,7,0,0,637,91,1,0,0,0,638,639,5,78,0,0,639,
-        640,5,88,0,0,640,644,5,1,0,0,641,642,5,219,0,0,642,643,5,184,0,0,
-        643,645,3,94,47,0,644,641,1,0,0,0,644,645,1,0,0,0,645,649,1,0,0,
-        0,646,647,5,220,0,0,647,648,5,59,0,0,648,650,3,96,48,0,649,646,1,
-        0,0,0,649,650,1,0,0,0,650,653,1,0,0,0,651,652,5,221,0,0,652,654,
-        3,98,49,0,653,651,1,0,0,0,653,654,1,0,0,0,654,657,1,0,0,0,655,656,
-        5,222,0,0,656,658,3,100,50,0,657,655,1,0,0,0,657,658,1,0,0,0,658,
-        93,1,0,0,0,659,660,5,2,0,0,660,95,1,0,0,0,661,662,5,2,0,0,662,97,
-        1,0,0,0,663,664,5,2,0,0,664,99,1,0,0,0,665,666,5,2,0,0,666,101,1,
-        0,0,0,667,668,5,79,0,0,668,669,5,85,0,0,669,670,3,152,76,0,670,671,
-        3,104,52,0,671,103,1,0,0,0,672,673,5,223,0,0,673,674,5,224,0,0,674,
-        690,3,72,36,0,675,676,5,80,0,0,676,677,5,224,0,0,677,690,3,154,77,
-        0,678,679,5,225,0,0,679,680,5,224,0,0,680,690,3,72,36,0,681,682,
-        5,223,0,0,682,683,5,119,0,0,683,684,3,106,53,0,684,685,3,108,54,
-        0,685,690,1,0,0,0,686,687,5,80,0,0,687,688,5,119,0,0,688,690,3,106,
-        53,0,689,672,1,0,0,0,689,675,1,0,0,0,689,678,1,0,0,0,689,681,1,0,
-        0,0,689,686,1,0,0,0,690,105,1,0,0,0,691,692,5,1,0,0,692,107,1,0,
-        0,0,693,694,5,111,0,0,694,695,5,113,0,0,695,696,5,6,0,0,696,697,
-        3,30,15,0,697,698,5,7,0,0,698,723,1,0,0,0,699,700,5,114,0,0,700,
-        701,5,6,0,0,701,702,3,30,15,0,702,703,5,7,0,0,703,723,1,0,0,0,704,
-        705,5,112,0,0,705,706,5,113,0,0,706,707,5,6,0,0,707,708,3,30,15,
-        0,708,709,5,7,0,0,709,710,5,120,0,0,710,715,3,152,76,0,711,712,5,
-        6,0,0,712,713,3,30,15,0,713,714,5,7,0,0,714,716,1,0,0,0,715,711,
-        1,0,0,0,715,716,1,0,0,0,716,723,1,0,0,0,717,718,5,118,0,0,718,719,
-        5,6,0,0,719,720,3,86,43,0,720,721,5,7,0,0,721,723,1,0,0,0,722,693,
-        1,0,0,0,722,699,1,0,0,0,722,704,1,0,0,0,722,717,1,0,0,0,723,109,
-        1,0,0,0,724,725,5,80,0,0,725,726,7,4,0,0,726,727,3,112,56,0,727,
-        111,1,0,0,0,728,729,5,1,0,0,729,113,1,0,0,0,730,731,5,83,0,0,731,
-        732,3,116,58,0,732,733,5,159,0,0,733,734,3,120,60,0,734,735,3,112,
-        56,0,735,736,5,226,0,0,736,737,3,122,61,0,737,115,1,0,0,0,738,743,
-        3,118,59,0,739,740,5,10,0,0,740,742,3,118,59,0,741,739,1,0,0,0,742,
-        745,1,0,0,0,743,741,1,0,0,0,743,744,1,0,0,0,744,117,1,0,0,0,745,
-        743,1,0,0,0,746,747,7,5,0,0,747,119,1,0,0,0,748,749,7,6,0,0,749,
-        121,1,0,0,0,750,755,3,124,62,0,751,752,5,10,0,0,752,754,3,124,62,
-        0,753,751,1,0,0,0,754,757,1,0,0,0,755,753,1,0,0,0,755,756,1,0,0,
-        0,756,123,1,0,0,0,757,755,1,0,0,0,758,759,7,7,0,0,759,125,1,0,0,
-        0,760,761,5,84,0,0,761,762,3,116,58,0,762,763,5,159,0,0,763,764,
-        3,120,60,0,764,765,3,112,56,0,765,766,5,56,0,0,766,767,3,122,61,
-        0,767,127,1,0,0,0,768,770,5,168,0,0,769,771,5,172,0,0,770,769,1,
-        0,0,0,770,771,1,0,0,0,771,129,1,0,0,0,772,774,5,169,0,0,773,775,
-        5,172,0,0,774,773,1,0,0,0,774,775,1,0,0,0,775,779,1,0,0,0,776,777,
-        5,226,0,0,777,778,5,170,0,0,778,780,3,134,67,0,779,776,1,0,0,0,779,
-        780,1,0,0,0,780,131,1,0,0,0,781,783,5,167,0,0,782,784,7,8,0,0,783,
-        782,1,0,0,0,783,784,1,0,0,0,784,133,1,0,0,0,785,786,5,1,0,0,786,
-        135,1,0,0,0,787,788,5,76,0,0,788,789,3,138,69,0,789,790,5,13,0,0,
-        790,791,3,140,70,0,791,137,1,0,0,0,792,793,5,1,0,0,793,139,1,0,0,
-        0,794,795,3,144,72,0,795,141,1,0,0,0,796,797,5,53,0,0,797,798,5,
-        159,0,0,798,799,7,9,0,0,799,800,3,112,56,0,800,801,5,43,0,0,801,
-        802,5,3,0,0,802,143,1,0,0,0,803,804,6,72,-1,0,804,813,3,146,73,0,
-        805,806,5,6,0,0,806,807,3,144,72,0,807,808,5,7,0,0,808,813,1,0,0,
-        0,809,813,3,166,83,0,810,813,3,184,92,0,811,813,3,194,97,0,812,803,
-        1,0,0,0,812,805,1,0,0,0,812,809,1,0,0,0,812,810,1,0,0,0,812,811,
-        1,0,0,0,813,820,1,0,0,0,814,815,10,5,0,0,815,816,3,158,79,0,816,
-        817,3,144,72,6,817,819,1,0,0,0,818,814,1,0,0,0,819,822,1,0,0,0,820,
-        818,1,0,0,0,820,821,1,0,0,0,821,145,1,0,0,0,822,820,1,0,0,0,823,
-        828,3,148,74,0,824,828,3,150,75,0,825,828,3,156,78,0,826,828,3,196,
-        98,0,827,823,1,0,0,0,827,824,1,0,0,0,827,825,1,0,0,0,827,826,1,0,
-        0,0,828,147,1,0,0,0,829,830,7,10,0,0,830,149,1,0,0,0,831,832,3,152,
-        76,0,832,833,5,22,0,0,833,835,1,0,0,0,834,831,1,0,0,0,834,835,1,
-        0,0,0,835,836,1,0,0,0,836,837,3,154,77,0,837,151,1,0,0,0,838,839,
-        5,1,0,0,839,153,1,0,0,0,840,841,5,1,0,0,841,155,1,0,0,0,842,843,
-        5,24,0,0,843,157,1,0,0,0,844,848,3,160,80,0,845,848,3,162,81,0,846,
-        848,3,164,82,0,847,844,1,0,0,0,847,845,1,0,0,0,847,846,1,0,0,0,848,
-        159,1,0,0,0,849,850,7,11,0,0,850,161,1,0,0,0,851,852,7,12,0,0,852,
-        163,1,0,0,0,853,854,7,13,0,0,854,165,1,0,0,0,855,856,3,168,84,0,
-        856,858,5,6,0,0,857,859,7,0,0,0,858,857,1,0,0,0,858,859,1,0,0,0,
-        859,862,1,0,0,0,860,863,3,170,85,0,861,863,5,16,0,0,862,860,1,0,
-        0,0,862,861,1,0,0,0,862,863,1,0,0,0,863,864,1,0,0,0,864,865,5,7,
-        0,0,865,868,1,0,0,0,866,868,3,172,86,0,867,855,1,0,0,0,867,866,1,
-        0,0,0,868,167,1,0,0,0,869,870,7,14,0,0,870,169,1,0,0,0,871,876,3,
-        144,72,0,872,873,5,10,0,0,873,875,3,144,72,0,874,872,1,0,0,0,875,
-        878,1,0,0,0,876,874,1,0,0,0,876,877,1,0,0,0,877,171,1,0,0,0,878,
-        876,1,0,0,0,879,880,3,174,87,0,880,882,5,6,0,0,881,883,3,170,85,
-        0,882,881,1,0,0,0,882,883,1,0,0,0,883,884,1,0,0,0,884,885,5,7,0,
-        0,885,886,5,194,0,0,886,887,3,176,88,0,887,173,1,0,0,0,888,889,7,
-        15,0,0,889,175,1,0,0,0,890,901,5,6,0,0,891,892,5,92,0,0,892,893,
-        5,59,0,0,893,898,3,144,72,0,894,895,5,10,0,0,895,897,3,144,72,0,
-        896,894,1,0,0,0,897,900,1,0,0,0,898,896,1,0,0,0,898,899,1,0,0,0,
-        899,902,1,0,0,0,900,898,1,0,0,0,901,891,1,0,0,0,901,902,1,0,0,0,
-        902,913,1,0,0,0,903,904,5,61,0,0,904,905,5,59,0,0,905,910,3,40,20,
-        0,906,907,5,10,0,0,907,909,3,40,20,0,908,906,1,0,0,0,909,912,1,0,
-        0,0,910,908,1,0,0,0,910,911,1,0,0,0,911,914,1,0,0,0,912,910,1,0,
-        0,0,913,903,1,0,0,0,913,914,1,0,0,0,914,915,1,0,0,0,915,917,7,16,
-        0,0,916,918,3,178,89,0,917,916,1,0,0,0,917,918,1,0,0,0,918,919,1,
-        0,0,0,919,920,5,7,0,0,920,177,1,0,0,0,921,928,3,180,90,0,922,923,
-        5,41,0,0,923,924,3,180,90,0,924,925,5,47,0,0,925,926,3,182,91,0,
-        926,928,1,0,0,0,927,921,1,0,0,0,927,922,1,0,0,0,928,179,1,0,0,0,
-        929,930,5,189,0,0,930,940,5,190,0,0,931,932,5,192,0,0,932,940,5,
-        193,0,0,933,934,3,144,72,0,934,935,5,190,0,0,935,940,1,0,0,0,936,
-        937,3,144,72,0,937,938,5,191,0,0,938,940,1,0,0,0,939,929,1,0,0,0,
-        939,931,1,0,0,0,939,933,1,0,0,0,939,936,1,0,0,0,940,181,1,0,0,0,
-        941,942,5,189,0,0,942,952,5,191,0,0,943,944,5,192,0,0,944,952,5,
-        193,0,0,945,946,3,144,72,0,946,947,5,190,0,0,947,952,1,0,0,0,948,
-        949,3,144,72,0,949,950,5,191,0,0,950,952,1,0,0,0,951,941,1,0,0,0,
-        951,943,1,0,0,0,951,945,1,0,0,0,951,948,1,0,0,0,952,183,1,0,0,0,
-        953,955,5,132,0,0,954,956,3,144,72,0,955,954,1,0,0,0,955,956,1,0,
-        0,0,956,958,1,0,0,0,957,959,3,186,93,0,958,957,1,0,0,0,959,960,1,
-        0,0,0,960,958,1,0,0,0,960,961,1,0,0,0,961,964,1,0,0,0,962,963,5,
-        135,0,0,963,965,3,192,96,0,964,962,1,0,0,0,964,965,1,0,0,0,965,966,
-        1,0,0,0,966,967,5,136,0,0,967,185,1,0,0,0,968,969,5,133,0,0,969,
-        970,3,188,94,0,970,971,5,134,0,0,971,972,3,190,95,0,972,187,1,0,
-        0,0,973,974,3,144,72,0,974,189,1,0,0,0,975,976,3,144,72,0,976,191,
-        1,0,0,0,977,978,3,144,72,0,978,193,1,0,0,0,979,980,5,137,0,0,980,
-        981,5,6,0,0,981,982,3,144,72,0,982,983,5,217,0,0,983,984,3,74,37,
-        0,984,985,5,7,0,0,985,195,1,0,0,0,986,987,5,6,0,0,987,988,3,6,3,
-        0,988,989,5,7,0,0,989,197,1,0,0,0,94,201,222,228,235,240,244,249,
-        253,257,261,268,272,276,279,285,295,301,306,309,315,318,323,327,
-        330,332,345,349,360,369,379,389,394,404,407,416,421,429,439,450,
-        455,466,472,475,480,483,491,498,509,517,526,537,547,558,562,572,
-        579,584,609,611,624,644,649,653,657,689,715,722,743,755,770,774,
-        779,783,812,820,827,834,847,858,862,867,876,882,898,901,910,913,
-        917,927,939,951,955,960,964
+        98,7,98,2,99,7,99,2,100,7,100,2,101,7,101,2,102,7,102,1,0,5,0,208,
+        8,0,10,0,12,0,211,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,231,8,1,1,2,1,2,1,3,1,3,3,3,237,
+        8,3,1,3,1,3,1,3,1,3,1,3,5,3,244,8,3,10,3,12,3,247,9,3,3,3,249,8,
+        3,1,3,1,3,1,3,1,3,3,3,255,8,3,1,3,1,3,1,3,3,3,260,8,3,1,3,1,3,3,
+        3,264,8,3,1,3,1,3,1,3,3,3,269,8,3,1,3,1,3,3,3,273,8,3,1,3,1,3,3,
+        3,277,8,3,1,3,1,3,3,3,281,8,3,1,4,1,4,1,4,5,4,286,8,4,10,4,12,4,
+        289,9,4,1,4,3,4,292,8,4,1,5,1,5,3,5,296,8,5,1,5,3,5,299,8,5,1,5,
+        1,5,1,5,1,5,3,5,305,8,5,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,3,7,315,
+        8,7,1,7,1,7,5,7,319,8,7,10,7,12,7,322,9,7,1,8,1,8,3,8,326,8,8,1,
+        8,3,8,329,8,8,1,8,1,8,1,8,1,8,3,8,335,8,8,1,8,3,8,338,8,8,1,8,1,
+        8,1,8,3,8,343,8,8,1,8,1,8,3,8,347,8,8,1,8,3,8,350,8,8,3,8,352,8,
+        8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,1,13,3,13,365,
+        8,13,1,13,1,13,3,13,369,8,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,
+        1,13,1,13,3,13,380,8,13,1,14,1,14,1,15,1,15,1,15,5,15,387,8,15,10,
+        15,12,15,390,9,15,1,16,1,16,1,17,1,17,1,17,5,17,397,8,17,10,17,12,
+        17,400,9,17,1,18,1,18,1,19,1,19,1,19,5,19,407,8,19,10,19,12,19,410,
+        9,19,1,20,1,20,3,20,414,8,20,1,21,1,21,1,22,1,22,1,23,1,23,3,23,
+        422,8,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,3,24,
+        434,8,24,1,24,1,24,1,24,3,24,439,8,24,1,25,1,25,1,25,1,25,5,25,445,
+        8,25,10,25,12,25,448,9,25,1,25,1,25,1,26,1,26,1,26,5,26,455,8,26,
+        10,26,12,26,458,9,26,1,27,1,27,1,27,1,27,1,27,1,27,5,27,466,8,27,
+        10,27,12,27,469,9,27,1,27,1,27,3,27,473,8,27,1,28,1,28,1,28,1,28,
+        1,29,1,29,1,29,1,29,1,29,3,29,484,8,29,1,30,1,30,1,30,1,30,3,30,
+        490,8,30,1,30,3,30,493,8,30,1,30,1,30,1,30,3,30,498,8,30,1,30,3,
+        30,501,8,30,1,30,1,30,1,30,1,30,1,30,1,30,3,30,509,8,30,1,30,1,30,
+        1,30,1,30,1,30,3,30,516,8,30,1,31,1,31,1,32,1,32,1,32,1,32,1,32,
+        5,32,525,8,32,10,32,12,32,528,9,32,1,33,1,33,1,33,1,33,1,33,3,33,
+        535,8,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,3,34,544,8,34,1,35,1,
+        35,1,35,1,35,1,35,1,35,1,35,5,35,553,8,35,10,35,12,35,556,9,35,1,
+        35,1,35,1,36,1,36,3,36,562,8,36,1,37,1,37,1,37,5,37,567,8,37,10,
+        37,12,37,570,9,37,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,3,38,580,
+        8,38,1,38,1,38,3,38,584,8,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,
+        1,38,3,38,594,8,38,1,38,1,38,1,38,1,38,1,38,3,38,601,8,38,1,38,1,
+        38,1,38,1,38,1,38,3,38,608,8,38,1,38,1,38,1,38,1,38,1,38,3,38,615,
+        8,38,1,38,1,38,1,38,1,38,1,38,3,38,622,8,38,1,38,1,38,1,38,1,38,
+        1,38,3,38,629,8,38,1,38,1,38,1,38,1,38,1,38,3,38,636,8,38,1,38,1,
+        38,1,38,1,38,1,38,1,38,1,38,3,38,645,8,38,1,38,3,38,648,8,38,1,39,
+        1,39,1,40,1,40,1,41,1,41,1,42,1,42,3,42,658,8,42,1,42,1,42,1,42,
+        3,42,663,8,42,1,42,1,42,3,42,667,8,42,1,42,1,42,1,42,1,42,1,42,1,
+        42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,3,42,683,8,42,1,42,5,
+        42,686,8,42,10,42,12,42,689,9,42,1,42,1,42,1,42,1,42,3,42,695,8,
+        42,1,42,1,42,1,42,1,42,1,42,3,42,702,8,42,1,42,5,42,705,8,42,10,
+        42,12,42,708,9,42,1,42,1,42,3,42,712,8,42,3,42,714,8,42,1,43,1,43,
+        3,43,718,8,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,
+        3,44,730,8,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,
+        3,45,742,8,45,1,46,1,46,1,47,1,47,1,48,1,48,1,48,1,48,1,48,1,48,
+        1,48,3,48,755,8,48,1,48,1,48,1,48,1,49,1,49,3,49,762,8,49,1,49,1,
+        49,1,49,1,49,1,49,1,49,1,49,1,49,5,49,772,8,49,10,49,12,49,775,9,
+        49,1,49,1,49,1,50,1,50,1,50,1,50,1,50,1,50,3,50,785,8,50,1,50,1,
+        50,1,50,3,50,790,8,50,1,50,1,50,3,50,794,8,50,1,50,1,50,3,50,798,
+        8,50,1,51,3,51,801,8,51,1,51,1,51,1,52,3,52,806,8,52,1,52,1,52,1,
+        53,3,53,811,8,53,1,53,1,53,1,54,3,54,816,8,54,1,54,1,54,1,55,1,55,
+        1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,
+        1,56,1,56,1,56,1,56,3,56,839,8,56,1,57,1,57,1,58,1,58,1,58,1,58,
+        1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,
+        1,58,1,58,1,58,1,58,1,58,3,58,865,8,58,1,58,5,58,868,8,58,10,58,
+        12,58,871,9,58,1,58,1,58,1,58,1,58,1,58,3,58,878,8,58,1,59,1,59,
+        1,59,1,59,1,60,1,60,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,62,
+        1,62,1,62,5,62,897,8,62,10,62,12,62,900,9,62,1,63,1,63,1,64,1,64,
+        1,65,1,65,1,65,5,65,909,8,65,10,65,12,65,912,9,65,1,66,1,66,1,67,
+        1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,68,1,68,3,68,926,8,68,1,69,
+        1,69,3,69,930,8,69,1,69,1,69,1,69,3,69,935,8,69,1,70,1,70,3,70,939,
+        8,70,1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,73,1,73,1,74,1,74,1,75,
+        1,75,1,75,1,75,1,75,1,75,1,75,1,76,1,76,1,76,1,76,1,76,1,76,1,76,
+        1,76,1,76,5,76,968,8,76,10,76,12,76,971,9,76,1,76,1,76,1,76,1,76,
+        1,76,1,76,1,76,1,76,3,76,981,8,76,1,76,1,76,1,76,1,76,1,76,1,76,
+        1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,
+        1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,
+        5,76,1015,8,76,10,76,12,76,1018,9,76,3,76,1020,8,76,1,76,1,76,5,
+        76,1024,8,76,10,76,12,76,1027,9,76,1,77,1,77,1,77,1,77,3,77,1033,
+        8,77,1,78,1,78,1,79,1,79,1,79,3,79,1040,8,79,1,79,1,79,1,80,1,80,
+        1,80,3,80,1047,8,80,1,80,1,80,1,81,1,81,1,81,3,81,1054,8,81,1,81,
+        1,81,1,82,1,82,1,83,1,83,1,84,1,84,3,84,1064,8,84,1,85,1,85,1,85,
+        1,85,3,85,1070,8,85,1,85,1,85,3,85,1074,8,85,1,86,1,86,1,87,1,87,
+        1,87,3,87,1081,8,87,1,87,1,87,3,87,1085,8,87,1,87,1,87,1,87,3,87,
+        1090,8,87,1,88,1,88,1,89,1,89,1,89,5,89,1097,8,89,10,89,12,89,1100,
+        9,89,1,90,1,90,1,90,3,90,1105,8,90,1,90,1,90,1,90,1,90,1,91,1,91,
+        1,92,1,92,1,92,1,92,1,92,1,92,5,92,1119,8,92,10,92,12,92,1122,9,
+        92,3,92,1124,8,92,1,92,1,92,1,92,1,92,1,92,5,92,1131,8,92,10,92,
+        12,92,1134,9,92,3,92,1136,8,92,1,92,1,92,3,92,1140,8,92,1,92,1,92,
+        1,93,1,93,1,93,1,93,1,93,1,93,3,93,1150,8,93,1,94,1,94,1,94,1,94,
+        1,94,1,94,1,94,1,94,1,94,1,94,3,94,1162,8,94,1,95,1,95,1,95,1,95,
+        1,95,1,95,1,95,1,95,1,95,1,95,3,95,1174,8,95,1,96,1,96,3,96,1178,
+        8,96,1,96,4,96,1181,8,96,11,96,12,96,1182,1,96,1,96,3,96,1187,8,
+        96,1,96,1,96,1,97,1,97,1,97,1,97,1,97,1,98,1,98,1,99,1,99,1,100,
+        1,100,1,101,1,101,1,101,1,101,1,101,1,101,1,101,1,102,1,102,1,102,
+        1,102,1,102,0,2,14,152,103,0,2,4,6,8,10,12,14,16,18,20,22,24,26,
+        28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,
+        72,74,76,78,80,82,84,86,88,90,92,94,96,98,100,102,104,106,108,110,
+        112,114,116,118,120,122,124,126,128,130,132,134,136,138,140,142,
+        144,146,148,150,152,154,156,158,160,162,164,166,168,170,172,174,
+        176,178,180,182,184,186,188,190,192,194,196,198,200,202,204,0,27,
+        1,0,178,179,2,0,2,2,232,232,1,0,167,169,1,0,62,63,1,0,67,68,2,0,
+        69,69,208,208,1,0,72,73,1,0,88,91,3,0,55,55,71,73,178,178,2,0,88,
+        89,91,91,2,0,100,100,232,232,1,0,187,188,2,0,88,88,96,96,1,0,13,
+        14,1,0,45,46,2,0,15,17,51,51,2,0,13,14,28,28,1,0,41,42,2,0,48,48,
+        50,50,1,0,43,44,1,0,39,40,3,0,1,4,128,128,192,194,2,0,16,16,21,21,
+        2,0,12,12,32,38,3,0,140,146,154,164,232,232,1,0,219,231,2,0,69,69,
+        202,203,1309,0,209,1,0,0,0,2,230,1,0,0,0,4,232,1,0,0,0,6,234,1,0,
+        0,0,8,291,1,0,0,0,10,304,1,0,0,0,12,306,1,0,0,0,14,314,1,0,0,0,16,
+        351,1,0,0,0,18,353,1,0,0,0,20,355,1,0,0,0,22,357,1,0,0,0,24,359,
+        1,0,0,0,26,368,1,0,0,0,28,381,1,0,0,0,30,383,1,0,0,0,32,391,1,0,
+        0,0,34,393,1,0,0,0,36,401,1,0,0,0,38,403,1,0,0,0,40,411,1,0,0,0,
+        42,415,1,0,0,0,44,417,1,0,0,0,46,419,1,0,0,0,48,426,1,0,0,0,50,440,
+        1,0,0,0,52,451,1,0,0,0,54,459,1,0,0,0,56,474,1,0,0,0,58,478,1,0,
+        0,0,60,485,1,0,0,0,62,517,1,0,0,0,64,519,1,0,0,0,66,529,1,0,0,0,
+        68,543,1,0,0,0,70,545,1,0,0,0,72,561,1,0,0,0,74,563,1,0,0,0,76,647,
+        1,0,0,0,78,649,1,0,0,0,80,651,1,0,0,0,82,653,1,0,0,0,84,657,1,0,
+        0,0,86,717,1,0,0,0,88,721,1,0,0,0,90,741,1,0,0,0,92,743,1,0,0,0,
+        94,745,1,0,0,0,96,747,1,0,0,0,98,759,1,0,0,0,100,778,1,0,0,0,102,
+        800,1,0,0,0,104,805,1,0,0,0,106,810,1,0,0,0,108,815,1,0,0,0,110,
+        819,1,0,0,0,112,838,1,0,0,0,114,840,1,0,0,0,116,877,1,0,0,0,118,
+        879,1,0,0,0,120,883,1,0,0,0,122,885,1,0,0,0,124,893,1,0,0,0,126,
+        901,1,0,0,0,128,903,1,0,0,0,130,905,1,0,0,0,132,913,1,0,0,0,134,
+        915,1,0,0,0,136,923,1,0,0,0,138,927,1,0,0,0,140,936,1,0,0,0,142,
+        940,1,0,0,0,144,942,1,0,0,0,146,947,1,0,0,0,148,949,1,0,0,0,150,
+        951,1,0,0,0,152,980,1,0,0,0,154,1032,1,0,0,0,156,1034,1,0,0,0,158,
+        1039,1,0,0,0,160,1046,1,0,0,0,162,1053,1,0,0,0,164,1057,1,0,0,0,
+        166,1059,1,0,0,0,168,1063,1,0,0,0,170,1065,1,0,0,0,172,1075,1,0,
+        0,0,174,1089,1,0,0,0,176,1091,1,0,0,0,178,1093,1,0,0,0,180,1101,
+        1,0,0,0,182,1110,1,0,0,0,184,1112,1,0,0,0,186,1149,1,0,0,0,188,1161,
+        1,0,0,0,190,1173,1,0,0,0,192,1175,1,0,0,0,194,1190,1,0,0,0,196,1195,
+        1,0,0,0,198,1197,1,0,0,0,200,1199,1,0,0,0,202,1201,1,0,0,0,204,1208,
+        1,0,0,0,206,208,3,2,1,0,207,206,1,0,0,0,208,211,1,0,0,0,209,207,
+        1,0,0,0,209,210,1,0,0,0,210,212,1,0,0,0,211,209,1,0,0,0,212,213,
+        5,0,0,1,213,1,1,0,0,0,214,231,3,6,3,0,215,231,3,48,24,0,216,231,
+        3,54,27,0,217,231,3,58,29,0,218,231,3,60,30,0,219,231,3,68,34,0,
+        220,231,3,110,55,0,221,231,3,118,59,0,222,231,3,122,61,0,223,231,
+        3,134,67,0,224,231,3,136,68,0,225,231,3,138,69,0,226,231,3,140,70,
+        0,227,231,3,144,72,0,228,231,3,150,75,0,229,231,3,4,2,0,230,214,
+        1,0,0,0,230,215,1,0,0,0,230,216,1,0,0,0,230,217,1,0,0,0,230,218,
+        1,0,0,0,230,219,1,0,0,0,230,220,1,0,0,0,230,221,1,0,0,0,230,222,
+        1,0,0,0,230,223,1,0,0,0,230,224,1,0,0,0,230,225,1,0,0,0,230,226,
+        1,0,0,0,230,227,1,0,0,0,230,228,1,0,0,0,230,229,1,0,0,0,231,3,1,
+        0,0,0,232,233,5,10,0,0,233,5,1,0,0,0,234,236,5,55,0,0,235,237,7,
+        0,0,0,236,235,1,0,0,0,236,237,1,0,0,0,237,238,1,0,0,0,238,248,3,
+        8,4,0,239,240,5,77,0,0,240,245,3,170,85,0,241,242,5,9,0,0,242,244,
+        3,170,85,0,243,241,1,0,0,0,244,247,1,0,0,0,245,243,1,0,0,0,245,246,
+        1,0,0,0,246,249,1,0,0,0,247,245,1,0,0,0,248,239,1,0,0,0,248,249,
+        1,0,0,0,249,250,1,0,0,0,250,251,5,56,0,0,251,254,3,14,7,0,252,253,
+        5,57,0,0,253,255,3,32,16,0,254,252,1,0,0,0,254,255,1,0,0,0,255,259,
+        1,0,0,0,256,257,5,58,0,0,257,258,5,59,0,0,258,260,3,34,17,0,259,
+        256,1,0,0,0,259,260,1,0,0,0,260,263,1,0,0,0,261,262,5,60,0,0,262,
+        264,3,36,18,0,263,261,1,0,0,0,263,264,1,0,0,0,264,268,1,0,0,0,265,
+        266,5,61,0,0,266,267,5,59,0,0,267,269,3,38,19,0,268,265,1,0,0,0,
+        268,269,1,0,0,0,269,272,1,0,0,0,270,271,5,64,0,0,271,273,3,42,21,
+        0,272,270,1,0,0,0,272,273,1,0,0,0,273,276,1,0,0,0,274,275,5,65,0,
+        0,275,277,3,44,22,0,276,274,1,0,0,0,276,277,1,0,0,0,277,280,1,0,
+        0,0,278,279,5,66,0,0,279,281,3,46,23,0,280,278,1,0,0,0,280,281,1,
+        0,0,0,281,7,1,0,0,0,282,287,3,10,5,0,283,284,5,9,0,0,284,286,3,10,
+        5,0,285,283,1,0,0,0,286,289,1,0,0,0,287,285,1,0,0,0,287,288,1,0,
+        0,0,288,292,1,0,0,0,289,287,1,0,0,0,290,292,5,15,0,0,291,282,1,0,
+        0,0,291,290,1,0,0,0,292,9,1,0,0,0,293,298,3,152,76,0,294,296,5,78,
+        0,0,295,294,1,0,0,0,295,296,1,0,0,0,296,297,1,0,0,0,297,299,3,12,
+        6,0,298,295,1,0,0,0,298,299,1,0,0,0,299,305,1,0,0,0,300,301,3,162,
+        81,0,301,302,5,21,0,0,302,303,5,15,0,0,303,305,1,0,0,0,304,293,1,
+        0,0,0,304,300,1,0,0,0,305,11,1,0,0,0,306,307,7,1,0,0,307,13,1,0,
+        0,0,308,309,6,7,-1,0,309,315,3,16,8,0,310,311,5,5,0,0,311,312,3,
+        14,7,0,312,313,5,6,0,0,313,315,1,0,0,0,314,308,1,0,0,0,314,310,1,
+        0,0,0,315,320,1,0,0,0,316,317,10,2,0,0,317,319,3,26,13,0,318,316,
+        1,0,0,0,319,322,1,0,0,0,320,318,1,0,0,0,320,321,1,0,0,0,321,15,1,
+        0,0,0,322,320,1,0,0,0,323,328,3,162,81,0,324,326,5,78,0,0,325,324,
+        1,0,0,0,325,326,1,0,0,0,326,327,1,0,0,0,327,329,3,12,6,0,328,325,
+        1,0,0,0,328,329,1,0,0,0,329,352,1,0,0,0,330,331,5,5,0,0,331,332,
+        3,6,3,0,332,337,5,6,0,0,333,335,5,78,0,0,334,333,1,0,0,0,334,335,
+        1,0,0,0,335,336,1,0,0,0,336,338,3,12,6,0,337,334,1,0,0,0,337,338,
+        1,0,0,0,338,352,1,0,0,0,339,340,3,18,9,0,340,342,5,5,0,0,341,343,
+        3,52,26,0,342,341,1,0,0,0,342,343,1,0,0,0,343,344,1,0,0,0,344,349,
+        5,6,0,0,345,347,5,78,0,0,346,345,1,0,0,0,346,347,1,0,0,0,347,348,
+        1,0,0,0,348,350,3,12,6,0,349,346,1,0,0,0,349,350,1,0,0,0,350,352,
+        1,0,0,0,351,323,1,0,0,0,351,330,1,0,0,0,351,339,1,0,0,0,352,17,1,
+        0,0,0,353,354,5,232,0,0,354,19,1,0,0,0,355,356,5,232,0,0,356,21,
+        1,0,0,0,357,358,5,232,0,0,358,23,1,0,0,0,359,360,5,232,0,0,360,25,
+        1,0,0,0,361,369,5,166,0,0,362,364,7,2,0,0,363,365,5,170,0,0,364,
+        363,1,0,0,0,364,365,1,0,0,0,365,369,1,0,0,0,366,369,5,171,0,0,367,
+        369,5,172,0,0,368,361,1,0,0,0,368,362,1,0,0,0,368,366,1,0,0,0,368,
+        367,1,0,0,0,368,369,1,0,0,0,369,370,1,0,0,0,370,371,5,165,0,0,371,
+        379,3,16,8,0,372,373,5,174,0,0,373,380,3,28,14,0,374,375,5,173,0,
+        0,375,376,5,5,0,0,376,377,3,30,15,0,377,378,5,6,0,0,378,380,1,0,
+        0,0,379,372,1,0,0,0,379,374,1,0,0,0,379,380,1,0,0,0,380,27,1,0,0,
+        0,381,382,3,152,76,0,382,29,1,0,0,0,383,388,3,166,83,0,384,385,5,
+        9,0,0,385,387,3,166,83,0,386,384,1,0,0,0,387,390,1,0,0,0,388,386,
+        1,0,0,0,388,389,1,0,0,0,389,31,1,0,0,0,390,388,1,0,0,0,391,392,3,
+        152,76,0,392,33,1,0,0,0,393,398,3,152,76,0,394,395,5,9,0,0,395,397,
+        3,152,76,0,396,394,1,0,0,0,397,400,1,0,0,0,398,396,1,0,0,0,398,399,
+        1,0,0,0,399,35,1,0,0,0,400,398,1,0,0,0,401,402,3,152,76,0,402,37,
+        1,0,0,0,403,408,3,40,20,0,404,405,5,9,0,0,405,407,3,40,20,0,406,
+        404,1,0,0,0,407,410,1,0,0,0,408,406,1,0,0,0,408,409,1,0,0,0,409,
+        39,1,0,0,0,410,408,1,0,0,0,411,413,3,152,76,0,412,414,7,3,0,0,413,
+        412,1,0,0,0,413,414,1,0,0,0,414,41,1,0,0,0,415,416,5,1,0,0,416,43,
+        1,0,0,0,417,418,5,1,0,0,418,45,1,0,0,0,419,421,7,4,0,0,420,422,5,
+        1,0,0,421,420,1,0,0,0,421,422,1,0,0,0,422,423,1,0,0,0,423,424,7,
+        5,0,0,424,425,5,70,0,0,425,47,1,0,0,0,426,427,5,71,0,0,427,428,5,
+        77,0,0,428,433,3,162,81,0,429,430,5,5,0,0,430,431,3,30,15,0,431,
+        432,5,6,0,0,432,434,1,0,0,0,433,429,1,0,0,0,433,434,1,0,0,0,434,
+        438,1,0,0,0,435,436,5,75,0,0,436,439,3,50,25,0,437,439,3,6,3,0,438,
+        435,1,0,0,0,438,437,1,0,0,0,439,49,1,0,0,0,440,441,5,5,0,0,441,446,
+        3,152,76,0,442,443,5,9,0,0,443,445,3,152,76,0,444,442,1,0,0,0,445,
+        448,1,0,0,0,446,444,1,0,0,0,446,447,1,0,0,0,447,449,1,0,0,0,448,
+        446,1,0,0,0,449,450,5,6,0,0,450,51,1,0,0,0,451,456,3,152,76,0,452,
+        453,5,9,0,0,453,455,3,152,76,0,454,452,1,0,0,0,455,458,1,0,0,0,456,
+        454,1,0,0,0,456,457,1,0,0,0,457,53,1,0,0,0,458,456,1,0,0,0,459,460,
+        5,72,0,0,460,461,3,162,81,0,461,462,5,76,0,0,462,467,3,56,28,0,463,
+        464,5,9,0,0,464,466,3,56,28,0,465,463,1,0,0,0,466,469,1,0,0,0,467,
+        465,1,0,0,0,467,468,1,0,0,0,468,472,1,0,0,0,469,467,1,0,0,0,470,
+        471,5,57,0,0,471,473,3,32,16,0,472,470,1,0,0,0,472,473,1,0,0,0,473,
+        55,1,0,0,0,474,475,3,166,83,0,475,476,5,12,0,0,476,477,3,152,76,
+        0,477,57,1,0,0,0,478,479,5,73,0,0,479,480,5,56,0,0,480,483,3,162,
+        81,0,481,482,5,57,0,0,482,484,3,32,16,0,483,481,1,0,0,0,483,484,
+        1,0,0,0,484,59,1,0,0,0,485,486,5,74,0,0,486,487,5,77,0,0,487,492,
+        3,162,81,0,488,490,5,78,0,0,489,488,1,0,0,0,489,490,1,0,0,0,490,
+        491,1,0,0,0,491,493,3,12,6,0,492,489,1,0,0,0,492,493,1,0,0,0,493,
+        494,1,0,0,0,494,495,5,173,0,0,495,500,3,16,8,0,496,498,5,78,0,0,
+        497,496,1,0,0,0,497,498,1,0,0,0,498,499,1,0,0,0,499,501,3,12,6,0,
+        500,497,1,0,0,0,500,501,1,0,0,0,501,502,1,0,0,0,502,503,5,174,0,
+        0,503,508,3,62,31,0,504,505,5,148,0,0,505,506,5,80,0,0,506,507,5,
+        149,0,0,507,509,3,64,32,0,508,504,1,0,0,0,508,509,1,0,0,0,509,515,
+        1,0,0,0,510,511,5,148,0,0,511,512,5,49,0,0,512,513,5,80,0,0,513,
+        514,5,149,0,0,514,516,3,66,33,0,515,510,1,0,0,0,515,516,1,0,0,0,
+        516,61,1,0,0,0,517,518,3,152,76,0,518,63,1,0,0,0,519,520,5,72,0,
+        0,520,521,5,76,0,0,521,526,3,56,28,0,522,523,5,9,0,0,523,525,3,56,
+        28,0,524,522,1,0,0,0,525,528,1,0,0,0,526,524,1,0,0,0,526,527,1,0,
+        0,0,527,65,1,0,0,0,528,526,1,0,0,0,529,534,5,71,0,0,530,531,5,5,
+        0,0,531,532,3,30,15,0,532,533,5,6,0,0,533,535,1,0,0,0,534,530,1,
+        0,0,0,534,535,1,0,0,0,535,536,1,0,0,0,536,537,5,75,0,0,537,538,3,
+        50,25,0,538,67,1,0,0,0,539,544,3,70,35,0,540,544,3,96,48,0,541,544,
+        3,98,49,0,542,544,3,100,50,0,543,539,1,0,0,0,543,540,1,0,0,0,543,
+        541,1,0,0,0,543,542,1,0,0,0,544,69,1,0,0,0,545,546,5,81,0,0,546,
+        547,5,88,0,0,547,548,3,162,81,0,548,549,5,5,0,0,549,554,3,72,36,
+        0,550,551,5,9,0,0,551,553,3,72,36,0,552,550,1,0,0,0,553,556,1,0,
+        0,0,554,552,1,0,0,0,554,555,1,0,0,0,555,557,1,0,0,0,556,554,1,0,
+        0,0,557,558,5,6,0,0,558,71,1,0,0,0,559,562,3,74,37,0,560,562,3,86,
+        43,0,561,559,1,0,0,0,561,560,1,0,0,0,562,73,1,0,0,0,563,564,3,166,
+        83,0,564,568,3,76,38,0,565,567,3,84,42,0,566,565,1,0,0,0,567,570,
+        1,0,0,0,568,566,1,0,0,0,568,569,1,0,0,0,569,75,1,0,0,0,570,568,1,
+        0,0,0,571,648,5,105,0,0,572,648,5,106,0,0,573,648,5,107,0,0,574,
+        583,5,108,0,0,575,576,5,5,0,0,576,579,3,78,39,0,577,578,5,9,0,0,
+        578,580,3,80,40,0,579,577,1,0,0,0,579,580,1,0,0,0,580,581,1,0,0,
+        0,581,582,5,6,0,0,582,584,1,0,0,0,583,575,1,0,0,0,583,584,1,0,0,
+        0,584,648,1,0,0,0,585,648,5,109,0,0,586,648,5,110,0,0,587,648,5,
+        111,0,0,588,593,5,112,0,0,589,590,5,5,0,0,590,591,3,82,41,0,591,
+        592,5,6,0,0,592,594,1,0,0,0,593,589,1,0,0,0,593,594,1,0,0,0,594,
+        648,1,0,0,0,595,600,5,113,0,0,596,597,5,5,0,0,597,598,3,82,41,0,
+        598,599,5,6,0,0,599,601,1,0,0,0,600,596,1,0,0,0,600,601,1,0,0,0,
+        601,648,1,0,0,0,602,607,5,115,0,0,603,604,5,5,0,0,604,605,3,82,41,
+        0,605,606,5,6,0,0,606,608,1,0,0,0,607,603,1,0,0,0,607,608,1,0,0,
+        0,608,648,1,0,0,0,609,614,5,116,0,0,610,611,5,5,0,0,611,612,3,82,
+        41,0,612,613,5,6,0,0,613,615,1,0,0,0,614,610,1,0,0,0,614,615,1,0,
+        0,0,615,648,1,0,0,0,616,621,5,114,0,0,617,618,5,5,0,0,618,619,3,
+        82,41,0,619,620,5,6,0,0,620,622,1,0,0,0,621,617,1,0,0,0,621,622,
+        1,0,0,0,622,648,1,0,0,0,623,628,5,117,0,0,624,625,5,5,0,0,625,626,
+        3,82,41,0,626,627,5,6,0,0,627,629,1,0,0,0,628,624,1,0,0,0,628,629,
+        1,0,0,0,629,648,1,0,0,0,630,635,5,118,0,0,631,632,5,5,0,0,632,633,
+        3,82,41,0,633,634,5,6,0,0,634,636,1,0,0,0,635,631,1,0,0,0,635,636,
+        1,0,0,0,636,648,1,0,0,0,637,648,5,119,0,0,638,648,5,120,0,0,639,
+        644,5,121,0,0,640,641,5,5,0,0,641,642,3,78,39,0,642,643,5,6,0,0,
+        643,645,1,0,0,0,644,640,1,0,0,0,644,645,1,0,0,0,645,648,1,0,0,0,
+        646,648,5,122,0,0,647,571,1,0,0,0,647,572,1,0,0,0,647,573,1,0,0,
+        0,647,574,1,0,0,0,647,585,1,0,0,0,647,586,1,0,0,0,647,587,1,0,0,
+        0,647,588,1,0,0,0,647,595,1,0,0,0,647,602,1,0,0,0,647,609,1,0,0,
+        0,647,616,1,0,0,0,647,623,1,0,0,0,647,630,1,0,0,0,647,637,1,0,0,
+        0,647,638,1,0,0,0,647,639,1,0,0,0,647,646,1,0,0,0,648,77,1,0,0,0,
+        649,650,5,1,0,0,650,79,1,0,0,0,651,652,5,1,0,0,652,81,1,0,0,0,653,
+        654,5,1,0,0,654,83,1,0,0,0,655,656,5,131,0,0,656,658,3,114,57,0,
+        657,655,1,0,0,0,657,658,1,0,0,0,658,713,1,0,0,0,659,714,5,127,0,
+        0,660,714,5,128,0,0,661,663,5,199,0,0,662,661,1,0,0,0,662,663,1,
+        0,0,0,663,664,1,0,0,0,664,666,5,129,0,0,665,667,3,92,46,0,666,665,
+        1,0,0,0,666,667,1,0,0,0,667,714,1,0,0,0,668,669,5,123,0,0,669,714,
+        5,125,0,0,670,714,5,126,0,0,671,672,5,130,0,0,672,673,5,5,0,0,673,
+        674,3,94,47,0,674,675,5,6,0,0,675,714,1,0,0,0,676,677,5,132,0,0,
+        677,682,3,162,81,0,678,679,5,5,0,0,679,680,3,30,15,0,680,681,5,6,
+        0,0,681,683,1,0,0,0,682,678,1,0,0,0,682,683,1,0,0,0,683,687,1,0,
+        0,0,684,686,3,88,44,0,685,684,1,0,0,0,686,689,1,0,0,0,687,685,1,
+        0,0,0,687,688,1,0,0,0,688,714,1,0,0,0,689,687,1,0,0,0,690,694,5,
+        137,0,0,691,695,5,138,0,0,692,693,5,59,0,0,693,695,5,129,0,0,694,
+        691,1,0,0,0,694,692,1,0,0,0,695,696,1,0,0,0,696,697,5,78,0,0,697,
+        711,5,139,0,0,698,699,5,5,0,0,699,706,3,90,45,0,700,702,5,9,0,0,
+        701,700,1,0,0,0,701,702,1,0,0,0,702,703,1,0,0,0,703,705,3,90,45,
+        0,704,701,1,0,0,0,705,708,1,0,0,0,706,704,1,0,0,0,706,707,1,0,0,
+        0,707,709,1,0,0,0,708,706,1,0,0,0,709,710,5,6,0,0,710,712,1,0,0,
+        0,711,698,1,0,0,0,711,712,1,0,0,0,712,714,1,0,0,0,713,659,1,0,0,
+        0,713,660,1,0,0,0,713,662,1,0,0,0,713,668,1,0,0,0,713,670,1,0,0,
+        0,713,671,1,0,0,0,713,676,1,0,0,0,713,690,1,0,0,0,714,85,1,0,0,0,
+        715,716,5,131,0,0,716,718,3,114,57,0,717,715,1,0,0,0,717,718,1,0,
+        0,0,718,719,1,0,0,0,719,720,3,116,58,0,720,87,1,0,0,0,721,722,5,
+        174,0,0,722,729,7,6,0,0,723,730,5,133,0,0,724,730,5,134,0,0,725,
+        730,5,135,0,0,726,730,5,136,0,0,727,728,5,76,0,0,728,730,5,129,0,
+        0,729,723,1,0,0,0,729,724,1,0,0,0,729,725,1,0,0,0,729,726,1,0,0,
+        0,729,727,1,0,0,0,730,89,1,0,0,0,731,732,5,101,0,0,732,733,5,199,
+        0,0,733,742,3,102,51,0,734,735,5,102,0,0,735,736,5,59,0,0,736,742,
+        3,104,52,0,737,738,5,103,0,0,738,742,3,106,53,0,739,740,5,104,0,
+        0,740,742,3,108,54,0,741,731,1,0,0,0,741,734,1,0,0,0,741,737,1,0,
+        0,0,741,739,1,0,0,0,742,91,1,0,0,0,743,744,3,152,76,0,744,93,1,0,
+        0,0,745,746,3,152,76,0,746,95,1,0,0,0,747,748,5,81,0,0,748,749,5,
+        89,0,0,749,754,3,162,81,0,750,751,5,5,0,0,751,752,3,30,15,0,752,
+        753,5,6,0,0,753,755,1,0,0,0,754,750,1,0,0,0,754,755,1,0,0,0,755,
+        756,1,0,0,0,756,757,5,78,0,0,757,758,3,6,3,0,758,97,1,0,0,0,759,
+        761,5,81,0,0,760,762,5,126,0,0,761,760,1,0,0,0,761,762,1,0,0,0,762,
+        763,1,0,0,0,763,764,5,90,0,0,764,765,3,162,81,0,765,766,5,174,0,
+        0,766,767,3,162,81,0,767,768,5,5,0,0,768,773,3,40,20,0,769,770,5,
+        9,0,0,770,772,3,40,20,0,771,769,1,0,0,0,772,775,1,0,0,0,773,771,
+        1,0,0,0,773,774,1,0,0,0,774,776,1,0,0,0,775,773,1,0,0,0,776,777,
+        5,6,0,0,777,99,1,0,0,0,778,779,5,81,0,0,779,780,5,91,0,0,780,784,
+        5,232,0,0,781,782,5,101,0,0,782,783,5,199,0,0,783,785,3,102,51,0,
+        784,781,1,0,0,0,784,785,1,0,0,0,785,789,1,0,0,0,786,787,5,102,0,
+        0,787,788,5,59,0,0,788,790,3,104,52,0,789,786,1,0,0,0,789,790,1,
+        0,0,0,790,793,1,0,0,0,791,792,5,103,0,0,792,794,3,106,53,0,793,791,
+        1,0,0,0,793,794,1,0,0,0,794,797,1,0,0,0,795,796,5,104,0,0,796,798,
+        3,108,54,0,797,795,1,0,0,0,797,798,1,0,0,0,798,101,1,0,0,0,799,801,
+        5,14,0,0,800,799,1,0,0,0,800,801,1,0,0,0,801,802,1,0,0,0,802,803,
+        5,1,0,0,803,103,1,0,0,0,804,806,5,14,0,0,805,804,1,0,0,0,805,806,
+        1,0,0,0,806,807,1,0,0,0,807,808,5,1,0,0,808,105,1,0,0,0,809,811,
+        5,14,0,0,810,809,1,0,0,0,810,811,1,0,0,0,811,812,1,0,0,0,812,813,
+        5,1,0,0,813,107,1,0,0,0,814,816,5,14,0,0,815,814,1,0,0,0,815,816,
+        1,0,0,0,816,817,1,0,0,0,817,818,5,1,0,0,818,109,1,0,0,0,819,820,
+        5,82,0,0,820,821,5,88,0,0,821,822,3,162,81,0,822,823,3,112,56,0,
+        823,111,1,0,0,0,824,825,5,97,0,0,825,826,5,96,0,0,826,839,3,74,37,
+        0,827,828,5,83,0,0,828,829,5,96,0,0,829,839,3,166,83,0,830,831,5,
+        98,0,0,831,832,5,96,0,0,832,839,3,74,37,0,833,834,5,97,0,0,834,839,
+        3,86,43,0,835,836,5,83,0,0,836,837,5,131,0,0,837,839,3,114,57,0,
+        838,824,1,0,0,0,838,827,1,0,0,0,838,830,1,0,0,0,838,833,1,0,0,0,
+        838,835,1,0,0,0,839,113,1,0,0,0,840,841,5,232,0,0,841,115,1,0,0,
+        0,842,843,5,123,0,0,843,844,5,125,0,0,844,845,5,5,0,0,845,846,3,
+        30,15,0,846,847,5,6,0,0,847,878,1,0,0,0,848,849,5,126,0,0,849,850,
+        5,5,0,0,850,851,3,30,15,0,851,852,5,6,0,0,852,878,1,0,0,0,853,854,
+        5,124,0,0,854,855,5,125,0,0,855,856,5,5,0,0,856,857,3,30,15,0,857,
+        858,5,6,0,0,858,859,5,132,0,0,859,864,3,162,81,0,860,861,5,5,0,0,
+        861,862,3,30,15,0,862,863,5,6,0,0,863,865,1,0,0,0,864,860,1,0,0,
+        0,864,865,1,0,0,0,865,869,1,0,0,0,866,868,3,88,44,0,867,866,1,0,
+        0,0,868,871,1,0,0,0,869,867,1,0,0,0,869,870,1,0,0,0,870,878,1,0,
+        0,0,871,869,1,0,0,0,872,873,5,130,0,0,873,874,5,5,0,0,874,875,3,
+        94,47,0,875,876,5,6,0,0,876,878,1,0,0,0,877,842,1,0,0,0,877,848,
+        1,0,0,0,877,853,1,0,0,0,877,872,1,0,0,0,878,117,1,0,0,0,879,880,
+        5,83,0,0,880,881,7,7,0,0,881,882,3,120,60,0,882,119,1,0,0,0,883,
+        884,3,162,81,0,884,121,1,0,0,0,885,886,5,86,0,0,886,887,3,124,62,
+        0,887,888,5,174,0,0,888,889,3,128,64,0,889,890,3,120,60,0,890,891,
+        5,79,0,0,891,892,3,130,65,0,892,123,1,0,0,0,893,898,3,126,63,0,894,
+        895,5,9,0,0,895,897,3,126,63,0,896,894,1,0,0,0,897,900,1,0,0,0,898,
+        896,1,0,0,0,898,899,1,0,0,0,899,125,1,0,0,0,900,898,1,0,0,0,901,
+        902,7,8,0,0,902,127,1,0,0,0,903,904,7,9,0,0,904,129,1,0,0,0,905,
+        910,3,132,66,0,906,907,5,9,0,0,907,909,3,132,66,0,908,906,1,0,0,
+        0,909,912,1,0,0,0,910,908,1,0,0,0,910,911,1,0,0,0,911,131,1,0,0,
+        0,912,910,1,0,0,0,913,914,7,10,0,0,914,133,1,0,0,0,915,916,5,87,
+        0,0,916,917,3,124,62,0,917,918,5,174,0,0,918,919,3,128,64,0,919,
+        920,3,120,60,0,920,921,5,56,0,0,921,922,3,130,65,0,922,135,1,0,0,
+        0,923,925,5,183,0,0,924,926,5,187,0,0,925,924,1,0,0,0,925,926,1,
+        0,0,0,926,137,1,0,0,0,927,929,5,184,0,0,928,930,5,187,0,0,929,928,
+        1,0,0,0,929,930,1,0,0,0,930,934,1,0,0,0,931,932,5,79,0,0,932,933,
+        5,185,0,0,933,935,3,142,71,0,934,931,1,0,0,0,934,935,1,0,0,0,935,
+        139,1,0,0,0,936,938,5,182,0,0,937,939,7,11,0,0,938,937,1,0,0,0,938,
+        939,1,0,0,0,939,141,1,0,0,0,940,941,5,232,0,0,941,143,1,0,0,0,942,
+        943,5,76,0,0,943,944,3,146,73,0,944,945,5,12,0,0,945,946,3,148,74,
+        0,946,145,1,0,0,0,947,948,5,232,0,0,948,147,1,0,0,0,949,950,3,152,
+        76,0,950,149,1,0,0,0,951,952,5,99,0,0,952,953,5,174,0,0,953,954,
+        7,12,0,0,954,955,3,120,60,0,955,956,5,43,0,0,956,957,5,2,0,0,957,
+        151,1,0,0,0,958,959,6,76,-1,0,959,981,3,154,77,0,960,981,3,174,87,
+        0,961,981,3,192,96,0,962,981,3,202,101,0,963,964,5,5,0,0,964,969,
+        3,152,76,0,965,966,5,9,0,0,966,968,3,152,76,0,967,965,1,0,0,0,968,
+        971,1,0,0,0,969,967,1,0,0,0,969,970,1,0,0,0,970,972,1,0,0,0,971,
+        969,1,0,0,0,972,973,5,6,0,0,973,981,1,0,0,0,974,975,7,13,0,0,975,
+        981,3,152,76,11,976,977,7,14,0,0,977,981,3,204,102,0,978,979,5,49,
+        0,0,979,981,3,152,76,3,980,958,1,0,0,0,980,960,1,0,0,0,980,961,1,
+        0,0,0,980,962,1,0,0,0,980,963,1,0,0,0,980,974,1,0,0,0,980,976,1,
+        0,0,0,980,978,1,0,0,0,981,1025,1,0,0,0,982,983,10,10,0,0,983,984,
+        7,15,0,0,984,1024,3,152,76,11,985,986,10,9,0,0,986,987,7,16,0,0,
+        987,1024,3,152,76,10,988,989,10,7,0,0,989,990,7,17,0,0,990,991,3,
+        152,76,0,991,992,5,47,0,0,992,993,3,152,76,8,993,1024,1,0,0,0,994,
+        995,10,5,0,0,995,996,3,172,86,0,996,997,3,152,76,6,997,1024,1,0,
+        0,0,998,999,10,2,0,0,999,1000,5,47,0,0,1000,1024,3,152,76,3,1001,
+        1002,10,1,0,0,1002,1003,7,18,0,0,1003,1024,3,152,76,2,1004,1005,
+        10,8,0,0,1005,1006,7,19,0,0,1006,1024,5,128,0,0,1007,1008,10,6,0,
+        0,1008,1009,7,20,0,0,1009,1019,5,5,0,0,1010,1020,3,6,3,0,1011,1016,
+        3,152,76,0,1012,1013,5,9,0,0,1013,1015,3,152,76,0,1014,1012,1,0,
+        0,0,1015,1018,1,0,0,0,1016,1014,1,0,0,0,1016,1017,1,0,0,0,1017,1020,
+        1,0,0,0,1018,1016,1,0,0,0,1019,1010,1,0,0,0,1019,1011,1,0,0,0,1020,
+        1021,1,0,0,0,1021,1022,5,6,0,0,1022,1024,1,0,0,0,1023,982,1,0,0,
+        0,1023,985,1,0,0,0,1023,988,1,0,0,0,1023,994,1,0,0,0,1023,998,1,
+        0,0,0,1023,1001,1,0,0,0,1023,1004,1,0,0,0,1023,1007,1,0,0,0,1024,
+        1027,1,0,0,0,1025,1023,1,0,0,0,1025,1026,1,0,0,0,1026,153,1,0,0,
+        0,1027,1025,1,0,0,0,1028,1033,3,156,78,0,1029,1033,3,158,79,0,1030,
+        1033,3,168,84,0,1031,1033,3,204,102,0,1032,1028,1,0,0,0,1032,1029,
+        1,0,0,0,1032,1030,1,0,0,0,1032,1031,1,0,0,0,1033,155,1,0,0,0,1034,
+        1035,7,21,0,0,1035,157,1,0,0,0,1036,1037,3,160,80,0,1037,1038,5,
+        21,0,0,1038,1040,1,0,0,0,1039,1036,1,0,0,0,1039,1040,1,0,0,0,1040,
+        1041,1,0,0,0,1041,1042,3,166,83,0,1042,159,1,0,0,0,1043,1044,3,164,
+        82,0,1044,1045,5,21,0,0,1045,1047,1,0,0,0,1046,1043,1,0,0,0,1046,
+        1047,1,0,0,0,1047,1048,1,0,0,0,1048,1049,5,232,0,0,1049,161,1,0,
+        0,0,1050,1051,3,164,82,0,1051,1052,7,22,0,0,1052,1054,1,0,0,0,1053,
+        1050,1,0,0,0,1053,1054,1,0,0,0,1054,1055,1,0,0,0,1055,1056,5,232,
+        0,0,1056,163,1,0,0,0,1057,1058,5,232,0,0,1058,165,1,0,0,0,1059,1060,
+        5,232,0,0,1060,167,1,0,0,0,1061,1064,5,23,0,0,1062,1064,3,170,85,
+        0,1063,1061,1,0,0,0,1063,1062,1,0,0,0,1064,169,1,0,0,0,1065,1066,
+        5,11,0,0,1066,1069,5,232,0,0,1067,1068,5,21,0,0,1068,1070,5,232,
+        0,0,1069,1067,1,0,0,0,1069,1070,1,0,0,0,1070,1073,1,0,0,0,1071,1072,
+        5,11,0,0,1072,1074,5,232,0,0,1073,1071,1,0,0,0,1073,1074,1,0,0,0,
+        1074,171,1,0,0,0,1075,1076,7,23,0,0,1076,173,1,0,0,0,1077,1078,3,
+        176,88,0,1078,1080,5,5,0,0,1079,1081,7,0,0,0,1080,1079,1,0,0,0,1080,
+        1081,1,0,0,0,1081,1084,1,0,0,0,1082,1085,3,178,89,0,1083,1085,5,
+        15,0,0,1084,1082,1,0,0,0,1084,1083,1,0,0,0,1084,1085,1,0,0,0,1085,
+        1086,1,0,0,0,1086,1087,5,6,0,0,1087,1090,1,0,0,0,1088,1090,3,180,
+        90,0,1089,1077,1,0,0,0,1089,1088,1,0,0,0,1090,175,1,0,0,0,1091,1092,
+        7,24,0,0,1092,177,1,0,0,0,1093,1098,3,152,76,0,1094,1095,5,9,0,0,
+        1095,1097,3,152,76,0,1096,1094,1,0,0,0,1097,1100,1,0,0,0,1098,1096,
+        1,0,0,0,1098,1099,1,0,0,0,1099,179,1,0,0,0,1100,1098,1,0,0,0,1101,
+        1102,3,182,91,0,1102,1104,5,5,0,0,1103,1105,3,178,89,0,1104,1103,
+        1,0,0,0,1104,1105,1,0,0,0,1105,1106,1,0,0,0,1106,1107,5,6,0,0,1107,
+        1108,5,209,0,0,1108,1109,3,184,92,0,1109,181,1,0,0,0,1110,1111,7,
+        25,0,0,1111,183,1,0,0,0,1112,1123,5,5,0,0,1113,1114,5,95,0,0,1114,
+        1115,5,59,0,0,1115,1120,3,152,76,0,1116,1117,5,9,0,0,1117,1119,3,
+        152,76,0,1118,1116,1,0,0,0,1119,1122,1,0,0,0,1120,1118,1,0,0,0,1120,
+        1121,1,0,0,0,1121,1124,1,0,0,0,1122,1120,1,0,0,0,1123,1113,1,0,0,
+        0,1123,1124,1,0,0,0,1124,1135,1,0,0,0,1125,1126,5,61,0,0,1126,1127,
+        5,59,0,0,1127,1132,3,40,20,0,1128,1129,5,9,0,0,1129,1131,3,40,20,
+        0,1130,1128,1,0,0,0,1131,1134,1,0,0,0,1132,1130,1,0,0,0,1132,1133,
+        1,0,0,0,1133,1136,1,0,0,0,1134,1132,1,0,0,0,1135,1125,1,0,0,0,1135,
+        1136,1,0,0,0,1136,1137,1,0,0,0,1137,1139,7,26,0,0,1138,1140,3,186,
+        93,0,1139,1138,1,0,0,0,1139,1140,1,0,0,0,1140,1141,1,0,0,0,1141,
+        1142,5,6,0,0,1142,185,1,0,0,0,1143,1150,3,188,94,0,1144,1145,5,41,
+        0,0,1145,1146,3,188,94,0,1146,1147,5,47,0,0,1147,1148,3,190,95,0,
+        1148,1150,1,0,0,0,1149,1143,1,0,0,0,1149,1144,1,0,0,0,1150,187,1,
+        0,0,0,1151,1152,5,204,0,0,1152,1162,5,205,0,0,1153,1154,5,207,0,
+        0,1154,1162,5,208,0,0,1155,1156,3,152,76,0,1156,1157,5,205,0,0,1157,
+        1162,1,0,0,0,1158,1159,3,152,76,0,1159,1160,5,206,0,0,1160,1162,
+        1,0,0,0,1161,1151,1,0,0,0,1161,1153,1,0,0,0,1161,1155,1,0,0,0,1161,
+        1158,1,0,0,0,1162,189,1,0,0,0,1163,1164,5,204,0,0,1164,1174,5,206,
+        0,0,1165,1166,5,207,0,0,1166,1174,5,208,0,0,1167,1168,3,152,76,0,
+        1168,1169,5,205,0,0,1169,1174,1,0,0,0,1170,1171,3,152,76,0,1171,
+        1172,5,206,0,0,1172,1174,1,0,0,0,1173,1163,1,0,0,0,1173,1165,1,0,
+        0,0,1173,1167,1,0,0,0,1173,1170,1,0,0,0,1174,191,1,0,0,0,1175,1177,
+        5,147,0,0,1176,1178,3,152,76,0,1177,1176,1,0,0,0,1177,1178,1,0,0,
+        0,1178,1180,1,0,0,0,1179,1181,3,194,97,0,1180,1179,1,0,0,0,1181,
+        1182,1,0,0,0,1182,1180,1,0,0,0,1182,1183,1,0,0,0,1183,1186,1,0,0,
+        0,1184,1185,5,150,0,0,1185,1187,3,200,100,0,1186,1184,1,0,0,0,1186,
+        1187,1,0,0,0,1187,1188,1,0,0,0,1188,1189,5,151,0,0,1189,193,1,0,
+        0,0,1190,1191,5,148,0,0,1191,1192,3,196,98,0,1192,1193,5,149,0,0,
+        1193,1194,3,198,99,0,1194,195,1,0,0,0,1195,1196,3,152,76,0,1196,
+        197,1,0,0,0,1197,1198,3,152,76,0,1198,199,1,0,0,0,1199,1200,3,152,
+        76,0,1200,201,1,0,0,0,1201,1202,5,152,0,0,1202,1203,5,5,0,0,1203,
+        1204,3,152,76,0,1204,1205,5,78,0,0,1205,1206,3,76,38,0,1206,1207,
+        5,6,0,0,1207,203,1,0,0,0,1208,1209,5,5,0,0,1209,1210,3,6,3,0,1210,
+        1211,5,6,0,0,1211,205,1,0,0,0,128,209,230,236,245,248,254,259,263,
+        268,272,276,280,287,291,295,298,304,314,320,325,328,334,337,342,
+        346,349,351,364,368,379,388,398,408,413,421,433,438,446,456,467,
+        472,483,489,492,497,500,508,515,526,534,543,554,561,568,579,583,
+        593,600,607,614,621,628,635,644,647,657,662,666,682,687,694,701,
+        706,711,713,717,729,741,754,761,773,784,789,793,797,800,805,810,
+        815,838,864,869,877,898,910,925,929,934,938,969,980,1016,1019,1023,
+        1025,1032,1039,1046,1053,1063,1069,1073,1080,1084,1089,1098,1104,
+        1120,1123,1132,1135,1139,1149,1161,1173,1177,1182,1186
     ]
 
 class db2_parser ( Parser ):
@@ -386,33 +488,37 @@ class db2_parser ( Parser ):
     sharedContextCache = PredictionContextCache()
 
     literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "<INVALID>", "'('", "')'", "'['", "']'", 
-                     "','", "';'", "':'", "'='", "'+'", "'-'", "'*'", "'/'", 
-                     "'%'", "'#'", "'@'", "'$'", "'.'", "'_'", "'?'", "'!'", 
-                     "'~'", "'^'", "'&'", "'|'", "'\\'", "'`'", "<INVALID>", 
-                     "'>'", "'<'", "'>='", "'<='", "'LIKE'", "<INVALID>", 
-                     "'IN'", "<INVALID>", "'BETWEEN'", "<INVALID>", "'IS'", 
-                     "<INVALID>", "'EXISTS'", "<INVALID>", "'AND'", "'OR'", 
-                     "'NOT'", "'XOR'", "<INVALID>", "<INVALID>", "<INVALID>", 
-                     "<INVALID>", "'SELECT'", "'FROM'", "'WHERE'", "'GROUP'", 
-                     "'BY'", "'HAVING'", "'ORDER'", "'ASC'", "'DESC'", "'LIMIT'", 
+                     "<INVALID>", "'('", "')'", "'['", "']'", "','", "';'", 
+                     "':'", "'='", "'+'", "'-'", "'*'", "'/'", "'%'", "'#'", 
+                     "'@'", "'$'", "'.'", "'_'", "'?'", "'!'", "'~'", "'^'", 
+                     "'&'", "'||'", "'|'", "'\\'", "'`'", "<INVALID>", "'>'", 
+                     "'<'", "'>='", "'<='", "'LIKE'", "<INVALID>", "'IN'", 
+                     "<INVALID>", "'BETWEEN'", "<INVALID>", "'IS'", "<INVALID>", 
+                     "'EXISTS'", "<INVALID>", "'AND'", "'OR'", "'NOT'", 
+                     "'XOR'", "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "'SELECT'", "'FROM'", "'WHERE'", "'GROUP'", "'BY'", 
+                     "'HAVING'", "'ORDER'", "'ASC'", "'DESC'", "'LIMIT'", 
                      "'OFFSET'", "'FETCH'", "'FIRST'", "'NEXT'", "'ROWS'", 
                      "'ONLY'", "'INSERT'", "'UPDATE'", "'DELETE'", "'MERGE'", 
-                     "'VALUES'", "'SET'", "'INTO'", "'CREATE'", "'ALTER'", 
-                     "'DROP'", "'TRUNCATE'", "'RENAME'", "'GRANT'", "'REVOKE'", 
-                     "'TABLE'", "'VIEW'", "'INDEX'", "'SEQUENCE'", "'SCHEMA'", 
-                     "'DATABASE'", "'TABLESPACE'", "'PARTITION'", "<INVALID>", 
-                     "'SMALLINT'", "'BIGINT'", "<INVALID>", "'REAL'", "<INVALID>", 
-                     "'FLOAT'", "<INVALID>", "<INVALID>", "<INVALID>", "'GRAPHIC'", 
-                     "<INVALID>", "<INVALID>", "<INVALID>", "'DATE'", "'TIME'", 
-                     "'TIMESTAMP'", "'XML'", "'PRIMARY'", "'FOREIGN'", "'KEY'", 
-                     "'UNIQUE'", "<INVALID>", "'NULL'", "'DEFAULT'", "'CHECK'", 
-                     "'CONSTRAINT'", "'REFERENCES'", "'CASCADE'", "'RESTRICT'", 
-                     "<INVALID>", "<INVALID>", "'COUNT'", "'SUM'", "<INVALID>", 
-                     "'MIN'", "'MAX'", "'COALESCE'", "'NULLIF'", "'CASE'", 
-                     "'WHEN'", "'THEN'", "'ELSE'", "'END'", "'CAST'", "'CONVERT'", 
-                     "<INVALID>", "<INVALID>", "'UPPER'", "'LOWER'", "'TRIM'", 
-                     "'LTRIM'", "'RTRIM'", "'REPLACE'", "'TRANSLATE'", "<INVALID>", 
+                     "'VALUES'", "'SET'", "'INTO'", "'AS'", "'TO'", "'MATCHED'", 
+                     "'CREATE'", "'ALTER'", "'DROP'", "'TRUNCATE'", "'RENAME'", 
+                     "'GRANT'", "'REVOKE'", "'TABLE'", "'VIEW'", "'INDEX'", 
+                     "'SEQUENCE'", "'SCHEMA'", "'DATABASE'", "'TABLESPACE'", 
+                     "'PARTITION'", "'COLUMN'", "'ADD'", "'MODIFY'", "'COMMENT'", 
+                     "'PUBLIC'", "'START'", "'INCREMENT'", "'MINVALUE'", 
+                     "'MAXVALUE'", "<INVALID>", "'SMALLINT'", "'BIGINT'", 
+                     "<INVALID>", "'REAL'", "<INVALID>", "'FLOAT'", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "'GRAPHIC'", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "'DATE'", "'TIME'", "'TIMESTAMP'", 
+                     "'XML'", "'PRIMARY'", "'FOREIGN'", "'KEY'", "'UNIQUE'", 
+                     "<INVALID>", "'NULL'", "'DEFAULT'", "'CHECK'", "'CONSTRAINT'", 
+                     "'REFERENCES'", "'CASCADE'", "'RESTRICT'", "<INVALID>", 
+                     "<INVALID>", "'GENERATED'", "'ALWAYS'", "'IDENTITY'", 
+                     "'COUNT'", "'SUM'", "<INVALID>", "'MIN'", "'MAX'", 
+                     "'COALESCE'", "'NULLIF'", "'CASE'", "'WHEN'", "'THEN'", 
+                     "'ELSE'", "'END'", "'CAST'", "'CONVERT'", "<INVALID>", 
+                     "<INVALID>", "'UPPER'", "'LOWER'", "'TRIM'", "'LTRIM'", 
+                     "'RTRIM'", "'REPLACE'", "'TRANSLATE'", "<INVALID>", 
                      "'LOCATE'", "'JOIN'", "'INNER'", "'LEFT'", "'RIGHT'", 
                      "'FULL'", "'OUTER'", "'CROSS'", "'NATURAL'", "'USING'", 
                      "'ON'", "'UNION'", "'INTERSECT'", "'EXCEPT'", "'ALL'", 
@@ -430,48 +536,49 @@ class db2_parser ( Parser ):
                      "'NTH_VALUE'", "'PERCENT_RANK'", "'CUME_DIST'", "'PERCENTILE_CONT'", 
                      "'PERCENTILE_DISC'" ]
 
-    symbolicNames = [ "<INVALID>", "IDENTIFIER", "NUMBER", "STRING", "DOUBLE_QUOTED_STRING", 
+    symbolicNames = [ "<INVALID>", "NUMBER", "STRING", "DOUBLE_QUOTED_STRING", 
                       "HEX_STRING", "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", 
                       "COMMA", "SEMICOLON", "COLON", "EQUALS", "PLUS", "MINUS", 
                       "ASTERISK", "SLASH", "PERCENT", "HASH", "AT", "DOLLAR", 
                       "DOT", "UNDERSCORE", "QUESTION", "EXCLAMATION", "TILDE", 
-                      "CARET", "AMPERSAND", "PIPE", "BACKSLASH", "GRAVE", 
-                      "NE", "GT", "LT", "GE", "LE", "LIKE", "NOT_LIKE", 
+                      "CARET", "AMPERSAND", "CONCAT", "PIPE", "BACKSLASH", 
+                      "GRAVE", "NE", "GT", "LT", "GE", "LE", "LIKE", "NOT_LIKE", 
                       "IN", "NOT_IN", "BETWEEN", "NOT_BETWEEN", "IS", "IS_NOT", 
                       "EXISTS", "NOT_EXISTS", "AND", "OR", "NOT", "XOR", 
-                      "POWER", "WS", "COMMENT", "LINE_COMMENT", "SELECT", 
+                      "POWER", "WS", "BLOCK_COMMENT", "LINE_COMMENT", "SELECT", 
                       "FROM", "WHERE", "GROUP", "BY", "HAVING", "ORDER", 
                       "ASC", "DESC", "LIMIT", "OFFSET", "FETCH", "FIRST", 
                       "NEXT", "ROWS", "ONLY", "INSERT", "UPDATE", "DELETE", 
-                      "MERGE", "VALUES", "SET", "INTO", "CREATE", "ALTER", 
-                      "DROP", "TRUNCATE", "RENAME", "GRANT", "REVOKE", "TABLE", 
-                      "VIEW", "INDEX", "SEQUENCE", "SCHEMA", "DATABASE", 
-                      "TABLESPACE", "PARTITION", "INTEGER", "SMALLINT", 
-                      "BIGINT", "DECIMAL", "REAL", "DOUBLE", "FLOAT", "CHAR", 
-                      "VARCHAR", "CLOB", "GRAPHIC", "VARGRAPHIC", "DBCLOB", 
-                      "BLOB", "DATE", "TIME", "TIMESTAMP", "XML", "PRIMARY", 
-                      "FOREIGN", "KEY", "UNIQUE", "NOT_NULL", "NULL", "DEFAULT", 
-                      "CHECK", "CONSTRAINT", "REFERENCES", "CASCADE", "RESTRICT", 
-                      "SET_NULL", "NO_ACTION", "COUNT", "SUM", "AVG", "MIN", 
-                      "MAX", "COALESCE", "NULLIF", "CASE", "WHEN", "THEN", 
-                      "ELSE", "END", "CAST", "CONVERT", "SUBSTRING", "LENGTH", 
-                      "UPPER", "LOWER", "TRIM", "LTRIM", "RTRIM", "REPLACE", 
-                      "TRANSLATE", "POSITION", "LOCATE", "JOIN", "INNER", 
-                      "LEFT", "RIGHT", "FULL", "OUTER", "CROSS", "NATURAL", 
-                      "USING", "ON", "UNION", "INTERSECT", "EXCEPT", "ALL", 
-                      "DISTINCT", "ANY", "SOME", "BEGIN", "COMMIT", "ROLLBACK", 
-                      "SAVEPOINT", "RELEASE", "WORK", "TRANSACTION", "CONNECT", 
-                      "DISCONNECT", "RESET", "CURRENT_DATE", "CURRENT_TIME", 
-                      "CURRENT_TIMESTAMP", "CURRENT_USER", "USER", "SYSTEM_USER", 
-                      "SESSION_USER", "WITH", "RECURSIVE", "LATERAL", "RANGE", 
-                      "GROUPS", "UNBOUNDED", "PRECEDING", "FOLLOWING", "CURRENT", 
-                      "ROW", "OVER", "WINDOW", "FRAME", "EXCLUDE", "TIES", 
-                      "RESPECT", "IGNORE", "NULLS", "LAST", "KEEP", "DENSE_RANK", 
-                      "RANK", "ROW_NUMBER", "NTILE", "LAG", "LEAD", "FIRST_VALUE", 
-                      "LAST_VALUE", "NTH_VALUE", "PERCENT_RANK", "CUME_DIST", 
-                      "PERCENTILE_CONT", "PERCENTILE_DISC", "AS", "MATCHED", 
-                      "START", "INCREMENT", "MINVALUE", "MAXVALUE", "ADD", 
-                      "COLUMN", "MODIFY", "TO", "PUBLIC", "EQ" ]
+                      "MERGE", "VALUES", "SET", "INTO", "AS", "TO", "MATCHED", 
+                      "CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME", "GRANT", 
+                      "REVOKE", "TABLE", "VIEW", "INDEX", "SEQUENCE", "SCHEMA", 
+                      "DATABASE", "TABLESPACE", "PARTITION", "COLUMN", "ADD", 
+                      "MODIFY", "COMMENT", "PUBLIC", "START", "INCREMENT", 
+                      "MINVALUE", "MAXVALUE", "INTEGER", "SMALLINT", "BIGINT", 
+                      "DECIMAL", "REAL", "DOUBLE", "FLOAT", "CHAR", "VARCHAR", 
+                      "CLOB", "GRAPHIC", "VARGRAPHIC", "DBCLOB", "BLOB", 
+                      "DATE", "TIME", "TIMESTAMP", "XML", "PRIMARY", "FOREIGN", 
+                      "KEY", "UNIQUE", "NOT_NULL", "NULL", "DEFAULT", "CHECK", 
+                      "CONSTRAINT", "REFERENCES", "CASCADE", "RESTRICT", 
+                      "SET_NULL", "NO_ACTION", "GENERATED", "ALWAYS", "IDENTITY", 
+                      "COUNT", "SUM", "AVG", "MIN", "MAX", "COALESCE", "NULLIF", 
+                      "CASE", "WHEN", "THEN", "ELSE", "END", "CAST", "CONVERT", 
+                      "SUBSTRING", "LENGTH", "UPPER", "LOWER", "TRIM", "LTRIM", 
+                      "RTRIM", "REPLACE", "TRANSLATE", "POSITION", "LOCATE", 
+                      "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "OUTER", 
+                      "CROSS", "NATURAL", "USING", "ON", "UNION", "INTERSECT", 
+                      "EXCEPT", "ALL", "DISTINCT", "ANY", "SOME", "BEGIN", 
+                      "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "WORK", 
+                      "TRANSACTION", "CONNECT", "DISCONNECT", "RESET", "CURRENT_DATE", 
+                      "CURRENT_TIME", "CURRENT_TIMESTAMP", "CURRENT_USER", 
+                      "USER", "SYSTEM_USER", "SESSION_USER", "WITH", "RECURSIVE", 
+                      "LATERAL", "RANGE", "GROUPS", "UNBOUNDED", "PRECEDING", 
+                      "FOLLOWING", "CURRENT", "ROW", "OVER", "WINDOW", "FRAME", 
+                      "EXCLUDE", "TIES", "RESPECT", "IGNORE", "NULLS", "LAST", 
+                      "KEEP", "DENSE_RANK", "RANK", "ROW_NUMBER", "NTILE", 
+                      "LAG", "LEAD", "FIRST_VALUE", "LAST_VALUE", "NTH_VALUE", 
+                      "PERCENT_RANK", "CUME_DIST", "PERCENTILE_CONT", "PERCENTILE_DISC", 
+                      "IDENTIFIER" ]
 
     RULE_sqlScript = 0
     RULE_sqlStatement = 1
@@ -509,69 +616,73 @@ class db2_parser ( Parser ):
     RULE_insertClause = 33
     RULE_createStatement = 34
     RULE_createTableStatement = 35
-    RULE_columnDefinition = 36
-    RULE_dataType = 37
-    RULE_precision = 38
-    RULE_scale = 39
-    RULE_length = 40
-    RULE_columnConstraint = 41
-    RULE_defaultValue = 42
-    RULE_checkCondition = 43
-    RULE_createViewStatement = 44
-    RULE_createIndexStatement = 45
-    RULE_createSequenceStatement = 46
-    RULE_startValue = 47
-    RULE_incrementValue = 48
-    RULE_minValue = 49
-    RULE_maxValue = 50
-    RULE_alterStatement = 51
-    RULE_alterAction = 52
-    RULE_constraintName = 53
-    RULE_constraintDefinition = 54
-    RULE_dropStatement = 55
-    RULE_objectName = 56
-    RULE_grantStatement = 57
-    RULE_privilegeList = 58
-    RULE_privilege = 59
-    RULE_objectType = 60
-    RULE_granteeList = 61
-    RULE_grantee = 62
-    RULE_revokeStatement = 63
-    RULE_commitStatement = 64
-    RULE_rollbackStatement = 65
-    RULE_beginStatement = 66
-    RULE_savepointName = 67
-    RULE_setStatement = 68
-    RULE_optionName = 69
-    RULE_optionValue = 70
-    RULE_commentStatement = 71
-    RULE_expression = 72
-    RULE_primaryExpression = 73
-    RULE_literal = 74
-    RULE_columnReference = 75
-    RULE_tableName = 76
-    RULE_columnName = 77
-    RULE_parameter = 78
-    RULE_operator = 79
-    RULE_arithmeticOperator = 80
-    RULE_comparisonOperator = 81
-    RULE_logicalOperator = 82
-    RULE_functionCall = 83
-    RULE_functionName = 84
-    RULE_argumentList = 85
-    RULE_windowFunction = 86
-    RULE_windowFunctionName = 87
-    RULE_windowSpecification = 88
-    RULE_frameSpecification = 89
-    RULE_frameStart = 90
-    RULE_frameEnd = 91
-    RULE_caseExpression = 92
-    RULE_whenClause = 93
-    RULE_whenExpression = 94
-    RULE_thenExpression = 95
-    RULE_elseExpression = 96
-    RULE_castExpression = 97
-    RULE_subquery = 98
+    RULE_tableElement = 36
+    RULE_columnDefinition = 37
+    RULE_dataType = 38
+    RULE_precision = 39
+    RULE_scale = 40
+    RULE_length = 41
+    RULE_columnConstraint = 42
+    RULE_tableConstraint = 43
+    RULE_referentialAction = 44
+    RULE_identityOption = 45
+    RULE_defaultValue = 46
+    RULE_checkCondition = 47
+    RULE_createViewStatement = 48
+    RULE_createIndexStatement = 49
+    RULE_createSequenceStatement = 50
+    RULE_startValue = 51
+    RULE_incrementValue = 52
+    RULE_minValue = 53
+    RULE_maxValue = 54
+    RULE_alterStatement = 55
+    RULE_alterAction = 56
+    RULE_constraintName = 57
+    RULE_constraintDefinition = 58
+    RULE_dropStatement = 59
+    RULE_objectName = 60
+    RULE_grantStatement = 61
+    RULE_privilegeList = 62
+    RULE_privilege = 63
+    RULE_objectType = 64
+    RULE_granteeList = 65
+    RULE_grantee = 66
+    RULE_revokeStatement = 67
+    RULE_commitStatement = 68
+    RULE_rollbackStatement = 69
+    RULE_beginStatement = 70
+    RULE_savepointName = 71
+    RULE_setStatement = 72
+    RULE_optionName = 73
+    RULE_optionValue = 74
+    RULE_commentStatement = 75
+    RULE_expression = 76
+    RULE_primaryExpression = 77
+    RULE_literal = 78
+    RULE_columnReference = 79
+    RULE_tableQualifier = 80
+    RULE_tableName = 81
+    RULE_schemaName = 82
+    RULE_columnName = 83
+    RULE_parameter = 84
+    RULE_hostVariable = 85
+    RULE_comparisonOperator = 86
+    RULE_functionCall = 87
+    RULE_functionName = 88
+    RULE_argumentList = 89
+    RULE_windowFunction = 90
+    RULE_windowFunctionName = 91
+    RULE_windowSpecification = 92
+    RULE_frameSpecification = 93
+    RULE_frameStart = 94
+    RULE_frameEnd = 95
+    RULE_caseExpression = 96
+    RULE_whenClause = 97
+    RULE_whenExpression = 98
+    RULE_thenExpression = 99
+    RULE_elseExpression = 100
+    RULE_castExpression = 101
+    RULE_subquery = 102
 
     ruleNames =  [ "sqlScript", "sqlStatement", "semicolon", "selectStatement", 
                    "selectList", "selectItem", "alias", "tableExpression", 
@@ -582,53 +693,56 @@ class db2_parser ( Parser ):
                    "insertStatement", "valueList", "arguments", "updateStatement", 
                    "setClause", "deleteStatement", "mergeStatement", "mergeCondition", 
                    "updateClause", "insertClause", "createStatement", "createTableStatement", 
-                   "columnDefinition", "dataType", "precision", "scale", 
-                   "length", "columnConstraint", "defaultValue", "checkCondition", 
-                   "createViewStatement", "createIndexStatement", "createSequenceStatement", 
-                   "startValue", "incrementValue", "minValue", "maxValue", 
-                   "alterStatement", "alterAction", "constraintName", "constraintDefinition", 
-                   "dropStatement", "objectName", "grantStatement", "privilegeList", 
-                   "privilege", "objectType", "granteeList", "grantee", 
-                   "revokeStatement", "commitStatement", "rollbackStatement", 
-                   "beginStatement", "savepointName", "setStatement", "optionName", 
-                   "optionValue", "commentStatement", "expression", "primaryExpression", 
-                   "literal", "columnReference", "tableName", "columnName", 
-                   "parameter", "operator", "arithmeticOperator", "comparisonOperator", 
-                   "logicalOperator", "functionCall", "functionName", "argumentList", 
-                   "windowFunction", "windowFunctionName", "windowSpecification", 
-                   "frameSpecification", "frameStart", "frameEnd", "caseExpression", 
-                   "whenClause", "whenExpression", "thenExpression", "elseExpression", 
-                   "castExpression", "subquery" ]
+                   "tableElement", "columnDefinition", "dataType", "precision", 
+                   "scale", "length", "columnConstraint", "tableConstraint", 
+                   "referentialAction", "identityOption", "defaultValue", 
+                   "checkCondition", "createViewStatement", "createIndexStatement", 
+                   "createSequenceStatement", "startValue", "incrementValue", 
+                   "minValue", "maxValue", "alterStatement", "alterAction", 
+                   "constraintName", "constraintDefinition", "dropStatement", 
+                   "objectName", "grantStatement", "privilegeList", "privilege", 
+                   "objectType", "granteeList", "grantee", "revokeStatement", 
+                   "commitStatement", "rollbackStatement", "beginStatement", 
+                   "savepointName", "setStatement", "optionName", "optionValue", 
+                   "commentStatement", "expression", "primaryExpression", 
+                   "literal", "columnReference", "tableQualifier", "tableName", 
+                   "schemaName", "columnName", "parameter", "hostVariable", 
+                   "comparisonOperator", "functionCall", "functionName", 
+                   "argumentList", "windowFunction", "windowFunctionName", 
+                   "windowSpecification", "frameSpecification", "frameStart", 
+                   "frameEnd", "caseExpression", "whenClause", "whenExpression", 
+                   "thenExpression", "elseExpression", "castExpression", 
+                   "subquery" ]
 
     EOF = Token.EOF
-    IDENTIFIER=1
-    NUMBER=2
-    STRING=3
-    DOUBLE_QUOTED_STRING=4
-    HEX_STRING=5
-    LPAREN=6
-    RPAREN=7
-    LBRACKET=8
-    RBRACKET=9
-    COMMA=10
-    SEMICOLON=11
-    COLON=12
-    EQUALS=13
-    PLUS=14
-    MINUS=15
-    ASTERISK=16
-    SLASH=17
-    PERCENT=18
-    HASH=19
-    AT=20
-    DOLLAR=21
-    DOT=22
-    UNDERSCORE=23
-    QUESTION=24
-    EXCLAMATION=25
-    TILDE=26
-    CARET=27
-    AMPERSAND=28
+    NUMBER=1
+    STRING=2
+    DOUBLE_QUOTED_STRING=3
+    HEX_STRING=4
+    LPAREN=5
+    RPAREN=6
+    LBRACKET=7
+    RBRACKET=8
+    COMMA=9
+    SEMICOLON=10
+    COLON=11
+    EQUALS=12
+    PLUS=13
+    MINUS=14
+    ASTERISK=15
+    SLASH=16
+    PERCENT=17
+    HASH=18
+    AT=19
+    DOLLAR=20
+    DOT=21
+    UNDERSCORE=22
+    QUESTION=23
+    EXCLAMATION=24
+    TILDE=25
+    CARET=26
+    AMPERSAND=27
+    CONCAT=28
     PIPE=29
     BACKSLASH=30
     GRAVE=31
@@ -653,7 +767,7 @@ class db2_parser ( Parser ):
     XOR=50
     POWER=51
     WS=52
-    COMMENT=53
+    BLOCK_COMMENT=53
     LINE_COMMENT=54
     SELECT=55
     FROM=56
@@ -678,157 +792,161 @@ class db2_parser ( Parser ):
     VALUES=75
     SET=76
     INTO=77
-    CREATE=78
-    ALTER=79
-    DROP=80
-    TRUNCATE=81
-    RENAME=82
-    GRANT=83
-    REVOKE=84
-    TABLE=85
-    VIEW=86
-    INDEX=87
-    SEQUENCE=88
-    SCHEMA=89
-    DATABASE=90
-    TABLESPACE=91
-    PARTITION=92
-    INTEGER=93
-    SMALLINT=94
-    BIGINT=95
-    DECIMAL=96
-    REAL=97
-    DOUBLE=98
-    FLOAT=99
-    CHAR=100
-    VARCHAR=101
-    CLOB=102
-    GRAPHIC=103
-    VARGRAPHIC=104
-    DBCLOB=105
-    BLOB=106
-    DATE=107
-    TIME=108
-    TIMESTAMP=109
-    XML=110
-    PRIMARY=111
-    FOREIGN=112
-    KEY=113
-    UNIQUE=114
-    NOT_NULL=115
-    NULL=116
-    DEFAULT=117
-    CHECK=118
-    CONSTRAINT=119
-    REFERENCES=120
-    CASCADE=121
-    RESTRICT=122
-    SET_NULL=123
-    NO_ACTION=124
-    COUNT=125
-    SUM=126
-    AVG=127
-    MIN=128
-    MAX=129
-    COALESCE=130
-    NULLIF=131
-    CASE=132
-    WHEN=133
-    THEN=134
-    ELSE=135
-    END=136
-    CAST=137
-    CONVERT=138
-    SUBSTRING=139
-    LENGTH=140
-    UPPER=141
-    LOWER=142
-    TRIM=143
-    LTRIM=144
-    RTRIM=145
-    REPLACE=146
-    TRANSLATE=147
-    POSITION=148
-    LOCATE=149
-    JOIN=150
-    INNER=151
-    LEFT=152
-    RIGHT=153
-    FULL=154
-    OUTER=155
-    CROSS=156
-    NATURAL=157
-    USING=158
-    ON=159
-    UNION=160
-    INTERSECT=161
-    EXCEPT=162
-    ALL=163
-    DISTINCT=164
-    ANY=165
-    SOME=166
-    BEGIN=167
-    COMMIT=168
-    ROLLBACK=169
-    SAVEPOINT=170
-    RELEASE=171
-    WORK=172
-    TRANSACTION=173
-    CONNECT=174
-    DISCONNECT=175
-    RESET=176
-    CURRENT_DATE=177
-    CURRENT_TIME=178
-    CURRENT_TIMESTAMP=179
-    CURRENT_USER=180
-    USER=181
-    SYSTEM_USER=182
-    SESSION_USER=183
-    WITH=184
-    RECURSIVE=185
-    LATERAL=186
-    RANGE=187
-    GROUPS=188
-    UNBOUNDED=189
-    PRECEDING=190
-    FOLLOWING=191
-    CURRENT=192
-    ROW=193
-    OVER=194
-    WINDOW=195
-    FRAME=196
-    EXCLUDE=197
-    TIES=198
-    RESPECT=199
-    IGNORE=200
-    NULLS=201
-    LAST=202
-    KEEP=203
-    DENSE_RANK=204
-    RANK=205
-    ROW_NUMBER=206
-    NTILE=207
-    LAG=208
-    LEAD=209
-    FIRST_VALUE=210
-    LAST_VALUE=211
-    NTH_VALUE=212
-    PERCENT_RANK=213
-    CUME_DIST=214
-    PERCENTILE_CONT=215
-    PERCENTILE_DISC=216
-    AS=217
-    MATCHED=218
-    START=219
-    INCREMENT=220
-    MINVALUE=221
-    MAXVALUE=222
-    ADD=223
-    COLUMN=224
-    MODIFY=225
-    TO=226
-    PUBLIC=227
-    EQ=228
+    AS=78
+    TO=79
+    MATCHED=80
+    CREATE=81
+    ALTER=82
+    DROP=83
+    TRUNCATE=84
+    RENAME=85
+    GRANT=86
+    REVOKE=87
+    TABLE=88
+    VIEW=89
+    INDEX=90
+    SEQUENCE=91
+    SCHEMA=92
+    DATABASE=93
+    TABLESPACE=94
+    PARTITION=95
+    COLUMN=96
+    ADD=97
+    MODIFY=98
+    COMMENT=99
+    PUBLIC=100
+    START=101
+    INCREMENT=102
+    MINVALUE=103
+    MAXVALUE=104
+    INTEGER=105
+    SMALLINT=106
+    BIGINT=107
+    DECIMAL=108
+    REAL=109
+    DOUBLE=110
+    FLOAT=111
+    CHAR=112
+    VARCHAR=113
+    CLOB=114
+    GRAPHIC=115
+    VARGRAPHIC=116
+    DBCLOB=117
+    BLOB=118
+    DATE=119
+    TIME=120
+    TIMESTAMP=121
+    XML=122
+    PRIMARY=123
+    FOREIGN=124
+    KEY=125
+    UNIQUE=126
+    NOT_NULL=127
+    NULL=128
+    DEFAULT=129
+    CHECK=130
+    CONSTRAINT=131
+    REFERENCES=132
+    CASCADE=133
+    RESTRICT=134
+    SET_NULL=135
+    NO_ACTION=136
+    GENERATED=137
+    ALWAYS=138
+    IDENTITY=139
+    COUNT=140
+    SUM=141
+    AVG=142
+    MIN=143
+    MAX=144
+    COALESCE=145
+    NULLIF=146
+    CASE=147
+    WHEN=148
+    THEN=149
+    ELSE=150
+    END=151
+    CAST=152
+    CONVERT=153
+    SUBSTRING=154
+    LENGTH=155
+    UPPER=156
+    LOWER=157
+    TRIM=158
+    LTRIM=159
+    RTRIM=160
+    REPLACE=161
+    TRANSLATE=162
+    POSITION=163
+    LOCATE=164
+    JOIN=165
+    INNER=166
+    LEFT=167
+    RIGHT=168
+    FULL=169
+    OUTER=170
+    CROSS=171
+    NATURAL=172
+    USING=173
+    ON=174
+    UNION=175
+    INTERSECT=176
+    EXCEPT=177
+    ALL=178
+    DISTINCT=179
+    ANY=180
+    SOME=181
+    BEGIN=182
+    COMMIT=183
+    ROLLBACK=184
+    SAVEPOINT=185
+    RELEASE=186
+    WORK=187
+    TRANSACTION=188
+    CONNECT=189
+    DISCONNECT=190
+    RESET=191
+    CURRENT_DATE=192
+    CURRENT_TIME=193
+    CURRENT_TIMESTAMP=194
+    CURRENT_USER=195
+    USER=196
+    SYSTEM_USER=197
+    SESSION_USER=198
+    WITH=199
+    RECURSIVE=200
+    LATERAL=201
+    RANGE=202
+    GROUPS=203
+    UNBOUNDED=204
+    PRECEDING=205
+    FOLLOWING=206
+    CURRENT=207
+    ROW=208
+    OVER=209
+    WINDOW=210
+    FRAME=211
+    EXCLUDE=212
+    TIES=213
+    RESPECT=214
+    IGNORE=215
+    NULLS=216
+    LAST=217
+    KEEP=218
+    DENSE_RANK=219
+    RANK=220
+    ROW_NUMBER=221
+    NTILE=222
+    LAG=223
+    LEAD=224
+    FIRST_VALUE=225
+    LAST_VALUE=226
+    NTH_VALUE=227
+    PERCENT_RANK=228
+    CUME_DIST=229
+    PERCENTILE_CONT=230
+    PERCENTILE_DISC=231
+    IDENTIFIER=232
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -883,17 +1001,17 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 201
+            self.state = 209
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 45035996273707008) != 0) or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & 13231) != 0) or ((((_la - 167)) & ~0x3f) == 0 and ((1 << (_la - 167)) & 7) != 0):
-                self.state = 198
+            while _la==10 or _la==55 or ((((_la - 71)) & ~0x3f) == 0 and ((1 << (_la - 71)) & 268540975) != 0) or ((((_la - 182)) & ~0x3f) == 0 and ((1 << (_la - 182)) & 7) != 0):
+                self.state = 206
                 self.sqlStatement()
-                self.state = 203
+                self.state = 211
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 204
+            self.state = 212
             self.match(db2_parser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -1000,87 +1118,87 @@ class db2_parser ( Parser ):
         localctx = db2_parser.SqlStatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_sqlStatement)
         try:
-            self.state = 222
+            self.state = 230
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [55]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 206
+                self.state = 214
                 self.selectStatement()
                 pass
             elif token in [71]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 207
+                self.state = 215
                 self.insertStatement()
                 pass
             elif token in [72]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 208
+                self.state = 216
                 self.updateStatement()
                 pass
             elif token in [73]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 209
+                self.state = 217
                 self.deleteStatement()
                 pass
             elif token in [74]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 210
+                self.state = 218
                 self.mergeStatement()
                 pass
-            elif token in [78]:
+            elif token in [81]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 211
+                self.state = 219
                 self.createStatement()
                 pass
-            elif token in [79]:
+            elif token in [82]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 212
+                self.state = 220
                 self.alterStatement()
                 pass
-            elif token in [80]:
+            elif token in [83]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 213
+                self.state = 221
                 self.dropStatement()
                 pass
-            elif token in [83]:
+            elif token in [86]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 214
+                self.state = 222
                 self.grantStatement()
                 pass
-            elif token in [84]:
+            elif token in [87]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 215
+                self.state = 223
                 self.revokeStatement()
                 pass
-            elif token in [168]:
+            elif token in [183]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 216
+                self.state = 224
                 self.commitStatement()
                 pass
-            elif token in [169]:
+            elif token in [184]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 217
+                self.state = 225
                 self.rollbackStatement()
                 pass
-            elif token in [167]:
+            elif token in [182]:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 218
+                self.state = 226
                 self.beginStatement()
                 pass
             elif token in [76]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 219
+                self.state = 227
                 self.setStatement()
                 pass
-            elif token in [53]:
+            elif token in [99]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 220
+                self.state = 228
                 self.commentStatement()
                 pass
-            elif token in [11]:
+            elif token in [10]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 221
+                self.state = 229
                 self.semicolon()
                 pass
             else:
@@ -1131,7 +1249,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 4, self.RULE_semicolon)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 224
+            self.state = 232
             self.match(db2_parser.SEMICOLON)
         except RecognitionException as re:
             localctx.exception = re
@@ -1163,6 +1281,16 @@ class db2_parser ( Parser ):
             return self.getTypedRuleContext(db2_parser.TableExpressionContext,0)
 
 
+        def INTO(self):
+            return self.getToken(db2_parser.INTO, 0)
+
+        def hostVariable(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.HostVariableContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.HostVariableContext,i)
+
+
         def WHERE(self):
             return self.getToken(db2_parser.WHERE, 0)
 
@@ -1224,6 +1352,12 @@ class db2_parser ( Parser ):
         def ALL(self):
             return self.getToken(db2_parser.ALL, 0)
 
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.COMMA)
+            else:
+                return self.getToken(db2_parser.COMMA, i)
+
         def getRuleIndex(self):
             return db2_parser.RULE_selectStatement
 
@@ -1251,98 +1385,120 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 226
+            self.state = 234
             self.match(db2_parser.SELECT)
-            self.state = 228
+            self.state = 236
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==163 or _la==164:
-                self.state = 227
+            if _la==178 or _la==179:
+                self.state = 235
                 _la = self._input.LA(1)
-                if not(_la==163 or _la==164):
+                if not(_la==178 or _la==179):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
 
 
-            self.state = 230
+            self.state = 238
             self.selectList()
-            self.state = 231
+            self.state = 248
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==77:
+                self.state = 239
+                self.match(db2_parser.INTO)
+                self.state = 240
+                self.hostVariable()
+                self.state = 245
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==9:
+                    self.state = 241
+                    self.match(db2_parser.COMMA)
+                    self.state = 242
+                    self.hostVariable()
+                    self.state = 247
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 250
             self.match(db2_parser.FROM)
-            self.state = 232
+            self.state = 251
             self.tableExpression(0)
-            self.state = 235
+            self.state = 254
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==57:
-                self.state = 233
+                self.state = 252
                 self.match(db2_parser.WHERE)
-                self.state = 234
+                self.state = 253
                 self.whereClause()
 
 
-            self.state = 240
+            self.state = 259
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==58:
-                self.state = 237
+                self.state = 256
                 self.match(db2_parser.GROUP)
-                self.state = 238
+                self.state = 257
                 self.match(db2_parser.BY)
-                self.state = 239
+                self.state = 258
                 self.groupByClause()
 
 
-            self.state = 244
+            self.state = 263
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==60:
-                self.state = 242
+                self.state = 261
                 self.match(db2_parser.HAVING)
-                self.state = 243
+                self.state = 262
                 self.havingClause()
 
 
-            self.state = 249
+            self.state = 268
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==61:
-                self.state = 246
+                self.state = 265
                 self.match(db2_parser.ORDER)
-                self.state = 247
+                self.state = 266
                 self.match(db2_parser.BY)
-                self.state = 248
+                self.state = 267
                 self.orderByClause()
 
 
-            self.state = 253
+            self.state = 272
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==64:
-                self.state = 251
+                self.state = 270
                 self.match(db2_parser.LIMIT)
-                self.state = 252
+                self.state = 271
                 self.limitClause()
 
 
-            self.state = 257
+            self.state = 276
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==65:
-                self.state = 255
+                self.state = 274
                 self.match(db2_parser.OFFSET)
-                self.state = 256
+                self.state = 275
                 self.offsetClause()
 
 
-            self.state = 261
+            self.state = 280
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==66:
-                self.state = 259
+                self.state = 278
                 self.match(db2_parser.FETCH)
-                self.state = 260
+                self.state = 279
                 self.fetchClause()
 
 
@@ -1404,29 +1560,29 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 8, self.RULE_selectList)
         self._la = 0 # Token type
         try:
-            self.state = 272
+            self.state = 291
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [1, 2, 3, 4, 5, 6, 24, 116, 125, 126, 127, 128, 129, 130, 131, 132, 137, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 177, 178, 179, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216]:
+            if token in [1, 2, 3, 4, 5, 11, 13, 14, 23, 45, 46, 49, 128, 140, 141, 142, 143, 144, 145, 146, 147, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 192, 193, 194, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 263
+                self.state = 282
                 self.selectItem()
-                self.state = 268
+                self.state = 287
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 264
+                while _la==9:
+                    self.state = 283
                     self.match(db2_parser.COMMA)
-                    self.state = 265
+                    self.state = 284
                     self.selectItem()
-                    self.state = 270
+                    self.state = 289
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
                 pass
-            elif token in [16]:
+            elif token in [15]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 271
+                self.state = 290
                 self.match(db2_parser.ASTERISK)
                 pass
             else:
@@ -1495,26 +1651,26 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 10, self.RULE_selectItem)
         self._la = 0 # Token type
         try:
-            self.state = 285
+            self.state = 304
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 274
+                self.state = 293
                 self.expression(0)
-                self.state = 279
+                self.state = 298
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==1 or _la==3 or _la==217:
-                    self.state = 276
+                if _la==2 or _la==78 or _la==232:
+                    self.state = 295
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if _la==217:
-                        self.state = 275
+                    if _la==78:
+                        self.state = 294
                         self.match(db2_parser.AS)
 
 
-                    self.state = 278
+                    self.state = 297
                     self.alias()
 
 
@@ -1522,11 +1678,11 @@ class db2_parser ( Parser ):
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 281
+                self.state = 300
                 self.tableName()
-                self.state = 282
+                self.state = 301
                 self.match(db2_parser.DOT)
-                self.state = 283
+                self.state = 302
                 self.match(db2_parser.ASTERISK)
                 pass
 
@@ -1580,9 +1736,9 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 287
+            self.state = 306
             _la = self._input.LA(1)
-            if not(_la==1 or _la==3):
+            if not(_la==2 or _la==232):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -1649,28 +1805,28 @@ class db2_parser ( Parser ):
         self.enterRecursionRule(localctx, 14, self.RULE_tableExpression, _p)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 295
+            self.state = 314
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
             if la_ == 1:
-                self.state = 290
+                self.state = 309
                 self.tableReference()
                 pass
 
             elif la_ == 2:
-                self.state = 291
+                self.state = 310
                 self.match(db2_parser.LPAREN)
-                self.state = 292
+                self.state = 311
                 self.tableExpression(0)
-                self.state = 293
+                self.state = 312
                 self.match(db2_parser.RPAREN)
                 pass
 
 
             self._ctx.stop = self._input.LT(-1)
-            self.state = 301
+            self.state = 320
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,16,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,18,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
                     if self._parseListeners is not None:
@@ -1678,15 +1834,15 @@ class db2_parser ( Parser ):
                     _prevctx = localctx
                     localctx = db2_parser.TableExpressionContext(self, _parentctx, _parentState)
                     self.pushNewRecursionContext(localctx, _startState, self.RULE_tableExpression)
-                    self.state = 297
+                    self.state = 316
                     if not self.precpred(self._ctx, 2):
                         from antlr4.error.Errors import FailedPredicateException
                         raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
-                    self.state = 298
+                    self.state = 317
                     self.joinClause() 
-                self.state = 303
+                self.state = 322
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,16,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,18,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -1759,26 +1915,26 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_tableReference)
         self._la = 0 # Token type
         try:
-            self.state = 332
+            self.state = 351
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 304
+                self.state = 323
                 self.tableName()
-                self.state = 309
+                self.state = 328
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,18,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
                 if la_ == 1:
-                    self.state = 306
+                    self.state = 325
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if _la==217:
-                        self.state = 305
+                    if _la==78:
+                        self.state = 324
                         self.match(db2_parser.AS)
 
 
-                    self.state = 308
+                    self.state = 327
                     self.alias()
 
 
@@ -1786,25 +1942,25 @@ class db2_parser ( Parser ):
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 311
+                self.state = 330
                 self.match(db2_parser.LPAREN)
-                self.state = 312
+                self.state = 331
                 self.selectStatement()
-                self.state = 313
+                self.state = 332
                 self.match(db2_parser.RPAREN)
-                self.state = 318
+                self.state = 337
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
                 if la_ == 1:
-                    self.state = 315
+                    self.state = 334
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if _la==217:
-                        self.state = 314
+                    if _la==78:
+                        self.state = 333
                         self.match(db2_parser.AS)
 
 
-                    self.state = 317
+                    self.state = 336
                     self.alias()
 
 
@@ -1812,33 +1968,33 @@ class db2_parser ( Parser ):
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 320
+                self.state = 339
                 self.tableFunctionName()
-                self.state = 321
+                self.state = 340
                 self.match(db2_parser.LPAREN)
-                self.state = 323
+                self.state = 342
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 16777342) != 0) or ((((_la - 116)) & ~0x3f) == 0 and ((1 << (_la - 116)) & -2305842992039985663) != 0) or ((((_la - 204)) & ~0x3f) == 0 and ((1 << (_la - 204)) & 8191) != 0):
-                    self.state = 322
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 668503078103102) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 137389666305) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & 2198889037831) != 0):
+                    self.state = 341
                     self.arguments()
 
 
-                self.state = 325
+                self.state = 344
                 self.match(db2_parser.RPAREN)
-                self.state = 330
+                self.state = 349
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,23,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,25,self._ctx)
                 if la_ == 1:
-                    self.state = 327
+                    self.state = 346
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if _la==217:
-                        self.state = 326
+                    if _la==78:
+                        self.state = 345
                         self.match(db2_parser.AS)
 
 
-                    self.state = 329
+                    self.state = 348
                     self.alias()
 
 
@@ -1890,7 +2046,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 18, self.RULE_tableFunctionName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 334
+            self.state = 353
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -1937,7 +2093,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 20, self.RULE_viewName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 336
+            self.state = 355
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -1984,7 +2140,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_indexName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 338
+            self.state = 357
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -2031,7 +2187,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 24, self.RULE_sequenceName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 340
+            self.state = 359
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -2124,63 +2280,63 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 349
+            self.state = 368
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [151]:
-                self.state = 342
+            if token in [166]:
+                self.state = 361
                 self.match(db2_parser.INNER)
                 pass
-            elif token in [152, 153, 154]:
-                self.state = 343
+            elif token in [167, 168, 169]:
+                self.state = 362
                 _la = self._input.LA(1)
-                if not(((((_la - 152)) & ~0x3f) == 0 and ((1 << (_la - 152)) & 7) != 0)):
+                if not(((((_la - 167)) & ~0x3f) == 0 and ((1 << (_la - 167)) & 7) != 0)):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 345
+                self.state = 364
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==155:
-                    self.state = 344
+                if _la==170:
+                    self.state = 363
                     self.match(db2_parser.OUTER)
 
 
                 pass
-            elif token in [156]:
-                self.state = 347
+            elif token in [171]:
+                self.state = 366
                 self.match(db2_parser.CROSS)
                 pass
-            elif token in [157]:
-                self.state = 348
+            elif token in [172]:
+                self.state = 367
                 self.match(db2_parser.NATURAL)
                 pass
-            elif token in [150]:
+            elif token in [165]:
                 pass
             else:
                 pass
-            self.state = 351
+            self.state = 370
             self.match(db2_parser.JOIN)
-            self.state = 352
+            self.state = 371
             self.tableReference()
-            self.state = 360
+            self.state = 379
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,27,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,29,self._ctx)
             if la_ == 1:
-                self.state = 353
+                self.state = 372
                 self.match(db2_parser.ON)
-                self.state = 354
+                self.state = 373
                 self.joinCondition()
 
             elif la_ == 2:
-                self.state = 355
+                self.state = 374
                 self.match(db2_parser.USING)
-                self.state = 356
+                self.state = 375
                 self.match(db2_parser.LPAREN)
-                self.state = 357
+                self.state = 376
                 self.columnList()
-                self.state = 358
+                self.state = 377
                 self.match(db2_parser.RPAREN)
 
 
@@ -2230,7 +2386,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 28, self.RULE_joinCondition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 362
+            self.state = 381
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -2288,17 +2444,17 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 364
+            self.state = 383
             self.columnName()
-            self.state = 369
+            self.state = 388
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 365
+            while _la==9:
+                self.state = 384
                 self.match(db2_parser.COMMA)
-                self.state = 366
+                self.state = 385
                 self.columnName()
-                self.state = 371
+                self.state = 390
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2348,7 +2504,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 32, self.RULE_whereClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 372
+            self.state = 391
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -2406,17 +2562,17 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 374
+            self.state = 393
             self.expression(0)
-            self.state = 379
+            self.state = 398
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 375
+            while _la==9:
+                self.state = 394
                 self.match(db2_parser.COMMA)
-                self.state = 376
+                self.state = 395
                 self.expression(0)
-                self.state = 381
+                self.state = 400
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2466,7 +2622,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 36, self.RULE_havingClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 382
+            self.state = 401
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -2524,17 +2680,17 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 384
+            self.state = 403
             self.orderByItem()
-            self.state = 389
+            self.state = 408
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 385
+            while _la==9:
+                self.state = 404
                 self.match(db2_parser.COMMA)
-                self.state = 386
+                self.state = 405
                 self.orderByItem()
-                self.state = 391
+                self.state = 410
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2591,13 +2747,13 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 392
+            self.state = 411
             self.expression(0)
-            self.state = 394
+            self.state = 413
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==62 or _la==63:
-                self.state = 393
+                self.state = 412
                 _la = self._input.LA(1)
                 if not(_la==62 or _la==63):
                     self._errHandler.recoverInline(self)
@@ -2651,7 +2807,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 42, self.RULE_limitClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 396
+            self.state = 415
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -2698,7 +2854,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 44, self.RULE_offsetClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 398
+            self.state = 417
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -2716,21 +2872,24 @@ class db2_parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
+        def ONLY(self):
+            return self.getToken(db2_parser.ONLY, 0)
+
         def FIRST(self):
             return self.getToken(db2_parser.FIRST, 0)
 
         def NEXT(self):
             return self.getToken(db2_parser.NEXT, 0)
 
-        def NUMBER(self):
-            return self.getToken(db2_parser.NUMBER, 0)
-
-        def ONLY(self):
-            return self.getToken(db2_parser.ONLY, 0)
+        def ROW(self):
+            return self.getToken(db2_parser.ROW, 0)
 
         def ROWS(self):
             return self.getToken(db2_parser.ROWS, 0)
 
+        def NUMBER(self):
+            return self.getToken(db2_parser.NUMBER, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_fetchClause
 
@@ -2757,34 +2916,31 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 46, self.RULE_fetchClause)
         self._la = 0 # Token type
         try:
-            self.state = 407
+            self.enterOuterAlt(localctx, 1)
+            self.state = 419
+            _la = self._input.LA(1)
+            if not(_la==67 or _la==68):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 421
             self._errHandler.sync(self)
-            token = self._input.LA(1)
-            if token in [67]:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 400
-                self.match(db2_parser.FIRST)
-                pass
-            elif token in [68]:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 401
-                self.match(db2_parser.NEXT)
-                self.state = 402
+            _la = self._input.LA(1)
+            if _la==1:
+                self.state = 420
                 self.match(db2_parser.NUMBER)
-                self.state = 404
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                if _la==69:
-                    self.state = 403
-                    self.match(db2_parser.ROWS)
 
 
-                self.state = 406
-                self.match(db2_parser.ONLY)
-                pass
+            self.state = 423
+            _la = self._input.LA(1)
+            if not(_la==69 or _la==208):
+                self._errHandler.recoverInline(self)
             else:
-                raise NoViableAltException(self)
-
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 424
+            self.match(db2_parser.ONLY)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2859,35 +3015,35 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 409
+            self.state = 426
             self.match(db2_parser.INSERT)
-            self.state = 410
+            self.state = 427
             self.match(db2_parser.INTO)
-            self.state = 411
+            self.state = 428
             self.tableName()
-            self.state = 416
+            self.state = 433
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==6:
-                self.state = 412
+            if _la==5:
+                self.state = 429
                 self.match(db2_parser.LPAREN)
-                self.state = 413
+                self.state = 430
                 self.columnList()
-                self.state = 414
+                self.state = 431
                 self.match(db2_parser.RPAREN)
 
 
-            self.state = 421
+            self.state = 438
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [75]:
-                self.state = 418
+                self.state = 435
                 self.match(db2_parser.VALUES)
-                self.state = 419
+                self.state = 436
                 self.valueList()
                 pass
             elif token in [55]:
-                self.state = 420
+                self.state = 437
                 self.selectStatement()
                 pass
             else:
@@ -2955,23 +3111,23 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 423
+            self.state = 440
             self.match(db2_parser.LPAREN)
-            self.state = 424
+            self.state = 441
             self.expression(0)
-            self.state = 429
+            self.state = 446
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 425
+            while _la==9:
+                self.state = 442
                 self.match(db2_parser.COMMA)
-                self.state = 426
+                self.state = 443
                 self.expression(0)
-                self.state = 431
+                self.state = 448
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 432
+            self.state = 449
             self.match(db2_parser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -3029,17 +3185,17 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 434
+            self.state = 451
             self.expression(0)
-            self.state = 439
+            self.state = 456
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 435
+            while _la==9:
+                self.state = 452
                 self.match(db2_parser.COMMA)
-                self.state = 436
+                self.state = 453
                 self.expression(0)
-                self.state = 441
+                self.state = 458
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3116,33 +3272,33 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 442
+            self.state = 459
             self.match(db2_parser.UPDATE)
-            self.state = 443
+            self.state = 460
             self.tableName()
-            self.state = 444
+            self.state = 461
             self.match(db2_parser.SET)
-            self.state = 445
+            self.state = 462
             self.setClause()
-            self.state = 450
+            self.state = 467
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 446
+            while _la==9:
+                self.state = 463
                 self.match(db2_parser.COMMA)
-                self.state = 447
+                self.state = 464
                 self.setClause()
-                self.state = 452
+                self.state = 469
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 455
+            self.state = 472
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==57:
-                self.state = 453
+                self.state = 470
                 self.match(db2_parser.WHERE)
-                self.state = 454
+                self.state = 471
                 self.whereClause()
 
 
@@ -3199,11 +3355,11 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 56, self.RULE_setClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 457
+            self.state = 474
             self.columnName()
-            self.state = 458
+            self.state = 475
             self.match(db2_parser.EQUALS)
-            self.state = 459
+            self.state = 476
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -3265,19 +3421,19 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 461
+            self.state = 478
             self.match(db2_parser.DELETE)
-            self.state = 462
+            self.state = 479
             self.match(db2_parser.FROM)
-            self.state = 463
+            self.state = 480
             self.tableName()
-            self.state = 466
+            self.state = 483
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==57:
-                self.state = 464
+                self.state = 481
                 self.match(db2_parser.WHERE)
-                self.state = 465
+                self.state = 482
                 self.whereClause()
 
 
@@ -3390,79 +3546,79 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 468
+            self.state = 485
             self.match(db2_parser.MERGE)
-            self.state = 469
+            self.state = 486
             self.match(db2_parser.INTO)
-            self.state = 470
+            self.state = 487
             self.tableName()
-            self.state = 475
+            self.state = 492
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==1 or _la==3 or _la==217:
-                self.state = 472
+            if _la==2 or _la==78 or _la==232:
+                self.state = 489
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==217:
-                    self.state = 471
+                if _la==78:
+                    self.state = 488
                     self.match(db2_parser.AS)
 
 
-                self.state = 474
+                self.state = 491
                 self.alias()
 
 
-            self.state = 477
+            self.state = 494
             self.match(db2_parser.USING)
-            self.state = 478
+            self.state = 495
             self.tableReference()
-            self.state = 483
+            self.state = 500
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==1 or _la==3 or _la==217:
-                self.state = 480
+            if _la==2 or _la==78 or _la==232:
+                self.state = 497
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==217:
-                    self.state = 479
+                if _la==78:
+                    self.state = 496
                     self.match(db2_parser.AS)
 
 
-                self.state = 482
+                self.state = 499
                 self.alias()
 
 
-            self.state = 485
+            self.state = 502
             self.match(db2_parser.ON)
-            self.state = 486
+            self.state = 503
             self.mergeCondition()
-            self.state = 491
+            self.state = 508
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,45,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,46,self._ctx)
             if la_ == 1:
-                self.state = 487
+                self.state = 504
                 self.match(db2_parser.WHEN)
-                self.state = 488
+                self.state = 505
                 self.match(db2_parser.MATCHED)
-                self.state = 489
+                self.state = 506
                 self.match(db2_parser.THEN)
-                self.state = 490
+                self.state = 507
                 self.updateClause()
 
 
-            self.state = 498
+            self.state = 515
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==133:
-                self.state = 493
+            if _la==148:
+                self.state = 510
                 self.match(db2_parser.WHEN)
-                self.state = 494
+                self.state = 511
                 self.match(db2_parser.NOT)
-                self.state = 495
+                self.state = 512
                 self.match(db2_parser.MATCHED)
-                self.state = 496
+                self.state = 513
                 self.match(db2_parser.THEN)
-                self.state = 497
+                self.state = 514
                 self.insertClause()
 
 
@@ -3512,7 +3668,7 @@ class db2_parser ( Parser ):
         self.enterRule(localctx, 62, self.RULE_mergeCondition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 500
+            self.state = 517
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -3576,21 +3732,21 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 502
+            self.state = 519
             self.match(db2_parser.UPDATE)
-            self.state = 503
+            self.state = 520
             self.match(db2_parser.SET)
-            self.state = 504
+            self.state = 521
             self.setClause()
-            self.state = 509
+            self.state = 526
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 505
+            while _la==9:
+                self.state = 522
                 self.match(db2_parser.COMMA)
-                self.state = 506
+                self.state = 523
                 self.setClause()
-                self.state = 511
+                self.state = 528
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3657,23 +3813,23 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 512
+            self.state = 529
             self.match(db2_parser.INSERT)
-            self.state = 517
+            self.state = 534
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==6:
-                self.state = 513
+            if _la==5:
+                self.state = 530
                 self.match(db2_parser.LPAREN)
-                self.state = 514
+                self.state = 531
                 self.columnList()
-                self.state = 515
+                self.state = 532
                 self.match(db2_parser.RPAREN)
 
 
-            self.state = 519
+            self.state = 536
             self.match(db2_parser.VALUES)
-            self.state = 520
+            self.state = 537
             self.valueList()
         except RecognitionException as re:
             localctx.exception = re
@@ -3732,30 +3888,30 @@ class db2_parser ( Parser ):
         localctx = db2_parser.CreateStatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 68, self.RULE_createStatement)
         try:
-            self.state = 526
+            self.state = 543
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,49,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,50,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 522
+                self.state = 539
                 self.createTableStatement()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 523
+                self.state = 540
                 self.createViewStatement()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 524
+                self.state = 541
                 self.createIndexStatement()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 525
+                self.state = 542
                 self.createSequenceStatement()
                 pass
 
@@ -3789,11 +3945,11 @@ class db2_parser ( Parser ):
         def LPAREN(self):
             return self.getToken(db2_parser.LPAREN, 0)
 
-        def columnDefinition(self, i:int=None):
+        def tableElement(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(db2_parser.ColumnDefinitionContext)
+                return self.getTypedRuleContexts(db2_parser.TableElementContext)
             else:
-                return self.getTypedRuleContext(db2_parser.ColumnDefinitionContext,i)
+                return self.getTypedRuleContext(db2_parser.TableElementContext,i)
 
 
         def RPAREN(self):
@@ -3832,29 +3988,29 @@ class db2_parser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 528
+            self.state = 545
             self.match(db2_parser.CREATE)
-            self.state = 529
+            self.state = 546
             self.match(db2_parser.TABLE)
-            self.state = 530
+            self.state = 547
             self.tableName()
-            self.state = 531
+            self.state = 548
             self.match(db2_parser.LPAREN)
-            self.state = 532
-            self.columnDefinition()
-            self.state = 537
+            self.state = 549
+            self.tableElement()
+            self.state = 554
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 533
+            while _la==9:
+                self.state = 550
                 self.match(db2_parser.COMMA)
-                self.state = 534
-                self.columnDefinition()
-                self.state = 539
+                self.state = 551
+                self.tableElement()
+                self.state = 556
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 540
+            self.state = 557
             self.match(db2_parser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -3865,66 +4021,131 @@ class db2_parser ( Parser ):
         return localctx
 
 
-    class ColumnDefinitionContext(ParserRuleContext):
+    class TableElementContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def columnName(self):
-            return self.getTypedRuleContext(db2_parser.ColumnNameContext,0)
-
-
-        def dataType(self):
-            return self.getTypedRuleContext(db2_parser.DataTypeContext,0)
+        def columnDefinition(self):
+            return self.getTypedRuleContext(db2_parser.ColumnDefinitionContext,0)
 
 
-        def columnConstraint(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(db2_parser.ColumnConstraintContext)
-            else:
-                return self.getTypedRuleContext(db2_parser.ColumnConstraintContext,i)
+        def tableConstraint(self):
+            return self.getTypedRuleContext(db2_parser.TableConstraintContext,0)
 
 
         def getRuleIndex(self):
-            return db2_parser.RULE_columnDefinition
+            return db2_parser.RULE_tableElement
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterColumnDefinition" ):
-                listener.enterColumnDefinition(self)
+            if hasattr( listener, "enterTableElement" ):
+                listener.enterTableElement(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitColumnDefinition" ):
-                listener.exitColumnDefinition(self)
+            if hasattr( listener, "exitTableElement" ):
+                listener.exitTableElement(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitColumnDefinition" ):
-                return visitor.visitColumnDefinition(self)
+            if hasattr( visitor, "visitTableElement" ):
+                return visitor.visitTableElement(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def columnDefinition(self):
+    def tableElement(self):
 
-        localctx = db2_parser.ColumnDefinitionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 72, self.RULE_columnDefinition)
-        self._la = 0 # Token type
+        localctx = db2_parser.TableElementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_tableElement)
         try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 542
-            self.columnName()
-            self.state = 543
+            self.state = 561
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [232]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 559
+                self.columnDefinition()
+                pass
+            elif token in [123, 124, 126, 130, 131]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 560
+                self.tableConstraint()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ColumnDefinitionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def columnName(self):
+            return self.getTypedRuleContext(db2_parser.ColumnNameContext,0)
+
+
+        def dataType(self):
+            return self.getTypedRuleContext(db2_parser.DataTypeContext,0)
+
+
+        def columnConstraint(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ColumnConstraintContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ColumnConstraintContext,i)
+
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_columnDefinition
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterColumnDefinition" ):
+                listener.enterColumnDefinition(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitColumnDefinition" ):
+                listener.exitColumnDefinition(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitColumnDefinition" ):
+                return visitor.visitColumnDefinition(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def columnDefinition(self):
+
+        localctx = db2_parser.ColumnDefinitionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_columnDefinition)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 563
+            self.columnName()
+            self.state = 564
             self.dataType()
-            self.state = 547
+            self.state = 568
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while ((((_la - 111)) & ~0x3f) == 0 and ((1 << (_la - 111)) & 729) != 0):
-                self.state = 544
+            while ((((_la - 123)) & ~0x3f) == 0 and ((1 << (_la - 123)) & 17401) != 0) or _la==199:
+                self.state = 565
                 self.columnConstraint()
-                self.state = 549
+                self.state = 570
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3992,6 +4213,21 @@ class db2_parser ( Parser ):
         def VARCHAR(self):
             return self.getToken(db2_parser.VARCHAR, 0)
 
+        def GRAPHIC(self):
+            return self.getToken(db2_parser.GRAPHIC, 0)
+
+        def VARGRAPHIC(self):
+            return self.getToken(db2_parser.VARGRAPHIC, 0)
+
+        def CLOB(self):
+            return self.getToken(db2_parser.CLOB, 0)
+
+        def DBCLOB(self):
+            return self.getToken(db2_parser.DBCLOB, 0)
+
+        def BLOB(self):
+            return self.getToken(db2_parser.BLOB, 0)
+
         def DATE(self):
             return self.getToken(db2_parser.DATE, 0)
 
@@ -4001,6 +4237,9 @@ class db2_parser ( Parser ):
         def TIMESTAMP(self):
             return self.getToken(db2_parser.TIMESTAMP, 0)
 
+        def XML(self):
+            return self.getToken(db2_parser.XML, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_dataType
 
@@ -4024,117 +4263,219 @@ class db2_parser ( Parser ):
     def dataType(self):
 
         localctx = db2_parser.DataTypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 74, self.RULE_dataType)
+        self.enterRule(localctx, 76, self.RULE_dataType)
         self._la = 0 # Token type
         try:
-            self.state = 584
+            self.state = 647
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [93]:
+            if token in [105]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 550
+                self.state = 571
                 self.match(db2_parser.INTEGER)
                 pass
-            elif token in [94]:
+            elif token in [106]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 551
+                self.state = 572
                 self.match(db2_parser.SMALLINT)
                 pass
-            elif token in [95]:
+            elif token in [107]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 552
+                self.state = 573
                 self.match(db2_parser.BIGINT)
                 pass
-            elif token in [96]:
+            elif token in [108]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 553
+                self.state = 574
                 self.match(db2_parser.DECIMAL)
-                self.state = 562
+                self.state = 583
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==6:
-                    self.state = 554
+                if _la==5:
+                    self.state = 575
                     self.match(db2_parser.LPAREN)
-                    self.state = 555
+                    self.state = 576
                     self.precision()
-                    self.state = 558
+                    self.state = 579
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
-                    if _la==10:
-                        self.state = 556
+                    if _la==9:
+                        self.state = 577
                         self.match(db2_parser.COMMA)
-                        self.state = 557
+                        self.state = 578
                         self.scale()
 
 
-                    self.state = 560
+                    self.state = 581
                     self.match(db2_parser.RPAREN)
 
 
                 pass
-            elif token in [97]:
+            elif token in [109]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 564
+                self.state = 585
                 self.match(db2_parser.REAL)
                 pass
-            elif token in [98]:
+            elif token in [110]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 565
+                self.state = 586
                 self.match(db2_parser.DOUBLE)
                 pass
-            elif token in [99]:
+            elif token in [111]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 566
+                self.state = 587
                 self.match(db2_parser.FLOAT)
                 pass
-            elif token in [100]:
+            elif token in [112]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 567
+                self.state = 588
                 self.match(db2_parser.CHAR)
-                self.state = 572
+                self.state = 593
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==6:
-                    self.state = 568
+                if _la==5:
+                    self.state = 589
                     self.match(db2_parser.LPAREN)
-                    self.state = 569
+                    self.state = 590
                     self.length()
-                    self.state = 570
+                    self.state = 591
                     self.match(db2_parser.RPAREN)
 
 
                 pass
-            elif token in [101]:
+            elif token in [113]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 574
+                self.state = 595
                 self.match(db2_parser.VARCHAR)
-                self.state = 579
+                self.state = 600
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==6:
-                    self.state = 575
+                if _la==5:
+                    self.state = 596
                     self.match(db2_parser.LPAREN)
-                    self.state = 576
+                    self.state = 597
                     self.length()
-                    self.state = 577
+                    self.state = 598
                     self.match(db2_parser.RPAREN)
 
 
                 pass
-            elif token in [107]:
+            elif token in [115]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 581
-                self.match(db2_parser.DATE)
+                self.state = 602
+                self.match(db2_parser.GRAPHIC)
+                self.state = 607
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 603
+                    self.match(db2_parser.LPAREN)
+                    self.state = 604
+                    self.length()
+                    self.state = 605
+                    self.match(db2_parser.RPAREN)
+
+
                 pass
-            elif token in [108]:
+            elif token in [116]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 582
-                self.match(db2_parser.TIME)
+                self.state = 609
+                self.match(db2_parser.VARGRAPHIC)
+                self.state = 614
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 610
+                    self.match(db2_parser.LPAREN)
+                    self.state = 611
+                    self.length()
+                    self.state = 612
+                    self.match(db2_parser.RPAREN)
+
+
                 pass
-            elif token in [109]:
+            elif token in [114]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 583
+                self.state = 616
+                self.match(db2_parser.CLOB)
+                self.state = 621
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 617
+                    self.match(db2_parser.LPAREN)
+                    self.state = 618
+                    self.length()
+                    self.state = 619
+                    self.match(db2_parser.RPAREN)
+
+
+                pass
+            elif token in [117]:
+                self.enterOuterAlt(localctx, 13)
+                self.state = 623
+                self.match(db2_parser.DBCLOB)
+                self.state = 628
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 624
+                    self.match(db2_parser.LPAREN)
+                    self.state = 625
+                    self.length()
+                    self.state = 626
+                    self.match(db2_parser.RPAREN)
+
+
+                pass
+            elif token in [118]:
+                self.enterOuterAlt(localctx, 14)
+                self.state = 630
+                self.match(db2_parser.BLOB)
+                self.state = 635
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 631
+                    self.match(db2_parser.LPAREN)
+                    self.state = 632
+                    self.length()
+                    self.state = 633
+                    self.match(db2_parser.RPAREN)
+
+
+                pass
+            elif token in [119]:
+                self.enterOuterAlt(localctx, 15)
+                self.state = 637
+                self.match(db2_parser.DATE)
+                pass
+            elif token in [120]:
+                self.enterOuterAlt(localctx, 16)
+                self.state = 638
+                self.match(db2_parser.TIME)
+                pass
+            elif token in [121]:
+                self.enterOuterAlt(localctx, 17)
+                self.state = 639
                 self.match(db2_parser.TIMESTAMP)
+                self.state = 644
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 640
+                    self.match(db2_parser.LPAREN)
+                    self.state = 641
+                    self.precision()
+                    self.state = 642
+                    self.match(db2_parser.RPAREN)
+
+
+                pass
+            elif token in [122]:
+                self.enterOuterAlt(localctx, 18)
+                self.state = 646
+                self.match(db2_parser.XML)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -4181,10 +4522,10 @@ class db2_parser ( Parser ):
     def precision(self):
 
         localctx = db2_parser.PrecisionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 76, self.RULE_precision)
+        self.enterRule(localctx, 78, self.RULE_precision)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 586
+            self.state = 649
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -4228,10 +4569,10 @@ class db2_parser ( Parser ):
     def scale(self):
 
         localctx = db2_parser.ScaleContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 78, self.RULE_scale)
+        self.enterRule(localctx, 80, self.RULE_scale)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 588
+            self.state = 651
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -4275,10 +4616,10 @@ class db2_parser ( Parser ):
     def length(self):
 
         localctx = db2_parser.LengthContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 80, self.RULE_length)
+        self.enterRule(localctx, 82, self.RULE_length)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 590
+            self.state = 653
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -4299,13 +4640,12 @@ class db2_parser ( Parser ):
         def NOT_NULL(self):
             return self.getToken(db2_parser.NOT_NULL, 0)
 
+        def NULL(self):
+            return self.getToken(db2_parser.NULL, 0)
+
         def DEFAULT(self):
             return self.getToken(db2_parser.DEFAULT, 0)
 
-        def defaultValue(self):
-            return self.getTypedRuleContext(db2_parser.DefaultValueContext,0)
-
-
         def PRIMARY(self):
             return self.getToken(db2_parser.PRIMARY, 0)
 
@@ -4335,9 +4675,58 @@ class db2_parser ( Parser ):
             return self.getTypedRuleContext(db2_parser.TableNameContext,0)
 
 
-        def columnName(self):
-            return self.getTypedRuleContext(db2_parser.ColumnNameContext,0)
+        def GENERATED(self):
+            return self.getToken(db2_parser.GENERATED, 0)
+
+        def AS(self):
+            return self.getToken(db2_parser.AS, 0)
+
+        def IDENTITY(self):
+            return self.getToken(db2_parser.IDENTITY, 0)
+
+        def CONSTRAINT(self):
+            return self.getToken(db2_parser.CONSTRAINT, 0)
+
+        def constraintName(self):
+            return self.getTypedRuleContext(db2_parser.ConstraintNameContext,0)
+
+
+        def ALWAYS(self):
+            return self.getToken(db2_parser.ALWAYS, 0)
+
+        def BY(self):
+            return self.getToken(db2_parser.BY, 0)
+
+        def WITH(self):
+            return self.getToken(db2_parser.WITH, 0)
+
+        def defaultValue(self):
+            return self.getTypedRuleContext(db2_parser.DefaultValueContext,0)
+
+
+        def columnList(self):
+            return self.getTypedRuleContext(db2_parser.ColumnListContext,0)
+
+
+        def referentialAction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ReferentialActionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ReferentialActionContext,i)
+
+
+        def identityOption(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.IdentityOptionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.IdentityOptionContext,i)
+
 
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.COMMA)
+            else:
+                return self.getToken(db2_parser.COMMA, i)
 
         def getRuleIndex(self):
             return db2_parser.RULE_columnConstraint
@@ -4362,62 +4751,149 @@ class db2_parser ( Parser ):
     def columnConstraint(self):
 
         localctx = db2_parser.ColumnConstraintContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 82, self.RULE_columnConstraint)
+        self.enterRule(localctx, 84, self.RULE_columnConstraint)
         self._la = 0 # Token type
         try:
-            self.state = 611
+            self.enterOuterAlt(localctx, 1)
+            self.state = 657
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==131:
+                self.state = 655
+                self.match(db2_parser.CONSTRAINT)
+                self.state = 656
+                self.constraintName()
+
+
+            self.state = 713
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [115]:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 592
+            if token in [127]:
+                self.state = 659
                 self.match(db2_parser.NOT_NULL)
                 pass
-            elif token in [117]:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 593
+            elif token in [128]:
+                self.state = 660
+                self.match(db2_parser.NULL)
+                pass
+            elif token in [129, 199]:
+                self.state = 662
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==199:
+                    self.state = 661
+                    self.match(db2_parser.WITH)
+
+
+                self.state = 664
                 self.match(db2_parser.DEFAULT)
-                self.state = 594
-                self.defaultValue()
+                self.state = 666
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,67,self._ctx)
+                if la_ == 1:
+                    self.state = 665
+                    self.defaultValue()
+
+
                 pass
-            elif token in [111]:
-                self.enterOuterAlt(localctx, 3)
-                self.state = 595
+            elif token in [123]:
+                self.state = 668
                 self.match(db2_parser.PRIMARY)
-                self.state = 596
+                self.state = 669
                 self.match(db2_parser.KEY)
                 pass
-            elif token in [114]:
-                self.enterOuterAlt(localctx, 4)
-                self.state = 597
+            elif token in [126]:
+                self.state = 670
                 self.match(db2_parser.UNIQUE)
                 pass
-            elif token in [118]:
-                self.enterOuterAlt(localctx, 5)
-                self.state = 598
+            elif token in [130]:
+                self.state = 671
                 self.match(db2_parser.CHECK)
-                self.state = 599
+                self.state = 672
                 self.match(db2_parser.LPAREN)
-                self.state = 600
+                self.state = 673
                 self.checkCondition()
-                self.state = 601
+                self.state = 674
                 self.match(db2_parser.RPAREN)
                 pass
-            elif token in [120]:
-                self.enterOuterAlt(localctx, 6)
-                self.state = 603
+            elif token in [132]:
+                self.state = 676
                 self.match(db2_parser.REFERENCES)
-                self.state = 604
+                self.state = 677
                 self.tableName()
-                self.state = 609
+                self.state = 682
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==6:
-                    self.state = 605
+                if _la==5:
+                    self.state = 678
                     self.match(db2_parser.LPAREN)
-                    self.state = 606
-                    self.columnName()
-                    self.state = 607
+                    self.state = 679
+                    self.columnList()
+                    self.state = 680
+                    self.match(db2_parser.RPAREN)
+
+
+                self.state = 687
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==174:
+                    self.state = 684
+                    self.referentialAction()
+                    self.state = 689
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            elif token in [137]:
+                self.state = 690
+                self.match(db2_parser.GENERATED)
+                self.state = 694
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [138]:
+                    self.state = 691
+                    self.match(db2_parser.ALWAYS)
+                    pass
+                elif token in [59]:
+                    self.state = 692
+                    self.match(db2_parser.BY)
+                    self.state = 693
+                    self.match(db2_parser.DEFAULT)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 696
+                self.match(db2_parser.AS)
+                self.state = 697
+                self.match(db2_parser.IDENTITY)
+                self.state = 711
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==5:
+                    self.state = 698
+                    self.match(db2_parser.LPAREN)
+                    self.state = 699
+                    self.identityOption()
+                    self.state = 706
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==9 or ((((_la - 101)) & ~0x3f) == 0 and ((1 << (_la - 101)) & 15) != 0):
+                        self.state = 701
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if _la==9:
+                            self.state = 700
+                            self.match(db2_parser.COMMA)
+
+
+                        self.state = 703
+                        self.identityOption()
+                        self.state = 708
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+                    self.state = 709
                     self.match(db2_parser.RPAREN)
 
 
@@ -4434,6 +4910,292 @@ class db2_parser ( Parser ):
         return localctx
 
 
+    class TableConstraintContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def constraintDefinition(self):
+            return self.getTypedRuleContext(db2_parser.ConstraintDefinitionContext,0)
+
+
+        def CONSTRAINT(self):
+            return self.getToken(db2_parser.CONSTRAINT, 0)
+
+        def constraintName(self):
+            return self.getTypedRuleContext(db2_parser.ConstraintNameContext,0)
+
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_tableConstraint
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterTableConstraint" ):
+                listener.enterTableConstraint(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitTableConstraint" ):
+                listener.exitTableConstraint(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTableConstraint" ):
+                return visitor.visitTableConstraint(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def tableConstraint(self):
+
+        localctx = db2_parser.TableConstraintContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_tableConstraint)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 717
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==131:
+                self.state = 715
+                self.match(db2_parser.CONSTRAINT)
+                self.state = 716
+                self.constraintName()
+
+
+            self.state = 719
+            self.constraintDefinition()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferentialActionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ON(self):
+            return self.getToken(db2_parser.ON, 0)
+
+        def DELETE(self):
+            return self.getToken(db2_parser.DELETE, 0)
+
+        def UPDATE(self):
+            return self.getToken(db2_parser.UPDATE, 0)
+
+        def CASCADE(self):
+            return self.getToken(db2_parser.CASCADE, 0)
+
+        def RESTRICT(self):
+            return self.getToken(db2_parser.RESTRICT, 0)
+
+        def SET_NULL(self):
+            return self.getToken(db2_parser.SET_NULL, 0)
+
+        def NO_ACTION(self):
+            return self.getToken(db2_parser.NO_ACTION, 0)
+
+        def SET(self):
+            return self.getToken(db2_parser.SET, 0)
+
+        def DEFAULT(self):
+            return self.getToken(db2_parser.DEFAULT, 0)
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_referentialAction
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterReferentialAction" ):
+                listener.enterReferentialAction(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitReferentialAction" ):
+                listener.exitReferentialAction(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferentialAction" ):
+                return visitor.visitReferentialAction(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referentialAction(self):
+
+        localctx = db2_parser.ReferentialActionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_referentialAction)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 721
+            self.match(db2_parser.ON)
+            self.state = 722
+            _la = self._input.LA(1)
+            if not(_la==72 or _la==73):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 729
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [133]:
+                self.state = 723
+                self.match(db2_parser.CASCADE)
+                pass
+            elif token in [134]:
+                self.state = 724
+                self.match(db2_parser.RESTRICT)
+                pass
+            elif token in [135]:
+                self.state = 725
+                self.match(db2_parser.SET_NULL)
+                pass
+            elif token in [136]:
+                self.state = 726
+                self.match(db2_parser.NO_ACTION)
+                pass
+            elif token in [76]:
+                self.state = 727
+                self.match(db2_parser.SET)
+                self.state = 728
+                self.match(db2_parser.DEFAULT)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IdentityOptionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def START(self):
+            return self.getToken(db2_parser.START, 0)
+
+        def WITH(self):
+            return self.getToken(db2_parser.WITH, 0)
+
+        def startValue(self):
+            return self.getTypedRuleContext(db2_parser.StartValueContext,0)
+
+
+        def INCREMENT(self):
+            return self.getToken(db2_parser.INCREMENT, 0)
+
+        def BY(self):
+            return self.getToken(db2_parser.BY, 0)
+
+        def incrementValue(self):
+            return self.getTypedRuleContext(db2_parser.IncrementValueContext,0)
+
+
+        def MINVALUE(self):
+            return self.getToken(db2_parser.MINVALUE, 0)
+
+        def minValue(self):
+            return self.getTypedRuleContext(db2_parser.MinValueContext,0)
+
+
+        def MAXVALUE(self):
+            return self.getToken(db2_parser.MAXVALUE, 0)
+
+        def maxValue(self):
+            return self.getTypedRuleContext(db2_parser.MaxValueContext,0)
+
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_identityOption
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIdentityOption" ):
+                listener.enterIdentityOption(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIdentityOption" ):
+                listener.exitIdentityOption(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentityOption" ):
+                return visitor.visitIdentityOption(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def identityOption(self):
+
+        localctx = db2_parser.IdentityOptionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_identityOption)
+        try:
+            self.state = 741
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [101]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 731
+                self.match(db2_parser.START)
+                self.state = 732
+                self.match(db2_parser.WITH)
+                self.state = 733
+                self.startValue()
+                pass
+            elif token in [102]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 734
+                self.match(db2_parser.INCREMENT)
+                self.state = 735
+                self.match(db2_parser.BY)
+                self.state = 736
+                self.incrementValue()
+                pass
+            elif token in [103]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 737
+                self.match(db2_parser.MINVALUE)
+                self.state = 738
+                self.minValue()
+                pass
+            elif token in [104]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 739
+                self.match(db2_parser.MAXVALUE)
+                self.state = 740
+                self.maxValue()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class DefaultValueContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -4468,10 +5230,10 @@ class db2_parser ( Parser ):
     def defaultValue(self):
 
         localctx = db2_parser.DefaultValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 84, self.RULE_defaultValue)
+        self.enterRule(localctx, 92, self.RULE_defaultValue)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 613
+            self.state = 743
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -4516,10 +5278,10 @@ class db2_parser ( Parser ):
     def checkCondition(self):
 
         localctx = db2_parser.CheckConditionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 86, self.RULE_checkCondition)
+        self.enterRule(localctx, 94, self.RULE_checkCondition)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 615
+            self.state = 745
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -4543,8 +5305,9 @@ class db2_parser ( Parser ):
         def VIEW(self):
             return self.getToken(db2_parser.VIEW, 0)
 
-        def IDENTIFIER(self):
-            return self.getToken(db2_parser.IDENTIFIER, 0)
+        def tableName(self):
+            return self.getTypedRuleContext(db2_parser.TableNameContext,0)
+
 
         def AS(self):
             return self.getToken(db2_parser.AS, 0)
@@ -4586,31 +5349,31 @@ class db2_parser ( Parser ):
     def createViewStatement(self):
 
         localctx = db2_parser.CreateViewStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 88, self.RULE_createViewStatement)
+        self.enterRule(localctx, 96, self.RULE_createViewStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 617
+            self.state = 747
             self.match(db2_parser.CREATE)
-            self.state = 618
+            self.state = 748
             self.match(db2_parser.VIEW)
-            self.state = 619
-            self.match(db2_parser.IDENTIFIER)
-            self.state = 624
+            self.state = 749
+            self.tableName()
+            self.state = 754
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==6:
-                self.state = 620
+            if _la==5:
+                self.state = 750
                 self.match(db2_parser.LPAREN)
-                self.state = 621
+                self.state = 751
                 self.columnList()
-                self.state = 622
+                self.state = 752
                 self.match(db2_parser.RPAREN)
 
 
-            self.state = 626
+            self.state = 756
             self.match(db2_parser.AS)
-            self.state = 627
+            self.state = 757
             self.selectStatement()
         except RecognitionException as re:
             localctx.exception = re
@@ -4634,26 +5397,38 @@ class db2_parser ( Parser ):
         def INDEX(self):
             return self.getToken(db2_parser.INDEX, 0)
 
-        def IDENTIFIER(self):
-            return self.getToken(db2_parser.IDENTIFIER, 0)
+        def tableName(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.TableNameContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.TableNameContext,i)
+
 
         def ON(self):
             return self.getToken(db2_parser.ON, 0)
 
-        def tableName(self):
-            return self.getTypedRuleContext(db2_parser.TableNameContext,0)
-
-
         def LPAREN(self):
             return self.getToken(db2_parser.LPAREN, 0)
 
-        def columnList(self):
-            return self.getTypedRuleContext(db2_parser.ColumnListContext,0)
+        def orderByItem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.OrderByItemContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.OrderByItemContext,i)
 
 
         def RPAREN(self):
             return self.getToken(db2_parser.RPAREN, 0)
 
+        def UNIQUE(self):
+            return self.getToken(db2_parser.UNIQUE, 0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.COMMA)
+            else:
+                return self.getToken(db2_parser.COMMA, i)
+
         def getRuleIndex(self):
             return db2_parser.RULE_createIndexStatement
 
@@ -4677,24 +5452,45 @@ class db2_parser ( Parser ):
     def createIndexStatement(self):
 
         localctx = db2_parser.CreateIndexStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 90, self.RULE_createIndexStatement)
+        self.enterRule(localctx, 98, self.RULE_createIndexStatement)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 629
+            self.state = 759
             self.match(db2_parser.CREATE)
-            self.state = 630
+            self.state = 761
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==126:
+                self.state = 760
+                self.match(db2_parser.UNIQUE)
+
+
+            self.state = 763
             self.match(db2_parser.INDEX)
-            self.state = 631
-            self.match(db2_parser.IDENTIFIER)
-            self.state = 632
+            self.state = 764
+            self.tableName()
+            self.state = 765
             self.match(db2_parser.ON)
-            self.state = 633
+            self.state = 766
             self.tableName()
-            self.state = 634
+            self.state = 767
             self.match(db2_parser.LPAREN)
-            self.state = 635
-            self.columnList()
-            self.state = 636
+            self.state = 768
+            self.orderByItem()
+            self.state = 773
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==9:
+                self.state = 769
+                self.match(db2_parser.COMMA)
+                self.state = 770
+                self.orderByItem()
+                self.state = 775
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 776
             self.match(db2_parser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -4778,57 +5574,57 @@ class db2_parser ( Parser ):
     def createSequenceStatement(self):
 
         localctx = db2_parser.CreateSequenceStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 92, self.RULE_createSequenceStatement)
+        self.enterRule(localctx, 100, self.RULE_createSequenceStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 638
+            self.state = 778
             self.match(db2_parser.CREATE)
-            self.state = 639
+            self.state = 779
             self.match(db2_parser.SEQUENCE)
-            self.state = 640
+            self.state = 780
             self.match(db2_parser.IDENTIFIER)
-            self.state = 644
+            self.state = 784
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==219:
-                self.state = 641
+            if _la==101:
+                self.state = 781
                 self.match(db2_parser.START)
-                self.state = 642
+                self.state = 782
                 self.match(db2_parser.WITH)
-                self.state = 643
+                self.state = 783
                 self.startValue()
 
 
-            self.state = 649
+            self.state = 789
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==220:
-                self.state = 646
+            if _la==102:
+                self.state = 786
                 self.match(db2_parser.INCREMENT)
-                self.state = 647
+                self.state = 787
                 self.match(db2_parser.BY)
-                self.state = 648
+                self.state = 788
                 self.incrementValue()
 
 
-            self.state = 653
+            self.state = 793
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==221:
-                self.state = 651
+            if _la==103:
+                self.state = 791
                 self.match(db2_parser.MINVALUE)
-                self.state = 652
+                self.state = 792
                 self.minValue()
 
 
-            self.state = 657
+            self.state = 797
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==222:
-                self.state = 655
+            if _la==104:
+                self.state = 795
                 self.match(db2_parser.MAXVALUE)
-                self.state = 656
+                self.state = 796
                 self.maxValue()
 
 
@@ -4851,6 +5647,9 @@ class db2_parser ( Parser ):
         def NUMBER(self):
             return self.getToken(db2_parser.NUMBER, 0)
 
+        def MINUS(self):
+            return self.getToken(db2_parser.MINUS, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_startValue
 
@@ -4874,10 +5673,19 @@ class db2_parser ( Parser ):
     def startValue(self):
 
         localctx = db2_parser.StartValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 94, self.RULE_startValue)
+        self.enterRule(localctx, 102, self.RULE_startValue)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 659
+            self.state = 800
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==14:
+                self.state = 799
+                self.match(db2_parser.MINUS)
+
+
+            self.state = 802
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -4898,6 +5706,9 @@ class db2_parser ( Parser ):
         def NUMBER(self):
             return self.getToken(db2_parser.NUMBER, 0)
 
+        def MINUS(self):
+            return self.getToken(db2_parser.MINUS, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_incrementValue
 
@@ -4921,10 +5732,19 @@ class db2_parser ( Parser ):
     def incrementValue(self):
 
         localctx = db2_parser.IncrementValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 96, self.RULE_incrementValue)
+        self.enterRule(localctx, 104, self.RULE_incrementValue)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 661
+            self.state = 805
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==14:
+                self.state = 804
+                self.match(db2_parser.MINUS)
+
+
+            self.state = 807
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -4945,6 +5765,9 @@ class db2_parser ( Parser ):
         def NUMBER(self):
             return self.getToken(db2_parser.NUMBER, 0)
 
+        def MINUS(self):
+            return self.getToken(db2_parser.MINUS, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_minValue
 
@@ -4968,10 +5791,19 @@ class db2_parser ( Parser ):
     def minValue(self):
 
         localctx = db2_parser.MinValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 98, self.RULE_minValue)
+        self.enterRule(localctx, 106, self.RULE_minValue)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 663
+            self.state = 810
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==14:
+                self.state = 809
+                self.match(db2_parser.MINUS)
+
+
+            self.state = 812
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -4992,6 +5824,9 @@ class db2_parser ( Parser ):
         def NUMBER(self):
             return self.getToken(db2_parser.NUMBER, 0)
 
+        def MINUS(self):
+            return self.getToken(db2_parser.MINUS, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_maxValue
 
@@ -5015,10 +5850,19 @@ class db2_parser ( Parser ):
     def maxValue(self):
 
         localctx = db2_parser.MaxValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 100, self.RULE_maxValue)
+        self.enterRule(localctx, 108, self.RULE_maxValue)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 665
+            self.state = 815
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==14:
+                self.state = 814
+                self.match(db2_parser.MINUS)
+
+
+            self.state = 817
             self.match(db2_parser.NUMBER)
         except RecognitionException as re:
             localctx.exception = re
@@ -5073,16 +5917,16 @@ class db2_parser ( Parser ):
     def alterStatement(self):
 
         localctx = db2_parser.AlterStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 102, self.RULE_alterStatement)
+        self.enterRule(localctx, 110, self.RULE_alterStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 667
+            self.state = 819
             self.match(db2_parser.ALTER)
-            self.state = 668
+            self.state = 820
             self.match(db2_parser.TABLE)
-            self.state = 669
+            self.state = 821
             self.tableName()
-            self.state = 670
+            self.state = 822
             self.alterAction()
         except RecognitionException as re:
             localctx.exception = re
@@ -5120,6 +5964,10 @@ class db2_parser ( Parser ):
         def MODIFY(self):
             return self.getToken(db2_parser.MODIFY, 0)
 
+        def tableConstraint(self):
+            return self.getTypedRuleContext(db2_parser.TableConstraintContext,0)
+
+
         def CONSTRAINT(self):
             return self.getToken(db2_parser.CONSTRAINT, 0)
 
@@ -5127,10 +5975,6 @@ class db2_parser ( Parser ):
             return self.getTypedRuleContext(db2_parser.ConstraintNameContext,0)
 
 
-        def constraintDefinition(self):
-            return self.getTypedRuleContext(db2_parser.ConstraintDefinitionContext,0)
-
-
         def getRuleIndex(self):
             return db2_parser.RULE_alterAction
 
@@ -5154,60 +5998,56 @@ class db2_parser ( Parser ):
     def alterAction(self):
 
         localctx = db2_parser.AlterActionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 104, self.RULE_alterAction)
+        self.enterRule(localctx, 112, self.RULE_alterAction)
         try:
-            self.state = 689
+            self.state = 838
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,64,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,89,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 672
+                self.state = 824
                 self.match(db2_parser.ADD)
-                self.state = 673
+                self.state = 825
                 self.match(db2_parser.COLUMN)
-                self.state = 674
+                self.state = 826
                 self.columnDefinition()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 675
+                self.state = 827
                 self.match(db2_parser.DROP)
-                self.state = 676
+                self.state = 828
                 self.match(db2_parser.COLUMN)
-                self.state = 677
+                self.state = 829
                 self.columnName()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 678
+                self.state = 830
                 self.match(db2_parser.MODIFY)
-                self.state = 679
+                self.state = 831
                 self.match(db2_parser.COLUMN)
-                self.state = 680
+                self.state = 832
                 self.columnDefinition()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 681
+                self.state = 833
                 self.match(db2_parser.ADD)
-                self.state = 682
-                self.match(db2_parser.CONSTRAINT)
-                self.state = 683
-                self.constraintName()
-                self.state = 684
-                self.constraintDefinition()
+                self.state = 834
+                self.tableConstraint()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 686
+                self.state = 835
                 self.match(db2_parser.DROP)
-                self.state = 687
+                self.state = 836
                 self.match(db2_parser.CONSTRAINT)
-                self.state = 688
+                self.state = 837
                 self.constraintName()
                 pass
 
@@ -5254,10 +6094,10 @@ class db2_parser ( Parser ):
     def constraintName(self):
 
         localctx = db2_parser.ConstraintNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 106, self.RULE_constraintName)
+        self.enterRule(localctx, 114, self.RULE_constraintName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 691
+            self.state = 840
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -5313,6 +6153,13 @@ class db2_parser ( Parser ):
             return self.getTypedRuleContext(db2_parser.TableNameContext,0)
 
 
+        def referentialAction(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ReferentialActionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ReferentialActionContext,i)
+
+
         def CHECK(self):
             return self.getToken(db2_parser.CHECK, 0)
 
@@ -5343,74 +6190,84 @@ class db2_parser ( Parser ):
     def constraintDefinition(self):
 
         localctx = db2_parser.ConstraintDefinitionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 108, self.RULE_constraintDefinition)
+        self.enterRule(localctx, 116, self.RULE_constraintDefinition)
         self._la = 0 # Token type
         try:
-            self.state = 722
+            self.state = 877
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [111]:
+            if token in [123]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 693
+                self.state = 842
                 self.match(db2_parser.PRIMARY)
-                self.state = 694
+                self.state = 843
                 self.match(db2_parser.KEY)
-                self.state = 695
+                self.state = 844
                 self.match(db2_parser.LPAREN)
-                self.state = 696
+                self.state = 845
                 self.columnList()
-                self.state = 697
+                self.state = 846
                 self.match(db2_parser.RPAREN)
                 pass
-            elif token in [114]:
+            elif token in [126]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 699
+                self.state = 848
                 self.match(db2_parser.UNIQUE)
-                self.state = 700
+                self.state = 849
                 self.match(db2_parser.LPAREN)
-                self.state = 701
+                self.state = 850
                 self.columnList()
-                self.state = 702
+                self.state = 851
                 self.match(db2_parser.RPAREN)
                 pass
-            elif token in [112]:
+            elif token in [124]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 704
+                self.state = 853
                 self.match(db2_parser.FOREIGN)
-                self.state = 705
+                self.state = 854
                 self.match(db2_parser.KEY)
-                self.state = 706
+                self.state = 855
                 self.match(db2_parser.LPAREN)
-                self.state = 707
+                self.state = 856
                 self.columnList()
-                self.state = 708
+                self.state = 857
                 self.match(db2_parser.RPAREN)
-                self.state = 709
+                self.state = 858
                 self.match(db2_parser.REFERENCES)
-                self.state = 710
+                self.state = 859
                 self.tableName()
-                self.state = 715
+                self.state = 864
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==6:
-                    self.state = 711
+                if _la==5:
+                    self.state = 860
                     self.match(db2_parser.LPAREN)
-                    self.state = 712
+                    self.state = 861
                     self.columnList()
-                    self.state = 713
+                    self.state = 862
                     self.match(db2_parser.RPAREN)
 
 
+                self.state = 869
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==174:
+                    self.state = 866
+                    self.referentialAction()
+                    self.state = 871
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
                 pass
-            elif token in [118]:
+            elif token in [130]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 717
+                self.state = 872
                 self.match(db2_parser.CHECK)
-                self.state = 718
+                self.state = 873
                 self.match(db2_parser.LPAREN)
-                self.state = 719
+                self.state = 874
                 self.checkCondition()
-                self.state = 720
+                self.state = 875
                 self.match(db2_parser.RPAREN)
                 pass
             else:
@@ -5474,20 +6331,20 @@ class db2_parser ( Parser ):
     def dropStatement(self):
 
         localctx = db2_parser.DropStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 110, self.RULE_dropStatement)
+        self.enterRule(localctx, 118, self.RULE_dropStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 724
+            self.state = 879
             self.match(db2_parser.DROP)
-            self.state = 725
+            self.state = 880
             _la = self._input.LA(1)
-            if not(((((_la - 85)) & ~0x3f) == 0 and ((1 << (_la - 85)) & 15) != 0)):
+            if not(((((_la - 88)) & ~0x3f) == 0 and ((1 << (_la - 88)) & 15) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 726
+            self.state = 881
             self.objectName()
         except RecognitionException as re:
             localctx.exception = re
@@ -5505,8 +6362,9 @@ class db2_parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def IDENTIFIER(self):
-            return self.getToken(db2_parser.IDENTIFIER, 0)
+        def tableName(self):
+            return self.getTypedRuleContext(db2_parser.TableNameContext,0)
+
 
         def getRuleIndex(self):
             return db2_parser.RULE_objectName
@@ -5531,11 +6389,11 @@ class db2_parser ( Parser ):
     def objectName(self):
 
         localctx = db2_parser.ObjectNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 112, self.RULE_objectName)
+        self.enterRule(localctx, 120, self.RULE_objectName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 728
-            self.match(db2_parser.IDENTIFIER)
+            self.state = 883
+            self.tableName()
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -5600,22 +6458,22 @@ class db2_parser ( Parser ):
     def grantStatement(self):
 
         localctx = db2_parser.GrantStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 114, self.RULE_grantStatement)
+        self.enterRule(localctx, 122, self.RULE_grantStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 730
+            self.state = 885
             self.match(db2_parser.GRANT)
-            self.state = 731
+            self.state = 886
             self.privilegeList()
-            self.state = 732
+            self.state = 887
             self.match(db2_parser.ON)
-            self.state = 733
+            self.state = 888
             self.objectType()
-            self.state = 734
+            self.state = 889
             self.objectName()
-            self.state = 735
+            self.state = 890
             self.match(db2_parser.TO)
-            self.state = 736
+            self.state = 891
             self.granteeList()
         except RecognitionException as re:
             localctx.exception = re
@@ -5669,21 +6527,21 @@ class db2_parser ( Parser ):
     def privilegeList(self):
 
         localctx = db2_parser.PrivilegeListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 116, self.RULE_privilegeList)
+        self.enterRule(localctx, 124, self.RULE_privilegeList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 738
+            self.state = 893
             self.privilege()
-            self.state = 743
+            self.state = 898
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 739
+            while _la==9:
+                self.state = 894
                 self.match(db2_parser.COMMA)
-                self.state = 740
+                self.state = 895
                 self.privilege()
-                self.state = 745
+                self.state = 900
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -5741,13 +6599,13 @@ class db2_parser ( Parser ):
     def privilege(self):
 
         localctx = db2_parser.PrivilegeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 118, self.RULE_privilege)
+        self.enterRule(localctx, 126, self.RULE_privilege)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 746
+            self.state = 901
             _la = self._input.LA(1)
-            if not(((((_la - 55)) & ~0x3f) == 0 and ((1 << (_la - 55)) & 458753) != 0) or _la==163):
+            if not(((((_la - 55)) & ~0x3f) == 0 and ((1 << (_la - 55)) & 458753) != 0) or _la==178):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -5800,13 +6658,13 @@ class db2_parser ( Parser ):
     def objectType(self):
 
         localctx = db2_parser.ObjectTypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 120, self.RULE_objectType)
+        self.enterRule(localctx, 128, self.RULE_objectType)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 748
+            self.state = 903
             _la = self._input.LA(1)
-            if not(((((_la - 85)) & ~0x3f) == 0 and ((1 << (_la - 85)) & 11) != 0)):
+            if not(((((_la - 88)) & ~0x3f) == 0 and ((1 << (_la - 88)) & 11) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -5863,21 +6721,21 @@ class db2_parser ( Parser ):
     def granteeList(self):
 
         localctx = db2_parser.GranteeListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 122, self.RULE_granteeList)
+        self.enterRule(localctx, 130, self.RULE_granteeList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 750
+            self.state = 905
             self.grantee()
-            self.state = 755
+            self.state = 910
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 751
+            while _la==9:
+                self.state = 906
                 self.match(db2_parser.COMMA)
-                self.state = 752
+                self.state = 907
                 self.grantee()
-                self.state = 757
+                self.state = 912
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -5926,13 +6784,13 @@ class db2_parser ( Parser ):
     def grantee(self):
 
         localctx = db2_parser.GranteeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 124, self.RULE_grantee)
+        self.enterRule(localctx, 132, self.RULE_grantee)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 758
+            self.state = 913
             _la = self._input.LA(1)
-            if not(_la==1 or _la==227):
+            if not(_la==100 or _la==232):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -6001,22 +6859,22 @@ class db2_parser ( Parser ):
     def revokeStatement(self):
 
         localctx = db2_parser.RevokeStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 126, self.RULE_revokeStatement)
+        self.enterRule(localctx, 134, self.RULE_revokeStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 760
+            self.state = 915
             self.match(db2_parser.REVOKE)
-            self.state = 761
+            self.state = 916
             self.privilegeList()
-            self.state = 762
+            self.state = 917
             self.match(db2_parser.ON)
-            self.state = 763
+            self.state = 918
             self.objectType()
-            self.state = 764
+            self.state = 919
             self.objectName()
-            self.state = 765
+            self.state = 920
             self.match(db2_parser.FROM)
-            self.state = 766
+            self.state = 921
             self.granteeList()
         except RecognitionException as re:
             localctx.exception = re
@@ -6063,17 +6921,17 @@ class db2_parser ( Parser ):
     def commitStatement(self):
 
         localctx = db2_parser.CommitStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 128, self.RULE_commitStatement)
+        self.enterRule(localctx, 136, self.RULE_commitStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 768
+            self.state = 923
             self.match(db2_parser.COMMIT)
-            self.state = 770
+            self.state = 925
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==172:
-                self.state = 769
+            if _la==187:
+                self.state = 924
                 self.match(db2_parser.WORK)
 
 
@@ -6132,29 +6990,29 @@ class db2_parser ( Parser ):
     def rollbackStatement(self):
 
         localctx = db2_parser.RollbackStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 130, self.RULE_rollbackStatement)
+        self.enterRule(localctx, 138, self.RULE_rollbackStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 772
+            self.state = 927
             self.match(db2_parser.ROLLBACK)
-            self.state = 774
+            self.state = 929
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==172:
-                self.state = 773
+            if _la==187:
+                self.state = 928
                 self.match(db2_parser.WORK)
 
 
-            self.state = 779
+            self.state = 934
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==226:
-                self.state = 776
+            if _la==79:
+                self.state = 931
                 self.match(db2_parser.TO)
-                self.state = 777
+                self.state = 932
                 self.match(db2_parser.SAVEPOINT)
-                self.state = 778
+                self.state = 933
                 self.savepointName()
 
 
@@ -6206,19 +7064,19 @@ class db2_parser ( Parser ):
     def beginStatement(self):
 
         localctx = db2_parser.BeginStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 132, self.RULE_beginStatement)
+        self.enterRule(localctx, 140, self.RULE_beginStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 781
+            self.state = 936
             self.match(db2_parser.BEGIN)
-            self.state = 783
+            self.state = 938
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==172 or _la==173:
-                self.state = 782
+            if _la==187 or _la==188:
+                self.state = 937
                 _la = self._input.LA(1)
-                if not(_la==172 or _la==173):
+                if not(_la==187 or _la==188):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
@@ -6267,10 +7125,10 @@ class db2_parser ( Parser ):
     def savepointName(self):
 
         localctx = db2_parser.SavepointNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 134, self.RULE_savepointName)
+        self.enterRule(localctx, 142, self.RULE_savepointName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 785
+            self.state = 940
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -6325,16 +7183,16 @@ class db2_parser ( Parser ):
     def setStatement(self):
 
         localctx = db2_parser.SetStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 136, self.RULE_setStatement)
+        self.enterRule(localctx, 144, self.RULE_setStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 787
+            self.state = 942
             self.match(db2_parser.SET)
-            self.state = 788
+            self.state = 943
             self.optionName()
-            self.state = 789
+            self.state = 944
             self.match(db2_parser.EQUALS)
-            self.state = 790
+            self.state = 945
             self.optionValue()
         except RecognitionException as re:
             localctx.exception = re
@@ -6378,10 +7236,10 @@ class db2_parser ( Parser ):
     def optionName(self):
 
         localctx = db2_parser.OptionNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 138, self.RULE_optionName)
+        self.enterRule(localctx, 146, self.RULE_optionName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 792
+            self.state = 947
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -6392,149 +7250,585 @@ class db2_parser ( Parser ):
         return localctx
 
 
-    class OptionValueContext(ParserRuleContext):
-        __slots__ = 'parser'
+    class OptionValueContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expression(self):
+            return self.getTypedRuleContext(db2_parser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_optionValue
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOptionValue" ):
+                listener.enterOptionValue(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOptionValue" ):
+                listener.exitOptionValue(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOptionValue" ):
+                return visitor.visitOptionValue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def optionValue(self):
+
+        localctx = db2_parser.OptionValueContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 148, self.RULE_optionValue)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 949
+            self.expression(0)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CommentStatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def COMMENT(self):
+            return self.getToken(db2_parser.COMMENT, 0)
+
+        def ON(self):
+            return self.getToken(db2_parser.ON, 0)
+
+        def objectName(self):
+            return self.getTypedRuleContext(db2_parser.ObjectNameContext,0)
+
+
+        def IS(self):
+            return self.getToken(db2_parser.IS, 0)
+
+        def STRING(self):
+            return self.getToken(db2_parser.STRING, 0)
+
+        def TABLE(self):
+            return self.getToken(db2_parser.TABLE, 0)
+
+        def COLUMN(self):
+            return self.getToken(db2_parser.COLUMN, 0)
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_commentStatement
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCommentStatement" ):
+                listener.enterCommentStatement(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCommentStatement" ):
+                listener.exitCommentStatement(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCommentStatement" ):
+                return visitor.visitCommentStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def commentStatement(self):
+
+        localctx = db2_parser.CommentStatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 150, self.RULE_commentStatement)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 951
+            self.match(db2_parser.COMMENT)
+            self.state = 952
+            self.match(db2_parser.ON)
+            self.state = 953
+            _la = self._input.LA(1)
+            if not(_la==88 or _la==96):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+            self.state = 954
+            self.objectName()
+            self.state = 955
+            self.match(db2_parser.IS)
+            self.state = 956
+            self.match(db2_parser.STRING)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_expression
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+    class CastExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def castExpression(self):
+            return self.getTypedRuleContext(db2_parser.CastExpressionContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCastExpr" ):
+                listener.enterCastExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCastExpr" ):
+                listener.exitCastExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCastExpr" ):
+                return visitor.visitCastExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class InExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
+
+        def LPAREN(self):
+            return self.getToken(db2_parser.LPAREN, 0)
+        def RPAREN(self):
+            return self.getToken(db2_parser.RPAREN, 0)
+        def IN(self):
+            return self.getToken(db2_parser.IN, 0)
+        def NOT_IN(self):
+            return self.getToken(db2_parser.NOT_IN, 0)
+        def selectStatement(self):
+            return self.getTypedRuleContext(db2_parser.SelectStatementContext,0)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.COMMA)
+            else:
+                return self.getToken(db2_parser.COMMA, i)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterInExpr" ):
+                listener.enterInExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitInExpr" ):
+                listener.exitInExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitInExpr" ):
+                return visitor.visitInExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class OrExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
+
+        def OR(self):
+            return self.getToken(db2_parser.OR, 0)
+        def XOR(self):
+            return self.getToken(db2_parser.XOR, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOrExpr" ):
+                listener.enterOrExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOrExpr" ):
+                listener.exitOrExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrExpr" ):
+                return visitor.visitOrExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ComparisonExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
+
+        def comparisonOperator(self):
+            return self.getTypedRuleContext(db2_parser.ComparisonOperatorContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterComparisonExpr" ):
+                listener.enterComparisonExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitComparisonExpr" ):
+                listener.exitComparisonExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitComparisonExpr" ):
+                return visitor.visitComparisonExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class AdditiveExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
+
+        def PLUS(self):
+            return self.getToken(db2_parser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(db2_parser.MINUS, 0)
+        def CONCAT(self):
+            return self.getToken(db2_parser.CONCAT, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterAdditiveExpr" ):
+                listener.enterAdditiveExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitAdditiveExpr" ):
+                listener.exitAdditiveExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAdditiveExpr" ):
+                return visitor.visitAdditiveExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ExistsExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def subquery(self):
+            return self.getTypedRuleContext(db2_parser.SubqueryContext,0)
+
+        def EXISTS(self):
+            return self.getToken(db2_parser.EXISTS, 0)
+        def NOT_EXISTS(self):
+            return self.getToken(db2_parser.NOT_EXISTS, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExistsExpr" ):
+                listener.enterExistsExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExistsExpr" ):
+                listener.exitExistsExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExistsExpr" ):
+                return visitor.visitExistsExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ParenExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def LPAREN(self):
+            return self.getToken(db2_parser.LPAREN, 0)
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
+
+        def RPAREN(self):
+            return self.getToken(db2_parser.RPAREN, 0)
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.COMMA)
+            else:
+                return self.getToken(db2_parser.COMMA, i)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterParenExpr" ):
+                listener.enterParenExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitParenExpr" ):
+                listener.exitParenExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParenExpr" ):
+                return visitor.visitParenExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class FunctionExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def functionCall(self):
+            return self.getTypedRuleContext(db2_parser.FunctionCallContext,0)
+
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFunctionExpr" ):
+                listener.enterFunctionExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFunctionExpr" ):
+                listener.exitFunctionExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctionExpr" ):
+                return visitor.visitFunctionExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BetweenExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
+
+        def AND(self):
+            return self.getToken(db2_parser.AND, 0)
+        def BETWEEN(self):
+            return self.getToken(db2_parser.BETWEEN, 0)
+        def NOT_BETWEEN(self):
+            return self.getToken(db2_parser.NOT_BETWEEN, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBetweenExpr" ):
+                listener.enterBetweenExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBetweenExpr" ):
+                listener.exitBetweenExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBetweenExpr" ):
+                return visitor.visitBetweenExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class UnaryExprContext(ExpressionContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def expression(self):
+            return self.getTypedRuleContext(db2_parser.ExpressionContext,0)
+
+        def PLUS(self):
+            return self.getToken(db2_parser.PLUS, 0)
+        def MINUS(self):
+            return self.getToken(db2_parser.MINUS, 0)
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterUnaryExpr" ):
+                listener.enterUnaryExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitUnaryExpr" ):
+                listener.exitUnaryExpr(self)
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaryExpr" ):
+                return visitor.visitUnaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class NotExprContext(ExpressionContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def NOT(self):
+            return self.getToken(db2_parser.NOT, 0)
         def expression(self):
             return self.getTypedRuleContext(db2_parser.ExpressionContext,0)
 
 
-        def getRuleIndex(self):
-            return db2_parser.RULE_optionValue
-
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterOptionValue" ):
-                listener.enterOptionValue(self)
+            if hasattr( listener, "enterNotExpr" ):
+                listener.enterNotExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitOptionValue" ):
-                listener.exitOptionValue(self)
+            if hasattr( listener, "exitNotExpr" ):
+                listener.exitNotExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitOptionValue" ):
-                return visitor.visitOptionValue(self)
+            if hasattr( visitor, "visitNotExpr" ):
+                return visitor.visitNotExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class PrimaryExprContext(ExpressionContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
-    def optionValue(self):
+        def primaryExpression(self):
+            return self.getTypedRuleContext(db2_parser.PrimaryExpressionContext,0)
 
-        localctx = db2_parser.OptionValueContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 140, self.RULE_optionValue)
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 794
-            self.expression(0)
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
 
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPrimaryExpr" ):
+                listener.enterPrimaryExpr(self)
 
-    class CommentStatementContext(ParserRuleContext):
-        __slots__ = 'parser'
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPrimaryExpr" ):
+                listener.exitPrimaryExpr(self)
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimaryExpr" ):
+                return visitor.visitPrimaryExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
-        def COMMENT(self):
-            return self.getToken(db2_parser.COMMENT, 0)
 
-        def ON(self):
-            return self.getToken(db2_parser.ON, 0)
+    class IsNullExprContext(ExpressionContext):
 
-        def objectName(self):
-            return self.getTypedRuleContext(db2_parser.ObjectNameContext,0)
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
+        def expression(self):
+            return self.getTypedRuleContext(db2_parser.ExpressionContext,0)
 
+        def NULL(self):
+            return self.getToken(db2_parser.NULL, 0)
         def IS(self):
             return self.getToken(db2_parser.IS, 0)
-
-        def STRING(self):
-            return self.getToken(db2_parser.STRING, 0)
-
-        def TABLE(self):
-            return self.getToken(db2_parser.TABLE, 0)
-
-        def COLUMN(self):
-            return self.getToken(db2_parser.COLUMN, 0)
-
-        def getRuleIndex(self):
-            return db2_parser.RULE_commentStatement
+        def IS_NOT(self):
+            return self.getToken(db2_parser.IS_NOT, 0)
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterCommentStatement" ):
-                listener.enterCommentStatement(self)
+            if hasattr( listener, "enterIsNullExpr" ):
+                listener.enterIsNullExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitCommentStatement" ):
-                listener.exitCommentStatement(self)
+            if hasattr( listener, "exitIsNullExpr" ):
+                listener.exitIsNullExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitCommentStatement" ):
-                return visitor.visitCommentStatement(self)
+            if hasattr( visitor, "visitIsNullExpr" ):
+                return visitor.visitIsNullExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class CaseExprContext(ExpressionContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
-    def commentStatement(self):
+        def caseExpression(self):
+            return self.getTypedRuleContext(db2_parser.CaseExpressionContext,0)
 
-        localctx = db2_parser.CommentStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 142, self.RULE_commentStatement)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 796
-            self.match(db2_parser.COMMENT)
-            self.state = 797
-            self.match(db2_parser.ON)
-            self.state = 798
-            _la = self._input.LA(1)
-            if not(_la==85 or _la==224):
-                self._errHandler.recoverInline(self)
-            else:
-                self._errHandler.reportMatch(self)
-                self.consume()
-            self.state = 799
-            self.objectName()
-            self.state = 800
-            self.match(db2_parser.IS)
-            self.state = 801
-            self.match(db2_parser.STRING)
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
 
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCaseExpr" ):
+                listener.enterCaseExpr(self)
 
-    class ExpressionContext(ParserRuleContext):
-        __slots__ = 'parser'
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCaseExpr" ):
+                listener.exitCaseExpr(self)
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCaseExpr" ):
+                return visitor.visitCaseExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
-        def primaryExpression(self):
-            return self.getTypedRuleContext(db2_parser.PrimaryExpressionContext,0)
 
+    class MultiplicativeExprContext(ExpressionContext):
 
-        def LPAREN(self):
-            return self.getToken(db2_parser.LPAREN, 0)
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
         def expression(self, i:int=None):
             if i is None:
@@ -6542,40 +7836,56 @@ class db2_parser ( Parser ):
             else:
                 return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
 
+        def ASTERISK(self):
+            return self.getToken(db2_parser.ASTERISK, 0)
+        def SLASH(self):
+            return self.getToken(db2_parser.SLASH, 0)
+        def PERCENT(self):
+            return self.getToken(db2_parser.PERCENT, 0)
+        def POWER(self):
+            return self.getToken(db2_parser.POWER, 0)
 
-        def RPAREN(self):
-            return self.getToken(db2_parser.RPAREN, 0)
-
-        def functionCall(self):
-            return self.getTypedRuleContext(db2_parser.FunctionCallContext,0)
-
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterMultiplicativeExpr" ):
+                listener.enterMultiplicativeExpr(self)
 
-        def caseExpression(self):
-            return self.getTypedRuleContext(db2_parser.CaseExpressionContext,0)
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitMultiplicativeExpr" ):
+                listener.exitMultiplicativeExpr(self)
 
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMultiplicativeExpr" ):
+                return visitor.visitMultiplicativeExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
-        def castExpression(self):
-            return self.getTypedRuleContext(db2_parser.CastExpressionContext,0)
 
+    class AndExprContext(ExpressionContext):
 
-        def operator(self):
-            return self.getTypedRuleContext(db2_parser.OperatorContext,0)
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a db2_parser.ExpressionContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(db2_parser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(db2_parser.ExpressionContext,i)
 
-        def getRuleIndex(self):
-            return db2_parser.RULE_expression
+        def AND(self):
+            return self.getToken(db2_parser.AND, 0)
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterExpression" ):
-                listener.enterExpression(self)
+            if hasattr( listener, "enterAndExpr" ):
+                listener.enterAndExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitExpression" ):
-                listener.exitExpression(self)
+            if hasattr( listener, "exitAndExpr" ):
+                listener.exitAndExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitExpression" ):
-                return visitor.visitExpression(self)
+            if hasattr( visitor, "visitAndExpr" ):
+                return visitor.visitAndExpr(self)
             else:
                 return visitor.visitChildren(self)
 
@@ -6586,65 +7896,294 @@ class db2_parser ( Parser ):
         _parentState = self.state
         localctx = db2_parser.ExpressionContext(self, self._ctx, _parentState)
         _prevctx = localctx
-        _startState = 144
-        self.enterRecursionRule(localctx, 144, self.RULE_expression, _p)
+        _startState = 152
+        self.enterRecursionRule(localctx, 152, self.RULE_expression, _p)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 812
+            self.state = 980
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,73,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,100,self._ctx)
             if la_ == 1:
-                self.state = 804
+                localctx = db2_parser.PrimaryExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 959
                 self.primaryExpression()
                 pass
 
             elif la_ == 2:
-                self.state = 805
-                self.match(db2_parser.LPAREN)
-                self.state = 806
-                self.expression(0)
-                self.state = 807
-                self.match(db2_parser.RPAREN)
+                localctx = db2_parser.FunctionExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 960
+                self.functionCall()
                 pass
 
             elif la_ == 3:
-                self.state = 809
-                self.functionCall()
+                localctx = db2_parser.CaseExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 961
+                self.caseExpression()
                 pass
 
             elif la_ == 4:
-                self.state = 810
-                self.caseExpression()
+                localctx = db2_parser.CastExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 962
+                self.castExpression()
                 pass
 
             elif la_ == 5:
-                self.state = 811
-                self.castExpression()
+                localctx = db2_parser.ParenExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 963
+                self.match(db2_parser.LPAREN)
+                self.state = 964
+                self.expression(0)
+                self.state = 969
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==9:
+                    self.state = 965
+                    self.match(db2_parser.COMMA)
+                    self.state = 966
+                    self.expression(0)
+                    self.state = 971
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 972
+                self.match(db2_parser.RPAREN)
+                pass
+
+            elif la_ == 6:
+                localctx = db2_parser.UnaryExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 974
+                _la = self._input.LA(1)
+                if not(_la==13 or _la==14):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 975
+                self.expression(11)
+                pass
+
+            elif la_ == 7:
+                localctx = db2_parser.ExistsExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 976
+                _la = self._input.LA(1)
+                if not(_la==45 or _la==46):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+                self.state = 977
+                self.subquery()
+                pass
+
+            elif la_ == 8:
+                localctx = db2_parser.NotExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 978
+                self.match(db2_parser.NOT)
+                self.state = 979
+                self.expression(3)
                 pass
 
 
             self._ctx.stop = self._input.LT(-1)
-            self.state = 820
+            self.state = 1025
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,74,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,104,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
                     if self._parseListeners is not None:
                         self.triggerExitRuleEvent()
                     _prevctx = localctx
-                    localctx = db2_parser.ExpressionContext(self, _parentctx, _parentState)
-                    self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                    self.state = 814
-                    if not self.precpred(self._ctx, 5):
-                        from antlr4.error.Errors import FailedPredicateException
-                        raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
-                    self.state = 815
-                    self.operator()
-                    self.state = 816
-                    self.expression(6) 
-                self.state = 822
+                    self.state = 1023
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,103,self._ctx)
+                    if la_ == 1:
+                        localctx = db2_parser.MultiplicativeExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 982
+                        if not self.precpred(self._ctx, 10):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
+                        self.state = 983
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2251799813914624) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 984
+                        self.expression(11)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = db2_parser.AdditiveExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 985
+                        if not self.precpred(self._ctx, 9):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
+                        self.state = 986
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 268460032) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 987
+                        self.expression(10)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = db2_parser.BetweenExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 988
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 989
+                        _la = self._input.LA(1)
+                        if not(_la==41 or _la==42):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 990
+                        self.expression(0)
+                        self.state = 991
+                        self.match(db2_parser.AND)
+                        self.state = 992
+                        self.expression(8)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = db2_parser.ComparisonExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 994
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 995
+                        self.comparisonOperator()
+                        self.state = 996
+                        self.expression(6)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = db2_parser.AndExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 998
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 999
+                        self.match(db2_parser.AND)
+                        self.state = 1000
+                        self.expression(3)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = db2_parser.OrExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 1001
+                        if not self.precpred(self._ctx, 1):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                        self.state = 1002
+                        _la = self._input.LA(1)
+                        if not(_la==48 or _la==50):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 1003
+                        self.expression(2)
+                        pass
+
+                    elif la_ == 7:
+                        localctx = db2_parser.IsNullExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 1004
+                        if not self.precpred(self._ctx, 8):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
+                        self.state = 1005
+                        _la = self._input.LA(1)
+                        if not(_la==43 or _la==44):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 1006
+                        self.match(db2_parser.NULL)
+                        pass
+
+                    elif la_ == 8:
+                        localctx = db2_parser.InExprContext(self, db2_parser.ExpressionContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
+                        self.state = 1007
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 1008
+                        _la = self._input.LA(1)
+                        if not(_la==39 or _la==40):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 1009
+                        self.match(db2_parser.LPAREN)
+                        self.state = 1019
+                        self._errHandler.sync(self)
+                        token = self._input.LA(1)
+                        if token in [55]:
+                            self.state = 1010
+                            self.selectStatement()
+                            pass
+                        elif token in [1, 2, 3, 4, 5, 11, 13, 14, 23, 45, 46, 49, 128, 140, 141, 142, 143, 144, 145, 146, 147, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 192, 193, 194, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232]:
+                            self.state = 1011
+                            self.expression(0)
+                            self.state = 1016
+                            self._errHandler.sync(self)
+                            _la = self._input.LA(1)
+                            while _la==9:
+                                self.state = 1012
+                                self.match(db2_parser.COMMA)
+                                self.state = 1013
+                                self.expression(0)
+                                self.state = 1018
+                                self._errHandler.sync(self)
+                                _la = self._input.LA(1)
+
+                            pass
+                        else:
+                            raise NoViableAltException(self)
+
+                        self.state = 1021
+                        self.match(db2_parser.RPAREN)
+                        pass
+
+             
+                self.state = 1027
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,74,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,104,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -6701,29 +8240,29 @@ class db2_parser ( Parser ):
     def primaryExpression(self):
 
         localctx = db2_parser.PrimaryExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 146, self.RULE_primaryExpression)
+        self.enterRule(localctx, 154, self.RULE_primaryExpression)
         try:
-            self.state = 827
+            self.state = 1032
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [2, 3, 4, 5, 116, 177, 178, 179]:
+            if token in [1, 2, 3, 4, 128, 192, 193, 194]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 823
+                self.state = 1028
                 self.literal()
                 pass
-            elif token in [1]:
+            elif token in [232]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 824
+                self.state = 1029
                 self.columnReference()
                 pass
-            elif token in [24]:
+            elif token in [11, 23]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 825
+                self.state = 1030
                 self.parameter()
                 pass
-            elif token in [6]:
+            elif token in [5]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 826
+                self.state = 1031
                 self.subquery()
                 pass
             else:
@@ -6792,13 +8331,13 @@ class db2_parser ( Parser ):
     def literal(self):
 
         localctx = db2_parser.LiteralContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 148, self.RULE_literal)
+        self.enterRule(localctx, 156, self.RULE_literal)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 829
+            self.state = 1034
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 60) != 0) or ((((_la - 116)) & ~0x3f) == 0 and ((1 << (_la - 116)) & -2305843009213693951) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30) != 0) or _la==128 or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & 7) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -6823,51 +8362,115 @@ class db2_parser ( Parser ):
             return self.getTypedRuleContext(db2_parser.ColumnNameContext,0)
 
 
-        def tableName(self):
-            return self.getTypedRuleContext(db2_parser.TableNameContext,0)
+        def tableQualifier(self):
+            return self.getTypedRuleContext(db2_parser.TableQualifierContext,0)
+
+
+        def DOT(self):
+            return self.getToken(db2_parser.DOT, 0)
+
+        def getRuleIndex(self):
+            return db2_parser.RULE_columnReference
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterColumnReference" ):
+                listener.enterColumnReference(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitColumnReference" ):
+                listener.exitColumnReference(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitColumnReference" ):
+                return visitor.visitColumnReference(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def columnReference(self):
+
+        localctx = db2_parser.ColumnReferenceContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 158, self.RULE_columnReference)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 1039
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,106,self._ctx)
+            if la_ == 1:
+                self.state = 1036
+                self.tableQualifier()
+                self.state = 1037
+                self.match(db2_parser.DOT)
+
+
+            self.state = 1041
+            self.columnName()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TableQualifierContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIER(self):
+            return self.getToken(db2_parser.IDENTIFIER, 0)
+
+        def schemaName(self):
+            return self.getTypedRuleContext(db2_parser.SchemaNameContext,0)
 
 
         def DOT(self):
             return self.getToken(db2_parser.DOT, 0)
 
         def getRuleIndex(self):
-            return db2_parser.RULE_columnReference
+            return db2_parser.RULE_tableQualifier
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterColumnReference" ):
-                listener.enterColumnReference(self)
+            if hasattr( listener, "enterTableQualifier" ):
+                listener.enterTableQualifier(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitColumnReference" ):
-                listener.exitColumnReference(self)
+            if hasattr( listener, "exitTableQualifier" ):
+                listener.exitTableQualifier(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitColumnReference" ):
-                return visitor.visitColumnReference(self)
+            if hasattr( visitor, "visitTableQualifier" ):
+                return visitor.visitTableQualifier(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def columnReference(self):
+    def tableQualifier(self):
 
-        localctx = db2_parser.ColumnReferenceContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 150, self.RULE_columnReference)
+        localctx = db2_parser.TableQualifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 160, self.RULE_tableQualifier)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 834
+            self.state = 1046
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,76,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,107,self._ctx)
             if la_ == 1:
-                self.state = 831
-                self.tableName()
-                self.state = 832
+                self.state = 1043
+                self.schemaName()
+                self.state = 1044
                 self.match(db2_parser.DOT)
 
 
-            self.state = 836
-            self.columnName()
+            self.state = 1048
+            self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -6887,6 +8490,16 @@ class db2_parser ( Parser ):
         def IDENTIFIER(self):
             return self.getToken(db2_parser.IDENTIFIER, 0)
 
+        def schemaName(self):
+            return self.getTypedRuleContext(db2_parser.SchemaNameContext,0)
+
+
+        def DOT(self):
+            return self.getToken(db2_parser.DOT, 0)
+
+        def SLASH(self):
+            return self.getToken(db2_parser.SLASH, 0)
+
         def getRuleIndex(self):
             return db2_parser.RULE_tableName
 
@@ -6910,10 +8523,26 @@ class db2_parser ( Parser ):
     def tableName(self):
 
         localctx = db2_parser.TableNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 152, self.RULE_tableName)
+        self.enterRule(localctx, 162, self.RULE_tableName)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 838
+            self.state = 1053
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,108,self._ctx)
+            if la_ == 1:
+                self.state = 1050
+                self.schemaName()
+                self.state = 1051
+                _la = self._input.LA(1)
+                if not(_la==16 or _la==21):
+                    self._errHandler.recoverInline(self)
+                else:
+                    self._errHandler.reportMatch(self)
+                    self.consume()
+
+
+            self.state = 1055
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -6924,7 +8553,7 @@ class db2_parser ( Parser ):
         return localctx
 
 
-    class ColumnNameContext(ParserRuleContext):
+    class SchemaNameContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
@@ -6935,32 +8564,32 @@ class db2_parser ( Parser ):
             return self.getToken(db2_parser.IDENTIFIER, 0)
 
         def getRuleIndex(self):
-            return db2_parser.RULE_columnName
+            return db2_parser.RULE_schemaName
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterColumnName" ):
-                listener.enterColumnName(self)
+            if hasattr( listener, "enterSchemaName" ):
+                listener.enterSchemaName(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitColumnName" ):
-                listener.exitColumnName(self)
+            if hasattr( listener, "exitSchemaName" ):
+                listener.exitSchemaName(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitColumnName" ):
-                return visitor.visitColumnName(self)
+            if hasattr( visitor, "visitSchemaName" ):
+                return visitor.visitSchemaName(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def columnName(self):
+    def schemaName(self):
 
-        localctx = db2_parser.ColumnNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 154, self.RULE_columnName)
+        localctx = db2_parser.SchemaNameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 164, self.RULE_schemaName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 840
+            self.state = 1057
             self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
@@ -6971,44 +8600,44 @@ class db2_parser ( Parser ):
         return localctx
 
 
-    class ParameterContext(ParserRuleContext):
+    class ColumnNameContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def QUESTION(self):
-            return self.getToken(db2_parser.QUESTION, 0)
+        def IDENTIFIER(self):
+            return self.getToken(db2_parser.IDENTIFIER, 0)
 
         def getRuleIndex(self):
-            return db2_parser.RULE_parameter
+            return db2_parser.RULE_columnName
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterParameter" ):
-                listener.enterParameter(self)
+            if hasattr( listener, "enterColumnName" ):
+                listener.enterColumnName(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitParameter" ):
-                listener.exitParameter(self)
+            if hasattr( listener, "exitColumnName" ):
+                listener.exitColumnName(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitParameter" ):
-                return visitor.visitParameter(self)
+            if hasattr( visitor, "visitColumnName" ):
+                return visitor.visitColumnName(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def parameter(self):
+    def columnName(self):
 
-        localctx = db2_parser.ParameterContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 156, self.RULE_parameter)
+        localctx = db2_parser.ColumnNameContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 166, self.RULE_columnName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 842
-            self.match(db2_parser.QUESTION)
+            self.state = 1059
+            self.match(db2_parser.IDENTIFIER)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -7018,67 +8647,57 @@ class db2_parser ( Parser ):
         return localctx
 
 
-    class OperatorContext(ParserRuleContext):
+    class ParameterContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def arithmeticOperator(self):
-            return self.getTypedRuleContext(db2_parser.ArithmeticOperatorContext,0)
-
-
-        def comparisonOperator(self):
-            return self.getTypedRuleContext(db2_parser.ComparisonOperatorContext,0)
-
+        def QUESTION(self):
+            return self.getToken(db2_parser.QUESTION, 0)
 
-        def logicalOperator(self):
-            return self.getTypedRuleContext(db2_parser.LogicalOperatorContext,0)
+        def hostVariable(self):
+            return self.getTypedRuleContext(db2_parser.HostVariableContext,0)
 
 
         def getRuleIndex(self):
-            return db2_parser.RULE_operator
+            return db2_parser.RULE_parameter
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterOperator" ):
-                listener.enterOperator(self)
+            if hasattr( listener, "enterParameter" ):
+                listener.enterParameter(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitOperator" ):
-                listener.exitOperator(self)
+            if hasattr( listener, "exitParameter" ):
+                listener.exitParameter(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitOperator" ):
-                return visitor.visitOperator(self)
+            if hasattr( visitor, "visitParameter" ):
+                return visitor.visitParameter(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def operator(self):
+    def parameter(self):
 
-        localctx = db2_parser.OperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 158, self.RULE_operator)
+        localctx = db2_parser.ParameterContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 168, self.RULE_parameter)
         try:
-            self.state = 847
+            self.state = 1063
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [14, 15, 16, 17, 18, 51]:
+            if token in [23]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 844
-                self.arithmeticOperator()
+                self.state = 1061
+                self.match(db2_parser.QUESTION)
                 pass
-            elif token in [32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 228]:
+            elif token in [11]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 845
-                self.comparisonOperator()
-                pass
-            elif token in [47, 48, 49, 50]:
-                self.enterOuterAlt(localctx, 3)
-                self.state = 846
-                self.logicalOperator()
+                self.state = 1062
+                self.hostVariable()
                 pass
             else:
                 raise NoViableAltException(self)
@@ -7092,65 +8711,78 @@ class db2_parser ( Parser ):
         return localctx
 
 
-    class ArithmeticOperatorContext(ParserRuleContext):
+    class HostVariableContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def PLUS(self):
-            return self.getToken(db2_parser.PLUS, 0)
-
-        def MINUS(self):
-            return self.getToken(db2_parser.MINUS, 0)
-
-        def ASTERISK(self):
-            return self.getToken(db2_parser.ASTERISK, 0)
-
-        def SLASH(self):
-            return self.getToken(db2_parser.SLASH, 0)
+        def COLON(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.COLON)
+            else:
+                return self.getToken(db2_parser.COLON, i)
 
-        def PERCENT(self):
-            return self.getToken(db2_parser.PERCENT, 0)
+        def IDENTIFIER(self, i:int=None):
+            if i is None:
+                return self.getTokens(db2_parser.IDENTIFIER)
+            else:
+                return self.getToken(db2_parser.IDENTIFIER, i)
 
-        def POWER(self):
-            return self.getToken(db2_parser.POWER, 0)
+        def DOT(self):
+            return self.getToken(db2_parser.DOT, 0)
 
         def getRuleIndex(self):
-            return db2_parser.RULE_arithmeticOperator
+            return db2_parser.RULE_hostVariable
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterArithmeticOperator" ):
-                listener.enterArithmeticOperator(self)
+            if hasattr( listener, "enterHostVariable" ):
+                listener.enterHostVariable(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitArithmeticOperator" ):
-                listener.exitArithmeticOperator(self)
+            if hasattr( listener, "exitHostVariable" ):
+                listener.exitHostVariable(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitArithmeticOperator" ):
-                return visitor.visitArithmeticOperator(self)
+            if hasattr( visitor, "visitHostVariable" ):
+                return visitor.visitHostVariable(self)
             else:
                 return visitor.visitChildren(self)
 
 
 
 
-    def arithmeticOperator(self):
+    def hostVariable(self):
 
-        localctx = db2_parser.ArithmeticOperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 160, self.RULE_arithmeticOperator)
-        self._la = 0 # Token type
+        localctx = db2_parser.HostVariableContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 170, self.RULE_hostVariable)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 849
-            _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2251799814193152) != 0)):
-                self._errHandler.recoverInline(self)
-            else:
-                self._errHandler.reportMatch(self)
-                self.consume()
+            self.state = 1065
+            self.match(db2_parser.COLON)
+            self.state = 1066
+            self.match(db2_parser.IDENTIFIER)
+            self.state = 1069
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,110,self._ctx)
+            if la_ == 1:
+                self.state = 1067
+                self.match(db2_parser.DOT)
+                self.state = 1068
+                self.match(db2_parser.IDENTIFIER)
+
+
+            self.state = 1073
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,111,self._ctx)
+            if la_ == 1:
+                self.state = 1071
+                self.match(db2_parser.COLON)
+                self.state = 1072
+                self.match(db2_parser.IDENTIFIER)
+
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -7167,8 +8799,8 @@ class db2_parser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def EQ(self):
-            return self.getToken(db2_parser.EQ, 0)
+        def EQUALS(self):
+            return self.getToken(db2_parser.EQUALS, 0)
 
         def NE(self):
             return self.getToken(db2_parser.NE, 0)
@@ -7191,30 +8823,6 @@ class db2_parser ( Parser ):
         def NOT_LIKE(self):
             return self.getToken(db2_parser.NOT_LIKE, 0)
 
-        def IN(self):
-            return self.getToken(db2_parser.IN, 0)
-
-        def NOT_IN(self):
-            return self.getToken(db2_parser.NOT_IN, 0)
-
-        def BETWEEN(self):
-            return self.getToken(db2_parser.BETWEEN, 0)
-
-        def NOT_BETWEEN(self):
-            return self.getToken(db2_parser.NOT_BETWEEN, 0)
-
-        def IS(self):
-            return self.getToken(db2_parser.IS, 0)
-
-        def IS_NOT(self):
-            return self.getToken(db2_parser.IS_NOT, 0)
-
-        def EXISTS(self):
-            return self.getToken(db2_parser.EXISTS, 0)
-
-        def NOT_EXISTS(self):
-            return self.getToken(db2_parser.NOT_EXISTS, 0)
-
         def getRuleIndex(self):
             return db2_parser.RULE_comparisonOperator
 
@@ -7238,75 +8846,13 @@ class db2_parser ( Parser ):
     def comparisonOperator(self):
 
         localctx = db2_parser.ComparisonOperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 162, self.RULE_comparisonOperator)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 851
-            _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 140733193388032) != 0) or _la==228):
-                self._errHandler.recoverInline(self)
-            else:
-                self._errHandler.reportMatch(self)
-                self.consume()
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class LogicalOperatorContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def AND(self):
-            return self.getToken(db2_parser.AND, 0)
-
-        def OR(self):
-            return self.getToken(db2_parser.OR, 0)
-
-        def NOT(self):
-            return self.getToken(db2_parser.NOT, 0)
-
-        def XOR(self):
-            return self.getToken(db2_parser.XOR, 0)
-
-        def getRuleIndex(self):
-            return db2_parser.RULE_logicalOperator
-
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLogicalOperator" ):
-                listener.enterLogicalOperator(self)
-
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLogicalOperator" ):
-                listener.exitLogicalOperator(self)
-
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLogicalOperator" ):
-                return visitor.visitLogicalOperator(self)
-            else:
-                return visitor.visitChildren(self)
-
-
-
-
-    def logicalOperator(self):
-
-        localctx = db2_parser.LogicalOperatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 164, self.RULE_logicalOperator)
+        self.enterRule(localctx, 172, self.RULE_comparisonOperator)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 853
+            self.state = 1075
             _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2111062325329920) != 0)):
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 545460850688) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -7377,52 +8923,52 @@ class db2_parser ( Parser ):
     def functionCall(self):
 
         localctx = db2_parser.FunctionCallContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 166, self.RULE_functionCall)
+        self.enterRule(localctx, 174, self.RULE_functionCall)
         self._la = 0 # Token type
         try:
-            self.state = 867
+            self.state = 1089
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [1, 125, 126, 127, 128, 129, 130, 131, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149]:
+            if token in [140, 141, 142, 143, 144, 145, 146, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 232]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 855
+                self.state = 1077
                 self.functionName()
-                self.state = 856
+                self.state = 1078
                 self.match(db2_parser.LPAREN)
-                self.state = 858
+                self.state = 1080
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if _la==163 or _la==164:
-                    self.state = 857
+                if _la==178 or _la==179:
+                    self.state = 1079
                     _la = self._input.LA(1)
-                    if not(_la==163 or _la==164):
+                    if not(_la==178 or _la==179):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
 
 
-                self.state = 862
+                self.state = 1084
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
-                if token in [1, 2, 3, 4, 5, 6, 24, 116, 125, 126, 127, 128, 129, 130, 131, 132, 137, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 177, 178, 179, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216]:
-                    self.state = 860
+                if token in [1, 2, 3, 4, 5, 11, 13, 14, 23, 45, 46, 49, 128, 140, 141, 142, 143, 144, 145, 146, 147, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 192, 193, 194, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232]:
+                    self.state = 1082
                     self.argumentList()
                     pass
-                elif token in [16]:
-                    self.state = 861
+                elif token in [15]:
+                    self.state = 1083
                     self.match(db2_parser.ASTERISK)
                     pass
-                elif token in [7]:
+                elif token in [6]:
                     pass
                 else:
                     pass
-                self.state = 864
+                self.state = 1086
                 self.match(db2_parser.RPAREN)
                 pass
-            elif token in [204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216]:
+            elif token in [219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 866
+                self.state = 1088
                 self.windowFunction()
                 pass
             else:
@@ -7524,13 +9070,13 @@ class db2_parser ( Parser ):
     def functionName(self):
 
         localctx = db2_parser.FunctionNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 168, self.RULE_functionName)
+        self.enterRule(localctx, 176, self.RULE_functionName)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 869
+            self.state = 1091
             _la = self._input.LA(1)
-            if not(_la==1 or ((((_la - 125)) & ~0x3f) == 0 and ((1 << (_la - 125)) & 33538175) != 0)):
+            if not(((((_la - 140)) & ~0x3f) == 0 and ((1 << (_la - 140)) & 33538175) != 0) or _la==232):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -7587,21 +9133,21 @@ class db2_parser ( Parser ):
     def argumentList(self):
 
         localctx = db2_parser.ArgumentListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 170, self.RULE_argumentList)
+        self.enterRule(localctx, 178, self.RULE_argumentList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 871
+            self.state = 1093
             self.expression(0)
-            self.state = 876
+            self.state = 1098
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==10:
-                self.state = 872
+            while _la==9:
+                self.state = 1094
                 self.match(db2_parser.COMMA)
-                self.state = 873
+                self.state = 1095
                 self.expression(0)
-                self.state = 878
+                self.state = 1100
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -7665,27 +9211,27 @@ class db2_parser ( Parser ):
     def windowFunction(self):
 
         localctx = db2_parser.WindowFunctionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 172, self.RULE_windowFunction)
+        self.enterRule(localctx, 180, self.RULE_windowFunction)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 879
+            self.state = 1101
             self.windowFunctionName()
-            self.state = 880
+            self.state = 1102
             self.match(db2_parser.LPAREN)
-            self.state = 882
+            self.state = 1104
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 16777342) != 0) or ((((_la - 116)) & ~0x3f) == 0 and ((1 << (_la - 116)) & -2305842992039985663) != 0) or ((((_la - 204)) & ~0x3f) == 0 and ((1 << (_la - 204)) & 8191) != 0):
-                self.state = 881
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 668503078103102) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 137389666305) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & 2198889037831) != 0):
+                self.state = 1103
                 self.argumentList()
 
 
-            self.state = 884
+            self.state = 1106
             self.match(db2_parser.RPAREN)
-            self.state = 885
+            self.state = 1107
             self.match(db2_parser.OVER)
-            self.state = 886
+            self.state = 1108
             self.windowSpecification()
         except RecognitionException as re:
             localctx.exception = re
@@ -7765,13 +9311,13 @@ class db2_parser ( Parser ):
     def windowFunctionName(self):
 
         localctx = db2_parser.WindowFunctionNameContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 174, self.RULE_windowFunctionName)
+        self.enterRule(localctx, 182, self.RULE_windowFunctionName)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 888
+            self.state = 1110
             _la = self._input.LA(1)
-            if not(((((_la - 204)) & ~0x3f) == 0 and ((1 << (_la - 204)) & 8191) != 0)):
+            if not(((((_la - 219)) & ~0x3f) == 0 and ((1 << (_la - 219)) & 8191) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
@@ -7866,76 +9412,76 @@ class db2_parser ( Parser ):
     def windowSpecification(self):
 
         localctx = db2_parser.WindowSpecificationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 176, self.RULE_windowSpecification)
+        self.enterRule(localctx, 184, self.RULE_windowSpecification)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 890
+            self.state = 1112
             self.match(db2_parser.LPAREN)
-            self.state = 901
+            self.state = 1123
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==92:
-                self.state = 891
+            if _la==95:
+                self.state = 1113
                 self.match(db2_parser.PARTITION)
-                self.state = 892
+                self.state = 1114
                 self.match(db2_parser.BY)
-                self.state = 893
+                self.state = 1115
                 self.expression(0)
-                self.state = 898
+                self.state = 1120
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 894
+                while _la==9:
+                    self.state = 1116
                     self.match(db2_parser.COMMA)
-                    self.state = 895
+                    self.state = 1117
                     self.expression(0)
-                    self.state = 900
+                    self.state = 1122
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 913
+            self.state = 1135
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==61:
-                self.state = 903
+                self.state = 1125
                 self.match(db2_parser.ORDER)
-                self.state = 904
+                self.state = 1126
                 self.match(db2_parser.BY)
-                self.state = 905
+                self.state = 1127
                 self.orderByItem()
-                self.state = 910
+                self.state = 1132
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==10:
-                    self.state = 906
+                while _la==9:
+                    self.state = 1128
                     self.match(db2_parser.COMMA)
-                    self.state = 907
+                    self.state = 1129
                     self.orderByItem()
-                    self.state = 912
+                    self.state = 1134
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 915
+            self.state = 1137
             _la = self._input.LA(1)
-            if not(_la==69 or _la==187 or _la==188):
+            if not(_la==69 or _la==202 or _la==203):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 917
+            self.state = 1139
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 2199040032894) != 0) or ((((_la - 116)) & ~0x3f) == 0 and ((1 << (_la - 116)) & -2305842992039985663) != 0) or ((((_la - 189)) & ~0x3f) == 0 and ((1 << (_la - 189)) & 268402697) != 0):
-                self.state = 916
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 670702101358654) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 137389666305) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & 2198889074695) != 0):
+                self.state = 1138
                 self.frameSpecification()
 
 
-            self.state = 919
+            self.state = 1141
             self.match(db2_parser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -7990,25 +9536,25 @@ class db2_parser ( Parser ):
     def frameSpecification(self):
 
         localctx = db2_parser.FrameSpecificationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 178, self.RULE_frameSpecification)
+        self.enterRule(localctx, 186, self.RULE_frameSpecification)
         try:
-            self.state = 927
+            self.state = 1149
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [1, 2, 3, 4, 5, 6, 24, 116, 125, 126, 127, 128, 129, 130, 131, 132, 137, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 177, 178, 179, 189, 192, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216]:
+            if token in [1, 2, 3, 4, 5, 11, 13, 14, 23, 45, 46, 49, 128, 140, 141, 142, 143, 144, 145, 146, 147, 152, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 192, 193, 194, 204, 207, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 921
+                self.state = 1143
                 self.frameStart()
                 pass
             elif token in [41]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 922
+                self.state = 1144
                 self.match(db2_parser.BETWEEN)
-                self.state = 923
+                self.state = 1145
                 self.frameStart()
-                self.state = 924
+                self.state = 1146
                 self.match(db2_parser.AND)
-                self.state = 925
+                self.state = 1147
                 self.frameEnd()
                 pass
             else:
@@ -8072,40 +9618,40 @@ class db2_parser ( Parser ):
     def frameStart(self):
 
         localctx = db2_parser.FrameStartContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 180, self.RULE_frameStart)
+        self.enterRule(localctx, 188, self.RULE_frameStart)
         try:
-            self.state = 939
+            self.state = 1161
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,89,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,123,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 929
+                self.state = 1151
                 self.match(db2_parser.UNBOUNDED)
-                self.state = 930
+                self.state = 1152
                 self.match(db2_parser.PRECEDING)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 931
+                self.state = 1153
                 self.match(db2_parser.CURRENT)
-                self.state = 932
+                self.state = 1154
                 self.match(db2_parser.ROW)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 933
+                self.state = 1155
                 self.expression(0)
-                self.state = 934
+                self.state = 1156
                 self.match(db2_parser.PRECEDING)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 936
+                self.state = 1158
                 self.expression(0)
-                self.state = 937
+                self.state = 1159
                 self.match(db2_parser.FOLLOWING)
                 pass
 
@@ -8168,40 +9714,40 @@ class db2_parser ( Parser ):
     def frameEnd(self):
 
         localctx = db2_parser.FrameEndContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 182, self.RULE_frameEnd)
+        self.enterRule(localctx, 190, self.RULE_frameEnd)
         try:
-            self.state = 951
+            self.state = 1173
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,90,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,124,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 941
+                self.state = 1163
                 self.match(db2_parser.UNBOUNDED)
-                self.state = 942
+                self.state = 1164
                 self.match(db2_parser.FOLLOWING)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 943
+                self.state = 1165
                 self.match(db2_parser.CURRENT)
-                self.state = 944
+                self.state = 1166
                 self.match(db2_parser.ROW)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 945
+                self.state = 1167
                 self.expression(0)
-                self.state = 946
+                self.state = 1168
                 self.match(db2_parser.PRECEDING)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 948
+                self.state = 1170
                 self.expression(0)
-                self.state = 949
+                self.state = 1171
                 self.match(db2_parser.FOLLOWING)
                 pass
 
@@ -8269,43 +9815,43 @@ class db2_parser ( Parser ):
     def caseExpression(self):
 
         localctx = db2_parser.CaseExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 184, self.RULE_caseExpression)
+        self.enterRule(localctx, 192, self.RULE_caseExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 953
+            self.state = 1175
             self.match(db2_parser.CASE)
-            self.state = 955
+            self.state = 1177
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 16777342) != 0) or ((((_la - 116)) & ~0x3f) == 0 and ((1 << (_la - 116)) & -2305842992039985663) != 0) or ((((_la - 204)) & ~0x3f) == 0 and ((1 << (_la - 204)) & 8191) != 0):
-                self.state = 954
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 668503078103102) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & 137389666305) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & 2198889037831) != 0):
+                self.state = 1176
                 self.expression(0)
 
 
-            self.state = 958 
+            self.state = 1180 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 957
+                self.state = 1179
                 self.whenClause()
-                self.state = 960 
+                self.state = 1182 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if not (_la==133):
+                if not (_la==148):
                     break
 
-            self.state = 964
+            self.state = 1186
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==135:
-                self.state = 962
+            if _la==150:
+                self.state = 1184
                 self.match(db2_parser.ELSE)
-                self.state = 963
+                self.state = 1185
                 self.elseExpression()
 
 
-            self.state = 966
+            self.state = 1188
             self.match(db2_parser.END)
         except RecognitionException as re:
             localctx.exception = re
@@ -8360,16 +9906,16 @@ class db2_parser ( Parser ):
     def whenClause(self):
 
         localctx = db2_parser.WhenClauseContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 186, self.RULE_whenClause)
+        self.enterRule(localctx, 194, self.RULE_whenClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 968
+            self.state = 1190
             self.match(db2_parser.WHEN)
-            self.state = 969
+            self.state = 1191
             self.whenExpression()
-            self.state = 970
+            self.state = 1192
             self.match(db2_parser.THEN)
-            self.state = 971
+            self.state = 1193
             self.thenExpression()
         except RecognitionException as re:
             localctx.exception = re
@@ -8414,10 +9960,10 @@ class db2_parser ( Parser ):
     def whenExpression(self):
 
         localctx = db2_parser.WhenExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 188, self.RULE_whenExpression)
+        self.enterRule(localctx, 196, self.RULE_whenExpression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 973
+            self.state = 1195
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -8462,10 +10008,10 @@ class db2_parser ( Parser ):
     def thenExpression(self):
 
         localctx = db2_parser.ThenExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 190, self.RULE_thenExpression)
+        self.enterRule(localctx, 198, self.RULE_thenExpression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 975
+            self.state = 1197
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -8510,10 +10056,10 @@ class db2_parser ( Parser ):
     def elseExpression(self):
 
         localctx = db2_parser.ElseExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 192, self.RULE_elseExpression)
+        self.enterRule(localctx, 200, self.RULE_elseExpression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 977
+            self.state = 1199
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -8574,20 +10120,20 @@ class db2_parser ( Parser ):
     def castExpression(self):
 
         localctx = db2_parser.CastExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 194, self.RULE_castExpression)
+        self.enterRule(localctx, 202, self.RULE_castExpression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 979
+            self.state = 1201
             self.match(db2_parser.CAST)
-            self.state = 980
+            self.state = 1202
             self.match(db2_parser.LPAREN)
-            self.state = 981
+            self.state = 1203
             self.expression(0)
-            self.state = 982
+            self.state = 1204
             self.match(db2_parser.AS)
-            self.state = 983
+            self.state = 1205
             self.dataType()
-            self.state = 984
+            self.state = 1206
             self.match(db2_parser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -8638,14 +10184,14 @@ class db2_parser ( Parser ):
     def subquery(self):
 
         localctx = db2_parser.SubqueryContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 196, self.RULE_subquery)
+        self.enterRule(localctx, 204, self.RULE_subquery)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 986
+            self.state = 1208
             self.match(db2_parser.LPAREN)
-            self.state = 987
+            self.state = 1209
             self.selectStatement()
-            self.state = 988
+            self.state = 1210
             self.match(db2_parser.RPAREN)
         except RecognitionException as re:
             localctx.exception = re
@@ -8661,7 +10207,7 @@ class db2_parser ( Parser ):
         if self._predicates == None:
             self._predicates = dict()
         self._predicates[7] = self.tableExpression_sempred
-        self._predicates[72] = self.expression_sempred
+        self._predicates[76] = self.expression_sempred
         pred = self._predicates.get(ruleIndex, None)
         if pred is None:
             raise Exception("No predicate with index:" + str(ruleIndex))
@@ -8675,9 +10221,37 @@ class db2_parser ( Parser ):
 
     def expression_sempred(self, localctx:ExpressionContext, predIndex:int):
             if predIndex == 1:
+                return self.precpred(self._ctx, 10)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 9)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 7)
+         
+
+            if predIndex == 4:
                 return self.precpred(self._ctx, 5)
          
 
+            if predIndex == 5:
+                return self.precpred(self._ctx, 2)
+         
+
+            if predIndex == 6:
+                return self.precpred(self._ctx, 1)
+         
+
+            if predIndex == 7:
+                return self.precpred(self._ctx, 8)
+         
+
+            if predIndex == 8:
+                return self.precpred(self._ctx, 6)
+         
+
 
 
 
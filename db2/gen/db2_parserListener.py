@@ -1,4 +1,4 @@
-# Generated from C:/Users/natar/AI/AS400Parser/grammars/db2_parser.g4 by ANTLR 4.13.2
+# Generated from db2_parser.g4 by ANTLR 4.13.2
 from antlr4 import *
 if "." in __name__:
     from .db2_parser import db2_parser
@@ -332,6 +332,15 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by db2_parser#tableElement.
+    def enterTableElement(self, ctx:db2_parser.TableElementContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#tableElement.
+    def exitTableElement(self, ctx:db2_parser.TableElementContext):
+        pass
+
+
     # Enter a parse tree produced by db2_parser#columnDefinition.
     def enterColumnDefinition(self, ctx:db2_parser.ColumnDefinitionContext):
         pass
@@ -386,6 +395,33 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by db2_parser#tableConstraint.
+    def enterTableConstraint(self, ctx:db2_parser.TableConstraintContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#tableConstraint.
+    def exitTableConstraint(self, ctx:db2_parser.TableConstraintContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#referentialAction.
+    def enterReferentialAction(self, ctx:db2_parser.ReferentialActionContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#referentialAction.
+    def exitReferentialAction(self, ctx:db2_parser.ReferentialActionContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#identityOption.
+    def enterIdentityOption(self, ctx:db2_parser.IdentityOptionContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#identityOption.
+    def exitIdentityOption(self, ctx:db2_parser.IdentityOptionContext):
+        pass
+
+
     # Enter a parse tree produced by db2_parser#defaultValue.
     def enterDefaultValue(self, ctx:db2_parser.DefaultValueContext):
         pass
@@ -656,12 +692,147 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by db2_parser#expression.
-    def enterExpression(self, ctx:db2_parser.ExpressionContext):
+    # Enter a parse tree produced by db2_parser#castExpr.
+    def enterCastExpr(self, ctx:db2_parser.CastExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#castExpr.
+    def exitCastExpr(self, ctx:db2_parser.CastExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#inExpr.
+    def enterInExpr(self, ctx:db2_parser.InExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#inExpr.
+    def exitInExpr(self, ctx:db2_parser.InExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#orExpr.
+    def enterOrExpr(self, ctx:db2_parser.OrExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#orExpr.
+    def exitOrExpr(self, ctx:db2_parser.OrExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#comparisonExpr.
+    def enterComparisonExpr(self, ctx:db2_parser.ComparisonExprContext):
         pass
 
-    # Exit a parse tree produced by db2_parser#expression.
-    def exitExpression(self, ctx:db2_parser.ExpressionContext):
+    # Exit a parse tree produced by db2_parser#comparisonExpr.
+    def exitComparisonExpr(self, ctx:db2_parser.ComparisonExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#additiveExpr.
+    def enterAdditiveExpr(self, ctx:db2_parser.AdditiveExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#additiveExpr.
+    def exitAdditiveExpr(self, ctx:db2_parser.AdditiveExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#existsExpr.
+    def enterExistsExpr(self, ctx:db2_parser.ExistsExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#existsExpr.
+    def exitExistsExpr(self, ctx:db2_parser.ExistsExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#parenExpr.
+    def enterParenExpr(self, ctx:db2_parser.ParenExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#parenExpr.
+    def exitParenExpr(self, ctx:db2_parser.ParenExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#functionExpr.
+    def enterFunctionExpr(self, ctx:db2_parser.FunctionExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#functionExpr.
+    def exitFunctionExpr(self, ctx:db2_parser.FunctionExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#betweenExpr.
+    def enterBetweenExpr(self, ctx:db2_parser.BetweenExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#betweenExpr.
+    def exitBetweenExpr(self, ctx:db2_parser.BetweenExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#unaryExpr.
+    def enterUnaryExpr(self, ctx:db2_parser.UnaryExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#unaryExpr.
+    def exitUnaryExpr(self, ctx:db2_parser.UnaryExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#notExpr.
+    def enterNotExpr(self, ctx:db2_parser.NotExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#notExpr.
+    def exitNotExpr(self, ctx:db2_parser.NotExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#primaryExpr.
+    def enterPrimaryExpr(self, ctx:db2_parser.PrimaryExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#primaryExpr.
+    def exitPrimaryExpr(self, ctx:db2_parser.PrimaryExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#isNullExpr.
+    def enterIsNullExpr(self, ctx:db2_parser.IsNullExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#isNullExpr.
+    def exitIsNullExpr(self, ctx:db2_parser.IsNullExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#caseExpr.
+    def enterCaseExpr(self, ctx:db2_parser.CaseExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#caseExpr.
+    def exitCaseExpr(self, ctx:db2_parser.CaseExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#multiplicativeExpr.
+    def enterMultiplicativeExpr(self, ctx:db2_parser.MultiplicativeExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#multiplicativeExpr.
+    def exitMultiplicativeExpr(self, ctx:db2_parser.MultiplicativeExprContext):
+        pass
+
+
+    # Enter a parse tree produced by db2_parser#andExpr.
+    def enterAndExpr(self, ctx:db2_parser.AndExprContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#andExpr.
+    def exitAndExpr(self, ctx:db2_parser.AndExprContext):
         pass
 
 
@@ -692,6 +863,15 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by db2_parser#tableQualifier.
+    def enterTableQualifier(self, ctx:db2_parser.TableQualifierContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#tableQualifier.
+    def exitTableQualifier(self, ctx:db2_parser.TableQualifierContext):
+        pass
+
+
     # Enter a parse tree produced by db2_parser#tableName.
     def enterTableName(self, ctx:db2_parser.TableNameContext):
         pass
@@ -701,6 +881,15 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by db2_parser#schemaName.
+    def enterSchemaName(self, ctx:db2_parser.SchemaNameContext):
+        pass
+
+    # Exit a parse tree produced by db2_parser#schemaName.
+    def exitSchemaName(self, ctx:db2_parser.SchemaNameContext):
+        pass
+
+
     # Enter a parse tree produced by db2_parser#columnName.
     def enterColumnName(self, ctx:db2_parser.ColumnNameContext):
         pass
@@ -719,21 +908,12 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by db2_parser#operator.
-    def enterOperator(self, ctx:db2_parser.OperatorContext):
-        pass
-
-    # Exit a parse tree produced by db2_parser#operator.
-    def exitOperator(self, ctx:db2_parser.OperatorContext):
-        pass
-
-
-    # Enter a parse tree produced by db2_parser#arithmeticOperator.
-    def enterArithmeticOperator(self, ctx:db2_parser.ArithmeticOperatorContext):
+    # Enter a parse tree produced by db2_parser#hostVariable.
+    def enterHostVariable(self, ctx:db2_parser.HostVariableContext):
         pass
 
-    # Exit a parse tree produced by db2_parser#arithmeticOperator.
-    def exitArithmeticOperator(self, ctx:db2_parser.ArithmeticOperatorContext):
+    # Exit a parse tree produced by db2_parser#hostVariable.
+    def exitHostVariable(self, ctx:db2_parser.HostVariableContext):
         pass
 
 
@@ -746,15 +926,6 @@ class db2_parserListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by db2_parser#logicalOperator.
-    def enterLogicalOperator(self, ctx:db2_parser.LogicalOperatorContext):
-        pass
-
-    # Exit a parse tree produced by db2_parser#logicalOperator.
-    def exitLogicalOperator(self, ctx:db2_parser.LogicalOperatorContext):
-        pass
-
-
     # Enter a parse tree produced by db2_parser#functionCall.
     def enterFunctionCall(self, ctx:db2_parser.FunctionCallContext):
         pass
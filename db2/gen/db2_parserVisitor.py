@@ -1,4 +1,4 @@
-# Generated from C:/Users/natar/AI/AS400Parser/grammars/db2_parser.g4 by ANTLR 4.13.2
+# Generated from db2_parser.g4 by ANTLR 4.13.2
 from antlr4 import *
 if "." in __name__:
     from .db2_parser import db2_parser
@@ -189,6 +189,11 @@ class db2_parserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by db2_parser#tableElement.
+    def visitTableElement(self, ctx:db2_parser.TableElementContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by db2_parser#columnDefinition.
     def visitColumnDefinition(self, ctx:db2_parser.ColumnDefinitionContext):
         return self.visitChildren(ctx)
@@ -219,6 +224,21 @@ class db2_parserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by db2_parser#tableConstraint.
+    def visitTableConstraint(self, ctx:db2_parser.TableConstraintContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#referentialAction.
+    def visitReferentialAction(self, ctx:db2_parser.ReferentialActionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#identityOption.
+    def visitIdentityOption(self, ctx:db2_parser.IdentityOptionContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by db2_parser#defaultValue.
     def visitDefaultValue(self, ctx:db2_parser.DefaultValueContext):
         return self.visitChildren(ctx)
@@ -369,8 +389,83 @@ class db2_parserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by db2_parser#expression.
-    def visitExpression(self, ctx:db2_parser.ExpressionContext):
+    # Visit a parse tree produced by db2_parser#castExpr.
+    def visitCastExpr(self, ctx:db2_parser.CastExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#inExpr.
+    def visitInExpr(self, ctx:db2_parser.InExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#orExpr.
+    def visitOrExpr(self, ctx:db2_parser.OrExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#comparisonExpr.
+    def visitComparisonExpr(self, ctx:db2_parser.ComparisonExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#additiveExpr.
+    def visitAdditiveExpr(self, ctx:db2_parser.AdditiveExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#existsExpr.
+    def visitExistsExpr(self, ctx:db2_parser.ExistsExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#parenExpr.
+    def visitParenExpr(self, ctx:db2_parser.ParenExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#functionExpr.
+    def visitFunctionExpr(self, ctx:db2_parser.FunctionExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#betweenExpr.
+    def visitBetweenExpr(self, ctx:db2_parser.BetweenExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#unaryExpr.
+    def visitUnaryExpr(self, ctx:db2_parser.UnaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#notExpr.
+    def visitNotExpr(self, ctx:db2_parser.NotExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#primaryExpr.
+    def visitPrimaryExpr(self, ctx:db2_parser.PrimaryExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#isNullExpr.
+    def visitIsNullExpr(self, ctx:db2_parser.IsNullExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#caseExpr.
+    def visitCaseExpr(self, ctx:db2_parser.CaseExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#multiplicativeExpr.
+    def visitMultiplicativeExpr(self, ctx:db2_parser.MultiplicativeExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by db2_parser#andExpr.
+    def visitAndExpr(self, ctx:db2_parser.AndExprContext):
         return self.visitChildren(ctx)
 
 
@@ -389,11 +484,21 @@ class db2_parserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by db2_parser#tableQualifier.
+    def visitTableQualifier(self, ctx:db2_parser.TableQualifierContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by db2_parser#tableName.
     def visitTableName(self, ctx:db2_parser.TableNameContext):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by db2_parser#schemaName.
+    def visitSchemaName(self, ctx:db2_parser.SchemaNameContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by db2_parser#columnName.
     def visitColumnName(self, ctx:db2_parser.ColumnNameContext):
         return self.visitChildren(ctx)
@@ -404,13 +509,8 @@ class db2_parserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by db2_parser#operator.
-    def visitOperator(self, ctx:db2_parser.OperatorContext):
-        return self.visitChildren(ctx)
-
-
-    # Visit a parse tree produced by db2_parser#arithmeticOperator.
-    def visitArithmeticOperator(self, ctx:db2_parser.ArithmeticOperatorContext):
+    # Visit a parse tree produced by db2_parser#hostVariable.
+    def visitHostVariable(self, ctx:db2_parser.HostVariableContext):
         return self.visitChildren(ctx)
 
 
@@ -419,11 +519,6 @@ class db2_parserVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by db2_parser#logicalOperator.
-    def visitLogicalOperator(self, ctx:db2_parser.LogicalOperatorContext):
-        return self.visitChildren(ctx)
-
-
     # Visit a parse tree produced by db2_parser#functionCall.
     def visitFunctionCall(self, ctx:db2_parser.FunctionCallContext):
         return self.visitChildren(ctx)
@@ -0,0 +1,94 @@
+"""
+SQL normaliser for embedded SQL.
+
+Canonicalises a statement so that copies differing only in layout, case,
+literal values or host variable names share one fingerprint. Literals and
+host variables are replaced by positional placeholders (:_L1, :_H1, ...)
+that the DB2 grammar parses as host variables. A parse of the canonical
+text is therefore a template that fits every copy (see db2.sql_cache).
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<ws>\s+|--[^\n]*|/\*.*?\*/)
+    | (?P<string>[XGN]?'(?:[^']|'')*')
+    | (?P<delimited>"(?:[^"]|"")*")
+    | (?P<host>:\s*[A-Za-z_$#@][\w$#@]*(?:\.[A-Za-z_$#@][\w$#@]*)?)
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:E[+-]?\d+)?)
+    | (?P<word>[A-Za-z_$#@][\w$#@]*)
+    | (?P<op><>|<=|>=|!=|\|\||\S)
+    """,
+    re.I | re.S | re.X,
+)
+
+PLACEHOLDER_RE = re.compile(r":_[HL]\d+\b")
+
+# Numbers after these words, or inside the parentheses of a type, are syntax, not values.
+_STRUCTURAL_NUMBER_AFTER = frozenset(("FIRST", "NEXT", "LIMIT", "OFFSET", "ROWS"))
+_TYPE_WORDS = frozenset((
+    "CHAR", "CHARACTER", "VARCHAR", "DECIMAL", "DEC", "NUMERIC", "GRAPHIC", "VARGRAPHIC",
+    "CLOB", "BLOB", "DBCLOB", "TIMESTAMP", "BINARY", "VARBINARY", "FLOAT",
+))
+
+
+@dataclass
+class NormalizedSql:
+    """Canonical form of one SQL statement."""
+
+    text: str  # canonical text with placeholders
+    fingerprint: str
+    host_variables: list[str] = field(default_factory=list)  # names, without ':' (in order)
+    literals: list[str] = field(default_factory=list)  # original literal text (in order)
+
+    def bindings(self) -> dict[str, str]:
+        """Placeholder -> original text (host variables keep their leading ':')."""
+        values = {f":_H{i}": f":{name}" for i, name in enumerate(self.host_variables, 1)}
+        values.update({f":_L{i}": lit for i, lit in enumerate(self.literals, 1)})
+        return values
+
+
+def normalize_sql(sql: str) -> NormalizedSql:
+    """
+    Canonicalise a statement: comments and layout dropped, words upper-cased,
+    literals and host variables replaced by placeholders. Delimited ("quoted")
+    identifiers keep their case.
+    """
+    out: list[str] = []
+    host_variables: list[str] = []
+    literals: list[str] = []
+    prev = ""  # previous significant token (upper case)
+    type_parens = 0  # depth inside CHAR(...), DECIMAL(...), ...
+    type_pending = False
+
+    for m in _TOKEN_RE.finditer(sql):
+        kind = m.lastgroup
+        if kind == "ws":
+            continue
+        tok = m.group()
+        if kind == "word":
+            tok = tok.upper()
+        elif kind == "host":
+            host_variables.append(tok[1:].strip())
+            tok = f":_H{len(host_variables)}"
+        elif kind == "string" or (kind == "number" and not type_parens and prev not in _STRUCTURAL_NUMBER_AFTER):
+            literals.append(tok)
+            tok = f":_L{len(literals)}"
+
+        if tok == "(":
+            if type_parens or type_pending:
+                type_parens += 1
+        elif tok == ")" and type_parens:
+            type_parens -= 1
+        type_pending = kind == "word" and tok in _TYPE_WORDS
+        if tok == ";":
+            break
+        out.append(tok)
+        prev = tok
+
+    text = " ".join(out).replace(" . ", ".")
+    fingerprint = hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+    return NormalizedSql(text, fingerprint, host_variables, literals)
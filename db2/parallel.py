@@ -0,0 +1,85 @@
+"""
+Statement-level parallel parsing for large DB2 SQL scripts.
+
+The script is cut at statement boundaries by db2.splitter, consecutive
+statements are grouped into chunks of roughly CHUNK_BYTES, and each chunk is
+parsed by parse_db2_chunk in a worker process. Chunks keep their original
+line and column positions, so the stitched Db2Script and its diagnostics
+read exactly as if the script had been parsed in one piece.
+"""
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+from core.diagnostics import Diagnostic
+from db2.ast_builder import parse_db2_chunk
+from db2.ast_nodes import Db2Script, SourceLocation
+from db2.splitter import SqlStatementText, split_sql
+
+CHUNK_BYTES = 256 * 1024
+
+
+def parse_db2_parallel(
+    source: str, filename: str, workers: int | None = None, chunk_bytes: int = CHUNK_BYTES
+) -> tuple[Db2Script, list[Diagnostic]]:
+    """
+    Parse a DB2 script in worker processes and stitch the results.
+
+    Statements come back in script order and diagnostics are ordered by
+    (line, column). A chunk that fails to parse falls back on its own, so one
+    bad statement no longer sends the whole script down the fallback path.
+    """
+    statements = split_sql(source)
+    chunks = list(_chunks(statements, chunk_bytes))
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+
+    if workers <= 1:
+        results = [parse_db2_chunk(text, filename, line) for text, line in chunks]
+    else:
+        texts, lines = zip(*chunks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse_db2_chunk, texts, [filename] * len(chunks), lines))
+
+    script = Db2Script(loc=SourceLocation(filename, statements[0].line if statements else 1, 0))
+    diagnostics: list[Diagnostic] = []
+    for chunk_ast, chunk_diagnostics in results:
+        script.statements.extend(chunk_ast.statements)
+        diagnostics.extend(chunk_diagnostics)
+    diagnostics.sort(key=lambda d: (d.line, d.column))  # stable: per-position order kept
+    return script, diagnostics
+
+
+def _chunks(statements: list[SqlStatementText], chunk_bytes: int) -> Iterator[tuple[str, int]]:
+    """
+    Group statements into (chunk text, first line) pairs.
+
+    Each statement is re-terminated with ';' and laid out at its original line
+    and column (gaps padded with newlines and spaces), so token positions in
+    the chunk match the script once the lexer starts at the first line.
+    """
+    parts: list[str] = []
+    size = 0
+    first_line = line = column = 0  # position just after the last ';' written
+    for stmt in statements:
+        if not parts:
+            first_line = line = stmt.line
+            column = 0
+        if stmt.line > line:
+            parts.append("\n" * (stmt.line - line))
+            column = 0
+        parts.append(" " * max(stmt.column - column, 1 if column else 0))
+        parts.append(stmt.text)
+        parts.append(";")
+        newlines = stmt.text.count("\n")
+        line = stmt.line + newlines
+        if newlines:
+            column = len(stmt.text) - stmt.text.rfind("\n")
+        else:
+            column = stmt.column + len(stmt.text) + 1
+        size += len(stmt.text)
+        if size >= chunk_bytes:
+            yield "".join(parts), first_line
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts), first_line
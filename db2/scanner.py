@@ -0,0 +1,70 @@
+"""
+Metrics-only scanner for DB2 SQL scripts.
+
+Cuts statements with the streaming splitter (literals, comments and
+BEGIN ... END bodies respected) and classifies each by its leading keywords.
+No parser, no AST. Feeds Db2Metrics in metrics-only mode.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from db2.splitter import iter_sql_statements
+
+_LEADING_WORDS_RE = re.compile(r"[A-Za-z_][\w$#@]*")
+
+_DDL_VERBS = frozenset(("CREATE", "ALTER", "DROP"))
+_DDL_MODIFIERS = frozenset(("OR", "REPLACE", "UNIQUE", "WHERE", "NOT", "DISTINCT", "ENCODED", "VECTOR"))
+
+
+@dataclass
+class Db2Scan:
+    """Counts gathered by scan_db2."""
+
+    total_lines: int = 0
+    statement_count: int = 0
+    table_count: int = 0
+    index_count: int = 0
+    operations: Counter = field(default_factory=Counter)
+
+
+def scan_db2(source: str | Iterable[str]) -> Db2Scan:
+    """
+    Count statements, CREATE TABLE / CREATE INDEX and statement kinds.
+
+    Accepts the script text or an iterable of lines (e.g. core.io.iter_lines),
+    so large exports are scanned without loading them whole.
+    """
+    scan = Db2Scan()
+    lines = source.splitlines(keepends=True) if isinstance(source, str) else source
+    for stmt in iter_sql_statements(_counted(lines, scan)):
+        _count_statement(_LEADING_WORDS_RE.findall(stmt.text, 0, 200)[:4], scan)
+    return scan
+
+
+def _counted(lines: Iterable[str], scan: Db2Scan) -> Iterator[str]:
+    for line in lines:
+        scan.total_lines += 1
+        yield line
+
+
+def _count_statement(words: list[str], scan: Db2Scan) -> None:
+    if not words:
+        return
+    words = [w.upper() for w in words]
+    scan.statement_count += 1
+    verb = words[0]
+    if verb in _DDL_VERBS:
+        obj = next((w for w in words[1:] if w not in _DDL_MODIFIERS), "")
+        kind = f"{verb} {obj}".strip()
+        scan.operations[kind] += 1
+        if kind == "CREATE TABLE":
+            scan.table_count += 1
+        elif kind == "CREATE INDEX":
+            scan.index_count += 1
+    elif verb in ("SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "WITH", "VALUES"):
+        scan.operations["DML"] += 1
+    else:
+        scan.operations[verb] += 1
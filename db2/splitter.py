@@ -0,0 +1,165 @@
+"""
+Streaming statement splitter for DB2 SQL scripts.
+
+Consumes source line by line and yields one SqlStatementText per statement.
+Terminators inside string literals, delimited identifiers, comments and
+compound (BEGIN ... END) bodies of procedures, functions and triggers do not
+end a statement. Only the statement being assembled is held in memory, so
+multi-gigabyte catalog exports split in bounded memory.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+_SQUOTE_END_RE = re.compile(r"'(?!')|''")
+_DQUOTE_END_RE = re.compile(r'"(?!")|""')
+_TERMINATOR_DIRECTIVE_RE = re.compile(r"--#SET\s+TERMINATOR\s+(\S+)", re.I)
+
+# END <kw> closes a block that did not open with BEGIN/CASE.
+_END_QUALIFIERS = frozenset(("IF", "LOOP", "WHILE", "FOR", "REPEAT"))
+
+_CODE, _SQUOTE, _DQUOTE, _COMMENT = range(4)
+
+_code_patterns: dict[str, re.Pattern] = {}
+
+
+def _code_re(terminator: str) -> re.Pattern:
+    """Tokens that change lexical state in code mode: quotes, comments, terminator, words."""
+    pattern = _code_patterns.get(terminator)
+    if pattern is None:
+        extra = "".join(re.escape(c) for c in "$#@" if c not in terminator)
+        pattern = re.compile(r"""'|"|--|/\*|(%s)|([A-Za-z_][\w%s]*)""" % (re.escape(terminator), extra))
+        _code_patterns[terminator] = pattern
+    return pattern
+
+
+@dataclass
+class SqlStatementText:
+    """One statement cut from a script, without its terminator."""
+
+    text: str
+    line: int  # 1-based line of the first token
+    column: int  # 0-based column of the first token
+    end_line: int
+
+
+def split_sql(source: str, terminator: str = ";") -> list[SqlStatementText]:
+    """Split an in-memory script; see iter_sql_statements."""
+    return list(iter_sql_statements(source.splitlines(keepends=True), terminator))
+
+
+def iter_sql_statements(lines: Iterable[str], terminator: str = ";") -> Iterator[SqlStatementText]:
+    """
+    Yield statements from an iterable of source lines (a text file works).
+
+    Leading whitespace and comments are dropped so each statement's line and
+    column point at its first token. A "--#SET TERMINATOR x" comment line
+    switches the terminator, as in the DB2 command line processor.
+    """
+    code_re = _code_re(terminator)
+    mode = _CODE
+    skip_comment = False  # current block comment precedes the statement
+    depth = 0  # BEGIN/CASE nesting
+    pending_end = False  # saw END, waiting for its optional qualifier
+    words = 0  # words seen in the current statement
+    parts: list[str] = []
+    start: tuple[int, int] | None = None
+    line_no = 0
+
+    for line in lines:
+        line_no += 1
+        if start is None and mode == _CODE:
+            directive = _TERMINATOR_DIRECTIVE_RE.match(line.lstrip())
+            if directive:
+                terminator = directive.group(1)
+                code_re = _code_re(terminator)
+                continue
+
+        n = len(line)
+        pos = 0
+        seg = 0  # start of the part of this line not yet buffered
+        while pos < n:
+            if mode == _SQUOTE or mode == _DQUOTE:
+                end_re = _SQUOTE_END_RE if mode == _SQUOTE else _DQUOTE_END_RE
+                m = end_re.search(line, pos)
+                while m is not None and m.end() - m.start() == 2:  # doubled quote
+                    m = end_re.search(line, m.end())
+                if m is None:
+                    break
+                pos = m.end()
+                mode = _CODE
+                continue
+            if mode == _COMMENT:
+                end = line.find("*/", pos)
+                if end < 0:
+                    break
+                pos = end + 2
+                mode = _CODE
+                if skip_comment:
+                    seg = pos
+                continue
+
+            m = code_re.search(line, pos)
+            stop = m.start() if m else n
+            if start is None:
+                lead = line[pos:stop]
+                if lead.strip():
+                    start = (line_no, pos + len(lead) - len(lead.lstrip()))
+                else:
+                    seg = stop
+            if m is None:
+                break
+
+            tok, term, word = m.group(0), m.group(1), m.group(2)
+            pos = m.end()
+            if tok == "--":
+                if start is None:
+                    seg = n
+                break
+            if tok == "/*":
+                mode = _COMMENT
+                skip_comment = start is None
+                continue
+            if term is not None:
+                if pending_end:
+                    pending_end = False
+                    depth = max(depth - 1, 0)
+                if depth == 0:
+                    if start is not None:
+                        parts.append(line[seg:m.start()])
+                        yield _statement(parts, start, line_no)
+                    parts, start, words = [], None, 0
+                    seg = pos
+                continue
+
+            if start is None:
+                start = (line_no, m.start())
+            if tok in ("'", '"'):
+                mode = _SQUOTE if tok == "'" else _DQUOTE
+                continue
+
+            words += 1
+            upper = word.upper()
+            if pending_end:
+                pending_end = False
+                if upper in _END_QUALIFIERS:
+                    continue
+                depth = max(depth - 1, 0)
+                if upper == "CASE":  # END CASE closes the CASE it names
+                    continue
+            if upper == "CASE" or (upper == "BEGIN" and words > 1):
+                # A statement-initial BEGIN is a transaction statement, not a compound body.
+                depth += 1
+            elif upper == "END":
+                pending_end = True
+
+        if start is not None and seg < n:
+            parts.append(line[seg:])
+
+    if start is not None:
+        yield _statement(parts, start, line_no)
+
+
+def _statement(parts: list[str], start: tuple[int, int], end_line: int) -> SqlStatementText:
+    return SqlStatementText(text="".join(parts).rstrip(), line=start[0], column=start[1], end_line=end_line)
@@ -0,0 +1,131 @@
+"""
+Fingerprint-keyed parse cache for embedded SQL.
+
+Each distinct normalised statement (see db2.normalizer) is parsed once. The
+cache keeps the resulting Db2* template and hands out copies with the
+placeholders bound back to each occurrence's literals and host variables.
+The cache can be pickled to disk, so repeated SQL across members and across
+runs is not parsed again.
+
+Nodes of a statement served from the cache all carry the statement's own
+location, and unquoted identifiers come back upper-cased (DB2 folds them
+anyway).
+"""
+
+import hashlib
+import pickle
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+from core.diagnostics import Diagnostic
+from db2.ast_builder import parse_db2_chunk
+from db2.ast_nodes import SourceLocation
+from db2.normalizer import PLACEHOLDER_RE, NormalizedSql, normalize_sql
+
+CACHE_VERSION = 2
+
+_TEMPLATE_FILE = "<sql-template>"
+
+
+class SqlParseCache:
+    """Parsed Db2 statement templates keyed by SQL fingerprint."""
+
+    def __init__(self):
+        self._templates: dict[str, tuple[list, list[Diagnostic]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def parse(
+        self, sql: str, filename: str, line: int = 1, column: int = 0
+    ) -> tuple[list, list[Diagnostic], NormalizedSql]:
+        """
+        Parse one SQL statement through the cache.
+
+        Returns the Db2* statements bound to this occurrence, diagnostics moved
+        to the statement's location, and the normalised form (host variables
+        and literals in source order).
+        """
+        norm = normalize_sql(sql)
+        template = self._templates.get(norm.fingerprint)
+        if template is None:
+            self.misses += 1
+            script, diagnostics = parse_db2_chunk(norm.text, _TEMPLATE_FILE)
+            template = (script.statements, diagnostics)
+            self._templates[norm.fingerprint] = template
+        else:
+            self.hits += 1
+
+        loc = SourceLocation(filename, line, column)
+        values = norm.bindings()
+        statements = [_bind(stmt, loc, values) for stmt in template[0]]
+        diagnostics = [Diagnostic(filename, line, column, d.severity, PLACEHOLDER_RE.sub(
+            lambda m: values.get(m.group(), m.group()), d.message)) for d in template[1]]
+        return statements, diagnostics, norm
+
+    # -- persistence -------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as f:
+            pickle.dump({"version": _cache_version(), "templates": self._templates}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SqlParseCache":
+        """Load a saved cache; a missing file, or one written by another grammar, gives an empty cache."""
+        cache = cls()
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return cache
+        if isinstance(data, dict) and data.get("version") == _cache_version():
+            cache._templates = data["templates"]
+        return cache
+
+
+_default_cache: SqlParseCache | None = None
+
+
+def default_cache() -> SqlParseCache:
+    """Process-wide cache shared by every caller that does not bring its own."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SqlParseCache()
+    return _default_cache
+
+
+def set_default_cache(cache: SqlParseCache) -> None:
+    """Install a (e.g. loaded) cache as the process-wide default."""
+    global _default_cache
+    _default_cache = cache
+
+
+def _bind(obj, loc: SourceLocation, values: dict[str, str]):
+    """Copy a template node, moving it to loc and replacing placeholders with values."""
+    if isinstance(obj, SourceLocation):
+        return loc
+    if isinstance(obj, str):
+        return PLACEHOLDER_RE.sub(lambda m: values.get(m.group(), m.group()), obj) if ":_" in obj else obj
+    if isinstance(obj, list):
+        return [_bind(item, loc, values) for item in obj]
+    if isinstance(obj, tuple):
+        return tuple(_bind(item, loc, values) for item in obj)
+    if is_dataclass(obj):
+        return type(obj)(**{f.name: _bind(getattr(obj, f.name), loc, values) for f in fields(obj)})
+    return obj
+
+
+_version: str | None = None
+
+
+def _cache_version() -> str:
+    """Cache format plus a digest of the generated parser; regenerating the grammar invalidates saved caches."""
+    global _version
+    if _version is None:
+        parser = Path(__file__).resolve().parent / "gen" / "db2_parser.py"
+        digest = hashlib.blake2b(parser.read_bytes(), digest_size=8).hexdigest() if parser.exists() else "none"
+        _version = f"{CACHE_VERSION}:{digest}"
+    return _version
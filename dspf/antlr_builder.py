@@ -0,0 +1,122 @@
+"""
+DSPF parsing with the generated ANTLR parser (dspf.gen, generated from
+grammars/dspf_lexer.g4 and grammars/dspf_parser.g4 by
+scripts/generate_parsers.py).
+
+The grammar is line-structured: each A-spec line is one token, typed by its
+columns (record format, field or constant, keyword line, comment), and the
+parser checks that they form file-level keywords followed by record formats
+and their fields. The lexer is given columns 1-44 of each line only (the
+keywords in 45-80 do not change a line's type), which halves its work. The
+DDS lines of an accepted tree are handed to
+dspf.ast_builder.build_display_file, the line parser's decoder, so both
+paths build the same AST.
+
+A file is parsed with SLL prediction and a bail-out error strategy first;
+only when that fails is it parsed again with full LL prediction. Input the
+grammar rejects gives None, and the caller falls back to the line parser.
+"""
+
+from core.antlr_listener import HAS_ANTLR, DiagnosticErrorListener
+from core.diagnostics import Diagnostic
+
+try:
+    from dspf.gen.dspf_parserVisitor import dspf_parserVisitor
+except ImportError:
+    dspf_parserVisitor = None  # type: ignore
+
+HAS_DSPF_GEN = HAS_ANTLR and dspf_parserVisitor is not None
+
+SPEC_COLUMNS = 44  # A-spec lines are cut or padded to this width so the lexer rules can test their columns
+
+
+def dds_lines_with_antlr(lines: list[str], filename: str, diagnostics: list[Diagnostic]) -> list[tuple[int, str]] | None:
+    """
+    (line number, text) of the DDS lines (record formats, fields and
+    constants, keyword lines) of a file the grammar accepts, in order.
+    None (after a warning for syntax errors) when the parser is not
+    generated or the grammar rejects the file.
+    """
+    if not HAS_DSPF_GEN:
+        return None
+    tree = _parse_tree([line[:SPEC_COLUMNS].ljust(SPEC_COLUMNS) if len(line) > 6 else line for line in lines],
+                       filename, diagnostics)
+    if tree is None:
+        return None
+    collector = DdsLineCollector()
+    collector.visit(tree)
+    return [(ln, lines[ln - 1]) for ln in collector.line_numbers]
+
+
+def _parse_tree(lines: list[str], filename: str, diagnostics: list[Diagnostic]):
+    """The parse tree, or None with a warning for the first syntax error."""
+    from antlr4 import CommonTokenStream, InputStream, PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException
+    from dspf.gen.dspf_lexer import dspf_lexer
+    from dspf.gen.dspf_parser import dspf_parser
+
+    errors: list[Diagnostic] = []
+    lexer = dspf_lexer(InputStream("\n".join(lines) + "\n"))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(DiagnosticErrorListener(filename=filename, diagnostics=errors))
+    tokens = CommonTokenStream(lexer)
+    tokens.fill()
+
+    parser = dspf_parser(tokens)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    tree = None
+    for mode in (PredictionMode.SLL, PredictionMode.LL):
+        if errors:
+            break
+        parser._interp.predictionMode = mode
+        try:
+            tree = parser.dspfFile()
+            break
+        except ParseCancellationException as e:
+            if mode == PredictionMode.LL:  # a real syntax error, not an SLL conflict
+                token = getattr(e.args[0], "offendingToken", None) if e.args else None
+                line, column = (token.line, token.column) if token is not None else (0, 0)
+                errors.append(Diagnostic(filename, line, column, "error",
+                                         f"unexpected {_describe(token)}" if token is not None else "syntax error"))
+            tokens.seek(0)
+            parser.reset()
+    if tree is None or errors:
+        first = errors[0] if errors else Diagnostic(filename, 0, 0, "error", "syntax error")
+        diagnostics.append(Diagnostic(filename, first.line, first.column, "warning",
+                                      f"DSPF grammar: {first.message}; parsed with the line parser"))
+        return None
+    return tree
+
+
+def _describe(token) -> str:
+    """A rejected token by its kind: every token is a whole line."""
+    from dspf.gen.dspf_parser import dspf_parser
+
+    if token.type == dspf_parser.EOF:
+        return "end of file"
+    return dspf_parser.symbolicNames[token.type].lower().replace("_", " ")
+
+
+if dspf_parserVisitor is not None:
+    from dspf.gen.dspf_parser import dspf_parser
+
+    _DDS_TOKENS = frozenset((dspf_parser.RECORD_LINE, dspf_parser.FIELD_LINE, dspf_parser.KEYWORD_LINE))
+
+    class DdsLineCollector(dspf_parserVisitor):
+        """Line numbers of the DDS line tokens of a dspf_parser parse tree, in order."""
+
+        def __init__(self):
+            self.line_numbers: list[int] = []
+
+        def visitTerminal(self, node):
+            token = node.symbol
+            if token.type in _DDS_TOKENS:
+                self.line_numbers.append(token.line)
+
+        def visitSkippedLine(self, ctx):
+            return None  # comments and non-DDS lines
+
+else:
+    DdsLineCollector = None  # type: ignore
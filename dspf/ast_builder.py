@@ -1,13 +1,21 @@
 """
 AST builder for DSPF DDS display files.
 
-Walks parse tree from Speedy ANTLR/ANTLR4 and builds DisplayFile AST.
-Fallback: line-based parser when ANTLR grammar not available.
-
-DDS structure: A=attributes, R=record format. Col 1: spec type.
+Line-based parser by default; the generated ANTLR parser (dspf.antlr_builder,
+grammar-checked) can be selected. Both build the AST through the same line
+decoder, so their ASTs are identical; the line parser is more than ten
+times faster at every file size (scripts/benchmark_dspf_parsers.py).
+
+DDS structure: A-specs, decoded by column (see dspf.dds_specs). Column 17
+holds R for a record format; a name in 19-28 starts a field, a line and
+position without one start a constant; keywords in 45-80 belong to the
+file (before the first record format), record format or field above.
 """
 
 import re
+
+from collections.abc import Iterable
+
 from core.diagnostics import Diagnostic
 from dspf.ast_nodes import (
     DisplayFile,
@@ -15,110 +23,205 @@ from dspf.ast_nodes import (
     Field,
     Attribute,
     SourceLocation,
+    Subfile,
 )
+from dspf.dds_specs import is_a_spec, is_keyword_line, split_a_spec
+from dspf.keywords import parse_keywords
 
 FILENAME = "<memory>"
 
+_INDICATOR_RE = re.compile(r"N?\d\d")
+_CONSTANT_RE = re.compile(r"\s*('(?:[^']|'')*')")
+# Keywords also listed as Field.attributes
+_ATTRIBUTE_KEYWORDS = frozenset(("DSPATR", "COLOR", "HI", "TEXT", "CHECK", "CHKMSGID"))
+
+
+PARSERS = ("lines", "antlr")
+_default_parser = "lines"
+
+
+def default_parser() -> str:
+    """Parser used when parse_dspf is not given one: "lines" unless changed with set_default_parser."""
+    return _default_parser
 
-def parse_dspf(source: str, filename: str = FILENAME) -> tuple[DisplayFile, list[Diagnostic]]:
+
+def set_default_parser(parser: str) -> None:
+    """Select the parser for all later parse_dspf calls: "lines" or "antlr"."""
+    global _default_parser
+    if parser not in PARSERS:
+        raise ValueError(f"unknown DSPF parser {parser!r}; expected one of {', '.join(PARSERS)}")
+    _default_parser = parser
+
+
+def parse_dspf(source: str, filename: str = FILENAME, parser: str | None = None) -> tuple[DisplayFile, list[Diagnostic]]:
     """
     Parse DSPF DDS source into DisplayFile AST.
 
+    parser is "lines" (the line parser below) or "antlr" (the generated
+    parser, see dspf.antlr_builder, falling back to the line parser for
+    source its grammar rejects); default: default_parser().
     Returns (ast, diagnostics).
     """
     diagnostics: list[Diagnostic] = []
-    return _fallback_parse_dspf(source, filename, diagnostics)
+    lines = source.splitlines()
+    parser = parser or _default_parser
+    numbered = None
+    if parser == "antlr":
+        from dspf.antlr_builder import dds_lines_with_antlr
+
+        numbered = dds_lines_with_antlr(lines, filename, diagnostics)
+    return build_display_file(numbered if numbered is not None else enumerate(lines, 1), filename, diagnostics)
 
 
-def _fallback_parse_dspf(
-    source: str, filename: str, diagnostics: list[Diagnostic]
+def build_display_file(
+    lines: Iterable[tuple[int, str]], filename: str, diagnostics: list[Diagnostic]
 ) -> tuple[DisplayFile, list[Diagnostic]]:
-    """Line-based fallback parser for DSPF DDS."""
+    """
+    Build the DisplayFile from (line number, text) pairs: one column decode
+    per line; comments and lines that are not DDS are skipped. Keyword text
+    ending in '+' continues at the first non-blank of the next line's
+    keywords, ending in '-' at column 45 of the next line.
+    """
     loc = SourceLocation(filename, 1, 0)
     record_formats: list[RecordFormat] = []
     current_record: RecordFormat | None = None
+    current_field: Field | None = None
     file_keywords: dict[str, str] = {}
+    pending = ""  # keyword text continued on the next line
+    pending_owner: RecordFormat | Field | None = None
+    pending_trim = False
+    orphans: list[int] = []  # lines of fields or constants before the first record format
 
-    lines = source.splitlines()
-    for i, line in enumerate(lines):
-        ln = i + 1
-        stripped = line.strip()
-        if not stripped or stripped.startswith("/*") or stripped[0] == "*":
+    for ln, line in lines:
+        if line[:5].strip(" 0123456789") or not is_a_spec(line):  # not DDS, or a comment
             continue
-
-        # Col 1: A (attributes/field) or R (record)
-        spec = stripped[0].upper() if stripped else ""
-        content = stripped[1:].strip() if len(stripped) > 1 else ""
-
-        if spec == "R":
-            # Record format: R RECORDNAME
-            parts = content.split()
-            name = parts[0] if parts else "unknown"
-            current_record = RecordFormat(
-                loc=SourceLocation(filename, ln, 0),
-                name=name,
-                keywords={},
-            )
-            record_formats.append(current_record)
-        elif spec == "A" and current_record:
-            # Field: A name, row, col, length, or attributes
-            field = _parse_field_line(content, filename, ln)
-            if field:
-                current_record.fields.append(field)
-
+        text = line[44:80].rstrip()
+        if pending:
+            text = pending + (text.lstrip() if pending_trim else text)
+            owner = pending_owner
+        elif is_keyword_line(line):  # the common case: keywords of the field or record above
+            owner = current_field or current_record
+            if owner is not None and line[7:16].strip():
+                # a keyword line's indicators condition the keyword, not whether the field is shown
+                known = owner.keyword_indicators if isinstance(owner, Field) else owner.indicators
+                known += [ind for ind in _conditioning(line[6:16]) if ind not in known]
+        else:
+            condition, name_type, name, _, length, data_type, decimals, usage, row, col, _ = split_a_spec(line)
+            indicators = _conditioning(condition) if condition[1:].strip() else []
+            name = name.strip()
+            if name_type in ("R", "r"):
+                current_record = RecordFormat(
+                    loc=SourceLocation(filename, ln, 18),
+                    name=name or "unknown",
+                    indicators=indicators,
+                )
+                current_field = None
+                record_formats.append(current_record)
+                owner = current_record
+            elif current_record is None:  # the grammar rejects this too
+                orphans.append(ln)
+                owner = None
+            elif name or (row + col).strip():
+                current_field = Field(
+                    loc=SourceLocation(filename, ln, 18 if name else 44),
+                    name=name,
+                    row=_number(row),
+                    col=_number(col),
+                    length=_number(length),
+                    data_type=data_type.strip().upper() or None,
+                    decimals=_number(decimals),
+                    usage=usage.strip().upper() or None,
+                    indicators=indicators,
+                )
+                current_record.fields.append(current_field)
+                owner = current_field
+            else:  # reference or usage only
+                owner = current_field or current_record
+        if text[-1:] in ("+", "-"):
+            pending, pending_owner, pending_trim = text[:-1], owner, text[-1] == "+"
+            continue
+        pending = ""
+        _add_keyword_text(owner, text, file_keywords, filename, ln)
+
+    if pending:  # continued past the last line
+        _add_keyword_text(pending_owner, pending, file_keywords, filename, ln)
+    if orphans:
+        diagnostics.append(Diagnostic(filename, orphans[0], 18, "warning",
+                                      f"{len(orphans)} field or constant line(s) before the first record format; ignored"))
     return DisplayFile(
         loc=loc,
         record_formats=record_formats,
         file_level_keywords=file_keywords,
+        subfiles=_link_subfiles(record_formats, diagnostics),
     ), diagnostics
 
 
-def _parse_field_line(content: str, filename: str, line: int) -> Field | None:
-    """Parse an A-spec field line."""
-    loc = SourceLocation(filename, line, 0)
-    # DSPF A-spec: name, position, length, type, attributes
-    # Simplified: first token = name, rest = pos/length/attrs
-    parts = content.split()
-    if not parts:
-        return None
-    name = parts[0]
-    attrs: list[Attribute] = []
-    keywords: dict[str, str] = {}
-    row, col, length = None, None, None
-
-    i = 1
-    while i < len(parts):
-        p = parts[i].upper()
-        if p in ("DSPATR", "COLOR", "HI", "TEXT", "REF", "CHECK", "CHKMSGID"):
-            attr_name = p
-            attr_val = parts[i + 1] if i + 1 < len(parts) else None
-            if attr_name == "REF" and attr_val:
-                keywords["REF"] = attr_val
-            else:
-                attrs.append(Attribute(loc=loc, name=attr_name, value=attr_val))
-            i += 2
-        elif p.isdigit():
-            nums = [int(p)]
-            j = i + 1
-            while j < len(parts) and parts[j].isdigit():
-                nums.append(int(parts[j]))
-                j += 1
-            if len(nums) >= 1:
-                row = nums[0]
-            if len(nums) >= 2:
-                col = nums[1]
-            if len(nums) >= 3:
-                length = nums[2]
-            i = j
-        else:
-            i += 1
-
-    return Field(
-        loc=loc,
-        name=name,
-        row=row,
-        col=col,
-        length=length,
-        attributes=attrs,
-        keywords=keywords,
-    )
+def _add_keyword_text(owner, text: str, file_keywords: dict[str, str], filename: str, line: int) -> None:
+    """
+    Give the (continued) keyword text of a line to its record format or
+    field (None: the file); a constant's text starts with its quoted value.
+    """
+    if not text:
+        return
+    if isinstance(owner, Field) and not owner.name and owner.constant is None:
+        m = _CONSTANT_RE.match(text)
+        if m:
+            owner.constant = m.group(1)
+            text = text[m.end():]
+    if not text.strip():
+        return
+    keywords = parse_keywords(text)
+    if owner is None:
+        _merge_keywords(file_keywords, keywords)
+        return
+    _merge_keywords(owner.keywords, keywords)
+    if isinstance(owner, Field):
+        loc = SourceLocation(filename, line, 44)
+        owner.attributes += [Attribute(loc=loc, name=k, value=v or None)
+                             for k, v in keywords.items() if k in _ATTRIBUTE_KEYWORDS]
+        if "REFFLD" in keywords:
+            owner.ref = keywords["REFFLD"]
+        if not owner.name and owner.constant is None and "DFT" in keywords:  # DFT('text') constant
+            owner.constant = keywords["DFT"]
+
+
+def _link_subfiles(record_formats: list[RecordFormat], diagnostics: list[Diagnostic]) -> list[Subfile]:
+    """Subfiles (SFL records) in source order, each with the record whose SFLCTL names it."""
+    subfiles = {r.name.upper(): Subfile(loc=r.loc, record=r) for r in record_formats if "SFL" in r.keywords}
+    for record in record_formats:
+        name = record.keywords.get("SFLCTL")
+        if name is None:
+            continue
+        subfile = subfiles.get(name.upper())
+        if subfile is None:
+            diagnostics.append(Diagnostic(record.loc.file, record.loc.line, record.loc.column, "warning",
+                                          f"SFLCTL({name}) of record {record.name} names no subfile record"))
+            continue
+        subfile.control = record
+        subfile.size = _number(record.keywords.get("SFLSIZ", ""))
+        subfile.page = _number(record.keywords.get("SFLPAG", ""))
+    for subfile in subfiles.values():
+        subfile.option_fields = [f for f in subfile.record.fields if f.name and f.usage in ("B", "I")]
+    return list(subfiles.values())
+
+
+def _merge_keywords(target: dict[str, str], keywords: dict[str, str]) -> None:
+    """Add keywords of one line to those of earlier lines; a repeated keyword keeps both parameter texts."""
+    for name, params in keywords.items():
+        previous = target.get(name)
+        target[name] = f"{previous} {params}" if previous and params else params or previous or ""
+
+
+def _conditioning(columns: str) -> list[str]:
+    """Indicators of columns 7-16 (AND/OR in 7, then three N-and-two-digit slots), as written: 31, N31."""
+    found = []
+    for start in (1, 4, 7):
+        ind = columns[start:start + 3].replace(" ", "").upper()
+        if _INDICATOR_RE.fullmatch(ind):
+            found.append(ind)
+    return found
+
+
+def _number(text: str) -> int | None:
+    text = text.strip()
+    return int(text) if text.isdigit() else None
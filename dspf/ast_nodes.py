@@ -1,7 +1,8 @@
 """
 Pythonic AST for DSPF (display file DDS).
 
-Covers record formats (R), fields (A), and attributes (DSPATR, COLOR, etc.).
+Covers record formats (R), fields (A), and attributes (DSPATR, COLOR, etc.);
+subfile records are linked to their control records.
 """
 
 from dataclasses import dataclass, field
@@ -28,7 +29,7 @@ class Attribute:
 
 @dataclass
 class Field:
-    """Display file field (A-spec)."""
+    """Display file field (A-spec); a constant has no name."""
 
     loc: SourceLocation
     name: str
@@ -36,9 +37,14 @@ class Field:
     col: int | None = None
     length: int | None = None
     data_type: str | None = None
+    decimals: int | None = None
+    usage: str | None = None  # B, I, O, H, M, P; blank (None) is O for a display file
+    constant: str | None = None  # quoted text of a constant, as written
     attributes: list[Attribute] = field(default_factory=list)
     ref: str | None = None  # REF keyword reference
     keywords: dict[str, str] = field(default_factory=dict)
+    indicators: list[str] = field(default_factory=list)  # option indicators of its own line (7-16): 31, N31
+    keyword_indicators: list[str] = field(default_factory=list)  # option indicators of its keyword lines only
 
 
 @dataclass
@@ -49,6 +55,19 @@ class RecordFormat:
     name: str
     fields: list[Field] = field(default_factory=list)
     keywords: dict[str, str] = field(default_factory=dict)
+    indicators: list[str] = field(default_factory=list)  # option indicators conditioning its keywords
+
+
+@dataclass
+class Subfile:
+    """A subfile record format (SFL) linked to its control record format (SFLCTL)."""
+
+    loc: SourceLocation
+    record: RecordFormat
+    control: RecordFormat | None = None  # None when no record names it in SFLCTL
+    size: int | None = None  # SFLSIZ of the control record
+    page: int | None = None  # SFLPAG of the control record
+    option_fields: list[Field] = field(default_factory=list)  # input-capable fields of the subfile record
 
 
 @dataclass
@@ -59,3 +78,4 @@ class DisplayFile:
     name: str | None = None
     record_formats: list[RecordFormat] = field(default_factory=list)
     file_level_keywords: dict[str, str] = field(default_factory=dict)
+    subfiles: list[Subfile] = field(default_factory=list)
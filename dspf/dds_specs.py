@@ -0,0 +1,54 @@
+"""
+Column layout of DDS A-specs.
+
+Fields map to (field name, 1-based from, to) as printed in the DDS
+reference. They are compiled once into one itemgetter over slice objects,
+so split_a_spec cuts a line into all its fields in a single C call.
+"""
+
+from operator import itemgetter
+
+# (field, first column, last column), 1-based and inclusive.
+A_SPEC_LAYOUT: tuple[tuple[str, int, int], ...] = (
+    ("condition", 7, 16),  # AND/OR in 7, then three N-and-two-digit indicators
+    ("name_type", 17, 17),  # R record format, H help area, blank field or constant
+    ("name", 19, 28),
+    ("reference", 29, 29),  # R: attributes come from a referenced field
+    ("length", 30, 34),
+    ("data_type", 35, 35),
+    ("decimals", 36, 37),
+    ("usage", 38, 38),  # B, I, O, H, M, P
+    ("line", 39, 41),
+    ("position", 42, 44),
+    ("keywords", 45, 80),
+)
+
+A_SPEC_FIELDS: tuple[str, ...] = tuple(name for name, _, _ in A_SPEC_LAYOUT)
+
+# Kept as written by decode_a_spec: the indicator slots of "condition" are
+# positional, and leading blanks of "keywords" matter to a '-' continuation.
+_RAW = frozenset(("condition", "keywords"))
+
+# split_a_spec(line): the columns of every A_SPEC_LAYOUT field, unstripped, in layout order
+split_a_spec = itemgetter(*(slice(first - 1, last) for _, first, last in A_SPEC_LAYOUT))
+
+
+def is_a_spec(line: str) -> bool:
+    """False for short lines, comments (* in column 7) and lines whose form type (column 6, optional in DDS) is not A."""
+    return len(line) > 6 and line[5] in " Aa" and line[6] != "*"
+
+
+def is_keyword_line(line: str) -> bool:
+    """An A-spec with nothing in columns 17-44: only conditioning indicators and keywords."""
+    return not line[16:44].strip()
+
+
+def decode_a_spec(line: str) -> dict[str, str] | None:
+    """
+    Decode one DDS line into {field: text}, stripped except condition and
+    keywords (keywords lose trailing blanks only). None when not is_a_spec.
+    """
+    if not is_a_spec(line):
+        return None
+    return {name: text.rstrip() if name in _RAW else text.strip()
+            for name, text in zip(A_SPEC_FIELDS, split_a_spec(line))}
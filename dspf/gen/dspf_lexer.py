@@ -0,0 +1,89 @@
+# Generated from dspf_lexer.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+def serializedATN():
+    return [
+        4,0,6,116,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,
+        6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,1,0,1,0,1,0,1,
+        0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,4,4,4,50,8,4,11,4,12,4,51,1,5,3,5,55,8,5,1,5,1,5,
+        1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,
+        1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,10,1,10,1,11,5,11,112,8,11,10,11,12,11,115,9,11,0,0,12,
+        1,1,3,2,5,3,7,4,9,5,11,6,13,0,15,0,17,0,19,0,21,0,23,0,1,0,6,2,0,
+        82,82,114,114,4,0,10,10,13,13,82,82,114,114,2,0,10,10,13,13,2,0,
+        32,32,48,57,3,0,32,32,65,65,97,97,3,0,10,10,13,13,42,42,112,0,1,
+        1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,
+        0,0,1,25,1,0,0,0,3,30,1,0,0,0,5,36,1,0,0,0,7,42,1,0,0,0,9,49,1,0,
+        0,0,11,54,1,0,0,0,13,60,1,0,0,0,15,66,1,0,0,0,17,68,1,0,0,0,19,79,
+        1,0,0,0,21,108,1,0,0,0,23,113,1,0,0,0,25,26,3,13,6,0,26,27,3,15,
+        7,0,27,28,5,42,0,0,28,29,3,23,11,0,29,2,1,0,0,0,30,31,3,13,6,0,31,
+        32,3,15,7,0,32,33,3,17,8,0,33,34,7,0,0,0,34,35,3,23,11,0,35,4,1,
+        0,0,0,36,37,3,13,6,0,37,38,3,15,7,0,38,39,3,17,8,0,39,40,3,19,9,
+        0,40,41,3,23,11,0,41,6,1,0,0,0,42,43,3,13,6,0,43,44,3,15,7,0,44,
+        45,3,17,8,0,45,46,8,1,0,0,46,47,3,23,11,0,47,8,1,0,0,0,48,50,8,2,
+        0,0,49,48,1,0,0,0,50,51,1,0,0,0,51,49,1,0,0,0,51,52,1,0,0,0,52,10,
+        1,0,0,0,53,55,5,13,0,0,54,53,1,0,0,0,54,55,1,0,0,0,55,56,1,0,0,0,
+        56,57,5,10,0,0,57,58,1,0,0,0,58,59,6,5,0,0,59,12,1,0,0,0,60,61,7,
+        3,0,0,61,62,7,3,0,0,62,63,7,3,0,0,63,64,7,3,0,0,64,65,7,3,0,0,65,
+        14,1,0,0,0,66,67,7,4,0,0,67,16,1,0,0,0,68,69,8,5,0,0,69,70,3,21,
+        10,0,70,71,3,21,10,0,71,72,3,21,10,0,72,73,3,21,10,0,73,74,3,21,
+        10,0,74,75,3,21,10,0,75,76,3,21,10,0,76,77,3,21,10,0,77,78,3,21,
+        10,0,78,18,1,0,0,0,79,80,5,32,0,0,80,81,5,32,0,0,81,82,5,32,0,0,
+        82,83,5,32,0,0,83,84,5,32,0,0,84,85,5,32,0,0,85,86,5,32,0,0,86,87,
+        5,32,0,0,87,88,5,32,0,0,88,89,5,32,0,0,89,90,5,32,0,0,90,91,5,32,
+        0,0,91,92,5,32,0,0,92,93,5,32,0,0,93,94,5,32,0,0,94,95,5,32,0,0,
+        95,96,5,32,0,0,96,97,5,32,0,0,97,98,5,32,0,0,98,99,5,32,0,0,99,100,
+        5,32,0,0,100,101,5,32,0,0,101,102,5,32,0,0,102,103,5,32,0,0,103,
+        104,5,32,0,0,104,105,5,32,0,0,105,106,5,32,0,0,106,107,5,32,0,0,
+        107,20,1,0,0,0,108,109,8,2,0,0,109,22,1,0,0,0,110,112,8,2,0,0,111,
+        110,1,0,0,0,112,115,1,0,0,0,113,111,1,0,0,0,113,114,1,0,0,0,114,
+        24,1,0,0,0,115,113,1,0,0,0,4,0,51,54,113,1,6,0,0
+    ]
+
+class dspf_lexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    COMMENT_LINE = 1
+    RECORD_LINE = 2
+    KEYWORD_LINE = 3
+    FIELD_LINE = 4
+    OTHER_LINE = 5
+    NEWLINE = 6
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+ ]
+
+    symbolicNames = [ "<INVALID>",
+            "COMMENT_LINE", "RECORD_LINE", "KEYWORD_LINE", "FIELD_LINE", 
+            "OTHER_LINE", "NEWLINE" ]
+
+    ruleNames = [ "COMMENT_LINE", "RECORD_LINE", "KEYWORD_LINE", "FIELD_LINE", 
+                  "OTHER_LINE", "NEWLINE", "SEQUENCE", "FORM_TYPE", "CONDITION", 
+                  "BLANK_17_44", "COLUMN", "REST" ]
+
+    grammarFileName = "dspf_lexer.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
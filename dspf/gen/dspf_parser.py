@@ -0,0 +1,463 @@
+# Generated from dspf_parser.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,6,51,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,1,0,1,0,5,0,13,
+        8,0,10,0,12,0,16,9,0,1,0,1,0,1,1,1,1,5,1,22,8,1,10,1,12,1,25,9,1,
+        1,2,1,2,1,2,5,2,30,8,2,10,2,12,2,33,9,2,1,2,5,2,36,8,2,10,2,12,2,
+        39,9,2,1,3,1,3,1,3,5,3,44,8,3,10,3,12,3,47,9,3,1,4,1,4,1,4,0,0,5,
+        0,2,4,6,8,0,1,2,0,1,1,5,5,53,0,10,1,0,0,0,2,23,1,0,0,0,4,26,1,0,
+        0,0,6,40,1,0,0,0,8,48,1,0,0,0,10,14,3,2,1,0,11,13,3,4,2,0,12,11,
+        1,0,0,0,13,16,1,0,0,0,14,12,1,0,0,0,14,15,1,0,0,0,15,17,1,0,0,0,
+        16,14,1,0,0,0,17,18,5,0,0,1,18,1,1,0,0,0,19,22,5,3,0,0,20,22,3,8,
+        4,0,21,19,1,0,0,0,21,20,1,0,0,0,22,25,1,0,0,0,23,21,1,0,0,0,23,24,
+        1,0,0,0,24,3,1,0,0,0,25,23,1,0,0,0,26,31,5,2,0,0,27,30,5,3,0,0,28,
+        30,3,8,4,0,29,27,1,0,0,0,29,28,1,0,0,0,30,33,1,0,0,0,31,29,1,0,0,
+        0,31,32,1,0,0,0,32,37,1,0,0,0,33,31,1,0,0,0,34,36,3,6,3,0,35,34,
+        1,0,0,0,36,39,1,0,0,0,37,35,1,0,0,0,37,38,1,0,0,0,38,5,1,0,0,0,39,
+        37,1,0,0,0,40,45,5,4,0,0,41,44,5,3,0,0,42,44,3,8,4,0,43,41,1,0,0,
+        0,43,42,1,0,0,0,44,47,1,0,0,0,45,43,1,0,0,0,45,46,1,0,0,0,46,7,1,
+        0,0,0,47,45,1,0,0,0,48,49,7,0,0,0,49,9,1,0,0,0,8,14,21,23,29,31,
+        37,43,45
+    ]
+
+class dspf_parser ( Parser ):
+
+    grammarFileName = "dspf_parser.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [  ]
+
+    symbolicNames = [ "<INVALID>", "COMMENT_LINE", "RECORD_LINE", "KEYWORD_LINE", 
+                      "FIELD_LINE", "OTHER_LINE", "NEWLINE" ]
+
+    RULE_dspfFile = 0
+    RULE_fileKeywords = 1
+    RULE_recordFormat = 2
+    RULE_fieldDefinition = 3
+    RULE_skippedLine = 4
+
+    ruleNames =  [ "dspfFile", "fileKeywords", "recordFormat", "fieldDefinition", 
+                   "skippedLine" ]
+
+    EOF = Token.EOF
+    COMMENT_LINE=1
+    RECORD_LINE=2
+    KEYWORD_LINE=3
+    FIELD_LINE=4
+    OTHER_LINE=5
+    NEWLINE=6
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class DspfFileContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def fileKeywords(self):
+            return self.getTypedRuleContext(dspf_parser.FileKeywordsContext,0)
+
+
+        def EOF(self):
+            return self.getToken(dspf_parser.EOF, 0)
+
+        def recordFormat(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(dspf_parser.RecordFormatContext)
+            else:
+                return self.getTypedRuleContext(dspf_parser.RecordFormatContext,i)
+
+
+        def getRuleIndex(self):
+            return dspf_parser.RULE_dspfFile
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterDspfFile" ):
+                listener.enterDspfFile(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitDspfFile" ):
+                listener.exitDspfFile(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDspfFile" ):
+                return visitor.visitDspfFile(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def dspfFile(self):
+
+        localctx = dspf_parser.DspfFileContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_dspfFile)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 10
+            self.fileKeywords()
+            self.state = 14
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==2:
+                self.state = 11
+                self.recordFormat()
+                self.state = 16
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 17
+            self.match(dspf_parser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FileKeywordsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def KEYWORD_LINE(self, i:int=None):
+            if i is None:
+                return self.getTokens(dspf_parser.KEYWORD_LINE)
+            else:
+                return self.getToken(dspf_parser.KEYWORD_LINE, i)
+
+        def skippedLine(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(dspf_parser.SkippedLineContext)
+            else:
+                return self.getTypedRuleContext(dspf_parser.SkippedLineContext,i)
+
+
+        def getRuleIndex(self):
+            return dspf_parser.RULE_fileKeywords
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFileKeywords" ):
+                listener.enterFileKeywords(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFileKeywords" ):
+                listener.exitFileKeywords(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFileKeywords" ):
+                return visitor.visitFileKeywords(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def fileKeywords(self):
+
+        localctx = dspf_parser.FileKeywordsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_fileKeywords)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 23
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 42) != 0):
+                self.state = 21
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [3]:
+                    self.state = 19
+                    self.match(dspf_parser.KEYWORD_LINE)
+                    pass
+                elif token in [1, 5]:
+                    self.state = 20
+                    self.skippedLine()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 25
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RecordFormatContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RECORD_LINE(self):
+            return self.getToken(dspf_parser.RECORD_LINE, 0)
+
+        def KEYWORD_LINE(self, i:int=None):
+            if i is None:
+                return self.getTokens(dspf_parser.KEYWORD_LINE)
+            else:
+                return self.getToken(dspf_parser.KEYWORD_LINE, i)
+
+        def skippedLine(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(dspf_parser.SkippedLineContext)
+            else:
+                return self.getTypedRuleContext(dspf_parser.SkippedLineContext,i)
+
+
+        def fieldDefinition(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(dspf_parser.FieldDefinitionContext)
+            else:
+                return self.getTypedRuleContext(dspf_parser.FieldDefinitionContext,i)
+
+
+        def getRuleIndex(self):
+            return dspf_parser.RULE_recordFormat
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterRecordFormat" ):
+                listener.enterRecordFormat(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitRecordFormat" ):
+                listener.exitRecordFormat(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRecordFormat" ):
+                return visitor.visitRecordFormat(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def recordFormat(self):
+
+        localctx = dspf_parser.RecordFormatContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_recordFormat)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 26
+            self.match(dspf_parser.RECORD_LINE)
+            self.state = 31
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 42) != 0):
+                self.state = 29
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [3]:
+                    self.state = 27
+                    self.match(dspf_parser.KEYWORD_LINE)
+                    pass
+                elif token in [1, 5]:
+                    self.state = 28
+                    self.skippedLine()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 33
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 37
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==4:
+                self.state = 34
+                self.fieldDefinition()
+                self.state = 39
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FieldDefinitionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FIELD_LINE(self):
+            return self.getToken(dspf_parser.FIELD_LINE, 0)
+
+        def KEYWORD_LINE(self, i:int=None):
+            if i is None:
+                return self.getTokens(dspf_parser.KEYWORD_LINE)
+            else:
+                return self.getToken(dspf_parser.KEYWORD_LINE, i)
+
+        def skippedLine(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(dspf_parser.SkippedLineContext)
+            else:
+                return self.getTypedRuleContext(dspf_parser.SkippedLineContext,i)
+
+
+        def getRuleIndex(self):
+            return dspf_parser.RULE_fieldDefinition
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterFieldDefinition" ):
+                listener.enterFieldDefinition(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitFieldDefinition" ):
+                listener.exitFieldDefinition(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFieldDefinition" ):
+                return visitor.visitFieldDefinition(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def fieldDefinition(self):
+
+        localctx = dspf_parser.FieldDefinitionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_fieldDefinition)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 40
+            self.match(dspf_parser.FIELD_LINE)
+            self.state = 45
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 42) != 0):
+                self.state = 43
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [3]:
+                    self.state = 41
+                    self.match(dspf_parser.KEYWORD_LINE)
+                    pass
+                elif token in [1, 5]:
+                    self.state = 42
+                    self.skippedLine()
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 47
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SkippedLineContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def COMMENT_LINE(self):
+            return self.getToken(dspf_parser.COMMENT_LINE, 0)
+
+        def OTHER_LINE(self):
+            return self.getToken(dspf_parser.OTHER_LINE, 0)
+
+        def getRuleIndex(self):
+            return dspf_parser.RULE_skippedLine
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSkippedLine" ):
+                listener.enterSkippedLine(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSkippedLine" ):
+                listener.exitSkippedLine(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSkippedLine" ):
+                return visitor.visitSkippedLine(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def skippedLine(self):
+
+        localctx = dspf_parser.SkippedLineContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_skippedLine)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 48
+            _la = self._input.LA(1)
+            if not(_la==1 or _la==5):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+
+
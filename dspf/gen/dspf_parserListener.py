@@ -0,0 +1,57 @@
+# Generated from dspf_parser.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .dspf_parser import dspf_parser
+else:
+    from dspf_parser import dspf_parser
+
+# This class defines a complete listener for a parse tree produced by dspf_parser.
+class dspf_parserListener(ParseTreeListener):
+
+    # Enter a parse tree produced by dspf_parser#dspfFile.
+    def enterDspfFile(self, ctx:dspf_parser.DspfFileContext):
+        pass
+
+    # Exit a parse tree produced by dspf_parser#dspfFile.
+    def exitDspfFile(self, ctx:dspf_parser.DspfFileContext):
+        pass
+
+
+    # Enter a parse tree produced by dspf_parser#fileKeywords.
+    def enterFileKeywords(self, ctx:dspf_parser.FileKeywordsContext):
+        pass
+
+    # Exit a parse tree produced by dspf_parser#fileKeywords.
+    def exitFileKeywords(self, ctx:dspf_parser.FileKeywordsContext):
+        pass
+
+
+    # Enter a parse tree produced by dspf_parser#recordFormat.
+    def enterRecordFormat(self, ctx:dspf_parser.RecordFormatContext):
+        pass
+
+    # Exit a parse tree produced by dspf_parser#recordFormat.
+    def exitRecordFormat(self, ctx:dspf_parser.RecordFormatContext):
+        pass
+
+
+    # Enter a parse tree produced by dspf_parser#fieldDefinition.
+    def enterFieldDefinition(self, ctx:dspf_parser.FieldDefinitionContext):
+        pass
+
+    # Exit a parse tree produced by dspf_parser#fieldDefinition.
+    def exitFieldDefinition(self, ctx:dspf_parser.FieldDefinitionContext):
+        pass
+
+
+    # Enter a parse tree produced by dspf_parser#skippedLine.
+    def enterSkippedLine(self, ctx:dspf_parser.SkippedLineContext):
+        pass
+
+    # Exit a parse tree produced by dspf_parser#skippedLine.
+    def exitSkippedLine(self, ctx:dspf_parser.SkippedLineContext):
+        pass
+
+
+
+del dspf_parser
\ No newline at end of file
@@ -0,0 +1,38 @@
+# Generated from dspf_parser.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .dspf_parser import dspf_parser
+else:
+    from dspf_parser import dspf_parser
+
+# This class defines a complete generic visitor for a parse tree produced by dspf_parser.
+
+class dspf_parserVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by dspf_parser#dspfFile.
+    def visitDspfFile(self, ctx:dspf_parser.DspfFileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by dspf_parser#fileKeywords.
+    def visitFileKeywords(self, ctx:dspf_parser.FileKeywordsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by dspf_parser#recordFormat.
+    def visitRecordFormat(self, ctx:dspf_parser.RecordFormatContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by dspf_parser#fieldDefinition.
+    def visitFieldDefinition(self, ctx:dspf_parser.FieldDefinitionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by dspf_parser#skippedLine.
+    def visitSkippedLine(self, ctx:dspf_parser.SkippedLineContext):
+        return self.visitChildren(ctx)
+
+
+
+del dspf_parser
\ No newline at end of file
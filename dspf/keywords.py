@@ -0,0 +1,104 @@
+"""
+Tokenizer for DDS keyword text (columns 45-80, continuation lines joined).
+
+Keywords are NAME or NAME(parameters); parameters may hold quoted strings
+(with '' for a quote, and parentheses inside), nested parenthesised groups
+such as WDWBORDER((*COLOR BLU) (*DSPATR RI)), and blank-separated values:
+
+    DSPATR(HI RI)  VALUES('A' 'B')  CF03(03 'Exit')  ERRMSG('Bad (code)' 31)
+
+One compiled pattern finds the next token; the scan is linear in the text.
+"""
+
+import re
+from functools import lru_cache
+
+_TOKEN_RE = re.compile(r"\s*(?:(?P<string>'(?:[^']|'')*'?)|(?P<open>\()|(?P<close>\))|(?P<word>[^\s()']+))")
+
+
+def iter_keywords(text: str):
+    """
+    Yield (NAME, parameter text) for each keyword in text; the parameter
+    text is what stands between the outer parentheses, stripped ("" for a
+    keyword without parameters). A quoted string outside any keyword (the
+    text of a constant) is skipped; unbalanced parentheses end at the end
+    of the text.
+    """
+    pos, n = 0, len(text)
+    name = None
+    while pos < n:
+        m = _TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:  # trailing blanks
+            break
+        kind = m.lastgroup
+        if kind == "open" and name is not None:
+            start = m.end()
+            pos = _matching_close(text, start)
+            yield name, text[start:pos].strip()
+            pos += 1
+            name = None
+            continue
+        if name is not None:
+            yield name, ""
+            name = None
+        if kind == "word":
+            name = m.group("word").upper()
+        pos = m.end()
+    if name is not None:
+        yield name, ""
+
+
+@lru_cache(maxsize=4096)
+def parse_keywords(text: str) -> dict[str, str]:
+    """
+    Keywords of text as {NAME: parameter text}. A keyword given more than
+    once keeps every parameter text, blank-separated (DSPATR(HI) on one
+    line and DSPATR(RI) on the next give "HI RI"). Shared between equal
+    texts: do not modify.
+    """
+    keywords: dict[str, str] = {}
+    for name, params in iter_keywords(text):
+        previous = keywords.get(name)
+        keywords[name] = f"{previous} {params}".strip() if previous else params
+    return keywords
+
+
+def keyword_arguments(params: str) -> list[str]:
+    """
+    Top-level parameters of a keyword: quoted strings (with their quotes),
+    values, and nested groups (with their parentheses), in order.
+    """
+    args: list[str] = []
+    pos, n = 0, len(params)
+    while pos < n:
+        m = _TOKEN_RE.match(params, pos)
+        if m is None or m.end() == pos:
+            break
+        if m.lastgroup == "open":
+            start = m.start("open")
+            pos = _matching_close(params, m.end()) + 1
+            args.append(params[start:pos])
+            continue
+        if m.lastgroup != "close":
+            args.append(m.group(m.lastgroup))
+        pos = m.end()
+    return args
+
+
+def _matching_close(text: str, pos: int) -> int:
+    """Index of the ')' closing the '(' just before pos (len(text) when missing)."""
+    depth = 1
+    n = len(text)
+    while pos < n:
+        m = _TOKEN_RE.match(text, pos)
+        if m is None or m.end() == pos:
+            break
+        kind = m.lastgroup
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if depth == 0:
+                return m.start("close")
+        pos = m.end()
+    return n
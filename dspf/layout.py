@@ -0,0 +1,244 @@
+"""
+Screen layout validation for display files.
+
+Each record format is laid out on an occupancy grid of the screen size from
+DSPSIZ (24x80 *DS3 or 27x132 *DS4; a WINDOW record on its window's size).
+The grid is one flat array of cells holding the number of the field that
+covers them, so a field is placed with one slice compare and one slice
+fill; a field running past the end of a screen line wraps to the next, as
+on the device (not in a window). Grids are kept per size and reused across
+records and files.
+
+A field covers its display attribute byte (the cell before its first
+position) and its length as shown: numeric fields with EDTCDE or EDTWRD
+take their edited length (commas, decimal point, sign, currency symbol).
+
+Reported, as Diagnostics:
+    error    a field or constant extends past the screen (or window), or
+             starts at line 1 position 1 with no cell for its attribute
+    error    two fields of a record cover the same cells, unless their
+             option indicators exclude each other (31 / N31)
+    warning  records shown together share screen lines: an OVERLAY record
+             erases the lines it shares with records already displayed,
+             and a subfile control record must keep clear of its
+             subfile's lines (SFLPAG of them from the SFL record's line)
+
+Hidden (H) and program-to-system (P) fields and fields without a fixed
+line, position and length (relative positions, REFFLD without a length)
+take no cells.
+"""
+
+from array import array
+
+from core.diagnostics import Diagnostic
+from dspf.ast_nodes import DisplayFile, Field, RecordFormat
+from dspf.keywords import keyword_arguments
+
+SCREEN_SIZES = {"*DS3": (24, 80), "*DS4": (27, 132)}
+DEFAULT_SCREEN_SIZE = SCREEN_SIZES["*DS3"]
+
+_NOT_DISPLAYED = frozenset(("H", "P"))
+_NUMERIC_TYPES = frozenset(("S", "P", "Y", "B", "F"))
+_COMMA_EDIT_CODES = frozenset("12ABJKNO")  # edit codes that insert thousands separators
+_USER_EDIT_CODES = frozenset("56789")  # user-defined edit codes: their length is not known here
+
+
+def screen_size(display_file: DisplayFile) -> tuple[int, int]:
+    """(lines, columns) of the primary DSPSIZ of a display file: 24x80 unless it says otherwise."""
+    args = keyword_arguments(display_file.file_level_keywords.get("DSPSIZ", ""))
+    if len(args) >= 2 and args[0].isdigit() and args[1].isdigit():
+        return int(args[0]), int(args[1])
+    if args:
+        return SCREEN_SIZES.get(args[0].upper(), DEFAULT_SCREEN_SIZE)
+    return DEFAULT_SCREEN_SIZE
+
+
+class LayoutValidator:
+    """Occupancy grids by screen size, shared by every display file validated."""
+
+    def __init__(self):
+        self._grids: dict[tuple[int, int], tuple[array, array]] = {}  # size -> (grid, blank)
+        self.files = 0
+        self.records = 0
+
+    def validate(self, display_file: DisplayFile) -> list[Diagnostic]:
+        """Diagnostics for every record format of display_file."""
+        self.files += 1
+        diagnostics: list[Diagnostic] = []
+        size = screen_size(display_file)
+        pages = {s.record.name.upper(): s.page for s in display_file.subfiles if s.page}
+        lines_used: dict[str, int] = {}  # record -> bitset of the screen lines it covers
+        for record in display_file.record_formats:
+            self.records += 1
+            lines_used[record.name.upper()] = self._place_record(record, _window_size(record) or size,
+                                                                 pages.get(record.name.upper(), 1), diagnostics)
+        _overlay_conflicts(display_file, lines_used, diagnostics)
+        return diagnostics
+
+    def _place_record(self, record: RecordFormat, size: tuple[int, int], page: int,
+                      diagnostics: list[Diagnostic]) -> int:
+        rows, cols = size
+        cells = rows * cols
+        grid, blank = self._grid(size)
+        grid[:] = blank
+        fields = record.fields
+        window = "WINDOW" in record.keywords  # a window's fields do not wrap to its next line
+        area = "window" if window else "screen"
+        lines = 0
+        for number, fld in enumerate(fields, 1):
+            length = _length(fld)
+            if length is None:
+                continue
+            row, col = fld.row, fld.col
+            start = (row - 1) * cols + (col - 1) - 1  # from the attribute byte before the field
+            end = start + 1 + length
+            if row < 1 or col < 1 or row > rows or col > cols or end > cells or (window and col + length - 1 > cols):
+                diagnostics.append(_diagnostic(
+                    fld, "error", f"{_label(fld)} at line {row} position {col} (length {length}) "
+                                  f"extends past the {rows}x{cols} {area}"))
+                start, end = max(start, 0), min(end, cells)
+                if start >= end:
+                    continue
+            elif start < 0:
+                diagnostics.append(_diagnostic(
+                    fld, "error", f"{_label(fld)} at line 1 position 1 leaves no cell for its attribute byte"))
+                start = 0
+            covered = grid[start:end]
+            if any(covered):
+                for other in sorted(set(covered) - {0}):
+                    if not _exclusive(fields[other - 1], fld):
+                        diagnostics.append(_diagnostic(
+                            fld, "error", f"{_label(fld)} in record {record.name} overlaps "
+                                          f"{_label(fields[other - 1])} (line {row} position {col})"))
+            grid[start:end] = array("H", (number,)) * (end - start)
+            first, last = start // cols, (end - 1) // cols + page - 1
+            lines |= ((1 << (last - first + 1)) - 1) << first
+        return lines
+
+    def _grid(self, size: tuple[int, int]) -> tuple[array, array]:
+        grids = self._grids.get(size)
+        if grids is None:
+            blank = array("H", bytes(2 * size[0] * size[1]))
+            grids = self._grids[size] = (array("H", blank), blank)
+        return grids
+
+
+_default_validator: LayoutValidator | None = None
+
+
+def default_validator() -> LayoutValidator:
+    """Process-wide validator shared by every caller that does not bring its own."""
+    global _default_validator
+    if _default_validator is None:
+        _default_validator = LayoutValidator()
+    return _default_validator
+
+
+def set_default_validator(validator: LayoutValidator) -> None:
+    """Install a validator as the process-wide default."""
+    global _default_validator
+    _default_validator = validator
+
+
+def validate_layout(display_file: DisplayFile, validator: LayoutValidator | None = None) -> list[Diagnostic]:
+    """Layout diagnostics of one display file; see the module docstring."""
+    return (validator or default_validator()).validate(display_file)
+
+
+def _length(fld: Field) -> int | None:
+    """
+    Cells a field shows (without its attribute byte), or None when it takes
+    none (hidden, relative position, unknown length).
+    """
+    if fld.row is None or fld.col is None or fld.usage in _NOT_DISPLAYED:
+        return None
+    if fld.constant is not None:
+        return max(len(fld.constant) - 2 - fld.constant.count("''"), 0) or None
+    if fld.length and (fld.decimals is not None or fld.data_type in _NUMERIC_TYPES):
+        return _edited_length(fld) or fld.length
+    return fld.length or None
+
+
+def _edited_length(fld: Field) -> int | None:
+    """Display length of a numeric field edited by EDTWRD or EDTCDE; None when it has neither (or a user code)."""
+    word = fld.keywords.get("EDTWRD")
+    if word:
+        word = word.strip()
+        return max(len(word) - 2 - word.count("''"), 0) if word[:1] == "'" else None
+    args = keyword_arguments(fld.keywords.get("EDTCDE", ""))
+    code = args[0].upper() if args else ""
+    if len(code) != 1 or code in _USER_EDIT_CODES:
+        return None
+    length, decimals = fld.length, fld.decimals or 0
+    if code == "Y":  # date: nn/nn or nn/nn/nn(nn)
+        return length + (1 if length <= 4 else 2)
+    if code in ("X", "Z"):
+        return length
+    shown = length
+    if code in _COMMA_EDIT_CODES:
+        shown += max(length - decimals - 1, 0) // 3
+    if decimals:
+        shown += 1  # decimal point
+    shown += 2 if code in "ABCD" else 1 if code in "JKLMNOPQ" else 0  # CR, or a minus sign
+    if len(args) > 1 and args[1] != "*":  # floating currency symbol; * only fills
+        shown += 1
+    return shown
+
+
+def _label(fld: Field) -> str:
+    return f"field {fld.name}" if fld.name else f"constant {fld.constant}"
+
+
+def _exclusive(a: Field, b: Field) -> bool:
+    """
+    True when a and b cannot be shown together: the option indicators of
+    their own lines exclude each other (31 on one, N31 on the other).
+    Indicators on keyword lines only condition keywords (31 DSPATR(RI)).
+    """
+    if not a.indicators or not b.indicators:
+        return False
+    for ind in a.indicators:
+        opposite = ind[1:] if ind[0] == "N" else "N" + ind
+        if opposite in b.indicators:
+            return True
+    return False
+
+
+def _window_size(record: RecordFormat) -> tuple[int, int] | None:
+    """(lines, columns) of a WINDOW record: WINDOW(start-line start-pos lines columns) or WINDOW(*DFT lines columns)."""
+    params = record.keywords.get("WINDOW")
+    if not params:
+        return None
+    numbers = [int(a) for a in keyword_arguments(params) if a.isdigit()]
+    if len(numbers) in (2, 4):
+        return numbers[-2], numbers[-1]
+    return None
+
+
+def _overlay_conflicts(display_file: DisplayFile, lines_used: dict[str, int], diagnostics: list[Diagnostic]) -> None:
+    """Warn about records shown together (OVERLAY, or a subfile and its control record) that share lines."""
+    records = display_file.record_formats
+    controls = {(id(s.control), id(s.record)) for s in display_file.subfiles if s.control is not None}
+    for i, a in enumerate(records):
+        a_lines = lines_used[a.name.upper()]
+        if not a_lines:
+            continue
+        for b in records[i + 1:]:
+            shared = a_lines & lines_used[b.name.upper()]
+            if not shared:
+                continue
+            line = (shared & -shared).bit_length()
+            if (id(a), id(b)) in controls or (id(b), id(a)) in controls:
+                control, subfile = (a, b) if (id(a), id(b)) in controls else (b, a)
+                diagnostics.append(_diagnostic(
+                    control, "warning", f"subfile control record {control.name} uses line {line}, "
+                                        f"inside subfile {subfile.name}"))
+            elif "OVERLAY" in a.keywords or "OVERLAY" in b.keywords:
+                later, earlier = (b, a) if "OVERLAY" in b.keywords else (a, b)
+                diagnostics.append(_diagnostic(
+                    later, "warning", f"record {later.name} (OVERLAY) shares line {line} with record "
+                                      f"{earlier.name}, which it erases when both are shown"))
+
+
+def _diagnostic(node, severity: str, message: str) -> Diagnostic:
+    return Diagnostic(node.loc.file, node.loc.line, node.loc.column, severity, message)
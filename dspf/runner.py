@@ -8,6 +8,7 @@ from core.diagnostics import Diagnostic
 from core.io import load_file
 from dspf.ast_nodes import DisplayFile
 from dspf.ast_builder import parse_dspf
+from dspf.layout import screen_size, validate_layout
 
 @dataclass
 class DspfMetrics:
@@ -34,6 +35,8 @@ def run_dspf_file(path: str) -> DspfResult:
         return DspfResult(path, None, [Diagnostic(path, 0, 0, "error", str(e))])
 
     ast, diagnostics = parse_dspf(source, path)
+    if ast:
+        diagnostics.extend(validate_layout(ast))
     
     # AST Generation
     ast_lines = []
@@ -55,7 +58,10 @@ def run_dspf_file(path: str) -> DspfResult:
         elif hasattr(node, "length") and hasattr(node, "name"):
             connector = "└── " if is_last_child else "├── "
             dtype = getattr(node, "data_type", "") or ""
-            ast_lines.append(f"{parent_prefix}{connector}Field: {node.name} ({dtype} {node.length})")
+            if node.name:
+                ast_lines.append(f"{parent_prefix}{connector}Field: {node.name} ({dtype} {node.length})")
+            else:
+                ast_lines.append(f"{parent_prefix}{connector}Constant: {node.constant} ({node.row} {node.col})")
 
     if ast:
         dump_ast(ast)
@@ -66,6 +72,7 @@ def run_dspf_file(path: str) -> DspfResult:
     if ast:
         metrics.record_count = len(ast.record_formats)
         metrics.field_count = sum(len(r.fields) for r in ast.record_formats)
+        metrics.screen_size = "x".join(map(str, screen_size(ast)))
 
     # Generate Report
     lines = []
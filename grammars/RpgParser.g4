@@ -1,3 +1,10 @@
+parser grammar RpgParser;
+
+options { tokenVocab = RpgLexer; }
+
+r: (dcl_pr
+	| dcl_pi
+	| ctl_opt
 //	| dspec_continuation
 //	| (dspec_continuation* dspec_fixed) 
   	| subroutine 
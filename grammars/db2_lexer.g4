@@ -3,12 +3,13 @@ lexer grammar db2_lexer;
 // DB2 SQL Lexer Grammar
 // Covers IBM DB2 for i SQL syntax
 
-// Basic tokens
-IDENTIFIER: [A-Za-z_][A-Za-z0-9_]*;
+options { caseInsensitive = true; }
+
+// Basic tokens (IDENTIFIER is declared last so keywords win ties)
 NUMBER: [0-9]+ ('.' [0-9]+)?;
-STRING: '\'' (~['\r\n])* '\'';
+STRING: '\'' ('\'\'' | ~['\r\n])* '\'';
 DOUBLE_QUOTED_STRING: '"' (~["\r\n])* '"';
-HEX_STRING: 'X\'' [0-9A-Fa-f]* '\'';
+HEX_STRING: 'X\'' [0-9A-F]* '\'';
 
 // Special characters
 LPAREN: '(';
@@ -34,6 +35,7 @@ EXCLAMATION: '!';
 TILDE: '~';
 CARET: '^';
 AMPERSAND: '&';
+CONCAT: '||';
 PIPE: '|';
 BACKSLASH: '\\';
 GRAVE: '`';
@@ -66,7 +68,7 @@ POWER: '**' | 'POWER';
 
 // Whitespace and separators
 WS: [ \t\r\n]+ -> skip;
-COMMENT: '/*' .*? '*/' -> skip;
+BLOCK_COMMENT: '/*' .*? '*/' -> skip;
 LINE_COMMENT: '--' ~[\r\n]* -> skip;
 
 // SQL keywords
@@ -95,6 +97,9 @@ MERGE: 'MERGE';
 VALUES: 'VALUES';
 SET: 'SET';
 INTO: 'INTO';
+AS: 'AS';
+TO: 'TO';
+MATCHED: 'MATCHED';
 
 // DDL keywords
 CREATE: 'CREATE';
@@ -114,6 +119,15 @@ SCHEMA: 'SCHEMA';
 DATABASE: 'DATABASE';
 TABLESPACE: 'TABLESPACE';
 PARTITION: 'PARTITION';
+COLUMN: 'COLUMN';
+ADD: 'ADD';
+MODIFY: 'MODIFY';
+COMMENT: 'COMMENT';
+PUBLIC: 'PUBLIC';
+START: 'START';
+INCREMENT: 'INCREMENT';
+MINVALUE: 'MINVALUE';
+MAXVALUE: 'MAXVALUE';
 
 // Data types
 INTEGER: 'INTEGER' | 'INT';
@@ -150,6 +164,9 @@ CASCADE: 'CASCADE';
 RESTRICT: 'RESTRICT';
 SET_NULL: 'SET' WS 'NULL';
 NO_ACTION: 'NO' WS 'ACTION';
+GENERATED: 'GENERATED';
+ALWAYS: 'ALWAYS';
+IDENTITY: 'IDENTITY';
 
 // Functions
 COUNT: 'COUNT';
@@ -256,3 +273,6 @@ PERCENT_RANK: 'PERCENT_RANK';
 CUME_DIST: 'CUME_DIST';
 PERCENTILE_CONT: 'PERCENTILE_CONT';
 PERCENTILE_DISC: 'PERCENTILE_DISC';
+
+// Identifiers (after all keywords)
+IDENTIFIER: [A-Z_@#$][A-Z0-9_@#$]*;
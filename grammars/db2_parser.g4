@@ -30,6 +30,7 @@ semicolon: SEMICOLON;
 // SELECT statement
 selectStatement:
     SELECT (DISTINCT | ALL)? selectList
+    (INTO hostVariable (COMMA hostVariable)*)?
     FROM tableExpression
     (WHERE whereClause)?
     (GROUP BY groupByClause)?
@@ -85,7 +86,7 @@ orderByItem: expression (ASC | DESC)?;
 
 limitClause: NUMBER;
 offsetClause: NUMBER;
-fetchClause: FIRST | NEXT NUMBER ROWS? ONLY;
+fetchClause: (FIRST | NEXT) NUMBER? (ROW | ROWS) ONLY;
 
 // INSERT statement
 insertStatement:
@@ -134,7 +135,12 @@ createStatement:
     ;
 
 createTableStatement:
-    CREATE TABLE tableName LPAREN columnDefinition (COMMA columnDefinition)* RPAREN
+    CREATE TABLE tableName LPAREN tableElement (COMMA tableElement)* RPAREN
+    ;
+
+tableElement:
+    columnDefinition
+    | tableConstraint
     ;
 
 columnDefinition:
@@ -147,7 +153,14 @@ dataType:
     | REAL | DOUBLE | FLOAT
     | CHAR (LPAREN length RPAREN)?
     | VARCHAR (LPAREN length RPAREN)?
-    | DATE | TIME | TIMESTAMP
+    | GRAPHIC (LPAREN length RPAREN)?
+    | VARGRAPHIC (LPAREN length RPAREN)?
+    | CLOB (LPAREN length RPAREN)?
+    | DBCLOB (LPAREN length RPAREN)?
+    | BLOB (LPAREN length RPAREN)?
+    | DATE | TIME
+    | TIMESTAMP (LPAREN precision RPAREN)?
+    | XML
     ;
 
 precision: NUMBER;
@@ -155,24 +168,43 @@ scale: NUMBER;
 length: NUMBER;
 
 columnConstraint:
-    NOT_NULL
-    | DEFAULT defaultValue
+    (CONSTRAINT constraintName)?
+    ( NOT_NULL
+    | NULL
+    | WITH? DEFAULT defaultValue?
     | PRIMARY KEY
     | UNIQUE
     | CHECK LPAREN checkCondition RPAREN
-    | REFERENCES tableName (LPAREN columnName RPAREN)?
+    | REFERENCES tableName (LPAREN columnList RPAREN)? referentialAction*
+    | GENERATED (ALWAYS | BY DEFAULT) AS IDENTITY (LPAREN identityOption (COMMA? identityOption)* RPAREN)?
+    )
+    ;
+
+tableConstraint:
+    (CONSTRAINT constraintName)? constraintDefinition
+    ;
+
+referentialAction:
+    ON (DELETE | UPDATE) (CASCADE | RESTRICT | SET_NULL | NO_ACTION | SET DEFAULT)
+    ;
+
+identityOption:
+    START WITH startValue
+    | INCREMENT BY incrementValue
+    | MINVALUE minValue
+    | MAXVALUE maxValue
     ;
 
 defaultValue: expression;
 checkCondition: expression;
 
 createViewStatement:
-    CREATE VIEW IDENTIFIER (LPAREN columnList RPAREN)?
+    CREATE VIEW tableName (LPAREN columnList RPAREN)?
     AS selectStatement
     ;
 
 createIndexStatement:
-    CREATE INDEX IDENTIFIER ON tableName LPAREN columnList RPAREN
+    CREATE UNIQUE? INDEX tableName ON tableName LPAREN orderByItem (COMMA orderByItem)* RPAREN
     ;
 
 createSequenceStatement:
@@ -183,10 +215,10 @@ createSequenceStatement:
     (MAXVALUE maxValue)?
     ;
 
-startValue: NUMBER;
-incrementValue: NUMBER;
-minValue: NUMBER;
-maxValue: NUMBER;
+startValue: MINUS? NUMBER;
+incrementValue: MINUS? NUMBER;
+minValue: MINUS? NUMBER;
+maxValue: MINUS? NUMBER;
 
 // ALTER statement
 alterStatement:
@@ -197,7 +229,7 @@ alterAction:
     ADD COLUMN columnDefinition
     | DROP COLUMN columnName
     | MODIFY COLUMN columnDefinition
-    | ADD CONSTRAINT constraintName constraintDefinition
+    | ADD tableConstraint
     | DROP CONSTRAINT constraintName
     ;
 
@@ -205,7 +237,7 @@ constraintName: IDENTIFIER;
 constraintDefinition:
     PRIMARY KEY LPAREN columnList RPAREN
     | UNIQUE LPAREN columnList RPAREN
-    | FOREIGN KEY LPAREN columnList RPAREN REFERENCES tableName (LPAREN columnList RPAREN)?
+    | FOREIGN KEY LPAREN columnList RPAREN REFERENCES tableName (LPAREN columnList RPAREN)? referentialAction*
     | CHECK LPAREN checkCondition RPAREN
     ;
 
@@ -214,7 +246,7 @@ dropStatement:
     DROP (TABLE | VIEW | INDEX | SEQUENCE) objectName
     ;
 
-objectName: IDENTIFIER;
+objectName: tableName;
 
 // GRANT statement
 grantStatement:
@@ -246,14 +278,24 @@ optionValue: expression;
 // COMMENT statement
 commentStatement: COMMENT ON (TABLE | COLUMN) objectName IS STRING;
 
-// Expressions
+// Expressions (alternatives listed from highest to lowest precedence)
 expression:
-    primaryExpression
-    | expression operator expression
-    | LPAREN expression RPAREN
-    | functionCall
-    | caseExpression
-    | castExpression
+    primaryExpression                                                       # primaryExpr
+    | functionCall                                                          # functionExpr
+    | caseExpression                                                        # caseExpr
+    | castExpression                                                        # castExpr
+    | LPAREN expression (COMMA expression)* RPAREN                          # parenExpr
+    | (PLUS | MINUS) expression                                             # unaryExpr
+    | expression (ASTERISK | SLASH | PERCENT | POWER) expression            # multiplicativeExpr
+    | expression (PLUS | MINUS | CONCAT) expression                         # additiveExpr
+    | expression (IS | IS_NOT) NULL                                         # isNullExpr
+    | expression (BETWEEN | NOT_BETWEEN) expression AND expression          # betweenExpr
+    | expression (IN | NOT_IN) LPAREN (selectStatement | expression (COMMA expression)*) RPAREN  # inExpr
+    | expression comparisonOperator expression                              # comparisonExpr
+    | (EXISTS | NOT_EXISTS) subquery                                        # existsExpr
+    | NOT expression                                                        # notExpr
+    | expression AND expression                                             # andExpr
+    | expression (OR | XOR) expression                                      # orExpr
     ;
 
 primaryExpression:
@@ -265,20 +307,18 @@ primaryExpression:
 
 literal: NUMBER | STRING | DOUBLE_QUOTED_STRING | HEX_STRING | NULL | CURRENT_DATE | CURRENT_TIME | CURRENT_TIMESTAMP;
 
-columnReference: (tableName DOT)? columnName;
-tableName: IDENTIFIER;
+columnReference: (tableQualifier DOT)? columnName;
+tableQualifier: (schemaName DOT)? IDENTIFIER;
+tableName: (schemaName (DOT | SLASH))? IDENTIFIER;
+schemaName: IDENTIFIER;
 columnName: IDENTIFIER;
-parameter: QUESTION;
+parameter: QUESTION | hostVariable;
 
-operator:
-    arithmeticOperator
-    | comparisonOperator
-    | logicalOperator
-    ;
+// Embedded SQL host variable, optionally a data structure subfield (:DS.FIELD)
+// and an indicator variable (:VAR:IND)
+hostVariable: COLON IDENTIFIER (DOT IDENTIFIER)? (COLON IDENTIFIER)?;
 
-arithmeticOperator: PLUS | MINUS | ASTERISK | SLASH | PERCENT | POWER;
-comparisonOperator: EQ | NE | GT | LT | GE | LE | LIKE | NOT_LIKE | IN | NOT_IN | BETWEEN | NOT_BETWEEN | IS | IS_NOT | EXISTS | NOT_EXISTS;
-logicalOperator: AND | OR | NOT | XOR;
+comparisonOperator: EQUALS | NE | GT | LT | GE | LE | LIKE | NOT_LIKE;
 
 // Functions
 functionCall:
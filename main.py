@@ -31,25 +31,29 @@ class PipelineResult:
     db2_results: list["Db2Result"]
     dspf_results: list["DspfResult"]
     diagnostics: list[Diagnostic] = field(default_factory=list)
+    catalog: "SchemaCatalog | None" = None
+    lineage: "LineageGraph | None" = None
+    indicators: "IndicatorIndex | None" = None
+    subfiles: "SubfileIndex | None" = None
 
 
 # Import runners lazily to avoid circular deps
-def _run_cl(path: str) -> "ClResult":
-    from cl.runner import run_cl_file
+def _run_cl(path: str, metrics_only: bool = False) -> "ClResult":
+    from cl.runner import run_cl_file, run_cl_metrics
 
-    return run_cl_file(path)
+    return run_cl_metrics(path) if metrics_only else run_cl_file(path)
 
 
-def _run_rpg(path: str) -> "RpgResult":
-    from rpg.runner import run_rpg_file
+def _run_rpg(path: str, metrics_only: bool = False) -> "RpgResult":
+    from rpg.runner import run_rpg_file, run_rpg_metrics
 
-    return run_rpg_file(path)
+    return run_rpg_metrics(path) if metrics_only else run_rpg_file(path)
 
 
-def _run_db2(path: str) -> "Db2Result":
-    from db2.runner import run_db2_file
+def _run_db2(path: str, metrics_only: bool = False) -> "Db2Result":
+    from db2.runner import run_db2_file, run_db2_metrics
 
-    return run_db2_file(path)
+    return run_db2_metrics(path) if metrics_only else run_db2_file(path)
 
 
 def _run_dspf(path: str) -> "DspfResult":
@@ -62,6 +66,16 @@ def run_pipeline(
     inputs: list[InputSpec],
     mode: str = "auto",
     export: "ExportOptions | None" = None,
+    metrics_only: bool = False,
+    catalog_path: str | None = None,
+    sql_cache_path: str | None = None,
+    lineage: bool = False,
+    include_paths: list[str] | None = None,
+    copybook_cache_path: str | None = None,
+    rpg_parser: str | None = None,
+    dspf_parser: str | None = None,
+    indicators: bool = False,
+    subfile_index_path: str | None = None,
 ) -> PipelineResult:
     """
     Run the parsing pipeline on the given inputs.
@@ -70,6 +84,26 @@ def run_pipeline(
         inputs: List of InputSpec (path + kind).
         mode: "cl" | "rpg" | "db2" | "dspf" | "combined" | "auto".
         export: Optional ExportOptions for PDF/email export.
+        metrics_only: Fill CL/RPG/DB2 metrics from a lexical scan; no parse, ast=None.
+        catalog_path: Load the schema catalog from this JSON file, update it with
+            the inputs that changed since it was saved, and save it back.
+        sql_cache_path: Load the embedded-SQL parse cache from this file before
+            the run and save it afterwards, so repeated SQL is parsed once across runs.
+        lineage: Build the column-level lineage graph (result.lineage) from the
+            DB2 and RPG ASTs, resolving columns through the catalog when one is loaded.
+        include_paths: Source directories searched for RPG /COPY and /INCLUDE
+            members (after the including member's own directory).
+        copybook_cache_path: Load parsed copybooks from this file before the run
+            and save them afterwards; copybooks changed on disk are parsed again.
+        rpg_parser: "lines" (default) or "antlr": the generated RPG parser, falling
+            back to the line parsers for source its grammar rejects.
+        dspf_parser: "lines" (default) or "antlr": the generated DSPF parser, falling
+            back to the line parser for source its grammar rejects.
+        indicators: Build the indicator index (result.indicators): *IN01-*IN99 set
+            and tested by each RPG program and display file record format.
+        subfile_index_path: Load the subfile index from this JSON file, update it
+            with the inputs that changed since it was saved, and save it back
+            (result.subfiles: SFL/SFLCTL records and the programs using them).
 
     Returns:
         PipelineResult with ASTs, diagnostics, and optional cross-links.
@@ -80,6 +114,27 @@ def run_pipeline(
     dspf_results: list = []
     all_diagnostics: list[Diagnostic] = []
 
+    if sql_cache_path is not None:
+        from db2.sql_cache import SqlParseCache, set_default_cache
+
+        set_default_cache(SqlParseCache.load(sql_cache_path))
+
+    if include_paths or copybook_cache_path is not None:
+        from rpg.copybooks import CopybookCache, CopybookResolver, set_default_resolver
+
+        cache = CopybookCache.load(copybook_cache_path) if copybook_cache_path is not None else None
+        set_default_resolver(CopybookResolver(include_paths or (), cache))
+
+    if rpg_parser is not None:
+        from rpg.ast_builder import set_default_parser
+
+        set_default_parser(rpg_parser)
+
+    if dspf_parser is not None:
+        from dspf.ast_builder import set_default_parser as set_default_dspf_parser
+
+        set_default_dspf_parser(dspf_parser)
+
     for spec in inputs:
         kind = spec.kind if spec.kind != "auto" else infer_kind_from_path(spec.path)
         if kind == "auto":
@@ -109,15 +164,15 @@ def run_pipeline(
             run_cl = run_rpg = run_db2 = False
 
         if run_cl:
-            r = _run_cl(spec.path)
+            r = _run_cl(spec.path, metrics_only)
             cl_results.append(r)
             all_diagnostics.extend(r.diagnostics)
         if run_rpg:
-            r = _run_rpg(spec.path)
+            r = _run_rpg(spec.path, metrics_only)
             rpg_results.append(r)
             all_diagnostics.extend(r.diagnostics)
         if run_db2:
-            r = _run_db2(spec.path)
+            r = _run_db2(spec.path, metrics_only)
             db2_results.append(r)
             all_diagnostics.extend(r.diagnostics)
         if run_dspf:
@@ -133,6 +188,36 @@ def run_pipeline(
         diagnostics=all_diagnostics,
     )
 
+    if catalog_path is not None and not metrics_only:
+        from rpg.runner import apply_catalog
+
+        result.catalog = _update_catalog(catalog_path, result)
+        for r in rpg_results:
+            apply_catalog(r, result.catalog)
+
+    if lineage and not metrics_only:
+        from core.lineage import build_lineage
+
+        result.lineage = build_lineage(db2_results, rpg_results, result.catalog)
+
+    if indicators and not metrics_only:
+        from core.indicators import build_indicator_index
+
+        result.indicators = build_indicator_index(rpg_results, dspf_results)
+
+    if subfile_index_path is not None and not metrics_only:
+        result.subfiles = _update_subfile_index(subfile_index_path, result)
+
+    if sql_cache_path is not None:
+        from db2.sql_cache import default_cache
+
+        default_cache().save(sql_cache_path)
+
+    if copybook_cache_path is not None and not metrics_only:
+        from rpg.copybooks import default_resolver
+
+        default_resolver().cache.save(copybook_cache_path)
+
     # Optional PDF export
     if export is not None and export.enable_pdf:
         try:
@@ -157,6 +242,59 @@ def run_pipeline(
     return result
 
 
+def _update_catalog(catalog_path: str, result: PipelineResult) -> "SchemaCatalog":
+    """Re-catalogue inputs that changed since the catalog was saved, then save it."""
+    from core.catalog import SchemaCatalog
+
+    catalog = SchemaCatalog.load(catalog_path)
+
+    def stale(r) -> bool:
+        if r.ast is None or catalog.is_current(r.path):
+            return False
+        catalog.remove_source(r.path)
+        catalog.mark_current(r.path)
+        return True
+
+    # DDL first so references from programs resolve against fresh definitions.
+    for r in result.db2_results:
+        if stale(r):
+            catalog.add_db2(r.ast, r.path)
+    for r in result.dspf_results:
+        if stale(r):
+            catalog.add_dspf(r.ast, r.path)
+    for r in result.rpg_results:
+        if stale(r):
+            program = Path(r.path).stem
+            for sql in r.ast.sql_statements:
+                catalog.add_statement_references(program, sql.statements, r.path)
+
+    catalog.save(catalog_path)
+    return catalog
+
+
+def _update_subfile_index(index_path: str, result: PipelineResult) -> "SubfileIndex":
+    """Re-index inputs that changed since the subfile index was saved, then save it."""
+    from core.subfiles import SubfileIndex
+
+    index = SubfileIndex.load(index_path)
+
+    def stale(r) -> bool:
+        if r.ast is None or index.is_current(r.path):
+            return False
+        index.remove_source(r.path)
+        index.mark_current(r.path)
+        return True
+
+    for r in result.dspf_results:
+        if stale(r):
+            index.add_display_file(r.ast, r.path)
+    for r in result.rpg_results:
+        if stale(r):
+            index.add_rpg_program(r.ast, r.path)
+    index.save(index_path)
+    return index
+
+
 @dataclass
 class ExportOptions:
     """Options for PDF/email export."""
@@ -177,6 +315,10 @@ if TYPE_CHECKING:
     from rpg.runner import RpgResult
     from db2.runner import Db2Result
     from dspf.runner import DspfResult
+    from core.catalog import SchemaCatalog
+    from core.lineage import LineageGraph
+    from core.indicators import IndicatorIndex
+    from core.subfiles import SubfileIndex
 
 
 def main_cli() -> None:
@@ -189,6 +331,11 @@ def main_cli() -> None:
         default="combined",
         help="Pipeline mode",
     )
+    parser.add_argument(
+        "--metrics-only",
+        action="store_true",
+        help="Scan CL/RPG/DB2 sources for metrics only (no parse, no AST)",
+    )
     parser.add_argument("--export-pdf", type=str, default=None, help="Export PDF to path")
     parser.add_argument("--email-to", type=str, default=None, help="Email address for report")
     parser.add_argument("--email-subject", type=str, default="IBM i analysis report", help="Email subject")
@@ -197,6 +344,64 @@ def main_cli() -> None:
     parser.add_argument("--smtp-user", type=str, default=None, help="SMTP username")
     parser.add_argument("--smtp-pass", type=str, default=None, help="SMTP password")
     parser.add_argument("--smtp-tls", action="store_true", help="Use TLS for SMTP")
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        default=None,
+        help="Schema catalog JSON to update incrementally with the inputs",
+    )
+    parser.add_argument(
+        "--sql-cache",
+        type=str,
+        default=None,
+        help="Embedded-SQL parse cache file, reused and updated across runs",
+    )
+    parser.add_argument(
+        "--include-path",
+        action="append",
+        default=None,
+        metavar="DIR",
+        help="Directory searched for RPG /COPY and /INCLUDE members (repeatable)",
+    )
+    parser.add_argument(
+        "--copybook-cache",
+        type=str,
+        default=None,
+        help="Parsed-copybook cache file, reused and updated across runs",
+    )
+    parser.add_argument(
+        "--rpg-parser",
+        choices=("lines", "antlr"),
+        default=None,
+        help="RPG parser: line-based (default, fast) or the generated ANTLR parser (grammar-checked, slow)",
+    )
+    parser.add_argument(
+        "--dspf-parser",
+        choices=("lines", "antlr"),
+        default=None,
+        help="DSPF parser: line-based (default, fast) or the generated ANTLR parser (grammar-checked, slow)",
+    )
+    parser.add_argument(
+        "--lineage",
+        type=str,
+        default=None,
+        metavar="TABLE.COLUMN",
+        help="Print where the column's data comes from and flows to (e.g. CUSTOMER.CUSNUM or PGM:VAR)",
+    )
+    parser.add_argument(
+        "--indicator",
+        type=int,
+        default=None,
+        metavar="NN",
+        help="Print the programs that set and test *INNN and the screens reacting to it",
+    )
+    parser.add_argument(
+        "--subfiles",
+        type=str,
+        default=None,
+        metavar="INDEX.json",
+        help="Subfile index JSON to update incrementally with the inputs; prints each subfile and its programs",
+    )
     args = parser.parse_args()
 
     inputs = [InputSpec(path=f, kind="auto") for f in args.files]
@@ -224,13 +429,42 @@ def main_cli() -> None:
             email_smtp_config=smtp_config,
         )
 
-    result = run_pipeline(inputs, mode=args.mode, export=export)
+    result = run_pipeline(inputs, mode=args.mode, export=export, metrics_only=args.metrics_only,
+                          catalog_path=args.catalog, sql_cache_path=args.sql_cache,
+                          lineage=args.lineage is not None, include_paths=args.include_path,
+                          copybook_cache_path=args.copybook_cache, rpg_parser=args.rpg_parser,
+                          dspf_parser=args.dspf_parser,
+                          indicators=args.indicator is not None, subfile_index_path=args.subfiles)
     print(f"Pipeline completed. Diagnostics: {len(result.diagnostics)}")
     for d in result.diagnostics[:20]:
         print(f"  {d}")
     if len(result.diagnostics) > 20:
         print(f"  ... and {len(result.diagnostics) - 20} more")
     print(f"CL: {len(result.cl_results)}, RPG: {len(result.rpg_results)}, DB2: {len(result.db2_results)}, DSPF: {len(result.dspf_results)}")
+    if result.catalog is not None:
+        print(f"Catalog: {len(result.catalog)} tables ({args.catalog})")
+    if result.lineage is not None:
+        print(f"\n--- Lineage of {args.lineage.upper()} ---")
+        print(f"Upstream: {', '.join(result.lineage.upstream(args.lineage)) or 'None'}")
+        print(f"Downstream: {', '.join(result.lineage.downstream(args.lineage)) or 'None'}")
+    if result.indicators is not None:
+        n = args.indicator
+        print(f"\n--- Indicator {n:02d} ---")
+        setters = result.indicators.programs_setting(n)
+        print(f"Set by: {', '.join(setters) or 'None'}")
+        print(f"Tested by: {', '.join(result.indicators.programs_testing(n)) or 'None'}")
+        for program in setters:
+            screens = result.indicators.screens_reacting_to(n, program)
+            print(f"Screens reacting to {program}: {', '.join(f'{d}.{f}' for d, f in screens) or 'None'}")
+        screens = result.indicators.screens_setting(n)
+        print(f"Returned by screens: {', '.join(f'{d}.{f}' for d, f in screens) or 'None'}")
+    if result.subfiles is not None:
+        print(f"\n--- Subfiles ({args.subfiles}) ---")
+        for sfl in result.subfiles.subfiles():
+            print(f"{sfl.file}.{sfl.record}: control {sfl.control or 'None'}, SFLSIZ {sfl.size}, "
+                  f"SFLPAG {sfl.page}, options {', '.join(sfl.option_fields) or 'None'}")
+            for opcode, programs in sorted(sfl.operations.items()):
+                print(f"  {opcode} by {', '.join(programs)}")
     print("\n--- Analysis Reports ---")
     for r in result.cl_results:
         print(f"\n{r.summary_report}")
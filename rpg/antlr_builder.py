@@ -0,0 +1,526 @@
+"""
+RPG AST builder over the generated ANTLR parser (rpg.gen, generated from
+grammars/RpgLexer.g4 and grammars/RpgParser.g4 by scripts/generate_parsers.py).
+
+This is the grammar-checked alternative to the line parsers in
+rpg.ast_builder, selected with parse_rpg(..., parser="antlr"). Procedures,
+declarations and block structure come from the parse tree; statement text is
+sliced from the source, and the node-building helpers of the line parsers
+are shared, so both paths produce the same node shapes.
+
+A member is parsed with SLL prediction and a bail-out error strategy first;
+only when that fails is it parsed again with full LL prediction. Input the
+grammar rejects gives None, and the caller falls back to the line parsers.
+
+The grammar is column-based: a **FREE member is parsed with its lines moved
+7 columns right (as if inside /FREE) and columns are moved back in the AST.
+Code past column 80 is a comment to the grammar, so **FREE members with
+longer lines, and free-form copybooks without **FREE, are left to the line
+parsers.
+"""
+
+from core.antlr_listener import HAS_ANTLR, DiagnosticErrorListener
+from core.diagnostics import Diagnostic
+from rpg.ast_nodes import (
+    EmbeddedSqlStmt,
+    RpgAssignStmt,
+    RpgCallStmt,
+    RpgExpr,
+    RpgFileDecl,
+    RpgFileOperation,
+    RpgParam,
+    RpgProcedure,
+    RpgProgram,
+    RpgReturnStmt,
+    RpgSpecLine,
+    RpgVarDecl,
+    SourceLocation,
+)
+from rpg.blocks import BlockBuilder
+from rpg.copybooks import copy_directive
+from rpg.expressions import parse_expression
+from rpg.fixed_specs import decode_spec, default_fixed_type, fixed_control, parse_fixed_cspec
+from rpg.free_specs import (
+    DCL_F_RE,
+    FILE_OPCODES,
+    FREE_LINE_RE,
+    INZ_RE,
+    PASSING_RE,
+    expression_text,
+    free_file_decl,
+    free_file_operation,
+)
+
+FREE_SHIFT = 7  # columns a **FREE line is moved right by
+FREE_MAX_LENGTH = 80 - FREE_SHIFT
+
+try:
+    from rpg.gen.RpgParserVisitor import RpgParserVisitor
+except ImportError:
+    RpgParserVisitor = None  # type: ignore
+
+HAS_RPG_GEN = HAS_ANTLR and RpgParserVisitor is not None
+
+
+def parse_with_antlr(
+    lines: list[str], filename: str, free: bool, diagnostics: list[Diagnostic], includes
+) -> RpgProgram | None:
+    """
+    Parse one member with the generated parser. Returns None (after a warning
+    for syntax errors) when the parser is not generated or the grammar does
+    not accept the member; includes is the member's rpg.ast_builder._Includes.
+    """
+    if not HAS_RPG_GEN:
+        return None
+    first = lines[0].lstrip()[:6].upper()
+    shift = 0
+    if first == "**FREE":
+        if any(len(line) > FREE_MAX_LENGTH for line in lines):
+            diagnostics.append(Diagnostic(filename, 1, 0, "warning",
+                                          f"**FREE lines longer than {FREE_MAX_LENGTH} columns are outside the "
+                                          "RPG grammar; parsed with the line parser"))
+            return None
+        lines = [""] + [" " * FREE_SHIFT + line if line else line for line in lines[1:]]
+        shift = FREE_SHIFT
+    elif free and first[:5] != "/FREE":
+        return None
+    else:  # member records are 80 columns; the lexer needs the blank trailing fields of fixed specs
+        lines = [line.ljust(80) for line in lines]
+
+    tree, tokens = _parse_tree(lines, filename, diagnostics)
+    if tree is None:
+        return None
+    builder = RpgTreeBuilder(lines, filename, shift, tokens, diagnostics, includes)
+    builder.visit(tree)
+    return builder.program()
+
+
+def _parse_tree(lines: list[str], filename: str, diagnostics: list[Diagnostic]):
+    """(parse tree, token stream), or (None, None) with a warning for the first syntax error."""
+    from antlr4 import CommonTokenStream, InputStream, PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException
+    from rpg.gen.RpgLexer import RpgLexer
+    from rpg.gen.RpgParser import RpgParser
+
+    errors: list[Diagnostic] = []
+    lexer = RpgLexer(InputStream("\n".join(lines) + "\n"))
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(DiagnosticErrorListener(filename=filename, diagnostics=errors))
+    tokens = CommonTokenStream(lexer)
+    tokens.fill()
+
+    parser = RpgParser(tokens)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    tree = None
+    for mode in (PredictionMode.SLL, PredictionMode.LL):
+        if errors:
+            break
+        parser._interp.predictionMode = mode
+        try:
+            tree = parser.r()
+            break
+        except ParseCancellationException as e:
+            if mode == PredictionMode.LL:  # a real syntax error, not an SLL conflict
+                token = getattr(e.args[0], "offendingToken", None) if e.args else None
+                line, column = (token.line, token.column) if token is not None else (0, 0)
+                errors.append(Diagnostic(filename, line, column, "error",
+                                         f"unexpected {token.text!r}" if token is not None else "syntax error"))
+            tokens.seek(0)
+            parser.reset()
+    if tree is None or errors:
+        first = errors[0] if errors else Diagnostic(filename, 0, 0, "error", "syntax error")
+        diagnostics.append(Diagnostic(filename, first.line, first.column, "warning",
+                                      f"RPG grammar: {first.message}; parsed with the line parser"))
+        return None, None
+    return tree, tokens
+
+
+def _fixed_name(name_ctx) -> str:
+    """Name of a fixed D-spec, joining '...' continuation lines."""
+    return "".join(part.strip().removesuffix("...") for part in name_ctx.getText().splitlines()).strip()
+
+
+if RpgParserVisitor is not None:
+    from rpg.gen.RpgParser import RpgParser
+
+    _FIXED_TOKENS = frozenset((RpgParser.HS_FIXED, RpgParser.FS_FIXED, RpgParser.DS_FIXED, RpgParser.IS_FIXED,
+                               RpgParser.CS_FIXED, RpgParser.OS_FIXED, RpgParser.PS_FIXED))
+    # tokens that end a statement rather than belong to its text
+    _TERMINATORS = frozenset((RpgParser.FREE_SEMI, RpgParser.EOL, RpgParser.C_FREE_NEWLINE))
+    # children of a control rule that carry their own expression
+    _NESTED_CONTEXTS = (RpgParser.StatementContext, RpgParser.CsANDxxContext, RpgParser.CsORxxContext)
+
+    class RpgTreeBuilder(RpgParserVisitor):
+        """
+        Builds an RpgProgram from an RpgParser parse tree.
+
+        Visiting is in source order; block rules (beginif, elsestmt, enddo,
+        csIFxx, ...) drive a BlockBuilder, so the nesting follows the tree
+        exactly as the line parsers' opcode stream does.
+        """
+
+        def __init__(self, lines: list[str], filename: str, shift: int, tokens, diagnostics: list[Diagnostic],
+                     includes):
+            self.lines = lines
+            self.filename = filename
+            self.shift = shift
+            self.tokens = tokens.tokens
+            self.source = tokens.tokenSource.inputStream.strdata
+            self.diagnostics = diagnostics
+            self.includes = includes
+            self.procedures: list[RpgProcedure] = []
+            self.main_body: list = []
+            self.variables: list[RpgVarDecl] = []
+            self.files: list[RpgFileDecl] = []
+            self.specs: list[RpgSpecLine] = []
+            self.sql_statements: list[EmbeddedSqlStmt] = []
+            self.file_operations: list[RpgFileOperation] = []
+            self.current_proc: RpgProcedure | None = None
+            self.main_builder = self.builder = BlockBuilder(self.main_body, diagnostics)
+            self.d_block = ""  # DS / PR / PI whose subfields or parameters are being visited
+            self.last_call: RpgCallStmt | None = None  # fixed CALL taking the following PARM lines
+
+        def program(self) -> RpgProgram:
+            self.main_builder.close(SourceLocation(self.filename, len(self.lines), 0))
+            return RpgProgram(
+                loc=SourceLocation(self.filename, 1, 0),
+                is_free_format=bool(self.shift) or not self.specs,
+                procedures=self.procedures,
+                main_body=self.main_body,
+                variables=self.variables,
+                files=self.files,
+                specs=self.specs,
+                sql_statements=self.sql_statements,
+                file_operations=self.file_operations,
+            )
+
+        # -- helpers -------------------------------------------------------
+
+        def _loc(self, ctx) -> SourceLocation:
+            token = ctx.start
+            return SourceLocation(self.filename, token.line, max(token.column - self.shift, 0))
+
+        def _text(self, ctx, skip: int = 0) -> str:
+            """Source text of ctx (after its first skip tokens), one slice per physical line joined by blanks."""
+            parts: list[str] = []
+            line = start = stop = -1
+            for token in self.tokens[ctx.start.tokenIndex + skip:ctx.stop.tokenIndex + 1]:
+                if token.channel != 0 or token.type in _TERMINATORS or token.start < 0:
+                    continue
+                if token.line != line:
+                    if start >= 0:
+                        parts.append(self.source[start:stop + 1])
+                    line, start = token.line, token.start
+                stop = token.stop
+            if start >= 0:
+                parts.append(self.source[start:stop + 1])
+            return " ".join(p.strip() for p in parts)
+
+        def _fields(self, line: int) -> dict[str, str]:
+            decoded = decode_spec(self.lines[line - 1])
+            return decoded[1] if decoded else {}
+
+        def _fixed(self, ctx) -> tuple[int, dict[str, str]]:
+            """Line and decoded columns of a fixed C-spec context (its opcode line, after indicator lines)."""
+            factor1 = getattr(ctx, "factor1", None)
+            line = (factor1 or ctx).start.line
+            return line, self._fields(line)
+
+        @staticmethod
+        def _c_free(ctx):
+            """Extended-factor-2 expression of a fixed-format context (not of statements nested in it)."""
+            stack = [ctx]
+            while stack:
+                node = stack.pop()
+                expr = getattr(node, "fixedexpression", None)
+                if expr is not None:
+                    return expr
+                stack.extend(c for c in node.getChildren()
+                             if hasattr(c, "getChildren") and not isinstance(c, _NESTED_CONTEXTS))
+            return None
+
+        def _is_fixed(self, ctx) -> bool:
+            return ctx.start.type in _FIXED_TOKENS
+
+        def visitTerminal(self, node):
+            token = node.symbol
+            if token.type in _FIXED_TOKENS:
+                decoded = decode_spec(self.lines[token.line - 1])
+                if decoded:
+                    self.specs.append(RpgSpecLine(loc=SourceLocation(self.filename, token.line, 6),
+                                                  spec=decoded[0], fields=decoded[1]))
+            return None
+
+        # -- block structure -----------------------------------------------
+
+        def _control(self, ctx) -> None:
+            """Apply the block opcode a control rule starts with (IF, ELSE, WHEN, ENDDO, ANDxx, ...)."""
+            self.last_call = None
+            if self._is_fixed(ctx):
+                line, f = self._fixed(ctx)
+                control = fixed_control(f.get("opcode", "").split("(")[0].upper(), f) if f else None
+                if control is None:
+                    return
+                opcode, condition = control
+                expr = self._c_free(ctx)
+                if expr is not None:
+                    condition = self._text(expr)
+                if opcode in ("AND", "OR"):
+                    self.builder.extend_condition(opcode, condition)
+                    return
+                loc = SourceLocation(self.filename, line, 6)
+            else:
+                text = self._text(ctx.getChild(0))
+                m = FREE_LINE_RE.match(text)
+                if m is None or m.group("word") is None:
+                    return
+                opcode, condition = m.group("word").upper(), expression_text(text, m.end())
+                loc = self._loc(ctx)
+            self.builder.control(opcode, parse_expression(condition, loc) if condition else None, loc)
+
+        def _control_and_children(self, ctx):
+            self._control(ctx)
+            return self.visitChildren(ctx)
+
+        visitBegindou = visitBegindow = visitBegindo = _control_and_children
+        visitCsDOUxx = visitCsDOWxx = visitCsWHENxx = _control_and_children
+        visitCsANDxx = visitCsORxx = _control_and_children
+        visitElseifstmt = visitElsestmt = visitEndif = visitEnddo = _control_and_children
+        visitBeginfor = visitEndfor = _control_and_children
+        visitBeginselect = visitWhen = visitOther = visitEndselect = _control_and_children
+        visitBeginmonitor = visitOnError = visitEndmonitor = _control_and_children
+
+        def visitBeginif(self, ctx):
+            if ctx.csIFxx() is None:  # csIFxx is visited on its own
+                self._control(ctx)
+            return self.visitChildren(ctx)
+
+        def visitCsIFxx(self, ctx):
+            return self._control_and_children(ctx)
+
+        # -- procedures ----------------------------------------------------
+
+        def visitProcedure(self, ctx):
+            begin = ctx.beginProcedure()
+            name_ctx = begin.psBegin().ps_name() if begin.psBegin() else begin.freeBeginProcedure().identifier()
+            self.current_proc = RpgProcedure(loc=self._loc(begin) if not self._is_fixed(begin)
+                                             else SourceLocation(self.filename, begin.start.line, 6),
+                                             name=name_ctx.getText().strip() or "unknown")
+            self.builder = BlockBuilder(self.current_proc.body, self.diagnostics)
+            self.visitChildren(ctx)
+            self.builder.close(SourceLocation(self.filename, ctx.stop.line, 0))
+            self.procedures.append(self.current_proc)
+            self.current_proc, self.builder = None, self.main_builder
+            return None
+
+        # -- declarations --------------------------------------------------
+
+        def _in_block(self, ctx, kind: str):
+            outer, self.d_block = self.d_block, kind
+            self.visitChildren(ctx)
+            self.d_block = outer
+            return None
+
+        def visitDcl_ds(self, ctx):
+            if not self._is_fixed(ctx):
+                self.variables.append(RpgVarDecl(loc=self._loc(ctx), name=ctx.identifier().getText(),
+                                                 data_type="DS"))
+                return None  # free-form subfields are not modelled
+            self._fixed_var(ctx.ds_name(), "DS")
+            return self._in_block(ctx, "DS")
+
+        def visitDcl_pr(self, ctx):
+            return self._in_block(ctx, "PR")
+
+        def visitDcl_pi(self, ctx):
+            return self._in_block(ctx, "PI")
+
+        def visitPiBegin(self, ctx):
+            self.visitChildren(ctx)  # spec line
+            if self.current_proc is not None:
+                f = self._fields(ctx.ds_name().stop.line)
+                self.current_proc.returns = (f.get("data_type", "") + f.get("length", "")) or None
+            return None
+
+        def visitDcl_pi_field(self, ctx):
+            if self.current_proc is not None:
+                passing = PASSING_RE.search(self._text(ctx))
+                self.current_proc.params.append(RpgParam(loc=self._loc(ctx), name=ctx.identifier().getText(),
+                                                         passing=passing.group(1).upper() if passing else None))
+            return None
+
+        def visitParm_fixed(self, ctx):
+            self.visitChildren(ctx)  # spec line
+            name_ctx = ctx.ds_name()
+            if self.d_block == "PI" and self.current_proc is not None:
+                f = self._fields(name_ctx.stop.line)
+                passing = PASSING_RE.search(f.get("keywords", ""))
+                self.current_proc.params.append(RpgParam(loc=SourceLocation(self.filename, name_ctx.stop.line, 6),
+                                                         name=_fixed_name(name_ctx),
+                                                         passing=passing.group(1).upper() if passing else None))
+            elif self.d_block == "DS":
+                self._fixed_var(name_ctx, "")
+            return None
+
+        def visitDspec(self, ctx):
+            self.visitChildren(ctx)  # spec lines
+            if ctx.name is not None:  # DCL-S
+                datatype = ctx.datatype()
+                self.variables.append(RpgVarDecl(loc=self._loc(ctx), name=ctx.name.getText(),
+                                                 data_type=datatype.datatypeName().getText() if datatype else None))
+                return None
+            name_ctx = ctx.ds_name() if ctx.ds_name() is not None else ctx.dspecConstant().ds_name()
+            self._fixed_var(name_ctx, "C" if ctx.dspecConstant() is not None else "S")
+            return None
+
+        def visitDspec_fixed(self, ctx):
+            self.visitChildren(ctx)  # spec line
+            decl = self._fields(ctx.ds_name().stop.line).get("decl_type", "").upper()
+            if decl not in ("PR", "PI"):
+                self._fixed_var(ctx.ds_name(), decl)
+            return None
+
+        def visitDcl_c(self, ctx):
+            self.visitChildren(ctx)  # spec line
+            if self._is_fixed(ctx):  # free-form DCL-C is not modelled
+                self._fixed_var(ctx.ds_name(), "C")
+            return None
+
+        def _fixed_var(self, name_ctx, decl: str) -> None:
+            line = name_ctx.stop.line
+            f = self._fields(line)
+            if not f:
+                return
+            inz = INZ_RE.search(f["keywords"])
+            self.variables.append(
+                RpgVarDecl(
+                    loc=SourceLocation(self.filename, line, 6),
+                    name=_fixed_name(name_ctx),
+                    data_type=f["data_type"].upper() or default_fixed_type(decl, self.d_block, f),
+                    length=f["length"] or None,
+                    decimals=f["decimals"] or None,
+                    inz=inz.group(1).strip() if inz else None,
+                )
+            )
+
+        def visitFspec(self, ctx):
+            m = DCL_F_RE.match(self._text(ctx))
+            if m:
+                self.files.append(free_file_decl(m, self.filename, ctx.start.line))
+            return None
+
+        def visitFspec_fixed(self, ctx):
+            self.visitChildren(ctx)  # spec lines
+            line = ctx.start.line
+            f = self._fields(line)
+            keywords = " ".join(self._text(k) for k in ctx.fs_keyword())
+            self.files.append(
+                RpgFileDecl(
+                    loc=SourceLocation(self.filename, line, 6),
+                    name=f["name"],
+                    usage=f["file_type"].upper() or None,
+                    designation=f["designation"].upper() or None,
+                    device=f["device"].upper() or None,
+                    externally_described=f["format"].upper() != "F",
+                    keyed=f["record_address_type"].upper() == "K",
+                    keywords=keywords or None,
+                )
+            )
+            return None
+
+        # -- statements ----------------------------------------------------
+
+        def visitFree(self, ctx):
+            self.last_call = None
+            if ctx.exec_sql() is not None:
+                return self.visitExec_sql(ctx.exec_sql())
+            op = ctx.baseExpression().op()
+            if op is None:
+                return None
+            loc = self._loc(ctx)
+            stmt = op.getChild(0)
+            if isinstance(stmt, (RpgParser.Op_evalContext, RpgParser.Op_evalrContext, RpgParser.Op_eval_corrContext)):
+                # assignmentExpression or assignOperatorExpression (x += y)
+                assign = stmt.evalExpression().getChild(0) if isinstance(stmt, RpgParser.Op_evalContext) \
+                    else stmt.assignmentExpression()
+                operator = assign.assignmentOperator() \
+                    if isinstance(assign, RpgParser.AssignOperatorExpressionContext) else None
+                self.builder.add(RpgAssignStmt(
+                    loc=loc,
+                    target=RpgExpr(loc=loc, kind="ident", value=self._text(assign.simpleExpression())),
+                    expr=parse_expression(self._text(assign.expression()), loc),
+                    operator=operator.getText()[:-1] if operator is not None else None,
+                ))
+            elif isinstance(stmt, RpgParser.Op_callpContext):
+                self.builder.add(RpgCallStmt(loc=loc, name=stmt.identifier().getText(), params=[]))
+            elif isinstance(stmt, RpgParser.Op_returnContext):
+                expr = stmt.expression()
+                self.builder.add(RpgReturnStmt(
+                    loc=loc, value=parse_expression(self._text(expr), loc) if expr else None))
+            else:
+                text = self._text(stmt)
+                m = FREE_LINE_RE.match(text)
+                word = m.group("word").upper() if m and m.group("word") else ""
+                if word in FILE_OPCODES:
+                    operation = free_file_operation(word, text[m.end():], loc)
+                    if operation is not None:
+                        self.file_operations.append(operation)
+            return None
+
+        def visitExec_sql(self, ctx):
+            start, stop = ctx.start, ctx.stop
+            end = stop.start if stop.type == RpgParser.SEMI else stop.stop + 1
+            self._add_sql(EmbeddedSqlStmt(loc=self._loc(ctx), sql_text=self.source[start.start:end]))
+            return None
+
+        def visitCspec_fixed_sql(self, ctx):
+            self.visitChildren(ctx)  # spec lines
+            text = "\n".join(t.getText().strip() for t in ctx.CSQL_TEXT())
+            self._add_sql(EmbeddedSqlStmt(loc=SourceLocation(self.filename, ctx.start.line, 6),
+                                          sql_text="EXEC SQL\n" + text))
+            return None
+
+        def _add_sql(self, sql: EmbeddedSqlStmt) -> None:
+            self.sql_statements.append(sql)
+            if self.current_proc is not None:
+                self.current_proc.sql_statements.append(sql)
+
+        def visitCspec_fixed(self, ctx):
+            line, f = self._fixed(ctx)
+            op = f.get("opcode", "").split("(")[0].upper()
+            expr = self._c_free(ctx)
+            if expr is not None:
+                f["extended_factor2"] = self._text(expr)
+            if op in FILE_OPCODES and f.get("factor2"):
+                self.file_operations.append(RpgFileOperation(loc=SourceLocation(self.filename, line, 6), opcode=op,
+                                                             name=f["factor2"]))
+            stmt = parse_fixed_cspec(op, f, self.filename, line) if op else None
+            self.last_call = stmt if isinstance(stmt, RpgCallStmt) and op != "CALLP" else None
+            if stmt:
+                self.builder.add(stmt)
+            return self.visitChildren(ctx)  # PARM lines, spec lines
+
+        def visitCsPARM(self, ctx):
+            line, f = self._fixed(ctx)
+            if self.last_call is not None and f:
+                self.last_call.params.append(RpgExpr(loc=SourceLocation(self.filename, line, 6), kind="ident",
+                                                     value=f["result"]))
+            return self.visitChildren(ctx)
+
+        def visitDirective(self, ctx):
+            self.visitChildren(ctx)  # spec lines
+            if ctx.dir_copy() is None and ctx.dir_include() is None:
+                return None
+            line = ctx.start.line
+            text = self.lines[line - 1]
+            slash = text.find("/")
+            directive = copy_directive(text[slash:]) if slash >= 0 else None
+            if directive:
+                loc = SourceLocation(self.filename, line, slash - self.shift)
+                # a copybook is column-limited unless its own first line is **FREE
+                copybook = self.includes.include(directive, loc, False, self.diagnostics)
+                for stmt in copybook.main_body if copybook else ():
+                    self.builder.add(stmt)
+            return None
@@ -1,18 +1,28 @@
 """
 AST builder for RPG / RPGLE / SQLRPGLE.
 
-Walks parse tree from Speedy ANTLR/ANTLR4 and builds RpgProgram AST.
-Fixed and free format map to same AST node types.
-Fallback: line-based parser when ANTLR grammar not available.
+Line-based parsers for fixed and free format, mapping to the same AST node
+types. The generated ANTLR parser (rpg.antlr_builder) can be selected
+instead; source its grammar rejects falls back to the line parsers.
 """
 
 import re
+from collections.abc import Iterator
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
 from core.diagnostics import Diagnostic
+from db2.sql_cache import SqlParseCache, default_cache
 from rpg.ast_nodes import (
     RpgProgram,
     RpgProcedure,
     RpgParam,
     RpgVarDecl,
+    RpgFileDecl,
+    RpgFileOperation,
+    RpgInclude,
+    RpgSpecLine,
     RpgExpr,
     RpgAssignStmt,
     RpgCallStmt,
@@ -20,230 +30,773 @@ from rpg.ast_nodes import (
     EmbeddedSqlStmt,
     SourceLocation,
 )
+from rpg.blocks import CONTROL_OPCODES, BlockBuilder, balanced_block_pattern, check_control
+from rpg.copybooks import CopybookResolver, copy_directive, default_resolver
+from rpg.expressions import parse_expression, refresh_expression
+from rpg.fixed_specs import decode_spec, default_fixed_type, fixed_control, parse_fixed_cspec
+from rpg.free_specs import (
+    DCL_F_RE,
+    FILE_OPCODES,
+    FREE_LINE_RE,
+    INZ_RE,
+    PASSING_RE,
+    expression_text,
+    free_file_decl,
+    free_file_operation,
+    split_assignment,
+)
+from rpg.regions import RpgRegion, iter_regions
+from rpg.splitter import FreeText, RpgStatementText, iter_free_statements, keyword_pattern, statement_pattern
+from rpg.symbols import GLOBAL, RpgSymbolTable, build_symbol_table
 
 FILENAME = "<memory>"
 
+_BLOCK_OPCODES = CONTROL_OPCODES - {"END"}  # END is a name, not an opcode, in free form
+_CONDITION_OPCODES = frozenset(("IF", "ELSEIF", "WHEN", "DOW", "DOU", "FOR", "ON-ERROR"))
+_NAME_RE = re.compile(r"\s*([\w$#@]+)")
+_DCL_S_RE = re.compile(r"\s+([\w$#@]+)\s+([\w$#@]+)")
+_EXEC_SQL_RE = re.compile(r"\bEXEC\s+SQL\b", re.I)
+_SQL_VERB_RE = re.compile(r"\s*([A-Za-z]+)")
+# DECLARE name [SENSITIVE ...] CURSOR [WITH HOLD | WITH RETURN ...] FOR <query>
+_CURSOR_QUERY_RE = re.compile(r"\s*DECLARE\s+[\w$#@]+\s+(?:\w+\s+)*?CURSOR\s+(?:[\w-]+\s+)*?FOR\s+(?=(?:SELECT|WITH)\b)",
+                              re.I)
+
+
+PARSERS = ("lines", "antlr")
+_default_parser = "lines"
+
+
+def default_parser() -> str:
+    """Parser used when parse_rpg is not given one: "lines" unless changed with set_default_parser."""
+    return _default_parser
+
 
-def parse_rpg(source: str, filename: str = FILENAME) -> tuple[RpgProgram, list[Diagnostic]]:
+def set_default_parser(parser: str) -> None:
+    """Select the parser for all later parse_rpg calls and copybooks: "lines" or "antlr"."""
+    global _default_parser
+    if parser not in PARSERS:
+        raise ValueError(f"unknown RPG parser {parser!r}; expected one of {', '.join(PARSERS)}")
+    _default_parser = parser
+
+
+def parse_rpg(
+    source: str, filename: str = FILENAME, copybooks: CopybookResolver | None = None, parser: str | None = None
+) -> tuple[RpgProgram, list[Diagnostic]]:
     """
     Parse RPG/RPGLE/SQLRPGLE source into RpgProgram AST.
 
-    Detects fixed vs free format: **FREE in first line => free.
+    A **FREE first line makes the member free-form; otherwise fixed specs,
+    /FREE ... /END-FREE blocks and free-form lines (columns 8-80) may mix,
+    and each region is parsed in its own form (see rpg.regions).
+    /COPY and /INCLUDE are resolved through copybooks (default: the
+    process-wide resolver, see rpg.copybooks). Embedded SQL is parsed into
+    Db2* nodes in one batch per program (see parse_embedded_sql).
+
+    parser is "lines" (the line parsers below) or "antlr" (the generated
+    parser, see rpg.antlr_builder, falling back to the line parsers for
+    source its grammar rejects); default: default_parser().
     Returns (ast, diagnostics).
     """
+    copybooks = copybooks or default_resolver()
+    active = (str(Path(filename).resolve()),) if filename != FILENAME else ()
+    return parse_rpg_member(source, filename, None, copybooks, active, parser)
+
+
+def parse_rpg_member(
+    source: str, filename: str, free: bool | None, copybooks: CopybookResolver, active: tuple[str, ...],
+    parser: str | None = None,
+) -> tuple[RpgProgram, list[Diagnostic]]:
+    """
+    Parse one member: a program, or a copybook. free is True for a copybook
+    included from a /FREE block of a column-limited member; one included
+    from a **FREE member is column-limited unless it starts with **FREE
+    itself, as the compiler reads it. active lists the members being
+    included around it, for cycle detection.
+    """
     diagnostics: list[Diagnostic] = []
     lines = source.splitlines()
     if not lines:
-        return RpgProgram(loc=SourceLocation(filename, 0, 0)), diagnostics
+        return RpgProgram(loc=SourceLocation(filename, 0, 0), is_free_format=bool(free)), diagnostics
 
     first = lines[0].strip()
-    is_free = first.upper().startswith("**FREE") or first.upper().startswith("/FREE")
+    is_free = first.upper().startswith("**FREE") or first.upper().startswith("/FREE") or bool(free)
 
-    if is_free:
-        return _parse_rpg_free(source, filename, diagnostics)
-    return _parse_rpg_fixed(source, filename, diagnostics)
+    includes = _Includes(copybooks, active)
+    program = None
+    if (parser or _default_parser) == "antlr":
+        from rpg.antlr_builder import parse_with_antlr
 
+        program = parse_with_antlr(lines, filename, is_free, diagnostics, includes)
+    if program is None:
+        if lines[0][:6].upper() == "**FREE":
+            _free_diagnostics(lines, filename, includes, diagnostics)
+            return _DeferredProgram(lines, filename, bool(free), copybooks, active), diagnostics
+        program = _LineParser(lines, filename, diagnostics, includes).parse(bool(free), is_free)
+    return _finish(program, includes), diagnostics
 
-def _parse_rpg_free(source: str, filename: str, diagnostics: list[Diagnostic]) -> tuple[RpgProgram, list[Diagnostic]]:
-    """Parse free-format RPG."""
-    loc = SourceLocation(filename, 1, 0)
-    procedures: list[RpgProcedure] = []
-    main_body: list = []
-    variables: list[RpgVarDecl] = []
-    sql_statements: list[EmbeddedSqlStmt] = []
 
+def _finish(program: RpgProgram, includes: "_Includes") -> RpgProgram:
+    """Merge the copybooks included into program, index it if the parser did not, and parse its SQL."""
+    _merge_includes(program, includes.found)
+    if program.symbols is None:  # the ANTLR path
+        program.symbols = build_symbol_table(program)
+    parse_embedded_sql(program.sql_statements)
+    return program
+
+
+def iter_rpg_procedures(
+    source: str, filename: str = FILENAME, copybooks: CopybookResolver | None = None,
+    diagnostics: list[Diagnostic] | None = None,
+) -> Iterator[RpgProcedure]:
+    """
+    Yield the procedures of a member one at a time, each as soon as its
+    END-PROC or P E line is parsed, for consumers of very large members
+    (service programs with thousands of procedures) that need not hold the
+    whole RpgProgram.
+
+    Only procedures are returned, each with its embedded SQL parsed (see
+    parse_embedded_sql). No symbol table is kept, and declarations, spec
+    lines, SQL statements and file operations are dropped as each procedure
+    is yielded, so memory stays bounded by the largest procedure. Procedures
+    of copybooks are not yielded, and the line parser is always used. Parse
+    diagnostics are added to diagnostics when it is given.
+    """
     lines = source.splitlines()
-    i = 0
-    in_procedure = False
-    current_proc: RpgProcedure | None = None
-    proc_body: list = []
-
-    while i < len(lines):
-        line = lines[i]
-        ln = i + 1
-        # Skip **FREE, /FREE, /END-FREE
-        s = line.strip()
-        if s.upper() in ("**FREE", "/FREE", "/END-FREE") or not s or s.startswith("//"):
-            i += 1
-            continue
+    if not lines:
+        return
+    copybooks = copybooks or default_resolver()
+    active = (str(Path(filename).resolve()),) if filename != FILENAME else ()
+    parser = _LineParser(lines, filename, diagnostics if diagnostics is not None else [],
+                         _Includes(copybooks, active), index=False)
+    for proc in parser.iter_procedures(False):
+        parse_embedded_sql(proc.sql_statements)
+        for kept in (parser.variables, parser.specs, parser.sql_statements, parser.file_operations):
+            kept.clear()
+        yield proc
 
-        # EXEC SQL ... END-EXEC
-        if "EXEC SQL" in s.upper():
-            sql_start = s.upper().find("EXEC SQL")
-            sql_text = _extract_embedded_sql(lines[i:], sql_start)
-            stmt_type = _guess_sql_type(sql_text)
-            sql_statements.append(
-                EmbeddedSqlStmt(
-                    loc=SourceLocation(filename, ln, 0),
-                    sql_text=sql_text,
-                    stmt_type=stmt_type,
-                )
-            )
-            i += sql_text.count("\n") + 1
+
+def parse_embedded_sql(statements: list[EmbeddedSqlStmt], cache: SqlParseCache | None = None) -> None:
+    """
+    Attach Db2* nodes, host variables and a fingerprint to each embedded statement.
+
+    Parsing goes through the fingerprint cache (db2.sql_cache), so a statement
+    repeated within the program, or seen earlier in the run, is not parsed
+    again. DECLARE CURSOR is parsed as its query. Statements the DB2 grammar
+    does not cover (FETCH, OPEN, SET OPTION, ...) keep statements=[] but still
+    get their host variables.
+    """
+    cache = cache or default_cache()
+    for stmt in statements:
+        if stmt.fingerprint is not None:  # already parsed (e.g. shared from a copybook)
             continue
+        text = stmt.statement_text
+        verb = _SQL_VERB_RE.match(text)
+        stmt.stmt_type = verb.group(1).upper() if verb else None
 
-        # Dcl-s (D-spec)
-        if re.match(r"^dcl[- ]?[s ]", s.lower()) or re.match(r"^d\s+", s, re.I):
-            # Simplified D-spec: Dcl-S name type;
-            m = re.search(r"dcl[- ]?s\s+(\w+)\s+(\w+)", s, re.I)
-            if m:
-                variables.append(
-                    RpgVarDecl(
-                        loc=SourceLocation(filename, ln, 0),
-                        name=m.group(1),
-                        data_type=m.group(2),
-                    )
-                )
-            i += 1
+        cursor = _CURSOR_QUERY_RE.match(text)
+        line = stmt.loc.line
+        if cursor:
+            line += text.count("\n", 0, cursor.end())
+            text = text[cursor.end():]
+        parsed, _, norm = cache.parse(text, stmt.loc.file, line, stmt.loc.column)
+        stmt.statements = parsed
+        stmt.host_variables = norm.host_variables
+        stmt.fingerprint = norm.fingerprint
+
+
+def _block_end(word: str, upper: str) -> str | None:
+    """END-xx closing the members of a DCL-DS / DCL-PR / DCL-PI statement (upper-case), None when it has none."""
+    if word == "DCL-DS" and ("LIKEDS" in upper or "LIKEREC" in upper):
+        return None
+    close = "END-" + word[4:]
+    return close if close not in upper else None
+
+
+class _Includes:
+    """Copy directives met while parsing one member."""
+
+    def __init__(self, copybooks: CopybookResolver, active: tuple[str, ...]):
+        self.copybooks = copybooks
+        self.active = active
+        self.found: list[RpgInclude] = []
+
+    def include(self, directive: tuple[str, str], loc: SourceLocation, free: bool,
+                diagnostics: list[Diagnostic]) -> RpgProgram | None:
+        include = self.copybooks.include(directive[0], directive[1], loc, free, self.active, diagnostics)
+        self.found.append(include)
+        return include.program
+
+
+def _merge_includes(program: RpgProgram, includes: list[RpgInclude]) -> None:
+    """Add the declarations of included copybooks to program; nodes are shared, not copied."""
+    program.includes = includes
+    for include in includes:
+        copybook = include.program
+        if copybook is None:
             continue
+        program.variables += copybook.variables
+        program.files += copybook.files
+        program.procedures += copybook.procedures
+        program.specs += copybook.specs
+        program.sql_statements += copybook.sql_statements
+        program.file_operations += copybook.file_operations
+
+
+# statements _free_diagnostics looks at: block opcodes, and those opening or closing a procedure or a declaration
+# block; a block holding none of them in its parts is passed over whole
+_CHECKED = _BLOCK_OPCODES | {"DCL-PROC", "END-PROC", "DCL-DS", "DCL-PR", "DCL-PI", "END-DS", "END-PR", "END-PI"}
+_CHECK_RE = keyword_pattern(_CHECKED, balanced_block_pattern(statement_pattern, statement_pattern(None, _CHECKED)))
 
-        # Dcl-Proc / End-Proc
-        if "dcl-proc" in s.lower():
-            m = re.search(r"dcl-proc\s+(\w+)", s, re.I)
-            name = m.group(1) if m else "unknown"
-            current_proc = RpgProcedure(loc=SourceLocation(filename, ln, 0), name=name)
-            proc_body = []
-            in_procedure = True
-        elif "end-proc" in s.lower() and current_proc:
-            current_proc.body = proc_body
-            procedures.append(current_proc)
-            current_proc = None
-            in_procedure = False
-        elif in_procedure and current_proc:
-            stmt = _parse_free_stmt(s, filename, ln)
-            if stmt:
-                proc_body.append(stmt)
+
+def _free_diagnostics(lines: list[str], filename: str, includes: _Includes, diagnostics: list[Diagnostic]) -> None:
+    """
+    Add what _LineParser reports for the **FREE member lines, in one pass:
+    copy directives are resolved, and procedures, declaration blocks and
+    block opcodes are followed as _parse_free does. _CHECK_RE passes over
+    every other statement, and blocks that cannot be reported, without
+    building them.
+    """
+    source = FreeText(lines[1:], 2)
+    text, match = source.text, _CHECK_RE.match
+    main = blocks = _BlockCheck(filename, diagnostics)  # blocks: of the open procedure, if any
+    block_end = None
+    pos = 0
+    while True:
+        m = match(text, pos)
+        word = m.group("word")
+        if word is not None:
+            start, pos = m.start("word"), m.end()
+            stmt = None  # sliced and located only where needed
         else:
-            stmt = _parse_free_stmt(s, filename, ln)
-            if stmt:
-                main_body.append(stmt)
-
-        i += 1
-
-    return (
-        RpgProgram(
-            loc=loc,
-            is_free_format=True,
-            procedures=procedures,
-            main_body=main_body,
-            variables=variables,
-            sql_statements=sql_statements,
-        ),
-        diagnostics,
-    )
-
-
-def _parse_rpg_fixed(source: str, filename: str, diagnostics: list[Diagnostic]) -> tuple[RpgProgram, list[Diagnostic]]:
-    """Parse fixed-format RPG. Spec type in col 6, content in 7-80."""
-    loc = SourceLocation(filename, 1, 0)
-    procedures: list[RpgProcedure] = []
-    main_body: list = []
-    variables: list[RpgVarDecl] = []
-    sql_statements: list[EmbeddedSqlStmt] = []
+            st, pos = source.statement(m.end())
+            if st is None:
+                break
+            f = FREE_LINE_RE.match(st.text)
+            if f is None:
+                continue
+            word = f.group("word")
+            if word is None:
+                directive = copy_directive(st.text)
+                if directive:
+                    includes.include(directive, SourceLocation(filename, st.line, st.column), False, diagnostics)
+                continue
+            stmt, ln, column = st.text, st.line, st.column
+        token = word.upper()
+        if block_end:
+            if token == block_end:
+                block_end = None
+        elif token == "DCL-PROC":
+            blocks = _BlockCheck(filename, diagnostics)
+        elif token in ("DCL-DS", "DCL-PR", "DCL-PI"):
+            block_end = _block_end(token, (text[start:pos - 1] if stmt is None else stmt).upper())
+        elif token in _BLOCK_OPCODES or token == "END-PROC" and blocks is not main:
+            if token == "END-PROC" and not blocks.depth:
+                blocks = main
+                continue
+            if stmt is None:
+                ln, line_start = source.line_at(start)
+                stmt, column = text[start:pos - 1], start - line_start
+            if token == "END-PROC":
+                blocks.close(SourceLocation(filename, ln, column))
+                blocks = main
+            else:
+                blocks.control(token, stmt, ln, column)
+    end = SourceLocation(filename, len(lines), 0)
+    if blocks is not main:
+        blocks.close(end)
+    main.close(end)
 
-    lines = source.splitlines()
-    for i, line in enumerate(lines):
-        ln = i + 1
-        if len(line) < 7:
-            continue
-        spec = line[5:6].upper()  # col 6
-        content = line[6:].rstrip() if len(line) > 6 else ""
-        if not content.strip():
-            continue
 
-        if spec == "D":  # D-spec
-            # D VARNAME     S              5  0
-            parts = content.split()
-            if len(parts) >= 2:
-                name = parts[0]
-                dt = parts[1] if len(parts) > 1 else None
-                variables.append(
-                    RpgVarDecl(loc=SourceLocation(filename, ln, 6), name=name, data_type=dt)
-                )
-        elif spec == "C":  # C-spec (calculation)
-            # C                   EVAL      X = 1
-            op = content[6:14].strip().upper() if len(content) > 14 else ""
-            rest = content[14:].strip() if len(content) > 14 else content.strip()
-            stmt = _parse_fixed_cspec(op, rest, filename, ln)
-            if stmt:
-                main_body.append(stmt)
-        elif spec == "P":  # P-spec (procedure)
-            name = content[:10].strip()
-            procedures.append(
-                RpgProcedure(loc=SourceLocation(filename, ln, 6), name=name or "unknown")
-            )
+class _BlockCheck:
+    """
+    Block opcodes of one body (a procedure, or the main body) for
+    _free_diagnostics: checked with rpg.blocks.check_control until one would
+    be reported, then replayed into a BlockBuilder, which reports from there on.
+    """
+
+    def __init__(self, filename: str, diagnostics: list[Diagnostic]):
+        self.filename = filename
+        self.diagnostics = diagnostics
+        self.open_blocks: list[str] = []
+        self.seen: list[tuple[str, str, int, int]] = []  # (opcode, statement, line, column)
+        self.builder: BlockBuilder | None = None
+
+    def control(self, opcode: str, stmt: str, line: int, column: int) -> None:
+        if self.builder is None:
+            if check_control(self.open_blocks, opcode, opcode != "WHEN" or bool(_condition_text(stmt))):
+                self.seen.append((opcode, stmt, line, column))
+                return
+            self._replay()
+        self._feed(opcode, stmt, line, column)
+
+    @property
+    def depth(self) -> int:
+        """Number of blocks open."""
+        return len(self.open_blocks) if self.builder is None else self.builder.depth
+
+    def close(self, loc: SourceLocation) -> None:
+        if self.builder is None:
+            if not self.open_blocks:
+                return
+            self._replay()
+        self.builder.close(loc)
+
+    def _replay(self) -> None:
+        self.builder = BlockBuilder([], self.diagnostics)
+        for seen in self.seen:
+            self._feed(*seen)
+
+    def _feed(self, opcode: str, stmt: str, line: int, column: int) -> None:
+        """As _LineParser._control / _block."""
+        loc = SourceLocation(self.filename, line, column)
+        rest = _condition_text(stmt) if opcode in _CONDITION_OPCODES else ""
+        self.builder.control(opcode, parse_expression(rest, loc) if rest else None, loc)
+
 
-    return (
-        RpgProgram(
-            loc=loc,
-            is_free_format=False,
-            procedures=procedures,
-            main_body=main_body,
-            variables=variables,
-            sql_statements=sql_statements,
-        ),
-        diagnostics,
-    )
-
-
-def _extract_embedded_sql(lines: list[str], start_col: int) -> str:
-    """Extract full embedded SQL from lines."""
-    out: list[str] = []
-    for line in lines:
-        s = line.strip()
-        out.append(s)
-        if "END-EXEC" in s.upper() or "END-SQL" in s.upper():
-            break
-    return "\n".join(out)
-
-
-def _guess_sql_type(sql: str) -> str | None:
-    sql = sql.upper()
-    for t in ("SELECT", "INSERT", "UPDATE", "DELETE", "DECLARE", "FETCH"):
-        if t in sql and sql.index(t) < 50:
-            return t
-    return None
-
-
-def _parse_free_stmt(s: str, filename: str, line: int) -> object | None:
-    """Parse a single free-format statement line."""
-    loc = SourceLocation(filename, line, 0)
-    s = s.strip().rstrip(";")
-    if not s:
+def _condition_text(stmt: str) -> str:
+    """What follows the opcode of a block statement, as _LineParser._control takes it."""
+    return expression_text(stmt, FREE_LINE_RE.match(stmt).end())
+
+
+class _DeferredProgram(RpgProgram):
+    """
+    Program of a **FREE member, parsed into it when any field but loc and
+    is_free_format is first read or set; its diagnostics were reported by
+    _free_diagnostics.
+    """
+
+    def __init__(self, lines: list[str], filename: str, free: bool, copybooks: CopybookResolver,
+                 active: tuple[str, ...]):
+        self.loc = SourceLocation(filename, 1, 0)
+        self.is_free_format = True
+        self._member: tuple | None = (lines, filename, free, copybooks, active)
+        self._fields: dict[str, Any] = {}
+
+    def _parse(self) -> None:
+        lines, filename, free, copybooks, active = self._member
+        self._member = None
+        includes = _Includes(copybooks, active)
+        program = _finish(_LineParser(lines, filename, [], includes).parse(free, True), includes)
+        self._fields = {name: getattr(program, name) for name in _DEFERRED_FIELDS}
+
+    def __reduce__(self):  # pickled (e.g. in a saved copybook cache) as the parsed RpgProgram
+        return RpgProgram, tuple(getattr(self, f.name) for f in fields(RpgProgram))
+
+
+def _deferred_field(name: str) -> property:
+    def get(self: _DeferredProgram):
+        if self._member is not None:
+            self._parse()
+        return self._fields[name]
+
+    def set(self: _DeferredProgram, value) -> None:
+        if self._member is not None:
+            self._parse()
+        self._fields[name] = value
+
+    return property(get, set)
+
+
+_DEFERRED_FIELDS = tuple(f.name for f in fields(RpgProgram) if f.name not in ("loc", "is_free_format"))
+for _name in _DEFERRED_FIELDS:
+    setattr(_DeferredProgram, _name, _deferred_field(_name))
+
+
+class _NoSymbols:
+    """Stands in for the RpgSymbolTable of a parser that keeps none: queues nothing."""
+
+    def later(self, method: str, *args) -> None:
         return None
-    s_upper = s.upper()
-    if s_upper.startswith("RETURN"):
-        return RpgReturnStmt(loc=loc, value=None)
-    if s_upper.startswith("CALL "):
-        name = s[5:].split("(")[0].strip()
-        return RpgCallStmt(loc=loc, name=name, params=[])
-    if "=" in s and " EXEC " not in s_upper:
-        idx = s.find("=")
-        target = s[:idx].strip()
-        expr = s[idx + 1 :].strip()
-        return RpgAssignStmt(
-            loc=loc,
-            target=RpgExpr(loc=loc, kind="ident", value=target),
-            expr=RpgExpr(loc=loc, kind="literal", value=expr),
+
+
+_NO_SYMBOLS = _NoSymbols()
+
+
+class _LineParser:
+    """
+    Line parser for one member. rpg.regions splits the member into fixed and
+    free regions in one pass; each region is parsed by _parse_fixed or
+    _parse_free into the same program state, so a procedure or block may
+    open in one region and close in another.
+
+    Free-format statements come from rpg.splitter (multi-line, comments
+    removed); each is classified by one precompiled match of its first
+    token, then a dict dispatch on that token. Statements whose first token
+    is not a keyword are assignments (or nothing).
+    """
+
+    def __init__(self, lines: list[str], filename: str, diagnostics: list[Diagnostic], includes: _Includes,
+                 index: bool = True):
+        """index: keep a symbol table (see rpg.symbols); a stream of procedures does without."""
+        self.lines = lines
+        self.filename = filename
+        self.diagnostics = diagnostics
+        self.includes = includes
+        self.fully_free = bool(lines) and lines[0][:6].upper() == "**FREE"
+        self.procedures: list[RpgProcedure] = []
+        self.main_body: list = []
+        self.variables: list[RpgVarDecl] = []
+        self.files: list[RpgFileDecl] = []
+        self.specs: list[RpgSpecLine] = []
+        self.sql_statements: list[EmbeddedSqlStmt] = []
+        self.file_operations: list[RpgFileOperation] = []
+        self.current_proc: RpgProcedure | None = None
+        self.main_builder = self.builder = BlockBuilder(self.main_body, diagnostics)
+        self.block_end: str | None = None  # END-DS / END-PR / END-PI while inside a declaration block
+        self.block_ds = ""  # data structure of the DCL-DS block, for its subfields
+        self.block_qualified = False
+        self.symbols = RpgSymbolTable() if index else _NO_SYMBOLS
+
+    def parse(self, free: bool, is_free_format: bool) -> RpgProgram:
+        """free: the member is free-form from its first line (see rpg.regions.iter_regions)."""
+        self.procedures.extend(self.iter_procedures(free))
+        return RpgProgram(
+            loc=SourceLocation(self.filename, 1, 0),
+            is_free_format=is_free_format,
+            procedures=self.procedures,
+            main_body=self.main_body,
+            variables=self.variables,
+            files=self.files,
+            specs=self.specs,
+            sql_statements=self.sql_statements,
+            file_operations=self.file_operations,
+            symbols=self.symbols if self.symbols is not _NO_SYMBOLS else None,
         )
-    return None
 
+    def iter_procedures(self, free: bool) -> Iterator[RpgProcedure]:
+        """Parse the member, yielding each procedure when it is closed; everything else is kept on self."""
+        column = 0
+        for region in iter_regions(self.lines, free):
+            if region.free:
+                yield from self._parse_free(region)
+            else:
+                yield from self._parse_fixed(region.start, region.end)
+            column = 0 if region.free else 6
+
+        end = SourceLocation(self.filename, len(self.lines), column)
+        if self.current_proc is not None:  # P B without P E, DCL-PROC without END-PROC
+            yield self._close_proc(end)
+        self.main_builder.close(end)
+        self.symbols.later("index_statements", self.main_body)
+
+    def _close_proc(self, loc: SourceLocation) -> RpgProcedure:
+        """Close the open procedure (END-PROC / P E at loc) and return it; statements go to the main body again."""
+        proc = self.current_proc
+        self.builder.close(loc)
+        self.symbols.later("index_statements", proc.body, proc.name)
+        self.current_proc = None
+        self.builder = self.main_builder
+        return proc
+
+    def _parse_free(self, region: RpgRegion) -> Iterator[RpgProcedure]:
+        lines = self.lines[region.start:region.end]
+        margin = region.margin
+        if margin:  # columns 1-5 of a fixed-form member hold sequence numbers, not code
+            blank = " " * margin
+            lines = [line if not line[:margin].strip() else blank + line[margin:] for line in lines]
+        dispatch = self._DISPATCH
+        for st in iter_free_statements(lines, region.start + 1):
+            m = FREE_LINE_RE.match(st.text)
+            if m is None:  # stray text
+                continue
+            word = m.group("word")
+            if word is None:
+                self._slash(m.group("slash"), st)
+                continue
+            token = word.upper()
+            if self.block_end:
+                self._block_member(token, st, m.end())
+                continue
+            if token == "END-PROC":
+                if self.current_proc is not None:
+                    yield self._close_proc(self._loc(st))
+                continue
+            dispatch.get(token, _LineParser._assign)(self, token, st, m.end())
 
-def _parse_fixed_cspec(op: str, rest: str, filename: str, line: int) -> object | None:
-    """Parse fixed C-spec operation and rest."""
-    loc = SourceLocation(filename, line, 6)
-    op = op.upper()
-    if op in ("EVAL", "EVALR", "EVAL-CORR"):
-        if "=" in rest:
-            t, _, e = rest.partition("=")
-            return RpgAssignStmt(
+    def _parse_fixed(self, start: int, end: int) -> Iterator[RpgProcedure]:
+        """
+        Parse fixed-format lines [start, end). Spec type in col 6; each line is
+        decoded in one pass through the column layouts in rpg.fixed_specs.
+        P B ... P E bracket procedure bodies.
+        """
+        lines, filename, diagnostics, includes = self.lines, self.filename, self.diagnostics, self.includes
+        variables, files, specs = self.variables, self.files, self.specs
+        builder = self.builder  # builder of the open procedure, if any
+        symbols = self.symbols
+        ds_name, ds_qualified = "", False  # data structure owning the following subfield lines
+        d_block = ""  # DS / PR / PI owning the following subfield or parameter lines
+        long_name = ""  # D/P name continued with '...'
+        last_call: RpgCallStmt | None = None  # CALL/CALLB taking the following PARM lines
+        last_expr: RpgExpr | None = None  # EVAL expression continued in extended factor 2
+        sql_lines: list[str] | None = None  # inside C/EXEC SQL ... C/END-EXEC
+        sql_line = 0
+
+        for i in range(start, end):
+            line = lines[i]
+            ln = i + 1
+            directive = copy_directive(line[6:]) if line[6:7] == "/" else None
+            if directive:
+                copybook = includes.include(directive, SourceLocation(filename, ln, 6), False, diagnostics)
+                self._include(copybook)
+                continue
+            decoded = decode_spec(line)
+            if decoded is None:
+                continue
+            spec, f = decoded
+            sloc = SourceLocation(filename, ln, 6)
+
+            if spec == "C":
+                content = line[6:].rstrip()
+                if content[:9].upper() == "/EXEC SQL":
+                    sql_lines, sql_line = [content[1:]], ln
+                    continue
+                if sql_lines is not None:
+                    if content[:1] == "+":
+                        sql_lines.append(content[1:].strip())
+                    elif content[:8].upper() == "/END-EXE":
+                        self._add_sql(EmbeddedSqlStmt(loc=SourceLocation(filename, sql_line, 6),
+                                                      sql_text="\n".join(sql_lines)))
+                        sql_lines = None
+                    continue
+            specs.append(RpgSpecLine(loc=sloc, spec=spec, fields=f))
+
+            if spec in ("D", "P") and line[6:80].rstrip().endswith("..."):  # name continued, may run past col 21
+                long_name += line[6:80].strip()[:-3]
+                continue
+            if spec == "F":
+                if f["name"]:
+                    files.append(
+                        RpgFileDecl(
+                            loc=sloc,
+                            name=f["name"],
+                            usage=f["file_type"].upper() or None,
+                            designation=f["designation"].upper() or None,
+                            device=f["device"].upper() or None,
+                            externally_described=f["format"].upper() != "F",
+                            keyed=f["record_address_type"].upper() == "K",
+                            keywords=f["keywords"] or None,
+                        )
+                    )
+                elif files and f["keywords"]:  # keyword continuation line
+                    files[-1].keywords = f"{files[-1].keywords or ''} {f['keywords']}".strip()
+            elif spec == "D":
+                name, long_name = long_name + f["name"], ""
+                decl = f["decl_type"].upper()
+                if decl:
+                    d_block = decl
+                current_proc = self.current_proc
+                if decl == "PI" and current_proc is not None:
+                    current_proc.returns = (f["data_type"] + f["length"]) or None
+                elif not decl and d_block in ("PR", "PI"):
+                    if d_block == "PI" and current_proc is not None and name:
+                        passing = PASSING_RE.search(f["keywords"])
+                        param = RpgParam(loc=sloc, name=name, passing=passing.group(1).upper() if passing else None)
+                        current_proc.params.append(param)
+                        symbols.later("declare", name, current_proc.name, "param", param)
+                elif name and decl not in ("PR", "PI"):
+                    inz = INZ_RE.search(f["keywords"])
+                    var = RpgVarDecl(
+                        loc=sloc,
+                        name=name,
+                        data_type=f["data_type"].upper() or default_fixed_type(decl, d_block, f),
+                        length=f["length"] or None,
+                        decimals=f["decimals"] or None,
+                        inz=inz.group(1).strip() if inz else None,
+                    )
+                    variables.append(var)
+                    if decl == "DS":
+                        symbols.later("declare_ds", name, self._scope(), var)
+                        ds_name, ds_qualified = name, "QUALIFIED" in f["keywords"].upper()
+                    elif not decl and d_block == "DS" and ds_name:
+                        symbols.later("declare", name, ds_name, "subfield", var, ds_qualified)
+                    else:
+                        symbols.later("declare", name, self._scope(), "const" if decl == "C" else "var", var)
+            elif spec == "P":
+                name, long_name = long_name + f["name"], ""
+                d_block = ""
+                if f["begin_end"].upper() == "B":
+                    self.current_proc = RpgProcedure(loc=sloc, name=name or "unknown")
+                    self.builder = builder = BlockBuilder(self.current_proc.body, diagnostics)
+                elif f["begin_end"].upper() == "E" and self.current_proc is not None:
+                    yield self._close_proc(sloc)
+                    builder = self.builder
+            elif spec == "C":
+                op = f["opcode"].split("(")[0].upper()
+                if not op:
+                    if last_expr is not None and f["extended_factor2"]:
+                        last_expr.value = f"{last_expr.value} {f['extended_factor2']}"
+                        refresh_expression(last_expr)
+                    continue
+                if op == "PARM" and last_call is not None:
+                    last_call.params.append(RpgExpr(loc=sloc, kind="ident", value=f["result"]))
+                    continue
+                control = fixed_control(op, f)
+                if control and control[0] in ("AND", "OR"):
+                    builder.extend_condition(*control)
+                    continue
+                if control:
+                    last_call = None
+                    last_expr = parse_expression(control[1], sloc) if control[1] else None
+                    builder.control(control[0], last_expr, sloc)
+                    continue
+                if op in FILE_OPCODES and f["factor2"]:
+                    self.file_operations.append(RpgFileOperation(loc=sloc, opcode=op, name=f["factor2"]))
+                stmt = parse_fixed_cspec(op, f, filename, ln)
+                last_call = stmt if isinstance(stmt, RpgCallStmt) and op != "CALLP" else None
+                last_expr = stmt.expr if isinstance(stmt, RpgAssignStmt) and op.startswith("EVAL") else None
+                if stmt:
+                    builder.add(stmt)
+
+    def _loc(self, st: RpgStatementText) -> SourceLocation:
+        return SourceLocation(self.filename, st.line, st.column)
+
+    def _scope(self) -> str:
+        """Symbol scope of the code being parsed: the open procedure, else global."""
+        return self.current_proc.name if self.current_proc is not None else GLOBAL
+
+    def _add_sql(self, sql: EmbeddedSqlStmt) -> None:
+        self.sql_statements.append(sql)
+        if self.current_proc is not None:
+            self.current_proc.sql_statements.append(sql)
+        self.symbols.later("index_sql", sql, self._scope())
+
+    def _include(self, copybook: RpgProgram | None) -> None:
+        """Merge the statements and symbols of a copybook at its directive."""
+        if copybook is None:
+            return
+        for stmt in copybook.main_body:
+            self.builder.add(stmt)
+        if copybook.symbols is not None:
+            self.symbols.later("include", copybook.symbols)
+
+    # -- handlers: (upper-case first token, statement, end of token in st.text)
+
+    def _slash(self, token: str, st: RpgStatementText) -> None:
+        """**FREE, /FREE, /END-FREE, or a /COPY / /INCLUDE directive."""
+        if token[:2] == "**":
+            return
+        directive = copy_directive(st.text)
+        if directive:
+            # from **FREE source the copybook's own first line decides its format
+            self._include(self.includes.include(directive, self._loc(st), not self.fully_free, self.diagnostics))
+
+    def _exec(self, word: str, st: RpgStatementText, end: int) -> None:
+        if not _EXEC_SQL_RE.match(st.text):
+            self._assign(word, st, end)
+            return
+        self._add_sql(EmbeddedSqlStmt(loc=self._loc(st), sql_text=st.text))
+
+    def _dcl_f(self, word: str, st: RpgStatementText, end: int) -> None:
+        m = DCL_F_RE.match(st.text)
+        if m:
+            self.files.append(free_file_decl(m, self.filename, st.line))
+
+    def _dcl_s(self, word: str, st: RpgStatementText, end: int) -> None:
+        m = _DCL_S_RE.match(st.text, end)
+        if m:
+            var = RpgVarDecl(loc=self._loc(st), name=m.group(1), data_type=m.group(2))
+            self.variables.append(var)
+            self.symbols.later("declare", var.name, self._scope(), "var", var)
+
+    def _dcl_block(self, word: str, st: RpgStatementText, end: int) -> None:
+        """DCL-DS / DCL-PR / DCL-PI: subfields or parameters follow up to END-xx, unless declared inline."""
+        upper = st.text.upper()
+        if word == "DCL-DS":
+            m = _NAME_RE.match(st.text, end)
+            if m:
+                var = RpgVarDecl(loc=self._loc(st), name=m.group(1), data_type="DS")
+                self.variables.append(var)
+                self.symbols.later("declare_ds", var.name, self._scope(), var)
+                self.block_ds, self.block_qualified = var.name, "QUALIFIED" in upper
+        self.block_end = _block_end(word, upper)
+
+    def _block_member(self, token: str, st: RpgStatementText, end: int) -> None:
+        """A statement inside a declaration block: END-xx, a DCL-PI parameter, or a subfield."""
+        if token == self.block_end:
+            self.block_end = None
+        elif self.block_end == "END-PI" and self.current_proc is not None:
+            passing = PASSING_RE.search(st.text)
+            param = RpgParam(loc=self._loc(st), name=st.text[:end].strip(),
+                             passing=passing.group(1).upper() if passing else None)
+            self.current_proc.params.append(param)
+            self.symbols.later("declare", param.name, self.current_proc.name, "param", param)
+        elif self.block_end == "END-DS" and self.block_ds:
+            if token == "DCL-SUBF":
+                m = _DCL_S_RE.match(st.text, end)
+                name, data_type = (m.group(1), m.group(2)) if m else ("", None)
+            else:
+                m = _NAME_RE.match(st.text, end)
+                name, data_type = st.text[:end].strip(), m.group(1) if m else None
+            if name:
+                var = RpgVarDecl(loc=self._loc(st), name=name, data_type=data_type)
+                self.symbols.later("declare", name, self.block_ds, "subfield", var, self.block_qualified)
+
+    def _dcl_proc(self, word: str, st: RpgStatementText, end: int) -> None:
+        m = _NAME_RE.match(st.text, end)
+        self.current_proc = RpgProcedure(loc=self._loc(st), name=m.group(1) if m else "unknown")
+        self.builder = BlockBuilder(self.current_proc.body, self.diagnostics)
+
+    def _control(self, word: str, st: RpgStatementText, end: int) -> None:
+        """Block opcode with a condition (IF, WHEN, DOW, FOR, ON-ERROR, ...)."""
+        loc = self._loc(st)
+        rest = expression_text(st.text, end)
+        self.builder.control(word, parse_expression(rest, loc) if rest else None, loc)
+
+    def _block(self, word: str, st: RpgStatementText, end: int) -> None:
+        """Block opcode without one (ELSE, OTHER, SELECT, MONITOR, ENDxx)."""
+        self.builder.control(word, None, self._loc(st))
+
+    def _return(self, word: str, st: RpgStatementText, end: int) -> None:
+        loc = self._loc(st)
+        rest = expression_text(st.text, end)
+        self.builder.add(RpgReturnStmt(loc=loc, value=parse_expression(rest, loc) if rest else None))
+
+    def _call(self, word: str, st: RpgStatementText, end: int) -> None:
+        m = _NAME_RE.match(st.text, end)
+        if m:
+            self.builder.add(RpgCallStmt(loc=self._loc(st), name=m.group(1), params=[]))
+
+    def _file_op(self, word: str, st: RpgStatementText, end: int) -> None:
+        operation = free_file_operation(word, st.text[end:], self._loc(st))
+        if operation is not None:
+            self.file_operations.append(operation)
+
+    def _eval(self, word: str, st: RpgStatementText, end: int) -> None:
+        self._assign("", st, end)
+
+    def _assign(self, word: str, st: RpgStatementText, end: int) -> None:
+        """target = expr or target op= expr (an implicit EVAL); other statements are not modelled."""
+        text = st.text
+        assignment = split_assignment(text, end - len(word))
+        if assignment is None:
+            return
+        target, operator, expr_start = assignment
+        loc = self._loc(st)
+        self.builder.add(
+            RpgAssignStmt(
                 loc=loc,
-                target=RpgExpr(loc=loc, kind="ident", value=t.strip()),
-                expr=RpgExpr(loc=loc, kind="literal", value=e.strip()),
+                target=RpgExpr(loc=loc, kind="ident", value=target),
+                expr=parse_expression(expression_text(text, expr_start), loc),
+                operator=operator,
             )
-    if op == "CALL":
-        name = rest.split()[0] if rest else ""
-        return RpgCallStmt(loc=loc, name=name, params=[])
-    if op in ("RETURN", "LEAVE"):
-        return RpgReturnStmt(loc=loc, value=None)
-    return None
+        )
+
+    # first token -> handler, a plain function (bound methods kept on the parser would make it a cycle)
+    _DISPATCH = dict.fromkeys(_BLOCK_OPCODES, _block)
+    _DISPATCH.update(dict.fromkeys(_CONDITION_OPCODES, _control))
+    _DISPATCH.update(dict.fromkeys(FILE_OPCODES, _file_op))
+    _DISPATCH.update({
+        "DCL-F": _dcl_f,
+        "DCL-S": _dcl_s,
+        "DCL-DS": _dcl_block,
+        "DCL-PR": _dcl_block,
+        "DCL-PI": _dcl_block,
+        "DCL-PROC": _dcl_proc,
+        "EXEC": _exec,
+        "RETURN": _return,
+        "CALL": _call,
+        "CALLP": _call,
+        "EVAL": _eval,
+        "EVALR": _eval,
+        "EVAL-CORR": _eval,
+    })
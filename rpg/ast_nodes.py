@@ -5,6 +5,7 @@ Supports both fixed-format (positional columns) and free-format.
 Same AST node types for both; fixed vs free only affects parsing.
 """
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -23,8 +24,8 @@ class SourceLocation:
 class RpgExpr:
     """Expression node (literal, identifier, binary op, etc.)."""
 
-    loc: SourceLocation
-    kind: str  # "literal" | "ident" | "binary" | "call" | "sql" | ...
+    loc: SourceLocation | None  # None inside a parse tree: subtrees are shared (rpg.expressions)
+    kind: str  # "expr" | "literal" | "ident" | "binary" | "unary" | "bif" | "call" | "member"
     value: str | None = None
     children: list["RpgExpr"] = field(default_factory=list)
 
@@ -50,6 +51,38 @@ class RpgVarDecl:
     inz: str | None = None
 
 
+@dataclass
+class RpgFileDecl:
+    """File declaration (F-spec / DCL-F)."""
+
+    loc: SourceLocation
+    name: str
+    usage: str | None = None  # I, O, U, C (F-spec file type) or *INPUT, *UPDATE, ... (DCL-F)
+    designation: str | None = None  # P, S, F, ... (F-spec only)
+    device: str | None = None  # DISK, WORKSTN, PRINTER, SEQ, SPECIAL
+    externally_described: bool = True
+    keyed: bool = False
+    keywords: str | None = None  # raw keyword text (RENAME, PREFIX, SFILE, ...)
+
+
+@dataclass
+class RpgFileOperation:
+    """Record-level I/O opcode (READC, WRITE, EXFMT, CHAIN, ...) and the file or record format it names."""
+
+    loc: SourceLocation
+    opcode: str  # upper case, without extender
+    name: str  # file or record format, as written
+
+
+@dataclass
+class RpgSpecLine:
+    """One decoded fixed-format specification line (see rpg.fixed_specs.SPEC_LAYOUTS)."""
+
+    loc: SourceLocation
+    spec: str  # H, F, D, I, C, O, P
+    fields: dict[str, str] = field(default_factory=dict)
+
+
 @dataclass
 class EmbeddedSqlStmt:
     """Embedded SQL statement (EXEC SQL ... END-EXEC)."""
@@ -57,16 +90,28 @@ class EmbeddedSqlStmt:
     loc: SourceLocation
     sql_text: str
     stmt_type: str | None = None  # SELECT, INSERT, UPDATE, DELETE, etc.
+    statements: list[Any] = field(default_factory=list)  # Db2* nodes from db2.ast_builder
+    host_variables: list[str] = field(default_factory=list)  # names without ':', in source order
+    fingerprint: str | None = None  # db2.normalizer fingerprint
+
+    @property
+    def statement_text(self) -> str:
+        """The SQL statement itself, without EXEC SQL / END-EXEC and the terminator."""
+        return _EXEC_SQL_WRAPPER_RE.sub("", self.sql_text).strip()
+
+
+_EXEC_SQL_WRAPPER_RE = re.compile(r"^\s*(?:C/)?exec\s+sql\b|[\s;]*(?:(?:C/)?end-exec\b[\s;]*)?$", re.I)
 
 
 # Statement variants
 @dataclass
 class RpgAssignStmt:
-    """Assignment statement."""
+    """Assignment statement: target = expr, or target op= expr (x += 1: operator "+")."""
 
     loc: SourceLocation
     target: RpgExpr
     expr: RpgExpr
+    operator: str | None = None  # "+", "-", "*", "/" or "**" of a compound assignment
 
 
 @dataclass
@@ -107,6 +152,15 @@ class RpgDoForStmt:
     body: list["RpgStatement"] = field(default_factory=list)
 
 
+@dataclass
+class RpgMonitorStmt:
+    """MONITOR/ON-ERROR/ENDMON."""
+
+    loc: SourceLocation
+    body: list["RpgStatement"] = field(default_factory=list)
+    handlers: list[tuple[RpgExpr | None, list["RpgStatement"]]] = field(default_factory=list)  # ON-ERROR status codes
+
+
 @dataclass
 class RpgReturnStmt:
     """Return statement."""
@@ -121,6 +175,7 @@ RpgStatement = (
     | RpgIfStmt
     | RpgSelectStmt
     | RpgDoForStmt
+    | RpgMonitorStmt
     | RpgReturnStmt
     | EmbeddedSqlStmt
 )
@@ -135,6 +190,18 @@ class RpgProcedure:
     params: list[RpgParam] = field(default_factory=list)
     body: list[RpgStatement] = field(default_factory=list)
     returns: str | None = None
+    sql_statements: list[EmbeddedSqlStmt] = field(default_factory=list)  # its own; also in RpgProgram.sql_statements
+
+
+@dataclass
+class RpgInclude:
+    """/COPY or /INCLUDE directive and the copybook it resolved to."""
+
+    loc: SourceLocation
+    directive: str  # COPY | INCLUDE
+    target: str  # as written: [LIB/]FILE,MEMBER, MEMBER or an IFS path
+    path: str | None = None  # resolved file; None when not found
+    program: "RpgProgram | None" = None  # parsed copybook, shared by every includer
 
 
 @dataclass
@@ -146,4 +213,9 @@ class RpgProgram:
     procedures: list[RpgProcedure] = field(default_factory=list)
     main_body: list[RpgStatement] = field(default_factory=list)
     variables: list[RpgVarDecl] = field(default_factory=list)
+    files: list[RpgFileDecl] = field(default_factory=list)
+    specs: list[RpgSpecLine] = field(default_factory=list)  # fixed format: every decoded spec line
+    includes: list[RpgInclude] = field(default_factory=list)  # /COPY and /INCLUDE, in source order
     sql_statements: list[EmbeddedSqlStmt] = field(default_factory=list)
+    file_operations: list[RpgFileOperation] = field(default_factory=list)  # in source order
+    symbols: Any = None  # rpg.symbols.RpgSymbolTable: scoped declarations and def-use index
@@ -0,0 +1,208 @@
+"""
+Stack-based nesting of RPG control-flow blocks.
+
+The free- and fixed-format parsers feed statements and block opcodes
+(IF ... ENDIF, SELECT ... ENDSL, DOW/DOU/FOR/DO ... ENDDO, MONITOR ... ENDMON)
+to a BlockBuilder in source order. One explicit stack of open blocks nests
+them in a single pass. Unbalanced blocks become diagnostics instead of
+exceptions, and parsing carries on.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from core.diagnostics import Diagnostic
+from rpg.ast_nodes import (
+    RpgDoForStmt,
+    RpgExpr,
+    RpgIfStmt,
+    RpgMonitorStmt,
+    RpgSelectStmt,
+    SourceLocation,
+)
+from rpg.expressions import refresh_expression
+
+# opcode -> kind of block it opens / continues / closes
+OPENERS = {"IF": "IF", "SELECT": "SELECT", "DO": "DO", "DOW": "DO", "DOU": "DO", "FOR": "DO", "MONITOR": "MONITOR"}
+MIDDLES = {"ELSEIF": "IF", "ELSE": "IF", "WHEN": "SELECT", "OTHER": "SELECT", "ON-ERROR": "MONITOR"}
+CLOSERS = {"ENDIF": "IF", "ENDSL": "SELECT", "ENDDO": "DO", "ENDFOR": "DO", "ENDMON": "MONITOR", "END": None}
+CONTROL_OPCODES = frozenset(OPENERS) | frozenset(MIDDLES) | frozenset(CLOSERS)
+
+_END_OPCODE = {"IF": "ENDIF", "SELECT": "ENDSL", "DO": "ENDDO", "MONITOR": "ENDMON"}
+_PAST_LAST_PART = {"ELSE": "IF", "OTHER": "SELECT"}  # check_control: an IF past its ELSE, a SELECT past OTHER
+
+
+def check_control(open_blocks: list[str], opcode: str, has_condition: bool = True) -> bool:
+    """
+    Apply an upper-case block opcode to open_blocks, the kinds of the open
+    blocks innermost last ("ELSE" / "OTHER" for an IF / SELECT past its ELSE /
+    OTHER), without building nodes. False where BlockBuilder.control would
+    report a diagnostic.
+    """
+    if opcode == "WHEN" and not has_condition and open_blocks[-1:] == ["SELECT"]:
+        opcode = "OTHER"  # a case without a condition: a later WHEN is reported as after OTHER
+    if opcode in OPENERS:
+        open_blocks.append(OPENERS[opcode])
+        return True
+    top = open_blocks[-1] if open_blocks else None
+    if opcode in MIDDLES:
+        if opcode in ("ELSEIF", "ELSE"):
+            ok = top == "IF"
+        elif opcode == "WHEN":
+            ok = top == "SELECT"
+        elif opcode == "OTHER":
+            ok = top in ("SELECT", "OTHER")
+        else:
+            ok = top == "MONITOR"
+        if ok and opcode in _PAST_LAST_PART:
+            open_blocks[-1] = opcode
+        return ok
+    kind = CLOSERS[opcode]
+    if top is None or kind is not None and _PAST_LAST_PART.get(top, top) != kind:
+        return False
+    open_blocks.pop()
+    return True
+
+
+def balanced_block_pattern(statement: Callable[..., str], other: str) -> str:
+    """
+    Pattern source for one block whose parts hold only statements matching
+    other (pattern source, no block opcode among them): BlockBuilder reports
+    nothing for such a block and leaves its stack as it was, so a check may
+    pass over it. statement(words, condition=False) gives the pattern source
+    for a statement starting with one of words (condition: with text after it).
+    """
+    body = f"(?:{other})*+"
+    parts = [
+        rf"{statement(['IF'])}{body}(?:{statement(['ELSEIF'])}{body})*+(?:{statement(['ELSE'])}{body})?+",
+        rf"{statement(['SELECT'])}{body}(?:{statement(['WHEN'], condition=True)}{body})*+"
+        rf"(?:{statement(['OTHER'])}{body})*+",
+        rf"{statement(['DO', 'DOW', 'DOU', 'FOR'])}{body}",
+        rf"{statement(['MONITOR'])}{body}(?:{statement(['ON-ERROR'])}{body})*+",
+    ]
+    closers = [["ENDIF"], ["ENDSL"], ["ENDDO", "ENDFOR"], ["ENDMON"]]
+    return "(?:" + "|".join(f"{part}{statement(words)}" for part, words in zip(parts, closers)) + ")"
+
+
+@dataclass
+class _Block:
+    kind: str  # IF | SELECT | DO | MONITOR
+    opcode: str  # opcode that opened it (for messages)
+    node: object
+    loc: SourceLocation
+    body: list  # list receiving the block's statements right now
+    condition: RpgExpr | None = None  # condition of the current part (ANDxx/ORxx extend it)
+
+
+class BlockBuilder:
+    """
+    Nests statements into control-flow nodes with an explicit stack.
+
+    add() appends a statement to the innermost open block (or the root body);
+    control() applies a block opcode; close() reports blocks left open, e.g.
+    at END-PROC or end of source.
+    """
+
+    def __init__(self, body: list, diagnostics: list[Diagnostic]):
+        self._root = body
+        self._stack: list[_Block] = []
+        self._diagnostics = diagnostics
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+    def add(self, stmt) -> None:
+        (self._stack[-1].body if self._stack else self._root).append(stmt)
+
+    def control(self, opcode: str, condition: RpgExpr | None, loc: SourceLocation) -> None:
+        """Apply a block opcode (IF, ELSEIF, WHEN, ENDDO, END, ...) with its condition, if any."""
+        opcode = opcode.upper()
+        if opcode in OPENERS:
+            self._open(opcode, condition, loc)
+        elif opcode in MIDDLES:
+            self._middle(opcode, condition, loc)
+        elif opcode in CLOSERS:
+            self._close(opcode, loc)
+
+    def extend_condition(self, connective: str, text: str) -> None:
+        """Append a fixed-format ANDxx / ORxx comparison to the current condition."""
+        if self._stack and self._stack[-1].condition is not None:
+            cond = self._stack[-1].condition
+            cond.value = f"{cond.value} {connective} {text}"
+            refresh_expression(cond)
+
+    def close(self, loc: SourceLocation) -> None:
+        """Report and drop every block still open (they stay in the AST as parsed so far)."""
+        while self._stack:
+            block = self._stack.pop()
+            self._report(block.loc, f"{block.opcode} has no matching {_END_OPCODE[block.kind]} "
+                                    f"before line {loc.line}")
+
+    # -- stack operations --------------------------------------------------
+
+    def _open(self, opcode: str, condition: RpgExpr | None, loc: SourceLocation) -> None:
+        kind = OPENERS[opcode]
+        if kind == "IF":
+            node = RpgIfStmt(loc=loc, condition=condition, then_body=[])
+            body = node.then_body
+        elif kind == "SELECT":
+            node = RpgSelectStmt(loc=loc, cases=[])
+            body = []  # statements before the first WHEN belong to no case
+        elif kind == "DO":
+            node = RpgDoForStmt(loc=loc, kind=opcode.lower(), condition=condition)
+            body = node.body
+        else:
+            node = RpgMonitorStmt(loc=loc)
+            body = node.body
+        self.add(node)
+        self._stack.append(_Block(kind, opcode, node, loc, body, condition))
+
+    def _middle(self, opcode: str, condition: RpgExpr | None, loc: SourceLocation) -> None:
+        kind = MIDDLES[opcode]
+        block = self._stack[-1] if self._stack else None
+        if block is None or block.kind != kind:
+            self._report(loc, f"{opcode} outside {kind}")
+            return
+        node = block.node
+        if opcode == "ELSEIF":
+            if block.body is node.else_body:
+                self._report(loc, "ELSEIF after ELSE")
+            node.else_if_parts.append((condition, []))
+            block.body = node.else_if_parts[-1][1]
+        elif opcode == "ELSE":
+            if block.body is node.else_body:
+                self._report(loc, "second ELSE in IF")
+            block.body = node.else_body
+        elif opcode == "WHEN":
+            if node.cases and node.cases[-1][0] is None:
+                self._report(loc, "WHEN after OTHER")
+            node.cases.append((condition, []))
+            block.body = node.cases[-1][1]
+        elif opcode == "OTHER":
+            node.cases.append((None, []))
+            block.body = node.cases[-1][1]
+        else:  # ON-ERROR
+            node.handlers.append((condition, []))
+            block.body = node.handlers[-1][1]
+        block.condition = condition
+
+    def _close(self, opcode: str, loc: SourceLocation) -> None:
+        kind = CLOSERS[opcode]  # None: fixed-format END closes the innermost block
+        if not self._stack:
+            self._report(loc, f"{opcode} without an open block")
+            return
+        if kind is None or self._stack[-1].kind == kind:
+            self._stack.pop()
+            return
+        if not any(b.kind == kind for b in self._stack):
+            self._report(loc, f"{opcode} without {kind}")
+            return
+        while self._stack[-1].kind != kind:  # close the blocks that were never ended
+            block = self._stack.pop()
+            self._report(block.loc, f"{block.opcode} has no matching {_END_OPCODE[block.kind]} before {opcode} "
+                                    f"at line {loc.line}")
+        self._stack.pop()
+
+    def _report(self, loc: SourceLocation, message: str) -> None:
+        self._diagnostics.append(Diagnostic(loc.file, loc.line, loc.column, "error", message))
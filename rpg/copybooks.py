@@ -0,0 +1,196 @@
+"""
+/COPY and /INCLUDE resolution for RPG.
+
+A directive names a source member (LIB/FILE,MEMBER, FILE,MEMBER or MEMBER,
+where FILE defaults to QRPGLESRC) or an IFS path (quoted, or with a file
+extension). Members are looked up under the including member's directory
+and then each search path, as <dir>/<LIB>/<FILE>/<MEMBER>, <dir>/<FILE>/<MEMBER>
+or <dir>/<MEMBER>; member names match case-insensitively, with or without a
+source extension.
+
+Each copybook is parsed once per CopybookCache (one per process by default;
+save/load keeps it across runs) and merged into every includer by
+reference: the nodes are shared, and their locations point into the
+copybook, not the includer. Include cycles are reported and cut.
+"""
+
+import pickle
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.diagnostics import Diagnostic
+from core.io import load_file
+from rpg.ast_nodes import RpgInclude, RpgProgram, SourceLocation
+
+CACHE_VERSION = 8
+
+DEFAULT_SOURCE_FILE = "QRPGLESRC"
+COPYBOOK_EXTENSIONS = ("", ".rpgle", ".rpgleinc", ".sqlrpgle", ".rpginc", ".rpg", ".mbr", ".txt")
+
+_DIRECTIVE_RE = re.compile(r"/(COPY|INCLUDE)\s+('[^']*'|\"[^\"]*\"|\S+)", re.I)
+
+
+def copy_directive(text: str) -> tuple[str, str] | None:
+    """(COPY | INCLUDE, target) when text (from column 7, or a free-format line) is a copy directive."""
+    m = _DIRECTIVE_RE.match(text.lstrip())
+    return (m.group(1).upper(), m.group(2)) if m else None
+
+
+@dataclass
+class _Entry:
+    stamp: list[int] | None  # size / mtime of the copybook when parsed
+    program: RpgProgram
+    diagnostics: list[Diagnostic] = field(default_factory=list)
+
+
+class CopybookCache:
+    """Parsed copybooks keyed by resolved path and format (free / fixed)."""
+
+    def __init__(self):
+        self._entries: dict[tuple[str, bool], _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str, free: bool, stamp: list[int] | None) -> _Entry | None:
+        entry = self._entries.get((path, free))
+        if entry is None or entry.stamp != stamp:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, path: str, free: bool, entry: _Entry) -> None:
+        self._entries[path, free] = entry
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "entries": self._entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CopybookCache":
+        """Load a saved cache; a missing or unreadable file gives an empty cache. Changed copybooks are re-parsed."""
+        cache = cls()
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return cache
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            cache._entries = data["entries"]
+        return cache
+
+
+class CopybookResolver:
+    """Finds, parses (through a CopybookCache) and cycle-checks copybooks."""
+
+    def __init__(self, search_paths=(), cache: CopybookCache | None = None):
+        self.search_paths = [Path(p) for p in search_paths]
+        self.cache = cache if cache is not None else CopybookCache()
+        self._listings: dict[Path, dict[str, Path]] = {}  # directory -> upper-case name -> entry
+
+    def resolve(self, target: str, includer: str | None = None) -> Path | None:
+        """File a directive target refers to, or None."""
+        dirs = ([Path(includer).parent] if includer else []) + self.search_paths
+        quoted = target[:1] in ("'", '"')
+        target = target.strip("'\"")
+        if not quoted and "." not in Path(target).name:
+            parts = target.split(",", 1)
+            member = parts[-1].strip()
+            lib, _, file = (parts[0].strip() if len(parts) == 2 else DEFAULT_SOURCE_FILE).rpartition("/")
+            subdirs = ([(lib, file)] if lib else []) + [(file,), ()]
+            for base in dirs:
+                for sub in subdirs:
+                    found = self._find(base.joinpath(*sub), member)
+                    if found is not None:
+                        return found
+        for base in ([Path()] if Path(target).is_absolute() else dirs):
+            path = base / target
+            if path.is_file():
+                return path
+        return None
+
+    def include(
+        self,
+        directive: str,
+        target: str,
+        loc: SourceLocation,
+        free: bool,
+        active: tuple[str, ...],
+        diagnostics: list[Diagnostic],
+    ) -> RpgInclude:
+        """
+        Resolve and parse one directive found at loc. active holds the resolved
+        paths of the members being included right now (outermost first).
+        """
+        include = RpgInclude(loc=loc, directive=directive, target=target)
+        path = self.resolve(target, loc.file)
+        if path is None:
+            diagnostics.append(Diagnostic(loc.file, loc.line, loc.column, "warning",
+                                          f"/{directive} {target}: copybook not found"))
+            return include
+        key = str(path.resolve())
+        include.path = str(path)
+        if key in active:
+            chain = " -> ".join(Path(p).name for p in active[active.index(key):] + (key,))
+            diagnostics.append(Diagnostic(loc.file, loc.line, loc.column, "error", f"include cycle: {chain}"))
+            return include
+
+        stamp = _stamp(path)
+        entry = self.cache.get(key, free, stamp)
+        if entry is None:
+            from rpg.ast_builder import parse_rpg_member
+
+            try:
+                source = load_file(str(path))
+            except (OSError, UnicodeDecodeError) as e:
+                diagnostics.append(Diagnostic(loc.file, loc.line, loc.column, "error", f"/{directive} {target}: {e}"))
+                return include
+            program, parse_diagnostics = parse_rpg_member(source, str(path), free, self, active + (key,))
+            entry = _Entry(stamp, program, parse_diagnostics)
+            self.cache.put(key, free, entry)
+        include.program = entry.program
+        diagnostics.extend(entry.diagnostics)
+        return include
+
+    def _find(self, directory: Path, member: str) -> Path | None:
+        listing = self._listings.get(directory)
+        if listing is None:
+            try:
+                listing = {p.name.upper(): p for p in directory.iterdir()}
+            except OSError:
+                listing = {}
+            self._listings[directory] = listing
+        for ext in COPYBOOK_EXTENSIONS:
+            path = listing.get((member + ext).upper())
+            if path is not None and path.is_file():
+                return path
+        return None
+
+
+_default_resolver: CopybookResolver | None = None
+
+
+def default_resolver() -> CopybookResolver:
+    """Process-wide resolver (no extra search paths) used when the caller brings none."""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = CopybookResolver()
+    return _default_resolver
+
+
+def set_default_resolver(resolver: CopybookResolver) -> None:
+    """Install a resolver (e.g. with search paths and a loaded cache) as the process-wide default."""
+    global _default_resolver
+    _default_resolver = resolver
+
+
+def _stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
@@ -0,0 +1,260 @@
+"""
+Precedence-climbing parser for RPG expressions.
+
+parse_expression(text, loc) returns the expression as written: an RpgExpr
+of kind "expr" whose value is the text and whose one child is the parse
+tree (no child when the text does not parse, so callers can fall back to
+the text). Tree nodes:
+
+    literal  'abc', X'0D25', D'2024-01-31', 12.50, *ON, *BLANKS, *ALL'-'
+    ident    name or qualified name: AMOUNT, ORDER.TOTAL
+    binary   value is the operator (+, -, *, /, **, =, <>, <, <=, >, >=,
+             AND, OR; TO / DOWNTO / BY of a FOR), children [left, right]
+    unary    -, + or NOT, children [operand]
+    bif      %SUBST, %TRIM, ... (upper case), children are the arguments
+    call     name(args): a procedure call or an indexed array (*IN(31)
+             too); which one is only known from the symbol table
+    member   .subfield of an indexed data structure: ds(i).name, children
+             [ds(i)], then the subfield's own index, if any: ds(i).arr(j)
+
+Precedence, loosest first: TO/DOWNTO/BY, OR, AND, comparisons, + -, * /,
+** (right associative), then unary - + NOT, as in the ILE RPG reference.
+
+Generated code repeats the same expressions heavily, so trees are interned:
+equal text is parsed once, and equal subtrees are one shared node. Shared
+nodes carry no location (loc is None); the "expr" root carries the
+statement's. The tree is only built when the root's children are first
+read, so a parse whose expressions nobody walks pays for none of them.
+"""
+
+import re
+
+from rpg.ast_nodes import RpgExpr, SourceLocation
+
+# Operands. Typed literals (X'..', D'..', UX'..') before names; *ALL'x' before other special values.
+_OPERAND_RE = re.compile(r"""\s*(?:
+    (?P<string>(?:UX|[XDTZGC])?'(?:[^']|'')*')
+  | (?P<number>\d+(?:\.\d*)?(?:E[+-]?\d+)?|\.\d+)
+  | (?P<special>\*ALL(?:'(?:[^']|'')*')?|\*[A-Z][\w$#@]*)
+  | (?P<bif>%[A-Z][\w]*)
+  | (?P<unary>NOT\b|[-+])
+  | (?P<name>[A-Z_$#@][\w$#@]*)
+  | (?P<open>\()
+)""", re.I | re.X)
+_BINARY_RE = re.compile(r"\s*(\*\*|<>|<=|>=|[-+*/=<>]|(?:AND|OR|TO|DOWNTO|BY)\b)", re.I)
+_PUNCT_RE = re.compile(r"\s*([():.])")
+_NAME_RE = re.compile(r"[A-Z_$#@][\w$#@]*", re.I)
+
+_PRECEDENCE = {
+    "TO": 1, "DOWNTO": 1, "BY": 1,
+    "OR": 2,
+    "AND": 3,
+    "=": 4, "<>": 4, "<": 4, "<=": 4, ">": 4, ">=": 4,
+    "+": 5, "-": 5,
+    "*": 6, "/": 6,
+    "**": 7,
+}
+_RIGHT_ASSOCIATIVE = frozenset(("**",))
+
+
+class _ParseError(Exception):
+    pass
+
+
+class ExpressionInterner:
+    """Parse trees by expression text, and one shared node per distinct subtree."""
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self._trees: dict[str, RpgExpr | None] = {}  # text -> tree (None: does not parse)
+        self._nodes: dict[tuple, RpgExpr] = {}  # (kind, value, child ids...) -> node
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def clear(self) -> None:
+        self._trees.clear()
+        self._nodes.clear()
+
+    def tree(self, text: str) -> RpgExpr | None:
+        """Parse tree of text (shared), or None when it is not an expression."""
+        try:
+            tree = self._trees[text]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return tree
+        self.misses += 1
+        if len(self._nodes) > self.max_size:
+            self.clear()  # children are keyed by id, so nodes and trees go together
+        try:
+            parser = _Parser(text, self)
+            tree = parser.parse()
+        except (_ParseError, RecursionError):
+            tree = None
+        self._trees[text] = tree
+        return tree
+
+    def node(self, kind: str, value: str | None, children: tuple[RpgExpr, ...] = ()) -> RpgExpr:
+        """The shared node with this kind, value and (already shared) children."""
+        key = (kind, value, *map(id, children))
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = RpgExpr(loc=None, kind=kind, value=value, children=list(children))
+        return node
+
+
+_default_interner: ExpressionInterner | None = None
+
+
+def default_interner() -> ExpressionInterner:
+    """Process-wide interner shared by every caller that does not bring its own."""
+    global _default_interner
+    if _default_interner is None:
+        _default_interner = ExpressionInterner()
+    return _default_interner
+
+
+def set_default_interner(interner: ExpressionInterner) -> None:
+    """Install an interner as the process-wide default."""
+    global _default_interner
+    _default_interner = interner
+
+
+def parse_expression(text: str, loc: SourceLocation, interner: ExpressionInterner | None = None) -> RpgExpr:
+    """
+    The expression text at loc: kind "expr", value text, its parse tree as the
+    one child. The tree is built on first use (through the default interner)
+    unless an interner is given.
+    """
+    if interner is None:
+        return _DeferredExpr(loc, text)
+    expr = RpgExpr(loc=loc, kind="expr", value=text)
+    refresh_expression(expr, interner)
+    return expr
+
+
+def refresh_expression(expr: RpgExpr, interner: ExpressionInterner | None = None) -> None:
+    """Parse expr.value again after it changed (a condition extended by ANDxx / ORxx, ...)."""
+    tree = (interner or default_interner()).tree(expr.value.strip().rstrip(";"))
+    expr.children = [tree] if tree is not None else []
+
+
+class _DeferredExpr(RpgExpr):
+    """An "expr" root whose children (its parse tree) are built when first read."""
+
+    def __init__(self, loc: SourceLocation, value: str):
+        self.loc = loc
+        self.kind = "expr"
+        self.value = value
+        self._children: list[RpgExpr] | None = None
+
+    @property
+    def children(self) -> list[RpgExpr]:
+        if self._children is None:
+            tree = default_interner().tree(self.value.strip().rstrip(";"))
+            self._children = [tree] if tree is not None else []
+        return self._children
+
+    @children.setter
+    def children(self, children: list[RpgExpr]) -> None:
+        self._children = children
+
+
+class _Parser:
+    """One expression; every node is built through the interner."""
+
+    def __init__(self, text: str, interner: ExpressionInterner):
+        self.text = text
+        self.pos = 0
+        self.node = interner.node
+
+    def parse(self) -> RpgExpr:
+        tree = self._expression(1)
+        if self.text[self.pos:].strip():
+            raise _ParseError(self.pos)
+        return tree
+
+    def _expression(self, min_precedence: int) -> RpgExpr:
+        left = self._unary()
+        while True:
+            m = _BINARY_RE.match(self.text, self.pos)
+            if m is None:
+                return left
+            op = m.group(1).upper()
+            precedence = _PRECEDENCE[op]
+            if precedence < min_precedence:
+                return left
+            self.pos = m.end()
+            right = self._expression(precedence if op in _RIGHT_ASSOCIATIVE else precedence + 1)
+            left = self.node("binary", op, (left, right))
+
+    def _unary(self) -> RpgExpr:
+        m = _OPERAND_RE.match(self.text, self.pos)
+        if m is None:
+            raise _ParseError(self.pos)
+        self.pos = m.end()
+        kind = m.lastgroup
+        token = m.group(kind)
+        if kind == "unary":
+            return self.node("unary", token.upper(), (self._unary(),))
+        if kind == "open":
+            inner = self._expression(1)
+            self._expect(")")
+            return inner
+        if kind in ("string", "number"):
+            return self.node("literal", token)
+        if kind == "bif":
+            args = self._arguments() if self._peek("(") else ()
+            return self.node("bif", token.upper(), args)
+        if kind == "special":
+            if self._peek("("):  # *IN(31)
+                return self.node("call", token.upper(), self._arguments())
+            return self.node("literal", token)
+        return self._reference(token)
+
+    def _reference(self, name: str) -> RpgExpr:
+        """name[.name...] with optional (index) and .subfield after it."""
+        node = None
+        while True:
+            if self._peek("("):
+                node = self.node("call", name, self._arguments())
+            elif node is None:
+                node = self.node("ident", name)
+            if not self._peek("."):
+                return node
+            m = _NAME_RE.match(self.text, self.pos)
+            if m is None:
+                raise _ParseError(self.pos)
+            self.pos = m.end()
+            if node.kind == "ident":
+                name = f"{name}.{m.group()}"
+                node = None
+            else:
+                index = self._arguments() if self._peek("(") else ()
+                node = self.node("member", m.group(), (node, *index))
+
+    def _arguments(self) -> tuple[RpgExpr, ...]:
+        """(arg : arg ...) after the '(' consumed by _peek."""
+        if self._peek(")"):
+            return ()
+        args = [self._expression(1)]
+        while self._peek(":"):
+            args.append(self._expression(1))
+        self._expect(")")
+        return tuple(args)
+
+    def _peek(self, char: str) -> bool:
+        """Consume char if it is the next non-blank character."""
+        m = _PUNCT_RE.match(self.text, self.pos)
+        if m is None or m.group(1) != char:
+            return False
+        self.pos = m.end()
+        return True
+
+    def _expect(self, char: str) -> None:
+        if not self._peek(char):
+            raise _ParseError(self.pos)
@@ -0,0 +1,180 @@
+"""
+Column layouts of fixed-format RPG IV specifications.
+
+Each spec type (column 6) maps to (field name, 1-based from, to) entries as
+printed in the ILE RPG reference. They are compiled once into slice objects,
+so decoding a line is one dict lookup plus a slice per field.
+
+The statement builders below turn decoded C- and D-spec fields into AST
+nodes for both the line parser and the ANTLR builder (rpg.antlr_builder).
+"""
+
+from rpg.ast_nodes import RpgAssignStmt, RpgCallStmt, RpgExpr, RpgReturnStmt, SourceLocation
+from rpg.blocks import CONTROL_OPCODES
+from rpg.expressions import parse_expression
+from rpg.free_specs import split_assignment
+
+# (field, first column, last column), 1-based and inclusive.
+SPEC_LAYOUTS: dict[str, tuple[tuple[str, int, int], ...]] = {
+    "H": (
+        ("keywords", 7, 80),
+    ),
+    "F": (
+        ("name", 7, 16),
+        ("file_type", 17, 17),  # I, O, U, C
+        ("designation", 18, 18),  # P, S, R, T, F, blank (output)
+        ("end_of_file", 19, 19),
+        ("addition", 20, 20),  # A: records can be added
+        ("sequence", 21, 21),
+        ("format", 22, 22),  # F program-described, E externally described
+        ("record_length", 23, 27),
+        ("limits", 28, 28),
+        ("key_length", 29, 33),
+        ("record_address_type", 34, 34),  # K keyed, A/P/G/D/T/Z key types
+        ("organization", 35, 35),
+        ("device", 36, 42),  # DISK, WORKSTN, PRINTER, SEQ, SPECIAL
+        ("keywords", 44, 80),
+    ),
+    "D": (
+        ("name", 7, 21),
+        ("external", 22, 22),
+        ("ds_type", 23, 23),
+        ("decl_type", 24, 25),  # S, C, DS, PR, PI, blank (subfield / parameter)
+        ("from", 26, 32),
+        ("length", 33, 39),  # to-position or length
+        ("data_type", 40, 40),
+        ("decimals", 41, 42),
+        ("keywords", 44, 80),
+    ),
+    "I": (
+        ("name", 7, 16),  # file or record format (record lines)
+        ("sequence", 17, 18),
+        ("record_indicator", 21, 22),
+        ("data_type", 36, 36),
+        ("from", 37, 41),
+        ("to", 42, 46),
+        ("decimals", 47, 48),
+        ("field", 49, 62),  # field lines
+        ("control_level", 63, 64),
+        ("match_fields", 65, 66),
+        ("field_indicators", 69, 74),
+    ),
+    "C": (
+        ("control_level", 7, 8),
+        ("conditioning", 9, 11),  # N01, 99, ...
+        ("factor1", 12, 25),
+        ("opcode", 26, 35),  # opcode(extender)
+        ("factor2", 36, 49),
+        ("extended_factor2", 36, 80),  # EVAL, IF, CALLP, ... free-form expression
+        ("result", 50, 63),
+        ("length", 64, 68),
+        ("decimals", 69, 70),
+        ("hi", 71, 72),
+        ("lo", 73, 74),
+        ("eq", 75, 76),
+    ),
+    "O": (
+        ("name", 7, 16),  # file or record format (record lines)
+        ("type", 17, 17),  # H, D, T, E
+        ("fetch", 18, 20),
+        ("indicators", 21, 29),
+        ("field", 30, 43),  # field lines
+        ("blank_after", 45, 45),
+        ("end_position", 47, 51),
+        ("data_format", 52, 52),
+        ("constant", 53, 80),
+    ),
+    "P": (
+        ("name", 7, 21),
+        ("begin_end", 24, 24),  # B, E
+        ("keywords", 44, 80),
+    ),
+}
+
+_COMPILED: dict[str, tuple[tuple[str, slice], ...]] = {
+    spec: tuple((name, slice(first - 1, last)) for name, first, last in layout)
+    for spec, layout in SPEC_LAYOUTS.items()
+}
+
+
+def decode_spec(line: str) -> tuple[str, dict[str, str]] | None:
+    """
+    Decode one fixed-format line into (spec letter, {field: stripped text}).
+
+    Returns None for blank, short or comment lines (* or // in column 7) and
+    for spec letters without a layout.
+    """
+    if len(line) < 7:
+        return None
+    spec = line[5].upper()
+    layout = _COMPILED.get(spec)
+    if layout is None or line[6] == "*" or line[6:8] == "//":
+        return None
+    return spec, {name: line[s].strip() for name, s in layout}
+
+# C-spec opcodes built as assignments (MOVE, ADD, ...) or compare conditions (IFEQ, DOWLT, ...)
+_FIXED_MOVE_OPCODES = frozenset(("MOVE", "MOVEL", "Z-ADD", "Z-SUB"))
+_FIXED_COMPARE = {"EQ": "=", "NE": "<>", "LT": "<", "LE": "<=", "GT": ">", "GE": ">="}
+_FIXED_ARITH_OPCODES = {"ADD": "+", "SUB": "-", "MULT": "*", "DIV": "/"}
+
+
+def fixed_control(op: str, f: dict[str, str]) -> tuple[str, str] | None:
+    """
+    (opcode, condition) for a fixed-format block opcode. Compare forms (IFEQ,
+    DOWLT, WHENGE, ANDNE, ORGT, ...) become IF/DOW/WHEN/AND/OR with
+    "factor1 op factor2"; DO takes its iteration count from factor 2.
+    """
+    if op in CONTROL_OPCODES:
+        return op, f["factor2"] if op == "DO" else f["extended_factor2"]
+    for prefix in ("IF", "DOW", "DOU", "WHEN", "AND", "OR"):
+        compare = _FIXED_COMPARE.get(op[len(prefix):]) if op.startswith(prefix) else None
+        if compare:
+            return prefix, f"{f['factor1']} {compare} {f['factor2']}"
+    return None
+
+
+def default_fixed_type(decl: str, d_block: str, f: dict[str, str]) -> str | None:
+    """Data type implied by a D-spec without one: packed standalone, zoned subfield, else character."""
+    if decl == "DS":
+        return "DS"
+    if not f["length"]:
+        return None  # LIKE(...), CONST(...), ...
+    if f["decimals"]:
+        return "S" if d_block == "DS" and not decl else "P"
+    return "A"
+
+
+def parse_fixed_cspec(op: str, f: dict[str, str], filename: str, line: int) -> object | None:
+    """Build a statement from a decoded C-spec (op is the opcode without its extender)."""
+    loc = SourceLocation(filename, line, 6)
+    ext = f["extended_factor2"]
+    if op in ("EVAL", "EVALR", "EVAL-CORR"):
+        assignment = split_assignment(ext)
+        if assignment is not None:
+            target, operator, start = assignment
+            return RpgAssignStmt(
+                loc=loc,
+                target=RpgExpr(loc=loc, kind="ident", value=target),
+                expr=parse_expression(ext[start:].strip(), loc),
+                operator=operator,
+            )
+    if op in ("CALL", "CALLB"):
+        return RpgCallStmt(loc=loc, name=f["factor2"].strip("'"), params=[])
+    if op == "CALLP":
+        return RpgCallStmt(loc=loc, name=ext.split("(")[0].strip(), params=[])
+    if op in ("RETURN", "LEAVE"):
+        return RpgReturnStmt(loc=loc, value=parse_expression(ext, loc) if ext else None)
+    if op in _FIXED_MOVE_OPCODES and f["result"]:
+        return RpgAssignStmt(
+            loc=loc,
+            target=RpgExpr(loc=loc, kind="ident", value=f["result"]),
+            expr=parse_expression(f["factor2"], loc),
+        )
+    if op in _FIXED_ARITH_OPCODES and f["result"]:
+        left = f["factor1"] or f["result"]
+        return RpgAssignStmt(
+            loc=loc,
+            target=RpgExpr(loc=loc, kind="ident", value=f["result"]),
+            expr=parse_expression(f"{left} {_FIXED_ARITH_OPCODES[op]} {f['factor2']}", loc),
+        )
+    return None
@@ -0,0 +1,82 @@
+"""
+Free-format RPG statement pieces shared by the line parser (rpg.ast_builder)
+and the ANTLR builder (rpg.antlr_builder): the first-token match of a line,
+assignments, DCL-F declarations, record-level I/O operands and declaration
+keywords.
+"""
+
+import re
+
+from rpg.ast_nodes import RpgFileDecl, RpgFileOperation, SourceLocation
+
+INZ_RE = re.compile(r"\bINZ\((.*?)\)\s*(?:$|\w)", re.I)
+PASSING_RE = re.compile(r"\b(VALUE|CONST)\b", re.I)
+# First token of a free-format line: a comment / directive, or an opcode or
+# name (with an optional opcode extender, which is skipped).
+FREE_LINE_RE = re.compile(
+    r"[ \t]*(?:(?P<slash>//|/[A-Za-z-]*|\*\*\w*)|(?P<word>[A-Za-z_$#@*%][\w$#@-]*)(?:\([HMNREhmnre ]*\)(?=\s))?)"
+)
+DCL_F_RE = re.compile(r"dcl-f\s+([\w$#@]+)\s*(.*?);?\s*$", re.I | re.S)
+_FILE_DEVICE_RE = re.compile(r"\b(DISK|WORKSTN|PRINTER|SEQ|SPECIAL)\b\s*(\(\s*\d)?", re.I)
+_FILE_USAGE_RE = re.compile(r"\bUSAGE\(([^)]*)\)", re.I)
+# DCL-F usage when USAGE is not given
+_DEFAULT_FILE_USAGE = {"DISK": "*INPUT", "SEQ": "*INPUT", "SPECIAL": "*INPUT",
+                       "WORKSTN": "*INPUT:*OUTPUT", "PRINTER": "*OUTPUT"}
+
+# Record-level I/O opcodes: the file or record format is factor 2 (fixed) or an operand (free)
+FILE_OPCODES = frozenset((
+    "CHAIN", "CLOSE", "DELETE", "EXFMT", "FEOD", "OPEN", "READ", "READC", "READE", "READP", "READPE", "SETGT",
+    "SETLL", "UNLOCK", "UPDATE", "WRITE",
+))
+# ... whose first free-form operand is a search argument when there are two
+_KEYED_FILE_OPCODES = frozenset(("CHAIN", "DELETE", "READE", "READPE", "SETGT", "SETLL"))
+_OPERAND_RE = re.compile(r"(?:[^\s(;]|\([^)]*\))+")  # one operand; a key list (a:b) or %KDS(ds) stays whole
+# operators of compound assignments (x += y), ** before *
+_ASSIGN_OPERATORS = ("**", "+", "-", "*", "/")
+
+
+def expression_text(text: str, start: int) -> str:
+    """Statement text from start, on one line."""
+    rest = text[start:].strip()
+    return rest.replace("\n", " ") if "\n" in rest else rest
+
+
+def split_assignment(text: str, start: int = 0) -> tuple[str, str | None, int] | None:
+    """
+    (target, operator, start of the expression) of the assignment in text
+    from start: target = expr, or target op= expr with op one of + - * / **
+    (operator None for a plain =). None when there is no =.
+    """
+    eq = text.find("=", start)
+    if eq < 0:
+        return None
+    target = text[start:eq].strip()
+    for operator in _ASSIGN_OPERATORS:
+        if target.endswith(operator):
+            return target[:-len(operator)].rstrip(), operator, eq + 1
+    return target, None, eq + 1
+
+
+def free_file_operation(op: str, operands: str, loc: SourceLocation) -> RpgFileOperation | None:
+    """The file or record format of a free-form I/O opcode: READC SFL01, CHAIN (key) CUSTREC, WRITE FMT ds."""
+    names = _OPERAND_RE.findall(operands)
+    if op in _KEYED_FILE_OPCODES and len(names) >= 2:
+        return RpgFileOperation(loc=loc, opcode=op, name=names[1])
+    return RpgFileOperation(loc=loc, opcode=op, name=names[0]) if names else None
+
+
+def free_file_decl(m: re.Match, filename: str, line: int) -> RpgFileDecl:
+    """RpgFileDecl from a matched DCL-F statement (device defaults to DISK)."""
+    keywords = m.group(2).strip()
+    device = _FILE_DEVICE_RE.search(keywords)
+    device_name = device.group(1).upper() if device else "DISK"
+    usage = _FILE_USAGE_RE.search(keywords)
+    return RpgFileDecl(
+        loc=SourceLocation(filename, line, 0),
+        name=m.group(1),
+        usage=usage.group(1).replace(" ", "").upper() if usage else _DEFAULT_FILE_USAGE[device_name],
+        device=device_name,
+        externally_described=not (device and device.group(2)),
+        keyed=re.search(r"\bKEYED\b", keywords, re.I) is not None,
+        keywords=keywords or None,
+    )
@@ -0,0 +1,9278 @@
+# Generated from RpgLexer.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+def serializedATN():
+    return [
+        4,0,768,11492,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,
+        6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,
+        6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,
+        6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,6,-1,2,0,7,0,2,
+        1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,6,2,7,7,7,2,8,7,8,2,
+        9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,2,14,7,14,2,15,7,15,
+        2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,7,20,2,21,7,21,2,22,
+        7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,2,27,7,27,2,28,7,28,
+        2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,7,33,2,34,7,34,2,35,
+        7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,2,40,7,40,2,41,7,41,
+        2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,46,7,46,2,47,7,47,2,48,
+        7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,52,7,52,2,53,7,53,2,54,7,54,
+        2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,58,2,59,7,59,2,60,7,60,2,61,
+        7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,65,7,65,2,66,7,66,2,67,7,67,
+        2,68,7,68,2,69,7,69,2,70,7,70,2,71,7,71,2,72,7,72,2,73,7,73,2,74,
+        7,74,2,75,7,75,2,76,7,76,2,77,7,77,2,78,7,78,2,79,7,79,2,80,7,80,
+        2,81,7,81,2,82,7,82,2,83,7,83,2,84,7,84,2,85,7,85,2,86,7,86,2,87,
+        7,87,2,88,7,88,2,89,7,89,2,90,7,90,2,91,7,91,2,92,7,92,2,93,7,93,
+        2,94,7,94,2,95,7,95,2,96,7,96,2,97,7,97,2,98,7,98,2,99,7,99,2,100,
+        7,100,2,101,7,101,2,102,7,102,2,103,7,103,2,104,7,104,2,105,7,105,
+        2,106,7,106,2,107,7,107,2,108,7,108,2,109,7,109,2,110,7,110,2,111,
+        7,111,2,112,7,112,2,113,7,113,2,114,7,114,2,115,7,115,2,116,7,116,
+        2,117,7,117,2,118,7,118,2,119,7,119,2,120,7,120,2,121,7,121,2,122,
+        7,122,2,123,7,123,2,124,7,124,2,125,7,125,2,126,7,126,2,127,7,127,
+        2,128,7,128,2,129,7,129,2,130,7,130,2,131,7,131,2,132,7,132,2,133,
+        7,133,2,134,7,134,2,135,7,135,2,136,7,136,2,137,7,137,2,138,7,138,
+        2,139,7,139,2,140,7,140,2,141,7,141,2,142,7,142,2,143,7,143,2,144,
+        7,144,2,145,7,145,2,146,7,146,2,147,7,147,2,148,7,148,2,149,7,149,
+        2,150,7,150,2,151,7,151,2,152,7,152,2,153,7,153,2,154,7,154,2,155,
+        7,155,2,156,7,156,2,157,7,157,2,158,7,158,2,159,7,159,2,160,7,160,
+        2,161,7,161,2,162,7,162,2,163,7,163,2,164,7,164,2,165,7,165,2,166,
+        7,166,2,167,7,167,2,168,7,168,2,169,7,169,2,170,7,170,2,171,7,171,
+        2,172,7,172,2,173,7,173,2,174,7,174,2,175,7,175,2,176,7,176,2,177,
+        7,177,2,178,7,178,2,179,7,179,2,180,7,180,2,181,7,181,2,182,7,182,
+        2,183,7,183,2,184,7,184,2,185,7,185,2,186,7,186,2,187,7,187,2,188,
+        7,188,2,189,7,189,2,190,7,190,2,191,7,191,2,192,7,192,2,193,7,193,
+        2,194,7,194,2,195,7,195,2,196,7,196,2,197,7,197,2,198,7,198,2,199,
+        7,199,2,200,7,200,2,201,7,201,2,202,7,202,2,203,7,203,2,204,7,204,
+        2,205,7,205,2,206,7,206,2,207,7,207,2,208,7,208,2,209,7,209,2,210,
+        7,210,2,211,7,211,2,212,7,212,2,213,7,213,2,214,7,214,2,215,7,215,
+        2,216,7,216,2,217,7,217,2,218,7,218,2,219,7,219,2,220,7,220,2,221,
+        7,221,2,222,7,222,2,223,7,223,2,224,7,224,2,225,7,225,2,226,7,226,
+        2,227,7,227,2,228,7,228,2,229,7,229,2,230,7,230,2,231,7,231,2,232,
+        7,232,2,233,7,233,2,234,7,234,2,235,7,235,2,236,7,236,2,237,7,237,
+        2,238,7,238,2,239,7,239,2,240,7,240,2,241,7,241,2,242,7,242,2,243,
+        7,243,2,244,7,244,2,245,7,245,2,246,7,246,2,247,7,247,2,248,7,248,
+        2,249,7,249,2,250,7,250,2,251,7,251,2,252,7,252,2,253,7,253,2,254,
+        7,254,2,255,7,255,2,256,7,256,2,257,7,257,2,258,7,258,2,259,7,259,
+        2,260,7,260,2,261,7,261,2,262,7,262,2,263,7,263,2,264,7,264,2,265,
+        7,265,2,266,7,266,2,267,7,267,2,268,7,268,2,269,7,269,2,270,7,270,
+        2,271,7,271,2,272,7,272,2,273,7,273,2,274,7,274,2,275,7,275,2,276,
+        7,276,2,277,7,277,2,278,7,278,2,279,7,279,2,280,7,280,2,281,7,281,
+        2,282,7,282,2,283,7,283,2,284,7,284,2,285,7,285,2,286,7,286,2,287,
+        7,287,2,288,7,288,2,289,7,289,2,290,7,290,2,291,7,291,2,292,7,292,
+        2,293,7,293,2,294,7,294,2,295,7,295,2,296,7,296,2,297,7,297,2,298,
+        7,298,2,299,7,299,2,300,7,300,2,301,7,301,2,302,7,302,2,303,7,303,
+        2,304,7,304,2,305,7,305,2,306,7,306,2,307,7,307,2,308,7,308,2,309,
+        7,309,2,310,7,310,2,311,7,311,2,312,7,312,2,313,7,313,2,314,7,314,
+        2,315,7,315,2,316,7,316,2,317,7,317,2,318,7,318,2,319,7,319,2,320,
+        7,320,2,321,7,321,2,322,7,322,2,323,7,323,2,324,7,324,2,325,7,325,
+        2,326,7,326,2,327,7,327,2,328,7,328,2,329,7,329,2,330,7,330,2,331,
+        7,331,2,332,7,332,2,333,7,333,2,334,7,334,2,335,7,335,2,336,7,336,
+        2,337,7,337,2,338,7,338,2,339,7,339,2,340,7,340,2,341,7,341,2,342,
+        7,342,2,343,7,343,2,344,7,344,2,345,7,345,2,346,7,346,2,347,7,347,
+        2,348,7,348,2,349,7,349,2,350,7,350,2,351,7,351,2,352,7,352,2,353,
+        7,353,2,354,7,354,2,355,7,355,2,356,7,356,2,357,7,357,2,358,7,358,
+        2,359,7,359,2,360,7,360,2,361,7,361,2,362,7,362,2,363,7,363,2,364,
+        7,364,2,365,7,365,2,366,7,366,2,367,7,367,2,368,7,368,2,369,7,369,
+        2,370,7,370,2,371,7,371,2,372,7,372,2,373,7,373,2,374,7,374,2,375,
+        7,375,2,376,7,376,2,377,7,377,2,378,7,378,2,379,7,379,2,380,7,380,
+        2,381,7,381,2,382,7,382,2,383,7,383,2,384,7,384,2,385,7,385,2,386,
+        7,386,2,387,7,387,2,388,7,388,2,389,7,389,2,390,7,390,2,391,7,391,
+        2,392,7,392,2,393,7,393,2,394,7,394,2,395,7,395,2,396,7,396,2,397,
+        7,397,2,398,7,398,2,399,7,399,2,400,7,400,2,401,7,401,2,402,7,402,
+        2,403,7,403,2,404,7,404,2,405,7,405,2,406,7,406,2,407,7,407,2,408,
+        7,408,2,409,7,409,2,410,7,410,2,411,7,411,2,412,7,412,2,413,7,413,
+        2,414,7,414,2,415,7,415,2,416,7,416,2,417,7,417,2,418,7,418,2,419,
+        7,419,2,420,7,420,2,421,7,421,2,422,7,422,2,423,7,423,2,424,7,424,
+        2,425,7,425,2,426,7,426,2,427,7,427,2,428,7,428,2,429,7,429,2,430,
+        7,430,2,431,7,431,2,432,7,432,2,433,7,433,2,434,7,434,2,435,7,435,
+        2,436,7,436,2,437,7,437,2,438,7,438,2,439,7,439,2,440,7,440,2,441,
+        7,441,2,442,7,442,2,443,7,443,2,444,7,444,2,445,7,445,2,446,7,446,
+        2,447,7,447,2,448,7,448,2,449,7,449,2,450,7,450,2,451,7,451,2,452,
+        7,452,2,453,7,453,2,454,7,454,2,455,7,455,2,456,7,456,2,457,7,457,
+        2,458,7,458,2,459,7,459,2,460,7,460,2,461,7,461,2,462,7,462,2,463,
+        7,463,2,464,7,464,2,465,7,465,2,466,7,466,2,467,7,467,2,468,7,468,
+        2,469,7,469,2,470,7,470,2,471,7,471,2,472,7,472,2,473,7,473,2,474,
+        7,474,2,475,7,475,2,476,7,476,2,477,7,477,2,478,7,478,2,479,7,479,
+        2,480,7,480,2,481,7,481,2,482,7,482,2,483,7,483,2,484,7,484,2,485,
+        7,485,2,486,7,486,2,487,7,487,2,488,7,488,2,489,7,489,2,490,7,490,
+        2,491,7,491,2,492,7,492,2,493,7,493,2,494,7,494,2,495,7,495,2,496,
+        7,496,2,497,7,497,2,498,7,498,2,499,7,499,2,500,7,500,2,501,7,501,
+        2,502,7,502,2,503,7,503,2,504,7,504,2,505,7,505,2,506,7,506,2,507,
+        7,507,2,508,7,508,2,509,7,509,2,510,7,510,2,511,7,511,2,512,7,512,
+        2,513,7,513,2,514,7,514,2,515,7,515,2,516,7,516,2,517,7,517,2,518,
+        7,518,2,519,7,519,2,520,7,520,2,521,7,521,2,522,7,522,2,523,7,523,
+        2,524,7,524,2,525,7,525,2,526,7,526,2,527,7,527,2,528,7,528,2,529,
+        7,529,2,530,7,530,2,531,7,531,2,532,7,532,2,533,7,533,2,534,7,534,
+        2,535,7,535,2,536,7,536,2,537,7,537,2,538,7,538,2,539,7,539,2,540,
+        7,540,2,541,7,541,2,542,7,542,2,543,7,543,2,544,7,544,2,545,7,545,
+        2,546,7,546,2,547,7,547,2,548,7,548,2,549,7,549,2,550,7,550,2,551,
+        7,551,2,552,7,552,2,553,7,553,2,554,7,554,2,555,7,555,2,556,7,556,
+        2,557,7,557,2,558,7,558,2,559,7,559,2,560,7,560,2,561,7,561,2,562,
+        7,562,2,563,7,563,2,564,7,564,2,565,7,565,2,566,7,566,2,567,7,567,
+        2,568,7,568,2,569,7,569,2,570,7,570,2,571,7,571,2,572,7,572,2,573,
+        7,573,2,574,7,574,2,575,7,575,2,576,7,576,2,577,7,577,2,578,7,578,
+        2,579,7,579,2,580,7,580,2,581,7,581,2,582,7,582,2,583,7,583,2,584,
+        7,584,2,585,7,585,2,586,7,586,2,587,7,587,2,588,7,588,2,589,7,589,
+        2,590,7,590,2,591,7,591,2,592,7,592,2,593,7,593,2,594,7,594,2,595,
+        7,595,2,596,7,596,2,597,7,597,2,598,7,598,2,599,7,599,2,600,7,600,
+        2,601,7,601,2,602,7,602,2,603,7,603,2,604,7,604,2,605,7,605,2,606,
+        7,606,2,607,7,607,2,608,7,608,2,609,7,609,2,610,7,610,2,611,7,611,
+        2,612,7,612,2,613,7,613,2,614,7,614,2,615,7,615,2,616,7,616,2,617,
+        7,617,2,618,7,618,2,619,7,619,2,620,7,620,2,621,7,621,2,622,7,622,
+        2,623,7,623,2,624,7,624,2,625,7,625,2,626,7,626,2,627,7,627,2,628,
+        7,628,2,629,7,629,2,630,7,630,2,631,7,631,2,632,7,632,2,633,7,633,
+        2,634,7,634,2,635,7,635,2,636,7,636,2,637,7,637,2,638,7,638,2,639,
+        7,639,2,640,7,640,2,641,7,641,2,642,7,642,2,643,7,643,2,644,7,644,
+        2,645,7,645,2,646,7,646,2,647,7,647,2,648,7,648,2,649,7,649,2,650,
+        7,650,2,651,7,651,2,652,7,652,2,653,7,653,2,654,7,654,2,655,7,655,
+        2,656,7,656,2,657,7,657,2,658,7,658,2,659,7,659,2,660,7,660,2,661,
+        7,661,2,662,7,662,2,663,7,663,2,664,7,664,2,665,7,665,2,666,7,666,
+        2,667,7,667,2,668,7,668,2,669,7,669,2,670,7,670,2,671,7,671,2,672,
+        7,672,2,673,7,673,2,674,7,674,2,675,7,675,2,676,7,676,2,677,7,677,
+        2,678,7,678,2,679,7,679,2,680,7,680,2,681,7,681,2,682,7,682,2,683,
+        7,683,2,684,7,684,2,685,7,685,2,686,7,686,2,687,7,687,2,688,7,688,
+        2,689,7,689,2,690,7,690,2,691,7,691,2,692,7,692,2,693,7,693,2,694,
+        7,694,2,695,7,695,2,696,7,696,2,697,7,697,2,698,7,698,2,699,7,699,
+        2,700,7,700,2,701,7,701,2,702,7,702,2,703,7,703,2,704,7,704,2,705,
+        7,705,2,706,7,706,2,707,7,707,2,708,7,708,2,709,7,709,2,710,7,710,
+        2,711,7,711,2,712,7,712,2,713,7,713,2,714,7,714,2,715,7,715,2,716,
+        7,716,2,717,7,717,2,718,7,718,2,719,7,719,2,720,7,720,2,721,7,721,
+        2,722,7,722,2,723,7,723,2,724,7,724,2,725,7,725,2,726,7,726,2,727,
+        7,727,2,728,7,728,2,729,7,729,2,730,7,730,2,731,7,731,2,732,7,732,
+        2,733,7,733,2,734,7,734,2,735,7,735,2,736,7,736,2,737,7,737,2,738,
+        7,738,2,739,7,739,2,740,7,740,2,741,7,741,2,742,7,742,2,743,7,743,
+        2,744,7,744,2,745,7,745,2,746,7,746,2,747,7,747,2,748,7,748,2,749,
+        7,749,2,750,7,750,2,751,7,751,2,752,7,752,2,753,7,753,2,754,7,754,
+        2,755,7,755,2,756,7,756,2,757,7,757,2,758,7,758,2,759,7,759,2,760,
+        7,760,2,761,7,761,2,762,7,762,2,763,7,763,2,764,7,764,2,765,7,765,
+        2,766,7,766,2,767,7,767,2,768,7,768,2,769,7,769,2,770,7,770,2,771,
+        7,771,2,772,7,772,2,773,7,773,2,774,7,774,2,775,7,775,2,776,7,776,
+        2,777,7,777,2,778,7,778,2,779,7,779,2,780,7,780,2,781,7,781,2,782,
+        7,782,2,783,7,783,2,784,7,784,2,785,7,785,2,786,7,786,2,787,7,787,
+        2,788,7,788,2,789,7,789,2,790,7,790,2,791,7,791,2,792,7,792,2,793,
+        7,793,2,794,7,794,2,795,7,795,2,796,7,796,2,797,7,797,2,798,7,798,
+        2,799,7,799,2,800,7,800,2,801,7,801,2,802,7,802,2,803,7,803,2,804,
+        7,804,2,805,7,805,2,806,7,806,2,807,7,807,2,808,7,808,2,809,7,809,
+        2,810,7,810,2,811,7,811,2,812,7,812,2,813,7,813,2,814,7,814,2,815,
+        7,815,2,816,7,816,2,817,7,817,2,818,7,818,2,819,7,819,2,820,7,820,
+        2,821,7,821,2,822,7,822,2,823,7,823,2,824,7,824,2,825,7,825,2,826,
+        7,826,2,827,7,827,2,828,7,828,2,829,7,829,2,830,7,830,2,831,7,831,
+        2,832,7,832,2,833,7,833,2,834,7,834,2,835,7,835,2,836,7,836,2,837,
+        7,837,2,838,7,838,2,839,7,839,2,840,7,840,2,841,7,841,2,842,7,842,
+        2,843,7,843,2,844,7,844,2,845,7,845,2,846,7,846,2,847,7,847,2,848,
+        7,848,2,849,7,849,2,850,7,850,2,851,7,851,2,852,7,852,2,853,7,853,
+        2,854,7,854,2,855,7,855,2,856,7,856,2,857,7,857,2,858,7,858,2,859,
+        7,859,2,860,7,860,2,861,7,861,2,862,7,862,2,863,7,863,2,864,7,864,
+        2,865,7,865,2,866,7,866,2,867,7,867,2,868,7,868,2,869,7,869,2,870,
+        7,870,2,871,7,871,2,872,7,872,2,873,7,873,2,874,7,874,2,875,7,875,
+        2,876,7,876,2,877,7,877,2,878,7,878,2,879,7,879,2,880,7,880,2,881,
+        7,881,2,882,7,882,2,883,7,883,2,884,7,884,2,885,7,885,2,886,7,886,
+        2,887,7,887,2,888,7,888,2,889,7,889,2,890,7,890,2,891,7,891,2,892,
+        7,892,2,893,7,893,2,894,7,894,2,895,7,895,2,896,7,896,2,897,7,897,
+        2,898,7,898,2,899,7,899,2,900,7,900,2,901,7,901,2,902,7,902,2,903,
+        7,903,2,904,7,904,2,905,7,905,2,906,7,906,2,907,7,907,2,908,7,908,
+        2,909,7,909,2,910,7,910,2,911,7,911,2,912,7,912,2,913,7,913,2,914,
+        7,914,2,915,7,915,2,916,7,916,2,917,7,917,2,918,7,918,2,919,7,919,
+        2,920,7,920,2,921,7,921,2,922,7,922,2,923,7,923,2,924,7,924,2,925,
+        7,925,2,926,7,926,2,927,7,927,2,928,7,928,2,929,7,929,2,930,7,930,
+        2,931,7,931,2,932,7,932,2,933,7,933,2,934,7,934,2,935,7,935,2,936,
+        7,936,2,937,7,937,2,938,7,938,2,939,7,939,2,940,7,940,2,941,7,941,
+        2,942,7,942,2,943,7,943,2,944,7,944,2,945,7,945,2,946,7,946,2,947,
+        7,947,2,948,7,948,2,949,7,949,2,950,7,950,2,951,7,951,2,952,7,952,
+        2,953,7,953,2,954,7,954,2,955,7,955,2,956,7,956,2,957,7,957,2,958,
+        7,958,2,959,7,959,2,960,7,960,2,961,7,961,2,962,7,962,2,963,7,963,
+        2,964,7,964,2,965,7,965,2,966,7,966,2,967,7,967,2,968,7,968,2,969,
+        7,969,2,970,7,970,2,971,7,971,2,972,7,972,2,973,7,973,2,974,7,974,
+        2,975,7,975,2,976,7,976,2,977,7,977,2,978,7,978,2,979,7,979,2,980,
+        7,980,2,981,7,981,2,982,7,982,2,983,7,983,2,984,7,984,2,985,7,985,
+        2,986,7,986,2,987,7,987,2,988,7,988,2,989,7,989,2,990,7,990,2,991,
+        7,991,2,992,7,992,2,993,7,993,2,994,7,994,2,995,7,995,2,996,7,996,
+        2,997,7,997,2,998,7,998,2,999,7,999,2,1000,7,1000,2,1001,7,1001,
+        2,1002,7,1002,2,1003,7,1003,2,1004,7,1004,2,1005,7,1005,2,1006,7,
+        1006,2,1007,7,1007,2,1008,7,1008,2,1009,7,1009,2,1010,7,1010,2,1011,
+        7,1011,2,1012,7,1012,2,1013,7,1013,2,1014,7,1014,2,1015,7,1015,2,
+        1016,7,1016,2,1017,7,1017,2,1018,7,1018,2,1019,7,1019,2,1020,7,1020,
+        2,1021,7,1021,2,1022,7,1022,2,1023,7,1023,2,1024,7,1024,2,1025,7,
+        1025,2,1026,7,1026,2,1027,7,1027,2,1028,7,1028,2,1029,7,1029,2,1030,
+        7,1030,2,1031,7,1031,2,1032,7,1032,2,1033,7,1033,2,1034,7,1034,2,
+        1035,7,1035,2,1036,7,1036,2,1037,7,1037,2,1038,7,1038,2,1039,7,1039,
+        2,1040,7,1040,2,1041,7,1041,2,1042,7,1042,2,1043,7,1043,2,1044,7,
+        1044,2,1045,7,1045,2,1046,7,1046,2,1047,7,1047,2,1048,7,1048,2,1049,
+        7,1049,2,1050,7,1050,2,1051,7,1051,2,1052,7,1052,2,1053,7,1053,2,
+        1054,7,1054,2,1055,7,1055,2,1056,7,1056,2,1057,7,1057,2,1058,7,1058,
+        2,1059,7,1059,2,1060,7,1060,2,1061,7,1061,2,1062,7,1062,2,1063,7,
+        1063,2,1064,7,1064,2,1065,7,1065,2,1066,7,1066,2,1067,7,1067,2,1068,
+        7,1068,2,1069,7,1069,2,1070,7,1070,2,1071,7,1071,2,1072,7,1072,2,
+        1073,7,1073,2,1074,7,1074,2,1075,7,1075,2,1076,7,1076,2,1077,7,1077,
+        2,1078,7,1078,2,1079,7,1079,2,1080,7,1080,2,1081,7,1081,2,1082,7,
+        1082,2,1083,7,1083,2,1084,7,1084,2,1085,7,1085,2,1086,7,1086,2,1087,
+        7,1087,2,1088,7,1088,2,1089,7,1089,2,1090,7,1090,2,1091,7,1091,2,
+        1092,7,1092,2,1093,7,1093,2,1094,7,1094,2,1095,7,1095,2,1096,7,1096,
+        2,1097,7,1097,2,1098,7,1098,2,1099,7,1099,2,1100,7,1100,2,1101,7,
+        1101,2,1102,7,1102,2,1103,7,1103,2,1104,7,1104,2,1105,7,1105,2,1106,
+        7,1106,2,1107,7,1107,2,1108,7,1108,2,1109,7,1109,2,1110,7,1110,2,
+        1111,7,1111,2,1112,7,1112,2,1113,7,1113,2,1114,7,1114,2,1115,7,1115,
+        2,1116,7,1116,2,1117,7,1117,2,1118,7,1118,2,1119,7,1119,2,1120,7,
+        1120,2,1121,7,1121,2,1122,7,1122,2,1123,7,1123,2,1124,7,1124,2,1125,
+        7,1125,2,1126,7,1126,2,1127,7,1127,2,1128,7,1128,2,1129,7,1129,2,
+        1130,7,1130,2,1131,7,1131,2,1132,7,1132,2,1133,7,1133,2,1134,7,1134,
+        2,1135,7,1135,2,1136,7,1136,2,1137,7,1137,2,1138,7,1138,2,1139,7,
+        1139,2,1140,7,1140,2,1141,7,1141,2,1142,7,1142,2,1143,7,1143,2,1144,
+        7,1144,2,1145,7,1145,2,1146,7,1146,2,1147,7,1147,2,1148,7,1148,2,
+        1149,7,1149,2,1150,7,1150,2,1151,7,1151,2,1152,7,1152,2,1153,7,1153,
+        2,1154,7,1154,2,1155,7,1155,2,1156,7,1156,2,1157,7,1157,2,1158,7,
+        1158,2,1159,7,1159,2,1160,7,1160,2,1161,7,1161,2,1162,7,1162,2,1163,
+        7,1163,2,1164,7,1164,2,1165,7,1165,2,1166,7,1166,2,1167,7,1167,2,
+        1168,7,1168,2,1169,7,1169,2,1170,7,1170,2,1171,7,1171,2,1172,7,1172,
+        2,1173,7,1173,2,1174,7,1174,2,1175,7,1175,2,1176,7,1176,2,1177,7,
+        1177,2,1178,7,1178,2,1179,7,1179,2,1180,7,1180,2,1181,7,1181,2,1182,
+        7,1182,2,1183,7,1183,2,1184,7,1184,2,1185,7,1185,2,1186,7,1186,2,
+        1187,7,1187,2,1188,7,1188,2,1189,7,1189,2,1190,7,1190,2,1191,7,1191,
+        2,1192,7,1192,2,1193,7,1193,2,1194,7,1194,2,1195,7,1195,2,1196,7,
+        1196,2,1197,7,1197,2,1198,7,1198,2,1199,7,1199,2,1200,7,1200,2,1201,
+        7,1201,2,1202,7,1202,2,1203,7,1203,2,1204,7,1204,2,1205,7,1205,2,
+        1206,7,1206,2,1207,7,1207,2,1208,7,1208,2,1209,7,1209,2,1210,7,1210,
+        2,1211,7,1211,2,1212,7,1212,2,1213,7,1213,2,1214,7,1214,2,1215,7,
+        1215,2,1216,7,1216,2,1217,7,1217,2,1218,7,1218,2,1219,7,1219,2,1220,
+        7,1220,2,1221,7,1221,2,1222,7,1222,2,1223,7,1223,2,1224,7,1224,2,
+        1225,7,1225,2,1226,7,1226,2,1227,7,1227,2,1228,7,1228,2,1229,7,1229,
+        2,1230,7,1230,2,1231,7,1231,2,1232,7,1232,2,1233,7,1233,2,1234,7,
+        1234,2,1235,7,1235,2,1236,7,1236,2,1237,7,1237,2,1238,7,1238,2,1239,
+        7,1239,2,1240,7,1240,2,1241,7,1241,2,1242,7,1242,2,1243,7,1243,2,
+        1244,7,1244,2,1245,7,1245,2,1246,7,1246,2,1247,7,1247,2,1248,7,1248,
+        2,1249,7,1249,2,1250,7,1250,2,1251,7,1251,2,1252,7,1252,2,1253,7,
+        1253,2,1254,7,1254,2,1255,7,1255,2,1256,7,1256,2,1257,7,1257,2,1258,
+        7,1258,2,1259,7,1259,2,1260,7,1260,2,1261,7,1261,2,1262,7,1262,2,
+        1263,7,1263,2,1264,7,1264,2,1265,7,1265,2,1266,7,1266,2,1267,7,1267,
+        2,1268,7,1268,2,1269,7,1269,2,1270,7,1270,2,1271,7,1271,2,1272,7,
+        1272,2,1273,7,1273,2,1274,7,1274,2,1275,7,1275,2,1276,7,1276,2,1277,
+        7,1277,2,1278,7,1278,2,1279,7,1279,2,1280,7,1280,2,1281,7,1281,2,
+        1282,7,1282,2,1283,7,1283,2,1284,7,1284,2,1285,7,1285,2,1286,7,1286,
+        2,1287,7,1287,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,5,0,2632,8,0,10,0,
+        12,0,2635,9,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,5,4,2737,8,4,10,4,12,4,2740,9,4,1,
+        4,3,4,2743,8,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,
+        6,1,6,1,6,1,6,1,7,1,7,1,8,1,8,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,
+        10,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,
+        12,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,
+        15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,
+        17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,
+        19,1,20,1,20,1,20,1,20,1,20,1,21,1,21,5,21,2832,8,21,10,21,12,21,
+        2835,9,21,1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,22,
+        1,23,1,23,1,23,5,23,2851,8,23,10,23,12,23,2854,9,23,1,23,1,23,1,
+        23,1,23,1,23,1,24,1,24,5,24,2863,8,24,10,24,12,24,2866,9,24,1,24,
+        1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,5,25,2877,8,25,10,25,12,
+        25,2880,9,25,1,25,1,25,1,25,1,25,1,25,1,26,3,26,2888,8,26,1,26,1,
+        26,1,26,1,26,1,26,1,27,1,27,1,27,5,27,2898,8,27,10,27,12,27,2901,
+        9,27,1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,
+        1,28,1,28,1,29,4,29,2983,8,29,11,29,12,29,2984,1,29,1,29,1,30,1,
+        30,1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,
+        31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,
+        32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,
+        34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,
+        35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,
+        37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,39,1,
+        39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,41,1,41,1,41,1,41,1,
+        41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,
+        42,1,42,1,42,1,42,1,42,1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,
+        44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,
+        45,1,45,1,45,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,
+        47,1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,49,1,49,1,49,1,49,1,49,1,
+        49,1,50,1,50,1,50,1,50,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,
+        52,1,53,1,53,1,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,55,1,55,1,
+        55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,57,1,57,1,57,1,57,1,58,1,
+        58,1,58,1,58,1,58,1,58,1,58,1,58,1,59,1,59,1,59,1,59,1,60,1,60,1,
+        60,1,60,1,61,4,61,3214,8,61,11,61,12,61,3215,1,62,1,62,1,62,1,62,
+        1,63,1,63,1,64,1,64,1,64,1,64,1,65,1,65,1,65,1,65,1,66,1,66,1,66,
+        1,66,1,66,1,67,1,67,1,67,1,67,1,67,1,68,5,68,3243,8,68,10,68,12,
+        68,3246,9,68,1,68,1,68,1,68,1,68,1,68,1,68,1,69,1,69,1,69,1,69,1,
+        69,1,69,1,69,1,69,1,70,1,70,1,70,1,70,1,70,1,71,1,71,1,71,1,71,1,
+        71,1,71,1,71,1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,72,1,73,5,73,3283,
+        8,73,10,73,12,73,3286,9,73,1,73,1,73,1,73,1,74,4,74,3292,8,74,11,
+        74,12,74,3293,1,75,1,75,1,75,1,75,1,76,1,76,5,76,3302,8,76,10,76,
+        12,76,3305,9,76,1,76,1,76,1,77,1,77,1,77,1,77,1,77,1,77,1,77,1,78,
+        1,78,1,78,1,78,1,78,1,78,1,78,1,78,1,79,1,79,1,79,1,79,1,79,1,79,
+        1,79,1,79,1,79,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,81,
+        1,81,1,81,1,81,1,81,1,81,1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,82,
+        1,82,1,82,1,82,1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,83,
+        1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,85,1,85,
+        1,85,1,85,1,85,1,85,1,85,1,85,1,85,1,85,1,86,1,86,1,86,1,86,1,86,
+        1,86,1,86,1,87,1,87,1,87,1,87,1,87,1,87,1,87,1,88,1,88,1,88,1,88,
+        1,88,1,88,1,88,1,88,1,88,1,89,1,89,1,89,1,89,1,89,1,89,1,89,1,89,
+        1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,91,1,91,1,91,1,91,1,91,1,91,
+        1,91,1,91,1,91,1,91,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,92,1,93,
+        1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,94,1,94,1,94,1,94,1,94,
+        1,94,1,94,1,94,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,95,1,96,
+        1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,97,1,97,1,97,1,97,1,97,1,97,
+        1,97,1,97,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,98,1,99,1,99,1,99,
+        1,99,1,99,1,99,1,99,1,99,1,99,1,100,1,100,1,100,1,100,1,100,1,100,
+        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,101,1,101,1,101,1,101,
+        1,101,1,101,1,101,1,101,1,101,1,102,1,102,1,102,1,102,1,102,1,102,
+        1,102,1,102,1,102,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,104,
+        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,105,1,105,1,105,1,105,
+        1,105,1,105,1,105,1,106,1,106,1,106,1,106,1,106,1,106,1,106,1,106,
+        1,107,1,107,1,107,1,107,1,107,1,107,1,108,1,108,1,108,1,108,1,108,
+        1,108,1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,110,1,110,1,110,
+        1,110,1,110,1,110,1,110,1,110,1,111,1,111,1,111,1,111,1,111,1,111,
+        1,111,1,111,1,111,1,111,1,112,1,112,1,112,1,112,1,112,1,112,1,112,
+        1,112,1,112,1,112,1,113,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
+        1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,1,114,
+        1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,116,1,116,1,116,
+        1,116,1,116,1,116,1,116,1,116,1,117,1,117,1,117,1,117,1,117,1,117,
+        1,117,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,118,1,119,1,119,
+        1,119,1,119,1,119,1,119,1,119,1,119,1,120,1,120,1,120,1,120,1,120,
+        1,120,1,120,1,120,1,120,1,121,1,121,1,121,1,121,1,121,1,121,1,121,
+        1,121,1,121,1,122,1,122,1,122,1,122,1,122,1,122,1,122,1,122,1,122,
+        1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,124,
+        1,124,1,124,1,124,1,124,1,124,1,124,1,125,1,125,1,125,1,125,1,125,
+        1,125,1,125,1,125,1,125,1,126,1,126,1,126,1,126,1,126,1,126,1,126,
+        1,126,1,126,1,126,1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,127,
+        1,127,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,128,1,129,
+        1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,130,1,130,1,130,
+        1,130,1,130,1,130,1,130,1,130,1,130,1,131,1,131,1,131,1,131,1,131,
+        1,131,1,131,1,131,1,131,1,132,1,132,1,132,1,132,1,132,1,132,1,132,
+        1,132,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,
+        1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,135,
+        1,135,1,135,1,135,1,135,1,135,1,135,1,135,1,136,1,136,1,136,1,136,
+        1,136,1,136,1,136,1,136,1,136,1,137,1,137,1,137,1,137,1,137,1,137,
+        1,137,1,137,1,137,1,137,1,137,1,137,1,138,1,138,1,138,1,138,1,138,
+        1,138,1,138,1,138,1,138,1,138,1,138,1,139,1,139,1,139,1,139,1,139,
+        1,139,1,139,1,139,1,140,1,140,1,140,1,140,1,140,1,140,1,140,1,140,
+        1,140,1,141,1,141,1,141,1,141,1,141,1,141,1,141,1,141,1,141,1,142,
+        1,142,1,142,1,142,1,142,1,142,1,142,1,142,1,142,1,143,1,143,1,143,
+        1,143,1,143,1,143,1,143,1,143,1,143,1,144,1,144,1,144,1,144,1,144,
+        1,144,1,144,1,144,1,144,1,144,1,144,1,145,1,145,1,145,1,145,1,145,
+        1,145,1,145,1,145,1,145,1,145,1,145,1,146,1,146,1,146,1,146,1,146,
+        1,146,1,146,1,146,1,146,1,147,1,147,1,147,1,147,1,147,1,147,1,147,
+        1,147,1,147,1,148,1,148,1,148,1,148,1,148,1,148,1,148,1,148,1,148,
+        1,148,1,148,1,149,1,149,1,149,1,149,1,149,1,149,1,149,1,149,1,149,
+        1,149,1,149,1,150,1,150,1,150,1,150,1,150,1,150,1,150,1,150,1,151,
+        1,151,1,151,1,151,1,151,1,151,1,151,1,151,1,152,1,152,1,152,1,152,
+        1,152,1,152,1,152,1,152,1,152,1,152,1,153,1,153,1,153,1,153,1,153,
+        4,153,3984,8,153,11,153,12,153,3985,1,153,1,153,1,153,1,153,1,153,
+        1,153,1,154,1,154,1,154,1,154,1,154,1,155,1,155,1,155,1,155,1,155,
+        1,156,1,156,1,156,1,156,1,156,1,157,1,157,1,157,1,157,1,157,1,158,
+        1,158,1,158,1,158,1,158,1,159,1,159,1,159,1,159,1,159,1,160,1,160,
+        1,160,1,160,1,160,1,161,1,161,1,161,1,161,1,161,1,162,1,162,1,162,
+        1,162,1,162,1,163,1,163,1,163,1,163,1,163,1,164,1,164,1,164,1,164,
+        1,164,1,165,1,165,1,165,1,165,1,165,1,166,1,166,1,166,1,166,1,166,
+        1,167,1,167,1,167,1,167,1,167,1,168,1,168,1,168,1,168,1,168,1,169,
+        1,169,1,169,1,169,1,169,1,170,1,170,1,170,1,170,1,170,1,171,1,171,
+        1,171,1,171,1,171,1,172,1,172,1,172,1,172,1,172,1,173,1,173,1,173,
+        1,173,1,173,1,174,1,174,1,174,1,174,1,174,1,175,1,175,1,175,1,175,
+        1,175,1,176,1,176,1,176,1,176,1,176,1,177,1,177,1,177,1,177,1,177,
+        1,178,1,178,1,178,1,178,1,178,1,179,1,179,1,179,1,179,1,179,1,180,
+        1,180,1,180,1,180,1,180,1,181,1,181,1,181,1,181,1,181,1,182,1,182,
+        1,182,1,182,1,182,1,183,1,183,1,183,1,183,1,183,1,184,1,184,1,184,
+        1,184,1,184,1,185,1,185,1,185,1,185,1,185,1,186,1,186,1,186,1,186,
+        1,186,1,187,1,187,1,187,1,187,1,187,1,188,1,188,1,188,1,188,1,188,
+        1,189,1,189,1,189,1,189,1,189,1,190,1,190,1,190,1,190,1,190,1,191,
+        1,191,1,191,1,191,1,191,1,192,1,192,1,192,1,192,1,192,1,193,1,193,
+        1,193,1,193,1,193,1,194,1,194,1,194,1,194,1,194,1,195,1,195,1,195,
+        1,195,1,195,1,196,1,196,1,196,1,196,1,196,1,197,1,197,1,197,1,197,
+        1,197,1,198,1,198,1,198,1,198,1,198,1,199,1,199,1,199,1,199,1,199,
+        1,200,1,200,1,200,1,200,1,200,1,201,1,201,1,201,1,201,1,201,1,202,
+        1,202,1,202,1,202,1,202,1,203,1,203,1,203,1,203,1,203,1,204,1,204,
+        1,204,1,204,1,204,1,205,1,205,1,205,1,205,1,205,1,206,1,206,1,206,
+        1,206,1,206,1,207,1,207,1,207,1,207,1,207,1,208,1,208,1,208,1,208,
+        1,208,1,209,1,209,1,209,1,209,1,209,1,210,1,210,1,210,1,210,1,210,
+        1,211,1,211,1,211,1,211,1,211,1,212,1,212,1,212,1,212,1,212,1,213,
+        1,213,1,213,1,213,1,213,1,214,1,214,1,214,1,214,1,214,1,215,1,215,
+        1,215,1,215,1,215,1,216,1,216,1,216,1,216,1,216,1,217,1,217,1,217,
+        1,217,1,217,1,218,1,218,1,218,1,218,1,218,1,219,1,219,1,219,1,219,
+        1,219,1,220,1,220,1,220,1,220,1,220,1,221,1,221,1,221,1,221,1,221,
+        1,222,1,222,1,222,1,222,1,222,1,223,1,223,1,223,1,223,1,223,1,224,
+        1,224,1,224,1,224,1,224,1,225,1,225,1,225,1,225,1,225,1,226,1,226,
+        1,226,1,226,1,226,1,227,1,227,1,227,1,227,1,227,1,228,1,228,1,228,
+        1,228,1,228,1,229,1,229,1,229,1,229,1,229,1,230,1,230,1,230,1,230,
+        1,230,1,231,1,231,1,231,1,231,1,231,1,232,1,232,1,232,1,232,1,232,
+        1,233,1,233,1,233,1,233,1,233,1,234,1,234,1,234,1,234,1,234,1,235,
+        1,235,1,235,1,235,1,235,1,236,1,236,1,236,1,236,1,236,1,237,1,237,
+        1,237,1,237,1,237,1,238,5,238,4415,8,238,10,238,12,238,4418,9,238,
+        1,238,1,238,5,238,4422,8,238,10,238,12,238,4425,9,238,1,238,1,238,
+        1,238,1,239,1,239,1,239,1,239,1,239,1,239,1,239,1,239,1,240,1,240,
+        1,240,1,240,1,240,1,241,1,241,1,241,1,241,1,241,1,242,1,242,1,242,
+        1,242,1,242,5,242,4453,8,242,10,242,12,242,4456,9,242,1,242,1,242,
+        1,242,4,242,4461,8,242,11,242,12,242,4462,1,242,1,242,1,242,1,242,
+        1,243,1,243,1,243,5,243,4472,8,243,10,243,12,243,4475,9,243,1,243,
+        1,243,1,244,1,244,1,244,1,244,1,244,1,245,1,245,1,245,1,245,1,245,
+        1,245,1,246,1,246,1,246,1,246,1,246,1,246,1,246,1,247,1,247,1,247,
+        1,247,1,247,1,247,1,247,1,247,1,248,1,248,1,248,1,248,1,248,1,248,
+        1,248,1,248,1,249,1,249,1,249,1,249,1,249,1,249,1,249,1,250,1,250,
+        1,250,1,250,1,250,1,250,1,250,1,250,1,251,1,251,1,251,1,251,1,251,
+        1,251,1,252,1,252,1,252,1,252,1,252,1,252,1,252,1,253,1,253,1,253,
+        1,253,1,253,1,253,1,253,1,253,1,254,1,254,1,254,1,254,1,254,1,254,
+        1,255,1,255,1,255,1,255,1,255,1,255,1,256,1,256,1,256,1,256,1,256,
+        1,257,1,257,1,257,1,257,1,257,1,257,1,258,1,258,1,258,1,258,1,258,
+        1,258,1,258,1,258,1,259,1,259,1,259,1,259,1,259,1,259,1,260,1,260,
+        1,260,1,260,1,260,1,261,1,261,1,261,1,261,1,261,1,261,1,261,1,262,
+        1,262,1,262,1,262,1,262,1,262,1,262,1,262,1,262,1,263,1,263,1,263,
+        1,263,1,263,1,263,1,263,1,264,1,264,1,264,1,264,1,264,1,264,1,265,
+        1,265,1,265,1,265,1,265,1,266,1,266,1,266,1,266,1,266,1,266,1,266,
+        1,267,1,267,1,267,1,267,1,267,1,267,1,267,1,268,1,268,1,268,1,268,
+        1,268,1,268,1,268,1,268,1,269,1,269,1,269,1,269,1,269,1,269,1,269,
+        1,270,1,270,1,270,1,270,1,270,1,270,1,270,1,271,1,271,1,271,1,271,
+        1,271,1,271,1,271,1,272,1,272,1,272,1,272,1,272,1,272,1,272,1,272,
+        1,272,1,273,1,273,1,273,1,273,1,273,1,273,1,273,1,274,1,274,1,274,
+        1,274,1,274,1,275,1,275,1,275,1,275,1,275,1,275,1,276,1,276,1,276,
+        1,276,1,276,1,277,1,277,1,277,1,277,1,277,1,278,1,278,1,278,1,278,
+        1,278,1,278,1,278,1,278,1,279,1,279,1,279,1,279,1,279,1,279,1,279,
+        1,279,1,279,1,279,1,280,1,280,1,280,1,280,1,280,1,280,1,280,1,280,
+        1,280,1,280,1,281,1,281,1,281,1,281,1,281,1,281,1,281,1,281,1,281,
+        1,281,1,282,1,282,1,282,1,282,1,282,1,282,1,282,1,282,1,282,1,282,
+        1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,283,1,284,1,284,
+        1,284,1,284,1,284,1,284,1,284,1,284,1,285,1,285,1,285,1,285,1,285,
+        1,285,1,285,1,285,1,285,1,285,1,286,1,286,1,286,1,286,1,286,1,286,
+        1,286,1,286,1,287,1,287,1,287,1,287,1,287,1,287,1,288,1,288,1,288,
+        1,288,1,288,1,288,1,289,1,289,1,289,1,289,1,289,1,289,1,289,1,290,
+        1,290,1,290,1,290,1,290,1,290,1,290,1,291,1,291,1,291,1,291,1,291,
+        1,291,1,291,1,291,1,291,1,292,1,292,1,292,1,292,1,292,1,292,1,292,
+        1,292,1,292,1,293,1,293,1,293,1,293,1,293,1,294,1,294,1,294,1,294,
+        1,294,1,294,1,294,1,294,1,294,1,295,1,295,1,295,1,295,1,295,1,295,
+        1,296,1,296,1,296,1,296,1,296,1,296,1,296,1,296,1,296,1,297,1,297,
+        1,297,1,297,1,297,1,297,1,297,1,297,1,298,1,298,1,298,1,298,1,298,
+        1,298,1,298,1,299,1,299,1,299,1,299,1,299,1,299,1,300,1,300,1,300,
+        1,300,1,300,1,300,1,301,1,301,1,301,1,301,1,301,1,301,1,301,1,301,
+        1,302,1,302,1,302,1,302,1,302,1,303,1,303,1,303,1,303,1,303,1,303,
+        1,303,1,303,1,304,1,304,1,304,1,304,1,304,1,304,1,304,1,305,1,305,
+        1,305,1,305,1,305,1,305,1,305,1,306,1,306,1,306,1,306,1,306,1,306,
+        1,307,1,307,1,307,1,307,1,307,1,307,1,308,1,308,1,308,1,308,1,308,
+        1,308,1,308,1,308,1,308,1,308,1,308,1,309,1,309,1,309,1,309,1,309,
+        1,309,1,309,1,309,1,309,1,310,1,310,1,310,1,310,1,310,1,310,1,310,
+        1,310,1,310,1,310,1,310,1,311,1,311,1,311,1,311,1,311,1,311,1,311,
+        1,311,1,311,1,311,1,311,1,312,1,312,1,312,1,312,1,312,1,312,1,312,
+        1,312,1,312,1,312,1,312,1,313,1,313,1,313,1,313,1,313,1,313,1,313,
+        1,313,1,313,1,313,1,313,1,314,1,314,1,314,1,314,1,314,1,314,1,315,
+        1,315,1,315,1,315,1,315,1,315,1,315,1,316,1,316,1,316,1,316,1,316,
+        1,316,1,316,1,317,1,317,1,317,1,317,1,317,1,317,1,318,1,318,1,318,
+        1,318,1,318,1,319,1,319,1,319,1,319,1,319,1,319,1,320,1,320,1,320,
+        1,320,1,320,1,320,1,320,1,321,1,321,1,321,1,321,1,321,1,321,1,321,
+        1,322,1,322,1,322,1,322,1,322,1,323,1,323,1,323,1,323,1,323,1,323,
+        1,323,1,324,1,324,1,324,1,324,1,324,1,325,1,325,1,325,1,325,1,325,
+        1,325,1,326,1,326,1,326,1,326,1,326,1,327,1,327,1,327,1,327,1,328,
+        1,328,1,328,1,328,1,328,1,328,1,328,1,328,1,329,1,329,1,329,1,329,
+        1,329,1,329,1,329,1,329,1,330,1,330,1,330,1,330,1,330,1,330,1,330,
+        1,330,1,330,1,330,1,330,1,331,1,331,1,331,1,331,1,331,1,331,1,331,
+        1,331,1,331,1,331,1,331,1,332,1,332,1,332,1,332,1,332,1,332,1,332,
+        1,332,1,333,1,333,1,333,1,333,1,333,1,333,1,334,1,334,1,334,1,334,
+        1,334,1,334,1,335,1,335,1,335,1,335,1,335,1,335,1,335,1,335,1,335,
+        1,335,1,335,1,336,1,336,1,336,1,336,1,336,1,336,1,337,1,337,1,337,
+        1,337,1,337,1,337,1,337,1,337,1,337,1,337,1,337,1,337,1,337,3,337,
+        5170,8,337,1,338,1,338,1,338,1,338,1,338,1,338,1,338,1,339,1,339,
+        1,339,1,339,1,339,1,339,3,339,5185,8,339,1,340,1,340,1,340,1,340,
+        1,340,1,340,3,340,5193,8,340,1,341,1,341,1,341,1,341,1,341,1,341,
+        3,341,5201,8,341,1,342,1,342,1,342,1,342,1,342,3,342,5208,8,342,
+        1,343,1,343,1,343,1,343,1,343,3,343,5215,8,343,1,344,1,344,1,344,
+        1,344,1,344,1,345,1,345,1,345,1,345,1,345,3,345,5227,8,345,1,346,
+        1,346,1,346,1,346,1,346,3,346,5234,8,346,1,347,1,347,1,347,1,347,
+        1,347,1,347,1,348,1,348,1,348,1,348,1,348,3,348,5247,8,348,1,349,
+        1,349,1,349,1,349,1,349,3,349,5254,8,349,1,350,1,350,1,350,1,350,
+        1,350,3,350,5261,8,350,1,351,1,351,1,351,1,351,1,351,3,351,5268,
+        8,351,1,352,1,352,1,352,1,352,1,352,1,352,1,353,1,353,1,353,1,353,
+        1,353,1,354,1,354,1,354,1,354,1,354,1,354,1,355,1,355,1,355,1,355,
+        1,355,1,355,1,356,1,356,1,356,1,356,1,356,1,356,1,356,1,356,1,357,
+        1,357,1,357,1,357,1,357,1,358,1,358,1,358,1,358,1,358,1,358,1,358,
+        1,359,1,359,1,359,1,359,1,359,1,359,1,359,1,359,1,360,1,360,1,360,
+        1,360,1,360,1,360,1,360,1,360,1,361,1,361,1,361,1,361,1,361,1,362,
+        1,362,1,362,1,362,1,362,1,362,1,363,1,363,1,363,1,363,1,363,1,363,
+        1,363,1,364,1,364,1,364,1,364,1,364,1,364,1,364,1,365,1,365,1,365,
+        1,365,1,365,1,365,1,366,1,366,1,366,1,366,1,366,1,366,1,366,1,366,
+        1,366,1,366,1,366,1,366,3,366,5372,8,366,1,367,1,367,1,367,1,367,
+        1,367,1,367,1,367,1,368,1,368,1,368,1,368,1,369,1,369,1,369,1,369,
+        1,369,1,369,1,369,1,370,1,370,1,370,1,370,1,370,1,370,1,370,1,370,
+        1,371,1,371,1,371,1,371,1,371,1,371,1,371,1,371,1,372,1,372,1,372,
+        1,372,1,372,1,373,1,373,1,373,1,373,1,373,1,374,1,374,1,374,1,374,
+        1,374,1,374,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,
+        1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,377,1,377,1,377,1,377,
+        1,377,1,378,1,378,1,378,1,378,1,378,1,378,1,378,1,379,1,379,1,379,
+        1,379,1,379,1,379,1,380,1,380,1,380,1,380,1,380,1,380,1,380,1,381,
+        1,381,1,381,1,381,1,381,1,381,1,381,1,382,1,382,1,382,1,382,1,382,
+        1,382,1,383,1,383,1,383,1,383,1,383,1,384,1,384,1,384,1,384,1,385,
+        1,385,1,385,1,385,1,385,1,385,1,386,1,386,1,386,1,386,1,386,1,387,
+        1,387,1,387,1,387,1,387,1,388,1,388,1,388,1,388,1,388,1,388,1,388,
+        1,389,1,389,1,389,1,389,1,389,1,389,1,390,1,390,1,390,1,390,1,390,
+        1,390,1,390,1,390,1,390,1,391,1,391,1,391,1,391,1,391,1,391,1,391,
+        1,392,1,392,1,392,1,392,1,392,1,393,1,393,1,393,1,393,1,393,1,393,
+        1,394,1,394,1,394,1,394,1,394,1,394,1,395,1,395,1,395,1,395,1,395,
+        1,395,1,396,1,396,1,396,1,396,1,396,1,396,1,397,1,397,1,397,1,397,
+        1,397,1,398,1,398,1,398,1,398,1,398,1,398,1,399,1,399,1,399,1,399,
+        1,399,1,399,1,399,1,399,1,399,1,399,1,399,3,399,5583,8,399,1,400,
+        1,400,1,400,1,400,1,400,3,400,5590,8,400,1,401,1,401,1,401,1,401,
+        1,401,1,401,1,402,1,402,1,402,1,402,1,402,1,402,1,403,1,403,1,403,
+        1,403,1,403,1,403,1,404,1,404,1,404,1,404,1,404,1,404,1,404,1,404,
+        1,405,1,405,1,405,1,405,1,405,1,405,1,405,1,405,1,406,1,406,1,406,
+        1,406,1,406,1,407,1,407,1,407,1,407,1,407,1,407,1,408,1,408,1,408,
+        1,408,1,408,1,408,1,408,1,408,1,408,1,409,1,409,1,409,1,409,1,409,
+        1,409,1,409,1,409,1,409,1,410,1,410,1,410,1,410,1,410,1,410,1,410,
+        1,410,1,411,1,411,1,411,1,411,1,411,1,411,1,411,1,411,1,411,1,411,
+        1,411,1,411,1,411,1,412,1,412,1,412,1,412,1,412,1,412,1,412,1,412,
+        1,413,1,413,1,413,1,413,1,413,1,413,1,413,1,413,1,413,1,414,1,414,
+        1,414,1,414,1,414,1,414,1,414,1,414,1,415,1,415,1,415,1,415,1,415,
+        1,415,1,416,1,416,1,416,1,416,1,416,1,416,1,416,1,416,1,417,1,417,
+        1,417,1,417,1,417,1,417,1,418,1,418,1,418,1,418,1,418,1,418,1,419,
+        1,419,1,419,1,419,1,419,1,419,1,419,1,420,1,420,1,420,1,420,1,420,
+        1,420,1,420,1,421,1,421,1,421,1,421,1,421,1,421,1,422,1,422,1,422,
+        1,422,1,422,1,422,1,423,1,423,1,423,1,423,1,423,1,424,1,424,1,424,
+        1,424,1,424,1,425,1,425,1,425,1,425,1,425,3,425,5768,8,425,1,426,
+        1,426,1,426,1,426,1,426,1,427,1,427,1,427,1,427,1,427,1,427,1,427,
+        1,427,1,428,1,428,1,428,1,428,1,428,1,429,1,429,1,429,1,429,1,429,
+        1,430,1,430,1,430,1,430,1,430,1,430,1,430,1,430,1,431,1,431,1,431,
+        1,431,1,431,1,431,1,432,1,432,1,432,1,432,1,432,1,432,1,432,1,432,
+        1,432,1,433,1,433,1,433,1,433,1,434,1,434,1,434,1,434,1,434,1,434,
+        1,434,1,435,1,435,1,435,1,435,1,435,1,435,1,436,1,436,1,436,1,436,
+        1,436,1,436,1,436,1,437,1,437,1,437,1,437,1,438,1,438,1,438,1,438,
+        1,439,1,439,1,439,1,439,1,439,1,439,1,440,1,440,1,440,1,440,1,440,
+        1,441,1,441,1,441,1,441,1,441,1,441,1,441,1,441,1,441,1,441,1,442,
+        1,442,1,442,1,442,1,442,1,442,1,442,1,442,1,443,1,443,1,443,1,443,
+        1,443,1,443,1,443,1,444,1,444,1,444,1,444,1,444,1,444,1,445,1,445,
+        1,445,1,445,1,445,1,445,1,446,1,446,1,446,1,446,1,447,1,447,1,447,
+        1,447,1,447,1,447,1,447,1,448,1,448,1,448,1,448,1,448,1,448,1,448,
+        1,449,1,449,1,449,1,449,1,449,1,449,1,450,1,450,1,450,1,450,1,450,
+        1,450,1,451,1,451,1,451,1,451,1,451,1,451,1,452,1,452,1,452,1,452,
+        1,452,1,452,1,453,1,453,1,453,1,453,1,453,1,453,1,453,1,454,1,454,
+        1,454,1,454,1,454,1,454,1,454,1,455,1,455,1,455,1,455,1,455,1,455,
+        1,455,1,455,1,456,1,456,1,456,1,456,1,457,1,457,1,457,1,457,1,457,
+        1,457,1,457,1,458,1,458,1,458,1,458,1,458,1,458,1,458,1,459,1,459,
+        1,459,1,459,1,460,1,460,1,460,1,460,1,460,1,460,1,460,1,461,1,461,
+        1,461,1,461,1,461,1,461,1,461,1,462,1,462,1,462,1,462,1,462,1,462,
+        1,462,1,462,1,463,1,463,1,463,1,463,1,463,1,463,1,463,1,464,1,464,
+        1,464,1,464,1,464,1,464,1,464,1,464,1,465,1,465,1,465,1,465,1,465,
+        1,465,1,465,1,465,1,465,1,466,1,466,1,466,1,466,1,466,1,466,1,466,
+        1,467,1,467,1,467,1,467,1,468,1,468,1,468,1,468,1,469,1,469,1,469,
+        1,469,1,469,1,469,1,469,1,470,1,470,1,470,1,470,1,470,1,471,1,471,
+        1,471,1,471,1,471,1,471,1,471,1,471,1,471,1,472,1,472,1,472,1,472,
+        1,472,1,472,1,472,1,472,1,473,1,473,1,473,1,473,1,473,1,473,1,474,
+        1,474,1,474,1,474,1,474,1,474,1,474,1,475,1,475,1,475,1,475,1,475,
+        1,475,1,475,1,476,1,476,1,476,1,476,1,476,1,476,1,476,1,476,1,477,
+        1,477,1,477,1,477,1,477,1,477,1,477,1,477,1,478,1,478,1,478,1,478,
+        1,478,1,478,1,478,1,478,1,478,1,479,1,479,1,479,1,479,1,479,1,479,
+        1,479,1,480,1,480,1,480,1,480,1,480,1,480,1,480,1,481,1,481,1,481,
+        1,481,1,482,1,482,1,482,1,482,1,482,1,482,1,482,1,482,1,483,1,483,
+        1,483,1,483,1,483,1,483,1,483,1,483,1,483,1,483,1,484,1,484,1,484,
+        1,484,1,484,1,484,1,484,1,484,1,485,1,485,1,485,1,485,1,485,1,485,
+        1,485,1,486,1,486,1,486,1,486,1,486,1,486,1,486,1,486,1,486,1,487,
+        1,487,1,487,1,487,1,487,1,487,1,487,1,488,1,488,1,488,1,488,1,488,
+        1,488,1,488,1,489,1,489,1,489,1,489,1,489,1,489,1,490,1,490,1,490,
+        1,490,1,490,1,490,1,490,1,490,1,491,1,491,1,491,1,491,1,491,1,491,
+        1,492,1,492,1,492,1,492,1,492,1,492,1,492,1,493,1,493,1,493,1,493,
+        1,493,1,493,1,494,1,494,1,494,1,494,1,494,1,494,1,494,1,494,1,495,
+        1,495,1,495,1,495,1,495,1,495,1,495,1,495,1,496,1,496,1,496,1,496,
+        1,496,1,496,1,496,1,497,1,497,1,497,1,497,1,497,1,497,1,497,1,498,
+        1,498,1,498,1,498,1,498,1,498,1,498,1,498,1,499,1,499,1,499,1,499,
+        1,499,1,499,1,499,1,499,1,500,1,500,1,500,1,500,1,500,1,500,1,500,
+        1,501,1,501,1,501,1,501,1,501,1,501,1,501,1,501,1,502,1,502,1,502,
+        1,502,1,502,1,502,1,503,1,503,1,503,1,503,1,503,1,503,1,504,1,504,
+        1,504,1,504,1,504,1,504,1,505,1,505,1,505,1,505,1,505,1,505,1,505,
+        1,506,1,506,1,506,1,506,1,506,1,506,1,506,1,507,1,507,1,507,1,507,
+        1,507,1,507,1,507,1,508,1,508,1,508,1,508,1,508,1,509,1,509,1,509,
+        1,509,1,509,1,509,1,509,1,509,1,510,1,510,1,510,1,510,1,510,1,510,
+        1,511,1,511,1,511,1,511,1,511,1,511,1,511,1,512,1,512,1,512,1,512,
+        1,512,1,512,1,512,1,512,1,513,1,513,1,513,1,513,1,513,1,513,1,514,
+        1,514,1,514,1,514,1,514,1,514,1,514,1,515,1,515,1,515,1,515,1,515,
+        1,515,1,515,1,516,1,516,1,516,1,516,1,516,1,516,1,516,1,516,1,517,
+        1,517,1,517,1,517,1,517,1,517,1,518,1,518,1,518,1,518,1,519,1,519,
+        1,519,1,519,1,519,1,519,1,519,1,519,1,519,1,520,1,520,1,520,1,520,
+        1,520,1,520,1,520,1,521,1,521,1,521,1,521,1,521,1,522,1,522,1,522,
+        1,522,1,522,1,522,1,522,1,522,1,523,1,523,1,523,1,523,1,523,1,523,
+        1,523,1,523,1,524,1,524,1,524,1,524,1,524,1,524,1,524,1,524,1,525,
+        1,525,1,525,1,525,1,525,1,525,1,526,1,526,1,526,1,526,1,526,1,526,
+        1,527,1,527,1,527,1,527,1,527,1,528,1,528,1,529,1,529,1,529,1,529,
+        1,530,1,530,1,530,1,531,1,531,1,531,1,531,1,532,1,532,1,533,1,533,
+        1,534,1,534,1,534,1,535,1,535,1,535,1,536,1,536,1,536,1,537,1,537,
+        1,537,1,538,1,538,1,539,1,539,1,539,1,540,1,540,1,540,1,541,1,541,
+        1,541,1,542,1,542,1,542,1,543,1,543,1,543,1,543,1,544,1,544,1,545,
+        1,545,1,546,1,546,1,546,1,547,1,547,1,547,1,548,1,548,1,548,1,549,
+        1,549,1,550,1,550,1,551,1,551,1,552,1,552,1,552,1,552,1,552,1,552,
+        1,553,4,553,6531,8,553,11,553,12,553,6532,1,553,1,553,5,553,6537,
+        8,553,10,553,12,553,6540,9,553,3,553,6542,8,553,1,553,1,553,4,553,
+        6546,8,553,11,553,12,553,6547,3,553,6550,8,553,1,554,1,554,1,555,
+        1,555,1,555,1,555,1,556,1,556,1,556,1,557,1,557,1,557,1,558,1,558,
+        1,558,1,558,1,558,1,558,1,558,1,559,1,559,1,559,1,559,1,560,1,560,
+        1,560,1,560,1,560,1,561,1,561,1,561,1,561,1,561,1,562,1,562,1,562,
+        1,562,1,562,1,563,1,563,1,563,1,563,1,563,1,564,1,564,1,564,1,564,
+        1,564,1,565,1,565,1,565,1,565,1,565,1,566,1,566,1,566,1,566,1,567,
+        1,567,1,567,1,567,1,567,1,567,1,567,3,567,6616,8,567,1,567,1,567,
+        1,567,1,567,1,567,1,567,1,567,1,567,1,567,1,567,1,567,1,567,5,567,
+        6630,8,567,10,567,12,567,6633,9,567,3,567,6635,8,567,1,568,5,568,
+        6638,8,568,10,568,12,568,6641,9,568,1,568,1,568,1,568,1,568,1,568,
+        1,568,1,568,1,568,1,569,1,569,1,569,5,569,6654,8,569,10,569,12,569,
+        6657,9,569,1,569,1,569,1,570,1,570,1,570,1,570,1,570,1,570,5,570,
+        6667,8,570,10,570,12,570,6670,9,570,1,570,1,570,1,570,1,570,1,571,
+        1,571,1,571,1,571,1,571,1,571,5,571,6682,8,571,10,571,12,571,6685,
+        9,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,
+        1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,
+        1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,1,571,
+        1,571,1,571,1,571,1,571,1,571,1,572,1,572,1,572,1,572,1,572,1,572,
+        5,572,6730,8,572,10,572,12,572,6733,9,572,1,572,1,572,1,572,1,572,
+        1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,
+        1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,
+        1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,1,572,
+        1,573,1,573,1,573,1,573,1,573,1,573,5,573,6778,8,573,10,573,12,573,
+        6781,9,573,1,573,1,573,1,573,1,573,1,573,5,573,6788,8,573,10,573,
+        12,573,6791,9,573,1,573,1,573,5,573,6795,8,573,10,573,12,573,6798,
+        9,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,
+        1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,
+        1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,1,573,
+        1,573,1,573,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,
+        1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,
+        1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,
+        1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,1,574,
+        1,574,1,574,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,
+        1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,
+        1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,
+        1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,1,575,
+        1,575,1,575,1,576,1,576,1,576,1,576,1,576,1,576,1,576,1,576,1,576,
+        1,576,1,577,1,577,1,577,1,577,1,577,1,578,1,578,1,578,1,578,1,578,
+        1,578,1,579,1,579,1,579,1,579,1,579,1,579,1,580,1,580,1,580,1,580,
+        1,580,1,580,1,580,1,580,1,581,1,581,1,581,1,581,1,581,1,581,1,581,
+        1,582,1,582,1,582,1,582,1,582,1,582,1,582,1,583,1,583,1,583,1,583,
+        1,583,1,583,1,583,1,584,1,584,1,584,1,584,1,584,1,585,4,585,6984,
+        8,585,11,585,12,585,6985,1,585,1,585,1,586,1,586,1,586,1,586,1,586,
+        1,587,1,587,1,587,1,587,1,587,1,588,1,588,1,588,1,588,1,588,1,588,
+        1,588,1,588,1,588,1,589,1,589,1,589,1,589,1,589,1,590,1,590,1,590,
+        1,590,1,590,1,591,1,591,1,591,1,591,1,591,1,591,1,591,1,591,1,591,
+        1,591,1,591,1,592,1,592,1,592,1,592,1,592,1,593,1,593,1,593,1,593,
+        1,593,1,593,1,594,1,594,1,594,1,594,1,594,1,594,1,595,1,595,1,595,
+        1,595,1,595,1,595,1,595,1,595,1,595,1,595,1,595,1,595,1,596,1,596,
+        1,596,1,596,1,596,1,597,1,597,1,597,1,597,1,597,1,597,1,597,1,597,
+        1,597,1,597,1,597,1,598,1,598,1,598,1,598,1,598,1,599,1,599,1,599,
+        1,599,1,599,1,600,1,600,1,600,1,600,1,600,1,601,1,601,1,601,1,601,
+        1,601,1,602,1,602,1,602,1,602,1,602,1,603,1,603,1,603,1,603,1,603,
+        1,604,1,604,1,604,1,604,1,604,1,605,1,605,1,605,1,605,1,605,1,606,
+        1,606,1,606,1,606,1,606,1,607,1,607,1,607,1,607,1,607,1,608,1,608,
+        1,608,1,608,1,608,1,609,1,609,1,609,1,609,1,609,1,610,1,610,1,610,
+        1,610,1,610,1,611,1,611,1,611,1,611,1,611,1,612,1,612,1,612,1,612,
+        1,612,1,613,1,613,1,613,1,613,1,613,1,614,1,614,1,614,1,614,1,614,
+        1,615,1,615,1,615,1,615,1,615,1,616,1,616,1,616,1,616,1,616,1,617,
+        1,617,1,617,1,617,1,617,1,618,5,618,7176,8,618,10,618,12,618,7179,
+        9,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,
+        1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,
+        1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,1,618,
+        1,618,1,618,1,618,5,618,7216,8,618,10,618,12,618,7219,9,618,1,618,
+        1,618,1,619,1,619,1,619,1,619,1,620,1,620,1,620,1,620,1,620,1,621,
+        1,621,1,621,1,621,1,622,1,622,1,622,1,622,1,622,1,623,1,623,1,623,
+        1,623,1,623,1,623,1,624,1,624,1,624,1,624,1,624,1,624,1,625,1,625,
+        1,625,1,625,1,625,1,625,1,626,1,626,1,626,1,626,1,626,1,626,1,627,
+        1,627,1,627,1,627,1,627,1,627,1,628,1,628,1,628,1,628,1,628,1,628,
+        1,629,1,629,1,629,1,629,1,629,1,629,1,630,1,630,1,630,1,630,1,630,
+        1,630,1,631,1,631,1,631,1,631,1,631,1,631,1,631,1,632,1,632,1,632,
+        1,632,1,632,1,632,1,633,1,633,1,633,1,633,1,633,1,633,1,634,1,634,
+        1,634,1,634,1,634,1,634,1,635,1,635,1,635,1,635,1,635,1,635,1,636,
+        1,636,1,636,1,636,1,636,1,636,1,637,1,637,1,637,1,637,1,637,1,637,
+        1,638,1,638,1,638,1,638,1,638,1,638,1,639,1,639,1,639,1,639,1,639,
+        1,639,1,640,1,640,1,640,1,640,1,640,1,641,1,641,1,641,1,642,1,642,
+        1,642,1,642,1,642,1,642,1,643,1,643,1,643,1,643,1,643,1,643,1,644,
+        1,644,1,644,1,644,1,644,1,644,1,645,1,645,1,645,1,645,1,645,1,645,
+        1,646,1,646,1,646,1,646,1,646,1,646,1,647,1,647,1,647,1,647,1,647,
+        1,647,1,648,1,648,1,648,1,648,1,649,1,649,1,649,1,649,1,650,1,650,
+        1,650,1,650,1,650,1,650,1,651,1,651,1,651,1,651,1,651,1,651,1,651,
+        1,652,1,652,1,652,1,652,1,652,1,653,1,653,1,653,1,653,1,653,1,653,
+        1,653,1,654,1,654,1,654,1,654,1,655,1,655,1,655,1,656,1,656,1,656,
+        1,656,1,656,1,656,1,657,1,657,1,657,1,657,1,657,1,657,1,658,1,658,
+        1,658,1,658,1,658,1,658,1,659,1,659,1,659,1,659,1,659,1,659,1,660,
+        1,660,1,660,1,660,1,660,1,660,1,661,1,661,1,661,1,661,1,661,1,661,
+        1,662,1,662,1,662,1,662,1,662,1,662,1,663,1,663,1,663,1,663,1,663,
+        1,663,1,664,1,664,1,664,1,664,1,664,1,664,1,665,1,665,1,665,1,665,
+        1,665,1,665,1,666,1,666,1,666,1,666,1,666,1,666,1,667,1,667,1,667,
+        1,667,1,667,1,667,1,668,1,668,1,668,1,668,1,669,1,669,1,669,1,669,
+        1,669,1,669,1,670,1,670,1,670,1,670,1,670,1,670,1,670,1,671,1,671,
+        1,671,1,671,1,671,1,672,1,672,1,672,1,672,1,672,1,673,1,673,1,673,
+        1,673,1,673,1,674,1,674,1,674,1,674,1,674,1,675,1,675,1,675,1,675,
+        1,675,1,676,1,676,1,676,1,676,1,676,1,677,1,677,1,677,1,677,1,677,
+        1,678,1,678,1,678,1,678,1,678,1,679,1,679,1,679,1,679,1,679,1,679,
+        1,680,1,680,1,680,1,680,1,680,1,680,1,680,1,681,1,681,1,681,1,681,
+        1,681,1,681,1,682,1,682,1,682,1,682,1,682,1,682,1,683,1,683,1,683,
+        1,683,1,683,1,683,1,684,1,684,1,684,1,684,1,684,1,684,1,685,1,685,
+        1,685,1,685,1,685,1,686,1,686,1,686,1,686,1,686,1,686,1,687,1,687,
+        1,687,1,687,1,687,1,687,1,688,1,688,1,688,1,688,1,688,1,689,1,689,
+        1,689,1,689,1,690,1,690,1,690,1,690,1,690,1,690,1,691,1,691,1,691,
+        1,691,1,691,1,692,1,692,1,692,1,692,1,692,1,693,1,693,1,693,1,693,
+        1,693,1,694,1,694,1,694,1,694,1,694,1,695,1,695,1,695,1,695,1,695,
+        1,696,1,696,1,696,1,696,1,696,1,697,1,697,1,697,1,697,1,697,1,698,
+        1,698,1,698,1,698,1,698,1,698,1,699,1,699,1,699,1,699,1,699,1,699,
+        1,699,1,699,1,700,1,700,1,700,1,700,1,700,1,701,1,701,1,701,1,701,
+        1,701,1,701,1,701,1,702,1,702,1,702,1,702,1,702,1,702,1,703,1,703,
+        1,703,1,703,1,703,1,703,1,704,1,704,1,704,1,704,1,704,1,705,1,705,
+        1,705,1,705,1,706,1,706,1,706,1,706,1,706,1,706,1,706,1,707,1,707,
+        1,707,1,707,1,707,1,707,1,708,1,708,1,708,1,708,1,709,1,709,1,709,
+        1,709,1,709,1,709,1,710,1,710,1,710,1,710,1,710,1,710,1,711,1,711,
+        1,711,1,711,1,711,1,711,1,712,1,712,1,712,1,712,1,712,1,713,1,713,
+        1,713,1,713,1,713,1,713,1,713,1,714,1,714,1,714,1,714,1,714,1,714,
+        1,714,1,715,1,715,1,715,1,715,1,715,1,715,1,715,1,716,1,716,1,716,
+        1,716,1,716,1,716,1,716,1,717,1,717,1,717,1,717,1,717,1,717,1,717,
+        1,718,1,718,1,718,1,718,1,718,1,718,1,718,1,719,1,719,1,719,1,719,
+        1,719,1,719,1,720,1,720,1,720,1,720,1,720,1,720,1,721,1,721,1,721,
+        1,721,1,721,1,721,1,722,1,722,1,722,1,722,1,722,1,722,1,723,4,723,
+        7815,8,723,11,723,12,723,7816,1,723,1,723,1,724,1,724,1,724,1,724,
+        1,724,1,724,1,724,1,725,1,725,1,725,1,725,1,725,1,726,1,726,1,726,
+        5,726,7836,8,726,10,726,12,726,7839,9,726,1,726,4,726,7842,8,726,
+        11,726,12,726,7843,1,727,1,727,1,727,1,727,1,728,1,728,1,728,1,728,
+        1,729,1,729,5,729,7856,8,729,10,729,12,729,7859,9,729,1,729,1,729,
+        1,729,1,729,1,729,1,729,1,729,1,729,1,730,1,730,5,730,7871,8,730,
+        10,730,12,730,7874,9,730,1,730,1,730,1,730,1,730,1,730,1,730,1,730,
+        1,731,1,731,1,731,5,731,7886,8,731,10,731,12,731,7889,9,731,1,731,
+        1,731,1,731,1,731,1,731,1,731,5,731,7897,8,731,10,731,12,731,7900,
+        9,731,1,731,1,731,1,732,1,732,1,732,5,732,7907,8,732,10,732,12,732,
+        7910,9,732,1,732,1,732,1,732,1,732,1,732,1,732,1,732,1,733,1,733,
+        1,734,4,734,7922,8,734,11,734,12,734,7923,1,734,1,734,1,735,1,735,
+        1,735,1,735,1,735,1,736,1,736,1,736,1,736,1,736,1,737,1,737,1,737,
+        1,737,5,737,7942,8,737,10,737,12,737,7945,9,737,1,737,1,737,1,737,
+        1,737,1,738,1,738,1,738,1,738,1,738,5,738,7956,8,738,10,738,12,738,
+        7959,9,738,1,738,1,738,1,738,1,738,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,3,739,7972,8,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,1,739,
+        3,739,8090,8,739,1,739,5,739,8093,8,739,10,739,12,739,8096,9,739,
+        1,739,1,739,3,739,8100,8,739,1,739,1,739,1,740,1,740,1,740,1,740,
+        1,740,1,741,1,741,4,741,8111,8,741,11,741,12,741,8112,1,741,1,741,
+        1,742,1,742,1,742,1,742,1,742,1,742,1,743,1,743,1,743,1,743,1,743,
+        1,743,1,744,1,744,1,744,1,744,1,744,1,745,4,745,8135,8,745,11,745,
+        12,745,8136,1,745,1,745,1,746,4,746,8142,8,746,11,746,12,746,8143,
+        1,746,1,746,1,746,1,746,1,747,1,747,1,747,1,747,1,747,1,748,4,748,
+        8156,8,748,11,748,12,748,8157,1,748,1,748,1,749,5,749,8163,8,749,
+        10,749,12,749,8166,9,749,1,749,1,749,1,750,1,750,1,750,1,750,1,750,
+        1,750,1,751,1,751,1,751,1,751,3,751,8180,8,751,1,751,1,751,1,751,
+        1,751,1,751,1,751,1,752,4,752,8189,8,752,11,752,12,752,8190,1,752,
+        1,752,1,753,1,753,1,753,1,753,1,753,1,754,1,754,4,754,8202,8,754,
+        11,754,12,754,8203,1,754,3,754,8207,8,754,1,755,1,755,1,755,1,755,
+        1,755,1,755,1,756,5,756,8216,8,756,10,756,12,756,8219,9,756,1,756,
+        4,756,8222,8,756,11,756,12,756,8223,1,756,1,756,1,756,1,756,1,756,
+        1,757,1,757,1,757,1,757,1,758,1,758,1,758,1,758,1,758,1,758,1,758,
+        1,759,1,759,1,759,1,760,1,760,1,760,1,761,1,761,1,761,1,761,1,761,
+        1,761,1,761,1,761,1,761,1,761,1,761,1,761,1,761,1,761,1,761,1,761,
+        1,761,1,761,1,761,1,761,1,761,1,761,1,761,1,761,1,762,1,762,1,762,
+        1,762,5,762,8276,8,762,10,762,12,762,8279,9,762,1,763,1,763,1,763,
+        5,763,8284,8,763,10,763,12,763,8287,9,763,1,763,1,763,1,763,1,763,
+        1,764,1,764,1,764,1,764,1,764,1,765,1,765,1,765,1,765,1,765,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,1,766,
+        1,767,1,767,5,767,8383,8,767,10,767,12,767,8386,9,767,1,767,4,767,
+        8389,8,767,11,767,12,767,8390,1,767,1,767,1,767,1,767,1,767,1,768,
+        1,768,1,768,1,768,1,769,1,769,1,769,1,769,1,769,1,769,1,770,1,770,
+        1,770,1,771,1,771,1,771,1,772,1,772,1,772,1,772,1,773,1,773,1,773,
+        1,773,1,774,1,774,1,774,1,774,1,775,1,775,1,775,1,775,1,776,1,776,
+        1,776,1,776,1,777,1,777,1,777,1,777,1,778,1,778,1,778,1,778,1,779,
+        1,779,1,779,1,779,1,779,1,780,1,780,1,780,1,780,1,780,1,781,1,781,
+        1,781,1,782,1,782,1,782,1,782,1,783,1,783,1,783,1,783,1,783,1,784,
+        1,784,1,784,5,784,8467,8,784,10,784,12,784,8470,9,784,1,784,1,784,
+        1,785,1,785,1,785,5,785,8477,8,785,10,785,12,785,8480,9,785,1,785,
+        1,785,1,786,1,786,1,786,1,786,1,787,1,787,1,787,1,787,1,788,1,788,
+        1,788,1,788,1,789,1,789,1,789,1,789,1,789,1,789,1,790,1,790,1,790,
+        1,790,1,790,1,790,1,791,1,791,1,791,1,791,1,792,1,792,1,792,5,792,
+        8515,8,792,10,792,12,792,8518,9,792,1,792,1,792,1,793,1,793,1,793,
+        1,793,1,794,1,794,1,794,1,794,1,794,1,795,1,795,1,795,1,795,1,795,
+        1,795,1,796,1,796,1,796,1,796,1,796,1,796,1,797,1,797,1,797,1,797,
+        1,798,1,798,1,798,1,798,1,799,1,799,1,799,1,799,1,800,1,800,1,800,
+        1,801,1,801,1,801,1,802,1,802,1,802,1,803,1,803,1,803,1,804,1,804,
+        1,804,1,805,1,805,1,805,1,806,1,806,1,806,1,807,1,807,1,807,1,808,
+        1,808,1,808,1,808,1,808,1,808,1,808,1,809,1,809,1,809,1,810,1,810,
+        1,810,1,811,1,811,1,811,1,811,1,811,1,812,1,812,1,812,1,812,1,812,
+        1,813,1,813,1,813,5,813,8605,8,813,10,813,12,813,8608,9,813,1,813,
+        1,813,1,814,1,814,1,814,1,814,1,814,1,815,1,815,1,815,1,815,1,816,
+        1,816,1,816,1,816,1,817,1,817,1,817,1,817,1,817,1,817,1,817,1,817,
+        1,817,1,817,1,817,1,817,1,817,1,817,1,817,1,817,3,817,8641,8,817,
+        1,817,1,817,1,817,1,817,1,817,1,817,1,817,1,818,1,818,1,818,1,818,
+        1,818,1,818,1,818,1,818,1,818,1,818,1,818,1,818,1,818,1,818,1,818,
+        1,818,1,818,1,818,1,818,1,818,1,818,1,818,1,819,1,819,1,819,1,820,
+        1,820,1,820,1,820,1,820,1,820,3,820,8681,8,820,1,820,1,820,1,820,
+        1,820,1,820,1,820,1,820,1,821,3,821,8691,8,821,1,821,1,821,1,821,
+        1,821,1,821,1,821,1,821,1,821,1,821,1,822,1,822,1,822,1,822,1,823,
+        1,823,1,823,1,823,1,823,1,824,1,824,1,824,1,824,1,824,1,824,1,824,
+        1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,
+        1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,1,824,
+        1,824,1,824,1,824,1,825,1,825,1,825,1,825,1,826,1,826,1,826,5,826,
+        8750,8,826,10,826,12,826,8753,9,826,1,826,1,826,1,826,1,827,1,827,
+        1,827,1,827,1,827,1,828,1,828,1,828,1,828,1,828,1,828,1,829,1,829,
+        1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,
+        1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,
+        1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,
+        1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,1,829,
+        1,829,1,830,1,830,1,830,1,830,1,830,1,830,1,830,1,830,1,831,1,831,
+        1,831,1,832,1,832,1,832,1,833,1,833,1,833,1,833,1,833,1,834,1,834,
+        1,834,1,835,1,835,1,835,1,835,1,835,1,836,1,836,1,836,1,836,1,837,
+        1,837,1,837,1,837,1,837,1,838,1,838,1,838,1,838,1,838,1,839,1,839,
+        1,839,1,839,1,839,1,840,1,840,1,840,1,840,1,840,1,841,1,841,1,841,
+        1,841,1,841,1,842,1,842,1,842,1,842,1,842,1,843,1,843,1,843,1,843,
+        1,843,1,844,1,844,1,844,1,844,1,844,1,845,1,845,1,845,1,845,1,845,
+        1,846,1,846,1,846,1,846,1,846,1,847,1,847,1,847,1,847,1,847,1,848,
+        1,848,1,848,1,848,1,848,1,849,1,849,1,849,1,849,1,849,1,850,1,850,
+        1,850,1,850,1,850,1,851,1,851,1,851,1,851,1,851,1,852,1,852,1,852,
+        1,852,1,852,1,853,1,853,1,853,1,853,1,853,1,854,1,854,1,854,1,854,
+        1,854,1,855,1,855,1,855,1,855,1,855,1,856,1,856,1,856,1,856,1,856,
+        1,857,1,857,1,857,1,857,1,857,1,858,1,858,1,858,1,858,1,858,1,859,
+        1,859,1,859,1,859,1,859,1,860,1,860,1,860,1,860,1,860,1,861,1,861,
+        1,861,1,861,1,861,1,862,1,862,1,862,1,862,1,862,1,863,1,863,1,863,
+        1,863,1,863,1,864,1,864,1,864,1,864,1,864,1,865,1,865,1,865,1,865,
+        1,865,1,866,1,866,1,866,1,866,1,866,1,867,1,867,1,867,1,867,1,867,
+        1,868,1,868,1,868,1,868,1,868,1,869,1,869,1,869,1,869,1,869,1,870,
+        1,870,1,870,1,870,1,870,1,871,1,871,1,871,1,871,1,871,1,872,1,872,
+        1,872,1,872,1,872,1,873,1,873,1,873,1,873,1,873,1,874,1,874,1,874,
+        1,874,1,874,1,875,1,875,1,875,1,875,1,875,1,876,1,876,1,876,1,876,
+        1,876,1,877,1,877,1,877,1,877,1,877,1,878,1,878,1,878,1,878,1,878,
+        1,879,1,879,1,879,1,879,1,879,1,880,1,880,1,880,1,880,1,880,1,881,
+        1,881,1,881,1,881,1,881,1,882,1,882,1,882,1,882,1,882,1,883,1,883,
+        1,883,1,883,1,883,1,884,1,884,1,884,1,884,1,884,1,885,1,885,1,885,
+        1,885,1,885,1,886,1,886,1,886,1,886,1,886,1,887,1,887,1,887,1,887,
+        1,887,1,888,1,888,1,888,1,888,1,888,1,889,1,889,1,889,1,889,1,889,
+        1,890,1,890,1,890,1,890,1,890,1,891,1,891,1,891,1,891,1,891,1,892,
+        1,892,1,892,1,892,1,892,1,893,1,893,1,893,1,893,1,893,1,894,1,894,
+        1,894,1,894,1,894,1,895,1,895,1,895,1,895,1,895,1,896,1,896,1,896,
+        1,896,1,896,1,897,1,897,1,897,1,897,1,897,1,898,1,898,1,898,1,898,
+        1,898,1,899,1,899,1,899,1,899,1,899,1,900,1,900,1,900,1,900,1,900,
+        1,901,1,901,1,901,1,901,1,901,1,902,1,902,1,902,1,902,1,902,1,903,
+        1,903,1,903,1,903,1,903,1,904,1,904,1,904,1,904,1,904,1,905,1,905,
+        1,905,1,905,1,905,1,906,1,906,1,906,1,906,1,906,1,907,1,907,1,907,
+        1,907,1,907,1,908,1,908,1,908,1,908,1,908,1,909,1,909,1,909,1,909,
+        1,909,1,910,1,910,1,910,1,910,1,910,1,911,1,911,1,911,1,911,1,911,
+        1,912,1,912,1,912,1,912,1,912,1,913,1,913,1,913,1,913,1,913,1,914,
+        1,914,1,914,1,914,1,914,1,915,1,915,1,915,1,915,1,915,1,916,1,916,
+        1,916,1,916,1,916,1,917,1,917,1,917,1,917,1,917,1,918,1,918,1,918,
+        1,918,1,918,1,919,1,919,1,919,1,919,1,919,1,920,1,920,1,920,1,920,
+        1,920,1,921,1,921,1,921,1,921,1,921,1,922,1,922,1,922,1,922,1,922,
+        1,923,1,923,1,923,1,923,1,923,1,924,1,924,1,924,1,924,1,924,1,925,
+        1,925,1,925,1,925,1,925,1,926,1,926,1,926,1,926,1,926,1,927,1,927,
+        1,927,1,927,1,927,1,928,1,928,1,928,1,928,1,928,1,929,1,929,1,929,
+        1,929,1,929,1,930,1,930,1,930,1,930,1,930,1,931,1,931,1,931,1,931,
+        1,931,1,932,1,932,1,932,1,932,1,932,1,933,1,933,1,933,1,933,1,933,
+        1,934,1,934,1,934,1,934,1,934,1,935,1,935,1,935,1,935,1,935,1,936,
+        1,936,1,936,1,936,1,936,1,937,1,937,1,937,1,937,1,937,1,938,1,938,
+        1,938,1,938,1,938,1,939,1,939,1,939,1,939,1,939,1,940,1,940,1,940,
+        1,940,1,940,1,941,1,941,1,941,1,941,1,941,1,942,1,942,1,942,1,942,
+        1,942,1,943,1,943,1,943,1,943,1,943,1,944,1,944,1,944,1,944,1,944,
+        1,945,1,945,1,945,1,945,1,945,1,946,1,946,1,946,1,946,1,946,1,947,
+        1,947,1,947,1,947,1,947,1,948,1,948,1,948,1,948,1,948,1,949,1,949,
+        1,949,1,949,1,949,1,950,1,950,1,950,1,950,1,950,1,951,1,951,1,951,
+        1,951,1,951,1,952,1,952,1,952,1,952,1,952,1,953,1,953,1,953,1,953,
+        1,953,1,954,1,954,1,954,1,954,1,954,1,955,1,955,1,955,1,955,1,955,
+        1,956,1,956,1,956,1,956,1,956,1,957,1,957,1,957,1,957,1,957,1,958,
+        1,958,1,958,1,958,1,958,1,959,1,959,1,959,1,959,1,959,1,960,1,960,
+        1,960,1,960,1,960,1,961,1,961,1,961,1,961,1,961,1,962,1,962,1,962,
+        1,962,1,962,1,963,1,963,1,963,1,963,1,963,1,964,1,964,1,964,1,964,
+        1,964,1,965,1,965,1,965,1,965,1,965,1,966,1,966,1,966,1,966,1,966,
+        1,967,1,967,1,967,1,967,1,967,1,968,1,968,1,968,1,968,1,968,1,969,
+        1,969,1,969,1,969,1,969,1,970,1,970,1,970,1,970,1,970,1,971,1,971,
+        1,971,1,971,1,971,1,972,1,972,1,972,1,972,1,972,1,973,1,973,1,973,
+        1,973,1,973,1,974,1,974,1,974,1,974,1,974,1,975,1,975,1,975,1,975,
+        1,975,1,976,1,976,1,976,1,976,1,976,1,977,1,977,1,977,1,977,1,977,
+        1,978,1,978,1,978,1,978,1,978,1,979,1,979,1,979,1,979,1,979,1,980,
+        1,980,1,980,1,980,1,980,1,981,1,981,1,981,1,981,1,981,1,982,1,982,
+        1,982,1,982,1,982,1,983,1,983,1,983,1,983,1,983,1,984,1,984,1,984,
+        1,984,1,984,1,985,1,985,1,985,1,985,1,985,1,986,1,986,1,986,1,986,
+        1,986,1,987,1,987,1,987,1,987,1,987,1,988,1,988,1,988,1,988,1,988,
+        1,989,1,989,1,989,1,989,1,989,1,990,1,990,1,990,1,990,1,990,1,991,
+        1,991,1,991,1,991,1,991,1,992,1,992,1,992,1,992,1,992,1,993,1,993,
+        1,993,1,993,1,993,1,994,1,994,1,994,1,994,1,994,1,995,1,995,1,995,
+        1,995,1,995,1,996,1,996,1,996,1,996,1,996,1,997,1,997,1,997,1,997,
+        1,997,1,998,1,998,1,998,1,998,1,998,1,999,1,999,1,999,1,999,1,999,
+        1,1000,1,1000,1,1000,1,1000,1,1000,1,1001,1,1001,1,1001,1,1001,1,
+        1001,1,1002,1,1002,1,1002,1,1002,1,1002,1,1003,1,1003,1,1003,1,1003,
+        1,1003,1,1004,1,1004,1,1004,1,1004,1,1004,1,1005,1,1005,1,1005,1,
+        1005,1,1005,1,1006,1,1006,1,1006,1,1006,1,1006,1,1007,1,1007,1,1007,
+        1,1007,1,1007,1,1008,1,1008,1,1008,1,1008,1,1008,1,1009,1,1009,1,
+        1009,1,1009,1,1009,1,1010,1,1010,1,1010,1,1010,1,1010,1,1011,1,1011,
+        1,1011,1,1011,1,1011,1,1012,1,1012,1,1012,1,1012,1,1012,1,1013,1,
+        1013,1,1013,1,1013,1,1013,1,1013,1,1013,1,1013,1,1013,1,1013,1,1013,
+        1,1013,1,1013,1,1013,1,1013,1,1013,1,1013,1,1014,1,1014,1,1014,1,
+        1014,1,1014,1,1014,1,1014,1,1014,1,1014,1,1014,1,1014,1,1014,1,1014,
+        1,1014,1,1014,1,1014,1,1014,5,1014,9761,8,1014,10,1014,12,1014,9764,
+        9,1014,1,1014,1,1014,1,1014,1,1014,1,1014,1,1015,1,1015,4,1015,9773,
+        8,1015,11,1015,12,1015,9774,1,1015,1,1015,1,1016,1,1016,4,1016,9781,
+        8,1016,11,1016,12,1016,9782,1,1016,1,1016,1,1017,1,1017,1,1017,1,
+        1017,1,1017,1,1017,1,1017,1,1018,1,1018,1,1018,1,1018,1,1018,1,1018,
+        1,1018,1,1019,1,1019,1,1019,1,1019,1,1019,1,1019,1,1019,1,1020,1,
+        1020,1,1020,1,1020,1,1020,1,1020,1,1020,1,1021,1,1021,1,1021,1,1021,
+        1,1021,1,1021,1,1021,1,1022,1,1022,1,1022,1,1022,1,1022,1,1022,1,
+        1023,1,1023,4,1023,9830,8,1023,11,1023,12,1023,9831,1,1024,1,1024,
+        4,1024,9836,8,1024,11,1024,12,1024,9837,1,1024,1,1024,1,1025,1,1025,
+        1,1025,1,1025,1,1025,1,1026,1,1026,1,1026,1,1026,1,1026,1,1026,1,
+        1026,1,1026,1,1026,1,1026,1,1026,1,1026,1,1026,1,1027,1,1027,4,1027,
+        9862,8,1027,11,1027,12,1027,9863,1,1027,1,1027,1,1028,1,1028,1,1028,
+        1,1028,1,1028,1,1029,1,1029,1,1029,1,1029,1,1029,1,1030,1,1030,1,
+        1030,1,1030,1,1030,1,1031,1,1031,1,1031,1,1031,1,1031,1,1032,1,1032,
+        1,1032,1,1032,1,1032,1,1033,1,1033,1,1033,1,1033,1,1033,1,1034,1,
+        1034,1,1034,1,1034,1,1034,1,1035,1,1035,1,1035,1,1035,1,1035,1,1036,
+        1,1036,1,1036,1,1036,1,1036,1,1037,1,1037,1,1037,1,1037,1,1037,1,
+        1038,1,1038,1,1038,1,1038,1,1038,1,1039,1,1039,1,1039,1,1039,1,1039,
+        1,1040,1,1040,1,1040,1,1040,1,1040,1,1041,1,1041,1,1041,1,1041,1,
+        1041,1,1042,1,1042,1,1042,1,1042,1,1042,1,1043,1,1043,1,1043,1,1043,
+        1,1043,1,1044,1,1044,1,1044,1,1044,1,1044,1,1045,1,1045,1,1045,1,
+        1045,1,1045,1,1046,1,1046,1,1046,1,1046,1,1046,1,1047,1,1047,1,1047,
+        1,1047,1,1047,1,1048,1,1048,1,1048,1,1048,1,1048,1,1049,1,1049,1,
+        1049,1,1049,1,1049,1,1050,1,1050,1,1050,1,1050,1,1050,1,1051,1,1051,
+        1,1051,1,1051,1,1051,1,1051,1,1051,1,1052,1,1052,1,1052,1,1052,1,
+        1052,1,1053,1,1053,1,1053,1,1053,1,1053,1,1054,1,1054,1,1054,1,1054,
+        1,1054,1,1055,1,1055,1,1055,1,1055,1,1055,1,1056,1,1056,1,1056,1,
+        1056,1,1056,1,1057,1,1057,1,1057,1,1057,1,1057,1,1058,1,1058,1,1058,
+        1,1058,1,1058,1,1059,1,1059,1,1059,1,1059,1,1059,1,1060,1,1060,1,
+        1060,1,1060,1,1060,1,1061,1,1061,1,1061,1,1061,1,1061,1,1062,1,1062,
+        1,1062,1,1062,1,1062,1,1063,1,1063,1,1063,1,1063,1,1063,1,1064,1,
+        1064,1,1064,1,1064,1,1064,1,1065,1,1065,1,1065,1,1065,1,1065,1,1066,
+        1,1066,1,1066,1,1066,1,1066,1,1067,1,1067,1,1067,1,1067,1,1067,1,
+        1068,1,1068,1,1068,1,1068,1,1068,1,1069,1,1069,1,1069,1,1069,1,1069,
+        1,1070,1,1070,1,1070,1,1070,1,1070,1,1071,1,1071,1,1071,1,1071,1,
+        1071,1,1072,1,1072,1,1072,1,1072,1,1072,1,1072,1,1072,1,1073,1,1073,
+        1,1073,1,1073,1,1073,1,1074,1,1074,1,1074,1,1074,1,1074,1,1075,1,
+        1075,1,1075,1,1075,1,1075,1,1076,1,1076,1,1076,1,1076,1,1076,1,1077,
+        1,1077,1,1077,1,1077,1,1077,1,1078,1,1078,1,1078,1,1078,1,1078,1,
+        1079,1,1079,1,1079,1,1079,1,1079,1,1079,1,1079,1,1080,1,1080,1,1080,
+        1,1080,1,1080,1,1081,1,1081,1,1081,1,1081,1,1081,1,1082,1,1082,1,
+        1082,1,1082,1,1082,1,1083,1,1083,1,1083,1,1083,1,1083,1,1084,1,1084,
+        1,1084,1,1084,1,1084,1,1085,1,1085,1,1085,1,1085,1,1085,1,1086,1,
+        1086,1,1086,1,1086,1,1086,1,1087,1,1087,1,1087,1,1087,1,1087,1,1088,
+        1,1088,1,1088,1,1088,1,1088,1,1089,1,1089,1,1089,1,1089,1,1089,1,
+        1089,1,1090,1,1090,1,1090,1,1090,1,1090,1,1091,1,1091,1,1091,1,1091,
+        1,1091,1,1092,1,1092,1,1092,1,1092,1,1092,1,1093,1,1093,1,1093,1,
+        1093,1,1093,1,1094,1,1094,1,1094,1,1094,1,1094,1,1095,1,1095,1,1095,
+        1,1095,1,1095,1,1096,1,1096,1,1096,1,1096,1,1096,1,1097,1,1097,1,
+        1097,1,1097,1,1097,1,1098,1,1098,1,1098,1,1098,1,1098,1,1098,1,1098,
+        1,1099,1,1099,1,1099,1,1099,1,1099,1,1099,1,1099,1,1100,1,1100,1,
+        1100,1,1100,1,1100,1,1100,1,1100,1,1101,1,1101,1,1101,1,1101,1,1101,
+        1,1102,1,1102,1,1102,1,1102,1,1102,1,1103,1,1103,1,1103,1,1103,1,
+        1103,1,1104,1,1104,1,1104,1,1104,1,1104,1,1105,1,1105,1,1105,1,1105,
+        1,1105,1,1106,1,1106,1,1106,1,1106,1,1106,1,1106,1,1106,1,1107,1,
+        1107,1,1107,1,1107,1,1107,1,1108,1,1108,1,1108,1,1108,1,1108,1,1109,
+        1,1109,1,1109,1,1109,1,1109,1,1109,1,1109,1,1110,1,1110,1,1110,1,
+        1110,1,1110,1,1111,1,1111,1,1111,1,1111,1,1111,1,1112,1,1112,1,1112,
+        1,1112,1,1112,1,1113,1,1113,1,1113,1,1113,1,1113,1,1114,1,1114,1,
+        1114,1,1114,1,1114,1,1115,1,1115,1,1115,1,1115,1,1115,1,1116,1,1116,
+        1,1116,1,1116,1,1116,1,1117,1,1117,1,1117,1,1117,1,1117,1,1118,1,
+        1118,1,1118,1,1118,1,1118,1,1119,1,1119,1,1119,1,1119,1,1119,1,1120,
+        1,1120,1,1120,1,1120,1,1120,1,1121,1,1121,1,1121,1,1121,1,1121,1,
+        1122,1,1122,1,1122,1,1122,1,1122,1,1123,1,1123,1,1123,1,1123,1,1123,
+        1,1124,1,1124,1,1124,1,1124,1,1124,1,1125,1,1125,1,1125,1,1125,1,
+        1125,1,1126,1,1126,1,1126,1,1126,1,1126,1,1127,1,1127,1,1127,1,1127,
+        1,1127,1,1128,1,1128,1,1128,1,1128,1,1128,1,1129,1,1129,1,1129,1,
+        1129,1,1129,1,1130,1,1130,1,1130,1,1130,1,1130,1,1131,1,1131,1,1131,
+        1,1131,1,1131,1,1132,1,1132,1,1132,1,1132,1,1132,1,1133,1,1133,1,
+        1133,1,1133,1,1133,1,1134,1,1134,1,1134,1,1134,1,1134,1,1135,1,1135,
+        1,1135,1,1135,1,1135,1,1135,1,1136,1,1136,1,1136,1,1136,1,1136,1,
+        1137,1,1137,1,1137,1,1137,1,1137,1,1138,1,1138,1,1138,1,1138,1,1138,
+        1,1139,1,1139,1,1139,1,1139,1,1139,1,1140,1,1140,1,1140,1,1140,1,
+        1140,1,1141,1,1141,1,1141,1,1141,1,1141,1,1142,1,1142,1,1142,1,1142,
+        1,1142,1,1143,1,1143,1,1143,1,1143,1,1143,1,1144,1,1144,1,1144,1,
+        1144,1,1144,1,1145,1,1145,1,1145,1,1145,1,1145,1,1146,1,1146,1,1146,
+        1,1146,1,1146,1,1147,1,1147,1,1147,1,1147,1,1147,1,1148,1,1148,1,
+        1148,1,1148,1,1148,1,1149,1,1149,1,1149,1,1149,1,1149,1,1150,1,1150,
+        1,1150,1,1150,1,1150,1,1151,1,1151,1,1151,1,1151,1,1151,1,1152,1,
+        1152,1,1152,1,1152,1,1152,1,1153,1,1153,1,1153,1,1153,1,1153,1,1154,
+        1,1154,1,1154,1,1154,1,1154,1,1155,1,1155,1,1155,1,1155,1,1155,1,
+        1156,1,1156,1,1156,1,1156,1,1156,1,1156,1,1156,1,1157,1,1157,1,1157,
+        1,1157,1,1157,1,1158,1,1158,1,1158,1,1158,1,1158,1,1159,1,1159,1,
+        1159,1,1159,1,1159,1,1160,1,1160,1,1160,1,1160,1,1160,1,1161,1,1161,
+        1,1161,1,1161,1,1161,1,1162,1,1162,1,1162,1,1162,1,1162,1,1163,1,
+        1163,1,1163,1,1163,1,1163,1,1164,1,1164,1,1164,1,1164,1,1164,1,1164,
+        1,1164,1,1165,1,1165,1,1165,1,1165,1,1165,1,1166,1,1166,1,1166,1,
+        1166,1,1166,1,1167,1,1167,1,1167,1,1167,1,1167,1,1168,1,1168,1,1168,
+        1,1168,1,1168,1,1169,1,1169,1,1169,1,1169,1,1169,1,1170,1,1170,1,
+        1170,1,1170,1,1170,1,1171,1,1171,1,1171,1,1171,1,1171,1,1172,1,1172,
+        1,1172,1,1172,1,1172,1,1173,1,1173,1,1173,1,1173,1,1173,1,1174,1,
+        1174,1,1174,1,1174,1,1174,1,1175,1,1175,1,1175,1,1175,1,1175,1,1176,
+        1,1176,1,1176,1,1176,1,1176,1,1177,1,1177,1,1177,1,1177,1,1177,1,
+        1178,1,1178,1,1178,1,1178,1,1178,1,1178,1,1178,1,1179,1,1179,1,1179,
+        1,1179,1,1179,1,1180,1,1180,1,1180,1,1180,1,1180,1,1181,1,1181,1,
+        1181,1,1181,1,1181,1,1182,1,1182,1,1182,1,1182,1,1182,1,1183,1,1183,
+        1,1183,1,1183,1,1183,1,1184,1,1184,1,1184,1,1184,1,1184,1,1185,1,
+        1185,1,1185,1,1185,1,1185,1,1186,1,1186,1,1186,1,1186,1,1186,1,1187,
+        1,1187,1,1187,1,1187,1,1187,1,1188,1,1188,1,1188,1,1188,1,1188,1,
+        1188,1,1188,1,1189,1,1189,1,1189,1,1189,1,1189,1,1189,1,1189,1,1190,
+        1,1190,1,1190,1,1190,1,1190,1,1191,1,1191,1,1191,1,1191,1,1191,1,
+        1192,1,1192,4,1192,10718,8,1192,11,1192,12,1192,10719,1,1193,1,1193,
+        1,1193,1,1193,1,1193,1,1194,1,1194,1,1194,1,1194,5,1194,10731,8,
+        1194,10,1194,12,1194,10734,9,1194,1,1194,1,1194,1,1194,1,1194,1,
+        1195,1,1195,1,1195,1,1195,1,1195,1,1195,1,1195,1,1196,1,1196,1,1196,
+        1,1196,1,1196,1,1196,1,1196,1,1196,1,1197,1,1197,1,1197,5,1197,10758,
+        8,1197,10,1197,12,1197,10761,9,1197,1,1197,1,1197,1,1198,1,1198,
+        1,1198,5,1198,10768,8,1198,10,1198,12,1198,10771,9,1198,1,1199,1,
+        1199,1,1199,5,1199,10776,8,1199,10,1199,12,1199,10779,9,1199,1,1200,
+        1,1200,1,1200,1,1200,1,1200,1,1201,1,1201,4,1201,10788,8,1201,11,
+        1201,12,1201,10789,1,1201,1,1201,1,1202,1,1202,1,1202,1,1202,1,1202,
+        1,1202,1,1202,1,1203,1,1203,1,1203,1,1203,1,1203,1,1204,1,1204,4,
+        1204,10808,8,1204,11,1204,12,1204,10809,1,1204,1,1204,1,1205,1,1205,
+        4,1205,10816,8,1205,11,1205,12,1205,10817,1,1205,1,1205,1,1206,1,
+        1206,1,1206,1,1206,5,1206,10826,8,1206,10,1206,12,1206,10829,9,1206,
+        1,1206,1,1206,1,1206,1,1206,1,1207,1,1207,1,1207,1,1207,1,1207,1,
+        1208,1,1208,1,1208,1,1208,1,1208,1,1208,1,1209,1,1209,1,1209,1,1209,
+        1,1209,1,1210,1,1210,1,1210,1,1210,1,1210,1,1211,1,1211,1,1211,1,
+        1211,1,1212,1,1212,1,1212,1,1212,1,1213,1,1213,1,1213,1,1213,1,1213,
+        1,1214,1,1214,1,1214,1,1214,1,1214,1,1215,1,1215,1,1215,1,1215,1,
+        1215,1,1216,1,1216,1,1216,1,1216,3,1216,10883,8,1216,1,1216,1,1216,
+        1,1217,1,1217,1,1217,1,1217,1,1217,1,1218,1,1218,1,1218,1,1218,1,
+        1218,1,1219,1,1219,1,1219,1,1219,1,1219,1,1220,1,1220,1,1220,1,1220,
+        1,1220,1,1221,1,1221,1,1221,1,1221,1,1221,1,1222,1,1222,1,1222,1,
+        1222,1,1222,1,1223,1,1223,1,1223,1,1223,1,1223,1,1224,1,1224,1,1224,
+        1,1224,1,1224,1,1225,1,1225,1,1225,1,1225,1,1225,1,1226,1,1226,1,
+        1226,1,1226,1,1226,1,1227,1,1227,1,1227,1,1227,1,1227,1,1228,1,1228,
+        1,1228,1,1228,1,1228,1,1229,1,1229,1,1229,1,1230,1,1230,1,1230,1,
+        1231,1,1231,1,1231,1,1232,1,1232,1,1232,5,1232,10959,8,1232,10,1232,
+        12,1232,10962,9,1232,1,1232,1,1232,1,1233,1,1233,1,1233,5,1233,10969,
+        8,1233,10,1233,12,1233,10972,9,1233,1,1234,1,1234,1,1234,1,1234,
+        1,1234,1,1234,1,1234,1,1234,1,1234,1,1234,1,1235,1,1235,1,1235,1,
+        1235,1,1235,1,1236,1,1236,1,1236,1,1236,1,1236,1,1236,1,1236,1,1236,
+        1,1236,1,1236,1,1236,1,1236,5,1236,11001,8,1236,10,1236,12,1236,
+        11004,9,1236,1,1236,1,1236,1,1236,1,1236,1,1237,1,1237,1,1237,1,
+        1237,1,1237,1,1238,1,1238,1,1238,1,1238,1,1238,1,1238,1,1239,1,1239,
+        1,1239,1,1239,1,1240,1,1240,1,1240,1,1240,1,1240,1,1241,1,1241,1,
+        1241,1,1241,1,1242,1,1242,1,1242,1,1242,1,1242,1,1243,1,1243,1,1243,
+        5,1243,11042,8,1243,10,1243,12,1243,11045,9,1243,1,1243,1,1243,1,
+        1244,1,1244,1,1244,5,1244,11052,8,1244,10,1244,12,1244,11055,9,1244,
+        1,1244,1,1244,1,1245,3,1245,11060,8,1245,1,1245,1,1245,1,1245,1,
+        1246,1,1246,1,1246,5,1246,11068,8,1246,10,1246,12,1246,11071,9,1246,
+        1,1246,1,1246,1,1247,1,1247,1,1247,5,1247,11078,8,1247,10,1247,12,
+        1247,11081,9,1247,1,1247,1,1247,1,1248,1,1248,1,1248,1,1248,1,1248,
+        1,1249,1,1249,4,1249,11092,8,1249,11,1249,12,1249,11093,1,1249,1,
+        1249,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,
+        1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,
+        1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,
+        1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,
+        1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,
+        1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,
+        1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,
+        1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,1250,1,
+        1250,1,1250,1,1250,1,1250,1,1250,1,1251,1,1251,1,1251,1,1251,1,1252,
+        1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,
+        1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,
+        1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,1252,1,
+        1252,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,
+        1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,1253,1,
+        1253,1,1253,1,1254,1,1254,1,1254,1,1254,1,1254,1,1254,1,1254,1,1254,
+        1,1254,3,1254,11241,8,1254,1,1254,1,1254,1,1255,1,1255,1,1255,1,
+        1255,1,1255,1,1255,1,1255,1,1255,1,1255,1,1255,1,1256,1,1256,1,1256,
+        1,1256,1,1257,1,1257,1,1257,1,1258,1,1258,1,1258,1,1258,1,1258,1,
+        1259,1,1259,1,1259,1,1259,1,1259,1,1259,1,1259,1,1259,1,1259,1,1259,
+        1,1260,1,1260,1,1260,5,1260,11280,8,1260,10,1260,12,1260,11283,9,
+        1260,1,1260,1,1260,1,1261,1,1261,1,1261,5,1261,11290,8,1261,10,1261,
+        12,1261,11293,9,1261,1,1261,1,1261,1,1262,1,1262,1,1262,1,1262,1,
+        1262,1,1263,1,1263,1,1263,1,1263,1,1264,1,1264,1,1264,1,1264,1,1264,
+        1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,
+        1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1264,1,1265,
+        1,1265,1,1265,1,1265,1,1265,1,1265,1,1265,1,1265,1,1265,1,1265,1,
+        1265,1,1266,1,1266,1,1266,1,1266,1,1266,1,1266,1,1266,1,1266,1,1266,
+        1,1266,1,1267,1,1267,1,1267,5,1267,11353,8,1267,10,1267,12,1267,
+        11356,9,1267,1,1267,1,1267,1,1267,1,1268,1,1268,1,1268,5,1268,11364,
+        8,1268,10,1268,12,1268,11367,9,1268,1,1268,1,1268,1,1268,1,1269,
+        1,1269,1,1269,1,1269,1,1269,1,1269,1,1270,1,1270,1,1270,1,1271,1,
+        1271,1,1271,1,1272,1,1272,1,1272,1,1272,1,1273,1,1273,1,1273,1,1273,
+        1,1274,1,1274,1,1274,1,1274,1,1274,1,1274,1,1274,1,1274,1,1275,1,
+        1275,1,1275,1,1275,3,1275,11404,8,1275,1,1275,1,1275,1,1276,1,1276,
+        1,1276,1,1276,3,1276,11412,8,1276,1,1276,1,1276,1,1276,1,1276,1,
+        1276,1,1276,1,1276,1,1277,1,1277,1,1277,1,1277,1,1277,1,1277,1,1277,
+        1,1277,1,1277,1,1277,1,1277,1,1278,1,1278,1,1278,5,1278,11435,8,
+        1278,10,1278,12,1278,11438,9,1278,1,1278,1,1278,1,1279,1,1279,1,
+        1279,1,1279,1,1279,1,1279,1,1280,1,1280,1,1280,1,1280,1,1281,1,1281,
+        1,1281,1,1281,1,1282,1,1282,1,1282,1,1282,1,1282,1,1283,1,1283,1,
+        1283,1,1283,1,1284,1,1284,5,1284,11467,8,1284,10,1284,12,1284,11470,
+        9,1284,1,1284,1,1284,1,1285,4,1285,11475,8,1285,11,1285,12,1285,
+        11476,1,1285,1,1285,1,1286,1,1286,1,1286,1,1286,1,1286,1,1286,1,
+        1286,1,1287,1,1287,1,1287,1,1287,1,1287,3,2864,2878,6639,0,1288,
+        47,1,49,2,51,3,53,4,55,5,57,0,59,0,61,0,63,0,65,0,67,0,69,6,71,7,
+        73,8,75,9,77,10,79,11,81,12,83,13,85,14,87,15,89,16,91,17,93,18,
+        95,19,97,20,99,21,101,22,103,23,105,0,107,0,109,24,111,25,113,26,
+        115,27,117,28,119,29,121,30,123,31,125,32,127,33,129,34,131,35,133,
+        36,135,37,137,38,139,39,141,40,143,41,145,0,147,0,149,0,151,0,153,
+        0,155,0,157,0,159,42,161,43,163,44,165,0,167,45,169,46,171,47,173,
+        48,175,0,177,0,179,0,181,0,183,0,185,0,187,49,189,50,191,0,193,51,
+        195,52,197,0,199,53,201,54,203,55,205,56,207,57,209,58,211,59,213,
+        60,215,61,217,62,219,63,221,64,223,65,225,66,227,67,229,68,231,69,
+        233,70,235,71,237,72,239,73,241,74,243,75,245,76,247,77,249,78,251,
+        79,253,80,255,81,257,82,259,83,261,84,263,85,265,86,267,87,269,88,
+        271,89,273,90,275,91,277,92,279,93,281,94,283,95,285,96,287,97,289,
+        98,291,99,293,100,295,101,297,102,299,103,301,104,303,105,305,106,
+        307,107,309,108,311,109,313,110,315,111,317,112,319,113,321,114,
+        323,115,325,116,327,117,329,118,331,119,333,120,335,121,337,122,
+        339,123,341,124,343,125,345,126,347,127,349,128,351,129,353,130,
+        355,0,357,0,359,0,361,0,363,0,365,0,367,0,369,0,371,0,373,0,375,
+        0,377,0,379,0,381,0,383,0,385,0,387,0,389,0,391,0,393,0,395,0,397,
+        0,399,0,401,0,403,0,405,0,407,0,409,0,411,0,413,0,415,0,417,0,419,
+        0,421,0,423,0,425,0,427,0,429,0,431,0,433,0,435,0,437,0,439,0,441,
+        0,443,0,445,0,447,0,449,0,451,0,453,0,455,0,457,0,459,0,461,0,463,
+        0,465,0,467,0,469,0,471,0,473,0,475,0,477,0,479,0,481,0,483,0,485,
+        0,487,0,489,0,491,0,493,0,495,0,497,0,499,0,501,0,503,0,505,0,507,
+        0,509,0,511,0,513,0,515,0,517,0,519,0,521,0,523,0,525,0,527,131,
+        529,0,531,0,533,132,535,133,537,134,539,135,541,136,543,137,545,
+        138,547,139,549,140,551,141,553,142,555,143,557,144,559,145,561,
+        146,563,147,565,148,567,149,569,150,571,151,573,152,575,153,577,
+        154,579,155,581,156,583,157,585,158,587,159,589,160,591,161,593,
+        162,595,163,597,164,599,165,601,166,603,167,605,168,607,169,609,
+        170,611,171,613,172,615,173,617,174,619,175,621,176,623,177,625,
+        178,627,179,629,180,631,181,633,182,635,183,637,184,639,185,641,
+        186,643,187,645,188,647,189,649,190,651,191,653,192,655,193,657,
+        194,659,195,661,196,663,197,665,198,667,199,669,200,671,201,673,
+        202,675,203,677,204,679,205,681,206,683,207,685,208,687,209,689,
+        210,691,211,693,212,695,213,697,214,699,215,701,216,703,217,705,
+        218,707,219,709,220,711,221,713,222,715,223,717,224,719,225,721,
+        226,723,227,725,228,727,229,729,230,731,231,733,232,735,233,737,
+        234,739,235,741,236,743,237,745,238,747,239,749,240,751,241,753,
+        242,755,243,757,244,759,245,761,246,763,247,765,248,767,249,769,
+        250,771,251,773,252,775,253,777,254,779,255,781,256,783,257,785,
+        258,787,259,789,260,791,261,793,262,795,263,797,264,799,265,801,
+        266,803,267,805,268,807,269,809,270,811,271,813,272,815,273,817,
+        274,819,275,821,276,823,277,825,278,827,279,829,280,831,281,833,
+        282,835,283,837,284,839,285,841,286,843,287,845,288,847,289,849,
+        290,851,291,853,292,855,293,857,294,859,295,861,296,863,297,865,
+        298,867,299,869,300,871,301,873,302,875,303,877,304,879,305,881,
+        306,883,307,885,308,887,309,889,310,891,311,893,312,895,313,897,
+        314,899,315,901,316,903,317,905,318,907,319,909,320,911,321,913,
+        322,915,323,917,324,919,325,921,326,923,327,925,328,927,329,929,
+        330,931,331,933,332,935,333,937,334,939,335,941,336,943,337,945,
+        338,947,339,949,340,951,341,953,342,955,343,957,344,959,345,961,
+        346,963,347,965,348,967,349,969,350,971,351,973,352,975,353,977,
+        354,979,355,981,356,983,357,985,358,987,359,989,360,991,361,993,
+        362,995,363,997,364,999,365,1001,366,1003,367,1005,368,1007,369,
+        1009,370,1011,371,1013,372,1015,373,1017,374,1019,375,1021,376,1023,
+        377,1025,378,1027,379,1029,380,1031,381,1033,382,1035,383,1037,384,
+        1039,385,1041,386,1043,387,1045,388,1047,389,1049,390,1051,391,1053,
+        392,1055,393,1057,394,1059,395,1061,396,1063,397,1065,398,1067,399,
+        1069,400,1071,401,1073,402,1075,403,1077,404,1079,405,1081,406,1083,
+        407,1085,408,1087,409,1089,410,1091,411,1093,412,1095,413,1097,414,
+        1099,415,1101,416,1103,417,1105,418,1107,419,1109,420,1111,421,1113,
+        422,1115,423,1117,424,1119,425,1121,426,1123,427,1125,428,1127,429,
+        1129,430,1131,431,1133,432,1135,433,1137,434,1139,435,1141,436,1143,
+        437,1145,438,1147,439,1149,440,1151,0,1153,441,1155,442,1157,443,
+        1159,444,1161,445,1163,446,1165,0,1167,447,1169,448,1171,449,1173,
+        450,1175,451,1177,452,1179,453,1181,454,1183,455,1185,456,1187,0,
+        1189,0,1191,0,1193,457,1195,458,1197,459,1199,460,1201,461,1203,
+        462,1205,463,1207,0,1209,0,1211,0,1213,464,1215,465,1217,466,1219,
+        467,1221,468,1223,469,1225,470,1227,471,1229,472,1231,473,1233,474,
+        1235,475,1237,476,1239,477,1241,478,1243,479,1245,480,1247,0,1249,
+        0,1251,0,1253,0,1255,0,1257,0,1259,0,1261,0,1263,0,1265,0,1267,0,
+        1269,0,1271,0,1273,0,1275,0,1277,0,1279,0,1281,481,1283,482,1285,
+        483,1287,484,1289,485,1291,486,1293,487,1295,488,1297,489,1299,490,
+        1301,491,1303,492,1305,493,1307,494,1309,495,1311,496,1313,497,1315,
+        498,1317,499,1319,500,1321,501,1323,502,1325,503,1327,504,1329,505,
+        1331,506,1333,507,1335,508,1337,509,1339,510,1341,511,1343,512,1345,
+        513,1347,514,1349,515,1351,516,1353,517,1355,518,1357,519,1359,520,
+        1361,521,1363,522,1365,523,1367,524,1369,525,1371,526,1373,527,1375,
+        528,1377,529,1379,530,1381,531,1383,532,1385,533,1387,534,1389,535,
+        1391,536,1393,537,1395,538,1397,539,1399,540,1401,541,1403,542,1405,
+        543,1407,544,1409,545,1411,546,1413,547,1415,548,1417,549,1419,550,
+        1421,551,1423,552,1425,553,1427,554,1429,555,1431,556,1433,557,1435,
+        558,1437,559,1439,560,1441,561,1443,562,1445,563,1447,564,1449,565,
+        1451,566,1453,567,1455,568,1457,569,1459,570,1461,571,1463,572,1465,
+        573,1467,574,1469,575,1471,576,1473,577,1475,578,1477,579,1479,580,
+        1481,581,1483,582,1485,583,1487,584,1489,585,1491,586,1493,587,1495,
+        588,1497,589,1499,590,1501,591,1503,592,1505,593,1507,594,1509,595,
+        1511,596,1513,597,1515,0,1517,0,1519,598,1521,599,1523,600,1525,
+        601,1527,602,1529,0,1531,0,1533,0,1535,603,1537,604,1539,605,1541,
+        606,1543,607,1545,608,1547,609,1549,0,1551,610,1553,611,1555,612,
+        1557,613,1559,614,1561,615,1563,616,1565,617,1567,618,1569,619,1571,
+        620,1573,621,1575,622,1577,623,1579,624,1581,625,1583,626,1585,627,
+        1587,628,1589,629,1591,630,1593,631,1595,632,1597,633,1599,634,1601,
+        635,1603,636,1605,637,1607,638,1609,639,1611,640,1613,641,1615,642,
+        1617,643,1619,644,1621,645,1623,646,1625,647,1627,648,1629,649,1631,
+        650,1633,651,1635,0,1637,652,1639,653,1641,654,1643,0,1645,655,1647,
+        656,1649,657,1651,658,1653,659,1655,660,1657,661,1659,662,1661,663,
+        1663,664,1665,665,1667,666,1669,667,1671,668,1673,669,1675,0,1677,
+        0,1679,670,1681,671,1683,672,1685,673,1687,674,1689,675,1691,676,
+        1693,677,1695,678,1697,679,1699,0,1701,0,1703,0,1705,0,1707,680,
+        1709,681,1711,682,1713,683,1715,684,1717,685,1719,686,1721,0,1723,
+        0,1725,0,1727,0,1729,0,1731,0,1733,0,1735,0,1737,0,1739,0,1741,0,
+        1743,0,1745,0,1747,0,1749,0,1751,0,1753,0,1755,0,1757,0,1759,0,1761,
+        0,1763,0,1765,0,1767,0,1769,0,1771,0,1773,0,1775,0,1777,0,1779,0,
+        1781,0,1783,0,1785,0,1787,0,1789,0,1791,0,1793,0,1795,0,1797,0,1799,
+        0,1801,0,1803,0,1805,0,1807,0,1809,0,1811,0,1813,0,1815,0,1817,0,
+        1819,0,1821,0,1823,0,1825,0,1827,0,1829,0,1831,0,1833,0,1835,0,1837,
+        0,1839,0,1841,0,1843,0,1845,0,1847,0,1849,0,1851,0,1853,0,1855,0,
+        1857,0,1859,0,1861,0,1863,0,1865,0,1867,0,1869,0,1871,0,1873,0,1875,
+        0,1877,0,1879,0,1881,0,1883,0,1885,0,1887,0,1889,0,1891,0,1893,0,
+        1895,0,1897,0,1899,0,1901,0,1903,0,1905,0,1907,0,1909,0,1911,0,1913,
+        0,1915,0,1917,0,1919,0,1921,0,1923,0,1925,0,1927,0,1929,0,1931,0,
+        1933,0,1935,0,1937,0,1939,0,1941,0,1943,0,1945,0,1947,0,1949,0,1951,
+        0,1953,0,1955,0,1957,0,1959,0,1961,0,1963,0,1965,0,1967,0,1969,0,
+        1971,0,1973,0,1975,0,1977,0,1979,0,1981,0,1983,0,1985,0,1987,0,1989,
+        0,1991,0,1993,0,1995,0,1997,0,1999,0,2001,0,2003,0,2005,0,2007,0,
+        2009,0,2011,0,2013,0,2015,0,2017,0,2019,0,2021,0,2023,0,2025,0,2027,
+        0,2029,0,2031,0,2033,0,2035,0,2037,0,2039,0,2041,0,2043,0,2045,0,
+        2047,0,2049,0,2051,0,2053,0,2055,0,2057,0,2059,0,2061,0,2063,0,2065,
+        0,2067,0,2069,0,2071,0,2073,687,2075,0,2077,688,2079,689,2081,0,
+        2083,0,2085,0,2087,0,2089,0,2091,0,2093,690,2095,0,2097,0,2099,691,
+        2101,692,2103,0,2105,0,2107,0,2109,0,2111,0,2113,0,2115,0,2117,0,
+        2119,0,2121,0,2123,0,2125,0,2127,0,2129,0,2131,0,2133,0,2135,0,2137,
+        0,2139,0,2141,0,2143,0,2145,0,2147,0,2149,0,2151,0,2153,0,2155,0,
+        2157,0,2159,0,2161,0,2163,0,2165,0,2167,0,2169,0,2171,0,2173,0,2175,
+        0,2177,0,2179,0,2181,0,2183,0,2185,0,2187,0,2189,0,2191,0,2193,0,
+        2195,0,2197,0,2199,0,2201,0,2203,0,2205,0,2207,0,2209,0,2211,0,2213,
+        0,2215,0,2217,0,2219,0,2221,0,2223,0,2225,0,2227,0,2229,0,2231,0,
+        2233,0,2235,0,2237,0,2239,0,2241,0,2243,0,2245,0,2247,0,2249,0,2251,
+        0,2253,0,2255,0,2257,0,2259,0,2261,0,2263,0,2265,0,2267,0,2269,0,
+        2271,0,2273,0,2275,0,2277,0,2279,0,2281,0,2283,0,2285,0,2287,0,2289,
+        0,2291,0,2293,0,2295,0,2297,0,2299,0,2301,0,2303,0,2305,0,2307,0,
+        2309,0,2311,0,2313,0,2315,0,2317,0,2319,0,2321,0,2323,0,2325,0,2327,
+        0,2329,0,2331,0,2333,0,2335,0,2337,0,2339,0,2341,0,2343,0,2345,0,
+        2347,0,2349,0,2351,0,2353,0,2355,0,2357,0,2359,0,2361,0,2363,0,2365,
+        0,2367,0,2369,0,2371,0,2373,0,2375,0,2377,0,2379,0,2381,0,2383,0,
+        2385,0,2387,0,2389,0,2391,0,2393,0,2395,0,2397,0,2399,0,2401,0,2403,
+        0,2405,0,2407,0,2409,0,2411,0,2413,0,2415,0,2417,0,2419,0,2421,0,
+        2423,0,2425,0,2427,0,2429,0,2431,693,2433,0,2435,0,2437,694,2439,
+        695,2441,696,2443,697,2445,698,2447,0,2449,699,2451,0,2453,700,2455,
+        701,2457,0,2459,0,2461,702,2463,0,2465,703,2467,0,2469,704,2471,
+        0,2473,705,2475,706,2477,707,2479,708,2481,709,2483,710,2485,711,
+        2487,712,2489,713,2491,714,2493,715,2495,716,2497,717,2499,718,2501,
+        719,2503,720,2505,721,2507,722,2509,723,2511,724,2513,725,2515,726,
+        2517,727,2519,728,2521,729,2523,730,2525,731,2527,732,2529,733,2531,
+        734,2533,735,2535,736,2537,737,2539,738,2541,739,2543,740,2545,0,
+        2547,0,2549,741,2551,742,2553,743,2555,744,2557,745,2559,746,2561,
+        747,2563,748,2565,749,2567,750,2569,751,2571,0,2573,752,2575,753,
+        2577,754,2579,755,2581,756,2583,0,2585,757,2587,758,2589,759,2591,
+        760,2593,761,2595,762,2597,763,2599,764,2601,765,2603,766,2605,0,
+        2607,0,2609,0,2611,0,2613,0,2615,0,2617,767,2619,768,2621,0,47,0,
+        1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,
+        26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,91,
+        2,0,10,10,13,13,3,0,10,10,13,13,42,42,1,0,32,32,6,0,32,32,35,36,
+        48,57,64,90,95,95,97,122,3,0,35,36,64,90,97,122,2,0,68,68,100,100,
+        2,0,70,70,102,102,2,0,79,79,111,111,2,0,67,67,99,99,2,0,73,73,105,
+        105,2,0,80,80,112,112,2,0,72,72,104,104,2,0,9,9,32,32,2,0,82,82,
+        114,114,2,0,69,69,101,101,2,0,78,78,110,110,2,0,84,84,116,116,2,
+        0,76,76,108,108,2,0,74,74,106,106,2,0,83,83,115,115,2,0,65,65,97,
+        97,2,0,89,89,121,121,2,0,85,85,117,117,7,0,9,10,13,13,32,32,34,34,
+        39,41,44,44,47,47,1,0,34,34,1,0,39,39,1,0,44,44,1,0,47,47,1,0,40,
+        40,1,0,41,41,2,0,81,81,113,113,2,0,66,66,98,98,2,0,71,71,103,103,
+        2,0,77,77,109,109,2,0,87,87,119,119,2,0,86,86,118,118,1,0,45,45,
+        2,0,88,88,120,120,2,0,75,75,107,107,4,0,35,36,64,90,95,95,97,122,
+        2,0,65,90,97,122,5,0,35,36,48,57,64,90,95,95,97,122,3,0,9,10,13,
+        13,32,32,2,0,90,90,122,122,1,0,48,57,2,0,38,38,44,48,2,0,45,45,48,
+        48,2,0,46,46,48,48,1,0,49,55,2,0,86,86,97,97,1,0,50,50,1,0,46,46,
+        4,0,65,78,80,89,97,110,112,121,1,0,49,56,4,0,35,37,64,90,95,95,97,
+        122,1,0,42,42,1,0,99,99,5,0,10,10,13,13,39,39,43,43,45,45,2,0,43,
+        43,45,45,3,0,10,10,13,13,34,34,3,0,10,10,13,13,39,39,4,0,10,10,13,
+        13,32,32,59,59,3,0,10,10,13,13,59,59,3,0,10,10,13,13,32,32,3,0,32,
+        32,69,69,101,101,5,0,32,32,83,83,85,85,115,115,117,117,4,0,32,32,
+        48,57,65,90,97,122,6,0,32,32,43,43,45,45,48,57,65,90,97,122,4,0,
+        32,32,42,42,65,90,97,122,4,0,32,32,43,43,45,45,48,57,2,0,32,32,48,
+        57,3,0,32,32,65,90,97,122,3,0,32,32,65,65,97,97,5,0,32,32,65,65,
+        68,68,97,97,100,100,3,0,32,32,69,70,101,102,3,0,32,32,76,76,108,
+        108,5,0,32,32,70,70,82,82,102,102,114,114,3,0,32,32,66,66,98,98,
+        5,0,10,10,13,13,32,32,39,39,58,58,1,0,58,58,5,0,45,45,48,57,65,90,
+        92,92,97,122,1,0,48,48,1,0,49,57,4,0,65,71,86,86,97,103,118,118,
+        1,0,49,49,3,0,32,32,67,67,99,99,4,0,32,32,49,49,78,78,110,110,3,
+        0,32,32,79,79,111,111,2,0,32,32,65,90,4,0,35,37,42,42,64,90,97,122,
+        7,0,35,36,38,38,42,42,44,57,64,90,95,95,97,122,11572,0,47,1,0,0,
+        0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,1,69,1,0,0,
+        0,1,71,1,0,0,0,1,73,1,0,0,0,1,75,1,0,0,0,1,77,1,0,0,0,1,79,1,0,0,
+        0,1,81,1,0,0,0,1,83,1,0,0,0,1,85,1,0,0,0,1,87,1,0,0,0,1,89,1,0,0,
+        0,1,91,1,0,0,0,1,93,1,0,0,0,1,95,1,0,0,0,1,97,1,0,0,0,1,99,1,0,0,
+        0,1,101,1,0,0,0,1,103,1,0,0,0,2,105,1,0,0,0,2,107,1,0,0,0,3,109,
+        1,0,0,0,3,111,1,0,0,0,3,113,1,0,0,0,3,115,1,0,0,0,3,117,1,0,0,0,
+        3,119,1,0,0,0,3,121,1,0,0,0,3,123,1,0,0,0,3,125,1,0,0,0,3,127,1,
+        0,0,0,3,129,1,0,0,0,3,131,1,0,0,0,3,133,1,0,0,0,3,135,1,0,0,0,3,
+        137,1,0,0,0,3,139,1,0,0,0,3,141,1,0,0,0,4,143,1,0,0,0,4,145,1,0,
+        0,0,4,147,1,0,0,0,4,149,1,0,0,0,4,151,1,0,0,0,4,153,1,0,0,0,4,155,
+        1,0,0,0,4,157,1,0,0,0,4,159,1,0,0,0,5,161,1,0,0,0,5,163,1,0,0,0,
+        5,165,1,0,0,0,5,167,1,0,0,0,5,169,1,0,0,0,5,171,1,0,0,0,5,173,1,
+        0,0,0,5,175,1,0,0,0,5,177,1,0,0,0,5,179,1,0,0,0,5,181,1,0,0,0,5,
+        183,1,0,0,0,6,185,1,0,0,0,6,187,1,0,0,0,7,189,1,0,0,0,7,191,1,0,
+        0,0,8,193,1,0,0,0,9,195,1,0,0,0,9,197,1,0,0,0,10,199,1,0,0,0,10,
+        201,1,0,0,0,10,203,1,0,0,0,10,205,1,0,0,0,10,207,1,0,0,0,10,209,
+        1,0,0,0,10,211,1,0,0,0,10,213,1,0,0,0,10,215,1,0,0,0,10,217,1,0,
+        0,0,10,219,1,0,0,0,10,221,1,0,0,0,10,223,1,0,0,0,10,225,1,0,0,0,
+        10,227,1,0,0,0,10,229,1,0,0,0,10,231,1,0,0,0,10,233,1,0,0,0,10,235,
+        1,0,0,0,10,237,1,0,0,0,10,239,1,0,0,0,10,241,1,0,0,0,10,243,1,0,
+        0,0,10,245,1,0,0,0,10,247,1,0,0,0,10,249,1,0,0,0,10,251,1,0,0,0,
+        10,253,1,0,0,0,10,255,1,0,0,0,10,257,1,0,0,0,10,259,1,0,0,0,10,261,
+        1,0,0,0,10,263,1,0,0,0,10,265,1,0,0,0,10,267,1,0,0,0,10,269,1,0,
+        0,0,10,271,1,0,0,0,10,273,1,0,0,0,10,275,1,0,0,0,10,277,1,0,0,0,
+        10,279,1,0,0,0,10,281,1,0,0,0,10,283,1,0,0,0,10,285,1,0,0,0,10,287,
+        1,0,0,0,10,289,1,0,0,0,10,291,1,0,0,0,10,293,1,0,0,0,10,295,1,0,
+        0,0,10,297,1,0,0,0,10,299,1,0,0,0,10,301,1,0,0,0,10,303,1,0,0,0,
+        10,305,1,0,0,0,10,307,1,0,0,0,10,309,1,0,0,0,10,311,1,0,0,0,10,313,
+        1,0,0,0,10,315,1,0,0,0,10,317,1,0,0,0,10,319,1,0,0,0,10,321,1,0,
+        0,0,10,323,1,0,0,0,10,325,1,0,0,0,10,327,1,0,0,0,10,329,1,0,0,0,
+        10,331,1,0,0,0,10,333,1,0,0,0,10,335,1,0,0,0,10,337,1,0,0,0,10,339,
+        1,0,0,0,10,341,1,0,0,0,10,343,1,0,0,0,10,345,1,0,0,0,10,347,1,0,
+        0,0,10,349,1,0,0,0,10,351,1,0,0,0,10,353,1,0,0,0,10,355,1,0,0,0,
+        10,357,1,0,0,0,10,359,1,0,0,0,10,361,1,0,0,0,10,363,1,0,0,0,10,365,
+        1,0,0,0,10,367,1,0,0,0,10,369,1,0,0,0,10,371,1,0,0,0,10,373,1,0,
+        0,0,10,375,1,0,0,0,10,377,1,0,0,0,10,379,1,0,0,0,10,381,1,0,0,0,
+        10,383,1,0,0,0,10,385,1,0,0,0,10,387,1,0,0,0,10,389,1,0,0,0,10,391,
+        1,0,0,0,10,393,1,0,0,0,10,395,1,0,0,0,10,397,1,0,0,0,10,399,1,0,
+        0,0,10,401,1,0,0,0,10,403,1,0,0,0,10,405,1,0,0,0,10,407,1,0,0,0,
+        10,409,1,0,0,0,10,411,1,0,0,0,10,413,1,0,0,0,10,415,1,0,0,0,10,417,
+        1,0,0,0,10,419,1,0,0,0,10,421,1,0,0,0,10,423,1,0,0,0,10,425,1,0,
+        0,0,10,427,1,0,0,0,10,429,1,0,0,0,10,431,1,0,0,0,10,433,1,0,0,0,
+        10,435,1,0,0,0,10,437,1,0,0,0,10,439,1,0,0,0,10,441,1,0,0,0,10,443,
+        1,0,0,0,10,445,1,0,0,0,10,447,1,0,0,0,10,449,1,0,0,0,10,451,1,0,
+        0,0,10,453,1,0,0,0,10,455,1,0,0,0,10,457,1,0,0,0,10,459,1,0,0,0,
+        10,461,1,0,0,0,10,463,1,0,0,0,10,465,1,0,0,0,10,467,1,0,0,0,10,469,
+        1,0,0,0,10,471,1,0,0,0,10,473,1,0,0,0,10,475,1,0,0,0,10,477,1,0,
+        0,0,10,479,1,0,0,0,10,481,1,0,0,0,10,483,1,0,0,0,10,485,1,0,0,0,
+        10,487,1,0,0,0,10,489,1,0,0,0,10,491,1,0,0,0,10,493,1,0,0,0,10,495,
+        1,0,0,0,10,497,1,0,0,0,10,499,1,0,0,0,10,501,1,0,0,0,10,503,1,0,
+        0,0,10,505,1,0,0,0,10,507,1,0,0,0,10,509,1,0,0,0,10,511,1,0,0,0,
+        10,513,1,0,0,0,10,515,1,0,0,0,10,517,1,0,0,0,10,519,1,0,0,0,10,521,
+        1,0,0,0,10,523,1,0,0,0,10,525,1,0,0,0,10,527,1,0,0,0,11,529,1,0,
+        0,0,11,531,1,0,0,0,11,533,1,0,0,0,11,535,1,0,0,0,11,537,1,0,0,0,
+        11,539,1,0,0,0,11,541,1,0,0,0,11,543,1,0,0,0,11,545,1,0,0,0,11,547,
+        1,0,0,0,11,549,1,0,0,0,11,551,1,0,0,0,11,553,1,0,0,0,11,555,1,0,
+        0,0,11,557,1,0,0,0,11,559,1,0,0,0,11,561,1,0,0,0,11,563,1,0,0,0,
+        11,565,1,0,0,0,11,567,1,0,0,0,11,569,1,0,0,0,11,571,1,0,0,0,11,573,
+        1,0,0,0,11,575,1,0,0,0,11,577,1,0,0,0,11,579,1,0,0,0,11,581,1,0,
+        0,0,11,583,1,0,0,0,11,585,1,0,0,0,11,587,1,0,0,0,11,589,1,0,0,0,
+        11,591,1,0,0,0,11,593,1,0,0,0,11,595,1,0,0,0,11,597,1,0,0,0,11,599,
+        1,0,0,0,11,601,1,0,0,0,11,603,1,0,0,0,11,605,1,0,0,0,11,607,1,0,
+        0,0,11,609,1,0,0,0,11,611,1,0,0,0,11,613,1,0,0,0,11,615,1,0,0,0,
+        11,617,1,0,0,0,11,619,1,0,0,0,11,621,1,0,0,0,11,623,1,0,0,0,11,625,
+        1,0,0,0,11,627,1,0,0,0,11,629,1,0,0,0,11,631,1,0,0,0,11,633,1,0,
+        0,0,11,635,1,0,0,0,11,637,1,0,0,0,11,639,1,0,0,0,11,641,1,0,0,0,
+        11,643,1,0,0,0,11,645,1,0,0,0,11,647,1,0,0,0,11,649,1,0,0,0,11,651,
+        1,0,0,0,11,653,1,0,0,0,11,655,1,0,0,0,11,657,1,0,0,0,11,659,1,0,
+        0,0,11,661,1,0,0,0,11,663,1,0,0,0,11,665,1,0,0,0,11,667,1,0,0,0,
+        11,669,1,0,0,0,11,671,1,0,0,0,11,673,1,0,0,0,11,675,1,0,0,0,11,677,
+        1,0,0,0,11,679,1,0,0,0,11,681,1,0,0,0,11,683,1,0,0,0,11,685,1,0,
+        0,0,11,687,1,0,0,0,11,689,1,0,0,0,11,691,1,0,0,0,11,693,1,0,0,0,
+        11,695,1,0,0,0,11,697,1,0,0,0,11,699,1,0,0,0,11,701,1,0,0,0,11,703,
+        1,0,0,0,11,705,1,0,0,0,11,707,1,0,0,0,11,709,1,0,0,0,11,711,1,0,
+        0,0,11,713,1,0,0,0,11,715,1,0,0,0,11,717,1,0,0,0,11,719,1,0,0,0,
+        11,721,1,0,0,0,11,723,1,0,0,0,11,725,1,0,0,0,11,727,1,0,0,0,11,729,
+        1,0,0,0,11,731,1,0,0,0,11,733,1,0,0,0,11,735,1,0,0,0,11,737,1,0,
+        0,0,11,739,1,0,0,0,11,741,1,0,0,0,11,743,1,0,0,0,11,745,1,0,0,0,
+        11,747,1,0,0,0,11,749,1,0,0,0,11,751,1,0,0,0,11,753,1,0,0,0,11,755,
+        1,0,0,0,11,757,1,0,0,0,11,759,1,0,0,0,11,761,1,0,0,0,11,763,1,0,
+        0,0,11,765,1,0,0,0,11,767,1,0,0,0,11,769,1,0,0,0,11,771,1,0,0,0,
+        11,773,1,0,0,0,11,775,1,0,0,0,11,777,1,0,0,0,11,779,1,0,0,0,11,781,
+        1,0,0,0,11,783,1,0,0,0,11,785,1,0,0,0,11,787,1,0,0,0,11,789,1,0,
+        0,0,11,791,1,0,0,0,11,793,1,0,0,0,11,795,1,0,0,0,11,797,1,0,0,0,
+        11,799,1,0,0,0,11,801,1,0,0,0,11,803,1,0,0,0,11,805,1,0,0,0,11,807,
+        1,0,0,0,11,809,1,0,0,0,11,811,1,0,0,0,11,813,1,0,0,0,11,815,1,0,
+        0,0,11,817,1,0,0,0,11,819,1,0,0,0,11,821,1,0,0,0,11,823,1,0,0,0,
+        11,825,1,0,0,0,11,827,1,0,0,0,11,829,1,0,0,0,11,831,1,0,0,0,11,833,
+        1,0,0,0,11,835,1,0,0,0,11,837,1,0,0,0,11,839,1,0,0,0,11,841,1,0,
+        0,0,11,843,1,0,0,0,11,845,1,0,0,0,11,847,1,0,0,0,11,849,1,0,0,0,
+        11,851,1,0,0,0,11,853,1,0,0,0,11,855,1,0,0,0,11,857,1,0,0,0,11,859,
+        1,0,0,0,11,861,1,0,0,0,11,863,1,0,0,0,11,865,1,0,0,0,11,867,1,0,
+        0,0,11,869,1,0,0,0,11,871,1,0,0,0,11,873,1,0,0,0,11,875,1,0,0,0,
+        11,877,1,0,0,0,11,879,1,0,0,0,11,881,1,0,0,0,11,883,1,0,0,0,11,885,
+        1,0,0,0,11,887,1,0,0,0,11,889,1,0,0,0,11,891,1,0,0,0,11,893,1,0,
+        0,0,11,895,1,0,0,0,11,897,1,0,0,0,11,899,1,0,0,0,11,901,1,0,0,0,
+        11,903,1,0,0,0,11,905,1,0,0,0,11,907,1,0,0,0,11,909,1,0,0,0,11,911,
+        1,0,0,0,11,913,1,0,0,0,11,915,1,0,0,0,11,917,1,0,0,0,11,919,1,0,
+        0,0,11,921,1,0,0,0,11,923,1,0,0,0,11,925,1,0,0,0,11,927,1,0,0,0,
+        11,929,1,0,0,0,11,931,1,0,0,0,11,933,1,0,0,0,11,935,1,0,0,0,11,937,
+        1,0,0,0,11,939,1,0,0,0,11,941,1,0,0,0,11,943,1,0,0,0,11,945,1,0,
+        0,0,11,947,1,0,0,0,11,949,1,0,0,0,11,951,1,0,0,0,11,953,1,0,0,0,
+        11,955,1,0,0,0,11,957,1,0,0,0,11,959,1,0,0,0,11,961,1,0,0,0,11,963,
+        1,0,0,0,11,965,1,0,0,0,11,967,1,0,0,0,11,969,1,0,0,0,11,971,1,0,
+        0,0,11,973,1,0,0,0,11,975,1,0,0,0,11,977,1,0,0,0,11,979,1,0,0,0,
+        11,981,1,0,0,0,11,983,1,0,0,0,11,985,1,0,0,0,11,987,1,0,0,0,11,989,
+        1,0,0,0,11,991,1,0,0,0,11,993,1,0,0,0,11,995,1,0,0,0,11,997,1,0,
+        0,0,11,999,1,0,0,0,11,1001,1,0,0,0,11,1003,1,0,0,0,11,1005,1,0,0,
+        0,11,1007,1,0,0,0,11,1009,1,0,0,0,11,1011,1,0,0,0,11,1013,1,0,0,
+        0,11,1015,1,0,0,0,11,1017,1,0,0,0,11,1019,1,0,0,0,11,1021,1,0,0,
+        0,11,1023,1,0,0,0,11,1025,1,0,0,0,11,1027,1,0,0,0,11,1029,1,0,0,
+        0,11,1031,1,0,0,0,11,1033,1,0,0,0,11,1035,1,0,0,0,11,1037,1,0,0,
+        0,11,1039,1,0,0,0,11,1041,1,0,0,0,11,1043,1,0,0,0,11,1045,1,0,0,
+        0,11,1047,1,0,0,0,11,1049,1,0,0,0,11,1051,1,0,0,0,11,1053,1,0,0,
+        0,11,1055,1,0,0,0,11,1057,1,0,0,0,11,1059,1,0,0,0,11,1061,1,0,0,
+        0,11,1063,1,0,0,0,11,1065,1,0,0,0,11,1067,1,0,0,0,11,1069,1,0,0,
+        0,11,1071,1,0,0,0,11,1073,1,0,0,0,11,1075,1,0,0,0,11,1077,1,0,0,
+        0,11,1079,1,0,0,0,11,1081,1,0,0,0,11,1083,1,0,0,0,11,1085,1,0,0,
+        0,11,1087,1,0,0,0,11,1089,1,0,0,0,11,1091,1,0,0,0,11,1093,1,0,0,
+        0,11,1095,1,0,0,0,11,1097,1,0,0,0,11,1099,1,0,0,0,11,1101,1,0,0,
+        0,11,1103,1,0,0,0,11,1105,1,0,0,0,11,1107,1,0,0,0,11,1109,1,0,0,
+        0,11,1111,1,0,0,0,11,1113,1,0,0,0,11,1115,1,0,0,0,11,1117,1,0,0,
+        0,11,1119,1,0,0,0,11,1121,1,0,0,0,11,1123,1,0,0,0,11,1125,1,0,0,
+        0,11,1127,1,0,0,0,11,1129,1,0,0,0,11,1131,1,0,0,0,11,1133,1,0,0,
+        0,11,1135,1,0,0,0,11,1137,1,0,0,0,11,1139,1,0,0,0,11,1141,1,0,0,
+        0,11,1143,1,0,0,0,11,1145,1,0,0,0,11,1147,1,0,0,0,11,1149,1,0,0,
+        0,11,1151,1,0,0,0,11,1153,1,0,0,0,11,1155,1,0,0,0,11,1157,1,0,0,
+        0,11,1159,1,0,0,0,11,1161,1,0,0,0,11,1163,1,0,0,0,11,1165,1,0,0,
+        0,11,1167,1,0,0,0,11,1169,1,0,0,0,11,1171,1,0,0,0,11,1173,1,0,0,
+        0,11,1175,1,0,0,0,11,1177,1,0,0,0,11,1179,1,0,0,0,11,1181,1,0,0,
+        0,11,1183,1,0,0,0,11,1185,1,0,0,0,11,1187,1,0,0,0,11,1189,1,0,0,
+        0,11,1191,1,0,0,0,11,1193,1,0,0,0,11,1195,1,0,0,0,11,1197,1,0,0,
+        0,11,1199,1,0,0,0,11,1201,1,0,0,0,11,1203,1,0,0,0,11,1205,1,0,0,
+        0,11,1207,1,0,0,0,11,1209,1,0,0,0,11,1211,1,0,0,0,11,1213,1,0,0,
+        0,11,1215,1,0,0,0,12,1217,1,0,0,0,12,1219,1,0,0,0,12,1221,1,0,0,
+        0,12,1223,1,0,0,0,12,1225,1,0,0,0,12,1227,1,0,0,0,12,1229,1,0,0,
+        0,12,1231,1,0,0,0,12,1233,1,0,0,0,12,1235,1,0,0,0,12,1237,1,0,0,
+        0,12,1239,1,0,0,0,12,1241,1,0,0,0,12,1243,1,0,0,0,12,1245,1,0,0,
+        0,12,1247,1,0,0,0,12,1249,1,0,0,0,12,1251,1,0,0,0,12,1253,1,0,0,
+        0,12,1255,1,0,0,0,12,1257,1,0,0,0,12,1259,1,0,0,0,12,1261,1,0,0,
+        0,12,1263,1,0,0,0,12,1265,1,0,0,0,12,1267,1,0,0,0,12,1269,1,0,0,
+        0,12,1271,1,0,0,0,12,1273,1,0,0,0,12,1275,1,0,0,0,12,1277,1,0,0,
+        0,12,1279,1,0,0,0,12,1281,1,0,0,0,13,1283,1,0,0,0,13,1285,1,0,0,
+        0,13,1287,1,0,0,0,14,1289,1,0,0,0,14,1291,1,0,0,0,14,1293,1,0,0,
+        0,14,1295,1,0,0,0,14,1297,1,0,0,0,14,1299,1,0,0,0,14,1301,1,0,0,
+        0,14,1303,1,0,0,0,14,1305,1,0,0,0,14,1307,1,0,0,0,14,1309,1,0,0,
+        0,14,1311,1,0,0,0,14,1313,1,0,0,0,14,1315,1,0,0,0,14,1317,1,0,0,
+        0,14,1319,1,0,0,0,14,1321,1,0,0,0,14,1323,1,0,0,0,14,1325,1,0,0,
+        0,14,1327,1,0,0,0,14,1329,1,0,0,0,14,1331,1,0,0,0,14,1333,1,0,0,
+        0,14,1335,1,0,0,0,14,1337,1,0,0,0,14,1339,1,0,0,0,14,1341,1,0,0,
+        0,14,1343,1,0,0,0,14,1345,1,0,0,0,14,1347,1,0,0,0,14,1349,1,0,0,
+        0,14,1351,1,0,0,0,14,1353,1,0,0,0,14,1355,1,0,0,0,14,1357,1,0,0,
+        0,14,1359,1,0,0,0,14,1361,1,0,0,0,14,1363,1,0,0,0,14,1365,1,0,0,
+        0,14,1367,1,0,0,0,14,1369,1,0,0,0,14,1371,1,0,0,0,14,1373,1,0,0,
+        0,14,1375,1,0,0,0,14,1377,1,0,0,0,14,1379,1,0,0,0,14,1381,1,0,0,
+        0,14,1383,1,0,0,0,14,1385,1,0,0,0,14,1387,1,0,0,0,14,1389,1,0,0,
+        0,14,1391,1,0,0,0,14,1393,1,0,0,0,14,1395,1,0,0,0,14,1397,1,0,0,
+        0,14,1399,1,0,0,0,14,1401,1,0,0,0,14,1403,1,0,0,0,14,1405,1,0,0,
+        0,14,1407,1,0,0,0,14,1409,1,0,0,0,14,1411,1,0,0,0,14,1413,1,0,0,
+        0,14,1415,1,0,0,0,14,1417,1,0,0,0,14,1419,1,0,0,0,14,1421,1,0,0,
+        0,14,1423,1,0,0,0,14,1425,1,0,0,0,14,1427,1,0,0,0,14,1429,1,0,0,
+        0,14,1431,1,0,0,0,14,1433,1,0,0,0,14,1435,1,0,0,0,14,1437,1,0,0,
+        0,14,1439,1,0,0,0,14,1441,1,0,0,0,14,1443,1,0,0,0,14,1445,1,0,0,
+        0,14,1447,1,0,0,0,14,1449,1,0,0,0,14,1451,1,0,0,0,14,1453,1,0,0,
+        0,14,1455,1,0,0,0,14,1457,1,0,0,0,14,1459,1,0,0,0,14,1461,1,0,0,
+        0,14,1463,1,0,0,0,14,1465,1,0,0,0,14,1467,1,0,0,0,14,1469,1,0,0,
+        0,14,1471,1,0,0,0,14,1473,1,0,0,0,14,1475,1,0,0,0,14,1477,1,0,0,
+        0,14,1479,1,0,0,0,14,1481,1,0,0,0,14,1483,1,0,0,0,14,1485,1,0,0,
+        0,14,1487,1,0,0,0,14,1489,1,0,0,0,14,1491,1,0,0,0,15,1493,1,0,0,
+        0,15,1495,1,0,0,0,15,1497,1,0,0,0,16,1499,1,0,0,0,16,1501,1,0,0,
+        0,16,1503,1,0,0,0,16,1505,1,0,0,0,16,1507,1,0,0,0,16,1509,1,0,0,
+        0,16,1511,1,0,0,0,16,1513,1,0,0,0,17,1515,1,0,0,0,17,1517,1,0,0,
+        0,18,1519,1,0,0,0,19,1521,1,0,0,0,19,1523,1,0,0,0,19,1525,1,0,0,
+        0,19,1527,1,0,0,0,20,1529,1,0,0,0,20,1531,1,0,0,0,20,1533,1,0,0,
+        0,20,1535,1,0,0,0,21,1537,1,0,0,0,21,1539,1,0,0,0,21,1541,1,0,0,
+        0,22,1543,1,0,0,0,22,1545,1,0,0,0,22,1547,1,0,0,0,22,1549,1,0,0,
+        0,23,1551,1,0,0,0,23,1553,1,0,0,0,23,1555,1,0,0,0,24,1557,1,0,0,
+        0,24,1559,1,0,0,0,24,1561,1,0,0,0,24,1563,1,0,0,0,24,1565,1,0,0,
+        0,24,1567,1,0,0,0,24,1569,1,0,0,0,24,1571,1,0,0,0,24,1573,1,0,0,
+        0,24,1575,1,0,0,0,24,1577,1,0,0,0,25,1579,1,0,0,0,25,1581,1,0,0,
+        0,25,1583,1,0,0,0,25,1585,1,0,0,0,25,1587,1,0,0,0,25,1589,1,0,0,
+        0,25,1591,1,0,0,0,25,1593,1,0,0,0,25,1595,1,0,0,0,25,1597,1,0,0,
+        0,25,1599,1,0,0,0,25,1601,1,0,0,0,25,1603,1,0,0,0,25,1605,1,0,0,
+        0,25,1607,1,0,0,0,25,1609,1,0,0,0,25,1611,1,0,0,0,25,1613,1,0,0,
+        0,25,1615,1,0,0,0,25,1617,1,0,0,0,25,1619,1,0,0,0,26,1621,1,0,0,
+        0,26,1623,1,0,0,0,26,1625,1,0,0,0,26,1627,1,0,0,0,26,1629,1,0,0,
+        0,26,1631,1,0,0,0,27,1633,1,0,0,0,27,1635,1,0,0,0,27,1637,1,0,0,
+        0,27,1639,1,0,0,0,27,1641,1,0,0,0,28,1643,1,0,0,0,28,1645,1,0,0,
+        0,28,1647,1,0,0,0,28,1649,1,0,0,0,28,1651,1,0,0,0,28,1653,1,0,0,
+        0,28,1655,1,0,0,0,28,1657,1,0,0,0,28,1659,1,0,0,0,28,1661,1,0,0,
+        0,28,1663,1,0,0,0,28,1665,1,0,0,0,28,1667,1,0,0,0,28,1669,1,0,0,
+        0,28,1671,1,0,0,0,28,1673,1,0,0,0,28,1675,1,0,0,0,29,1677,1,0,0,
+        0,29,1679,1,0,0,0,29,1681,1,0,0,0,29,1683,1,0,0,0,29,1685,1,0,0,
+        0,29,1687,1,0,0,0,29,1689,1,0,0,0,29,1691,1,0,0,0,29,1693,1,0,0,
+        0,29,1695,1,0,0,0,29,1697,1,0,0,0,29,1699,1,0,0,0,29,1701,1,0,0,
+        0,30,1703,1,0,0,0,30,1705,1,0,0,0,31,1707,1,0,0,0,31,1709,1,0,0,
+        0,31,1711,1,0,0,0,31,1713,1,0,0,0,31,1715,1,0,0,0,31,1717,1,0,0,
+        0,31,1719,1,0,0,0,32,1721,1,0,0,0,32,1723,1,0,0,0,32,1725,1,0,0,
+        0,32,1727,1,0,0,0,32,1729,1,0,0,0,32,1731,1,0,0,0,32,1733,1,0,0,
+        0,32,1735,1,0,0,0,32,1737,1,0,0,0,32,1739,1,0,0,0,32,1741,1,0,0,
+        0,32,1743,1,0,0,0,32,1745,1,0,0,0,32,1747,1,0,0,0,32,1749,1,0,0,
+        0,32,1751,1,0,0,0,32,1753,1,0,0,0,32,1755,1,0,0,0,32,1757,1,0,0,
+        0,32,1759,1,0,0,0,32,1761,1,0,0,0,32,1763,1,0,0,0,32,1765,1,0,0,
+        0,32,1767,1,0,0,0,32,1769,1,0,0,0,32,1771,1,0,0,0,32,1773,1,0,0,
+        0,32,1775,1,0,0,0,32,1777,1,0,0,0,32,1779,1,0,0,0,32,1781,1,0,0,
+        0,32,1783,1,0,0,0,32,1785,1,0,0,0,32,1787,1,0,0,0,32,1789,1,0,0,
+        0,32,1791,1,0,0,0,32,1793,1,0,0,0,32,1795,1,0,0,0,32,1797,1,0,0,
+        0,32,1799,1,0,0,0,32,1801,1,0,0,0,32,1803,1,0,0,0,32,1805,1,0,0,
+        0,32,1807,1,0,0,0,32,1809,1,0,0,0,32,1811,1,0,0,0,32,1813,1,0,0,
+        0,32,1815,1,0,0,0,32,1817,1,0,0,0,32,1819,1,0,0,0,32,1821,1,0,0,
+        0,32,1823,1,0,0,0,32,1825,1,0,0,0,32,1827,1,0,0,0,32,1829,1,0,0,
+        0,32,1831,1,0,0,0,32,1833,1,0,0,0,32,1835,1,0,0,0,32,1837,1,0,0,
+        0,32,1839,1,0,0,0,32,1841,1,0,0,0,32,1843,1,0,0,0,32,1845,1,0,0,
+        0,32,1847,1,0,0,0,32,1849,1,0,0,0,32,1851,1,0,0,0,32,1853,1,0,0,
+        0,32,1855,1,0,0,0,32,1857,1,0,0,0,32,1859,1,0,0,0,32,1861,1,0,0,
+        0,32,1863,1,0,0,0,32,1865,1,0,0,0,32,1867,1,0,0,0,32,1869,1,0,0,
+        0,32,1871,1,0,0,0,32,1873,1,0,0,0,32,1875,1,0,0,0,32,1877,1,0,0,
+        0,32,1879,1,0,0,0,32,1881,1,0,0,0,32,1883,1,0,0,0,32,1885,1,0,0,
+        0,32,1887,1,0,0,0,32,1889,1,0,0,0,32,1891,1,0,0,0,32,1893,1,0,0,
+        0,32,1895,1,0,0,0,32,1897,1,0,0,0,32,1899,1,0,0,0,32,1901,1,0,0,
+        0,32,1903,1,0,0,0,32,1905,1,0,0,0,32,1907,1,0,0,0,32,1909,1,0,0,
+        0,32,1911,1,0,0,0,32,1913,1,0,0,0,32,1915,1,0,0,0,32,1917,1,0,0,
+        0,32,1919,1,0,0,0,32,1921,1,0,0,0,32,1923,1,0,0,0,32,1925,1,0,0,
+        0,32,1927,1,0,0,0,32,1929,1,0,0,0,32,1931,1,0,0,0,32,1933,1,0,0,
+        0,32,1935,1,0,0,0,32,1937,1,0,0,0,32,1939,1,0,0,0,32,1941,1,0,0,
+        0,32,1943,1,0,0,0,32,1945,1,0,0,0,32,1947,1,0,0,0,32,1949,1,0,0,
+        0,32,1951,1,0,0,0,32,1953,1,0,0,0,32,1955,1,0,0,0,32,1957,1,0,0,
+        0,32,1959,1,0,0,0,32,1961,1,0,0,0,32,1963,1,0,0,0,32,1965,1,0,0,
+        0,32,1967,1,0,0,0,32,1969,1,0,0,0,32,1971,1,0,0,0,32,1973,1,0,0,
+        0,32,1975,1,0,0,0,32,1977,1,0,0,0,32,1979,1,0,0,0,32,1981,1,0,0,
+        0,32,1983,1,0,0,0,32,1985,1,0,0,0,32,1987,1,0,0,0,32,1989,1,0,0,
+        0,32,1991,1,0,0,0,32,1993,1,0,0,0,32,1995,1,0,0,0,32,1997,1,0,0,
+        0,32,1999,1,0,0,0,32,2001,1,0,0,0,32,2003,1,0,0,0,32,2005,1,0,0,
+        0,32,2007,1,0,0,0,32,2009,1,0,0,0,32,2011,1,0,0,0,32,2013,1,0,0,
+        0,32,2015,1,0,0,0,32,2017,1,0,0,0,32,2019,1,0,0,0,32,2021,1,0,0,
+        0,32,2023,1,0,0,0,32,2025,1,0,0,0,32,2027,1,0,0,0,32,2029,1,0,0,
+        0,32,2031,1,0,0,0,32,2033,1,0,0,0,32,2035,1,0,0,0,32,2037,1,0,0,
+        0,32,2039,1,0,0,0,32,2041,1,0,0,0,32,2043,1,0,0,0,32,2045,1,0,0,
+        0,32,2047,1,0,0,0,32,2049,1,0,0,0,32,2051,1,0,0,0,32,2053,1,0,0,
+        0,32,2055,1,0,0,0,32,2057,1,0,0,0,32,2059,1,0,0,0,32,2061,1,0,0,
+        0,32,2063,1,0,0,0,32,2065,1,0,0,0,32,2067,1,0,0,0,32,2069,1,0,0,
+        0,32,2071,1,0,0,0,32,2073,1,0,0,0,32,2075,1,0,0,0,32,2077,1,0,0,
+        0,32,2079,1,0,0,0,32,2081,1,0,0,0,32,2083,1,0,0,0,32,2085,1,0,0,
+        0,32,2087,1,0,0,0,32,2089,1,0,0,0,32,2091,1,0,0,0,32,2093,1,0,0,
+        0,32,2095,1,0,0,0,32,2097,1,0,0,0,32,2099,1,0,0,0,32,2101,1,0,0,
+        0,32,2103,1,0,0,0,32,2105,1,0,0,0,32,2107,1,0,0,0,32,2109,1,0,0,
+        0,32,2111,1,0,0,0,32,2113,1,0,0,0,32,2115,1,0,0,0,32,2117,1,0,0,
+        0,32,2119,1,0,0,0,32,2121,1,0,0,0,32,2123,1,0,0,0,32,2125,1,0,0,
+        0,32,2127,1,0,0,0,32,2129,1,0,0,0,32,2131,1,0,0,0,32,2133,1,0,0,
+        0,32,2135,1,0,0,0,32,2137,1,0,0,0,32,2139,1,0,0,0,32,2141,1,0,0,
+        0,32,2143,1,0,0,0,32,2145,1,0,0,0,32,2147,1,0,0,0,32,2149,1,0,0,
+        0,32,2151,1,0,0,0,32,2153,1,0,0,0,32,2155,1,0,0,0,32,2157,1,0,0,
+        0,32,2159,1,0,0,0,32,2161,1,0,0,0,32,2163,1,0,0,0,32,2165,1,0,0,
+        0,32,2167,1,0,0,0,32,2169,1,0,0,0,32,2171,1,0,0,0,32,2173,1,0,0,
+        0,32,2175,1,0,0,0,32,2177,1,0,0,0,32,2179,1,0,0,0,32,2181,1,0,0,
+        0,32,2183,1,0,0,0,32,2185,1,0,0,0,32,2187,1,0,0,0,32,2189,1,0,0,
+        0,32,2191,1,0,0,0,32,2193,1,0,0,0,32,2195,1,0,0,0,32,2197,1,0,0,
+        0,32,2199,1,0,0,0,32,2201,1,0,0,0,32,2203,1,0,0,0,32,2205,1,0,0,
+        0,32,2207,1,0,0,0,32,2209,1,0,0,0,32,2211,1,0,0,0,32,2213,1,0,0,
+        0,32,2215,1,0,0,0,32,2217,1,0,0,0,32,2219,1,0,0,0,32,2221,1,0,0,
+        0,32,2223,1,0,0,0,32,2225,1,0,0,0,32,2227,1,0,0,0,32,2229,1,0,0,
+        0,32,2231,1,0,0,0,32,2233,1,0,0,0,32,2235,1,0,0,0,32,2237,1,0,0,
+        0,32,2239,1,0,0,0,32,2241,1,0,0,0,32,2243,1,0,0,0,32,2245,1,0,0,
+        0,32,2247,1,0,0,0,32,2249,1,0,0,0,32,2251,1,0,0,0,32,2253,1,0,0,
+        0,32,2255,1,0,0,0,32,2257,1,0,0,0,32,2259,1,0,0,0,32,2261,1,0,0,
+        0,32,2263,1,0,0,0,32,2265,1,0,0,0,32,2267,1,0,0,0,32,2269,1,0,0,
+        0,32,2271,1,0,0,0,32,2273,1,0,0,0,32,2275,1,0,0,0,32,2277,1,0,0,
+        0,32,2279,1,0,0,0,32,2281,1,0,0,0,32,2283,1,0,0,0,32,2285,1,0,0,
+        0,32,2287,1,0,0,0,32,2289,1,0,0,0,32,2291,1,0,0,0,32,2293,1,0,0,
+        0,32,2295,1,0,0,0,32,2297,1,0,0,0,32,2299,1,0,0,0,32,2301,1,0,0,
+        0,32,2303,1,0,0,0,32,2305,1,0,0,0,32,2307,1,0,0,0,32,2309,1,0,0,
+        0,32,2311,1,0,0,0,32,2313,1,0,0,0,32,2315,1,0,0,0,32,2317,1,0,0,
+        0,32,2319,1,0,0,0,32,2321,1,0,0,0,32,2323,1,0,0,0,32,2325,1,0,0,
+        0,32,2327,1,0,0,0,32,2329,1,0,0,0,32,2331,1,0,0,0,32,2333,1,0,0,
+        0,32,2335,1,0,0,0,32,2337,1,0,0,0,32,2339,1,0,0,0,32,2341,1,0,0,
+        0,32,2343,1,0,0,0,32,2345,1,0,0,0,32,2347,1,0,0,0,32,2349,1,0,0,
+        0,32,2351,1,0,0,0,32,2353,1,0,0,0,32,2355,1,0,0,0,32,2357,1,0,0,
+        0,32,2359,1,0,0,0,32,2361,1,0,0,0,32,2363,1,0,0,0,32,2365,1,0,0,
+        0,32,2367,1,0,0,0,32,2369,1,0,0,0,32,2371,1,0,0,0,32,2373,1,0,0,
+        0,32,2375,1,0,0,0,32,2377,1,0,0,0,32,2379,1,0,0,0,32,2381,1,0,0,
+        0,32,2383,1,0,0,0,32,2385,1,0,0,0,32,2387,1,0,0,0,32,2389,1,0,0,
+        0,32,2391,1,0,0,0,32,2393,1,0,0,0,32,2395,1,0,0,0,32,2397,1,0,0,
+        0,32,2399,1,0,0,0,32,2401,1,0,0,0,32,2403,1,0,0,0,32,2405,1,0,0,
+        0,32,2407,1,0,0,0,32,2409,1,0,0,0,32,2411,1,0,0,0,32,2413,1,0,0,
+        0,32,2415,1,0,0,0,32,2417,1,0,0,0,32,2419,1,0,0,0,32,2421,1,0,0,
+        0,32,2423,1,0,0,0,32,2425,1,0,0,0,32,2427,1,0,0,0,32,2429,1,0,0,
+        0,32,2431,1,0,0,0,32,2433,1,0,0,0,32,2435,1,0,0,0,32,2437,1,0,0,
+        0,32,2439,1,0,0,0,32,2441,1,0,0,0,32,2443,1,0,0,0,32,2445,1,0,0,
+        0,32,2447,1,0,0,0,33,2449,1,0,0,0,33,2451,1,0,0,0,33,2453,1,0,0,
+        0,34,2455,1,0,0,0,34,2457,1,0,0,0,34,2459,1,0,0,0,34,2461,1,0,0,
+        0,35,2463,1,0,0,0,35,2465,1,0,0,0,36,2467,1,0,0,0,36,2469,1,0,0,
+        0,36,2471,1,0,0,0,37,2473,1,0,0,0,37,2475,1,0,0,0,38,2477,1,0,0,
+        0,38,2479,1,0,0,0,38,2481,1,0,0,0,38,2483,1,0,0,0,38,2485,1,0,0,
+        0,38,2487,1,0,0,0,38,2489,1,0,0,0,38,2491,1,0,0,0,38,2493,1,0,0,
+        0,38,2495,1,0,0,0,38,2497,1,0,0,0,38,2499,1,0,0,0,38,2501,1,0,0,
+        0,38,2503,1,0,0,0,38,2505,1,0,0,0,38,2507,1,0,0,0,38,2509,1,0,0,
+        0,39,2511,1,0,0,0,39,2513,1,0,0,0,39,2515,1,0,0,0,39,2517,1,0,0,
+        0,39,2519,1,0,0,0,39,2521,1,0,0,0,39,2523,1,0,0,0,39,2525,1,0,0,
+        0,39,2527,1,0,0,0,40,2529,1,0,0,0,40,2531,1,0,0,0,40,2533,1,0,0,
+        0,40,2535,1,0,0,0,40,2537,1,0,0,0,41,2539,1,0,0,0,41,2541,1,0,0,
+        0,41,2543,1,0,0,0,42,2547,1,0,0,0,42,2549,1,0,0,0,42,2551,1,0,0,
+        0,42,2553,1,0,0,0,42,2555,1,0,0,0,42,2557,1,0,0,0,42,2559,1,0,0,
+        0,42,2561,1,0,0,0,42,2563,1,0,0,0,42,2565,1,0,0,0,42,2567,1,0,0,
+        0,42,2569,1,0,0,0,42,2571,1,0,0,0,43,2573,1,0,0,0,43,2575,1,0,0,
+        0,43,2577,1,0,0,0,43,2579,1,0,0,0,43,2581,1,0,0,0,44,2583,1,0,0,
+        0,45,2585,1,0,0,0,45,2587,1,0,0,0,45,2589,1,0,0,0,45,2591,1,0,0,
+        0,45,2593,1,0,0,0,45,2595,1,0,0,0,45,2597,1,0,0,0,45,2599,1,0,0,
+        0,45,2601,1,0,0,0,45,2603,1,0,0,0,45,2605,1,0,0,0,46,2607,1,0,0,
+        0,46,2609,1,0,0,0,46,2611,1,0,0,0,46,2613,1,0,0,0,46,2615,1,0,0,
+        0,46,2617,1,0,0,0,46,2619,1,0,0,0,46,2621,1,0,0,0,47,2623,1,0,0,
+        0,49,2640,1,0,0,0,51,2649,1,0,0,0,53,2654,1,0,0,0,55,2738,1,0,0,
+        0,57,2748,1,0,0,0,59,2754,1,0,0,0,61,2760,1,0,0,0,63,2762,1,0,0,
+        0,65,2764,1,0,0,0,67,2766,1,0,0,0,69,2772,1,0,0,0,71,2778,1,0,0,
+        0,73,2785,1,0,0,0,75,2790,1,0,0,0,77,2795,1,0,0,0,79,2800,1,0,0,
+        0,81,2807,1,0,0,0,83,2814,1,0,0,0,85,2819,1,0,0,0,87,2824,1,0,0,
+        0,89,2829,1,0,0,0,91,2841,1,0,0,0,93,2847,1,0,0,0,95,2860,1,0,0,
+        0,97,2874,1,0,0,0,99,2887,1,0,0,0,101,2894,1,0,0,0,103,2904,1,0,
+        0,0,105,2982,1,0,0,0,107,2988,1,0,0,0,109,2994,1,0,0,0,111,3003,
+        1,0,0,0,113,3016,1,0,0,0,115,3026,1,0,0,0,117,3036,1,0,0,0,119,3045,
+        1,0,0,0,121,3052,1,0,0,0,123,3063,1,0,0,0,125,3071,1,0,0,0,127,3082,
+        1,0,0,0,129,3089,1,0,0,0,131,3099,1,0,0,0,133,3111,1,0,0,0,135,3117,
+        1,0,0,0,137,3125,1,0,0,0,139,3135,1,0,0,0,141,3144,1,0,0,0,143,3149,
+        1,0,0,0,145,3153,1,0,0,0,147,3159,1,0,0,0,149,3163,1,0,0,0,151,3167,
+        1,0,0,0,153,3172,1,0,0,0,155,3177,1,0,0,0,157,3182,1,0,0,0,159,3187,
+        1,0,0,0,161,3192,1,0,0,0,163,3196,1,0,0,0,165,3204,1,0,0,0,167,3208,
+        1,0,0,0,169,3213,1,0,0,0,171,3217,1,0,0,0,173,3221,1,0,0,0,175,3223,
+        1,0,0,0,177,3227,1,0,0,0,179,3231,1,0,0,0,181,3236,1,0,0,0,183,3244,
+        1,0,0,0,185,3253,1,0,0,0,187,3261,1,0,0,0,189,3266,1,0,0,0,191,3275,
+        1,0,0,0,193,3284,1,0,0,0,195,3291,1,0,0,0,197,3295,1,0,0,0,199,3299,
+        1,0,0,0,201,3308,1,0,0,0,203,3315,1,0,0,0,205,3323,1,0,0,0,207,3332,
+        1,0,0,0,209,3341,1,0,0,0,211,3349,1,0,0,0,213,3358,1,0,0,0,215,3368,
+        1,0,0,0,217,3379,1,0,0,0,219,3389,1,0,0,0,221,3396,1,0,0,0,223,3403,
+        1,0,0,0,225,3412,1,0,0,0,227,3420,1,0,0,0,229,3427,1,0,0,0,231,3437,
+        1,0,0,0,233,3445,1,0,0,0,235,3454,1,0,0,0,237,3462,1,0,0,0,239,3471,
+        1,0,0,0,241,3479,1,0,0,0,243,3487,1,0,0,0,245,3495,1,0,0,0,247,3504,
+        1,0,0,0,249,3517,1,0,0,0,251,3526,1,0,0,0,253,3535,1,0,0,0,255,3542,
+        1,0,0,0,257,3550,1,0,0,0,259,3557,1,0,0,0,261,3565,1,0,0,0,263,3571,
+        1,0,0,0,265,3577,1,0,0,0,267,3584,1,0,0,0,269,3592,1,0,0,0,271,3602,
+        1,0,0,0,273,3612,1,0,0,0,275,3620,1,0,0,0,277,3631,1,0,0,0,279,3639,
+        1,0,0,0,281,3647,1,0,0,0,283,3654,1,0,0,0,285,3662,1,0,0,0,287,3670,
+        1,0,0,0,289,3679,1,0,0,0,291,3688,1,0,0,0,293,3697,1,0,0,0,295,3707,
+        1,0,0,0,297,3714,1,0,0,0,299,3723,1,0,0,0,301,3733,1,0,0,0,303,3742,
+        1,0,0,0,305,3751,1,0,0,0,307,3760,1,0,0,0,309,3769,1,0,0,0,311,3778,
+        1,0,0,0,313,3786,1,0,0,0,315,3796,1,0,0,0,317,3806,1,0,0,0,319,3814,
+        1,0,0,0,321,3823,1,0,0,0,323,3835,1,0,0,0,325,3846,1,0,0,0,327,3854,
+        1,0,0,0,329,3863,1,0,0,0,331,3872,1,0,0,0,333,3881,1,0,0,0,335,3890,
+        1,0,0,0,337,3901,1,0,0,0,339,3912,1,0,0,0,341,3921,1,0,0,0,343,3930,
+        1,0,0,0,345,3941,1,0,0,0,347,3952,1,0,0,0,349,3960,1,0,0,0,351,3968,
+        1,0,0,0,353,3978,1,0,0,0,355,3993,1,0,0,0,357,3998,1,0,0,0,359,4003,
+        1,0,0,0,361,4008,1,0,0,0,363,4013,1,0,0,0,365,4018,1,0,0,0,367,4023,
+        1,0,0,0,369,4028,1,0,0,0,371,4033,1,0,0,0,373,4038,1,0,0,0,375,4043,
+        1,0,0,0,377,4048,1,0,0,0,379,4053,1,0,0,0,381,4058,1,0,0,0,383,4063,
+        1,0,0,0,385,4068,1,0,0,0,387,4073,1,0,0,0,389,4078,1,0,0,0,391,4083,
+        1,0,0,0,393,4088,1,0,0,0,395,4093,1,0,0,0,397,4098,1,0,0,0,399,4103,
+        1,0,0,0,401,4108,1,0,0,0,403,4113,1,0,0,0,405,4118,1,0,0,0,407,4123,
+        1,0,0,0,409,4128,1,0,0,0,411,4133,1,0,0,0,413,4138,1,0,0,0,415,4143,
+        1,0,0,0,417,4148,1,0,0,0,419,4153,1,0,0,0,421,4158,1,0,0,0,423,4163,
+        1,0,0,0,425,4168,1,0,0,0,427,4173,1,0,0,0,429,4178,1,0,0,0,431,4183,
+        1,0,0,0,433,4188,1,0,0,0,435,4193,1,0,0,0,437,4198,1,0,0,0,439,4203,
+        1,0,0,0,441,4208,1,0,0,0,443,4213,1,0,0,0,445,4218,1,0,0,0,447,4223,
+        1,0,0,0,449,4228,1,0,0,0,451,4233,1,0,0,0,453,4238,1,0,0,0,455,4243,
+        1,0,0,0,457,4248,1,0,0,0,459,4253,1,0,0,0,461,4258,1,0,0,0,463,4263,
+        1,0,0,0,465,4268,1,0,0,0,467,4273,1,0,0,0,469,4278,1,0,0,0,471,4283,
+        1,0,0,0,473,4288,1,0,0,0,475,4293,1,0,0,0,477,4298,1,0,0,0,479,4303,
+        1,0,0,0,481,4308,1,0,0,0,483,4313,1,0,0,0,485,4318,1,0,0,0,487,4323,
+        1,0,0,0,489,4328,1,0,0,0,491,4333,1,0,0,0,493,4338,1,0,0,0,495,4343,
+        1,0,0,0,497,4348,1,0,0,0,499,4353,1,0,0,0,501,4358,1,0,0,0,503,4363,
+        1,0,0,0,505,4368,1,0,0,0,507,4373,1,0,0,0,509,4378,1,0,0,0,511,4383,
+        1,0,0,0,513,4388,1,0,0,0,515,4393,1,0,0,0,517,4398,1,0,0,0,519,4403,
+        1,0,0,0,521,4408,1,0,0,0,523,4416,1,0,0,0,525,4429,1,0,0,0,527,4437,
+        1,0,0,0,529,4442,1,0,0,0,531,4447,1,0,0,0,533,4468,1,0,0,0,535,4478,
+        1,0,0,0,537,4483,1,0,0,0,539,4489,1,0,0,0,541,4496,1,0,0,0,543,4504,
+        1,0,0,0,545,4512,1,0,0,0,547,4519,1,0,0,0,549,4527,1,0,0,0,551,4533,
+        1,0,0,0,553,4540,1,0,0,0,555,4548,1,0,0,0,557,4554,1,0,0,0,559,4560,
+        1,0,0,0,561,4565,1,0,0,0,563,4571,1,0,0,0,565,4579,1,0,0,0,567,4585,
+        1,0,0,0,569,4590,1,0,0,0,571,4597,1,0,0,0,573,4606,1,0,0,0,575,4613,
+        1,0,0,0,577,4619,1,0,0,0,579,4624,1,0,0,0,581,4631,1,0,0,0,583,4638,
+        1,0,0,0,585,4646,1,0,0,0,587,4653,1,0,0,0,589,4660,1,0,0,0,591,4667,
+        1,0,0,0,593,4676,1,0,0,0,595,4683,1,0,0,0,597,4688,1,0,0,0,599,4694,
+        1,0,0,0,601,4699,1,0,0,0,603,4704,1,0,0,0,605,4712,1,0,0,0,607,4722,
+        1,0,0,0,609,4732,1,0,0,0,611,4742,1,0,0,0,613,4752,1,0,0,0,615,4761,
+        1,0,0,0,617,4769,1,0,0,0,619,4779,1,0,0,0,621,4787,1,0,0,0,623,4793,
+        1,0,0,0,625,4799,1,0,0,0,627,4806,1,0,0,0,629,4813,1,0,0,0,631,4822,
+        1,0,0,0,633,4831,1,0,0,0,635,4836,1,0,0,0,637,4845,1,0,0,0,639,4851,
+        1,0,0,0,641,4860,1,0,0,0,643,4868,1,0,0,0,645,4875,1,0,0,0,647,4881,
+        1,0,0,0,649,4887,1,0,0,0,651,4895,1,0,0,0,653,4900,1,0,0,0,655,4908,
+        1,0,0,0,657,4915,1,0,0,0,659,4922,1,0,0,0,661,4928,1,0,0,0,663,4934,
+        1,0,0,0,665,4945,1,0,0,0,667,4954,1,0,0,0,669,4965,1,0,0,0,671,4976,
+        1,0,0,0,673,4987,1,0,0,0,675,4998,1,0,0,0,677,5004,1,0,0,0,679,5011,
+        1,0,0,0,681,5018,1,0,0,0,683,5024,1,0,0,0,685,5029,1,0,0,0,687,5035,
+        1,0,0,0,689,5042,1,0,0,0,691,5049,1,0,0,0,693,5054,1,0,0,0,695,5061,
+        1,0,0,0,697,5066,1,0,0,0,699,5072,1,0,0,0,701,5077,1,0,0,0,703,5081,
+        1,0,0,0,705,5089,1,0,0,0,707,5097,1,0,0,0,709,5108,1,0,0,0,711,5119,
+        1,0,0,0,713,5127,1,0,0,0,715,5133,1,0,0,0,717,5139,1,0,0,0,719,5150,
+        1,0,0,0,721,5169,1,0,0,0,723,5171,1,0,0,0,725,5178,1,0,0,0,727,5186,
+        1,0,0,0,729,5194,1,0,0,0,731,5202,1,0,0,0,733,5209,1,0,0,0,735,5216,
+        1,0,0,0,737,5221,1,0,0,0,739,5228,1,0,0,0,741,5235,1,0,0,0,743,5241,
+        1,0,0,0,745,5248,1,0,0,0,747,5255,1,0,0,0,749,5262,1,0,0,0,751,5269,
+        1,0,0,0,753,5275,1,0,0,0,755,5280,1,0,0,0,757,5286,1,0,0,0,759,5292,
+        1,0,0,0,761,5300,1,0,0,0,763,5305,1,0,0,0,765,5312,1,0,0,0,767,5320,
+        1,0,0,0,769,5328,1,0,0,0,771,5333,1,0,0,0,773,5339,1,0,0,0,775,5346,
+        1,0,0,0,777,5353,1,0,0,0,779,5371,1,0,0,0,781,5373,1,0,0,0,783,5380,
+        1,0,0,0,785,5384,1,0,0,0,787,5391,1,0,0,0,789,5399,1,0,0,0,791,5407,
+        1,0,0,0,793,5412,1,0,0,0,795,5417,1,0,0,0,797,5423,1,0,0,0,799,5432,
+        1,0,0,0,801,5439,1,0,0,0,803,5444,1,0,0,0,805,5451,1,0,0,0,807,5457,
+        1,0,0,0,809,5464,1,0,0,0,811,5471,1,0,0,0,813,5477,1,0,0,0,815,5482,
+        1,0,0,0,817,5486,1,0,0,0,819,5492,1,0,0,0,821,5497,1,0,0,0,823,5502,
+        1,0,0,0,825,5509,1,0,0,0,827,5515,1,0,0,0,829,5524,1,0,0,0,831,5531,
+        1,0,0,0,833,5536,1,0,0,0,835,5542,1,0,0,0,837,5548,1,0,0,0,839,5554,
+        1,0,0,0,841,5560,1,0,0,0,843,5565,1,0,0,0,845,5582,1,0,0,0,847,5584,
+        1,0,0,0,849,5591,1,0,0,0,851,5597,1,0,0,0,853,5603,1,0,0,0,855,5609,
+        1,0,0,0,857,5617,1,0,0,0,859,5625,1,0,0,0,861,5630,1,0,0,0,863,5636,
+        1,0,0,0,865,5645,1,0,0,0,867,5654,1,0,0,0,869,5662,1,0,0,0,871,5675,
+        1,0,0,0,873,5683,1,0,0,0,875,5692,1,0,0,0,877,5700,1,0,0,0,879,5706,
+        1,0,0,0,881,5714,1,0,0,0,883,5720,1,0,0,0,885,5726,1,0,0,0,887,5733,
+        1,0,0,0,889,5740,1,0,0,0,891,5746,1,0,0,0,893,5752,1,0,0,0,895,5757,
+        1,0,0,0,897,5762,1,0,0,0,899,5769,1,0,0,0,901,5774,1,0,0,0,903,5782,
+        1,0,0,0,905,5787,1,0,0,0,907,5792,1,0,0,0,909,5800,1,0,0,0,911,5806,
+        1,0,0,0,913,5815,1,0,0,0,915,5819,1,0,0,0,917,5826,1,0,0,0,919,5832,
+        1,0,0,0,921,5839,1,0,0,0,923,5843,1,0,0,0,925,5847,1,0,0,0,927,5853,
+        1,0,0,0,929,5858,1,0,0,0,931,5868,1,0,0,0,933,5876,1,0,0,0,935,5883,
+        1,0,0,0,937,5889,1,0,0,0,939,5895,1,0,0,0,941,5899,1,0,0,0,943,5906,
+        1,0,0,0,945,5913,1,0,0,0,947,5919,1,0,0,0,949,5925,1,0,0,0,951,5931,
+        1,0,0,0,953,5937,1,0,0,0,955,5944,1,0,0,0,957,5951,1,0,0,0,959,5959,
+        1,0,0,0,961,5963,1,0,0,0,963,5970,1,0,0,0,965,5977,1,0,0,0,967,5981,
+        1,0,0,0,969,5988,1,0,0,0,971,5995,1,0,0,0,973,6003,1,0,0,0,975,6010,
+        1,0,0,0,977,6018,1,0,0,0,979,6027,1,0,0,0,981,6034,1,0,0,0,983,6038,
+        1,0,0,0,985,6042,1,0,0,0,987,6049,1,0,0,0,989,6054,1,0,0,0,991,6063,
+        1,0,0,0,993,6071,1,0,0,0,995,6077,1,0,0,0,997,6084,1,0,0,0,999,6091,
+        1,0,0,0,1001,6099,1,0,0,0,1003,6107,1,0,0,0,1005,6116,1,0,0,0,1007,
+        6123,1,0,0,0,1009,6130,1,0,0,0,1011,6134,1,0,0,0,1013,6142,1,0,0,
+        0,1015,6152,1,0,0,0,1017,6160,1,0,0,0,1019,6167,1,0,0,0,1021,6176,
+        1,0,0,0,1023,6183,1,0,0,0,1025,6190,1,0,0,0,1027,6196,1,0,0,0,1029,
+        6204,1,0,0,0,1031,6210,1,0,0,0,1033,6217,1,0,0,0,1035,6223,1,0,0,
+        0,1037,6231,1,0,0,0,1039,6239,1,0,0,0,1041,6246,1,0,0,0,1043,6253,
+        1,0,0,0,1045,6261,1,0,0,0,1047,6269,1,0,0,0,1049,6276,1,0,0,0,1051,
+        6284,1,0,0,0,1053,6290,1,0,0,0,1055,6296,1,0,0,0,1057,6302,1,0,0,
+        0,1059,6309,1,0,0,0,1061,6316,1,0,0,0,1063,6323,1,0,0,0,1065,6328,
+        1,0,0,0,1067,6336,1,0,0,0,1069,6342,1,0,0,0,1071,6349,1,0,0,0,1073,
+        6357,1,0,0,0,1075,6363,1,0,0,0,1077,6370,1,0,0,0,1079,6377,1,0,0,
+        0,1081,6385,1,0,0,0,1083,6391,1,0,0,0,1085,6395,1,0,0,0,1087,6404,
+        1,0,0,0,1089,6411,1,0,0,0,1091,6416,1,0,0,0,1093,6424,1,0,0,0,1095,
+        6432,1,0,0,0,1097,6440,1,0,0,0,1099,6446,1,0,0,0,1101,6452,1,0,0,
+        0,1103,6457,1,0,0,0,1105,6459,1,0,0,0,1107,6463,1,0,0,0,1109,6466,
+        1,0,0,0,1111,6470,1,0,0,0,1113,6472,1,0,0,0,1115,6474,1,0,0,0,1117,
+        6477,1,0,0,0,1119,6480,1,0,0,0,1121,6483,1,0,0,0,1123,6486,1,0,0,
+        0,1125,6488,1,0,0,0,1127,6491,1,0,0,0,1129,6494,1,0,0,0,1131,6497,
+        1,0,0,0,1133,6500,1,0,0,0,1135,6504,1,0,0,0,1137,6506,1,0,0,0,1139,
+        6508,1,0,0,0,1141,6511,1,0,0,0,1143,6514,1,0,0,0,1145,6517,1,0,0,
+        0,1147,6519,1,0,0,0,1149,6521,1,0,0,0,1151,6523,1,0,0,0,1153,6549,
+        1,0,0,0,1155,6551,1,0,0,0,1157,6553,1,0,0,0,1159,6557,1,0,0,0,1161,
+        6560,1,0,0,0,1163,6563,1,0,0,0,1165,6570,1,0,0,0,1167,6574,1,0,0,
+        0,1169,6579,1,0,0,0,1171,6584,1,0,0,0,1173,6589,1,0,0,0,1175,6594,
+        1,0,0,0,1177,6599,1,0,0,0,1179,6604,1,0,0,0,1181,6634,1,0,0,0,1183,
+        6639,1,0,0,0,1185,6650,1,0,0,0,1187,6660,1,0,0,0,1189,6675,1,0,0,
+        0,1191,6723,1,0,0,0,1193,6771,1,0,0,0,1195,6833,1,0,0,0,1197,6877,
+        1,0,0,0,1199,6921,1,0,0,0,1201,6931,1,0,0,0,1203,6936,1,0,0,0,1205,
+        6942,1,0,0,0,1207,6948,1,0,0,0,1209,6956,1,0,0,0,1211,6963,1,0,0,
+        0,1213,6970,1,0,0,0,1215,6977,1,0,0,0,1217,6983,1,0,0,0,1219,6989,
+        1,0,0,0,1221,6994,1,0,0,0,1223,6999,1,0,0,0,1225,7008,1,0,0,0,1227,
+        7013,1,0,0,0,1229,7018,1,0,0,0,1231,7029,1,0,0,0,1233,7034,1,0,0,
+        0,1235,7040,1,0,0,0,1237,7046,1,0,0,0,1239,7058,1,0,0,0,1241,7063,
+        1,0,0,0,1243,7074,1,0,0,0,1245,7079,1,0,0,0,1247,7084,1,0,0,0,1249,
+        7089,1,0,0,0,1251,7094,1,0,0,0,1253,7099,1,0,0,0,1255,7104,1,0,0,
+        0,1257,7109,1,0,0,0,1259,7114,1,0,0,0,1261,7119,1,0,0,0,1263,7124,
+        1,0,0,0,1265,7129,1,0,0,0,1267,7134,1,0,0,0,1269,7139,1,0,0,0,1271,
+        7144,1,0,0,0,1273,7149,1,0,0,0,1275,7154,1,0,0,0,1277,7159,1,0,0,
+        0,1279,7164,1,0,0,0,1281,7169,1,0,0,0,1283,7177,1,0,0,0,1285,7222,
+        1,0,0,0,1287,7226,1,0,0,0,1289,7231,1,0,0,0,1291,7235,1,0,0,0,1293,
+        7240,1,0,0,0,1295,7246,1,0,0,0,1297,7252,1,0,0,0,1299,7258,1,0,0,
+        0,1301,7264,1,0,0,0,1303,7270,1,0,0,0,1305,7276,1,0,0,0,1307,7282,
+        1,0,0,0,1309,7288,1,0,0,0,1311,7295,1,0,0,0,1313,7301,1,0,0,0,1315,
+        7307,1,0,0,0,1317,7313,1,0,0,0,1319,7319,1,0,0,0,1321,7325,1,0,0,
+        0,1323,7331,1,0,0,0,1325,7337,1,0,0,0,1327,7343,1,0,0,0,1329,7348,
+        1,0,0,0,1331,7351,1,0,0,0,1333,7357,1,0,0,0,1335,7363,1,0,0,0,1337,
+        7369,1,0,0,0,1339,7375,1,0,0,0,1341,7381,1,0,0,0,1343,7387,1,0,0,
+        0,1345,7391,1,0,0,0,1347,7395,1,0,0,0,1349,7401,1,0,0,0,1351,7408,
+        1,0,0,0,1353,7413,1,0,0,0,1355,7420,1,0,0,0,1357,7424,1,0,0,0,1359,
+        7427,1,0,0,0,1361,7433,1,0,0,0,1363,7439,1,0,0,0,1365,7445,1,0,0,
+        0,1367,7451,1,0,0,0,1369,7457,1,0,0,0,1371,7463,1,0,0,0,1373,7469,
+        1,0,0,0,1375,7475,1,0,0,0,1377,7481,1,0,0,0,1379,7487,1,0,0,0,1381,
+        7493,1,0,0,0,1383,7499,1,0,0,0,1385,7503,1,0,0,0,1387,7509,1,0,0,
+        0,1389,7516,1,0,0,0,1391,7521,1,0,0,0,1393,7526,1,0,0,0,1395,7531,
+        1,0,0,0,1397,7536,1,0,0,0,1399,7541,1,0,0,0,1401,7546,1,0,0,0,1403,
+        7551,1,0,0,0,1405,7556,1,0,0,0,1407,7562,1,0,0,0,1409,7569,1,0,0,
+        0,1411,7575,1,0,0,0,1413,7581,1,0,0,0,1415,7587,1,0,0,0,1417,7593,
+        1,0,0,0,1419,7598,1,0,0,0,1421,7604,1,0,0,0,1423,7610,1,0,0,0,1425,
+        7615,1,0,0,0,1427,7619,1,0,0,0,1429,7625,1,0,0,0,1431,7630,1,0,0,
+        0,1433,7635,1,0,0,0,1435,7640,1,0,0,0,1437,7645,1,0,0,0,1439,7650,
+        1,0,0,0,1441,7655,1,0,0,0,1443,7660,1,0,0,0,1445,7666,1,0,0,0,1447,
+        7674,1,0,0,0,1449,7679,1,0,0,0,1451,7686,1,0,0,0,1453,7692,1,0,0,
+        0,1455,7698,1,0,0,0,1457,7703,1,0,0,0,1459,7707,1,0,0,0,1461,7714,
+        1,0,0,0,1463,7720,1,0,0,0,1465,7724,1,0,0,0,1467,7730,1,0,0,0,1469,
+        7736,1,0,0,0,1471,7742,1,0,0,0,1473,7747,1,0,0,0,1475,7754,1,0,0,
+        0,1477,7761,1,0,0,0,1479,7768,1,0,0,0,1481,7775,1,0,0,0,1483,7782,
+        1,0,0,0,1485,7789,1,0,0,0,1487,7795,1,0,0,0,1489,7801,1,0,0,0,1491,
+        7807,1,0,0,0,1493,7814,1,0,0,0,1495,7820,1,0,0,0,1497,7827,1,0,0,
+        0,1499,7841,1,0,0,0,1501,7845,1,0,0,0,1503,7849,1,0,0,0,1505,7853,
+        1,0,0,0,1507,7868,1,0,0,0,1509,7882,1,0,0,0,1511,7903,1,0,0,0,1513,
+        7918,1,0,0,0,1515,7921,1,0,0,0,1517,7927,1,0,0,0,1519,7932,1,0,0,
+        0,1521,7937,1,0,0,0,1523,7950,1,0,0,0,1525,7964,1,0,0,0,1527,8103,
+        1,0,0,0,1529,8110,1,0,0,0,1531,8116,1,0,0,0,1533,8122,1,0,0,0,1535,
+        8128,1,0,0,0,1537,8134,1,0,0,0,1539,8141,1,0,0,0,1541,8149,1,0,0,
+        0,1543,8155,1,0,0,0,1545,8164,1,0,0,0,1547,8169,1,0,0,0,1549,8175,
+        1,0,0,0,1551,8188,1,0,0,0,1553,8194,1,0,0,0,1555,8199,1,0,0,0,1557,
+        8208,1,0,0,0,1559,8217,1,0,0,0,1561,8230,1,0,0,0,1563,8234,1,0,0,
+        0,1565,8241,1,0,0,0,1567,8244,1,0,0,0,1569,8247,1,0,0,0,1571,8271,
+        1,0,0,0,1573,8280,1,0,0,0,1575,8292,1,0,0,0,1577,8297,1,0,0,0,1579,
+        8302,1,0,0,0,1581,8380,1,0,0,0,1583,8397,1,0,0,0,1585,8401,1,0,0,
+        0,1587,8407,1,0,0,0,1589,8410,1,0,0,0,1591,8413,1,0,0,0,1593,8417,
+        1,0,0,0,1595,8421,1,0,0,0,1597,8425,1,0,0,0,1599,8429,1,0,0,0,1601,
+        8433,1,0,0,0,1603,8437,1,0,0,0,1605,8441,1,0,0,0,1607,8446,1,0,0,
+        0,1609,8451,1,0,0,0,1611,8454,1,0,0,0,1613,8458,1,0,0,0,1615,8463,
+        1,0,0,0,1617,8473,1,0,0,0,1619,8483,1,0,0,0,1621,8487,1,0,0,0,1623,
+        8491,1,0,0,0,1625,8495,1,0,0,0,1627,8501,1,0,0,0,1629,8507,1,0,0,
+        0,1631,8511,1,0,0,0,1633,8521,1,0,0,0,1635,8525,1,0,0,0,1637,8530,
+        1,0,0,0,1639,8536,1,0,0,0,1641,8542,1,0,0,0,1643,8546,1,0,0,0,1645,
+        8550,1,0,0,0,1647,8554,1,0,0,0,1649,8557,1,0,0,0,1651,8560,1,0,0,
+        0,1653,8563,1,0,0,0,1655,8566,1,0,0,0,1657,8569,1,0,0,0,1659,8572,
+        1,0,0,0,1661,8575,1,0,0,0,1663,8578,1,0,0,0,1665,8585,1,0,0,0,1667,
+        8588,1,0,0,0,1669,8591,1,0,0,0,1671,8596,1,0,0,0,1673,8601,1,0,0,
+        0,1675,8611,1,0,0,0,1677,8616,1,0,0,0,1679,8620,1,0,0,0,1681,8624,
+        1,0,0,0,1683,8649,1,0,0,0,1685,8671,1,0,0,0,1687,8680,1,0,0,0,1689,
+        8690,1,0,0,0,1691,8701,1,0,0,0,1693,8705,1,0,0,0,1695,8710,1,0,0,
+        0,1697,8742,1,0,0,0,1699,8746,1,0,0,0,1701,8757,1,0,0,0,1703,8762,
+        1,0,0,0,1705,8768,1,0,0,0,1707,8815,1,0,0,0,1709,8823,1,0,0,0,1711,
+        8826,1,0,0,0,1713,8829,1,0,0,0,1715,8834,1,0,0,0,1717,8837,1,0,0,
+        0,1719,8842,1,0,0,0,1721,8846,1,0,0,0,1723,8851,1,0,0,0,1725,8856,
+        1,0,0,0,1727,8861,1,0,0,0,1729,8866,1,0,0,0,1731,8871,1,0,0,0,1733,
+        8876,1,0,0,0,1735,8881,1,0,0,0,1737,8886,1,0,0,0,1739,8891,1,0,0,
+        0,1741,8896,1,0,0,0,1743,8901,1,0,0,0,1745,8906,1,0,0,0,1747,8911,
+        1,0,0,0,1749,8916,1,0,0,0,1751,8921,1,0,0,0,1753,8926,1,0,0,0,1755,
+        8931,1,0,0,0,1757,8936,1,0,0,0,1759,8941,1,0,0,0,1761,8946,1,0,0,
+        0,1763,8951,1,0,0,0,1765,8956,1,0,0,0,1767,8961,1,0,0,0,1769,8966,
+        1,0,0,0,1771,8971,1,0,0,0,1773,8976,1,0,0,0,1775,8981,1,0,0,0,1777,
+        8986,1,0,0,0,1779,8991,1,0,0,0,1781,8996,1,0,0,0,1783,9001,1,0,0,
+        0,1785,9006,1,0,0,0,1787,9011,1,0,0,0,1789,9016,1,0,0,0,1791,9021,
+        1,0,0,0,1793,9026,1,0,0,0,1795,9031,1,0,0,0,1797,9036,1,0,0,0,1799,
+        9041,1,0,0,0,1801,9046,1,0,0,0,1803,9051,1,0,0,0,1805,9056,1,0,0,
+        0,1807,9061,1,0,0,0,1809,9066,1,0,0,0,1811,9071,1,0,0,0,1813,9076,
+        1,0,0,0,1815,9081,1,0,0,0,1817,9086,1,0,0,0,1819,9091,1,0,0,0,1821,
+        9096,1,0,0,0,1823,9101,1,0,0,0,1825,9106,1,0,0,0,1827,9111,1,0,0,
+        0,1829,9116,1,0,0,0,1831,9121,1,0,0,0,1833,9126,1,0,0,0,1835,9131,
+        1,0,0,0,1837,9136,1,0,0,0,1839,9141,1,0,0,0,1841,9146,1,0,0,0,1843,
+        9151,1,0,0,0,1845,9156,1,0,0,0,1847,9161,1,0,0,0,1849,9166,1,0,0,
+        0,1851,9171,1,0,0,0,1853,9176,1,0,0,0,1855,9181,1,0,0,0,1857,9186,
+        1,0,0,0,1859,9191,1,0,0,0,1861,9196,1,0,0,0,1863,9201,1,0,0,0,1865,
+        9206,1,0,0,0,1867,9211,1,0,0,0,1869,9216,1,0,0,0,1871,9221,1,0,0,
+        0,1873,9226,1,0,0,0,1875,9231,1,0,0,0,1877,9236,1,0,0,0,1879,9241,
+        1,0,0,0,1881,9246,1,0,0,0,1883,9251,1,0,0,0,1885,9256,1,0,0,0,1887,
+        9261,1,0,0,0,1889,9266,1,0,0,0,1891,9271,1,0,0,0,1893,9276,1,0,0,
+        0,1895,9281,1,0,0,0,1897,9286,1,0,0,0,1899,9291,1,0,0,0,1901,9296,
+        1,0,0,0,1903,9301,1,0,0,0,1905,9306,1,0,0,0,1907,9311,1,0,0,0,1909,
+        9316,1,0,0,0,1911,9321,1,0,0,0,1913,9326,1,0,0,0,1915,9331,1,0,0,
+        0,1917,9336,1,0,0,0,1919,9341,1,0,0,0,1921,9346,1,0,0,0,1923,9351,
+        1,0,0,0,1925,9356,1,0,0,0,1927,9361,1,0,0,0,1929,9366,1,0,0,0,1931,
+        9371,1,0,0,0,1933,9376,1,0,0,0,1935,9381,1,0,0,0,1937,9386,1,0,0,
+        0,1939,9391,1,0,0,0,1941,9396,1,0,0,0,1943,9401,1,0,0,0,1945,9406,
+        1,0,0,0,1947,9411,1,0,0,0,1949,9416,1,0,0,0,1951,9421,1,0,0,0,1953,
+        9426,1,0,0,0,1955,9431,1,0,0,0,1957,9436,1,0,0,0,1959,9441,1,0,0,
+        0,1961,9446,1,0,0,0,1963,9451,1,0,0,0,1965,9456,1,0,0,0,1967,9461,
+        1,0,0,0,1969,9466,1,0,0,0,1971,9471,1,0,0,0,1973,9476,1,0,0,0,1975,
+        9481,1,0,0,0,1977,9486,1,0,0,0,1979,9491,1,0,0,0,1981,9496,1,0,0,
+        0,1983,9501,1,0,0,0,1985,9506,1,0,0,0,1987,9511,1,0,0,0,1989,9516,
+        1,0,0,0,1991,9521,1,0,0,0,1993,9526,1,0,0,0,1995,9531,1,0,0,0,1997,
+        9536,1,0,0,0,1999,9541,1,0,0,0,2001,9546,1,0,0,0,2003,9551,1,0,0,
+        0,2005,9556,1,0,0,0,2007,9561,1,0,0,0,2009,9566,1,0,0,0,2011,9571,
+        1,0,0,0,2013,9576,1,0,0,0,2015,9581,1,0,0,0,2017,9586,1,0,0,0,2019,
+        9591,1,0,0,0,2021,9596,1,0,0,0,2023,9601,1,0,0,0,2025,9606,1,0,0,
+        0,2027,9611,1,0,0,0,2029,9616,1,0,0,0,2031,9621,1,0,0,0,2033,9626,
+        1,0,0,0,2035,9631,1,0,0,0,2037,9636,1,0,0,0,2039,9641,1,0,0,0,2041,
+        9646,1,0,0,0,2043,9651,1,0,0,0,2045,9656,1,0,0,0,2047,9661,1,0,0,
+        0,2049,9666,1,0,0,0,2051,9671,1,0,0,0,2053,9676,1,0,0,0,2055,9681,
+        1,0,0,0,2057,9686,1,0,0,0,2059,9691,1,0,0,0,2061,9696,1,0,0,0,2063,
+        9701,1,0,0,0,2065,9706,1,0,0,0,2067,9711,1,0,0,0,2069,9716,1,0,0,
+        0,2071,9721,1,0,0,0,2073,9726,1,0,0,0,2075,9743,1,0,0,0,2077,9772,
+        1,0,0,0,2079,9780,1,0,0,0,2081,9786,1,0,0,0,2083,9793,1,0,0,0,2085,
+        9800,1,0,0,0,2087,9807,1,0,0,0,2089,9814,1,0,0,0,2091,9821,1,0,0,
+        0,2093,9829,1,0,0,0,2095,9835,1,0,0,0,2097,9841,1,0,0,0,2099,9846,
+        1,0,0,0,2101,9861,1,0,0,0,2103,9867,1,0,0,0,2105,9872,1,0,0,0,2107,
+        9877,1,0,0,0,2109,9882,1,0,0,0,2111,9887,1,0,0,0,2113,9892,1,0,0,
+        0,2115,9897,1,0,0,0,2117,9902,1,0,0,0,2119,9907,1,0,0,0,2121,9912,
+        1,0,0,0,2123,9917,1,0,0,0,2125,9922,1,0,0,0,2127,9927,1,0,0,0,2129,
+        9932,1,0,0,0,2131,9937,1,0,0,0,2133,9942,1,0,0,0,2135,9947,1,0,0,
+        0,2137,9952,1,0,0,0,2139,9957,1,0,0,0,2141,9962,1,0,0,0,2143,9967,
+        1,0,0,0,2145,9972,1,0,0,0,2147,9977,1,0,0,0,2149,9982,1,0,0,0,2151,
+        9989,1,0,0,0,2153,9994,1,0,0,0,2155,9999,1,0,0,0,2157,10004,1,0,
+        0,0,2159,10009,1,0,0,0,2161,10014,1,0,0,0,2163,10019,1,0,0,0,2165,
+        10024,1,0,0,0,2167,10029,1,0,0,0,2169,10034,1,0,0,0,2171,10039,1,
+        0,0,0,2173,10044,1,0,0,0,2175,10049,1,0,0,0,2177,10054,1,0,0,0,2179,
+        10059,1,0,0,0,2181,10064,1,0,0,0,2183,10069,1,0,0,0,2185,10074,1,
+        0,0,0,2187,10079,1,0,0,0,2189,10084,1,0,0,0,2191,10089,1,0,0,0,2193,
+        10096,1,0,0,0,2195,10101,1,0,0,0,2197,10106,1,0,0,0,2199,10111,1,
+        0,0,0,2201,10116,1,0,0,0,2203,10121,1,0,0,0,2205,10126,1,0,0,0,2207,
+        10133,1,0,0,0,2209,10138,1,0,0,0,2211,10143,1,0,0,0,2213,10148,1,
+        0,0,0,2215,10153,1,0,0,0,2217,10158,1,0,0,0,2219,10163,1,0,0,0,2221,
+        10168,1,0,0,0,2223,10173,1,0,0,0,2225,10178,1,0,0,0,2227,10184,1,
+        0,0,0,2229,10189,1,0,0,0,2231,10194,1,0,0,0,2233,10199,1,0,0,0,2235,
+        10204,1,0,0,0,2237,10209,1,0,0,0,2239,10214,1,0,0,0,2241,10219,1,
+        0,0,0,2243,10224,1,0,0,0,2245,10231,1,0,0,0,2247,10238,1,0,0,0,2249,
+        10245,1,0,0,0,2251,10250,1,0,0,0,2253,10255,1,0,0,0,2255,10260,1,
+        0,0,0,2257,10265,1,0,0,0,2259,10270,1,0,0,0,2261,10277,1,0,0,0,2263,
+        10282,1,0,0,0,2265,10287,1,0,0,0,2267,10294,1,0,0,0,2269,10299,1,
+        0,0,0,2271,10304,1,0,0,0,2273,10309,1,0,0,0,2275,10314,1,0,0,0,2277,
+        10319,1,0,0,0,2279,10324,1,0,0,0,2281,10329,1,0,0,0,2283,10334,1,
+        0,0,0,2285,10339,1,0,0,0,2287,10344,1,0,0,0,2289,10349,1,0,0,0,2291,
+        10354,1,0,0,0,2293,10359,1,0,0,0,2295,10364,1,0,0,0,2297,10369,1,
+        0,0,0,2299,10374,1,0,0,0,2301,10379,1,0,0,0,2303,10384,1,0,0,0,2305,
+        10389,1,0,0,0,2307,10394,1,0,0,0,2309,10399,1,0,0,0,2311,10404,1,
+        0,0,0,2313,10409,1,0,0,0,2315,10414,1,0,0,0,2317,10419,1,0,0,0,2319,
+        10425,1,0,0,0,2321,10430,1,0,0,0,2323,10435,1,0,0,0,2325,10440,1,
+        0,0,0,2327,10445,1,0,0,0,2329,10450,1,0,0,0,2331,10455,1,0,0,0,2333,
+        10460,1,0,0,0,2335,10465,1,0,0,0,2337,10470,1,0,0,0,2339,10475,1,
+        0,0,0,2341,10480,1,0,0,0,2343,10485,1,0,0,0,2345,10490,1,0,0,0,2347,
+        10495,1,0,0,0,2349,10500,1,0,0,0,2351,10505,1,0,0,0,2353,10510,1,
+        0,0,0,2355,10515,1,0,0,0,2357,10520,1,0,0,0,2359,10525,1,0,0,0,2361,
+        10532,1,0,0,0,2363,10537,1,0,0,0,2365,10542,1,0,0,0,2367,10547,1,
+        0,0,0,2369,10552,1,0,0,0,2371,10557,1,0,0,0,2373,10562,1,0,0,0,2375,
+        10567,1,0,0,0,2377,10574,1,0,0,0,2379,10579,1,0,0,0,2381,10584,1,
+        0,0,0,2383,10589,1,0,0,0,2385,10594,1,0,0,0,2387,10599,1,0,0,0,2389,
+        10604,1,0,0,0,2391,10609,1,0,0,0,2393,10614,1,0,0,0,2395,10619,1,
+        0,0,0,2397,10624,1,0,0,0,2399,10629,1,0,0,0,2401,10634,1,0,0,0,2403,
+        10639,1,0,0,0,2405,10646,1,0,0,0,2407,10651,1,0,0,0,2409,10656,1,
+        0,0,0,2411,10661,1,0,0,0,2413,10666,1,0,0,0,2415,10671,1,0,0,0,2417,
+        10676,1,0,0,0,2419,10681,1,0,0,0,2421,10686,1,0,0,0,2423,10691,1,
+        0,0,0,2425,10698,1,0,0,0,2427,10705,1,0,0,0,2429,10710,1,0,0,0,2431,
+        10717,1,0,0,0,2433,10721,1,0,0,0,2435,10726,1,0,0,0,2437,10739,1,
+        0,0,0,2439,10746,1,0,0,0,2441,10754,1,0,0,0,2443,10764,1,0,0,0,2445,
+        10772,1,0,0,0,2447,10780,1,0,0,0,2449,10787,1,0,0,0,2451,10793,1,
+        0,0,0,2453,10800,1,0,0,0,2455,10807,1,0,0,0,2457,10815,1,0,0,0,2459,
+        10821,1,0,0,0,2461,10834,1,0,0,0,2463,10839,1,0,0,0,2465,10845,1,
+        0,0,0,2467,10850,1,0,0,0,2469,10855,1,0,0,0,2471,10859,1,0,0,0,2473,
+        10863,1,0,0,0,2475,10868,1,0,0,0,2477,10873,1,0,0,0,2479,10882,1,
+        0,0,0,2481,10886,1,0,0,0,2483,10891,1,0,0,0,2485,10896,1,0,0,0,2487,
+        10901,1,0,0,0,2489,10906,1,0,0,0,2491,10911,1,0,0,0,2493,10916,1,
+        0,0,0,2495,10921,1,0,0,0,2497,10926,1,0,0,0,2499,10931,1,0,0,0,2501,
+        10936,1,0,0,0,2503,10941,1,0,0,0,2505,10946,1,0,0,0,2507,10949,1,
+        0,0,0,2509,10952,1,0,0,0,2511,10955,1,0,0,0,2513,10965,1,0,0,0,2515,
+        10973,1,0,0,0,2517,10983,1,0,0,0,2519,10988,1,0,0,0,2521,11009,1,
+        0,0,0,2523,11014,1,0,0,0,2525,11020,1,0,0,0,2527,11024,1,0,0,0,2529,
+        11029,1,0,0,0,2531,11033,1,0,0,0,2533,11038,1,0,0,0,2535,11048,1,
+        0,0,0,2537,11059,1,0,0,0,2539,11064,1,0,0,0,2541,11074,1,0,0,0,2543,
+        11084,1,0,0,0,2545,11089,1,0,0,0,2547,11097,1,0,0,0,2549,11177,1,
+        0,0,0,2551,11181,1,0,0,0,2553,11211,1,0,0,0,2555,11240,1,0,0,0,2557,
+        11244,1,0,0,0,2559,11254,1,0,0,0,2561,11258,1,0,0,0,2563,11261,1,
+        0,0,0,2565,11266,1,0,0,0,2567,11276,1,0,0,0,2569,11286,1,0,0,0,2571,
+        11296,1,0,0,0,2573,11301,1,0,0,0,2575,11305,1,0,0,0,2577,11328,1,
+        0,0,0,2579,11339,1,0,0,0,2581,11349,1,0,0,0,2583,11360,1,0,0,0,2585,
+        11371,1,0,0,0,2587,11377,1,0,0,0,2589,11380,1,0,0,0,2591,11383,1,
+        0,0,0,2593,11387,1,0,0,0,2595,11391,1,0,0,0,2597,11403,1,0,0,0,2599,
+        11411,1,0,0,0,2601,11420,1,0,0,0,2603,11431,1,0,0,0,2605,11441,1,
+        0,0,0,2607,11447,1,0,0,0,2609,11451,1,0,0,0,2611,11455,1,0,0,0,2613,
+        11460,1,0,0,0,2615,11464,1,0,0,0,2617,11474,1,0,0,0,2619,11480,1,
+        0,0,0,2621,11487,1,0,0,0,2623,2624,5,42,0,0,2624,2625,5,42,0,0,2625,
+        2626,1,0,0,0,2626,2627,8,0,0,0,2627,2628,8,0,0,0,2628,2629,8,0,0,
+        0,2629,2633,8,1,0,0,2630,2632,8,0,0,0,2631,2630,1,0,0,0,2632,2635,
+        1,0,0,0,2633,2631,1,0,0,0,2633,2634,1,0,0,0,2634,2636,1,0,0,0,2635,
+        2633,1,0,0,0,2636,2637,3,1619,786,0,2637,2638,1,0,0,0,2638,2639,
+        6,0,0,0,2639,48,1,0,0,0,2640,2641,5,32,0,0,2641,2642,5,32,0,0,2642,
+        2643,5,32,0,0,2643,2644,5,32,0,0,2644,2645,5,32,0,0,2645,2646,1,
+        0,0,0,2646,2647,6,1,1,0,2647,2648,6,1,2,0,2648,50,1,0,0,0,2649,2650,
+        3,57,5,0,2650,2651,1,0,0,0,2651,2652,6,2,1,0,2652,2653,6,2,3,0,2653,
+        52,1,0,0,0,2654,2655,5,32,0,0,2655,2656,5,32,0,0,2656,2657,5,32,
+        0,0,2657,2658,5,32,0,0,2658,2659,5,32,0,0,2659,2660,5,32,0,0,2660,
+        2661,5,32,0,0,2661,2662,5,32,0,0,2662,2663,5,32,0,0,2663,2664,5,
+        32,0,0,2664,2665,5,32,0,0,2665,2666,5,32,0,0,2666,2667,5,32,0,0,
+        2667,2668,5,32,0,0,2668,2669,5,32,0,0,2669,2670,5,32,0,0,2670,2671,
+        5,32,0,0,2671,2672,5,32,0,0,2672,2673,5,32,0,0,2673,2674,5,32,0,
+        0,2674,2675,5,32,0,0,2675,2676,5,32,0,0,2676,2677,5,32,0,0,2677,
+        2678,5,32,0,0,2678,2679,5,32,0,0,2679,2680,5,32,0,0,2680,2681,5,
+        32,0,0,2681,2682,5,32,0,0,2682,2683,5,32,0,0,2683,2684,5,32,0,0,
+        2684,2685,5,32,0,0,2685,2686,5,32,0,0,2686,2687,5,32,0,0,2687,2688,
+        5,32,0,0,2688,2689,5,32,0,0,2689,2690,5,32,0,0,2690,2691,5,32,0,
+        0,2691,2692,5,32,0,0,2692,2693,5,32,0,0,2693,2694,5,32,0,0,2694,
+        2695,5,32,0,0,2695,2696,5,32,0,0,2696,2697,5,32,0,0,2697,2698,5,
+        32,0,0,2698,2699,5,32,0,0,2699,2700,5,32,0,0,2700,2701,5,32,0,0,
+        2701,2702,5,32,0,0,2702,2703,5,32,0,0,2703,2704,5,32,0,0,2704,2705,
+        5,32,0,0,2705,2706,5,32,0,0,2706,2707,5,32,0,0,2707,2708,5,32,0,
+        0,2708,2709,5,32,0,0,2709,2710,5,32,0,0,2710,2711,5,32,0,0,2711,
+        2712,5,32,0,0,2712,2713,5,32,0,0,2713,2714,5,32,0,0,2714,2715,5,
+        32,0,0,2715,2716,5,32,0,0,2716,2717,5,32,0,0,2717,2718,5,32,0,0,
+        2718,2719,5,32,0,0,2719,2720,5,32,0,0,2720,2721,5,32,0,0,2721,2722,
+        5,32,0,0,2722,2723,5,32,0,0,2723,2724,5,32,0,0,2724,2725,5,32,0,
+        0,2725,2726,5,32,0,0,2726,2727,5,32,0,0,2727,2728,5,32,0,0,2728,
+        2729,5,32,0,0,2729,2730,1,0,0,0,2730,2731,4,3,0,0,2731,2732,1,0,
+        0,0,2732,2733,6,3,4,0,2733,2734,6,3,3,0,2734,54,1,0,0,0,2735,2737,
+        7,2,0,0,2736,2735,1,0,0,0,2737,2740,1,0,0,0,2738,2736,1,0,0,0,2738,
+        2739,1,0,0,0,2739,2742,1,0,0,0,2740,2738,1,0,0,0,2741,2743,5,13,
+        0,0,2742,2741,1,0,0,0,2742,2743,1,0,0,0,2743,2744,1,0,0,0,2744,2745,
+        5,10,0,0,2745,2746,1,0,0,0,2746,2747,6,4,2,0,2747,56,1,0,0,0,2748,
+        2749,8,0,0,0,2749,2750,8,0,0,0,2750,2751,8,0,0,0,2751,2752,8,0,0,
+        0,2752,2753,8,0,0,0,2753,58,1,0,0,0,2754,2755,3,61,7,0,2755,2756,
+        3,61,7,0,2756,2757,3,61,7,0,2757,2758,3,61,7,0,2758,2759,3,61,7,
+        0,2759,60,1,0,0,0,2760,2761,7,3,0,0,2761,62,1,0,0,0,2762,2763,7,
+        4,0,0,2763,64,1,0,0,0,2764,2765,8,0,0,0,2765,66,1,0,0,0,2766,2767,
+        3,65,9,0,2767,2768,3,65,9,0,2768,2769,3,65,9,0,2769,2770,3,65,9,
+        0,2770,2771,3,65,9,0,2771,68,1,0,0,0,2772,2773,7,2,0,0,2773,2774,
+        1,0,0,0,2774,2775,6,11,5,0,2775,2776,6,11,6,0,2776,2777,6,11,2,0,
+        2777,70,1,0,0,0,2778,2779,9,0,0,0,2779,2780,5,42,0,0,2780,2781,1,
+        0,0,0,2781,2782,6,12,5,0,2782,2783,6,12,4,0,2783,2784,6,12,3,0,2784,
+        72,1,0,0,0,2785,2786,7,5,0,0,2786,2787,1,0,0,0,2787,2788,6,13,5,
+        0,2788,2789,6,13,7,0,2789,74,1,0,0,0,2790,2791,7,6,0,0,2791,2792,
+        1,0,0,0,2792,2793,6,14,5,0,2793,2794,6,14,8,0,2794,76,1,0,0,0,2795,
+        2796,7,7,0,0,2796,2797,1,0,0,0,2797,2798,6,15,5,0,2798,2799,6,15,
+        9,0,2799,78,1,0,0,0,2800,2801,7,8,0,0,2801,2802,1,0,0,0,2802,2803,
+        6,16,5,0,2803,2804,6,16,10,0,2804,2805,6,16,11,0,2805,2806,6,16,
+        12,0,2806,80,1,0,0,0,2807,2808,7,8,0,0,2808,2809,5,47,0,0,2809,2810,
+        3,353,153,0,2810,2811,1,0,0,0,2811,2812,6,17,5,0,2812,2813,6,17,
+        13,0,2813,82,1,0,0,0,2814,2815,7,9,0,0,2815,2816,1,0,0,0,2816,2817,
+        6,18,5,0,2817,2818,6,18,14,0,2818,84,1,0,0,0,2819,2820,7,10,0,0,
+        2820,2821,1,0,0,0,2821,2822,6,19,5,0,2822,2823,6,19,15,0,2823,86,
+        1,0,0,0,2824,2825,7,11,0,0,2825,2826,1,0,0,0,2826,2827,6,20,5,0,
+        2827,2828,6,20,16,0,2828,88,1,0,0,0,2829,2833,7,2,0,0,2830,2832,
+        7,2,0,0,2831,2830,1,0,0,0,2832,2835,1,0,0,0,2833,2831,1,0,0,0,2833,
+        2834,1,0,0,0,2834,2836,1,0,0,0,2835,2833,1,0,0,0,2836,2837,3,99,
+        26,0,2837,2838,1,0,0,0,2838,2839,6,21,5,0,2839,2840,6,21,2,0,2840,
+        90,1,0,0,0,2841,2842,9,0,0,0,2842,2843,3,99,26,0,2843,2844,1,0,0,
+        0,2844,2845,6,22,5,0,2845,2846,6,22,2,0,2846,92,1,0,0,0,2847,2848,
+        9,0,0,0,2848,2852,7,2,0,0,2849,2851,7,2,0,0,2850,2849,1,0,0,0,2851,
+        2854,1,0,0,0,2852,2850,1,0,0,0,2852,2853,1,0,0,0,2853,2855,1,0,0,
+        0,2854,2852,1,0,0,0,2855,2856,3,99,26,0,2856,2857,1,0,0,0,2857,2858,
+        6,23,5,0,2858,2859,6,23,2,0,2859,94,1,0,0,0,2860,2864,7,2,0,0,2861,
+        2863,7,2,0,0,2862,2861,1,0,0,0,2863,2866,1,0,0,0,2864,2865,1,0,0,
+        0,2864,2862,1,0,0,0,2865,2867,1,0,0,0,2866,2864,1,0,0,0,2867,2868,
+        5,47,0,0,2868,2869,5,47,0,0,2869,2870,1,0,0,0,2870,2871,6,24,5,0,
+        2871,2872,6,24,4,0,2872,2873,6,24,3,0,2873,96,1,0,0,0,2874,2878,
+        9,0,0,0,2875,2877,7,2,0,0,2876,2875,1,0,0,0,2877,2880,1,0,0,0,2878,
+        2879,1,0,0,0,2878,2876,1,0,0,0,2879,2881,1,0,0,0,2880,2878,1,0,0,
+        0,2881,2882,5,47,0,0,2882,2883,1,0,0,0,2883,2884,6,25,5,0,2884,2885,
+        6,25,17,0,2885,98,1,0,0,0,2886,2888,5,13,0,0,2887,2886,1,0,0,0,2887,
+        2888,1,0,0,0,2888,2889,1,0,0,0,2889,2890,5,10,0,0,2890,2891,1,0,
+        0,0,2891,2892,6,26,5,0,2892,2893,6,26,2,0,2893,100,1,0,0,0,2894,
+        2895,7,12,0,0,2895,2899,4,27,1,0,2896,2898,7,12,0,0,2897,2896,1,
+        0,0,0,2898,2901,1,0,0,0,2899,2897,1,0,0,0,2899,2900,1,0,0,0,2900,
+        2902,1,0,0,0,2901,2899,1,0,0,0,2902,2903,6,27,2,0,2903,102,1,0,0,
+        0,2904,2905,5,32,0,0,2905,2906,5,32,0,0,2906,2907,5,32,0,0,2907,
+        2908,5,32,0,0,2908,2909,5,32,0,0,2909,2910,5,32,0,0,2910,2911,5,
+        32,0,0,2911,2912,5,32,0,0,2912,2913,5,32,0,0,2913,2914,5,32,0,0,
+        2914,2915,5,32,0,0,2915,2916,5,32,0,0,2916,2917,5,32,0,0,2917,2918,
+        5,32,0,0,2918,2919,5,32,0,0,2919,2920,5,32,0,0,2920,2921,5,32,0,
+        0,2921,2922,5,32,0,0,2922,2923,5,32,0,0,2923,2924,5,32,0,0,2924,
+        2925,5,32,0,0,2925,2926,5,32,0,0,2926,2927,5,32,0,0,2927,2928,5,
+        32,0,0,2928,2929,5,32,0,0,2929,2930,5,32,0,0,2930,2931,5,32,0,0,
+        2931,2932,5,32,0,0,2932,2933,5,32,0,0,2933,2934,5,32,0,0,2934,2935,
+        5,32,0,0,2935,2936,5,32,0,0,2936,2937,5,32,0,0,2937,2938,5,32,0,
+        0,2938,2939,5,32,0,0,2939,2940,5,32,0,0,2940,2941,5,32,0,0,2941,
+        2942,5,32,0,0,2942,2943,5,32,0,0,2943,2944,5,32,0,0,2944,2945,5,
+        32,0,0,2945,2946,5,32,0,0,2946,2947,5,32,0,0,2947,2948,5,32,0,0,
+        2948,2949,5,32,0,0,2949,2950,5,32,0,0,2950,2951,5,32,0,0,2951,2952,
+        5,32,0,0,2952,2953,5,32,0,0,2953,2954,5,32,0,0,2954,2955,5,32,0,
+        0,2955,2956,5,32,0,0,2956,2957,5,32,0,0,2957,2958,5,32,0,0,2958,
+        2959,5,32,0,0,2959,2960,5,32,0,0,2960,2961,5,32,0,0,2961,2962,5,
+        32,0,0,2962,2963,5,32,0,0,2963,2964,5,32,0,0,2964,2965,5,32,0,0,
+        2965,2966,5,32,0,0,2966,2967,5,32,0,0,2967,2968,5,32,0,0,2968,2969,
+        5,32,0,0,2969,2970,5,32,0,0,2970,2971,5,32,0,0,2971,2972,5,32,0,
+        0,2972,2973,5,32,0,0,2973,2974,5,32,0,0,2974,2975,5,32,0,0,2975,
+        2976,5,32,0,0,2976,2977,1,0,0,0,2977,2978,6,28,5,0,2978,2979,6,28,
+        4,0,2979,2980,6,28,3,0,2980,104,1,0,0,0,2981,2983,8,0,0,0,2982,2981,
+        1,0,0,0,2983,2984,1,0,0,0,2984,2982,1,0,0,0,2984,2985,1,0,0,0,2985,
+        2986,1,0,0,0,2986,2987,6,29,18,0,2987,106,1,0,0,0,2988,2989,3,99,
+        26,0,2989,2990,1,0,0,0,2990,2991,6,30,19,0,2991,2992,6,30,5,0,2992,
+        2993,6,30,5,0,2993,108,1,0,0,0,2994,2995,7,6,0,0,2995,2996,7,13,
+        0,0,2996,2997,7,14,0,0,2997,2998,7,14,0,0,2998,2999,1,0,0,0,2999,
+        3000,6,31,5,0,3000,3001,6,31,20,0,3001,3002,6,31,21,0,3002,110,1,
+        0,0,0,3003,3004,7,14,0,0,3004,3005,7,15,0,0,3005,3006,7,5,0,0,3006,
+        3007,5,45,0,0,3007,3008,7,6,0,0,3008,3009,7,13,0,0,3009,3010,7,14,
+        0,0,3010,3011,7,14,0,0,3011,3012,1,0,0,0,3012,3013,6,32,5,0,3013,
+        3014,6,32,20,0,3014,3015,6,32,21,0,3015,112,1,0,0,0,3016,3017,7,
+        16,0,0,3017,3018,7,9,0,0,3018,3019,7,16,0,0,3019,3020,7,17,0,0,3020,
+        3021,7,14,0,0,3021,3022,1,0,0,0,3022,3023,6,33,5,0,3023,3024,6,33,
+        20,0,3024,3025,6,33,22,0,3025,114,1,0,0,0,3026,3027,7,14,0,0,3027,
+        3028,7,18,0,0,3028,3029,7,14,0,0,3029,3030,7,8,0,0,3030,3031,7,16,
+        0,0,3031,3032,1,0,0,0,3032,3033,6,34,5,0,3033,3034,6,34,20,0,3034,
+        3035,6,34,21,0,3035,116,1,0,0,0,3036,3037,7,19,0,0,3037,3038,7,10,
+        0,0,3038,3039,7,20,0,0,3039,3040,7,8,0,0,3040,3041,7,14,0,0,3041,
+        3042,1,0,0,0,3042,3043,6,35,5,0,3043,3044,6,35,20,0,3044,118,1,0,
+        0,0,3045,3046,7,19,0,0,3046,3047,7,14,0,0,3047,3048,7,16,0,0,3048,
+        3049,1,0,0,0,3049,3050,6,36,5,0,3050,3051,6,36,20,0,3051,120,1,0,
+        0,0,3052,3053,7,13,0,0,3053,3054,7,14,0,0,3054,3055,7,19,0,0,3055,
+        3056,7,16,0,0,3056,3057,7,7,0,0,3057,3058,7,13,0,0,3058,3059,7,14,
+        0,0,3059,3060,1,0,0,0,3060,3061,6,37,5,0,3061,3062,6,37,20,0,3062,
+        122,1,0,0,0,3063,3064,7,8,0,0,3064,3065,7,7,0,0,3065,3066,7,10,0,
+        0,3066,3067,7,21,0,0,3067,3068,1,0,0,0,3068,3069,6,38,5,0,3069,3070,
+        6,38,23,0,3070,124,1,0,0,0,3071,3072,7,9,0,0,3072,3073,7,15,0,0,
+        3073,3074,7,8,0,0,3074,3075,7,17,0,0,3075,3076,7,22,0,0,3076,3077,
+        7,5,0,0,3077,3078,7,14,0,0,3078,3079,1,0,0,0,3079,3080,6,39,5,0,
+        3080,3081,6,39,20,0,3081,126,1,0,0,0,3082,3083,7,14,0,0,3083,3084,
+        7,7,0,0,3084,3085,7,6,0,0,3085,3086,1,0,0,0,3086,3087,6,40,5,0,3087,
+        3088,6,40,20,0,3088,128,1,0,0,0,3089,3090,7,5,0,0,3090,3091,7,14,
+        0,0,3091,3092,7,6,0,0,3092,3093,7,9,0,0,3093,3094,7,15,0,0,3094,
+        3095,7,14,0,0,3095,3096,1,0,0,0,3096,3097,6,41,5,0,3097,3098,6,41,
+        20,0,3098,130,1,0,0,0,3099,3100,7,22,0,0,3100,3101,7,15,0,0,3101,
+        3102,7,5,0,0,3102,3103,7,14,0,0,3103,3104,7,6,0,0,3104,3105,7,9,
+        0,0,3105,3106,7,15,0,0,3106,3107,7,14,0,0,3107,3108,1,0,0,0,3108,
+        3109,6,42,5,0,3109,3110,6,42,20,0,3110,132,1,0,0,0,3111,3112,7,9,
+        0,0,3112,3113,7,6,0,0,3113,3114,1,0,0,0,3114,3115,6,43,5,0,3115,
+        3116,6,43,20,0,3116,134,1,0,0,0,3117,3118,7,14,0,0,3118,3119,7,17,
+        0,0,3119,3120,7,19,0,0,3120,3121,7,14,0,0,3121,3122,1,0,0,0,3122,
+        3123,6,44,5,0,3123,3124,6,44,20,0,3124,136,1,0,0,0,3125,3126,7,14,
+        0,0,3126,3127,7,17,0,0,3127,3128,7,19,0,0,3128,3129,7,14,0,0,3129,
+        3130,7,9,0,0,3130,3131,7,6,0,0,3131,3132,1,0,0,0,3132,3133,6,45,
+        5,0,3133,3134,6,45,20,0,3134,138,1,0,0,0,3135,3136,7,14,0,0,3136,
+        3137,7,15,0,0,3137,3138,7,5,0,0,3138,3139,7,9,0,0,3139,3140,7,6,
+        0,0,3140,3141,1,0,0,0,3141,3142,6,46,5,0,3142,3143,6,46,20,0,3143,
+        140,1,0,0,0,3144,3145,1,0,0,0,3145,3146,1,0,0,0,3146,3147,6,47,5,
+        0,3147,3148,6,47,20,0,3148,142,1,0,0,0,3149,3150,7,2,0,0,3150,3151,
+        1,0,0,0,3151,3152,6,48,2,0,3152,144,1,0,0,0,3153,3154,8,23,0,0,3154,
+        3155,4,49,2,0,3155,3156,3,169,61,0,3156,3157,1,0,0,0,3157,3158,6,
+        49,18,0,3158,146,1,0,0,0,3159,3160,3,171,62,0,3160,3161,1,0,0,0,
+        3161,3162,6,50,24,0,3162,148,1,0,0,0,3163,3164,3,173,63,0,3164,3165,
+        1,0,0,0,3165,3166,6,51,25,0,3166,150,1,0,0,0,3167,3168,3,183,68,
+        0,3168,3169,1,0,0,0,3169,3170,6,52,19,0,3170,3171,6,52,5,0,3171,
+        152,1,0,0,0,3172,3173,8,23,0,0,3173,3174,1,0,0,0,3174,3175,6,53,
+        26,0,3175,3176,6,53,27,0,3176,154,1,0,0,0,3177,3178,7,24,0,0,3178,
+        3179,1,0,0,0,3179,3180,6,54,28,0,3180,3181,6,54,29,0,3181,156,1,
+        0,0,0,3182,3183,7,25,0,0,3183,3184,1,0,0,0,3184,3185,6,55,30,0,3185,
+        3186,6,55,29,0,3186,158,1,0,0,0,3187,3188,1,0,0,0,3188,3189,1,0,
+        0,0,3189,3190,6,56,2,0,3190,3191,6,56,5,0,3191,160,1,0,0,0,3192,
+        3193,7,15,0,0,3193,3194,7,7,0,0,3194,3195,7,16,0,0,3195,162,1,0,
+        0,0,3196,3197,7,5,0,0,3197,3198,7,14,0,0,3198,3199,7,6,0,0,3199,
+        3200,7,9,0,0,3200,3201,7,15,0,0,3201,3202,7,14,0,0,3202,3203,7,5,
+        0,0,3203,164,1,0,0,0,3204,3205,3,1153,553,0,3205,3206,1,0,0,0,3206,
+        3207,6,59,31,0,3207,166,1,0,0,0,3208,3209,7,2,0,0,3209,3210,1,0,
+        0,0,3210,3211,6,60,2,0,3211,168,1,0,0,0,3212,3214,8,23,0,0,3213,
+        3212,1,0,0,0,3214,3215,1,0,0,0,3215,3213,1,0,0,0,3215,3216,1,0,0,
+        0,3216,170,1,0,0,0,3217,3218,7,26,0,0,3218,3219,1,0,0,0,3219,3220,
+        6,62,2,0,3220,172,1,0,0,0,3221,3222,7,27,0,0,3222,174,1,0,0,0,3223,
+        3224,7,28,0,0,3224,3225,1,0,0,0,3225,3226,6,64,32,0,3226,176,1,0,
+        0,0,3227,3228,7,29,0,0,3228,3229,1,0,0,0,3229,3230,6,65,33,0,3230,
+        178,1,0,0,0,3231,3232,7,24,0,0,3232,3233,1,0,0,0,3233,3234,6,66,
+        28,0,3234,3235,6,66,29,0,3235,180,1,0,0,0,3236,3237,7,25,0,0,3237,
+        3238,1,0,0,0,3238,3239,6,67,30,0,3239,3240,6,67,29,0,3240,182,1,
+        0,0,0,3241,3243,7,2,0,0,3242,3241,1,0,0,0,3243,3246,1,0,0,0,3244,
+        3242,1,0,0,0,3244,3245,1,0,0,0,3245,3247,1,0,0,0,3246,3244,1,0,0,
+        0,3247,3248,3,99,26,0,3248,3249,6,68,34,0,3249,3250,1,0,0,0,3250,
+        3251,6,68,19,0,3251,3252,6,68,5,0,3252,184,1,0,0,0,3253,3254,9,0,
+        0,0,3254,3255,5,42,0,0,3255,3256,1,0,0,0,3256,3257,6,69,35,0,3257,
+        3258,6,69,5,0,3258,3259,6,69,4,0,3259,3260,6,69,3,0,3260,186,1,0,
+        0,0,3261,3262,1,0,0,0,3262,3263,1,0,0,0,3263,3264,6,70,2,0,3264,
+        3265,6,70,5,0,3265,188,1,0,0,0,3266,3267,5,32,0,0,3267,3268,5,32,
+        0,0,3268,3269,5,32,0,0,3269,3270,5,32,0,0,3270,3271,5,32,0,0,3271,
+        3272,1,0,0,0,3272,3273,6,71,2,0,3273,3274,6,71,5,0,3274,190,1,0,
+        0,0,3275,3276,3,51,2,0,3276,3277,1,0,0,0,3277,3278,6,72,36,0,3278,
+        3279,6,72,3,0,3279,3280,6,72,5,0,3280,192,1,0,0,0,3281,3283,8,0,
+        0,0,3282,3281,1,0,0,0,3283,3286,1,0,0,0,3284,3282,1,0,0,0,3284,3285,
+        1,0,0,0,3285,3287,1,0,0,0,3286,3284,1,0,0,0,3287,3288,6,73,5,0,3288,
+        3289,6,73,2,0,3289,194,1,0,0,0,3290,3292,8,0,0,0,3291,3290,1,0,0,
+        0,3292,3293,1,0,0,0,3293,3291,1,0,0,0,3293,3294,1,0,0,0,3294,196,
+        1,0,0,0,3295,3296,3,99,26,0,3296,3297,1,0,0,0,3297,3298,6,75,19,
+        0,3298,198,1,0,0,0,3299,3303,7,12,0,0,3300,3302,7,12,0,0,3301,3300,
+        1,0,0,0,3302,3305,1,0,0,0,3303,3301,1,0,0,0,3303,3304,1,0,0,0,3304,
+        3306,1,0,0,0,3305,3303,1,0,0,0,3306,3307,6,76,2,0,3307,200,1,0,0,
+        0,3308,3309,7,20,0,0,3309,3310,7,8,0,0,3310,3311,7,30,0,0,3311,3312,
+        1,0,0,0,3312,3313,6,77,37,0,3313,3314,6,77,38,0,3314,202,1,0,0,0,
+        3315,3316,7,31,0,0,3316,3317,7,14,0,0,3317,3318,7,32,0,0,3318,3319,
+        7,19,0,0,3319,3320,7,13,0,0,3320,3321,1,0,0,0,3321,3322,6,78,37,
+        0,3322,204,1,0,0,0,3323,3324,7,8,0,0,3324,3325,7,20,0,0,3325,3326,
+        7,17,0,0,3326,3327,7,17,0,0,3327,3328,7,10,0,0,3328,3329,1,0,0,0,
+        3329,3330,6,79,37,0,3330,3331,6,79,38,0,3331,206,1,0,0,0,3332,3333,
+        7,8,0,0,3333,3334,7,11,0,0,3334,3335,7,20,0,0,3335,3336,7,9,0,0,
+        3336,3337,7,15,0,0,3337,3338,1,0,0,0,3338,3339,6,80,37,0,3339,3340,
+        6,80,38,0,3340,208,1,0,0,0,3341,3342,7,8,0,0,3342,3343,7,17,0,0,
+        3343,3344,7,14,0,0,3344,3345,7,20,0,0,3345,3346,7,13,0,0,3346,3347,
+        1,0,0,0,3347,3348,6,81,37,0,3348,210,1,0,0,0,3349,3350,7,8,0,0,3350,
+        3351,7,17,0,0,3351,3352,7,7,0,0,3352,3353,7,19,0,0,3353,3354,7,14,
+        0,0,3354,3355,1,0,0,0,3355,3356,6,82,37,0,3356,3357,6,82,38,0,3357,
+        212,1,0,0,0,3358,3359,7,8,0,0,3359,3360,7,7,0,0,3360,3361,7,33,0,
+        0,3361,3362,7,33,0,0,3362,3363,7,9,0,0,3363,3364,7,16,0,0,3364,3365,
+        1,0,0,0,3365,3366,6,83,37,0,3366,3367,6,83,38,0,3367,214,1,0,0,0,
+        3368,3369,7,5,0,0,3369,3370,7,14,0,0,3370,3371,7,20,0,0,3371,3372,
+        7,17,0,0,3372,3373,7,17,0,0,3373,3374,7,7,0,0,3374,3375,7,8,0,0,
+        3375,3376,1,0,0,0,3376,3377,6,84,37,0,3377,3378,6,84,38,0,3378,216,
+        1,0,0,0,3379,3380,7,5,0,0,3380,3381,7,14,0,0,3381,3382,7,17,0,0,
+        3382,3383,7,14,0,0,3383,3384,7,16,0,0,3384,3385,7,14,0,0,3385,3386,
+        1,0,0,0,3386,3387,6,85,37,0,3387,3388,6,85,38,0,3388,218,1,0,0,0,
+        3389,3390,7,5,0,0,3390,3391,7,7,0,0,3391,3392,7,22,0,0,3392,3393,
+        1,0,0,0,3393,3394,6,86,37,0,3394,3395,6,86,38,0,3395,220,1,0,0,0,
+        3396,3397,7,5,0,0,3397,3398,7,7,0,0,3398,3399,7,34,0,0,3399,3400,
+        1,0,0,0,3400,3401,6,87,37,0,3401,3402,6,87,38,0,3402,222,1,0,0,0,
+        3403,3404,7,5,0,0,3404,3405,7,19,0,0,3405,3406,7,10,0,0,3406,3407,
+        7,17,0,0,3407,3408,7,21,0,0,3408,3409,1,0,0,0,3409,3410,6,88,37,
+        0,3410,3411,6,88,38,0,3411,224,1,0,0,0,3412,3413,7,5,0,0,3413,3414,
+        7,22,0,0,3414,3415,7,33,0,0,3415,3416,7,10,0,0,3416,3417,1,0,0,0,
+        3417,3418,6,89,37,0,3418,3419,6,89,38,0,3419,226,1,0,0,0,3420,3421,
+        7,14,0,0,3421,3422,7,17,0,0,3422,3423,7,19,0,0,3423,3424,7,14,0,
+        0,3424,3425,1,0,0,0,3425,3426,6,90,37,0,3426,228,1,0,0,0,3427,3428,
+        7,14,0,0,3428,3429,7,17,0,0,3429,3430,7,19,0,0,3430,3431,7,14,0,
+        0,3431,3432,7,9,0,0,3432,3433,7,6,0,0,3433,3434,1,0,0,0,3434,3435,
+        6,91,37,0,3435,3436,6,91,38,0,3436,230,1,0,0,0,3437,3438,7,14,0,
+        0,3438,3439,7,15,0,0,3439,3440,7,5,0,0,3440,3441,7,5,0,0,3441,3442,
+        7,7,0,0,3442,3443,1,0,0,0,3443,3444,6,92,37,0,3444,232,1,0,0,0,3445,
+        3446,7,14,0,0,3446,3447,7,15,0,0,3447,3448,7,5,0,0,3448,3449,7,6,
+        0,0,3449,3450,7,7,0,0,3450,3451,7,13,0,0,3451,3452,1,0,0,0,3452,
+        3453,6,93,37,0,3453,234,1,0,0,0,3454,3455,7,14,0,0,3455,3456,7,15,
+        0,0,3456,3457,7,5,0,0,3457,3458,7,9,0,0,3458,3459,7,6,0,0,3459,3460,
+        1,0,0,0,3460,3461,6,94,37,0,3461,236,1,0,0,0,3462,3463,7,14,0,0,
+        3463,3464,7,15,0,0,3464,3465,7,5,0,0,3465,3466,7,33,0,0,3466,3467,
+        7,7,0,0,3467,3468,7,15,0,0,3468,3469,1,0,0,0,3469,3470,6,95,37,0,
+        3470,238,1,0,0,0,3471,3472,7,14,0,0,3472,3473,7,15,0,0,3473,3474,
+        7,5,0,0,3474,3475,7,19,0,0,3475,3476,7,17,0,0,3476,3477,1,0,0,0,
+        3477,3478,6,96,37,0,3478,240,1,0,0,0,3479,3480,7,14,0,0,3480,3481,
+        7,15,0,0,3481,3482,7,5,0,0,3482,3483,7,19,0,0,3483,3484,7,13,0,0,
+        3484,3485,1,0,0,0,3485,3486,6,97,37,0,3486,242,1,0,0,0,3487,3488,
+        7,14,0,0,3488,3489,7,35,0,0,3489,3490,7,20,0,0,3490,3491,7,17,0,
+        0,3491,3492,1,0,0,0,3492,3493,6,98,37,0,3493,3494,6,98,38,0,3494,
+        244,1,0,0,0,3495,3496,7,14,0,0,3496,3497,7,35,0,0,3497,3498,7,20,
+        0,0,3498,3499,7,17,0,0,3499,3500,7,13,0,0,3500,3501,1,0,0,0,3501,
+        3502,6,99,37,0,3502,3503,6,99,38,0,3503,246,1,0,0,0,3504,3505,7,
+        14,0,0,3505,3506,7,35,0,0,3506,3507,7,20,0,0,3507,3508,7,17,0,0,
+        3508,3509,7,36,0,0,3509,3510,7,8,0,0,3510,3511,7,7,0,0,3511,3512,
+        7,13,0,0,3512,3513,7,13,0,0,3513,3514,1,0,0,0,3514,3515,6,100,37,
+        0,3515,3516,6,100,38,0,3516,248,1,0,0,0,3517,3518,7,14,0,0,3518,
+        3519,7,37,0,0,3519,3520,7,8,0,0,3520,3521,7,14,0,0,3521,3522,7,10,
+        0,0,3522,3523,7,16,0,0,3523,3524,1,0,0,0,3524,3525,6,101,37,0,3525,
+        250,1,0,0,0,3526,3527,7,14,0,0,3527,3528,7,37,0,0,3528,3529,7,6,
+        0,0,3529,3530,7,33,0,0,3530,3531,7,16,0,0,3531,3532,1,0,0,0,3532,
+        3533,6,102,37,0,3533,3534,6,102,38,0,3534,252,1,0,0,0,3535,3536,
+        7,14,0,0,3536,3537,7,37,0,0,3537,3538,7,19,0,0,3538,3539,7,13,0,
+        0,3539,3540,1,0,0,0,3540,3541,6,103,37,0,3541,254,1,0,0,0,3542,3543,
+        7,6,0,0,3543,3544,7,14,0,0,3544,3545,7,7,0,0,3545,3546,7,5,0,0,3546,
+        3547,1,0,0,0,3547,3548,6,104,37,0,3548,3549,6,104,38,0,3549,256,
+        1,0,0,0,3550,3551,7,6,0,0,3551,3552,7,7,0,0,3552,3553,7,13,0,0,3553,
+        3554,1,0,0,0,3554,3555,6,105,37,0,3555,3556,6,105,38,0,3556,258,
+        1,0,0,0,3557,3558,7,6,0,0,3558,3559,7,7,0,0,3559,3560,7,13,0,0,3560,
+        3561,7,8,0,0,3561,3562,7,14,0,0,3562,3563,1,0,0,0,3563,3564,6,106,
+        37,0,3564,260,1,0,0,0,3565,3566,7,9,0,0,3566,3567,7,6,0,0,3567,3568,
+        1,0,0,0,3568,3569,6,107,37,0,3569,3570,6,107,38,0,3570,262,1,0,0,
+        0,3571,3572,7,9,0,0,3572,3573,7,15,0,0,3573,3574,1,0,0,0,3574,3575,
+        6,108,37,0,3575,3576,6,108,38,0,3576,264,1,0,0,0,3577,3578,7,9,0,
+        0,3578,3579,7,16,0,0,3579,3580,7,14,0,0,3580,3581,7,13,0,0,3581,
+        3582,1,0,0,0,3582,3583,6,109,37,0,3583,266,1,0,0,0,3584,3585,7,17,
+        0,0,3585,3586,7,14,0,0,3586,3587,7,20,0,0,3587,3588,7,35,0,0,3588,
+        3589,7,14,0,0,3589,3590,1,0,0,0,3590,3591,6,110,37,0,3591,268,1,
+        0,0,0,3592,3593,7,17,0,0,3593,3594,7,14,0,0,3594,3595,7,20,0,0,3595,
+        3596,7,35,0,0,3596,3597,7,14,0,0,3597,3598,7,19,0,0,3598,3599,7,
+        13,0,0,3599,3600,1,0,0,0,3600,3601,6,111,37,0,3601,270,1,0,0,0,3602,
+        3603,7,33,0,0,3603,3604,7,7,0,0,3604,3605,7,15,0,0,3605,3606,7,9,
+        0,0,3606,3607,7,16,0,0,3607,3608,7,7,0,0,3608,3609,7,13,0,0,3609,
+        3610,1,0,0,0,3610,3611,6,112,37,0,3611,272,1,0,0,0,3612,3613,7,15,
+        0,0,3613,3614,7,14,0,0,3614,3615,7,37,0,0,3615,3616,7,16,0,0,3616,
+        3617,1,0,0,0,3617,3618,6,113,37,0,3618,3619,6,113,38,0,3619,274,
+        1,0,0,0,3620,3621,7,7,0,0,3621,3622,7,15,0,0,3622,3623,7,36,0,0,
+        3623,3624,7,14,0,0,3624,3625,7,13,0,0,3625,3626,7,13,0,0,3626,3627,
+        7,7,0,0,3627,3628,7,13,0,0,3628,3629,1,0,0,0,3629,3630,6,114,37,
+        0,3630,276,1,0,0,0,3631,3632,7,7,0,0,3632,3633,7,10,0,0,3633,3634,
+        7,14,0,0,3634,3635,7,15,0,0,3635,3636,1,0,0,0,3636,3637,6,115,37,
+        0,3637,3638,6,115,38,0,3638,278,1,0,0,0,3639,3640,7,7,0,0,3640,3641,
+        7,16,0,0,3641,3642,7,11,0,0,3642,3643,7,14,0,0,3643,3644,7,13,0,
+        0,3644,3645,1,0,0,0,3645,3646,6,116,37,0,3646,280,1,0,0,0,3647,3648,
+        7,7,0,0,3648,3649,7,22,0,0,3649,3650,7,16,0,0,3650,3651,1,0,0,0,
+        3651,3652,6,117,37,0,3652,3653,6,117,38,0,3653,282,1,0,0,0,3654,
+        3655,7,10,0,0,3655,3656,7,7,0,0,3656,3657,7,19,0,0,3657,3658,7,16,
+        0,0,3658,3659,1,0,0,0,3659,3660,6,118,37,0,3660,3661,6,118,38,0,
+        3661,284,1,0,0,0,3662,3663,7,13,0,0,3663,3664,7,14,0,0,3664,3665,
+        7,20,0,0,3665,3666,7,5,0,0,3666,3667,1,0,0,0,3667,3668,6,119,37,
+        0,3668,3669,6,119,38,0,3669,286,1,0,0,0,3670,3671,7,13,0,0,3671,
+        3672,7,14,0,0,3672,3673,7,20,0,0,3673,3674,7,5,0,0,3674,3675,7,8,
+        0,0,3675,3676,1,0,0,0,3676,3677,6,120,37,0,3677,3678,6,120,38,0,
+        3678,288,1,0,0,0,3679,3680,7,13,0,0,3680,3681,7,14,0,0,3681,3682,
+        7,20,0,0,3682,3683,7,5,0,0,3683,3684,7,14,0,0,3684,3685,1,0,0,0,
+        3685,3686,6,121,37,0,3686,3687,6,121,38,0,3687,290,1,0,0,0,3688,
+        3689,7,13,0,0,3689,3690,7,14,0,0,3690,3691,7,20,0,0,3691,3692,7,
+        5,0,0,3692,3693,7,10,0,0,3693,3694,1,0,0,0,3694,3695,6,122,37,0,
+        3695,3696,6,122,38,0,3696,292,1,0,0,0,3697,3698,7,13,0,0,3698,3699,
+        7,14,0,0,3699,3700,7,20,0,0,3700,3701,7,5,0,0,3701,3702,7,10,0,0,
+        3702,3703,7,14,0,0,3703,3704,1,0,0,0,3704,3705,6,123,37,0,3705,3706,
+        6,123,38,0,3706,294,1,0,0,0,3707,3708,7,13,0,0,3708,3709,7,14,0,
+        0,3709,3710,7,17,0,0,3710,3711,1,0,0,0,3711,3712,6,124,37,0,3712,
+        3713,6,124,38,0,3713,296,1,0,0,0,3714,3715,7,13,0,0,3715,3716,7,
+        14,0,0,3716,3717,7,19,0,0,3717,3718,7,14,0,0,3718,3719,7,16,0,0,
+        3719,3720,1,0,0,0,3720,3721,6,125,37,0,3721,3722,6,125,38,0,3722,
+        298,1,0,0,0,3723,3724,7,13,0,0,3724,3725,7,14,0,0,3725,3726,7,16,
+        0,0,3726,3727,7,22,0,0,3727,3728,7,13,0,0,3728,3729,7,15,0,0,3729,
+        3730,1,0,0,0,3730,3731,6,126,37,0,3731,3732,6,126,38,0,3732,300,
+        1,0,0,0,3733,3734,7,13,0,0,3734,3735,7,7,0,0,3735,3736,7,17,0,0,
+        3736,3737,7,31,0,0,3737,3738,7,38,0,0,3738,3739,1,0,0,0,3739,3740,
+        6,127,37,0,3740,3741,6,127,38,0,3741,302,1,0,0,0,3742,3743,7,19,
+        0,0,3743,3744,7,14,0,0,3744,3745,7,17,0,0,3745,3746,7,14,0,0,3746,
+        3747,7,8,0,0,3747,3748,7,16,0,0,3748,3749,1,0,0,0,3749,3750,6,128,
+        37,0,3750,304,1,0,0,0,3751,3752,7,19,0,0,3752,3753,7,14,0,0,3753,
+        3754,7,16,0,0,3754,3755,7,32,0,0,3755,3756,7,16,0,0,3756,3757,1,
+        0,0,0,3757,3758,6,129,37,0,3758,3759,6,129,38,0,3759,306,1,0,0,0,
+        3760,3761,7,19,0,0,3761,3762,7,14,0,0,3762,3763,7,16,0,0,3763,3764,
+        7,17,0,0,3764,3765,7,17,0,0,3765,3766,1,0,0,0,3766,3767,6,130,37,
+        0,3767,3768,6,130,38,0,3768,308,1,0,0,0,3769,3770,7,19,0,0,3770,
+        3771,7,7,0,0,3771,3772,7,13,0,0,3772,3773,7,16,0,0,3773,3774,7,20,
+        0,0,3774,3775,1,0,0,0,3775,3776,6,131,37,0,3776,3777,6,131,38,0,
+        3777,310,1,0,0,0,3778,3779,7,16,0,0,3779,3780,7,14,0,0,3780,3781,
+        7,19,0,0,3781,3782,7,16,0,0,3782,3783,1,0,0,0,3783,3784,6,132,37,
+        0,3784,3785,6,132,38,0,3785,312,1,0,0,0,3786,3787,7,22,0,0,3787,
+        3788,7,15,0,0,3788,3789,7,17,0,0,3789,3790,7,7,0,0,3790,3791,7,8,
+        0,0,3791,3792,7,38,0,0,3792,3793,1,0,0,0,3793,3794,6,133,37,0,3794,
+        3795,6,133,38,0,3795,314,1,0,0,0,3796,3797,7,22,0,0,3797,3798,7,
+        10,0,0,3798,3799,7,5,0,0,3799,3800,7,20,0,0,3800,3801,7,16,0,0,3801,
+        3802,7,14,0,0,3802,3803,1,0,0,0,3803,3804,6,134,37,0,3804,3805,6,
+        134,38,0,3805,316,1,0,0,0,3806,3807,7,34,0,0,3807,3808,7,11,0,0,
+        3808,3809,7,14,0,0,3809,3810,7,15,0,0,3810,3811,1,0,0,0,3811,3812,
+        6,135,37,0,3812,3813,6,135,38,0,3813,318,1,0,0,0,3814,3815,7,34,
+        0,0,3815,3816,7,13,0,0,3816,3817,7,9,0,0,3817,3818,7,16,0,0,3818,
+        3819,7,14,0,0,3819,3820,1,0,0,0,3820,3821,6,136,37,0,3821,3822,6,
+        136,38,0,3822,320,1,0,0,0,3823,3824,7,37,0,0,3824,3825,7,33,0,0,
+        3825,3826,7,17,0,0,3826,3827,7,36,0,0,3827,3828,7,9,0,0,3828,3829,
+        7,15,0,0,3829,3830,7,16,0,0,3830,3831,7,7,0,0,3831,3832,1,0,0,0,
+        3832,3833,6,137,37,0,3833,3834,6,137,38,0,3834,322,1,0,0,0,3835,
+        3836,7,37,0,0,3836,3837,7,33,0,0,3837,3838,7,17,0,0,3838,3839,7,
+        36,0,0,3839,3840,7,19,0,0,3840,3841,7,20,0,0,3841,3842,7,37,0,0,
+        3842,3843,1,0,0,0,3843,3844,6,138,37,0,3844,3845,6,138,38,0,3845,
+        324,1,0,0,0,3846,3847,7,5,0,0,3847,3848,7,8,0,0,3848,3849,7,17,0,
+        0,3849,3850,5,45,0,0,3850,3851,7,19,0,0,3851,3852,1,0,0,0,3852,3853,
+        6,139,37,0,3853,326,1,0,0,0,3854,3855,7,5,0,0,3855,3856,7,8,0,0,
+        3856,3857,7,17,0,0,3857,3858,5,45,0,0,3858,3859,7,5,0,0,3859,3860,
+        7,19,0,0,3860,3861,1,0,0,0,3861,3862,6,140,37,0,3862,328,1,0,0,0,
+        3863,3864,7,14,0,0,3864,3865,7,15,0,0,3865,3866,7,5,0,0,3866,3867,
+        5,45,0,0,3867,3868,7,5,0,0,3868,3869,7,19,0,0,3869,3870,1,0,0,0,
+        3870,3871,6,141,37,0,3871,330,1,0,0,0,3872,3873,7,5,0,0,3873,3874,
+        7,8,0,0,3874,3875,7,17,0,0,3875,3876,5,45,0,0,3876,3877,7,10,0,0,
+        3877,3878,7,13,0,0,3878,3879,1,0,0,0,3879,3880,6,142,37,0,3880,332,
+        1,0,0,0,3881,3882,7,14,0,0,3882,3883,7,15,0,0,3883,3884,7,5,0,0,
+        3884,3885,5,45,0,0,3885,3886,7,10,0,0,3886,3887,7,13,0,0,3887,3888,
+        1,0,0,0,3888,3889,6,143,37,0,3889,334,1,0,0,0,3890,3891,7,5,0,0,
+        3891,3892,7,8,0,0,3892,3893,7,17,0,0,3893,3894,5,45,0,0,3894,3895,
+        7,10,0,0,3895,3896,7,20,0,0,3896,3897,7,13,0,0,3897,3898,7,33,0,
+        0,3898,3899,1,0,0,0,3899,3900,6,144,37,0,3900,336,1,0,0,0,3901,3902,
+        7,5,0,0,3902,3903,7,8,0,0,3903,3904,7,17,0,0,3904,3905,5,45,0,0,
+        3905,3906,7,19,0,0,3906,3907,7,22,0,0,3907,3908,7,31,0,0,3908,3909,
+        7,6,0,0,3909,3910,1,0,0,0,3910,3911,6,145,37,0,3911,338,1,0,0,0,
+        3912,3913,7,5,0,0,3913,3914,7,8,0,0,3914,3915,7,17,0,0,3915,3916,
+        5,45,0,0,3916,3917,7,10,0,0,3917,3918,7,9,0,0,3918,3919,1,0,0,0,
+        3919,3920,6,146,37,0,3920,340,1,0,0,0,3921,3922,7,14,0,0,3922,3923,
+        7,15,0,0,3923,3924,7,5,0,0,3924,3925,5,45,0,0,3925,3926,7,10,0,0,
+        3926,3927,7,9,0,0,3927,3928,1,0,0,0,3928,3929,6,147,37,0,3929,342,
+        1,0,0,0,3930,3931,7,5,0,0,3931,3932,7,8,0,0,3932,3933,7,17,0,0,3933,
+        3934,5,45,0,0,3934,3935,7,10,0,0,3935,3936,7,13,0,0,3936,3937,7,
+        7,0,0,3937,3938,7,8,0,0,3938,3939,1,0,0,0,3939,3940,6,148,37,0,3940,
+        344,1,0,0,0,3941,3942,7,14,0,0,3942,3943,7,15,0,0,3943,3944,7,5,
+        0,0,3944,3945,5,45,0,0,3945,3946,7,10,0,0,3946,3947,7,13,0,0,3947,
+        3948,7,7,0,0,3948,3949,7,8,0,0,3949,3950,1,0,0,0,3950,3951,6,149,
+        37,0,3951,346,1,0,0,0,3952,3953,7,5,0,0,3953,3954,7,8,0,0,3954,3955,
+        7,17,0,0,3955,3956,5,45,0,0,3956,3957,7,8,0,0,3957,3958,1,0,0,0,
+        3958,3959,6,150,37,0,3959,348,1,0,0,0,3960,3961,7,5,0,0,3961,3962,
+        7,8,0,0,3962,3963,7,17,0,0,3963,3964,5,45,0,0,3964,3965,7,6,0,0,
+        3965,3966,1,0,0,0,3966,3967,6,151,37,0,3967,350,1,0,0,0,3968,3969,
+        7,8,0,0,3969,3970,7,16,0,0,3970,3971,7,17,0,0,3971,3972,5,45,0,0,
+        3972,3973,7,7,0,0,3973,3974,7,10,0,0,3974,3975,7,16,0,0,3975,3976,
+        1,0,0,0,3976,3977,6,152,37,0,3977,352,1,0,0,0,3978,3979,7,14,0,0,
+        3979,3980,7,37,0,0,3980,3981,7,14,0,0,3981,3983,7,8,0,0,3982,3984,
+        7,2,0,0,3983,3982,1,0,0,0,3984,3985,1,0,0,0,3985,3983,1,0,0,0,3985,
+        3986,1,0,0,0,3986,3987,1,0,0,0,3987,3988,7,19,0,0,3988,3989,7,30,
+        0,0,3989,3990,7,17,0,0,3990,3991,1,0,0,0,3991,3992,6,153,39,0,3992,
+        354,1,0,0,0,3993,3994,3,935,444,0,3994,3995,1,0,0,0,3995,3996,6,
+        154,40,0,3996,3997,6,154,37,0,3997,356,1,0,0,0,3998,3999,3,937,445,
+        0,3999,4000,1,0,0,0,4000,4001,6,155,41,0,4001,4002,6,155,37,0,4002,
+        358,1,0,0,0,4003,4004,3,939,446,0,4004,4005,1,0,0,0,4005,4006,6,
+        156,42,0,4006,4007,6,156,37,0,4007,360,1,0,0,0,4008,4009,3,941,447,
+        0,4009,4010,1,0,0,0,4010,4011,6,157,43,0,4011,4012,6,157,37,0,4012,
+        362,1,0,0,0,4013,4014,3,943,448,0,4014,4015,1,0,0,0,4015,4016,6,
+        158,44,0,4016,4017,6,158,37,0,4017,364,1,0,0,0,4018,4019,3,945,449,
+        0,4019,4020,1,0,0,0,4020,4021,6,159,45,0,4021,4022,6,159,37,0,4022,
+        366,1,0,0,0,4023,4024,3,947,450,0,4024,4025,1,0,0,0,4025,4026,6,
+        160,46,0,4026,4027,6,160,37,0,4027,368,1,0,0,0,4028,4029,3,949,451,
+        0,4029,4030,1,0,0,0,4030,4031,6,161,47,0,4031,4032,6,161,37,0,4032,
+        370,1,0,0,0,4033,4034,3,951,452,0,4034,4035,1,0,0,0,4035,4036,6,
+        162,48,0,4036,4037,6,162,37,0,4037,372,1,0,0,0,4038,4039,3,953,453,
+        0,4039,4040,1,0,0,0,4040,4041,6,163,49,0,4041,4042,6,163,37,0,4042,
+        374,1,0,0,0,4043,4044,3,955,454,0,4044,4045,1,0,0,0,4045,4046,6,
+        164,50,0,4046,4047,6,164,37,0,4047,376,1,0,0,0,4048,4049,3,957,455,
+        0,4049,4050,1,0,0,0,4050,4051,6,165,51,0,4051,4052,6,165,37,0,4052,
+        378,1,0,0,0,4053,4054,3,959,456,0,4054,4055,1,0,0,0,4055,4056,6,
+        166,52,0,4056,4057,6,166,37,0,4057,380,1,0,0,0,4058,4059,3,961,457,
+        0,4059,4060,1,0,0,0,4060,4061,6,167,53,0,4061,4062,6,167,37,0,4062,
+        382,1,0,0,0,4063,4064,3,963,458,0,4064,4065,1,0,0,0,4065,4066,6,
+        168,54,0,4066,4067,6,168,37,0,4067,384,1,0,0,0,4068,4069,3,965,459,
+        0,4069,4070,1,0,0,0,4070,4071,6,169,55,0,4071,4072,6,169,37,0,4072,
+        386,1,0,0,0,4073,4074,3,967,460,0,4074,4075,1,0,0,0,4075,4076,6,
+        170,56,0,4076,4077,6,170,37,0,4077,388,1,0,0,0,4078,4079,3,969,461,
+        0,4079,4080,1,0,0,0,4080,4081,6,171,57,0,4081,4082,6,171,37,0,4082,
+        390,1,0,0,0,4083,4084,3,971,462,0,4084,4085,1,0,0,0,4085,4086,6,
+        172,58,0,4086,4087,6,172,37,0,4087,392,1,0,0,0,4088,4089,3,973,463,
+        0,4089,4090,1,0,0,0,4090,4091,6,173,59,0,4091,4092,6,173,37,0,4092,
+        394,1,0,0,0,4093,4094,3,975,464,0,4094,4095,1,0,0,0,4095,4096,6,
+        174,60,0,4096,4097,6,174,37,0,4097,396,1,0,0,0,4098,4099,3,977,465,
+        0,4099,4100,1,0,0,0,4100,4101,6,175,61,0,4101,4102,6,175,37,0,4102,
+        398,1,0,0,0,4103,4104,3,979,466,0,4104,4105,1,0,0,0,4105,4106,6,
+        176,62,0,4106,4107,6,176,37,0,4107,400,1,0,0,0,4108,4109,3,981,467,
+        0,4109,4110,1,0,0,0,4110,4111,6,177,63,0,4111,4112,6,177,37,0,4112,
+        402,1,0,0,0,4113,4114,3,983,468,0,4114,4115,1,0,0,0,4115,4116,6,
+        178,64,0,4116,4117,6,178,37,0,4117,404,1,0,0,0,4118,4119,3,985,469,
+        0,4119,4120,1,0,0,0,4120,4121,6,179,65,0,4121,4122,6,179,37,0,4122,
+        406,1,0,0,0,4123,4124,3,987,470,0,4124,4125,1,0,0,0,4125,4126,6,
+        180,66,0,4126,4127,6,180,37,0,4127,408,1,0,0,0,4128,4129,3,989,471,
+        0,4129,4130,1,0,0,0,4130,4131,6,181,67,0,4131,4132,6,181,37,0,4132,
+        410,1,0,0,0,4133,4134,3,991,472,0,4134,4135,1,0,0,0,4135,4136,6,
+        182,68,0,4136,4137,6,182,37,0,4137,412,1,0,0,0,4138,4139,3,993,473,
+        0,4139,4140,1,0,0,0,4140,4141,6,183,69,0,4141,4142,6,183,37,0,4142,
+        414,1,0,0,0,4143,4144,3,995,474,0,4144,4145,1,0,0,0,4145,4146,6,
+        184,70,0,4146,4147,6,184,37,0,4147,416,1,0,0,0,4148,4149,3,997,475,
+        0,4149,4150,1,0,0,0,4150,4151,6,185,71,0,4151,4152,6,185,37,0,4152,
+        418,1,0,0,0,4153,4154,3,999,476,0,4154,4155,1,0,0,0,4155,4156,6,
+        186,72,0,4156,4157,6,186,37,0,4157,420,1,0,0,0,4158,4159,3,1001,
+        477,0,4159,4160,1,0,0,0,4160,4161,6,187,73,0,4161,4162,6,187,37,
+        0,4162,422,1,0,0,0,4163,4164,3,1003,478,0,4164,4165,1,0,0,0,4165,
+        4166,6,188,74,0,4166,4167,6,188,37,0,4167,424,1,0,0,0,4168,4169,
+        3,1005,479,0,4169,4170,1,0,0,0,4170,4171,6,189,75,0,4171,4172,6,
+        189,37,0,4172,426,1,0,0,0,4173,4174,3,1007,480,0,4174,4175,1,0,0,
+        0,4175,4176,6,190,76,0,4176,4177,6,190,37,0,4177,428,1,0,0,0,4178,
+        4179,3,1009,481,0,4179,4180,1,0,0,0,4180,4181,6,191,77,0,4181,4182,
+        6,191,37,0,4182,430,1,0,0,0,4183,4184,3,1011,482,0,4184,4185,1,0,
+        0,0,4185,4186,6,192,78,0,4186,4187,6,192,37,0,4187,432,1,0,0,0,4188,
+        4189,3,1013,483,0,4189,4190,1,0,0,0,4190,4191,6,193,79,0,4191,4192,
+        6,193,37,0,4192,434,1,0,0,0,4193,4194,3,1015,484,0,4194,4195,1,0,
+        0,0,4195,4196,6,194,80,0,4196,4197,6,194,37,0,4197,436,1,0,0,0,4198,
+        4199,3,1017,485,0,4199,4200,1,0,0,0,4200,4201,6,195,81,0,4201,4202,
+        6,195,37,0,4202,438,1,0,0,0,4203,4204,3,1019,486,0,4204,4205,1,0,
+        0,0,4205,4206,6,196,82,0,4206,4207,6,196,37,0,4207,440,1,0,0,0,4208,
+        4209,3,1021,487,0,4209,4210,1,0,0,0,4210,4211,6,197,83,0,4211,4212,
+        6,197,37,0,4212,442,1,0,0,0,4213,4214,3,1023,488,0,4214,4215,1,0,
+        0,0,4215,4216,6,198,84,0,4216,4217,6,198,37,0,4217,444,1,0,0,0,4218,
+        4219,3,1025,489,0,4219,4220,1,0,0,0,4220,4221,6,199,85,0,4221,4222,
+        6,199,37,0,4222,446,1,0,0,0,4223,4224,3,1027,490,0,4224,4225,1,0,
+        0,0,4225,4226,6,200,86,0,4226,4227,6,200,37,0,4227,448,1,0,0,0,4228,
+        4229,3,1029,491,0,4229,4230,1,0,0,0,4230,4231,6,201,87,0,4231,4232,
+        6,201,37,0,4232,450,1,0,0,0,4233,4234,3,1031,492,0,4234,4235,1,0,
+        0,0,4235,4236,6,202,88,0,4236,4237,6,202,37,0,4237,452,1,0,0,0,4238,
+        4239,3,1033,493,0,4239,4240,1,0,0,0,4240,4241,6,203,89,0,4241,4242,
+        6,203,37,0,4242,454,1,0,0,0,4243,4244,3,1035,494,0,4244,4245,1,0,
+        0,0,4245,4246,6,204,90,0,4246,4247,6,204,37,0,4247,456,1,0,0,0,4248,
+        4249,3,1037,495,0,4249,4250,1,0,0,0,4250,4251,6,205,91,0,4251,4252,
+        6,205,37,0,4252,458,1,0,0,0,4253,4254,3,1039,496,0,4254,4255,1,0,
+        0,0,4255,4256,6,206,92,0,4256,4257,6,206,37,0,4257,460,1,0,0,0,4258,
+        4259,3,1041,497,0,4259,4260,1,0,0,0,4260,4261,6,207,93,0,4261,4262,
+        6,207,37,0,4262,462,1,0,0,0,4263,4264,3,1043,498,0,4264,4265,1,0,
+        0,0,4265,4266,6,208,94,0,4266,4267,6,208,37,0,4267,464,1,0,0,0,4268,
+        4269,3,1045,499,0,4269,4270,1,0,0,0,4270,4271,6,209,95,0,4271,4272,
+        6,209,37,0,4272,466,1,0,0,0,4273,4274,3,1047,500,0,4274,4275,1,0,
+        0,0,4275,4276,6,210,96,0,4276,4277,6,210,37,0,4277,468,1,0,0,0,4278,
+        4279,3,1049,501,0,4279,4280,1,0,0,0,4280,4281,6,211,97,0,4281,4282,
+        6,211,37,0,4282,470,1,0,0,0,4283,4284,3,1051,502,0,4284,4285,1,0,
+        0,0,4285,4286,6,212,98,0,4286,4287,6,212,37,0,4287,472,1,0,0,0,4288,
+        4289,3,1053,503,0,4289,4290,1,0,0,0,4290,4291,6,213,99,0,4291,4292,
+        6,213,37,0,4292,474,1,0,0,0,4293,4294,3,1055,504,0,4294,4295,1,0,
+        0,0,4295,4296,6,214,100,0,4296,4297,6,214,37,0,4297,476,1,0,0,0,
+        4298,4299,3,1057,505,0,4299,4300,1,0,0,0,4300,4301,6,215,101,0,4301,
+        4302,6,215,37,0,4302,478,1,0,0,0,4303,4304,3,1059,506,0,4304,4305,
+        1,0,0,0,4305,4306,6,216,102,0,4306,4307,6,216,37,0,4307,480,1,0,
+        0,0,4308,4309,3,1061,507,0,4309,4310,1,0,0,0,4310,4311,6,217,103,
+        0,4311,4312,6,217,37,0,4312,482,1,0,0,0,4313,4314,3,1063,508,0,4314,
+        4315,1,0,0,0,4315,4316,6,218,104,0,4316,4317,6,218,37,0,4317,484,
+        1,0,0,0,4318,4319,3,1065,509,0,4319,4320,1,0,0,0,4320,4321,6,219,
+        105,0,4321,4322,6,219,37,0,4322,486,1,0,0,0,4323,4324,3,1067,510,
+        0,4324,4325,1,0,0,0,4325,4326,6,220,106,0,4326,4327,6,220,37,0,4327,
+        488,1,0,0,0,4328,4329,3,1069,511,0,4329,4330,1,0,0,0,4330,4331,6,
+        221,107,0,4331,4332,6,221,37,0,4332,490,1,0,0,0,4333,4334,3,1071,
+        512,0,4334,4335,1,0,0,0,4335,4336,6,222,108,0,4336,4337,6,222,37,
+        0,4337,492,1,0,0,0,4338,4339,3,1073,513,0,4339,4340,1,0,0,0,4340,
+        4341,6,223,109,0,4341,4342,6,223,37,0,4342,494,1,0,0,0,4343,4344,
+        3,1075,514,0,4344,4345,1,0,0,0,4345,4346,6,224,110,0,4346,4347,6,
+        224,37,0,4347,496,1,0,0,0,4348,4349,3,1077,515,0,4349,4350,1,0,0,
+        0,4350,4351,6,225,111,0,4351,4352,6,225,37,0,4352,498,1,0,0,0,4353,
+        4354,3,1079,516,0,4354,4355,1,0,0,0,4355,4356,6,226,112,0,4356,4357,
+        6,226,37,0,4357,500,1,0,0,0,4358,4359,3,1081,517,0,4359,4360,1,0,
+        0,0,4360,4361,6,227,113,0,4361,4362,6,227,37,0,4362,502,1,0,0,0,
+        4363,4364,3,1083,518,0,4364,4365,1,0,0,0,4365,4366,6,228,114,0,4366,
+        4367,6,228,37,0,4367,504,1,0,0,0,4368,4369,3,1085,519,0,4369,4370,
+        1,0,0,0,4370,4371,6,229,115,0,4371,4372,6,229,37,0,4372,506,1,0,
+        0,0,4373,4374,3,1087,520,0,4374,4375,1,0,0,0,4375,4376,6,230,116,
+        0,4376,4377,6,230,37,0,4377,508,1,0,0,0,4378,4379,3,1089,521,0,4379,
+        4380,1,0,0,0,4380,4381,6,231,117,0,4381,4382,6,231,37,0,4382,510,
+        1,0,0,0,4383,4384,3,1091,522,0,4384,4385,1,0,0,0,4385,4386,6,232,
+        118,0,4386,4387,6,232,37,0,4387,512,1,0,0,0,4388,4389,3,1093,523,
+        0,4389,4390,1,0,0,0,4390,4391,6,233,119,0,4391,4392,6,233,37,0,4392,
+        514,1,0,0,0,4393,4394,3,1095,524,0,4394,4395,1,0,0,0,4395,4396,6,
+        234,120,0,4396,4397,6,234,37,0,4397,516,1,0,0,0,4398,4399,3,1097,
+        525,0,4399,4400,1,0,0,0,4400,4401,6,235,121,0,4401,4402,6,235,37,
+        0,4402,518,1,0,0,0,4403,4404,3,1099,526,0,4404,4405,1,0,0,0,4405,
+        4406,6,236,122,0,4406,4407,6,236,37,0,4407,520,1,0,0,0,4408,4409,
+        3,1101,527,0,4409,4410,1,0,0,0,4410,4411,6,237,123,0,4411,4412,6,
+        237,37,0,4412,522,1,0,0,0,4413,4415,7,39,0,0,4414,4413,1,0,0,0,4415,
+        4418,1,0,0,0,4416,4414,1,0,0,0,4416,4417,1,0,0,0,4417,4419,1,0,0,
+        0,4418,4416,1,0,0,0,4419,4423,7,40,0,0,4420,4422,7,41,0,0,4421,4420,
+        1,0,0,0,4422,4425,1,0,0,0,4423,4421,1,0,0,0,4423,4424,1,0,0,0,4424,
+        4426,1,0,0,0,4425,4423,1,0,0,0,4426,4427,6,238,124,0,4427,4428,6,
+        238,37,0,4428,524,1,0,0,0,4429,4430,8,42,0,0,4430,4431,4,239,3,0,
+        4431,4432,1,0,0,0,4432,4433,6,239,26,0,4433,4434,6,239,37,0,4434,
+        4435,6,239,4,0,4435,4436,6,239,3,0,4436,526,1,0,0,0,4437,4438,1,
+        0,0,0,4438,4439,1,0,0,0,4439,4440,6,240,2,0,4440,4441,6,240,37,0,
+        4441,528,1,0,0,0,4442,4443,3,329,141,0,4443,4444,1,0,0,0,4444,4445,
+        6,241,125,0,4445,4446,6,241,37,0,4446,530,1,0,0,0,4447,4448,5,46,
+        0,0,4448,4449,5,46,0,0,4449,4450,5,46,0,0,4450,4454,1,0,0,0,4451,
+        4453,7,2,0,0,4452,4451,1,0,0,0,4453,4456,1,0,0,0,4454,4452,1,0,0,
+        0,4454,4455,1,0,0,0,4455,4457,1,0,0,0,4456,4454,1,0,0,0,4457,4458,
+        3,99,26,0,4458,4460,3,57,5,0,4459,4461,7,2,0,0,4460,4459,1,0,0,0,
+        4461,4462,1,0,0,0,4462,4460,1,0,0,0,4462,4463,1,0,0,0,4463,4464,
+        1,0,0,0,4464,4465,6,242,126,0,4465,4466,1,0,0,0,4466,4467,6,242,
+        127,0,4467,532,1,0,0,0,4468,4469,8,0,0,0,4469,4473,4,243,4,0,4470,
+        4472,8,0,0,0,4471,4470,1,0,0,0,4472,4475,1,0,0,0,4473,4471,1,0,0,
+        0,4473,4474,1,0,0,0,4474,4476,1,0,0,0,4475,4473,1,0,0,0,4476,4477,
+        6,243,3,0,4477,534,1,0,0,0,4478,4479,5,37,0,0,4479,4480,7,20,0,0,
+        4480,4481,7,31,0,0,4481,4482,7,19,0,0,4482,536,1,0,0,0,4483,4484,
+        5,37,0,0,4484,4485,7,20,0,0,4485,4486,7,5,0,0,4486,4487,7,5,0,0,
+        4487,4488,7,13,0,0,4488,538,1,0,0,0,4489,4490,5,37,0,0,4490,4491,
+        7,20,0,0,4491,4492,7,17,0,0,4492,4493,7,17,0,0,4493,4494,7,7,0,0,
+        4494,4495,7,8,0,0,4495,540,1,0,0,0,4496,4497,5,37,0,0,4497,4498,
+        7,31,0,0,4498,4499,7,9,0,0,4499,4500,7,16,0,0,4500,4501,7,20,0,0,
+        4501,4502,7,15,0,0,4502,4503,7,5,0,0,4503,542,1,0,0,0,4504,4505,
+        5,37,0,0,4505,4506,7,31,0,0,4506,4507,7,9,0,0,4507,4508,7,16,0,0,
+        4508,4509,7,15,0,0,4509,4510,7,7,0,0,4510,4511,7,16,0,0,4511,544,
+        1,0,0,0,4512,4513,5,37,0,0,4513,4514,7,31,0,0,4514,4515,7,9,0,0,
+        4515,4516,7,16,0,0,4516,4517,7,7,0,0,4517,4518,7,13,0,0,4518,546,
+        1,0,0,0,4519,4520,5,37,0,0,4520,4521,7,31,0,0,4521,4522,7,9,0,0,
+        4522,4523,7,16,0,0,4523,4524,7,37,0,0,4524,4525,7,7,0,0,4525,4526,
+        7,13,0,0,4526,548,1,0,0,0,4527,4528,5,37,0,0,4528,4529,7,8,0,0,4529,
+        4530,7,11,0,0,4530,4531,7,20,0,0,4531,4532,7,13,0,0,4532,550,1,0,
+        0,0,4533,4534,5,37,0,0,4534,4535,7,8,0,0,4535,4536,7,11,0,0,4536,
+        4537,7,14,0,0,4537,4538,7,8,0,0,4538,4539,7,38,0,0,4539,552,1,0,
+        0,0,4540,4541,5,37,0,0,4541,4542,7,8,0,0,4542,4543,7,11,0,0,4543,
+        4544,7,14,0,0,4544,4545,7,8,0,0,4545,4546,7,38,0,0,4546,4547,7,13,
+        0,0,4547,554,1,0,0,0,4548,4549,5,37,0,0,4549,4550,7,5,0,0,4550,4551,
+        7,20,0,0,4551,4552,7,16,0,0,4552,4553,7,14,0,0,4553,556,1,0,0,0,
+        4554,4555,5,37,0,0,4555,4556,7,5,0,0,4556,4557,7,20,0,0,4557,4558,
+        7,21,0,0,4558,4559,7,19,0,0,4559,558,1,0,0,0,4560,4561,5,37,0,0,
+        4561,4562,7,5,0,0,4562,4563,7,14,0,0,4563,4564,7,8,0,0,4564,560,
+        1,0,0,0,4565,4566,5,37,0,0,4566,4567,7,5,0,0,4567,4568,7,14,0,0,
+        4568,4569,7,8,0,0,4569,4570,7,11,0,0,4570,562,1,0,0,0,4571,4572,
+        5,37,0,0,4572,4573,7,5,0,0,4573,4574,7,14,0,0,4574,4575,7,8,0,0,
+        4575,4576,7,10,0,0,4576,4577,7,7,0,0,4577,4578,7,19,0,0,4578,564,
+        1,0,0,0,4579,4580,5,37,0,0,4580,4581,7,5,0,0,4581,4582,7,9,0,0,4582,
+        4583,7,6,0,0,4583,4584,7,6,0,0,4584,566,1,0,0,0,4585,4586,5,37,0,
+        0,4586,4587,7,5,0,0,4587,4588,7,9,0,0,4588,4589,7,35,0,0,4589,568,
+        1,0,0,0,4590,4591,5,37,0,0,4591,4592,7,14,0,0,4592,4593,7,5,0,0,
+        4593,4594,7,9,0,0,4594,4595,7,16,0,0,4595,4596,7,8,0,0,4596,570,
+        1,0,0,0,4597,4598,5,37,0,0,4598,4599,7,14,0,0,4599,4600,7,5,0,0,
+        4600,4601,7,9,0,0,4601,4602,7,16,0,0,4602,4603,7,6,0,0,4603,4604,
+        7,17,0,0,4604,4605,7,16,0,0,4605,572,1,0,0,0,4606,4607,5,37,0,0,
+        4607,4608,7,14,0,0,4608,4609,7,5,0,0,4609,4610,7,9,0,0,4610,4611,
+        7,16,0,0,4611,4612,7,34,0,0,4612,574,1,0,0,0,4613,4614,5,37,0,0,
+        4614,4615,7,14,0,0,4615,4616,7,17,0,0,4616,4617,7,14,0,0,4617,4618,
+        7,33,0,0,4618,576,1,0,0,0,4619,4620,5,37,0,0,4620,4621,7,14,0,0,
+        4621,4622,7,7,0,0,4622,4623,7,6,0,0,4623,578,1,0,0,0,4624,4625,5,
+        37,0,0,4625,4626,7,14,0,0,4626,4627,7,30,0,0,4627,4628,7,22,0,0,
+        4628,4629,7,20,0,0,4629,4630,7,17,0,0,4630,580,1,0,0,0,4631,4632,
+        5,37,0,0,4632,4633,7,14,0,0,4633,4634,7,13,0,0,4634,4635,7,13,0,
+        0,4635,4636,7,7,0,0,4636,4637,7,13,0,0,4637,582,1,0,0,0,4638,4639,
+        5,37,0,0,4639,4640,7,6,0,0,4640,4641,7,9,0,0,4641,4642,7,14,0,0,
+        4642,4643,7,17,0,0,4643,4644,7,5,0,0,4644,4645,7,19,0,0,4645,584,
+        1,0,0,0,4646,4647,5,37,0,0,4647,4648,7,6,0,0,4648,4649,7,17,0,0,
+        4649,4650,7,7,0,0,4650,4651,7,20,0,0,4651,4652,7,16,0,0,4652,586,
+        1,0,0,0,4653,4654,5,37,0,0,4654,4655,7,6,0,0,4655,4656,7,7,0,0,4656,
+        4657,7,22,0,0,4657,4658,7,15,0,0,4658,4659,7,5,0,0,4659,588,1,0,
+        0,0,4660,4661,5,37,0,0,4661,4662,7,32,0,0,4662,4663,7,13,0,0,4663,
+        4664,7,20,0,0,4664,4665,7,10,0,0,4665,4666,7,11,0,0,4666,590,1,0,
+        0,0,4667,4668,5,37,0,0,4668,4669,7,11,0,0,4669,4670,7,20,0,0,4670,
+        4671,7,15,0,0,4671,4672,7,5,0,0,4672,4673,7,17,0,0,4673,4674,7,14,
+        0,0,4674,4675,7,13,0,0,4675,592,1,0,0,0,4676,4677,5,37,0,0,4677,
+        4678,7,11,0,0,4678,4679,7,7,0,0,4679,4680,7,22,0,0,4680,4681,7,13,
+        0,0,4681,4682,7,19,0,0,4682,594,1,0,0,0,4683,4684,5,37,0,0,4684,
+        4685,7,9,0,0,4685,4686,7,15,0,0,4686,4687,7,16,0,0,4687,596,1,0,
+        0,0,4688,4689,5,37,0,0,4689,4690,7,9,0,0,4690,4691,7,15,0,0,4691,
+        4692,7,16,0,0,4692,4693,7,11,0,0,4693,598,1,0,0,0,4694,4695,5,37,
+        0,0,4695,4696,7,38,0,0,4696,4697,7,5,0,0,4697,4698,7,19,0,0,4698,
+        600,1,0,0,0,4699,4700,5,37,0,0,4700,4701,7,17,0,0,4701,4702,7,14,
+        0,0,4702,4703,7,15,0,0,4703,602,1,0,0,0,4704,4705,5,37,0,0,4705,
+        4706,7,17,0,0,4706,4707,7,7,0,0,4707,4708,7,7,0,0,4708,4709,7,38,
+        0,0,4709,4710,7,22,0,0,4710,4711,7,10,0,0,4711,604,1,0,0,0,4712,
+        4713,5,37,0,0,4713,4714,7,17,0,0,4714,4715,7,7,0,0,4715,4716,7,7,
+        0,0,4716,4717,7,38,0,0,4717,4718,7,22,0,0,4718,4719,7,10,0,0,4719,
+        4720,7,17,0,0,4720,4721,7,16,0,0,4721,606,1,0,0,0,4722,4723,5,37,
+        0,0,4723,4724,7,17,0,0,4724,4725,7,7,0,0,4725,4726,7,7,0,0,4726,
+        4727,7,38,0,0,4727,4728,7,22,0,0,4728,4729,7,10,0,0,4729,4730,7,
+        17,0,0,4730,4731,7,14,0,0,4731,608,1,0,0,0,4732,4733,5,37,0,0,4733,
+        4734,7,17,0,0,4734,4735,7,7,0,0,4735,4736,7,7,0,0,4736,4737,7,38,
+        0,0,4737,4738,7,22,0,0,4738,4739,7,10,0,0,4739,4740,7,32,0,0,4740,
+        4741,7,16,0,0,4741,610,1,0,0,0,4742,4743,5,37,0,0,4743,4744,7,17,
+        0,0,4744,4745,7,7,0,0,4745,4746,7,7,0,0,4746,4747,7,38,0,0,4747,
+        4748,7,22,0,0,4748,4749,7,10,0,0,4749,4750,7,32,0,0,4750,4751,7,
+        14,0,0,4751,612,1,0,0,0,4752,4753,5,37,0,0,4753,4754,7,33,0,0,4754,
+        4755,7,9,0,0,4755,4756,7,15,0,0,4756,4757,7,22,0,0,4757,4758,7,16,
+        0,0,4758,4759,7,14,0,0,4759,4760,7,19,0,0,4760,614,1,0,0,0,4761,
+        4762,5,37,0,0,4762,4763,7,33,0,0,4763,4764,7,7,0,0,4764,4765,7,15,
+        0,0,4765,4766,7,16,0,0,4766,4767,7,11,0,0,4767,4768,7,19,0,0,4768,
+        616,1,0,0,0,4769,4770,5,37,0,0,4770,4771,7,33,0,0,4771,4772,7,19,
+        0,0,4772,4773,7,14,0,0,4773,4774,7,8,0,0,4774,4775,7,7,0,0,4775,
+        4776,7,15,0,0,4776,4777,7,5,0,0,4777,4778,7,19,0,0,4778,618,1,0,
+        0,0,4779,4780,5,37,0,0,4780,4781,7,15,0,0,4781,4782,7,22,0,0,4782,
+        4783,7,17,0,0,4783,4784,7,9,0,0,4784,4785,7,15,0,0,4785,4786,7,5,
+        0,0,4786,620,1,0,0,0,4787,4788,5,37,0,0,4788,4789,7,7,0,0,4789,4790,
+        7,8,0,0,4790,4791,7,22,0,0,4791,4792,7,13,0,0,4792,622,1,0,0,0,4793,
+        4794,5,37,0,0,4794,4795,7,7,0,0,4795,4796,7,10,0,0,4796,4797,7,14,
+        0,0,4797,4798,7,15,0,0,4798,624,1,0,0,0,4799,4800,5,37,0,0,4800,
+        4801,7,10,0,0,4801,4802,7,20,0,0,4802,4803,7,5,0,0,4803,4804,7,5,
+        0,0,4804,4805,7,13,0,0,4805,626,1,0,0,0,4806,4807,5,37,0,0,4807,
+        4808,7,10,0,0,4808,4809,7,20,0,0,4809,4810,7,13,0,0,4810,4811,7,
+        33,0,0,4811,4812,7,19,0,0,4812,628,1,0,0,0,4813,4814,5,37,0,0,4814,
+        4815,7,10,0,0,4815,4816,7,20,0,0,4816,4817,7,13,0,0,4817,4818,7,
+        33,0,0,4818,4819,7,15,0,0,4819,4820,7,22,0,0,4820,4821,7,33,0,0,
+        4821,630,1,0,0,0,4822,4823,5,37,0,0,4823,4824,7,13,0,0,4824,4825,
+        7,14,0,0,4825,4826,7,20,0,0,4826,4827,7,17,0,0,4827,4828,7,17,0,
+        0,4828,4829,7,7,0,0,4829,4830,7,8,0,0,4830,632,1,0,0,0,4831,4832,
+        5,37,0,0,4832,4833,7,13,0,0,4833,4834,7,14,0,0,4834,4835,7,33,0,
+        0,4835,634,1,0,0,0,4836,4837,5,37,0,0,4837,4838,7,13,0,0,4838,4839,
+        7,14,0,0,4839,4840,7,10,0,0,4840,4841,7,17,0,0,4841,4842,7,20,0,
+        0,4842,4843,7,8,0,0,4843,4844,7,14,0,0,4844,636,1,0,0,0,4845,4846,
+        5,37,0,0,4846,4847,7,19,0,0,4847,4848,7,8,0,0,4848,4849,7,20,0,0,
+        4849,4850,7,15,0,0,4850,638,1,0,0,0,4851,4852,5,37,0,0,4852,4853,
+        7,19,0,0,4853,4854,7,8,0,0,4854,4855,7,20,0,0,4855,4856,7,15,0,0,
+        4856,4857,7,13,0,0,4857,4858,7,10,0,0,4858,4859,7,17,0,0,4859,640,
+        1,0,0,0,4860,4861,5,37,0,0,4861,4862,7,19,0,0,4862,4863,7,14,0,0,
+        4863,4864,7,8,0,0,4864,4865,7,7,0,0,4865,4866,7,15,0,0,4866,4867,
+        7,5,0,0,4867,642,1,0,0,0,4868,4869,5,37,0,0,4869,4870,7,19,0,0,4870,
+        4871,7,11,0,0,4871,4872,7,16,0,0,4872,4873,7,5,0,0,4873,4874,7,15,
+        0,0,4874,644,1,0,0,0,4875,4876,5,37,0,0,4876,4877,7,19,0,0,4877,
+        4878,7,9,0,0,4878,4879,7,43,0,0,4879,4880,7,14,0,0,4880,646,1,0,
+        0,0,4881,4882,5,37,0,0,4882,4883,7,19,0,0,4883,4884,7,30,0,0,4884,
+        4885,7,13,0,0,4885,4886,7,16,0,0,4886,648,1,0,0,0,4887,4888,5,37,
+        0,0,4888,4889,7,19,0,0,4889,4890,7,16,0,0,4890,4891,7,20,0,0,4891,
+        4892,7,16,0,0,4892,4893,7,22,0,0,4893,4894,7,19,0,0,4894,650,1,0,
+        0,0,4895,4896,5,37,0,0,4896,4897,7,19,0,0,4897,4898,7,16,0,0,4898,
+        4899,7,13,0,0,4899,652,1,0,0,0,4900,4901,5,37,0,0,4901,4902,7,19,
+        0,0,4902,4903,7,22,0,0,4903,4904,7,31,0,0,4904,4905,7,20,0,0,4905,
+        4906,7,13,0,0,4906,4907,7,13,0,0,4907,654,1,0,0,0,4908,4909,5,37,
+        0,0,4909,4910,7,19,0,0,4910,4911,7,22,0,0,4911,4912,7,31,0,0,4912,
+        4913,7,5,0,0,4913,4914,7,16,0,0,4914,656,1,0,0,0,4915,4916,5,37,
+        0,0,4916,4917,7,19,0,0,4917,4918,7,22,0,0,4918,4919,7,31,0,0,4919,
+        4920,7,19,0,0,4920,4921,7,16,0,0,4921,658,1,0,0,0,4922,4923,5,37,
+        0,0,4923,4924,7,16,0,0,4924,4925,7,11,0,0,4925,4926,7,9,0,0,4926,
+        4927,7,19,0,0,4927,660,1,0,0,0,4928,4929,5,37,0,0,4929,4930,7,16,
+        0,0,4930,4931,7,9,0,0,4931,4932,7,33,0,0,4932,4933,7,14,0,0,4933,
+        662,1,0,0,0,4934,4935,5,37,0,0,4935,4936,7,16,0,0,4936,4937,7,9,
+        0,0,4937,4938,7,33,0,0,4938,4939,7,14,0,0,4939,4940,7,19,0,0,4940,
+        4941,7,16,0,0,4941,4942,7,20,0,0,4942,4943,7,33,0,0,4943,4944,7,
+        10,0,0,4944,664,1,0,0,0,4945,4946,5,37,0,0,4946,4947,7,16,0,0,4947,
+        4948,7,17,0,0,4948,4949,7,7,0,0,4949,4950,7,7,0,0,4950,4951,7,38,
+        0,0,4951,4952,7,22,0,0,4952,4953,7,10,0,0,4953,666,1,0,0,0,4954,
+        4955,5,37,0,0,4955,4956,7,16,0,0,4956,4957,7,17,0,0,4957,4958,7,
+        7,0,0,4958,4959,7,7,0,0,4959,4960,7,38,0,0,4960,4961,7,22,0,0,4961,
+        4962,7,10,0,0,4962,4963,7,17,0,0,4963,4964,7,16,0,0,4964,668,1,0,
+        0,0,4965,4966,5,37,0,0,4966,4967,7,16,0,0,4967,4968,7,17,0,0,4968,
+        4969,7,7,0,0,4969,4970,7,7,0,0,4970,4971,7,38,0,0,4971,4972,7,22,
+        0,0,4972,4973,7,10,0,0,4973,4974,7,17,0,0,4974,4975,7,14,0,0,4975,
+        670,1,0,0,0,4976,4977,5,37,0,0,4977,4978,7,16,0,0,4978,4979,7,17,
+        0,0,4979,4980,7,7,0,0,4980,4981,7,7,0,0,4981,4982,7,38,0,0,4982,
+        4983,7,22,0,0,4983,4984,7,10,0,0,4984,4985,7,32,0,0,4985,4986,7,
+        16,0,0,4986,672,1,0,0,0,4987,4988,5,37,0,0,4988,4989,7,16,0,0,4989,
+        4990,7,17,0,0,4990,4991,7,7,0,0,4991,4992,7,7,0,0,4992,4993,7,38,
+        0,0,4993,4994,7,22,0,0,4994,4995,7,10,0,0,4995,4996,7,32,0,0,4996,
+        4997,7,14,0,0,4997,674,1,0,0,0,4998,4999,5,37,0,0,4999,5000,7,16,
+        0,0,5000,5001,7,13,0,0,5001,5002,7,9,0,0,5002,5003,7,33,0,0,5003,
+        676,1,0,0,0,5004,5005,5,37,0,0,5005,5006,7,16,0,0,5006,5007,7,13,
+        0,0,5007,5008,7,9,0,0,5008,5009,7,33,0,0,5009,5010,7,17,0,0,5010,
+        678,1,0,0,0,5011,5012,5,37,0,0,5012,5013,7,16,0,0,5013,5014,7,13,
+        0,0,5014,5015,7,9,0,0,5015,5016,7,33,0,0,5016,5017,7,13,0,0,5017,
+        680,1,0,0,0,5018,5019,5,37,0,0,5019,5020,7,22,0,0,5020,5021,7,8,
+        0,0,5021,5022,7,19,0,0,5022,5023,5,50,0,0,5023,682,1,0,0,0,5024,
+        5025,5,37,0,0,5025,5026,7,22,0,0,5026,5027,7,15,0,0,5027,5028,7,
+        19,0,0,5028,684,1,0,0,0,5029,5030,5,37,0,0,5030,5031,7,22,0,0,5031,
+        5032,7,15,0,0,5032,5033,7,19,0,0,5033,5034,7,11,0,0,5034,686,1,0,
+        0,0,5035,5036,5,37,0,0,5036,5037,7,37,0,0,5037,5038,7,6,0,0,5038,
+        5039,7,7,0,0,5039,5040,7,7,0,0,5040,5041,7,16,0,0,5041,688,1,0,0,
+        0,5042,5043,5,37,0,0,5043,5044,7,37,0,0,5044,5045,7,17,0,0,5045,
+        5046,7,20,0,0,5046,5047,7,16,0,0,5047,5048,7,14,0,0,5048,690,1,0,
+        0,0,5049,5050,5,37,0,0,5050,5051,7,37,0,0,5051,5052,7,33,0,0,5052,
+        5053,7,17,0,0,5053,692,1,0,0,0,5054,5055,5,37,0,0,5055,5056,7,21,
+        0,0,5056,5057,7,14,0,0,5057,5058,7,20,0,0,5058,5059,7,13,0,0,5059,
+        5060,7,19,0,0,5060,694,1,0,0,0,5061,5062,5,42,0,0,5062,5063,7,20,
+        0,0,5063,5064,7,17,0,0,5064,5065,7,17,0,0,5065,696,1,0,0,0,5066,
+        5067,5,42,0,0,5067,5068,7,15,0,0,5068,5069,7,7,0,0,5069,5070,7,15,
+        0,0,5070,5071,7,14,0,0,5071,698,1,0,0,0,5072,5073,5,42,0,0,5073,
+        5074,7,21,0,0,5074,5075,7,14,0,0,5075,5076,7,19,0,0,5076,700,1,0,
+        0,0,5077,5078,5,42,0,0,5078,5079,7,15,0,0,5079,5080,7,7,0,0,5080,
+        702,1,0,0,0,5081,5082,5,42,0,0,5082,5083,7,9,0,0,5083,5084,7,17,
+        0,0,5084,5085,7,14,0,0,5085,5086,7,13,0,0,5086,5087,7,10,0,0,5087,
+        5088,7,32,0,0,5088,704,1,0,0,0,5089,5090,5,42,0,0,5090,5091,7,8,
+        0,0,5091,5092,7,7,0,0,5092,5093,7,33,0,0,5093,5094,7,10,0,0,5094,
+        5095,7,20,0,0,5095,5096,7,16,0,0,5096,706,1,0,0,0,5097,5098,5,42,
+        0,0,5098,5099,7,8,0,0,5099,5100,7,13,0,0,5100,5101,7,16,0,0,5101,
+        5102,7,31,0,0,5102,5103,7,15,0,0,5103,5104,7,5,0,0,5104,5105,7,13,
+        0,0,5105,5106,7,10,0,0,5106,5107,7,32,0,0,5107,708,1,0,0,0,5108,
+        5109,5,42,0,0,5109,5110,7,8,0,0,5110,5111,7,13,0,0,5111,5112,7,16,
+        0,0,5112,5113,7,13,0,0,5113,5114,7,10,0,0,5114,5115,7,32,0,0,5115,
+        5116,7,33,0,0,5116,5117,7,7,0,0,5117,5118,7,5,0,0,5118,710,1,0,0,
+        0,5119,5120,5,42,0,0,5120,5121,7,35,0,0,5121,5122,7,44,0,0,5122,
+        5123,7,13,0,0,5123,5124,7,44,0,0,5124,5125,7,33,0,0,5125,5126,7,
+        44,0,0,5126,712,1,0,0,0,5127,5128,5,42,0,0,5128,5129,7,20,0,0,5129,
+        5130,7,17,0,0,5130,5131,7,17,0,0,5131,5132,7,32,0,0,5132,714,1,0,
+        0,0,5133,5134,5,42,0,0,5134,5135,7,20,0,0,5135,5136,7,17,0,0,5136,
+        5137,7,17,0,0,5137,5138,7,22,0,0,5138,716,1,0,0,0,5139,5140,5,42,
+        0,0,5140,5141,7,20,0,0,5141,5142,7,17,0,0,5142,5143,7,17,0,0,5143,
+        5144,7,16,0,0,5144,5145,7,11,0,0,5145,5146,7,13,0,0,5146,5147,7,
+        14,0,0,5147,5148,7,20,0,0,5148,5149,7,5,0,0,5149,718,1,0,0,0,5150,
+        5151,5,42,0,0,5151,5152,7,20,0,0,5152,5153,7,17,0,0,5153,5154,7,
+        17,0,0,5154,5155,7,37,0,0,5155,720,1,0,0,0,5156,5157,5,42,0,0,5157,
+        5158,7,31,0,0,5158,5159,7,17,0,0,5159,5160,7,20,0,0,5160,5161,7,
+        15,0,0,5161,5162,7,38,0,0,5162,5170,7,19,0,0,5163,5164,5,42,0,0,
+        5164,5165,7,31,0,0,5165,5166,7,17,0,0,5166,5167,7,20,0,0,5167,5168,
+        7,15,0,0,5168,5170,7,38,0,0,5169,5156,1,0,0,0,5169,5163,1,0,0,0,
+        5170,722,1,0,0,0,5171,5172,5,42,0,0,5172,5173,7,8,0,0,5173,5174,
+        7,20,0,0,5174,5175,7,15,0,0,5175,5176,7,8,0,0,5176,5177,7,17,0,0,
+        5177,724,1,0,0,0,5178,5179,5,42,0,0,5179,5180,7,8,0,0,5180,5181,
+        7,21,0,0,5181,5182,7,33,0,0,5182,5184,7,5,0,0,5183,5185,7,45,0,0,
+        5184,5183,1,0,0,0,5184,5185,1,0,0,0,5185,726,1,0,0,0,5186,5187,5,
+        42,0,0,5187,5188,7,8,0,0,5188,5189,7,33,0,0,5189,5190,7,5,0,0,5190,
+        5192,7,21,0,0,5191,5193,7,45,0,0,5192,5191,1,0,0,0,5192,5193,1,0,
+        0,0,5193,728,1,0,0,0,5194,5195,5,42,0,0,5195,5196,7,8,0,0,5196,5197,
+        7,5,0,0,5197,5198,7,33,0,0,5198,5200,7,21,0,0,5199,5201,7,45,0,0,
+        5200,5199,1,0,0,0,5200,5201,1,0,0,0,5201,730,1,0,0,0,5202,5203,5,
+        42,0,0,5203,5204,7,33,0,0,5204,5205,7,5,0,0,5205,5207,7,21,0,0,5206,
+        5208,7,45,0,0,5207,5206,1,0,0,0,5207,5208,1,0,0,0,5208,732,1,0,0,
+        0,5209,5210,5,42,0,0,5210,5211,7,5,0,0,5211,5212,7,33,0,0,5212,5214,
+        7,21,0,0,5213,5215,7,45,0,0,5214,5213,1,0,0,0,5214,5215,1,0,0,0,
+        5215,734,1,0,0,0,5216,5217,5,42,0,0,5217,5218,7,5,0,0,5218,5219,
+        7,6,0,0,5219,5220,7,16,0,0,5220,736,1,0,0,0,5221,5222,5,42,0,0,5222,
+        5223,7,21,0,0,5223,5224,7,33,0,0,5224,5226,7,5,0,0,5225,5227,7,45,
+        0,0,5226,5225,1,0,0,0,5226,5227,1,0,0,0,5227,738,1,0,0,0,5228,5229,
+        5,42,0,0,5229,5230,7,18,0,0,5230,5231,7,22,0,0,5231,5233,7,17,0,
+        0,5232,5234,7,45,0,0,5233,5232,1,0,0,0,5233,5234,1,0,0,0,5234,740,
+        1,0,0,0,5235,5236,5,42,0,0,5236,5237,7,18,0,0,5237,5238,7,20,0,0,
+        5238,5239,7,35,0,0,5239,5240,7,20,0,0,5240,742,1,0,0,0,5241,5242,
+        5,42,0,0,5242,5243,7,9,0,0,5243,5244,7,19,0,0,5244,5246,7,7,0,0,
+        5245,5247,7,46,0,0,5246,5245,1,0,0,0,5246,5247,1,0,0,0,5247,744,
+        1,0,0,0,5248,5249,5,42,0,0,5249,5250,7,22,0,0,5250,5251,7,19,0,0,
+        5251,5253,7,20,0,0,5252,5254,2,47,48,0,5253,5252,1,0,0,0,5253,5254,
+        1,0,0,0,5254,746,1,0,0,0,5255,5256,5,42,0,0,5256,5257,7,14,0,0,5257,
+        5258,7,22,0,0,5258,5260,7,13,0,0,5259,5261,7,47,0,0,5260,5259,1,
+        0,0,0,5260,5261,1,0,0,0,5261,748,1,0,0,0,5262,5263,5,42,0,0,5263,
+        5264,7,18,0,0,5264,5265,7,9,0,0,5265,5267,7,19,0,0,5266,5268,7,46,
+        0,0,5267,5266,1,0,0,0,5267,5268,1,0,0,0,5268,750,1,0,0,0,5269,5270,
+        5,42,0,0,5270,5271,7,5,0,0,5271,5272,7,20,0,0,5272,5273,7,16,0,0,
+        5273,5274,7,14,0,0,5274,752,1,0,0,0,5275,5276,5,42,0,0,5276,5277,
+        7,5,0,0,5277,5278,7,20,0,0,5278,5279,7,21,0,0,5279,754,1,0,0,0,5280,
+        5281,5,42,0,0,5281,5282,7,5,0,0,5282,5283,7,14,0,0,5283,5284,7,16,
+        0,0,5284,5285,7,8,0,0,5285,756,1,0,0,0,5286,5287,5,42,0,0,5287,5288,
+        7,5,0,0,5288,5289,7,14,0,0,5289,5290,7,16,0,0,5290,5291,7,17,0,0,
+        5291,758,1,0,0,0,5292,5293,5,42,0,0,5293,5294,7,5,0,0,5294,5295,
+        7,16,0,0,5295,5296,7,20,0,0,5296,5297,7,20,0,0,5297,5298,7,13,0,
+        0,5298,5299,7,20,0,0,5299,760,1,0,0,0,5300,5301,5,42,0,0,5301,5302,
+        7,14,0,0,5302,5303,7,15,0,0,5303,5304,7,5,0,0,5304,762,1,0,0,0,5305,
+        5306,5,42,0,0,5306,5307,7,14,0,0,5307,5308,7,15,0,0,5308,5309,7,
+        16,0,0,5309,5310,7,13,0,0,5310,5311,7,21,0,0,5311,764,1,0,0,0,5312,
+        5313,5,42,0,0,5313,5314,7,14,0,0,5314,5315,7,30,0,0,5315,5316,7,
+        22,0,0,5316,5317,7,20,0,0,5317,5318,7,16,0,0,5318,5319,7,14,0,0,
+        5319,766,1,0,0,0,5320,5321,5,42,0,0,5321,5322,7,14,0,0,5322,5323,
+        7,37,0,0,5323,5324,7,16,0,0,5324,5325,7,5,0,0,5325,5326,7,6,0,0,
+        5326,5327,7,16,0,0,5327,768,1,0,0,0,5328,5329,5,42,0,0,5329,5330,
+        7,14,0,0,5330,5331,7,37,0,0,5331,5332,7,16,0,0,5332,770,1,0,0,0,
+        5333,5334,5,42,0,0,5334,5335,7,6,0,0,5335,5336,7,9,0,0,5336,5337,
+        7,17,0,0,5337,5338,7,14,0,0,5338,772,1,0,0,0,5339,5340,5,42,0,0,
+        5340,5341,7,32,0,0,5341,5342,7,14,0,0,5342,5343,7,16,0,0,5343,5344,
+        7,9,0,0,5344,5345,7,15,0,0,5345,774,1,0,0,0,5346,5347,5,42,0,0,5347,
+        5348,7,11,0,0,5348,5349,7,9,0,0,5349,5350,7,35,0,0,5350,5351,7,20,
+        0,0,5351,5352,7,17,0,0,5352,776,1,0,0,0,5353,5354,5,42,0,0,5354,
+        5355,7,9,0,0,5355,5356,7,15,0,0,5356,5357,7,9,0,0,5357,5358,7,16,
+        0,0,5358,778,1,0,0,0,5359,5360,5,42,0,0,5360,5361,7,9,0,0,5361,5362,
+        7,15,0,0,5362,5363,7,44,0,0,5363,5372,7,44,0,0,5364,5365,5,42,0,
+        0,5365,5366,7,9,0,0,5366,5367,7,15,0,0,5367,5368,5,40,0,0,5368,5369,
+        7,44,0,0,5369,5370,7,44,0,0,5370,5372,5,41,0,0,5371,5359,1,0,0,0,
+        5371,5364,1,0,0,0,5372,780,1,0,0,0,5373,5374,5,42,0,0,5374,5375,
+        7,9,0,0,5375,5376,7,15,0,0,5376,5377,7,43,0,0,5377,5378,7,19,0,0,
+        5378,5379,7,13,0,0,5379,782,1,0,0,0,5380,5381,5,42,0,0,5381,5382,
+        7,9,0,0,5382,5383,7,15,0,0,5383,784,1,0,0,0,5384,5385,5,42,0,0,5385,
+        5386,7,9,0,0,5386,5387,7,15,0,0,5387,5388,7,10,0,0,5388,5389,7,22,
+        0,0,5389,5390,7,16,0,0,5390,786,1,0,0,0,5391,5392,5,42,0,0,5392,
+        5393,7,7,0,0,5393,5394,7,22,0,0,5394,5395,7,16,0,0,5395,5396,7,10,
+        0,0,5396,5397,7,22,0,0,5397,5398,7,16,0,0,5398,788,1,0,0,0,5399,
+        5400,5,42,0,0,5400,5401,7,18,0,0,5401,5402,7,7,0,0,5402,5403,7,31,
+        0,0,5403,5404,7,13,0,0,5404,5405,7,22,0,0,5405,5406,7,15,0,0,5406,
+        790,1,0,0,0,5407,5408,5,42,0,0,5408,5409,7,18,0,0,5409,5410,7,7,
+        0,0,5410,5411,7,31,0,0,5411,792,1,0,0,0,5412,5413,5,42,0,0,5413,
+        5414,7,17,0,0,5414,5415,7,5,0,0,5415,5416,7,20,0,0,5416,794,1,0,
+        0,0,5417,5418,5,42,0,0,5418,5419,7,17,0,0,5419,5420,7,9,0,0,5420,
+        5421,7,38,0,0,5421,5422,7,14,0,0,5422,796,1,0,0,0,5423,5424,5,42,
+        0,0,5424,5425,7,17,0,0,5425,5426,7,7,0,0,5426,5427,7,15,0,0,5427,
+        5428,7,32,0,0,5428,5429,7,18,0,0,5429,5430,7,22,0,0,5430,5431,7,
+        17,0,0,5431,798,1,0,0,0,5432,5433,5,42,0,0,5433,5434,7,17,0,0,5434,
+        5435,7,7,0,0,5435,5436,7,35,0,0,5436,5437,7,20,0,0,5437,5438,7,17,
+        0,0,5438,800,1,0,0,0,5439,5440,5,42,0,0,5440,5441,7,38,0,0,5441,
+        5442,7,14,0,0,5442,5443,7,21,0,0,5443,802,1,0,0,0,5444,5445,5,42,
+        0,0,5445,5446,7,33,0,0,5446,5447,7,7,0,0,5447,5448,7,15,0,0,5448,
+        5449,7,16,0,0,5449,5450,7,11,0,0,5450,804,1,0,0,0,5451,5452,5,42,
+        0,0,5452,5453,7,15,0,0,5453,5454,7,14,0,0,5454,5455,7,37,0,0,5455,
+        5456,7,16,0,0,5456,806,1,0,0,0,5457,5458,5,42,0,0,5458,5459,7,15,
+        0,0,5459,5460,7,7,0,0,5460,5461,7,9,0,0,5461,5462,7,15,0,0,5462,
+        5463,7,5,0,0,5463,808,1,0,0,0,5464,5465,5,42,0,0,5465,5466,7,15,
+        0,0,5466,5467,7,7,0,0,5467,5468,7,38,0,0,5468,5469,7,14,0,0,5469,
+        5470,7,21,0,0,5470,810,1,0,0,0,5471,5472,5,42,0,0,5472,5473,7,15,
+        0,0,5473,5474,7,22,0,0,5474,5475,7,17,0,0,5475,5476,7,17,0,0,5476,
+        812,1,0,0,0,5477,5478,5,42,0,0,5478,5479,7,7,0,0,5479,5480,7,6,0,
+        0,5480,5481,7,17,0,0,5481,814,1,0,0,0,5482,5483,5,42,0,0,5483,5484,
+        7,7,0,0,5484,5485,7,15,0,0,5485,816,1,0,0,0,5486,5487,5,42,0,0,5487,
+        5488,7,7,0,0,5488,5489,7,15,0,0,5489,5490,7,17,0,0,5490,5491,7,21,
+        0,0,5491,818,1,0,0,0,5492,5493,5,42,0,0,5493,5494,7,7,0,0,5494,5495,
+        7,6,0,0,5495,5496,7,6,0,0,5496,820,1,0,0,0,5497,5498,5,42,0,0,5498,
+        5499,7,10,0,0,5499,5500,7,5,0,0,5500,5501,7,20,0,0,5501,822,1,0,
+        0,0,5502,5503,5,42,0,0,5503,5504,7,10,0,0,5504,5505,7,17,0,0,5505,
+        5506,7,20,0,0,5506,5507,7,8,0,0,5507,5508,7,14,0,0,5508,824,1,0,
+        0,0,5509,5510,5,42,0,0,5510,5511,7,10,0,0,5511,5512,7,19,0,0,5512,
+        5513,7,19,0,0,5513,5514,7,13,0,0,5514,826,1,0,0,0,5515,5516,5,42,
+        0,0,5516,5517,7,13,0,0,5517,5518,7,7,0,0,5518,5519,7,22,0,0,5519,
+        5520,7,16,0,0,5520,5521,7,9,0,0,5521,5522,7,15,0,0,5522,5523,7,14,
+        0,0,5523,828,1,0,0,0,5524,5525,5,42,0,0,5525,5526,7,19,0,0,5526,
+        5527,7,16,0,0,5527,5528,7,20,0,0,5528,5529,7,13,0,0,5529,5530,7,
+        16,0,0,5530,830,1,0,0,0,5531,5532,5,42,0,0,5532,5533,7,19,0,0,5533,
+        5534,7,21,0,0,5534,5535,7,19,0,0,5535,832,1,0,0,0,5536,5537,5,42,
+        0,0,5537,5538,7,16,0,0,5538,5539,7,14,0,0,5539,5540,7,13,0,0,5540,
+        5541,7,33,0,0,5541,834,1,0,0,0,5542,5543,5,42,0,0,5543,5544,7,16,
+        0,0,5544,5545,7,7,0,0,5545,5546,7,16,0,0,5546,5547,7,8,0,0,5547,
+        836,1,0,0,0,5548,5549,5,42,0,0,5549,5550,7,16,0,0,5550,5551,7,7,
+        0,0,5551,5552,7,16,0,0,5552,5553,7,17,0,0,5553,838,1,0,0,0,5554,
+        5555,5,42,0,0,5555,5556,7,22,0,0,5556,5557,7,19,0,0,5557,5558,7,
+        14,0,0,5558,5559,7,13,0,0,5559,840,1,0,0,0,5560,5561,5,42,0,0,5561,
+        5562,7,35,0,0,5562,5563,7,20,0,0,5563,5564,7,13,0,0,5564,842,1,0,
+        0,0,5565,5566,5,42,0,0,5566,5567,7,21,0,0,5567,5568,7,14,0,0,5568,
+        5569,7,20,0,0,5569,5570,7,13,0,0,5570,844,1,0,0,0,5571,5572,5,42,
+        0,0,5572,5573,7,43,0,0,5573,5574,7,14,0,0,5574,5575,7,13,0,0,5575,
+        5576,7,7,0,0,5576,5583,7,19,0,0,5577,5578,5,42,0,0,5578,5579,7,43,
+        0,0,5579,5580,7,14,0,0,5580,5581,7,13,0,0,5581,5583,7,7,0,0,5582,
+        5571,1,0,0,0,5582,5577,1,0,0,0,5583,846,1,0,0,0,5584,5585,5,42,0,
+        0,5585,5586,7,11,0,0,5586,5587,7,33,0,0,5587,5589,7,19,0,0,5588,
+        5590,7,45,0,0,5589,5588,1,0,0,0,5589,5590,1,0,0,0,5590,848,1,0,0,
+        0,5591,5592,5,42,0,0,5592,5593,7,9,0,0,5593,5594,7,15,0,0,5594,5595,
+        7,17,0,0,5595,5596,7,13,0,0,5596,850,1,0,0,0,5597,5598,5,42,0,0,
+        5598,5599,7,9,0,0,5599,5600,7,15,0,0,5600,5601,7,7,0,0,5601,5602,
+        7,6,0,0,5602,852,1,0,0,0,5603,5604,5,42,0,0,5604,5605,7,5,0,0,5605,
+        5606,7,20,0,0,5606,5607,7,16,0,0,5607,5608,7,20,0,0,5608,854,1,0,
+        0,0,5609,5610,5,42,0,0,5610,5611,7,20,0,0,5611,5612,7,19,0,0,5612,
+        5613,7,16,0,0,5613,5614,7,6,0,0,5614,5615,7,9,0,0,5615,5616,7,17,
+        0,0,5616,856,1,0,0,0,5617,5618,5,42,0,0,5618,5619,7,8,0,0,5619,5620,
+        7,22,0,0,5620,5621,7,13,0,0,5621,5622,7,19,0,0,5622,5623,7,21,0,
+        0,5623,5624,7,33,0,0,5624,858,1,0,0,0,5625,5626,5,42,0,0,5626,5627,
+        7,33,0,0,5627,5628,7,20,0,0,5628,5629,7,37,0,0,5629,860,1,0,0,0,
+        5630,5631,5,42,0,0,5631,5632,7,17,0,0,5632,5633,7,7,0,0,5633,5634,
+        7,8,0,0,5634,5635,7,38,0,0,5635,862,1,0,0,0,5636,5637,5,42,0,0,5637,
+        5638,7,10,0,0,5638,5639,7,13,0,0,5639,5640,7,7,0,0,5640,5641,7,32,
+        0,0,5641,5642,7,13,0,0,5642,5643,7,20,0,0,5643,5644,7,33,0,0,5644,
+        864,1,0,0,0,5645,5646,5,42,0,0,5646,5647,7,14,0,0,5647,5648,7,37,
+        0,0,5648,5649,7,16,0,0,5649,5650,7,5,0,0,5650,5651,7,14,0,0,5651,
+        5652,7,19,0,0,5652,5653,7,8,0,0,5653,866,1,0,0,0,5654,5655,5,42,
+        0,0,5655,5656,7,19,0,0,5656,5657,7,16,0,0,5657,5658,7,13,0,0,5658,
+        5659,7,9,0,0,5659,5660,7,15,0,0,5660,5661,7,32,0,0,5661,868,1,0,
+        0,0,5662,5663,5,42,0,0,5663,5664,7,8,0,0,5664,5665,7,7,0,0,5665,
+        5666,7,15,0,0,5666,5667,7,19,0,0,5667,5668,7,16,0,0,5668,5669,7,
+        13,0,0,5669,5670,7,22,0,0,5670,5671,7,8,0,0,5671,5672,7,16,0,0,5672,
+        5673,7,7,0,0,5673,5674,7,13,0,0,5674,870,1,0,0,0,5675,5676,5,42,
+        0,0,5676,5677,7,17,0,0,5677,5678,7,9,0,0,5678,5679,7,38,0,0,5679,
+        5680,7,14,0,0,5680,5681,7,5,0,0,5681,5682,7,19,0,0,5682,872,1,0,
+        0,0,5683,5684,5,42,0,0,5684,5685,7,35,0,0,5685,5686,7,20,0,0,5686,
+        5687,7,13,0,0,5687,5688,7,19,0,0,5688,5689,7,9,0,0,5689,5690,7,43,
+        0,0,5690,5691,7,14,0,0,5691,874,1,0,0,0,5692,5693,5,42,0,0,5693,
+        5694,7,15,0,0,5694,5695,7,7,0,0,5695,5696,7,10,0,0,5696,5697,7,20,
+        0,0,5697,5698,7,19,0,0,5698,5699,7,19,0,0,5699,876,1,0,0,0,5700,
+        5701,5,42,0,0,5701,5702,7,10,0,0,5702,5703,7,13,0,0,5703,5704,7,
+        7,0,0,5704,5705,7,8,0,0,5705,878,1,0,0,0,5706,5707,5,42,0,0,5707,
+        5708,7,19,0,0,5708,5709,7,16,0,0,5709,5710,7,20,0,0,5710,5711,7,
+        16,0,0,5711,5712,7,22,0,0,5712,5713,7,19,0,0,5713,880,1,0,0,0,5714,
+        5715,7,22,0,0,5715,5716,7,5,0,0,5716,5717,7,20,0,0,5717,5718,7,16,
+        0,0,5718,5719,7,14,0,0,5719,882,1,0,0,0,5720,5721,5,42,0,0,5721,
+        5722,7,5,0,0,5722,5723,7,20,0,0,5723,5724,7,16,0,0,5724,5725,7,14,
+        0,0,5725,884,1,0,0,0,5726,5727,7,22,0,0,5727,5728,7,33,0,0,5728,
+        5729,7,7,0,0,5729,5730,7,15,0,0,5730,5731,7,16,0,0,5731,5732,7,11,
+        0,0,5732,886,1,0,0,0,5733,5734,5,42,0,0,5734,5735,7,33,0,0,5735,
+        5736,7,7,0,0,5736,5737,7,15,0,0,5737,5738,7,16,0,0,5738,5739,7,11,
+        0,0,5739,888,1,0,0,0,5740,5741,7,22,0,0,5741,5742,7,21,0,0,5742,
+        5743,7,14,0,0,5743,5744,7,20,0,0,5744,5745,7,13,0,0,5745,890,1,0,
+        0,0,5746,5747,5,42,0,0,5747,5748,7,21,0,0,5748,5749,7,14,0,0,5749,
+        5750,7,20,0,0,5750,5751,7,13,0,0,5751,892,1,0,0,0,5752,5753,7,22,
+        0,0,5753,5754,7,5,0,0,5754,5755,7,20,0,0,5755,5756,7,21,0,0,5756,
+        894,1,0,0,0,5757,5758,5,42,0,0,5758,5759,7,5,0,0,5759,5760,7,20,
+        0,0,5760,5761,7,21,0,0,5761,896,1,0,0,0,5762,5763,7,10,0,0,5763,
+        5764,7,20,0,0,5764,5765,7,32,0,0,5765,5767,7,14,0,0,5766,5768,7,
+        48,0,0,5767,5766,1,0,0,0,5767,5768,1,0,0,0,5768,898,1,0,0,0,5769,
+        5770,7,8,0,0,5770,5771,7,11,0,0,5771,5772,7,20,0,0,5772,5773,7,13,
+        0,0,5773,900,1,0,0,0,5774,5775,7,49,0,0,5775,5776,7,20,0,0,5776,
+        5777,7,13,0,0,5777,5778,7,8,0,0,5778,5779,7,11,0,0,5779,5780,7,20,
+        0,0,5780,5781,7,13,0,0,5781,902,1,0,0,0,5782,5783,7,22,0,0,5783,
+        5784,7,8,0,0,5784,5785,7,19,0,0,5785,5786,7,50,0,0,5786,904,1,0,
+        0,0,5787,5788,7,5,0,0,5788,5789,7,20,0,0,5789,5790,7,16,0,0,5790,
+        5791,7,14,0,0,5791,906,1,0,0,0,5792,5793,7,49,0,0,5793,5794,7,20,
+        0,0,5794,5795,7,13,0,0,5795,5796,7,22,0,0,5796,5797,7,8,0,0,5797,
+        5798,7,19,0,0,5798,5799,7,50,0,0,5799,908,1,0,0,0,5800,5801,7,32,
+        0,0,5801,5802,7,13,0,0,5802,5803,7,20,0,0,5803,5804,7,10,0,0,5804,
+        5805,7,11,0,0,5805,910,1,0,0,0,5806,5807,7,49,0,0,5807,5808,7,20,
+        0,0,5808,5809,7,13,0,0,5809,5810,7,32,0,0,5810,5811,7,13,0,0,5811,
+        5812,7,20,0,0,5812,5813,7,10,0,0,5813,5814,7,11,0,0,5814,912,1,0,
+        0,0,5815,5816,7,9,0,0,5816,5817,7,15,0,0,5817,5818,7,5,0,0,5818,
+        914,1,0,0,0,5819,5820,7,10,0,0,5820,5821,7,20,0,0,5821,5822,7,8,
+        0,0,5822,5823,7,38,0,0,5823,5824,7,14,0,0,5824,5825,7,5,0,0,5825,
+        916,1,0,0,0,5826,5827,7,43,0,0,5827,5828,7,7,0,0,5828,5829,7,15,
+        0,0,5829,5830,7,14,0,0,5830,5831,7,5,0,0,5831,918,1,0,0,0,5832,5833,
+        7,31,0,0,5833,5834,7,9,0,0,5834,5835,7,15,0,0,5835,5836,7,5,0,0,
+        5836,5837,7,14,0,0,5837,5838,7,8,0,0,5838,920,1,0,0,0,5839,5840,
+        7,9,0,0,5840,5841,7,15,0,0,5841,5842,7,16,0,0,5842,922,1,0,0,0,5843,
+        5844,7,22,0,0,5844,5845,7,15,0,0,5845,5846,7,19,0,0,5846,924,1,0,
+        0,0,5847,5848,7,6,0,0,5848,5849,7,17,0,0,5849,5850,7,7,0,0,5850,
+        5851,7,20,0,0,5851,5852,7,16,0,0,5852,926,1,0,0,0,5853,5854,7,16,
+        0,0,5854,5855,7,9,0,0,5855,5856,7,33,0,0,5856,5857,7,14,0,0,5857,
+        928,1,0,0,0,5858,5859,7,16,0,0,5859,5860,7,9,0,0,5860,5861,7,33,
+        0,0,5861,5862,7,14,0,0,5862,5863,7,19,0,0,5863,5864,7,16,0,0,5864,
+        5865,7,20,0,0,5865,5866,7,33,0,0,5866,5867,7,10,0,0,5867,930,1,0,
+        0,0,5868,5869,7,10,0,0,5869,5870,7,7,0,0,5870,5871,7,9,0,0,5871,
+        5872,7,15,0,0,5872,5873,7,16,0,0,5873,5874,7,14,0,0,5874,5875,7,
+        13,0,0,5875,932,1,0,0,0,5876,5877,7,7,0,0,5877,5878,7,31,0,0,5878,
+        5879,7,18,0,0,5879,5880,7,14,0,0,5880,5881,7,8,0,0,5881,5882,7,16,
+        0,0,5882,934,1,0,0,0,5883,5884,7,20,0,0,5884,5885,7,17,0,0,5885,
+        5886,7,9,0,0,5886,5887,7,20,0,0,5887,5888,7,19,0,0,5888,936,1,0,
+        0,0,5889,5890,7,20,0,0,5890,5891,7,17,0,0,5891,5892,7,9,0,0,5892,
+        5893,7,32,0,0,5893,5894,7,15,0,0,5894,938,1,0,0,0,5895,5896,7,20,
+        0,0,5896,5897,7,17,0,0,5897,5898,7,16,0,0,5898,940,1,0,0,0,5899,
+        5900,7,20,0,0,5900,5901,7,17,0,0,5901,5902,7,16,0,0,5902,5903,7,
+        19,0,0,5903,5904,7,14,0,0,5904,5905,7,30,0,0,5905,942,1,0,0,0,5906,
+        5907,7,20,0,0,5907,5908,7,19,0,0,5908,5909,7,8,0,0,5909,5910,7,14,
+        0,0,5910,5911,7,15,0,0,5911,5912,7,5,0,0,5912,944,1,0,0,0,5913,5914,
+        7,31,0,0,5914,5915,7,20,0,0,5915,5916,7,19,0,0,5916,5917,7,14,0,
+        0,5917,5918,7,5,0,0,5918,946,1,0,0,0,5919,5920,7,8,0,0,5920,5921,
+        7,8,0,0,5921,5922,7,19,0,0,5922,5923,7,9,0,0,5923,5924,7,5,0,0,5924,
+        948,1,0,0,0,5925,5926,7,8,0,0,5926,5927,7,17,0,0,5927,5928,7,20,
+        0,0,5928,5929,7,19,0,0,5929,5930,7,19,0,0,5930,950,1,0,0,0,5931,
+        5932,7,8,0,0,5932,5933,7,7,0,0,5933,5934,7,15,0,0,5934,5935,7,19,
+        0,0,5935,5936,7,16,0,0,5936,952,1,0,0,0,5937,5938,7,8,0,0,5938,5939,
+        7,16,0,0,5939,5940,7,5,0,0,5940,5941,7,20,0,0,5941,5942,7,16,0,0,
+        5942,5943,7,20,0,0,5943,954,1,0,0,0,5944,5945,7,5,0,0,5945,5946,
+        7,20,0,0,5946,5947,7,16,0,0,5947,5948,7,6,0,0,5948,5949,7,33,0,0,
+        5949,5950,7,16,0,0,5950,956,1,0,0,0,5951,5952,7,5,0,0,5952,5953,
+        7,14,0,0,5953,5954,7,19,0,0,5954,5955,7,8,0,0,5955,5956,7,14,0,0,
+        5956,5957,7,15,0,0,5957,5958,7,5,0,0,5958,958,1,0,0,0,5959,5960,
+        7,5,0,0,5960,5961,7,9,0,0,5961,5962,7,33,0,0,5962,960,1,0,0,0,5963,
+        5964,7,5,0,0,5964,5965,7,16,0,0,5965,5966,7,20,0,0,5966,5967,7,20,
+        0,0,5967,5968,7,13,0,0,5968,5969,7,20,0,0,5969,962,1,0,0,0,5970,
+        5971,7,14,0,0,5971,5972,7,37,0,0,5972,5973,7,10,0,0,5973,5974,7,
+        7,0,0,5974,5975,7,13,0,0,5975,5976,7,16,0,0,5976,964,1,0,0,0,5977,
+        5978,7,14,0,0,5978,5979,7,37,0,0,5979,5980,7,16,0,0,5980,966,1,0,
+        0,0,5981,5982,7,14,0,0,5982,5983,7,37,0,0,5983,5984,7,16,0,0,5984,
+        5985,7,6,0,0,5985,5986,7,17,0,0,5986,5987,7,5,0,0,5987,968,1,0,0,
+        0,5988,5989,7,14,0,0,5989,5990,7,37,0,0,5990,5991,7,16,0,0,5991,
+        5992,7,6,0,0,5992,5993,7,33,0,0,5993,5994,7,16,0,0,5994,970,1,0,
+        0,0,5995,5996,7,14,0,0,5996,5997,7,37,0,0,5997,5998,7,16,0,0,5998,
+        5999,7,15,0,0,5999,6000,7,20,0,0,6000,6001,7,33,0,0,6001,6002,7,
+        14,0,0,6002,972,1,0,0,0,6003,6004,7,14,0,0,6004,6005,7,37,0,0,6005,
+        6006,7,16,0,0,6006,6007,7,10,0,0,6007,6008,7,32,0,0,6008,6009,7,
+        33,0,0,6009,974,1,0,0,0,6010,6011,7,14,0,0,6011,6012,7,37,0,0,6012,
+        6013,7,16,0,0,6013,6014,7,10,0,0,6014,6015,7,13,0,0,6015,6016,7,
+        7,0,0,6016,6017,7,8,0,0,6017,976,1,0,0,0,6018,6019,7,6,0,0,6019,
+        6020,7,13,0,0,6020,6021,7,7,0,0,6021,6022,7,33,0,0,6022,6023,7,6,
+        0,0,6023,6024,7,9,0,0,6024,6025,7,17,0,0,6025,6026,7,14,0,0,6026,
+        978,1,0,0,0,6027,6028,7,9,0,0,6028,6029,7,33,0,0,6029,6030,7,10,
+        0,0,6030,6031,7,7,0,0,6031,6032,7,13,0,0,6032,6033,7,16,0,0,6033,
+        980,1,0,0,0,6034,6035,7,9,0,0,6035,6036,7,15,0,0,6036,6037,7,43,
+        0,0,6037,982,1,0,0,0,6038,6039,7,17,0,0,6039,6040,7,14,0,0,6040,
+        6041,7,15,0,0,6041,984,1,0,0,0,6042,6043,7,17,0,0,6043,6044,7,9,
+        0,0,6044,6045,7,38,0,0,6045,6046,7,14,0,0,6046,6047,7,5,0,0,6047,
+        6048,7,19,0,0,6048,986,1,0,0,0,6049,6050,7,17,0,0,6050,6051,7,9,
+        0,0,6051,6052,7,38,0,0,6052,6053,7,14,0,0,6053,988,1,0,0,0,6054,
+        6055,7,17,0,0,6055,6056,7,9,0,0,6056,6057,7,38,0,0,6057,6058,7,14,
+        0,0,6058,6059,7,6,0,0,6059,6060,7,9,0,0,6060,6061,7,17,0,0,6061,
+        6062,7,14,0,0,6062,990,1,0,0,0,6063,6064,7,17,0,0,6064,6065,7,9,
+        0,0,6065,6066,7,38,0,0,6066,6067,7,14,0,0,6067,6068,7,13,0,0,6068,
+        6069,7,14,0,0,6069,6070,7,8,0,0,6070,992,1,0,0,0,6071,6072,7,15,
+        0,0,6072,6073,7,7,0,0,6073,6074,7,7,0,0,6074,6075,7,10,0,0,6075,
+        6076,7,16,0,0,6076,994,1,0,0,0,6077,6078,7,7,0,0,6078,6079,7,8,0,
+        0,6079,6080,7,8,0,0,6080,6081,7,22,0,0,6081,6082,7,13,0,0,6082,6083,
+        7,19,0,0,6083,996,1,0,0,0,6084,6085,7,7,0,0,6085,6086,7,10,0,0,6086,
+        6087,7,5,0,0,6087,6088,7,14,0,0,6088,6089,7,19,0,0,6089,6090,7,8,
+        0,0,6090,998,1,0,0,0,6091,6092,7,7,0,0,6092,6093,7,10,0,0,6093,6094,
+        7,16,0,0,6094,6095,7,9,0,0,6095,6096,7,7,0,0,6096,6097,7,15,0,0,
+        6097,6098,7,19,0,0,6098,1000,1,0,0,0,6099,6100,7,7,0,0,6100,6101,
+        7,35,0,0,6101,6102,7,14,0,0,6102,6103,7,13,0,0,6103,6104,7,17,0,
+        0,6104,6105,7,20,0,0,6105,6106,7,21,0,0,6106,1002,1,0,0,0,6107,6108,
+        7,10,0,0,6108,6109,7,20,0,0,6109,6110,7,8,0,0,6110,6111,7,38,0,0,
+        6111,6112,7,14,0,0,6112,6113,7,35,0,0,6113,6114,7,14,0,0,6114,6115,
+        7,15,0,0,6115,1004,1,0,0,0,6116,6117,7,10,0,0,6117,6118,7,14,0,0,
+        6118,6119,7,13,0,0,6119,6120,7,13,0,0,6120,6121,7,8,0,0,6121,6122,
+        7,5,0,0,6122,1006,1,0,0,0,6123,6124,7,10,0,0,6124,6125,7,13,0,0,
+        6125,6126,7,14,0,0,6126,6127,7,6,0,0,6127,6128,7,9,0,0,6128,6129,
+        7,37,0,0,6129,1008,1,0,0,0,6130,6131,7,10,0,0,6131,6132,7,7,0,0,
+        6132,6133,7,19,0,0,6133,1010,1,0,0,0,6134,6135,7,10,0,0,6135,6136,
+        7,13,0,0,6136,6137,7,7,0,0,6137,6138,7,8,0,0,6138,6139,7,10,0,0,
+        6139,6140,7,16,0,0,6140,6141,7,13,0,0,6141,1012,1,0,0,0,6142,6143,
+        7,30,0,0,6143,6144,7,22,0,0,6144,6145,7,20,0,0,6145,6146,7,17,0,
+        0,6146,6147,7,9,0,0,6147,6148,7,6,0,0,6148,6149,7,9,0,0,6149,6150,
+        7,14,0,0,6150,6151,7,5,0,0,6151,1014,1,0,0,0,6152,6153,7,13,0,0,
+        6153,6154,7,16,0,0,6154,6155,7,15,0,0,6155,6156,7,10,0,0,6156,6157,
+        7,20,0,0,6157,6158,7,13,0,0,6158,6159,7,33,0,0,6159,1016,1,0,0,0,
+        6160,6161,7,19,0,0,6161,6162,7,16,0,0,6162,6163,7,20,0,0,6163,6164,
+        7,16,0,0,6164,6165,7,9,0,0,6165,6166,7,8,0,0,6166,1018,1,0,0,0,6167,
+        6168,7,16,0,0,6168,6169,7,14,0,0,6169,6170,7,33,0,0,6170,6171,7,
+        10,0,0,6171,6172,7,17,0,0,6172,6173,7,20,0,0,6173,6174,7,16,0,0,
+        6174,6175,7,14,0,0,6175,1020,1,0,0,0,6176,6177,7,16,0,0,6177,6178,
+        7,9,0,0,6178,6179,7,33,0,0,6179,6180,7,6,0,0,6180,6181,7,33,0,0,
+        6181,6182,7,16,0,0,6182,1022,1,0,0,0,6183,6184,7,16,0,0,6184,6185,
+        7,7,0,0,6185,6186,7,6,0,0,6186,6187,7,9,0,0,6187,6188,7,17,0,0,6188,
+        6189,7,14,0,0,6189,1024,1,0,0,0,6190,6191,7,35,0,0,6191,6192,7,20,
+        0,0,6192,6193,7,17,0,0,6193,6194,7,22,0,0,6194,6195,7,14,0,0,6195,
+        1026,1,0,0,0,6196,6197,7,35,0,0,6197,6198,7,20,0,0,6198,6199,7,13,
+        0,0,6199,6200,7,21,0,0,6200,6201,7,9,0,0,6201,6202,7,15,0,0,6202,
+        6203,7,32,0,0,6203,1028,1,0,0,0,6204,6205,7,31,0,0,6205,6206,7,17,
+        0,0,6206,6207,7,7,0,0,6207,6208,7,8,0,0,6208,6209,7,38,0,0,6209,
+        1030,1,0,0,0,6210,6211,7,8,0,0,6211,6212,7,7,0,0,6212,6213,7,33,
+        0,0,6213,6214,7,33,0,0,6214,6215,7,9,0,0,6215,6216,7,16,0,0,6216,
+        1032,1,0,0,0,6217,6218,7,5,0,0,6218,6219,7,14,0,0,6219,6220,7,35,
+        0,0,6220,6221,7,9,0,0,6221,6222,7,5,0,0,6222,1034,1,0,0,0,6223,6224,
+        7,14,0,0,6224,6225,7,37,0,0,6225,6226,7,16,0,0,6226,6227,7,5,0,0,
+        6227,6228,7,14,0,0,6228,6229,7,19,0,0,6229,6230,7,8,0,0,6230,1036,
+        1,0,0,0,6231,6232,7,14,0,0,6232,6233,7,37,0,0,6233,6234,7,16,0,0,
+        6234,6235,7,6,0,0,6235,6236,7,9,0,0,6236,6237,7,17,0,0,6237,6238,
+        7,14,0,0,6238,1038,1,0,0,0,6239,6240,7,14,0,0,6240,6241,7,37,0,0,
+        6241,6242,7,16,0,0,6242,6243,7,9,0,0,6243,6244,7,15,0,0,6244,6245,
+        7,5,0,0,6245,1040,1,0,0,0,6246,6247,7,14,0,0,6247,6248,7,37,0,0,
+        6248,6249,7,16,0,0,6249,6250,7,33,0,0,6250,6251,7,31,0,0,6251,6252,
+        7,13,0,0,6252,1042,1,0,0,0,6253,6254,7,6,0,0,6254,6255,7,7,0,0,6255,
+        6256,7,13,0,0,6256,6257,7,33,0,0,6257,6258,7,17,0,0,6258,6259,7,
+        14,0,0,6259,6260,7,15,0,0,6260,1044,1,0,0,0,6261,6262,7,6,0,0,6262,
+        6263,7,7,0,0,6263,6264,7,13,0,0,6264,6265,7,33,0,0,6265,6266,7,7,
+        0,0,6266,6267,7,6,0,0,6267,6268,7,17,0,0,6268,1046,1,0,0,0,6269,
+        6270,7,9,0,0,6270,6271,7,32,0,0,6271,6272,7,15,0,0,6272,6273,7,7,
+        0,0,6273,6274,7,13,0,0,6274,6275,7,14,0,0,6275,1048,1,0,0,0,6276,
+        6277,7,9,0,0,6277,6278,7,15,0,0,6278,6279,7,8,0,0,6279,6280,7,17,
+        0,0,6280,6281,7,22,0,0,6281,6282,7,5,0,0,6282,6283,7,14,0,0,6283,
+        1050,1,0,0,0,6284,6285,7,9,0,0,6285,6286,7,15,0,0,6286,6287,7,5,
+        0,0,6287,6288,7,5,0,0,6288,6289,7,19,0,0,6289,1052,1,0,0,0,6290,
+        6291,7,9,0,0,6291,6292,7,15,0,0,6292,6293,7,6,0,0,6293,6294,7,5,
+        0,0,6294,6295,7,19,0,0,6295,1054,1,0,0,0,6296,6297,7,9,0,0,6297,
+        6298,7,15,0,0,6298,6299,7,6,0,0,6299,6300,7,19,0,0,6300,6301,7,13,
+        0,0,6301,1056,1,0,0,0,6302,6303,7,38,0,0,6303,6304,7,14,0,0,6304,
+        6305,7,21,0,0,6305,6306,7,17,0,0,6306,6307,7,7,0,0,6307,6308,7,8,
+        0,0,6308,1058,1,0,0,0,6309,6310,7,33,0,0,6310,6311,7,20,0,0,6311,
+        6312,7,37,0,0,6312,6313,7,5,0,0,6313,6314,7,14,0,0,6314,6315,7,35,
+        0,0,6315,1060,1,0,0,0,6316,6317,7,7,0,0,6317,6318,7,6,0,0,6318,6319,
+        7,17,0,0,6319,6320,7,9,0,0,6320,6321,7,15,0,0,6321,6322,7,5,0,0,
+        6322,1062,1,0,0,0,6323,6324,7,10,0,0,6324,6325,7,20,0,0,6325,6326,
+        7,19,0,0,6326,6327,7,19,0,0,6327,1064,1,0,0,0,6328,6329,7,10,0,0,
+        6329,6330,7,32,0,0,6330,6331,7,33,0,0,6331,6332,7,15,0,0,6332,6333,
+        7,20,0,0,6333,6334,7,33,0,0,6334,6335,7,14,0,0,6335,1066,1,0,0,0,
+        6336,6337,7,10,0,0,6337,6338,7,17,0,0,6338,6339,7,9,0,0,6339,6340,
+        7,19,0,0,6340,6341,7,16,0,0,6341,1068,1,0,0,0,6342,6343,7,10,0,0,
+        6343,6344,7,13,0,0,6344,6345,7,16,0,0,6345,6346,7,8,0,0,6346,6347,
+        7,16,0,0,6347,6348,7,17,0,0,6348,1070,1,0,0,0,6349,6350,7,13,0,0,
+        6350,6351,7,20,0,0,6351,6352,7,6,0,0,6352,6353,7,5,0,0,6353,6354,
+        7,20,0,0,6354,6355,7,16,0,0,6355,6356,7,20,0,0,6356,1072,1,0,0,0,
+        6357,6358,7,13,0,0,6358,6359,7,14,0,0,6359,6360,7,8,0,0,6360,6361,
+        7,15,0,0,6361,6362,7,7,0,0,6362,1074,1,0,0,0,6363,6364,7,13,0,0,
+        6364,6365,7,14,0,0,6365,6366,7,15,0,0,6366,6367,7,20,0,0,6367,6368,
+        7,33,0,0,6368,6369,7,14,0,0,6369,1076,1,0,0,0,6370,6371,7,19,0,0,
+        6371,6372,7,20,0,0,6372,6373,7,35,0,0,6373,6374,7,14,0,0,6374,6375,
+        7,5,0,0,6375,6376,7,19,0,0,6376,1078,1,0,0,0,6377,6378,7,19,0,0,
+        6378,6379,7,20,0,0,6379,6380,7,35,0,0,6380,6381,7,14,0,0,6381,6382,
+        7,9,0,0,6382,6383,7,15,0,0,6383,6384,7,5,0,0,6384,1080,1,0,0,0,6385,
+        6386,7,19,0,0,6386,6387,7,6,0,0,6387,6388,7,9,0,0,6388,6389,7,17,
+        0,0,6389,6390,7,14,0,0,6390,1082,1,0,0,0,6391,6392,7,19,0,0,6392,
+        6393,7,17,0,0,6393,6394,7,15,0,0,6394,1084,1,0,0,0,6395,6396,7,19,
+        0,0,6396,6397,7,30,0,0,6397,6398,7,17,0,0,6398,6399,7,16,0,0,6399,
+        6400,7,21,0,0,6400,6401,7,10,0,0,6401,6402,7,14,0,0,6402,6403,4,
+        519,5,0,6403,1086,1,0,0,0,6404,6405,7,22,0,0,6405,6406,7,19,0,0,
+        6406,6407,7,13,0,0,6407,6408,7,7,0,0,6408,6409,7,10,0,0,6409,6410,
+        7,15,0,0,6410,1088,1,0,0,0,6411,6412,7,5,0,0,6412,6413,7,9,0,0,6413,
+        6414,7,19,0,0,6414,6415,7,38,0,0,6415,1090,1,0,0,0,6416,6417,7,34,
+        0,0,6417,6418,7,7,0,0,6418,6419,7,13,0,0,6419,6420,7,38,0,0,6420,
+        6421,7,19,0,0,6421,6422,7,16,0,0,6422,6423,7,15,0,0,6423,1092,1,
+        0,0,0,6424,6425,7,10,0,0,6425,6426,7,13,0,0,6426,6427,7,9,0,0,6427,
+        6428,7,15,0,0,6428,6429,7,16,0,0,6429,6430,7,14,0,0,6430,6431,7,
+        13,0,0,6431,1094,1,0,0,0,6432,6433,7,19,0,0,6433,6434,7,10,0,0,6434,
+        6435,7,14,0,0,6435,6436,7,8,0,0,6436,6437,7,9,0,0,6437,6438,7,20,
+        0,0,6438,6439,7,17,0,0,6439,1096,1,0,0,0,6440,6441,7,38,0,0,6441,
+        6442,7,14,0,0,6442,6443,7,21,0,0,6443,6444,7,14,0,0,6444,6445,7,
+        5,0,0,6445,1098,1,0,0,0,6446,6447,7,22,0,0,6447,6448,7,19,0,0,6448,
+        6449,7,20,0,0,6449,6450,7,32,0,0,6450,6451,7,14,0,0,6451,1100,1,
+        0,0,0,6452,6453,7,10,0,0,6453,6454,7,19,0,0,6454,6455,7,5,0,0,6455,
+        6456,7,19,0,0,6456,1102,1,0,0,0,6457,6458,5,38,0,0,6458,1104,1,0,
+        0,0,6459,6460,7,20,0,0,6460,6461,7,15,0,0,6461,6462,7,5,0,0,6462,
+        1106,1,0,0,0,6463,6464,7,7,0,0,6464,6465,7,13,0,0,6465,1108,1,0,
+        0,0,6466,6467,7,15,0,0,6467,6468,7,7,0,0,6468,6469,7,16,0,0,6469,
+        1110,1,0,0,0,6470,6471,5,43,0,0,6471,1112,1,0,0,0,6472,6473,5,45,
+        0,0,6473,1114,1,0,0,0,6474,6475,5,42,0,0,6475,6476,5,42,0,0,6476,
+        1116,1,0,0,0,6477,6478,4,535,6,0,6478,6479,5,42,0,0,6479,1118,1,
+        0,0,0,6480,6481,5,42,0,0,6481,6482,4,536,7,0,6482,1120,1,0,0,0,6483,
+        6484,5,42,0,0,6484,6485,4,537,8,0,6485,1122,1,0,0,0,6486,6487,5,
+        47,0,0,6487,1124,1,0,0,0,6488,6489,5,43,0,0,6489,6490,5,61,0,0,6490,
+        1126,1,0,0,0,6491,6492,5,45,0,0,6492,6493,5,61,0,0,6493,1128,1,0,
+        0,0,6494,6495,5,42,0,0,6495,6496,5,61,0,0,6496,1130,1,0,0,0,6497,
+        6498,5,47,0,0,6498,6499,5,61,0,0,6499,1132,1,0,0,0,6500,6501,5,42,
+        0,0,6501,6502,5,42,0,0,6502,6503,5,61,0,0,6503,1134,1,0,0,0,6504,
+        6505,5,62,0,0,6505,1136,1,0,0,0,6506,6507,5,60,0,0,6507,1138,1,0,
+        0,0,6508,6509,5,62,0,0,6509,6510,5,61,0,0,6510,1140,1,0,0,0,6511,
+        6512,5,60,0,0,6512,6513,5,61,0,0,6513,1142,1,0,0,0,6514,6515,5,60,
+        0,0,6515,6516,5,62,0,0,6516,1144,1,0,0,0,6517,6518,5,40,0,0,6518,
+        1146,1,0,0,0,6519,6520,5,41,0,0,6520,1148,1,0,0,0,6521,6522,5,46,
+        0,0,6522,1150,1,0,0,0,6523,6524,3,1153,553,0,6524,6525,4,552,9,0,
+        6525,6526,1,0,0,0,6526,6527,6,552,128,0,6527,6528,6,552,31,0,6528,
+        1152,1,0,0,0,6529,6531,7,44,0,0,6530,6529,1,0,0,0,6531,6532,1,0,
+        0,0,6532,6530,1,0,0,0,6532,6533,1,0,0,0,6533,6541,1,0,0,0,6534,6538,
+        7,51,0,0,6535,6537,7,44,0,0,6536,6535,1,0,0,0,6537,6540,1,0,0,0,
+        6538,6536,1,0,0,0,6538,6539,1,0,0,0,6539,6542,1,0,0,0,6540,6538,
+        1,0,0,0,6541,6534,1,0,0,0,6541,6542,1,0,0,0,6542,6550,1,0,0,0,6543,
+        6545,7,51,0,0,6544,6546,7,44,0,0,6545,6544,1,0,0,0,6546,6547,1,0,
+        0,0,6547,6545,1,0,0,0,6547,6548,1,0,0,0,6548,6550,1,0,0,0,6549,6530,
+        1,0,0,0,6549,6543,1,0,0,0,6550,1154,1,0,0,0,6551,6552,5,61,0,0,6552,
+        1156,1,0,0,0,6553,6554,5,58,0,0,6554,6555,1,0,0,0,6555,6556,6,555,
+        129,0,6556,1158,1,0,0,0,6557,6558,7,31,0,0,6558,6559,7,21,0,0,6559,
+        1160,1,0,0,0,6560,6561,7,16,0,0,6561,6562,7,7,0,0,6562,1162,1,0,
+        0,0,6563,6564,7,5,0,0,6564,6565,7,7,0,0,6565,6566,7,34,0,0,6566,
+        6567,7,15,0,0,6567,6568,7,16,0,0,6568,6569,7,7,0,0,6569,1164,1,0,
+        0,0,6570,6571,3,1181,567,0,6571,6572,1,0,0,0,6572,6573,6,559,124,
+        0,6573,1166,1,0,0,0,6574,6575,7,37,0,0,6575,6576,7,25,0,0,6576,6577,
+        1,0,0,0,6577,6578,6,560,30,0,6578,1168,1,0,0,0,6579,6580,7,5,0,0,
+        6580,6581,7,25,0,0,6581,6582,1,0,0,0,6582,6583,6,561,30,0,6583,1170,
+        1,0,0,0,6584,6585,7,16,0,0,6585,6586,7,25,0,0,6586,6587,1,0,0,0,
+        6587,6588,6,562,30,0,6588,1172,1,0,0,0,6589,6590,7,43,0,0,6590,6591,
+        7,25,0,0,6591,6592,1,0,0,0,6592,6593,6,563,30,0,6593,1174,1,0,0,
+        0,6594,6595,7,32,0,0,6595,6596,7,25,0,0,6596,6597,1,0,0,0,6597,6598,
+        6,564,30,0,6598,1176,1,0,0,0,6599,6600,7,22,0,0,6600,6601,7,25,0,
+        0,6601,6602,1,0,0,0,6602,6603,6,565,30,0,6603,1178,1,0,0,0,6604,
+        6605,7,25,0,0,6605,6606,1,0,0,0,6606,6607,6,566,30,0,6607,1180,1,
+        0,0,0,6608,6609,5,42,0,0,6609,6610,7,9,0,0,6610,6615,7,15,0,0,6611,
+        6612,7,38,0,0,6612,6616,7,52,0,0,6613,6614,7,22,0,0,6614,6616,7,
+        53,0,0,6615,6611,1,0,0,0,6615,6613,1,0,0,0,6616,6635,1,0,0,0,6617,
+        6618,5,42,0,0,6618,6619,7,33,0,0,6619,6620,7,40,0,0,6620,6621,7,
+        40,0,0,6621,6622,7,40,0,0,6622,6623,7,44,0,0,6623,6624,7,44,0,0,
+        6624,6625,7,44,0,0,6625,6635,7,44,0,0,6626,6627,7,54,0,0,6627,6631,
+        4,567,10,0,6628,6630,7,41,0,0,6629,6628,1,0,0,0,6630,6633,1,0,0,
+        0,6631,6629,1,0,0,0,6631,6632,1,0,0,0,6632,6635,1,0,0,0,6633,6631,
+        1,0,0,0,6634,6608,1,0,0,0,6634,6617,1,0,0,0,6634,6626,1,0,0,0,6635,
+        1182,1,0,0,0,6636,6638,7,2,0,0,6637,6636,1,0,0,0,6638,6641,1,0,0,
+        0,6639,6640,1,0,0,0,6639,6637,1,0,0,0,6640,6642,1,0,0,0,6641,6639,
+        1,0,0,0,6642,6643,5,47,0,0,6643,6644,5,47,0,0,6644,6645,1,0,0,0,
+        6645,6646,4,568,11,0,6646,6647,1,0,0,0,6647,6648,6,568,130,0,6648,
+        6649,6,568,3,0,6649,1184,1,0,0,0,6650,6651,7,12,0,0,6651,6655,4,
+        569,12,0,6652,6654,7,12,0,0,6653,6652,1,0,0,0,6654,6657,1,0,0,0,
+        6655,6653,1,0,0,0,6655,6656,1,0,0,0,6656,6658,1,0,0,0,6657,6655,
+        1,0,0,0,6658,6659,6,569,2,0,6659,1186,1,0,0,0,6660,6661,5,46,0,0,
+        6661,6662,5,46,0,0,6662,6663,5,46,0,0,6663,6664,1,0,0,0,6664,6668,
+        4,570,13,0,6665,6667,3,101,27,0,6666,6665,1,0,0,0,6667,6670,1,0,
+        0,0,6668,6666,1,0,0,0,6668,6669,1,0,0,0,6669,6671,1,0,0,0,6670,6668,
+        1,0,0,0,6671,6672,3,99,26,0,6672,6673,1,0,0,0,6673,6674,6,570,127,
+        0,6674,1188,1,0,0,0,6675,6676,5,46,0,0,6676,6677,5,46,0,0,6677,6678,
+        5,46,0,0,6678,6679,1,0,0,0,6679,6683,4,571,14,0,6680,6682,3,101,
+        27,0,6681,6680,1,0,0,0,6682,6685,1,0,0,0,6683,6681,1,0,0,0,6683,
+        6684,1,0,0,0,6684,6686,1,0,0,0,6685,6683,1,0,0,0,6686,6687,3,99,
+        26,0,6687,6688,3,57,5,0,6688,6689,7,8,0,0,6689,6690,8,55,0,0,6690,
+        6691,5,32,0,0,6691,6692,5,32,0,0,6692,6693,5,32,0,0,6693,6694,5,
+        32,0,0,6694,6695,5,32,0,0,6695,6696,5,32,0,0,6696,6697,5,32,0,0,
+        6697,6698,5,32,0,0,6698,6699,5,32,0,0,6699,6700,5,32,0,0,6700,6701,
+        5,32,0,0,6701,6702,5,32,0,0,6702,6703,5,32,0,0,6703,6704,5,32,0,
+        0,6704,6705,5,32,0,0,6705,6706,5,32,0,0,6706,6707,5,32,0,0,6707,
+        6708,5,32,0,0,6708,6709,5,32,0,0,6709,6710,5,32,0,0,6710,6711,5,
+        32,0,0,6711,6712,5,32,0,0,6712,6713,5,32,0,0,6713,6714,5,32,0,0,
+        6714,6715,5,32,0,0,6715,6716,5,32,0,0,6716,6717,5,32,0,0,6717,6718,
+        5,32,0,0,6718,6719,1,0,0,0,6719,6720,6,571,131,0,6720,6721,1,0,0,
+        0,6721,6722,6,571,127,0,6722,1190,1,0,0,0,6723,6724,5,46,0,0,6724,
+        6725,5,46,0,0,6725,6726,5,46,0,0,6726,6727,1,0,0,0,6727,6731,4,572,
+        15,0,6728,6730,3,101,27,0,6729,6728,1,0,0,0,6730,6733,1,0,0,0,6731,
+        6729,1,0,0,0,6731,6732,1,0,0,0,6732,6734,1,0,0,0,6733,6731,1,0,0,
+        0,6734,6735,3,99,26,0,6735,6736,3,57,5,0,6736,6737,7,5,0,0,6737,
+        6738,8,55,0,0,6738,6739,5,32,0,0,6739,6740,5,32,0,0,6740,6741,5,
+        32,0,0,6741,6742,5,32,0,0,6742,6743,5,32,0,0,6743,6744,5,32,0,0,
+        6744,6745,5,32,0,0,6745,6746,5,32,0,0,6746,6747,5,32,0,0,6747,6748,
+        5,32,0,0,6748,6749,5,32,0,0,6749,6750,5,32,0,0,6750,6751,5,32,0,
+        0,6751,6752,5,32,0,0,6752,6753,5,32,0,0,6753,6754,5,32,0,0,6754,
+        6755,5,32,0,0,6755,6756,5,32,0,0,6756,6757,5,32,0,0,6757,6758,5,
+        32,0,0,6758,6759,5,32,0,0,6759,6760,5,32,0,0,6760,6761,5,32,0,0,
+        6761,6762,5,32,0,0,6762,6763,5,32,0,0,6763,6764,5,32,0,0,6764,6765,
+        5,32,0,0,6765,6766,5,32,0,0,6766,6767,1,0,0,0,6767,6768,6,572,132,
+        0,6768,6769,1,0,0,0,6769,6770,6,572,127,0,6770,1192,1,0,0,0,6771,
+        6772,3,99,26,0,6772,6796,4,573,16,0,6773,6774,3,57,5,0,6774,6775,
+        8,0,0,0,6775,6779,7,55,0,0,6776,6778,8,0,0,0,6777,6776,1,0,0,0,6778,
+        6781,1,0,0,0,6779,6777,1,0,0,0,6779,6780,1,0,0,0,6780,6782,1,0,0,
+        0,6781,6779,1,0,0,0,6782,6783,3,99,26,0,6783,6795,1,0,0,0,6784,6785,
+        3,57,5,0,6785,6789,8,0,0,0,6786,6788,7,2,0,0,6787,6786,1,0,0,0,6788,
+        6791,1,0,0,0,6789,6787,1,0,0,0,6789,6790,1,0,0,0,6790,6792,1,0,0,
+        0,6791,6789,1,0,0,0,6792,6793,3,99,26,0,6793,6795,1,0,0,0,6794,6773,
+        1,0,0,0,6794,6784,1,0,0,0,6795,6798,1,0,0,0,6796,6794,1,0,0,0,6796,
+        6797,1,0,0,0,6797,6799,1,0,0,0,6798,6796,1,0,0,0,6799,6800,3,57,
+        5,0,6800,6801,7,8,0,0,6801,6802,8,55,0,0,6802,6803,5,32,0,0,6803,
+        6804,5,32,0,0,6804,6805,5,32,0,0,6805,6806,5,32,0,0,6806,6807,5,
+        32,0,0,6807,6808,5,32,0,0,6808,6809,5,32,0,0,6809,6810,5,32,0,0,
+        6810,6811,5,32,0,0,6811,6812,5,32,0,0,6812,6813,5,32,0,0,6813,6814,
+        5,32,0,0,6814,6815,5,32,0,0,6815,6816,5,32,0,0,6816,6817,5,32,0,
+        0,6817,6818,5,32,0,0,6818,6819,5,32,0,0,6819,6820,5,32,0,0,6820,
+        6821,5,32,0,0,6821,6822,5,32,0,0,6822,6823,5,32,0,0,6823,6824,5,
+        32,0,0,6824,6825,5,32,0,0,6825,6826,5,32,0,0,6826,6827,5,32,0,0,
+        6827,6828,5,32,0,0,6828,6829,5,32,0,0,6829,6830,5,32,0,0,6830,6831,
+        1,0,0,0,6831,6832,6,573,2,0,6832,1194,1,0,0,0,6833,6834,3,99,26,
+        0,6834,6835,4,574,17,0,6835,6836,3,57,5,0,6836,6837,7,5,0,0,6837,
+        6838,8,55,0,0,6838,6839,5,32,0,0,6839,6840,5,32,0,0,6840,6841,5,
+        32,0,0,6841,6842,5,32,0,0,6842,6843,5,32,0,0,6843,6844,5,32,0,0,
+        6844,6845,5,32,0,0,6845,6846,5,32,0,0,6846,6847,5,32,0,0,6847,6848,
+        5,32,0,0,6848,6849,5,32,0,0,6849,6850,5,32,0,0,6850,6851,5,32,0,
+        0,6851,6852,5,32,0,0,6852,6853,5,32,0,0,6853,6854,5,32,0,0,6854,
+        6855,5,32,0,0,6855,6856,5,32,0,0,6856,6857,5,32,0,0,6857,6858,5,
+        32,0,0,6858,6859,5,32,0,0,6859,6860,5,32,0,0,6860,6861,5,32,0,0,
+        6861,6862,5,32,0,0,6862,6863,5,32,0,0,6863,6864,5,32,0,0,6864,6865,
+        5,32,0,0,6865,6866,5,32,0,0,6866,6867,5,32,0,0,6867,6868,5,32,0,
+        0,6868,6869,5,32,0,0,6869,6870,5,32,0,0,6870,6871,5,32,0,0,6871,
+        6872,5,32,0,0,6872,6873,5,32,0,0,6873,6874,5,32,0,0,6874,6875,1,
+        0,0,0,6875,6876,6,574,2,0,6876,1196,1,0,0,0,6877,6878,3,99,26,0,
+        6878,6879,4,575,18,0,6879,6880,3,57,5,0,6880,6881,7,6,0,0,6881,6882,
+        8,55,0,0,6882,6883,5,32,0,0,6883,6884,5,32,0,0,6884,6885,5,32,0,
+        0,6885,6886,5,32,0,0,6886,6887,5,32,0,0,6887,6888,5,32,0,0,6888,
+        6889,5,32,0,0,6889,6890,5,32,0,0,6890,6891,5,32,0,0,6891,6892,5,
+        32,0,0,6892,6893,5,32,0,0,6893,6894,5,32,0,0,6894,6895,5,32,0,0,
+        6895,6896,5,32,0,0,6896,6897,5,32,0,0,6897,6898,5,32,0,0,6898,6899,
+        5,32,0,0,6899,6900,5,32,0,0,6900,6901,5,32,0,0,6901,6902,5,32,0,
+        0,6902,6903,5,32,0,0,6903,6904,5,32,0,0,6904,6905,5,32,0,0,6905,
+        6906,5,32,0,0,6906,6907,5,32,0,0,6907,6908,5,32,0,0,6908,6909,5,
+        32,0,0,6909,6910,5,32,0,0,6910,6911,5,32,0,0,6911,6912,5,32,0,0,
+        6912,6913,5,32,0,0,6913,6914,5,32,0,0,6914,6915,5,32,0,0,6915,6916,
+        5,32,0,0,6916,6917,5,32,0,0,6917,6918,5,32,0,0,6918,6919,1,0,0,0,
+        6919,6920,6,575,2,0,6920,1198,1,0,0,0,6921,6922,5,32,0,0,6922,6923,
+        5,32,0,0,6923,6924,5,32,0,0,6924,6925,5,32,0,0,6925,6926,5,32,0,
+        0,6926,6927,1,0,0,0,6927,6928,4,576,19,0,6928,6929,1,0,0,0,6929,
+        6930,6,576,2,0,6930,1200,1,0,0,0,6931,6932,3,57,5,0,6932,6933,4,
+        577,20,0,6933,6934,1,0,0,0,6934,6935,6,577,3,0,6935,1202,1,0,0,0,
+        6936,6937,7,2,0,0,6937,6938,7,2,0,0,6938,6939,4,578,21,0,6939,6940,
+        1,0,0,0,6940,6941,6,578,2,0,6941,1204,1,0,0,0,6942,6943,3,99,26,
+        0,6943,6944,4,579,22,0,6944,6945,1,0,0,0,6945,6946,6,579,5,0,6946,
+        6947,6,579,5,0,6947,1206,1,0,0,0,6948,6949,3,99,26,0,6949,6950,4,
+        580,23,0,6950,6951,1,0,0,0,6951,6952,6,580,19,0,6952,6953,6,580,
+        5,0,6953,6954,6,580,5,0,6954,6955,6,580,5,0,6955,1208,1,0,0,0,6956,
+        6957,3,99,26,0,6957,6958,4,581,24,0,6958,6959,1,0,0,0,6959,6960,
+        6,581,19,0,6960,6961,6,581,5,0,6961,6962,6,581,5,0,6962,1210,1,0,
+        0,0,6963,6964,3,99,26,0,6964,6965,4,582,25,0,6965,6966,1,0,0,0,6966,
+        6967,6,582,19,0,6967,6968,6,582,5,0,6968,6969,6,582,5,0,6969,1212,
+        1,0,0,0,6970,6971,3,99,26,0,6971,6972,4,583,26,0,6972,6973,1,0,0,
+        0,6973,6974,6,583,2,0,6974,6975,6,583,27,0,6975,6976,6,583,133,0,
+        6976,1214,1,0,0,0,6977,6978,5,59,0,0,6978,6979,1,0,0,0,6979,6980,
+        6,584,5,0,6980,6981,6,584,134,0,6981,1216,1,0,0,0,6982,6984,5,32,
+        0,0,6983,6982,1,0,0,0,6984,6985,1,0,0,0,6985,6983,1,0,0,0,6985,6986,
+        1,0,0,0,6986,6987,1,0,0,0,6987,6988,6,585,2,0,6988,1218,1,0,0,0,
+        6989,6990,5,42,0,0,6990,6991,7,5,0,0,6991,6992,1,0,0,0,6992,6993,
+        6,586,5,0,6993,1220,1,0,0,0,6994,6995,5,42,0,0,6995,6996,7,11,0,
+        0,6996,6997,1,0,0,0,6997,6998,6,587,5,0,6998,1222,1,0,0,0,6999,7000,
+        5,42,0,0,7000,7001,7,11,0,0,7001,7002,7,7,0,0,7002,7003,7,22,0,0,
+        7003,7004,7,13,0,0,7004,7005,7,19,0,0,7005,7006,1,0,0,0,7006,7007,
+        6,588,5,0,7007,1224,1,0,0,0,7008,7009,3,753,353,0,7009,7010,7,19,
+        0,0,7010,7011,1,0,0,0,7011,7012,6,589,5,0,7012,1226,1,0,0,0,7013,
+        7014,5,42,0,0,7014,7015,7,33,0,0,7015,7016,1,0,0,0,7016,7017,6,590,
+        5,0,7017,1228,1,0,0,0,7018,7019,5,42,0,0,7019,7020,7,33,0,0,7020,
+        7021,7,9,0,0,7021,7022,7,15,0,0,7022,7023,7,22,0,0,7023,7024,7,16,
+        0,0,7024,7025,7,14,0,0,7025,7026,7,19,0,0,7026,7027,1,0,0,0,7027,
+        7028,6,591,5,0,7028,1230,1,0,0,0,7029,7030,3,803,378,0,7030,7031,
+        7,19,0,0,7031,7032,1,0,0,0,7032,7033,6,592,5,0,7033,1232,1,0,0,0,
+        7034,7035,5,42,0,0,7035,7036,7,33,0,0,7036,7037,7,15,0,0,7037,7038,
+        1,0,0,0,7038,7039,6,593,5,0,7039,1234,1,0,0,0,7040,7041,5,42,0,0,
+        7041,7042,7,33,0,0,7042,7043,7,19,0,0,7043,7044,1,0,0,0,7044,7045,
+        6,594,5,0,7045,1236,1,0,0,0,7046,7047,5,42,0,0,7047,7048,7,33,0,
+        0,7048,7049,7,19,0,0,7049,7050,7,14,0,0,7050,7051,7,8,0,0,7051,7052,
+        7,7,0,0,7052,7053,7,15,0,0,7053,7054,7,5,0,0,7054,7055,7,19,0,0,
+        7055,7056,1,0,0,0,7056,7057,6,595,5,0,7057,1238,1,0,0,0,7058,7059,
+        5,42,0,0,7059,7060,7,19,0,0,7060,7061,1,0,0,0,7061,7062,6,596,5,
+        0,7062,1240,1,0,0,0,7063,7064,5,42,0,0,7064,7065,7,19,0,0,7065,7066,
+        7,14,0,0,7066,7067,7,8,0,0,7067,7068,7,7,0,0,7068,7069,7,15,0,0,
+        7069,7070,7,5,0,0,7070,7071,7,19,0,0,7071,7072,1,0,0,0,7072,7073,
+        6,597,5,0,7073,1242,1,0,0,0,7074,7075,5,42,0,0,7075,7076,7,21,0,
+        0,7076,7077,1,0,0,0,7077,7078,6,598,5,0,7078,1244,1,0,0,0,7079,7080,
+        3,843,398,0,7080,7081,7,19,0,0,7081,7082,1,0,0,0,7082,7083,6,599,
+        5,0,7083,1246,1,0,0,0,7084,7085,3,853,403,0,7085,7086,1,0,0,0,7086,
+        7087,6,600,135,0,7087,7088,6,600,5,0,7088,1248,1,0,0,0,7089,7090,
+        3,751,352,0,7090,7091,1,0,0,0,7091,7092,6,601,136,0,7092,7093,6,
+        601,5,0,7093,1250,1,0,0,0,7094,7095,3,753,353,0,7095,7096,1,0,0,
+        0,7096,7097,6,602,137,0,7097,7098,6,602,5,0,7098,1252,1,0,0,0,7099,
+        7100,3,755,354,0,7100,7101,1,0,0,0,7101,7102,6,603,138,0,7102,7103,
+        6,603,5,0,7103,1254,1,0,0,0,7104,7105,3,757,355,0,7105,7106,1,0,
+        0,0,7106,7107,6,604,139,0,7107,7108,6,604,5,0,7108,1256,1,0,0,0,
+        7109,7110,3,733,343,0,7110,7111,1,0,0,0,7111,7112,6,605,140,0,7112,
+        7113,6,605,5,0,7113,1258,1,0,0,0,7114,7115,3,775,364,0,7115,7116,
+        1,0,0,0,7116,7117,6,606,141,0,7117,7118,6,606,5,0,7118,1260,1,0,
+        0,0,7119,7120,3,847,400,0,7120,7121,1,0,0,0,7121,7122,6,607,142,
+        0,7122,7123,6,607,5,0,7123,1262,1,0,0,0,7124,7125,3,859,406,0,7125,
+        7126,1,0,0,0,7126,7127,6,608,143,0,7127,7128,6,608,5,0,7128,1264,
+        1,0,0,0,7129,7130,3,731,342,0,7130,7131,1,0,0,0,7131,7132,6,609,
+        144,0,7132,7133,6,609,5,0,7133,1266,1,0,0,0,7134,7135,3,803,378,
+        0,7135,7136,1,0,0,0,7136,7137,6,610,145,0,7137,7138,6,610,5,0,7138,
+        1268,1,0,0,0,7139,7140,3,759,356,0,7140,7141,1,0,0,0,7141,7142,6,
+        611,146,0,7142,7143,6,611,5,0,7143,1270,1,0,0,0,7144,7145,3,829,
+        391,0,7145,7146,1,0,0,0,7146,7147,6,612,147,0,7147,7148,6,612,5,
+        0,7148,1272,1,0,0,0,7149,7150,3,867,410,0,7150,7151,1,0,0,0,7151,
+        7152,6,613,148,0,7152,7153,6,613,5,0,7153,1274,1,0,0,0,7154,7155,
+        3,879,416,0,7155,7156,1,0,0,0,7156,7157,6,614,149,0,7157,7158,6,
+        614,5,0,7158,1276,1,0,0,0,7159,7160,3,831,392,0,7160,7161,1,0,0,
+        0,7161,7162,6,615,150,0,7162,7163,6,615,5,0,7163,1278,1,0,0,0,7164,
+        7165,3,843,398,0,7165,7166,1,0,0,0,7166,7167,6,616,151,0,7167,7168,
+        6,616,5,0,7168,1280,1,0,0,0,7169,7170,1,0,0,0,7170,7171,1,0,0,0,
+        7171,7172,6,617,5,0,7172,7173,6,617,2,0,7173,1282,1,0,0,0,7174,7176,
+        7,2,0,0,7175,7174,1,0,0,0,7176,7179,1,0,0,0,7177,7175,1,0,0,0,7177,
+        7178,1,0,0,0,7178,7180,1,0,0,0,7179,7177,1,0,0,0,7180,7181,3,99,
+        26,0,7181,7182,1,0,0,0,7182,7183,3,57,5,0,7183,7184,7,5,0,0,7184,
+        7185,8,55,0,0,7185,7186,5,32,0,0,7186,7187,5,32,0,0,7187,7188,5,
+        32,0,0,7188,7189,5,32,0,0,7189,7190,5,32,0,0,7190,7191,5,32,0,0,
+        7191,7192,5,32,0,0,7192,7193,5,32,0,0,7193,7194,5,32,0,0,7194,7195,
+        5,32,0,0,7195,7196,5,32,0,0,7196,7197,5,32,0,0,7197,7198,5,32,0,
+        0,7198,7199,5,32,0,0,7199,7200,5,32,0,0,7200,7201,5,32,0,0,7201,
+        7202,5,32,0,0,7202,7203,5,32,0,0,7203,7204,5,32,0,0,7204,7205,5,
+        32,0,0,7205,7206,5,32,0,0,7206,7207,5,32,0,0,7207,7208,5,32,0,0,
+        7208,7209,5,32,0,0,7209,7210,5,32,0,0,7210,7211,5,32,0,0,7211,7212,
+        5,32,0,0,7212,7213,5,32,0,0,7213,7217,1,0,0,0,7214,7216,7,2,0,0,
+        7215,7214,1,0,0,0,7216,7219,1,0,0,0,7217,7215,1,0,0,0,7217,7218,
+        1,0,0,0,7218,7220,1,0,0,0,7219,7217,1,0,0,0,7220,7221,6,618,2,0,
+        7221,1284,1,0,0,0,7222,7223,3,1153,553,0,7223,7224,1,0,0,0,7224,
+        7225,6,619,5,0,7225,1286,1,0,0,0,7226,7227,1,0,0,0,7227,7228,1,0,
+        0,0,7228,7229,6,620,5,0,7229,7230,6,620,2,0,7230,1288,1,0,0,0,7231,
+        7232,7,20,0,0,7232,7233,7,5,0,0,7233,7234,7,5,0,0,7234,1290,1,0,
+        0,0,7235,7236,3,1289,621,0,7236,7237,7,5,0,0,7237,7238,7,22,0,0,
+        7238,7239,7,13,0,0,7239,1292,1,0,0,0,7240,7241,7,20,0,0,7241,7242,
+        7,17,0,0,7242,7243,7,17,0,0,7243,7244,7,7,0,0,7244,7245,7,8,0,0,
+        7245,1294,1,0,0,0,7246,7247,7,20,0,0,7247,7248,7,15,0,0,7248,7249,
+        7,5,0,0,7249,7250,7,44,0,0,7250,7251,7,44,0,0,7251,1296,1,0,0,0,
+        7252,7253,7,20,0,0,7253,7254,7,15,0,0,7254,7255,7,5,0,0,7255,7256,
+        7,14,0,0,7256,7257,7,30,0,0,7257,1298,1,0,0,0,7258,7259,7,20,0,0,
+        7259,7260,7,15,0,0,7260,7261,7,5,0,0,7261,7262,7,15,0,0,7262,7263,
+        7,14,0,0,7263,1300,1,0,0,0,7264,7265,7,20,0,0,7265,7266,7,15,0,0,
+        7266,7267,7,5,0,0,7267,7268,7,17,0,0,7268,7269,7,14,0,0,7269,1302,
+        1,0,0,0,7270,7271,7,20,0,0,7271,7272,7,15,0,0,7272,7273,7,5,0,0,
+        7273,7274,7,17,0,0,7274,7275,7,16,0,0,7275,1304,1,0,0,0,7276,7277,
+        7,20,0,0,7277,7278,7,15,0,0,7278,7279,7,5,0,0,7279,7280,7,32,0,0,
+        7280,7281,7,14,0,0,7281,1306,1,0,0,0,7282,7283,7,20,0,0,7283,7284,
+        7,15,0,0,7284,7285,7,5,0,0,7285,7286,7,32,0,0,7286,7287,7,16,0,0,
+        7287,1308,1,0,0,0,7288,7289,7,31,0,0,7289,7290,7,9,0,0,7290,7291,
+        7,16,0,0,7291,7292,7,7,0,0,7292,7293,7,6,0,0,7293,7294,7,6,0,0,7294,
+        1310,1,0,0,0,7295,7296,7,31,0,0,7296,7297,7,9,0,0,7297,7298,7,16,
+        0,0,7298,7299,7,7,0,0,7299,7300,7,15,0,0,7300,1312,1,0,0,0,7301,
+        7302,7,56,0,0,7302,7303,7,20,0,0,7303,7304,7,31,0,0,7304,7305,7,
+        44,0,0,7305,7306,7,44,0,0,7306,1314,1,0,0,0,7307,7308,7,8,0,0,7308,
+        7309,7,20,0,0,7309,7310,7,31,0,0,7310,7311,7,14,0,0,7311,7312,7,
+        30,0,0,7312,1316,1,0,0,0,7313,7314,7,8,0,0,7314,7315,7,20,0,0,7315,
+        7316,7,31,0,0,7316,7317,7,15,0,0,7317,7318,7,14,0,0,7318,1318,1,
+        0,0,0,7319,7320,7,8,0,0,7320,7321,7,20,0,0,7321,7322,7,31,0,0,7322,
+        7323,7,17,0,0,7323,7324,7,14,0,0,7324,1320,1,0,0,0,7325,7326,7,8,
+        0,0,7326,7327,7,20,0,0,7327,7328,7,31,0,0,7328,7329,7,17,0,0,7329,
+        7330,7,16,0,0,7330,1322,1,0,0,0,7331,7332,7,8,0,0,7332,7333,7,20,
+        0,0,7333,7334,7,31,0,0,7334,7335,7,32,0,0,7335,7336,7,14,0,0,7336,
+        1324,1,0,0,0,7337,7338,7,8,0,0,7338,7339,7,20,0,0,7339,7340,7,31,
+        0,0,7340,7341,7,32,0,0,7341,7342,7,16,0,0,7342,1326,1,0,0,0,7343,
+        7344,7,8,0,0,7344,7345,7,20,0,0,7345,7346,7,17,0,0,7346,7347,7,17,
+        0,0,7347,1328,1,0,0,0,7348,7349,3,1327,640,0,7349,7350,7,31,0,0,
+        7350,1330,1,0,0,0,7351,7352,7,8,0,0,7352,7353,7,20,0,0,7353,7354,
+        7,19,0,0,7354,7355,7,14,0,0,7355,7356,7,30,0,0,7356,1332,1,0,0,0,
+        7357,7358,7,8,0,0,7358,7359,7,20,0,0,7359,7360,7,19,0,0,7360,7361,
+        7,15,0,0,7361,7362,7,14,0,0,7362,1334,1,0,0,0,7363,7364,7,8,0,0,
+        7364,7365,7,20,0,0,7365,7366,7,19,0,0,7366,7367,7,17,0,0,7367,7368,
+        7,14,0,0,7368,1336,1,0,0,0,7369,7370,7,8,0,0,7370,7371,7,20,0,0,
+        7371,7372,7,19,0,0,7372,7373,7,17,0,0,7373,7374,7,16,0,0,7374,1338,
+        1,0,0,0,7375,7376,7,8,0,0,7376,7377,7,20,0,0,7377,7378,7,19,0,0,
+        7378,7379,7,32,0,0,7379,7380,7,14,0,0,7380,1340,1,0,0,0,7381,7382,
+        7,8,0,0,7382,7383,7,20,0,0,7383,7384,7,19,0,0,7384,7385,7,32,0,0,
+        7385,7386,7,16,0,0,7386,1342,1,0,0,0,7387,7388,7,8,0,0,7388,7389,
+        7,20,0,0,7389,7390,7,19,0,0,7390,1344,1,0,0,0,7391,7392,7,8,0,0,
+        7392,7393,7,20,0,0,7393,7394,7,16,0,0,7394,1346,1,0,0,0,7395,7396,
+        7,8,0,0,7396,7397,7,11,0,0,7397,7398,7,14,0,0,7398,7399,7,8,0,0,
+        7399,7400,7,38,0,0,7400,1348,1,0,0,0,7401,7402,7,8,0,0,7402,7403,
+        7,11,0,0,7403,7404,7,14,0,0,7404,7405,7,8,0,0,7405,7406,7,38,0,0,
+        7406,7407,7,13,0,0,7407,1350,1,0,0,0,7408,7409,7,8,0,0,7409,7410,
+        7,7,0,0,7410,7411,7,33,0,0,7411,7412,7,10,0,0,7412,1352,1,0,0,0,
+        7413,7414,7,5,0,0,7414,7415,7,14,0,0,7415,7416,7,6,0,0,7416,7417,
+        7,9,0,0,7417,7418,7,15,0,0,7418,7419,7,14,0,0,7419,1354,1,0,0,0,
+        7420,7421,7,5,0,0,7421,7422,7,9,0,0,7422,7423,7,35,0,0,7423,1356,
+        1,0,0,0,7424,7425,7,5,0,0,7425,7426,7,7,0,0,7426,1358,1,0,0,0,7427,
+        7428,7,5,0,0,7428,7429,7,7,0,0,7429,7430,7,22,0,0,7430,7431,7,14,
+        0,0,7431,7432,7,30,0,0,7432,1360,1,0,0,0,7433,7434,7,5,0,0,7434,
+        7435,7,7,0,0,7435,7436,7,22,0,0,7436,7437,7,15,0,0,7437,7438,7,14,
+        0,0,7438,1362,1,0,0,0,7439,7440,7,5,0,0,7440,7441,7,7,0,0,7441,7442,
+        7,22,0,0,7442,7443,7,17,0,0,7443,7444,7,14,0,0,7444,1364,1,0,0,0,
+        7445,7446,7,5,0,0,7446,7447,7,7,0,0,7447,7448,7,22,0,0,7448,7449,
+        7,17,0,0,7449,7450,7,16,0,0,7450,1366,1,0,0,0,7451,7452,7,5,0,0,
+        7452,7453,7,7,0,0,7453,7454,7,22,0,0,7454,7455,7,32,0,0,7455,7456,
+        7,14,0,0,7456,1368,1,0,0,0,7457,7458,7,5,0,0,7458,7459,7,7,0,0,7459,
+        7460,7,22,0,0,7460,7461,7,32,0,0,7461,7462,7,16,0,0,7462,1370,1,
+        0,0,0,7463,7464,7,5,0,0,7464,7465,7,7,0,0,7465,7466,7,34,0,0,7466,
+        7467,7,14,0,0,7467,7468,7,30,0,0,7468,1372,1,0,0,0,7469,7470,7,5,
+        0,0,7470,7471,7,7,0,0,7471,7472,7,34,0,0,7472,7473,7,15,0,0,7473,
+        7474,7,14,0,0,7474,1374,1,0,0,0,7475,7476,7,5,0,0,7476,7477,7,7,
+        0,0,7477,7478,7,34,0,0,7478,7479,7,17,0,0,7479,7480,7,14,0,0,7480,
+        1376,1,0,0,0,7481,7482,7,5,0,0,7482,7483,7,7,0,0,7483,7484,7,34,
+        0,0,7484,7485,7,17,0,0,7485,7486,7,16,0,0,7486,1378,1,0,0,0,7487,
+        7488,7,5,0,0,7488,7489,7,7,0,0,7489,7490,7,34,0,0,7490,7491,7,32,
+        0,0,7491,7492,7,14,0,0,7492,1380,1,0,0,0,7493,7494,7,5,0,0,7494,
+        7495,7,7,0,0,7495,7496,7,34,0,0,7496,7497,7,32,0,0,7497,7498,7,16,
+        0,0,7498,1382,1,0,0,0,7499,7500,7,14,0,0,7500,7501,7,15,0,0,7501,
+        7502,7,5,0,0,7502,1384,1,0,0,0,7503,7504,7,14,0,0,7504,7505,7,15,
+        0,0,7505,7506,7,5,0,0,7506,7507,7,8,0,0,7507,7508,7,19,0,0,7508,
+        1386,1,0,0,0,7509,7510,7,14,0,0,7510,7511,7,37,0,0,7511,7512,7,16,
+        0,0,7512,7513,7,13,0,0,7513,7514,7,8,0,0,7514,7515,7,16,0,0,7515,
+        1388,1,0,0,0,7516,7517,7,32,0,0,7517,7518,7,7,0,0,7518,7519,7,16,
+        0,0,7519,7520,7,7,0,0,7520,1390,1,0,0,0,7521,7522,7,9,0,0,7522,7523,
+        7,6,0,0,7523,7524,7,14,0,0,7524,7525,7,30,0,0,7525,1392,1,0,0,0,
+        7526,7527,7,9,0,0,7527,7528,7,6,0,0,7528,7529,7,15,0,0,7529,7530,
+        7,14,0,0,7530,1394,1,0,0,0,7531,7532,7,9,0,0,7532,7533,7,6,0,0,7533,
+        7534,7,17,0,0,7534,7535,7,14,0,0,7535,1396,1,0,0,0,7536,7537,7,9,
+        0,0,7537,7538,7,6,0,0,7538,7539,7,17,0,0,7539,7540,7,16,0,0,7540,
+        1398,1,0,0,0,7541,7542,7,9,0,0,7542,7543,7,6,0,0,7543,7544,7,32,
+        0,0,7544,7545,7,14,0,0,7545,1400,1,0,0,0,7546,7547,7,9,0,0,7547,
+        7548,7,6,0,0,7548,7549,7,32,0,0,7549,7550,7,16,0,0,7550,1402,1,0,
+        0,0,7551,7552,7,38,0,0,7552,7553,7,6,0,0,7553,7554,7,17,0,0,7554,
+        7555,7,5,0,0,7555,1404,1,0,0,0,7556,7557,7,38,0,0,7557,7558,7,17,
+        0,0,7558,7559,7,9,0,0,7559,7560,7,19,0,0,7560,7561,7,16,0,0,7561,
+        1406,1,0,0,0,7562,7563,7,17,0,0,7563,7564,7,7,0,0,7564,7565,7,7,
+        0,0,7565,7566,7,38,0,0,7566,7567,7,22,0,0,7567,7568,7,10,0,0,7568,
+        1408,1,0,0,0,7569,7570,7,33,0,0,7570,7571,7,11,0,0,7571,7572,7,11,
+        0,0,7572,7573,7,43,0,0,7573,7574,7,7,0,0,7574,1410,1,0,0,0,7575,
+        7576,7,33,0,0,7576,7577,7,11,0,0,7577,7578,7,17,0,0,7578,7579,7,
+        43,0,0,7579,7580,7,7,0,0,7580,1412,1,0,0,0,7581,7582,7,33,0,0,7582,
+        7583,7,17,0,0,7583,7584,7,11,0,0,7584,7585,7,43,0,0,7585,7586,7,
+        7,0,0,7586,1414,1,0,0,0,7587,7588,7,33,0,0,7588,7589,7,17,0,0,7589,
+        7590,7,17,0,0,7590,7591,7,43,0,0,7591,7592,7,7,0,0,7592,1416,1,0,
+        0,0,7593,7594,7,33,0,0,7594,7595,7,7,0,0,7595,7596,7,35,0,0,7596,
+        7597,7,14,0,0,7597,1418,1,0,0,0,7598,7599,7,33,0,0,7599,7600,7,7,
+        0,0,7600,7601,7,35,0,0,7601,7602,7,14,0,0,7602,7603,7,20,0,0,7603,
+        1420,1,0,0,0,7604,7605,7,33,0,0,7605,7606,7,7,0,0,7606,7607,7,35,
+        0,0,7607,7608,7,14,0,0,7608,7609,7,17,0,0,7609,1422,1,0,0,0,7610,
+        7611,7,33,0,0,7611,7612,7,22,0,0,7612,7613,7,17,0,0,7613,7614,7,
+        16,0,0,7614,1424,1,0,0,0,7615,7616,7,33,0,0,7616,7617,7,35,0,0,7617,
+        7618,7,13,0,0,7618,1426,1,0,0,0,7619,7620,7,7,0,0,7620,7621,7,8,
+        0,0,7621,7622,7,8,0,0,7622,7623,7,22,0,0,7623,7624,7,13,0,0,7624,
+        1428,1,0,0,0,7625,7626,7,7,0,0,7626,7627,7,13,0,0,7627,7628,7,14,
+        0,0,7628,7629,7,30,0,0,7629,1430,1,0,0,0,7630,7631,7,7,0,0,7631,
+        7632,7,13,0,0,7632,7633,7,15,0,0,7633,7634,7,14,0,0,7634,1432,1,
+        0,0,0,7635,7636,7,7,0,0,7636,7637,7,13,0,0,7637,7638,7,17,0,0,7638,
+        7639,7,14,0,0,7639,1434,1,0,0,0,7640,7641,7,7,0,0,7641,7642,7,13,
+        0,0,7642,7643,7,17,0,0,7643,7644,7,16,0,0,7644,1436,1,0,0,0,7645,
+        7646,7,7,0,0,7646,7647,7,13,0,0,7647,7648,7,32,0,0,7648,7649,7,14,
+        0,0,7649,1438,1,0,0,0,7650,7651,7,7,0,0,7651,7652,7,13,0,0,7652,
+        7653,7,32,0,0,7653,7654,7,16,0,0,7654,1440,1,0,0,0,7655,7656,7,10,
+        0,0,7656,7657,7,20,0,0,7657,7658,7,13,0,0,7658,7659,7,33,0,0,7659,
+        1442,1,0,0,0,7660,7661,7,10,0,0,7661,7662,7,17,0,0,7662,7663,7,9,
+        0,0,7663,7664,7,19,0,0,7664,7665,7,16,0,0,7665,1444,1,0,0,0,7666,
+        7667,7,13,0,0,7667,7668,7,14,0,0,7668,7669,7,20,0,0,7669,7670,7,
+        17,0,0,7670,7671,7,17,0,0,7671,7672,7,7,0,0,7672,7673,7,8,0,0,7673,
+        1446,1,0,0,0,7674,7675,7,19,0,0,7675,7676,7,8,0,0,7676,7677,7,20,
+        0,0,7677,7678,7,15,0,0,7678,1448,1,0,0,0,7679,7680,7,19,0,0,7680,
+        7681,7,14,0,0,7681,7682,7,16,0,0,7682,7683,7,7,0,0,7683,7684,7,6,
+        0,0,7684,7685,7,6,0,0,7685,1450,1,0,0,0,7686,7687,7,19,0,0,7687,
+        7688,7,14,0,0,7688,7689,7,16,0,0,7689,7690,7,7,0,0,7690,7691,7,15,
+        0,0,7691,1452,1,0,0,0,7692,7693,7,19,0,0,7693,7694,7,11,0,0,7694,
+        7695,7,16,0,0,7695,7696,7,5,0,0,7696,7697,7,15,0,0,7697,1454,1,0,
+        0,0,7698,7699,7,19,0,0,7699,7700,7,30,0,0,7700,7701,7,13,0,0,7701,
+        7702,7,16,0,0,7702,1456,1,0,0,0,7703,7704,7,19,0,0,7704,7705,7,22,
+        0,0,7705,7706,7,31,0,0,7706,1458,1,0,0,0,7707,7708,7,19,0,0,7708,
+        7709,7,22,0,0,7709,7710,7,31,0,0,7710,7711,7,5,0,0,7711,7712,7,22,
+        0,0,7712,7713,7,13,0,0,7713,1460,1,0,0,0,7714,7715,7,19,0,0,7715,
+        7716,7,22,0,0,7716,7717,7,31,0,0,7717,7718,7,19,0,0,7718,7719,7,
+        16,0,0,7719,1462,1,0,0,0,7720,7721,7,16,0,0,7721,7722,7,20,0,0,7722,
+        7723,7,32,0,0,7723,1464,1,0,0,0,7724,7725,7,16,0,0,7725,7726,7,14,
+        0,0,7726,7727,7,19,0,0,7727,7728,7,16,0,0,7728,7729,7,31,0,0,7729,
+        1466,1,0,0,0,7730,7731,7,16,0,0,7731,7732,7,14,0,0,7732,7733,7,19,
+        0,0,7733,7734,7,16,0,0,7734,7735,7,15,0,0,7735,1468,1,0,0,0,7736,
+        7737,7,16,0,0,7737,7738,7,14,0,0,7738,7739,7,19,0,0,7739,7740,7,
+        16,0,0,7740,7741,7,43,0,0,7741,1470,1,0,0,0,7742,7743,7,16,0,0,7743,
+        7744,7,9,0,0,7744,7745,7,33,0,0,7745,7746,7,14,0,0,7746,1472,1,0,
+        0,0,7747,7748,7,34,0,0,7748,7749,7,11,0,0,7749,7750,7,14,0,0,7750,
+        7751,7,15,0,0,7751,7752,7,14,0,0,7752,7753,7,30,0,0,7753,1474,1,
+        0,0,0,7754,7755,7,34,0,0,7755,7756,7,11,0,0,7756,7757,7,14,0,0,7757,
+        7758,7,15,0,0,7758,7759,7,15,0,0,7759,7760,7,14,0,0,7760,1476,1,
+        0,0,0,7761,7762,7,34,0,0,7762,7763,7,11,0,0,7763,7764,7,14,0,0,7764,
+        7765,7,15,0,0,7765,7766,7,17,0,0,7766,7767,7,14,0,0,7767,1478,1,
+        0,0,0,7768,7769,7,34,0,0,7769,7770,7,11,0,0,7770,7771,7,14,0,0,7771,
+        7772,7,15,0,0,7772,7773,7,17,0,0,7773,7774,7,16,0,0,7774,1480,1,
+        0,0,0,7775,7776,7,34,0,0,7776,7777,7,11,0,0,7777,7778,7,14,0,0,7778,
+        7779,7,15,0,0,7779,7780,7,32,0,0,7780,7781,7,14,0,0,7781,1482,1,
+        0,0,0,7782,7783,7,34,0,0,7783,7784,7,11,0,0,7784,7785,7,14,0,0,7785,
+        7786,7,15,0,0,7786,7787,7,32,0,0,7787,7788,7,16,0,0,7788,1484,1,
+        0,0,0,7789,7790,7,37,0,0,7790,7791,7,6,0,0,7791,7792,7,7,0,0,7792,
+        7793,7,7,0,0,7793,7794,7,16,0,0,7794,1486,1,0,0,0,7795,7796,7,37,
+        0,0,7796,7797,7,17,0,0,7797,7798,7,20,0,0,7798,7799,7,16,0,0,7799,
+        7800,7,14,0,0,7800,1488,1,0,0,0,7801,7802,7,43,0,0,7802,7803,5,45,
+        0,0,7803,7804,7,20,0,0,7804,7805,7,5,0,0,7805,7806,7,5,0,0,7806,
+        1490,1,0,0,0,7807,7808,7,43,0,0,7808,7809,5,45,0,0,7809,7810,7,19,
+        0,0,7810,7811,7,22,0,0,7811,7812,7,31,0,0,7812,1492,1,0,0,0,7813,
+        7815,7,2,0,0,7814,7813,1,0,0,0,7815,7816,1,0,0,0,7816,7814,1,0,0,
+        0,7816,7817,1,0,0,0,7817,7818,1,0,0,0,7818,7819,6,723,2,0,7819,1494,
+        1,0,0,0,7820,7821,5,47,0,0,7821,7822,5,47,0,0,7822,7823,1,0,0,0,
+        7823,7824,6,724,5,0,7824,7825,6,724,130,0,7825,7826,6,724,3,0,7826,
+        1496,1,0,0,0,7827,7828,3,99,26,0,7828,7829,1,0,0,0,7829,7830,6,725,
+        5,0,7830,7831,6,725,2,0,7831,1498,1,0,0,0,7832,7842,8,57,0,0,7833,
+        7837,7,58,0,0,7834,7836,7,2,0,0,7835,7834,1,0,0,0,7836,7839,1,0,
+        0,0,7837,7835,1,0,0,0,7837,7838,1,0,0,0,7838,7840,1,0,0,0,7839,7837,
+        1,0,0,0,7840,7842,4,726,27,0,7841,7832,1,0,0,0,7841,7833,1,0,0,0,
+        7842,7843,1,0,0,0,7843,7841,1,0,0,0,7843,7844,1,0,0,0,7844,1500,
+        1,0,0,0,7845,7846,7,25,0,0,7846,7847,7,25,0,0,7847,7848,6,727,152,
+        0,7848,1502,1,0,0,0,7849,7850,7,25,0,0,7850,7851,1,0,0,0,7851,7852,
+        6,728,5,0,7852,1504,1,0,0,0,7853,7857,5,43,0,0,7854,7856,7,2,0,0,
+        7855,7854,1,0,0,0,7856,7859,1,0,0,0,7857,7855,1,0,0,0,7857,7858,
+        1,0,0,0,7858,7860,1,0,0,0,7859,7857,1,0,0,0,7860,7861,3,99,26,0,
+        7861,7862,1,0,0,0,7862,7863,4,729,28,0,7863,7864,1,0,0,0,7864,7865,
+        6,729,153,0,7865,7866,6,729,154,0,7866,7867,6,729,2,0,7867,1506,
+        1,0,0,0,7868,7872,5,45,0,0,7869,7871,7,2,0,0,7870,7869,1,0,0,0,7871,
+        7874,1,0,0,0,7872,7870,1,0,0,0,7872,7873,1,0,0,0,7873,7875,1,0,0,
+        0,7874,7872,1,0,0,0,7875,7876,3,99,26,0,7876,7877,1,0,0,0,7877,7878,
+        4,730,29,0,7878,7879,1,0,0,0,7879,7880,6,730,154,0,7880,7881,6,730,
+        2,0,7881,1508,1,0,0,0,7882,7883,4,731,30,0,7883,7887,5,43,0,0,7884,
+        7886,7,2,0,0,7885,7884,1,0,0,0,7886,7889,1,0,0,0,7887,7885,1,0,0,
+        0,7887,7888,1,0,0,0,7888,7890,1,0,0,0,7889,7887,1,0,0,0,7890,7891,
+        3,99,26,0,7891,7892,3,57,5,0,7892,7893,5,32,0,0,7893,7894,5,32,0,
+        0,7894,7898,1,0,0,0,7895,7897,7,2,0,0,7896,7895,1,0,0,0,7897,7900,
+        1,0,0,0,7898,7896,1,0,0,0,7898,7899,1,0,0,0,7899,7901,1,0,0,0,7900,
+        7898,1,0,0,0,7901,7902,6,731,2,0,7902,1510,1,0,0,0,7903,7904,4,732,
+        31,0,7904,7908,5,45,0,0,7905,7907,7,2,0,0,7906,7905,1,0,0,0,7907,
+        7910,1,0,0,0,7908,7906,1,0,0,0,7908,7909,1,0,0,0,7909,7911,1,0,0,
+        0,7910,7908,1,0,0,0,7911,7912,3,99,26,0,7912,7913,3,57,5,0,7913,
+        7914,5,32,0,0,7914,7915,5,32,0,0,7915,7916,1,0,0,0,7916,7917,6,732,
+        2,0,7917,1512,1,0,0,0,7918,7919,7,58,0,0,7919,1514,1,0,0,0,7920,
+        7922,8,59,0,0,7921,7920,1,0,0,0,7922,7923,1,0,0,0,7923,7921,1,0,
+        0,0,7923,7924,1,0,0,0,7924,7925,1,0,0,0,7925,7926,6,734,155,0,7926,
+        1516,1,0,0,0,7927,7928,7,24,0,0,7928,7929,1,0,0,0,7929,7930,6,735,
+        5,0,7930,7931,6,735,156,0,7931,1518,1,0,0,0,7932,7933,1,0,0,0,7933,
+        7934,1,0,0,0,7934,7935,6,736,5,0,7935,7936,6,736,2,0,7936,1520,1,
+        0,0,0,7937,7938,3,57,5,0,7938,7939,8,0,0,0,7939,7943,4,737,32,0,
+        7940,7942,7,2,0,0,7941,7940,1,0,0,0,7942,7945,1,0,0,0,7943,7941,
+        1,0,0,0,7943,7944,1,0,0,0,7944,7946,1,0,0,0,7945,7943,1,0,0,0,7946,
+        7947,3,99,26,0,7947,7948,1,0,0,0,7948,7949,6,737,2,0,7949,1522,1,
+        0,0,0,7950,7951,3,57,5,0,7951,7952,8,0,0,0,7952,7953,4,738,33,0,
+        7953,7957,7,55,0,0,7954,7956,8,0,0,0,7955,7954,1,0,0,0,7956,7959,
+        1,0,0,0,7957,7955,1,0,0,0,7957,7958,1,0,0,0,7958,7960,1,0,0,0,7959,
+        7957,1,0,0,0,7960,7961,3,99,26,0,7961,7962,1,0,0,0,7962,7963,6,738,
+        2,0,7963,1524,1,0,0,0,7964,7971,3,57,5,0,7965,7966,7,8,0,0,7966,
+        7972,4,739,34,0,7967,7968,7,5,0,0,7968,7972,4,739,35,0,7969,7970,
+        7,7,0,0,7970,7972,4,739,36,0,7971,7965,1,0,0,0,7971,7967,1,0,0,0,
+        7971,7969,1,0,0,0,7972,7973,1,0,0,0,7973,8089,8,55,0,0,7974,7975,
+        5,32,0,0,7975,7976,5,32,0,0,7976,7977,5,32,0,0,7977,7978,5,32,0,
+        0,7978,7979,5,32,0,0,7979,7980,5,32,0,0,7980,7981,5,32,0,0,7981,
+        7982,5,32,0,0,7982,7983,5,32,0,0,7983,7984,5,32,0,0,7984,7985,5,
+        32,0,0,7985,7986,5,32,0,0,7986,7987,5,32,0,0,7987,7988,5,32,0,0,
+        7988,7989,5,32,0,0,7989,7990,5,32,0,0,7990,7991,5,32,0,0,7991,7992,
+        5,32,0,0,7992,7993,5,32,0,0,7993,7994,5,32,0,0,7994,7995,5,32,0,
+        0,7995,7996,5,32,0,0,7996,7997,5,32,0,0,7997,7998,5,32,0,0,7998,
+        7999,5,32,0,0,7999,8000,5,32,0,0,8000,8001,5,32,0,0,8001,8002,5,
+        32,0,0,8002,8003,1,0,0,0,8003,8090,4,739,37,0,8004,8005,5,32,0,0,
+        8005,8006,5,32,0,0,8006,8007,5,32,0,0,8007,8008,5,32,0,0,8008,8009,
+        5,32,0,0,8009,8010,5,32,0,0,8010,8011,5,32,0,0,8011,8012,5,32,0,
+        0,8012,8013,5,32,0,0,8013,8014,5,32,0,0,8014,8015,5,32,0,0,8015,
+        8016,5,32,0,0,8016,8017,5,32,0,0,8017,8018,5,32,0,0,8018,8019,5,
+        32,0,0,8019,8020,5,32,0,0,8020,8021,5,32,0,0,8021,8022,5,32,0,0,
+        8022,8023,5,32,0,0,8023,8024,5,32,0,0,8024,8025,5,32,0,0,8025,8026,
+        5,32,0,0,8026,8027,5,32,0,0,8027,8028,5,32,0,0,8028,8029,5,32,0,
+        0,8029,8030,5,32,0,0,8030,8031,5,32,0,0,8031,8032,5,32,0,0,8032,
+        8033,5,32,0,0,8033,8034,5,32,0,0,8034,8035,5,32,0,0,8035,8036,5,
+        32,0,0,8036,8037,5,32,0,0,8037,8038,5,32,0,0,8038,8039,5,32,0,0,
+        8039,8040,5,32,0,0,8040,8041,1,0,0,0,8041,8090,4,739,38,0,8042,8043,
+        5,32,0,0,8043,8044,5,32,0,0,8044,8045,5,32,0,0,8045,8046,5,32,0,
+        0,8046,8047,5,32,0,0,8047,8048,5,32,0,0,8048,8049,5,32,0,0,8049,
+        8050,5,32,0,0,8050,8051,5,32,0,0,8051,8052,5,32,0,0,8052,8053,5,
+        32,0,0,8053,8054,5,32,0,0,8054,8055,5,32,0,0,8055,8056,5,32,0,0,
+        8056,8057,5,32,0,0,8057,8058,5,32,0,0,8058,8059,5,32,0,0,8059,8060,
+        5,32,0,0,8060,8061,5,32,0,0,8061,8062,5,32,0,0,8062,8063,5,32,0,
+        0,8063,8064,5,32,0,0,8064,8065,5,32,0,0,8065,8066,5,32,0,0,8066,
+        8067,5,32,0,0,8067,8068,5,32,0,0,8068,8069,5,32,0,0,8069,8070,5,
+        32,0,0,8070,8071,5,32,0,0,8071,8072,5,32,0,0,8072,8073,5,32,0,0,
+        8073,8074,5,32,0,0,8074,8075,5,32,0,0,8075,8076,5,32,0,0,8076,8077,
+        5,32,0,0,8077,8078,5,32,0,0,8078,8079,5,32,0,0,8079,8080,5,32,0,
+        0,8080,8081,5,32,0,0,8081,8082,5,32,0,0,8082,8083,5,32,0,0,8083,
+        8084,5,32,0,0,8084,8085,5,32,0,0,8085,8086,5,32,0,0,8086,8087,5,
+        32,0,0,8087,8088,1,0,0,0,8088,8090,4,739,39,0,8089,7974,1,0,0,0,
+        8089,8004,1,0,0,0,8089,8042,1,0,0,0,8090,8099,1,0,0,0,8091,8093,
+        7,2,0,0,8092,8091,1,0,0,0,8093,8096,1,0,0,0,8094,8092,1,0,0,0,8094,
+        8095,1,0,0,0,8095,8097,1,0,0,0,8096,8094,1,0,0,0,8097,8100,4,739,
+        40,0,8098,8100,1,0,0,0,8099,8094,1,0,0,0,8099,8098,1,0,0,0,8100,
+        8101,1,0,0,0,8101,8102,6,739,2,0,8102,1526,1,0,0,0,8103,8104,1,0,
+        0,0,8104,8105,1,0,0,0,8105,8106,6,740,5,0,8106,8107,6,740,2,0,8107,
+        1528,1,0,0,0,8108,8109,8,60,0,0,8109,8111,4,741,41,0,8110,8108,1,
+        0,0,0,8111,8112,1,0,0,0,8112,8110,1,0,0,0,8112,8113,1,0,0,0,8113,
+        8114,1,0,0,0,8114,8115,6,741,155,0,8115,1530,1,0,0,0,8116,8117,7,
+        25,0,0,8117,8118,7,25,0,0,8118,8119,4,742,42,0,8119,8120,1,0,0,0,
+        8120,8121,6,742,157,0,8121,1532,1,0,0,0,8122,8123,7,25,0,0,8123,
+        8124,4,743,43,0,8124,8125,1,0,0,0,8125,8126,6,743,156,0,8126,8127,
+        6,743,5,0,8127,1534,1,0,0,0,8128,8129,4,744,44,0,8129,8130,1,0,0,
+        0,8130,8131,6,744,2,0,8131,8132,6,744,5,0,8132,1536,1,0,0,0,8133,
+        8135,7,2,0,0,8134,8133,1,0,0,0,8135,8136,1,0,0,0,8136,8134,1,0,0,
+        0,8136,8137,1,0,0,0,8137,8138,1,0,0,0,8138,8139,6,745,2,0,8139,1538,
+        1,0,0,0,8140,8142,8,0,0,0,8141,8140,1,0,0,0,8142,8143,1,0,0,0,8143,
+        8141,1,0,0,0,8143,8144,1,0,0,0,8144,8145,1,0,0,0,8145,8146,6,746,
+        158,0,8146,8147,1,0,0,0,8147,8148,6,746,3,0,8148,1540,1,0,0,0,8149,
+        8150,3,99,26,0,8150,8151,1,0,0,0,8151,8152,6,747,5,0,8152,8153,6,
+        747,2,0,8153,1542,1,0,0,0,8154,8156,7,2,0,0,8155,8154,1,0,0,0,8156,
+        8157,1,0,0,0,8157,8155,1,0,0,0,8157,8158,1,0,0,0,8158,8159,1,0,0,
+        0,8159,8160,6,748,2,0,8160,1544,1,0,0,0,8161,8163,8,0,0,0,8162,8161,
+        1,0,0,0,8163,8166,1,0,0,0,8164,8162,1,0,0,0,8164,8165,1,0,0,0,8165,
+        8167,1,0,0,0,8166,8164,1,0,0,0,8167,8168,6,749,3,0,8168,1546,1,0,
+        0,0,8169,8170,3,99,26,0,8170,8171,4,750,45,0,8171,8172,1,0,0,0,8172,
+        8173,6,750,3,0,8173,8174,6,750,5,0,8174,1548,1,0,0,0,8175,8179,3,
+        99,26,0,8176,8177,3,57,5,0,8177,8178,7,2,0,0,8178,8180,1,0,0,0,8179,
+        8176,1,0,0,0,8179,8180,1,0,0,0,8180,8181,1,0,0,0,8181,8182,4,751,
+        46,0,8182,8183,1,0,0,0,8183,8184,6,751,159,0,8184,8185,6,751,3,0,
+        8185,8186,6,751,5,0,8186,1550,1,0,0,0,8187,8189,7,42,0,0,8188,8187,
+        1,0,0,0,8189,8190,1,0,0,0,8190,8188,1,0,0,0,8190,8191,1,0,0,0,8191,
+        8192,1,0,0,0,8192,8193,6,752,2,0,8193,1552,1,0,0,0,8194,8195,5,59,
+        0,0,8195,8196,1,0,0,0,8196,8197,6,753,5,0,8197,8198,6,753,5,0,8198,
+        1554,1,0,0,0,8199,8206,8,61,0,0,8200,8202,8,62,0,0,8201,8200,1,0,
+        0,0,8202,8203,1,0,0,0,8203,8201,1,0,0,0,8203,8204,1,0,0,0,8204,8205,
+        1,0,0,0,8205,8207,8,61,0,0,8206,8201,1,0,0,0,8206,8207,1,0,0,0,8207,
+        1556,1,0,0,0,8208,8209,3,59,6,0,8209,8210,3,59,6,0,8210,8211,3,59,
+        6,0,8211,8212,4,755,47,0,8212,8213,6,755,160,0,8213,1558,1,0,0,0,
+        8214,8216,7,2,0,0,8215,8214,1,0,0,0,8216,8219,1,0,0,0,8217,8215,
+        1,0,0,0,8217,8218,1,0,0,0,8218,8221,1,0,0,0,8219,8217,1,0,0,0,8220,
+        8222,8,63,0,0,8221,8220,1,0,0,0,8222,8223,1,0,0,0,8223,8221,1,0,
+        0,0,8223,8224,1,0,0,0,8224,8225,1,0,0,0,8225,8226,3,1561,757,0,8226,
+        8227,6,756,161,0,8227,8228,1,0,0,0,8228,8229,6,756,162,0,8229,1560,
+        1,0,0,0,8230,8231,5,46,0,0,8231,8232,5,46,0,0,8232,8233,5,46,0,0,
+        8233,1562,1,0,0,0,8234,8235,5,32,0,0,8235,8236,5,32,0,0,8236,8237,
+        1,0,0,0,8237,8238,4,758,48,0,8238,8239,1,0,0,0,8239,8240,6,758,2,
+        0,8240,1564,1,0,0,0,8241,8242,7,31,0,0,8242,8243,4,759,49,0,8243,
+        1566,1,0,0,0,8244,8245,7,14,0,0,8245,8246,4,760,50,0,8246,1568,1,
+        0,0,0,8247,8248,5,32,0,0,8248,8249,5,32,0,0,8249,8250,5,32,0,0,8250,
+        8251,5,32,0,0,8251,8252,5,32,0,0,8252,8253,5,32,0,0,8253,8254,5,
+        32,0,0,8254,8255,5,32,0,0,8255,8256,5,32,0,0,8256,8257,5,32,0,0,
+        8257,8258,5,32,0,0,8258,8259,5,32,0,0,8259,8260,5,32,0,0,8260,8261,
+        5,32,0,0,8261,8262,5,32,0,0,8262,8263,5,32,0,0,8263,8264,5,32,0,
+        0,8264,8265,5,32,0,0,8265,8266,5,32,0,0,8266,8267,1,0,0,0,8267,8268,
+        4,761,51,0,8268,8269,1,0,0,0,8269,8270,6,761,2,0,8270,1570,1,0,0,
+        0,8271,8272,8,0,0,0,8272,8277,4,762,52,0,8273,8274,8,0,0,0,8274,
+        8276,4,762,53,0,8275,8273,1,0,0,0,8276,8279,1,0,0,0,8277,8275,1,
+        0,0,0,8277,8278,1,0,0,0,8278,1572,1,0,0,0,8279,8277,1,0,0,0,8280,
+        8281,7,2,0,0,8281,8285,4,763,54,0,8282,8284,7,2,0,0,8283,8282,1,
+        0,0,0,8284,8287,1,0,0,0,8285,8283,1,0,0,0,8285,8286,1,0,0,0,8286,
+        8288,1,0,0,0,8287,8285,1,0,0,0,8288,8289,3,99,26,0,8289,8290,1,0,
+        0,0,8290,8291,6,763,2,0,8291,1574,1,0,0,0,8292,8293,3,533,243,0,
+        8293,8294,1,0,0,0,8294,8295,6,764,3,0,8295,8296,6,764,5,0,8296,1576,
+        1,0,0,0,8297,8298,1,0,0,0,8298,8299,1,0,0,0,8299,8300,6,765,5,0,
+        8300,8301,6,765,2,0,8301,1578,1,0,0,0,8302,8303,5,32,0,0,8303,8304,
+        5,32,0,0,8304,8305,5,32,0,0,8305,8306,5,32,0,0,8306,8307,5,32,0,
+        0,8307,8308,5,32,0,0,8308,8309,5,32,0,0,8309,8310,5,32,0,0,8310,
+        8311,5,32,0,0,8311,8312,5,32,0,0,8312,8313,5,32,0,0,8313,8314,5,
+        32,0,0,8314,8315,5,32,0,0,8315,8316,5,32,0,0,8316,8317,5,32,0,0,
+        8317,8318,5,32,0,0,8318,8319,5,32,0,0,8319,8320,5,32,0,0,8320,8321,
+        5,32,0,0,8321,8322,5,32,0,0,8322,8323,5,32,0,0,8323,8324,5,32,0,
+        0,8324,8325,5,32,0,0,8325,8326,5,32,0,0,8326,8327,5,32,0,0,8327,
+        8328,5,32,0,0,8328,8329,5,32,0,0,8329,8330,5,32,0,0,8330,8331,5,
+        32,0,0,8331,8332,5,32,0,0,8332,8333,5,32,0,0,8333,8334,5,32,0,0,
+        8334,8335,5,32,0,0,8335,8336,5,32,0,0,8336,8337,5,32,0,0,8337,8338,
+        5,32,0,0,8338,8339,5,32,0,0,8339,8340,5,32,0,0,8340,8341,5,32,0,
+        0,8341,8342,5,32,0,0,8342,8343,5,32,0,0,8343,8344,5,32,0,0,8344,
+        8345,5,32,0,0,8345,8346,5,32,0,0,8346,8347,5,32,0,0,8347,8348,5,
+        32,0,0,8348,8349,5,32,0,0,8349,8350,5,32,0,0,8350,8351,5,32,0,0,
+        8351,8352,5,32,0,0,8352,8353,5,32,0,0,8353,8354,5,32,0,0,8354,8355,
+        5,32,0,0,8355,8356,5,32,0,0,8356,8357,5,32,0,0,8357,8358,5,32,0,
+        0,8358,8359,5,32,0,0,8359,8360,5,32,0,0,8360,8361,5,32,0,0,8361,
+        8362,5,32,0,0,8362,8363,5,32,0,0,8363,8364,5,32,0,0,8364,8365,5,
+        32,0,0,8365,8366,5,32,0,0,8366,8367,5,32,0,0,8367,8368,5,32,0,0,
+        8368,8369,5,32,0,0,8369,8370,5,32,0,0,8370,8371,5,32,0,0,8371,8372,
+        5,32,0,0,8372,8373,5,32,0,0,8373,8374,5,32,0,0,8374,8375,5,32,0,
+        0,8375,8376,5,32,0,0,8376,8377,5,32,0,0,8377,8378,1,0,0,0,8378,8379,
+        4,766,55,0,8379,1580,1,0,0,0,8380,8384,4,767,56,0,8381,8383,7,2,
+        0,0,8382,8381,1,0,0,0,8383,8386,1,0,0,0,8384,8382,1,0,0,0,8384,8385,
+        1,0,0,0,8385,8388,1,0,0,0,8386,8384,1,0,0,0,8387,8389,3,61,7,0,8388,
+        8387,1,0,0,0,8389,8390,1,0,0,0,8390,8388,1,0,0,0,8390,8391,1,0,0,
+        0,8391,8392,1,0,0,0,8392,8393,3,1583,768,0,8393,8394,6,767,163,0,
+        8394,8395,1,0,0,0,8395,8396,6,767,162,0,8396,1582,1,0,0,0,8397,8398,
+        5,46,0,0,8398,8399,5,46,0,0,8399,8400,5,46,0,0,8400,1584,1,0,0,0,
+        8401,8402,3,59,6,0,8402,8403,3,59,6,0,8403,8404,3,59,6,0,8404,8405,
+        4,769,57,0,8405,8406,6,769,164,0,8406,1586,1,0,0,0,8407,8408,7,64,
+        0,0,8408,8409,4,770,58,0,8409,1588,1,0,0,0,8410,8411,7,65,0,0,8411,
+        8412,4,771,59,0,8412,1590,1,0,0,0,8413,8414,7,8,0,0,8414,8415,7,
+        2,0,0,8415,8416,4,772,60,0,8416,1592,1,0,0,0,8417,8418,7,10,0,0,
+        8418,8419,7,9,0,0,8419,8420,4,773,61,0,8420,1594,1,0,0,0,8421,8422,
+        7,10,0,0,8422,8423,7,13,0,0,8423,8424,4,774,62,0,8424,1596,1,0,0,
+        0,8425,8426,7,5,0,0,8426,8427,7,19,0,0,8427,8428,4,775,63,0,8428,
+        1598,1,0,0,0,8429,8430,7,19,0,0,8430,8431,7,2,0,0,8431,8432,4,776,
+        64,0,8432,1600,1,0,0,0,8433,8434,7,2,0,0,8434,8435,7,2,0,0,8435,
+        8436,4,777,65,0,8436,1602,1,0,0,0,8437,8438,7,66,0,0,8438,8439,7,
+        66,0,0,8439,8440,4,778,66,0,8440,1604,1,0,0,0,8441,8442,3,57,5,0,
+        8442,8443,7,67,0,0,8443,8444,7,66,0,0,8444,8445,4,779,67,0,8445,
+        1606,1,0,0,0,8446,8447,3,57,5,0,8447,8448,7,67,0,0,8448,8449,7,66,
+        0,0,8449,8450,4,780,68,0,8450,1608,1,0,0,0,8451,8452,7,68,0,0,8452,
+        8453,4,781,69,0,8453,1610,1,0,0,0,8454,8455,7,69,0,0,8455,8456,7,
+        70,0,0,8456,8457,4,782,70,0,8457,1612,1,0,0,0,8458,8459,5,32,0,0,
+        8459,8460,4,783,71,0,8460,8461,1,0,0,0,8461,8462,6,783,165,0,8462,
+        1614,1,0,0,0,8463,8464,7,12,0,0,8464,8468,4,784,72,0,8465,8467,7,
+        12,0,0,8466,8465,1,0,0,0,8467,8470,1,0,0,0,8468,8466,1,0,0,0,8468,
+        8469,1,0,0,0,8469,8471,1,0,0,0,8470,8468,1,0,0,0,8471,8472,6,784,
+        2,0,8472,1616,1,0,0,0,8473,8474,8,0,0,0,8474,8478,4,785,73,0,8475,
+        8477,8,0,0,0,8476,8475,1,0,0,0,8477,8480,1,0,0,0,8478,8476,1,0,0,
+        0,8478,8479,1,0,0,0,8479,8481,1,0,0,0,8480,8478,1,0,0,0,8481,8482,
+        6,785,3,0,8482,1618,1,0,0,0,8483,8484,3,99,26,0,8484,8485,1,0,0,
+        0,8485,8486,6,786,5,0,8486,1620,1,0,0,0,8487,8488,3,101,27,0,8488,
+        8489,1,0,0,0,8489,8490,6,787,2,0,8490,1622,1,0,0,0,8491,8492,3,99,
+        26,0,8492,8493,1,0,0,0,8493,8494,6,788,2,0,8494,1624,1,0,0,0,8495,
+        8496,3,49,1,0,8496,8497,1,0,0,0,8497,8498,6,789,2,0,8498,8499,6,
+        789,5,0,8499,8500,6,789,166,0,8500,1626,1,0,0,0,8501,8502,3,51,2,
+        0,8502,8503,1,0,0,0,8503,8504,6,790,3,0,8504,8505,6,790,5,0,8505,
+        8506,6,790,166,0,8506,1628,1,0,0,0,8507,8508,3,99,26,0,8508,8509,
+        1,0,0,0,8509,8510,6,791,2,0,8510,1630,1,0,0,0,8511,8512,8,63,0,0,
+        8512,8516,4,792,74,0,8513,8515,8,0,0,0,8514,8513,1,0,0,0,8515,8518,
+        1,0,0,0,8516,8514,1,0,0,0,8516,8517,1,0,0,0,8517,8519,1,0,0,0,8518,
+        8516,1,0,0,0,8519,8520,6,792,3,0,8520,1632,1,0,0,0,8521,8522,3,101,
+        27,0,8522,8523,1,0,0,0,8523,8524,6,793,2,0,8524,1634,1,0,0,0,8525,
+        8526,3,1631,792,0,8526,8527,1,0,0,0,8527,8528,6,794,167,0,8528,8529,
+        6,794,3,0,8529,1636,1,0,0,0,8530,8531,7,5,0,0,8531,8532,4,795,75,
+        0,8532,8533,1,0,0,0,8533,8534,6,795,2,0,8534,8535,6,795,5,0,8535,
+        1638,1,0,0,0,8536,8537,7,10,0,0,8537,8538,4,796,76,0,8538,8539,1,
+        0,0,0,8539,8540,6,796,2,0,8540,8541,6,796,5,0,8541,1640,1,0,0,0,
+        8542,8543,3,99,26,0,8543,8544,1,0,0,0,8544,8545,6,797,2,0,8545,1642,
+        1,0,0,0,8546,8547,3,1579,766,0,8547,8548,1,0,0,0,8548,8549,6,798,
+        168,0,8549,1644,1,0,0,0,8550,8551,3,57,5,0,8551,8552,3,57,5,0,8552,
+        8553,4,799,77,0,8553,1646,1,0,0,0,8554,8555,7,71,0,0,8555,8556,4,
+        800,78,0,8556,1648,1,0,0,0,8557,8558,7,71,0,0,8558,8559,4,801,79,
+        0,8559,1650,1,0,0,0,8560,8561,7,64,0,0,8561,8562,4,802,80,0,8562,
+        1652,1,0,0,0,8563,8564,7,72,0,0,8564,8565,4,803,81,0,8565,1654,1,
+        0,0,0,8566,8567,7,73,0,0,8567,8568,4,804,82,0,8568,1656,1,0,0,0,
+        8569,8570,7,74,0,0,8570,8571,4,805,83,0,8571,1658,1,0,0,0,8572,8573,
+        3,57,5,0,8573,8574,4,806,84,0,8574,1660,1,0,0,0,8575,8576,7,75,0,
+        0,8576,8577,4,807,85,0,8577,1662,1,0,0,0,8578,8579,7,70,0,0,8579,
+        8580,7,70,0,0,8580,8581,7,70,0,0,8581,8582,7,70,0,0,8582,8583,7,
+        70,0,0,8583,8584,4,808,86,0,8584,1664,1,0,0,0,8585,8586,7,71,0,0,
+        8586,8587,4,809,87,0,8587,1666,1,0,0,0,8588,8589,7,71,0,0,8589,8590,
+        4,810,88,0,8590,1668,1,0,0,0,8591,8592,3,57,5,0,8592,8593,7,71,0,
+        0,8593,8594,7,71,0,0,8594,8595,4,811,89,0,8595,1670,1,0,0,0,8596,
+        8597,7,2,0,0,8597,8598,4,812,90,0,8598,8599,1,0,0,0,8599,8600,6,
+        812,165,0,8600,1672,1,0,0,0,8601,8602,7,12,0,0,8602,8606,4,813,91,
+        0,8603,8605,7,12,0,0,8604,8603,1,0,0,0,8605,8608,1,0,0,0,8606,8604,
+        1,0,0,0,8606,8607,1,0,0,0,8607,8609,1,0,0,0,8608,8606,1,0,0,0,8609,
+        8610,6,813,2,0,8610,1674,1,0,0,0,8611,8612,3,99,26,0,8612,8613,1,
+        0,0,0,8613,8614,6,814,19,0,8614,8615,6,814,5,0,8615,1676,1,0,0,0,
+        8616,8617,3,1579,766,0,8617,8618,1,0,0,0,8618,8619,6,815,168,0,8619,
+        1678,1,0,0,0,8620,8621,3,57,5,0,8621,8622,3,57,5,0,8622,8623,4,816,
+        92,0,8623,1680,1,0,0,0,8624,8625,5,32,0,0,8625,8626,5,32,0,0,8626,
+        8627,5,32,0,0,8627,8628,5,32,0,0,8628,8629,5,32,0,0,8629,8630,5,
+        32,0,0,8630,8631,5,32,0,0,8631,8632,5,32,0,0,8632,8633,5,32,0,0,
+        8633,8640,1,0,0,0,8634,8635,7,20,0,0,8635,8636,7,15,0,0,8636,8641,
+        7,5,0,0,8637,8638,7,7,0,0,8638,8639,7,13,0,0,8639,8641,5,32,0,0,
+        8640,8634,1,0,0,0,8640,8637,1,0,0,0,8641,8642,1,0,0,0,8642,8643,
+        5,32,0,0,8643,8644,5,32,0,0,8644,8645,1,0,0,0,8645,8646,6,817,11,
+        0,8646,8647,6,817,11,0,8647,8648,6,817,11,0,8648,1682,1,0,0,0,8649,
+        8650,5,32,0,0,8650,8651,5,32,0,0,8651,8652,5,32,0,0,8652,8653,5,
+        32,0,0,8653,8654,5,32,0,0,8654,8655,5,32,0,0,8655,8656,5,32,0,0,
+        8656,8657,5,32,0,0,8657,8658,5,32,0,0,8658,8659,5,32,0,0,8659,8660,
+        5,32,0,0,8660,8661,5,32,0,0,8661,8662,5,32,0,0,8662,8663,5,32,0,
+        0,8663,8664,1,0,0,0,8664,8665,4,818,93,0,8665,8666,1,0,0,0,8666,
+        8667,6,818,169,0,8667,8668,6,818,11,0,8668,8669,6,818,11,0,8669,
+        8670,6,818,11,0,8670,1684,1,0,0,0,8671,8672,7,71,0,0,8672,8673,4,
+        819,94,0,8673,1686,1,0,0,0,8674,8675,7,20,0,0,8675,8676,7,5,0,0,
+        8676,8681,7,5,0,0,8677,8678,7,5,0,0,8678,8679,7,14,0,0,8679,8681,
+        7,17,0,0,8680,8674,1,0,0,0,8680,8677,1,0,0,0,8681,8682,1,0,0,0,8682,
+        8683,4,820,95,0,8683,8684,1,0,0,0,8684,8685,6,820,170,0,8685,8686,
+        6,820,11,0,8686,8687,6,820,11,0,8687,8688,6,820,11,0,8688,1688,1,
+        0,0,0,8689,8691,7,76,0,0,8690,8689,1,0,0,0,8691,8692,1,0,0,0,8692,
+        8693,5,32,0,0,8693,8694,5,32,0,0,8694,8695,1,0,0,0,8695,8696,4,821,
+        96,0,8696,8697,1,0,0,0,8697,8698,6,821,11,0,8698,8699,6,821,11,0,
+        8699,8700,6,821,11,0,8700,1690,1,0,0,0,8701,8702,3,57,5,0,8702,8703,
+        3,57,5,0,8703,8704,4,822,97,0,8704,1692,1,0,0,0,8705,8706,7,70,0,
+        0,8706,8707,7,70,0,0,8707,8708,7,70,0,0,8708,8709,4,823,98,0,8709,
+        1694,1,0,0,0,8710,8711,5,32,0,0,8711,8712,5,32,0,0,8712,8713,5,32,
+        0,0,8713,8714,5,32,0,0,8714,8715,5,32,0,0,8715,8716,5,32,0,0,8716,
+        8717,5,32,0,0,8717,8718,5,32,0,0,8718,8719,5,32,0,0,8719,8720,5,
+        32,0,0,8720,8721,5,32,0,0,8721,8722,5,32,0,0,8722,8723,5,32,0,0,
+        8723,8724,5,32,0,0,8724,8725,5,32,0,0,8725,8726,5,32,0,0,8726,8727,
+        5,32,0,0,8727,8728,5,32,0,0,8728,8729,5,32,0,0,8729,8730,5,32,0,
+        0,8730,8731,5,32,0,0,8731,8732,5,32,0,0,8732,8733,5,32,0,0,8733,
+        8734,5,32,0,0,8734,8735,5,32,0,0,8735,8736,5,32,0,0,8736,8737,5,
+        32,0,0,8737,8738,5,32,0,0,8738,8739,5,32,0,0,8739,8740,1,0,0,0,8740,
+        8741,4,824,99,0,8741,1696,1,0,0,0,8742,8743,3,2443,1198,0,8743,8744,
+        1,0,0,0,8744,8745,6,825,3,0,8745,1698,1,0,0,0,8746,8747,7,12,0,0,
+        8747,8751,4,826,100,0,8748,8750,7,12,0,0,8749,8748,1,0,0,0,8750,
+        8753,1,0,0,0,8751,8749,1,0,0,0,8751,8752,1,0,0,0,8752,8754,1,0,0,
+        0,8753,8751,1,0,0,0,8754,8755,6,826,171,0,8755,8756,6,826,2,0,8756,
+        1700,1,0,0,0,8757,8758,3,99,26,0,8758,8759,1,0,0,0,8759,8760,6,827,
+        19,0,8760,8761,6,827,5,0,8761,1702,1,0,0,0,8762,8763,3,57,5,0,8763,
+        8764,3,57,5,0,8764,8765,4,828,101,0,8765,8766,1,0,0,0,8766,8767,
+        6,828,172,0,8767,1704,1,0,0,0,8768,8769,5,32,0,0,8769,8770,5,32,
+        0,0,8770,8771,5,32,0,0,8771,8772,5,32,0,0,8772,8773,5,32,0,0,8773,
+        8774,5,32,0,0,8774,8775,5,32,0,0,8775,8776,5,32,0,0,8776,8777,5,
+        32,0,0,8777,8778,5,32,0,0,8778,8779,5,32,0,0,8779,8780,5,32,0,0,
+        8780,8781,5,32,0,0,8781,8782,5,32,0,0,8782,8783,5,32,0,0,8783,8784,
+        5,32,0,0,8784,8785,5,32,0,0,8785,8786,5,32,0,0,8786,8787,5,32,0,
+        0,8787,8788,5,32,0,0,8788,8789,5,32,0,0,8789,8790,5,32,0,0,8790,
+        8791,5,32,0,0,8791,8792,5,32,0,0,8792,8793,5,32,0,0,8793,8794,5,
+        32,0,0,8794,8795,5,32,0,0,8795,8796,5,32,0,0,8796,8797,5,32,0,0,
+        8797,8798,5,32,0,0,8798,8799,5,32,0,0,8799,8800,5,32,0,0,8800,8801,
+        5,32,0,0,8801,8802,5,32,0,0,8802,8803,5,32,0,0,8803,8804,5,32,0,
+        0,8804,8805,5,32,0,0,8805,8806,5,32,0,0,8806,8807,5,32,0,0,8807,
+        8808,5,32,0,0,8808,8809,5,32,0,0,8809,8810,1,0,0,0,8810,8811,4,829,
+        102,0,8811,8812,1,0,0,0,8812,8813,6,829,173,0,8813,8814,6,829,5,
+        0,8814,1706,1,0,0,0,8815,8816,3,57,5,0,8816,8817,3,57,5,0,8817,8818,
+        8,0,0,0,8818,8819,8,0,0,0,8819,8820,8,0,0,0,8820,8821,8,0,0,0,8821,
+        8822,4,830,103,0,8822,1708,1,0,0,0,8823,8824,7,66,0,0,8824,8825,
+        4,831,104,0,8825,1710,1,0,0,0,8826,8827,7,77,0,0,8827,8828,4,832,
+        105,0,8828,1712,1,0,0,0,8829,8830,7,2,0,0,8830,8831,4,833,106,0,
+        8831,8832,1,0,0,0,8832,8833,6,833,2,0,8833,1714,1,0,0,0,8834,8835,
+        3,57,5,0,8835,8836,4,834,107,0,8836,1716,1,0,0,0,8837,8838,7,66,
+        0,0,8838,8839,4,835,108,0,8839,8840,1,0,0,0,8840,8841,6,835,165,
+        0,8841,1718,1,0,0,0,8842,8843,1,0,0,0,8843,8844,1,0,0,0,8844,8845,
+        6,836,5,0,8845,1720,1,0,0,0,8846,8847,3,695,324,0,8847,8848,4,837,
+        109,0,8848,8849,1,0,0,0,8849,8850,6,837,174,0,8850,1722,1,0,0,0,
+        8851,8852,3,697,325,0,8852,8853,4,838,110,0,8853,8854,1,0,0,0,8854,
+        8855,6,838,175,0,8855,1724,1,0,0,0,8856,8857,3,703,328,0,8857,8858,
+        4,839,111,0,8858,8859,1,0,0,0,8859,8860,6,839,176,0,8860,1726,1,
+        0,0,0,8861,8862,3,707,330,0,8862,8863,4,840,112,0,8863,8864,1,0,
+        0,0,8864,8865,6,840,177,0,8865,1728,1,0,0,0,8866,8867,3,709,331,
+        0,8867,8868,4,841,113,0,8868,8869,1,0,0,0,8869,8870,6,841,178,0,
+        8870,1730,1,0,0,0,8871,8872,3,711,332,0,8872,8873,4,842,114,0,8873,
+        8874,1,0,0,0,8874,8875,6,842,179,0,8875,1732,1,0,0,0,8876,8877,3,
+        713,333,0,8877,8878,4,843,115,0,8878,8879,1,0,0,0,8879,8880,6,843,
+        180,0,8880,1734,1,0,0,0,8881,8882,3,715,334,0,8882,8883,4,844,116,
+        0,8883,8884,1,0,0,0,8884,8885,6,844,181,0,8885,1736,1,0,0,0,8886,
+        8887,3,719,336,0,8887,8888,4,845,117,0,8888,8889,1,0,0,0,8889,8890,
+        6,845,182,0,8890,1738,1,0,0,0,8891,8892,3,721,337,0,8892,8893,4,
+        846,118,0,8893,8894,1,0,0,0,8894,8895,6,846,183,0,8895,1740,1,0,
+        0,0,8896,8897,3,723,338,0,8897,8898,4,847,119,0,8898,8899,1,0,0,
+        0,8899,8900,6,847,184,0,8900,1742,1,0,0,0,8901,8902,3,725,339,0,
+        8902,8903,4,848,120,0,8903,8904,1,0,0,0,8904,8905,6,848,185,0,8905,
+        1744,1,0,0,0,8906,8907,3,727,340,0,8907,8908,4,849,121,0,8908,8909,
+        1,0,0,0,8909,8910,6,849,186,0,8910,1746,1,0,0,0,8911,8912,3,729,
+        341,0,8912,8913,4,850,122,0,8913,8914,1,0,0,0,8914,8915,6,850,187,
+        0,8915,1748,1,0,0,0,8916,8917,3,731,342,0,8917,8918,4,851,123,0,
+        8918,8919,1,0,0,0,8919,8920,6,851,144,0,8920,1750,1,0,0,0,8921,8922,
+        3,733,343,0,8922,8923,4,852,124,0,8923,8924,1,0,0,0,8924,8925,6,
+        852,140,0,8925,1752,1,0,0,0,8926,8927,3,737,345,0,8927,8928,4,853,
+        125,0,8928,8929,1,0,0,0,8929,8930,6,853,188,0,8930,1754,1,0,0,0,
+        8931,8932,3,739,346,0,8932,8933,4,854,126,0,8933,8934,1,0,0,0,8934,
+        8935,6,854,189,0,8935,1756,1,0,0,0,8936,8937,3,743,348,0,8937,8938,
+        4,855,127,0,8938,8939,1,0,0,0,8939,8940,6,855,190,0,8940,1758,1,
+        0,0,0,8941,8942,3,745,349,0,8942,8943,4,856,128,0,8943,8944,1,0,
+        0,0,8944,8945,6,856,191,0,8945,1760,1,0,0,0,8946,8947,3,747,350,
+        0,8947,8948,4,857,129,0,8948,8949,1,0,0,0,8949,8950,6,857,192,0,
+        8950,1762,1,0,0,0,8951,8952,3,749,351,0,8952,8953,4,858,130,0,8953,
+        8954,1,0,0,0,8954,8955,6,858,193,0,8955,1764,1,0,0,0,8956,8957,3,
+        751,352,0,8957,8958,4,859,131,0,8958,8959,1,0,0,0,8959,8960,6,859,
+        136,0,8960,1766,1,0,0,0,8961,8962,3,753,353,0,8962,8963,4,860,132,
+        0,8963,8964,1,0,0,0,8964,8965,6,860,137,0,8965,1768,1,0,0,0,8966,
+        8967,3,755,354,0,8967,8968,4,861,133,0,8968,8969,1,0,0,0,8969,8970,
+        6,861,138,0,8970,1770,1,0,0,0,8971,8972,3,757,355,0,8972,8973,4,
+        862,134,0,8973,8974,1,0,0,0,8974,8975,6,862,139,0,8975,1772,1,0,
+        0,0,8976,8977,3,759,356,0,8977,8978,4,863,135,0,8978,8979,1,0,0,
+        0,8979,8980,6,863,146,0,8980,1774,1,0,0,0,8981,8982,3,761,357,0,
+        8982,8983,4,864,136,0,8983,8984,1,0,0,0,8984,8985,6,864,194,0,8985,
+        1776,1,0,0,0,8986,8987,3,763,358,0,8987,8988,4,865,137,0,8988,8989,
+        1,0,0,0,8989,8990,6,865,195,0,8990,1778,1,0,0,0,8991,8992,3,765,
+        359,0,8992,8993,4,866,138,0,8993,8994,1,0,0,0,8994,8995,6,866,196,
+        0,8995,1780,1,0,0,0,8996,8997,3,767,360,0,8997,8998,4,867,139,0,
+        8998,8999,1,0,0,0,8999,9000,6,867,197,0,9000,1782,1,0,0,0,9001,9002,
+        3,769,361,0,9002,9003,4,868,140,0,9003,9004,1,0,0,0,9004,9005,6,
+        868,198,0,9005,1784,1,0,0,0,9006,9007,3,771,362,0,9007,9008,4,869,
+        141,0,9008,9009,1,0,0,0,9009,9010,6,869,199,0,9010,1786,1,0,0,0,
+        9011,9012,3,773,363,0,9012,9013,4,870,142,0,9013,9014,1,0,0,0,9014,
+        9015,6,870,200,0,9015,1788,1,0,0,0,9016,9017,3,775,364,0,9017,9018,
+        4,871,143,0,9018,9019,1,0,0,0,9019,9020,6,871,141,0,9020,1790,1,
+        0,0,0,9021,9022,3,777,365,0,9022,9023,4,872,144,0,9023,9024,1,0,
+        0,0,9024,9025,6,872,201,0,9025,1792,1,0,0,0,9026,9027,3,779,366,
+        0,9027,9028,4,873,145,0,9028,9029,1,0,0,0,9029,9030,6,873,202,0,
+        9030,1794,1,0,0,0,9031,9032,3,781,367,0,9032,9033,4,874,146,0,9033,
+        9034,1,0,0,0,9034,9035,6,874,203,0,9035,1796,1,0,0,0,9036,9037,3,
+        783,368,0,9037,9038,4,875,147,0,9038,9039,1,0,0,0,9039,9040,6,875,
+        204,0,9040,1798,1,0,0,0,9041,9042,3,789,371,0,9042,9043,4,876,148,
+        0,9043,9044,1,0,0,0,9044,9045,6,876,205,0,9045,1800,1,0,0,0,9046,
+        9047,3,791,372,0,9047,9048,4,877,149,0,9048,9049,1,0,0,0,9049,9050,
+        6,877,206,0,9050,1802,1,0,0,0,9051,9052,3,793,373,0,9052,9053,4,
+        878,150,0,9053,9054,1,0,0,0,9054,9055,6,878,207,0,9055,1804,1,0,
+        0,0,9056,9057,3,795,374,0,9057,9058,4,879,151,0,9058,9059,1,0,0,
+        0,9059,9060,6,879,208,0,9060,1806,1,0,0,0,9061,9062,3,797,375,0,
+        9062,9063,4,880,152,0,9063,9064,1,0,0,0,9064,9065,6,880,209,0,9065,
+        1808,1,0,0,0,9066,9067,3,799,376,0,9067,9068,4,881,153,0,9068,9069,
+        1,0,0,0,9069,9070,6,881,210,0,9070,1810,1,0,0,0,9071,9072,3,803,
+        378,0,9072,9073,4,882,154,0,9073,9074,1,0,0,0,9074,9075,6,882,145,
+        0,9075,1812,1,0,0,0,9076,9077,3,807,380,0,9077,9078,4,883,155,0,
+        9078,9079,1,0,0,0,9079,9080,6,883,211,0,9080,1814,1,0,0,0,9081,9082,
+        3,809,381,0,9082,9083,4,884,156,0,9083,9084,1,0,0,0,9084,9085,6,
+        884,212,0,9085,1816,1,0,0,0,9086,9087,3,811,382,0,9087,9088,4,885,
+        157,0,9088,9089,1,0,0,0,9089,9090,6,885,213,0,9090,1818,1,0,0,0,
+        9091,9092,3,813,383,0,9092,9093,4,886,158,0,9093,9094,1,0,0,0,9094,
+        9095,6,886,214,0,9095,1820,1,0,0,0,9096,9097,3,815,384,0,9097,9098,
+        4,887,159,0,9098,9099,1,0,0,0,9099,9100,6,887,215,0,9100,1822,1,
+        0,0,0,9101,9102,3,819,386,0,9102,9103,4,888,160,0,9103,9104,1,0,
+        0,0,9104,9105,6,888,216,0,9105,1824,1,0,0,0,9106,9107,3,821,387,
+        0,9107,9108,4,889,161,0,9108,9109,1,0,0,0,9109,9110,6,889,217,0,
+        9110,1826,1,0,0,0,9111,9112,3,823,388,0,9112,9113,4,890,162,0,9113,
+        9114,1,0,0,0,9114,9115,6,890,218,0,9115,1828,1,0,0,0,9116,9117,3,
+        825,389,0,9117,9118,4,891,163,0,9118,9119,1,0,0,0,9119,9120,6,891,
+        219,0,9120,1830,1,0,0,0,9121,9122,3,827,390,0,9122,9123,4,892,164,
+        0,9123,9124,1,0,0,0,9124,9125,6,892,220,0,9125,1832,1,0,0,0,9126,
+        9127,3,829,391,0,9127,9128,4,893,165,0,9128,9129,1,0,0,0,9129,9130,
+        6,893,147,0,9130,1834,1,0,0,0,9131,9132,3,831,392,0,9132,9133,4,
+        894,166,0,9133,9134,1,0,0,0,9134,9135,6,894,150,0,9135,1836,1,0,
+        0,0,9136,9137,3,833,393,0,9137,9138,4,895,167,0,9138,9139,1,0,0,
+        0,9139,9140,6,895,221,0,9140,1838,1,0,0,0,9141,9142,3,835,394,0,
+        9142,9143,4,896,168,0,9143,9144,1,0,0,0,9144,9145,6,896,222,0,9145,
+        1840,1,0,0,0,9146,9147,3,837,395,0,9147,9148,4,897,169,0,9148,9149,
+        1,0,0,0,9149,9150,6,897,223,0,9150,1842,1,0,0,0,9151,9152,3,839,
+        396,0,9152,9153,4,898,170,0,9153,9154,1,0,0,0,9154,9155,6,898,224,
+        0,9155,1844,1,0,0,0,9156,9157,3,841,397,0,9157,9158,4,899,171,0,
+        9158,9159,1,0,0,0,9159,9160,6,899,225,0,9160,1846,1,0,0,0,9161,9162,
+        3,843,398,0,9162,9163,4,900,172,0,9163,9164,1,0,0,0,9164,9165,6,
+        900,151,0,9165,1848,1,0,0,0,9166,9167,3,845,399,0,9167,9168,4,901,
+        173,0,9168,9169,1,0,0,0,9169,9170,6,901,226,0,9170,1850,1,0,0,0,
+        9171,9172,3,847,400,0,9172,9173,4,902,174,0,9173,9174,1,0,0,0,9174,
+        9175,6,902,142,0,9175,1852,1,0,0,0,9176,9177,3,849,401,0,9177,9178,
+        4,903,175,0,9178,9179,1,0,0,0,9179,9180,6,903,227,0,9180,1854,1,
+        0,0,0,9181,9182,3,851,402,0,9182,9183,4,904,176,0,9183,9184,1,0,
+        0,0,9184,9185,6,904,228,0,9185,1856,1,0,0,0,9186,9187,3,1219,586,
+        0,9187,9188,4,905,177,0,9188,9189,1,0,0,0,9189,9190,6,905,229,0,
+        9190,1858,1,0,0,0,9191,9192,3,1225,589,0,9192,9193,4,906,178,0,9193,
+        9194,1,0,0,0,9194,9195,6,906,230,0,9195,1860,1,0,0,0,9196,9197,3,
+        1221,587,0,9197,9198,4,907,179,0,9198,9199,1,0,0,0,9199,9200,6,907,
+        231,0,9200,1862,1,0,0,0,9201,9202,3,1223,588,0,9202,9203,4,908,180,
+        0,9203,9204,1,0,0,0,9204,9205,6,908,232,0,9205,1864,1,0,0,0,9206,
+        9207,3,1229,591,0,9207,9208,4,909,181,0,9208,9209,1,0,0,0,9209,9210,
+        6,909,233,0,9210,1866,1,0,0,0,9211,9212,3,1231,592,0,9212,9213,4,
+        910,182,0,9213,9214,1,0,0,0,9214,9215,6,910,234,0,9215,1868,1,0,
+        0,0,9216,9217,3,1227,590,0,9217,9218,4,911,183,0,9218,9219,1,0,0,
+        0,9219,9220,6,911,235,0,9220,1870,1,0,0,0,9221,9222,3,1233,593,0,
+        9222,9223,4,912,184,0,9223,9224,1,0,0,0,9224,9225,6,912,236,0,9225,
+        1872,1,0,0,0,9226,9227,3,1235,594,0,9227,9228,4,913,185,0,9228,9229,
+        1,0,0,0,9229,9230,6,913,237,0,9230,1874,1,0,0,0,9231,9232,3,1237,
+        595,0,9232,9233,4,914,186,0,9233,9234,1,0,0,0,9234,9235,6,914,238,
+        0,9235,1876,1,0,0,0,9236,9237,3,1241,597,0,9237,9238,4,915,187,0,
+        9238,9239,1,0,0,0,9239,9240,6,915,239,0,9240,1878,1,0,0,0,9241,9242,
+        3,1245,599,0,9242,9243,4,916,188,0,9243,9244,1,0,0,0,9244,9245,6,
+        916,240,0,9245,1880,1,0,0,0,9246,9247,3,1243,598,0,9247,9248,4,917,
+        189,0,9248,9249,1,0,0,0,9249,9250,6,917,241,0,9250,1882,1,0,0,0,
+        9251,9252,3,695,324,0,9252,9253,4,918,190,0,9253,9254,1,0,0,0,9254,
+        9255,6,918,174,0,9255,1884,1,0,0,0,9256,9257,3,697,325,0,9257,9258,
+        4,919,191,0,9258,9259,1,0,0,0,9259,9260,6,919,175,0,9260,1886,1,
+        0,0,0,9261,9262,3,703,328,0,9262,9263,4,920,192,0,9263,9264,1,0,
+        0,0,9264,9265,6,920,176,0,9265,1888,1,0,0,0,9266,9267,3,707,330,
+        0,9267,9268,4,921,193,0,9268,9269,1,0,0,0,9269,9270,6,921,177,0,
+        9270,1890,1,0,0,0,9271,9272,3,709,331,0,9272,9273,4,922,194,0,9273,
+        9274,1,0,0,0,9274,9275,6,922,178,0,9275,1892,1,0,0,0,9276,9277,3,
+        711,332,0,9277,9278,4,923,195,0,9278,9279,1,0,0,0,9279,9280,6,923,
+        179,0,9280,1894,1,0,0,0,9281,9282,3,713,333,0,9282,9283,4,924,196,
+        0,9283,9284,1,0,0,0,9284,9285,6,924,180,0,9285,1896,1,0,0,0,9286,
+        9287,3,715,334,0,9287,9288,4,925,197,0,9288,9289,1,0,0,0,9289,9290,
+        6,925,181,0,9290,1898,1,0,0,0,9291,9292,3,719,336,0,9292,9293,4,
+        926,198,0,9293,9294,1,0,0,0,9294,9295,6,926,182,0,9295,1900,1,0,
+        0,0,9296,9297,3,721,337,0,9297,9298,4,927,199,0,9298,9299,1,0,0,
+        0,9299,9300,6,927,183,0,9300,1902,1,0,0,0,9301,9302,3,723,338,0,
+        9302,9303,4,928,200,0,9303,9304,1,0,0,0,9304,9305,6,928,184,0,9305,
+        1904,1,0,0,0,9306,9307,3,725,339,0,9307,9308,4,929,201,0,9308,9309,
+        1,0,0,0,9309,9310,6,929,185,0,9310,1906,1,0,0,0,9311,9312,3,727,
+        340,0,9312,9313,4,930,202,0,9313,9314,1,0,0,0,9314,9315,6,930,186,
+        0,9315,1908,1,0,0,0,9316,9317,3,729,341,0,9317,9318,4,931,203,0,
+        9318,9319,1,0,0,0,9319,9320,6,931,187,0,9320,1910,1,0,0,0,9321,9322,
+        3,731,342,0,9322,9323,4,932,204,0,9323,9324,1,0,0,0,9324,9325,6,
+        932,144,0,9325,1912,1,0,0,0,9326,9327,3,733,343,0,9327,9328,4,933,
+        205,0,9328,9329,1,0,0,0,9329,9330,6,933,140,0,9330,1914,1,0,0,0,
+        9331,9332,3,737,345,0,9332,9333,4,934,206,0,9333,9334,1,0,0,0,9334,
+        9335,6,934,188,0,9335,1916,1,0,0,0,9336,9337,3,739,346,0,9337,9338,
+        4,935,207,0,9338,9339,1,0,0,0,9339,9340,6,935,189,0,9340,1918,1,
+        0,0,0,9341,9342,3,743,348,0,9342,9343,4,936,208,0,9343,9344,1,0,
+        0,0,9344,9345,6,936,190,0,9345,1920,1,0,0,0,9346,9347,3,745,349,
+        0,9347,9348,4,937,209,0,9348,9349,1,0,0,0,9349,9350,6,937,191,0,
+        9350,1922,1,0,0,0,9351,9352,3,747,350,0,9352,9353,4,938,210,0,9353,
+        9354,1,0,0,0,9354,9355,6,938,192,0,9355,1924,1,0,0,0,9356,9357,3,
+        749,351,0,9357,9358,4,939,211,0,9358,9359,1,0,0,0,9359,9360,6,939,
+        193,0,9360,1926,1,0,0,0,9361,9362,3,751,352,0,9362,9363,4,940,212,
+        0,9363,9364,1,0,0,0,9364,9365,6,940,136,0,9365,1928,1,0,0,0,9366,
+        9367,3,753,353,0,9367,9368,4,941,213,0,9368,9369,1,0,0,0,9369,9370,
+        6,941,137,0,9370,1930,1,0,0,0,9371,9372,3,755,354,0,9372,9373,4,
+        942,214,0,9373,9374,1,0,0,0,9374,9375,6,942,138,0,9375,1932,1,0,
+        0,0,9376,9377,3,757,355,0,9377,9378,4,943,215,0,9378,9379,1,0,0,
+        0,9379,9380,6,943,139,0,9380,1934,1,0,0,0,9381,9382,3,759,356,0,
+        9382,9383,4,944,216,0,9383,9384,1,0,0,0,9384,9385,6,944,146,0,9385,
+        1936,1,0,0,0,9386,9387,3,761,357,0,9387,9388,4,945,217,0,9388,9389,
+        1,0,0,0,9389,9390,6,945,194,0,9390,1938,1,0,0,0,9391,9392,3,763,
+        358,0,9392,9393,4,946,218,0,9393,9394,1,0,0,0,9394,9395,6,946,195,
+        0,9395,1940,1,0,0,0,9396,9397,3,765,359,0,9397,9398,4,947,219,0,
+        9398,9399,1,0,0,0,9399,9400,6,947,196,0,9400,1942,1,0,0,0,9401,9402,
+        3,767,360,0,9402,9403,4,948,220,0,9403,9404,1,0,0,0,9404,9405,6,
+        948,197,0,9405,1944,1,0,0,0,9406,9407,3,769,361,0,9407,9408,4,949,
+        221,0,9408,9409,1,0,0,0,9409,9410,6,949,198,0,9410,1946,1,0,0,0,
+        9411,9412,3,771,362,0,9412,9413,4,950,222,0,9413,9414,1,0,0,0,9414,
+        9415,6,950,199,0,9415,1948,1,0,0,0,9416,9417,3,773,363,0,9417,9418,
+        4,951,223,0,9418,9419,1,0,0,0,9419,9420,6,951,200,0,9420,1950,1,
+        0,0,0,9421,9422,3,775,364,0,9422,9423,4,952,224,0,9423,9424,1,0,
+        0,0,9424,9425,6,952,141,0,9425,1952,1,0,0,0,9426,9427,3,777,365,
+        0,9427,9428,4,953,225,0,9428,9429,1,0,0,0,9429,9430,6,953,201,0,
+        9430,1954,1,0,0,0,9431,9432,3,779,366,0,9432,9433,4,954,226,0,9433,
+        9434,1,0,0,0,9434,9435,6,954,202,0,9435,1956,1,0,0,0,9436,9437,3,
+        781,367,0,9437,9438,4,955,227,0,9438,9439,1,0,0,0,9439,9440,6,955,
+        203,0,9440,1958,1,0,0,0,9441,9442,3,783,368,0,9442,9443,4,956,228,
+        0,9443,9444,1,0,0,0,9444,9445,6,956,204,0,9445,1960,1,0,0,0,9446,
+        9447,3,789,371,0,9447,9448,4,957,229,0,9448,9449,1,0,0,0,9449,9450,
+        6,957,205,0,9450,1962,1,0,0,0,9451,9452,3,791,372,0,9452,9453,4,
+        958,230,0,9453,9454,1,0,0,0,9454,9455,6,958,206,0,9455,1964,1,0,
+        0,0,9456,9457,3,793,373,0,9457,9458,4,959,231,0,9458,9459,1,0,0,
+        0,9459,9460,6,959,207,0,9460,1966,1,0,0,0,9461,9462,3,795,374,0,
+        9462,9463,4,960,232,0,9463,9464,1,0,0,0,9464,9465,6,960,208,0,9465,
+        1968,1,0,0,0,9466,9467,3,797,375,0,9467,9468,4,961,233,0,9468,9469,
+        1,0,0,0,9469,9470,6,961,209,0,9470,1970,1,0,0,0,9471,9472,3,799,
+        376,0,9472,9473,4,962,234,0,9473,9474,1,0,0,0,9474,9475,6,962,210,
+        0,9475,1972,1,0,0,0,9476,9477,3,803,378,0,9477,9478,4,963,235,0,
+        9478,9479,1,0,0,0,9479,9480,6,963,145,0,9480,1974,1,0,0,0,9481,9482,
+        3,807,380,0,9482,9483,4,964,236,0,9483,9484,1,0,0,0,9484,9485,6,
+        964,211,0,9485,1976,1,0,0,0,9486,9487,3,809,381,0,9487,9488,4,965,
+        237,0,9488,9489,1,0,0,0,9489,9490,6,965,212,0,9490,1978,1,0,0,0,
+        9491,9492,3,811,382,0,9492,9493,4,966,238,0,9493,9494,1,0,0,0,9494,
+        9495,6,966,213,0,9495,1980,1,0,0,0,9496,9497,3,813,383,0,9497,9498,
+        4,967,239,0,9498,9499,1,0,0,0,9499,9500,6,967,214,0,9500,1982,1,
+        0,0,0,9501,9502,3,815,384,0,9502,9503,4,968,240,0,9503,9504,1,0,
+        0,0,9504,9505,6,968,215,0,9505,1984,1,0,0,0,9506,9507,3,819,386,
+        0,9507,9508,4,969,241,0,9508,9509,1,0,0,0,9509,9510,6,969,216,0,
+        9510,1986,1,0,0,0,9511,9512,3,821,387,0,9512,9513,4,970,242,0,9513,
+        9514,1,0,0,0,9514,9515,6,970,217,0,9515,1988,1,0,0,0,9516,9517,3,
+        823,388,0,9517,9518,4,971,243,0,9518,9519,1,0,0,0,9519,9520,6,971,
+        218,0,9520,1990,1,0,0,0,9521,9522,3,825,389,0,9522,9523,4,972,244,
+        0,9523,9524,1,0,0,0,9524,9525,6,972,219,0,9525,1992,1,0,0,0,9526,
+        9527,3,827,390,0,9527,9528,4,973,245,0,9528,9529,1,0,0,0,9529,9530,
+        6,973,220,0,9530,1994,1,0,0,0,9531,9532,3,829,391,0,9532,9533,4,
+        974,246,0,9533,9534,1,0,0,0,9534,9535,6,974,147,0,9535,1996,1,0,
+        0,0,9536,9537,3,831,392,0,9537,9538,4,975,247,0,9538,9539,1,0,0,
+        0,9539,9540,6,975,150,0,9540,1998,1,0,0,0,9541,9542,3,833,393,0,
+        9542,9543,4,976,248,0,9543,9544,1,0,0,0,9544,9545,6,976,221,0,9545,
+        2000,1,0,0,0,9546,9547,3,835,394,0,9547,9548,4,977,249,0,9548,9549,
+        1,0,0,0,9549,9550,6,977,222,0,9550,2002,1,0,0,0,9551,9552,3,837,
+        395,0,9552,9553,4,978,250,0,9553,9554,1,0,0,0,9554,9555,6,978,223,
+        0,9555,2004,1,0,0,0,9556,9557,3,839,396,0,9557,9558,4,979,251,0,
+        9558,9559,1,0,0,0,9559,9560,6,979,224,0,9560,2006,1,0,0,0,9561,9562,
+        3,841,397,0,9562,9563,4,980,252,0,9563,9564,1,0,0,0,9564,9565,6,
+        980,225,0,9565,2008,1,0,0,0,9566,9567,3,843,398,0,9567,9568,4,981,
+        253,0,9568,9569,1,0,0,0,9569,9570,6,981,151,0,9570,2010,1,0,0,0,
+        9571,9572,3,845,399,0,9572,9573,4,982,254,0,9573,9574,1,0,0,0,9574,
+        9575,6,982,226,0,9575,2012,1,0,0,0,9576,9577,3,847,400,0,9577,9578,
+        4,983,255,0,9578,9579,1,0,0,0,9579,9580,6,983,142,0,9580,2014,1,
+        0,0,0,9581,9582,3,849,401,0,9582,9583,4,984,256,0,9583,9584,1,0,
+        0,0,9584,9585,6,984,227,0,9585,2016,1,0,0,0,9586,9587,3,851,402,
+        0,9587,9588,4,985,257,0,9588,9589,1,0,0,0,9589,9590,6,985,228,0,
+        9590,2018,1,0,0,0,9591,9592,3,1219,586,0,9592,9593,4,986,258,0,9593,
+        9594,1,0,0,0,9594,9595,6,986,229,0,9595,2020,1,0,0,0,9596,9597,3,
+        1225,589,0,9597,9598,4,987,259,0,9598,9599,1,0,0,0,9599,9600,6,987,
+        230,0,9600,2022,1,0,0,0,9601,9602,3,1221,587,0,9602,9603,4,988,260,
+        0,9603,9604,1,0,0,0,9604,9605,6,988,231,0,9605,2024,1,0,0,0,9606,
+        9607,3,1223,588,0,9607,9608,4,989,261,0,9608,9609,1,0,0,0,9609,9610,
+        6,989,232,0,9610,2026,1,0,0,0,9611,9612,3,1229,591,0,9612,9613,4,
+        990,262,0,9613,9614,1,0,0,0,9614,9615,6,990,233,0,9615,2028,1,0,
+        0,0,9616,9617,3,1231,592,0,9617,9618,4,991,263,0,9618,9619,1,0,0,
+        0,9619,9620,6,991,234,0,9620,2030,1,0,0,0,9621,9622,3,1227,590,0,
+        9622,9623,4,992,264,0,9623,9624,1,0,0,0,9624,9625,6,992,235,0,9625,
+        2032,1,0,0,0,9626,9627,3,1233,593,0,9627,9628,4,993,265,0,9628,9629,
+        1,0,0,0,9629,9630,6,993,236,0,9630,2034,1,0,0,0,9631,9632,3,1235,
+        594,0,9632,9633,4,994,266,0,9633,9634,1,0,0,0,9634,9635,6,994,237,
+        0,9635,2036,1,0,0,0,9636,9637,3,1237,595,0,9637,9638,4,995,267,0,
+        9638,9639,1,0,0,0,9639,9640,6,995,238,0,9640,2038,1,0,0,0,9641,9642,
+        3,1241,597,0,9642,9643,4,996,268,0,9643,9644,1,0,0,0,9644,9645,6,
+        996,239,0,9645,2040,1,0,0,0,9646,9647,3,1245,599,0,9647,9648,4,997,
+        269,0,9648,9649,1,0,0,0,9649,9650,6,997,240,0,9650,2042,1,0,0,0,
+        9651,9652,3,1243,598,0,9652,9653,4,998,270,0,9653,9654,1,0,0,0,9654,
+        9655,6,998,241,0,9655,2044,1,0,0,0,9656,9657,3,1219,586,0,9657,9658,
+        4,999,271,0,9658,9659,1,0,0,0,9659,9660,6,999,229,0,9660,2046,1,
+        0,0,0,9661,9662,3,1225,589,0,9662,9663,4,1000,272,0,9663,9664,1,
+        0,0,0,9664,9665,6,1000,230,0,9665,2048,1,0,0,0,9666,9667,3,1221,
+        587,0,9667,9668,4,1001,273,0,9668,9669,1,0,0,0,9669,9670,6,1001,
+        231,0,9670,2050,1,0,0,0,9671,9672,3,1223,588,0,9672,9673,4,1002,
+        274,0,9673,9674,1,0,0,0,9674,9675,6,1002,232,0,9675,2052,1,0,0,0,
+        9676,9677,3,1229,591,0,9677,9678,4,1003,275,0,9678,9679,1,0,0,0,
+        9679,9680,6,1003,233,0,9680,2054,1,0,0,0,9681,9682,3,1231,592,0,
+        9682,9683,4,1004,276,0,9683,9684,1,0,0,0,9684,9685,6,1004,234,0,
+        9685,2056,1,0,0,0,9686,9687,3,1227,590,0,9687,9688,4,1005,277,0,
+        9688,9689,1,0,0,0,9689,9690,6,1005,235,0,9690,2058,1,0,0,0,9691,
+        9692,3,1233,593,0,9692,9693,4,1006,278,0,9693,9694,1,0,0,0,9694,
+        9695,6,1006,236,0,9695,2060,1,0,0,0,9696,9697,3,1235,594,0,9697,
+        9698,4,1007,279,0,9698,9699,1,0,0,0,9699,9700,6,1007,237,0,9700,
+        2062,1,0,0,0,9701,9702,3,1237,595,0,9702,9703,4,1008,280,0,9703,
+        9704,1,0,0,0,9704,9705,6,1008,238,0,9705,2064,1,0,0,0,9706,9707,
+        3,1241,597,0,9707,9708,4,1009,281,0,9708,9709,1,0,0,0,9709,9710,
+        6,1009,239,0,9710,2066,1,0,0,0,9711,9712,3,1245,599,0,9712,9713,
+        4,1010,282,0,9713,9714,1,0,0,0,9714,9715,6,1010,240,0,9715,2068,
+        1,0,0,0,9716,9717,3,1243,598,0,9717,9718,4,1011,283,0,9718,9719,
+        1,0,0,0,9719,9720,6,1011,241,0,9720,2070,1,0,0,0,9721,9722,3,1239,
+        596,0,9722,9723,4,1012,284,0,9723,9724,1,0,0,0,9724,9725,6,1012,
+        242,0,9725,2072,1,0,0,0,9726,9727,5,32,0,0,9727,9728,5,32,0,0,9728,
+        9729,5,32,0,0,9729,9730,5,32,0,0,9730,9731,5,32,0,0,9731,9732,5,
+        32,0,0,9732,9733,5,32,0,0,9733,9734,5,32,0,0,9734,9735,5,32,0,0,
+        9735,9736,5,32,0,0,9736,9737,5,32,0,0,9737,9738,5,32,0,0,9738,9739,
+        5,32,0,0,9739,9740,5,32,0,0,9740,9741,1,0,0,0,9741,9742,4,1013,285,
+        0,9742,2074,1,0,0,0,9743,9744,5,32,0,0,9744,9745,5,32,0,0,9745,9746,
+        5,32,0,0,9746,9747,5,32,0,0,9747,9748,5,32,0,0,9748,9749,5,32,0,
+        0,9749,9750,5,32,0,0,9750,9751,5,32,0,0,9751,9752,5,32,0,0,9752,
+        9753,5,32,0,0,9753,9754,5,32,0,0,9754,9755,5,32,0,0,9755,9756,5,
+        32,0,0,9756,9757,5,32,0,0,9757,9758,1,0,0,0,9758,9762,4,1014,286,
+        0,9759,9761,7,2,0,0,9760,9759,1,0,0,0,9761,9764,1,0,0,0,9762,9760,
+        1,0,0,0,9762,9763,1,0,0,0,9763,9765,1,0,0,0,9764,9762,1,0,0,0,9765,
+        9766,3,99,26,0,9766,9767,1,0,0,0,9767,9768,6,1014,19,0,9768,9769,
+        6,1014,5,0,9769,2076,1,0,0,0,9770,9771,5,32,0,0,9771,9773,4,1015,
+        287,0,9772,9770,1,0,0,0,9773,9774,1,0,0,0,9774,9772,1,0,0,0,9774,
+        9775,1,0,0,0,9775,9776,1,0,0,0,9776,9777,6,1015,2,0,9777,2078,1,
+        0,0,0,9778,9779,5,32,0,0,9779,9781,4,1016,288,0,9780,9778,1,0,0,
+        0,9781,9782,1,0,0,0,9782,9780,1,0,0,0,9782,9783,1,0,0,0,9783,9784,
+        1,0,0,0,9784,9785,6,1016,2,0,9785,2080,1,0,0,0,9786,9787,7,37,0,
+        0,9787,9788,7,25,0,0,9788,9789,4,1017,289,0,9789,9790,1,0,0,0,9790,
+        9791,6,1017,243,0,9791,9792,6,1017,244,0,9792,2082,1,0,0,0,9793,
+        9794,7,5,0,0,9794,9795,7,25,0,0,9795,9796,4,1018,290,0,9796,9797,
+        1,0,0,0,9797,9798,6,1018,245,0,9798,9799,6,1018,244,0,9799,2084,
+        1,0,0,0,9800,9801,7,16,0,0,9801,9802,7,25,0,0,9802,9803,4,1019,291,
+        0,9803,9804,1,0,0,0,9804,9805,6,1019,246,0,9805,9806,6,1019,244,
+        0,9806,2086,1,0,0,0,9807,9808,7,32,0,0,9808,9809,7,25,0,0,9809,9810,
+        4,1020,292,0,9810,9811,1,0,0,0,9811,9812,6,1020,247,0,9812,9813,
+        6,1020,244,0,9813,2088,1,0,0,0,9814,9815,7,22,0,0,9815,9816,7,25,
+        0,0,9816,9817,4,1021,293,0,9817,9818,1,0,0,0,9818,9819,6,1021,248,
+        0,9819,9820,6,1021,244,0,9820,2090,1,0,0,0,9821,9822,7,25,0,0,9822,
+        9823,4,1022,294,0,9823,9824,1,0,0,0,9824,9825,6,1022,29,0,9825,9826,
+        6,1022,244,0,9826,2092,1,0,0,0,9827,9828,8,78,0,0,9828,9830,4,1023,
+        295,0,9829,9827,1,0,0,0,9830,9831,1,0,0,0,9831,9829,1,0,0,0,9831,
+        9832,1,0,0,0,9832,2094,1,0,0,0,9833,9834,8,78,0,0,9834,9836,4,1024,
+        296,0,9835,9833,1,0,0,0,9836,9837,1,0,0,0,9837,9835,1,0,0,0,9837,
+        9838,1,0,0,0,9838,9839,1,0,0,0,9839,9840,6,1024,249,0,9840,2096,
+        1,0,0,0,9841,9842,7,79,0,0,9842,9843,4,1025,297,0,9843,9844,1,0,
+        0,0,9844,9845,6,1025,250,0,9845,2098,1,0,0,0,9846,9847,5,32,0,0,
+        9847,9848,5,32,0,0,9848,9849,5,32,0,0,9849,9850,5,32,0,0,9850,9851,
+        5,32,0,0,9851,9852,5,32,0,0,9852,9853,5,32,0,0,9853,9854,5,32,0,
+        0,9854,9855,5,32,0,0,9855,9856,5,32,0,0,9856,9857,1,0,0,0,9857,9858,
+        4,1026,298,0,9858,2100,1,0,0,0,9859,9860,7,2,0,0,9860,9862,4,1027,
+        299,0,9861,9859,1,0,0,0,9862,9863,1,0,0,0,9863,9861,1,0,0,0,9863,
+        9864,1,0,0,0,9864,9865,1,0,0,0,9865,9866,6,1027,2,0,9866,2102,1,
+        0,0,0,9867,9868,3,201,77,0,9868,9869,4,1028,300,0,9869,9870,1,0,
+        0,0,9870,9871,6,1028,251,0,9871,2104,1,0,0,0,9872,9873,3,1289,621,
+        0,9873,9874,4,1029,301,0,9874,9875,1,0,0,0,9875,9876,6,1029,252,
+        0,9876,2106,1,0,0,0,9877,9878,3,1291,622,0,9878,9879,4,1030,302,
+        0,9879,9880,1,0,0,0,9880,9881,6,1030,253,0,9881,2108,1,0,0,0,9882,
+        9883,3,1293,623,0,9883,9884,4,1031,303,0,9884,9885,1,0,0,0,9885,
+        9886,6,1031,254,0,9886,2110,1,0,0,0,9887,9888,3,1297,625,0,9888,
+        9889,4,1032,304,0,9889,9890,1,0,0,0,9890,9891,6,1032,255,0,9891,
+        2112,1,0,0,0,9892,9893,3,1299,626,0,9893,9894,4,1033,305,0,9894,
+        9895,1,0,0,0,9895,9896,6,1033,256,0,9896,2114,1,0,0,0,9897,9898,
+        3,1301,627,0,9898,9899,4,1034,306,0,9899,9900,1,0,0,0,9900,9901,
+        6,1034,257,0,9901,2116,1,0,0,0,9902,9903,3,1303,628,0,9903,9904,
+        4,1035,307,0,9904,9905,1,0,0,0,9905,9906,6,1035,258,0,9906,2118,
+        1,0,0,0,9907,9908,3,1305,629,0,9908,9909,4,1036,308,0,9909,9910,
+        1,0,0,0,9910,9911,6,1036,259,0,9911,2120,1,0,0,0,9912,9913,3,1307,
+        630,0,9913,9914,4,1037,309,0,9914,9915,1,0,0,0,9915,9916,6,1037,
+        260,0,9916,2122,1,0,0,0,9917,9918,3,1295,624,0,9918,9919,4,1038,
+        310,0,9919,9920,1,0,0,0,9920,9921,6,1038,261,0,9921,2124,1,0,0,0,
+        9922,9923,3,203,78,0,9923,9924,4,1039,311,0,9924,9925,1,0,0,0,9925,
+        9926,6,1039,262,0,9926,2126,1,0,0,0,9927,9928,3,1309,631,0,9928,
+        9929,4,1040,312,0,9929,9930,1,0,0,0,9930,9931,6,1040,263,0,9931,
+        2128,1,0,0,0,9932,9933,3,1311,632,0,9933,9934,4,1041,313,0,9934,
+        9935,1,0,0,0,9935,9936,6,1041,264,0,9936,2130,1,0,0,0,9937,9938,
+        3,1313,633,0,9938,9939,4,1042,314,0,9939,9940,1,0,0,0,9940,9941,
+        6,1042,265,0,9941,2132,1,0,0,0,9942,9943,3,1315,634,0,9943,9944,
+        4,1043,315,0,9944,9945,1,0,0,0,9945,9946,6,1043,266,0,9946,2134,
+        1,0,0,0,9947,9948,3,1317,635,0,9948,9949,4,1044,316,0,9949,9950,
+        1,0,0,0,9950,9951,6,1044,267,0,9951,2136,1,0,0,0,9952,9953,3,1319,
+        636,0,9953,9954,4,1045,317,0,9954,9955,1,0,0,0,9955,9956,6,1045,
+        268,0,9956,2138,1,0,0,0,9957,9958,3,1321,637,0,9958,9959,4,1046,
+        318,0,9959,9960,1,0,0,0,9960,9961,6,1046,269,0,9961,2140,1,0,0,0,
+        9962,9963,3,1323,638,0,9963,9964,4,1047,319,0,9964,9965,1,0,0,0,
+        9965,9966,6,1047,270,0,9966,2142,1,0,0,0,9967,9968,3,1325,639,0,
+        9968,9969,4,1048,320,0,9969,9970,1,0,0,0,9970,9971,6,1048,271,0,
+        9971,2144,1,0,0,0,9972,9973,3,1327,640,0,9973,9974,4,1049,321,0,
+        9974,9975,1,0,0,0,9975,9976,6,1049,272,0,9976,2146,1,0,0,0,9977,
+        9978,3,1329,641,0,9978,9979,4,1050,322,0,9979,9980,1,0,0,0,9980,
+        9981,6,1050,273,0,9981,2148,1,0,0,0,9982,9983,3,205,79,0,9983,9984,
+        4,1051,323,0,9984,9985,1,0,0,0,9985,9986,6,1051,274,0,9986,9987,
+        6,1051,165,0,9987,9988,6,1051,275,0,9988,2150,1,0,0,0,9989,9990,
+        3,1331,642,0,9990,9991,4,1052,324,0,9991,9992,1,0,0,0,9992,9993,
+        6,1052,276,0,9993,2152,1,0,0,0,9994,9995,3,1333,643,0,9995,9996,
+        4,1053,325,0,9996,9997,1,0,0,0,9997,9998,6,1053,277,0,9998,2154,
+        1,0,0,0,9999,10000,3,1335,644,0,10000,10001,4,1054,326,0,10001,10002,
+        1,0,0,0,10002,10003,6,1054,278,0,10003,2156,1,0,0,0,10004,10005,
+        3,1337,645,0,10005,10006,4,1055,327,0,10006,10007,1,0,0,0,10007,
+        10008,6,1055,279,0,10008,2158,1,0,0,0,10009,10010,3,1339,646,0,10010,
+        10011,4,1056,328,0,10011,10012,1,0,0,0,10012,10013,6,1056,280,0,
+        10013,2160,1,0,0,0,10014,10015,3,1341,647,0,10015,10016,4,1057,329,
+        0,10016,10017,1,0,0,0,10017,10018,6,1057,281,0,10018,2162,1,0,0,
+        0,10019,10020,3,1343,648,0,10020,10021,4,1058,330,0,10021,10022,
+        1,0,0,0,10022,10023,6,1058,282,0,10023,2164,1,0,0,0,10024,10025,
+        3,1345,649,0,10025,10026,4,1059,331,0,10026,10027,1,0,0,0,10027,
+        10028,6,1059,283,0,10028,2166,1,0,0,0,10029,10030,3,207,80,0,10030,
+        10031,4,1060,332,0,10031,10032,1,0,0,0,10032,10033,6,1060,284,0,
+        10033,2168,1,0,0,0,10034,10035,3,1347,650,0,10035,10036,4,1061,333,
+        0,10036,10037,1,0,0,0,10037,10038,6,1061,285,0,10038,2170,1,0,0,
+        0,10039,10040,3,1349,651,0,10040,10041,4,1062,334,0,10041,10042,
+        1,0,0,0,10042,10043,6,1062,286,0,10043,2172,1,0,0,0,10044,10045,
+        3,209,81,0,10045,10046,4,1063,335,0,10046,10047,1,0,0,0,10047,10048,
+        6,1063,287,0,10048,2174,1,0,0,0,10049,10050,3,211,82,0,10050,10051,
+        4,1064,336,0,10051,10052,1,0,0,0,10052,10053,6,1064,288,0,10053,
+        2176,1,0,0,0,10054,10055,3,213,83,0,10055,10056,4,1065,337,0,10056,
+        10057,1,0,0,0,10057,10058,6,1065,289,0,10058,2178,1,0,0,0,10059,
+        10060,3,1351,652,0,10060,10061,4,1066,338,0,10061,10062,1,0,0,0,
+        10062,10063,6,1066,290,0,10063,2180,1,0,0,0,10064,10065,3,215,84,
+        0,10065,10066,4,1067,339,0,10066,10067,1,0,0,0,10067,10068,6,1067,
+        291,0,10068,2182,1,0,0,0,10069,10070,3,1353,653,0,10070,10071,4,
+        1068,340,0,10071,10072,1,0,0,0,10072,10073,6,1068,292,0,10073,2184,
+        1,0,0,0,10074,10075,3,217,85,0,10075,10076,4,1069,341,0,10076,10077,
+        1,0,0,0,10077,10078,6,1069,293,0,10078,2186,1,0,0,0,10079,10080,
+        3,1355,654,0,10080,10081,4,1070,342,0,10081,10082,1,0,0,0,10082,
+        10083,6,1070,294,0,10083,2188,1,0,0,0,10084,10085,3,1357,655,0,10085,
+        10086,4,1071,343,0,10086,10087,1,0,0,0,10087,10088,6,1071,295,0,
+        10088,2190,1,0,0,0,10089,10090,3,219,86,0,10090,10091,4,1072,344,
+        0,10091,10092,1,0,0,0,10092,10093,6,1072,296,0,10093,10094,6,1072,
+        165,0,10094,10095,6,1072,275,0,10095,2192,1,0,0,0,10096,10097,3,
+        1359,656,0,10097,10098,4,1073,345,0,10098,10099,1,0,0,0,10099,10100,
+        6,1073,297,0,10100,2194,1,0,0,0,10101,10102,3,1361,657,0,10102,10103,
+        4,1074,346,0,10103,10104,1,0,0,0,10104,10105,6,1074,298,0,10105,
+        2196,1,0,0,0,10106,10107,3,1363,658,0,10107,10108,4,1075,347,0,10108,
+        10109,1,0,0,0,10109,10110,6,1075,299,0,10110,2198,1,0,0,0,10111,
+        10112,3,1365,659,0,10112,10113,4,1076,348,0,10113,10114,1,0,0,0,
+        10114,10115,6,1076,300,0,10115,2200,1,0,0,0,10116,10117,3,1367,660,
+        0,10117,10118,4,1077,349,0,10118,10119,1,0,0,0,10119,10120,6,1077,
+        301,0,10120,2202,1,0,0,0,10121,10122,3,1369,661,0,10122,10123,4,
+        1078,350,0,10123,10124,1,0,0,0,10124,10125,6,1078,302,0,10125,2204,
+        1,0,0,0,10126,10127,3,221,87,0,10127,10128,4,1079,351,0,10128,10129,
+        1,0,0,0,10129,10130,6,1079,303,0,10130,10131,6,1079,165,0,10131,
+        10132,6,1079,275,0,10132,2206,1,0,0,0,10133,10134,3,1371,662,0,10134,
+        10135,4,1080,352,0,10135,10136,1,0,0,0,10136,10137,6,1080,304,0,
+        10137,2208,1,0,0,0,10138,10139,3,1373,663,0,10139,10140,4,1081,353,
+        0,10140,10141,1,0,0,0,10141,10142,6,1081,305,0,10142,2210,1,0,0,
+        0,10143,10144,3,1375,664,0,10144,10145,4,1082,354,0,10145,10146,
+        1,0,0,0,10146,10147,6,1082,306,0,10147,2212,1,0,0,0,10148,10149,
+        3,1377,665,0,10149,10150,4,1083,355,0,10150,10151,1,0,0,0,10151,
+        10152,6,1083,307,0,10152,2214,1,0,0,0,10153,10154,3,1379,666,0,10154,
+        10155,4,1084,356,0,10155,10156,1,0,0,0,10156,10157,6,1084,308,0,
+        10157,2216,1,0,0,0,10158,10159,3,1381,667,0,10159,10160,4,1085,357,
+        0,10160,10161,1,0,0,0,10161,10162,6,1085,309,0,10162,2218,1,0,0,
+        0,10163,10164,3,223,88,0,10164,10165,4,1086,358,0,10165,10166,1,
+        0,0,0,10166,10167,6,1086,310,0,10167,2220,1,0,0,0,10168,10169,3,
+        225,89,0,10169,10170,4,1087,359,0,10170,10171,1,0,0,0,10171,10172,
+        6,1087,311,0,10172,2222,1,0,0,0,10173,10174,3,227,90,0,10174,10175,
+        4,1088,360,0,10175,10176,1,0,0,0,10176,10177,6,1088,312,0,10177,
+        2224,1,0,0,0,10178,10179,3,229,91,0,10179,10180,4,1089,361,0,10180,
+        10181,1,0,0,0,10181,10182,6,1089,313,0,10182,10183,6,1089,165,0,
+        10183,2226,1,0,0,0,10184,10185,3,1383,668,0,10185,10186,4,1090,362,
+        0,10186,10187,1,0,0,0,10187,10188,6,1090,314,0,10188,2228,1,0,0,
+        0,10189,10190,3,1385,669,0,10190,10191,4,1091,363,0,10191,10192,
+        1,0,0,0,10192,10193,6,1091,315,0,10193,2230,1,0,0,0,10194,10195,
+        3,231,92,0,10195,10196,4,1092,364,0,10196,10197,1,0,0,0,10197,10198,
+        6,1092,316,0,10198,2232,1,0,0,0,10199,10200,3,233,93,0,10200,10201,
+        4,1093,365,0,10201,10202,1,0,0,0,10202,10203,6,1093,317,0,10203,
+        2234,1,0,0,0,10204,10205,3,235,94,0,10205,10206,4,1094,366,0,10206,
+        10207,1,0,0,0,10207,10208,6,1094,318,0,10208,2236,1,0,0,0,10209,
+        10210,3,237,95,0,10210,10211,4,1095,367,0,10211,10212,1,0,0,0,10212,
+        10213,6,1095,319,0,10213,2238,1,0,0,0,10214,10215,3,239,96,0,10215,
+        10216,4,1096,368,0,10216,10217,1,0,0,0,10217,10218,6,1096,320,0,
+        10218,2240,1,0,0,0,10219,10220,3,241,97,0,10220,10221,4,1097,369,
+        0,10221,10222,1,0,0,0,10222,10223,6,1097,321,0,10223,2242,1,0,0,
+        0,10224,10225,3,243,98,0,10225,10226,4,1098,370,0,10226,10227,1,
+        0,0,0,10227,10228,6,1098,322,0,10228,10229,6,1098,165,0,10229,10230,
+        6,1098,275,0,10230,2244,1,0,0,0,10231,10232,3,245,99,0,10232,10233,
+        4,1099,371,0,10233,10234,1,0,0,0,10234,10235,6,1099,323,0,10235,
+        10236,6,1099,165,0,10236,10237,6,1099,275,0,10237,2246,1,0,0,0,10238,
+        10239,3,247,100,0,10239,10240,4,1100,372,0,10240,10241,1,0,0,0,10241,
+        10242,6,1100,324,0,10242,10243,6,1100,165,0,10243,10244,6,1100,275,
+        0,10244,2248,1,0,0,0,10245,10246,3,249,101,0,10246,10247,4,1101,
+        373,0,10247,10248,1,0,0,0,10248,10249,6,1101,325,0,10249,2250,1,
+        0,0,0,10250,10251,3,251,102,0,10251,10252,4,1102,374,0,10252,10253,
+        1,0,0,0,10253,10254,6,1102,326,0,10254,2252,1,0,0,0,10255,10256,
+        3,253,103,0,10256,10257,4,1103,375,0,10257,10258,1,0,0,0,10258,10259,
+        6,1103,327,0,10259,2254,1,0,0,0,10260,10261,3,1387,670,0,10261,10262,
+        4,1104,376,0,10262,10263,1,0,0,0,10263,10264,6,1104,328,0,10264,
+        2256,1,0,0,0,10265,10266,3,255,104,0,10266,10267,4,1105,377,0,10267,
+        10268,1,0,0,0,10268,10269,6,1105,329,0,10269,2258,1,0,0,0,10270,
+        10271,3,257,105,0,10271,10272,4,1106,378,0,10272,10273,1,0,0,0,10273,
+        10274,6,1106,330,0,10274,10275,6,1106,165,0,10275,10276,6,1106,275,
+        0,10276,2260,1,0,0,0,10277,10278,3,259,106,0,10278,10279,4,1107,
+        379,0,10279,10280,1,0,0,0,10280,10281,6,1107,331,0,10281,2262,1,
+        0,0,0,10282,10283,3,1389,671,0,10283,10284,4,1108,380,0,10284,10285,
+        1,0,0,0,10285,10286,6,1108,332,0,10286,2264,1,0,0,0,10287,10288,
+        3,261,107,0,10288,10289,4,1109,381,0,10289,10290,1,0,0,0,10290,10291,
+        6,1109,333,0,10291,10292,6,1109,165,0,10292,10293,6,1109,275,0,10293,
+        2266,1,0,0,0,10294,10295,3,1391,672,0,10295,10296,4,1110,382,0,10296,
+        10297,1,0,0,0,10297,10298,6,1110,334,0,10298,2268,1,0,0,0,10299,
+        10300,3,1393,673,0,10300,10301,4,1111,383,0,10301,10302,1,0,0,0,
+        10302,10303,6,1111,335,0,10303,2270,1,0,0,0,10304,10305,3,1395,674,
+        0,10305,10306,4,1112,384,0,10306,10307,1,0,0,0,10307,10308,6,1112,
+        336,0,10308,2272,1,0,0,0,10309,10310,3,1397,675,0,10310,10311,4,
+        1113,385,0,10311,10312,1,0,0,0,10312,10313,6,1113,337,0,10313,2274,
+        1,0,0,0,10314,10315,3,1399,676,0,10315,10316,4,1114,386,0,10316,
+        10317,1,0,0,0,10317,10318,6,1114,338,0,10318,2276,1,0,0,0,10319,
+        10320,3,1401,677,0,10320,10321,4,1115,387,0,10321,10322,1,0,0,0,
+        10322,10323,6,1115,339,0,10323,2278,1,0,0,0,10324,10325,3,263,108,
+        0,10325,10326,4,1116,388,0,10326,10327,1,0,0,0,10327,10328,6,1116,
+        340,0,10328,2280,1,0,0,0,10329,10330,3,265,109,0,10330,10331,4,1117,
+        389,0,10331,10332,1,0,0,0,10332,10333,6,1117,341,0,10333,2282,1,
+        0,0,0,10334,10335,3,1403,678,0,10335,10336,4,1118,390,0,10336,10337,
+        1,0,0,0,10337,10338,6,1118,342,0,10338,2284,1,0,0,0,10339,10340,
+        3,1405,679,0,10340,10341,4,1119,391,0,10341,10342,1,0,0,0,10342,
+        10343,6,1119,343,0,10343,2286,1,0,0,0,10344,10345,3,267,110,0,10345,
+        10346,4,1120,392,0,10346,10347,1,0,0,0,10347,10348,6,1120,344,0,
+        10348,2288,1,0,0,0,10349,10350,3,269,111,0,10350,10351,4,1121,393,
+        0,10351,10352,1,0,0,0,10352,10353,6,1121,345,0,10353,2290,1,0,0,
+        0,10354,10355,3,1407,680,0,10355,10356,4,1122,394,0,10356,10357,
+        1,0,0,0,10357,10358,6,1122,346,0,10358,2292,1,0,0,0,10359,10360,
+        3,1409,681,0,10360,10361,4,1123,395,0,10361,10362,1,0,0,0,10362,
+        10363,6,1123,347,0,10363,2294,1,0,0,0,10364,10365,3,1411,682,0,10365,
+        10366,4,1124,396,0,10366,10367,1,0,0,0,10367,10368,6,1124,348,0,
+        10368,2296,1,0,0,0,10369,10370,3,1413,683,0,10370,10371,4,1125,397,
+        0,10371,10372,1,0,0,0,10372,10373,6,1125,349,0,10373,2298,1,0,0,
+        0,10374,10375,3,1415,684,0,10375,10376,4,1126,398,0,10376,10377,
+        1,0,0,0,10377,10378,6,1126,350,0,10378,2300,1,0,0,0,10379,10380,
+        3,271,112,0,10380,10381,4,1127,399,0,10381,10382,1,0,0,0,10382,10383,
+        6,1127,351,0,10383,2302,1,0,0,0,10384,10385,3,1417,685,0,10385,10386,
+        4,1128,400,0,10386,10387,1,0,0,0,10387,10388,6,1128,352,0,10388,
+        2304,1,0,0,0,10389,10390,3,1419,686,0,10390,10391,4,1129,401,0,10391,
+        10392,1,0,0,0,10392,10393,6,1129,353,0,10393,2306,1,0,0,0,10394,
+        10395,3,1421,687,0,10395,10396,4,1130,402,0,10396,10397,1,0,0,0,
+        10397,10398,6,1130,354,0,10398,2308,1,0,0,0,10399,10400,3,1423,688,
+        0,10400,10401,4,1131,403,0,10401,10402,1,0,0,0,10402,10403,6,1131,
+        355,0,10403,2310,1,0,0,0,10404,10405,3,1425,689,0,10405,10406,4,
+        1132,404,0,10406,10407,1,0,0,0,10407,10408,6,1132,356,0,10408,2312,
+        1,0,0,0,10409,10410,3,273,113,0,10410,10411,4,1133,405,0,10411,10412,
+        1,0,0,0,10412,10413,6,1133,357,0,10413,2314,1,0,0,0,10414,10415,
+        3,1427,690,0,10415,10416,4,1134,406,0,10416,10417,1,0,0,0,10417,
+        10418,6,1134,358,0,10418,2316,1,0,0,0,10419,10420,3,275,114,0,10420,
+        10421,4,1135,407,0,10421,10422,1,0,0,0,10422,10423,6,1135,359,0,
+        10423,10424,6,1135,165,0,10424,2318,1,0,0,0,10425,10426,3,277,115,
+        0,10426,10427,4,1136,408,0,10427,10428,1,0,0,0,10428,10429,6,1136,
+        360,0,10429,2320,1,0,0,0,10430,10431,3,1429,691,0,10431,10432,4,
+        1137,409,0,10432,10433,1,0,0,0,10433,10434,6,1137,361,0,10434,2322,
+        1,0,0,0,10435,10436,3,1431,692,0,10436,10437,4,1138,410,0,10437,
+        10438,1,0,0,0,10438,10439,6,1138,362,0,10439,2324,1,0,0,0,10440,
+        10441,3,1433,693,0,10441,10442,4,1139,411,0,10442,10443,1,0,0,0,
+        10443,10444,6,1139,363,0,10444,2326,1,0,0,0,10445,10446,3,1435,694,
+        0,10446,10447,4,1140,412,0,10447,10448,1,0,0,0,10448,10449,6,1140,
+        364,0,10449,2328,1,0,0,0,10450,10451,3,1437,695,0,10451,10452,4,
+        1141,413,0,10452,10453,1,0,0,0,10453,10454,6,1141,365,0,10454,2330,
+        1,0,0,0,10455,10456,3,1439,696,0,10456,10457,4,1142,414,0,10457,
+        10458,1,0,0,0,10458,10459,6,1142,366,0,10459,2332,1,0,0,0,10460,
+        10461,3,279,116,0,10461,10462,4,1143,415,0,10462,10463,1,0,0,0,10463,
+        10464,6,1143,367,0,10464,2334,1,0,0,0,10465,10466,3,281,117,0,10466,
+        10467,4,1144,416,0,10467,10468,1,0,0,0,10468,10469,6,1144,368,0,
+        10469,2336,1,0,0,0,10470,10471,3,1441,697,0,10471,10472,4,1145,417,
+        0,10472,10473,1,0,0,0,10473,10474,6,1145,369,0,10474,2338,1,0,0,
+        0,10475,10476,3,1443,698,0,10476,10477,4,1146,418,0,10477,10478,
+        1,0,0,0,10478,10479,6,1146,370,0,10479,2340,1,0,0,0,10480,10481,
+        3,283,118,0,10481,10482,4,1147,419,0,10482,10483,1,0,0,0,10483,10484,
+        6,1147,371,0,10484,2342,1,0,0,0,10485,10486,3,285,119,0,10486,10487,
+        4,1148,420,0,10487,10488,1,0,0,0,10488,10489,6,1148,372,0,10489,
+        2344,1,0,0,0,10490,10491,3,287,120,0,10491,10492,4,1149,421,0,10492,
+        10493,1,0,0,0,10493,10494,6,1149,373,0,10494,2346,1,0,0,0,10495,
+        10496,3,289,121,0,10496,10497,4,1150,422,0,10497,10498,1,0,0,0,10498,
+        10499,6,1150,374,0,10499,2348,1,0,0,0,10500,10501,3,291,122,0,10501,
+        10502,4,1151,423,0,10502,10503,1,0,0,0,10503,10504,6,1151,375,0,
+        10504,2350,1,0,0,0,10505,10506,3,293,123,0,10506,10507,4,1152,424,
+        0,10507,10508,1,0,0,0,10508,10509,6,1152,376,0,10509,2352,1,0,0,
+        0,10510,10511,3,1445,699,0,10511,10512,4,1153,425,0,10512,10513,
+        1,0,0,0,10513,10514,6,1153,377,0,10514,2354,1,0,0,0,10515,10516,
+        3,295,124,0,10516,10517,4,1154,426,0,10517,10518,1,0,0,0,10518,10519,
+        6,1154,378,0,10519,2356,1,0,0,0,10520,10521,3,297,125,0,10521,10522,
+        4,1155,427,0,10522,10523,1,0,0,0,10523,10524,6,1155,379,0,10524,
+        2358,1,0,0,0,10525,10526,3,299,126,0,10526,10527,4,1156,428,0,10527,
+        10528,1,0,0,0,10528,10529,6,1156,380,0,10529,10530,6,1156,165,0,
+        10530,10531,6,1156,275,0,10531,2360,1,0,0,0,10532,10533,3,301,127,
+        0,10533,10534,4,1157,429,0,10534,10535,1,0,0,0,10535,10536,6,1157,
+        381,0,10536,2362,1,0,0,0,10537,10538,3,1447,700,0,10538,10539,4,
+        1158,430,0,10539,10540,1,0,0,0,10540,10541,6,1158,382,0,10541,2364,
+        1,0,0,0,10542,10543,3,303,128,0,10543,10544,4,1159,431,0,10544,10545,
+        1,0,0,0,10545,10546,6,1159,383,0,10546,2366,1,0,0,0,10547,10548,
+        3,305,129,0,10548,10549,4,1160,432,0,10549,10550,1,0,0,0,10550,10551,
+        6,1160,384,0,10551,2368,1,0,0,0,10552,10553,3,307,130,0,10553,10554,
+        4,1161,433,0,10554,10555,1,0,0,0,10555,10556,6,1161,385,0,10556,
+        2370,1,0,0,0,10557,10558,3,1449,701,0,10558,10559,4,1162,434,0,10559,
+        10560,1,0,0,0,10560,10561,6,1162,386,0,10561,2372,1,0,0,0,10562,
+        10563,3,1451,702,0,10563,10564,4,1163,435,0,10564,10565,1,0,0,0,
+        10565,10566,6,1163,387,0,10566,2374,1,0,0,0,10567,10568,3,309,131,
+        0,10568,10569,4,1164,436,0,10569,10570,1,0,0,0,10570,10571,6,1164,
+        388,0,10571,10572,6,1164,165,0,10572,10573,6,1164,275,0,10573,2376,
+        1,0,0,0,10574,10575,3,1453,703,0,10575,10576,4,1165,437,0,10576,
+        10577,1,0,0,0,10577,10578,6,1165,389,0,10578,2378,1,0,0,0,10579,
+        10580,3,1455,704,0,10580,10581,4,1166,438,0,10581,10582,1,0,0,0,
+        10582,10583,6,1166,390,0,10583,2380,1,0,0,0,10584,10585,3,1457,705,
+        0,10585,10586,4,1167,439,0,10586,10587,1,0,0,0,10587,10588,6,1167,
+        391,0,10588,2382,1,0,0,0,10589,10590,3,1459,706,0,10590,10591,4,
+        1168,440,0,10591,10592,1,0,0,0,10592,10593,6,1168,392,0,10593,2384,
+        1,0,0,0,10594,10595,3,1461,707,0,10595,10596,4,1169,441,0,10596,
+        10597,1,0,0,0,10597,10598,6,1169,393,0,10598,2386,1,0,0,0,10599,
+        10600,3,1463,708,0,10600,10601,4,1170,442,0,10601,10602,1,0,0,0,
+        10602,10603,6,1170,394,0,10603,2388,1,0,0,0,10604,10605,3,311,132,
+        0,10605,10606,4,1171,443,0,10606,10607,1,0,0,0,10607,10608,6,1171,
+        395,0,10608,2390,1,0,0,0,10609,10610,3,1465,709,0,10610,10611,4,
+        1172,444,0,10611,10612,1,0,0,0,10612,10613,6,1172,396,0,10613,2392,
+        1,0,0,0,10614,10615,3,1467,710,0,10615,10616,4,1173,445,0,10616,
+        10617,1,0,0,0,10617,10618,6,1173,397,0,10618,2394,1,0,0,0,10619,
+        10620,3,1469,711,0,10620,10621,4,1174,446,0,10621,10622,1,0,0,0,
+        10622,10623,6,1174,398,0,10623,2396,1,0,0,0,10624,10625,3,1471,712,
+        0,10625,10626,4,1175,447,0,10626,10627,1,0,0,0,10627,10628,6,1175,
+        399,0,10628,2398,1,0,0,0,10629,10630,3,313,133,0,10630,10631,4,1176,
+        448,0,10631,10632,1,0,0,0,10632,10633,6,1176,400,0,10633,2400,1,
+        0,0,0,10634,10635,3,315,134,0,10635,10636,4,1177,449,0,10636,10637,
+        1,0,0,0,10637,10638,6,1177,401,0,10638,2402,1,0,0,0,10639,10640,
+        3,317,135,0,10640,10641,4,1178,450,0,10641,10642,1,0,0,0,10642,10643,
+        6,1178,402,0,10643,10644,6,1178,165,0,10644,10645,6,1178,275,0,10645,
+        2404,1,0,0,0,10646,10647,3,1473,713,0,10647,10648,4,1179,451,0,10648,
+        10649,1,0,0,0,10649,10650,6,1179,403,0,10650,2406,1,0,0,0,10651,
+        10652,3,1475,714,0,10652,10653,4,1180,452,0,10653,10654,1,0,0,0,
+        10654,10655,6,1180,404,0,10655,2408,1,0,0,0,10656,10657,3,1477,715,
+        0,10657,10658,4,1181,453,0,10658,10659,1,0,0,0,10659,10660,6,1181,
+        405,0,10660,2410,1,0,0,0,10661,10662,3,1479,716,0,10662,10663,4,
+        1182,454,0,10663,10664,1,0,0,0,10664,10665,6,1182,406,0,10665,2412,
+        1,0,0,0,10666,10667,3,1481,717,0,10667,10668,4,1183,455,0,10668,
+        10669,1,0,0,0,10669,10670,6,1183,407,0,10670,2414,1,0,0,0,10671,
+        10672,3,1483,718,0,10672,10673,4,1184,456,0,10673,10674,1,0,0,0,
+        10674,10675,6,1184,408,0,10675,2416,1,0,0,0,10676,10677,3,319,136,
+        0,10677,10678,4,1185,457,0,10678,10679,1,0,0,0,10679,10680,6,1185,
+        409,0,10680,2418,1,0,0,0,10681,10682,3,1485,719,0,10682,10683,4,
+        1186,458,0,10683,10684,1,0,0,0,10684,10685,6,1186,410,0,10685,2420,
+        1,0,0,0,10686,10687,3,1487,720,0,10687,10688,4,1187,459,0,10688,
+        10689,1,0,0,0,10689,10690,6,1187,411,0,10690,2422,1,0,0,0,10691,
+        10692,3,321,137,0,10692,10693,4,1188,460,0,10693,10694,1,0,0,0,10694,
+        10695,6,1188,412,0,10695,10696,6,1188,165,0,10696,10697,6,1188,275,
+        0,10697,2424,1,0,0,0,10698,10699,3,323,138,0,10699,10700,4,1189,
+        461,0,10700,10701,1,0,0,0,10701,10702,6,1189,413,0,10702,10703,6,
+        1189,165,0,10703,10704,6,1189,275,0,10704,2426,1,0,0,0,10705,10706,
+        3,1489,721,0,10706,10707,4,1190,462,0,10707,10708,1,0,0,0,10708,
+        10709,6,1190,414,0,10709,2428,1,0,0,0,10710,10711,3,1491,722,0,10711,
+        10712,4,1191,463,0,10712,10713,1,0,0,0,10713,10714,6,1191,415,0,
+        10714,2430,1,0,0,0,10715,10716,7,80,0,0,10716,10718,4,1192,464,0,
+        10717,10715,1,0,0,0,10718,10719,1,0,0,0,10719,10717,1,0,0,0,10719,
+        10720,1,0,0,0,10720,2432,1,0,0,0,10721,10722,3,1145,549,0,10722,
+        10723,4,1193,465,0,10723,10724,1,0,0,0,10724,10725,6,1193,32,0,10725,
+        2434,1,0,0,0,10726,10727,3,1147,550,0,10727,10732,4,1194,466,0,10728,
+        10729,5,32,0,0,10729,10731,4,1194,467,0,10730,10728,1,0,0,0,10731,
+        10734,1,0,0,0,10732,10730,1,0,0,0,10732,10733,1,0,0,0,10733,10735,
+        1,0,0,0,10734,10732,1,0,0,0,10735,10736,6,1194,416,0,10736,10737,
+        1,0,0,0,10737,10738,6,1194,33,0,10738,2436,1,0,0,0,10739,10740,7,
+        69,0,0,10740,10741,7,69,0,0,10741,10742,7,69,0,0,10742,10743,7,69,
+        0,0,10743,10744,7,69,0,0,10744,10745,4,1195,468,0,10745,2438,1,0,
+        0,0,10746,10747,7,70,0,0,10747,10748,7,70,0,0,10748,10749,4,1196,
+        469,0,10749,10750,1,0,0,0,10750,10751,6,1196,12,0,10751,10752,6,
+        1196,12,0,10752,10753,6,1196,12,0,10753,2440,1,0,0,0,10754,10755,
+        7,12,0,0,10755,10759,4,1197,470,0,10756,10758,7,12,0,0,10757,10756,
+        1,0,0,0,10758,10761,1,0,0,0,10759,10757,1,0,0,0,10759,10760,1,0,
+        0,0,10760,10762,1,0,0,0,10761,10759,1,0,0,0,10762,10763,6,1197,2,
+        0,10763,2442,1,0,0,0,10764,10765,8,0,0,0,10765,10769,4,1198,471,
+        0,10766,10768,8,0,0,0,10767,10766,1,0,0,0,10768,10771,1,0,0,0,10769,
+        10767,1,0,0,0,10769,10770,1,0,0,0,10770,2444,1,0,0,0,10771,10769,
+        1,0,0,0,10772,10773,8,0,0,0,10773,10777,4,1199,472,0,10774,10776,
+        8,0,0,0,10775,10774,1,0,0,0,10776,10779,1,0,0,0,10777,10775,1,0,
+        0,0,10777,10778,1,0,0,0,10778,2446,1,0,0,0,10779,10777,1,0,0,0,10780,
+        10781,3,99,26,0,10781,10782,1,0,0,0,10782,10783,6,1200,19,0,10783,
+        10784,6,1200,5,0,10784,2448,1,0,0,0,10785,10786,7,2,0,0,10786,10788,
+        4,1201,473,0,10787,10785,1,0,0,0,10788,10789,1,0,0,0,10789,10787,
+        1,0,0,0,10789,10790,1,0,0,0,10790,10791,1,0,0,0,10791,10792,6,1201,
+        2,0,10792,2450,1,0,0,0,10793,10794,3,1145,549,0,10794,10795,4,1202,
+        474,0,10795,10796,1,0,0,0,10796,10797,6,1202,32,0,10797,10798,6,
+        1202,5,0,10798,10799,6,1202,417,0,10799,2452,1,0,0,0,10800,10801,
+        4,1203,475,0,10801,10802,1,0,0,0,10802,10803,6,1203,2,0,10803,10804,
+        6,1203,5,0,10804,2454,1,0,0,0,10805,10806,7,2,0,0,10806,10808,4,
+        1204,476,0,10807,10805,1,0,0,0,10808,10809,1,0,0,0,10809,10807,1,
+        0,0,0,10809,10810,1,0,0,0,10810,10811,1,0,0,0,10811,10812,6,1204,
+        2,0,10812,2456,1,0,0,0,10813,10814,7,80,0,0,10814,10816,4,1205,477,
+        0,10815,10813,1,0,0,0,10816,10817,1,0,0,0,10817,10815,1,0,0,0,10817,
+        10818,1,0,0,0,10818,10819,1,0,0,0,10819,10820,6,1205,418,0,10820,
+        2458,1,0,0,0,10821,10822,3,1147,550,0,10822,10827,4,1206,478,0,10823,
+        10824,5,32,0,0,10824,10826,4,1206,479,0,10825,10823,1,0,0,0,10826,
+        10829,1,0,0,0,10827,10825,1,0,0,0,10827,10828,1,0,0,0,10828,10830,
+        1,0,0,0,10829,10827,1,0,0,0,10830,10831,6,1206,419,0,10831,10832,
+        1,0,0,0,10832,10833,6,1206,33,0,10833,2460,1,0,0,0,10834,10835,4,
+        1207,480,0,10835,10836,1,0,0,0,10836,10837,6,1207,2,0,10837,10838,
+        6,1207,5,0,10838,2462,1,0,0,0,10839,10840,3,1145,549,0,10840,10841,
+        1,0,0,0,10841,10842,6,1208,5,0,10842,10843,6,1208,32,0,10843,10844,
+        6,1208,420,0,10844,2464,1,0,0,0,10845,10846,1,0,0,0,10846,10847,
+        1,0,0,0,10847,10848,6,1209,5,0,10848,10849,6,1209,2,0,10849,2466,
+        1,0,0,0,10850,10851,3,1147,550,0,10851,10852,1,0,0,0,10852,10853,
+        6,1210,5,0,10853,10854,6,1210,33,0,10854,2468,1,0,0,0,10855,10856,
+        3,101,27,0,10856,10857,1,0,0,0,10857,10858,6,1211,2,0,10858,2470,
+        1,0,0,0,10859,10860,7,80,0,0,10860,10861,1,0,0,0,10861,10862,6,1212,
+        418,0,10862,2472,1,0,0,0,10863,10864,7,2,0,0,10864,10865,1,0,0,0,
+        10865,10866,6,1213,5,0,10866,10867,6,1213,12,0,10867,2474,1,0,0,
+        0,10868,10869,7,15,0,0,10869,10870,1,0,0,0,10870,10871,6,1214,5,
+        0,10871,10872,6,1214,12,0,10872,2476,1,0,0,0,10873,10874,7,2,0,0,
+        10874,10875,7,2,0,0,10875,10876,1,0,0,0,10876,10877,6,1215,5,0,10877,
+        2478,1,0,0,0,10878,10879,7,81,0,0,10879,10883,7,82,0,0,10880,10881,
+        7,82,0,0,10881,10883,7,44,0,0,10882,10878,1,0,0,0,10882,10880,1,
+        0,0,0,10883,10884,1,0,0,0,10884,10885,6,1216,5,0,10885,2480,1,0,
+        0,0,10886,10887,7,38,0,0,10887,10888,7,52,0,0,10888,10889,1,0,0,
+        0,10889,10890,6,1217,5,0,10890,2482,1,0,0,0,10891,10892,7,17,0,0,
+        10892,10893,7,82,0,0,10893,10894,1,0,0,0,10894,10895,6,1218,5,0,
+        10895,2484,1,0,0,0,10896,10897,7,17,0,0,10897,10898,7,81,0,0,10898,
+        10899,1,0,0,0,10899,10900,6,1219,5,0,10900,2486,1,0,0,0,10901,10902,
+        7,17,0,0,10902,10903,7,13,0,0,10903,10904,1,0,0,0,10904,10905,6,
+        1220,5,0,10905,2488,1,0,0,0,10906,10907,7,33,0,0,10907,10908,7,13,
+        0,0,10908,10909,1,0,0,0,10909,10910,6,1221,5,0,10910,2490,1,0,0,
+        0,10911,10912,7,11,0,0,10912,10913,7,82,0,0,10913,10914,1,0,0,0,
+        10914,10915,6,1222,5,0,10915,2492,1,0,0,0,10916,10917,7,13,0,0,10917,
+        10918,7,16,0,0,10918,10919,1,0,0,0,10919,10920,6,1223,5,0,10920,
+        2494,1,0,0,0,10921,10922,7,22,0,0,10922,10923,7,53,0,0,10923,10924,
+        1,0,0,0,10924,10925,6,1224,5,0,10925,2496,1,0,0,0,10926,10927,7,
+        7,0,0,10927,10928,7,83,0,0,10928,10929,1,0,0,0,10929,10930,6,1225,
+        5,0,10930,2498,1,0,0,0,10931,10932,7,19,0,0,10932,10933,7,13,0,0,
+        10933,10934,1,0,0,0,10934,10935,6,1226,5,0,10935,2500,1,0,0,0,10936,
+        10937,7,20,0,0,10937,10938,7,15,0,0,10938,10939,1,0,0,0,10939,10940,
+        6,1227,5,0,10940,2502,1,0,0,0,10941,10942,7,7,0,0,10942,10943,7,
+        13,0,0,10943,10944,1,0,0,0,10944,10945,6,1228,5,0,10945,2504,1,0,
+        0,0,10946,10947,5,42,0,0,10947,10948,5,42,0,0,10948,2506,1,0,0,0,
+        10949,10950,7,84,0,0,10950,10951,7,10,0,0,10951,2508,1,0,0,0,10952,
+        10953,8,0,0,0,10953,10954,8,0,0,0,10954,2510,1,0,0,0,10955,10956,
+        7,2,0,0,10956,10960,4,1232,481,0,10957,10959,7,2,0,0,10958,10957,
+        1,0,0,0,10959,10962,1,0,0,0,10960,10958,1,0,0,0,10960,10961,1,0,
+        0,0,10961,10963,1,0,0,0,10962,10960,1,0,0,0,10963,10964,6,1232,2,
+        0,10964,2512,1,0,0,0,10965,10966,8,0,0,0,10966,10970,4,1233,482,
+        0,10967,10969,8,0,0,0,10968,10967,1,0,0,0,10969,10972,1,0,0,0,10970,
+        10968,1,0,0,0,10970,10971,1,0,0,0,10971,2514,1,0,0,0,10972,10970,
+        1,0,0,0,10973,10974,5,32,0,0,10974,10975,5,32,0,0,10975,10976,5,
+        32,0,0,10976,10977,5,32,0,0,10977,10978,5,32,0,0,10978,10979,1,0,
+        0,0,10979,10980,4,1234,483,0,10980,10981,1,0,0,0,10981,10982,6,1234,
+        2,0,10982,2516,1,0,0,0,10983,10984,3,57,5,0,10984,10985,4,1235,484,
+        0,10985,10986,1,0,0,0,10986,10987,6,1235,2,0,10987,2518,1,0,0,0,
+        10988,10989,7,8,0,0,10989,10990,5,47,0,0,10990,10991,7,14,0,0,10991,
+        10992,7,15,0,0,10992,10993,7,5,0,0,10993,10994,7,36,0,0,10994,10995,
+        7,14,0,0,10995,10996,7,37,0,0,10996,10997,7,14,0,0,10997,10998,7,
+        8,0,0,10998,11002,3,101,27,0,10999,11001,8,0,0,0,11000,10999,1,0,
+        0,0,11001,11004,1,0,0,0,11002,11000,1,0,0,0,11002,11003,1,0,0,0,
+        11003,11005,1,0,0,0,11004,11002,1,0,0,0,11005,11006,6,1236,421,0,
+        11006,11007,1,0,0,0,11007,11008,6,1236,5,0,11008,2520,1,0,0,0,11009,
+        11010,7,85,0,0,11010,11011,5,43,0,0,11011,11012,1,0,0,0,11012,11013,
+        6,1237,2,0,11013,2522,1,0,0,0,11014,11015,7,85,0,0,11015,11016,5,
+        42,0,0,11016,11017,1,0,0,0,11017,11018,6,1238,2,0,11018,11019,6,
+        1238,422,0,11019,2524,1,0,0,0,11020,11021,3,99,26,0,11021,11022,
+        1,0,0,0,11022,11023,6,1239,2,0,11023,2526,1,0,0,0,11024,11025,1,
+        0,0,0,11025,11026,1,0,0,0,11026,11027,6,1240,2,0,11027,11028,6,1240,
+        5,0,11028,2528,1,0,0,0,11029,11030,3,2517,1235,0,11030,11031,1,0,
+        0,0,11031,11032,6,1241,2,0,11032,2530,1,0,0,0,11033,11034,7,85,0,
+        0,11034,11035,5,42,0,0,11035,11036,1,0,0,0,11036,11037,6,1242,2,
+        0,11037,2532,1,0,0,0,11038,11039,7,12,0,0,11039,11043,4,1243,485,
+        0,11040,11042,7,12,0,0,11041,11040,1,0,0,0,11042,11045,1,0,0,0,11043,
+        11041,1,0,0,0,11043,11044,1,0,0,0,11044,11046,1,0,0,0,11045,11043,
+        1,0,0,0,11046,11047,6,1243,2,0,11047,2534,1,0,0,0,11048,11049,8,
+        63,0,0,11049,11053,4,1244,486,0,11050,11052,8,0,0,0,11051,11050,
+        1,0,0,0,11052,11055,1,0,0,0,11053,11051,1,0,0,0,11053,11054,1,0,
+        0,0,11054,11056,1,0,0,0,11055,11053,1,0,0,0,11056,11057,6,1244,3,
+        0,11057,2536,1,0,0,0,11058,11060,3,99,26,0,11059,11058,1,0,0,0,11059,
+        11060,1,0,0,0,11060,11061,1,0,0,0,11061,11062,6,1245,2,0,11062,11063,
+        6,1245,5,0,11063,2538,1,0,0,0,11064,11065,8,0,0,0,11065,11069,4,
+        1246,487,0,11066,11068,8,0,0,0,11067,11066,1,0,0,0,11068,11071,1,
+        0,0,0,11069,11067,1,0,0,0,11069,11070,1,0,0,0,11070,11072,1,0,0,
+        0,11071,11069,1,0,0,0,11072,11073,3,2545,1249,0,11073,2540,1,0,0,
+        0,11074,11075,8,0,0,0,11075,11079,4,1247,488,0,11076,11078,8,0,0,
+        0,11077,11076,1,0,0,0,11078,11081,1,0,0,0,11079,11077,1,0,0,0,11079,
+        11080,1,0,0,0,11080,11082,1,0,0,0,11081,11079,1,0,0,0,11082,11083,
+        6,1247,5,0,11083,2542,1,0,0,0,11084,11085,8,0,0,0,11085,11086,4,
+        1248,489,0,11086,11087,1,0,0,0,11087,11088,6,1248,2,0,11088,2544,
+        1,0,0,0,11089,11091,5,43,0,0,11090,11092,7,2,0,0,11091,11090,1,0,
+        0,0,11092,11093,1,0,0,0,11093,11091,1,0,0,0,11093,11094,1,0,0,0,
+        11094,11095,1,0,0,0,11095,11096,3,99,26,0,11096,2546,1,0,0,0,11097,
+        11098,5,32,0,0,11098,11099,5,32,0,0,11099,11100,5,32,0,0,11100,11101,
+        5,32,0,0,11101,11102,5,32,0,0,11102,11103,5,32,0,0,11103,11104,5,
+        32,0,0,11104,11105,5,32,0,0,11105,11106,5,32,0,0,11106,11107,5,32,
+        0,0,11107,11108,5,32,0,0,11108,11109,5,32,0,0,11109,11110,5,32,0,
+        0,11110,11111,5,32,0,0,11111,11112,5,32,0,0,11112,11113,5,32,0,0,
+        11113,11114,5,32,0,0,11114,11115,5,32,0,0,11115,11116,5,32,0,0,11116,
+        11117,5,32,0,0,11117,11118,5,32,0,0,11118,11119,5,32,0,0,11119,11120,
+        5,32,0,0,11120,11121,5,32,0,0,11121,11122,5,32,0,0,11122,11123,5,
+        32,0,0,11123,11124,5,32,0,0,11124,11125,5,32,0,0,11125,11126,5,32,
+        0,0,11126,11127,5,32,0,0,11127,11128,5,32,0,0,11128,11129,5,32,0,
+        0,11129,11130,5,32,0,0,11130,11131,5,32,0,0,11131,11132,5,32,0,0,
+        11132,11133,5,32,0,0,11133,11134,5,32,0,0,11134,11135,5,32,0,0,11135,
+        11136,5,32,0,0,11136,11137,5,32,0,0,11137,11138,5,32,0,0,11138,11139,
+        5,32,0,0,11139,11140,5,32,0,0,11140,11141,5,32,0,0,11141,11142,5,
+        32,0,0,11142,11143,5,32,0,0,11143,11144,5,32,0,0,11144,11145,5,32,
+        0,0,11145,11146,5,32,0,0,11146,11147,5,32,0,0,11147,11148,5,32,0,
+        0,11148,11149,5,32,0,0,11149,11150,5,32,0,0,11150,11151,5,32,0,0,
+        11151,11152,5,32,0,0,11152,11153,5,32,0,0,11153,11154,5,32,0,0,11154,
+        11155,5,32,0,0,11155,11156,5,32,0,0,11156,11157,5,32,0,0,11157,11158,
+        5,32,0,0,11158,11159,5,32,0,0,11159,11160,5,32,0,0,11160,11161,5,
+        32,0,0,11161,11162,5,32,0,0,11162,11163,5,32,0,0,11163,11164,5,32,
+        0,0,11164,11165,5,32,0,0,11165,11166,5,32,0,0,11166,11167,5,32,0,
+        0,11167,11168,5,32,0,0,11168,11169,5,32,0,0,11169,11170,5,32,0,0,
+        11170,11171,5,32,0,0,11171,11172,5,32,0,0,11172,11173,1,0,0,0,11173,
+        11174,4,1250,490,0,11174,11175,1,0,0,0,11175,11176,6,1250,168,0,
+        11176,2548,1,0,0,0,11177,11178,3,67,10,0,11178,11179,3,67,10,0,11179,
+        11180,4,1251,491,0,11180,2550,1,0,0,0,11181,11182,5,32,0,0,11182,
+        11183,5,32,0,0,11183,11184,5,32,0,0,11184,11185,5,32,0,0,11185,11186,
+        5,32,0,0,11186,11187,5,32,0,0,11187,11188,5,32,0,0,11188,11189,5,
+        32,0,0,11189,11190,5,32,0,0,11190,11191,5,32,0,0,11191,11192,5,32,
+        0,0,11192,11193,5,32,0,0,11193,11194,5,32,0,0,11194,11195,5,32,0,
+        0,11195,11196,5,32,0,0,11196,11197,5,32,0,0,11197,11198,5,32,0,0,
+        11198,11199,5,32,0,0,11199,11200,5,32,0,0,11200,11201,5,32,0,0,11201,
+        11202,5,32,0,0,11202,11203,5,32,0,0,11203,11204,5,32,0,0,11204,11205,
+        5,32,0,0,11205,11206,1,0,0,0,11206,11207,4,1252,492,0,11207,11208,
+        1,0,0,0,11208,11209,6,1252,423,0,11209,11210,6,1252,2,0,11210,2552,
+        1,0,0,0,11211,11212,5,32,0,0,11212,11213,5,32,0,0,11213,11214,5,
+        32,0,0,11214,11215,5,32,0,0,11215,11216,5,32,0,0,11216,11217,5,32,
+        0,0,11217,11218,5,32,0,0,11218,11219,5,32,0,0,11219,11220,5,32,0,
+        0,11220,11221,5,32,0,0,11221,11222,5,32,0,0,11222,11223,5,32,0,0,
+        11223,11224,5,32,0,0,11224,11225,5,32,0,0,11225,11226,1,0,0,0,11226,
+        11227,4,1253,493,0,11227,11228,1,0,0,0,11228,11229,6,1253,424,0,
+        11229,11230,6,1253,2,0,11230,2554,1,0,0,0,11231,11232,5,65,0,0,11232,
+        11233,5,78,0,0,11233,11241,5,68,0,0,11234,11235,5,79,0,0,11235,11236,
+        5,82,0,0,11236,11241,5,32,0,0,11237,11238,5,32,0,0,11238,11239,5,
+        79,0,0,11239,11241,5,82,0,0,11240,11231,1,0,0,0,11240,11234,1,0,
+        0,0,11240,11237,1,0,0,0,11241,11242,1,0,0,0,11242,11243,4,1254,494,
+        0,11243,2556,1,0,0,0,11244,11245,5,32,0,0,11245,11246,5,32,0,0,11246,
+        11247,5,32,0,0,11247,11248,5,32,0,0,11248,11249,1,0,0,0,11249,11250,
+        4,1255,495,0,11250,11251,1,0,0,0,11251,11252,6,1255,425,0,11252,
+        11253,6,1255,12,0,11253,2558,1,0,0,0,11254,11255,3,65,9,0,11255,
+        11256,3,65,9,0,11256,11257,4,1256,496,0,11257,2560,1,0,0,0,11258,
+        11259,7,86,0,0,11259,11260,4,1257,497,0,11260,2562,1,0,0,0,11261,
+        11262,7,87,0,0,11262,11263,4,1258,498,0,11263,11264,1,0,0,0,11264,
+        11265,6,1258,12,0,11265,2564,1,0,0,0,11266,11267,3,67,10,0,11267,
+        11268,3,67,10,0,11268,11269,3,67,10,0,11269,11270,3,67,10,0,11270,
+        11271,3,65,9,0,11271,11272,3,65,9,0,11272,11273,3,65,9,0,11273,11274,
+        3,65,9,0,11274,11275,4,1259,499,0,11275,2566,1,0,0,0,11276,11277,
+        7,12,0,0,11277,11281,4,1260,500,0,11278,11280,7,12,0,0,11279,11278,
+        1,0,0,0,11280,11283,1,0,0,0,11281,11279,1,0,0,0,11281,11282,1,0,
+        0,0,11282,11284,1,0,0,0,11283,11281,1,0,0,0,11284,11285,6,1260,2,
+        0,11285,2568,1,0,0,0,11286,11287,8,0,0,0,11287,11291,4,1261,501,
+        0,11288,11290,8,0,0,0,11289,11288,1,0,0,0,11290,11293,1,0,0,0,11291,
+        11289,1,0,0,0,11291,11292,1,0,0,0,11292,11294,1,0,0,0,11293,11291,
+        1,0,0,0,11294,11295,6,1261,3,0,11295,2570,1,0,0,0,11296,11297,3,
+        99,26,0,11297,11298,1,0,0,0,11298,11299,6,1262,19,0,11299,11300,
+        6,1262,5,0,11300,2572,1,0,0,0,11301,11302,3,67,10,0,11302,11303,
+        3,67,10,0,11303,11304,4,1263,502,0,11304,2574,1,0,0,0,11305,11306,
+        5,32,0,0,11306,11307,5,32,0,0,11307,11308,5,32,0,0,11308,11309,5,
+        32,0,0,11309,11310,5,32,0,0,11310,11311,5,32,0,0,11311,11312,5,32,
+        0,0,11312,11313,5,32,0,0,11313,11314,5,32,0,0,11314,11315,5,32,0,
+        0,11315,11316,5,32,0,0,11316,11317,5,32,0,0,11317,11318,5,32,0,0,
+        11318,11319,5,32,0,0,11319,11320,5,32,0,0,11320,11321,5,32,0,0,11321,
+        11322,5,32,0,0,11322,11323,5,32,0,0,11323,11324,1,0,0,0,11324,11325,
+        4,1264,503,0,11325,11326,1,0,0,0,11326,11327,6,1264,2,0,11327,2576,
+        1,0,0,0,11328,11329,3,67,10,0,11329,11330,3,67,10,0,11330,11331,
+        3,65,9,0,11331,11332,3,65,9,0,11332,11333,3,65,9,0,11333,11334,3,
+        65,9,0,11334,11335,4,1265,504,0,11335,11336,1,0,0,0,11336,11337,
+        6,1265,12,0,11337,11338,6,1265,12,0,11338,2578,1,0,0,0,11339,11340,
+        5,32,0,0,11340,11341,5,32,0,0,11341,11342,1,0,0,0,11342,11343,4,
+        1266,505,0,11343,11344,1,0,0,0,11344,11345,6,1266,12,0,11345,11346,
+        6,1266,12,0,11346,11347,6,1266,12,0,11347,11348,6,1266,2,0,11348,
+        2580,1,0,0,0,11349,11350,7,12,0,0,11350,11354,4,1267,506,0,11351,
+        11353,7,12,0,0,11352,11351,1,0,0,0,11353,11356,1,0,0,0,11354,11352,
+        1,0,0,0,11354,11355,1,0,0,0,11355,11357,1,0,0,0,11356,11354,1,0,
+        0,0,11357,11358,6,1267,5,0,11358,11359,6,1267,2,0,11359,2582,1,0,
+        0,0,11360,11361,7,12,0,0,11361,11365,4,1268,507,0,11362,11364,7,
+        12,0,0,11363,11362,1,0,0,0,11364,11367,1,0,0,0,11365,11363,1,0,0,
+        0,11365,11366,1,0,0,0,11366,11368,1,0,0,0,11367,11365,1,0,0,0,11368,
+        11369,6,1268,171,0,11369,11370,6,1268,5,0,11370,2584,1,0,0,0,11371,
+        11372,3,65,9,0,11372,11373,3,65,9,0,11373,11374,3,65,9,0,11374,11375,
+        3,65,9,0,11375,11376,4,1269,508,0,11376,2586,1,0,0,0,11377,11378,
+        8,0,0,0,11378,11379,4,1270,509,0,11379,2588,1,0,0,0,11380,11381,
+        7,88,0,0,11381,11382,4,1271,510,0,11382,2590,1,0,0,0,11383,11384,
+        3,67,10,0,11384,11385,3,67,10,0,11385,11386,4,1272,511,0,11386,2592,
+        1,0,0,0,11387,11388,7,70,0,0,11388,11389,7,70,0,0,11389,11390,4,
+        1273,512,0,11390,2594,1,0,0,0,11391,11392,3,67,10,0,11392,11393,
+        3,67,10,0,11393,11394,3,65,9,0,11394,11395,3,65,9,0,11395,11396,
+        3,65,9,0,11396,11397,3,65,9,0,11397,11398,4,1274,513,0,11398,2596,
+        1,0,0,0,11399,11400,5,76,0,0,11400,11404,7,44,0,0,11401,11402,5,
+        32,0,0,11402,11404,5,32,0,0,11403,11399,1,0,0,0,11403,11401,1,0,
+        0,0,11404,11405,1,0,0,0,11405,11406,4,1275,514,0,11406,2598,1,0,
+        0,0,11407,11408,5,77,0,0,11408,11412,7,44,0,0,11409,11410,5,32,0,
+        0,11410,11412,5,32,0,0,11411,11407,1,0,0,0,11411,11409,1,0,0,0,11412,
+        11413,1,0,0,0,11413,11414,4,1276,515,0,11414,11415,1,0,0,0,11415,
+        11416,6,1276,12,0,11416,11417,6,1276,12,0,11417,11418,6,1276,12,
+        0,11418,11419,6,1276,12,0,11419,2600,1,0,0,0,11420,11421,5,32,0,
+        0,11421,11422,5,32,0,0,11422,11423,5,32,0,0,11423,11424,5,32,0,0,
+        11424,11425,5,32,0,0,11425,11426,5,32,0,0,11426,11427,1,0,0,0,11427,
+        11428,4,1277,516,0,11428,11429,1,0,0,0,11429,11430,6,1277,2,0,11430,
+        2602,1,0,0,0,11431,11432,8,0,0,0,11432,11436,4,1278,517,0,11433,
+        11435,8,0,0,0,11434,11433,1,0,0,0,11435,11438,1,0,0,0,11436,11434,
+        1,0,0,0,11436,11437,1,0,0,0,11437,11439,1,0,0,0,11438,11436,1,0,
+        0,0,11439,11440,6,1278,3,0,11440,2604,1,0,0,0,11441,11442,3,99,26,
+        0,11442,11443,1,0,0,0,11443,11444,6,1279,19,0,11444,11445,6,1279,
+        5,0,11445,11446,6,1279,5,0,11446,2606,1,0,0,0,11447,11448,3,1145,
+        549,0,11448,11449,1,0,0,0,11449,11450,6,1280,32,0,11450,2608,1,0,
+        0,0,11451,11452,3,1147,550,0,11452,11453,1,0,0,0,11453,11454,6,1281,
+        33,0,11454,2610,1,0,0,0,11455,11456,7,25,0,0,11456,11457,1,0,0,0,
+        11457,11458,6,1282,29,0,11458,11459,6,1282,30,0,11459,2612,1,0,0,
+        0,11460,11461,5,58,0,0,11461,11462,1,0,0,0,11462,11463,6,1283,250,
+        0,11463,2614,1,0,0,0,11464,11468,7,89,0,0,11465,11467,7,90,0,0,11466,
+        11465,1,0,0,0,11467,11470,1,0,0,0,11468,11466,1,0,0,0,11468,11469,
+        1,0,0,0,11469,11471,1,0,0,0,11470,11468,1,0,0,0,11471,11472,6,1284,
+        124,0,11472,2616,1,0,0,0,11473,11475,7,12,0,0,11474,11473,1,0,0,
+        0,11475,11476,1,0,0,0,11476,11474,1,0,0,0,11476,11477,1,0,0,0,11477,
+        11478,1,0,0,0,11478,11479,6,1285,2,0,11479,2618,1,0,0,0,11480,11481,
+        3,99,26,0,11481,11482,3,57,5,0,11482,11483,7,11,0,0,11483,11484,
+        8,55,0,0,11484,11485,1,0,0,0,11485,11486,6,1286,2,0,11486,2620,1,
+        0,0,0,11487,11488,3,99,26,0,11488,11489,1,0,0,0,11489,11490,6,1287,
+        19,0,11490,11491,6,1287,5,0,11491,2622,1,0,0,0,178,0,1,2,3,4,5,6,
+        7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,
+        30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,2633,2738,2742,
+        2833,2852,2864,2878,2887,2899,2984,3215,3244,3284,3293,3303,3985,
+        4416,4423,4454,4462,4473,5169,5184,5192,5200,5207,5214,5226,5233,
+        5246,5253,5260,5267,5371,5582,5589,5767,6532,6538,6541,6547,6549,
+        6615,6631,6634,6639,6655,6668,6683,6731,6779,6789,6794,6796,6985,
+        7177,7217,7816,7837,7841,7843,7857,7872,7887,7898,7908,7923,7943,
+        7957,7971,8089,8094,8099,8112,8136,8143,8157,8164,8179,8190,8203,
+        8206,8217,8223,8277,8285,8384,8390,8468,8478,8516,8606,8640,8680,
+        8690,8751,9762,9774,9782,9831,9837,9863,10719,10732,10759,10769,
+        10777,10789,10809,10817,10827,10882,10960,10970,11002,11043,11053,
+        11059,11069,11079,11093,11240,11281,11291,11354,11365,11403,11411,
+        11436,11468,11476,426,5,9,0,5,1,0,6,0,0,0,1,0,5,21,0,4,0,0,5,10,
+        0,5,25,0,5,28,0,5,29,0,5,32,0,5,37,0,5,38,0,5,39,0,5,42,0,5,24,0,
+        5,46,0,5,3,0,7,46,0,7,644,0,5,5,0,5,8,0,5,2,0,5,4,0,7,47,0,7,48,
+        0,3,0,0,5,6,0,5,17,0,7,453,0,5,16,0,7,441,0,7,438,0,7,439,0,1,68,
+        0,7,7,0,7,3,0,2,11,0,5,35,0,5,23,0,7,333,0,7,334,0,7,335,0,7,336,
+        0,7,337,0,7,338,0,7,339,0,7,340,0,7,341,0,7,342,0,7,343,0,7,344,
+        0,7,345,0,7,346,0,7,347,0,7,348,0,7,349,0,7,350,0,7,351,0,7,352,
+        0,7,353,0,7,354,0,7,355,0,7,356,0,7,357,0,7,358,0,7,359,0,7,360,
+        0,7,361,0,7,362,0,7,363,0,7,364,0,7,365,0,7,366,0,7,367,0,7,368,
+        0,7,369,0,7,370,0,7,371,0,7,372,0,7,373,0,7,374,0,7,375,0,7,376,
+        0,7,377,0,7,378,0,7,379,0,7,380,0,7,381,0,7,382,0,7,383,0,7,384,
+        0,7,385,0,7,386,0,7,387,0,7,388,0,7,389,0,7,390,0,7,391,0,7,392,
+        0,7,393,0,7,394,0,7,395,0,7,396,0,7,397,0,7,398,0,7,399,0,7,400,
+        0,7,401,0,7,402,0,7,403,0,7,404,0,7,405,0,7,406,0,7,407,0,7,408,
+        0,7,409,0,7,410,0,7,411,0,7,412,0,7,413,0,7,414,0,7,415,0,7,416,
+        0,7,454,0,7,118,0,1,242,1,7,626,0,5,13,0,5,12,0,5,22,0,1,571,2,1,
+        572,3,5,7,0,5,15,0,7,292,0,7,241,0,7,242,0,7,243,0,7,244,0,7,232,
+        0,7,253,0,7,289,0,7,295,0,7,231,0,7,267,0,7,245,0,7,280,0,7,299,
+        0,7,305,0,7,281,0,7,287,0,1,727,4,5,18,0,5,19,0,7,590,0,7,592,0,
+        7,591,0,1,746,5,7,609,0,1,755,6,1,756,7,5,26,0,1,767,8,1,769,9,5,
+        11,0,5,27,0,7,650,0,7,624,0,5,31,0,5,30,0,7,22,0,7,676,0,7,678,0,
+        7,213,0,7,214,0,7,217,0,7,219,0,7,220,0,7,221,0,7,222,0,7,223,0,
+        7,225,0,7,226,0,7,227,0,7,228,0,7,229,0,7,230,0,7,234,0,7,235,0,
+        7,237,0,7,238,0,7,239,0,7,240,0,7,246,0,7,247,0,7,248,0,7,249,0,
+        7,250,0,7,251,0,7,252,0,7,254,0,7,255,0,7,256,0,7,257,0,7,260,0,
+        7,261,0,7,262,0,7,263,0,7,264,0,7,265,0,7,269,0,7,270,0,7,271,0,
+        7,272,0,7,273,0,7,275,0,7,276,0,7,277,0,7,278,0,7,279,0,7,282,0,
+        7,283,0,7,284,0,7,285,0,7,286,0,7,288,0,7,290,0,7,291,0,7,467,0,
+        7,470,0,7,468,0,7,469,0,7,472,0,7,473,0,7,471,0,7,474,0,7,475,0,
+        7,476,0,7,478,0,7,480,0,7,479,0,7,477,0,7,447,0,5,20,0,7,448,0,7,
+        449,0,7,451,0,7,452,0,7,690,0,7,443,0,7,54,0,7,485,0,7,486,0,7,487,
+        0,7,489,0,7,490,0,7,491,0,7,492,0,7,493,0,7,494,0,7,488,0,7,55,0,
+        7,495,0,7,496,0,7,497,0,7,498,0,7,499,0,7,500,0,7,501,0,7,502,0,
+        7,503,0,7,504,0,7,505,0,7,56,0,5,33,0,7,506,0,7,507,0,7,508,0,7,
+        509,0,7,510,0,7,511,0,7,512,0,7,513,0,7,57,0,7,514,0,7,515,0,7,58,
+        0,7,59,0,7,60,0,7,516,0,7,61,0,7,517,0,7,62,0,7,518,0,7,519,0,7,
+        63,0,7,520,0,7,521,0,7,522,0,7,523,0,7,524,0,7,525,0,7,64,0,7,526,
+        0,7,527,0,7,528,0,7,529,0,7,530,0,7,531,0,7,65,0,7,66,0,7,67,0,7,
+        68,0,7,532,0,7,533,0,7,69,0,7,70,0,7,71,0,7,72,0,7,73,0,7,74,0,7,
+        75,0,7,76,0,7,77,0,7,78,0,7,79,0,7,80,0,7,534,0,7,81,0,7,82,0,7,
+        83,0,7,535,0,7,84,0,7,536,0,7,537,0,7,538,0,7,539,0,7,540,0,7,541,
+        0,7,85,0,7,86,0,7,542,0,7,543,0,7,87,0,7,88,0,7,544,0,7,545,0,7,
+        546,0,7,547,0,7,548,0,7,89,0,7,549,0,7,550,0,7,551,0,7,552,0,7,553,
+        0,7,90,0,7,554,0,7,91,0,7,92,0,7,555,0,7,556,0,7,557,0,7,558,0,7,
+        559,0,7,560,0,7,93,0,7,94,0,7,561,0,7,562,0,7,95,0,7,96,0,7,97,0,
+        7,98,0,7,99,0,7,100,0,7,563,0,7,101,0,7,102,0,7,103,0,7,104,0,7,
+        564,0,7,105,0,7,106,0,7,107,0,7,565,0,7,566,0,7,108,0,7,567,0,7,
+        568,0,7,569,0,7,570,0,7,571,0,7,572,0,7,109,0,7,573,0,7,574,0,7,
+        575,0,7,576,0,7,110,0,7,111,0,7,112,0,7,577,0,7,578,0,7,579,0,7,
+        580,0,7,581,0,7,582,0,7,113,0,7,583,0,7,584,0,7,114,0,7,115,0,7,
+        585,0,7,586,0,1,1194,10,5,34,0,7,693,0,1,1206,11,5,36,0,1,1236,12,
+        5,40,0,5,45,0,5,43,0,5,44,0
+    ]
+
+class RpgLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    Selector = 1
+    DirectiveTitle = 2
+    DirectiveMode_Start = 3
+    CopyMode = 4
+    DirectiveMode = 5
+    CheckComment = 6
+    First5 = 7
+    SKIP_REMAINING_WS = 8
+    EndOfSourceMode = 9
+    FREE_Start = 10
+    FREE = 11
+    CheckDuration = 12
+    NumberContinuation = 13
+    FixedOpCodes = 14
+    FREE_ENDED = 15
+    InStringMode = 16
+    InDoubleStringMode = 17
+    EatCommentLinesPlus = 18
+    EatCommentLines = 19
+    InFactorStringMode = 20
+    FIXED_CommentMode = 21
+    FIXED_CommentMode_HIDDEN = 22
+    SQL_MODE = 23
+    FIXED_ProcedureSpec = 24
+    FIXED_DefSpec = 25
+    CONTINUATION_ELIPSIS = 26
+    CONTINUATION_ELIPSIS_2 = 27
+    FIXED_FileSpec = 28
+    FIXED_OutputSpec = 29
+    FIXED_OutputSpec_PGM1 = 30
+    FIXED_OutputSpec_PGMFIELD = 31
+    FIXED_CalcSpec = 32
+    FixedOpExtender = 33
+    FixedOpExtender2 = 34
+    FreeOpExtender = 35
+    FreeOpExtender2 = 36
+    OnOffIndicatorMode = 37
+    IndicatorMode = 38
+    FIXED_CalcSpec_SQL = 39
+    FIXED_CalcSpec_SQL_Comments = 40
+    FIXED_CalcSpec_X2 = 41
+    FIXED_InputSpec = 42
+    FIXED_I_EXT_FIELD_SPEC = 43
+    FIXED_I_EXT_REC_SPEC = 44
+    FIXED_I_FIELD_SPEC = 45
+    HeaderSpecMode = 46
+
+    END_SOURCE = 1
+    LEAD_WS5 = 2
+    LEAD_WS5_Comments = 3
+    EMPTY_LINE = 4
+    EMPTY_NEWLINE = 5
+    FREE_SPEC = 6
+    COMMENT_SPEC_FIXED = 7
+    DS_FIXED = 8
+    FS_FIXED = 9
+    OS_FIXED = 10
+    CS_FIXED = 11
+    CS_ExecSQL = 12
+    IS_FIXED = 13
+    PS_FIXED = 14
+    HS_FIXED = 15
+    BLANK_LINE = 16
+    BLANK_SPEC_LINE1 = 17
+    BLANK_SPEC_LINE = 18
+    COMMENTS = 19
+    DIRECTIVE = 20
+    NEWLINE = 21
+    WS = 22
+    GUTTER_COMMENTS = 23
+    DIR_FREE = 24
+    DIR_ENDFREE = 25
+    DIR_TITLE = 26
+    DIR_EJECT = 27
+    DIR_SPACE = 28
+    DIR_SET = 29
+    DIR_RESTORE = 30
+    DIR_COPY = 31
+    DIR_INCLUDE = 32
+    DIR_EOF = 33
+    DIR_DEFINE = 34
+    DIR_UNDEFINE = 35
+    DIR_IF = 36
+    DIR_ELSE = 37
+    DIR_ELSEIF = 38
+    DIR_ENDIF = 39
+    DIR_Start_Any = 40
+    COPY_WhiteSpace = 41
+    COPY_NA = 42
+    DIR_NOT = 43
+    DIR_DEFINED = 44
+    DIR_WhiteSpace = 45
+    DIR_OtherText = 46
+    DIR_Comma = 47
+    DIR_Slash = 48
+    CheckComment_NoSpace = 49
+    First5_LEAD_WS5 = 50
+    DIR_FREE_OTHER_TEXT = 51
+    EOS_Text = 52
+    OP_WS = 53
+    OP_ACQ = 54
+    OP_BEGSR = 55
+    OP_CALLP = 56
+    OP_CHAIN = 57
+    OP_CLEAR = 58
+    OP_CLOSE = 59
+    OP_COMMIT = 60
+    OP_DEALLOC = 61
+    OP_DELETE = 62
+    OP_DOU = 63
+    OP_DOW = 64
+    OP_DSPLY = 65
+    OP_DUMP = 66
+    OP_ELSE = 67
+    OP_ELSEIF = 68
+    OP_ENDDO = 69
+    OP_ENDFOR = 70
+    OP_ENDIF = 71
+    OP_ENDMON = 72
+    OP_ENDSL = 73
+    OP_ENDSR = 74
+    OP_EVAL = 75
+    OP_EVALR = 76
+    OP_EVAL_CORR = 77
+    OP_EXCEPT = 78
+    OP_EXFMT = 79
+    OP_EXSR = 80
+    OP_FEOD = 81
+    OP_FOR = 82
+    OP_FORCE = 83
+    OP_IF = 84
+    OP_IN = 85
+    OP_ITER = 86
+    OP_LEAVE = 87
+    OP_LEAVESR = 88
+    OP_MONITOR = 89
+    OP_NEXT = 90
+    OP_ON_ERROR = 91
+    OP_OPEN = 92
+    OP_OTHER = 93
+    OP_OUT = 94
+    OP_POST = 95
+    OP_READ = 96
+    OP_READC = 97
+    OP_READE = 98
+    OP_READP = 99
+    OP_READPE = 100
+    OP_REL = 101
+    OP_RESET = 102
+    OP_RETURN = 103
+    OP_ROLBK = 104
+    OP_SELECT = 105
+    OP_SETGT = 106
+    OP_SETLL = 107
+    OP_SORTA = 108
+    OP_TEST = 109
+    OP_UNLOCK = 110
+    OP_UPDATE = 111
+    OP_WHEN = 112
+    OP_WRITE = 113
+    OP_XML_INTO = 114
+    OP_XML_SAX = 115
+    DS_Standalone = 116
+    DS_DataStructureStart = 117
+    DS_DataStructureEnd = 118
+    DS_PrototypeStart = 119
+    DS_PrototypeEnd = 120
+    DS_Parm = 121
+    DS_SubField = 122
+    DS_ProcedureInterfaceStart = 123
+    DS_ProcedureInterfaceEnd = 124
+    DS_ProcedureStart = 125
+    DS_ProcedureEnd = 126
+    DS_Constant = 127
+    FS_FreeFile = 128
+    H_SPEC = 129
+    EXEC_SQL = 130
+    FREE_Start_NoSpace = 131
+    FREE_COMMENTS80 = 132
+    BIF_ABS = 133
+    BIF_ADDR = 134
+    BIF_ALLOC = 135
+    BIF_BITAND = 136
+    BIF_BITNOT = 137
+    BIF_BITOR = 138
+    BIF_BITXOR = 139
+    BIF_CHAR = 140
+    BIF_CHECK = 141
+    BIF_CHECKR = 142
+    BIF_DATE = 143
+    BIF_DAYS = 144
+    BIF_DEC = 145
+    BIF_DECH = 146
+    BIF_DECPOS = 147
+    BIF_DIFF = 148
+    BIF_DIV = 149
+    BIF_EDITC = 150
+    BIF_EDITFLT = 151
+    BIF_EDITW = 152
+    BIF_ELEM = 153
+    BIF_EOF = 154
+    BIF_EQUAL = 155
+    BIF_ERROR = 156
+    BIF_FIELDS = 157
+    BIF_FLOAT = 158
+    BIF_FOUND = 159
+    BIF_GRAPH = 160
+    BIF_HANDLER = 161
+    BIF_HOURS = 162
+    BIF_INT = 163
+    BIF_INTH = 164
+    BIF_KDS = 165
+    BIF_LEN = 166
+    BIF_LOOKUP = 167
+    BIF_LOOKUPLT = 168
+    BIF_LOOKUPLE = 169
+    BIF_LOOKUPGT = 170
+    BIF_LOOKUPGE = 171
+    BIF_MINUTES = 172
+    BIF_MONTHS = 173
+    BIF_MSECONDS = 174
+    BIF_NULLIND = 175
+    BIF_OCCUR = 176
+    BIF_OPEN = 177
+    BIF_PADDR = 178
+    BIF_PARMS = 179
+    BIF_PARMNUM = 180
+    BIF_REALLOC = 181
+    BIF_REM = 182
+    BIF_REPLACE = 183
+    BIF_SCAN = 184
+    BIF_SCANRPL = 185
+    BIF_SECONDS = 186
+    BIF_SHTDN = 187
+    BIF_SIZE = 188
+    BIF_SQRT = 189
+    BIF_STATUS = 190
+    BIF_STR = 191
+    BIF_SUBARR = 192
+    BIF_SUBDT = 193
+    BIF_SUBST = 194
+    BIF_THIS = 195
+    BIF_TIME = 196
+    BIF_TIMESTAMP = 197
+    BIF_TLOOKUP = 198
+    BIF_TLOOKUPLT = 199
+    BIF_TLOOKUPLE = 200
+    BIF_TLOOKUPGT = 201
+    BIF_TLOOKUPGE = 202
+    BIF_TRIM = 203
+    BIF_TRIML = 204
+    BIF_TRIMR = 205
+    BIF_UCS2 = 206
+    BIF_UNS = 207
+    BIF_UNSH = 208
+    BIF_XFOOT = 209
+    BIF_XLATE = 210
+    BIF_XML = 211
+    BIF_YEARS = 212
+    SPLAT_ALL = 213
+    SPLAT_NONE = 214
+    SPLAT_YES = 215
+    SPLAT_NO = 216
+    SPLAT_ILERPG = 217
+    SPLAT_COMPAT = 218
+    SPLAT_CRTBNDRPG = 219
+    SPLAT_CRTRPGMOD = 220
+    SPLAT_VRM = 221
+    SPLAT_ALLG = 222
+    SPLAT_ALLU = 223
+    SPLAT_ALLTHREAD = 224
+    SPLAT_ALLX = 225
+    SPLAT_BLANKS = 226
+    SPLAT_CANCL = 227
+    SPLAT_CYMD = 228
+    SPLAT_CMDY = 229
+    SPLAT_CDMY = 230
+    SPLAT_MDY = 231
+    SPLAT_DMY = 232
+    SPLAT_DFT = 233
+    SPLAT_YMD = 234
+    SPLAT_JUL = 235
+    SPLAT_JAVA = 236
+    SPLAT_ISO = 237
+    SPLAT_USA = 238
+    SPLAT_EUR = 239
+    SPLAT_JIS = 240
+    SPLAT_DATE = 241
+    SPLAT_DAY = 242
+    SPLAT_DETC = 243
+    SPLAT_DETL = 244
+    SPLAT_DTAARA = 245
+    SPLAT_END = 246
+    SPLAT_ENTRY = 247
+    SPLAT_EQUATE = 248
+    SPLAT_EXTDFT = 249
+    SPLAT_EXT = 250
+    SPLAT_FILE = 251
+    SPLAT_GETIN = 252
+    SPLAT_HIVAL = 253
+    SPLAT_INIT = 254
+    SPLAT_INDICATOR = 255
+    SPLAT_INZSR = 256
+    SPLAT_IN = 257
+    SPLAT_INPUT = 258
+    SPLAT_OUTPUT = 259
+    SPLAT_JOBRUN = 260
+    SPLAT_JOB = 261
+    SPLAT_LDA = 262
+    SPLAT_LIKE = 263
+    SPLAT_LONGJUL = 264
+    SPLAT_LOVAL = 265
+    SPLAT_KEY = 266
+    SPLAT_MONTH = 267
+    SPLAT_NEXT = 268
+    SPLAT_NOIND = 269
+    SPLAT_NOKEY = 270
+    SPLAT_NULL = 271
+    SPLAT_OFL = 272
+    SPLAT_ON = 273
+    SPLAT_ONLY = 274
+    SPLAT_OFF = 275
+    SPLAT_PDA = 276
+    SPLAT_PLACE = 277
+    SPLAT_PSSR = 278
+    SPLAT_ROUTINE = 279
+    SPLAT_START = 280
+    SPLAT_SYS = 281
+    SPLAT_TERM = 282
+    SPLAT_TOTC = 283
+    SPLAT_TOTL = 284
+    SPLAT_USER = 285
+    SPLAT_VAR = 286
+    SPLAT_YEAR = 287
+    SPLAT_ZEROS = 288
+    SPLAT_HMS = 289
+    SPLAT_INLR = 290
+    SPLAT_INOF = 291
+    SPLAT_DATA = 292
+    SPLAT_ASTFILL = 293
+    SPLAT_CURSYM = 294
+    SPLAT_MAX = 295
+    SPLAT_LOCK = 296
+    SPLAT_PROGRAM = 297
+    SPLAT_EXTDESC = 298
+    SPLAT_STRING = 299
+    SPLAT_CONSTRUCTOR = 300
+    SPLAT_LIKEDS = 301
+    SPLAT_VARSIZE = 302
+    SPLAT_NOPASS = 303
+    SPLAT_PROC = 304
+    SPLAT_STATUS = 305
+    UDATE = 306
+    DATE = 307
+    UMONTH = 308
+    MONTH = 309
+    UYEAR = 310
+    YEAR = 311
+    UDAY = 312
+    DAY = 313
+    PAGE = 314
+    CHAR = 315
+    VARCHAR = 316
+    UCS2 = 317
+    DATE_ = 318
+    VARUCS2 = 319
+    GRAPH = 320
+    VARGRAPH = 321
+    IND = 322
+    PACKED = 323
+    ZONED = 324
+    BINDEC = 325
+    INT = 326
+    UNS = 327
+    FLOAT = 328
+    TIME = 329
+    TIMESTAMP = 330
+    POINTER = 331
+    OBJECT = 332
+    KEYWORD_ALIAS = 333
+    KEYWORD_ALIGN = 334
+    KEYWORD_ALT = 335
+    KEYWORD_ALTSEQ = 336
+    KEYWORD_ASCEND = 337
+    KEYWORD_BASED = 338
+    KEYWORD_CCSID = 339
+    KEYWORD_CLASS = 340
+    KEYWORD_CONST = 341
+    KEYWORD_CTDATA = 342
+    KEYWORD_DATFMT = 343
+    KEYWORD_DESCEND = 344
+    KEYWORD_DIM = 345
+    KEYWORD_DTAARA = 346
+    KEYWORD_EXPORT = 347
+    KEYWORD_EXT = 348
+    KEYWORD_EXTFLD = 349
+    KEYWORD_EXTFMT = 350
+    KEYWORD_EXTNAME = 351
+    KEYWORD_EXTPGM = 352
+    KEYWORD_EXTPROC = 353
+    KEYWORD_FROMFILE = 354
+    KEYWORD_IMPORT = 355
+    KEYWORD_INZ = 356
+    KEYWORD_LEN = 357
+    KEYWORD_LIKEDS = 358
+    KEYWORD_LIKE = 359
+    KEYWORD_LIKEFILE = 360
+    KEYWORD_LIKEREC = 361
+    KEYWORD_NOOPT = 362
+    KEYWORD_OCCURS = 363
+    KEYWORD_OPDESC = 364
+    KEYWORD_OPTIONS = 365
+    KEYWORD_OVERLAY = 366
+    KEYWORD_PACKEVEN = 367
+    KEYWORD_PERRCD = 368
+    KEYWORD_PREFIX = 369
+    KEYWORD_POS = 370
+    KEYWORD_PROCPTR = 371
+    KEYWORD_QUALIFIED = 372
+    KEYWORD_RTNPARM = 373
+    KEYWORD_STATIC = 374
+    KEYWORD_TEMPLATE = 375
+    KEYWORD_TIMFMT = 376
+    KEYWORD_TOFILE = 377
+    KEYWORD_VALUE = 378
+    KEYWORD_VARYING = 379
+    KEYWORD_BLOCK = 380
+    KEYWORD_COMMIT = 381
+    KEYWORD_DEVID = 382
+    KEYWORD_EXTDESC = 383
+    KEYWORD_EXTFILE = 384
+    KEYWORD_EXTIND = 385
+    KEYWORD_EXTMBR = 386
+    KEYWORD_FORMLEN = 387
+    KEYWORD_FORMOFL = 388
+    KEYWORD_IGNORE = 389
+    KEYWORD_INCLUDE = 390
+    KEYWORD_INDDS = 391
+    KEYWORD_INFDS = 392
+    KEYWORD_INFSR = 393
+    KEYWORD_KEYLOC = 394
+    KEYWORD_MAXDEV = 395
+    KEYWORD_OFLIND = 396
+    KEYWORD_PASS = 397
+    KEYWORD_PGMNAME = 398
+    KEYWORD_PLIST = 399
+    KEYWORD_PRTCTL = 400
+    KEYWORD_RAFDATA = 401
+    KEYWORD_RECNO = 402
+    KEYWORD_RENAME = 403
+    KEYWORD_SAVEDS = 404
+    KEYWORD_SAVEIND = 405
+    KEYWORD_SFILE = 406
+    KEYWORD_SLN = 407
+    KEYWORD_SQLTYPE = 408
+    KEYWORD_USROPN = 409
+    KEYWORD_DISK = 410
+    KEYWORD_WORKSTN = 411
+    KEYWORD_PRINTER = 412
+    KEYWORD_SPECIAL = 413
+    KEYWORD_KEYED = 414
+    KEYWORD_USAGE = 415
+    KEYWORD_PSDS = 416
+    AMPERSAND = 417
+    AND = 418
+    OR = 419
+    NOT = 420
+    PLUS = 421
+    MINUS = 422
+    EXP = 423
+    ARRAY_REPEAT = 424
+    MULT_NOSPACE = 425
+    MULT = 426
+    DIV = 427
+    CPLUS = 428
+    CMINUS = 429
+    CMULT = 430
+    CDIV = 431
+    CEXP = 432
+    GT = 433
+    LT = 434
+    GE = 435
+    LE = 436
+    NE = 437
+    OPEN_PAREN = 438
+    CLOSE_PAREN = 439
+    FREE_DOT = 440
+    NUMBER = 441
+    EQUAL = 442
+    COLON = 443
+    FREE_BY = 444
+    FREE_TO = 445
+    FREE_DOWNTO = 446
+    HexLiteralStart = 447
+    DateLiteralStart = 448
+    TimeLiteralStart = 449
+    TimeStampLiteralStart = 450
+    GraphicLiteralStart = 451
+    UCS2LiteralStart = 452
+    StringLiteralStart = 453
+    ID = 454
+    FREE_COMMENTS = 455
+    FREE_WS = 456
+    C_FREE_CONTINUATION = 457
+    D_FREE_CONTINUATION = 458
+    F_FREE_CONTINUATION = 459
+    FREE_LEAD_WS5 = 460
+    FREE_LEAD_WS5_Comments = 461
+    FREE_FREE_SPEC = 462
+    C_FREE_NEWLINE = 463
+    FREE_NEWLINE = 464
+    FREE_SEMI = 465
+    CheckDuration_WS = 466
+    SPLAT_D = 467
+    SPLAT_H = 468
+    SPLAT_HOURS = 469
+    SPLAT_DAYS = 470
+    SPLAT_M = 471
+    SPLAT_MINUTES = 472
+    SPLAT_MONTHS = 473
+    SPLAT_MN = 474
+    SPLAT_MS = 475
+    SPLAT_MSECONDS = 476
+    SPLAT_S = 477
+    SPLAT_SECONDS = 478
+    SPLAT_Y = 479
+    SPLAT_YEARS = 480
+    CheckDuration_ANY = 481
+    NumberContinuation_CONTINUATION = 482
+    NumberPart = 483
+    NumberContinuation_ANY = 484
+    OP_ADD = 485
+    OP_ADDDUR = 486
+    OP_ALLOC = 487
+    OP_ANDxx = 488
+    OP_ANDEQ = 489
+    OP_ANDNE = 490
+    OP_ANDLE = 491
+    OP_ANDLT = 492
+    OP_ANDGE = 493
+    OP_ANDGT = 494
+    OP_BITOFF = 495
+    OP_BITON = 496
+    OP_CABxx = 497
+    OP_CABEQ = 498
+    OP_CABNE = 499
+    OP_CABLE = 500
+    OP_CABLT = 501
+    OP_CABGE = 502
+    OP_CABGT = 503
+    OP_CALL = 504
+    OP_CALLB = 505
+    OP_CASEQ = 506
+    OP_CASNE = 507
+    OP_CASLE = 508
+    OP_CASLT = 509
+    OP_CASGE = 510
+    OP_CASGT = 511
+    OP_CAS = 512
+    OP_CAT = 513
+    OP_CHECK = 514
+    OP_CHECKR = 515
+    OP_COMP = 516
+    OP_DEFINE = 517
+    OP_DIV = 518
+    OP_DO = 519
+    OP_DOUEQ = 520
+    OP_DOUNE = 521
+    OP_DOULE = 522
+    OP_DOULT = 523
+    OP_DOUGE = 524
+    OP_DOUGT = 525
+    OP_DOWEQ = 526
+    OP_DOWNE = 527
+    OP_DOWLE = 528
+    OP_DOWLT = 529
+    OP_DOWGE = 530
+    OP_DOWGT = 531
+    OP_END = 532
+    OP_ENDCS = 533
+    OP_EXTRCT = 534
+    OP_GOTO = 535
+    OP_IFEQ = 536
+    OP_IFNE = 537
+    OP_IFLE = 538
+    OP_IFLT = 539
+    OP_IFGE = 540
+    OP_IFGT = 541
+    OP_KFLD = 542
+    OP_KLIST = 543
+    OP_LOOKUP = 544
+    OP_MHHZO = 545
+    OP_MHLZO = 546
+    OP_MLHZO = 547
+    OP_MLLZO = 548
+    OP_MOVE = 549
+    OP_MOVEA = 550
+    OP_MOVEL = 551
+    OP_MULT = 552
+    OP_MVR = 553
+    OP_OCCUR = 554
+    OP_OREQ = 555
+    OP_ORNE = 556
+    OP_ORLE = 557
+    OP_ORLT = 558
+    OP_ORGE = 559
+    OP_ORGT = 560
+    OP_PARM = 561
+    OP_PLIST = 562
+    OP_REALLOC = 563
+    OP_SCAN = 564
+    OP_SETOFF = 565
+    OP_SETON = 566
+    OP_SHTDN = 567
+    OP_SQRT = 568
+    OP_SUB = 569
+    OP_SUBDUR = 570
+    OP_SUBST = 571
+    OP_TAG = 572
+    OP_TESTB = 573
+    OP_TESTN = 574
+    OP_TESTZ = 575
+    OP_TIME = 576
+    OP_WHENEQ = 577
+    OP_WHENNE = 578
+    OP_WHENLE = 579
+    OP_WHENLT = 580
+    OP_WHENGE = 581
+    OP_WHENGT = 582
+    OP_XFOOT = 583
+    OP_XLATE = 584
+    OP_Z_ADD = 585
+    OP_Z_SUB = 586
+    FE_BLANKS = 587
+    FE_COMMENTS = 588
+    FE_NEWLINE = 589
+    StringContent = 590
+    StringEscapedQuote = 591
+    StringLiteralEnd = 592
+    FIXED_FREE_STRING_CONTINUATION = 593
+    FIXED_FREE_STRING_CONTINUATION_MINUS = 594
+    FREE_STRING_CONTINUATION_PLUS = 595
+    FREE_STRING_CONTINUATION_MINUS = 596
+    PlusOrMinus = 597
+    EatCommentLinesPlus_Any = 598
+    EatCommentLines_WhiteSpace = 599
+    EatCommentLines_StarComment = 600
+    FIXED_FREE_STRING_CONTINUATION_Part2 = 601
+    EatCommentLines_NothingLeft = 602
+    InFactor_EndFactor = 603
+    BLANK_COMMENTS_TEXT = 604
+    COMMENTS_TEXT = 605
+    COMMENTS_EOL = 606
+    COMMENTS_TEXT_SKIP = 607
+    COMMENTS_TEXT_HIDDEN = 608
+    COMMENTS_EOL_HIDDEN = 609
+    SQL_WS = 610
+    SEMI = 611
+    WORDS = 612
+    PS_NAME = 613
+    PS_CONTINUATION_NAME = 614
+    PS_CONTINUATION = 615
+    PS_RESERVED1 = 616
+    PS_BEGIN = 617
+    PS_END = 618
+    PS_RESERVED2 = 619
+    PS_KEYWORDS = 620
+    PS_WS80 = 621
+    PS_COMMENTS80 = 622
+    PS_Any = 623
+    BLANK_SPEC = 624
+    CONTINUATION_NAME = 625
+    CONTINUATION = 626
+    NAME = 627
+    EXTERNAL_DESCRIPTION = 628
+    DATA_STRUCTURE_TYPE = 629
+    DEF_TYPE_C = 630
+    DEF_TYPE_PI = 631
+    DEF_TYPE_PR = 632
+    DEF_TYPE_DS = 633
+    DEF_TYPE_S = 634
+    DEF_TYPE_BLANK = 635
+    DEF_TYPE = 636
+    FROM_POSITION = 637
+    TO_POSITION = 638
+    DATA_TYPE = 639
+    DECIMAL_POSITIONS = 640
+    RESERVED = 641
+    D_WS = 642
+    D_COMMENTS80 = 643
+    EOL = 644
+    CE_WS = 645
+    CE_Start_NEWLINE = 646
+    CE_Start_WS5 = 647
+    CE_LEAD_WS5_Comments = 648
+    CE_NEWLINE = 649
+    CE_COMMENTS80 = 650
+    CE2_WS = 651
+    CE_D_SPEC_FIXED = 652
+    CE_P_SPEC_FIXED = 653
+    CE2_NEWLINE = 654
+    FS_RecordName = 655
+    FS_Type = 656
+    FS_Designation = 657
+    FS_EndOfFile = 658
+    FS_Addution = 659
+    FS_Sequence = 660
+    FS_Format = 661
+    FS_RecordLength = 662
+    FS_Limits = 663
+    FS_LengthOfKey = 664
+    FS_RecordAddressType = 665
+    FS_Organization = 666
+    FS_Device = 667
+    FS_Reserved = 668
+    FS_WhiteSpace = 669
+    OS_RecordName = 670
+    OS_AndOr = 671
+    OS_FieldReserved = 672
+    OS_Type = 673
+    OS_AddDelete = 674
+    OS_FetchOverflow = 675
+    OS_ExceptName = 676
+    OS_Space3 = 677
+    OS_RemainingSpace = 678
+    OS_Comments = 679
+    OS_FieldName = 680
+    OS_EditNames = 681
+    OS_BlankAfter = 682
+    OS_Reserved1 = 683
+    OS_EndPosition = 684
+    OS_DataFormat = 685
+    OS_Any = 686
+    CS_BlankFactor = 687
+    CS_FactorWs = 688
+    CS_FactorWs2 = 689
+    CS_FactorContent = 690
+    CS_OperationAndExtender_Blank = 691
+    CS_OperationAndExtender_WS = 692
+    CS_OperationAndExtender = 693
+    CS_FieldLength = 694
+    CS_DecimalPositions = 695
+    CS_WhiteSpace = 696
+    CS_Comments = 697
+    CS_FixedComments = 698
+    CS_FixedOperationAndExtender_WS = 699
+    CS_FixedOperationExtenderReturn = 700
+    CS_FixedOperationAndExtender2_WS = 701
+    CS_FixedOperationExtender2Return = 702
+    FreeOpExtender_Any = 703
+    FreeOpExtender2_WS = 704
+    BlankFlag = 705
+    NoFlag = 706
+    BlankIndicator = 707
+    GeneralIndicator = 708
+    FunctionKeyIndicator = 709
+    ControlLevelIndicator = 710
+    ControlLevel0Indicator = 711
+    LastRecordIndicator = 712
+    MatchingRecordIndicator = 713
+    HaltIndicator = 714
+    ReturnIndicator = 715
+    ExternalIndicator = 716
+    OverflowIndicator = 717
+    SubroutineIndicator = 718
+    AndIndicator = 719
+    OrIndicator = 720
+    DoubleSplatIndicator = 721
+    FirstPageIndicator = 722
+    OtherTextIndicator = 723
+    CSQL_EMPTY_TEXT = 724
+    CSQL_TEXT = 725
+    CSQL_LEADBLANK = 726
+    CSQL_LEADWS = 727
+    CSQL_END = 728
+    CSQL_CONT = 729
+    CSQL_CSplat = 730
+    CSQL_EOL = 731
+    CSQL_Any = 732
+    CSQLC_LEADWS = 733
+    CSQLC_CSplat = 734
+    CSQLC_WS = 735
+    CSQLC_Comments = 736
+    CSQLC_Any = 737
+    C2_FACTOR2_CONT = 738
+    C2_FACTOR2 = 739
+    C2_OTHER = 740
+    IS_FileName = 741
+    IS_FieldReserved = 742
+    IS_ExtFieldReserved = 743
+    IS_LogicalRelationship = 744
+    IS_ExtRecordReserved = 745
+    IS_Sequence = 746
+    IS_Number = 747
+    IS_Option = 748
+    IS_RecordIdCode = 749
+    IS_WS = 750
+    IS_COMMENTS = 751
+    IF_Name = 752
+    IF_Reserved = 753
+    IF_FieldName = 754
+    IF_Reserved2 = 755
+    IF_WS = 756
+    IFD_DATA_ATTR = 757
+    IFD_DATETIME_SEP = 758
+    IFD_DATA_FORMAT = 759
+    IFD_FIELD_LOCATION = 760
+    IFD_DECIMAL_POSITIONS = 761
+    IFD_FIELD_NAME = 762
+    IFD_CONTROL_LEVEL = 763
+    IFD_MATCHING_FIELDS = 764
+    IFD_BLANKS = 765
+    IFD_COMMENTS = 766
+    HS_WhiteSpace = 767
+    HS_CONTINUATION = 768
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE", "Selector", "DirectiveTitle", "DirectiveMode_Start", 
+                  "CopyMode", "DirectiveMode", "CheckComment", "First5", 
+                  "SKIP_REMAINING_WS", "EndOfSourceMode", "FREE_Start", 
+                  "FREE", "CheckDuration", "NumberContinuation", "FixedOpCodes", 
+                  "FREE_ENDED", "InStringMode", "InDoubleStringMode", "EatCommentLinesPlus", 
+                  "EatCommentLines", "InFactorStringMode", "FIXED_CommentMode", 
+                  "FIXED_CommentMode_HIDDEN", "SQL_MODE", "FIXED_ProcedureSpec", 
+                  "FIXED_DefSpec", "CONTINUATION_ELIPSIS", "CONTINUATION_ELIPSIS_2", 
+                  "FIXED_FileSpec", "FIXED_OutputSpec", "FIXED_OutputSpec_PGM1", 
+                  "FIXED_OutputSpec_PGMFIELD", "FIXED_CalcSpec", "FixedOpExtender", 
+                  "FixedOpExtender2", "FreeOpExtender", "FreeOpExtender2", 
+                  "OnOffIndicatorMode", "IndicatorMode", "FIXED_CalcSpec_SQL", 
+                  "FIXED_CalcSpec_SQL_Comments", "FIXED_CalcSpec_X2", "FIXED_InputSpec", 
+                  "FIXED_I_EXT_FIELD_SPEC", "FIXED_I_EXT_REC_SPEC", "FIXED_I_FIELD_SPEC", 
+                  "HeaderSpecMode" ]
+
+    literalNames = [ "<INVALID>",
+            "'&'", "'+'", "'-'", "'/'", "'+='", "'-='", "'*='", "'/='", 
+            "'**='", "'>'", "'<'", "'>='", "'<='", "'<>'", "'('", "')'", 
+            "'.'", "'='", "'                                                                           '", 
+            "'                             '", "'              '", "'          '" ]
+
+    symbolicNames = [ "<INVALID>",
+            "END_SOURCE", "LEAD_WS5", "LEAD_WS5_Comments", "EMPTY_LINE", 
+            "EMPTY_NEWLINE", "FREE_SPEC", "COMMENT_SPEC_FIXED", "DS_FIXED", 
+            "FS_FIXED", "OS_FIXED", "CS_FIXED", "CS_ExecSQL", "IS_FIXED", 
+            "PS_FIXED", "HS_FIXED", "BLANK_LINE", "BLANK_SPEC_LINE1", "BLANK_SPEC_LINE", 
+            "COMMENTS", "DIRECTIVE", "NEWLINE", "WS", "GUTTER_COMMENTS", 
+            "DIR_FREE", "DIR_ENDFREE", "DIR_TITLE", "DIR_EJECT", "DIR_SPACE", 
+            "DIR_SET", "DIR_RESTORE", "DIR_COPY", "DIR_INCLUDE", "DIR_EOF", 
+            "DIR_DEFINE", "DIR_UNDEFINE", "DIR_IF", "DIR_ELSE", "DIR_ELSEIF", 
+            "DIR_ENDIF", "DIR_Start_Any", "COPY_WhiteSpace", "COPY_NA", 
+            "DIR_NOT", "DIR_DEFINED", "DIR_WhiteSpace", "DIR_OtherText", 
+            "DIR_Comma", "DIR_Slash", "CheckComment_NoSpace", "First5_LEAD_WS5", 
+            "DIR_FREE_OTHER_TEXT", "EOS_Text", "OP_WS", "OP_ACQ", "OP_BEGSR", 
+            "OP_CALLP", "OP_CHAIN", "OP_CLEAR", "OP_CLOSE", "OP_COMMIT", 
+            "OP_DEALLOC", "OP_DELETE", "OP_DOU", "OP_DOW", "OP_DSPLY", "OP_DUMP", 
+            "OP_ELSE", "OP_ELSEIF", "OP_ENDDO", "OP_ENDFOR", "OP_ENDIF", 
+            "OP_ENDMON", "OP_ENDSL", "OP_ENDSR", "OP_EVAL", "OP_EVALR", 
+            "OP_EVAL_CORR", "OP_EXCEPT", "OP_EXFMT", "OP_EXSR", "OP_FEOD", 
+            "OP_FOR", "OP_FORCE", "OP_IF", "OP_IN", "OP_ITER", "OP_LEAVE", 
+            "OP_LEAVESR", "OP_MONITOR", "OP_NEXT", "OP_ON_ERROR", "OP_OPEN", 
+            "OP_OTHER", "OP_OUT", "OP_POST", "OP_READ", "OP_READC", "OP_READE", 
+            "OP_READP", "OP_READPE", "OP_REL", "OP_RESET", "OP_RETURN", 
+            "OP_ROLBK", "OP_SELECT", "OP_SETGT", "OP_SETLL", "OP_SORTA", 
+            "OP_TEST", "OP_UNLOCK", "OP_UPDATE", "OP_WHEN", "OP_WRITE", 
+            "OP_XML_INTO", "OP_XML_SAX", "DS_Standalone", "DS_DataStructureStart", 
+            "DS_DataStructureEnd", "DS_PrototypeStart", "DS_PrototypeEnd", 
+            "DS_Parm", "DS_SubField", "DS_ProcedureInterfaceStart", "DS_ProcedureInterfaceEnd", 
+            "DS_ProcedureStart", "DS_ProcedureEnd", "DS_Constant", "FS_FreeFile", 
+            "H_SPEC", "EXEC_SQL", "FREE_Start_NoSpace", "FREE_COMMENTS80", 
+            "BIF_ABS", "BIF_ADDR", "BIF_ALLOC", "BIF_BITAND", "BIF_BITNOT", 
+            "BIF_BITOR", "BIF_BITXOR", "BIF_CHAR", "BIF_CHECK", "BIF_CHECKR", 
+            "BIF_DATE", "BIF_DAYS", "BIF_DEC", "BIF_DECH", "BIF_DECPOS", 
+            "BIF_DIFF", "BIF_DIV", "BIF_EDITC", "BIF_EDITFLT", "BIF_EDITW", 
+            "BIF_ELEM", "BIF_EOF", "BIF_EQUAL", "BIF_ERROR", "BIF_FIELDS", 
+            "BIF_FLOAT", "BIF_FOUND", "BIF_GRAPH", "BIF_HANDLER", "BIF_HOURS", 
+            "BIF_INT", "BIF_INTH", "BIF_KDS", "BIF_LEN", "BIF_LOOKUP", "BIF_LOOKUPLT", 
+            "BIF_LOOKUPLE", "BIF_LOOKUPGT", "BIF_LOOKUPGE", "BIF_MINUTES", 
+            "BIF_MONTHS", "BIF_MSECONDS", "BIF_NULLIND", "BIF_OCCUR", "BIF_OPEN", 
+            "BIF_PADDR", "BIF_PARMS", "BIF_PARMNUM", "BIF_REALLOC", "BIF_REM", 
+            "BIF_REPLACE", "BIF_SCAN", "BIF_SCANRPL", "BIF_SECONDS", "BIF_SHTDN", 
+            "BIF_SIZE", "BIF_SQRT", "BIF_STATUS", "BIF_STR", "BIF_SUBARR", 
+            "BIF_SUBDT", "BIF_SUBST", "BIF_THIS", "BIF_TIME", "BIF_TIMESTAMP", 
+            "BIF_TLOOKUP", "BIF_TLOOKUPLT", "BIF_TLOOKUPLE", "BIF_TLOOKUPGT", 
+            "BIF_TLOOKUPGE", "BIF_TRIM", "BIF_TRIML", "BIF_TRIMR", "BIF_UCS2", 
+            "BIF_UNS", "BIF_UNSH", "BIF_XFOOT", "BIF_XLATE", "BIF_XML", 
+            "BIF_YEARS", "SPLAT_ALL", "SPLAT_NONE", "SPLAT_YES", "SPLAT_NO", 
+            "SPLAT_ILERPG", "SPLAT_COMPAT", "SPLAT_CRTBNDRPG", "SPLAT_CRTRPGMOD", 
+            "SPLAT_VRM", "SPLAT_ALLG", "SPLAT_ALLU", "SPLAT_ALLTHREAD", 
+            "SPLAT_ALLX", "SPLAT_BLANKS", "SPLAT_CANCL", "SPLAT_CYMD", "SPLAT_CMDY", 
+            "SPLAT_CDMY", "SPLAT_MDY", "SPLAT_DMY", "SPLAT_DFT", "SPLAT_YMD", 
+            "SPLAT_JUL", "SPLAT_JAVA", "SPLAT_ISO", "SPLAT_USA", "SPLAT_EUR", 
+            "SPLAT_JIS", "SPLAT_DATE", "SPLAT_DAY", "SPLAT_DETC", "SPLAT_DETL", 
+            "SPLAT_DTAARA", "SPLAT_END", "SPLAT_ENTRY", "SPLAT_EQUATE", 
+            "SPLAT_EXTDFT", "SPLAT_EXT", "SPLAT_FILE", "SPLAT_GETIN", "SPLAT_HIVAL", 
+            "SPLAT_INIT", "SPLAT_INDICATOR", "SPLAT_INZSR", "SPLAT_IN", 
+            "SPLAT_INPUT", "SPLAT_OUTPUT", "SPLAT_JOBRUN", "SPLAT_JOB", 
+            "SPLAT_LDA", "SPLAT_LIKE", "SPLAT_LONGJUL", "SPLAT_LOVAL", "SPLAT_KEY", 
+            "SPLAT_MONTH", "SPLAT_NEXT", "SPLAT_NOIND", "SPLAT_NOKEY", "SPLAT_NULL", 
+            "SPLAT_OFL", "SPLAT_ON", "SPLAT_ONLY", "SPLAT_OFF", "SPLAT_PDA", 
+            "SPLAT_PLACE", "SPLAT_PSSR", "SPLAT_ROUTINE", "SPLAT_START", 
+            "SPLAT_SYS", "SPLAT_TERM", "SPLAT_TOTC", "SPLAT_TOTL", "SPLAT_USER", 
+            "SPLAT_VAR", "SPLAT_YEAR", "SPLAT_ZEROS", "SPLAT_HMS", "SPLAT_INLR", 
+            "SPLAT_INOF", "SPLAT_DATA", "SPLAT_ASTFILL", "SPLAT_CURSYM", 
+            "SPLAT_MAX", "SPLAT_LOCK", "SPLAT_PROGRAM", "SPLAT_EXTDESC", 
+            "SPLAT_STRING", "SPLAT_CONSTRUCTOR", "SPLAT_LIKEDS", "SPLAT_VARSIZE", 
+            "SPLAT_NOPASS", "SPLAT_PROC", "SPLAT_STATUS", "UDATE", "DATE", 
+            "UMONTH", "MONTH", "UYEAR", "YEAR", "UDAY", "DAY", "PAGE", "CHAR", 
+            "VARCHAR", "UCS2", "DATE_", "VARUCS2", "GRAPH", "VARGRAPH", 
+            "IND", "PACKED", "ZONED", "BINDEC", "INT", "UNS", "FLOAT", "TIME", 
+            "TIMESTAMP", "POINTER", "OBJECT", "KEYWORD_ALIAS", "KEYWORD_ALIGN", 
+            "KEYWORD_ALT", "KEYWORD_ALTSEQ", "KEYWORD_ASCEND", "KEYWORD_BASED", 
+            "KEYWORD_CCSID", "KEYWORD_CLASS", "KEYWORD_CONST", "KEYWORD_CTDATA", 
+            "KEYWORD_DATFMT", "KEYWORD_DESCEND", "KEYWORD_DIM", "KEYWORD_DTAARA", 
+            "KEYWORD_EXPORT", "KEYWORD_EXT", "KEYWORD_EXTFLD", "KEYWORD_EXTFMT", 
+            "KEYWORD_EXTNAME", "KEYWORD_EXTPGM", "KEYWORD_EXTPROC", "KEYWORD_FROMFILE", 
+            "KEYWORD_IMPORT", "KEYWORD_INZ", "KEYWORD_LEN", "KEYWORD_LIKEDS", 
+            "KEYWORD_LIKE", "KEYWORD_LIKEFILE", "KEYWORD_LIKEREC", "KEYWORD_NOOPT", 
+            "KEYWORD_OCCURS", "KEYWORD_OPDESC", "KEYWORD_OPTIONS", "KEYWORD_OVERLAY", 
+            "KEYWORD_PACKEVEN", "KEYWORD_PERRCD", "KEYWORD_PREFIX", "KEYWORD_POS", 
+            "KEYWORD_PROCPTR", "KEYWORD_QUALIFIED", "KEYWORD_RTNPARM", "KEYWORD_STATIC", 
+            "KEYWORD_TEMPLATE", "KEYWORD_TIMFMT", "KEYWORD_TOFILE", "KEYWORD_VALUE", 
+            "KEYWORD_VARYING", "KEYWORD_BLOCK", "KEYWORD_COMMIT", "KEYWORD_DEVID", 
+            "KEYWORD_EXTDESC", "KEYWORD_EXTFILE", "KEYWORD_EXTIND", "KEYWORD_EXTMBR", 
+            "KEYWORD_FORMLEN", "KEYWORD_FORMOFL", "KEYWORD_IGNORE", "KEYWORD_INCLUDE", 
+            "KEYWORD_INDDS", "KEYWORD_INFDS", "KEYWORD_INFSR", "KEYWORD_KEYLOC", 
+            "KEYWORD_MAXDEV", "KEYWORD_OFLIND", "KEYWORD_PASS", "KEYWORD_PGMNAME", 
+            "KEYWORD_PLIST", "KEYWORD_PRTCTL", "KEYWORD_RAFDATA", "KEYWORD_RECNO", 
+            "KEYWORD_RENAME", "KEYWORD_SAVEDS", "KEYWORD_SAVEIND", "KEYWORD_SFILE", 
+            "KEYWORD_SLN", "KEYWORD_SQLTYPE", "KEYWORD_USROPN", "KEYWORD_DISK", 
+            "KEYWORD_WORKSTN", "KEYWORD_PRINTER", "KEYWORD_SPECIAL", "KEYWORD_KEYED", 
+            "KEYWORD_USAGE", "KEYWORD_PSDS", "AMPERSAND", "AND", "OR", "NOT", 
+            "PLUS", "MINUS", "EXP", "ARRAY_REPEAT", "MULT_NOSPACE", "MULT", 
+            "DIV", "CPLUS", "CMINUS", "CMULT", "CDIV", "CEXP", "GT", "LT", 
+            "GE", "LE", "NE", "OPEN_PAREN", "CLOSE_PAREN", "FREE_DOT", "NUMBER", 
+            "EQUAL", "COLON", "FREE_BY", "FREE_TO", "FREE_DOWNTO", "HexLiteralStart", 
+            "DateLiteralStart", "TimeLiteralStart", "TimeStampLiteralStart", 
+            "GraphicLiteralStart", "UCS2LiteralStart", "StringLiteralStart", 
+            "ID", "FREE_COMMENTS", "FREE_WS", "C_FREE_CONTINUATION", "D_FREE_CONTINUATION", 
+            "F_FREE_CONTINUATION", "FREE_LEAD_WS5", "FREE_LEAD_WS5_Comments", 
+            "FREE_FREE_SPEC", "C_FREE_NEWLINE", "FREE_NEWLINE", "FREE_SEMI", 
+            "CheckDuration_WS", "SPLAT_D", "SPLAT_H", "SPLAT_HOURS", "SPLAT_DAYS", 
+            "SPLAT_M", "SPLAT_MINUTES", "SPLAT_MONTHS", "SPLAT_MN", "SPLAT_MS", 
+            "SPLAT_MSECONDS", "SPLAT_S", "SPLAT_SECONDS", "SPLAT_Y", "SPLAT_YEARS", 
+            "CheckDuration_ANY", "NumberContinuation_CONTINUATION", "NumberPart", 
+            "NumberContinuation_ANY", "OP_ADD", "OP_ADDDUR", "OP_ALLOC", 
+            "OP_ANDxx", "OP_ANDEQ", "OP_ANDNE", "OP_ANDLE", "OP_ANDLT", 
+            "OP_ANDGE", "OP_ANDGT", "OP_BITOFF", "OP_BITON", "OP_CABxx", 
+            "OP_CABEQ", "OP_CABNE", "OP_CABLE", "OP_CABLT", "OP_CABGE", 
+            "OP_CABGT", "OP_CALL", "OP_CALLB", "OP_CASEQ", "OP_CASNE", "OP_CASLE", 
+            "OP_CASLT", "OP_CASGE", "OP_CASGT", "OP_CAS", "OP_CAT", "OP_CHECK", 
+            "OP_CHECKR", "OP_COMP", "OP_DEFINE", "OP_DIV", "OP_DO", "OP_DOUEQ", 
+            "OP_DOUNE", "OP_DOULE", "OP_DOULT", "OP_DOUGE", "OP_DOUGT", 
+            "OP_DOWEQ", "OP_DOWNE", "OP_DOWLE", "OP_DOWLT", "OP_DOWGE", 
+            "OP_DOWGT", "OP_END", "OP_ENDCS", "OP_EXTRCT", "OP_GOTO", "OP_IFEQ", 
+            "OP_IFNE", "OP_IFLE", "OP_IFLT", "OP_IFGE", "OP_IFGT", "OP_KFLD", 
+            "OP_KLIST", "OP_LOOKUP", "OP_MHHZO", "OP_MHLZO", "OP_MLHZO", 
+            "OP_MLLZO", "OP_MOVE", "OP_MOVEA", "OP_MOVEL", "OP_MULT", "OP_MVR", 
+            "OP_OCCUR", "OP_OREQ", "OP_ORNE", "OP_ORLE", "OP_ORLT", "OP_ORGE", 
+            "OP_ORGT", "OP_PARM", "OP_PLIST", "OP_REALLOC", "OP_SCAN", "OP_SETOFF", 
+            "OP_SETON", "OP_SHTDN", "OP_SQRT", "OP_SUB", "OP_SUBDUR", "OP_SUBST", 
+            "OP_TAG", "OP_TESTB", "OP_TESTN", "OP_TESTZ", "OP_TIME", "OP_WHENEQ", 
+            "OP_WHENNE", "OP_WHENLE", "OP_WHENLT", "OP_WHENGE", "OP_WHENGT", 
+            "OP_XFOOT", "OP_XLATE", "OP_Z_ADD", "OP_Z_SUB", "FE_BLANKS", 
+            "FE_COMMENTS", "FE_NEWLINE", "StringContent", "StringEscapedQuote", 
+            "StringLiteralEnd", "FIXED_FREE_STRING_CONTINUATION", "FIXED_FREE_STRING_CONTINUATION_MINUS", 
+            "FREE_STRING_CONTINUATION_PLUS", "FREE_STRING_CONTINUATION_MINUS", 
+            "PlusOrMinus", "EatCommentLinesPlus_Any", "EatCommentLines_WhiteSpace", 
+            "EatCommentLines_StarComment", "FIXED_FREE_STRING_CONTINUATION_Part2", 
+            "EatCommentLines_NothingLeft", "InFactor_EndFactor", "BLANK_COMMENTS_TEXT", 
+            "COMMENTS_TEXT", "COMMENTS_EOL", "COMMENTS_TEXT_SKIP", "COMMENTS_TEXT_HIDDEN", 
+            "COMMENTS_EOL_HIDDEN", "SQL_WS", "SEMI", "WORDS", "PS_NAME", 
+            "PS_CONTINUATION_NAME", "PS_CONTINUATION", "PS_RESERVED1", "PS_BEGIN", 
+            "PS_END", "PS_RESERVED2", "PS_KEYWORDS", "PS_WS80", "PS_COMMENTS80", 
+            "PS_Any", "BLANK_SPEC", "CONTINUATION_NAME", "CONTINUATION", 
+            "NAME", "EXTERNAL_DESCRIPTION", "DATA_STRUCTURE_TYPE", "DEF_TYPE_C", 
+            "DEF_TYPE_PI", "DEF_TYPE_PR", "DEF_TYPE_DS", "DEF_TYPE_S", "DEF_TYPE_BLANK", 
+            "DEF_TYPE", "FROM_POSITION", "TO_POSITION", "DATA_TYPE", "DECIMAL_POSITIONS", 
+            "RESERVED", "D_WS", "D_COMMENTS80", "EOL", "CE_WS", "CE_Start_NEWLINE", 
+            "CE_Start_WS5", "CE_LEAD_WS5_Comments", "CE_NEWLINE", "CE_COMMENTS80", 
+            "CE2_WS", "CE_D_SPEC_FIXED", "CE_P_SPEC_FIXED", "CE2_NEWLINE", 
+            "FS_RecordName", "FS_Type", "FS_Designation", "FS_EndOfFile", 
+            "FS_Addution", "FS_Sequence", "FS_Format", "FS_RecordLength", 
+            "FS_Limits", "FS_LengthOfKey", "FS_RecordAddressType", "FS_Organization", 
+            "FS_Device", "FS_Reserved", "FS_WhiteSpace", "OS_RecordName", 
+            "OS_AndOr", "OS_FieldReserved", "OS_Type", "OS_AddDelete", "OS_FetchOverflow", 
+            "OS_ExceptName", "OS_Space3", "OS_RemainingSpace", "OS_Comments", 
+            "OS_FieldName", "OS_EditNames", "OS_BlankAfter", "OS_Reserved1", 
+            "OS_EndPosition", "OS_DataFormat", "OS_Any", "CS_BlankFactor", 
+            "CS_FactorWs", "CS_FactorWs2", "CS_FactorContent", "CS_OperationAndExtender_Blank", 
+            "CS_OperationAndExtender_WS", "CS_OperationAndExtender", "CS_FieldLength", 
+            "CS_DecimalPositions", "CS_WhiteSpace", "CS_Comments", "CS_FixedComments", 
+            "CS_FixedOperationAndExtender_WS", "CS_FixedOperationExtenderReturn", 
+            "CS_FixedOperationAndExtender2_WS", "CS_FixedOperationExtender2Return", 
+            "FreeOpExtender_Any", "FreeOpExtender2_WS", "BlankFlag", "NoFlag", 
+            "BlankIndicator", "GeneralIndicator", "FunctionKeyIndicator", 
+            "ControlLevelIndicator", "ControlLevel0Indicator", "LastRecordIndicator", 
+            "MatchingRecordIndicator", "HaltIndicator", "ReturnIndicator", 
+            "ExternalIndicator", "OverflowIndicator", "SubroutineIndicator", 
+            "AndIndicator", "OrIndicator", "DoubleSplatIndicator", "FirstPageIndicator", 
+            "OtherTextIndicator", "CSQL_EMPTY_TEXT", "CSQL_TEXT", "CSQL_LEADBLANK", 
+            "CSQL_LEADWS", "CSQL_END", "CSQL_CONT", "CSQL_CSplat", "CSQL_EOL", 
+            "CSQL_Any", "CSQLC_LEADWS", "CSQLC_CSplat", "CSQLC_WS", "CSQLC_Comments", 
+            "CSQLC_Any", "C2_FACTOR2_CONT", "C2_FACTOR2", "C2_OTHER", "IS_FileName", 
+            "IS_FieldReserved", "IS_ExtFieldReserved", "IS_LogicalRelationship", 
+            "IS_ExtRecordReserved", "IS_Sequence", "IS_Number", "IS_Option", 
+            "IS_RecordIdCode", "IS_WS", "IS_COMMENTS", "IF_Name", "IF_Reserved", 
+            "IF_FieldName", "IF_Reserved2", "IF_WS", "IFD_DATA_ATTR", "IFD_DATETIME_SEP", 
+            "IFD_DATA_FORMAT", "IFD_FIELD_LOCATION", "IFD_DECIMAL_POSITIONS", 
+            "IFD_FIELD_NAME", "IFD_CONTROL_LEVEL", "IFD_MATCHING_FIELDS", 
+            "IFD_BLANKS", "IFD_COMMENTS", "HS_WhiteSpace", "HS_CONTINUATION" ]
+
+    ruleNames = [ "END_SOURCE", "LEAD_WS5", "LEAD_WS5_Comments", "EMPTY_LINE", 
+                  "EMPTY_NEWLINE", "WORD5", "NAME5", "NAMECHAR", "INITNAMECHAR", 
+                  "WORD_WCOLON", "WORD5_WCOLON", "FREE_SPEC", "COMMENT_SPEC_FIXED", 
+                  "DS_FIXED", "FS_FIXED", "OS_FIXED", "CS_FIXED", "CS_ExecSQL", 
+                  "IS_FIXED", "PS_FIXED", "HS_FIXED", "BLANK_LINE", "BLANK_SPEC_LINE1", 
+                  "BLANK_SPEC_LINE", "COMMENTS", "DIRECTIVE", "NEWLINE", 
+                  "WS", "GUTTER_COMMENTS", "TITLE_Text", "TITLE_EOL", "DIR_FREE", 
+                  "DIR_ENDFREE", "DIR_TITLE", "DIR_EJECT", "DIR_SPACE", 
+                  "DIR_SET", "DIR_RESTORE", "DIR_COPY", "DIR_INCLUDE", "DIR_EOF", 
+                  "DIR_DEFINE", "DIR_UNDEFINE", "DIR_IF", "DIR_ELSE", "DIR_ELSEIF", 
+                  "DIR_ENDIF", "DIR_Start_Any", "COPY_WhiteSpace", "COPY_OtherText", 
+                  "COPY_Comma", "COPY_Slash", "COPY_EOL", "COPY_Comment", 
+                  "COPY_DblStringLiteralStart", "COPY_StringLiteralStart", 
+                  "COPY_NA", "DIR_NOT", "DIR_DEFINED", "DIR_Number", "DIR_WhiteSpace", 
+                  "DIR_OtherText", "DIR_Comma", "DIR_Slash", "DIR_OpenParen", 
+                  "DIR_CloseParen", "DIR_DblStringLiteralStart", "DIR_StringLiteralStart", 
+                  "DIR_EOL", "CheckComment_COMMENT_SPEC_FIXED", "CheckComment_NoSpace", 
+                  "First5_LEAD_WS5", "First5_LEAD_WS5_Comments", "DIR_FREE_OTHER_TEXT", 
+                  "EOS_Text", "EOS_EOL", "OP_WS", "OP_ACQ", "OP_BEGSR", 
+                  "OP_CALLP", "OP_CHAIN", "OP_CLEAR", "OP_CLOSE", "OP_COMMIT", 
+                  "OP_DEALLOC", "OP_DELETE", "OP_DOU", "OP_DOW", "OP_DSPLY", 
+                  "OP_DUMP", "OP_ELSE", "OP_ELSEIF", "OP_ENDDO", "OP_ENDFOR", 
+                  "OP_ENDIF", "OP_ENDMON", "OP_ENDSL", "OP_ENDSR", "OP_EVAL", 
+                  "OP_EVALR", "OP_EVAL_CORR", "OP_EXCEPT", "OP_EXFMT", "OP_EXSR", 
+                  "OP_FEOD", "OP_FOR", "OP_FORCE", "OP_IF", "OP_IN", "OP_ITER", 
+                  "OP_LEAVE", "OP_LEAVESR", "OP_MONITOR", "OP_NEXT", "OP_ON_ERROR", 
+                  "OP_OPEN", "OP_OTHER", "OP_OUT", "OP_POST", "OP_READ", 
+                  "OP_READC", "OP_READE", "OP_READP", "OP_READPE", "OP_REL", 
+                  "OP_RESET", "OP_RETURN", "OP_ROLBK", "OP_SELECT", "OP_SETGT", 
+                  "OP_SETLL", "OP_SORTA", "OP_TEST", "OP_UNLOCK", "OP_UPDATE", 
+                  "OP_WHEN", "OP_WRITE", "OP_XML_INTO", "OP_XML_SAX", "DS_Standalone", 
+                  "DS_DataStructureStart", "DS_DataStructureEnd", "DS_PrototypeStart", 
+                  "DS_PrototypeEnd", "DS_Parm", "DS_SubField", "DS_ProcedureInterfaceStart", 
+                  "DS_ProcedureInterfaceEnd", "DS_ProcedureStart", "DS_ProcedureEnd", 
+                  "DS_Constant", "FS_FreeFile", "H_SPEC", "EXEC_SQL", "FREE_Start_KEYWORD_ALIAS", 
+                  "FREE_Start_KEYWORD_ALIGN", "FREE_Start_KEYWORD_ALT", 
+                  "FREE_Start_KEYWORD_ALTSEQ", "FREE_Start_KEYWORD_ASCEND", 
+                  "FREE_Start_KEYWORD_BASED", "FREE_Start_KEYWORD_CCSID", 
+                  "FREE_Start_KEYWORD_CLASS", "FREE_Start_KEYWORD_CONST", 
+                  "FREE_Start_KEYWORD_CTDATA", "FREE_Start_KEYWORD_DATFMT", 
+                  "FREE_Start_KEYWORD_DESCEND", "FREE_Start_KEYWORD_DIM", 
+                  "FREE_Start_KEYWORD_DTAARA", "FREE_Start_KEYWORD_EXPORT", 
+                  "FREE_Start_KEYWORD_EXT", "FREE_Start_KEYWORD_EXTFLD", 
+                  "FREE_Start_KEYWORD_EXTFMT", "FREE_Start_KEYWORD_EXTNAME", 
+                  "FREE_Start_KEYWORD_EXTPGM", "FREE_Start_KEYWORD_EXTPROC", 
+                  "FREE_Start_KEYWORD_FROMFILE", "FREE_Start_KEYWORD_IMPORT", 
+                  "FREE_Start_KEYWORD_INZ", "FREE_Start_KEYWORD_LEN", "FREE_Start_KEYWORD_LIKEDS", 
+                  "FREE_Start_KEYWORD_LIKE", "FREE_Start_KEYWORD_LIKEFILE", 
+                  "FREE_Start_KEYWORD_LIKEREC", "FREE_Start_KEYWORD_NOOPT", 
+                  "FREE_Start_KEYWORD_OCCURS", "FREE_Start_KEYWORD_OPDESC", 
+                  "FREE_Start_KEYWORD_OPTIONS", "FREE_Start_KEYWORD_OVERLAY", 
+                  "FREE_Start_KEYWORD_PACKEVEN", "FREE_Start_KEYWORD_PERRCD", 
+                  "FREE_Start_KEYWORD_PREFIX", "FREE_Start_KEYWORD_POS", 
+                  "FREE_Start_KEYWORD_PROCPTR", "FREE_Start_KEYWORD_QUALIFIED", 
+                  "FREE_Start_KEYWORD_RTNPARM", "FREE_Start_KEYWORD_STATIC", 
+                  "FREE_Start_KEYWORD_TEMPLATE", "FREE_Start_KEYWORD_TIMFMT", 
+                  "FREE_Start_KEYWORD_TOFILE", "FREE_Start_KEYWORD_VALUE", 
+                  "FREE_Start_KEYWORD_VARYING", "FREE_Start_KEYWORD_BLOCK", 
+                  "FREE_Start_KEYWORD_COMMIT", "FREE_Start_KEYWORD_DEVID", 
+                  "FREE_Start_KEYWORD_EXTDESC", "FREE_Start_KEYWORD_EXTFILE", 
+                  "FREE_Start_KEYWORD_EXTIND", "FREE_Start_KEYWORD_EXTMBR", 
+                  "FREE_Start_KEYWORD_FORMLEN", "FREE_Start_KEYWORD_FORMOFL", 
+                  "FREE_Start_KEYWORD_IGNORE", "FREE_Start_KEYWORD_INCLUDE", 
+                  "FREE_Start_KEYWORD_INDDS", "FREE_Start_KEYWORD_INFDS", 
+                  "FREE_Start_KEYWORD_INFSR", "FREE_Start_KEYWORD_KEYLOC", 
+                  "FREE_Start_KEYWORD_MAXDEV", "FREE_Start_KEYWORD_OFLIND", 
+                  "FREE_Start_KEYWORD_PASS", "FREE_Start_KEYWORD_PGMNAME", 
+                  "FREE_Start_KEYWORD_PLIST", "FREE_Start_KEYWORD_PRTCTL", 
+                  "FREE_Start_KEYWORD_RAFDATA", "FREE_Start_KEYWORD_RECNO", 
+                  "FREE_Start_KEYWORD_RENAME", "FREE_Start_KEYWORD_SAVEDS", 
+                  "FREE_Start_KEYWORD_SAVEIND", "FREE_Start_KEYWORD_SFILE", 
+                  "FREE_Start_KEYWORD_SLN", "FREE_Start_KEYWORD_SQLTYPE", 
+                  "FREE_Start_KEYWORD_USROPN", "FREE_Start_KEYWORD_DISK", 
+                  "FREE_Start_KEYWORD_WORKSTN", "FREE_Start_KEYWORD_PRINTER", 
+                  "FREE_Start_KEYWORD_SPECIAL", "FREE_Start_KEYWORD_KEYED", 
+                  "FREE_Start_KEYWORD_USAGE", "FREE_Start_KEYWORD_PSDS", 
+                  "FREE_Start_ID", "FREE_GUTTER_COMMENTS", "FREE_Start_NoSpace", 
+                  "Inline_DS_DataStructureEnd", "FREE_CONT", "FREE_COMMENTS80", 
+                  "BIF_ABS", "BIF_ADDR", "BIF_ALLOC", "BIF_BITAND", "BIF_BITNOT", 
+                  "BIF_BITOR", "BIF_BITXOR", "BIF_CHAR", "BIF_CHECK", "BIF_CHECKR", 
+                  "BIF_DATE", "BIF_DAYS", "BIF_DEC", "BIF_DECH", "BIF_DECPOS", 
+                  "BIF_DIFF", "BIF_DIV", "BIF_EDITC", "BIF_EDITFLT", "BIF_EDITW", 
+                  "BIF_ELEM", "BIF_EOF", "BIF_EQUAL", "BIF_ERROR", "BIF_FIELDS", 
+                  "BIF_FLOAT", "BIF_FOUND", "BIF_GRAPH", "BIF_HANDLER", 
+                  "BIF_HOURS", "BIF_INT", "BIF_INTH", "BIF_KDS", "BIF_LEN", 
+                  "BIF_LOOKUP", "BIF_LOOKUPLT", "BIF_LOOKUPLE", "BIF_LOOKUPGT", 
+                  "BIF_LOOKUPGE", "BIF_MINUTES", "BIF_MONTHS", "BIF_MSECONDS", 
+                  "BIF_NULLIND", "BIF_OCCUR", "BIF_OPEN", "BIF_PADDR", "BIF_PARMS", 
+                  "BIF_PARMNUM", "BIF_REALLOC", "BIF_REM", "BIF_REPLACE", 
+                  "BIF_SCAN", "BIF_SCANRPL", "BIF_SECONDS", "BIF_SHTDN", 
+                  "BIF_SIZE", "BIF_SQRT", "BIF_STATUS", "BIF_STR", "BIF_SUBARR", 
+                  "BIF_SUBDT", "BIF_SUBST", "BIF_THIS", "BIF_TIME", "BIF_TIMESTAMP", 
+                  "BIF_TLOOKUP", "BIF_TLOOKUPLT", "BIF_TLOOKUPLE", "BIF_TLOOKUPGT", 
+                  "BIF_TLOOKUPGE", "BIF_TRIM", "BIF_TRIML", "BIF_TRIMR", 
+                  "BIF_UCS2", "BIF_UNS", "BIF_UNSH", "BIF_XFOOT", "BIF_XLATE", 
+                  "BIF_XML", "BIF_YEARS", "SPLAT_ALL", "SPLAT_NONE", "SPLAT_YES", 
+                  "SPLAT_NO", "SPLAT_ILERPG", "SPLAT_COMPAT", "SPLAT_CRTBNDRPG", 
+                  "SPLAT_CRTRPGMOD", "SPLAT_VRM", "SPLAT_ALLG", "SPLAT_ALLU", 
+                  "SPLAT_ALLTHREAD", "SPLAT_ALLX", "SPLAT_BLANKS", "SPLAT_CANCL", 
+                  "SPLAT_CYMD", "SPLAT_CMDY", "SPLAT_CDMY", "SPLAT_MDY", 
+                  "SPLAT_DMY", "SPLAT_DFT", "SPLAT_YMD", "SPLAT_JUL", "SPLAT_JAVA", 
+                  "SPLAT_ISO", "SPLAT_USA", "SPLAT_EUR", "SPLAT_JIS", "SPLAT_DATE", 
+                  "SPLAT_DAY", "SPLAT_DETC", "SPLAT_DETL", "SPLAT_DTAARA", 
+                  "SPLAT_END", "SPLAT_ENTRY", "SPLAT_EQUATE", "SPLAT_EXTDFT", 
+                  "SPLAT_EXT", "SPLAT_FILE", "SPLAT_GETIN", "SPLAT_HIVAL", 
+                  "SPLAT_INIT", "SPLAT_INDICATOR", "SPLAT_INZSR", "SPLAT_IN", 
+                  "SPLAT_INPUT", "SPLAT_OUTPUT", "SPLAT_JOBRUN", "SPLAT_JOB", 
+                  "SPLAT_LDA", "SPLAT_LIKE", "SPLAT_LONGJUL", "SPLAT_LOVAL", 
+                  "SPLAT_KEY", "SPLAT_MONTH", "SPLAT_NEXT", "SPLAT_NOIND", 
+                  "SPLAT_NOKEY", "SPLAT_NULL", "SPLAT_OFL", "SPLAT_ON", 
+                  "SPLAT_ONLY", "SPLAT_OFF", "SPLAT_PDA", "SPLAT_PLACE", 
+                  "SPLAT_PSSR", "SPLAT_ROUTINE", "SPLAT_START", "SPLAT_SYS", 
+                  "SPLAT_TERM", "SPLAT_TOTC", "SPLAT_TOTL", "SPLAT_USER", 
+                  "SPLAT_VAR", "SPLAT_YEAR", "SPLAT_ZEROS", "SPLAT_HMS", 
+                  "SPLAT_INLR", "SPLAT_INOF", "SPLAT_DATA", "SPLAT_ASTFILL", 
+                  "SPLAT_CURSYM", "SPLAT_MAX", "SPLAT_LOCK", "SPLAT_PROGRAM", 
+                  "SPLAT_EXTDESC", "SPLAT_STRING", "SPLAT_CONSTRUCTOR", 
+                  "SPLAT_LIKEDS", "SPLAT_VARSIZE", "SPLAT_NOPASS", "SPLAT_PROC", 
+                  "SPLAT_STATUS", "UDATE", "DATE", "UMONTH", "MONTH", "UYEAR", 
+                  "YEAR", "UDAY", "DAY", "PAGE", "CHAR", "VARCHAR", "UCS2", 
+                  "DATE_", "VARUCS2", "GRAPH", "VARGRAPH", "IND", "PACKED", 
+                  "ZONED", "BINDEC", "INT", "UNS", "FLOAT", "TIME", "TIMESTAMP", 
+                  "POINTER", "OBJECT", "KEYWORD_ALIAS", "KEYWORD_ALIGN", 
+                  "KEYWORD_ALT", "KEYWORD_ALTSEQ", "KEYWORD_ASCEND", "KEYWORD_BASED", 
+                  "KEYWORD_CCSID", "KEYWORD_CLASS", "KEYWORD_CONST", "KEYWORD_CTDATA", 
+                  "KEYWORD_DATFMT", "KEYWORD_DESCEND", "KEYWORD_DIM", "KEYWORD_DTAARA", 
+                  "KEYWORD_EXPORT", "KEYWORD_EXT", "KEYWORD_EXTFLD", "KEYWORD_EXTFMT", 
+                  "KEYWORD_EXTNAME", "KEYWORD_EXTPGM", "KEYWORD_EXTPROC", 
+                  "KEYWORD_FROMFILE", "KEYWORD_IMPORT", "KEYWORD_INZ", "KEYWORD_LEN", 
+                  "KEYWORD_LIKEDS", "KEYWORD_LIKE", "KEYWORD_LIKEFILE", 
+                  "KEYWORD_LIKEREC", "KEYWORD_NOOPT", "KEYWORD_OCCURS", 
+                  "KEYWORD_OPDESC", "KEYWORD_OPTIONS", "KEYWORD_OVERLAY", 
+                  "KEYWORD_PACKEVEN", "KEYWORD_PERRCD", "KEYWORD_PREFIX", 
+                  "KEYWORD_POS", "KEYWORD_PROCPTR", "KEYWORD_QUALIFIED", 
+                  "KEYWORD_RTNPARM", "KEYWORD_STATIC", "KEYWORD_TEMPLATE", 
+                  "KEYWORD_TIMFMT", "KEYWORD_TOFILE", "KEYWORD_VALUE", "KEYWORD_VARYING", 
+                  "KEYWORD_BLOCK", "KEYWORD_COMMIT", "KEYWORD_DEVID", "KEYWORD_EXTDESC", 
+                  "KEYWORD_EXTFILE", "KEYWORD_EXTIND", "KEYWORD_EXTMBR", 
+                  "KEYWORD_FORMLEN", "KEYWORD_FORMOFL", "KEYWORD_IGNORE", 
+                  "KEYWORD_INCLUDE", "KEYWORD_INDDS", "KEYWORD_INFDS", "KEYWORD_INFSR", 
+                  "KEYWORD_KEYLOC", "KEYWORD_MAXDEV", "KEYWORD_OFLIND", 
+                  "KEYWORD_PASS", "KEYWORD_PGMNAME", "KEYWORD_PLIST", "KEYWORD_PRTCTL", 
+                  "KEYWORD_RAFDATA", "KEYWORD_RECNO", "KEYWORD_RENAME", 
+                  "KEYWORD_SAVEDS", "KEYWORD_SAVEIND", "KEYWORD_SFILE", 
+                  "KEYWORD_SLN", "KEYWORD_SQLTYPE", "KEYWORD_USROPN", "KEYWORD_DISK", 
+                  "KEYWORD_WORKSTN", "KEYWORD_PRINTER", "KEYWORD_SPECIAL", 
+                  "KEYWORD_KEYED", "KEYWORD_USAGE", "KEYWORD_PSDS", "AMPERSAND", 
+                  "AND", "OR", "NOT", "PLUS", "MINUS", "EXP", "ARRAY_REPEAT", 
+                  "MULT_NOSPACE", "MULT", "DIV", "CPLUS", "CMINUS", "CMULT", 
+                  "CDIV", "CEXP", "GT", "LT", "GE", "LE", "NE", "OPEN_PAREN", 
+                  "CLOSE_PAREN", "FREE_DOT", "FREE_NUMBER_CONT", "NUMBER", 
+                  "EQUAL", "COLON", "FREE_BY", "FREE_TO", "FREE_DOWNTO", 
+                  "FREE_ID", "HexLiteralStart", "DateLiteralStart", "TimeLiteralStart", 
+                  "TimeStampLiteralStart", "GraphicLiteralStart", "UCS2LiteralStart", 
+                  "StringLiteralStart", "ID", "FREE_COMMENTS", "FREE_WS", 
+                  "FREE_CONTINUATION", "C_FREE_CONTINUATION_DOTS", "D_FREE_CONTINUATION_DOTS", 
+                  "C_FREE_CONTINUATION", "D_FREE_CONTINUATION", "F_FREE_CONTINUATION", 
+                  "FREE_LEAD_WS5", "FREE_LEAD_WS5_Comments", "FREE_FREE_SPEC", 
+                  "C_FREE_NEWLINE", "O_FREE_NEWLINE", "D_FREE_NEWLINE", 
+                  "F_FREE_NEWLINE", "FREE_NEWLINE", "FREE_SEMI", "CheckDuration_WS", 
+                  "SPLAT_D", "SPLAT_H", "SPLAT_HOURS", "SPLAT_DAYS", "SPLAT_M", 
+                  "SPLAT_MINUTES", "SPLAT_MONTHS", "SPLAT_MN", "SPLAT_MS", 
+                  "SPLAT_MSECONDS", "SPLAT_S", "SPLAT_SECONDS", "SPLAT_Y", 
+                  "SPLAT_YEARS", "CheckDuration_SPLAT_DATA", "CheckDuration_SPLAT_DATE", 
+                  "CheckDuration_SPLAT_DAY", "CheckDuration_SPLAT_DETC", 
+                  "CheckDuration_SPLAT_DETL", "CheckDuration_SPLAT_DMY", 
+                  "CheckDuration_SPLAT_HIVAL", "CheckDuration_SPLAT_HMS", 
+                  "CheckDuration_SPLAT_MAX", "CheckDuration_SPLAT_MDY", 
+                  "CheckDuration_SPLAT_MONTH", "CheckDuration_SPLAT_DTAARA", 
+                  "CheckDuration_SPLAT_START", "CheckDuration_SPLAT_STRING", 
+                  "CheckDuration_SPLAT_STATUS", "CheckDuration_SPLAT_SYS", 
+                  "CheckDuration_SPLAT_YEAR", "CheckDuration_ANY", "NumberContinuation_CONTINUATION", 
+                  "NumberPart", "NumberContinuation_ANY", "OP_ADD", "OP_ADDDUR", 
+                  "OP_ALLOC", "OP_ANDxx", "OP_ANDEQ", "OP_ANDNE", "OP_ANDLE", 
+                  "OP_ANDLT", "OP_ANDGE", "OP_ANDGT", "OP_BITOFF", "OP_BITON", 
+                  "OP_CABxx", "OP_CABEQ", "OP_CABNE", "OP_CABLE", "OP_CABLT", 
+                  "OP_CABGE", "OP_CABGT", "OP_CALL", "OP_CALLB", "OP_CASEQ", 
+                  "OP_CASNE", "OP_CASLE", "OP_CASLT", "OP_CASGE", "OP_CASGT", 
+                  "OP_CAS", "OP_CAT", "OP_CHECK", "OP_CHECKR", "OP_COMP", 
+                  "OP_DEFINE", "OP_DIV", "OP_DO", "OP_DOUEQ", "OP_DOUNE", 
+                  "OP_DOULE", "OP_DOULT", "OP_DOUGE", "OP_DOUGT", "OP_DOWEQ", 
+                  "OP_DOWNE", "OP_DOWLE", "OP_DOWLT", "OP_DOWGE", "OP_DOWGT", 
+                  "OP_END", "OP_ENDCS", "OP_EXTRCT", "OP_GOTO", "OP_IFEQ", 
+                  "OP_IFNE", "OP_IFLE", "OP_IFLT", "OP_IFGE", "OP_IFGT", 
+                  "OP_KFLD", "OP_KLIST", "OP_LOOKUP", "OP_MHHZO", "OP_MHLZO", 
+                  "OP_MLHZO", "OP_MLLZO", "OP_MOVE", "OP_MOVEA", "OP_MOVEL", 
+                  "OP_MULT", "OP_MVR", "OP_OCCUR", "OP_OREQ", "OP_ORNE", 
+                  "OP_ORLE", "OP_ORLT", "OP_ORGE", "OP_ORGT", "OP_PARM", 
+                  "OP_PLIST", "OP_REALLOC", "OP_SCAN", "OP_SETOFF", "OP_SETON", 
+                  "OP_SHTDN", "OP_SQRT", "OP_SUB", "OP_SUBDUR", "OP_SUBST", 
+                  "OP_TAG", "OP_TESTB", "OP_TESTN", "OP_TESTZ", "OP_TIME", 
+                  "OP_WHENEQ", "OP_WHENNE", "OP_WHENLE", "OP_WHENLT", "OP_WHENGE", 
+                  "OP_WHENGT", "OP_XFOOT", "OP_XLATE", "OP_Z_ADD", "OP_Z_SUB", 
+                  "FE_BLANKS", "FE_COMMENTS", "FE_NEWLINE", "StringContent", 
+                  "StringEscapedQuote", "StringLiteralEnd", "FIXED_FREE_STRING_CONTINUATION", 
+                  "FIXED_FREE_STRING_CONTINUATION_MINUS", "FREE_STRING_CONTINUATION_PLUS", 
+                  "FREE_STRING_CONTINUATION_MINUS", "PlusOrMinus", "DblStringContent", 
+                  "DblStringLiteralEnd", "EatCommentLinesPlus_Any", "EatCommentLines_WhiteSpace", 
+                  "EatCommentLines_StarComment", "FIXED_FREE_STRING_CONTINUATION_Part2", 
+                  "EatCommentLines_NothingLeft", "InFactor_StringContent", 
+                  "InFactor_StringEscapedQuote", "InFactor_StringLiteralEnd", 
+                  "InFactor_EndFactor", "BLANK_COMMENTS_TEXT", "COMMENTS_TEXT", 
+                  "COMMENTS_EOL", "COMMENTS_TEXT_SKIP", "COMMENTS_TEXT_HIDDEN", 
+                  "COMMENTS_EOL_HIDDEN", "COMMENTS_EOL_HIDDEN_FREE", "SQL_WS", 
+                  "SEMI", "WORDS", "PS_NAME", "PS_CONTINUATION_NAME", "PS_CONTINUATION", 
+                  "PS_RESERVED1", "PS_BEGIN", "PS_END", "PS_RESERVED2", 
+                  "PS_KEYWORDS", "PS_WS80", "PS_COMMENTS80", "PS_Any", "BLANK_SPEC", 
+                  "CONTINUATION_NAME", "CONTINUATION", "NAME", "EXTERNAL_DESCRIPTION", 
+                  "DATA_STRUCTURE_TYPE", "DEF_TYPE_C", "DEF_TYPE_PI", "DEF_TYPE_PR", 
+                  "DEF_TYPE_DS", "DEF_TYPE_S", "DEF_TYPE_BLANK", "DEF_TYPE", 
+                  "FROM_POSITION", "TO_POSITION", "DATA_TYPE", "DECIMAL_POSITIONS", 
+                  "RESERVED", "D_WS", "D_COMMENTS80", "EOL", "CE_WS", "CE_Start_NEWLINE", 
+                  "CE_Start_WS5", "CE_LEAD_WS5_Comments", "CE_NEWLINE", 
+                  "CE_COMMENTS80", "CE2_WS", "CE2_COMMENTS80", "CE_D_SPEC_FIXED", 
+                  "CE_P_SPEC_FIXED", "CE2_NEWLINE", "FS_BLANK_SPEC", "FS_RecordName", 
+                  "FS_Type", "FS_Designation", "FS_EndOfFile", "FS_Addution", 
+                  "FS_Sequence", "FS_Format", "FS_RecordLength", "FS_Limits", 
+                  "FS_LengthOfKey", "FS_RecordAddressType", "FS_Organization", 
+                  "FS_Device", "FS_Reserved", "FS_WhiteSpace", "FS_EOL", 
+                  "OS_BLANK_SPEC", "OS_RecordName", "OS_AndOr", "OS_FieldReserved", 
+                  "OS_Type", "OS_AddDelete", "OS_FetchOverflow", "OS_ExceptName", 
+                  "OS_Space3", "OS_RemainingSpace", "OS_Comments", "OS_WS", 
+                  "OS_EOL", "O1_ExceptName", "O1_RemainingSpace", "OS_FieldName", 
+                  "OS_EditNames", "OS_BlankAfter", "OS_Reserved1", "OS_EndPosition", 
+                  "OS_DataFormat", "OS_Any", "CS_Factor1_SPLAT_ALL", "CS_Factor1_SPLAT_NONE", 
+                  "CS_Factor1_SPLAT_ILERPG", "CS_Factor1_SPLAT_CRTBNDRPG", 
+                  "CS_Factor1_SPLAT_CRTRPGMOD", "CS_Factor1_SPLAT_VRM", 
+                  "CS_Factor1_SPLAT_ALLG", "CS_Factor1_SPLAT_ALLU", "CS_Factor1_SPLAT_ALLX", 
+                  "CS_Factor1_SPLAT_BLANKS", "CS_Factor1_SPLAT_CANCL", "CS_Factor1_SPLAT_CYMD", 
+                  "CS_Factor1_SPLAT_CMDY", "CS_Factor1_SPLAT_CDMY", "CS_Factor1_SPLAT_MDY", 
+                  "CS_Factor1_SPLAT_DMY", "CS_Factor1_SPLAT_YMD", "CS_Factor1_SPLAT_JUL", 
+                  "CS_Factor1_SPLAT_ISO", "CS_Factor1_SPLAT_USA", "CS_Factor1_SPLAT_EUR", 
+                  "CS_Factor1_SPLAT_JIS", "CS_Factor1_SPLAT_DATE", "CS_Factor1_SPLAT_DAY", 
+                  "CS_Factor1_SPLAT_DETC", "CS_Factor1_SPLAT_DETL", "CS_Factor1_SPLAT_DTAARA", 
+                  "CS_Factor1_SPLAT_END", "CS_Factor1_SPLAT_ENTRY", "CS_Factor1_SPLAT_EQUATE", 
+                  "CS_Factor1_SPLAT_EXTDFT", "CS_Factor1_SPLAT_EXT", "CS_Factor1_SPLAT_FILE", 
+                  "CS_Factor1_SPLAT_GETIN", "CS_Factor1_SPLAT_HIVAL", "CS_Factor1_SPLAT_INIT", 
+                  "CS_Factor1_SPLAT_INDICATOR", "CS_Factor1_SPLAT_INZSR", 
+                  "CS_Factor1_SPLAT_IN", "CS_Factor1_SPLAT_JOBRUN", "CS_Factor1_SPLAT_JOB", 
+                  "CS_Factor1_SPLAT_LDA", "CS_Factor1_SPLAT_LIKE", "CS_Factor1_SPLAT_LONGJUL", 
+                  "CS_Factor1_SPLAT_LOVAL", "CS_Factor1_SPLAT_MONTH", "CS_Factor1_SPLAT_NOIND", 
+                  "CS_Factor1_SPLAT_NOKEY", "CS_Factor1_SPLAT_NULL", "CS_Factor1_SPLAT_OFL", 
+                  "CS_Factor1_SPLAT_ON", "CS_Factor1_SPLAT_OFF", "CS_Factor1_SPLAT_PDA", 
+                  "CS_Factor1_SPLAT_PLACE", "CS_Factor1_SPLAT_PSSR", "CS_Factor1_SPLAT_ROUTINE", 
+                  "CS_Factor1_SPLAT_START", "CS_Factor1_SPLAT_SYS", "CS_Factor1_SPLAT_TERM", 
+                  "CS_Factor1_SPLAT_TOTC", "CS_Factor1_SPLAT_TOTL", "CS_Factor1_SPLAT_USER", 
+                  "CS_Factor1_SPLAT_VAR", "CS_Factor1_SPLAT_YEAR", "CS_Factor1_SPLAT_ZEROS", 
+                  "CS_Factor1_SPLAT_HMS", "CS_Factor1_SPLAT_INLR", "CS_Factor1_SPLAT_INOF", 
+                  "CS_Factor1_SPLAT_D", "CS_Factor1_SPLAT_DAYS", "CS_Factor1_SPLAT_H", 
+                  "CS_Factor1_SPLAT_HOURS", "CS_Factor1_SPLAT_MINUTES", 
+                  "CS_Factor1_SPLAT_MONTHS", "CS_Factor1_SPLAT_M", "CS_Factor1_SPLAT_MN", 
+                  "CS_Factor1_SPLAT_MS", "CS_Factor1_SPLAT_MSECONDS", "CS_Factor1_SPLAT_SECONDS", 
+                  "CS_Factor1_SPLAT_YEARS", "CS_Factor1_SPLAT_Y", "CS_Factor2_SPLAT_ALL", 
+                  "CS_Factor2_SPLAT_NONE", "CS_Factor2_SPLAT_ILERPG", "CS_Factor2_SPLAT_CRTBNDRPG", 
+                  "CS_Factor2_SPLAT_CRTRPGMOD", "CS_Factor2_SPLAT_VRM", 
+                  "CS_Factor2_SPLAT_ALLG", "CS_Factor2_SPLAT_ALLU", "CS_Factor2_SPLAT_ALLX", 
+                  "CS_Factor2_SPLAT_BLANKS", "CS_Factor2_SPLAT_CANCL", "CS_Factor2_SPLAT_CYMD", 
+                  "CS_Factor2_SPLAT_CMDY", "CS_Factor2_SPLAT_CDMY", "CS_Factor2_SPLAT_MDY", 
+                  "CS_Factor2_SPLAT_DMY", "CS_Factor2_SPLAT_YMD", "CS_Factor2_SPLAT_JUL", 
+                  "CS_Factor2_SPLAT_ISO", "CS_Factor2_SPLAT_USA", "CS_Factor2_SPLAT_EUR", 
+                  "CS_Factor2_SPLAT_JIS", "CS_Factor2_SPLAT_DATE", "CS_Factor2_SPLAT_DAY", 
+                  "CS_Factor2_SPLAT_DETC", "CS_Factor2_SPLAT_DETL", "CS_Factor2_SPLAT_DTAARA", 
+                  "CS_Factor2_SPLAT_END", "CS_Factor2_SPLAT_ENTRY", "CS_Factor2_SPLAT_EQUATE", 
+                  "CS_Factor2_SPLAT_EXTDFT", "CS_Factor2_SPLAT_EXT", "CS_Factor2_SPLAT_FILE", 
+                  "CS_Factor2_SPLAT_GETIN", "CS_Factor2_SPLAT_HIVAL", "CS_Factor2_SPLAT_INIT", 
+                  "CS_Factor2_SPLAT_INDICATOR", "CS_Factor2_SPLAT_INZSR", 
+                  "CS_Factor2_SPLAT_IN", "CS_Factor2_SPLAT_JOBRUN", "CS_Factor2_SPLAT_JOB", 
+                  "CS_Factor2_SPLAT_LDA", "CS_Factor2_SPLAT_LIKE", "CS_Factor2_SPLAT_LONGJUL", 
+                  "CS_Factor2_SPLAT_LOVAL", "CS_Factor2_SPLAT_MONTH", "CS_Factor2_SPLAT_NOIND", 
+                  "CS_Factor2_SPLAT_NOKEY", "CS_Factor2_SPLAT_NULL", "CS_Factor2_SPLAT_OFL", 
+                  "CS_Factor2_SPLAT_ON", "CS_Factor2_SPLAT_OFF", "CS_Factor2_SPLAT_PDA", 
+                  "CS_Factor2_SPLAT_PLACE", "CS_Factor2_SPLAT_PSSR", "CS_Factor2_SPLAT_ROUTINE", 
+                  "CS_Factor2_SPLAT_START", "CS_Factor2_SPLAT_SYS", "CS_Factor2_SPLAT_TERM", 
+                  "CS_Factor2_SPLAT_TOTC", "CS_Factor2_SPLAT_TOTL", "CS_Factor2_SPLAT_USER", 
+                  "CS_Factor2_SPLAT_VAR", "CS_Factor2_SPLAT_YEAR", "CS_Factor2_SPLAT_ZEROS", 
+                  "CS_Factor2_SPLAT_HMS", "CS_Factor2_SPLAT_INLR", "CS_Factor2_SPLAT_INOF", 
+                  "CS_Factor2_SPLAT_D", "CS_Factor2_SPLAT_DAYS", "CS_Factor2_SPLAT_H", 
+                  "CS_Factor2_SPLAT_HOURS", "CS_Factor2_SPLAT_MINUTES", 
+                  "CS_Factor2_SPLAT_MONTHS", "CS_Factor2_SPLAT_M", "CS_Factor2_SPLAT_MN", 
+                  "CS_Factor2_SPLAT_MS", "CS_Factor2_SPLAT_MSECONDS", "CS_Factor2_SPLAT_SECONDS", 
+                  "CS_Factor2_SPLAT_YEARS", "CS_Factor2_SPLAT_Y", "CS_Result_SPLAT_D", 
+                  "CS_Result_SPLAT_DAYS", "CS_Result_SPLAT_H", "CS_Result_SPLAT_HOURS", 
+                  "CS_Result_SPLAT_MINUTES", "CS_Result_SPLAT_MONTHS", "CS_Result_SPLAT_M", 
+                  "CS_Result_SPLAT_MN", "CS_Result_SPLAT_MS", "CS_Result_SPLAT_MSECONDS", 
+                  "CS_Result_SPLAT_SECONDS", "CS_Result_SPLAT_YEARS", "CS_Result_SPLAT_Y", 
+                  "CS_Result_SPLAT_S", "CS_BlankFactor", "CS_BlankFactor_EOL", 
+                  "CS_FactorWs", "CS_FactorWs2", "CS_FactorContentHexLiteral", 
+                  "CS_FactorContentDateLiteral", "CS_FactorContentTimeLiteral", 
+                  "CS_FactorContentGraphicLiteral", "CS_FactorContentUCS2Literal", 
+                  "CS_FactorContentStringLiteral", "CS_FactorContent", "CS_ResultContent", 
+                  "CS_FactorColon", "CS_OperationAndExtender_Blank", "CS_OperationAndExtender_WS", 
+                  "CS_Operation_ACQ", "CS_Operation_ADD", "CS_Operation_ADDDUR", 
+                  "CS_Operation_ALLOC", "CS_Operation_ANDEQ", "CS_Operation_ANDNE", 
+                  "CS_Operation_ANDLE", "CS_Operation_ANDLT", "CS_Operation_ANDGE", 
+                  "CS_Operation_ANDGT", "CS_Operation_ANDxx", "CS_Operation_BEGSR", 
+                  "CS_Operation_BITOFF", "CS_Operation_BITON", "CS_Operation_CABxx", 
+                  "CS_Operation_CABEQ", "CS_Operation_CABNE", "CS_Operation_CABLE", 
+                  "CS_Operation_CABLT", "CS_Operation_CABGE", "CS_Operation_CABGT", 
+                  "CS_Operation_CALL", "CS_Operation_CALLB", "CS_Operation_CALLP", 
+                  "CS_Operation_CASEQ", "CS_Operation_CASNE", "CS_Operation_CASLE", 
+                  "CS_Operation_CASLT", "CS_Operation_CASGE", "CS_Operation_CASGT", 
+                  "CS_Operation_CAS", "CS_Operation_CAT", "CS_Operation_CHAIN", 
+                  "CS_Operation_CHECK", "CS_Operation_CHECKR", "CS_Operation_CLEAR", 
+                  "CS_Operation_CLOSE", "CS_Operation_COMMIT", "CS_Operation_COMP", 
+                  "CS_Operation_DEALLOC", "CS_Operation_DEFINE", "CS_Operation_DELETE", 
+                  "CS_Operation_DIV", "CS_Operation_DO", "CS_Operation_DOU", 
+                  "CS_Operation_DOUEQ", "CS_Operation_DOUNE", "CS_Operation_DOULE", 
+                  "CS_Operation_DOULT", "CS_Operation_DOUGE", "CS_Operation_DOUGT", 
+                  "CS_Operation_DOW", "CS_Operation_DOWEQ", "CS_Operation_DOWNE", 
+                  "CS_Operation_DOWLE", "CS_Operation_DOWLT", "CS_Operation_DOWGE", 
+                  "CS_Operation_DOWGT", "CS_Operation_DSPLY", "CS_Operation_DUMP", 
+                  "CS_Operation_ELSE", "CS_Operation_ELSEIF", "CS_Operation_END", 
+                  "CS_Operation_ENDCS", "CS_Operation_ENDDO", "CS_Operation_ENDFOR", 
+                  "CS_Operation_ENDIF", "CS_Operation_ENDMON", "CS_Operation_ENDSL", 
+                  "CS_Operation_ENDSR", "CS_Operation_EVAL", "CS_Operation_EVALR", 
+                  "CS_Operation_EVAL_CORR", "CS_Operation_EXCEPT", "CS_Operation_EXFMT", 
+                  "CS_Operation_EXSR", "CS_Operation_EXTRCT", "CS_Operation_FEOD", 
+                  "CS_Operation_FOR", "CS_Operation_FORCE", "CS_Operation_GOTO", 
+                  "CS_Operation_IF", "CS_Operation_IFEQ", "CS_Operation_IFNE", 
+                  "CS_Operation_IFLE", "CS_Operation_IFLT", "CS_Operation_IFGE", 
+                  "CS_Operation_IFGT", "CS_Operation_IN", "CS_Operation_ITER", 
+                  "CS_Operation_KFLD", "CS_Operation_KLIST", "CS_Operation_LEAVE", 
+                  "CS_Operation_LEAVESR", "CS_Operation_LOOKUP", "CS_Operation_MHHZO", 
+                  "CS_Operation_MHLZO", "CS_Operation_MLHZO", "CS_Operation_MLLZO", 
+                  "CS_Operation_MONITOR", "CS_Operation_MOVE", "CS_Operation_MOVEA", 
+                  "CS_Operation_MOVEL", "CS_Operation_MULT", "CS_Operation_MVR", 
+                  "CS_Operation_NEXT", "CS_Operation_OCCUR", "CS_Operation_ON_ERROR", 
+                  "CS_Operation_OPEN", "CS_Operation_OREQ", "CS_Operation_ORNE", 
+                  "CS_Operation_ORLE", "CS_Operation_ORLT", "CS_Operation_ORGE", 
+                  "CS_Operation_ORGT", "CS_Operation_OTHER", "CS_Operation_OUT", 
+                  "CS_Operation_PARM", "CS_Operation_PLIST", "CS_Operation_POST", 
+                  "CS_Operation_READ", "CS_Operation_READC", "CS_Operation_READE", 
+                  "CS_Operation_READP", "CS_Operation_READPE", "CS_Operation_REALLOC", 
+                  "CS_Operation_REL", "CS_Operation_RESET", "CS_Operation_RETURN", 
+                  "CS_Operation_ROLBK", "CS_Operation_SCAN", "CS_Operation_SELECT", 
+                  "CS_Operation_SETGT", "CS_Operation_SETLL", "CS_Operation_SETOFF", 
+                  "CS_Operation_SETON", "CS_Operation_SORTA", "CS_Operation_SHTDN", 
+                  "CS_Operation_SQRT", "CS_Operation_SUB", "CS_Operation_SUBDUR", 
+                  "CS_Operation_SUBST", "CS_Operation_TAG", "CS_Operation_TEST", 
+                  "CS_Operation_TESTB", "CS_Operation_TESTN", "CS_Operation_TESTZ", 
+                  "CS_Operation_TIME", "CS_Operation_UNLOCK", "CS_Operation_UPDATE", 
+                  "CS_Operation_WHEN", "CS_Operation_WHENEQ", "CS_Operation_WHENNE", 
+                  "CS_Operation_WHENLE", "CS_Operation_WHENLT", "CS_Operation_WHENGE", 
+                  "CS_Operation_WHENGT", "CS_Operation_WRITE", "CS_Operation_XFOOT", 
+                  "CS_Operation_XLATE", "CS_Operation_XML_INTO", "CS_Operation_XML_SAX", 
+                  "CS_Operation_Z_ADD", "CS_Operation_Z_SUB", "CS_OperationAndExtender", 
+                  "CS_OperationExtenderOpen", "CS_OperationExtenderClose", 
+                  "CS_FieldLength", "CS_DecimalPositions", "CS_WhiteSpace", 
+                  "CS_Comments", "CS_FixedComments", "CS_EOL", "CS_FixedOperationAndExtender_WS", 
+                  "CS_FixedOperationExtenderOpen", "CS_FixedOperationExtenderReturn", 
+                  "CS_FixedOperationAndExtender2_WS", "CS_FixedOperationAndExtender2", 
+                  "CS_FixedOperationExtender2Close", "CS_FixedOperationExtender2Return", 
+                  "FreeOpExtender_OPEN_PAREN", "FreeOpExtender_Any", "FreeOpExtender2_CLOSE_PAREN", 
+                  "FreeOpExtender2_WS", "FreeOpExtender_Extender", "BlankFlag", 
+                  "NoFlag", "BlankIndicator", "GeneralIndicator", "FunctionKeyIndicator", 
+                  "ControlLevelIndicator", "ControlLevel0Indicator", "LastRecordIndicator", 
+                  "MatchingRecordIndicator", "HaltIndicator", "ReturnIndicator", 
+                  "ExternalIndicator", "OverflowIndicator", "SubroutineIndicator", 
+                  "AndIndicator", "OrIndicator", "DoubleSplatIndicator", 
+                  "FirstPageIndicator", "OtherTextIndicator", "CSQL_EMPTY_TEXT", 
+                  "CSQL_TEXT", "CSQL_LEADBLANK", "CSQL_LEADWS", "CSQL_END", 
+                  "CSQL_CONT", "CSQL_CSplat", "CSQL_EOL", "CSQL_Any", "CSQLC_LEADWS", 
+                  "CSQLC_CSplat", "CSQLC_WS", "CSQLC_Comments", "CSQLC_Any", 
+                  "C2_FACTOR2_CONT", "C2_FACTOR2", "C2_OTHER", "REPEAT_FIXED_CalcSpec_X2", 
+                  "IS_BLANK_SPEC", "IS_FileName", "IS_FieldReserved", "IS_ExtFieldReserved", 
+                  "IS_LogicalRelationship", "IS_ExtRecordReserved", "IS_Sequence", 
+                  "IS_Number", "IS_Option", "IS_RecordIdCode", "IS_WS", 
+                  "IS_COMMENTS", "IS_EOL", "IF_Name", "IF_Reserved", "IF_FieldName", 
+                  "IF_Reserved2", "IF_WS", "IR_WS", "IFD_DATA_ATTR", "IFD_DATETIME_SEP", 
+                  "IFD_DATA_FORMAT", "IFD_FIELD_LOCATION", "IFD_DECIMAL_POSITIONS", 
+                  "IFD_FIELD_NAME", "IFD_CONTROL_LEVEL", "IFD_MATCHING_FIELDS", 
+                  "IFD_BLANKS", "IFD_COMMENTS", "IFD_EOL", "HS_OPEN_PAREN", 
+                  "HS_CLOSE_PAREN", "HS_StringLiteralStart", "HS_COLON", 
+                  "HS_ID", "HS_WhiteSpace", "HS_CONTINUATION", "HS_EOL" ]
+
+    grammarFileName = "RpgLexer.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[68] = self.DIR_EOL_action 
+            actions[242] = self.FREE_CONT_action 
+            actions[571] = self.C_FREE_CONTINUATION_DOTS_action 
+            actions[572] = self.D_FREE_CONTINUATION_DOTS_action 
+            actions[727] = self.StringEscapedQuote_action 
+            actions[746] = self.COMMENTS_TEXT_action 
+            actions[755] = self.PS_NAME_action 
+            actions[756] = self.PS_CONTINUATION_NAME_action 
+            actions[767] = self.CONTINUATION_NAME_action 
+            actions[769] = self.NAME_action 
+            actions[1194] = self.CS_OperationExtenderClose_action 
+            actions[1206] = self.CS_FixedOperationExtender2Close_action 
+            actions[1236] = self.CSQL_END_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def DIR_EOL_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+            self.text = self.text.strip()
+     
+
+    def FREE_CONT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 1:
+            self.text = "..."
+     
+
+    def C_FREE_CONTINUATION_DOTS_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 2:
+            self.text = "..."
+     
+
+    def D_FREE_CONTINUATION_DOTS_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 3:
+            self.text = "..."
+     
+
+    def StringEscapedQuote_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 4:
+            self.text = "'"
+     
+
+    def COMMENTS_TEXT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 5:
+            self.text = self.text.strip()
+     
+
+    def PS_NAME_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 6:
+            self.text = self.text.strip()
+     
+
+    def PS_CONTINUATION_NAME_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 7:
+            self.text = self.text[:-3]
+     
+
+    def CONTINUATION_NAME_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 8:
+            self.text = self.text[:-3].strip()
+     
+
+    def NAME_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 9:
+            self.text = self.text.strip()
+     
+
+    def CS_OperationExtenderClose_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 10:
+            self.text = self.text.strip()
+     
+
+    def CS_FixedOperationExtender2Close_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 11:
+            self.text = self.text.strip()
+     
+
+    def CSQL_END_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 12:
+            self.text = self.text.strip()
+     
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates is None:
+            preds = dict()
+            preds[3] = self.EMPTY_LINE_sempred
+            preds[27] = self.WS_sempred
+            preds[49] = self.COPY_OtherText_sempred
+            preds[239] = self.FREE_GUTTER_COMMENTS_sempred
+            preds[243] = self.FREE_COMMENTS80_sempred
+            preds[519] = self.KEYWORD_SQLTYPE_sempred
+            preds[535] = self.ARRAY_REPEAT_sempred
+            preds[536] = self.MULT_NOSPACE_sempred
+            preds[537] = self.MULT_sempred
+            preds[552] = self.FREE_NUMBER_CONT_sempred
+            preds[567] = self.ID_sempred
+            preds[568] = self.FREE_COMMENTS_sempred
+            preds[569] = self.FREE_WS_sempred
+            preds[570] = self.FREE_CONTINUATION_sempred
+            preds[571] = self.C_FREE_CONTINUATION_DOTS_sempred
+            preds[572] = self.D_FREE_CONTINUATION_DOTS_sempred
+            preds[573] = self.C_FREE_CONTINUATION_sempred
+            preds[574] = self.D_FREE_CONTINUATION_sempred
+            preds[575] = self.F_FREE_CONTINUATION_sempred
+            preds[576] = self.FREE_LEAD_WS5_sempred
+            preds[577] = self.FREE_LEAD_WS5_Comments_sempred
+            preds[578] = self.FREE_FREE_SPEC_sempred
+            preds[579] = self.C_FREE_NEWLINE_sempred
+            preds[580] = self.O_FREE_NEWLINE_sempred
+            preds[581] = self.D_FREE_NEWLINE_sempred
+            preds[582] = self.F_FREE_NEWLINE_sempred
+            preds[583] = self.FREE_NEWLINE_sempred
+            preds[726] = self.StringContent_sempred
+            preds[729] = self.FIXED_FREE_STRING_CONTINUATION_sempred
+            preds[730] = self.FIXED_FREE_STRING_CONTINUATION_MINUS_sempred
+            preds[731] = self.FREE_STRING_CONTINUATION_PLUS_sempred
+            preds[732] = self.FREE_STRING_CONTINUATION_MINUS_sempred
+            preds[737] = self.EatCommentLines_WhiteSpace_sempred
+            preds[738] = self.EatCommentLines_StarComment_sempred
+            preds[739] = self.FIXED_FREE_STRING_CONTINUATION_Part2_sempred
+            preds[741] = self.InFactor_StringContent_sempred
+            preds[742] = self.InFactor_StringEscapedQuote_sempred
+            preds[743] = self.InFactor_StringLiteralEnd_sempred
+            preds[744] = self.InFactor_EndFactor_sempred
+            preds[750] = self.COMMENTS_EOL_HIDDEN_sempred
+            preds[751] = self.COMMENTS_EOL_HIDDEN_FREE_sempred
+            preds[755] = self.PS_NAME_sempred
+            preds[758] = self.PS_RESERVED1_sempred
+            preds[759] = self.PS_BEGIN_sempred
+            preds[760] = self.PS_END_sempred
+            preds[761] = self.PS_RESERVED2_sempred
+            preds[762] = self.PS_KEYWORDS_sempred
+            preds[763] = self.PS_WS80_sempred
+            preds[766] = self.BLANK_SPEC_sempred
+            preds[767] = self.CONTINUATION_NAME_sempred
+            preds[769] = self.NAME_sempred
+            preds[770] = self.EXTERNAL_DESCRIPTION_sempred
+            preds[771] = self.DATA_STRUCTURE_TYPE_sempred
+            preds[772] = self.DEF_TYPE_C_sempred
+            preds[773] = self.DEF_TYPE_PI_sempred
+            preds[774] = self.DEF_TYPE_PR_sempred
+            preds[775] = self.DEF_TYPE_DS_sempred
+            preds[776] = self.DEF_TYPE_S_sempred
+            preds[777] = self.DEF_TYPE_BLANK_sempred
+            preds[778] = self.DEF_TYPE_sempred
+            preds[779] = self.FROM_POSITION_sempred
+            preds[780] = self.TO_POSITION_sempred
+            preds[781] = self.DATA_TYPE_sempred
+            preds[782] = self.DECIMAL_POSITIONS_sempred
+            preds[783] = self.RESERVED_sempred
+            preds[784] = self.D_WS_sempred
+            preds[785] = self.D_COMMENTS80_sempred
+            preds[792] = self.CE_COMMENTS80_sempred
+            preds[795] = self.CE_D_SPEC_FIXED_sempred
+            preds[796] = self.CE_P_SPEC_FIXED_sempred
+            preds[799] = self.FS_RecordName_sempred
+            preds[800] = self.FS_Type_sempred
+            preds[801] = self.FS_Designation_sempred
+            preds[802] = self.FS_EndOfFile_sempred
+            preds[803] = self.FS_Addution_sempred
+            preds[804] = self.FS_Sequence_sempred
+            preds[805] = self.FS_Format_sempred
+            preds[806] = self.FS_RecordLength_sempred
+            preds[807] = self.FS_Limits_sempred
+            preds[808] = self.FS_LengthOfKey_sempred
+            preds[809] = self.FS_RecordAddressType_sempred
+            preds[810] = self.FS_Organization_sempred
+            preds[811] = self.FS_Device_sempred
+            preds[812] = self.FS_Reserved_sempred
+            preds[813] = self.FS_WhiteSpace_sempred
+            preds[816] = self.OS_RecordName_sempred
+            preds[818] = self.OS_FieldReserved_sempred
+            preds[819] = self.OS_Type_sempred
+            preds[820] = self.OS_AddDelete_sempred
+            preds[821] = self.OS_FetchOverflow_sempred
+            preds[822] = self.OS_ExceptName_sempred
+            preds[823] = self.OS_Space3_sempred
+            preds[824] = self.OS_RemainingSpace_sempred
+            preds[826] = self.OS_WS_sempred
+            preds[828] = self.O1_ExceptName_sempred
+            preds[829] = self.O1_RemainingSpace_sempred
+            preds[830] = self.OS_FieldName_sempred
+            preds[831] = self.OS_EditNames_sempred
+            preds[832] = self.OS_BlankAfter_sempred
+            preds[833] = self.OS_Reserved1_sempred
+            preds[834] = self.OS_EndPosition_sempred
+            preds[835] = self.OS_DataFormat_sempred
+            preds[837] = self.CS_Factor1_SPLAT_ALL_sempred
+            preds[838] = self.CS_Factor1_SPLAT_NONE_sempred
+            preds[839] = self.CS_Factor1_SPLAT_ILERPG_sempred
+            preds[840] = self.CS_Factor1_SPLAT_CRTBNDRPG_sempred
+            preds[841] = self.CS_Factor1_SPLAT_CRTRPGMOD_sempred
+            preds[842] = self.CS_Factor1_SPLAT_VRM_sempred
+            preds[843] = self.CS_Factor1_SPLAT_ALLG_sempred
+            preds[844] = self.CS_Factor1_SPLAT_ALLU_sempred
+            preds[845] = self.CS_Factor1_SPLAT_ALLX_sempred
+            preds[846] = self.CS_Factor1_SPLAT_BLANKS_sempred
+            preds[847] = self.CS_Factor1_SPLAT_CANCL_sempred
+            preds[848] = self.CS_Factor1_SPLAT_CYMD_sempred
+            preds[849] = self.CS_Factor1_SPLAT_CMDY_sempred
+            preds[850] = self.CS_Factor1_SPLAT_CDMY_sempred
+            preds[851] = self.CS_Factor1_SPLAT_MDY_sempred
+            preds[852] = self.CS_Factor1_SPLAT_DMY_sempred
+            preds[853] = self.CS_Factor1_SPLAT_YMD_sempred
+            preds[854] = self.CS_Factor1_SPLAT_JUL_sempred
+            preds[855] = self.CS_Factor1_SPLAT_ISO_sempred
+            preds[856] = self.CS_Factor1_SPLAT_USA_sempred
+            preds[857] = self.CS_Factor1_SPLAT_EUR_sempred
+            preds[858] = self.CS_Factor1_SPLAT_JIS_sempred
+            preds[859] = self.CS_Factor1_SPLAT_DATE_sempred
+            preds[860] = self.CS_Factor1_SPLAT_DAY_sempred
+            preds[861] = self.CS_Factor1_SPLAT_DETC_sempred
+            preds[862] = self.CS_Factor1_SPLAT_DETL_sempred
+            preds[863] = self.CS_Factor1_SPLAT_DTAARA_sempred
+            preds[864] = self.CS_Factor1_SPLAT_END_sempred
+            preds[865] = self.CS_Factor1_SPLAT_ENTRY_sempred
+            preds[866] = self.CS_Factor1_SPLAT_EQUATE_sempred
+            preds[867] = self.CS_Factor1_SPLAT_EXTDFT_sempred
+            preds[868] = self.CS_Factor1_SPLAT_EXT_sempred
+            preds[869] = self.CS_Factor1_SPLAT_FILE_sempred
+            preds[870] = self.CS_Factor1_SPLAT_GETIN_sempred
+            preds[871] = self.CS_Factor1_SPLAT_HIVAL_sempred
+            preds[872] = self.CS_Factor1_SPLAT_INIT_sempred
+            preds[873] = self.CS_Factor1_SPLAT_INDICATOR_sempred
+            preds[874] = self.CS_Factor1_SPLAT_INZSR_sempred
+            preds[875] = self.CS_Factor1_SPLAT_IN_sempred
+            preds[876] = self.CS_Factor1_SPLAT_JOBRUN_sempred
+            preds[877] = self.CS_Factor1_SPLAT_JOB_sempred
+            preds[878] = self.CS_Factor1_SPLAT_LDA_sempred
+            preds[879] = self.CS_Factor1_SPLAT_LIKE_sempred
+            preds[880] = self.CS_Factor1_SPLAT_LONGJUL_sempred
+            preds[881] = self.CS_Factor1_SPLAT_LOVAL_sempred
+            preds[882] = self.CS_Factor1_SPLAT_MONTH_sempred
+            preds[883] = self.CS_Factor1_SPLAT_NOIND_sempred
+            preds[884] = self.CS_Factor1_SPLAT_NOKEY_sempred
+            preds[885] = self.CS_Factor1_SPLAT_NULL_sempred
+            preds[886] = self.CS_Factor1_SPLAT_OFL_sempred
+            preds[887] = self.CS_Factor1_SPLAT_ON_sempred
+            preds[888] = self.CS_Factor1_SPLAT_OFF_sempred
+            preds[889] = self.CS_Factor1_SPLAT_PDA_sempred
+            preds[890] = self.CS_Factor1_SPLAT_PLACE_sempred
+            preds[891] = self.CS_Factor1_SPLAT_PSSR_sempred
+            preds[892] = self.CS_Factor1_SPLAT_ROUTINE_sempred
+            preds[893] = self.CS_Factor1_SPLAT_START_sempred
+            preds[894] = self.CS_Factor1_SPLAT_SYS_sempred
+            preds[895] = self.CS_Factor1_SPLAT_TERM_sempred
+            preds[896] = self.CS_Factor1_SPLAT_TOTC_sempred
+            preds[897] = self.CS_Factor1_SPLAT_TOTL_sempred
+            preds[898] = self.CS_Factor1_SPLAT_USER_sempred
+            preds[899] = self.CS_Factor1_SPLAT_VAR_sempred
+            preds[900] = self.CS_Factor1_SPLAT_YEAR_sempred
+            preds[901] = self.CS_Factor1_SPLAT_ZEROS_sempred
+            preds[902] = self.CS_Factor1_SPLAT_HMS_sempred
+            preds[903] = self.CS_Factor1_SPLAT_INLR_sempred
+            preds[904] = self.CS_Factor1_SPLAT_INOF_sempred
+            preds[905] = self.CS_Factor1_SPLAT_D_sempred
+            preds[906] = self.CS_Factor1_SPLAT_DAYS_sempred
+            preds[907] = self.CS_Factor1_SPLAT_H_sempred
+            preds[908] = self.CS_Factor1_SPLAT_HOURS_sempred
+            preds[909] = self.CS_Factor1_SPLAT_MINUTES_sempred
+            preds[910] = self.CS_Factor1_SPLAT_MONTHS_sempred
+            preds[911] = self.CS_Factor1_SPLAT_M_sempred
+            preds[912] = self.CS_Factor1_SPLAT_MN_sempred
+            preds[913] = self.CS_Factor1_SPLAT_MS_sempred
+            preds[914] = self.CS_Factor1_SPLAT_MSECONDS_sempred
+            preds[915] = self.CS_Factor1_SPLAT_SECONDS_sempred
+            preds[916] = self.CS_Factor1_SPLAT_YEARS_sempred
+            preds[917] = self.CS_Factor1_SPLAT_Y_sempred
+            preds[918] = self.CS_Factor2_SPLAT_ALL_sempred
+            preds[919] = self.CS_Factor2_SPLAT_NONE_sempred
+            preds[920] = self.CS_Factor2_SPLAT_ILERPG_sempred
+            preds[921] = self.CS_Factor2_SPLAT_CRTBNDRPG_sempred
+            preds[922] = self.CS_Factor2_SPLAT_CRTRPGMOD_sempred
+            preds[923] = self.CS_Factor2_SPLAT_VRM_sempred
+            preds[924] = self.CS_Factor2_SPLAT_ALLG_sempred
+            preds[925] = self.CS_Factor2_SPLAT_ALLU_sempred
+            preds[926] = self.CS_Factor2_SPLAT_ALLX_sempred
+            preds[927] = self.CS_Factor2_SPLAT_BLANKS_sempred
+            preds[928] = self.CS_Factor2_SPLAT_CANCL_sempred
+            preds[929] = self.CS_Factor2_SPLAT_CYMD_sempred
+            preds[930] = self.CS_Factor2_SPLAT_CMDY_sempred
+            preds[931] = self.CS_Factor2_SPLAT_CDMY_sempred
+            preds[932] = self.CS_Factor2_SPLAT_MDY_sempred
+            preds[933] = self.CS_Factor2_SPLAT_DMY_sempred
+            preds[934] = self.CS_Factor2_SPLAT_YMD_sempred
+            preds[935] = self.CS_Factor2_SPLAT_JUL_sempred
+            preds[936] = self.CS_Factor2_SPLAT_ISO_sempred
+            preds[937] = self.CS_Factor2_SPLAT_USA_sempred
+            preds[938] = self.CS_Factor2_SPLAT_EUR_sempred
+            preds[939] = self.CS_Factor2_SPLAT_JIS_sempred
+            preds[940] = self.CS_Factor2_SPLAT_DATE_sempred
+            preds[941] = self.CS_Factor2_SPLAT_DAY_sempred
+            preds[942] = self.CS_Factor2_SPLAT_DETC_sempred
+            preds[943] = self.CS_Factor2_SPLAT_DETL_sempred
+            preds[944] = self.CS_Factor2_SPLAT_DTAARA_sempred
+            preds[945] = self.CS_Factor2_SPLAT_END_sempred
+            preds[946] = self.CS_Factor2_SPLAT_ENTRY_sempred
+            preds[947] = self.CS_Factor2_SPLAT_EQUATE_sempred
+            preds[948] = self.CS_Factor2_SPLAT_EXTDFT_sempred
+            preds[949] = self.CS_Factor2_SPLAT_EXT_sempred
+            preds[950] = self.CS_Factor2_SPLAT_FILE_sempred
+            preds[951] = self.CS_Factor2_SPLAT_GETIN_sempred
+            preds[952] = self.CS_Factor2_SPLAT_HIVAL_sempred
+            preds[953] = self.CS_Factor2_SPLAT_INIT_sempred
+            preds[954] = self.CS_Factor2_SPLAT_INDICATOR_sempred
+            preds[955] = self.CS_Factor2_SPLAT_INZSR_sempred
+            preds[956] = self.CS_Factor2_SPLAT_IN_sempred
+            preds[957] = self.CS_Factor2_SPLAT_JOBRUN_sempred
+            preds[958] = self.CS_Factor2_SPLAT_JOB_sempred
+            preds[959] = self.CS_Factor2_SPLAT_LDA_sempred
+            preds[960] = self.CS_Factor2_SPLAT_LIKE_sempred
+            preds[961] = self.CS_Factor2_SPLAT_LONGJUL_sempred
+            preds[962] = self.CS_Factor2_SPLAT_LOVAL_sempred
+            preds[963] = self.CS_Factor2_SPLAT_MONTH_sempred
+            preds[964] = self.CS_Factor2_SPLAT_NOIND_sempred
+            preds[965] = self.CS_Factor2_SPLAT_NOKEY_sempred
+            preds[966] = self.CS_Factor2_SPLAT_NULL_sempred
+            preds[967] = self.CS_Factor2_SPLAT_OFL_sempred
+            preds[968] = self.CS_Factor2_SPLAT_ON_sempred
+            preds[969] = self.CS_Factor2_SPLAT_OFF_sempred
+            preds[970] = self.CS_Factor2_SPLAT_PDA_sempred
+            preds[971] = self.CS_Factor2_SPLAT_PLACE_sempred
+            preds[972] = self.CS_Factor2_SPLAT_PSSR_sempred
+            preds[973] = self.CS_Factor2_SPLAT_ROUTINE_sempred
+            preds[974] = self.CS_Factor2_SPLAT_START_sempred
+            preds[975] = self.CS_Factor2_SPLAT_SYS_sempred
+            preds[976] = self.CS_Factor2_SPLAT_TERM_sempred
+            preds[977] = self.CS_Factor2_SPLAT_TOTC_sempred
+            preds[978] = self.CS_Factor2_SPLAT_TOTL_sempred
+            preds[979] = self.CS_Factor2_SPLAT_USER_sempred
+            preds[980] = self.CS_Factor2_SPLAT_VAR_sempred
+            preds[981] = self.CS_Factor2_SPLAT_YEAR_sempred
+            preds[982] = self.CS_Factor2_SPLAT_ZEROS_sempred
+            preds[983] = self.CS_Factor2_SPLAT_HMS_sempred
+            preds[984] = self.CS_Factor2_SPLAT_INLR_sempred
+            preds[985] = self.CS_Factor2_SPLAT_INOF_sempred
+            preds[986] = self.CS_Factor2_SPLAT_D_sempred
+            preds[987] = self.CS_Factor2_SPLAT_DAYS_sempred
+            preds[988] = self.CS_Factor2_SPLAT_H_sempred
+            preds[989] = self.CS_Factor2_SPLAT_HOURS_sempred
+            preds[990] = self.CS_Factor2_SPLAT_MINUTES_sempred
+            preds[991] = self.CS_Factor2_SPLAT_MONTHS_sempred
+            preds[992] = self.CS_Factor2_SPLAT_M_sempred
+            preds[993] = self.CS_Factor2_SPLAT_MN_sempred
+            preds[994] = self.CS_Factor2_SPLAT_MS_sempred
+            preds[995] = self.CS_Factor2_SPLAT_MSECONDS_sempred
+            preds[996] = self.CS_Factor2_SPLAT_SECONDS_sempred
+            preds[997] = self.CS_Factor2_SPLAT_YEARS_sempred
+            preds[998] = self.CS_Factor2_SPLAT_Y_sempred
+            preds[999] = self.CS_Result_SPLAT_D_sempred
+            preds[1000] = self.CS_Result_SPLAT_DAYS_sempred
+            preds[1001] = self.CS_Result_SPLAT_H_sempred
+            preds[1002] = self.CS_Result_SPLAT_HOURS_sempred
+            preds[1003] = self.CS_Result_SPLAT_MINUTES_sempred
+            preds[1004] = self.CS_Result_SPLAT_MONTHS_sempred
+            preds[1005] = self.CS_Result_SPLAT_M_sempred
+            preds[1006] = self.CS_Result_SPLAT_MN_sempred
+            preds[1007] = self.CS_Result_SPLAT_MS_sempred
+            preds[1008] = self.CS_Result_SPLAT_MSECONDS_sempred
+            preds[1009] = self.CS_Result_SPLAT_SECONDS_sempred
+            preds[1010] = self.CS_Result_SPLAT_YEARS_sempred
+            preds[1011] = self.CS_Result_SPLAT_Y_sempred
+            preds[1012] = self.CS_Result_SPLAT_S_sempred
+            preds[1013] = self.CS_BlankFactor_sempred
+            preds[1014] = self.CS_BlankFactor_EOL_sempred
+            preds[1015] = self.CS_FactorWs_sempred
+            preds[1016] = self.CS_FactorWs2_sempred
+            preds[1017] = self.CS_FactorContentHexLiteral_sempred
+            preds[1018] = self.CS_FactorContentDateLiteral_sempred
+            preds[1019] = self.CS_FactorContentTimeLiteral_sempred
+            preds[1020] = self.CS_FactorContentGraphicLiteral_sempred
+            preds[1021] = self.CS_FactorContentUCS2Literal_sempred
+            preds[1022] = self.CS_FactorContentStringLiteral_sempred
+            preds[1023] = self.CS_FactorContent_sempred
+            preds[1024] = self.CS_ResultContent_sempred
+            preds[1025] = self.CS_FactorColon_sempred
+            preds[1026] = self.CS_OperationAndExtender_Blank_sempred
+            preds[1027] = self.CS_OperationAndExtender_WS_sempred
+            preds[1028] = self.CS_Operation_ACQ_sempred
+            preds[1029] = self.CS_Operation_ADD_sempred
+            preds[1030] = self.CS_Operation_ADDDUR_sempred
+            preds[1031] = self.CS_Operation_ALLOC_sempred
+            preds[1032] = self.CS_Operation_ANDEQ_sempred
+            preds[1033] = self.CS_Operation_ANDNE_sempred
+            preds[1034] = self.CS_Operation_ANDLE_sempred
+            preds[1035] = self.CS_Operation_ANDLT_sempred
+            preds[1036] = self.CS_Operation_ANDGE_sempred
+            preds[1037] = self.CS_Operation_ANDGT_sempred
+            preds[1038] = self.CS_Operation_ANDxx_sempred
+            preds[1039] = self.CS_Operation_BEGSR_sempred
+            preds[1040] = self.CS_Operation_BITOFF_sempred
+            preds[1041] = self.CS_Operation_BITON_sempred
+            preds[1042] = self.CS_Operation_CABxx_sempred
+            preds[1043] = self.CS_Operation_CABEQ_sempred
+            preds[1044] = self.CS_Operation_CABNE_sempred
+            preds[1045] = self.CS_Operation_CABLE_sempred
+            preds[1046] = self.CS_Operation_CABLT_sempred
+            preds[1047] = self.CS_Operation_CABGE_sempred
+            preds[1048] = self.CS_Operation_CABGT_sempred
+            preds[1049] = self.CS_Operation_CALL_sempred
+            preds[1050] = self.CS_Operation_CALLB_sempred
+            preds[1051] = self.CS_Operation_CALLP_sempred
+            preds[1052] = self.CS_Operation_CASEQ_sempred
+            preds[1053] = self.CS_Operation_CASNE_sempred
+            preds[1054] = self.CS_Operation_CASLE_sempred
+            preds[1055] = self.CS_Operation_CASLT_sempred
+            preds[1056] = self.CS_Operation_CASGE_sempred
+            preds[1057] = self.CS_Operation_CASGT_sempred
+            preds[1058] = self.CS_Operation_CAS_sempred
+            preds[1059] = self.CS_Operation_CAT_sempred
+            preds[1060] = self.CS_Operation_CHAIN_sempred
+            preds[1061] = self.CS_Operation_CHECK_sempred
+            preds[1062] = self.CS_Operation_CHECKR_sempred
+            preds[1063] = self.CS_Operation_CLEAR_sempred
+            preds[1064] = self.CS_Operation_CLOSE_sempred
+            preds[1065] = self.CS_Operation_COMMIT_sempred
+            preds[1066] = self.CS_Operation_COMP_sempred
+            preds[1067] = self.CS_Operation_DEALLOC_sempred
+            preds[1068] = self.CS_Operation_DEFINE_sempred
+            preds[1069] = self.CS_Operation_DELETE_sempred
+            preds[1070] = self.CS_Operation_DIV_sempred
+            preds[1071] = self.CS_Operation_DO_sempred
+            preds[1072] = self.CS_Operation_DOU_sempred
+            preds[1073] = self.CS_Operation_DOUEQ_sempred
+            preds[1074] = self.CS_Operation_DOUNE_sempred
+            preds[1075] = self.CS_Operation_DOULE_sempred
+            preds[1076] = self.CS_Operation_DOULT_sempred
+            preds[1077] = self.CS_Operation_DOUGE_sempred
+            preds[1078] = self.CS_Operation_DOUGT_sempred
+            preds[1079] = self.CS_Operation_DOW_sempred
+            preds[1080] = self.CS_Operation_DOWEQ_sempred
+            preds[1081] = self.CS_Operation_DOWNE_sempred
+            preds[1082] = self.CS_Operation_DOWLE_sempred
+            preds[1083] = self.CS_Operation_DOWLT_sempred
+            preds[1084] = self.CS_Operation_DOWGE_sempred
+            preds[1085] = self.CS_Operation_DOWGT_sempred
+            preds[1086] = self.CS_Operation_DSPLY_sempred
+            preds[1087] = self.CS_Operation_DUMP_sempred
+            preds[1088] = self.CS_Operation_ELSE_sempred
+            preds[1089] = self.CS_Operation_ELSEIF_sempred
+            preds[1090] = self.CS_Operation_END_sempred
+            preds[1091] = self.CS_Operation_ENDCS_sempred
+            preds[1092] = self.CS_Operation_ENDDO_sempred
+            preds[1093] = self.CS_Operation_ENDFOR_sempred
+            preds[1094] = self.CS_Operation_ENDIF_sempred
+            preds[1095] = self.CS_Operation_ENDMON_sempred
+            preds[1096] = self.CS_Operation_ENDSL_sempred
+            preds[1097] = self.CS_Operation_ENDSR_sempred
+            preds[1098] = self.CS_Operation_EVAL_sempred
+            preds[1099] = self.CS_Operation_EVALR_sempred
+            preds[1100] = self.CS_Operation_EVAL_CORR_sempred
+            preds[1101] = self.CS_Operation_EXCEPT_sempred
+            preds[1102] = self.CS_Operation_EXFMT_sempred
+            preds[1103] = self.CS_Operation_EXSR_sempred
+            preds[1104] = self.CS_Operation_EXTRCT_sempred
+            preds[1105] = self.CS_Operation_FEOD_sempred
+            preds[1106] = self.CS_Operation_FOR_sempred
+            preds[1107] = self.CS_Operation_FORCE_sempred
+            preds[1108] = self.CS_Operation_GOTO_sempred
+            preds[1109] = self.CS_Operation_IF_sempred
+            preds[1110] = self.CS_Operation_IFEQ_sempred
+            preds[1111] = self.CS_Operation_IFNE_sempred
+            preds[1112] = self.CS_Operation_IFLE_sempred
+            preds[1113] = self.CS_Operation_IFLT_sempred
+            preds[1114] = self.CS_Operation_IFGE_sempred
+            preds[1115] = self.CS_Operation_IFGT_sempred
+            preds[1116] = self.CS_Operation_IN_sempred
+            preds[1117] = self.CS_Operation_ITER_sempred
+            preds[1118] = self.CS_Operation_KFLD_sempred
+            preds[1119] = self.CS_Operation_KLIST_sempred
+            preds[1120] = self.CS_Operation_LEAVE_sempred
+            preds[1121] = self.CS_Operation_LEAVESR_sempred
+            preds[1122] = self.CS_Operation_LOOKUP_sempred
+            preds[1123] = self.CS_Operation_MHHZO_sempred
+            preds[1124] = self.CS_Operation_MHLZO_sempred
+            preds[1125] = self.CS_Operation_MLHZO_sempred
+            preds[1126] = self.CS_Operation_MLLZO_sempred
+            preds[1127] = self.CS_Operation_MONITOR_sempred
+            preds[1128] = self.CS_Operation_MOVE_sempred
+            preds[1129] = self.CS_Operation_MOVEA_sempred
+            preds[1130] = self.CS_Operation_MOVEL_sempred
+            preds[1131] = self.CS_Operation_MULT_sempred
+            preds[1132] = self.CS_Operation_MVR_sempred
+            preds[1133] = self.CS_Operation_NEXT_sempred
+            preds[1134] = self.CS_Operation_OCCUR_sempred
+            preds[1135] = self.CS_Operation_ON_ERROR_sempred
+            preds[1136] = self.CS_Operation_OPEN_sempred
+            preds[1137] = self.CS_Operation_OREQ_sempred
+            preds[1138] = self.CS_Operation_ORNE_sempred
+            preds[1139] = self.CS_Operation_ORLE_sempred
+            preds[1140] = self.CS_Operation_ORLT_sempred
+            preds[1141] = self.CS_Operation_ORGE_sempred
+            preds[1142] = self.CS_Operation_ORGT_sempred
+            preds[1143] = self.CS_Operation_OTHER_sempred
+            preds[1144] = self.CS_Operation_OUT_sempred
+            preds[1145] = self.CS_Operation_PARM_sempred
+            preds[1146] = self.CS_Operation_PLIST_sempred
+            preds[1147] = self.CS_Operation_POST_sempred
+            preds[1148] = self.CS_Operation_READ_sempred
+            preds[1149] = self.CS_Operation_READC_sempred
+            preds[1150] = self.CS_Operation_READE_sempred
+            preds[1151] = self.CS_Operation_READP_sempred
+            preds[1152] = self.CS_Operation_READPE_sempred
+            preds[1153] = self.CS_Operation_REALLOC_sempred
+            preds[1154] = self.CS_Operation_REL_sempred
+            preds[1155] = self.CS_Operation_RESET_sempred
+            preds[1156] = self.CS_Operation_RETURN_sempred
+            preds[1157] = self.CS_Operation_ROLBK_sempred
+            preds[1158] = self.CS_Operation_SCAN_sempred
+            preds[1159] = self.CS_Operation_SELECT_sempred
+            preds[1160] = self.CS_Operation_SETGT_sempred
+            preds[1161] = self.CS_Operation_SETLL_sempred
+            preds[1162] = self.CS_Operation_SETOFF_sempred
+            preds[1163] = self.CS_Operation_SETON_sempred
+            preds[1164] = self.CS_Operation_SORTA_sempred
+            preds[1165] = self.CS_Operation_SHTDN_sempred
+            preds[1166] = self.CS_Operation_SQRT_sempred
+            preds[1167] = self.CS_Operation_SUB_sempred
+            preds[1168] = self.CS_Operation_SUBDUR_sempred
+            preds[1169] = self.CS_Operation_SUBST_sempred
+            preds[1170] = self.CS_Operation_TAG_sempred
+            preds[1171] = self.CS_Operation_TEST_sempred
+            preds[1172] = self.CS_Operation_TESTB_sempred
+            preds[1173] = self.CS_Operation_TESTN_sempred
+            preds[1174] = self.CS_Operation_TESTZ_sempred
+            preds[1175] = self.CS_Operation_TIME_sempred
+            preds[1176] = self.CS_Operation_UNLOCK_sempred
+            preds[1177] = self.CS_Operation_UPDATE_sempred
+            preds[1178] = self.CS_Operation_WHEN_sempred
+            preds[1179] = self.CS_Operation_WHENEQ_sempred
+            preds[1180] = self.CS_Operation_WHENNE_sempred
+            preds[1181] = self.CS_Operation_WHENLE_sempred
+            preds[1182] = self.CS_Operation_WHENLT_sempred
+            preds[1183] = self.CS_Operation_WHENGE_sempred
+            preds[1184] = self.CS_Operation_WHENGT_sempred
+            preds[1185] = self.CS_Operation_WRITE_sempred
+            preds[1186] = self.CS_Operation_XFOOT_sempred
+            preds[1187] = self.CS_Operation_XLATE_sempred
+            preds[1188] = self.CS_Operation_XML_INTO_sempred
+            preds[1189] = self.CS_Operation_XML_SAX_sempred
+            preds[1190] = self.CS_Operation_Z_ADD_sempred
+            preds[1191] = self.CS_Operation_Z_SUB_sempred
+            preds[1192] = self.CS_OperationAndExtender_sempred
+            preds[1193] = self.CS_OperationExtenderOpen_sempred
+            preds[1194] = self.CS_OperationExtenderClose_sempred
+            preds[1195] = self.CS_FieldLength_sempred
+            preds[1196] = self.CS_DecimalPositions_sempred
+            preds[1197] = self.CS_WhiteSpace_sempred
+            preds[1198] = self.CS_Comments_sempred
+            preds[1199] = self.CS_FixedComments_sempred
+            preds[1201] = self.CS_FixedOperationAndExtender_WS_sempred
+            preds[1202] = self.CS_FixedOperationExtenderOpen_sempred
+            preds[1203] = self.CS_FixedOperationExtenderReturn_sempred
+            preds[1204] = self.CS_FixedOperationAndExtender2_WS_sempred
+            preds[1205] = self.CS_FixedOperationAndExtender2_sempred
+            preds[1206] = self.CS_FixedOperationExtender2Close_sempred
+            preds[1207] = self.CS_FixedOperationExtender2Return_sempred
+            preds[1232] = self.CSQL_EMPTY_TEXT_sempred
+            preds[1233] = self.CSQL_TEXT_sempred
+            preds[1234] = self.CSQL_LEADBLANK_sempred
+            preds[1235] = self.CSQL_LEADWS_sempred
+            preds[1243] = self.CSQLC_WS_sempred
+            preds[1244] = self.CSQLC_Comments_sempred
+            preds[1246] = self.C2_FACTOR2_CONT_sempred
+            preds[1247] = self.C2_FACTOR2_sempred
+            preds[1248] = self.C2_OTHER_sempred
+            preds[1250] = self.IS_BLANK_SPEC_sempred
+            preds[1251] = self.IS_FileName_sempred
+            preds[1252] = self.IS_FieldReserved_sempred
+            preds[1253] = self.IS_ExtFieldReserved_sempred
+            preds[1254] = self.IS_LogicalRelationship_sempred
+            preds[1255] = self.IS_ExtRecordReserved_sempred
+            preds[1256] = self.IS_Sequence_sempred
+            preds[1257] = self.IS_Number_sempred
+            preds[1258] = self.IS_Option_sempred
+            preds[1259] = self.IS_RecordIdCode_sempred
+            preds[1260] = self.IS_WS_sempred
+            preds[1261] = self.IS_COMMENTS_sempred
+            preds[1263] = self.IF_Name_sempred
+            preds[1264] = self.IF_Reserved_sempred
+            preds[1265] = self.IF_FieldName_sempred
+            preds[1266] = self.IF_Reserved2_sempred
+            preds[1267] = self.IF_WS_sempred
+            preds[1268] = self.IR_WS_sempred
+            preds[1269] = self.IFD_DATA_ATTR_sempred
+            preds[1270] = self.IFD_DATETIME_SEP_sempred
+            preds[1271] = self.IFD_DATA_FORMAT_sempred
+            preds[1272] = self.IFD_FIELD_LOCATION_sempred
+            preds[1273] = self.IFD_DECIMAL_POSITIONS_sempred
+            preds[1274] = self.IFD_FIELD_NAME_sempred
+            preds[1275] = self.IFD_CONTROL_LEVEL_sempred
+            preds[1276] = self.IFD_MATCHING_FIELDS_sempred
+            preds[1277] = self.IFD_BLANKS_sempred
+            preds[1278] = self.IFD_COMMENTS_sempred
+            self._predicates = preds
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is not None:
+            return pred(localctx, predIndex)
+        else:
+            raise Exception("No registered predicate for:" + str(ruleIndex))
+
+    def EMPTY_LINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 0:
+                return self.column>=80
+         
+
+    def WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 1:
+                return self.column>6
+         
+
+    def COPY_OtherText_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 2:
+                return self.column<50
+         
+
+    def FREE_GUTTER_COMMENTS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 3:
+                return self.column>=81
+         
+
+    def FREE_COMMENTS80_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 4:
+                return self.column>80
+         
+
+    def KEYWORD_SQLTYPE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 5:
+                return (self.FIXED_DefSpec in self._modeStack)
+         
+
+    def ARRAY_REPEAT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 6:
+                return self._input.LA(2) == ord(')') and self._input.LA(-1) == ord('(')
+         
+
+    def MULT_NOSPACE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 7:
+                return self._input.LA(1) != 32
+         
+
+    def MULT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 8:
+                return self._input.LA(1) == 32
+         
+
+    def FREE_NUMBER_CONT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 9:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_DefSpec
+         
+
+    def ID_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 10:
+                return self.column >= 7
+         
+
+    def FREE_COMMENTS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 11:
+                return self.column>=8
+         
+
+    def FREE_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 12:
+                return self.column>6
+         
+
+    def FREE_CONTINUATION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 13:
+                return (self._modeStack[-1] if self._modeStack else None)!=self.FIXED_CalcSpec and (self._modeStack[-1] if self._modeStack else None)!=self.FIXED_DefSpec
+         
+
+    def C_FREE_CONTINUATION_DOTS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 14:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_CalcSpec
+         
+
+    def D_FREE_CONTINUATION_DOTS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 15:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_DefSpec
+         
+
+    def C_FREE_CONTINUATION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 16:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_CalcSpec
+         
+
+    def D_FREE_CONTINUATION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 17:
+                return (self._modeStack[-1] if self._modeStack else None) == self.FIXED_DefSpec
+         
+
+    def F_FREE_CONTINUATION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 18:
+                return (self._modeStack[-1] if self._modeStack else None) == self.FIXED_FileSpec
+         
+
+    def FREE_LEAD_WS5_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 19:
+                return self.column==5
+         
+
+    def FREE_LEAD_WS5_Comments_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 20:
+                return self.column==5
+         
+
+    def FREE_FREE_SPEC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 21:
+                return self.column==7
+         
+
+    def C_FREE_NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 22:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_CalcSpec
+         
+
+    def O_FREE_NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 23:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_OutputSpec_PGMFIELD
+         
+
+    def D_FREE_NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 24:
+                return (self._modeStack[-1] if self._modeStack else None) == self.FIXED_DefSpec
+         
+
+    def F_FREE_NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 25:
+                return (self._modeStack[-1] if self._modeStack else None) == self.FIXED_FileSpec
+         
+
+    def FREE_NEWLINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 26:
+                return (self._modeStack[-1] if self._modeStack else None)!=self.FIXED_CalcSpec
+         
+
+    def StringContent_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 27:
+                return self._input.LA(1)!=ord(' ') and self._input.LA(1)!=ord('\r') and self._input.LA(1)!=ord('\n')
+         
+
+    def FIXED_FREE_STRING_CONTINUATION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 28:
+                return (self.FIXED_CalcSpec in self._modeStack) or (self.FIXED_DefSpec in self._modeStack) or (self.FIXED_OutputSpec in self._modeStack)
+         
+
+    def FIXED_FREE_STRING_CONTINUATION_MINUS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 29:
+                return (self.FIXED_CalcSpec in self._modeStack) or (self.FIXED_DefSpec in self._modeStack) or (self.FIXED_OutputSpec in self._modeStack)
+         
+
+    def FREE_STRING_CONTINUATION_PLUS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 30:
+                return not (self.FIXED_CalcSpec in self._modeStack) and not (self.FIXED_DefSpec in self._modeStack) and not (self.FIXED_OutputSpec in self._modeStack)
+         
+
+    def FREE_STRING_CONTINUATION_MINUS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 31:
+                return not (self.FIXED_CalcSpec in self._modeStack) and not (self.FIXED_DefSpec in self._modeStack) and not (self.FIXED_OutputSpec in self._modeStack)
+         
+
+    def EatCommentLines_WhiteSpace_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 32:
+                return self.column==6
+         
+
+    def EatCommentLines_StarComment_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 33:
+                return self.column==6
+         
+
+    def FIXED_FREE_STRING_CONTINUATION_Part2_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 34:
+                return (self.FIXED_CalcSpec in self._modeStack)
+         
+
+            if predIndex == 35:
+                return (self.FIXED_DefSpec in self._modeStack)
+         
+
+            if predIndex == 36:
+                return (self.FIXED_OutputSpec in self._modeStack)
+         
+
+            if predIndex == 37:
+                return (self.FIXED_CalcSpec in self._modeStack)
+         
+
+            if predIndex == 38:
+                return (self.FIXED_DefSpec in self._modeStack)
+         
+
+            if predIndex == 39:
+                return (self.FIXED_OutputSpec in self._modeStack)
+         
+
+            if predIndex == 40:
+                return (self._modeStack[-1] if self._modeStack else None) == self.EatCommentLinesPlus
+         
+
+    def InFactor_StringContent_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 41:
+                return (self.column>=12 and self.column<=25) or (self.column>=36 and self.column<=49) or (self.column>=50 and self.column<=63)
+         
+
+    def InFactor_StringEscapedQuote_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 42:
+                return (self.column>=12 and self.column<=24) or (self.column>=36 and self.column<=48) or (self.column>=50 and self.column<=62)
+         
+
+    def InFactor_StringLiteralEnd_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 43:
+                return (self.column>=12 and self.column<=25) or (self.column>=36 and self.column<=49) or (self.column>=50 and self.column<=63)
+         
+
+    def InFactor_EndFactor_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 44:
+                return (self.column==25) or (self.column==49) or (self.column==61)
+         
+
+    def COMMENTS_EOL_HIDDEN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 45:
+                return (self._modeStack[-1] if self._modeStack else None)!=self.FREE
+         
+
+    def COMMENTS_EOL_HIDDEN_FREE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 46:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FREE
+         
+
+    def PS_NAME_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 47:
+                return self.column==21
+         
+
+    def PS_RESERVED1_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 48:
+                return self.column==23
+         
+
+    def PS_BEGIN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 49:
+                return self.column==24
+         
+
+    def PS_END_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 50:
+                return self.column==24
+         
+
+    def PS_RESERVED2_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 51:
+                return self.column==43
+         
+
+    def PS_KEYWORDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 52:
+                return self.column==44
+         
+
+            if predIndex == 53:
+                return self.column<=80
+         
+
+    def PS_WS80_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 54:
+                return self.column>80
+         
+
+    def BLANK_SPEC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 55:
+                return self.column==81
+         
+
+    def CONTINUATION_NAME_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 56:
+                return self.column<21
+         
+
+    def NAME_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 57:
+                return self.column==21
+         
+
+    def EXTERNAL_DESCRIPTION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 58:
+                return self.column==22
+         
+
+    def DATA_STRUCTURE_TYPE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 59:
+                return self.column==23
+         
+
+    def DEF_TYPE_C_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 60:
+                return self.column==25
+         
+
+    def DEF_TYPE_PI_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 61:
+                return self.column==25
+         
+
+    def DEF_TYPE_PR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 62:
+                return self.column==25
+         
+
+    def DEF_TYPE_DS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 63:
+                return self.column==25
+         
+
+    def DEF_TYPE_S_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 64:
+                return self.column==25
+         
+
+    def DEF_TYPE_BLANK_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 65:
+                return self.column==25
+         
+
+    def DEF_TYPE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 66:
+                return self.column==25
+         
+
+    def FROM_POSITION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 67:
+                return self.column==32
+         
+
+    def TO_POSITION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 68:
+                return self.column==39
+         
+
+    def DATA_TYPE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 69:
+                return self.column==40
+         
+
+    def DECIMAL_POSITIONS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 70:
+                return self.column==42
+         
+
+    def RESERVED_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 71:
+                return self.column==43
+         
+
+    def D_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 72:
+                return self.column>=81
+         
+
+    def D_COMMENTS80_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 73:
+                return self.column>=81
+         
+
+    def CE_COMMENTS80_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 74:
+                return self.column>=81
+         
+
+    def CE_D_SPEC_FIXED_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 75:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_DefSpec and self.column==6
+         
+
+    def CE_P_SPEC_FIXED_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 76:
+                return (self._modeStack[-1] if self._modeStack else None)==self.FIXED_ProcedureSpec and self.column==6
+         
+
+    def FS_RecordName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 77:
+                return self.column==16
+         
+
+    def FS_Type_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 78:
+                return self.column==17
+         
+
+    def FS_Designation_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 79:
+                return self.column==18
+         
+
+    def FS_EndOfFile_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 80:
+                return self.column==19
+         
+
+    def FS_Addution_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 81:
+                return self.column==20
+         
+
+    def FS_Sequence_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 82:
+                return self.column==21
+         
+
+    def FS_Format_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 83:
+                return self.column==22
+         
+
+    def FS_RecordLength_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 84:
+                return self.column==27
+         
+
+    def FS_Limits_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 85:
+                return self.column==28
+         
+
+    def FS_LengthOfKey_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 86:
+                return self.column==33
+         
+
+    def FS_RecordAddressType_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 87:
+                return self.column==34
+         
+
+    def FS_Organization_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 88:
+                return self.column==35
+         
+
+    def FS_Device_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 89:
+                return self.column==42
+         
+
+    def FS_Reserved_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 90:
+                return self.column==43
+         
+
+    def FS_WhiteSpace_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 91:
+                return self.column>80
+         
+
+    def OS_RecordName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 92:
+                return self.column==16
+         
+
+    def OS_FieldReserved_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 93:
+                return self.column==20
+         
+
+    def OS_Type_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 94:
+                return self.column==17
+         
+
+    def OS_AddDelete_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 95:
+                return self.column==20
+         
+
+    def OS_FetchOverflow_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 96:
+                return self.column==20
+         
+
+    def OS_ExceptName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 97:
+                return self.column==39
+         
+
+    def OS_Space3_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 98:
+                return self.column==42 or self.column==45 or self.column==48 or self.column==51
+         
+
+    def OS_RemainingSpace_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 99:
+                return self.column==80
+         
+
+    def OS_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 100:
+                return self.column>80
+         
+
+    def O1_ExceptName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 101:
+                return self.column==39
+         
+
+    def O1_RemainingSpace_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 102:
+                return self.column==80
+         
+
+    def OS_FieldName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 103:
+                return self.column==43
+         
+
+    def OS_EditNames_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 104:
+                return self.column==44
+         
+
+    def OS_BlankAfter_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 105:
+                return self.column==45
+         
+
+    def OS_Reserved1_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 106:
+                return self.column==46
+         
+
+    def OS_EndPosition_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 107:
+                return self.column==51
+         
+
+    def OS_DataFormat_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 108:
+                return self.column==52
+         
+
+    def CS_Factor1_SPLAT_ALL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 109:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_NONE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 110:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ILERPG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 111:
+                return 11+7<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_CRTBNDRPG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 112:
+                return 11+10<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_CRTRPGMOD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 113:
+                return 11+10<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_VRM_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 114:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ALLG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 115:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ALLU_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 116:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ALLX_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 117:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_BLANKS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 118:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_CANCL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 119:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_CYMD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 120:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_CMDY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 121:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_CDMY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 122:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MDY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 123:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DMY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 124:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_YMD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 125:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_JUL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 126:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ISO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 127:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_USA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 128:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_EUR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 129:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_JIS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 130:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DATE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 131:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DAY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 132:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DETC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 133:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DETL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 134:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DTAARA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 135:
+                return 11+7<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_END_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 136:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ENTRY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 137:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_EQUATE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 138:
+                return 11+7<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_EXTDFT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 139:
+                return 11+7<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_EXT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 140:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_FILE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 141:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_GETIN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 142:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_HIVAL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 143:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_INIT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 144:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_INDICATOR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 145:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_INZSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 146:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_IN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 147:
+                return 11+3<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_JOBRUN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 148:
+                return 11+7<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_JOB_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 149:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_LDA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 150:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_LIKE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 151:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_LONGJUL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 152:
+                return 11+8<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_LOVAL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 153:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MONTH_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 154:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_NOIND_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 155:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_NOKEY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 156:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_NULL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 157:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_OFL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 158:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ON_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 159:
+                return 11+3<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_OFF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 160:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_PDA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 161:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_PLACE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 162:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_PSSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 163:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ROUTINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 164:
+                return 11+8<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_START_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 165:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_SYS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 166:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_TERM_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 167:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_TOTC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 168:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_TOTL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 169:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_USER_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 170:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_VAR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 171:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_YEAR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 172:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_ZEROS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 173:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_HMS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 174:
+                return 11+4<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_INLR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 175:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_INOF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 176:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_D_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 177:
+                return 11+2<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_DAYS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 178:
+                return 11+5<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_H_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 179:
+                return 11+2<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_HOURS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 180:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MINUTES_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 181:
+                return 11+8<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MONTHS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 182:
+                return 11+7<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_M_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 183:
+                return 11+2<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 184:
+                return 11+3<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 185:
+                return 11+3<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_MSECONDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 186:
+                return 11+9<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_SECONDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 187:
+                return 11+8<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_YEARS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 188:
+                return 11+6<= self.column and self.column<=24
+         
+
+    def CS_Factor1_SPLAT_Y_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 189:
+                return 11+2<= self.column and self.column<=24
+         
+
+    def CS_Factor2_SPLAT_ALL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 190:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_NONE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 191:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ILERPG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 192:
+                return 35+7<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_CRTBNDRPG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 193:
+                return 35+10<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_CRTRPGMOD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 194:
+                return 35+10<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_VRM_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 195:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ALLG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 196:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ALLU_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 197:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ALLX_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 198:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_BLANKS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 199:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_CANCL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 200:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_CYMD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 201:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_CMDY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 202:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_CDMY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 203:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MDY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 204:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DMY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 205:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_YMD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 206:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_JUL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 207:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ISO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 208:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_USA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 209:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_EUR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 210:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_JIS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 211:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DATE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 212:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DAY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 213:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DETC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 214:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DETL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 215:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DTAARA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 216:
+                return 35+7<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_END_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 217:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ENTRY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 218:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_EQUATE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 219:
+                return 35+7<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_EXTDFT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 220:
+                return 35+7<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_EXT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 221:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_FILE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 222:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_GETIN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 223:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_HIVAL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 224:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_INIT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 225:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_INDICATOR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 226:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_INZSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 227:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_IN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 228:
+                return 35+3<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_JOBRUN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 229:
+                return 35+7<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_JOB_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 230:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_LDA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 231:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_LIKE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 232:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_LONGJUL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 233:
+                return 35+8<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_LOVAL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 234:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MONTH_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 235:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_NOIND_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 236:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_NOKEY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 237:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_NULL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 238:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_OFL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 239:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ON_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 240:
+                return 35+3<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_OFF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 241:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_PDA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 242:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_PLACE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 243:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_PSSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 244:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ROUTINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 245:
+                return 35+8<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_START_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 246:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_SYS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 247:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_TERM_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 248:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_TOTC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 249:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_TOTL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 250:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_USER_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 251:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_VAR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 252:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_YEAR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 253:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_ZEROS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 254:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_HMS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 255:
+                return 35+4<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_INLR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 256:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_INOF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 257:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_D_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 258:
+                return 35+2<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_DAYS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 259:
+                return 35+5<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_H_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 260:
+                return 35+2<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_HOURS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 261:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MINUTES_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 262:
+                return 35+8<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MONTHS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 263:
+                return 35+7<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_M_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 264:
+                return 35+2<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 265:
+                return 35+3<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 266:
+                return 35+3<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_MSECONDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 267:
+                return 35+9<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_SECONDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 268:
+                return 35+8<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_YEARS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 269:
+                return 35+6<= self.column and self.column<=48
+         
+
+    def CS_Factor2_SPLAT_Y_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 270:
+                return 35+2<= self.column and self.column<=48
+         
+
+    def CS_Result_SPLAT_D_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 271:
+                return 49+2<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_DAYS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 272:
+                return 49+5<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_H_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 273:
+                return 49+2<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_HOURS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 274:
+                return 49+6<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_MINUTES_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 275:
+                return 49+8<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_MONTHS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 276:
+                return 49+7<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_M_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 277:
+                return 49+2<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_MN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 278:
+                return 49+3<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_MS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 279:
+                return 49+3<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_MSECONDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 280:
+                return 49+9<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_SECONDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 281:
+                return 49+8<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_YEARS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 282:
+                return 49+6<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_Y_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 283:
+                return 49+2<= self.column and self.column<=62
+         
+
+    def CS_Result_SPLAT_S_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 284:
+                return 49+2<= self.column and self.column<=62
+         
+
+    def CS_BlankFactor_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 285:
+                return (self.column==25) or (self.column==49) or (self.column==63)
+         
+
+    def CS_BlankFactor_EOL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 286:
+                return self.column==25
+         
+
+    def CS_FactorWs_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 287:
+                return (self.column>=12 and self.column<=25) or (self.column>=36 and self.column<=49)
+         
+
+    def CS_FactorWs2_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 288:
+                return (self.column>=50 and self.column<=63)
+         
+
+    def CS_FactorContentHexLiteral_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 289:
+                return (self.column>=13 and self.column<=25) or (self.column>=37 and self.column<=49) or (self.column>=51 and self.column<=63)
+         
+
+    def CS_FactorContentDateLiteral_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 290:
+                return (self.column>=13 and self.column<=25) or (self.column>=37 and self.column<=49) or (self.column>=51 and self.column<=63)
+         
+
+    def CS_FactorContentTimeLiteral_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 291:
+                return (self.column>=13 and self.column<=25) or (self.column>=37 and self.column<=49) or (self.column>=51 and self.column<=63)
+         
+
+    def CS_FactorContentGraphicLiteral_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 292:
+                return (self.column>=13 and self.column<=25) or (self.column>=37 and self.column<=49) or (self.column>=51 and self.column<=63)
+         
+
+    def CS_FactorContentUCS2Literal_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 293:
+                return (self.column>=13 and self.column<=25) or (self.column>=37 and self.column<=49) or (self.column>=51 and self.column<=63)
+         
+
+    def CS_FactorContentStringLiteral_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 294:
+                return (self.column>=12 and self.column<=25) or (self.column>=36 and self.column<=49) or (self.column>=50 and self.column<=63)
+         
+
+    def CS_FactorContent_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 295:
+                return (self.column>=12 and self.column<=25) or (self.column>=36 and self.column<=49)
+         
+
+    def CS_ResultContent_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 296:
+                return (self.column>=50 and self.column<=63)
+         
+
+    def CS_FactorColon_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 297:
+                return (self.column>12 and self.column<25) or (self.column>36 and self.column<49) or (self.column>50 and self.column<63)
+         
+
+    def CS_OperationAndExtender_Blank_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 298:
+                return self.column==35
+         
+
+    def CS_OperationAndExtender_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 299:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_Operation_ACQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 300:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_ADD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 301:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_ADDDUR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 302:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_ALLOC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 303:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 304:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 305:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 306:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 307:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 308:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 309:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ANDxx_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 310:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_BEGSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 311:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_BITOFF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 312:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_BITON_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 313:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABxx_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 314:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 315:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 316:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 317:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 318:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 319:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CABGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 320:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CALL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 321:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_CALLB_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 322:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CALLP_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 323:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CASEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 324:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CASNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 325:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CASLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 326:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CASLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 327:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CASGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 328:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CASGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 329:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CAS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 330:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_CAT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 331:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_CHAIN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 332:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CHECK_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 333:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CHECKR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 334:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_CLEAR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 335:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_CLOSE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 336:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_COMMIT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 337:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_COMP_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 338:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_DEALLOC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 339:
+                return self.column>=32 and self.column<36
+         
+
+    def CS_Operation_DEFINE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 340:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DELETE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 341:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DIV_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 342:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_DO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 343:
+                return self.column>=27 and self.column<36
+         
+
+    def CS_Operation_DOU_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 344:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_DOUEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 345:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOUNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 346:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOULE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 347:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOULT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 348:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOUGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 349:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOUGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 350:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOW_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 351:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_DOWEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 352:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOWNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 353:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOWLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 354:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOWLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 355:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOWGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 356:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DOWGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 357:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DSPLY_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 358:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_DUMP_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 359:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ELSE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 360:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ELSEIF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 361:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_END_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 362:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_ENDCS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 363:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ENDDO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 364:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ENDFOR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 365:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_ENDIF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 366:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ENDMON_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 367:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_ENDSL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 368:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ENDSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 369:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_EVAL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 370:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_EVALR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 371:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_EVAL_CORR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 372:
+                return self.column>=34 and self.column<36
+         
+
+    def CS_Operation_EXCEPT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 373:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_EXFMT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 374:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_EXSR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 375:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_EXTRCT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 376:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_FEOD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 377:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_FOR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 378:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_FORCE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 379:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_GOTO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 380:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 381:
+                return self.column>=27 and self.column<36
+         
+
+    def CS_Operation_IFEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 382:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IFNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 383:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IFLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 384:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IFLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 385:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IFGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 386:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IFGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 387:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_IN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 388:
+                return self.column>=27 and self.column<36
+         
+
+    def CS_Operation_ITER_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 389:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_KFLD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 390:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_KLIST_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 391:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_LEAVE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 392:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_LEAVESR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 393:
+                return self.column>=32 and self.column<36
+         
+
+    def CS_Operation_LOOKUP_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 394:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_MHHZO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 395:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_MHLZO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 396:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_MLHZO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 397:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_MLLZO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 398:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_MONITOR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 399:
+                return self.column>=32 and self.column<36
+         
+
+    def CS_Operation_MOVE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 400:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_MOVEA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 401:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_MOVEL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 402:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_MULT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 403:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_MVR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 404:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_NEXT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 405:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_OCCUR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 406:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ON_ERROR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 407:
+                return self.column>=33 and self.column<36
+         
+
+    def CS_Operation_OPEN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 408:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_OREQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 409:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ORNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 410:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ORLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 411:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ORLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 412:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ORGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 413:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_ORGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 414:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_OTHER_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 415:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_OUT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 416:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_PARM_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 417:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_PLIST_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 418:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_POST_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 419:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_READ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 420:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_READC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 421:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_READE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 422:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_READP_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 423:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_READPE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 424:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_REALLOC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 425:
+                return self.column>=32 and self.column<36
+         
+
+    def CS_Operation_REL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 426:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_RESET_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 427:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_RETURN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 428:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_ROLBK_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 429:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_SCAN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 430:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_SELECT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 431:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_SETGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 432:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_SETLL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 433:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_SETOFF_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 434:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_SETON_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 435:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_SORTA_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 436:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_SHTDN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 437:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_SQRT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 438:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_SUB_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 439:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_SUBDUR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 440:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_SUBST_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 441:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_TAG_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 442:
+                return self.column>=28 and self.column<36
+         
+
+    def CS_Operation_TEST_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 443:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_TESTB_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 444:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_TESTN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 445:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_TESTZ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 446:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_TIME_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 447:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_UNLOCK_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 448:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_UPDATE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 449:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WHEN_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 450:
+                return self.column>=29 and self.column<36
+         
+
+    def CS_Operation_WHENEQ_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 451:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WHENNE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 452:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WHENLE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 453:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WHENLT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 454:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WHENGE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 455:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WHENGT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 456:
+                return self.column>=31 and self.column<36
+         
+
+    def CS_Operation_WRITE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 457:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_XFOOT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 458:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_XLATE_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 459:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_XML_INTO_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 460:
+                return self.column>=33 and self.column<36
+         
+
+    def CS_Operation_XML_SAX_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 461:
+                return self.column>=32 and self.column<36
+         
+
+    def CS_Operation_Z_ADD_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 462:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_Operation_Z_SUB_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 463:
+                return self.column>=30 and self.column<36
+         
+
+    def CS_OperationAndExtender_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 464:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_OperationExtenderOpen_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 465:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_OperationExtenderClose_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 466:
+                return self.column>=26 and self.column<36
+         
+
+            if predIndex == 467:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_FieldLength_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 468:
+                return self.column==68
+         
+
+    def CS_DecimalPositions_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 469:
+                return self.column==70
+         
+
+    def CS_WhiteSpace_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 470:
+                return self.column>=77
+         
+
+    def CS_Comments_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 471:
+                return self.column>80
+         
+
+    def CS_FixedComments_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 472:
+                return self.column>=77
+         
+
+    def CS_FixedOperationAndExtender_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 473:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_FixedOperationExtenderOpen_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 474:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_FixedOperationExtenderReturn_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 475:
+                return self.column>=25 and self.column<=35
+         
+
+    def CS_FixedOperationAndExtender2_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 476:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_FixedOperationAndExtender2_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 477:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_FixedOperationExtender2Close_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 478:
+                return self.column>=26 and self.column<36
+         
+
+            if predIndex == 479:
+                return self.column>=26 and self.column<36
+         
+
+    def CS_FixedOperationExtender2Return_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 480:
+                return self.column==35
+         
+
+    def CSQL_EMPTY_TEXT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 481:
+                return self.column>=8
+         
+
+    def CSQL_TEXT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 482:
+                return self.column>=8
+         
+
+    def CSQL_LEADBLANK_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 483:
+                return self.column==5
+         
+
+    def CSQL_LEADWS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 484:
+                return self.column==5
+         
+
+    def CSQLC_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 485:
+                return self.column>=8
+         
+
+    def CSQLC_Comments_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 486:
+                return self.column>=8
+         
+
+    def C2_FACTOR2_CONT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 487:
+                return self.column==36
+         
+
+    def C2_FACTOR2_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 488:
+                return self.column==36
+         
+
+    def C2_OTHER_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 489:
+                return self.column<36
+         
+
+    def IS_BLANK_SPEC_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 490:
+                return self.column==80
+         
+
+    def IS_FileName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 491:
+                return self.column==16
+         
+
+    def IS_FieldReserved_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 492:
+                return self.column==30
+         
+
+    def IS_ExtFieldReserved_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 493:
+                return self.column==20
+         
+
+    def IS_LogicalRelationship_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 494:
+                return self.column==18
+         
+
+    def IS_ExtRecordReserved_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 495:
+                return self.column==20
+         
+
+    def IS_Sequence_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 496:
+                return self.column==18
+         
+
+    def IS_Number_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 497:
+                return self.column==19
+         
+
+    def IS_Option_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 498:
+                return self.column==20
+         
+
+    def IS_RecordIdCode_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 499:
+                return self.column==46
+         
+
+    def IS_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 500:
+                return self.column>=47
+         
+
+    def IS_COMMENTS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 501:
+                return self.column>80
+         
+
+    def IF_Name_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 502:
+                return self.column==30
+         
+
+    def IF_Reserved_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 503:
+                return self.column==48
+         
+
+    def IF_FieldName_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 504:
+                return self.column==62
+         
+
+    def IF_Reserved2_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 505:
+                return self.column==68
+         
+
+    def IF_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 506:
+                return self.column>=75
+         
+
+    def IR_WS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 507:
+                return self.column>=23
+         
+
+    def IFD_DATA_ATTR_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 508:
+                return self.column==34
+         
+
+    def IFD_DATETIME_SEP_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 509:
+                return self.column==35
+         
+
+    def IFD_DATA_FORMAT_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 510:
+                return self.column==36
+         
+
+    def IFD_FIELD_LOCATION_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 511:
+                return self.column==46
+         
+
+    def IFD_DECIMAL_POSITIONS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 512:
+                return self.column==48
+         
+
+    def IFD_FIELD_NAME_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 513:
+                return self.column==62
+         
+
+    def IFD_CONTROL_LEVEL_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 514:
+                return self.column==64
+         
+
+    def IFD_MATCHING_FIELDS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 515:
+                return self.column==66
+         
+
+    def IFD_BLANKS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 516:
+                return self.column==80
+         
+
+    def IFD_COMMENTS_sempred(self, localctx:RuleContext, predIndex:int):
+            if predIndex == 517:
+                return self.column>80
+         
+
+
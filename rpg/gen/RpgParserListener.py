@@ -0,0 +1,5205 @@
+# Generated from RpgParser.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .RpgParser import RpgParser
+else:
+    from RpgParser import RpgParser
+
+# This class defines a complete listener for a parse tree produced by RpgParser.
+class RpgParserListener(ParseTreeListener):
+
+    # Enter a parse tree produced by RpgParser#r.
+    def enterR(self, ctx:RpgParser.RContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#r.
+    def exitR(self, ctx:RpgParser.RContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#statement.
+    def enterStatement(self, ctx:RpgParser.StatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#statement.
+    def exitStatement(self, ctx:RpgParser.StatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endSource.
+    def enterEndSource(self, ctx:RpgParser.EndSourceContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endSource.
+    def exitEndSource(self, ctx:RpgParser.EndSourceContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endSourceHead.
+    def enterEndSourceHead(self, ctx:RpgParser.EndSourceHeadContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endSourceHead.
+    def exitEndSourceHead(self, ctx:RpgParser.EndSourceHeadContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endSourceLine.
+    def enterEndSourceLine(self, ctx:RpgParser.EndSourceLineContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endSourceLine.
+    def exitEndSourceLine(self, ctx:RpgParser.EndSourceLineContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#star_comments.
+    def enterStar_comments(self, ctx:RpgParser.Star_commentsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#star_comments.
+    def exitStar_comments(self, ctx:RpgParser.Star_commentsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#free_comments.
+    def enterFree_comments(self, ctx:RpgParser.Free_commentsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#free_comments.
+    def exitFree_comments(self, ctx:RpgParser.Free_commentsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#free_linecomments.
+    def enterFree_linecomments(self, ctx:RpgParser.Free_linecommentsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#free_linecomments.
+    def exitFree_linecomments(self, ctx:RpgParser.Free_linecommentsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#comments.
+    def enterComments(self, ctx:RpgParser.CommentsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#comments.
+    def exitComments(self, ctx:RpgParser.CommentsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dspec.
+    def enterDspec(self, ctx:RpgParser.DspecContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dspec.
+    def exitDspec(self, ctx:RpgParser.DspecContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dspecConstant.
+    def enterDspecConstant(self, ctx:RpgParser.DspecConstantContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dspecConstant.
+    def exitDspecConstant(self, ctx:RpgParser.DspecConstantContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#datatype.
+    def enterDatatype(self, ctx:RpgParser.DatatypeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#datatype.
+    def exitDatatype(self, ctx:RpgParser.DatatypeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword.
+    def enterKeyword(self, ctx:RpgParser.KeywordContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword.
+    def exitKeyword(self, ctx:RpgParser.KeywordContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dspec_bif.
+    def enterDspec_bif(self, ctx:RpgParser.Dspec_bifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dspec_bif.
+    def exitDspec_bif(self, ctx:RpgParser.Dspec_bifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_alias.
+    def enterKeyword_alias(self, ctx:RpgParser.Keyword_aliasContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_alias.
+    def exitKeyword_alias(self, ctx:RpgParser.Keyword_aliasContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_align.
+    def enterKeyword_align(self, ctx:RpgParser.Keyword_alignContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_align.
+    def exitKeyword_align(self, ctx:RpgParser.Keyword_alignContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_alt.
+    def enterKeyword_alt(self, ctx:RpgParser.Keyword_altContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_alt.
+    def exitKeyword_alt(self, ctx:RpgParser.Keyword_altContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_altseq.
+    def enterKeyword_altseq(self, ctx:RpgParser.Keyword_altseqContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_altseq.
+    def exitKeyword_altseq(self, ctx:RpgParser.Keyword_altseqContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_ascend.
+    def enterKeyword_ascend(self, ctx:RpgParser.Keyword_ascendContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_ascend.
+    def exitKeyword_ascend(self, ctx:RpgParser.Keyword_ascendContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_based.
+    def enterKeyword_based(self, ctx:RpgParser.Keyword_basedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_based.
+    def exitKeyword_based(self, ctx:RpgParser.Keyword_basedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_ccsid.
+    def enterKeyword_ccsid(self, ctx:RpgParser.Keyword_ccsidContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_ccsid.
+    def exitKeyword_ccsid(self, ctx:RpgParser.Keyword_ccsidContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_class.
+    def enterKeyword_class(self, ctx:RpgParser.Keyword_classContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_class.
+    def exitKeyword_class(self, ctx:RpgParser.Keyword_classContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_const.
+    def enterKeyword_const(self, ctx:RpgParser.Keyword_constContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_const.
+    def exitKeyword_const(self, ctx:RpgParser.Keyword_constContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_ctdata.
+    def enterKeyword_ctdata(self, ctx:RpgParser.Keyword_ctdataContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_ctdata.
+    def exitKeyword_ctdata(self, ctx:RpgParser.Keyword_ctdataContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_datfmt.
+    def enterKeyword_datfmt(self, ctx:RpgParser.Keyword_datfmtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_datfmt.
+    def exitKeyword_datfmt(self, ctx:RpgParser.Keyword_datfmtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dateSeparator.
+    def enterDateSeparator(self, ctx:RpgParser.DateSeparatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dateSeparator.
+    def exitDateSeparator(self, ctx:RpgParser.DateSeparatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_descend.
+    def enterKeyword_descend(self, ctx:RpgParser.Keyword_descendContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_descend.
+    def exitKeyword_descend(self, ctx:RpgParser.Keyword_descendContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_dim.
+    def enterKeyword_dim(self, ctx:RpgParser.Keyword_dimContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_dim.
+    def exitKeyword_dim(self, ctx:RpgParser.Keyword_dimContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_dtaara.
+    def enterKeyword_dtaara(self, ctx:RpgParser.Keyword_dtaaraContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_dtaara.
+    def exitKeyword_dtaara(self, ctx:RpgParser.Keyword_dtaaraContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_export.
+    def enterKeyword_export(self, ctx:RpgParser.Keyword_exportContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_export.
+    def exitKeyword_export(self, ctx:RpgParser.Keyword_exportContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_ext.
+    def enterKeyword_ext(self, ctx:RpgParser.Keyword_extContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_ext.
+    def exitKeyword_ext(self, ctx:RpgParser.Keyword_extContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extfld.
+    def enterKeyword_extfld(self, ctx:RpgParser.Keyword_extfldContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extfld.
+    def exitKeyword_extfld(self, ctx:RpgParser.Keyword_extfldContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extfmt.
+    def enterKeyword_extfmt(self, ctx:RpgParser.Keyword_extfmtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extfmt.
+    def exitKeyword_extfmt(self, ctx:RpgParser.Keyword_extfmtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extname.
+    def enterKeyword_extname(self, ctx:RpgParser.Keyword_extnameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extname.
+    def exitKeyword_extname(self, ctx:RpgParser.Keyword_extnameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extpgm.
+    def enterKeyword_extpgm(self, ctx:RpgParser.Keyword_extpgmContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extpgm.
+    def exitKeyword_extpgm(self, ctx:RpgParser.Keyword_extpgmContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extproc.
+    def enterKeyword_extproc(self, ctx:RpgParser.Keyword_extprocContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extproc.
+    def exitKeyword_extproc(self, ctx:RpgParser.Keyword_extprocContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_fromfile.
+    def enterKeyword_fromfile(self, ctx:RpgParser.Keyword_fromfileContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_fromfile.
+    def exitKeyword_fromfile(self, ctx:RpgParser.Keyword_fromfileContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_import.
+    def enterKeyword_import(self, ctx:RpgParser.Keyword_importContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_import.
+    def exitKeyword_import(self, ctx:RpgParser.Keyword_importContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_inz.
+    def enterKeyword_inz(self, ctx:RpgParser.Keyword_inzContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_inz.
+    def exitKeyword_inz(self, ctx:RpgParser.Keyword_inzContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_len.
+    def enterKeyword_len(self, ctx:RpgParser.Keyword_lenContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_len.
+    def exitKeyword_len(self, ctx:RpgParser.Keyword_lenContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_like.
+    def enterKeyword_like(self, ctx:RpgParser.Keyword_likeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_like.
+    def exitKeyword_like(self, ctx:RpgParser.Keyword_likeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_likeds.
+    def enterKeyword_likeds(self, ctx:RpgParser.Keyword_likedsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_likeds.
+    def exitKeyword_likeds(self, ctx:RpgParser.Keyword_likedsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_likefile.
+    def enterKeyword_likefile(self, ctx:RpgParser.Keyword_likefileContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_likefile.
+    def exitKeyword_likefile(self, ctx:RpgParser.Keyword_likefileContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_likerec.
+    def enterKeyword_likerec(self, ctx:RpgParser.Keyword_likerecContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_likerec.
+    def exitKeyword_likerec(self, ctx:RpgParser.Keyword_likerecContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_noopt.
+    def enterKeyword_noopt(self, ctx:RpgParser.Keyword_nooptContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_noopt.
+    def exitKeyword_noopt(self, ctx:RpgParser.Keyword_nooptContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_occurs.
+    def enterKeyword_occurs(self, ctx:RpgParser.Keyword_occursContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_occurs.
+    def exitKeyword_occurs(self, ctx:RpgParser.Keyword_occursContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_opdesc.
+    def enterKeyword_opdesc(self, ctx:RpgParser.Keyword_opdescContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_opdesc.
+    def exitKeyword_opdesc(self, ctx:RpgParser.Keyword_opdescContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_options.
+    def enterKeyword_options(self, ctx:RpgParser.Keyword_optionsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_options.
+    def exitKeyword_options(self, ctx:RpgParser.Keyword_optionsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_overlay.
+    def enterKeyword_overlay(self, ctx:RpgParser.Keyword_overlayContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_overlay.
+    def exitKeyword_overlay(self, ctx:RpgParser.Keyword_overlayContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_packeven.
+    def enterKeyword_packeven(self, ctx:RpgParser.Keyword_packevenContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_packeven.
+    def exitKeyword_packeven(self, ctx:RpgParser.Keyword_packevenContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_perrcd.
+    def enterKeyword_perrcd(self, ctx:RpgParser.Keyword_perrcdContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_perrcd.
+    def exitKeyword_perrcd(self, ctx:RpgParser.Keyword_perrcdContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_prefix.
+    def enterKeyword_prefix(self, ctx:RpgParser.Keyword_prefixContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_prefix.
+    def exitKeyword_prefix(self, ctx:RpgParser.Keyword_prefixContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_pos.
+    def enterKeyword_pos(self, ctx:RpgParser.Keyword_posContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_pos.
+    def exitKeyword_pos(self, ctx:RpgParser.Keyword_posContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_procptr.
+    def enterKeyword_procptr(self, ctx:RpgParser.Keyword_procptrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_procptr.
+    def exitKeyword_procptr(self, ctx:RpgParser.Keyword_procptrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_qualified.
+    def enterKeyword_qualified(self, ctx:RpgParser.Keyword_qualifiedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_qualified.
+    def exitKeyword_qualified(self, ctx:RpgParser.Keyword_qualifiedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_rtnparm.
+    def enterKeyword_rtnparm(self, ctx:RpgParser.Keyword_rtnparmContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_rtnparm.
+    def exitKeyword_rtnparm(self, ctx:RpgParser.Keyword_rtnparmContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_static.
+    def enterKeyword_static(self, ctx:RpgParser.Keyword_staticContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_static.
+    def exitKeyword_static(self, ctx:RpgParser.Keyword_staticContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_sqltype.
+    def enterKeyword_sqltype(self, ctx:RpgParser.Keyword_sqltypeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_sqltype.
+    def exitKeyword_sqltype(self, ctx:RpgParser.Keyword_sqltypeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_template.
+    def enterKeyword_template(self, ctx:RpgParser.Keyword_templateContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_template.
+    def exitKeyword_template(self, ctx:RpgParser.Keyword_templateContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_timfmt.
+    def enterKeyword_timfmt(self, ctx:RpgParser.Keyword_timfmtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_timfmt.
+    def exitKeyword_timfmt(self, ctx:RpgParser.Keyword_timfmtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_tofile.
+    def enterKeyword_tofile(self, ctx:RpgParser.Keyword_tofileContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_tofile.
+    def exitKeyword_tofile(self, ctx:RpgParser.Keyword_tofileContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_value.
+    def enterKeyword_value(self, ctx:RpgParser.Keyword_valueContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_value.
+    def exitKeyword_value(self, ctx:RpgParser.Keyword_valueContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_varying.
+    def enterKeyword_varying(self, ctx:RpgParser.Keyword_varyingContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_varying.
+    def exitKeyword_varying(self, ctx:RpgParser.Keyword_varyingContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_psds.
+    def enterKeyword_psds(self, ctx:RpgParser.Keyword_psdsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_psds.
+    def exitKeyword_psds(self, ctx:RpgParser.Keyword_psdsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_block.
+    def enterKeyword_block(self, ctx:RpgParser.Keyword_blockContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_block.
+    def exitKeyword_block(self, ctx:RpgParser.Keyword_blockContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_commit.
+    def enterKeyword_commit(self, ctx:RpgParser.Keyword_commitContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_commit.
+    def exitKeyword_commit(self, ctx:RpgParser.Keyword_commitContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_devid.
+    def enterKeyword_devid(self, ctx:RpgParser.Keyword_devidContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_devid.
+    def exitKeyword_devid(self, ctx:RpgParser.Keyword_devidContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extdesc.
+    def enterKeyword_extdesc(self, ctx:RpgParser.Keyword_extdescContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extdesc.
+    def exitKeyword_extdesc(self, ctx:RpgParser.Keyword_extdescContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extfile.
+    def enterKeyword_extfile(self, ctx:RpgParser.Keyword_extfileContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extfile.
+    def exitKeyword_extfile(self, ctx:RpgParser.Keyword_extfileContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extind.
+    def enterKeyword_extind(self, ctx:RpgParser.Keyword_extindContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extind.
+    def exitKeyword_extind(self, ctx:RpgParser.Keyword_extindContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_extmbr.
+    def enterKeyword_extmbr(self, ctx:RpgParser.Keyword_extmbrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_extmbr.
+    def exitKeyword_extmbr(self, ctx:RpgParser.Keyword_extmbrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_formlen.
+    def enterKeyword_formlen(self, ctx:RpgParser.Keyword_formlenContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_formlen.
+    def exitKeyword_formlen(self, ctx:RpgParser.Keyword_formlenContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_formofl.
+    def enterKeyword_formofl(self, ctx:RpgParser.Keyword_formoflContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_formofl.
+    def exitKeyword_formofl(self, ctx:RpgParser.Keyword_formoflContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_ignore.
+    def enterKeyword_ignore(self, ctx:RpgParser.Keyword_ignoreContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_ignore.
+    def exitKeyword_ignore(self, ctx:RpgParser.Keyword_ignoreContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_include.
+    def enterKeyword_include(self, ctx:RpgParser.Keyword_includeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_include.
+    def exitKeyword_include(self, ctx:RpgParser.Keyword_includeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_indds.
+    def enterKeyword_indds(self, ctx:RpgParser.Keyword_inddsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_indds.
+    def exitKeyword_indds(self, ctx:RpgParser.Keyword_inddsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_infds.
+    def enterKeyword_infds(self, ctx:RpgParser.Keyword_infdsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_infds.
+    def exitKeyword_infds(self, ctx:RpgParser.Keyword_infdsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_infsr.
+    def enterKeyword_infsr(self, ctx:RpgParser.Keyword_infsrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_infsr.
+    def exitKeyword_infsr(self, ctx:RpgParser.Keyword_infsrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_keyloc.
+    def enterKeyword_keyloc(self, ctx:RpgParser.Keyword_keylocContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_keyloc.
+    def exitKeyword_keyloc(self, ctx:RpgParser.Keyword_keylocContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_maxdev.
+    def enterKeyword_maxdev(self, ctx:RpgParser.Keyword_maxdevContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_maxdev.
+    def exitKeyword_maxdev(self, ctx:RpgParser.Keyword_maxdevContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_oflind.
+    def enterKeyword_oflind(self, ctx:RpgParser.Keyword_oflindContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_oflind.
+    def exitKeyword_oflind(self, ctx:RpgParser.Keyword_oflindContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_pass.
+    def enterKeyword_pass(self, ctx:RpgParser.Keyword_passContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_pass.
+    def exitKeyword_pass(self, ctx:RpgParser.Keyword_passContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_pgmname.
+    def enterKeyword_pgmname(self, ctx:RpgParser.Keyword_pgmnameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_pgmname.
+    def exitKeyword_pgmname(self, ctx:RpgParser.Keyword_pgmnameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_plist.
+    def enterKeyword_plist(self, ctx:RpgParser.Keyword_plistContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_plist.
+    def exitKeyword_plist(self, ctx:RpgParser.Keyword_plistContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_prtctl.
+    def enterKeyword_prtctl(self, ctx:RpgParser.Keyword_prtctlContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_prtctl.
+    def exitKeyword_prtctl(self, ctx:RpgParser.Keyword_prtctlContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_rafdata.
+    def enterKeyword_rafdata(self, ctx:RpgParser.Keyword_rafdataContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_rafdata.
+    def exitKeyword_rafdata(self, ctx:RpgParser.Keyword_rafdataContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_recno.
+    def enterKeyword_recno(self, ctx:RpgParser.Keyword_recnoContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_recno.
+    def exitKeyword_recno(self, ctx:RpgParser.Keyword_recnoContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_rename.
+    def enterKeyword_rename(self, ctx:RpgParser.Keyword_renameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_rename.
+    def exitKeyword_rename(self, ctx:RpgParser.Keyword_renameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_saveds.
+    def enterKeyword_saveds(self, ctx:RpgParser.Keyword_savedsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_saveds.
+    def exitKeyword_saveds(self, ctx:RpgParser.Keyword_savedsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_saveind.
+    def enterKeyword_saveind(self, ctx:RpgParser.Keyword_saveindContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_saveind.
+    def exitKeyword_saveind(self, ctx:RpgParser.Keyword_saveindContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_sfile.
+    def enterKeyword_sfile(self, ctx:RpgParser.Keyword_sfileContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_sfile.
+    def exitKeyword_sfile(self, ctx:RpgParser.Keyword_sfileContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_sln.
+    def enterKeyword_sln(self, ctx:RpgParser.Keyword_slnContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_sln.
+    def exitKeyword_sln(self, ctx:RpgParser.Keyword_slnContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_usropn.
+    def enterKeyword_usropn(self, ctx:RpgParser.Keyword_usropnContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_usropn.
+    def exitKeyword_usropn(self, ctx:RpgParser.Keyword_usropnContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_disk.
+    def enterKeyword_disk(self, ctx:RpgParser.Keyword_diskContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_disk.
+    def exitKeyword_disk(self, ctx:RpgParser.Keyword_diskContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_workstn.
+    def enterKeyword_workstn(self, ctx:RpgParser.Keyword_workstnContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_workstn.
+    def exitKeyword_workstn(self, ctx:RpgParser.Keyword_workstnContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_printer.
+    def enterKeyword_printer(self, ctx:RpgParser.Keyword_printerContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_printer.
+    def exitKeyword_printer(self, ctx:RpgParser.Keyword_printerContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_special.
+    def enterKeyword_special(self, ctx:RpgParser.Keyword_specialContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_special.
+    def exitKeyword_special(self, ctx:RpgParser.Keyword_specialContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_keyed.
+    def enterKeyword_keyed(self, ctx:RpgParser.Keyword_keyedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_keyed.
+    def exitKeyword_keyed(self, ctx:RpgParser.Keyword_keyedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#keyword_usage.
+    def enterKeyword_usage(self, ctx:RpgParser.Keyword_usageContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#keyword_usage.
+    def exitKeyword_usage(self, ctx:RpgParser.Keyword_usageContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#like_lengthAdjustment.
+    def enterLike_lengthAdjustment(self, ctx:RpgParser.Like_lengthAdjustmentContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#like_lengthAdjustment.
+    def exitLike_lengthAdjustment(self, ctx:RpgParser.Like_lengthAdjustmentContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#sign.
+    def enterSign(self, ctx:RpgParser.SignContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#sign.
+    def exitSign(self, ctx:RpgParser.SignContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_ds.
+    def enterDcl_ds(self, ctx:RpgParser.Dcl_dsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_ds.
+    def exitDcl_ds(self, ctx:RpgParser.Dcl_dsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_ds_field.
+    def enterDcl_ds_field(self, ctx:RpgParser.Dcl_ds_fieldContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_ds_field.
+    def exitDcl_ds_field(self, ctx:RpgParser.Dcl_ds_fieldContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#end_dcl_ds.
+    def enterEnd_dcl_ds(self, ctx:RpgParser.End_dcl_dsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#end_dcl_ds.
+    def exitEnd_dcl_ds(self, ctx:RpgParser.End_dcl_dsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_pr.
+    def enterDcl_pr(self, ctx:RpgParser.Dcl_prContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_pr.
+    def exitDcl_pr(self, ctx:RpgParser.Dcl_prContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_pr_field.
+    def enterDcl_pr_field(self, ctx:RpgParser.Dcl_pr_fieldContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_pr_field.
+    def exitDcl_pr_field(self, ctx:RpgParser.Dcl_pr_fieldContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#end_dcl_pr.
+    def enterEnd_dcl_pr(self, ctx:RpgParser.End_dcl_prContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#end_dcl_pr.
+    def exitEnd_dcl_pr(self, ctx:RpgParser.End_dcl_prContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_pi.
+    def enterDcl_pi(self, ctx:RpgParser.Dcl_piContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_pi.
+    def exitDcl_pi(self, ctx:RpgParser.Dcl_piContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_pi_field.
+    def enterDcl_pi_field(self, ctx:RpgParser.Dcl_pi_fieldContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_pi_field.
+    def exitDcl_pi_field(self, ctx:RpgParser.Dcl_pi_fieldContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#end_dcl_pi.
+    def enterEnd_dcl_pi(self, ctx:RpgParser.End_dcl_piContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#end_dcl_pi.
+    def exitEnd_dcl_pi(self, ctx:RpgParser.End_dcl_piContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dcl_c.
+    def enterDcl_c(self, ctx:RpgParser.Dcl_cContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dcl_c.
+    def exitDcl_c(self, ctx:RpgParser.Dcl_cContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#ctl_opt.
+    def enterCtl_opt(self, ctx:RpgParser.Ctl_optContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#ctl_opt.
+    def exitCtl_opt(self, ctx:RpgParser.Ctl_optContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#datatypeName.
+    def enterDatatypeName(self, ctx:RpgParser.DatatypeNameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#datatypeName.
+    def exitDatatypeName(self, ctx:RpgParser.DatatypeNameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#block.
+    def enterBlock(self, ctx:RpgParser.BlockContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#block.
+    def exitBlock(self, ctx:RpgParser.BlockContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#ifstatement.
+    def enterIfstatement(self, ctx:RpgParser.IfstatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#ifstatement.
+    def exitIfstatement(self, ctx:RpgParser.IfstatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#casestatement.
+    def enterCasestatement(self, ctx:RpgParser.CasestatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#casestatement.
+    def exitCasestatement(self, ctx:RpgParser.CasestatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#casestatementend.
+    def enterCasestatementend(self, ctx:RpgParser.CasestatementendContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#casestatementend.
+    def exitCasestatementend(self, ctx:RpgParser.CasestatementendContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#monitorstatement.
+    def enterMonitorstatement(self, ctx:RpgParser.MonitorstatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#monitorstatement.
+    def exitMonitorstatement(self, ctx:RpgParser.MonitorstatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#beginmonitor.
+    def enterBeginmonitor(self, ctx:RpgParser.BeginmonitorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#beginmonitor.
+    def exitBeginmonitor(self, ctx:RpgParser.BeginmonitorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endmonitor.
+    def enterEndmonitor(self, ctx:RpgParser.EndmonitorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endmonitor.
+    def exitEndmonitor(self, ctx:RpgParser.EndmonitorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#onError.
+    def enterOnError(self, ctx:RpgParser.OnErrorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#onError.
+    def exitOnError(self, ctx:RpgParser.OnErrorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#selectstatement.
+    def enterSelectstatement(self, ctx:RpgParser.SelectstatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#selectstatement.
+    def exitSelectstatement(self, ctx:RpgParser.SelectstatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#other.
+    def enterOther(self, ctx:RpgParser.OtherContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#other.
+    def exitOther(self, ctx:RpgParser.OtherContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#beginselect.
+    def enterBeginselect(self, ctx:RpgParser.BeginselectContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#beginselect.
+    def exitBeginselect(self, ctx:RpgParser.BeginselectContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#whenstatement.
+    def enterWhenstatement(self, ctx:RpgParser.WhenstatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#whenstatement.
+    def exitWhenstatement(self, ctx:RpgParser.WhenstatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#when.
+    def enterWhen(self, ctx:RpgParser.WhenContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#when.
+    def exitWhen(self, ctx:RpgParser.WhenContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENxx.
+    def enterCsWHENxx(self, ctx:RpgParser.CsWHENxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENxx.
+    def exitCsWHENxx(self, ctx:RpgParser.CsWHENxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endselect.
+    def enterEndselect(self, ctx:RpgParser.EndselectContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endselect.
+    def exitEndselect(self, ctx:RpgParser.EndselectContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#beginif.
+    def enterBeginif(self, ctx:RpgParser.BeginifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#beginif.
+    def exitBeginif(self, ctx:RpgParser.BeginifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#begindou.
+    def enterBegindou(self, ctx:RpgParser.BegindouContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#begindou.
+    def exitBegindou(self, ctx:RpgParser.BegindouContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#begindow.
+    def enterBegindow(self, ctx:RpgParser.BegindowContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#begindow.
+    def exitBegindow(self, ctx:RpgParser.BegindowContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#begindo.
+    def enterBegindo(self, ctx:RpgParser.BegindoContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#begindo.
+    def exitBegindo(self, ctx:RpgParser.BegindoContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#elseifstmt.
+    def enterElseifstmt(self, ctx:RpgParser.ElseifstmtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#elseifstmt.
+    def exitElseifstmt(self, ctx:RpgParser.ElseifstmtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#elsestmt.
+    def enterElsestmt(self, ctx:RpgParser.ElsestmtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#elsestmt.
+    def exitElsestmt(self, ctx:RpgParser.ElsestmtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFxx.
+    def enterCsIFxx(self, ctx:RpgParser.CsIFxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFxx.
+    def exitCsIFxx(self, ctx:RpgParser.CsIFxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOUxx.
+    def enterCsDOUxx(self, ctx:RpgParser.CsDOUxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOUxx.
+    def exitCsDOUxx(self, ctx:RpgParser.CsDOUxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWxx.
+    def enterCsDOWxx(self, ctx:RpgParser.CsDOWxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWxx.
+    def exitCsDOWxx(self, ctx:RpgParser.CsDOWxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#complexCondxx.
+    def enterComplexCondxx(self, ctx:RpgParser.ComplexCondxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#complexCondxx.
+    def exitComplexCondxx(self, ctx:RpgParser.ComplexCondxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDxx.
+    def enterCsANDxx(self, ctx:RpgParser.CsANDxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDxx.
+    def exitCsANDxx(self, ctx:RpgParser.CsANDxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csORxx.
+    def enterCsORxx(self, ctx:RpgParser.CsORxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csORxx.
+    def exitCsORxx(self, ctx:RpgParser.CsORxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#forstatement.
+    def enterForstatement(self, ctx:RpgParser.ForstatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#forstatement.
+    def exitForstatement(self, ctx:RpgParser.ForstatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#beginfor.
+    def enterBeginfor(self, ctx:RpgParser.BeginforContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#beginfor.
+    def exitBeginfor(self, ctx:RpgParser.BeginforContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endif.
+    def enterEndif(self, ctx:RpgParser.EndifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endif.
+    def exitEndif(self, ctx:RpgParser.EndifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#enddo.
+    def enterEnddo(self, ctx:RpgParser.EnddoContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#enddo.
+    def exitEnddo(self, ctx:RpgParser.EnddoContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endfor.
+    def enterEndfor(self, ctx:RpgParser.EndforContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endfor.
+    def exitEndfor(self, ctx:RpgParser.EndforContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dspec_fixed.
+    def enterDspec_fixed(self, ctx:RpgParser.Dspec_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dspec_fixed.
+    def exitDspec_fixed(self, ctx:RpgParser.Dspec_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#ds_name.
+    def enterDs_name(self, ctx:RpgParser.Ds_nameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#ds_name.
+    def exitDs_name(self, ctx:RpgParser.Ds_nameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#ospec_fixed.
+    def enterOspec_fixed(self, ctx:RpgParser.Ospec_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#ospec_fixed.
+    def exitOspec_fixed(self, ctx:RpgParser.Ospec_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#os_fixed_pgmdesc1.
+    def enterOs_fixed_pgmdesc1(self, ctx:RpgParser.Os_fixed_pgmdesc1Context):
+        pass
+
+    # Exit a parse tree produced by RpgParser#os_fixed_pgmdesc1.
+    def exitOs_fixed_pgmdesc1(self, ctx:RpgParser.Os_fixed_pgmdesc1Context):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#outputConditioningOnOffIndicator.
+    def enterOutputConditioningOnOffIndicator(self, ctx:RpgParser.OutputConditioningOnOffIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#outputConditioningOnOffIndicator.
+    def exitOutputConditioningOnOffIndicator(self, ctx:RpgParser.OutputConditioningOnOffIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#outputConditioningIndicator.
+    def enterOutputConditioningIndicator(self, ctx:RpgParser.OutputConditioningIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#outputConditioningIndicator.
+    def exitOutputConditioningIndicator(self, ctx:RpgParser.OutputConditioningIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#os_fixed_pgmdesc_compound.
+    def enterOs_fixed_pgmdesc_compound(self, ctx:RpgParser.Os_fixed_pgmdesc_compoundContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#os_fixed_pgmdesc_compound.
+    def exitOs_fixed_pgmdesc_compound(self, ctx:RpgParser.Os_fixed_pgmdesc_compoundContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#os_fixed_pgmdesc2.
+    def enterOs_fixed_pgmdesc2(self, ctx:RpgParser.Os_fixed_pgmdesc2Context):
+        pass
+
+    # Exit a parse tree produced by RpgParser#os_fixed_pgmdesc2.
+    def exitOs_fixed_pgmdesc2(self, ctx:RpgParser.Os_fixed_pgmdesc2Context):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#os_fixed_pgmfield.
+    def enterOs_fixed_pgmfield(self, ctx:RpgParser.Os_fixed_pgmfieldContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#os_fixed_pgmfield.
+    def exitOs_fixed_pgmfield(self, ctx:RpgParser.Os_fixed_pgmfieldContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#ps_name.
+    def enterPs_name(self, ctx:RpgParser.Ps_nameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#ps_name.
+    def exitPs_name(self, ctx:RpgParser.Ps_nameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fspec.
+    def enterFspec(self, ctx:RpgParser.FspecContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fspec.
+    def exitFspec(self, ctx:RpgParser.FspecContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#filename.
+    def enterFilename(self, ctx:RpgParser.FilenameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#filename.
+    def exitFilename(self, ctx:RpgParser.FilenameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fs_parm.
+    def enterFs_parm(self, ctx:RpgParser.Fs_parmContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fs_parm.
+    def exitFs_parm(self, ctx:RpgParser.Fs_parmContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fs_string.
+    def enterFs_string(self, ctx:RpgParser.Fs_stringContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fs_string.
+    def exitFs_string(self, ctx:RpgParser.Fs_stringContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fs_keyword.
+    def enterFs_keyword(self, ctx:RpgParser.Fs_keywordContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fs_keyword.
+    def exitFs_keyword(self, ctx:RpgParser.Fs_keywordContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fspec_fixed.
+    def enterFspec_fixed(self, ctx:RpgParser.Fspec_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fspec_fixed.
+    def exitFspec_fixed(self, ctx:RpgParser.Fspec_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_fixed.
+    def enterCspec_fixed(self, ctx:RpgParser.Cspec_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_fixed.
+    def exitCspec_fixed(self, ctx:RpgParser.Cspec_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_continuedIndicators.
+    def enterCspec_continuedIndicators(self, ctx:RpgParser.Cspec_continuedIndicatorsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_continuedIndicators.
+    def exitCspec_continuedIndicators(self, ctx:RpgParser.Cspec_continuedIndicatorsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_blank.
+    def enterCspec_blank(self, ctx:RpgParser.Cspec_blankContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_blank.
+    def exitCspec_blank(self, ctx:RpgParser.Cspec_blankContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#blank_spec.
+    def enterBlank_spec(self, ctx:RpgParser.Blank_specContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#blank_spec.
+    def exitBlank_spec(self, ctx:RpgParser.Blank_specContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#piBegin.
+    def enterPiBegin(self, ctx:RpgParser.PiBeginContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#piBegin.
+    def exitPiBegin(self, ctx:RpgParser.PiBeginContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#parm_fixed.
+    def enterParm_fixed(self, ctx:RpgParser.Parm_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#parm_fixed.
+    def exitParm_fixed(self, ctx:RpgParser.Parm_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#pr_parm_fixed.
+    def enterPr_parm_fixed(self, ctx:RpgParser.Pr_parm_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#pr_parm_fixed.
+    def exitPr_parm_fixed(self, ctx:RpgParser.Pr_parm_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#pi_parm_fixed.
+    def enterPi_parm_fixed(self, ctx:RpgParser.Pi_parm_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#pi_parm_fixed.
+    def exitPi_parm_fixed(self, ctx:RpgParser.Pi_parm_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#procedure.
+    def enterProcedure(self, ctx:RpgParser.ProcedureContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#procedure.
+    def exitProcedure(self, ctx:RpgParser.ProcedureContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#beginProcedure.
+    def enterBeginProcedure(self, ctx:RpgParser.BeginProcedureContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#beginProcedure.
+    def exitBeginProcedure(self, ctx:RpgParser.BeginProcedureContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endProcedure.
+    def enterEndProcedure(self, ctx:RpgParser.EndProcedureContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endProcedure.
+    def exitEndProcedure(self, ctx:RpgParser.EndProcedureContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#psBegin.
+    def enterPsBegin(self, ctx:RpgParser.PsBeginContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#psBegin.
+    def exitPsBegin(self, ctx:RpgParser.PsBeginContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#freeBeginProcedure.
+    def enterFreeBeginProcedure(self, ctx:RpgParser.FreeBeginProcedureContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#freeBeginProcedure.
+    def exitFreeBeginProcedure(self, ctx:RpgParser.FreeBeginProcedureContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#psEnd.
+    def enterPsEnd(self, ctx:RpgParser.PsEndContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#psEnd.
+    def exitPsEnd(self, ctx:RpgParser.PsEndContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#freeEndProcedure.
+    def enterFreeEndProcedure(self, ctx:RpgParser.FreeEndProcedureContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#freeEndProcedure.
+    def exitFreeEndProcedure(self, ctx:RpgParser.FreeEndProcedureContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#prBegin.
+    def enterPrBegin(self, ctx:RpgParser.PrBeginContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#prBegin.
+    def exitPrBegin(self, ctx:RpgParser.PrBeginContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#subroutine.
+    def enterSubroutine(self, ctx:RpgParser.SubroutineContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#subroutine.
+    def exitSubroutine(self, ctx:RpgParser.SubroutineContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#subprocedurestatement.
+    def enterSubprocedurestatement(self, ctx:RpgParser.SubprocedurestatementContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#subprocedurestatement.
+    def exitSubprocedurestatement(self, ctx:RpgParser.SubprocedurestatementContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#begsr.
+    def enterBegsr(self, ctx:RpgParser.BegsrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#begsr.
+    def exitBegsr(self, ctx:RpgParser.BegsrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endsr.
+    def enterEndsr(self, ctx:RpgParser.EndsrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endsr.
+    def exitEndsr(self, ctx:RpgParser.EndsrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csBEGSR.
+    def enterCsBEGSR(self, ctx:RpgParser.CsBEGSRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csBEGSR.
+    def exitCsBEGSR(self, ctx:RpgParser.CsBEGSRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#freeBEGSR.
+    def enterFreeBEGSR(self, ctx:RpgParser.FreeBEGSRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#freeBEGSR.
+    def exitFreeBEGSR(self, ctx:RpgParser.FreeBEGSRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDSR.
+    def enterCsENDSR(self, ctx:RpgParser.CsENDSRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDSR.
+    def exitCsENDSR(self, ctx:RpgParser.CsENDSRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#freeENDSR.
+    def enterFreeENDSR(self, ctx:RpgParser.FreeENDSRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#freeENDSR.
+    def exitFreeENDSR(self, ctx:RpgParser.FreeENDSRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#onOffIndicatorsFlag.
+    def enterOnOffIndicatorsFlag(self, ctx:RpgParser.OnOffIndicatorsFlagContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#onOffIndicatorsFlag.
+    def exitOnOffIndicatorsFlag(self, ctx:RpgParser.OnOffIndicatorsFlagContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cs_controlLevel.
+    def enterCs_controlLevel(self, ctx:RpgParser.Cs_controlLevelContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cs_controlLevel.
+    def exitCs_controlLevel(self, ctx:RpgParser.Cs_controlLevelContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cs_indicators.
+    def enterCs_indicators(self, ctx:RpgParser.Cs_indicatorsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cs_indicators.
+    def exitCs_indicators(self, ctx:RpgParser.Cs_indicatorsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#resultIndicator.
+    def enterResultIndicator(self, ctx:RpgParser.ResultIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#resultIndicator.
+    def exitResultIndicator(self, ctx:RpgParser.ResultIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_fixed_sql.
+    def enterCspec_fixed_sql(self, ctx:RpgParser.Cspec_fixed_sqlContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_fixed_sql.
+    def exitCspec_fixed_sql(self, ctx:RpgParser.Cspec_fixed_sqlContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_fixed_standard.
+    def enterCspec_fixed_standard(self, ctx:RpgParser.Cspec_fixed_standardContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_fixed_standard.
+    def exitCspec_fixed_standard(self, ctx:RpgParser.Cspec_fixed_standardContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_fixed_standard_parts.
+    def enterCspec_fixed_standard_parts(self, ctx:RpgParser.Cspec_fixed_standard_partsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_fixed_standard_parts.
+    def exitCspec_fixed_standard_parts(self, ctx:RpgParser.Cspec_fixed_standard_partsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csACQ.
+    def enterCsACQ(self, ctx:RpgParser.CsACQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csACQ.
+    def exitCsACQ(self, ctx:RpgParser.CsACQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csADD.
+    def enterCsADD(self, ctx:RpgParser.CsADDContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csADD.
+    def exitCsADD(self, ctx:RpgParser.CsADDContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csADDDUR.
+    def enterCsADDDUR(self, ctx:RpgParser.CsADDDURContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csADDDUR.
+    def exitCsADDDUR(self, ctx:RpgParser.CsADDDURContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csALLOC.
+    def enterCsALLOC(self, ctx:RpgParser.CsALLOCContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csALLOC.
+    def exitCsALLOC(self, ctx:RpgParser.CsALLOCContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDEQ.
+    def enterCsANDEQ(self, ctx:RpgParser.CsANDEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDEQ.
+    def exitCsANDEQ(self, ctx:RpgParser.CsANDEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDNE.
+    def enterCsANDNE(self, ctx:RpgParser.CsANDNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDNE.
+    def exitCsANDNE(self, ctx:RpgParser.CsANDNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDLE.
+    def enterCsANDLE(self, ctx:RpgParser.CsANDLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDLE.
+    def exitCsANDLE(self, ctx:RpgParser.CsANDLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDLT.
+    def enterCsANDLT(self, ctx:RpgParser.CsANDLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDLT.
+    def exitCsANDLT(self, ctx:RpgParser.CsANDLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDGE.
+    def enterCsANDGE(self, ctx:RpgParser.CsANDGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDGE.
+    def exitCsANDGE(self, ctx:RpgParser.CsANDGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csANDGT.
+    def enterCsANDGT(self, ctx:RpgParser.CsANDGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csANDGT.
+    def exitCsANDGT(self, ctx:RpgParser.CsANDGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csBITOFF.
+    def enterCsBITOFF(self, ctx:RpgParser.CsBITOFFContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csBITOFF.
+    def exitCsBITOFF(self, ctx:RpgParser.CsBITOFFContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csBITON.
+    def enterCsBITON(self, ctx:RpgParser.CsBITONContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csBITON.
+    def exitCsBITON(self, ctx:RpgParser.CsBITONContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABxx.
+    def enterCsCABxx(self, ctx:RpgParser.CsCABxxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABxx.
+    def exitCsCABxx(self, ctx:RpgParser.CsCABxxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABEQ.
+    def enterCsCABEQ(self, ctx:RpgParser.CsCABEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABEQ.
+    def exitCsCABEQ(self, ctx:RpgParser.CsCABEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABNE.
+    def enterCsCABNE(self, ctx:RpgParser.CsCABNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABNE.
+    def exitCsCABNE(self, ctx:RpgParser.CsCABNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABLE.
+    def enterCsCABLE(self, ctx:RpgParser.CsCABLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABLE.
+    def exitCsCABLE(self, ctx:RpgParser.CsCABLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABLT.
+    def enterCsCABLT(self, ctx:RpgParser.CsCABLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABLT.
+    def exitCsCABLT(self, ctx:RpgParser.CsCABLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABGE.
+    def enterCsCABGE(self, ctx:RpgParser.CsCABGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABGE.
+    def exitCsCABGE(self, ctx:RpgParser.CsCABGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCABGT.
+    def enterCsCABGT(self, ctx:RpgParser.CsCABGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCABGT.
+    def exitCsCABGT(self, ctx:RpgParser.CsCABGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCALL.
+    def enterCsCALL(self, ctx:RpgParser.CsCALLContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCALL.
+    def exitCsCALL(self, ctx:RpgParser.CsCALLContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCALLB.
+    def enterCsCALLB(self, ctx:RpgParser.CsCALLBContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCALLB.
+    def exitCsCALLB(self, ctx:RpgParser.CsCALLBContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCALLP.
+    def enterCsCALLP(self, ctx:RpgParser.CsCALLPContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCALLP.
+    def exitCsCALLP(self, ctx:RpgParser.CsCALLPContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCASEQ.
+    def enterCsCASEQ(self, ctx:RpgParser.CsCASEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCASEQ.
+    def exitCsCASEQ(self, ctx:RpgParser.CsCASEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCASNE.
+    def enterCsCASNE(self, ctx:RpgParser.CsCASNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCASNE.
+    def exitCsCASNE(self, ctx:RpgParser.CsCASNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCASLE.
+    def enterCsCASLE(self, ctx:RpgParser.CsCASLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCASLE.
+    def exitCsCASLE(self, ctx:RpgParser.CsCASLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCASLT.
+    def enterCsCASLT(self, ctx:RpgParser.CsCASLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCASLT.
+    def exitCsCASLT(self, ctx:RpgParser.CsCASLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCASGE.
+    def enterCsCASGE(self, ctx:RpgParser.CsCASGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCASGE.
+    def exitCsCASGE(self, ctx:RpgParser.CsCASGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCASGT.
+    def enterCsCASGT(self, ctx:RpgParser.CsCASGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCASGT.
+    def exitCsCASGT(self, ctx:RpgParser.CsCASGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCAS.
+    def enterCsCAS(self, ctx:RpgParser.CsCASContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCAS.
+    def exitCsCAS(self, ctx:RpgParser.CsCASContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCAT.
+    def enterCsCAT(self, ctx:RpgParser.CsCATContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCAT.
+    def exitCsCAT(self, ctx:RpgParser.CsCATContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCHAIN.
+    def enterCsCHAIN(self, ctx:RpgParser.CsCHAINContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCHAIN.
+    def exitCsCHAIN(self, ctx:RpgParser.CsCHAINContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCHECK.
+    def enterCsCHECK(self, ctx:RpgParser.CsCHECKContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCHECK.
+    def exitCsCHECK(self, ctx:RpgParser.CsCHECKContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCHECKR.
+    def enterCsCHECKR(self, ctx:RpgParser.CsCHECKRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCHECKR.
+    def exitCsCHECKR(self, ctx:RpgParser.CsCHECKRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCLEAR.
+    def enterCsCLEAR(self, ctx:RpgParser.CsCLEARContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCLEAR.
+    def exitCsCLEAR(self, ctx:RpgParser.CsCLEARContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCLOSE.
+    def enterCsCLOSE(self, ctx:RpgParser.CsCLOSEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCLOSE.
+    def exitCsCLOSE(self, ctx:RpgParser.CsCLOSEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCOMMIT.
+    def enterCsCOMMIT(self, ctx:RpgParser.CsCOMMITContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCOMMIT.
+    def exitCsCOMMIT(self, ctx:RpgParser.CsCOMMITContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csCOMP.
+    def enterCsCOMP(self, ctx:RpgParser.CsCOMPContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csCOMP.
+    def exitCsCOMP(self, ctx:RpgParser.CsCOMPContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDEALLOC.
+    def enterCsDEALLOC(self, ctx:RpgParser.CsDEALLOCContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDEALLOC.
+    def exitCsDEALLOC(self, ctx:RpgParser.CsDEALLOCContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDEFINE.
+    def enterCsDEFINE(self, ctx:RpgParser.CsDEFINEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDEFINE.
+    def exitCsDEFINE(self, ctx:RpgParser.CsDEFINEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDELETE.
+    def enterCsDELETE(self, ctx:RpgParser.CsDELETEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDELETE.
+    def exitCsDELETE(self, ctx:RpgParser.CsDELETEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDIV.
+    def enterCsDIV(self, ctx:RpgParser.CsDIVContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDIV.
+    def exitCsDIV(self, ctx:RpgParser.CsDIVContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDO.
+    def enterCsDO(self, ctx:RpgParser.CsDOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDO.
+    def exitCsDO(self, ctx:RpgParser.CsDOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOU.
+    def enterCsDOU(self, ctx:RpgParser.CsDOUContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOU.
+    def exitCsDOU(self, ctx:RpgParser.CsDOUContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOUEQ.
+    def enterCsDOUEQ(self, ctx:RpgParser.CsDOUEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOUEQ.
+    def exitCsDOUEQ(self, ctx:RpgParser.CsDOUEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOUNE.
+    def enterCsDOUNE(self, ctx:RpgParser.CsDOUNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOUNE.
+    def exitCsDOUNE(self, ctx:RpgParser.CsDOUNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOULE.
+    def enterCsDOULE(self, ctx:RpgParser.CsDOULEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOULE.
+    def exitCsDOULE(self, ctx:RpgParser.CsDOULEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOULT.
+    def enterCsDOULT(self, ctx:RpgParser.CsDOULTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOULT.
+    def exitCsDOULT(self, ctx:RpgParser.CsDOULTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOUGE.
+    def enterCsDOUGE(self, ctx:RpgParser.CsDOUGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOUGE.
+    def exitCsDOUGE(self, ctx:RpgParser.CsDOUGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOUGT.
+    def enterCsDOUGT(self, ctx:RpgParser.CsDOUGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOUGT.
+    def exitCsDOUGT(self, ctx:RpgParser.CsDOUGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOW.
+    def enterCsDOW(self, ctx:RpgParser.CsDOWContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOW.
+    def exitCsDOW(self, ctx:RpgParser.CsDOWContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWEQ.
+    def enterCsDOWEQ(self, ctx:RpgParser.CsDOWEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWEQ.
+    def exitCsDOWEQ(self, ctx:RpgParser.CsDOWEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWNE.
+    def enterCsDOWNE(self, ctx:RpgParser.CsDOWNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWNE.
+    def exitCsDOWNE(self, ctx:RpgParser.CsDOWNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWLE.
+    def enterCsDOWLE(self, ctx:RpgParser.CsDOWLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWLE.
+    def exitCsDOWLE(self, ctx:RpgParser.CsDOWLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWLT.
+    def enterCsDOWLT(self, ctx:RpgParser.CsDOWLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWLT.
+    def exitCsDOWLT(self, ctx:RpgParser.CsDOWLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWGE.
+    def enterCsDOWGE(self, ctx:RpgParser.CsDOWGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWGE.
+    def exitCsDOWGE(self, ctx:RpgParser.CsDOWGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDOWGT.
+    def enterCsDOWGT(self, ctx:RpgParser.CsDOWGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDOWGT.
+    def exitCsDOWGT(self, ctx:RpgParser.CsDOWGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDSPLY.
+    def enterCsDSPLY(self, ctx:RpgParser.CsDSPLYContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDSPLY.
+    def exitCsDSPLY(self, ctx:RpgParser.CsDSPLYContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csDUMP.
+    def enterCsDUMP(self, ctx:RpgParser.CsDUMPContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csDUMP.
+    def exitCsDUMP(self, ctx:RpgParser.CsDUMPContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csELSE.
+    def enterCsELSE(self, ctx:RpgParser.CsELSEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csELSE.
+    def exitCsELSE(self, ctx:RpgParser.CsELSEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csELSEIF.
+    def enterCsELSEIF(self, ctx:RpgParser.CsELSEIFContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csELSEIF.
+    def exitCsELSEIF(self, ctx:RpgParser.CsELSEIFContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEND.
+    def enterCsEND(self, ctx:RpgParser.CsENDContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEND.
+    def exitCsEND(self, ctx:RpgParser.CsENDContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDCS.
+    def enterCsENDCS(self, ctx:RpgParser.CsENDCSContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDCS.
+    def exitCsENDCS(self, ctx:RpgParser.CsENDCSContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDDO.
+    def enterCsENDDO(self, ctx:RpgParser.CsENDDOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDDO.
+    def exitCsENDDO(self, ctx:RpgParser.CsENDDOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDFOR.
+    def enterCsENDFOR(self, ctx:RpgParser.CsENDFORContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDFOR.
+    def exitCsENDFOR(self, ctx:RpgParser.CsENDFORContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDIF.
+    def enterCsENDIF(self, ctx:RpgParser.CsENDIFContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDIF.
+    def exitCsENDIF(self, ctx:RpgParser.CsENDIFContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDMON.
+    def enterCsENDMON(self, ctx:RpgParser.CsENDMONContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDMON.
+    def exitCsENDMON(self, ctx:RpgParser.CsENDMONContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csENDSL.
+    def enterCsENDSL(self, ctx:RpgParser.CsENDSLContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csENDSL.
+    def exitCsENDSL(self, ctx:RpgParser.CsENDSLContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEVAL.
+    def enterCsEVAL(self, ctx:RpgParser.CsEVALContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEVAL.
+    def exitCsEVAL(self, ctx:RpgParser.CsEVALContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEVAL_CORR.
+    def enterCsEVAL_CORR(self, ctx:RpgParser.CsEVAL_CORRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEVAL_CORR.
+    def exitCsEVAL_CORR(self, ctx:RpgParser.CsEVAL_CORRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEVALR.
+    def enterCsEVALR(self, ctx:RpgParser.CsEVALRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEVALR.
+    def exitCsEVALR(self, ctx:RpgParser.CsEVALRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEXCEPT.
+    def enterCsEXCEPT(self, ctx:RpgParser.CsEXCEPTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEXCEPT.
+    def exitCsEXCEPT(self, ctx:RpgParser.CsEXCEPTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEXFMT.
+    def enterCsEXFMT(self, ctx:RpgParser.CsEXFMTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEXFMT.
+    def exitCsEXFMT(self, ctx:RpgParser.CsEXFMTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEXSR.
+    def enterCsEXSR(self, ctx:RpgParser.CsEXSRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEXSR.
+    def exitCsEXSR(self, ctx:RpgParser.CsEXSRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csEXTRCT.
+    def enterCsEXTRCT(self, ctx:RpgParser.CsEXTRCTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csEXTRCT.
+    def exitCsEXTRCT(self, ctx:RpgParser.CsEXTRCTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csFEOD.
+    def enterCsFEOD(self, ctx:RpgParser.CsFEODContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csFEOD.
+    def exitCsFEOD(self, ctx:RpgParser.CsFEODContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csFOR.
+    def enterCsFOR(self, ctx:RpgParser.CsFORContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csFOR.
+    def exitCsFOR(self, ctx:RpgParser.CsFORContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csFORCE.
+    def enterCsFORCE(self, ctx:RpgParser.CsFORCEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csFORCE.
+    def exitCsFORCE(self, ctx:RpgParser.CsFORCEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csGOTO.
+    def enterCsGOTO(self, ctx:RpgParser.CsGOTOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csGOTO.
+    def exitCsGOTO(self, ctx:RpgParser.CsGOTOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIF.
+    def enterCsIF(self, ctx:RpgParser.CsIFContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIF.
+    def exitCsIF(self, ctx:RpgParser.CsIFContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFEQ.
+    def enterCsIFEQ(self, ctx:RpgParser.CsIFEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFEQ.
+    def exitCsIFEQ(self, ctx:RpgParser.CsIFEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFNE.
+    def enterCsIFNE(self, ctx:RpgParser.CsIFNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFNE.
+    def exitCsIFNE(self, ctx:RpgParser.CsIFNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFLE.
+    def enterCsIFLE(self, ctx:RpgParser.CsIFLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFLE.
+    def exitCsIFLE(self, ctx:RpgParser.CsIFLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFLT.
+    def enterCsIFLT(self, ctx:RpgParser.CsIFLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFLT.
+    def exitCsIFLT(self, ctx:RpgParser.CsIFLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFGE.
+    def enterCsIFGE(self, ctx:RpgParser.CsIFGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFGE.
+    def exitCsIFGE(self, ctx:RpgParser.CsIFGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIFGT.
+    def enterCsIFGT(self, ctx:RpgParser.CsIFGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIFGT.
+    def exitCsIFGT(self, ctx:RpgParser.CsIFGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csIN.
+    def enterCsIN(self, ctx:RpgParser.CsINContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csIN.
+    def exitCsIN(self, ctx:RpgParser.CsINContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csITER.
+    def enterCsITER(self, ctx:RpgParser.CsITERContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csITER.
+    def exitCsITER(self, ctx:RpgParser.CsITERContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csKLIST.
+    def enterCsKLIST(self, ctx:RpgParser.CsKLISTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csKLIST.
+    def exitCsKLIST(self, ctx:RpgParser.CsKLISTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csKFLD.
+    def enterCsKFLD(self, ctx:RpgParser.CsKFLDContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csKFLD.
+    def exitCsKFLD(self, ctx:RpgParser.CsKFLDContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csLEAVE.
+    def enterCsLEAVE(self, ctx:RpgParser.CsLEAVEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csLEAVE.
+    def exitCsLEAVE(self, ctx:RpgParser.CsLEAVEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csLEAVESR.
+    def enterCsLEAVESR(self, ctx:RpgParser.CsLEAVESRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csLEAVESR.
+    def exitCsLEAVESR(self, ctx:RpgParser.CsLEAVESRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csLOOKUP.
+    def enterCsLOOKUP(self, ctx:RpgParser.CsLOOKUPContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csLOOKUP.
+    def exitCsLOOKUP(self, ctx:RpgParser.CsLOOKUPContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMHHZO.
+    def enterCsMHHZO(self, ctx:RpgParser.CsMHHZOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMHHZO.
+    def exitCsMHHZO(self, ctx:RpgParser.CsMHHZOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMHLZO.
+    def enterCsMHLZO(self, ctx:RpgParser.CsMHLZOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMHLZO.
+    def exitCsMHLZO(self, ctx:RpgParser.CsMHLZOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMLHZO.
+    def enterCsMLHZO(self, ctx:RpgParser.CsMLHZOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMLHZO.
+    def exitCsMLHZO(self, ctx:RpgParser.CsMLHZOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMLLZO.
+    def enterCsMLLZO(self, ctx:RpgParser.CsMLLZOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMLLZO.
+    def exitCsMLLZO(self, ctx:RpgParser.CsMLLZOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMONITOR.
+    def enterCsMONITOR(self, ctx:RpgParser.CsMONITORContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMONITOR.
+    def exitCsMONITOR(self, ctx:RpgParser.CsMONITORContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMOVE.
+    def enterCsMOVE(self, ctx:RpgParser.CsMOVEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMOVE.
+    def exitCsMOVE(self, ctx:RpgParser.CsMOVEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMOVEA.
+    def enterCsMOVEA(self, ctx:RpgParser.CsMOVEAContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMOVEA.
+    def exitCsMOVEA(self, ctx:RpgParser.CsMOVEAContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMOVEL.
+    def enterCsMOVEL(self, ctx:RpgParser.CsMOVELContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMOVEL.
+    def exitCsMOVEL(self, ctx:RpgParser.CsMOVELContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMULT.
+    def enterCsMULT(self, ctx:RpgParser.CsMULTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMULT.
+    def exitCsMULT(self, ctx:RpgParser.CsMULTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csMVR.
+    def enterCsMVR(self, ctx:RpgParser.CsMVRContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csMVR.
+    def exitCsMVR(self, ctx:RpgParser.CsMVRContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csNEXT.
+    def enterCsNEXT(self, ctx:RpgParser.CsNEXTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csNEXT.
+    def exitCsNEXT(self, ctx:RpgParser.CsNEXTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csOCCUR.
+    def enterCsOCCUR(self, ctx:RpgParser.CsOCCURContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csOCCUR.
+    def exitCsOCCUR(self, ctx:RpgParser.CsOCCURContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csON_ERROR.
+    def enterCsON_ERROR(self, ctx:RpgParser.CsON_ERRORContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csON_ERROR.
+    def exitCsON_ERROR(self, ctx:RpgParser.CsON_ERRORContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#onErrorCode.
+    def enterOnErrorCode(self, ctx:RpgParser.OnErrorCodeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#onErrorCode.
+    def exitOnErrorCode(self, ctx:RpgParser.OnErrorCodeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csOPEN.
+    def enterCsOPEN(self, ctx:RpgParser.CsOPENContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csOPEN.
+    def exitCsOPEN(self, ctx:RpgParser.CsOPENContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csOREQ.
+    def enterCsOREQ(self, ctx:RpgParser.CsOREQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csOREQ.
+    def exitCsOREQ(self, ctx:RpgParser.CsOREQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csORNE.
+    def enterCsORNE(self, ctx:RpgParser.CsORNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csORNE.
+    def exitCsORNE(self, ctx:RpgParser.CsORNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csORLE.
+    def enterCsORLE(self, ctx:RpgParser.CsORLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csORLE.
+    def exitCsORLE(self, ctx:RpgParser.CsORLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csORLT.
+    def enterCsORLT(self, ctx:RpgParser.CsORLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csORLT.
+    def exitCsORLT(self, ctx:RpgParser.CsORLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csORGE.
+    def enterCsORGE(self, ctx:RpgParser.CsORGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csORGE.
+    def exitCsORGE(self, ctx:RpgParser.CsORGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csORGT.
+    def enterCsORGT(self, ctx:RpgParser.CsORGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csORGT.
+    def exitCsORGT(self, ctx:RpgParser.CsORGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csOTHER.
+    def enterCsOTHER(self, ctx:RpgParser.CsOTHERContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csOTHER.
+    def exitCsOTHER(self, ctx:RpgParser.CsOTHERContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csOUT.
+    def enterCsOUT(self, ctx:RpgParser.CsOUTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csOUT.
+    def exitCsOUT(self, ctx:RpgParser.CsOUTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csPARM.
+    def enterCsPARM(self, ctx:RpgParser.CsPARMContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csPARM.
+    def exitCsPARM(self, ctx:RpgParser.CsPARMContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csPLIST.
+    def enterCsPLIST(self, ctx:RpgParser.CsPLISTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csPLIST.
+    def exitCsPLIST(self, ctx:RpgParser.CsPLISTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csPOST.
+    def enterCsPOST(self, ctx:RpgParser.CsPOSTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csPOST.
+    def exitCsPOST(self, ctx:RpgParser.CsPOSTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREAD.
+    def enterCsREAD(self, ctx:RpgParser.CsREADContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREAD.
+    def exitCsREAD(self, ctx:RpgParser.CsREADContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREADC.
+    def enterCsREADC(self, ctx:RpgParser.CsREADCContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREADC.
+    def exitCsREADC(self, ctx:RpgParser.CsREADCContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREADE.
+    def enterCsREADE(self, ctx:RpgParser.CsREADEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREADE.
+    def exitCsREADE(self, ctx:RpgParser.CsREADEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREADP.
+    def enterCsREADP(self, ctx:RpgParser.CsREADPContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREADP.
+    def exitCsREADP(self, ctx:RpgParser.CsREADPContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREADPE.
+    def enterCsREADPE(self, ctx:RpgParser.CsREADPEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREADPE.
+    def exitCsREADPE(self, ctx:RpgParser.CsREADPEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREALLOC.
+    def enterCsREALLOC(self, ctx:RpgParser.CsREALLOCContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREALLOC.
+    def exitCsREALLOC(self, ctx:RpgParser.CsREALLOCContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csREL.
+    def enterCsREL(self, ctx:RpgParser.CsRELContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csREL.
+    def exitCsREL(self, ctx:RpgParser.CsRELContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csRESET.
+    def enterCsRESET(self, ctx:RpgParser.CsRESETContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csRESET.
+    def exitCsRESET(self, ctx:RpgParser.CsRESETContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csRETURN.
+    def enterCsRETURN(self, ctx:RpgParser.CsRETURNContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csRETURN.
+    def exitCsRETURN(self, ctx:RpgParser.CsRETURNContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csROLBK.
+    def enterCsROLBK(self, ctx:RpgParser.CsROLBKContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csROLBK.
+    def exitCsROLBK(self, ctx:RpgParser.CsROLBKContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSCAN.
+    def enterCsSCAN(self, ctx:RpgParser.CsSCANContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSCAN.
+    def exitCsSCAN(self, ctx:RpgParser.CsSCANContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSELECT.
+    def enterCsSELECT(self, ctx:RpgParser.CsSELECTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSELECT.
+    def exitCsSELECT(self, ctx:RpgParser.CsSELECTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSETGT.
+    def enterCsSETGT(self, ctx:RpgParser.CsSETGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSETGT.
+    def exitCsSETGT(self, ctx:RpgParser.CsSETGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSETLL.
+    def enterCsSETLL(self, ctx:RpgParser.CsSETLLContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSETLL.
+    def exitCsSETLL(self, ctx:RpgParser.CsSETLLContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSETOFF.
+    def enterCsSETOFF(self, ctx:RpgParser.CsSETOFFContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSETOFF.
+    def exitCsSETOFF(self, ctx:RpgParser.CsSETOFFContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSETON.
+    def enterCsSETON(self, ctx:RpgParser.CsSETONContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSETON.
+    def exitCsSETON(self, ctx:RpgParser.CsSETONContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSHTDN.
+    def enterCsSHTDN(self, ctx:RpgParser.CsSHTDNContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSHTDN.
+    def exitCsSHTDN(self, ctx:RpgParser.CsSHTDNContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSORTA.
+    def enterCsSORTA(self, ctx:RpgParser.CsSORTAContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSORTA.
+    def exitCsSORTA(self, ctx:RpgParser.CsSORTAContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSQRT.
+    def enterCsSQRT(self, ctx:RpgParser.CsSQRTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSQRT.
+    def exitCsSQRT(self, ctx:RpgParser.CsSQRTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSUB.
+    def enterCsSUB(self, ctx:RpgParser.CsSUBContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSUB.
+    def exitCsSUB(self, ctx:RpgParser.CsSUBContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSUBDUR.
+    def enterCsSUBDUR(self, ctx:RpgParser.CsSUBDURContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSUBDUR.
+    def exitCsSUBDUR(self, ctx:RpgParser.CsSUBDURContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csSUBST.
+    def enterCsSUBST(self, ctx:RpgParser.CsSUBSTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csSUBST.
+    def exitCsSUBST(self, ctx:RpgParser.CsSUBSTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csTAG.
+    def enterCsTAG(self, ctx:RpgParser.CsTAGContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csTAG.
+    def exitCsTAG(self, ctx:RpgParser.CsTAGContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csTEST.
+    def enterCsTEST(self, ctx:RpgParser.CsTESTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csTEST.
+    def exitCsTEST(self, ctx:RpgParser.CsTESTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csTESTB.
+    def enterCsTESTB(self, ctx:RpgParser.CsTESTBContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csTESTB.
+    def exitCsTESTB(self, ctx:RpgParser.CsTESTBContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csTESTN.
+    def enterCsTESTN(self, ctx:RpgParser.CsTESTNContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csTESTN.
+    def exitCsTESTN(self, ctx:RpgParser.CsTESTNContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csTESTZ.
+    def enterCsTESTZ(self, ctx:RpgParser.CsTESTZContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csTESTZ.
+    def exitCsTESTZ(self, ctx:RpgParser.CsTESTZContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csTIME.
+    def enterCsTIME(self, ctx:RpgParser.CsTIMEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csTIME.
+    def exitCsTIME(self, ctx:RpgParser.CsTIMEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csUNLOCK.
+    def enterCsUNLOCK(self, ctx:RpgParser.CsUNLOCKContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csUNLOCK.
+    def exitCsUNLOCK(self, ctx:RpgParser.CsUNLOCKContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csUPDATE.
+    def enterCsUPDATE(self, ctx:RpgParser.CsUPDATEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csUPDATE.
+    def exitCsUPDATE(self, ctx:RpgParser.CsUPDATEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHEN.
+    def enterCsWHEN(self, ctx:RpgParser.CsWHENContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHEN.
+    def exitCsWHEN(self, ctx:RpgParser.CsWHENContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENEQ.
+    def enterCsWHENEQ(self, ctx:RpgParser.CsWHENEQContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENEQ.
+    def exitCsWHENEQ(self, ctx:RpgParser.CsWHENEQContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENNE.
+    def enterCsWHENNE(self, ctx:RpgParser.CsWHENNEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENNE.
+    def exitCsWHENNE(self, ctx:RpgParser.CsWHENNEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENLE.
+    def enterCsWHENLE(self, ctx:RpgParser.CsWHENLEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENLE.
+    def exitCsWHENLE(self, ctx:RpgParser.CsWHENLEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENLT.
+    def enterCsWHENLT(self, ctx:RpgParser.CsWHENLTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENLT.
+    def exitCsWHENLT(self, ctx:RpgParser.CsWHENLTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENGE.
+    def enterCsWHENGE(self, ctx:RpgParser.CsWHENGEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENGE.
+    def exitCsWHENGE(self, ctx:RpgParser.CsWHENGEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWHENGT.
+    def enterCsWHENGT(self, ctx:RpgParser.CsWHENGTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWHENGT.
+    def exitCsWHENGT(self, ctx:RpgParser.CsWHENGTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csWRITE.
+    def enterCsWRITE(self, ctx:RpgParser.CsWRITEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csWRITE.
+    def exitCsWRITE(self, ctx:RpgParser.CsWRITEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csXFOOT.
+    def enterCsXFOOT(self, ctx:RpgParser.CsXFOOTContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csXFOOT.
+    def exitCsXFOOT(self, ctx:RpgParser.CsXFOOTContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csXLATE.
+    def enterCsXLATE(self, ctx:RpgParser.CsXLATEContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csXLATE.
+    def exitCsXLATE(self, ctx:RpgParser.CsXLATEContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csXML_INTO.
+    def enterCsXML_INTO(self, ctx:RpgParser.CsXML_INTOContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csXML_INTO.
+    def exitCsXML_INTO(self, ctx:RpgParser.CsXML_INTOContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csXML_SAX.
+    def enterCsXML_SAX(self, ctx:RpgParser.CsXML_SAXContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csXML_SAX.
+    def exitCsXML_SAX(self, ctx:RpgParser.CsXML_SAXContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csZ_ADD.
+    def enterCsZ_ADD(self, ctx:RpgParser.CsZ_ADDContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csZ_ADD.
+    def exitCsZ_ADD(self, ctx:RpgParser.CsZ_ADDContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csZ_SUB.
+    def enterCsZ_SUB(self, ctx:RpgParser.CsZ_SUBContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csZ_SUB.
+    def exitCsZ_SUB(self, ctx:RpgParser.CsZ_SUBContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cs_operationExtender.
+    def enterCs_operationExtender(self, ctx:RpgParser.Cs_operationExtenderContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cs_operationExtender.
+    def exitCs_operationExtender(self, ctx:RpgParser.Cs_operationExtenderContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#factor.
+    def enterFactor(self, ctx:RpgParser.FactorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#factor.
+    def exitFactor(self, ctx:RpgParser.FactorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#factorContent.
+    def enterFactorContent(self, ctx:RpgParser.FactorContentContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#factorContent.
+    def exitFactorContent(self, ctx:RpgParser.FactorContentContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#resultType.
+    def enterResultType(self, ctx:RpgParser.ResultTypeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#resultType.
+    def exitResultType(self, ctx:RpgParser.ResultTypeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cs_fixed_comments.
+    def enterCs_fixed_comments(self, ctx:RpgParser.Cs_fixed_commentsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cs_fixed_comments.
+    def exitCs_fixed_comments(self, ctx:RpgParser.Cs_fixed_commentsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#cspec_fixed_x2.
+    def enterCspec_fixed_x2(self, ctx:RpgParser.Cspec_fixed_x2Context):
+        pass
+
+    # Exit a parse tree produced by RpgParser#cspec_fixed_x2.
+    def exitCspec_fixed_x2(self, ctx:RpgParser.Cspec_fixed_x2Context):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#csOperationAndExtendedFactor2.
+    def enterCsOperationAndExtendedFactor2(self, ctx:RpgParser.CsOperationAndExtendedFactor2Context):
+        pass
+
+    # Exit a parse tree produced by RpgParser#csOperationAndExtendedFactor2.
+    def exitCsOperationAndExtendedFactor2(self, ctx:RpgParser.CsOperationAndExtendedFactor2Context):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#ispec_fixed.
+    def enterIspec_fixed(self, ctx:RpgParser.Ispec_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#ispec_fixed.
+    def exitIspec_fixed(self, ctx:RpgParser.Ispec_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fieldRecordRelation.
+    def enterFieldRecordRelation(self, ctx:RpgParser.FieldRecordRelationContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fieldRecordRelation.
+    def exitFieldRecordRelation(self, ctx:RpgParser.FieldRecordRelationContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#fieldIndicator.
+    def enterFieldIndicator(self, ctx:RpgParser.FieldIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#fieldIndicator.
+    def exitFieldIndicator(self, ctx:RpgParser.FieldIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#is_external_rec.
+    def enterIs_external_rec(self, ctx:RpgParser.Is_external_recContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#is_external_rec.
+    def exitIs_external_rec(self, ctx:RpgParser.Is_external_recContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#is_rec.
+    def enterIs_rec(self, ctx:RpgParser.Is_recContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#is_rec.
+    def exitIs_rec(self, ctx:RpgParser.Is_recContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#recordIdIndicator.
+    def enterRecordIdIndicator(self, ctx:RpgParser.RecordIdIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#recordIdIndicator.
+    def exitRecordIdIndicator(self, ctx:RpgParser.RecordIdIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#is_external_field.
+    def enterIs_external_field(self, ctx:RpgParser.Is_external_fieldContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#is_external_field.
+    def exitIs_external_field(self, ctx:RpgParser.Is_external_fieldContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#controlLevelIndicator.
+    def enterControlLevelIndicator(self, ctx:RpgParser.ControlLevelIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#controlLevelIndicator.
+    def exitControlLevelIndicator(self, ctx:RpgParser.ControlLevelIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#matchingFieldsIndicator.
+    def enterMatchingFieldsIndicator(self, ctx:RpgParser.MatchingFieldsIndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#matchingFieldsIndicator.
+    def exitMatchingFieldsIndicator(self, ctx:RpgParser.MatchingFieldsIndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#hspec_fixed.
+    def enterHspec_fixed(self, ctx:RpgParser.Hspec_fixedContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#hspec_fixed.
+    def exitHspec_fixed(self, ctx:RpgParser.Hspec_fixedContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#hs_expression.
+    def enterHs_expression(self, ctx:RpgParser.Hs_expressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#hs_expression.
+    def exitHs_expression(self, ctx:RpgParser.Hs_expressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#hs_parm.
+    def enterHs_parm(self, ctx:RpgParser.Hs_parmContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#hs_parm.
+    def exitHs_parm(self, ctx:RpgParser.Hs_parmContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#hs_string.
+    def enterHs_string(self, ctx:RpgParser.Hs_stringContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#hs_string.
+    def exitHs_string(self, ctx:RpgParser.Hs_stringContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#blank_line.
+    def enterBlank_line(self, ctx:RpgParser.Blank_lineContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#blank_line.
+    def exitBlank_line(self, ctx:RpgParser.Blank_lineContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#directive.
+    def enterDirective(self, ctx:RpgParser.DirectiveContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#directive.
+    def exitDirective(self, ctx:RpgParser.DirectiveContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#space_directive.
+    def enterSpace_directive(self, ctx:RpgParser.Space_directiveContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#space_directive.
+    def exitSpace_directive(self, ctx:RpgParser.Space_directiveContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_copy.
+    def enterDir_copy(self, ctx:RpgParser.Dir_copyContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_copy.
+    def exitDir_copy(self, ctx:RpgParser.Dir_copyContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_include.
+    def enterDir_include(self, ctx:RpgParser.Dir_includeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_include.
+    def exitDir_include(self, ctx:RpgParser.Dir_includeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_if.
+    def enterDir_if(self, ctx:RpgParser.Dir_ifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_if.
+    def exitDir_if(self, ctx:RpgParser.Dir_ifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_elseif.
+    def enterDir_elseif(self, ctx:RpgParser.Dir_elseifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_elseif.
+    def exitDir_elseif(self, ctx:RpgParser.Dir_elseifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_else.
+    def enterDir_else(self, ctx:RpgParser.Dir_elseContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_else.
+    def exitDir_else(self, ctx:RpgParser.Dir_elseContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_endif.
+    def enterDir_endif(self, ctx:RpgParser.Dir_endifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_endif.
+    def exitDir_endif(self, ctx:RpgParser.Dir_endifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_define.
+    def enterDir_define(self, ctx:RpgParser.Dir_defineContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_define.
+    def exitDir_define(self, ctx:RpgParser.Dir_defineContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_undefine.
+    def enterDir_undefine(self, ctx:RpgParser.Dir_undefineContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_undefine.
+    def exitDir_undefine(self, ctx:RpgParser.Dir_undefineContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#dir_eof.
+    def enterDir_eof(self, ctx:RpgParser.Dir_eofContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#dir_eof.
+    def exitDir_eof(self, ctx:RpgParser.Dir_eofContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#beginfree_directive.
+    def enterBeginfree_directive(self, ctx:RpgParser.Beginfree_directiveContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#beginfree_directive.
+    def exitBeginfree_directive(self, ctx:RpgParser.Beginfree_directiveContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#endfree_directive.
+    def enterEndfree_directive(self, ctx:RpgParser.Endfree_directiveContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#endfree_directive.
+    def exitEndfree_directive(self, ctx:RpgParser.Endfree_directiveContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#copyText.
+    def enterCopyText(self, ctx:RpgParser.CopyTextContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#copyText.
+    def exitCopyText(self, ctx:RpgParser.CopyTextContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#trailing_ws.
+    def enterTrailing_ws(self, ctx:RpgParser.Trailing_wsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#trailing_ws.
+    def exitTrailing_ws(self, ctx:RpgParser.Trailing_wsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#title_directive.
+    def enterTitle_directive(self, ctx:RpgParser.Title_directiveContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#title_directive.
+    def exitTitle_directive(self, ctx:RpgParser.Title_directiveContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#title_text.
+    def enterTitle_text(self, ctx:RpgParser.Title_textContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#title_text.
+    def exitTitle_text(self, ctx:RpgParser.Title_textContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op.
+    def enterOp(self, ctx:RpgParser.OpContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op.
+    def exitOp(self, ctx:RpgParser.OpContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_acq.
+    def enterOp_acq(self, ctx:RpgParser.Op_acqContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_acq.
+    def exitOp_acq(self, ctx:RpgParser.Op_acqContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_callp.
+    def enterOp_callp(self, ctx:RpgParser.Op_callpContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_callp.
+    def exitOp_callp(self, ctx:RpgParser.Op_callpContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_chain.
+    def enterOp_chain(self, ctx:RpgParser.Op_chainContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_chain.
+    def exitOp_chain(self, ctx:RpgParser.Op_chainContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_clear.
+    def enterOp_clear(self, ctx:RpgParser.Op_clearContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_clear.
+    def exitOp_clear(self, ctx:RpgParser.Op_clearContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_close.
+    def enterOp_close(self, ctx:RpgParser.Op_closeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_close.
+    def exitOp_close(self, ctx:RpgParser.Op_closeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_commit.
+    def enterOp_commit(self, ctx:RpgParser.Op_commitContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_commit.
+    def exitOp_commit(self, ctx:RpgParser.Op_commitContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_dealloc.
+    def enterOp_dealloc(self, ctx:RpgParser.Op_deallocContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_dealloc.
+    def exitOp_dealloc(self, ctx:RpgParser.Op_deallocContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_delete.
+    def enterOp_delete(self, ctx:RpgParser.Op_deleteContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_delete.
+    def exitOp_delete(self, ctx:RpgParser.Op_deleteContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_dou.
+    def enterOp_dou(self, ctx:RpgParser.Op_douContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_dou.
+    def exitOp_dou(self, ctx:RpgParser.Op_douContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_dow.
+    def enterOp_dow(self, ctx:RpgParser.Op_dowContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_dow.
+    def exitOp_dow(self, ctx:RpgParser.Op_dowContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_dsply.
+    def enterOp_dsply(self, ctx:RpgParser.Op_dsplyContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_dsply.
+    def exitOp_dsply(self, ctx:RpgParser.Op_dsplyContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_dump.
+    def enterOp_dump(self, ctx:RpgParser.Op_dumpContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_dump.
+    def exitOp_dump(self, ctx:RpgParser.Op_dumpContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_else.
+    def enterOp_else(self, ctx:RpgParser.Op_elseContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_else.
+    def exitOp_else(self, ctx:RpgParser.Op_elseContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_elseif.
+    def enterOp_elseif(self, ctx:RpgParser.Op_elseifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_elseif.
+    def exitOp_elseif(self, ctx:RpgParser.Op_elseifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_enddo.
+    def enterOp_enddo(self, ctx:RpgParser.Op_enddoContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_enddo.
+    def exitOp_enddo(self, ctx:RpgParser.Op_enddoContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_endfor.
+    def enterOp_endfor(self, ctx:RpgParser.Op_endforContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_endfor.
+    def exitOp_endfor(self, ctx:RpgParser.Op_endforContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_endif.
+    def enterOp_endif(self, ctx:RpgParser.Op_endifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_endif.
+    def exitOp_endif(self, ctx:RpgParser.Op_endifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_endmon.
+    def enterOp_endmon(self, ctx:RpgParser.Op_endmonContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_endmon.
+    def exitOp_endmon(self, ctx:RpgParser.Op_endmonContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_endsl.
+    def enterOp_endsl(self, ctx:RpgParser.Op_endslContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_endsl.
+    def exitOp_endsl(self, ctx:RpgParser.Op_endslContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_eval.
+    def enterOp_eval(self, ctx:RpgParser.Op_evalContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_eval.
+    def exitOp_eval(self, ctx:RpgParser.Op_evalContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_evalr.
+    def enterOp_evalr(self, ctx:RpgParser.Op_evalrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_evalr.
+    def exitOp_evalr(self, ctx:RpgParser.Op_evalrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_eval_corr.
+    def enterOp_eval_corr(self, ctx:RpgParser.Op_eval_corrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_eval_corr.
+    def exitOp_eval_corr(self, ctx:RpgParser.Op_eval_corrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_except.
+    def enterOp_except(self, ctx:RpgParser.Op_exceptContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_except.
+    def exitOp_except(self, ctx:RpgParser.Op_exceptContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_exfmt.
+    def enterOp_exfmt(self, ctx:RpgParser.Op_exfmtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_exfmt.
+    def exitOp_exfmt(self, ctx:RpgParser.Op_exfmtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_exsr.
+    def enterOp_exsr(self, ctx:RpgParser.Op_exsrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_exsr.
+    def exitOp_exsr(self, ctx:RpgParser.Op_exsrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_feod.
+    def enterOp_feod(self, ctx:RpgParser.Op_feodContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_feod.
+    def exitOp_feod(self, ctx:RpgParser.Op_feodContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_for.
+    def enterOp_for(self, ctx:RpgParser.Op_forContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_for.
+    def exitOp_for(self, ctx:RpgParser.Op_forContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_force.
+    def enterOp_force(self, ctx:RpgParser.Op_forceContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_force.
+    def exitOp_force(self, ctx:RpgParser.Op_forceContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_if.
+    def enterOp_if(self, ctx:RpgParser.Op_ifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_if.
+    def exitOp_if(self, ctx:RpgParser.Op_ifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_in.
+    def enterOp_in(self, ctx:RpgParser.Op_inContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_in.
+    def exitOp_in(self, ctx:RpgParser.Op_inContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_iter.
+    def enterOp_iter(self, ctx:RpgParser.Op_iterContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_iter.
+    def exitOp_iter(self, ctx:RpgParser.Op_iterContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_leave.
+    def enterOp_leave(self, ctx:RpgParser.Op_leaveContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_leave.
+    def exitOp_leave(self, ctx:RpgParser.Op_leaveContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_leavesr.
+    def enterOp_leavesr(self, ctx:RpgParser.Op_leavesrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_leavesr.
+    def exitOp_leavesr(self, ctx:RpgParser.Op_leavesrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_monitor.
+    def enterOp_monitor(self, ctx:RpgParser.Op_monitorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_monitor.
+    def exitOp_monitor(self, ctx:RpgParser.Op_monitorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_next.
+    def enterOp_next(self, ctx:RpgParser.Op_nextContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_next.
+    def exitOp_next(self, ctx:RpgParser.Op_nextContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_on_error.
+    def enterOp_on_error(self, ctx:RpgParser.Op_on_errorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_on_error.
+    def exitOp_on_error(self, ctx:RpgParser.Op_on_errorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_open.
+    def enterOp_open(self, ctx:RpgParser.Op_openContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_open.
+    def exitOp_open(self, ctx:RpgParser.Op_openContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_other.
+    def enterOp_other(self, ctx:RpgParser.Op_otherContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_other.
+    def exitOp_other(self, ctx:RpgParser.Op_otherContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_out.
+    def enterOp_out(self, ctx:RpgParser.Op_outContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_out.
+    def exitOp_out(self, ctx:RpgParser.Op_outContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_post.
+    def enterOp_post(self, ctx:RpgParser.Op_postContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_post.
+    def exitOp_post(self, ctx:RpgParser.Op_postContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_read.
+    def enterOp_read(self, ctx:RpgParser.Op_readContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_read.
+    def exitOp_read(self, ctx:RpgParser.Op_readContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_readc.
+    def enterOp_readc(self, ctx:RpgParser.Op_readcContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_readc.
+    def exitOp_readc(self, ctx:RpgParser.Op_readcContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_reade.
+    def enterOp_reade(self, ctx:RpgParser.Op_readeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_reade.
+    def exitOp_reade(self, ctx:RpgParser.Op_readeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_readp.
+    def enterOp_readp(self, ctx:RpgParser.Op_readpContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_readp.
+    def exitOp_readp(self, ctx:RpgParser.Op_readpContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_readpe.
+    def enterOp_readpe(self, ctx:RpgParser.Op_readpeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_readpe.
+    def exitOp_readpe(self, ctx:RpgParser.Op_readpeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_rel.
+    def enterOp_rel(self, ctx:RpgParser.Op_relContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_rel.
+    def exitOp_rel(self, ctx:RpgParser.Op_relContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_reset2.
+    def enterOp_reset2(self, ctx:RpgParser.Op_reset2Context):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_reset2.
+    def exitOp_reset2(self, ctx:RpgParser.Op_reset2Context):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_reset.
+    def enterOp_reset(self, ctx:RpgParser.Op_resetContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_reset.
+    def exitOp_reset(self, ctx:RpgParser.Op_resetContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_return.
+    def enterOp_return(self, ctx:RpgParser.Op_returnContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_return.
+    def exitOp_return(self, ctx:RpgParser.Op_returnContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_rolbk.
+    def enterOp_rolbk(self, ctx:RpgParser.Op_rolbkContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_rolbk.
+    def exitOp_rolbk(self, ctx:RpgParser.Op_rolbkContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_select.
+    def enterOp_select(self, ctx:RpgParser.Op_selectContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_select.
+    def exitOp_select(self, ctx:RpgParser.Op_selectContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_setgt.
+    def enterOp_setgt(self, ctx:RpgParser.Op_setgtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_setgt.
+    def exitOp_setgt(self, ctx:RpgParser.Op_setgtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_setll.
+    def enterOp_setll(self, ctx:RpgParser.Op_setllContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_setll.
+    def exitOp_setll(self, ctx:RpgParser.Op_setllContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_sorta.
+    def enterOp_sorta(self, ctx:RpgParser.Op_sortaContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_sorta.
+    def exitOp_sorta(self, ctx:RpgParser.Op_sortaContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_test.
+    def enterOp_test(self, ctx:RpgParser.Op_testContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_test.
+    def exitOp_test(self, ctx:RpgParser.Op_testContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_unlock.
+    def enterOp_unlock(self, ctx:RpgParser.Op_unlockContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_unlock.
+    def exitOp_unlock(self, ctx:RpgParser.Op_unlockContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_update.
+    def enterOp_update(self, ctx:RpgParser.Op_updateContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_update.
+    def exitOp_update(self, ctx:RpgParser.Op_updateContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_when.
+    def enterOp_when(self, ctx:RpgParser.Op_whenContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_when.
+    def exitOp_when(self, ctx:RpgParser.Op_whenContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_write.
+    def enterOp_write(self, ctx:RpgParser.Op_writeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_write.
+    def exitOp_write(self, ctx:RpgParser.Op_writeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_xml_into.
+    def enterOp_xml_into(self, ctx:RpgParser.Op_xml_intoContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_xml_into.
+    def exitOp_xml_into(self, ctx:RpgParser.Op_xml_intoContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_xml_sax.
+    def enterOp_xml_sax(self, ctx:RpgParser.Op_xml_saxContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_xml_sax.
+    def exitOp_xml_sax(self, ctx:RpgParser.Op_xml_saxContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#search_arg.
+    def enterSearch_arg(self, ctx:RpgParser.Search_argContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#search_arg.
+    def exitSearch_arg(self, ctx:RpgParser.Search_argContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#op_code.
+    def enterOp_code(self, ctx:RpgParser.Op_codeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#op_code.
+    def exitOp_code(self, ctx:RpgParser.Op_codeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif.
+    def enterBif(self, ctx:RpgParser.BifContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif.
+    def exitBif(self, ctx:RpgParser.BifContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#optargs.
+    def enterOptargs(self, ctx:RpgParser.OptargsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#optargs.
+    def exitOptargs(self, ctx:RpgParser.OptargsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_charformat.
+    def enterBif_charformat(self, ctx:RpgParser.Bif_charformatContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_charformat.
+    def exitBif_charformat(self, ctx:RpgParser.Bif_charformatContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_dateformat.
+    def enterBif_dateformat(self, ctx:RpgParser.Bif_dateformatContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_dateformat.
+    def exitBif_dateformat(self, ctx:RpgParser.Bif_dateformatContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_timeformat.
+    def enterBif_timeformat(self, ctx:RpgParser.Bif_timeformatContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_timeformat.
+    def exitBif_timeformat(self, ctx:RpgParser.Bif_timeformatContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_editccurrency.
+    def enterBif_editccurrency(self, ctx:RpgParser.Bif_editccurrencyContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_editccurrency.
+    def exitBif_editccurrency(self, ctx:RpgParser.Bif_editccurrencyContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_lookupargs.
+    def enterBif_lookupargs(self, ctx:RpgParser.Bif_lookupargsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_lookupargs.
+    def exitBif_lookupargs(self, ctx:RpgParser.Bif_lookupargsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#durationCode.
+    def enterDurationCode(self, ctx:RpgParser.DurationCodeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#durationCode.
+    def exitDurationCode(self, ctx:RpgParser.DurationCodeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_timestampargs.
+    def enterBif_timestampargs(self, ctx:RpgParser.Bif_timestampargsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_timestampargs.
+    def exitBif_timestampargs(self, ctx:RpgParser.Bif_timestampargsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_tlookupargs.
+    def enterBif_tlookupargs(self, ctx:RpgParser.Bif_tlookupargsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_tlookupargs.
+    def exitBif_tlookupargs(self, ctx:RpgParser.Bif_tlookupargsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_abs.
+    def enterBif_abs(self, ctx:RpgParser.Bif_absContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_abs.
+    def exitBif_abs(self, ctx:RpgParser.Bif_absContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_addr.
+    def enterBif_addr(self, ctx:RpgParser.Bif_addrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_addr.
+    def exitBif_addr(self, ctx:RpgParser.Bif_addrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_alloc.
+    def enterBif_alloc(self, ctx:RpgParser.Bif_allocContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_alloc.
+    def exitBif_alloc(self, ctx:RpgParser.Bif_allocContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_bitand.
+    def enterBif_bitand(self, ctx:RpgParser.Bif_bitandContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_bitand.
+    def exitBif_bitand(self, ctx:RpgParser.Bif_bitandContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_bitnot.
+    def enterBif_bitnot(self, ctx:RpgParser.Bif_bitnotContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_bitnot.
+    def exitBif_bitnot(self, ctx:RpgParser.Bif_bitnotContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_bitor.
+    def enterBif_bitor(self, ctx:RpgParser.Bif_bitorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_bitor.
+    def exitBif_bitor(self, ctx:RpgParser.Bif_bitorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_bitxor.
+    def enterBif_bitxor(self, ctx:RpgParser.Bif_bitxorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_bitxor.
+    def exitBif_bitxor(self, ctx:RpgParser.Bif_bitxorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_char.
+    def enterBif_char(self, ctx:RpgParser.Bif_charContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_char.
+    def exitBif_char(self, ctx:RpgParser.Bif_charContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_check.
+    def enterBif_check(self, ctx:RpgParser.Bif_checkContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_check.
+    def exitBif_check(self, ctx:RpgParser.Bif_checkContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_checkr.
+    def enterBif_checkr(self, ctx:RpgParser.Bif_checkrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_checkr.
+    def exitBif_checkr(self, ctx:RpgParser.Bif_checkrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_date.
+    def enterBif_date(self, ctx:RpgParser.Bif_dateContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_date.
+    def exitBif_date(self, ctx:RpgParser.Bif_dateContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_days.
+    def enterBif_days(self, ctx:RpgParser.Bif_daysContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_days.
+    def exitBif_days(self, ctx:RpgParser.Bif_daysContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_dec.
+    def enterBif_dec(self, ctx:RpgParser.Bif_decContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_dec.
+    def exitBif_dec(self, ctx:RpgParser.Bif_decContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_dech.
+    def enterBif_dech(self, ctx:RpgParser.Bif_dechContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_dech.
+    def exitBif_dech(self, ctx:RpgParser.Bif_dechContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_decpos.
+    def enterBif_decpos(self, ctx:RpgParser.Bif_decposContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_decpos.
+    def exitBif_decpos(self, ctx:RpgParser.Bif_decposContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_diff.
+    def enterBif_diff(self, ctx:RpgParser.Bif_diffContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_diff.
+    def exitBif_diff(self, ctx:RpgParser.Bif_diffContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_div.
+    def enterBif_div(self, ctx:RpgParser.Bif_divContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_div.
+    def exitBif_div(self, ctx:RpgParser.Bif_divContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_editc.
+    def enterBif_editc(self, ctx:RpgParser.Bif_editcContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_editc.
+    def exitBif_editc(self, ctx:RpgParser.Bif_editcContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_editflt.
+    def enterBif_editflt(self, ctx:RpgParser.Bif_editfltContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_editflt.
+    def exitBif_editflt(self, ctx:RpgParser.Bif_editfltContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_editw.
+    def enterBif_editw(self, ctx:RpgParser.Bif_editwContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_editw.
+    def exitBif_editw(self, ctx:RpgParser.Bif_editwContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_elem.
+    def enterBif_elem(self, ctx:RpgParser.Bif_elemContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_elem.
+    def exitBif_elem(self, ctx:RpgParser.Bif_elemContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_eof.
+    def enterBif_eof(self, ctx:RpgParser.Bif_eofContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_eof.
+    def exitBif_eof(self, ctx:RpgParser.Bif_eofContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_equal.
+    def enterBif_equal(self, ctx:RpgParser.Bif_equalContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_equal.
+    def exitBif_equal(self, ctx:RpgParser.Bif_equalContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_error.
+    def enterBif_error(self, ctx:RpgParser.Bif_errorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_error.
+    def exitBif_error(self, ctx:RpgParser.Bif_errorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_fields.
+    def enterBif_fields(self, ctx:RpgParser.Bif_fieldsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_fields.
+    def exitBif_fields(self, ctx:RpgParser.Bif_fieldsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_float.
+    def enterBif_float(self, ctx:RpgParser.Bif_floatContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_float.
+    def exitBif_float(self, ctx:RpgParser.Bif_floatContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_found.
+    def enterBif_found(self, ctx:RpgParser.Bif_foundContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_found.
+    def exitBif_found(self, ctx:RpgParser.Bif_foundContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_graph.
+    def enterBif_graph(self, ctx:RpgParser.Bif_graphContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_graph.
+    def exitBif_graph(self, ctx:RpgParser.Bif_graphContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_handler.
+    def enterBif_handler(self, ctx:RpgParser.Bif_handlerContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_handler.
+    def exitBif_handler(self, ctx:RpgParser.Bif_handlerContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_hours.
+    def enterBif_hours(self, ctx:RpgParser.Bif_hoursContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_hours.
+    def exitBif_hours(self, ctx:RpgParser.Bif_hoursContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_int.
+    def enterBif_int(self, ctx:RpgParser.Bif_intContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_int.
+    def exitBif_int(self, ctx:RpgParser.Bif_intContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_inth.
+    def enterBif_inth(self, ctx:RpgParser.Bif_inthContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_inth.
+    def exitBif_inth(self, ctx:RpgParser.Bif_inthContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_kds.
+    def enterBif_kds(self, ctx:RpgParser.Bif_kdsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_kds.
+    def exitBif_kds(self, ctx:RpgParser.Bif_kdsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_len.
+    def enterBif_len(self, ctx:RpgParser.Bif_lenContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_len.
+    def exitBif_len(self, ctx:RpgParser.Bif_lenContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_lookup.
+    def enterBif_lookup(self, ctx:RpgParser.Bif_lookupContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_lookup.
+    def exitBif_lookup(self, ctx:RpgParser.Bif_lookupContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_lookuplt.
+    def enterBif_lookuplt(self, ctx:RpgParser.Bif_lookupltContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_lookuplt.
+    def exitBif_lookuplt(self, ctx:RpgParser.Bif_lookupltContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_lookuple.
+    def enterBif_lookuple(self, ctx:RpgParser.Bif_lookupleContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_lookuple.
+    def exitBif_lookuple(self, ctx:RpgParser.Bif_lookupleContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_lookupgt.
+    def enterBif_lookupgt(self, ctx:RpgParser.Bif_lookupgtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_lookupgt.
+    def exitBif_lookupgt(self, ctx:RpgParser.Bif_lookupgtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_lookupge.
+    def enterBif_lookupge(self, ctx:RpgParser.Bif_lookupgeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_lookupge.
+    def exitBif_lookupge(self, ctx:RpgParser.Bif_lookupgeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_minutes.
+    def enterBif_minutes(self, ctx:RpgParser.Bif_minutesContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_minutes.
+    def exitBif_minutes(self, ctx:RpgParser.Bif_minutesContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_months.
+    def enterBif_months(self, ctx:RpgParser.Bif_monthsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_months.
+    def exitBif_months(self, ctx:RpgParser.Bif_monthsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_mseconds.
+    def enterBif_mseconds(self, ctx:RpgParser.Bif_msecondsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_mseconds.
+    def exitBif_mseconds(self, ctx:RpgParser.Bif_msecondsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_nullind.
+    def enterBif_nullind(self, ctx:RpgParser.Bif_nullindContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_nullind.
+    def exitBif_nullind(self, ctx:RpgParser.Bif_nullindContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_occur.
+    def enterBif_occur(self, ctx:RpgParser.Bif_occurContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_occur.
+    def exitBif_occur(self, ctx:RpgParser.Bif_occurContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_open.
+    def enterBif_open(self, ctx:RpgParser.Bif_openContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_open.
+    def exitBif_open(self, ctx:RpgParser.Bif_openContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_paddr.
+    def enterBif_paddr(self, ctx:RpgParser.Bif_paddrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_paddr.
+    def exitBif_paddr(self, ctx:RpgParser.Bif_paddrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_parms.
+    def enterBif_parms(self, ctx:RpgParser.Bif_parmsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_parms.
+    def exitBif_parms(self, ctx:RpgParser.Bif_parmsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_parmnum.
+    def enterBif_parmnum(self, ctx:RpgParser.Bif_parmnumContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_parmnum.
+    def exitBif_parmnum(self, ctx:RpgParser.Bif_parmnumContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_realloc.
+    def enterBif_realloc(self, ctx:RpgParser.Bif_reallocContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_realloc.
+    def exitBif_realloc(self, ctx:RpgParser.Bif_reallocContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_rem.
+    def enterBif_rem(self, ctx:RpgParser.Bif_remContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_rem.
+    def exitBif_rem(self, ctx:RpgParser.Bif_remContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_replace.
+    def enterBif_replace(self, ctx:RpgParser.Bif_replaceContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_replace.
+    def exitBif_replace(self, ctx:RpgParser.Bif_replaceContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_scan.
+    def enterBif_scan(self, ctx:RpgParser.Bif_scanContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_scan.
+    def exitBif_scan(self, ctx:RpgParser.Bif_scanContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_scanrpl.
+    def enterBif_scanrpl(self, ctx:RpgParser.Bif_scanrplContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_scanrpl.
+    def exitBif_scanrpl(self, ctx:RpgParser.Bif_scanrplContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_seconds.
+    def enterBif_seconds(self, ctx:RpgParser.Bif_secondsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_seconds.
+    def exitBif_seconds(self, ctx:RpgParser.Bif_secondsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_shtdn.
+    def enterBif_shtdn(self, ctx:RpgParser.Bif_shtdnContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_shtdn.
+    def exitBif_shtdn(self, ctx:RpgParser.Bif_shtdnContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_size.
+    def enterBif_size(self, ctx:RpgParser.Bif_sizeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_size.
+    def exitBif_size(self, ctx:RpgParser.Bif_sizeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_sqrt.
+    def enterBif_sqrt(self, ctx:RpgParser.Bif_sqrtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_sqrt.
+    def exitBif_sqrt(self, ctx:RpgParser.Bif_sqrtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_status.
+    def enterBif_status(self, ctx:RpgParser.Bif_statusContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_status.
+    def exitBif_status(self, ctx:RpgParser.Bif_statusContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_str.
+    def enterBif_str(self, ctx:RpgParser.Bif_strContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_str.
+    def exitBif_str(self, ctx:RpgParser.Bif_strContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_subarr.
+    def enterBif_subarr(self, ctx:RpgParser.Bif_subarrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_subarr.
+    def exitBif_subarr(self, ctx:RpgParser.Bif_subarrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_subdt.
+    def enterBif_subdt(self, ctx:RpgParser.Bif_subdtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_subdt.
+    def exitBif_subdt(self, ctx:RpgParser.Bif_subdtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_subst.
+    def enterBif_subst(self, ctx:RpgParser.Bif_substContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_subst.
+    def exitBif_subst(self, ctx:RpgParser.Bif_substContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_this.
+    def enterBif_this(self, ctx:RpgParser.Bif_thisContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_this.
+    def exitBif_this(self, ctx:RpgParser.Bif_thisContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_time.
+    def enterBif_time(self, ctx:RpgParser.Bif_timeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_time.
+    def exitBif_time(self, ctx:RpgParser.Bif_timeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_timestamp.
+    def enterBif_timestamp(self, ctx:RpgParser.Bif_timestampContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_timestamp.
+    def exitBif_timestamp(self, ctx:RpgParser.Bif_timestampContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_tlookup.
+    def enterBif_tlookup(self, ctx:RpgParser.Bif_tlookupContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_tlookup.
+    def exitBif_tlookup(self, ctx:RpgParser.Bif_tlookupContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_tlookuplt.
+    def enterBif_tlookuplt(self, ctx:RpgParser.Bif_tlookupltContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_tlookuplt.
+    def exitBif_tlookuplt(self, ctx:RpgParser.Bif_tlookupltContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_tlookuple.
+    def enterBif_tlookuple(self, ctx:RpgParser.Bif_tlookupleContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_tlookuple.
+    def exitBif_tlookuple(self, ctx:RpgParser.Bif_tlookupleContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_tlookupgt.
+    def enterBif_tlookupgt(self, ctx:RpgParser.Bif_tlookupgtContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_tlookupgt.
+    def exitBif_tlookupgt(self, ctx:RpgParser.Bif_tlookupgtContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_tlookupge.
+    def enterBif_tlookupge(self, ctx:RpgParser.Bif_tlookupgeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_tlookupge.
+    def exitBif_tlookupge(self, ctx:RpgParser.Bif_tlookupgeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_trim.
+    def enterBif_trim(self, ctx:RpgParser.Bif_trimContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_trim.
+    def exitBif_trim(self, ctx:RpgParser.Bif_trimContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_triml.
+    def enterBif_triml(self, ctx:RpgParser.Bif_trimlContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_triml.
+    def exitBif_triml(self, ctx:RpgParser.Bif_trimlContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_trimr.
+    def enterBif_trimr(self, ctx:RpgParser.Bif_trimrContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_trimr.
+    def exitBif_trimr(self, ctx:RpgParser.Bif_trimrContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_ucs2.
+    def enterBif_ucs2(self, ctx:RpgParser.Bif_ucs2Context):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_ucs2.
+    def exitBif_ucs2(self, ctx:RpgParser.Bif_ucs2Context):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_uns.
+    def enterBif_uns(self, ctx:RpgParser.Bif_unsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_uns.
+    def exitBif_uns(self, ctx:RpgParser.Bif_unsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_unsh.
+    def enterBif_unsh(self, ctx:RpgParser.Bif_unshContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_unsh.
+    def exitBif_unsh(self, ctx:RpgParser.Bif_unshContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_xfoot.
+    def enterBif_xfoot(self, ctx:RpgParser.Bif_xfootContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_xfoot.
+    def exitBif_xfoot(self, ctx:RpgParser.Bif_xfootContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_xlate.
+    def enterBif_xlate(self, ctx:RpgParser.Bif_xlateContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_xlate.
+    def exitBif_xlate(self, ctx:RpgParser.Bif_xlateContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_xml.
+    def enterBif_xml(self, ctx:RpgParser.Bif_xmlContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_xml.
+    def exitBif_xml(self, ctx:RpgParser.Bif_xmlContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_years.
+    def enterBif_years(self, ctx:RpgParser.Bif_yearsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_years.
+    def exitBif_years(self, ctx:RpgParser.Bif_yearsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#bif_code.
+    def enterBif_code(self, ctx:RpgParser.Bif_codeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#bif_code.
+    def exitBif_code(self, ctx:RpgParser.Bif_codeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#free.
+    def enterFree(self, ctx:RpgParser.FreeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#free.
+    def exitFree(self, ctx:RpgParser.FreeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#c_free.
+    def enterC_free(self, ctx:RpgParser.C_freeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#c_free.
+    def exitC_free(self, ctx:RpgParser.C_freeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#control.
+    def enterControl(self, ctx:RpgParser.ControlContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#control.
+    def exitControl(self, ctx:RpgParser.ControlContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#exec_sql.
+    def enterExec_sql(self, ctx:RpgParser.Exec_sqlContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#exec_sql.
+    def exitExec_sql(self, ctx:RpgParser.Exec_sqlContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#baseExpression.
+    def enterBaseExpression(self, ctx:RpgParser.BaseExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#baseExpression.
+    def exitBaseExpression(self, ctx:RpgParser.BaseExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#indicator.
+    def enterIndicator(self, ctx:RpgParser.IndicatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#indicator.
+    def exitIndicator(self, ctx:RpgParser.IndicatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#assignmentExpression.
+    def enterAssignmentExpression(self, ctx:RpgParser.AssignmentExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#assignmentExpression.
+    def exitAssignmentExpression(self, ctx:RpgParser.AssignmentExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#assignOperatorExpression.
+    def enterAssignOperatorExpression(self, ctx:RpgParser.AssignOperatorExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#assignOperatorExpression.
+    def exitAssignOperatorExpression(self, ctx:RpgParser.AssignOperatorExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#evalExpression.
+    def enterEvalExpression(self, ctx:RpgParser.EvalExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#evalExpression.
+    def exitEvalExpression(self, ctx:RpgParser.EvalExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#simpleExpression.
+    def enterSimpleExpression(self, ctx:RpgParser.SimpleExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#simpleExpression.
+    def exitSimpleExpression(self, ctx:RpgParser.SimpleExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#unaryExpression.
+    def enterUnaryExpression(self, ctx:RpgParser.UnaryExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#unaryExpression.
+    def exitUnaryExpression(self, ctx:RpgParser.UnaryExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#expression.
+    def enterExpression(self, ctx:RpgParser.ExpressionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#expression.
+    def exitExpression(self, ctx:RpgParser.ExpressionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#indicator_expr.
+    def enterIndicator_expr(self, ctx:RpgParser.Indicator_exprContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#indicator_expr.
+    def exitIndicator_expr(self, ctx:RpgParser.Indicator_exprContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#function.
+    def enterFunction(self, ctx:RpgParser.FunctionContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#function.
+    def exitFunction(self, ctx:RpgParser.FunctionContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#comparisonOperator.
+    def enterComparisonOperator(self, ctx:RpgParser.ComparisonOperatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#comparisonOperator.
+    def exitComparisonOperator(self, ctx:RpgParser.ComparisonOperatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#assignmentOperator.
+    def enterAssignmentOperator(self, ctx:RpgParser.AssignmentOperatorContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#assignmentOperator.
+    def exitAssignmentOperator(self, ctx:RpgParser.AssignmentOperatorContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#args.
+    def enterArgs(self, ctx:RpgParser.ArgsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#args.
+    def exitArgs(self, ctx:RpgParser.ArgsContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#literal.
+    def enterLiteral(self, ctx:RpgParser.LiteralContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#literal.
+    def exitLiteral(self, ctx:RpgParser.LiteralContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#identifier.
+    def enterIdentifier(self, ctx:RpgParser.IdentifierContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#identifier.
+    def exitIdentifier(self, ctx:RpgParser.IdentifierContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#all.
+    def enterAll(self, ctx:RpgParser.AllContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#all.
+    def exitAll(self, ctx:RpgParser.AllContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#functionName.
+    def enterFunctionName(self, ctx:RpgParser.FunctionNameContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#functionName.
+    def exitFunctionName(self, ctx:RpgParser.FunctionNameContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#multipart_identifier.
+    def enterMultipart_identifier(self, ctx:RpgParser.Multipart_identifierContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#multipart_identifier.
+    def exitMultipart_identifier(self, ctx:RpgParser.Multipart_identifierContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#indexed_identifier.
+    def enterIndexed_identifier(self, ctx:RpgParser.Indexed_identifierContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#indexed_identifier.
+    def exitIndexed_identifier(self, ctx:RpgParser.Indexed_identifierContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#opCode.
+    def enterOpCode(self, ctx:RpgParser.OpCodeContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#opCode.
+    def exitOpCode(self, ctx:RpgParser.OpCodeContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#number.
+    def enterNumber(self, ctx:RpgParser.NumberContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#number.
+    def exitNumber(self, ctx:RpgParser.NumberContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#free_identifier.
+    def enterFree_identifier(self, ctx:RpgParser.Free_identifierContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#free_identifier.
+    def exitFree_identifier(self, ctx:RpgParser.Free_identifierContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#continuedIdentifier.
+    def enterContinuedIdentifier(self, ctx:RpgParser.ContinuedIdentifierContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#continuedIdentifier.
+    def exitContinuedIdentifier(self, ctx:RpgParser.ContinuedIdentifierContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#idOrKeyword.
+    def enterIdOrKeyword(self, ctx:RpgParser.IdOrKeywordContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#idOrKeyword.
+    def exitIdOrKeyword(self, ctx:RpgParser.IdOrKeywordContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#argument.
+    def enterArgument(self, ctx:RpgParser.ArgumentContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#argument.
+    def exitArgument(self, ctx:RpgParser.ArgumentContext):
+        pass
+
+
+    # Enter a parse tree produced by RpgParser#symbolicConstants.
+    def enterSymbolicConstants(self, ctx:RpgParser.SymbolicConstantsContext):
+        pass
+
+    # Exit a parse tree produced by RpgParser#symbolicConstants.
+    def exitSymbolicConstants(self, ctx:RpgParser.SymbolicConstantsContext):
+        pass
+
+
+
+del RpgParser
\ No newline at end of file
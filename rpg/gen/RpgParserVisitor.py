@@ -0,0 +1,2898 @@
+# Generated from RpgParser.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .RpgParser import RpgParser
+else:
+    from RpgParser import RpgParser
+
+# This class defines a complete generic visitor for a parse tree produced by RpgParser.
+
+class RpgParserVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by RpgParser#r.
+    def visitR(self, ctx:RpgParser.RContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#statement.
+    def visitStatement(self, ctx:RpgParser.StatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endSource.
+    def visitEndSource(self, ctx:RpgParser.EndSourceContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endSourceHead.
+    def visitEndSourceHead(self, ctx:RpgParser.EndSourceHeadContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endSourceLine.
+    def visitEndSourceLine(self, ctx:RpgParser.EndSourceLineContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#star_comments.
+    def visitStar_comments(self, ctx:RpgParser.Star_commentsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#free_comments.
+    def visitFree_comments(self, ctx:RpgParser.Free_commentsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#free_linecomments.
+    def visitFree_linecomments(self, ctx:RpgParser.Free_linecommentsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#comments.
+    def visitComments(self, ctx:RpgParser.CommentsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dspec.
+    def visitDspec(self, ctx:RpgParser.DspecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dspecConstant.
+    def visitDspecConstant(self, ctx:RpgParser.DspecConstantContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#datatype.
+    def visitDatatype(self, ctx:RpgParser.DatatypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword.
+    def visitKeyword(self, ctx:RpgParser.KeywordContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dspec_bif.
+    def visitDspec_bif(self, ctx:RpgParser.Dspec_bifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_alias.
+    def visitKeyword_alias(self, ctx:RpgParser.Keyword_aliasContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_align.
+    def visitKeyword_align(self, ctx:RpgParser.Keyword_alignContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_alt.
+    def visitKeyword_alt(self, ctx:RpgParser.Keyword_altContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_altseq.
+    def visitKeyword_altseq(self, ctx:RpgParser.Keyword_altseqContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_ascend.
+    def visitKeyword_ascend(self, ctx:RpgParser.Keyword_ascendContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_based.
+    def visitKeyword_based(self, ctx:RpgParser.Keyword_basedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_ccsid.
+    def visitKeyword_ccsid(self, ctx:RpgParser.Keyword_ccsidContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_class.
+    def visitKeyword_class(self, ctx:RpgParser.Keyword_classContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_const.
+    def visitKeyword_const(self, ctx:RpgParser.Keyword_constContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_ctdata.
+    def visitKeyword_ctdata(self, ctx:RpgParser.Keyword_ctdataContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_datfmt.
+    def visitKeyword_datfmt(self, ctx:RpgParser.Keyword_datfmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dateSeparator.
+    def visitDateSeparator(self, ctx:RpgParser.DateSeparatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_descend.
+    def visitKeyword_descend(self, ctx:RpgParser.Keyword_descendContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_dim.
+    def visitKeyword_dim(self, ctx:RpgParser.Keyword_dimContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_dtaara.
+    def visitKeyword_dtaara(self, ctx:RpgParser.Keyword_dtaaraContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_export.
+    def visitKeyword_export(self, ctx:RpgParser.Keyword_exportContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_ext.
+    def visitKeyword_ext(self, ctx:RpgParser.Keyword_extContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extfld.
+    def visitKeyword_extfld(self, ctx:RpgParser.Keyword_extfldContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extfmt.
+    def visitKeyword_extfmt(self, ctx:RpgParser.Keyword_extfmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extname.
+    def visitKeyword_extname(self, ctx:RpgParser.Keyword_extnameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extpgm.
+    def visitKeyword_extpgm(self, ctx:RpgParser.Keyword_extpgmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extproc.
+    def visitKeyword_extproc(self, ctx:RpgParser.Keyword_extprocContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_fromfile.
+    def visitKeyword_fromfile(self, ctx:RpgParser.Keyword_fromfileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_import.
+    def visitKeyword_import(self, ctx:RpgParser.Keyword_importContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_inz.
+    def visitKeyword_inz(self, ctx:RpgParser.Keyword_inzContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_len.
+    def visitKeyword_len(self, ctx:RpgParser.Keyword_lenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_like.
+    def visitKeyword_like(self, ctx:RpgParser.Keyword_likeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_likeds.
+    def visitKeyword_likeds(self, ctx:RpgParser.Keyword_likedsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_likefile.
+    def visitKeyword_likefile(self, ctx:RpgParser.Keyword_likefileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_likerec.
+    def visitKeyword_likerec(self, ctx:RpgParser.Keyword_likerecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_noopt.
+    def visitKeyword_noopt(self, ctx:RpgParser.Keyword_nooptContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_occurs.
+    def visitKeyword_occurs(self, ctx:RpgParser.Keyword_occursContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_opdesc.
+    def visitKeyword_opdesc(self, ctx:RpgParser.Keyword_opdescContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_options.
+    def visitKeyword_options(self, ctx:RpgParser.Keyword_optionsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_overlay.
+    def visitKeyword_overlay(self, ctx:RpgParser.Keyword_overlayContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_packeven.
+    def visitKeyword_packeven(self, ctx:RpgParser.Keyword_packevenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_perrcd.
+    def visitKeyword_perrcd(self, ctx:RpgParser.Keyword_perrcdContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_prefix.
+    def visitKeyword_prefix(self, ctx:RpgParser.Keyword_prefixContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_pos.
+    def visitKeyword_pos(self, ctx:RpgParser.Keyword_posContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_procptr.
+    def visitKeyword_procptr(self, ctx:RpgParser.Keyword_procptrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_qualified.
+    def visitKeyword_qualified(self, ctx:RpgParser.Keyword_qualifiedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_rtnparm.
+    def visitKeyword_rtnparm(self, ctx:RpgParser.Keyword_rtnparmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_static.
+    def visitKeyword_static(self, ctx:RpgParser.Keyword_staticContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_sqltype.
+    def visitKeyword_sqltype(self, ctx:RpgParser.Keyword_sqltypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_template.
+    def visitKeyword_template(self, ctx:RpgParser.Keyword_templateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_timfmt.
+    def visitKeyword_timfmt(self, ctx:RpgParser.Keyword_timfmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_tofile.
+    def visitKeyword_tofile(self, ctx:RpgParser.Keyword_tofileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_value.
+    def visitKeyword_value(self, ctx:RpgParser.Keyword_valueContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_varying.
+    def visitKeyword_varying(self, ctx:RpgParser.Keyword_varyingContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_psds.
+    def visitKeyword_psds(self, ctx:RpgParser.Keyword_psdsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_block.
+    def visitKeyword_block(self, ctx:RpgParser.Keyword_blockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_commit.
+    def visitKeyword_commit(self, ctx:RpgParser.Keyword_commitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_devid.
+    def visitKeyword_devid(self, ctx:RpgParser.Keyword_devidContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extdesc.
+    def visitKeyword_extdesc(self, ctx:RpgParser.Keyword_extdescContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extfile.
+    def visitKeyword_extfile(self, ctx:RpgParser.Keyword_extfileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extind.
+    def visitKeyword_extind(self, ctx:RpgParser.Keyword_extindContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_extmbr.
+    def visitKeyword_extmbr(self, ctx:RpgParser.Keyword_extmbrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_formlen.
+    def visitKeyword_formlen(self, ctx:RpgParser.Keyword_formlenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_formofl.
+    def visitKeyword_formofl(self, ctx:RpgParser.Keyword_formoflContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_ignore.
+    def visitKeyword_ignore(self, ctx:RpgParser.Keyword_ignoreContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_include.
+    def visitKeyword_include(self, ctx:RpgParser.Keyword_includeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_indds.
+    def visitKeyword_indds(self, ctx:RpgParser.Keyword_inddsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_infds.
+    def visitKeyword_infds(self, ctx:RpgParser.Keyword_infdsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_infsr.
+    def visitKeyword_infsr(self, ctx:RpgParser.Keyword_infsrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_keyloc.
+    def visitKeyword_keyloc(self, ctx:RpgParser.Keyword_keylocContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_maxdev.
+    def visitKeyword_maxdev(self, ctx:RpgParser.Keyword_maxdevContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_oflind.
+    def visitKeyword_oflind(self, ctx:RpgParser.Keyword_oflindContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_pass.
+    def visitKeyword_pass(self, ctx:RpgParser.Keyword_passContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_pgmname.
+    def visitKeyword_pgmname(self, ctx:RpgParser.Keyword_pgmnameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_plist.
+    def visitKeyword_plist(self, ctx:RpgParser.Keyword_plistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_prtctl.
+    def visitKeyword_prtctl(self, ctx:RpgParser.Keyword_prtctlContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_rafdata.
+    def visitKeyword_rafdata(self, ctx:RpgParser.Keyword_rafdataContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_recno.
+    def visitKeyword_recno(self, ctx:RpgParser.Keyword_recnoContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_rename.
+    def visitKeyword_rename(self, ctx:RpgParser.Keyword_renameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_saveds.
+    def visitKeyword_saveds(self, ctx:RpgParser.Keyword_savedsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_saveind.
+    def visitKeyword_saveind(self, ctx:RpgParser.Keyword_saveindContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_sfile.
+    def visitKeyword_sfile(self, ctx:RpgParser.Keyword_sfileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_sln.
+    def visitKeyword_sln(self, ctx:RpgParser.Keyword_slnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_usropn.
+    def visitKeyword_usropn(self, ctx:RpgParser.Keyword_usropnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_disk.
+    def visitKeyword_disk(self, ctx:RpgParser.Keyword_diskContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_workstn.
+    def visitKeyword_workstn(self, ctx:RpgParser.Keyword_workstnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_printer.
+    def visitKeyword_printer(self, ctx:RpgParser.Keyword_printerContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_special.
+    def visitKeyword_special(self, ctx:RpgParser.Keyword_specialContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_keyed.
+    def visitKeyword_keyed(self, ctx:RpgParser.Keyword_keyedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#keyword_usage.
+    def visitKeyword_usage(self, ctx:RpgParser.Keyword_usageContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#like_lengthAdjustment.
+    def visitLike_lengthAdjustment(self, ctx:RpgParser.Like_lengthAdjustmentContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#sign.
+    def visitSign(self, ctx:RpgParser.SignContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_ds.
+    def visitDcl_ds(self, ctx:RpgParser.Dcl_dsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_ds_field.
+    def visitDcl_ds_field(self, ctx:RpgParser.Dcl_ds_fieldContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#end_dcl_ds.
+    def visitEnd_dcl_ds(self, ctx:RpgParser.End_dcl_dsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_pr.
+    def visitDcl_pr(self, ctx:RpgParser.Dcl_prContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_pr_field.
+    def visitDcl_pr_field(self, ctx:RpgParser.Dcl_pr_fieldContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#end_dcl_pr.
+    def visitEnd_dcl_pr(self, ctx:RpgParser.End_dcl_prContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_pi.
+    def visitDcl_pi(self, ctx:RpgParser.Dcl_piContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_pi_field.
+    def visitDcl_pi_field(self, ctx:RpgParser.Dcl_pi_fieldContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#end_dcl_pi.
+    def visitEnd_dcl_pi(self, ctx:RpgParser.End_dcl_piContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dcl_c.
+    def visitDcl_c(self, ctx:RpgParser.Dcl_cContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#ctl_opt.
+    def visitCtl_opt(self, ctx:RpgParser.Ctl_optContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#datatypeName.
+    def visitDatatypeName(self, ctx:RpgParser.DatatypeNameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#block.
+    def visitBlock(self, ctx:RpgParser.BlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#ifstatement.
+    def visitIfstatement(self, ctx:RpgParser.IfstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#casestatement.
+    def visitCasestatement(self, ctx:RpgParser.CasestatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#casestatementend.
+    def visitCasestatementend(self, ctx:RpgParser.CasestatementendContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#monitorstatement.
+    def visitMonitorstatement(self, ctx:RpgParser.MonitorstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#beginmonitor.
+    def visitBeginmonitor(self, ctx:RpgParser.BeginmonitorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endmonitor.
+    def visitEndmonitor(self, ctx:RpgParser.EndmonitorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#onError.
+    def visitOnError(self, ctx:RpgParser.OnErrorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#selectstatement.
+    def visitSelectstatement(self, ctx:RpgParser.SelectstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#other.
+    def visitOther(self, ctx:RpgParser.OtherContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#beginselect.
+    def visitBeginselect(self, ctx:RpgParser.BeginselectContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#whenstatement.
+    def visitWhenstatement(self, ctx:RpgParser.WhenstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#when.
+    def visitWhen(self, ctx:RpgParser.WhenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENxx.
+    def visitCsWHENxx(self, ctx:RpgParser.CsWHENxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endselect.
+    def visitEndselect(self, ctx:RpgParser.EndselectContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#beginif.
+    def visitBeginif(self, ctx:RpgParser.BeginifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#begindou.
+    def visitBegindou(self, ctx:RpgParser.BegindouContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#begindow.
+    def visitBegindow(self, ctx:RpgParser.BegindowContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#begindo.
+    def visitBegindo(self, ctx:RpgParser.BegindoContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#elseifstmt.
+    def visitElseifstmt(self, ctx:RpgParser.ElseifstmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#elsestmt.
+    def visitElsestmt(self, ctx:RpgParser.ElsestmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFxx.
+    def visitCsIFxx(self, ctx:RpgParser.CsIFxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOUxx.
+    def visitCsDOUxx(self, ctx:RpgParser.CsDOUxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWxx.
+    def visitCsDOWxx(self, ctx:RpgParser.CsDOWxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#complexCondxx.
+    def visitComplexCondxx(self, ctx:RpgParser.ComplexCondxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDxx.
+    def visitCsANDxx(self, ctx:RpgParser.CsANDxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csORxx.
+    def visitCsORxx(self, ctx:RpgParser.CsORxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#forstatement.
+    def visitForstatement(self, ctx:RpgParser.ForstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#beginfor.
+    def visitBeginfor(self, ctx:RpgParser.BeginforContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endif.
+    def visitEndif(self, ctx:RpgParser.EndifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#enddo.
+    def visitEnddo(self, ctx:RpgParser.EnddoContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endfor.
+    def visitEndfor(self, ctx:RpgParser.EndforContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dspec_fixed.
+    def visitDspec_fixed(self, ctx:RpgParser.Dspec_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#ds_name.
+    def visitDs_name(self, ctx:RpgParser.Ds_nameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#ospec_fixed.
+    def visitOspec_fixed(self, ctx:RpgParser.Ospec_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#os_fixed_pgmdesc1.
+    def visitOs_fixed_pgmdesc1(self, ctx:RpgParser.Os_fixed_pgmdesc1Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#outputConditioningOnOffIndicator.
+    def visitOutputConditioningOnOffIndicator(self, ctx:RpgParser.OutputConditioningOnOffIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#outputConditioningIndicator.
+    def visitOutputConditioningIndicator(self, ctx:RpgParser.OutputConditioningIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#os_fixed_pgmdesc_compound.
+    def visitOs_fixed_pgmdesc_compound(self, ctx:RpgParser.Os_fixed_pgmdesc_compoundContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#os_fixed_pgmdesc2.
+    def visitOs_fixed_pgmdesc2(self, ctx:RpgParser.Os_fixed_pgmdesc2Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#os_fixed_pgmfield.
+    def visitOs_fixed_pgmfield(self, ctx:RpgParser.Os_fixed_pgmfieldContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#ps_name.
+    def visitPs_name(self, ctx:RpgParser.Ps_nameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fspec.
+    def visitFspec(self, ctx:RpgParser.FspecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#filename.
+    def visitFilename(self, ctx:RpgParser.FilenameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fs_parm.
+    def visitFs_parm(self, ctx:RpgParser.Fs_parmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fs_string.
+    def visitFs_string(self, ctx:RpgParser.Fs_stringContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fs_keyword.
+    def visitFs_keyword(self, ctx:RpgParser.Fs_keywordContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fspec_fixed.
+    def visitFspec_fixed(self, ctx:RpgParser.Fspec_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_fixed.
+    def visitCspec_fixed(self, ctx:RpgParser.Cspec_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_continuedIndicators.
+    def visitCspec_continuedIndicators(self, ctx:RpgParser.Cspec_continuedIndicatorsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_blank.
+    def visitCspec_blank(self, ctx:RpgParser.Cspec_blankContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#blank_spec.
+    def visitBlank_spec(self, ctx:RpgParser.Blank_specContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#piBegin.
+    def visitPiBegin(self, ctx:RpgParser.PiBeginContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#parm_fixed.
+    def visitParm_fixed(self, ctx:RpgParser.Parm_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#pr_parm_fixed.
+    def visitPr_parm_fixed(self, ctx:RpgParser.Pr_parm_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#pi_parm_fixed.
+    def visitPi_parm_fixed(self, ctx:RpgParser.Pi_parm_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#procedure.
+    def visitProcedure(self, ctx:RpgParser.ProcedureContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#beginProcedure.
+    def visitBeginProcedure(self, ctx:RpgParser.BeginProcedureContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endProcedure.
+    def visitEndProcedure(self, ctx:RpgParser.EndProcedureContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#psBegin.
+    def visitPsBegin(self, ctx:RpgParser.PsBeginContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#freeBeginProcedure.
+    def visitFreeBeginProcedure(self, ctx:RpgParser.FreeBeginProcedureContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#psEnd.
+    def visitPsEnd(self, ctx:RpgParser.PsEndContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#freeEndProcedure.
+    def visitFreeEndProcedure(self, ctx:RpgParser.FreeEndProcedureContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#prBegin.
+    def visitPrBegin(self, ctx:RpgParser.PrBeginContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#subroutine.
+    def visitSubroutine(self, ctx:RpgParser.SubroutineContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#subprocedurestatement.
+    def visitSubprocedurestatement(self, ctx:RpgParser.SubprocedurestatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#begsr.
+    def visitBegsr(self, ctx:RpgParser.BegsrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endsr.
+    def visitEndsr(self, ctx:RpgParser.EndsrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csBEGSR.
+    def visitCsBEGSR(self, ctx:RpgParser.CsBEGSRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#freeBEGSR.
+    def visitFreeBEGSR(self, ctx:RpgParser.FreeBEGSRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDSR.
+    def visitCsENDSR(self, ctx:RpgParser.CsENDSRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#freeENDSR.
+    def visitFreeENDSR(self, ctx:RpgParser.FreeENDSRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#onOffIndicatorsFlag.
+    def visitOnOffIndicatorsFlag(self, ctx:RpgParser.OnOffIndicatorsFlagContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cs_controlLevel.
+    def visitCs_controlLevel(self, ctx:RpgParser.Cs_controlLevelContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cs_indicators.
+    def visitCs_indicators(self, ctx:RpgParser.Cs_indicatorsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#resultIndicator.
+    def visitResultIndicator(self, ctx:RpgParser.ResultIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_fixed_sql.
+    def visitCspec_fixed_sql(self, ctx:RpgParser.Cspec_fixed_sqlContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_fixed_standard.
+    def visitCspec_fixed_standard(self, ctx:RpgParser.Cspec_fixed_standardContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_fixed_standard_parts.
+    def visitCspec_fixed_standard_parts(self, ctx:RpgParser.Cspec_fixed_standard_partsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csACQ.
+    def visitCsACQ(self, ctx:RpgParser.CsACQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csADD.
+    def visitCsADD(self, ctx:RpgParser.CsADDContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csADDDUR.
+    def visitCsADDDUR(self, ctx:RpgParser.CsADDDURContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csALLOC.
+    def visitCsALLOC(self, ctx:RpgParser.CsALLOCContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDEQ.
+    def visitCsANDEQ(self, ctx:RpgParser.CsANDEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDNE.
+    def visitCsANDNE(self, ctx:RpgParser.CsANDNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDLE.
+    def visitCsANDLE(self, ctx:RpgParser.CsANDLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDLT.
+    def visitCsANDLT(self, ctx:RpgParser.CsANDLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDGE.
+    def visitCsANDGE(self, ctx:RpgParser.CsANDGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csANDGT.
+    def visitCsANDGT(self, ctx:RpgParser.CsANDGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csBITOFF.
+    def visitCsBITOFF(self, ctx:RpgParser.CsBITOFFContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csBITON.
+    def visitCsBITON(self, ctx:RpgParser.CsBITONContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABxx.
+    def visitCsCABxx(self, ctx:RpgParser.CsCABxxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABEQ.
+    def visitCsCABEQ(self, ctx:RpgParser.CsCABEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABNE.
+    def visitCsCABNE(self, ctx:RpgParser.CsCABNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABLE.
+    def visitCsCABLE(self, ctx:RpgParser.CsCABLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABLT.
+    def visitCsCABLT(self, ctx:RpgParser.CsCABLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABGE.
+    def visitCsCABGE(self, ctx:RpgParser.CsCABGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCABGT.
+    def visitCsCABGT(self, ctx:RpgParser.CsCABGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCALL.
+    def visitCsCALL(self, ctx:RpgParser.CsCALLContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCALLB.
+    def visitCsCALLB(self, ctx:RpgParser.CsCALLBContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCALLP.
+    def visitCsCALLP(self, ctx:RpgParser.CsCALLPContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCASEQ.
+    def visitCsCASEQ(self, ctx:RpgParser.CsCASEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCASNE.
+    def visitCsCASNE(self, ctx:RpgParser.CsCASNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCASLE.
+    def visitCsCASLE(self, ctx:RpgParser.CsCASLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCASLT.
+    def visitCsCASLT(self, ctx:RpgParser.CsCASLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCASGE.
+    def visitCsCASGE(self, ctx:RpgParser.CsCASGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCASGT.
+    def visitCsCASGT(self, ctx:RpgParser.CsCASGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCAS.
+    def visitCsCAS(self, ctx:RpgParser.CsCASContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCAT.
+    def visitCsCAT(self, ctx:RpgParser.CsCATContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCHAIN.
+    def visitCsCHAIN(self, ctx:RpgParser.CsCHAINContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCHECK.
+    def visitCsCHECK(self, ctx:RpgParser.CsCHECKContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCHECKR.
+    def visitCsCHECKR(self, ctx:RpgParser.CsCHECKRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCLEAR.
+    def visitCsCLEAR(self, ctx:RpgParser.CsCLEARContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCLOSE.
+    def visitCsCLOSE(self, ctx:RpgParser.CsCLOSEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCOMMIT.
+    def visitCsCOMMIT(self, ctx:RpgParser.CsCOMMITContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csCOMP.
+    def visitCsCOMP(self, ctx:RpgParser.CsCOMPContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDEALLOC.
+    def visitCsDEALLOC(self, ctx:RpgParser.CsDEALLOCContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDEFINE.
+    def visitCsDEFINE(self, ctx:RpgParser.CsDEFINEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDELETE.
+    def visitCsDELETE(self, ctx:RpgParser.CsDELETEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDIV.
+    def visitCsDIV(self, ctx:RpgParser.CsDIVContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDO.
+    def visitCsDO(self, ctx:RpgParser.CsDOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOU.
+    def visitCsDOU(self, ctx:RpgParser.CsDOUContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOUEQ.
+    def visitCsDOUEQ(self, ctx:RpgParser.CsDOUEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOUNE.
+    def visitCsDOUNE(self, ctx:RpgParser.CsDOUNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOULE.
+    def visitCsDOULE(self, ctx:RpgParser.CsDOULEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOULT.
+    def visitCsDOULT(self, ctx:RpgParser.CsDOULTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOUGE.
+    def visitCsDOUGE(self, ctx:RpgParser.CsDOUGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOUGT.
+    def visitCsDOUGT(self, ctx:RpgParser.CsDOUGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOW.
+    def visitCsDOW(self, ctx:RpgParser.CsDOWContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWEQ.
+    def visitCsDOWEQ(self, ctx:RpgParser.CsDOWEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWNE.
+    def visitCsDOWNE(self, ctx:RpgParser.CsDOWNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWLE.
+    def visitCsDOWLE(self, ctx:RpgParser.CsDOWLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWLT.
+    def visitCsDOWLT(self, ctx:RpgParser.CsDOWLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWGE.
+    def visitCsDOWGE(self, ctx:RpgParser.CsDOWGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDOWGT.
+    def visitCsDOWGT(self, ctx:RpgParser.CsDOWGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDSPLY.
+    def visitCsDSPLY(self, ctx:RpgParser.CsDSPLYContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csDUMP.
+    def visitCsDUMP(self, ctx:RpgParser.CsDUMPContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csELSE.
+    def visitCsELSE(self, ctx:RpgParser.CsELSEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csELSEIF.
+    def visitCsELSEIF(self, ctx:RpgParser.CsELSEIFContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEND.
+    def visitCsEND(self, ctx:RpgParser.CsENDContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDCS.
+    def visitCsENDCS(self, ctx:RpgParser.CsENDCSContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDDO.
+    def visitCsENDDO(self, ctx:RpgParser.CsENDDOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDFOR.
+    def visitCsENDFOR(self, ctx:RpgParser.CsENDFORContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDIF.
+    def visitCsENDIF(self, ctx:RpgParser.CsENDIFContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDMON.
+    def visitCsENDMON(self, ctx:RpgParser.CsENDMONContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csENDSL.
+    def visitCsENDSL(self, ctx:RpgParser.CsENDSLContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEVAL.
+    def visitCsEVAL(self, ctx:RpgParser.CsEVALContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEVAL_CORR.
+    def visitCsEVAL_CORR(self, ctx:RpgParser.CsEVAL_CORRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEVALR.
+    def visitCsEVALR(self, ctx:RpgParser.CsEVALRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEXCEPT.
+    def visitCsEXCEPT(self, ctx:RpgParser.CsEXCEPTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEXFMT.
+    def visitCsEXFMT(self, ctx:RpgParser.CsEXFMTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEXSR.
+    def visitCsEXSR(self, ctx:RpgParser.CsEXSRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csEXTRCT.
+    def visitCsEXTRCT(self, ctx:RpgParser.CsEXTRCTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csFEOD.
+    def visitCsFEOD(self, ctx:RpgParser.CsFEODContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csFOR.
+    def visitCsFOR(self, ctx:RpgParser.CsFORContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csFORCE.
+    def visitCsFORCE(self, ctx:RpgParser.CsFORCEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csGOTO.
+    def visitCsGOTO(self, ctx:RpgParser.CsGOTOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIF.
+    def visitCsIF(self, ctx:RpgParser.CsIFContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFEQ.
+    def visitCsIFEQ(self, ctx:RpgParser.CsIFEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFNE.
+    def visitCsIFNE(self, ctx:RpgParser.CsIFNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFLE.
+    def visitCsIFLE(self, ctx:RpgParser.CsIFLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFLT.
+    def visitCsIFLT(self, ctx:RpgParser.CsIFLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFGE.
+    def visitCsIFGE(self, ctx:RpgParser.CsIFGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIFGT.
+    def visitCsIFGT(self, ctx:RpgParser.CsIFGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csIN.
+    def visitCsIN(self, ctx:RpgParser.CsINContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csITER.
+    def visitCsITER(self, ctx:RpgParser.CsITERContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csKLIST.
+    def visitCsKLIST(self, ctx:RpgParser.CsKLISTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csKFLD.
+    def visitCsKFLD(self, ctx:RpgParser.CsKFLDContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csLEAVE.
+    def visitCsLEAVE(self, ctx:RpgParser.CsLEAVEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csLEAVESR.
+    def visitCsLEAVESR(self, ctx:RpgParser.CsLEAVESRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csLOOKUP.
+    def visitCsLOOKUP(self, ctx:RpgParser.CsLOOKUPContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMHHZO.
+    def visitCsMHHZO(self, ctx:RpgParser.CsMHHZOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMHLZO.
+    def visitCsMHLZO(self, ctx:RpgParser.CsMHLZOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMLHZO.
+    def visitCsMLHZO(self, ctx:RpgParser.CsMLHZOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMLLZO.
+    def visitCsMLLZO(self, ctx:RpgParser.CsMLLZOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMONITOR.
+    def visitCsMONITOR(self, ctx:RpgParser.CsMONITORContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMOVE.
+    def visitCsMOVE(self, ctx:RpgParser.CsMOVEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMOVEA.
+    def visitCsMOVEA(self, ctx:RpgParser.CsMOVEAContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMOVEL.
+    def visitCsMOVEL(self, ctx:RpgParser.CsMOVELContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMULT.
+    def visitCsMULT(self, ctx:RpgParser.CsMULTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csMVR.
+    def visitCsMVR(self, ctx:RpgParser.CsMVRContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csNEXT.
+    def visitCsNEXT(self, ctx:RpgParser.CsNEXTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csOCCUR.
+    def visitCsOCCUR(self, ctx:RpgParser.CsOCCURContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csON_ERROR.
+    def visitCsON_ERROR(self, ctx:RpgParser.CsON_ERRORContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#onErrorCode.
+    def visitOnErrorCode(self, ctx:RpgParser.OnErrorCodeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csOPEN.
+    def visitCsOPEN(self, ctx:RpgParser.CsOPENContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csOREQ.
+    def visitCsOREQ(self, ctx:RpgParser.CsOREQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csORNE.
+    def visitCsORNE(self, ctx:RpgParser.CsORNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csORLE.
+    def visitCsORLE(self, ctx:RpgParser.CsORLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csORLT.
+    def visitCsORLT(self, ctx:RpgParser.CsORLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csORGE.
+    def visitCsORGE(self, ctx:RpgParser.CsORGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csORGT.
+    def visitCsORGT(self, ctx:RpgParser.CsORGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csOTHER.
+    def visitCsOTHER(self, ctx:RpgParser.CsOTHERContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csOUT.
+    def visitCsOUT(self, ctx:RpgParser.CsOUTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csPARM.
+    def visitCsPARM(self, ctx:RpgParser.CsPARMContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csPLIST.
+    def visitCsPLIST(self, ctx:RpgParser.CsPLISTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csPOST.
+    def visitCsPOST(self, ctx:RpgParser.CsPOSTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREAD.
+    def visitCsREAD(self, ctx:RpgParser.CsREADContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREADC.
+    def visitCsREADC(self, ctx:RpgParser.CsREADCContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREADE.
+    def visitCsREADE(self, ctx:RpgParser.CsREADEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREADP.
+    def visitCsREADP(self, ctx:RpgParser.CsREADPContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREADPE.
+    def visitCsREADPE(self, ctx:RpgParser.CsREADPEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREALLOC.
+    def visitCsREALLOC(self, ctx:RpgParser.CsREALLOCContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csREL.
+    def visitCsREL(self, ctx:RpgParser.CsRELContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csRESET.
+    def visitCsRESET(self, ctx:RpgParser.CsRESETContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csRETURN.
+    def visitCsRETURN(self, ctx:RpgParser.CsRETURNContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csROLBK.
+    def visitCsROLBK(self, ctx:RpgParser.CsROLBKContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSCAN.
+    def visitCsSCAN(self, ctx:RpgParser.CsSCANContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSELECT.
+    def visitCsSELECT(self, ctx:RpgParser.CsSELECTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSETGT.
+    def visitCsSETGT(self, ctx:RpgParser.CsSETGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSETLL.
+    def visitCsSETLL(self, ctx:RpgParser.CsSETLLContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSETOFF.
+    def visitCsSETOFF(self, ctx:RpgParser.CsSETOFFContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSETON.
+    def visitCsSETON(self, ctx:RpgParser.CsSETONContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSHTDN.
+    def visitCsSHTDN(self, ctx:RpgParser.CsSHTDNContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSORTA.
+    def visitCsSORTA(self, ctx:RpgParser.CsSORTAContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSQRT.
+    def visitCsSQRT(self, ctx:RpgParser.CsSQRTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSUB.
+    def visitCsSUB(self, ctx:RpgParser.CsSUBContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSUBDUR.
+    def visitCsSUBDUR(self, ctx:RpgParser.CsSUBDURContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csSUBST.
+    def visitCsSUBST(self, ctx:RpgParser.CsSUBSTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csTAG.
+    def visitCsTAG(self, ctx:RpgParser.CsTAGContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csTEST.
+    def visitCsTEST(self, ctx:RpgParser.CsTESTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csTESTB.
+    def visitCsTESTB(self, ctx:RpgParser.CsTESTBContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csTESTN.
+    def visitCsTESTN(self, ctx:RpgParser.CsTESTNContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csTESTZ.
+    def visitCsTESTZ(self, ctx:RpgParser.CsTESTZContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csTIME.
+    def visitCsTIME(self, ctx:RpgParser.CsTIMEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csUNLOCK.
+    def visitCsUNLOCK(self, ctx:RpgParser.CsUNLOCKContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csUPDATE.
+    def visitCsUPDATE(self, ctx:RpgParser.CsUPDATEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHEN.
+    def visitCsWHEN(self, ctx:RpgParser.CsWHENContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENEQ.
+    def visitCsWHENEQ(self, ctx:RpgParser.CsWHENEQContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENNE.
+    def visitCsWHENNE(self, ctx:RpgParser.CsWHENNEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENLE.
+    def visitCsWHENLE(self, ctx:RpgParser.CsWHENLEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENLT.
+    def visitCsWHENLT(self, ctx:RpgParser.CsWHENLTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENGE.
+    def visitCsWHENGE(self, ctx:RpgParser.CsWHENGEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWHENGT.
+    def visitCsWHENGT(self, ctx:RpgParser.CsWHENGTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csWRITE.
+    def visitCsWRITE(self, ctx:RpgParser.CsWRITEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csXFOOT.
+    def visitCsXFOOT(self, ctx:RpgParser.CsXFOOTContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csXLATE.
+    def visitCsXLATE(self, ctx:RpgParser.CsXLATEContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csXML_INTO.
+    def visitCsXML_INTO(self, ctx:RpgParser.CsXML_INTOContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csXML_SAX.
+    def visitCsXML_SAX(self, ctx:RpgParser.CsXML_SAXContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csZ_ADD.
+    def visitCsZ_ADD(self, ctx:RpgParser.CsZ_ADDContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csZ_SUB.
+    def visitCsZ_SUB(self, ctx:RpgParser.CsZ_SUBContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cs_operationExtender.
+    def visitCs_operationExtender(self, ctx:RpgParser.Cs_operationExtenderContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#factor.
+    def visitFactor(self, ctx:RpgParser.FactorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#factorContent.
+    def visitFactorContent(self, ctx:RpgParser.FactorContentContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#resultType.
+    def visitResultType(self, ctx:RpgParser.ResultTypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cs_fixed_comments.
+    def visitCs_fixed_comments(self, ctx:RpgParser.Cs_fixed_commentsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#cspec_fixed_x2.
+    def visitCspec_fixed_x2(self, ctx:RpgParser.Cspec_fixed_x2Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#csOperationAndExtendedFactor2.
+    def visitCsOperationAndExtendedFactor2(self, ctx:RpgParser.CsOperationAndExtendedFactor2Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#ispec_fixed.
+    def visitIspec_fixed(self, ctx:RpgParser.Ispec_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fieldRecordRelation.
+    def visitFieldRecordRelation(self, ctx:RpgParser.FieldRecordRelationContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#fieldIndicator.
+    def visitFieldIndicator(self, ctx:RpgParser.FieldIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#is_external_rec.
+    def visitIs_external_rec(self, ctx:RpgParser.Is_external_recContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#is_rec.
+    def visitIs_rec(self, ctx:RpgParser.Is_recContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#recordIdIndicator.
+    def visitRecordIdIndicator(self, ctx:RpgParser.RecordIdIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#is_external_field.
+    def visitIs_external_field(self, ctx:RpgParser.Is_external_fieldContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#controlLevelIndicator.
+    def visitControlLevelIndicator(self, ctx:RpgParser.ControlLevelIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#matchingFieldsIndicator.
+    def visitMatchingFieldsIndicator(self, ctx:RpgParser.MatchingFieldsIndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#hspec_fixed.
+    def visitHspec_fixed(self, ctx:RpgParser.Hspec_fixedContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#hs_expression.
+    def visitHs_expression(self, ctx:RpgParser.Hs_expressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#hs_parm.
+    def visitHs_parm(self, ctx:RpgParser.Hs_parmContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#hs_string.
+    def visitHs_string(self, ctx:RpgParser.Hs_stringContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#blank_line.
+    def visitBlank_line(self, ctx:RpgParser.Blank_lineContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#directive.
+    def visitDirective(self, ctx:RpgParser.DirectiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#space_directive.
+    def visitSpace_directive(self, ctx:RpgParser.Space_directiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_copy.
+    def visitDir_copy(self, ctx:RpgParser.Dir_copyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_include.
+    def visitDir_include(self, ctx:RpgParser.Dir_includeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_if.
+    def visitDir_if(self, ctx:RpgParser.Dir_ifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_elseif.
+    def visitDir_elseif(self, ctx:RpgParser.Dir_elseifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_else.
+    def visitDir_else(self, ctx:RpgParser.Dir_elseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_endif.
+    def visitDir_endif(self, ctx:RpgParser.Dir_endifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_define.
+    def visitDir_define(self, ctx:RpgParser.Dir_defineContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_undefine.
+    def visitDir_undefine(self, ctx:RpgParser.Dir_undefineContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#dir_eof.
+    def visitDir_eof(self, ctx:RpgParser.Dir_eofContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#beginfree_directive.
+    def visitBeginfree_directive(self, ctx:RpgParser.Beginfree_directiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#endfree_directive.
+    def visitEndfree_directive(self, ctx:RpgParser.Endfree_directiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#copyText.
+    def visitCopyText(self, ctx:RpgParser.CopyTextContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#trailing_ws.
+    def visitTrailing_ws(self, ctx:RpgParser.Trailing_wsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#title_directive.
+    def visitTitle_directive(self, ctx:RpgParser.Title_directiveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#title_text.
+    def visitTitle_text(self, ctx:RpgParser.Title_textContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op.
+    def visitOp(self, ctx:RpgParser.OpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_acq.
+    def visitOp_acq(self, ctx:RpgParser.Op_acqContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_callp.
+    def visitOp_callp(self, ctx:RpgParser.Op_callpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_chain.
+    def visitOp_chain(self, ctx:RpgParser.Op_chainContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_clear.
+    def visitOp_clear(self, ctx:RpgParser.Op_clearContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_close.
+    def visitOp_close(self, ctx:RpgParser.Op_closeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_commit.
+    def visitOp_commit(self, ctx:RpgParser.Op_commitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_dealloc.
+    def visitOp_dealloc(self, ctx:RpgParser.Op_deallocContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_delete.
+    def visitOp_delete(self, ctx:RpgParser.Op_deleteContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_dou.
+    def visitOp_dou(self, ctx:RpgParser.Op_douContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_dow.
+    def visitOp_dow(self, ctx:RpgParser.Op_dowContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_dsply.
+    def visitOp_dsply(self, ctx:RpgParser.Op_dsplyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_dump.
+    def visitOp_dump(self, ctx:RpgParser.Op_dumpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_else.
+    def visitOp_else(self, ctx:RpgParser.Op_elseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_elseif.
+    def visitOp_elseif(self, ctx:RpgParser.Op_elseifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_enddo.
+    def visitOp_enddo(self, ctx:RpgParser.Op_enddoContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_endfor.
+    def visitOp_endfor(self, ctx:RpgParser.Op_endforContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_endif.
+    def visitOp_endif(self, ctx:RpgParser.Op_endifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_endmon.
+    def visitOp_endmon(self, ctx:RpgParser.Op_endmonContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_endsl.
+    def visitOp_endsl(self, ctx:RpgParser.Op_endslContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_eval.
+    def visitOp_eval(self, ctx:RpgParser.Op_evalContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_evalr.
+    def visitOp_evalr(self, ctx:RpgParser.Op_evalrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_eval_corr.
+    def visitOp_eval_corr(self, ctx:RpgParser.Op_eval_corrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_except.
+    def visitOp_except(self, ctx:RpgParser.Op_exceptContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_exfmt.
+    def visitOp_exfmt(self, ctx:RpgParser.Op_exfmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_exsr.
+    def visitOp_exsr(self, ctx:RpgParser.Op_exsrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_feod.
+    def visitOp_feod(self, ctx:RpgParser.Op_feodContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_for.
+    def visitOp_for(self, ctx:RpgParser.Op_forContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_force.
+    def visitOp_force(self, ctx:RpgParser.Op_forceContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_if.
+    def visitOp_if(self, ctx:RpgParser.Op_ifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_in.
+    def visitOp_in(self, ctx:RpgParser.Op_inContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_iter.
+    def visitOp_iter(self, ctx:RpgParser.Op_iterContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_leave.
+    def visitOp_leave(self, ctx:RpgParser.Op_leaveContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_leavesr.
+    def visitOp_leavesr(self, ctx:RpgParser.Op_leavesrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_monitor.
+    def visitOp_monitor(self, ctx:RpgParser.Op_monitorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_next.
+    def visitOp_next(self, ctx:RpgParser.Op_nextContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_on_error.
+    def visitOp_on_error(self, ctx:RpgParser.Op_on_errorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_open.
+    def visitOp_open(self, ctx:RpgParser.Op_openContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_other.
+    def visitOp_other(self, ctx:RpgParser.Op_otherContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_out.
+    def visitOp_out(self, ctx:RpgParser.Op_outContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_post.
+    def visitOp_post(self, ctx:RpgParser.Op_postContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_read.
+    def visitOp_read(self, ctx:RpgParser.Op_readContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_readc.
+    def visitOp_readc(self, ctx:RpgParser.Op_readcContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_reade.
+    def visitOp_reade(self, ctx:RpgParser.Op_readeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_readp.
+    def visitOp_readp(self, ctx:RpgParser.Op_readpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_readpe.
+    def visitOp_readpe(self, ctx:RpgParser.Op_readpeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_rel.
+    def visitOp_rel(self, ctx:RpgParser.Op_relContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_reset2.
+    def visitOp_reset2(self, ctx:RpgParser.Op_reset2Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_reset.
+    def visitOp_reset(self, ctx:RpgParser.Op_resetContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_return.
+    def visitOp_return(self, ctx:RpgParser.Op_returnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_rolbk.
+    def visitOp_rolbk(self, ctx:RpgParser.Op_rolbkContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_select.
+    def visitOp_select(self, ctx:RpgParser.Op_selectContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_setgt.
+    def visitOp_setgt(self, ctx:RpgParser.Op_setgtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_setll.
+    def visitOp_setll(self, ctx:RpgParser.Op_setllContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_sorta.
+    def visitOp_sorta(self, ctx:RpgParser.Op_sortaContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_test.
+    def visitOp_test(self, ctx:RpgParser.Op_testContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_unlock.
+    def visitOp_unlock(self, ctx:RpgParser.Op_unlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_update.
+    def visitOp_update(self, ctx:RpgParser.Op_updateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_when.
+    def visitOp_when(self, ctx:RpgParser.Op_whenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_write.
+    def visitOp_write(self, ctx:RpgParser.Op_writeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_xml_into.
+    def visitOp_xml_into(self, ctx:RpgParser.Op_xml_intoContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_xml_sax.
+    def visitOp_xml_sax(self, ctx:RpgParser.Op_xml_saxContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#search_arg.
+    def visitSearch_arg(self, ctx:RpgParser.Search_argContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#op_code.
+    def visitOp_code(self, ctx:RpgParser.Op_codeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif.
+    def visitBif(self, ctx:RpgParser.BifContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#optargs.
+    def visitOptargs(self, ctx:RpgParser.OptargsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_charformat.
+    def visitBif_charformat(self, ctx:RpgParser.Bif_charformatContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_dateformat.
+    def visitBif_dateformat(self, ctx:RpgParser.Bif_dateformatContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_timeformat.
+    def visitBif_timeformat(self, ctx:RpgParser.Bif_timeformatContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_editccurrency.
+    def visitBif_editccurrency(self, ctx:RpgParser.Bif_editccurrencyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_lookupargs.
+    def visitBif_lookupargs(self, ctx:RpgParser.Bif_lookupargsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#durationCode.
+    def visitDurationCode(self, ctx:RpgParser.DurationCodeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_timestampargs.
+    def visitBif_timestampargs(self, ctx:RpgParser.Bif_timestampargsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_tlookupargs.
+    def visitBif_tlookupargs(self, ctx:RpgParser.Bif_tlookupargsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_abs.
+    def visitBif_abs(self, ctx:RpgParser.Bif_absContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_addr.
+    def visitBif_addr(self, ctx:RpgParser.Bif_addrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_alloc.
+    def visitBif_alloc(self, ctx:RpgParser.Bif_allocContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_bitand.
+    def visitBif_bitand(self, ctx:RpgParser.Bif_bitandContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_bitnot.
+    def visitBif_bitnot(self, ctx:RpgParser.Bif_bitnotContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_bitor.
+    def visitBif_bitor(self, ctx:RpgParser.Bif_bitorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_bitxor.
+    def visitBif_bitxor(self, ctx:RpgParser.Bif_bitxorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_char.
+    def visitBif_char(self, ctx:RpgParser.Bif_charContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_check.
+    def visitBif_check(self, ctx:RpgParser.Bif_checkContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_checkr.
+    def visitBif_checkr(self, ctx:RpgParser.Bif_checkrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_date.
+    def visitBif_date(self, ctx:RpgParser.Bif_dateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_days.
+    def visitBif_days(self, ctx:RpgParser.Bif_daysContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_dec.
+    def visitBif_dec(self, ctx:RpgParser.Bif_decContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_dech.
+    def visitBif_dech(self, ctx:RpgParser.Bif_dechContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_decpos.
+    def visitBif_decpos(self, ctx:RpgParser.Bif_decposContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_diff.
+    def visitBif_diff(self, ctx:RpgParser.Bif_diffContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_div.
+    def visitBif_div(self, ctx:RpgParser.Bif_divContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_editc.
+    def visitBif_editc(self, ctx:RpgParser.Bif_editcContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_editflt.
+    def visitBif_editflt(self, ctx:RpgParser.Bif_editfltContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_editw.
+    def visitBif_editw(self, ctx:RpgParser.Bif_editwContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_elem.
+    def visitBif_elem(self, ctx:RpgParser.Bif_elemContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_eof.
+    def visitBif_eof(self, ctx:RpgParser.Bif_eofContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_equal.
+    def visitBif_equal(self, ctx:RpgParser.Bif_equalContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_error.
+    def visitBif_error(self, ctx:RpgParser.Bif_errorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_fields.
+    def visitBif_fields(self, ctx:RpgParser.Bif_fieldsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_float.
+    def visitBif_float(self, ctx:RpgParser.Bif_floatContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_found.
+    def visitBif_found(self, ctx:RpgParser.Bif_foundContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_graph.
+    def visitBif_graph(self, ctx:RpgParser.Bif_graphContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_handler.
+    def visitBif_handler(self, ctx:RpgParser.Bif_handlerContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_hours.
+    def visitBif_hours(self, ctx:RpgParser.Bif_hoursContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_int.
+    def visitBif_int(self, ctx:RpgParser.Bif_intContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_inth.
+    def visitBif_inth(self, ctx:RpgParser.Bif_inthContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_kds.
+    def visitBif_kds(self, ctx:RpgParser.Bif_kdsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_len.
+    def visitBif_len(self, ctx:RpgParser.Bif_lenContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_lookup.
+    def visitBif_lookup(self, ctx:RpgParser.Bif_lookupContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_lookuplt.
+    def visitBif_lookuplt(self, ctx:RpgParser.Bif_lookupltContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_lookuple.
+    def visitBif_lookuple(self, ctx:RpgParser.Bif_lookupleContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_lookupgt.
+    def visitBif_lookupgt(self, ctx:RpgParser.Bif_lookupgtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_lookupge.
+    def visitBif_lookupge(self, ctx:RpgParser.Bif_lookupgeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_minutes.
+    def visitBif_minutes(self, ctx:RpgParser.Bif_minutesContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_months.
+    def visitBif_months(self, ctx:RpgParser.Bif_monthsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_mseconds.
+    def visitBif_mseconds(self, ctx:RpgParser.Bif_msecondsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_nullind.
+    def visitBif_nullind(self, ctx:RpgParser.Bif_nullindContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_occur.
+    def visitBif_occur(self, ctx:RpgParser.Bif_occurContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_open.
+    def visitBif_open(self, ctx:RpgParser.Bif_openContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_paddr.
+    def visitBif_paddr(self, ctx:RpgParser.Bif_paddrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_parms.
+    def visitBif_parms(self, ctx:RpgParser.Bif_parmsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_parmnum.
+    def visitBif_parmnum(self, ctx:RpgParser.Bif_parmnumContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_realloc.
+    def visitBif_realloc(self, ctx:RpgParser.Bif_reallocContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_rem.
+    def visitBif_rem(self, ctx:RpgParser.Bif_remContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_replace.
+    def visitBif_replace(self, ctx:RpgParser.Bif_replaceContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_scan.
+    def visitBif_scan(self, ctx:RpgParser.Bif_scanContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_scanrpl.
+    def visitBif_scanrpl(self, ctx:RpgParser.Bif_scanrplContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_seconds.
+    def visitBif_seconds(self, ctx:RpgParser.Bif_secondsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_shtdn.
+    def visitBif_shtdn(self, ctx:RpgParser.Bif_shtdnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_size.
+    def visitBif_size(self, ctx:RpgParser.Bif_sizeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_sqrt.
+    def visitBif_sqrt(self, ctx:RpgParser.Bif_sqrtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_status.
+    def visitBif_status(self, ctx:RpgParser.Bif_statusContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_str.
+    def visitBif_str(self, ctx:RpgParser.Bif_strContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_subarr.
+    def visitBif_subarr(self, ctx:RpgParser.Bif_subarrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_subdt.
+    def visitBif_subdt(self, ctx:RpgParser.Bif_subdtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_subst.
+    def visitBif_subst(self, ctx:RpgParser.Bif_substContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_this.
+    def visitBif_this(self, ctx:RpgParser.Bif_thisContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_time.
+    def visitBif_time(self, ctx:RpgParser.Bif_timeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_timestamp.
+    def visitBif_timestamp(self, ctx:RpgParser.Bif_timestampContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_tlookup.
+    def visitBif_tlookup(self, ctx:RpgParser.Bif_tlookupContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_tlookuplt.
+    def visitBif_tlookuplt(self, ctx:RpgParser.Bif_tlookupltContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_tlookuple.
+    def visitBif_tlookuple(self, ctx:RpgParser.Bif_tlookupleContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_tlookupgt.
+    def visitBif_tlookupgt(self, ctx:RpgParser.Bif_tlookupgtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_tlookupge.
+    def visitBif_tlookupge(self, ctx:RpgParser.Bif_tlookupgeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_trim.
+    def visitBif_trim(self, ctx:RpgParser.Bif_trimContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_triml.
+    def visitBif_triml(self, ctx:RpgParser.Bif_trimlContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_trimr.
+    def visitBif_trimr(self, ctx:RpgParser.Bif_trimrContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_ucs2.
+    def visitBif_ucs2(self, ctx:RpgParser.Bif_ucs2Context):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_uns.
+    def visitBif_uns(self, ctx:RpgParser.Bif_unsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_unsh.
+    def visitBif_unsh(self, ctx:RpgParser.Bif_unshContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_xfoot.
+    def visitBif_xfoot(self, ctx:RpgParser.Bif_xfootContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_xlate.
+    def visitBif_xlate(self, ctx:RpgParser.Bif_xlateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_xml.
+    def visitBif_xml(self, ctx:RpgParser.Bif_xmlContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_years.
+    def visitBif_years(self, ctx:RpgParser.Bif_yearsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#bif_code.
+    def visitBif_code(self, ctx:RpgParser.Bif_codeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#free.
+    def visitFree(self, ctx:RpgParser.FreeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#c_free.
+    def visitC_free(self, ctx:RpgParser.C_freeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#control.
+    def visitControl(self, ctx:RpgParser.ControlContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#exec_sql.
+    def visitExec_sql(self, ctx:RpgParser.Exec_sqlContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#baseExpression.
+    def visitBaseExpression(self, ctx:RpgParser.BaseExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#indicator.
+    def visitIndicator(self, ctx:RpgParser.IndicatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#assignmentExpression.
+    def visitAssignmentExpression(self, ctx:RpgParser.AssignmentExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#assignOperatorExpression.
+    def visitAssignOperatorExpression(self, ctx:RpgParser.AssignOperatorExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#evalExpression.
+    def visitEvalExpression(self, ctx:RpgParser.EvalExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#simpleExpression.
+    def visitSimpleExpression(self, ctx:RpgParser.SimpleExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#unaryExpression.
+    def visitUnaryExpression(self, ctx:RpgParser.UnaryExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#expression.
+    def visitExpression(self, ctx:RpgParser.ExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#indicator_expr.
+    def visitIndicator_expr(self, ctx:RpgParser.Indicator_exprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#function.
+    def visitFunction(self, ctx:RpgParser.FunctionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#comparisonOperator.
+    def visitComparisonOperator(self, ctx:RpgParser.ComparisonOperatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#assignmentOperator.
+    def visitAssignmentOperator(self, ctx:RpgParser.AssignmentOperatorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#args.
+    def visitArgs(self, ctx:RpgParser.ArgsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#literal.
+    def visitLiteral(self, ctx:RpgParser.LiteralContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#identifier.
+    def visitIdentifier(self, ctx:RpgParser.IdentifierContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#all.
+    def visitAll(self, ctx:RpgParser.AllContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#functionName.
+    def visitFunctionName(self, ctx:RpgParser.FunctionNameContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#multipart_identifier.
+    def visitMultipart_identifier(self, ctx:RpgParser.Multipart_identifierContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#indexed_identifier.
+    def visitIndexed_identifier(self, ctx:RpgParser.Indexed_identifierContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#opCode.
+    def visitOpCode(self, ctx:RpgParser.OpCodeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#number.
+    def visitNumber(self, ctx:RpgParser.NumberContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#free_identifier.
+    def visitFree_identifier(self, ctx:RpgParser.Free_identifierContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#continuedIdentifier.
+    def visitContinuedIdentifier(self, ctx:RpgParser.ContinuedIdentifierContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#idOrKeyword.
+    def visitIdOrKeyword(self, ctx:RpgParser.IdOrKeywordContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#argument.
+    def visitArgument(self, ctx:RpgParser.ArgumentContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by RpgParser#symbolicConstants.
+    def visitSymbolicConstants(self, ctx:RpgParser.SymbolicConstantsContext):
+        return self.visitChildren(ctx)
+
+
+
+del RpgParser
\ No newline at end of file
@@ -0,0 +1 @@
+# Generated parser package
@@ -0,0 +1,85 @@
+"""
+Fixed / free region classifier for RPG members.
+
+A member may mix both forms: fixed specs, /FREE ... /END-FREE blocks, and
+(RPG IV 7.1 TR7 onwards) free-form lines in columns 8-80 with columns 6-7
+blank. A **FREE first line makes the whole member free-form. Each line is
+looked at once, and a region is yielded as soon as it ends, so the parser
+can start on it before the rest of the member is classified.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+_FIXED, _FREE_BLOCK, _FREE_LINES = 0, 1, 2
+
+
+@dataclass
+class RpgRegion:
+    """Lines [start, end) (0-based indexes) of one form."""
+
+    free: bool
+    start: int
+    end: int
+    margin: int = 0  # leading columns that are not code: 7 for free-form code inside a fixed-form member
+
+
+def split_regions(lines: Sequence[str], free: bool = False) -> list[RpgRegion]:
+    """All regions of a member; see iter_regions."""
+    return list(iter_regions(lines, free))
+
+
+def iter_regions(lines: Sequence[str], free: bool = False) -> Iterator[RpgRegion]:
+    """
+    Yield the fixed and free regions of a member in order. free makes the
+    member free-form from its first line (a copybook included from free-form
+    code). The /FREE and /END-FREE lines themselves belong to no region;
+    other directives stay in the region around them. Compile-time data
+    (** in column 1) ends the member.
+    """
+    n = len(lines)
+    if n and lines[0][:6].upper() == "**FREE":
+        if n > 1:
+            yield RpgRegion(True, 1, n)
+        return
+
+    kind = _FREE_BLOCK if free else _FIXED
+    margin = 0 if free else 7
+    start = 0
+    end = n
+    for i in range(n):
+        line = lines[i]
+        if line[:2] == "**":
+            end = i
+            break
+        if kind == _FIXED and line[5:6].strip() and line[6:7] != "/":  # fast path: a fixed spec line
+            continue
+        text = line.lstrip()
+        if not text:
+            continue
+        # directives start in column 7 (after a sequence number, perhaps) or anywhere in free-form code
+        directive = text if text[0] == "/" else line[6:] if line[6:7] == "/" else None
+        if directive is not None:
+            word = directive[:9].upper()
+            if word[:5] == "/FREE":
+                new_kind, new_start = _FREE_BLOCK, i + 1
+            elif word == "/END-FREE":
+                new_kind, new_start = _FIXED, i + 1
+            else:
+                continue
+        elif kind == _FREE_BLOCK:
+            continue
+        elif line[5:7] == "  " and not line[7:].isspace() and len(line) > 7:  # columns 6-7 blank, code from 8
+            if kind == _FREE_LINES:
+                continue
+            new_kind, new_start = _FREE_LINES, i
+        elif kind == _FIXED:
+            continue
+        else:
+            new_kind, new_start = _FIXED, i
+        if i > start:
+            yield RpgRegion(kind != _FIXED, start, i, margin if kind != _FIXED else 0)
+        kind, start = new_kind, new_start
+        margin = 7
+    if end > start:
+        yield RpgRegion(kind != _FIXED, start, end, margin if kind != _FIXED else 0)
@@ -3,14 +3,18 @@ RPG/RPGLE/SQLRPGLE runner: parse file and return RpgResult.
 """
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
+from core.catalog import SchemaCatalog, statement_tables
 from core.diagnostics import Diagnostic
+from core.lineage import iter_rpg_statements
 from core.io import load_file
 from rpg.ast_nodes import (
     RpgProgram,
     RpgIfStmt,
     RpgSelectStmt,
     RpgDoForStmt,
+    RpgMonitorStmt,
     RpgProcedure,
     RpgStatement,
     RpgAssignStmt,
@@ -19,6 +23,7 @@ from rpg.ast_nodes import (
     EmbeddedSqlStmt,
 )
 from rpg.ast_builder import parse_rpg
+from rpg.scanner import scan_rpg
 
 
 @dataclass
@@ -28,6 +33,7 @@ class RpgMetrics:
     variable_count: int = 0
     sql_statement_count: int = 0
     maintainability_rating: str = "A"
+    call_targets: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -91,7 +97,7 @@ def run_rpg_file(path: str) -> RpgResult:
             for i, s in enumerate(node.body):
                 is_last_proc_stmt = (i == len(node.body) - 1)
                 dump_ast_text(s, proc_prefix, is_last_proc_stmt)
-        elif isinstance(node, (RpgAssignStmt, RpgCallStmt, RpgIfStmt, EmbeddedSqlStmt)):
+        elif isinstance(node, (RpgAssignStmt, RpgCallStmt, RpgReturnStmt, EmbeddedSqlStmt)):
             connector = "└── " if is_last_child else "├── "
             node_type = type(node).__name__.replace("Rpg", "").replace("Stmt", "")
             if isinstance(node, RpgCallStmt):
@@ -100,6 +106,15 @@ def run_rpg_file(path: str) -> RpgResult:
                 ast_lines.append(f"{parent_prefix}{connector}{node_type}: {node.stmt_type}")
             else:
                 ast_lines.append(f"{parent_prefix}{connector}{node_type}")
+        elif isinstance(node, (RpgIfStmt, RpgSelectStmt, RpgDoForStmt, RpgMonitorStmt)):
+            connector = "└── " if is_last_child else "├── "
+            node_type = type(node).__name__.replace("Rpg", "").replace("Stmt", "")
+            condition = getattr(node, "condition", None)
+            ast_lines.append(f"{parent_prefix}{connector}{node_type}" + (f": {condition.value}" if condition else ""))
+            children = _child_statements(node)
+            block_prefix = parent_prefix + ("    " if is_last_child else "│   ")
+            for i, s in enumerate(children):
+                dump_ast_text(s, block_prefix, i == len(children) - 1)
     
     def dump_ast_mermaid(node, parent_id=None):
         nonlocal node_counter
@@ -114,9 +129,10 @@ def run_rpg_file(path: str) -> RpgResult:
         if isinstance(node, RpgProgram):
             for s in node.main_body: dump_ast_mermaid(s, my_id)
             for p in node.procedures: dump_ast_mermaid(p, my_id)
-        elif isinstance(node, (RpgProcedure, RpgIfStmt)):
-            body = getattr(node, 'body', []) or getattr(node, 'then_body', [])
-            for s in body: dump_ast_mermaid(s, my_id)
+        elif isinstance(node, RpgProcedure):
+            for s in node.body: dump_ast_mermaid(s, my_id)
+        else:
+            for s in _child_statements(node): dump_ast_mermaid(s, my_id)
 
     if ast:
         dump_ast_text(ast)
@@ -131,62 +147,171 @@ def run_rpg_file(path: str) -> RpgResult:
         metrics.variable_count = len(ast.variables)
         metrics.sql_statement_count = len(ast.sql_statements)
 
-        # Calculate Complexity (Base 1 + Control Flow)
-        complexity = 1
-
-        def visit_stmts(stmts: list):
-            nonlocal complexity
-            for stmt in stmts:
-                if isinstance(stmt, (RpgIfStmt, RpgSelectStmt, RpgDoForStmt)):
-                    complexity += 1
-                # Recurse into bodies if they exist (simplified for this AST structure)
-                if hasattr(stmt, "then_body"):
-                    visit_stmts(stmt.then_body)
-                if hasattr(stmt, "else_body"):
-                    visit_stmts(stmt.else_body)
-                if hasattr(stmt, "body") and isinstance(stmt.body, list):
-                    visit_stmts(stmt.body)
-
-        visit_stmts(ast.main_body)
+        # Cyclomatic complexity: 1 + one per decision point (IF/ELSEIF, WHEN, loop, ON-ERROR)
+        statements = list(iter_rpg_statements(ast.main_body))
         for proc in ast.procedures:
-            visit_stmts(proc.body)
+            statements += iter_rpg_statements(proc.body)
+        complexity = 1 + sum(_decision_points(stmt) for stmt in statements)
 
         metrics.cyclomatic_complexity = complexity
-        if complexity > 20:
-            metrics.maintainability_rating = "C"
-        elif complexity > 10:
-            metrics.maintainability_rating = "B"
+        metrics.maintainability_rating = _maintainability_rating(complexity)
+        metrics.call_targets = [stmt.name.upper() for stmt in statements if isinstance(stmt, RpgCallStmt)]
+
+    report_text = _summary_report(
+        path,
+        len(source.splitlines()),
+        metrics,
+        is_free_format=bool(ast and ast.is_free_format),
+        logical_loc=metrics.sql_statement_count + metrics.variable_count + len(ast.main_body) if ast else 0,
+        operations="Assignment, Call, SQL, Control Flow",
+        issue_count=len(diagnostics),
+        files_used=_files_used(ast) if ast else [],
+    )
+
+    return RpgResult(
+        path=path,
+        ast=ast,
+        diagnostics=diagnostics,
+        metrics=metrics,
+        summary_report=report_text,
+        mermaid_diagram="\n".join(mermaid_lines),
+        ast_tree="\n".join(ast_lines),
+    )
+
+
+def run_rpg_metrics(path: str) -> RpgResult:
+    """Fill RpgMetrics for an RPG file from a lexical scan only (no parse, no AST)."""
+    try:
+        source = load_file(path)
+    except (FileNotFoundError, UnicodeDecodeError) as e:
+        return RpgResult(
+            path=path,
+            ast=None,
+            diagnostics=[Diagnostic(file=path, line=0, column=0, severity="error", message=str(e))],
+        )
+
+    scan = scan_rpg(source)
+    complexity = 1 + scan.decision_count
+    metrics = RpgMetrics(
+        cyclomatic_complexity=complexity,
+        procedure_count=scan.procedure_count,
+        variable_count=scan.variable_count,
+        sql_statement_count=scan.sql_statement_count,
+        maintainability_rating=_maintainability_rating(complexity),
+        call_targets=scan.call_targets,
+    )
+    report_text = _summary_report(
+        path,
+        scan.total_lines,
+        metrics,
+        is_free_format=scan.is_free_format,
+        logical_loc=scan.sql_statement_count + scan.variable_count + scan.statement_count,
+        operations=", ".join(sorted(scan.operations)) or "None",
+        issue_count=0,
+        files_used=scan.files_used,
+    )
+    return RpgResult(path=path, ast=None, diagnostics=[], metrics=metrics, summary_report=report_text)
+
 
-    # Generate Text Report
+def _child_statements(stmt) -> list:
+    """Statements directly nested in a control-flow statement, all branches in source order."""
+    if isinstance(stmt, RpgIfStmt):
+        return stmt.then_body + [s for _, body in stmt.else_if_parts for s in body] + stmt.else_body
+    if isinstance(stmt, RpgSelectStmt):
+        return [s for _, body in stmt.cases for s in body]
+    if isinstance(stmt, RpgMonitorStmt):
+        return stmt.body + [s for _, body in stmt.handlers for s in body]
+    if isinstance(stmt, RpgDoForStmt):
+        return stmt.body
+    return []
+
+
+def _decision_points(stmt) -> int:
+    """Decision points a statement adds to cyclomatic complexity (not counting nested statements)."""
+    if isinstance(stmt, RpgIfStmt):
+        return 1 + len(stmt.else_if_parts)
+    if isinstance(stmt, RpgSelectStmt):
+        return sum(1 for condition, _ in stmt.cases if condition is not None)
+    if isinstance(stmt, RpgDoForStmt):
+        return 1
+    if isinstance(stmt, RpgMonitorStmt):
+        return len(stmt.handlers)
+    return 0
+
+
+def apply_catalog(result: RpgResult, catalog: SchemaCatalog) -> None:
+    """
+    Resolve the Files Used of result's report through a schema catalog, once
+    the pipeline has catalogued every input: the program's references by
+    name, qualified when the catalog defines the table.
+    """
+    if result.ast is None or not result.summary_report:
+        return
+    files = _files_used(result.ast, catalog, Path(result.path).stem)
+    result.summary_report = "\n".join(
+        _files_used_line(files) if line.startswith("Files Used:") else line
+        for line in result.summary_report.splitlines()
+    )
+
+
+def _files_used(ast: RpgProgram, catalog: SchemaCatalog | None = None, program: str | None = None) -> list[str]:
+    """
+    Declared files (F-specs / DCL-F), then tables read or written by embedded
+    SQL: the program's references in catalog when given, else the statements'.
+    """
+    names = [f.name.upper() for f in ast.files]
+    if catalog is not None and program is not None:
+        for name in sorted(catalog.tables_referenced_by(program)):
+            table = catalog.table(name)
+            names.append(table.qualified_name.upper() if table is not None else name)
+    else:
+        for sql in ast.sql_statements:
+            for stmt in sql.statements:
+                names += [t.name.upper() for t in statement_tables(stmt)]
+    return list(dict.fromkeys(names))
+
+
+def _files_used_line(files_used: list[str]) -> str:
+    return f"Files Used: {', '.join(files_used) if files_used else 'None'}"
+
+
+def _maintainability_rating(complexity: int) -> str:
+    if complexity > 20:
+        return "C"
+    if complexity > 10:
+        return "B"
+    return "A"
+
+
+def _summary_report(
+    path: str,
+    total_lines: int,
+    metrics: RpgMetrics,
+    is_free_format: bool,
+    logical_loc: int,
+    operations: str,
+    issue_count: int,
+    files_used: list[str],
+) -> str:
     lines = []
     lines.append("Summarization/Analysis Report")
     lines.append(f"Program: {path}")
-    lines.append(f"Type: {'Free-Form' if ast and ast.is_free_format else 'Fixed-Format'} RPGLE")
+    lines.append(f"Type: {'Free-Form' if is_free_format else 'Fixed-Format'} RPGLE")
     lines.append("I. Overview")
-    lines.append(f"Total Lines: {len(source.splitlines())}")
-    lines.append(f"Logical LOC: {metrics.sql_statement_count + metrics.variable_count + len(ast.main_body) if ast else 0}")
+    lines.append(f"Total Lines: {total_lines}")
+    lines.append(f"Logical LOC: {logical_loc}")
     lines.append(f"Procedural Complexity: {'Low' if metrics.cyclomatic_complexity < 5 else 'Medium'} ({metrics.cyclomatic_complexity})")
     lines.append(f"Database Access: {metrics.sql_statement_count} SQL Statements")
-    lines.append(f"Type of Operations: Assignment, Call, SQL, Control Flow")
+    lines.append(f"Type of Operations: {operations}")
     lines.append("II. Metrics & Violations")
     lines.append(f"Maintainability Index: {metrics.maintainability_rating}")
     lines.append(f"Cyclomatic Complexity: {metrics.cyclomatic_complexity}")
-    lines.append(f"Issues: {len(diagnostics)}")
+    lines.append(f"Issues: {issue_count}")
     lines.append("III. Data Flow & Dependencies")
-    lines.append(f"Files Used: (Derived from SQL/F-specs)")
+    lines.append(_files_used_line(files_used))
     lines.append(f"Internal Variables: {metrics.variable_count} defined")
-    
-    report_text = "\n".join(lines)
-
-    return RpgResult(
-        path=path,
-        ast=ast,
-        diagnostics=diagnostics,
-        metrics=metrics,
-        summary_report=report_text,
-        mermaid_diagram="\n".join(mermaid_lines),
-        ast_tree="\n".join(ast_lines),
-    )
+    lines.append(f"Calls: {', '.join(metrics.call_targets) if metrics.call_targets else 'None'}")
+    return "\n".join(lines)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""
+Metrics-only scanner for RPG / RPGLE / SQLRPGLE.
+
+Classifies each line by its spec column (fixed) or first token (free) in a
+single pass; no AST is built. Feeds RpgMetrics in metrics-only mode.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+_FREE_TOKEN_RE = re.compile(r"\s*([A-Za-z][\w-]*|/[\w-]+)")
+_FREE_CALL_RE = re.compile(r"\s*callp?(?:\([a-z ]*\))?\s+([\w$#@]+)", re.I)
+_EXEC_SQL_RE = re.compile(r"\bexec\s+sql\b", re.I)
+
+# Opcodes (free first token or fixed factor) that add a decision point; matches
+# the AST count in rpg.runner (SELECT itself adds none, each WHEN does).
+DECISION_OPCODES = ("IF", "ELSEIF", "DOW", "DOU", "DO", "FOR", "WHEN", "ON-ERROR")
+FREE_OPCODES = frozenset((
+    "ACQ", "BEGSR", "CALL", "CALLP", "CHAIN", "CLEAR", "CLOSE", "COMMIT", "DEALLOC", "DELETE",
+    "DOU", "DOW", "DSPLY", "DUMP", "ELSE", "ELSEIF", "ENDDO", "ENDFOR", "ENDIF", "ENDMON", "ENDSL",
+    "ENDSR", "EVAL", "EVAL-CORR", "EVALR", "EXCEPT", "EXFMT", "EXSR", "FEOD", "FOR", "FORCE",
+    "IF", "IN", "ITER", "LEAVE", "LEAVESR", "MONITOR", "NEXT", "ON-ERROR", "ON-EXIT", "OPEN",
+    "OTHER", "OUT", "POST", "READ", "READC", "READE", "READP", "READPE", "REL", "RESET", "RETURN",
+    "ROLBK", "SELECT", "SETGT", "SETLL", "SORTA", "TEST", "UNLOCK", "UPDATE", "WHEN", "WRITE",
+    "XML-INTO", "XML-SAX", "DATA-INTO", "DATA-GEN", "SND-MSG",
+))
+FREE_SPEC_KEYWORDS = frozenset(("CTL-OPT", "DCL-F", "DCL-S", "DCL-C", "DCL-DS", "DCL-PR", "DCL-PI",
+                                "DCL-PROC", "END-DS", "END-PR", "END-PI", "END-PROC", "DCL-PARM",
+                                "DCL-SUBF"))
+
+
+@dataclass
+class RpgScan:
+    """Counts gathered by scan_rpg."""
+
+    total_lines: int = 0
+    is_free_format: bool = False
+    statement_count: int = 0
+    variable_count: int = 0
+    procedure_count: int = 0
+    sql_statement_count: int = 0
+    decision_count: int = 0
+    operations: Counter = field(default_factory=Counter)
+    call_targets: list[str] = field(default_factory=list)
+    files_used: list[str] = field(default_factory=list)
+
+
+def scan_rpg(source: str) -> RpgScan:
+    """
+    Count declarations, procedures, SQL, decisions, opcodes, call targets and files.
+
+    Fixed-format lines are classified by the spec letter in column 6; lines
+    under **FREE or inside /FREE ... /END-FREE are classified by the first
+    token of each ';'-terminated statement.
+    """
+    scan = RpgScan()
+    free = False
+    fully_free = False
+    in_sql = False
+    at_start = True  # next free-format line begins a new statement
+    block_end = None  # END-DS / END-PR / END-PI while inside a declaration block
+
+    for line in source.splitlines():
+        scan.total_lines += 1
+        if scan.total_lines == 1 and line[:6].upper() == "**FREE":
+            scan.is_free_format = fully_free = free = True
+            continue
+        directive = line.strip()[:9].upper()
+        if directive.startswith("/FREE"):
+            scan.is_free_format = free = True
+            continue
+        if directive.startswith("/END-FREE"):
+            free = fully_free
+            continue
+
+        if in_sql:
+            if ";" in line or "END-EXEC" in line.upper():
+                in_sql = False
+            continue
+
+        if not free:
+            if len(line) > 6 and line[6] != "*":
+                _scan_fixed(line, scan)
+            continue
+
+        code = line.split("//", 1)[0]
+        m = _FREE_TOKEN_RE.match(code)
+        if not m:
+            continue
+        if at_start:
+            token = m.group(1).upper()
+            if block_end:
+                if token == block_end:
+                    block_end = None
+            elif token == "EXEC" and _EXEC_SQL_RE.match(code.lstrip()):
+                scan.sql_statement_count += 1
+                scan.operations["SQL"] += 1
+                in_sql = ";" not in code
+            elif token in FREE_SPEC_KEYWORDS:
+                block_end = _scan_free_declaration(token, code, scan)
+            elif not token.startswith("/"):
+                _scan_free_statement(token, code, scan)
+        at_start = ";" in code
+
+    return scan
+
+
+def _scan_fixed(line: str, scan: RpgScan) -> None:
+    spec = line[5].upper()
+    if spec == "C":
+        if line[6:15].upper() == "/EXEC SQL":
+            scan.sql_statement_count += 1
+            scan.operations["SQL"] += 1
+            return
+        opcode = line[25:35].split("(")[0].strip().upper()
+        if not opcode:
+            return
+        scan.statement_count += 1
+        scan.operations[opcode] += 1
+        # Fixed-form compare variants (IFEQ, DOWLT, DOUGE, WHENNE, ...) count like IF/DOW/DOU/WHEN.
+        if opcode in DECISION_OPCODES or opcode[:2] == "IF" or opcode[:3] in ("DOW", "DOU") or opcode[:4] == "WHEN":
+            scan.decision_count += 1
+        elif opcode in ("CALL", "CALLB", "CALLP"):
+            # CALLP takes its prototype and parameters in extended factor 2 (36-80)
+            target = line[35:80 if opcode == "CALLP" else 49].strip().strip("'").split("(")[0].strip()
+            if target:
+                scan.call_targets.append(target.upper())
+    elif spec == "D":
+        decl = line[23:25].strip().upper()
+        if decl in ("S", "DS") and line[6:21].strip():
+            scan.variable_count += 1
+    elif spec == "F":
+        name = line[6:16].strip()
+        if name:
+            scan.files_used.append(name.upper())
+    elif spec == "P":
+        if line[23:24].upper() == "B":
+            scan.procedure_count += 1
+
+
+def _scan_free_declaration(token: str, code: str, scan: RpgScan) -> str | None:
+    """Count a free-format declaration. Returns the END-xx token when a block opens."""
+    upper = code.upper()
+    if token in ("DCL-S", "DCL-DS"):
+        scan.variable_count += 1
+    elif token == "DCL-F":
+        name = code.split()[1:2]
+        if name:
+            scan.files_used.append(name[0].rstrip(";").upper())
+    elif token == "DCL-PROC":
+        scan.procedure_count += 1
+    if token == "DCL-DS" and "LIKEDS" not in upper and "LIKEREC" not in upper and "END-DS" not in upper:
+        return "END-DS"
+    if token in ("DCL-PR", "DCL-PI"):
+        end = "END-" + token[4:]
+        return None if end in upper else end
+    return None
+
+
+def _scan_free_statement(token: str, code: str, scan: RpgScan) -> None:
+    if token not in FREE_OPCODES:
+        # Bare "target = expr" is an implicit EVAL; anything else is a prototyped call.
+        token = "EVAL" if "=" in code else "CALLP"
+    scan.statement_count += 1
+    scan.operations[token] += 1
+    if token in DECISION_OPCODES:
+        scan.decision_count += 1
+    elif token in ("CALL", "CALLP", "CALLB"):
+        target = _FREE_CALL_RE.match(code)
+        name = target.group(1) if target else _FREE_TOKEN_RE.match(code).group(1)
+        scan.call_targets.append(name.upper())
@@ -0,0 +1,296 @@
+"""
+Streaming statement assembler for free-format RPG.
+
+Free-format statements run until ';' and may span many lines: long IF
+conditions, CALLP parameter lists, EXEC SQL. One RpgStatementText is
+yielded per logical statement. A ';' inside a string literal or a comment
+(// in RPG, also -- in EXEC SQL) does not end a statement. Directives
+(/COPY, /FREE, /IF ..., **FREE) take one line and need no ';'. **CTDATA /
+** starts compile-time data, which ends the source.
+
+Most statements need none of that: one match of _STATEMENT_RE over the
+joined lines (FreeText) skips the blank and comment lines before a statement
+and takes it up to its ';'. A statement the pattern cannot take whole (a
+directive, a comment or continued literal inside it, SQL with -- comments,
+an unterminated last statement) goes through the line scanner, which
+consumes lines one at a time. A keyword_pattern match passes over a run of
+statements in one go, for a caller that only needs some of them.
+"""
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import chain, islice
+
+_CODE_RE = re.compile(r"'|//|;")
+_SQL_CODE_RE = re.compile(r"'|//|--|;")
+_QUOTE_END_RE = re.compile(r"''|'")
+_EXEC_SQL_RE = re.compile(r"EXEC\s+SQL\b", re.I)
+# blank and comment lines, then a statement up to its ';': literals closed on their line, no // in it and
+# no line of it a comment or starting with ** (compile-time data).
+# A directive (/x, **x) is left to the line scanner. Possessive throughout: no backtracking.
+_GAP = r"(?:\s++|//[^\n]*+)*+"
+_TEXT = r"[^;'/\n]*+(?:(?:'[^'\n]*+'|/(?!/)|\n(?![ \t]*+//|\*\*))[^;'/\n]*+)*+"
+_STATEMENT_RE = re.compile(rf"{_GAP}(?![/]|\*\*)(?P<text>{_TEXT});")
+_LINE_BREAK_RE = re.compile(r"[ \t]*\n[ \t]*")
+
+
+@dataclass
+class RpgStatementText:
+    """One free-format statement: physical lines joined by newlines, comments removed, without its ';'."""
+
+    text: str
+    line: int  # 1-based line of the first token
+    column: int  # 0-based column of the first token
+    end_line: int
+    end_column: int  # 0-based column of the ';' (or end of text for directives / an unterminated last statement)
+    terminated: bool = True  # False for directives and a statement cut off by end of source
+
+
+def split_free(source: str, first_line: int = 1) -> list[RpgStatementText]:
+    """Split in-memory free-format source; see iter_free_statements."""
+    return list(iter_free_statements(source.splitlines(), first_line))
+
+
+def iter_free_statements(lines: Sequence[str], first_line: int = 1) -> Iterator[RpgStatementText]:
+    """Yield the logical statements of free-format lines (first_line numbers the first of them)."""
+    source = FreeText(lines, first_line)
+    pos = 0
+    while True:
+        st, pos = source.statement(pos)
+        if st is None:
+            return
+        yield st
+
+
+def statement_pattern(words: Iterable[str] | None = None, excluding: Iterable[str] = (), condition: bool = False) -> str:
+    """
+    Pattern source for one statement the fast path takes whole, with the
+    blank and comment lines before it: one whose first token is one of words
+    (upper-case; matched in any ASCII case), or with words None, one whose
+    first token is none of excluding and not EXEC (SQL may hide a ';' in a --
+    comment), and not a directive. condition: the token is followed by more
+    text (not an opcode extender).
+    """
+    if words is None:
+        stop = rf"(?:{_any_case({*excluding, 'EXEC'})})(?![\w$#@-])"
+        return rf"{_GAP}(?![/]|\*\*|{stop}){_TEXT};"
+    end = r"(?=[ \t\n]++[^;\s])" if condition else r"(?![\w$#@-])"
+    return rf"{_GAP}(?:{_any_case(words)}){end}{_TEXT};"
+
+
+def keyword_pattern(words: Iterable[str], runs: str = "") -> re.Pattern:
+    """
+    Pattern over FreeText.text from where a statement may start: it passes
+    over the statements the fast path takes whole that start with none of
+    words (upper-case; matched in any ASCII case), and over runs (pattern
+    source, e.g. from statement_pattern), then takes the next statement if it
+    starts with one of words, in groups word and rest (the statement after
+    it, without its ';'). A directive, EXEC or a statement the fast path
+    cannot take leaves word None, for FreeText.statement to take.
+    """
+    words = set(words) - {"EXEC"}
+    other = statement_pattern(None, words)
+    skip = f"{other}|{runs}" if runs else other
+    return re.compile(rf"(?:{skip})*+{_GAP}(?:(?P<word>{_any_case(words)})(?![\w$#@-])(?P<rest>{_TEXT});)?")
+
+
+def _any_case(words: Iterable[str]) -> str:
+    """Alternation of words in any ASCII case, as a trie: words sharing a prefix do not test it again."""
+    by_first: dict[str, list[str]] = {}
+    for word in words:
+        by_first.setdefault(word[:1], []).append(word[1:])
+    branches = [(f"[{c}{c.lower()}]" if c.isalpha() else re.escape(c)) + _any_case(rest)
+                for c, rest in sorted(by_first.items()) if c]
+    if not branches:
+        return ""
+    if "" not in by_first:
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    return f"(?:{'|'.join(branches)})?"  # a word ends here
+
+
+class FreeText:
+    """
+    Free-format lines joined by newlines, read one statement at a time from
+    any offset (iter_free_statements reads them in order). Line numbers are
+    counted forward from the last offset asked about, so offsets must come
+    in order.
+    """
+
+    def __init__(self, lines: Sequence[str], first_line: int = 1):
+        self.lines = lines
+        self.first_line = first_line
+        self.text = "\n".join(lines)
+        self.line, self.line_start = first_line, 0  # a line number and the offset of that line in text
+
+    def line_at(self, offset: int) -> tuple[int, int]:
+        """(line number, offset of that line) of offset."""
+        self.line += self.text.count("\n", self.line_start, offset)
+        self.line_start = self.text.rfind("\n", 0, offset) + 1
+        return self.line, self.line_start
+
+    def statement(self, pos: int) -> tuple[RpgStatementText | None, int]:
+        """
+        The first statement from pos (blank and comment lines before it are
+        passed over) and the offset after it; (None, end of text) when none is left.
+        """
+        text = self.text
+        while True:
+            m = _STATEMENT_RE.match(text, pos)
+            if m is None:
+                break
+            start, end = m.span(1)
+            stmt = text[start:end]
+            if "--" in stmt and _EXEC_SQL_RE.match(stmt):
+                break
+            ln, line_start = self.line_at(start)
+            pos = end + 1
+            if "\n" in stmt:  # continuation lines lose their indentation, as in the line scanner
+                stmt = _LINE_BREAK_RE.sub("\n", stmt)
+                end_line, end_column = ln + stmt.count("\n"), end - 1 - text.rfind("\n", 0, end)
+            else:
+                end_line, end_column = ln, end - line_start
+            stmt = stmt.rstrip()
+            if stmt:
+                return RpgStatementText(stmt, ln, start - line_start, end_line, end_column), pos
+
+        # through the line scanner, from pos (its line blanked up to there)
+        ln, line_start = self.line_at(pos)
+        index = ln - self.first_line
+        if index >= len(self.lines):
+            return None, len(text)
+        column = pos - line_start
+        first = " " * column + self.lines[index][column:]
+        st = next(_scan_lines(chain((first,), islice(self.lines, index + 1, None)), ln), None)
+        if st is None:
+            return None, len(text)  # only blank and comment lines, or compile-time data, follow
+        if not st.terminated and st.text[:1] != "/" and st.text[:2] != "**":
+            return st, len(text)  # cut off by the end of the source or by compile-time data
+        for _ in range(st.end_line - ln):
+            line_start = text.index("\n", line_start) + 1
+        self.line, self.line_start = st.end_line, line_start
+        return st, line_start + st.end_column + st.terminated
+
+
+def _scan_lines(lines: Iterable[str], first_line: int) -> Iterator[RpgStatementText]:
+    """The line scanner: statements of lines, consumed one line at a time."""
+    buf: list[str] = []  # text of the statement being assembled
+    started = False
+    start = (0, 0)
+    last = (0, 0)  # end of the last text added (line, column)
+    code_re = _CODE_RE
+    in_string = False
+    continuation = ""  # '+' or '-' that continued a string literal onto the next line
+
+    ln = first_line - 1
+    for line in lines:
+        ln += 1
+        line = line.rstrip("\r\n")
+        pos = 0
+        if line[:2] == "**" and line[:6].upper() != "**FREE" and not in_string:
+            break  # **CTDATA / ** in column 1: compile-time data follows
+        if not started:
+            stripped = line.lstrip()
+            if not stripped or stripped[:2] == "//":
+                continue
+            if stripped[0] == "/" or stripped[:2] == "**":
+                column = len(line) - len(stripped)
+                text = stripped.rstrip()
+                yield RpgStatementText(text, ln, column, ln, column + len(text), terminated=False)
+                continue
+        elif continuation:
+            if continuation == "+":  # '+' continues from the first non-blank, '-' from column 1
+                pos = len(line) - len(line.lstrip())
+            continuation = ""
+        else:
+            buf.append("\n")
+            pos = len(line) - len(line.lstrip())
+
+        if not in_string and "'" not in line:
+            # fast path: no string literal on the line, so the first // starts a
+            # comment and every ';' before it ends a statement
+            code = line[pos:]
+            if "//" in code:
+                code = code.split("//", 1)[0]
+            if "--" not in code:
+                pieces = code.split(";")
+                for piece in pieces[:-1]:
+                    if started:
+                        buf.append(piece)
+                        yield RpgStatementText("".join(buf).strip(), start[0], start[1], ln, pos + len(piece))
+                        buf = []
+                        started = False
+                    else:
+                        text = piece.strip()
+                        if text:
+                            yield RpgStatementText(text, ln, pos + piece.find(text[0]), ln, pos + len(piece))
+                    pos += len(piece) + 1
+                rest = pieces[-1].rstrip()
+                if rest:
+                    if not started:
+                        text = rest.lstrip()
+                        if not text:
+                            continue
+                        started = True
+                        start = (ln, pos + len(rest) - len(text))
+                        code_re = _SQL_CODE_RE if _EXEC_SQL_RE.match(text) else _CODE_RE
+                        rest = text
+                    buf.append(rest)
+                    last = (ln, pos + len(pieces[-1].rstrip()))
+                continue
+
+        while True:
+            if not started:
+                pos += len(line) - pos - len(line[pos:].lstrip())
+                if pos >= len(line) or line.startswith("//", pos):
+                    break
+                started = True
+                start = (ln, pos)
+                code_re = _SQL_CODE_RE if _EXEC_SQL_RE.match(line, pos) else _CODE_RE
+            if in_string:
+                m = _QUOTE_END_RE.search(line, pos)
+                while m and m.group() == "''":
+                    m = _QUOTE_END_RE.search(line, m.end())
+                if m is None:  # literal runs to the end of the line
+                    rest = line[pos:].rstrip()
+                    if rest[-1:] in ("+", "-"):
+                        buf.append(rest[:-1])
+                        continuation = rest[-1]
+                    else:  # not continued: treat it as closed here
+                        buf.append(rest)
+                        in_string = False
+                    last = (ln, pos + len(rest))
+                    break
+                buf.append(line[pos:m.end()])
+                pos = m.end()
+                last = (ln, pos)
+                in_string = False
+                continue
+            m = code_re.search(line, pos)
+            if m is None:
+                rest = line[pos:].rstrip()
+                buf.append(rest)
+                if rest:
+                    last = (ln, pos + len(rest))
+                break
+            token = m.group()
+            if token == "'":
+                buf.append(line[pos:m.end()])
+                pos = m.end()
+                last = (ln, pos)
+                in_string = True
+            elif token == ";":
+                buf.append(line[pos:m.start()])
+                yield RpgStatementText("".join(buf).strip(), start[0], start[1], ln, m.start())
+                buf = []
+                started = False
+                pos = m.end()
+            else:  # comment to the end of the line
+                rest = line[pos:m.start()].rstrip()
+                buf.append(rest)
+                if rest:
+                    last = (ln, pos + len(rest))
+                break
+
+    if started:
+        yield RpgStatementText("".join(buf).strip(), start[0], start[1], last[0], last[1], terminated=False)
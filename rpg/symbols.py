@@ -0,0 +1,277 @@
+"""
+Symbol table and def-use index for one RPG program.
+
+Scopes are the global scope (GLOBAL), one per procedure (its name) and
+one per data structure (its name, holding the subfields; subfields of a
+data structure that is not QUALIFIED are visible by name in the scope
+declaring it too). Names are upper-cased and interned.
+
+The line parser only queues work while it parses (later): declarations as
+they are met, the definitions and uses of a procedure when it closes (of
+the main body at the end of the member), and embedded SQL when it is
+parsed. The queue runs, in order, at the first query, so a parse whose
+table is never asked costs a tuple per declaration. "Where is X modified"
+is then table.defs("X"): dictionary lookups, no AST walk.
+
+Definitions are assignment targets (EVAL, MOVE, ADD, ...; x += y also uses
+x), FOR control variables and SQL INTO host variables; uses are names read by conditions,
+assignment expressions, return values, call parameters and other host
+variables. Names that are used but not declared (file fields, fields
+defined on a C-spec) get an "implicit" global symbol.
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+
+from rpg.ast_nodes import (
+    EmbeddedSqlStmt,
+    RpgAssignStmt,
+    RpgCallStmt,
+    RpgDoForStmt,
+    RpgExpr,
+    RpgIfStmt,
+    RpgParam,
+    RpgReturnStmt,
+    RpgSelectStmt,
+    RpgVarDecl,
+    SourceLocation,
+)
+
+GLOBAL = ""
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+# [qualifier.]name, not a BIF (%), special value (*) or part of a literal; group 2 is set for name(
+_NAME_RE = re.compile(r"(?<![\w$#@%*'])([A-Za-z_$#@][\w$#@]*(?:\.[A-Za-z_$#@][\w$#@]*)?)(\s*\()?")
+_HOST_VAR_RE = re.compile(r":\s*([A-Za-z_$#@][\w$#@]*(?:\.[A-Za-z_$#@][\w$#@]*)?)")
+# host variables from INTO up to the next clause are set by the statement
+_SQL_INTO_RE = re.compile(r"\bINTO\b(.*?)(?=\b(?:FROM|WHERE|VALUES|SELECT|USING|ORDER|GROUP|FOR)\b|$)", re.I | re.S)
+_OPERATOR_WORDS = frozenset(("AND", "OR", "NOT", "IN", "TO", "BY", "DOWNTO"))
+
+
+@dataclass
+class RpgSymbol:
+    """A declared (or implicit) name and the places that define and use it."""
+
+    name: str  # upper case, interned
+    scope: str  # GLOBAL, a procedure name, or the data structure of a subfield
+    kind: str  # "var" | "const" | "ds" | "subfield" | "param" | "implicit"
+    decl: RpgVarDecl | RpgParam | None = None
+    defs: list[SourceLocation] = field(default_factory=list)
+    uses: list[SourceLocation] = field(default_factory=list)
+
+
+class RpgSymbolTable:
+    """Scoped symbols of one program, with their def-use index."""
+
+    def __init__(self):
+        self.scopes: dict[str, dict[str, RpgSymbol]] = {GLOBAL: {}}
+        self._by_name: dict[str, list[RpgSymbol]] = {}  # every symbol with a name, over all scopes
+        self._ds_scope: dict[str, str] = {}  # scope that declared each data structure
+        self._pending: list[tuple[str, tuple]] = []  # (method, arguments) queued by later
+
+    def later(self, method: str, *args) -> None:
+        """Queue a call of method (declare, index_statements, ...) until the first query."""
+        self._pending.append((method, args))
+
+    def _run_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        for method, args in pending:
+            getattr(self, method)(*args)
+
+    # -- declarations ------------------------------------------------------
+
+    def declare(self, name: str, scope: str = GLOBAL, kind: str = "var",
+                decl: RpgVarDecl | RpgParam | None = None, qualified: bool = False) -> RpgSymbol:
+        """
+        Declare name in scope (a procedure name or GLOBAL). For kind
+        "subfield", scope is the data structure; the subfield is visible in
+        the data structure's own scope too unless it is qualified.
+        """
+        key = sys.intern(name.upper())
+        scope = sys.intern(scope.upper())
+        symbol = RpgSymbol(key, scope, kind, decl)
+        self.scopes.setdefault(scope, {})[key] = symbol
+        self._by_name.setdefault(key, []).append(symbol)
+        if kind == "subfield" and not qualified:
+            owner = self._ds_scope.get(scope)
+            if owner is not None:
+                self.scopes[owner].setdefault(key, symbol)
+        return symbol
+
+    def declare_ds(self, name: str, scope: str = GLOBAL, decl: RpgVarDecl | None = None) -> RpgSymbol:
+        """Declare a data structure; its subfields are then declared with scope=name."""
+        symbol = self.declare(name, scope, "ds", decl)
+        self._ds_scope[symbol.name] = symbol.scope
+        return symbol
+
+    def include(self, other: "RpgSymbolTable") -> None:
+        """Declare the symbols of a copybook's table here (without its defs and uses)."""
+        if other._pending:
+            other._run_pending()
+        for scope, symbols in other.scopes.items():
+            target = self.scopes.setdefault(scope, {})
+            for key, symbol in symbols.items():
+                if key not in target and symbol.kind != "implicit":
+                    copy = RpgSymbol(key, symbol.scope, symbol.kind, symbol.decl)
+                    target[key] = copy
+                    self._by_name.setdefault(key, []).append(copy)
+        self._ds_scope.update(other._ds_scope)
+
+    # -- queries -----------------------------------------------------------
+
+    def lookup(self, name: str, scope: str = GLOBAL) -> RpgSymbol | None:
+        """The symbol name refers to in scope (procedure, then global); DS.SUBFIELD is looked up in DS."""
+        if self._pending:
+            self._run_pending()
+        key = name.upper()
+        if "." in key:
+            ds, _, sub = key.partition(".")
+            return self.scopes.get(ds, {}).get(sub)
+        if scope:
+            symbol = self.scopes.get(scope.upper(), {}).get(key)
+            if symbol is not None:
+                return symbol
+        return self.scopes[GLOBAL].get(key)
+
+    def symbols(self, name: str) -> list[RpgSymbol]:
+        """Every symbol called name, in any scope."""
+        if self._pending:
+            self._run_pending()
+        return self._by_name.get(name.upper(), [])
+
+    def defs(self, name: str, scope: str | None = None) -> list[SourceLocation]:
+        """
+        Where name is assigned: in scope when given (resolved as lookup does),
+        else in every scope; DS.SUBFIELD names the one subfield either way.
+        """
+        return self._locations(name, scope, "defs")
+
+    def uses(self, name: str, scope: str | None = None) -> list[SourceLocation]:
+        """Where name is read; see defs."""
+        return self._locations(name, scope, "uses")
+
+    def _locations(self, name: str, scope: str | None, attr: str) -> list[SourceLocation]:
+        if scope is not None or "." in name:
+            symbol = self.lookup(name, scope or GLOBAL)
+            return getattr(symbol, attr) if symbol is not None else []
+        found: list[SourceLocation] = []
+        for symbol in self.symbols(name):
+            found += getattr(symbol, attr)
+        return found
+
+    # -- def-use indexing --------------------------------------------------
+
+    def index_statements(self, statements: list, scope: str = GLOBAL) -> None:
+        """Record the definitions and uses of statements (nested blocks included) in scope."""
+        for stmt in statements:
+            if isinstance(stmt, RpgAssignStmt):
+                self._index_target(stmt.target, scope, stmt.operator is not None)
+                self._use_expr(stmt.expr, scope)
+            elif isinstance(stmt, RpgIfStmt):
+                self._use_expr(stmt.condition, scope)
+                self.index_statements(stmt.then_body, scope)
+                for condition, body in stmt.else_if_parts:
+                    self._use_expr(condition, scope)
+                    self.index_statements(body, scope)
+                self.index_statements(stmt.else_body, scope)
+            elif isinstance(stmt, RpgSelectStmt):
+                for condition, body in stmt.cases:
+                    self._use_expr(condition, scope)
+                    self.index_statements(body, scope)
+            elif isinstance(stmt, RpgDoForStmt):
+                if stmt.kind == "for" and stmt.condition is not None:
+                    m = _NAME_RE.search(stmt.condition.value or "")  # FOR i = 1 TO 10: the loop sets i
+                    if m:
+                        self._record(m.group(1), scope, stmt.condition.loc or stmt.loc, True)
+                self._use_expr(stmt.condition, scope)
+                self.index_statements(stmt.body, scope)
+            elif isinstance(stmt, RpgCallStmt):
+                for param in stmt.params:
+                    self._use_expr(param, scope)
+            elif isinstance(stmt, RpgReturnStmt):
+                self._use_expr(stmt.value, scope)
+            elif isinstance(stmt, EmbeddedSqlStmt):
+                self.index_sql(stmt, scope)
+            else:  # MONITOR
+                self.index_statements(getattr(stmt, "body", None) or [], scope)
+                for _, body in getattr(stmt, "handlers", None) or []:
+                    self.index_statements(body, scope)
+
+    def index_sql(self, stmt: EmbeddedSqlStmt, scope: str = GLOBAL) -> None:
+        """Host variables of an embedded statement: INTO targets are definitions, the rest uses."""
+        text = stmt.sql_text
+        into = [(m.start(1), m.end(1)) for m in _SQL_INTO_RE.finditer(text)]
+        for m in _HOST_VAR_RE.finditer(text):
+            pos = m.start()
+            defined = any(start <= pos < end for start, end in into)
+            self._record(m.group(1), scope, stmt.loc, defined)
+
+    def _index_target(self, target: RpgExpr, scope: str, updated: bool = False) -> None:
+        """The target is defined (and used too when updated: x += y); its subscripts are used."""
+        text = target.value or ""
+        if not text:
+            return
+        first = True
+        for m in _NAME_RE.finditer(_STRING_RE.sub(" ", text)):
+            name = m.group(1)
+            if first:
+                self._record(name, scope, target.loc, True)
+                if updated:
+                    self._record(name, scope, target.loc, False)
+                first = False
+            elif name.upper() not in _OPERATOR_WORDS:
+                self._record(name, scope, target.loc, False)  # subscripts
+
+    def _use_expr(self, expr: RpgExpr | None, scope: str, loc: SourceLocation | None = None) -> None:
+        """Names read by expr, at loc (the statement's: nodes of a shared parse tree have none)."""
+        if expr is None:
+            return
+        loc = loc or expr.loc
+        if expr.children:
+            if expr.kind == "call" and self.lookup(expr.value, scope) is not None:
+                self._record(expr.value, scope, loc, False)  # an array element, not a procedure call
+            for child in expr.children:
+                self._use_expr(child, scope, loc)
+            return
+        if not expr.value:
+            return
+        if expr.kind == "ident":
+            self._record(expr.value, scope, loc, False)
+            return
+        if expr.kind != "expr":
+            return  # literal, BIF or call without arguments
+        for m in _NAME_RE.finditer(_STRING_RE.sub(" ", expr.value)):
+            name = m.group(1)
+            if name.upper() in _OPERATOR_WORDS:
+                continue
+            if m.group(2) and self.lookup(name, scope) is None:
+                continue  # a procedure call, not an array
+            self._record(name, scope, loc, False)
+
+    def _record(self, name: str, scope: str, loc: SourceLocation, is_def: bool) -> None:
+        symbol = self.lookup(name, scope)
+        if symbol is None:
+            ds, _, sub = name.rpartition(".")
+            symbol = self.declare(sub, ds or GLOBAL, "implicit")
+        (symbol.defs if is_def else symbol.uses).append(loc)
+
+
+def build_symbol_table(program) -> RpgSymbolTable:
+    """
+    Symbol table of a program parsed without one (the ANTLR path): variables
+    are global, procedure parameters are local, and all bodies and embedded
+    SQL are indexed. Copybook declarations are included in program.variables.
+    """
+    table = RpgSymbolTable()
+    for var in program.variables:
+        table.declare(var.name, GLOBAL, "ds" if var.data_type == "DS" else "var", var)
+    for proc in program.procedures:
+        for param in proc.params:
+            table.declare(param.name, proc.name, "param", param)
+    table.index_statements(program.main_body)
+    for proc in program.procedures:
+        table.index_statements(proc.body, proc.name)
+    for stmt in program.sql_statements:
+        table.index_sql(stmt)
+    return table
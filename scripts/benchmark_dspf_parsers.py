@@ -0,0 +1,62 @@
+"""
+Compare the DSPF line parser with the generated ANTLR parser, by file size.
+
+For each file, and for its first N lines at each --sizes step: parse time
+of both paths (best of --repeat), whether the ANTLR path fell back to the
+line parser, and whether the two ASTs are equal.
+
+Usage: python scripts/benchmark_dspf_parsers.py [--repeat N] [--sizes 50,500,5000] FILE...
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.io import load_file  # noqa: E402
+from dspf.ast_builder import parse_dspf  # noqa: E402
+
+
+def _time(source: str, filename: str, parser: str, repeat: int):
+    """(display file, diagnostics, best seconds)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        display_file, diagnostics = parse_dspf(source, filename, parser=parser)
+        times.append(time.perf_counter() - start)
+    return display_file, diagnostics, min(times)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the DSPF line parser against the ANTLR parser.")
+    ap.add_argument("files", nargs="+", help="DSPF DDS source files")
+    ap.add_argument("--repeat", type=int, default=3, help="parses per file, size and parser (default: 3)")
+    ap.add_argument("--sizes", type=str, default="", help="comma-separated line counts to cut each file to")
+    args = ap.parse_args()
+
+    from dspf.antlr_builder import HAS_DSPF_GEN
+    if not HAS_DSPF_GEN:
+        print("dspf/gen is missing or antlr4-python3-runtime is not installed; run scripts/generate_parsers.py")
+        return 1
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    for path in args.files:
+        lines = load_file(path).splitlines()
+        print(f"{path} ({len(lines)} lines)")
+        for size in sorted({n for n in sizes if n < len(lines)} | {len(lines)}):
+            source = "\n".join(lines[:size])
+            lines_ast, _, lines_best = _time(source, path, "lines", args.repeat)
+            antlr_ast, diagnostics, antlr_best = _time(source, path, "antlr", args.repeat)
+            fallback = any("parsed with the line parser" in d.message for d in diagnostics)
+            print(f"  {size:7d} lines  lines {lines_best * 1000:9.2f} ms  antlr {antlr_best * 1000:9.2f} ms"
+                  f"  ({antlr_best / lines_best if lines_best else 0:5.1f}x)"
+                  + ("  (fell back to the line parser)" if fallback
+                     else "  same AST" if lines_ast == antlr_ast else "  ASTs differ"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
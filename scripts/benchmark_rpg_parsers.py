@@ -0,0 +1,81 @@
+"""
+Compare the RPG line parsers with the generated ANTLR parser.
+
+For each file: parse time of both paths (first run, and best of --repeat;
+the first ANTLR run includes building its prediction DFA), whether the
+ANTLR path fell back to the line parsers, and AST fidelity: how many
+procedures, variables, files, SQL statements and statements (by type and
+line, nested blocks included) the two ASTs have in common.
+
+Usage: python scripts/benchmark_rpg_parsers.py [--repeat N] FILE...
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.io import load_file  # noqa: E402
+from core.lineage import iter_rpg_statements  # noqa: E402
+from rpg.ast_builder import parse_rpg  # noqa: E402
+from rpg.copybooks import CopybookResolver  # noqa: E402
+
+
+def _time(source: str, filename: str, parser: str, repeat: int):
+    """(program, diagnostics, first seconds, best seconds)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        program, diagnostics = parse_rpg(source, filename, CopybookResolver(), parser=parser)
+        times.append(time.perf_counter() - start)
+    return program, diagnostics, times[0], min(times)
+
+
+def _keys(program) -> dict[str, set]:
+    """Comparable facts of an AST, by kind."""
+    body = list(program.main_body) + [s for p in program.procedures for s in p.body]
+    return {
+        "procedures": {(p.name.upper(), len(p.params)) for p in program.procedures},
+        "variables": {(v.name.upper(), v.loc.line) for v in program.variables},
+        "files": {(f.name.upper(), f.loc.line) for f in program.files},
+        "sql": {s.loc.line for s in program.sql_statements},
+        "statements": {(type(s).__name__, s.loc.line) for s in iter_rpg_statements(body)},
+    }
+
+
+def _fidelity(lines_ast, antlr_ast) -> str:
+    expected, actual = _keys(lines_ast), _keys(antlr_ast)
+    return "  ".join(f"{kind} {len(expected[kind] & actual[kind])}/{len(expected[kind] | actual[kind])}"
+                     for kind in expected)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the RPG line parsers against the ANTLR parser.")
+    ap.add_argument("files", nargs="+", help="RPG source files")
+    ap.add_argument("--repeat", type=int, default=3, help="parses per file and parser (default: 3)")
+    args = ap.parse_args()
+
+    from rpg.antlr_builder import HAS_RPG_GEN
+    if not HAS_RPG_GEN:
+        print("rpg/gen is missing or antlr4-python3-runtime is not installed; run scripts/generate_parsers.py")
+        return 1
+
+    for path in args.files:
+        source = load_file(path)
+        lines_ast, _, lines_first, lines_best = _time(source, path, "lines", args.repeat)
+        antlr_ast, diagnostics, antlr_first, antlr_best = _time(source, path, "antlr", args.repeat)
+        fallback = any("parsed with the line parser" in d.message for d in diagnostics)
+        print(f"{path} ({source.count(chr(10)) + 1} lines)")
+        print(f"  lines  first {lines_first * 1000:9.1f} ms  best {lines_best * 1000:9.1f} ms")
+        print(f"  antlr  first {antlr_first * 1000:9.1f} ms  best {antlr_best * 1000:9.1f} ms"
+              + ("  (fell back to the line parser)" if fallback else ""))
+        if not fallback:
+            print(f"  common {_fidelity(lines_ast, antlr_ast)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
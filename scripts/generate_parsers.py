@@ -7,9 +7,11 @@ Usage: python scripts/generate_parsers.py
 """
 
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -17,14 +19,66 @@ GRAMMARS = ROOT / "grammars"
 
 # Grammar pairs: (lexer_g4, parser_g4, output_dir)
 # Order: lexer first, then parser (parser depends on lexer tokens)
-# Note: sqlrpgle and dspf grammars have syntax issues; CL and DB2 work.
+# Note: the sqlrpgle grammar has syntax issues; CL, DB2, RPG (RpgLexer/RpgParser) and DSPF work.
 CONFIGS = [
     ("clle_lexer.g4", "clle_parser.g4", ROOT / "cl" / "gen"),
     ("db2_lexer.g4", "db2_parser.g4", ROOT / "db2" / "gen"),
+    ("RpgLexer.g4", "RpgParser.g4", ROOT / "rpg" / "gen"),
     # ("sqlrpgle_lexer.g4", "sqlrpgle_parser.g4", ROOT / "rpg" / "gen"),  # grammar name mismatch, syntax errors
-    # ("dspf_lexer.g4", "dspf_parser.g4", ROOT / "dspf" / "gen"),  # syntax errors in grammar
+    ("dspf_lexer.g4", "dspf_parser.g4", ROOT / "dspf" / "gen"),
 ]
 
+# Grammars whose embedded predicates/actions are written for the Java target.
+# They are translated to Python into a build directory before generation.
+JAVA_ACTION_GRAMMARS = {"RpgLexer.g4"}
+
+_ACTION_RE = re.compile(r"(?<!options )(?<!tokens )(?<!channels )\{([^{}]*)\}(\?)?")
+_MODE_RE = re.compile(r"^mode\s+(\w+)\s*;", re.M)
+_JAVA_TO_PYTHON = [
+    (re.compile(r"System\.out\.println\([^;]*\);"), ""),
+    (re.compile(r"getCharPositionInLine\(\)"), "self.column"),
+    (re.compile(r"_modeStack\.peek\(\)"), "(self._modeStack[-1] if self._modeStack else None)"),
+    (re.compile(r"_modeStack\.contains\((\w+)\)"), r"(\1 in self._modeStack)"),
+    (re.compile(r"_input\.LA\("), "self._input.LA("),
+    (re.compile(r"getText\(\)\.substring\(0,\s*getText\(\)\.length\(\)-(\d+)\)"), r"self.text[:-\1]"),
+    (re.compile(r"setText\((.*)\);"), r"self.text = \1"),
+    (re.compile(r"getText\(\)"), "self.text"),
+    (re.compile(r"\.trim\(\)"), ".strip()"),
+    (re.compile(r"'(\\?.)'"), r"ord('\1')"),  # Java char literals compare as int
+    (re.compile(r"&&"), " and "),
+    (re.compile(r"\|\|"), " or "),
+    (re.compile(r"!(?!=)"), " not "),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def _java_actions_to_python(grammar: str) -> str:
+    """Rewrite the Java predicates/actions of a lexer grammar for the Python3 target."""
+    modes = _MODE_RE.findall(grammar)
+    mode_re = re.compile(r"(?<![\w.])(%s)\b" % "|".join(modes)) if modes else None
+
+    def action(m: re.Match) -> str:
+        code = m.group(1)
+        for pattern, repl in _JAVA_TO_PYTHON:
+            code = pattern.sub(repl, code)
+        if mode_re is not None:
+            code = mode_re.sub(r"self.\1", code)
+        code = code.strip()
+        if not code:
+            return ""
+        return "{" + code + "}" + (m.group(2) or "")
+
+    return _ACTION_RE.sub(action, grammar)
+
+
+def prepare_grammar(path: Path, build_dir: Path) -> Path:
+    """Grammar file to hand to ANTLR: path itself, or its Python-action translation in build_dir."""
+    if path.name not in JAVA_ACTION_GRAMMARS:
+        return path
+    out = build_dir / path.name
+    out.write_text(_java_actions_to_python(path.read_text(encoding="utf-8")), encoding="utf-8")
+    return out
+
 
 def find_antlr_jar() -> Path | None:
     """Find ANTLR jar in antlr4-tool site-packages."""
@@ -48,11 +102,14 @@ def run_antlr4(grammar_path: Path, output_dir: Path) -> bool:
         "-Dlanguage=Python3",
         "-visitor",
         "-no-listener",
+        "-lib", str(output_dir),
         "-o", str(output_dir),
-        str(grammar_path),
+        "-Xexact-output-dir",
+        grammar_path.name,
     ]
     try:
-        r = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, timeout=60)
+        # run in the grammar's directory so the generated headers name it relatively
+        r = subprocess.run(cmd, cwd=grammar_path.parent, capture_output=True, text=True, timeout=60)
         if r.returncode != 0:
             print(f"ANTLR error for {grammar_path.name}: {r.stderr}")
             return False
@@ -79,13 +136,16 @@ def main() -> int:
                 print(f"Skip: {lex_g4}/{par_g4} not found")
                 continue
             out_dir.mkdir(parents=True, exist_ok=True)
-            for g in [lex_path, par_path]:
-                cmd = [antlr_cmd, "-Dlanguage=Python3", "-visitor", "-o", str(out_dir), str(g)]
-                r = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
-                if r.returncode != 0:
-                    print(f"Failed {g.name}: {r.stderr}")
-                else:
-                    print(f"Generated from {g.name} -> {out_dir}")
+            with tempfile.TemporaryDirectory() as build:
+                for g in [lex_path, par_path]:
+                    src = prepare_grammar(g, Path(build))
+                    cmd = [antlr_cmd, "-Dlanguage=Python3", "-visitor", "-lib", str(out_dir),
+                           "-o", str(out_dir), "-Xexact-output-dir", src.name]
+                    r = subprocess.run(cmd, cwd=src.parent, capture_output=True, text=True)
+                    if r.returncode != 0:
+                        print(f"Failed {g.name}: {r.stderr}")
+                    else:
+                        print(f"Generated from {g.name} -> {out_dir}")
         _write_gen_init()
         return 0
 
@@ -106,15 +166,16 @@ def main() -> int:
     print("Using ANTLR jar:", ANTLR_JAR)
     ok = True
     for lex_g4, par_g4, out_dir in CONFIGS:
-        for g4 in [lex_g4, par_g4]:
-            p = GRAMMARS / g4
-            if p.exists():
-                if run_antlr4(p, out_dir):
-                    print(f"Generated {g4} -> {out_dir}")
+        with tempfile.TemporaryDirectory() as build:
+            for g4 in [lex_g4, par_g4]:
+                p = GRAMMARS / g4
+                if p.exists():
+                    if run_antlr4(prepare_grammar(p, Path(build)), out_dir):
+                        print(f"Generated {g4} -> {out_dir}")
+                    else:
+                        ok = False
                 else:
-                    ok = False
-            else:
-                print(f"Skip: {g4} not found")
+                    print(f"Skip: {g4} not found")
     _write_gen_init()
     return 0 if ok else 1
 